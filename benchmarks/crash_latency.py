@@ -0,0 +1,210 @@
+"""
+Crash-to-visible latency of the exception dialog, with and without prewarming.
+
+    python -m benchmarks.crash_latency -o crash.json
+    python -m benchmarks.crash_latency -o crash-new.json --compare crash.json
+
+Each sample runs in a fresh interpreter, which installs the handlers (with
+`prewarm = True` or not), waits for the prewarm as an idle application would,
+and then hands an exception to `sys.excepthook`. Measured from there:
+
+- crash_to_constructed_ms: until the dialog and all its controls exist;
+- crash_to_visible_ms: until it is shown and painted, children included
+  (`RedrawWindow` with RDW_UPDATENOW | RDW_ALLCHILDREN), the moment the user
+  sees it;
+- prewarm_ms: time the background prewarm took, off the crash path.
+
+Both modes run against an empty and a filled canvas cache, each in a private
+directory; crash reports go to a temporary directory. Needs a real Win32
+backend and is recorded as skipped elsewhere.
+"""
+import argparse
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+from benchmarks.startup import _git_commit
+
+RESULTS_VERSION = 1
+
+_RUNS = 5
+
+# Changes smaller than this (percent) are shown as noise in a comparison
+_NOISE_PERCENT = 10.0
+
+# (prewarm, canvas cache state) per scenario
+_SCENARIOS = {
+    'no prewarm (cold cache)': (False, 'cold'),
+    'no prewarm (warm cache)': (False, 'warm'),
+    'prewarm (cold cache)': (True, 'cold'),
+    'prewarm (warm cache)': (True, 'warm'),
+}
+
+_METRICS = ('prewarm_ms', 'crash_to_constructed_ms', 'crash_to_visible_ms')
+
+
+def _crash_child(prewarm: bool, cache_dir: str, crash_dir: str) -> dict:
+    """Runs in the child process: install, let the prewarm finish, crash, and close the dialog once painted."""
+    import win32con
+
+    from skeletal_framework import ExceptionHandlerDialog
+    from skeletal_framework._crash_log import CrashLogWriter
+    from skeletal_framework.canvas_cache import CanvasCache
+    from skeletal_framework.core_context import CoreContext
+    from skeletal_framework.win32_bindings.user32 import RedrawWindow, SendMessage, ShowWindow
+
+    # First instances win; the dialog then uses these directories
+    CanvasCache(cache_dir)
+    CrashLogWriter(crash_dir, echo = False)
+
+    marks = {}
+
+    class Probe(ExceptionHandlerDialog):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            marks['constructed'] = time.perf_counter()
+
+        def show_window(self):
+            hwnd = CoreContext().main_window
+            ShowWindow(hwnd, win32con.SW_SHOWNOACTIVATE)
+            RedrawWindow(
+                hwnd, None, None,
+                win32con.RDW_INVALIDATE | win32con.RDW_ERASE | win32con.RDW_UPDATENOW | win32con.RDW_ALLCHILDREN
+            )
+            marks['visible'] = time.perf_counter()
+
+            SendMessage(hwnd, win32con.WM_CLOSE, 0, 0)
+
+    Probe.install_exception_handlers(prewarm = prewarm)
+
+    installed = time.perf_counter()
+    if Probe._prewarm_thread is not None:
+        Probe._prewarm_thread.join()
+    prewarmed = time.perf_counter()
+
+    try:
+        raise RuntimeError('benchmark crash')
+    except RuntimeError:
+        exc_info = sys.exc_info()
+
+    crashed = time.perf_counter()
+    sys.excepthook(*exc_info)
+
+    return {
+        'prewarm_ms': (prewarmed - installed) * 1000,
+        'crash_to_constructed_ms': (marks['constructed'] - crashed) * 1000,
+        'crash_to_visible_ms': (marks['visible'] - crashed) * 1000
+    }
+
+
+def _run_child(prewarm: bool, cache_dir: str, crash_dir: str) -> dict:
+    command = [sys.executable, '-m', 'benchmarks.crash_latency', '--child', cache_dir, crash_dir]
+    if prewarm:
+        command.append('--prewarm')
+
+    result = subprocess.run(command, capture_output = True, text = True, cwd = Path(__file__).parent.parent)
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1] if result.stderr.strip() else 'child failed')
+
+    # The framework may print; the measurement is the last line
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def measure(runs: int = _RUNS) -> dict:
+    if sys.platform != 'win32':
+        return {name: {'skipped': f'needs Win32, running on {sys.platform}'} for name in _SCENARIOS}
+
+    results = {}
+    for name, (prewarm, cache_state) in _SCENARIOS.items():
+        with tempfile.TemporaryDirectory() as cache_root, tempfile.TemporaryDirectory() as crash_dir:
+            samples = []
+
+            for index in range(runs):
+                cache_dir = str(Path(cache_root) / str(index)) if cache_state == 'cold' else cache_root
+
+                try:
+                    if cache_state == 'warm' and index == 0:
+                        # Fills the cache; not counted
+                        _run_child(prewarm, cache_dir, crash_dir)
+
+                    samples.append(_run_child(prewarm, cache_dir, crash_dir))
+                except RuntimeError as error:
+                    results[name] = {'skipped': str(error)}
+                    break
+
+            else:
+                results[name] = {metric: statistics.median(sample[metric] for sample in samples) for metric in _METRICS}
+
+    return results
+
+
+def run(runs: int = _RUNS) -> dict:
+    return {
+        'version': RESULTS_VERSION,
+        'timestamp': datetime.now(timezone.utc).isoformat(timespec = 'seconds'),
+        'commit': _git_commit(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'runs': runs,
+        'scenarios': measure(runs)
+    }
+
+
+def print_results(results: dict) -> None:
+    print(f'{"scenario":<28}' + ''.join(f'{metric:>26}' for metric in _METRICS))
+
+    for scenario, values in results['scenarios'].items():
+        if 'skipped' in values:
+            print(f'{scenario:<28}skipped ({values["skipped"]})')
+        else:
+            print(f'{scenario:<28}' + ''.join(f'{values[metric]:>26.2f}' for metric in _METRICS))
+
+
+def print_comparison(old: dict, new: dict) -> None:
+    print(f'\n{old.get("commit") or "old"} -> {new.get("commit") or "new"}')
+    print(f'{"metric":<56}{"old (ms)":>12}{"new (ms)":>12}{"change":>10}')
+
+    for scenario in [name for name in new['scenarios'] if name in old['scenarios']]:
+        for metric in _METRICS:
+            if metric not in old['scenarios'][scenario] or metric not in new['scenarios'][scenario]:
+                continue
+
+            before, after = old['scenarios'][scenario][metric], new['scenarios'][scenario][metric]
+            change = (after - before) / before * 100 if before else 0.0
+            note = '' if abs(change) < _NOISE_PERCENT else ('  slower' if change > 0 else '  faster')
+            print(f'{scenario + " " + metric:<56}{before:>12.2f}{after:>12.2f}{change:>+9.1f}%{note}')
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog = 'python -m benchmarks.crash_latency', description = __doc__.split('\n\n')[0].strip())
+    parser.add_argument('-o', '--output', type = Path, help = 'write the results to this JSON file')
+    parser.add_argument('--compare', type = Path, help = 'earlier results to compare against')
+    parser.add_argument('-n', '--runs', type = int, default = _RUNS, help = 'samples per scenario (default: %(default)s)')
+    parser.add_argument('--child', nargs = 2, metavar = ('CACHE_DIR', 'CRASH_DIR'), help = argparse.SUPPRESS)
+    parser.add_argument('--prewarm', action = 'store_true', help = argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.child:
+        print(json.dumps(_crash_child(args.prewarm, *args.child)))
+        return 0
+
+    results = run(args.runs)
+    print_results(results)
+
+    if args.output is not None:
+        args.output.write_text(json.dumps(results, indent = 2), encoding = 'utf-8')
+
+    if args.compare is not None:
+        print_comparison(json.loads(args.compare.read_text(encoding = 'utf-8')), results)
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,126 @@
+"""
+Compares the property-backed rectangle classes that `monitor_info` used to ship
+with the tuple-backed `RectangleSequence` / `Workspace` / `SlicedRectangle`.
+
+    python -m benchmarks.rectangle_sequence
+"""
+import collections.abc
+import timeit
+from ctypes import wintypes
+
+from skeletal_framework.win32_bindings.monitor_info import Workspace
+
+
+# --- Legacy implementation (as of the baseline), kept here only for comparison ---
+class LegacyRectangleSequence(collections.abc.Sequence):
+    @property
+    def width(self):
+        return self.right - self.left
+
+    @property
+    def height(self):
+        return self.bottom - self.top
+
+    @property
+    def _data(self):
+        return self.left, self.top, self.right, self.bottom
+
+    def __iter__(self):
+        return iter(self._data)
+
+    def __len__(self):
+        return 4
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return LegacySlicedRectangle(self._data[index])
+        return self._data[index]
+
+    def __eq__(self, other):
+        if isinstance(other, LegacyRectangleSequence):
+            return self._data == other._data
+        elif isinstance(other, collections.abc.Sequence):
+            return self._data == tuple(other)
+        return NotImplemented
+
+    def __str__(self):
+        return str(self._data)
+
+
+class LegacySlicedRectangle(LegacyRectangleSequence):
+    def __init__(self, data):
+        self._rect_data = tuple(list(data) + [0] * (4 - len(data)))[:4]
+
+    @property
+    def left(self):
+        return self._rect_data[0]
+
+    @property
+    def top(self):
+        return self._rect_data[1]
+
+    @property
+    def right(self):
+        return self._rect_data[2]
+
+    @property
+    def bottom(self):
+        return self._rect_data[3]
+
+
+class LegacyWorkspace(LegacyRectangleSequence):
+    def __init__(self, workspace):
+        self._workspace = workspace
+
+    @property
+    def left(self):
+        return self._workspace.left
+
+    @property
+    def top(self):
+        return self._workspace.top
+
+    @property
+    def right(self):
+        return self._workspace.right
+
+    @property
+    def bottom(self):
+        return self._workspace.bottom
+
+
+CASES = {
+    'construct': 'cls(rect)',
+    'unpack'   : 'l, t, r, b = a',
+    'equality' : 'a == b',
+    'index'    : 'a[2]',
+    'slice'    : 'a[:2]',
+    'str'      : 'str(a)',
+    'width'    : 'a.width',
+}
+
+
+def measure(cls, number: int) -> dict[str, float]:
+    rect = wintypes.RECT(0, 0, 1920, 1040)
+    namespace = {'cls': cls, 'rect': rect, 'a': cls(rect), 'b': cls(rect)}
+
+    return {
+        name: min(timeit.repeat(statement, globals = namespace, number = number, repeat = 5)) / number * 1e9
+        for name, statement in CASES.items()
+    }
+
+
+def main(number: int = 200_000):
+    legacy = measure(LegacyWorkspace, number)
+    current = measure(Workspace, number)
+
+    print(f"{'operation':<12}{'legacy (ns)':>14}{'tuple (ns)':>14}{'speed-up':>10}")
+    for name in CASES:
+        print(f"{name:<12}{legacy[name]:>14.1f}{current[name]:>14.1f}{legacy[name] / current[name]:>9.1f}x")
+
+    rect = Workspace(wintypes.RECT(0, 0, 1920, 1040))
+    print(f"\nhash(Workspace) -> {hash(rect)} (the legacy class is unhashable)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,65 @@
+"""
+Cost of importing `skeletal_framework.resources` versus first touching an image.
+
+Each measurement runs in a fresh interpreter with `-X importtime`, and only the
+resource modules (the package, the pack reader, PIL) are counted, so the
+(platform-dependent) cost of the parent package is left out.
+
+    python -m benchmarks.resources_import
+"""
+import statistics
+import subprocess
+import sys
+
+_RUNS = 5
+
+_COUNTED = ('skeletal_framework.resources', 'skeletal_framework.resource_pack', 'PIL')
+
+_SCENARIOS = {
+    'import only': 'import skeletal_framework.resources',
+    'import + EXCEPTION_FACE': 'import skeletal_framework.resources as r; r.EXCEPTION_FACE',
+    'import + both images': 'import skeletal_framework.resources as r; r.EXCEPTION_FACE; r.EXCEPTION_HAND',
+}
+
+
+def resources_import_us(statement: str) -> int:
+    """Cumulative import time, in microseconds, of the resource modules for one statement."""
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', statement],
+        capture_output = True, text = True, check = True
+    )
+
+    total = 0
+    for line in result.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        if not line.startswith('import time:') or '|' not in line:
+            continue
+
+        self_us, _, name = (part.strip() for part in line[len('import time:'):].split('|'))
+        if name.startswith(_COUNTED) and self_us.isdigit():
+            total += int(self_us)
+
+    return total
+
+
+def decode_ms(statement: str) -> float:
+    """Wall time of the statement beyond the bare import: decoding and opening the images."""
+    setup = 'import time, skeletal_framework.resources as r; start = time.perf_counter()'
+    code = f'{setup}; {statement.split(";", 1)[1] if ";" in statement else "pass"}; ' \
+           f'print((time.perf_counter() - start) * 1000)'
+
+    result = subprocess.run([sys.executable, '-c', code], capture_output = True, text = True, check = True)
+    return float(result.stdout.strip())
+
+
+def main():
+    print(f'{"scenario":<26}{"module import (ms)":>20}{"first access (ms)":>20}')
+
+    for name, statement in _SCENARIOS.items():
+        imports = statistics.median(resources_import_us(statement) for _ in range(_RUNS)) / 1000
+        access = statistics.median(decode_ms(statement) for _ in range(_RUNS))
+        print(f'{name:<26}{imports:>20.2f}{access:>20.2f}')
+
+
+if __name__ == '__main__':
+    main()
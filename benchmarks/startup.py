@@ -0,0 +1,323 @@
+"""
+Startup benchmarks: importing the package, and constructing, first painting and
+closing the dialogs.
+
+    python -m benchmarks.startup -o startup.json
+    python -m benchmarks.startup -o startup-new.json --compare startup.json
+
+Every sample runs in a fresh interpreter, since the first import and the first
+window of a process are exactly what is being measured (singletons, class
+registration and module caches would otherwise carry over between samples).
+
+- import: `-X importtime` output of `import skeletal_framework`, parsed into
+  per-module self/cumulative times and totals per package; medians over the runs.
+- lifecycle: wall time of the constructor, of the first paint of the window and
+  all its children (shown without activation, then `RedrawWindow` with
+  RDW_UPDATENOW | RDW_ALLCHILDREN), and of the teardown through WM_CLOSE, the
+  path a user's close takes. `ExceptionHandlerDialog` is measured with an empty
+  and with a filled canvas cache, each in a private cache directory.
+
+The lifecycle needs a real Win32 backend and is recorded as skipped elsewhere.
+Results are JSON, with the commit and interpreter they came from; `--compare`
+prints the change of every metric against an earlier file.
+"""
+import argparse
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+RESULTS_VERSION = 1
+
+_RUNS = 5
+
+# Modules listed individually in the printed summary
+_TOP_MODULES = 15
+
+# Changes smaller than this (percent) are shown as noise in a comparison
+_NOISE_PERCENT = 10.0
+
+# (dialog, canvas cache state) per lifecycle scenario
+_LIFECYCLE_SCENARIOS = {
+    'example_window': ('example', None),
+    'exception_dialog (cold cache)': ('exception', 'cold'),
+    'exception_dialog (warm cache)': ('exception', 'warm'),
+}
+
+_LIFECYCLE_METRICS = ('import_ms', 'construct_ms', 'first_paint_ms', 'teardown_ms')
+
+
+def parse_importtime(stderr: str) -> dict[str, tuple[int, int]]:
+    """Module -> (self, cumulative) microseconds from `-X importtime` output."""
+    modules = {}
+
+    for line in stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        if not line.startswith('import time:') or '|' not in line:
+            continue
+
+        self_us, cumulative_us, name = (part.strip() for part in line[len('import time:'):].split('|'))
+        if self_us.isdigit() and cumulative_us.isdigit():
+            modules[name] = int(self_us), int(cumulative_us)
+
+    return modules
+
+
+def _group(module: str) -> str:
+    """Packages are totalled by top-level name, the framework's by subpackage."""
+    parts = module.split('.')
+    if parts[0] == 'skeletal_framework' and len(parts) > 2:
+        return '.'.join(parts[:2])
+    return parts[0]
+
+
+def measure_import(runs: int = _RUNS) -> dict:
+    samples = []
+
+    for _ in range(runs):
+        result = subprocess.run(
+            [sys.executable, '-X', 'importtime', '-c', 'import skeletal_framework'],
+            capture_output = True, text = True
+        )
+        if result.returncode != 0:
+            return {'skipped': result.stderr.strip().splitlines()[-1]}
+
+        samples.append(parse_importtime(result.stderr))
+
+    # Median per module over the runs in which it was imported
+    modules = {}
+    for name in samples[0]:
+        self_times = [sample[name][0] for sample in samples if name in sample]
+        cumulative_times = [sample[name][1] for sample in samples if name in sample]
+        modules[name] = {
+            'self_ms': statistics.median(self_times) / 1000,
+            'cumulative_ms': statistics.median(cumulative_times) / 1000
+        }
+
+    groups: dict[str, float] = {}
+    for name, times in modules.items():
+        groups[_group(name)] = groups.get(_group(name), 0.0) + times['self_ms']
+
+    return {
+        'total_ms': statistics.median(sum(self_us for self_us, _ in sample.values()) for sample in samples) / 1000,
+        'modules': modules,
+        'groups': dict(sorted(groups.items(), key = lambda item: item[1], reverse = True))
+    }
+
+
+def _sample_log(lines: int = 2000) -> str:
+    frames = [
+        f'  File "C:\\Application\\module_{index % 40}.py", line {index * 7 % 900 + 1}, in handler_{index}\n'
+        f'    result = process(payload[{index}])\n'
+        for index in range(lines // 2)
+    ]
+    return 'Traceback (most recent call last):\n' + ''.join(frames) + 'RuntimeError: benchmark\n'
+
+
+def _lifecycle_child(dialog: str, cache_dir: str | None) -> dict:
+    """Runs in the child process: one construct / first paint / close cycle."""
+    start = time.perf_counter()
+
+    import win32con
+
+    from skeletal_framework.core_context import CoreContext
+    from skeletal_framework.win32_bindings.user32 import RedrawWindow, SendMessage, ShowWindow
+
+    if dialog == 'example':
+        from skeletal_framework.example_dialog import ExampleWindow as create
+    else:
+        from skeletal_framework import ExceptionHandlerDialog
+        from skeletal_framework.canvas_cache import CanvasCache
+
+        # First instance wins; the dialog's header then uses this directory
+        CanvasCache(cache_dir)
+        log_text = _sample_log()
+
+        def create():
+            return ExceptionHandlerDialog(RuntimeError, log_text)
+
+    imported = time.perf_counter()
+    create()
+    constructed = time.perf_counter()
+
+    hwnd = CoreContext().main_window
+    ShowWindow(hwnd, win32con.SW_SHOWNOACTIVATE)
+    RedrawWindow(
+        hwnd, None, None,
+        win32con.RDW_INVALIDATE | win32con.RDW_ERASE | win32con.RDW_UPDATENOW | win32con.RDW_ALLCHILDREN
+    )
+    painted = time.perf_counter()
+
+    SendMessage(hwnd, win32con.WM_CLOSE, 0, 0)
+    closed = time.perf_counter()
+
+    return {
+        'import_ms': (imported - start) * 1000,
+        'construct_ms': (constructed - imported) * 1000,
+        'first_paint_ms': (painted - constructed) * 1000,
+        'teardown_ms': (closed - painted) * 1000
+    }
+
+
+def _run_child(dialog: str, cache_dir: str | None) -> dict:
+    command = [sys.executable, '-m', 'benchmarks.startup', '--child', dialog]
+    if cache_dir is not None:
+        command += ['--canvas-cache', cache_dir]
+
+    result = subprocess.run(command, capture_output = True, text = True, cwd = Path(__file__).parent.parent)
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1] if result.stderr.strip() else 'child failed')
+
+    # The framework may print; the measurement is the last line
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def measure_lifecycle(runs: int = _RUNS) -> dict:
+    if sys.platform != 'win32':
+        return {name: {'skipped': f'needs Win32, running on {sys.platform}'} for name in _LIFECYCLE_SCENARIOS}
+
+    results = {}
+    for name, (dialog, cache_state) in _LIFECYCLE_SCENARIOS.items():
+        with tempfile.TemporaryDirectory() as cache_root:
+            samples = []
+
+            for index in range(runs):
+                cache_dir = None
+                if cache_state == 'cold':
+                    cache_dir = str(Path(cache_root) / str(index))
+                elif cache_state == 'warm':
+                    cache_dir = cache_root
+
+                try:
+                    if cache_state == 'warm' and index == 0:
+                        # Fills the cache; not counted
+                        _run_child(dialog, cache_dir)
+
+                    samples.append(_run_child(dialog, cache_dir))
+                except RuntimeError as error:
+                    results[name] = {'skipped': str(error)}
+                    break
+
+            else:
+                results[name] = {
+                    metric: statistics.median(sample[metric] for sample in samples)
+                    for metric in _LIFECYCLE_METRICS
+                }
+
+    return results
+
+
+def _git_commit() -> str | None:
+    try:
+        result = subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'],
+            capture_output = True, text = True, cwd = Path(__file__).parent.parent
+        )
+    except OSError:
+        return None
+
+    if result.returncode != 0:
+        return None
+    return result.stdout.strip() or None
+
+
+def run(runs: int = _RUNS) -> dict:
+    return {
+        'version': RESULTS_VERSION,
+        'timestamp': datetime.now(timezone.utc).isoformat(timespec = 'seconds'),
+        'commit': _git_commit(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'runs': runs,
+        'import': measure_import(runs),
+        'lifecycle': measure_lifecycle(runs)
+    }
+
+
+def _metrics(results: dict) -> dict[str, float]:
+    """Flat name -> milliseconds of everything worth comparing."""
+    metrics = {}
+
+    imports = results.get('import', {})
+    if 'total_ms' in imports:
+        metrics['import total'] = imports['total_ms']
+        for group, milliseconds in imports['groups'].items():
+            metrics[f'import {group}'] = milliseconds
+
+    for scenario, values in results.get('lifecycle', {}).items():
+        for metric in _LIFECYCLE_METRICS:
+            if metric in values:
+                metrics[f'{scenario} {metric}'] = values[metric]
+
+    return metrics
+
+
+def print_results(results: dict) -> None:
+    imports = results['import']
+    if 'skipped' in imports:
+        print(f'import: skipped ({imports["skipped"]})')
+    else:
+        print(f'import skeletal_framework: {imports["total_ms"]:.2f} ms')
+
+        print(f'\n{"package":<40}{"self (ms)":>12}')
+        for group, milliseconds in imports['groups'].items():
+            print(f'{group:<40}{milliseconds:>12.2f}')
+
+        print(f'\n{"module":<52}{"self (ms)":>12}{"cumulative (ms)":>18}')
+        slowest = sorted(imports['modules'].items(), key = lambda item: item[1]['self_ms'], reverse = True)
+        for name, times in slowest[:_TOP_MODULES]:
+            print(f'{name:<52}{times["self_ms"]:>12.2f}{times["cumulative_ms"]:>18.2f}')
+
+    print(f'\n{"dialog":<32}' + ''.join(f'{metric:>16}' for metric in _LIFECYCLE_METRICS))
+    for scenario, values in results['lifecycle'].items():
+        if 'skipped' in values:
+            print(f'{scenario:<32}skipped ({values["skipped"]})')
+        else:
+            print(f'{scenario:<32}' + ''.join(f'{values[metric]:>16.2f}' for metric in _LIFECYCLE_METRICS))
+
+
+def print_comparison(old: dict, new: dict) -> None:
+    old_metrics, new_metrics = _metrics(old), _metrics(new)
+
+    print(f'\n{old.get("commit") or "old"} -> {new.get("commit") or "new"}')
+    print(f'{"metric":<56}{"old (ms)":>12}{"new (ms)":>12}{"change":>10}')
+
+    for name in sorted(old_metrics.keys() & new_metrics.keys()):
+        before, after = old_metrics[name], new_metrics[name]
+        change = (after - before) / before * 100 if before else 0.0
+        note = '' if abs(change) < _NOISE_PERCENT else ('  slower' if change > 0 else '  faster')
+        print(f'{name:<56}{before:>12.2f}{after:>12.2f}{change:>+9.1f}%{note}')
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog = 'python -m benchmarks.startup', description = __doc__.split('\n\n')[0].strip())
+    parser.add_argument('-o', '--output', type = Path, help = 'write the results to this JSON file')
+    parser.add_argument('--compare', type = Path, help = 'earlier results to compare against')
+    parser.add_argument('-n', '--runs', type = int, default = _RUNS, help = 'samples per measurement (default: %(default)s)')
+    parser.add_argument('--child', choices = ('example', 'exception'), help = argparse.SUPPRESS)
+    parser.add_argument('--canvas-cache', help = argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.child:
+        print(json.dumps(_lifecycle_child(args.child, args.canvas_cache)))
+        return 0
+
+    results = run(args.runs)
+    print_results(results)
+
+    if args.output is not None:
+        args.output.write_text(json.dumps(results, indent = 2), encoding = 'utf-8')
+
+    if args.compare is not None:
+        print_comparison(json.loads(args.compare.read_text(encoding = 'utf-8')), results)
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
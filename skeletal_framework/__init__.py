@@ -1,3 +1,14 @@
-from skeletal_framework._error_handling import ExceptionHandlerDialog
+from typing import TYPE_CHECKING
+
+from skeletal_framework._lazy import lazy_attributes
+
+if TYPE_CHECKING:
+    from skeletal_framework._error_handling import ExceptionHandlerDialog
 
 __all__ = ['ExceptionHandlerDialog']
+
+# Importing the package loads nothing else; the crash dialog (and with it Pillow
+# and rich) is imported the first time it is used
+__getattr__, __dir__ = lazy_attributes(globals(), {
+    'ExceptionHandlerDialog': 'skeletal_framework._error_handling',
+})
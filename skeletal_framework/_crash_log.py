@@ -0,0 +1,448 @@
+"""
+Background writer for crash reports.
+
+A crash handler runs while the process is already in trouble, so it should do
+as little as possible itself. `CrashLogWriter.submit` only puts the report on a
+bounded queue; a daemon thread writes it to its own file, echoes it to the
+console from memory, and trims the directory:
+
+    CrashLogWriter().submit(CrashReport(text))
+
+- File names carry the time down to microseconds plus a sequence number, and
+  are created exclusively, so reports of the same second never overwrite
+  each other.
+- When the queue is full (a crash loop) reports are dropped and counted rather
+  than blocking the crashing thread.
+- The directory is kept under `max_files` reports and `max_bytes`, oldest
+  first; with `compress_after` set, all but that many newest reports are
+  gzipped.
+- Reports that carry a fingerprint (see `_crash_record.crash_fingerprint`)
+  are counted in a `CrashIndex`; a crash that is already known, and whose
+  sample report still exists, only bumps its counter instead of writing
+  another copy of the same traceback.
+- Reports that carry a `CrashRecord` are also appended as one JSON line to
+  `crashes.jsonl`, which is rotated to `crashes.1.jsonl` at `max_record_bytes`.
+  Repeats get their line too, pointing at the sample report.
+- Pending reports are flushed at interpreter exit.
+
+The first `CrashLogWriter(...)` call configures the process-wide instance.
+"""
+import atexit
+import gzip
+import json
+import os
+import queue
+import shutil
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime
+from operator import attrgetter
+from pathlib import Path
+
+from skeletal_framework._crash_record import CrashRecord
+from skeletal_framework._lazy import lazy_import, preload
+from skeletal_framework.singleton import Singleton
+
+__all__ = ['CrashEntry', 'CrashIndex', 'CrashLogWriter', 'CrashReport', 'default_crash_dir']
+
+# Only needed once a report is echoed
+rich_console = lazy_import('rich.console')
+
+_SUFFIXES = ('.log', '.log.gz')
+
+INDEX_NAME = 'index.jsonl'
+RECORDS_NAME = 'crashes.jsonl'
+RECORDS_ROTATED_NAME = 'crashes.1.jsonl'
+
+
+def default_crash_dir() -> Path:
+    return Path(__file__).parent.parent / 'crash_reports'
+
+
+@dataclass(slots = True)
+class CrashReport:
+    text: str
+    time: datetime = field(default_factory = datetime.now)
+    # Identifies repeats of the same crash; reports without one are always written
+    fingerprint: str | None = None
+    exception: str = ''
+    # Written to the structured log as well when given
+    record: CrashRecord | None = None
+
+
+@dataclass(slots = True)
+class CrashEntry:
+    fingerprint: str
+    first_seen: datetime
+    last_seen: datetime
+    count: int
+    exception: str
+    # Name of a full report of this crash, relative to the crash directory
+    sample: str | None
+
+    def to_json(self) -> str:
+        return json.dumps({
+            'fingerprint': self.fingerprint,
+            'first': self.first_seen.isoformat(),
+            'last': self.last_seen.isoformat(),
+            'count': self.count,
+            'exception': self.exception,
+            'sample': self.sample
+        }, separators = (',', ':'))
+
+    @classmethod
+    def from_json(cls, line: str) -> 'CrashEntry':
+        data = json.loads(line)
+        return cls(
+            data['fingerprint'],
+            datetime.fromisoformat(data['first']),
+            datetime.fromisoformat(data['last']),
+            int(data['count']),
+            data['exception'],
+            data['sample']
+        )
+
+    def merge(self, other: 'CrashEntry') -> None:
+        self.first_seen = min(self.first_seen, other.first_seen)
+        self.last_seen = max(self.last_seen, other.last_seen)
+        self.count += other.count
+        self.exception = other.exception or self.exception
+        self.sample = other.sample or self.sample
+
+
+class CrashIndex:
+    """
+    Per-fingerprint crash counts, kept next to the reports in `index.jsonl`.
+
+    Every occurrence appends one line with a count of 1; loading folds the lines
+    per fingerprint, so `top` never has to open a report. Once the file holds
+    many more lines than fingerprints it is rewritten with one line each, which
+    keeps it proportional to the number of distinct crashes rather than to
+    their count.
+    """
+
+    # Rewrite once there are this many lines per fingerprint (plus a small allowance)
+    COMPACT_RATIO = 4
+    COMPACT_SLACK = 64
+
+    def __init__(self, directory: str | os.PathLike):
+        self.path = Path(directory) / INDEX_NAME
+
+        self._lock = threading.Lock()
+        self._entries: dict[str, CrashEntry] | None = None
+        self._lines = 0
+
+    def _load(self) -> dict[str, CrashEntry]:
+        if self._entries is not None:
+            return self._entries
+
+        entries = {}
+        lines = 0
+
+        try:
+            with open(self.path, encoding = 'utf-8') as file:
+                for line in file:
+                    try:
+                        entry = CrashEntry.from_json(line)
+                    except (ValueError, KeyError, TypeError):
+                        # A torn last line from a killed process
+                        continue
+
+                    lines += 1
+                    if entry.fingerprint in entries:
+                        entries[entry.fingerprint].merge(entry)
+                    else:
+                        entries[entry.fingerprint] = entry
+        except OSError:
+            pass
+
+        self._entries, self._lines = entries, lines
+        return entries
+
+    def get(self, fingerprint: str) -> CrashEntry | None:
+        with self._lock:
+            return self._load().get(fingerprint)
+
+    def record(self, fingerprint: str, time: datetime, exception: str, sample: str | None) -> CrashEntry:
+        """Count one occurrence; `sample` replaces the stored report name when given."""
+        occurrence = CrashEntry(fingerprint, time, time, 1, exception, sample)
+
+        with self._lock:
+            entries = self._load()
+
+            if fingerprint in entries:
+                entries[fingerprint].merge(occurrence)
+            else:
+                entries[fingerprint] = CrashEntry(fingerprint, time, time, 1, exception, sample)
+
+            self.path.parent.mkdir(parents = True, exist_ok = True)
+            with open(self.path, 'a', encoding = 'utf-8') as file:
+                file.write(occurrence.to_json() + '\n')
+            self._lines += 1
+
+            if self._lines > self.COMPACT_RATIO * len(entries) + self.COMPACT_SLACK:
+                self._compact()
+
+            return self._entries[fingerprint]
+
+    def top(self, limit: int = 10) -> list[CrashEntry]:
+        """The most frequent crashes, most recent first among equal counts."""
+        with self._lock:
+            entries = list(self._load().values())
+
+        entries.sort(key = attrgetter('last_seen'), reverse = True)
+        entries.sort(key = attrgetter('count'), reverse = True)
+        return entries[:limit]
+
+    def _compact(self) -> None:
+        # Re-read first, other processes may have appended since the last load
+        self._entries = None
+        entries = self._load()
+        temporary = self.path.with_name(f'{self.path.name}.{os.getpid()}.tmp')
+
+        try:
+            temporary.write_text(''.join(entry.to_json() + '\n' for entry in entries.values()), encoding = 'utf-8')
+            os.replace(temporary, self.path)
+            self._lines = len(entries)
+        except OSError:
+            temporary.unlink(missing_ok = True)
+
+
+class CrashLogWriter(Singleton):
+    """
+    Process-wide crash report writer.
+
+    Args:
+        directory: Where reports are written; created on first write.
+        max_queue: Reports waiting to be written before new ones are dropped.
+        max_files: Reports kept in the directory.
+        max_bytes: Total size of the reports kept.
+        compress_after: Number of newest reports left as plain text; older ones are
+                        gzipped. None disables compression.
+        max_record_bytes: Size at which the structured log is rotated.
+        echo: Print every report to the console.
+    """
+
+    # How long the exit handler waits for pending reports
+    EXIT_TIMEOUT = 2.0
+
+    def __init__(
+            self,
+            directory: str | os.PathLike | None = None,
+            *,
+            max_queue: int = 32,
+            max_files: int = 200,
+            max_bytes: int = 50 * 1024 * 1024,
+            compress_after: int | None = None,
+            max_record_bytes: int = 8 * 1024 * 1024,
+            echo: bool = True
+    ):
+        self.directory = Path(directory) if directory is not None else default_crash_dir()
+        self.max_files = max_files
+        self.max_bytes = max_bytes
+        self.compress_after = compress_after
+        self.max_record_bytes = max_record_bytes
+        self.echo = echo
+
+        self._queue: queue.Queue[CrashReport | None] = queue.Queue(maxsize = max_queue)
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+        self._sequence = 0
+
+        self.index = CrashIndex(self.directory)
+
+        self.written = 0
+        self.repeated = 0
+        self.dropped = 0
+        self.last_path: Path | None = None
+
+    def prepare(self) -> None:
+        """Start the thread, and load the console if reports are echoed, before the first crash."""
+        self._start()
+        if self.echo:
+            preload(rich_console)
+
+    def submit(self, report: CrashReport) -> bool:
+        """Queue a report; returns False if it was dropped because the queue is full."""
+        self._start()
+
+        try:
+            self._queue.put_nowait(report)
+        except queue.Full:
+            self.dropped += 1
+            return False
+
+        return True
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Wait until every queued report is written; returns False on timeout."""
+        with self._queue.all_tasks_done:
+            return self._queue.all_tasks_done.wait_for(lambda: not self._queue.unfinished_tasks, timeout)
+
+    def close(self, timeout: float | None = None) -> None:
+        """Write what is queued and stop the thread; a later `submit` starts it again."""
+        with self._lock:
+            thread, self._thread = self._thread, None
+
+        if thread is None:
+            return
+
+        try:
+            self._queue.put(None, timeout = timeout)
+        except queue.Full:
+            return
+
+        thread.join(timeout)
+
+    def _start(self) -> None:
+        with self._lock:
+            if self._thread is not None:
+                return
+
+            self._thread = threading.Thread(target = self._run, name = 'CrashLogWriter', daemon = True)
+            self._thread.start()
+
+        atexit.unregister(self._close_at_exit)
+        atexit.register(self._close_at_exit)
+
+    def _close_at_exit(self) -> None:
+        self.close(self.EXIT_TIMEOUT)
+
+    def _run(self) -> None:
+        while True:
+            report = self._queue.get()
+            try:
+                if report is None:
+                    return
+                self._write(report)
+            except Exception:  # noqa
+                # Failing to log a crash must not take the writer down with it
+                pass
+            finally:
+                self._queue.task_done()
+
+    def top_crashes(self, limit: int = 10) -> list[CrashEntry]:
+        return self.index.top(limit)
+
+    def _write(self, report: CrashReport) -> None:
+        if report.fingerprint is not None:
+            known = self.index.get(report.fingerprint)
+
+            if known is not None and self._sample_exists(known.sample):
+                entry = self.index.record(report.fingerprint, report.time, report.exception, None)
+                self.repeated += 1
+
+                # Only the text report is deduplicated; every crash keeps its record
+                if report.record is not None:
+                    self._append_record(report.record.to_json(report = known.sample))
+
+                if self.echo:
+                    rich_console.Console(highlight = False, style = 'red').print(
+                        f'{report.exception or "Crash"} seen {entry.count} times; see {known.sample}'
+                    )
+                return
+
+        self.directory.mkdir(parents = True, exist_ok = True)
+
+        stem = f'{report.time.strftime("%m-%d-%Y %H.%M.%S")}.{report.time.microsecond:06d}'
+        while True:
+            self._sequence += 1
+            path = self.directory / f'{stem}-{os.getpid()}-{self._sequence}.log'
+
+            # Exclusive creation; another process may use the same name
+            try:
+                with open(path, 'x', encoding = 'utf-8') as file:
+                    file.write(report.text)
+                break
+            except FileExistsError:
+                continue
+
+        self.written += 1
+        self.last_path = path
+
+        if report.fingerprint is not None:
+            self.index.record(report.fingerprint, report.time, report.exception, path.name)
+
+        if report.record is not None:
+            self._append_record(report.record.to_json(report = path.name))
+
+        if self.echo:
+            rich_console.Console(highlight = False, style = 'red').print(report.text)
+
+        self._enforce_retention()
+
+    def _append_record(self, line: str) -> None:
+        path = self.directory / RECORDS_NAME
+
+        try:
+            if path.stat().st_size >= self.max_record_bytes:
+                os.replace(path, self.directory / RECORDS_ROTATED_NAME)
+        except OSError:
+            pass
+
+        with open(path, 'a', encoding = 'utf-8') as file:
+            file.write(line + '\n')
+
+    def _sample_exists(self, sample: str | None) -> bool:
+        # Retention may have deleted or gzipped it since
+        return sample is not None and any((self.directory / (sample + suffix)).exists() for suffix in ('', '.gz'))
+
+    def _reports(self) -> list[tuple[float, int, Path]]:
+        """(mtime, size, path) of every report, oldest first."""
+        reports = []
+
+        try:
+            with os.scandir(self.directory) as entries:
+                for entry in entries:
+                    if not entry.name.endswith(_SUFFIXES):
+                        continue
+                    try:
+                        stat = entry.stat()
+                    except OSError:
+                        continue
+                    reports.append((stat.st_mtime, stat.st_size, Path(entry.path)))
+        except OSError:
+            pass
+
+        return sorted(reports)
+
+    def _enforce_retention(self) -> None:
+        reports = self._reports()
+
+        if self.compress_after is not None:
+            plain = [item for item in reports if item[2].suffix == '.log']
+            for mtime, size, path in plain[:max(0, len(plain) - self.compress_after)]:
+                compressed = self._compress(path, mtime)
+                if compressed is not None:
+                    reports[reports.index((mtime, size, path))] = compressed
+
+        total = sum(size for _, size, _ in reports)
+        count = len(reports)
+
+        for _, size, path in reports:
+            if count <= self.max_files and total <= self.max_bytes:
+                break
+
+            try:
+                path.unlink()
+            except OSError:
+                continue
+
+            count -= 1
+            total -= size
+
+    @staticmethod
+    def _compress(path: Path, mtime: float) -> tuple[float, int, Path] | None:
+        """Gzip a report in place of the original; keeps its mtime so the age order holds."""
+        target = path.with_name(path.name + '.gz')
+
+        try:
+            with open(path, 'rb') as source, gzip.open(target, 'wb') as destination:
+                shutil.copyfileobj(source, destination)
+            os.utime(target, (mtime, mtime))
+            path.unlink()
+            return mtime, target.stat().st_size, target
+
+        except OSError:
+            target.unlink(missing_ok = True)
+            return None
@@ -0,0 +1,338 @@
+"""
+Structured description of a crash.
+
+`build_crash_record` turns an uncaught exception into a `CrashRecord`: the
+exception chain with its frames, the thread, the time, the fingerprint and the
+formatted traceback text. The crash dialog shows the record and the log writer
+stores it, both as the usual text report and, when structured logging is on,
+as one JSON line per crash:
+
+    record = build_crash_record(exc_type, exc_value, exc_traceback, locals_budget = LocalsBudget())
+    record.to_json()
+
+Local variables are only captured when a `LocalsBudget` is given. Every value
+goes through a size-limited `reprlib.Repr`, and capture stops at the per-frame
+byte and time budgets. A single `__repr__` cannot be interrupted, so each frame
+is captured on its own worker thread and the handler stops waiting after
+`total_seconds`, keeping whatever was done by then; capture can delay a crash
+report by that much at most.
+"""
+import hashlib
+import json
+import linecache
+import os
+import reprlib
+import threading
+import time
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from pathlib import PurePath
+from threading import Thread
+from traceback import format_exception, walk_tb
+from types import FrameType, TracebackType
+from typing import Any, ClassVar, Type
+
+__all__ = ['CrashRecord', 'ExceptionRecord', 'FrameRecord', 'LocalsBudget', 'build_crash_record', 'crash_fingerprint']
+
+# Trailing path components kept of a frame's file; drops the install location
+_FINGERPRINT_PATH_PARTS = 2
+
+# Exception messages are clipped to this many bytes
+_MESSAGE_BYTES = 4096
+
+
+def _exception_chain(exc_value: BaseException | None):
+    """The exception and its causes / contexts, as the traceback printout walks them."""
+    seen = set()
+
+    while exc_value is not None and id(exc_value) not in seen:
+        seen.add(id(exc_value))
+        yield exc_value
+
+        if exc_value.__cause__ is not None:
+            exc_value = exc_value.__cause__
+        elif not exc_value.__suppress_context__:
+            exc_value = exc_value.__context__
+        else:
+            exc_value = None
+
+
+def _qualified_name(kind: type) -> str:
+    return f'{kind.__module__}.{kind.__qualname__}'
+
+
+def _normalized_file(filename: str) -> str:
+    return '/'.join(PurePath(filename).parts[-_FINGERPRINT_PATH_PARTS:]).lower()
+
+
+def crash_fingerprint(exc_type: Type[BaseException], exc_value: BaseException | None, exc_traceback: TracebackType | None) -> str:
+    """
+    Stable identifier of a crash: a digest of the exception types and the frames
+    (file, function, line) of the whole chain. Messages are left out, as they
+    usually carry values that differ between otherwise identical crashes, and
+    files are reduced to their last components so that installs in different
+    directories agree.
+    """
+    digest = hashlib.sha1(usedforsecurity = False)
+
+    chain = list(_exception_chain(exc_value)) or [None]
+    for index, exception in enumerate(chain):
+        kind = exc_type if index == 0 else type(exception)
+        traceback = exc_traceback if index == 0 else exception.__traceback__
+
+        digest.update(f'{_qualified_name(kind)}\n'.encode())
+        for frame, line in walk_tb(traceback):
+            digest.update(f'{_normalized_file(frame.f_code.co_filename)}:{frame.f_code.co_name}:{line}\n'.encode())
+
+    return digest.hexdigest()[:16]
+
+
+@dataclass(frozen = True, slots = True)
+class LocalsBudget:
+    """
+    Limits of a locals snapshot.
+
+    Args:
+        value_bytes: Longest repr kept of a single value (UTF-8 bytes).
+        frame_bytes: Reprs kept per frame; later variables are dropped.
+        value_seconds: A repr slower than this is discarded, and values of the same
+                       type are not repr'd again in this snapshot.
+        frame_seconds: Time spent per frame; later variables are dropped.
+        total_seconds: Hard limit for the whole snapshot.
+        frames: Innermost frames captured.
+    """
+    value_bytes: int = 256
+    frame_bytes: int = 4096
+    value_seconds: float = 0.005
+    frame_seconds: float = 0.02
+    total_seconds: float = 0.2
+    frames: int = 16
+
+
+def _clip(text: str, limit: int) -> str:
+    encoded = text.encode('utf-8', 'backslashreplace')
+    if len(encoded) <= limit:
+        return text
+
+    return encoded[:max(0, limit - 3)].decode('utf-8', 'ignore') + '...'
+
+
+class _BoundedRepr(reprlib.Repr):
+    """reprlib with every result clipped to the value budget, and slow types skipped."""
+
+    def __init__(self, budget: LocalsBudget):
+        super().__init__(maxlevel = 3, maxstring = budget.value_bytes, maxother = budget.value_bytes, maxlong = 64)
+        self.budget = budget
+        self.slow_types: set[type] = set()
+
+    def repr_instance(self, x: Any, level: int) -> str:
+        kind = type(x)
+        if kind in self.slow_types:
+            return f'<{kind.__qualname__} (slow repr skipped)>'
+
+        return super().repr_instance(x, level)
+
+    def value(self, x: Any) -> str:
+        start = time.perf_counter()
+        try:
+            text = _clip(self.repr(x), self.budget.value_bytes)
+        except Exception as error:  # noqa
+            text = f'<{type(x).__qualname__} (repr raised {type(error).__name__})>'
+
+        elapsed = time.perf_counter() - start
+        if elapsed > self.budget.value_seconds:
+            self.slow_types.add(type(x))
+            return f'<{type(x).__qualname__} (repr took {elapsed * 1000:.0f} ms)>'
+
+        return text
+
+
+def _snapshot_frame(frame: FrameType, bounded: _BoundedRepr, values: dict[str, str], cancelled: threading.Event) -> bool:
+    """
+    Fills `values` with reprs of the frame's locals within the frame budget; returns
+    whether some were dropped. Values appear one by one, so a frame that runs out
+    of time still shows what was done.
+    """
+    budget = bounded.budget
+    start = time.perf_counter()
+    used = 0
+
+    for name, value in list(frame.f_locals.items()):
+        if used >= budget.frame_bytes or time.perf_counter() - start > budget.frame_seconds or cancelled.is_set():
+            return True
+
+        text = bounded.value(value)
+        values[name] = text
+        used += len(name) + len(text.encode('utf-8', 'backslashreplace'))
+
+    return False
+
+
+def _capture_locals(frames: list[FrameType], budget: LocalsBudget) -> list[tuple[dict[str, str], bool]]:
+    """
+    (locals, truncated) per frame. Every frame is captured on its own worker thread,
+    so one slow `__repr__` only costs its own frame; whatever is not done after
+    `total_seconds` is returned as it stands.
+    """
+    bounded = _BoundedRepr(budget)
+    cancelled = threading.Event()
+
+    values: list[dict[str, str]] = [{} for _ in frames]
+    truncated = [True] * len(frames)
+
+    def capture(index: int):
+        truncated[index] = _snapshot_frame(frames[index], bounded, values[index], cancelled)
+
+    deadline = time.perf_counter() + budget.total_seconds
+    workers = []
+
+    for index in range(len(frames)):
+        worker = Thread(target = capture, args = (index,), name = 'CrashLocalsSnapshot', daemon = True)
+        try:
+            worker.start()
+        except RuntimeError:
+            # No new threads during interpreter shutdown
+            break
+        workers.append(worker)
+
+    for worker in workers:
+        worker.join(max(0.0, deadline - time.perf_counter()))
+    cancelled.set()
+
+    # Copies, as late workers may still be adding to them
+    return [
+        (dict(values[index]), truncated[index] or workers[index].is_alive() if index < len(workers) else True)
+        for index in range(len(frames))
+    ]
+
+
+@dataclass(slots = True)
+class FrameRecord:
+    file: str
+    function: str
+    line: int | None
+    code: str
+    # Variable -> bounded repr; None when locals were not captured for this frame
+    locals: dict[str, str] | None = None
+    locals_truncated: bool = False
+
+
+@dataclass(slots = True)
+class ExceptionRecord:
+    type: str
+    message: str
+    # How it relates to the exception before it in the chain: 'cause', 'context' or None
+    relation: str | None
+    frames: list[FrameRecord] = field(default_factory = list)
+
+
+@dataclass(slots = True)
+class CrashRecord:
+    fingerprint: str
+    time: datetime
+    thread: str | None
+    exceptions: list[ExceptionRecord]
+    # The formatted traceback, as shown in the dialog and written to the .log report
+    text: str
+    pid: int = field(default_factory = os.getpid)
+    capture_ms: float = 0.0
+    # Not serialized; lets the dialog and the handlers see the actual class
+    exc_type: Type[BaseException] | None = field(default = None, repr = False, compare = False)
+
+    VERSION: ClassVar[int] = 1
+
+    @property
+    def exception_name(self) -> str:
+        return self.exceptions[0].type.rpartition('.')[2] if self.exceptions else 'Exception'
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            'version': self.VERSION,
+            'fingerprint': self.fingerprint,
+            'time': self.time.astimezone().isoformat(),
+            'unix_time': self.time.timestamp(),
+            'pid': self.pid,
+            'thread': self.thread,
+            'capture_ms': round(self.capture_ms, 3),
+            'exceptions': [asdict(exception) for exception in self.exceptions]
+        }
+
+    def to_json(self, **extra: Any) -> str:
+        """One line of JSON; `extra` keys (such as the report file) are added to it."""
+        return json.dumps(self.to_dict() | extra, ensure_ascii = False, separators = (',', ':'))
+
+
+def _message(exc_value: BaseException | None) -> str:
+    if exc_value is None:
+        return ''
+
+    try:
+        return _clip(str(exc_value), _MESSAGE_BYTES)
+    except Exception:  # noqa
+        return f'<{type(exc_value).__qualname__} (str raised)>'
+
+
+def build_crash_record(
+        exc_type: Type[BaseException],
+        exc_value: BaseException | None,
+        exc_traceback: TracebackType | None,
+        exc_thread: Thread | None = None,
+        locals_budget: LocalsBudget | None = None
+) -> CrashRecord:
+    start = time.perf_counter()
+    now = datetime.now()
+
+    text = format_exception(exc_type, exc_value, exc_traceback)
+    if exc_thread is not None:
+        text.insert(0, f'Exception occurred in thread: {exc_thread.name!r}\n')
+
+    exceptions = []
+    # Frame objects, innermost of the raised exception first, for the locals snapshot
+    live_frames: list[tuple[FrameType, FrameRecord]] = []
+
+    relation = None
+    for index, exception in enumerate(list(_exception_chain(exc_value)) or [None]):
+        kind = exc_type if index == 0 else type(exception)
+        traceback = exc_traceback if index == 0 else exception.__traceback__
+
+        record = ExceptionRecord(_qualified_name(kind), _message(exception), relation)
+        for frame, line in walk_tb(traceback):
+            code = frame.f_code
+            frame_record = FrameRecord(
+                code.co_filename, code.co_name, line,
+                linecache.getline(code.co_filename, line).strip() if line is not None else ''
+            )
+            record.frames.append(frame_record)
+            live_frames.append((frame, frame_record))
+
+        exceptions.append(record)
+
+        if exception is not None:
+            relation = 'cause' if exception.__cause__ is not None else 'context'
+
+    if locals_budget is not None and live_frames:
+        # Innermost frames first: within the raised exception, then down the chain
+        outer = len(exceptions[0].frames)
+        ordered = live_frames[:outer][::-1] + live_frames[outer:][::-1]
+
+        # A frame that shows up in several tracebacks of the chain is captured once
+        unique: dict[int, FrameType] = {}
+        for frame, _ in ordered:
+            if len(unique) < locals_budget.frames:
+                unique.setdefault(id(frame), frame)
+
+        snapshots = dict(zip(unique, _capture_locals(list(unique.values()), locals_budget)))
+        for frame, frame_record in ordered:
+            if id(frame) in snapshots:
+                values, frame_record.locals_truncated = snapshots[id(frame)]
+                frame_record.locals = dict(values)
+
+    return CrashRecord(
+        fingerprint = crash_fingerprint(exc_type, exc_value, exc_traceback),
+        time = now,
+        thread = exc_thread.name if exc_thread is not None else threading.current_thread().name,
+        exceptions = exceptions,
+        text = ''.join(text),
+        capture_ms = (time.perf_counter() - start) * 1000,
+        exc_type = exc_type
+    )
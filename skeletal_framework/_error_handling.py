@@ -1,42 +1,67 @@
 import ctypes
 import sys
 import threading
-from traceback import format_exception
 from ctypes import wintypes
-from datetime import datetime
-from pathlib import Path
 from threading import Thread, ExceptHookArgs
 from typing import Type
 from types import TracebackType
 
-
-import rich
 import win32con
 
+from skeletal_framework import resources
+from skeletal_framework._crash_log import CrashLogWriter, CrashReport
+from skeletal_framework._crash_record import CrashRecord, LocalsBudget, build_crash_record, crash_fingerprint  # noqa
 from skeletal_framework.controls.editbox import CustomEditBox
 from skeletal_framework.controls.header import Header
+from skeletal_framework.controls.virtual_text_view import VirtualTextView
 from skeletal_framework.core_context import CoreContext
 from skeletal_framework.dispatcher import Dispatcher
+from skeletal_framework.dpi import DpiContext, WM_DPICHANGED, enable_per_monitor_dpi_awareness, handle_dpi_changed
+from skeletal_framework.layout.box_layout import Column, ControlItem, LayoutNode, Margins
+from skeletal_framework.layout.live_resize import LiveResize
+from skeletal_framework.layout.transaction import move_window
+from skeletal_framework.monitor_registry import MonitorRegistry
 from skeletal_framework.win32_bindings.dwmapi import DwmSetWindowAttribute, DWMWINDOWATTRIBUTE  # noqa
 from skeletal_framework.win32_bindings.gdi32 import *
 from skeletal_framework.win32_bindings.kernel32 import GetModuleHandle
-from skeletal_framework.win32_bindings.macros import hiword, loword
-from skeletal_framework.win32_bindings.monitor_info import GetMonitorInfo, MonitorFromPoint
 from skeletal_framework.win32_bindings.user32 import *
-from skeletal_framework.resources import *
 
 
 class ExceptionHandlerDialog:
-    _ID_EDITBOX = 1000
+    _class_name = 'ExceptionHandlerDialogClass'
+    _ATOM = None
+    # The prewarm thread may register the class while a crash does the same
+    _register_lock = threading.Lock()
+
+    # Client size in 96-DPI units
+    _width = 800
+    _height = 600
+    _min_width = 400
+    _min_height = 300
+
+    _header_edge_length = 125
+
+    font_name = "Segoe UI"
+    font_size = 12
+
+    # Longest a crash waits for a prewarm still in progress; whatever it has not done
+    # by then, the dialog does itself
+    _PREWARM_WAIT_SECONDS = 0.25
+
+    # Set by install_exception_handlers
+    _structured_log = False
+    _locals_budget: LocalsBudget | None = None
+    _prewarm_thread: Thread | None = None
 
-    def __init__(self, exc_type: Type[BaseException], log_text: str):
+    def __init__(self, exc_type: Type[BaseException], log_text: str, record: CrashRecord | None = None):
         self._core_context = CoreContext()
+        self._monitor_registry = MonitorRegistry()
 
-        self._class_name = 'ExceptionHandlerDialogClass'
         self._window_name = 'Application has crashed . . .'
 
         self._exception_name = exc_type.__name__
-        self._log_text = '\r\n'.join(log_text.splitlines())
+        self._log_text = log_text
+        self.record = record
 
         self._hbr_background = GetSysColorBrush(win32con.COLOR_BTNFACE)
         # self._hbr_background = CreateSolidBrush(
@@ -45,18 +70,14 @@ class ExceptionHandlerDialog:
         #     )
         # )
 
-        self._width = 800
-        self._height = 600
-
-        self.font_name = "Segoe UI"
-        self.font_size = 12
-
-        self._h_font = self._create_font()
+        self._dpi: DpiContext | None = None
         self._header: Header | None = None
-        self._edit_box: int | None = None
+        self._log_view: VirtualTextView | None = None
+        self._layout: LayoutNode | None = None
+        self._live_resize: LiveResize | None = None
         self._h_instance = GetModuleHandle(None)
 
-        self._atom = self._register_class()
+        self._register_class(self._h_instance)
         self._create_window()
 
     def wnd_proc(self, hwnd, msg, wparam, lparam):
@@ -65,18 +86,32 @@ class ExceptionHandlerDialog:
                 key = 'main_window',
                 value = hwnd
             )
+            self._dpi = DpiContext.for_window(hwnd)
+            self._live_resize = LiveResize(hwnd, self._on_live_resize)
 
         elif msg == win32con.WM_CREATE:
             self.invalidate_geometry()
             self.create_controls()
             return 0
 
-        elif msg == win32con.WM_COMMAND:
-            control_id = loword(wparam)
-            if control_id == self._ID_EDITBOX:
-                notification_code = hiword(wparam)
-                if notification_code == win32con.EN_SETFOCUS:
-                    HideCaret(lparam)
+        elif msg in LiveResize.MESSAGES:
+            if self._live_resize.handle(msg, wparam, lparam):
+                return 0
+
+        elif msg == win32con.WM_GETMINMAXINFO:
+            if self._dpi is not None:
+                info = MINMAXINFO.from_address(lparam)
+                info.ptMinTrackSize.x = self._dpi.scale(self._min_width)
+                info.ptMinTrackSize.y = self._dpi.scale(self._min_height)
+                return 0
+
+        elif msg in MonitorRegistry.INVALIDATING_MESSAGES:
+            self._monitor_registry.invalidate()
+
+            if msg == WM_DPICHANGED:
+                self._dpi = handle_dpi_changed(hwnd, wparam, lparam, [self._apply_dpi])
+                self._relayout()
+                return 0
 
         elif msg == win32con.WM_CLOSE:
             pass
@@ -91,9 +126,9 @@ class ExceptionHandlerDialog:
     def create_controls(self):
         self._header = Header(
             text = self._exception_name,
-            side_image = EXCEPTION_HAND,
-            center_image = EXCEPTION_FACE,
-            edge_length = 125,
+            side_image = resources.EXCEPTION_HAND,
+            center_image = resources.EXCEPTION_FACE,
+            edge_length = self._header_edge_length,
             # scale_factors = (0.90, 0.70, 1.285, 1.3),
             text_color = wintypes.RGB(red = 255, green = 0, blue = 0),
             # bg_color = wintypes.RGB(60, 60, 60)
@@ -109,85 +144,87 @@ class ExceptionHandlerDialog:
         #     text_color = wintypes.RGB(red = 255, green = 0, blue = 0),
         # )
 
-        style = (
-            win32con.WS_CHILD
-            | win32con.WS_VISIBLE
-            | win32con.WS_BORDER
-            | win32con.ES_LEFT
-            | win32con.ES_MULTILINE
-            | win32con. ES_AUTOVSCROLL
-            | win32con.WS_VSCROLL
-            | win32con.ES_AUTOHSCROLL
-            | win32con.WS_HSCROLL
-            | win32con.ES_READONLY
-            | win32con.WS_TABSTOP
+        # Painted row by row from a line index, so even huge logs open instantly
+        self._log_view = VirtualTextView(
+            0, 0, 0, 0,
+            text = self._log_text,
+            font_name = self.font_name,
+            font_size = self.font_size,
+            border_color = GetSysColor(win32con.COLOR_WINDOWFRAME),
+            bg_color = GetSysColor(win32con.COLOR_WINDOW),
+            text_color = GetSysColor(win32con.COLOR_WINDOWTEXT),
         )
 
-        self._edit_box = CreateWindowEx(
-            dwExStyle = 0,
-            lpClassName = "EDIT",
-            lpWindowName = self._log_text,
-            dwStyle = style,
-            x = 10, y = 145, nWidth = self._width - 20, nHeight = self._height - 155,
-            hWndParent = self._core_context.main_window,
-            hMenu = self._ID_EDITBOX,
-            hInstance = self._h_instance,
-            lpParam = None
-        )
-        SendMessage(
-            self._edit_box,
-            win32con.WM_SETFONT,
-            self._h_font,
-            True
-        )
+        self._layout = self._create_layout()
+        self._relayout()
+
+        SetFocus(self._log_view.hwnd)
+
+    def _create_layout(self) -> LayoutNode:
+        scale = self._dpi.scale
 
-    def _create_font(self):
-        # Calculate height from point size.
-        # Formula: -MulDiv(PointSize, GetDeviceCaps(hDC, LOGPIXELSY), 72)
-        # Assuming 96 DPI for simplicity here: -int(size * 96 / 72) -> size * 1.333
-        height = -int(self.font_size * 1.33333)
-
-        return CreateFont(
-            cHeight = height,
-            cWidth = 0,
-            cEscapement = 0,
-            cOrientation = 0,
-            cWeight = win32con.FW_NORMAL,
-            bItalic = 0,
-            bUnderline = 0,
-            bStrikeOut = 0,
-            iCharSet = win32con.DEFAULT_CHARSET,
-            iOutPrecision = win32con.OUT_DEFAULT_PRECIS,
-            iClipPrecision = win32con.CLIP_DEFAULT_PRECIS,
-            iQuality = win32con.CLEARTYPE_QUALITY,
-            iPitchAndFamily = win32con.DEFAULT_PITCH | win32con.FF_DONTCARE,
-            pszFaceName = self.font_name
+        return Column(
+            ControlItem(self._header, size_hint = (0, self._header.height)),
+            ControlItem(self._log_view, stretch = 1, margins = Margins(scale(10), scale(14), scale(10), scale(10))),
         )
 
+    def _relayout(self):
+        rect = wintypes.RECT()
+        GetClientRect(self._core_context.main_window, rect)
+        self._layout.update(rect.right - rect.left, rect.bottom - rect.top)
+
+    def _on_live_resize(self, width: int, height: int, final: bool):
+        if self._layout is None:
+            return
+
+        if not final:
+            self._header.set_draft_quality(True)
+
+        self._layout.update(width, height)
+
+        if final:
+            self._header.set_draft_quality(False)
+
+    def _apply_dpi(self, context: DpiContext):
+        # Runs inside the LayoutTransaction of handle_dpi_changed
+        self._dpi = context
+
+        self._header.set_dpi(context)
+        self._log_view.set_dpi(context)
+
+        self._layout = self._create_layout()
+
     def _create_window(self):
         return CreateWindowEx(
             dwExStyle = win32con.WS_EX_TOPMOST,
             lpClassName = self._class_name,
             lpWindowName = self._window_name,
-            dwStyle = win32con.WS_SYSMENU,
+            dwStyle = win32con.WS_SYSMENU | win32con.WS_THICKFRAME,
             x = win32con.CW_USEDEFAULT, y = win32con.CW_USEDEFAULT,
             nWidth = self._width, nHeight = self._height,
             hWndParent = None, hMenu = None,
             hInstance = self._h_instance, lpParam = id(self)
         )
 
-    def _register_class(self):
-        return RegisterClass(
-            lpWndClass = WNDCLASS(
-                style = win32con.CS_HREDRAW | win32con.CS_VREDRAW,
-                lpfnWndProc = Dispatcher,
-                hInstance = self._h_instance,
-                hIcon = None,
-                hbrBackground = self._hbr_background,
-                hCursor = LoadCursor(0, win32con.IDC_ARROW),
-                lpszClassName = self._class_name
-            )
-        )
+    @classmethod
+    def _register_class(cls, h_instance: int):
+        # Registered ahead of time by prewarm, or here by the first dialog
+        if ExceptionHandlerDialog._ATOM is not None:
+            return
+
+        with ExceptionHandlerDialog._register_lock:
+            if ExceptionHandlerDialog._ATOM is None:
+                ExceptionHandlerDialog._ATOM = RegisterClass(
+                    lpWndClass = WNDCLASS(
+                        style = win32con.CS_HREDRAW | win32con.CS_VREDRAW,
+                        lpfnWndProc = Dispatcher,
+                        hInstance = h_instance,
+                        hIcon = None,
+                        hbrBackground = GetSysColorBrush(win32con.COLOR_BTNFACE),
+                        hCursor = LoadCursor(0, win32con.IDC_ARROW),
+                        lpszClassName = cls._class_name
+                    )
+                )
 
     def invalidate_geometry(self):
         hwnd = self._core_context.main_window
@@ -196,8 +233,8 @@ class ExceptionHandlerDialog:
         GetClientRect(hwnd, rect)
         width, height = rect.right - rect.left, rect.bottom - rect.top
 
-        width_adjustment = self._width - width
-        height_adjustment = self._height - height
+        width_adjustment = self._dpi.scale(self._width) - width
+        height_adjustment = self._dpi.scale(self._height) - height
 
         if width_adjustment > 0 or height_adjustment > 0:
             GetWindowRect(hwnd, rect)
@@ -205,12 +242,12 @@ class ExceptionHandlerDialog:
 
             width, height = current_width + width_adjustment, current_height + height_adjustment
 
-            monitor = GetMonitorInfo(MonitorFromPoint(0, 0))
-            SetWindowPos(
-                hwnd, 0,
-                (monitor.width - width) // 2, (monitor.height - height) // 2,
-                width, height,
-                win32con.SWP_NOZORDER | win32con.SWP_NOACTIVATE
+            monitor = self._monitor_registry.from_window(hwnd)
+            move_window(
+                hwnd,
+                monitor.left + (monitor.width - width) // 2,
+                monitor.top + (monitor.height - height) // 2,
+                width, height
             )
 
     def destroy(self):
@@ -230,10 +267,12 @@ class ExceptionHandlerDialog:
 
         if hwnd is not None and hwnd:
             DestroyWindow(hwnd)
-            try:
-                UnregisterClass(self._class_name, self._h_instance)
-            except:  # noqa
-                pass
+            with ExceptionHandlerDialog._register_lock:
+                try:
+                    UnregisterClass(self._class_name, self._h_instance)
+                    ExceptionHandlerDialog._ATOM = None
+                except:  # noqa
+                    pass
 
     def show_window(self):
         hwnd = self._core_context.main_window
@@ -268,36 +307,100 @@ class ExceptionHandlerDialog:
             sys.__excepthook__(exc_type, exc_value, exc_traceback)
             return
 
-        traceback = format_exception(exc_type, exc_value, exc_traceback)
-        if exc_thread is not None:
-            traceback.insert(0, f'Exception occurred in thread: {exc_thread.name!r}\n')
-        traceback = ''.join(traceback)
-
-        cls._log_exception(text = traceback)
-        cls(
-            exc_type = exc_type,
-            log_text = traceback
-        ).show_window()
-
-    @staticmethod
-    def _log_exception(
-            text: str
-    ) -> None:
-        """Handle uncaught exceptions by logging to file and displaying dialog."""
-
-        rootpath = Path(__file__).parent.parent
-        crash_reports = rootpath / 'crash_reports'
-        crash_reports.mkdir(parents = True, exist_ok = True)
-
-        # Create a log file with a timestamp
-        now = datetime.now()
-        log_file = crash_reports / f'{now.strftime('%m-%d-%Y %H.%M.%S')}.log'
-        log_file.write_text(text, encoding = 'utf-8')
-        rich.console.Console(highlight = False, style = 'red').print(log_file.read_text())
+        # One record feeds both the log writer and the dialog
+        record = build_crash_record(exc_type, exc_value, exc_traceback, exc_thread, cls._locals_budget)
+
+        cls._log_exception(record)
+
+        # Most of a prewarm that is already running is cheaper to wait for than to
+        # redo, but a stuck one must not keep the dialog from showing. Registration
+        # and font creation are locked, so finishing the rest here is safe.
+        prewarm_thread = cls._prewarm_thread
+        if prewarm_thread is not None and prewarm_thread is not threading.current_thread():
+            prewarm_thread.join(cls._PREWARM_WAIT_SECONDS)
+
+        cls.from_record(record).show_window()
+
+    @classmethod
+    def prewarm(cls) -> None:
+        """
+        Do everything showing the dialog needs except creating its windows and
+        inserting the text: register the window classes, create the fonts, fit and pin
+        the header's canvases at the system DPI and start the crash log writer. A dialog
+        that opens on a monitor with another DPI fits its canvases then.
+        """
+        context = DpiContext.for_dpi(GetDpiForSystem())
+
+        cls._register_class(GetModuleHandle(None))
+        Header.prepare(
+            context, context.scale(cls._width),
+            side_image = resources.EXCEPTION_HAND,
+            center_image = resources.EXCEPTION_FACE,
+            edge_length = cls._header_edge_length
+        )
+        VirtualTextView.prepare(context, cls.font_name, cls.font_size)
+        CrashLogWriter().prepare()
+
+    @classmethod
+    def _prewarm_in_background(cls) -> None:
+        try:
+            cls.prewarm()
+        except Exception:  # noqa
+            # Best effort; whatever is missing is done when the dialog opens
+            pass
 
     @classmethod
-    def install_exception_handlers(cls, main_class_name: str = "Application"):
-        """Install the custom exception handler."""
+    def from_record(cls, record: CrashRecord) -> 'ExceptionHandlerDialog':
+        return cls(
+            exc_type = record.exc_type,
+            log_text = record.text,
+            record = record
+        )
+
+    @classmethod
+    def _log_exception(cls, record: CrashRecord) -> None:
+        """Queue the report for the crash log writer; the dialog does not wait for the disk."""
+        CrashLogWriter().submit(CrashReport(
+            record.text,
+            record.time,
+            fingerprint = record.fingerprint,
+            exception = record.exception_name,
+            record = record if cls._structured_log else None
+        ))
+
+    @classmethod
+    def install_exception_handlers(
+            cls,
+            main_class_name: str = "Application",
+            structured_log: bool = False,
+            locals_budget: LocalsBudget | None = None,
+            prewarm: bool = False,
+            dpi_aware: bool = False
+    ):
+        """
+        Install the custom exception handler.
+
+        Args:
+            main_class_name: Name of the application's main class.
+            structured_log: Also append every crash as a JSON line to `crashes.jsonl`
+                            next to the reports.
+            locals_budget: Capture the local variables of the innermost frames within
+                           these limits; None captures none.
+            prewarm: Run `prewarm` on a background thread now, so that a crash only
+                     has to create the dialog's windows.
+            dpi_aware: Make the whole process per-monitor DPI aware, so the dialog is
+                       drawn sharp at any DPI. Only for applications whose own windows
+                       scale themselves; otherwise the dialog is scaled by the system
+                       like every other window of the process.
+        """
         cls._main_class_name = main_class_name
+        cls._structured_log = structured_log
+        cls._locals_budget = locals_budget
+        if dpi_aware:
+            enable_per_monitor_dpi_awareness()
         sys.excepthook = cls.system_exception_hook
         threading.excepthook = cls.threading_exception_hook
+
+        if prewarm:
+            cls._prewarm_thread = Thread(target = cls._prewarm_in_background, name = 'ExceptionHandlerPrewarm', daemon = True)
+            cls._prewarm_thread.start()
@@ -0,0 +1,90 @@
+"""
+Deferred imports.
+
+Pillow and rich are only needed once the crash dialog actually opens, yet a
+top-level `import` would load them for every application that merely imports
+the framework. `lazy_import` returns a stand-in that imports the module on the
+first attribute access:
+
+    PilImage = lazy_import('PIL.Image')
+
+    def fit(image):
+        return PilImage.new('RGB', image.size)   # PIL is imported here
+
+`lazy_attributes` does the same for a package's own names, e.g. the
+`ExceptionHandlerDialog` re-exported by `skeletal_framework`:
+
+    __getattr__, __dir__ = lazy_attributes(globals(), {'ExceptionHandlerDialog': 'skeletal_framework._error_handling'})
+
+`preload` imports stand-ins ahead of time, e.g. on a worker thread while the
+application is idle.
+
+A stand-in cannot be used where the module itself is needed at import time,
+such as a base class or a default argument; those modules keep ordinary imports.
+"""
+import importlib
+import types
+from collections.abc import Callable
+from typing import Any
+
+__all__ = ['LazyModule', 'lazy_attributes', 'lazy_import', 'preload']
+
+
+class LazyModule(types.ModuleType):
+    """Stand-in for a module that is imported on first attribute access."""
+
+    def __init__(self, name: str):
+        super().__init__(name)
+        self.__dict__['_lazy_module'] = None
+
+    def _load(self) -> types.ModuleType:
+        module = self.__dict__['_lazy_module']
+        if module is None:
+            module = self.__dict__['_lazy_module'] = importlib.import_module(self.__name__)
+
+        return module
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._load(), name)
+
+    def __dir__(self) -> list[str]:
+        return dir(self._load())
+
+    def __repr__(self) -> str:
+        state = 'not loaded' if self.__dict__['_lazy_module'] is None else 'loaded'
+        return f'<lazy module {self.__name__!r} ({state})>'
+
+
+def lazy_import(name: str) -> LazyModule:
+    return LazyModule(name)
+
+
+def preload(*modules: LazyModule) -> None:
+    for module in modules:
+        module._load()
+
+
+def lazy_attributes(
+        namespace: dict[str, Any],
+        attributes: dict[str, str]
+) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """
+    Module-level `__getattr__` and `__dir__` that import `attributes` (name -> module
+    defining it) on first access. The value is then stored in `namespace`, the
+    module's globals, so later lookups no longer reach `__getattr__`.
+    """
+    module_name = namespace['__name__']
+
+    def __getattr__(name: str) -> Any:
+        try:
+            source = attributes[name]
+        except KeyError:
+            raise AttributeError(f'module {module_name!r} has no attribute {name!r}') from None
+
+        value = namespace[name] = getattr(importlib.import_module(source), name)
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted(set(namespace) | set(attributes))
+
+    return __getattr__, __dir__
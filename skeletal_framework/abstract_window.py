@@ -5,9 +5,10 @@ import win32con
 
 from skeletal_framework.core_context import CoreContext
 from skeletal_framework.dispatcher import Dispatcher
+from skeletal_framework.layout.transaction import move_window
+from skeletal_framework.monitor_registry import MonitorRegistry
 from skeletal_framework.win32_bindings.dwmapi import DwmSetWindowAttribute, DWMWINDOWATTRIBUTE
 from skeletal_framework.win32_bindings.gdi32 import CreateSolidBrush, DeleteObject
-from skeletal_framework.win32_bindings.monitor_info import GetMonitorInfo, MonitorFromPoint
 from skeletal_framework.win32_bindings.user32 import (
     # Structures
     WNDCLASS,
@@ -19,7 +20,7 @@ from skeletal_framework.win32_bindings.user32 import (
     LoadCursor,
     PostQuitMessage,
     RegisterClass,
-    SetWindowPos, ShowWindow,
+    ShowWindow,
     UpdateWindow, UnregisterClass,
     TranslateMessage
 )
@@ -31,6 +32,7 @@ class AbstractDialogWindow:
 
     def __init__(self):
         self._core_context = CoreContext()
+        self._monitor_registry = MonitorRegistry()
 
         self._hbr_background = CreateSolidBrush(
             color = wintypes.RGB(
@@ -56,6 +58,9 @@ class AbstractDialogWindow:
             self.create_controls()
             return 0
 
+        elif msg in MonitorRegistry.INVALIDATING_MESSAGES:
+            self._monitor_registry.invalidate()
+
         elif msg == win32con.WM_CLOSE:
             pass
 
@@ -117,12 +122,12 @@ class AbstractDialogWindow:
 
             width, height = current_width + width_adjustment, current_height + height_adjustment
 
-            monitor = GetMonitorInfo(MonitorFromPoint(0, 0))
-            SetWindowPos(
-                hwnd, 0,
-                (monitor.width - width) // 2, (monitor.height - height) // 2,
-                width, height,
-                win32con.SWP_NOZORDER | win32con.SWP_NOACTIVATE
+            monitor = self._monitor_registry.from_window(hwnd)
+            move_window(
+                hwnd,
+                monitor.left + (monitor.width - width) // 2,
+                monitor.top + (monitor.height - height) // 2,
+                width, height
             )
 
     def destroy(self):
@@ -0,0 +1,247 @@
+"""
+Persistent cache of derived images.
+
+Fitting an image to a canvas (resize, alpha split, paste) is by far the most
+expensive part of building a `Header`, and its result only depends on the
+source pixels and a handful of parameters. `CanvasCache` stores such results on
+disk, keyed by (source content digest, target size, background color,
+resampling filter), so the next process that needs the same canvas reads the
+pixels back instead of resampling:
+
+    canvas = CanvasCache().get_or_create(
+        image, (width, height), bg_color, resample,
+        lambda: fit_image(image, width, height, bg_color, resample)
+    )
+
+Entries are raw RGB rows behind a 12-byte header, written to a temporary file
+and renamed into place, and memory-mapped when read. The directory is kept
+under `max_bytes` by evicting the least recently used entries; reading an entry
+refreshes its modification time, which serves as the LRU clock.
+
+`pin` additionally keeps a canvas in memory for the rest of the process, for
+the few canvases that must be ready the moment they are needed (the crash
+dialog's header); lookups of a pinned canvas return a copy without touching
+the disk.
+
+The cache is best-effort: any I/O problem falls back to computing the image.
+"""
+import hashlib
+import mmap
+import os
+import struct
+import tempfile
+from collections.abc import Callable
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from skeletal_framework._lazy import lazy_import
+from skeletal_framework.resource_pack import DIGEST_KEY
+from skeletal_framework.singleton import Singleton
+
+if TYPE_CHECKING:
+    from PIL.Image import Image
+
+PilImage = lazy_import('PIL.Image')
+
+__all__ = ['CanvasCache', 'default_cache_dir']
+
+_MAGIC = b'SFCV'
+# magic, width, height
+_HEADER = struct.Struct('<4sII')
+
+# Bump when the way canvases are derived changes, to orphan old entries
+_KEY_VERSION = 2
+
+
+def default_cache_dir() -> Path:
+    base = os.environ.get('LOCALAPPDATA') or tempfile.gettempdir()
+    return Path(base) / 'SkeletalFramework' / 'canvas_cache'
+
+
+class CanvasCache(Singleton):
+    """
+    Process-wide handle on the on-disk canvas cache.
+
+    Args:
+        directory: Where entries are stored; created on first write.
+        max_bytes: Size the directory is trimmed back to after a write.
+    """
+
+    def __init__(self, directory: str | os.PathLike | None = None, max_bytes: int = 64 * 1024 * 1024):
+        self.directory = Path(directory) if directory is not None else default_cache_dir()
+        self.max_bytes = max_bytes
+
+        # Bytes on disk; measured on the first write
+        self._total: int | None = None
+
+        self._pinned: dict[str, 'Image'] = {}
+
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def source_digest(image: 'Image') -> str:
+        """
+        Digest of the image's content. Images opened from a `ResourcePack` carry the
+        digest of their encoded bytes, which avoids decoding them; other images are
+        hashed once by pixels and the result is kept in `image.info`.
+        """
+        digest = image.info.get(DIGEST_KEY)
+        if digest is None:
+            hasher = hashlib.blake2b(digest_size = 16)
+            hasher.update(f'{image.mode}:{image.width}x{image.height}:'.encode())
+            hasher.update(image.tobytes())
+            digest = image.info[DIGEST_KEY] = hasher.hexdigest()
+
+        return digest
+
+    def key(self, image: 'Image', size: tuple[int, int], bg_color: int, resample: int) -> str:
+        description = f'{_KEY_VERSION}|{self.source_digest(image)}|{size[0]}x{size[1]}|{bg_color:06x}|{int(resample)}'
+        return hashlib.blake2b(description.encode(), digest_size = 16).hexdigest()
+
+    def get_or_create(
+            self,
+            image: 'Image',
+            size: tuple[int, int],
+            bg_color: int,
+            resample: int,
+            create: Callable[[], 'Image']
+    ) -> 'Image':
+        """The cached canvas for these parameters, or `create()`'s result, which is then stored."""
+        key = self.key(image, size, bg_color, resample)
+
+        pinned = self._pinned.get(key)
+        if pinned is not None:
+            self.hits += 1
+            # Callers own (and close) what they get
+            return pinned.copy()
+
+        canvas = self.load(key)
+        if canvas is not None:
+            self.hits += 1
+            return canvas
+
+        self.misses += 1
+        canvas = create()
+        self.store(key, canvas)
+
+        return canvas
+
+    def pin(
+            self,
+            image: 'Image',
+            size: tuple[int, int],
+            bg_color: int,
+            resample: int,
+            create: Callable[[], 'Image']
+    ) -> 'Image':
+        """`get_or_create`, and keep the canvas in memory so later lookups return a copy of it."""
+        key = self.key(image, size, bg_color, resample)
+
+        if key not in self._pinned:
+            self._pinned[key] = self.get_or_create(image, size, bg_color, resample, create)
+
+        return self._pinned[key].copy()
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f'{key}.rgb'
+
+    def load(self, key: str) -> 'Image | None':
+        path = self._path(key)
+
+        try:
+            with open(path, 'rb') as file, mmap.mmap(file.fileno(), 0, access = mmap.ACCESS_READ) as mapped:
+                magic, width, height = _HEADER.unpack_from(mapped, 0)
+                if magic != _MAGIC or len(mapped) != _HEADER.size + width * height * 3:
+                    return None
+
+                with memoryview(mapped) as view:
+                    canvas = PilImage.frombytes('RGB', (width, height), view[_HEADER.size:])
+
+            # Refresh the LRU clock
+            os.utime(path)
+
+        except (OSError, ValueError, struct.error):
+            return None
+
+        return canvas
+
+    def store(self, key: str, canvas: 'Image') -> None:
+        if canvas.mode != 'RGB':
+            canvas = canvas.convert('RGB')
+
+        path = self._path(key)
+        blob = _HEADER.pack(_MAGIC, canvas.width, canvas.height) + canvas.tobytes()
+
+        try:
+            self.directory.mkdir(parents = True, exist_ok = True)
+
+            # Written next to the destination and renamed, so readers never see a partial entry
+            fd, temporary = tempfile.mkstemp(dir = self.directory, suffix = '.tmp')
+            try:
+                with os.fdopen(fd, 'wb') as file:
+                    file.write(blob)
+                os.replace(temporary, path)
+            except BaseException:
+                Path(temporary).unlink(missing_ok = True)
+                raise
+
+        except OSError:
+            return
+
+        if self._total is None:
+            self._total = self._measure()
+        else:
+            self._total += len(blob)
+
+        if self._total > self.max_bytes:
+            self._evict()
+
+    def _files(self) -> list[tuple[float, int, str]]:
+        """(mtime, size, path) of every entry; files that vanish while listing are skipped."""
+        files = []
+
+        try:
+            with os.scandir(self.directory) as entries:
+                for entry in entries:
+                    if not entry.name.endswith('.rgb'):
+                        continue
+                    try:
+                        stat = entry.stat()
+                    except OSError:
+                        continue
+                    files.append((stat.st_mtime, stat.st_size, entry.path))
+        except OSError:
+            pass
+
+        return files
+
+    def _measure(self) -> int:
+        return sum(size for _, size, _ in self._files())
+
+    def _evict(self) -> None:
+        """Delete the least recently used entries until the directory is under `max_bytes`."""
+        files = sorted(self._files())
+        total = sum(size for _, size, _ in files)
+
+        for _, size, path in files:
+            if total <= self.max_bytes:
+                break
+
+            try:
+                os.unlink(path)
+                total -= size
+            except OSError:
+                pass
+
+        self._total = total
+
+    def clear(self) -> None:
+        for _, _, path in self._files():
+            try:
+                os.unlink(path)
+            except OSError:
+                pass
+
+        self._total = 0
+        self.hits = self.misses = 0
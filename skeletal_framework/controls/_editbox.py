@@ -3,7 +3,9 @@ from ctypes import wintypes
 
 import win32con
 
+from skeletal_framework.controls.edit_stream import EditStream
 from skeletal_framework.core_context import CoreContext
+from skeletal_framework.dpi import DpiContext
 from skeletal_framework.win32_bindings.gdi32 import (
     CreateFontIndirect, LOGFONT, CreateSolidBrush, DeleteObject, SetTextColor, SetBkColor
 )
@@ -33,6 +35,7 @@ class EditBox:
             text_color: int = wintypes.RGB(255, 0, 0),
             bg_color: int = wintypes.RGB(75, 75, 75),
             read_only: bool = False,
+            ring_limit: int | None = None,
             parent_hwnd: int | None = None
     ):
         self._core_context = CoreContext()
@@ -51,7 +54,7 @@ class EditBox:
             self._parent_hwnd = self._core_context.main_window
 
         self._h_instance = GetModuleHandle(None)
-        self._font = self._create_font(font_name, font_size)
+        self._font = self._create_font(font_name, font_size, DpiContext.for_window(self._parent_hwnd))
         self._bg_brush = CreateSolidBrush(self.bg_color)
 
         self._hwnd = self._create_window()
@@ -60,11 +63,13 @@ class EditBox:
         SetWindowLong(self._hwnd, win32con.GWL_USERDATA, id(self))
         self._parent_proc = SetWindowLong(self._hwnd, win32con.GWL_WNDPROC, _subclass_wnd_proc)
 
+        self._stream = EditStream(self._hwnd, ring_limit = ring_limit)
+
     @staticmethod
-    def _create_font(font_name, font_size):
+    def _create_font(font_name, font_size, dpi: DpiContext):
         return CreateFontIndirect(
             LOGFONT(
-                height = -int(font_size * 1.333),
+                height = dpi.font_height(font_size),
                 face_name = font_name,
                 quality = win32con.CLEARTYPE_QUALITY,
             )
@@ -99,6 +104,10 @@ class EditBox:
 
     def wnd_proc(self, hwnd, msg, wparam, lparam):
         """Handles messages for this specific EditBox instance."""
+        if msg == EditStream.WM_FLUSH:
+            self._stream.flush()
+            return 0
+
         if msg == win32con.WM_SETFOCUS and self.read_only:
             HideCaret(hwnd)
 
@@ -131,6 +140,17 @@ class EditBox:
         self.text = text
         SetWindowText(self._hwnd, self.text)
 
+    def append(self, text: str):
+        """
+        Appends text to the edit control without rewriting its buffer.
+        `text` keeps the last value passed to `set_text`.
+        """
+        self._stream.append(text)
+
+    def post_append(self, text: str):
+        """Thread-safe `append`; queued text is inserted in one batch on the UI thread."""
+        self._stream.post(text)
+
     def destroy(self):
         """Destroys the window handle."""
         if self._hwnd:
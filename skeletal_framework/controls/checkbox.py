@@ -7,6 +7,7 @@ from typing import Any, TypedDict, Unpack
 import win32con
 
 from skeletal_framework.core_context import CoreContext
+from skeletal_framework.dpi import DpiContext
 from skeletal_framework.win32_bindings.gdi32 import *
 from skeletal_framework.win32_bindings.user32 import *
 
@@ -71,7 +72,7 @@ class Checkbox(ABC):
         self._ctrl_id = ctrl_id
         self._text = text
         self._hwnd = self._crete_window(x, y, width, 20, text)
-        self._font, self._checkmark_font = self._create_logfonts(font_size)
+        self._font, self._checkmark_font = self._create_logfonts(font_size, DpiContext.for_window(self._parent_hwnd))
 
         if not hasattr(self, '_is_checked'):
             self._is_checked = False
@@ -103,11 +104,11 @@ class Checkbox(ABC):
         )
 
     @staticmethod
-    def _create_logfonts(font_size) -> tuple[Any, Any]:
+    def _create_logfonts(font_size, dpi: DpiContext) -> tuple[Any, Any]:
         return (
             CreateFontIndirect(
                 LOGFONT(
-                    height = -int(font_size * 1.333),  # Negative for character height in pixels
+                    height = dpi.font_height(font_size),  # Negative for character height in pixels
                     charset = win32con.DEFAULT_CHARSET,
                     out_precision = win32con.OUT_DEFAULT_PRECIS,
                     clip_precision = win32con.CLIP_DEFAULT_PRECIS,
@@ -118,7 +119,7 @@ class Checkbox(ABC):
             ),
             CreateFontIndirect(
                 LOGFONT(
-                    height = -26,
+                    height = -dpi.scale(26),
                     charset = win32con.DEFAULT_CHARSET,
                     out_precision = win32con.OUT_DEFAULT_PRECIS,
                     clip_precision = win32con.CLIP_DEFAULT_PRECIS,
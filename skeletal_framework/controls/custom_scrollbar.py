@@ -1,4 +1,8 @@
 from ctypes import wintypes
+import threading
+import time
+from collections import deque
+
 import win32con
 
 from skeletal_framework.win32_bindings.gdi32 import (
@@ -12,13 +16,27 @@ from skeletal_framework.win32_bindings.user32 import (
     SetTimer, KillTimer, ScreenToClient
 )
 from skeletal_framework.win32_bindings.kernel32 import GetModuleHandle
+from skeletal_framework.controls.scroll_target import ScrollState, ScrollTarget
+from skeletal_framework.controls.smooth_scroll import SmoothScroller
 from skeletal_framework.dispatcher import Dispatcher
+from skeletal_framework.dpi import DpiContext
+from skeletal_framework.layout.transaction import move_window
 from skeletal_framework.win32_bindings.macros import hiword, loword, MAKEWPARAM
 
 
 class CustomScrollBar:
+    """
+    Owner-drawn scrollbar. Vertical by default; with `horizontal = True` the same
+    layout runs along the x axis, which is why geometry below is worked out as for a
+    vertical bar and only flipped (`_axis_rect`, `_axis_point`) when painting and
+    hit-testing.
+    """
+
     _CLASS_NAME = "CustomScrollBarClass"
     _ATOM = None
+    # Registered ahead of time on a worker thread by ExceptionHandlerDialog.prewarm,
+    # possibly while the UI thread creates its first bar
+    _register_lock = threading.Lock()
 
     _TIMER_ID = 1
     _INITIAL_DELAY_MS = 400
@@ -26,6 +44,9 @@ class CustomScrollBar:
 
     _NULL_PEN = 8
 
+    # A thumb released within this long after its last move keeps the drag's momentum
+    _FLING_WINDOW_S = 0.05
+
     def __init__(
             self,
             parent_hwnd: int,
@@ -36,9 +57,19 @@ class CustomScrollBar:
             thumb_hover_color: int = wintypes.RGB(100, 100, 100),
             thumb_press_color: int = wintypes.RGB(120, 120, 120),
             button_color: int = wintypes.RGB(75, 75, 75),
-            arrow_color: int = wintypes.RGB(25, 25, 25)
+            arrow_color: int = wintypes.RGB(25, 25, 25),
+            target: ScrollTarget | None = None,
+            smooth: bool = True,
+            horizontal: bool = False
     ):
         self._parent_hwnd = parent_hwnd
+        self.horizontal = horizontal
+
+        # With a target, scrolling is done through direct calls in the target's own
+        # units; without one, WM_VSCROLL (WM_HSCROLL) is posted to the parent with a
+        # 16-bit position.
+        self.target = target
+        self._state: ScrollState | None = None
         self.x = x
         self.y = y
         self.width = width
@@ -52,7 +83,7 @@ class CustomScrollBar:
         self.arrow_color = arrow_color
 
         self._h_instance = GetModuleHandle(None)
-        self._register_class()
+        self._register_class(self._h_instance)
 
         self._scroll_pos = 0
         self._page_size = 1.0
@@ -60,11 +91,15 @@ class CustomScrollBar:
         self._is_dragging = False
         self._drag_start_y = 0
         self._drag_start_pos = 0.0
+        self._drag_start_position = 0
+        self._drag_position = 0
 
         self._auto_scroll_action = None
         self._timer_active = False
 
-        self._btn_size = width
+        self._btn_size = height if horizontal else width
+        self._dpi = DpiContext.for_window(parent_hwnd)
+        self._scale_metrics()
 
         self._bg_brush = CreateSolidBrush(self.bg_color)
         self._thumb_brush = CreateSolidBrush(self.thumb_color)
@@ -75,17 +110,28 @@ class CustomScrollBar:
 
         self._hwnd = self._create_window()
 
-    def _register_class(self):
-        if CustomScrollBar._ATOM is None:
-            wnd_class = WNDCLASS(
-                style = win32con.CS_HREDRAW | win32con.CS_VREDRAW,
-                lpfnWndProc = Dispatcher,
-                hInstance = self._h_instance,
-                hCursor = LoadCursor(0, win32con.IDC_ARROW),
-                lpszClassName = self._CLASS_NAME,
-                hbrBackground = None
-            )
-            CustomScrollBar._ATOM = RegisterClass(wnd_class)
+        # Targets are scrolled through a frame-timed animation unless `smooth` is False
+        self._scroller: SmoothScroller | None = None
+        if target is not None and smooth:
+            self._scroller = SmoothScroller(self._hwnd, target, on_frame = self._on_smooth_frame)
+        self._drag_samples: deque[tuple[float, float]] = deque(maxlen = 6)
+
+    @classmethod
+    def _register_class(cls, h_instance: int):
+        if CustomScrollBar._ATOM is not None:
+            return
+
+        with CustomScrollBar._register_lock:
+            if CustomScrollBar._ATOM is None:
+                wnd_class = WNDCLASS(
+                    style = win32con.CS_HREDRAW | win32con.CS_VREDRAW,
+                    lpfnWndProc = Dispatcher,
+                    hInstance = h_instance,
+                    hCursor = LoadCursor(0, win32con.IDC_ARROW),
+                    lpszClassName = cls._CLASS_NAME,
+                    hbrBackground = None
+                )
+                CustomScrollBar._ATOM = RegisterClass(wnd_class)
 
     def _create_window(self):
         return CreateWindowEx(
@@ -105,9 +151,104 @@ class CustomScrollBar:
     def hwnd(self):
         return self._hwnd
 
+    def _scale_metrics(self):
+        # Paint metrics in 96-DPI units, converted once per DPI change
+        self._button_gap = self._dpi.scale(2)
+        self._min_thumb_height = self._dpi.scale(20)
+        self._arrow_radius = self._dpi.scale(5)
+        self._thumb_width = self._dpi.scale(8)
+        self._thumb_offset = self._dpi.scale(1)
+
+    def set_dpi(self, context: DpiContext):
+        """Switch to the metrics of a new DPI; the owner moves the bar to its new rectangle."""
+        if context is self._dpi:
+            return
+
+        self._dpi = context
+        self._scale_metrics()
+        InvalidateRect(self._hwnd, None, False)
+
+    def move(self, x: int, y: int, width: int, height: int):
+        self.x, self.y, self.width, self.height = x, y, width, height
+        self._btn_size = height if self.horizontal else width
+        move_window(self._hwnd, x, y, width, height)
+
+    def _axis_rect(self, rect: wintypes.RECT) -> wintypes.RECT:
+        """Swap the axes of a rectangle for a horizontal bar; the swap is its own inverse."""
+        if not self.horizontal:
+            return rect
+        return wintypes.RECT(rect.top, rect.left, rect.bottom, rect.right)
+
+    def _axis_point(self, point: wintypes.POINT) -> wintypes.POINT:
+        if not self.horizontal:
+            return point
+        return wintypes.POINT(point.y, point.x)
+
+    def _axis_client_rect(self, hwnd) -> wintypes.RECT:
+        client_rect = wintypes.RECT()
+        GetClientRect(hwnd, client_rect)
+        return self._axis_rect(client_rect)
+
+    def _axis_coordinate(self, lparam) -> int:
+        """The mouse position along the bar, from a mouse message's lParam."""
+        position = loword(lparam) if self.horizontal else hiword(lparam)
+        return position - 65536 if position > 32767 else position
+
+    def set_scroll_state(self, state: ScrollState):
+        """Sync with the target's scroll state; exact at any document length."""
+        self._state = state
+
+        if self._scroller is not None:
+            self._scroller.sync(state)
+            if self._scroller.animating:
+                # The thumb follows the fractional position instead of whole units
+                self._on_smooth_frame(self._scroller.position)
+                return
+
+        self._set_fractions(state.fraction, state.page_fraction)
+
+    @property
+    def scroller(self) -> SmoothScroller | None:
+        """The animation engine, for frame statistics; None for bars without a smooth target."""
+        return self._scroller
+
+    def scroll_by(self, delta: float):
+        """Scroll the target by `delta` units, gliding when smooth scrolling is on."""
+        if self._scroller is not None:
+            self._scroller.scroll_by(delta)
+        elif self.target is not None:
+            self.target.scroll_by(round(delta))
+
+    def impulse(self, delta: float):
+        """Wheel input: momentum worth about `delta` units, which accumulates over quick turns."""
+        if self._scroller is not None:
+            self._scroller.impulse(delta)
+        else:
+            self.scroll_by(delta)
+
+    def _on_smooth_frame(self, position: float):
+        state = self._state
+        if state is None:
+            return
+
+        max_position = state.max_position
+        self._set_fractions(position / max_position if max_position > 0 else 0.0, state.page_fraction)
+
     def set_scroll_params(self, pos: float, page_size: float):
-        self._scroll_pos = max(0.0, min(1.0, pos))
-        self._page_size = max(0.0, min(1.0, page_size))
+        """Sync from fractions; for parents that handle WM_VSCROLL themselves."""
+        self._state = None
+        self._set_fractions(pos, page_size)
+
+    def _set_fractions(self, pos: float, page_size: float):
+        pos = max(0.0, min(1.0, pos))
+        page_size = max(0.0, min(1.0, page_size))
+
+        # Owners sync after every scroll-related event; only repaint on an actual change
+        if pos == self._scroll_pos and page_size == self._page_size:
+            return
+
+        self._scroll_pos = pos
+        self._page_size = page_size
         InvalidateRect(self._hwnd, None, False)
 
     def wnd_proc(self, hwnd, msg, wparam, lparam):
@@ -128,7 +269,8 @@ class CustomScrollBar:
             return 0
 
         elif msg == win32con.WM_TIMER:
-            self._on_timer(hwnd, wparam)
+            if self._scroller is None or not self._scroller.handle_timer(wparam):
+                self._on_timer(hwnd, wparam)
             return 0
 
         elif msg == win32con.WM_MOUSELEAVE:
@@ -149,8 +291,8 @@ class CustomScrollBar:
         # Standard size based on width
         std_size = self._btn_size
 
-        # Shrink the physical button height by 2 pixels to create the gap
-        btn_h = std_size - 2
+        # Shrink the physical button height to create the gap
+        btn_h = std_size - self._button_gap
 
         if h < 2 * std_size:
             return None, None, None
@@ -174,7 +316,7 @@ class CustomScrollBar:
         track_h = track_rect.bottom - track_rect.top
         if track_h <= 0: return wintypes.RECT(0, 0, 0, 0), 0
 
-        min_thumb_height = 20
+        min_thumb_height = self._min_thumb_height
         thumb_height = max(min_thumb_height, int(track_h * self._page_size))
         thumb_height = min(thumb_height, track_h)
 
@@ -193,12 +335,15 @@ class CustomScrollBar:
         ), travel_range
 
     def _draw_arrow(self, hdc, rect, direction = 'up'):
-        """Draws a simple triangle arrow in the center of rect."""
+        """
+        Draws a simple triangle arrow in the center of rect. Both are in vertical-bar
+        coordinates; on a horizontal bar 'up' points left and 'down' points right.
+        """
         cx = (rect.left + rect.right) // 2
         cy = (rect.top + rect.bottom) // 2
 
         # Arrow radius
-        r = 5
+        r = self._arrow_radius
 
         if direction == 'up':
             points = [
@@ -214,6 +359,8 @@ class CustomScrollBar:
                 wintypes.POINT(cx, cy + r)  # Bottom
             ]
 
+        points = [self._axis_point(point) for point in points]
+
         old_brush = SelectObject(hdc, self._arrow_brush)
         # NULL_PEN ensures no outline
         null_pen = GetStockObject(self._NULL_PEN)
@@ -231,12 +378,12 @@ class CustomScrollBar:
             GetClientRect(hwnd, client_rect)
             FillRect(hdc, client_rect, self._bg_brush)
 
-            top_btn, bot_btn, track_rect = self._get_layout(client_rect)
+            top_btn, bot_btn, track_rect = self._get_layout(self._axis_rect(client_rect))
 
             if top_btn:
                 # 1. Draw Buttons
-                FillRect(hdc, top_btn, self._button_brush)
-                FillRect(hdc, bot_btn, self._button_brush)
+                FillRect(hdc, self._axis_rect(top_btn), self._button_brush)
+                FillRect(hdc, self._axis_rect(bot_btn), self._button_brush)
 
                 # 2. Draw Arrows
                 self._draw_arrow(hdc, top_btn, 'up')
@@ -255,11 +402,11 @@ class CustomScrollBar:
 
                     # Rounded Thumb Logic with Nudge
                     rect_width = thumb_rect.right - thumb_rect.left
-                    desired_width = 8
+                    desired_width = self._thumb_width
                     if desired_width > rect_width: desired_width = rect_width
 
                     margin = (rect_width - desired_width) // 2
-                    thumb_offset_x = 1
+                    thumb_offset_x = self._thumb_offset
 
                     visual_left = thumb_rect.left + margin + thumb_offset_x
                     visual_right = visual_left + desired_width
@@ -275,7 +422,8 @@ class CustomScrollBar:
                     old_pen = SelectObject(hdc, null_pen)
                     old_brush = SelectObject(hdc, brush)
 
-                    RoundRect(hdc, visual_left, visual_top, visual_right, visual_bottom, desired_width, desired_width)
+                    visual = self._axis_rect(wintypes.RECT(visual_left, visual_top, visual_right, visual_bottom))
+                    RoundRect(hdc, visual.left, visual.top, visual.right, visual.bottom, desired_width, desired_width)
 
                     SelectObject(hdc, old_brush)
                     SelectObject(hdc, old_pen)
@@ -291,32 +439,51 @@ class CustomScrollBar:
             InvalidateRect(hwnd, None, False)
 
         if self._is_dragging:
-            y = hiword(lparam)
-            if y > 32767: y -= 65536
+            y = self._axis_coordinate(lparam)
 
-            client_rect = wintypes.RECT()
-            GetClientRect(hwnd, client_rect)
-            _, _, track_rect = self._get_layout(client_rect)
+            _, _, track_rect = self._get_layout(self._axis_client_rect(hwnd))
 
             if track_rect:
                 _, travel_range = self._calculate_thumb_rect(track_rect)
                 if travel_range > 0:
                     delta_y = y - self._drag_start_y
-                    delta_pos = delta_y / travel_range
-                    new_pos = self._drag_start_pos + delta_pos
-                    self._scroll_pos = max(0.0, min(1.0, new_pos))
+
+                    if self._scroller is not None and self._state is not None:
+                        # Fractional; the scroller rounds once per frame
+                        max_position = self._state.max_position
+                        position = self._drag_start_position + delta_y * max_position / travel_range
+                        position = max(0.0, min(float(max_position), position))
+
+                        self._drag_samples.append((time.perf_counter(), position))
+                        self._scroller.drag_to(position)
+                        self._scroll_pos = position / max_position if max_position > 0 else 0.0
+                        InvalidateRect(hwnd, None, False)
+                        return
+
+                    elif self.target is not None and self._state is not None:
+                        # Whole units, so that every line of a long document is reachable
+                        max_position = self._state.max_position
+                        position = self._drag_start_position + round(delta_y * max_position / travel_range)
+                        self._drag_position = max(0, min(max_position, position))
+                        self._scroll_pos = self._drag_position / max_position if max_position > 0 else 0.0
+
+                    else:
+                        delta_pos = delta_y / travel_range
+                        new_pos = self._drag_start_pos + delta_pos
+                        self._scroll_pos = max(0.0, min(1.0, new_pos))
+
                     self._notify_parent(win32con.SB_THUMBTRACK)
                     InvalidateRect(hwnd, None, False)
 
     def _on_left_button_down(self, hwnd, lparam):
         x = loword(lparam)
         y = hiword(lparam)
+        if x > 32767: x -= 65536
         if y > 32767: y -= 65536
-        pt = wintypes.POINT(x, y)
+        pt = self._axis_point(wintypes.POINT(x, y))
+        y = pt.y
 
-        client_rect = wintypes.RECT()
-        GetClientRect(hwnd, client_rect)
-        top_btn, bot_btn, track_rect = self._get_layout(client_rect)
+        top_btn, bot_btn, track_rect = self._get_layout(self._axis_client_rect(hwnd))
         if not top_btn: return
 
         action = None
@@ -332,6 +499,11 @@ class CustomScrollBar:
                 self._is_dragging = True
                 self._drag_start_y = y
                 self._drag_start_pos = self._scroll_pos
+                self._drag_start_position = self._state.position if self._state is not None else 0
+                self._drag_samples.clear()
+                if self._scroller is not None:
+                    self._scroller.stop()
+                    self._drag_start_position = self._scroller.position
                 SetCapture(hwnd)
                 InvalidateRect(hwnd, None, False)
                 return
@@ -342,7 +514,12 @@ class CustomScrollBar:
             elif y > thumb_rect.bottom:
                 action = win32con.SB_PAGEDOWN
 
-        if action is not None:
+        if action is not None and self._scroller is not None:
+            self._auto_scroll_action = action
+            self._start_smooth_repeat(action)
+            SetCapture(hwnd)
+
+        elif action is not None:
             self._auto_scroll_action = action
             self._notify_parent(action)
             SetTimer(hwnd, self._TIMER_ID, self._INITIAL_DELAY_MS, None)
@@ -355,6 +532,14 @@ class CustomScrollBar:
             ReleaseCapture()
             InvalidateRect(hwnd, None, False)
 
+            if self._scroller is not None:
+                self._fling_from_drag()
+
+        if self._scroller is not None and self._auto_scroll_action is not None:
+            self._scroller.release()
+            self._auto_scroll_action = None
+            ReleaseCapture()
+
         if self._timer_active:
             KillTimer(hwnd, self._TIMER_ID)
             self._timer_active = False
@@ -366,35 +551,68 @@ class CustomScrollBar:
             KillTimer(hwnd, self._TIMER_ID)
             SetTimer(hwnd, self._TIMER_ID, self._REPEAT_DELAY_MS, None)
 
-            pt = wintypes.POINT()
-            ScreenToClient(hwnd, pt)
+            if self._action_under_cursor(self._auto_scroll_action):
+                self._notify_parent(self._auto_scroll_action)
 
-            rect = wintypes.RECT()
-            GetClientRect(hwnd, rect)
-            top_btn, bot_btn, track_rect = self._get_layout(rect)
+    def _action_under_cursor(self, action) -> bool:
+        """Whether the cursor is still where `action` started, so auto-repeat may continue."""
+        pt = wintypes.POINT()
+        ScreenToClient(self._hwnd, pt)
+        pt = self._axis_point(pt)
 
-            should_scroll = False
-            if self._auto_scroll_action == win32con.SB_LINEUP:
-                should_scroll = PtInRect(top_btn, pt)
+        top_btn, bot_btn, track_rect = self._get_layout(self._axis_client_rect(self._hwnd))
+        if not top_btn:
+            return False
 
-            elif self._auto_scroll_action == win32con.SB_LINEDOWN:
-                should_scroll = PtInRect(bot_btn, pt)
+        if action == win32con.SB_LINEUP:
+            return bool(PtInRect(top_btn, pt))
 
-            elif self._auto_scroll_action in (win32con.SB_PAGEUP, win32con.SB_PAGEDOWN):
-                thumb_rect, _ = self._calculate_thumb_rect(track_rect)
-                if PtInRect(thumb_rect, pt):
-                    should_scroll = False
+        elif action == win32con.SB_LINEDOWN:
+            return bool(PtInRect(bot_btn, pt))
 
-                elif self._auto_scroll_action == win32con.SB_PAGEUP and pt.y < thumb_rect.top:
-                    should_scroll = True
+        elif action in (win32con.SB_PAGEUP, win32con.SB_PAGEDOWN):
+            thumb_rect, _ = self._calculate_thumb_rect(track_rect)
+            if PtInRect(thumb_rect, pt):
+                return False
 
-                elif self._auto_scroll_action == win32con.SB_PAGEDOWN and pt.y > thumb_rect.bottom:
-                    should_scroll = True
+            elif action == win32con.SB_PAGEUP:
+                return pt.y < thumb_rect.top
 
-            if should_scroll:
-                self._notify_parent(self._auto_scroll_action)
+            return pt.y > thumb_rect.bottom
+
+        return False
+
+    def _start_smooth_repeat(self, action):
+        # One glided step right away, then a steady motion at the old repeat rate
+        if action in (win32con.SB_LINEUP, win32con.SB_LINEDOWN):
+            step = 1
+        else:
+            step = max(1, (self._state or self.target.scroll_state()).page)
+
+        if action in (win32con.SB_LINEUP, win32con.SB_PAGEUP):
+            step = -step
+
+        self._scroller.scroll_by(step)
+        self._scroller.hold(
+            step * 1000 / self._REPEAT_DELAY_MS,
+            self._INITIAL_DELAY_MS,
+            lambda: self._action_under_cursor(action)
+        )
+
+    def _fling_from_drag(self):
+        samples = self._drag_samples
+        if len(samples) < 2 or time.perf_counter() - samples[-1][0] > self._FLING_WINDOW_S:
+            return
+
+        (t0, p0), (t1, p1) = samples[0], samples[-1]
+        if t1 > t0:
+            self._scroller.fling((p1 - p0) / (t1 - t0))
 
     def _notify_parent(self, code):
+        if self.target is not None:
+            self._scroll_target(code)
+            return
+
         if code == win32con.SB_THUMBTRACK:
             pos_int = int(self._scroll_pos * 65535)
             wparam = MAKEWPARAM(code, pos_int)
@@ -402,9 +620,30 @@ class CustomScrollBar:
         else:
             wparam = MAKEWPARAM(code, 0)
 
-        PostMessage(self._parent_hwnd, win32con.WM_VSCROLL, wparam, self._hwnd)
+        message = win32con.WM_HSCROLL if self.horizontal else win32con.WM_VSCROLL
+        PostMessage(self._parent_hwnd, message, wparam, self._hwnd)
+
+    def _scroll_target(self, code):
+        target = self.target
+
+        if code == win32con.SB_THUMBTRACK:
+            target.scroll_to(self._drag_position)
+
+        elif code == win32con.SB_LINEUP:
+            target.scroll_by(-1)
+
+        elif code == win32con.SB_LINEDOWN:
+            target.scroll_by(1)
+
+        elif code in (win32con.SB_PAGEUP, win32con.SB_PAGEDOWN):
+            state = self._state or target.scroll_state()
+            page = max(1, state.page)
+            target.scroll_by(-page if code == win32con.SB_PAGEUP else page)
 
     def _cleanup(self):
+        if self._scroller is not None:
+            self._scroller.stop()
+
         if self._timer_active:
             KillTimer(self._hwnd, self._TIMER_ID)
 
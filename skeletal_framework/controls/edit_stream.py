@@ -0,0 +1,190 @@
+"""
+Incremental appends to a multi-line EDIT control.
+
+`SetWindowText` replaces, re-measures and repaints the whole buffer, so tailing a
+growing log with it costs O(total size) per update. `EditStream` appends through
+`EM_SETSEL` / `EM_REPLACESEL` instead, trims the head of the buffer in whole-line
+chunks once it grows past a ring limit, and lets background threads queue text
+that the UI thread then inserts in one batch per message-loop turn.
+
+    stream = EditStream(hwnd_edit, ring_limit = 4_000_000)
+
+    # UI thread
+    stream.append("one more line\\n")
+
+    # Any thread; the window procedure calls stream.flush() on WM_FLUSH
+    stream.post("line from a worker\\n")
+"""
+import ctypes
+import threading
+from collections import deque
+from collections.abc import Callable
+from ctypes import wintypes
+
+import win32con
+
+from skeletal_framework.win32_bindings.user32 import InvalidateRect, PostMessage, SendMessage
+
+__all__ = ['EditStream']
+
+
+class EditStream:
+    """
+    Append-only writer for one EDIT control.
+
+    Args:
+        hwnd: The EDIT control
+        ring_limit: Maximum number of characters kept; when an append would exceed it,
+                    whole lines are dropped from the head. None keeps everything.
+        trim_chunk: Minimum number of characters dropped per trim, so that a steady
+                    stream trims now and then instead of on every append.
+        on_change: Called after every batch of appends, e.g. to sync a custom scrollbar.
+    """
+
+    # Posted to the EDIT control itself; its (subclassed) window procedure calls flush()
+    WM_FLUSH = win32con.WM_APP + 0x35
+
+    def __init__(
+            self,
+            hwnd: int,
+            *,
+            ring_limit: int | None = None,
+            trim_chunk: int = 64 * 1024,
+            on_change: Callable[[], None] | None = None
+    ):
+        self._hwnd = hwnd
+        self.ring_limit = ring_limit
+        self.trim_chunk = trim_chunk
+        self._on_change = on_change
+
+        self._pending: deque[str] = deque()
+        self._lock = threading.Lock()
+        self._posted = False
+
+        # The default limit (~32K characters) also applies to EM_REPLACESEL;
+        # 0 raises it to the maximum a multi-line control supports.
+        SendMessage(hwnd, win32con.EM_SETLIMITTEXT, 0, 0)
+
+    @staticmethod
+    def normalize(text: str) -> str:
+        """Convert line breaks to the CRLF the EDIT control expects."""
+        if '\n' not in text:
+            return text
+
+        return text.replace('\r\n', '\n').replace('\n', '\r\n')
+
+    def append(self, text: str) -> None:
+        """Append text at the end of the buffer. UI thread only."""
+        if text:
+            self._insert(self.normalize(text))
+
+    def post(self, text: str) -> None:
+        """
+        Queue text from any thread. Everything queued before the UI thread gets to
+        the WM_FLUSH message is inserted with a single EM_REPLACESEL.
+        """
+        if not text:
+            return
+
+        with self._lock:
+            self._pending.append(text)
+            if self._posted:
+                return
+            self._posted = True
+
+        PostMessage(self._hwnd, self.WM_FLUSH, 0, 0)
+
+    def flush(self) -> None:
+        """Insert everything queued by `post`. UI thread only."""
+        with self._lock:
+            chunks = list(self._pending)
+            self._pending.clear()
+            self._posted = False
+
+        if chunks:
+            self._insert(self.normalize(''.join(chunks)))
+
+    def _insert(self, text: str) -> None:
+        hwnd = self._hwnd
+
+        length = SendMessage(hwnd, win32con.WM_GETTEXTLENGTH, 0, 0)
+        first_visible = SendMessage(hwnd, win32con.EM_GETFIRSTVISIBLELINE, 0, 0)
+        following = self._is_at_end()
+
+        SendMessage(hwnd, win32con.WM_SETREDRAW, False, 0)
+        try:
+            trimmed_lines = 0
+            if self.ring_limit is not None and length + len(text) > self.ring_limit:
+                trimmed_lines, removed = self._trim_head(length + len(text) - self.ring_limit)
+                length -= removed
+
+            SendMessage(hwnd, win32con.EM_SETSEL, length, length)
+            SendMessage(hwnd, win32con.EM_REPLACESEL, False, text)
+
+            if following:
+                SendMessage(hwnd, win32con.EM_SCROLLCARET, 0, 0)
+            else:
+                # Keep the lines the reader was looking at in place
+                target = max(0, first_visible - trimmed_lines)
+                current = SendMessage(hwnd, win32con.EM_GETFIRSTVISIBLELINE, 0, 0)
+                if current != target:
+                    SendMessage(hwnd, win32con.EM_LINESCROLL, 0, target - current)
+
+        finally:
+            SendMessage(hwnd, win32con.WM_SETREDRAW, True, 0)
+            InvalidateRect(hwnd, None, True)
+
+        if self._on_change is not None:
+            self._on_change()
+
+    def _trim_head(self, excess: int) -> tuple[int, int]:
+        """Drop at least `excess` characters, in whole lines, from the head of the buffer."""
+        hwnd = self._hwnd
+
+        target = max(excess, self.trim_chunk)
+        length = SendMessage(hwnd, win32con.WM_GETTEXTLENGTH, 0, 0)
+        if target >= length:
+            line_count = SendMessage(hwnd, win32con.EM_GETLINECOUNT, 0, 0)
+            SendMessage(hwnd, win32con.EM_SETSEL, 0, -1)
+            SendMessage(hwnd, win32con.EM_REPLACESEL, False, '')
+            return line_count - 1, length
+
+        # Cut at the start of the line following the target offset
+        line = SendMessage(hwnd, win32con.EM_LINEFROMCHAR, target, 0) + 1
+        cut = SendMessage(hwnd, win32con.EM_LINEINDEX, line, 0)
+        if cut < 0:
+            cut = length
+
+        SendMessage(hwnd, win32con.EM_SETSEL, 0, cut)
+        SendMessage(hwnd, win32con.EM_REPLACESEL, False, '')
+
+        return line, cut
+
+    def _is_at_end(self) -> bool:
+        hwnd = self._hwnd
+
+        line_count = SendMessage(hwnd, win32con.EM_GETLINECOUNT, 0, 0)
+        first_visible = SendMessage(hwnd, win32con.EM_GETFIRSTVISIBLELINE, 0, 0)
+
+        # The last line is visible if it fits in the rows below the first visible one
+        return line_count - first_visible <= self.visible_rows()
+
+    def visible_rows(self) -> int:
+        """Number of text rows the control shows, from its formatting rectangle and line height."""
+        hwnd = self._hwnd
+
+        second_line = SendMessage(hwnd, win32con.EM_LINEINDEX, 1, 0)
+        if second_line < 0:
+            return 1
+
+        rect = wintypes.RECT()
+        SendMessage(hwnd, win32con.EM_GETRECT, 0, ctypes.byref(rect))
+
+        # EM_POSFROMCHAR packs the client position as x | (y << 16)
+        first_y = (SendMessage(hwnd, win32con.EM_POSFROMCHAR, 0, 0) >> 16) & 0xFFFF
+        second_y = (SendMessage(hwnd, win32con.EM_POSFROMCHAR, second_line, 0) >> 16) & 0xFFFF
+        line_height = second_y - first_y
+        if line_height <= 0:
+            return 1
+
+        return max(1, (rect.bottom - rect.top) // line_height)
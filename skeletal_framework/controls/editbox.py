@@ -4,17 +4,21 @@ import win32con
 
 from skeletal_framework.core_context import CoreContext
 from skeletal_framework.controls.custom_scrollbar import CustomScrollBar
+from skeletal_framework.controls.edit_stream import EditStream
+from skeletal_framework.controls.scroll_target import ScrollState
 from skeletal_framework.dispatcher import Dispatcher
+from skeletal_framework.dpi import DpiContext
+from skeletal_framework.layout.transaction import LayoutTransaction, after_layout, move_window
 from skeletal_framework.win32_bindings.gdi32 import (
-    CreateSolidBrush, DeleteObject, SetTextColor, SetBkColor, CreateFont
+    CreateSolidBrush, DeleteObject, SetTextColor, SetBkColor
 )
 from skeletal_framework.win32_bindings.kernel32 import GetModuleHandle
-from skeletal_framework.win32_bindings.macros import hiword, loword, MAKEWPARAM
+from skeletal_framework.win32_bindings.macros import hiword
 from skeletal_framework.win32_bindings.user32 import (
     SCROLLINFO, WNDCLASS, WNDPROC, CreateWindowEx, DefWindowProc, RegisterClass,
     LoadCursor, PostMessage, SetWindowLong, CallWindowProc,
     SendMessage, SetWindowText, GetWindowLong, GetScrollInfo,
-    GetSystemMetrics, SetWindowPos
+    SetWindowPos
 )
 
 
@@ -22,6 +26,17 @@ class CustomEditBox:
     _CLASS_NAME = "CustomEditBoxContainerClass"
     _ATOM = None
 
+    # Notifications after which the EDIT control's scroll state may have changed
+    _SCROLL_NOTIFICATIONS = frozenset({win32con.EN_VSCROLL, win32con.EN_CHANGE, win32con.EN_UPDATE})
+
+    _WHEEL_LINES = 3
+
+    # Caret movement can scroll the control without any notification
+    _NAVIGATION_KEYS = frozenset({
+        win32con.VK_UP, win32con.VK_DOWN, win32con.VK_PRIOR, win32con.VK_NEXT,
+        win32con.VK_HOME, win32con.VK_END
+    })
+
     def __init__(
             self,
             x: int, y: int, width: int, height: int,
@@ -35,6 +50,7 @@ class CustomEditBox:
             text_color: int = wintypes.RGB(220, 220, 220),
             scrollbar_width: int = 18,
             border_size: int = 1,
+            ring_limit: int | None = None,
             parent_hwnd: int | None = None
     ):
         self._core_context = CoreContext()
@@ -49,6 +65,9 @@ class CustomEditBox:
         self.scrollbar_width = scrollbar_width
         self.border_size = border_size
 
+        self._dpi = DpiContext.for_window(self._parent_hwnd)
+        self._scale_metrics()
+
         self._h_instance = GetModuleHandle(None)
         self._bg_brush = CreateSolidBrush(self.bg_color)
         self._border_brush = CreateSolidBrush(self.border_color)
@@ -58,8 +77,8 @@ class CustomEditBox:
 
         self._hwnd_edit = self._create_edit_control()
 
-        # Create and set font
-        self._h_font = self._create_font()
+        # The font is owned by the DPI context
+        self._h_font = self._dpi.font(self.font_name, self.font_size)
         SendMessage(self._hwnd_edit, win32con.WM_SETFONT, self._h_font, True)
 
         self._scrollbar = self._create_scrollbar()
@@ -71,34 +90,23 @@ class CustomEditBox:
             win32con.SWP_NOMOVE | win32con.SWP_NOSIZE
         )
 
+        # The state of the last sync, and whether a notification arrived since;
+        # the sync runs once the EDIT control finished the message.
+        self._scroll_state: ScrollState | None = None
+        self._scroll_dirty = False
+
         self._parent_proc = None
         self._subclass_edit_control()
 
+        self._stream = EditStream(self._hwnd_edit, ring_limit = ring_limit, on_change = self.update_scrollbar)
+
         self.set_text(text)
         self.update_scrollbar()
 
-    def _create_font(self):
-        # Calculate height from point size.
-        # Formula: -MulDiv(PointSize, GetDeviceCaps(hDC, LOGPIXELSY), 72)
-        # Assuming 96 DPI for simplicity here: -int(size * 96 / 72) -> size * 1.333
-        height = -int(self.font_size * 1.33333)
-
-        return CreateFont(
-            cHeight = height,
-            cWidth = 0,
-            cEscapement = 0,
-            cOrientation = 0,
-            cWeight = win32con.FW_NORMAL,
-            bItalic = 0,
-            bUnderline = 0,
-            bStrikeOut = 0,
-            iCharSet = win32con.DEFAULT_CHARSET,
-            iOutPrecision = win32con.OUT_DEFAULT_PRECIS,
-            iClipPrecision = win32con.CLIP_DEFAULT_PRECIS,
-            iQuality = win32con.CLEARTYPE_QUALITY,
-            iPitchAndFamily = win32con.DEFAULT_PITCH | win32con.FF_DONTCARE,
-            pszFaceName = self.font_name
-        )
+    def _scale_metrics(self):
+        # scrollbar_width and border_size are 96-DPI lengths
+        self._scrollbar_px = self._dpi.scale(self.scrollbar_width)
+        self._border_px = self._dpi.scale(self.border_size)
 
     def _register_class(self):
         if CustomEditBox._ATOM is None:
@@ -139,15 +147,7 @@ class CustomEditBox:
                 | win32con.WS_CLIPSIBLINGS
         )
 
-        sys_sb_width = GetSystemMetrics(win32con.SM_CXVSCROLL)
-
-        edit_x = self.border_size
-        edit_y = self.border_size
-
-        available_width = self.width - (self.border_size * 2) - self.scrollbar_width
-        edit_width = available_width + sys_sb_width
-
-        edit_height = self.height - (self.border_size * 2)
+        edit_x, edit_y, edit_width, edit_height = self._edit_rect()
 
         hwnd = CreateWindowEx(
             dwExStyle = 0, lpClassName = 'EDIT', lpWindowName = "", dwStyle = edit_style,
@@ -156,14 +156,31 @@ class CustomEditBox:
         )
         return hwnd
 
+    def _edit_rect(self) -> tuple[int, int, int, int]:
+        # The EDIT control is made wider than the container by the width of its own
+        # scrollbar, which pushes the native scrollbar out of sight under ours.
+        sys_sb_width = self._dpi.metric(win32con.SM_CXVSCROLL)
+
+        available_width = self.width - (self._border_px * 2) - self._scrollbar_px
+        edit_width = available_width + sys_sb_width
+        edit_height = self.height - (self._border_px * 2)
+
+        return self._border_px, self._border_px, edit_width, edit_height
+
+    def _scrollbar_rect(self) -> tuple[int, int, int, int]:
+        sb_x = self.width - self._scrollbar_px - self._border_px
+        sb_y = self._border_px
+        sb_height = self.height - (self._border_px * 2)
+
+        return sb_x, sb_y, self._scrollbar_px, sb_height
+
     def _create_scrollbar(self):
-        sb_x = self.width - self.scrollbar_width - self.border_size
-        sb_y = self.border_size
-        sb_height = self.height - (self.border_size * 2)
+        sb_x, sb_y, sb_width, sb_height = self._scrollbar_rect()
         return CustomScrollBar(
             parent_hwnd = self._hwnd,
             x = sb_x, y = sb_y,
-            width = self.scrollbar_width, height = sb_height
+            width = sb_width, height = sb_height,
+            target = self
         )
 
     def _subclass_edit_control(self):
@@ -174,11 +191,58 @@ class CustomEditBox:
     def hwnd(self):
         return self._hwnd
 
+    def move(self, x: int, y: int, width: int, height: int):
+        """
+        Move and resize the container, the EDIT control and the scrollbar in one batch.
+
+        Joins the caller's open `LayoutTransaction`, if any, so the box can be laid out
+        together with its siblings. The scrollbar is synced with the EDIT control once
+        that transaction is committed, as only then does the control have its new size.
+        """
+        self.x, self.y, self.width, self.height = x, y, width, height
+
+        with LayoutTransaction():
+            move_window(self._hwnd, x, y, width, height)
+            move_window(self._hwnd_edit, *self._edit_rect())
+            self._scrollbar.move(*self._scrollbar_rect())
+            after_layout(self.update_scrollbar)
+
+    def set_dpi(self, context: DpiContext):
+        """
+        Switch fonts and metrics to a new DPI and re-place the children.
+
+        The owner is expected to move the box itself to its rescaled rectangle in the
+        same `LayoutTransaction`.
+        """
+        if context is self._dpi:
+            return
+
+        self._dpi = context
+        self._scale_metrics()
+
+        self._h_font = context.font(self.font_name, self.font_size)
+        SendMessage(self._hwnd_edit, win32con.WM_SETFONT, self._h_font, True)
+
+        self._scrollbar.set_dpi(context)
+        self.move(self.x, self.y, self.width, self.height)
+
     def set_text(self, text: str):
         SetWindowText(self._hwnd_edit, text)
         self.update_scrollbar()
 
-    def update_scrollbar(self):
+    def append(self, text: str):
+        """
+        Append text without rewriting the buffer; the view follows the tail unless it
+        was scrolled up. With a `ring_limit`, the oldest lines are dropped as needed.
+        """
+        self._stream.append(text)
+
+    def post_append(self, text: str):
+        """Thread-safe `append`; queued text is inserted in one batch on the UI thread."""
+        self._stream.post(text)
+
+    def scroll_state(self) -> ScrollState:
+        """The EDIT control's vertical scroll state, in lines."""
         si = SCROLLINFO()
         si.cbSize = ctypes.sizeof(SCROLLINFO)
         si.fMask = win32con.SIF_ALL
@@ -186,20 +250,33 @@ class CustomEditBox:
         try:
             GetScrollInfo(self._hwnd_edit, win32con.SB_VERT, si)
         except OSError:
-            self._scrollbar.set_scroll_params(0.0, 1.0)
-            return
+            # No scroll range: everything fits
+            return ScrollState(0, 0, 0)
+
+        return ScrollState(si.nPos - si.nMin, si.nPage, si.nMax - si.nMin + 1)
 
-        content_size = si.nMax - si.nMin + 1
+    def scroll_to(self, position: int):
+        """Make line `position` the first visible line."""
+        state = self.scroll_state()
+        position = max(0, min(position, state.max_position))
+
+        if position != state.position:
+            SendMessage(self._hwnd_edit, win32con.EM_LINESCROLL, 0, position - state.position)
+        self.update_scrollbar()
+
+    def scroll_by(self, lines: int):
+        SendMessage(self._hwnd_edit, win32con.EM_LINESCROLL, 0, lines)
+        self.update_scrollbar()
+
+    def update_scrollbar(self):
+        self._scroll_dirty = False
 
-        if si.nMax <= 0 or si.nPage >= content_size:
-            scroll_pos = 0.0
-            page_size = 1.0
-        else:
-            max_scroll = content_size - si.nPage
-            scroll_pos = si.nPos / max_scroll if max_scroll > 0 else 0
-            page_size = si.nPage / content_size
+        state = self.scroll_state()
+        if state == self._scroll_state:
+            return
 
-        self._scrollbar.set_scroll_params(scroll_pos, page_size)
+        self._scroll_state = state
+        self._scrollbar.set_scroll_state(state)
 
     def wnd_proc(self, hwnd, msg, wparam, lparam):
         if msg == win32con.WM_CTLCOLORSTATIC and lparam == self._hwnd_edit:
@@ -207,30 +284,13 @@ class CustomEditBox:
             SetBkColor(wparam, self.bg_color)
             return self._bg_brush
 
-        elif msg == win32con.WM_MOUSEWHEEL:
-            SendMessage(self._hwnd_edit, msg, wparam, lparam)
+        elif msg == win32con.WM_COMMAND and lparam == self._hwnd_edit:
+            if hiword(wparam) in self._SCROLL_NOTIFICATIONS:
+                self._scroll_dirty = True
             return 0
 
-        elif msg == win32con.WM_VSCROLL and lparam == self._scrollbar.hwnd:
-            scroll_code = loword(wparam)
-
-            if scroll_code == win32con.SB_THUMBTRACK:
-                pos_float = hiword(wparam) / 65535.0
-                si = SCROLLINFO()
-                si.cbSize = ctypes.sizeof(SCROLLINFO)
-                si.fMask = win32con.SIF_RANGE | win32con.SIF_PAGE
-                try:
-                    GetScrollInfo(self._hwnd_edit, win32con.SB_VERT, si)
-                    max_scroll = si.nMax - si.nPage + 1
-                    new_pos = int(pos_float * max_scroll)
-                    SendMessage(self._hwnd_edit, win32con.WM_VSCROLL, MAKEWPARAM(win32con.SB_THUMBTRACK, new_pos), 0)
-                except OSError:
-                    pass
-
-            elif scroll_code in (win32con.SB_LINEUP, win32con.SB_LINEDOWN, win32con.SB_PAGEUP, win32con.SB_PAGEDOWN):
-                SendMessage(self._hwnd_edit, win32con.WM_VSCROLL, MAKEWPARAM(scroll_code, 0), 0)
-
-            self.update_scrollbar()
+        elif msg == win32con.WM_MOUSEWHEEL:
+            self._on_mouse_wheel(wparam)
             return 0
 
         elif msg == win32con.WM_NCDESTROY:
@@ -239,10 +299,30 @@ class CustomEditBox:
 
         return DefWindowProc(hwnd, msg, wparam, lparam)
 
+    def _on_mouse_wheel(self, wparam):
+        delta = hiword(wparam)
+        if delta > 32767: delta -= 65536
+
+        # Scrolled through the scrollbar's smooth scroller rather than the EDIT control
+        self._scrollbar.impulse(-delta * self._WHEEL_LINES / 120)
+
     def wnd_proc_edit(self, hwnd, msg, wparam, lparam):
+        if msg == EditStream.WM_FLUSH:
+            self._stream.flush()
+            return 0
+
+        elif msg == win32con.WM_MOUSEWHEEL:
+            self._on_mouse_wheel(wparam)
+            return 0
+
         res = CallWindowProc(self._parent_proc, hwnd, msg, wparam, lparam)
 
-        if msg in (win32con.WM_VSCROLL, win32con.WM_MOUSEWHEEL, win32con.WM_KEYDOWN, win32con.WM_KEYUP, win32con.WM_CHAR):
+        if msg == win32con.WM_KEYDOWN and wparam in self._NAVIGATION_KEYS:
+            self._scroll_dirty = True
+
+        # EN_* notifications are sent while the EDIT control handles the message,
+        # which may be before it updated its scroll position; sync afterwards.
+        if self._scroll_dirty:
             self.update_scrollbar()
 
         return res
@@ -250,9 +330,6 @@ class CustomEditBox:
     def _cleanup(self):
         if self._bg_brush: DeleteObject(self._bg_brush)
         if self._border_brush: DeleteObject(self._border_brush)
-        # Delete font object
-        if hasattr(self, '_h_font') and self._h_font:
-            DeleteObject(self._h_font)
 
         if self._hwnd_edit and self._parent_proc:
             SetWindowLong(self._hwnd_edit, win32con.GWL_WNDPROC, self._parent_proc)
@@ -1,17 +1,14 @@
-import ctypes
 from ctypes import wintypes
 
 import win32con
 
+from skeletal_framework.dpi import DpiContext
+from skeletal_framework.layout.box_layout import Size
+from skeletal_framework.text_metrics import TextMetrics
 from skeletal_framework.win32_bindings.gdi32 import (
-    # Structures
-    LOGFONT,
-
-    # Functions
-    CreateFontIndirect, CreatePen, CreateSolidBrush,
+    CreatePen, CreateSolidBrush,
     DeleteObject,
     ExtTextOut,
-    GetTextExtentPoint32,
     RoundRect,
     SelectObject, SetBkMode, SetTextColor
 )
@@ -46,20 +43,14 @@ class GroupBox:
         self.corner_radius = corner_radius
         self.line_color = line_color or wintypes.RGB(180, 180, 180)  # Light gray default
         self.title_padding = title_padding
-        self._font = self._create_log_font(font_name, font_size)
-
-    @staticmethod
-    def _create_log_font(font_name: str, font_size: int) -> LOGFONT:
-        """Helper method to create a LOGFONT structure."""
-        return LOGFONT(
-            height = -int(font_size * 1.333),
-            charset = win32con.DEFAULT_CHARSET,
-            out_precision = win32con.OUT_DEFAULT_PRECIS,
-            clip_precision = win32con.CLIP_DEFAULT_PRECIS,
-            quality = win32con.DEFAULT_QUALITY,
-            pitch_and_family = win32con.DEFAULT_PITCH | win32con.FF_DONTCARE,
-            face_name = font_name,
-        )
+        self.font_name = font_name
+        self.font_size = font_size
+        self._dpi = DpiContext.for_window(parent_hwnd)
+
+    @property
+    def _font(self) -> int:
+        # Shared by the DPI context, so the handle is stable and its measurements cacheable
+        return self._dpi.font(self.font_name, self.font_size, quality = win32con.DEFAULT_QUALITY)
 
     def draw(self, hdc: int):
         release_dc = False
@@ -72,12 +63,11 @@ class GroupBox:
 
         old_bk_mode = SetBkMode(hdc, win32con.TRANSPARENT)
 
-        hfont = CreateFontIndirect(ctypes.byref(self._font))
+        hfont = self._font
         old_font = SelectObject(hdc, hfont)
 
         try:
-            title_size = wintypes.SIZE()
-            GetTextExtentPoint32(hdc, self.title, len(self.title), ctypes.byref(title_size))
+            title_size = TextMetrics().measure(hfont, self.title)
 
             self._draw_rounded_rect_with_title_gap(hdc, title_size)
 
@@ -86,7 +76,7 @@ class GroupBox:
                 ExtTextOut(
                     hdc,
                     self.x + self.corner_radius + self.title_padding,
-                    self.y - title_size.cy // 2 - 2,
+                    self.y - title_size.height // 2 - 2,
                     0,
                     None,
                     self.title,
@@ -96,7 +86,6 @@ class GroupBox:
 
         finally:
             SelectObject(hdc, old_font)
-            DeleteObject(hfont)
             SetBkMode(hdc, old_bk_mode)
             SelectObject(hdc, old_pen)
             DeleteObject(pen)
@@ -104,12 +93,12 @@ class GroupBox:
             if release_dc:
                 ReleaseDC(self._parent_hwnd, hdc)
 
-    def _draw_rounded_rect_with_title_gap(self, hdc, title_size: wintypes.SIZE):
+    def _draw_rounded_rect_with_title_gap(self, hdc, title_size: Size):
         """Draw a rounded rectangle with a gap for the title text."""
         if self.title:
             # Calculate the gap for the title using title_padding
             gap_start = self.x + self.title_padding - 10
-            gap_width = gap_start + 10 + title_size.cx + 20
+            gap_width = gap_start + 10 + title_size.width + 20
 
             bg_color = GetSysColor(win32con.COLOR_BTNFACE)
             bg_brush = CreateSolidBrush(bg_color)
@@ -1,35 +1,44 @@
-from functools import cached_property
+import threading
 from ctypes import wintypes
+from typing import TYPE_CHECKING
 
 import win32con
-from PIL import Image as PilImage, ImageWin
-from PIL.Image import Image
-
+from skeletal_framework import resources
+from skeletal_framework._lazy import lazy_import, preload
+from skeletal_framework.canvas_cache import CanvasCache
 from skeletal_framework.core_context import CoreContext
 from skeletal_framework.dispatcher import Dispatcher
-from skeletal_framework.win32_bindings.gdi32 import CreateSolidBrush, CreatePen, DeleteObject, SelectObject, MoveToEx, LineTo, SetBkMode, SetTextColor, LOGFONT, CreateFontIndirect
-from skeletal_framework.win32_bindings.user32 import GetClientRect, CreateWindowEx, ShowWindow, UpdateWindow, RegisterClassEx, WNDCLASSEX, LoadCursor, BeginPaint, EndPaint, FillRect, DestroyWindow, GetSysColorBrush, DefWindowProc, DrawText
+from skeletal_framework.dpi import DpiContext
+from skeletal_framework.layout.transaction import move_window
+from skeletal_framework.win32_bindings.gdi32 import CreateSolidBrush, CreatePen, DeleteObject, SelectObject, MoveToEx, LineTo, SetBkMode, SetTextColor
+from skeletal_framework.win32_bindings.user32 import GetClientRect, CreateWindowEx, ShowWindow, UpdateWindow, RegisterClassEx, WNDCLASSEX, LoadCursor, BeginPaint, EndPaint, FillRect, InvalidateRect, DestroyWindow, GetSysColorBrush, DefWindowProc, DrawText
 from skeletal_framework.win32_bindings.macros import adjust_rgb, get_rgb
 
+if TYPE_CHECKING:
+    from PIL.Image import Image
+
+# Loaded when the first canvas is fitted, not when the module is imported
+PilImage = lazy_import('PIL.Image')
+ImageWin = lazy_import('PIL.ImageWin')
+
 _image_panels = {}
 
 
 class Header:
     _class_registered = False
     _class_name = "TitlePanelClass"
+    # `prepare` may run on a worker thread while the UI thread creates a header
+    _register_lock = threading.Lock()
 
-    @cached_property
-    def _width(self) -> int:
-        rect = wintypes.RECT()
-        GetClientRect(self._core_context.main_window, rect)
-
-        return rect.right - rect.left
+    # 56.25pt is 75px at 96 DPI; the font is shared through the DPI context
+    _FONT_NAME = 'Microsoft Sans Serif'
+    _FONT_SIZE = 56.25
 
     def __init__(
             self, text: str,
             *,
-            side_image: Image,
-            center_image: Image | None = None,
+            side_image: 'Image',
+            center_image: 'Image | None' = None,
             edge_length: int = 60,
             text_color: int = wintypes.RGB(0, 0, 0),
             bg_color: int = wintypes.RGB(255, 255, 255),
@@ -38,8 +47,11 @@ class Header:
             flip_right_image: bool = False,
     ):
         self._core_context: CoreContext = CoreContext()
+        self._dpi = DpiContext.for_window(self._core_context.main_window)
 
-        self._edge_length = edge_length
+        # edge_length is a 96-DPI length; _edge_length is in physical pixels
+        self._base_edge_length = edge_length
+        self._edge_length = self._dpi.scale(edge_length)
         self._text_color = text_color
         self._bg_color = bg_color
         self._scale_factors = scale_factors
@@ -47,37 +59,167 @@ class Header:
         self._flip_right_image = flip_right_image
         self._text = text
         self._side_image = side_image
+        self._center_image = center_image
+        self._width = self._parent_client_width()
 
         self._register_window_class(h_instance = self._core_context.h_instance)
         self.hwnd = self._create_window()
 
-        self._side_canvas = self._create_fitted_canvas(
-            image = side_image,
+        self._side_canvas: 'Image | None' = None
+        self._center_canvas: 'Image | None' = None
+        self._draft = False
+        self._center_canvas_is_draft = False
+        self._fit_side_canvas()
+        self._fit_center_canvas()
+
+        _image_panels[self.hwnd] = self
+
+        UpdateWindow(self.hwnd)
+        ShowWindow(self.hwnd, win32con.SW_SHOW)
+
+    @classmethod
+    def prepare(
+            cls, context: DpiContext, parent_width: int,
+            *,
+            side_image: 'Image',
+            center_image: 'Image | None' = None,
+            edge_length: int = 60,
+            bg_color: int = wintypes.RGB(255, 255, 255)
+    ) -> None:
+        """
+        Do the expensive part of constructing a header ahead of time: register the
+        window class, create the font, and fit and pin the canvases that a header with
+        these arguments needs under a `parent_width` wide parent at `context`. A header
+        built that way afterwards only creates its window.
+        """
+        preload(PilImage, ImageWin)
+        cls._register_window_class(h_instance = CoreContext().h_instance)
+        context.font(cls._FONT_NAME, cls._FONT_SIZE, weight = win32con.FW_BOLD)
+
+        edge = context.scale(edge_length)
+        cls._cached_fitted_canvas(side_image, edge, edge, bg_color, pin = True).close()
+
+        if center_image:
+            cls._cached_fitted_canvas(
+                center_image, cls._center_width(parent_width, edge), edge, bg_color, pin = True
+            ).close()
+
+    @property
+    def height(self) -> int:
+        return self._edge_length + 6
+
+    @staticmethod
+    def _center_width(width: int, edge_length: int) -> int:
+        return max(1, width - (edge_length * 2) - 6)
+
+    def move(self, x: int, y: int, width: int, height: int) -> None:
+        """Reposition the panel; the center image is refitted when the width changes."""
+        if width != self._width:
+            self._width = width
+            self._fit_center_canvas()
+
+        move_window(self.hwnd, x, y, width, height)
+
+    def set_draft_quality(self, draft: bool) -> None:
+        """
+        While a window is being resized interactively, refit the center image with a
+        fast filter; switching back refits it at full quality if needed.
+        """
+        self._draft = draft
+
+        if not draft and self._center_canvas_is_draft:
+            self._fit_center_canvas()
+            InvalidateRect(self.hwnd, None, False)
+
+    def set_dpi(self, context: DpiContext) -> None:
+        """Rescale the images and the font; the owner re-lays the panel out at its new `height`."""
+        if context is self._dpi:
+            return
+
+        self._dpi = context
+        self._edge_length = context.scale(self._base_edge_length)
+
+        self._fit_side_canvas()
+        self._fit_center_canvas()
+
+    def _parent_client_width(self) -> int:
+        rect = wintypes.RECT()
+        GetClientRect(self._core_context.main_window, rect)
+
+        return rect.right - rect.left
+
+    def _fit_side_canvas(self) -> None:
+        if self._side_canvas is not None:
+            self._side_canvas.close()
+
+        self._side_canvas = self._cached_fitted_canvas(
+            image = self._side_image,
             width = self._edge_length,
             height = self._edge_length,
             bg_color = self._bg_color
         )
 
-        self._center_canvas: Image | None = None
-        if center_image:
-            center_canvas_width = self._width - (self._edge_length * 2) - 6
+    def _fit_center_canvas(self) -> None:
+        if not self._center_image:
+            return
+
+        if self._center_canvas is not None:
+            self._center_canvas.close()
+
+        width = self._center_width(self._width, self._edge_length)
+
+        # Draft canvases are thrown away when the drag ends; only final ones are worth keeping
+        if self._draft:
             self._center_canvas = self._create_fitted_canvas(
-                image = center_image,
-                width = center_canvas_width,
+                image = self._center_image,
+                width = width,
+                height = self._edge_length,
+                bg_color = self._bg_color,
+                resample = PilImage.Resampling.BILINEAR
+            )
+        else:
+            self._center_canvas = self._cached_fitted_canvas(
+                image = self._center_image,
+                width = width,
                 height = self._edge_length,
                 bg_color = self._bg_color
             )
+        self._center_canvas_is_draft = self._draft
 
-        _image_panels[self.hwnd] = self
-
-        UpdateWindow(self.hwnd)
-        ShowWindow(self.hwnd, win32con.SW_SHOW)
+    @classmethod
+    def _cached_fitted_canvas(
+            cls, image: 'Image', width: int, height: int, bg_color: int,
+            resample: int | None = None, pin: bool = False
+    ) -> 'Image':
+        """
+        `_create_fitted_canvas` through the disk cache, so reopening the dialog resamples
+        nothing; `pin` also keeps the canvas in memory (`CanvasCache.pin`).
+        """
+        if resample is None:
+            resample = PilImage.Resampling.LANCZOS
+
+        cache = CanvasCache()
+        return (cache.pin if pin else cache.get_or_create)(
+            image, (width, height), bg_color, resample,
+            lambda: cls._create_fitted_canvas(image, width, height, bg_color, resample)
+        )
 
     @staticmethod
-    def _create_fitted_canvas(image: Image, width: int, height: int, bg_color: int) -> Image:
+    def _create_fitted_canvas(
+            image: 'Image', width: int, height: int, bg_color: int,
+            resample: int | None = None
+    ) -> 'Image':
+        """`image` scaled to fit `width` x `height`, centered on `bg_color`; LANCZOS unless `resample` is given."""
+        if resample is None:
+            resample = PilImage.Resampling.LANCZOS
+
         ratio = min(width / image.width, height / image.height)
         new_size = (int(image.width * ratio), int(image.height * ratio))
-        resized_image = image.resize(new_size, PilImage.Resampling.LANCZOS)
+
+        # Resample from the smallest embedded level that covers the target; at the
+        # DPIs the pack was built for that is an exact fit and nothing is resized
+        source = resources.nearest_level(image, *new_size)
+        resized_image = source if source.size == new_size else source.resize(new_size, resample)
         mask = resized_image.split()[3] if 'A' in resized_image.getbands() else None
 
         paste_x = (width - new_size[0]) // 2
@@ -94,7 +236,7 @@ class Header:
             lpClassName = self._class_name,
             lpWindowName = "Title Panel",
             dwStyle = win32con.WS_CHILD,
-            x = 0, y = 0, nWidth = self._width, nHeight = self._edge_length + 6,
+            x = 0, y = 0, nWidth = self._width, nHeight = self.height,
             hWndParent = self._core_context.main_window,
             hMenu = None,
             hInstance = self._core_context.h_instance,
@@ -108,17 +250,21 @@ class Header:
         if cls._class_registered:
             return
 
-        RegisterClassEx(
-            WNDCLASSEX(
-                style = win32con.CS_HREDRAW | win32con.CS_VREDRAW,
-                lpfnWndProc = Dispatcher,
-                hInstance = h_instance,
-                hCursor = LoadCursor(0, win32con.IDC_ARROW),
-                hbrBackground = GetSysColorBrush(win32con.BLACK_BRUSH),
-                lpszClassName = cls._class_name
+        with Header._register_lock:
+            if cls._class_registered:
+                return
+
+            RegisterClassEx(
+                WNDCLASSEX(
+                    style = win32con.CS_HREDRAW | win32con.CS_VREDRAW,
+                    lpfnWndProc = Dispatcher,
+                    hInstance = h_instance,
+                    hCursor = LoadCursor(0, win32con.IDC_ARROW),
+                    hbrBackground = GetSysColorBrush(win32con.BLACK_BRUSH),
+                    lpszClassName = cls._class_name
+                )
             )
-        )
-        cls._class_registered = True
+            cls._class_registered = True
 
     @staticmethod
     def wnd_proc(hwnd, msg, wparam, lparam):
@@ -130,7 +276,7 @@ class Header:
             if header:
                 ps, hdc = BeginPaint(hwnd)
 
-                header._draw_sunken_area(hdc, 0, 0, header._width, header._edge_length + 6)
+                header._draw_sunken_area(hdc, 0, 0, header._width, header.height)
                 header._draw_left_image(hdc, 3, 3, header._flip_left_image)
                 header._draw_right_image(hdc, header._width - header._edge_length - 3, 3, header._flip_right_image)
                 header._draw_center_image(hdc, header._edge_length + 3, 3)
@@ -262,14 +408,7 @@ class Header:
             rect.bottom
         )
 
-        font = LOGFONT(
-            height = -75,
-            weight = win32con.FW_BOLD,
-            face_name = 'Microsoft Sans Serif',
-            charset = win32con.DEFAULT_CHARSET,  # Important for character encoding
-            quality = win32con.CLEARTYPE_QUALITY  # Better text rendering
-        )
-        h_font = CreateFontIndirect(font)
+        h_font = self._dpi.font(self._FONT_NAME, self._FONT_SIZE, weight = win32con.FW_BOLD)
         old_font = SelectObject(hdc, h_font)
 
         SetBkMode(hdc, win32con.TRANSPARENT)
@@ -284,7 +423,6 @@ class Header:
         )
 
         SelectObject(hdc, old_font)
-        DeleteObject(h_font)
 
     def destroy(self) -> None:
         """Destroy the panel window."""
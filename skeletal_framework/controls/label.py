@@ -5,6 +5,7 @@ import win32con
 
 from skeletal_framework.core_context import CoreContext
 from skeletal_framework.dispatcher import Dispatcher
+from skeletal_framework.dpi import DpiContext
 from skeletal_framework.win32_bindings.gdi32 import *
 from skeletal_framework.win32_bindings.user32 import *
 
@@ -29,7 +30,7 @@ class Label:
         self._context = CoreContext()
         self._parent_hwnd = parent_hwnd or self._context.main_window
 
-        self._font = self._create_font(font_name, font_size)
+        self._font = self._create_font(font_name, font_size, DpiContext.for_window(self._parent_hwnd))
         self._style = style
 
         self._register_class(self._context.h_instance)
@@ -67,11 +68,11 @@ class Label:
         cls._class_registered = True
 
     @staticmethod
-    def _create_font(font_name: str, font_size: int) -> int:
+    def _create_font(font_name: str, font_size: int, dpi: DpiContext) -> int:
         """Helper method to create a LOGFONT structure."""
         return CreateFontIndirect(
             LOGFONT(
-                height = -int(font_size * 1.333),
+                height = dpi.font_height(font_size),
                 weight = win32con.FW_NORMAL,
                 charset = win32con.DEFAULT_CHARSET,
                 out_precision = win32con.OUT_DEFAULT_PRECIS,
@@ -0,0 +1,66 @@
+"""
+Scroll protocol between `CustomScrollBar` and the view it scrolls.
+
+WM_VSCROLL can only carry a 16-bit thumb position, which cannot address every
+line of a document longer than 65,535 lines. A scrollbar bound to a
+`ScrollTarget` calls the view directly instead, in the view's own integer
+units, and the view reports back its `ScrollState`:
+
+    self._scrollbar = CustomScrollBar(hwnd, x, y, width, height, target = self)
+
+    def scroll_state(self) -> ScrollState:
+        return ScrollState(self._top_line, self.visible_lines, self.line_count)
+"""
+from dataclasses import dataclass
+from typing import Protocol, runtime_checkable
+
+__all__ = ['ScrollState', 'ScrollTarget']
+
+
+@dataclass(frozen = True, slots = True)
+class ScrollState:
+    """
+    Scroll position of a view, in units of the view's choosing (typically lines).
+
+    Attributes:
+        position: First visible unit, 0 to `max_position`.
+        page: Number of units visible at once.
+        total: Number of units in the document.
+    """
+    position: int
+    page: int
+    total: int
+
+    @property
+    def max_position(self) -> int:
+        return max(0, self.total - self.page)
+
+    @property
+    def fraction(self) -> float:
+        """Position as a fraction of the scrollable range; for painting only."""
+        max_position = self.max_position
+        return min(1.0, self.position / max_position) if max_position > 0 else 0.0
+
+    @property
+    def page_fraction(self) -> float:
+        """Visible part of the document, 1.0 when everything fits."""
+        return min(1.0, self.page / self.total) if self.total > 0 else 1.0
+
+    def position_at(self, fraction: float) -> int:
+        """The position at a fraction of the scrollable range."""
+        return round(max(0.0, min(1.0, fraction)) * self.max_position)
+
+
+@runtime_checkable
+class ScrollTarget(Protocol):
+    """A view that a `CustomScrollBar` scrolls through direct calls."""
+
+    def scroll_state(self) -> ScrollState:
+        ...
+
+    def scroll_to(self, position: int) -> None:
+        """Scroll so that `position` is the first visible unit, clamped to the valid range."""
+        ...
+
+    def scroll_by(self, delta: int) -> None:
+        ...
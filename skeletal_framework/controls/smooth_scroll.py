@@ -0,0 +1,255 @@
+"""
+Frame-timed smooth and kinetic scrolling for a `ScrollTarget`.
+
+`SmoothScroller` keeps a fractional scroll position and advances it on a single
+frame timer. Every input only changes where the position is heading:
+
+- `scroll_by` / `scroll_to` glide to a new goal (arrow buttons, track clicks, keys),
+- `impulse` adds momentum that decays with friction (mouse wheel),
+- `fling` starts a decelerating motion at a given velocity (thumb release),
+- `drag_to` follows the thumb directly, without easing,
+- `hold` keeps moving at a steady rate while a button is held down.
+
+On each frame the position is rounded to the target's units and the target gets
+at most one `scroll_to`, whatever number of inputs arrived since the last frame.
+The timer only runs while something is moving.
+
+    self._scroller = SmoothScroller(self._hwnd, target, on_frame = self._on_smooth_frame)
+
+    def wnd_proc(self, hwnd, msg, wparam, lparam):
+        if msg == win32con.WM_TIMER and self._scroller.handle_timer(wparam):
+            return 0
+"""
+import math
+import time
+from collections import deque
+from collections.abc import Callable
+from statistics import fmean
+
+from skeletal_framework.controls.scroll_target import ScrollState, ScrollTarget
+from skeletal_framework.layout.live_resize import FrameStats
+from skeletal_framework.win32_bindings.user32 import KillTimer, SetTimer
+
+__all__ = ['SmoothScroller']
+
+
+class SmoothScroller:
+    """
+    Animates the scroll position of one target.
+
+    Args:
+        hwnd: Window that receives the frame timer's WM_TIMER.
+        target: The view being scrolled.
+        on_frame: Called with the fractional position after every frame, e.g. to move a thumb.
+        frame_ms: Frame timer interval.
+        glide_ms: Time constant of the easing towards a goal; about 95% of the distance
+                  is covered after three of them.
+        friction: Velocity decay rate, per second, of impulses and flings.
+        history: Number of frame timings kept for `stats`.
+    """
+
+    TIMER_ID = 0x5353  # 'SS'
+
+    # Below this many units per second a motion is considered finished
+    _MIN_VELOCITY = 0.5
+    # Longest frame delta used for the physics; after a stall the motion resumes
+    # where it was rather than jumping
+    _MAX_DT = 0.1
+
+    def __init__(
+            self,
+            hwnd: int,
+            target: ScrollTarget,
+            *,
+            on_frame: Callable[[float], None] | None = None,
+            frame_ms: int = 16,
+            glide_ms: float = 60.0,
+            friction: float = 6.0,
+            history: int = 240
+    ):
+        self._hwnd = hwnd
+        self._target = target
+        self._on_frame = on_frame
+        self._frame_ms = frame_ms
+        self._glide = glide_ms / 1000
+        self.friction = friction
+
+        # Filled in by the first `sync`
+        self._state = ScrollState(0, 0, 0)
+        self._position = self._goal = 0.0
+        self._velocity = 0.0
+        self._sent = 0
+
+        self._hold_rate = 0.0
+        self._hold_start = 0.0
+        self._hold_condition: Callable[[], bool] | None = None
+
+        self._running = False
+        self._last_tick = 0.0
+        self._timings: deque[float] = deque(maxlen = history)
+        self._intervals: deque[float] = deque(maxlen = history)
+
+    @property
+    def position(self) -> float:
+        """Current fractional position, in target units."""
+        return self._position
+
+    @property
+    def animating(self) -> bool:
+        return self._running
+
+    def sync(self, state: ScrollState) -> None:
+        """
+        Record the target's state. A position the scroller did not send means the
+        target was scrolled by other means (keyboard, new text), which ends any motion.
+        """
+        self._state = state
+
+        if state.position != self._sent:
+            self.stop()
+            self._position = self._goal = float(state.position)
+            self._sent = state.position
+
+    def scroll_by(self, delta: float) -> None:
+        """Glide by `delta` units from wherever the current motion is heading."""
+        self._velocity = 0.0
+        self._set_goal(self._goal + delta)
+
+    def scroll_to(self, position: float) -> None:
+        self._velocity = 0.0
+        self._set_goal(position)
+
+    def impulse(self, delta: float) -> None:
+        """
+        Add momentum that carries the position about `delta` units further;
+        successive impulses in one direction accumulate.
+        """
+        if self._velocity and (self._velocity > 0) != (delta > 0):
+            self._velocity = 0.0
+
+        self._velocity += delta * self.friction
+        self._start()
+
+    def fling(self, velocity: float) -> None:
+        """Continue at `velocity` units per second, slowing down with friction."""
+        self._velocity = velocity
+        self._start()
+
+    def drag_to(self, position: float) -> None:
+        """Follow a thumb drag: no easing, but still applied on the next frame only."""
+        self._velocity = 0.0
+        self._position = self._goal = self._clamp(position)
+        self._start()
+
+    def hold(self, rate: float, delay_ms: int, condition: Callable[[], bool]) -> None:
+        """
+        After `delay_ms`, keep moving at `rate` units per second for as long as the hold
+        lasts, but only on frames where `condition()` is true.
+        """
+        self._hold_rate = rate
+        self._hold_start = time.perf_counter() + delay_ms / 1000
+        self._hold_condition = condition
+        self._start()
+
+    def release(self) -> None:
+        """End a `hold`; the position still glides to its goal."""
+        self._hold_condition = None
+        self._hold_rate = 0.0
+
+    def stop(self) -> None:
+        """End every motion where it is."""
+        self.release()
+        self._velocity = 0.0
+        self._goal = self._position
+
+        if self._running:
+            KillTimer(self._hwnd, self.TIMER_ID)
+            self._running = False
+
+    def handle_timer(self, timer_id: int) -> bool:
+        """Advance one frame if the WM_TIMER is the scroller's; returns whether it was."""
+        if timer_id != self.TIMER_ID:
+            return False
+
+        if self._running:
+            self._tick()
+        return True
+
+    def _set_goal(self, goal: float) -> None:
+        self._goal = self._clamp(goal)
+        self._start()
+
+    def _clamp(self, position: float) -> float:
+        return max(0.0, min(float(self._state.max_position), position))
+
+    def _start(self) -> None:
+        if self._running:
+            return
+
+        self._running = True
+        self._last_tick = time.perf_counter()
+        SetTimer(self._hwnd, self.TIMER_ID, self._frame_ms, None)
+
+    def _tick(self) -> None:
+        start = time.perf_counter()
+        dt = min(start - self._last_tick, self._MAX_DT)
+        self._intervals.append((start - self._last_tick) * 1000)
+        self._last_tick = start
+
+        if self._hold_condition is not None and start >= self._hold_start and self._hold_condition():
+            self._goal = self._clamp(self._goal + self._hold_rate * dt)
+
+        if self._velocity:
+            position = self._position + self._velocity * dt
+            self._velocity *= math.exp(-self.friction * dt)
+
+            clamped = self._clamp(position)
+            if clamped != position or abs(self._velocity) < self._MIN_VELOCITY:
+                self._velocity = 0.0
+            self._position = self._goal = clamped
+
+        else:
+            self._position += (self._goal - self._position) * (1 - math.exp(-dt / self._glide))
+            if abs(self._goal - self._position) < 0.01:
+                self._position = self._goal
+
+        # One target update per frame, and only when the whole-unit position moved
+        rounded = round(self._position)
+        if rounded != self._sent:
+            self._sent = rounded
+            self._target.scroll_to(rounded)
+
+        if self._on_frame is not None:
+            self._on_frame(self._position)
+
+        if not self._velocity and self._position == self._goal and self._hold_condition is None:
+            KillTimer(self._hwnd, self.TIMER_ID)
+            self._running = False
+
+        self._timings.append((time.perf_counter() - start) * 1000)
+
+    def stats(self) -> FrameStats:
+        """Time spent per frame, including the target update."""
+        return self._summarize(self._timings)
+
+    def interval_stats(self) -> FrameStats:
+        """Time between frames, as delivered by the timer."""
+        return self._summarize(self._intervals)
+
+    def reset_stats(self) -> None:
+        self._timings.clear()
+        self._intervals.clear()
+
+    @staticmethod
+    def _summarize(samples: deque[float]) -> FrameStats:
+        ordered = sorted(samples)
+        if not ordered:
+            return FrameStats(0, 0.0, 0.0, 0.0, 0.0)
+
+        return FrameStats(
+            frames = len(ordered),
+            mean_ms = fmean(ordered),
+            p95_ms = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))],
+            max_ms = ordered[-1],
+            last_ms = samples[-1]
+        )
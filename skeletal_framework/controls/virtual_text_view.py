@@ -0,0 +1,580 @@
+"""
+Read-only, virtualized text view for very large logs.
+
+The standard EDIT control copies its whole buffer, has a default text limit and
+re-wraps the entire text on every change, which makes multi-megabyte crash logs
+slow to open. `VirtualTextView` keeps the text as a single string, finds line
+starts lazily, and only paints the rows that are visible: opening a log costs
+one `str.count`, and scrolling costs one repaint of the visible rows, whatever
+the size of the log.
+
+Lines are never wrapped or cut: a second scrollbar scrolls them sideways, in
+columns, over the widest line found so far (lines are measured as they are
+indexed, a chunk at a time). There is no partial selection; Ctrl+A highlights
+the whole log and Ctrl+C copies all of it to the clipboard.
+"""
+import ctypes
+import threading
+from array import array
+from ctypes import wintypes
+from itertools import accumulate, islice
+
+import win32con
+
+from skeletal_framework.controls.custom_scrollbar import CustomScrollBar
+from skeletal_framework.controls.scroll_target import ScrollState
+from skeletal_framework.core_context import CoreContext
+from skeletal_framework.dispatcher import Dispatcher
+from skeletal_framework.dpi import DpiContext
+from skeletal_framework.layout.transaction import LayoutTransaction, move_window
+from skeletal_framework.text_metrics import TextMetrics
+from skeletal_framework.win32_bindings.gdi32 import (
+    CreateSolidBrush, DeleteObject, ExtTextOut, SelectObject, SetBkColor, SetTextColor
+)
+from skeletal_framework.win32_bindings.kernel32 import (
+    GMEM_MOVEABLE, GetModuleHandle, GlobalAlloc, GlobalFree, GlobalLock, GlobalUnlock
+)
+from skeletal_framework.win32_bindings.macros import hiword
+from skeletal_framework.win32_bindings.user32 import (
+    BeginPaint, CloseClipboard, CreateWindowEx, DefWindowProc, EmptyClipboard, EndPaint, FillRect, FrameRect,
+    GetClientRect, GetKeyState, GetSysColor, InvalidateRect, LoadCursor, OpenClipboard, RegisterClass,
+    SetClipboardData, SetFocus, WNDCLASS
+)
+
+__all__ = ['VirtualTextView']
+
+WM_MOUSEHWHEEL = 0x020E
+
+
+class _LineStore:
+    """
+    The text as one string plus an array of line start offsets.
+
+    The line count comes from `str.count` up front; the offsets are only found as
+    far as a caller has asked for, so showing the top of a huge log never scans
+    the rest of it.
+    """
+
+    __slots__ = ('_text', '_starts', 'line_count', 'widest')
+
+    # Offsets are found a chunk of text at a time, with str.split and accumulate
+    # doing the per-line work in C.
+    _CHUNK = 1 << 20
+
+    def __init__(self, text: str):
+        self._text = text
+        self._starts = array('q', [0])
+        self.line_count = text.count('\n') + 1
+        # Length of the longest line indexed or read so far
+        self.widest = 0
+
+    @property
+    def text(self) -> str:
+        return self._text
+
+    def _index_to(self, line: int) -> None:
+        starts, text = self._starts, self._text
+
+        while len(starts) <= line:
+            pos = starts[-1]
+
+            end = text.rfind('\n', pos, pos + self._CHUNK)
+            if end < 0:
+                # A single line longer than a chunk
+                end = text.find('\n', pos)
+
+            lengths = list(map(len, text[pos:end].split('\n')))
+            self.widest = max(self.widest, max(lengths))
+
+            step_lengths = map((1).__add__, lengths)
+            starts.extend(islice(accumulate(step_lengths, initial = pos), 1, None))
+
+    def line(self, index: int, max_chars: int) -> str:
+        """Line `index` without its line break, cut to at most `max_chars` characters."""
+        last = index + 1 >= self.line_count
+        self._index_to(index if last else index + 1)
+
+        start = self._starts[index]
+        end = len(self._text) if last else self._starts[index + 1] - 1
+        if end > start and self._text[end - 1] == '\r':
+            end -= 1
+
+        if end - start > self.widest:
+            self.widest = end - start
+
+        return self._text[start:min(end, start + max_chars)]
+
+
+class _ColumnAxis:
+    """The horizontal `ScrollTarget` of a `VirtualTextView`, in columns."""
+
+    __slots__ = ('_view',)
+
+    def __init__(self, view: 'VirtualTextView'):
+        self._view = view
+
+    def scroll_state(self) -> ScrollState:
+        return self._view.column_state()
+
+    def scroll_to(self, position: int) -> None:
+        self._view.scroll_to_column(position)
+
+    def scroll_by(self, delta: int) -> None:
+        self._view.scroll_to_column(self._view.left_column + delta)
+
+
+class VirtualTextView:
+    _CLASS_NAME = "VirtualTextViewClass"
+    _ATOM = None
+    # Views may be prepared on a worker thread (see ExceptionHandlerDialog.prewarm)
+    _register_lock = threading.Lock()
+
+    _WHEEL_LINES = 3
+    _WHEEL_COLUMNS = 6
+
+    def __init__(
+            self,
+            x: int, y: int, width: int, height: int,
+            *,
+            text: str = "",
+            font_name: str = "Consolas",
+            font_size: int = 10,
+            border_color: int = wintypes.RGB(0, 0, 0),
+            bg_color: int = wintypes.RGB(255, 255, 255),
+            text_color: int = wintypes.RGB(0, 0, 0),
+            scrollbar_width: int = 18,
+            border_size: int = 1,
+            padding: int = 4,
+            tab_size: int = 4,
+            parent_hwnd: int | None = None
+    ):
+        self._core_context = CoreContext()
+
+        self._parent_hwnd = parent_hwnd or self._core_context.main_window
+        self.x, self.y, self.width, self.height = x, y, width, height
+        self.font_name = font_name
+        self.font_size = font_size
+        self.border_color = border_color
+        self.bg_color = bg_color
+        self.text_color = text_color
+        self.scrollbar_width = scrollbar_width
+        self.border_size = border_size
+        self.padding = padding
+        self.tab_size = tab_size
+
+        self._lines = _LineStore(text)
+        self._top_line = 0
+        self._left_column = 0
+        self._all_selected = False
+
+        self._dpi = DpiContext.for_window(self._parent_hwnd)
+        self._scale_metrics()
+
+        self._h_instance = GetModuleHandle(None)
+        self._bg_brush = CreateSolidBrush(self.bg_color)
+        self._border_brush = CreateSolidBrush(self.border_color)
+
+        self._register_class(self._h_instance)
+        self._hwnd = self._create_window()
+        self._scrollbar = self._create_scrollbar()
+        self._hscrollbar = self._create_hscrollbar()
+        # The square where the two bars meet
+        self._corner_brush = CreateSolidBrush(self._scrollbar.bg_color)
+
+        self._update_scrollbar()
+        self._update_hscrollbar()
+
+    @classmethod
+    def prepare(cls, context: DpiContext, font_name: str = "Consolas", font_size: int = 10) -> None:
+        """
+        Register the window classes and create the font of a view at `context` ahead
+        of time; a view constructed afterwards only creates its windows.
+        """
+        h_instance = GetModuleHandle(None)
+        cls._register_class(h_instance)
+        CustomScrollBar._register_class(h_instance)
+
+        context.font(font_name, font_size)
+
+    def _scale_metrics(self):
+        self._scrollbar_px = self._dpi.scale(self.scrollbar_width)
+        self._border_px = self._dpi.scale(self.border_size)
+        self._padding_px = self._dpi.scale(self.padding)
+
+        # Measured once per font; every row has the same height
+        self._h_font = self._dpi.font(self.font_name, self.font_size)
+        self._line_height = max(1, TextMetrics().measure(self._h_font, 'Ag').height)
+        # Horizontal scroll unit; exact for monospaced fonts such as the default
+        self._column_width = max(1, TextMetrics().measure(self._h_font, '0').width)
+
+    @classmethod
+    def _register_class(cls, h_instance: int):
+        if VirtualTextView._ATOM is not None:
+            return
+
+        with VirtualTextView._register_lock:
+            if VirtualTextView._ATOM is None:
+                wnd_class = WNDCLASS(
+                    style = 0,
+                    lpfnWndProc = Dispatcher,
+                    hInstance = h_instance,
+                    hCursor = LoadCursor(0, win32con.IDC_ARROW),
+                    lpszClassName = cls._CLASS_NAME,
+                    hbrBackground = None
+                )
+                VirtualTextView._ATOM = RegisterClass(wnd_class)
+
+    def _create_window(self):
+        return CreateWindowEx(
+            dwExStyle = 0,
+            lpClassName = self._CLASS_NAME,
+            lpWindowName = "",
+            dwStyle = win32con.WS_CHILD | win32con.WS_VISIBLE | win32con.WS_CLIPCHILDREN | win32con.WS_TABSTOP,
+            x = self.x, y = self.y,
+            nWidth = self.width, nHeight = self.height,
+            hWndParent = self._parent_hwnd,
+            hMenu = None,
+            hInstance = self._h_instance,
+            lpParam = id(self)
+        )
+
+    def _scrollbar_rect(self) -> tuple[int, int, int, int]:
+        sb_x = self.width - self._scrollbar_px - self._border_px
+        sb_y = self._border_px
+        sb_height = self.height - (self._border_px * 2) - self._scrollbar_px
+
+        return sb_x, sb_y, self._scrollbar_px, sb_height
+
+    def _hscrollbar_rect(self) -> tuple[int, int, int, int]:
+        sb_x = self._border_px
+        sb_y = self.height - self._scrollbar_px - self._border_px
+        sb_width = self.width - (self._border_px * 2) - self._scrollbar_px
+
+        return sb_x, sb_y, sb_width, self._scrollbar_px
+
+    def _create_scrollbar(self):
+        sb_x, sb_y, sb_width, sb_height = self._scrollbar_rect()
+        return CustomScrollBar(
+            parent_hwnd = self._hwnd,
+            x = sb_x, y = sb_y,
+            width = sb_width, height = sb_height,
+            target = self
+        )
+
+    def _create_hscrollbar(self):
+        sb_x, sb_y, sb_width, sb_height = self._hscrollbar_rect()
+        return CustomScrollBar(
+            parent_hwnd = self._hwnd,
+            x = sb_x, y = sb_y,
+            width = sb_width, height = sb_height,
+            target = _ColumnAxis(self),
+            horizontal = True
+        )
+
+    @property
+    def hwnd(self):
+        return self._hwnd
+
+    @property
+    def line_count(self) -> int:
+        return self._lines.line_count
+
+    @property
+    def top_line(self) -> int:
+        return self._top_line
+
+    @property
+    def left_column(self) -> int:
+        return self._left_column
+
+    @property
+    def text(self) -> str:
+        return self._lines.text
+
+    @property
+    def visible_lines(self) -> int:
+        """Number of rows that fit completely in the view."""
+        text_height = self.height - (self._border_px + self._padding_px) * 2 - self._scrollbar_px
+        return max(1, text_height // self._line_height)
+
+    @property
+    def visible_columns(self) -> int:
+        """Number of columns that fit completely in the view."""
+        text_width = self.width - (self._border_px + self._padding_px) * 2 - self._scrollbar_px
+        return max(1, text_width // self._column_width)
+
+    @property
+    def _max_top_line(self) -> int:
+        return max(0, self._lines.line_count - self.visible_lines)
+
+    @property
+    def _max_left_column(self) -> int:
+        return max(0, self._lines.widest - self.visible_columns)
+
+    def move(self, x: int, y: int, width: int, height: int):
+        self.x, self.y, self.width, self.height = x, y, width, height
+
+        with LayoutTransaction():
+            move_window(self._hwnd, x, y, width, height)
+            self._scrollbar.move(*self._scrollbar_rect())
+            self._hscrollbar.move(*self._hscrollbar_rect())
+
+        # A larger view may now show lines past the end, or columns past the widest line
+        self._top_line = min(self._top_line, self._max_top_line)
+        self._left_column = min(self._left_column, self._max_left_column)
+        self._update_scrollbar()
+        self._update_hscrollbar()
+
+    def set_dpi(self, context: DpiContext):
+        if context is self._dpi:
+            return
+
+        self._dpi = context
+        self._scale_metrics()
+
+        self._scrollbar.set_dpi(context)
+        self._hscrollbar.set_dpi(context)
+        self.move(self.x, self.y, self.width, self.height)
+        InvalidateRect(self._hwnd, None, False)
+
+    def set_text(self, text: str):
+        self._lines = _LineStore(text)
+        self._top_line = 0
+        self._left_column = 0
+        self._all_selected = False
+
+        self._update_scrollbar()
+        self._update_hscrollbar()
+        InvalidateRect(self._hwnd, None, False)
+
+    def scroll_to(self, line: int):
+        """Make `line` the top row; clamped so the view never scrolls past the last page."""
+        line = max(0, min(line, self._max_top_line))
+        if line == self._top_line:
+            return
+
+        self._top_line = line
+        self._update_scrollbar()
+        InvalidateRect(self._hwnd, None, False)
+
+    def scroll_by(self, lines: int):
+        self.scroll_to(self._top_line + lines)
+
+    def scroll_state(self) -> ScrollState:
+        return ScrollState(self._top_line, self.visible_lines, self._lines.line_count)
+
+    def scroll_to_column(self, column: int):
+        """Make `column` the first visible one; clamped to the widest line found so far."""
+        column = max(0, min(column, self._max_left_column))
+        if column == self._left_column:
+            return
+
+        self._left_column = column
+        self._update_hscrollbar()
+        InvalidateRect(self._hwnd, None, False)
+
+    def column_state(self) -> ScrollState:
+        visible = self.visible_columns
+        return ScrollState(self._left_column, visible, max(self._lines.widest, visible))
+
+    def _update_scrollbar(self):
+        self._scrollbar.set_scroll_state(self.scroll_state())
+
+    def _update_hscrollbar(self):
+        self._hscrollbar.set_scroll_state(self.column_state())
+
+    def select_all(self):
+        """Highlight the whole text, as a reminder that `copy` takes all of it."""
+        if not self._all_selected:
+            self._all_selected = True
+            InvalidateRect(self._hwnd, None, False)
+
+    def clear_selection(self):
+        if self._all_selected:
+            self._all_selected = False
+            InvalidateRect(self._hwnd, None, False)
+
+    def copy(self) -> bool:
+        """
+        Put the whole text on the clipboard as CF_UNICODETEXT, with CRLF line breaks.
+
+        Returns:
+            False if the clipboard could not be opened or written, e.g. because another
+            window holds it open.
+        """
+        text = self._lines.text.replace('\r\n', '\n').replace('\n', '\r\n')
+        data = text.encode('utf-16-le') + b'\0\0'
+
+        try:
+            OpenClipboard(self._hwnd)
+        except OSError:
+            return False
+
+        h_mem = None
+        try:
+            EmptyClipboard()
+
+            h_mem = GlobalAlloc(GMEM_MOVEABLE, len(data))
+            ctypes.memmove(GlobalLock(h_mem), data, len(data))
+            GlobalUnlock(h_mem)
+
+            SetClipboardData(win32con.CF_UNICODETEXT, h_mem)
+            # Owned by the system from here on
+            h_mem = None
+            return True
+
+        except OSError:
+            return False
+
+        finally:
+            if h_mem is not None:
+                GlobalFree(h_mem)
+            CloseClipboard()
+
+    def wnd_proc(self, hwnd, msg, wparam, lparam):
+        if msg == win32con.WM_PAINT:
+            self._on_paint(hwnd)
+            return 0
+
+        elif msg == win32con.WM_ERASEBKGND:
+            return 1
+
+        elif msg == win32con.WM_MOUSEWHEEL:
+            delta = hiword(wparam)
+            if delta > 32767: delta -= 65536
+
+            # Fractional deltas from precision touchpads add up instead of being lost;
+            # Shift turns the wheel sideways
+            if GetKeyState(win32con.VK_SHIFT) < 0:
+                self._hscrollbar.impulse(-delta * self._WHEEL_COLUMNS / 120)
+            else:
+                self._scrollbar.impulse(-delta * self._WHEEL_LINES / 120)
+            return 0
+
+        elif msg == WM_MOUSEHWHEEL:
+            delta = hiword(wparam)
+            if delta > 32767: delta -= 65536
+
+            # Positive deltas tilt to the right, unlike the vertical wheel
+            self._hscrollbar.impulse(delta * self._WHEEL_COLUMNS / 120)
+            return 0
+
+        elif msg == win32con.WM_KEYDOWN:
+            if GetKeyState(win32con.VK_CONTROL) < 0:
+                if wparam == ord('A'):
+                    self.select_all()
+                elif wparam == ord('C'):
+                    self.copy()
+                elif wparam == win32con.VK_HOME:
+                    self.scroll_to(0)
+                elif wparam == win32con.VK_END:
+                    self.scroll_to(self._max_top_line)
+                return 0
+
+            page = self.visible_lines
+            steps = {
+                win32con.VK_UP: -1, win32con.VK_DOWN: 1,
+                win32con.VK_PRIOR: -page, win32con.VK_NEXT: page,
+            }
+
+            if wparam in steps:
+                self._scrollbar.scroll_by(steps[wparam])
+            elif wparam == win32con.VK_LEFT:
+                self._hscrollbar.scroll_by(-1)
+            elif wparam == win32con.VK_RIGHT:
+                self._hscrollbar.scroll_by(1)
+            elif wparam == win32con.VK_HOME:
+                self.scroll_to(0)
+            elif wparam == win32con.VK_END:
+                self.scroll_to(self._max_top_line)
+            return 0
+
+        elif msg == win32con.WM_LBUTTONDOWN:
+            self.clear_selection()
+            SetFocus(hwnd)
+            return 0
+
+        elif msg == win32con.WM_GETDLGCODE:
+            return win32con.DLGC_WANTARROWS | win32con.DLGC_WANTCHARS
+
+        elif msg == win32con.WM_NCDESTROY:
+            self._cleanup()
+            return 0
+
+        return DefWindowProc(hwnd, msg, wparam, lparam)
+
+    def _on_paint(self, hwnd):
+        ps, hdc = BeginPaint(hwnd)
+        try:
+            client = wintypes.RECT()
+            GetClientRect(hwnd, client)
+
+            border, padding, line_height = self._border_px, self._padding_px, self._line_height
+
+            text_left = client.left + border
+            text_right = client.right - border - self._scrollbar_px
+            text_top = client.top + border
+            text_bottom = client.bottom - border - self._scrollbar_px
+
+            FrameRect(hdc, client, self._border_brush)
+            FillRect(hdc, wintypes.RECT(text_right, text_bottom, client.right - border, client.bottom - border), self._corner_brush)
+
+            old_font = SelectObject(hdc, self._h_font)
+            if self._all_selected:
+                SetTextColor(hdc, GetSysColor(win32con.COLOR_HIGHLIGHTTEXT))
+                SetBkColor(hdc, GetSysColor(win32con.COLOR_HIGHLIGHT))
+            else:
+                SetTextColor(hdc, self.text_color)
+                SetBkColor(hdc, self.bg_color)
+
+            # Enough of every line to reach past the right edge after tab expansion,
+            # which only ever makes a line longer
+            first_column = self._left_column
+            last_column = first_column + self.visible_columns + 1
+            widest = self._lines.widest
+
+            # Only the rows intersecting the update region are drawn
+            first_row = max(0, (ps.rcPaint.top - text_top - padding) // line_height)
+            last_row = min(
+                (ps.rcPaint.bottom - text_top - padding) // line_height,
+                self._lines.line_count - 1 - self._top_line
+            )
+
+            # Padding above the first row
+            if first_row == 0:
+                FillRect(hdc, wintypes.RECT(text_left, text_top, text_right, text_top + padding), self._bg_brush)
+
+            y = text_top + padding + first_row * line_height
+            for row in range(first_row, last_row + 1):
+                line = self._lines.line(self._top_line + row, last_column)
+                if '\t' in line:
+                    line = line.expandtabs(self.tab_size)
+                    if len(line) > self._lines.widest:
+                        self._lines.widest = len(line)
+                line = line[first_column:last_column]
+
+                row_rect = wintypes.RECT(text_left, y, text_right, min(y + line_height, text_bottom))
+                ExtTextOut(
+                    hdc, text_left + padding, y,
+                    win32con.ETO_OPAQUE | win32con.ETO_CLIPPED,
+                    row_rect, line, len(line), None
+                )
+                y += line_height
+
+            # Whatever is left below the last row
+            if y < text_bottom:
+                FillRect(hdc, wintypes.RECT(text_left, y, text_right, text_bottom), self._bg_brush)
+
+            SelectObject(hdc, old_font)
+
+        finally:
+            EndPaint(hwnd, ps)
+
+        # Painting may have come across wider lines than were known
+        if self._lines.widest != widest:
+            self._update_hscrollbar()
+
+    def _cleanup(self):
+        if self._bg_brush: DeleteObject(self._bg_brush)
+        if self._border_brush: DeleteObject(self._border_brush)
+        if self._corner_brush: DeleteObject(self._corner_brush)
@@ -0,0 +1,209 @@
+"""
+Per-monitor DPI support.
+
+The process opts into per-monitor-v2 awareness through `enable_per_monitor_dpi_awareness`,
+after which every window is created and painted in physical pixels of the monitor it
+is on. Sizes are still written in 96-DPI units and converted through a `DpiContext`:
+
+    self._dpi = DpiContext.for_window(hwnd)
+    width = self._dpi.scale(800)
+    h_font = self._dpi.font('Segoe UI', 12)
+
+A `DpiContext` caches everything derived from the DPI (system metrics, fonts), and
+there is one per distinct DPI, shared by every window on a monitor with that DPI.
+Windows hold on to their context and only swap it on WM_DPICHANGED, through
+`handle_dpi_changed`, which applies the whole rescale in one `LayoutTransaction`.
+"""
+import ctypes
+import threading
+from collections.abc import Callable, Iterable
+from ctypes import wintypes
+
+import win32con
+
+from skeletal_framework.layout.transaction import LayoutTransaction, move_window
+from skeletal_framework.monitor_registry import WM_DPICHANGED
+from skeletal_framework.text_metrics import TextMetrics
+from skeletal_framework.win32_bindings.gdi32 import CreateFontIndirect, DeleteObject, LOGFONT
+from skeletal_framework.win32_bindings.macros import hiword
+from skeletal_framework.win32_bindings.user32 import (
+    GetDpiForWindow, GetSystemMetricsForDpi, SetProcessDPIAware, SetProcessDpiAwarenessContext
+)
+
+__all__ = [
+    'DPI_AWARENESS_CONTEXT_PER_MONITOR_AWARE_V2', 'USER_DEFAULT_SCREEN_DPI', 'WM_DPICHANGED',
+    'DpiContext', 'enable_per_monitor_dpi_awareness', 'handle_dpi_changed'
+]
+
+USER_DEFAULT_SCREEN_DPI = 96
+
+# DPI_AWARENESS_CONTEXT values are pseudo-handles
+DPI_AWARENESS_CONTEXT_PER_MONITOR_AWARE_V2 = -4
+
+_awareness_enabled = False
+
+
+def enable_per_monitor_dpi_awareness() -> bool:
+    """
+    Make the process per-monitor-v2 DPI aware, falling back to system awareness on
+    systems older than Windows 10 1703. Must run before the first window is created.
+
+    Returns:
+        True if per-monitor-v2 awareness is in effect.
+    """
+    global _awareness_enabled
+
+    if _awareness_enabled:
+        return True
+
+    try:
+        SetProcessDpiAwarenessContext(DPI_AWARENESS_CONTEXT_PER_MONITOR_AWARE_V2)
+    except OSError:
+        # Either an older system, or ERROR_ACCESS_DENIED: the awareness was already
+        # set, by a manifest or an earlier call, and cannot be changed anymore.
+        try:
+            SetProcessDPIAware()
+        except OSError:
+            pass
+        return False
+
+    _awareness_enabled = True
+    return True
+
+
+class DpiContext:
+    """
+    Scale factor, scaled system metrics and fonts for one DPI.
+
+    Obtain instances through `for_window` or `for_dpi`; they are cached per DPI,
+    and the fonts they create are owned by the context, so controls must not
+    delete them.
+    """
+
+    _contexts: dict[int, 'DpiContext'] = {}
+
+    # Fonts may be created ahead of time on a worker thread (see ExceptionHandlerDialog.prewarm)
+    _font_lock = threading.Lock()
+
+    def __init__(self, dpi: int):
+        self.dpi = dpi
+        self.scale_factor = dpi / USER_DEFAULT_SCREEN_DPI
+
+        self._metrics: dict[int, int] = {}
+        self._fonts: dict[tuple, int] = {}
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}(dpi={self.dpi})'
+
+    @classmethod
+    def for_dpi(cls, dpi: int) -> 'DpiContext':
+        context = cls._contexts.get(dpi)
+        if context is None:
+            context = cls._contexts[dpi] = cls(dpi)
+
+        return context
+
+    @classmethod
+    def for_window(cls, hwnd: int | None) -> 'DpiContext':
+        """The context of the monitor the window is on (96 DPI for unaware windows)."""
+        dpi = GetDpiForWindow(hwnd) if hwnd else 0
+
+        return cls.for_dpi(dpi or USER_DEFAULT_SCREEN_DPI)
+
+    @classmethod
+    def release_all(cls) -> None:
+        """Delete every cached font; for process shutdown."""
+        for context in cls._contexts.values():
+            context.release()
+
+        cls._contexts.clear()
+
+    def scale(self, value: int) -> int:
+        """Convert a 96-DPI length to physical pixels (MulDiv rounding)."""
+        return (value * self.dpi + USER_DEFAULT_SCREEN_DPI // 2) // USER_DEFAULT_SCREEN_DPI
+
+    def unscale(self, value: int) -> int:
+        """Convert physical pixels back to a 96-DPI length."""
+        return (value * USER_DEFAULT_SCREEN_DPI + self.dpi // 2) // self.dpi
+
+    def metric(self, index: int) -> int:
+        """`GetSystemMetricsForDpi`, cached per index."""
+        value = self._metrics.get(index)
+        if value is None:
+            value = self._metrics[index] = GetSystemMetricsForDpi(index, self.dpi)
+
+        return value
+
+    def font_height(self, point_size: float) -> int:
+        """LOGFONT height for a point size: -MulDiv(PointSize, dpi, 72)."""
+        return -int(point_size * self.dpi / 72 + 0.5)
+
+    def font(
+            self,
+            face_name: str,
+            point_size: float,
+            *,
+            weight: int = win32con.FW_NORMAL,
+            italic: bool = False,
+            quality: int = win32con.CLEARTYPE_QUALITY
+    ) -> int:
+        """A shared HFONT for the description at this DPI, created on first use."""
+        key = (face_name, point_size, weight, italic, quality)
+
+        h_font = self._fonts.get(key)
+        if h_font is None:
+            with self._font_lock:
+                h_font = self._fonts.get(key)
+                if h_font is None:
+                    h_font = self._fonts[key] = CreateFontIndirect(
+                        LOGFONT(
+                            height = self.font_height(point_size),
+                            weight = weight,
+                            italic = italic,
+                            quality = quality,
+                            face_name = face_name
+                        )
+                    )
+
+        return h_font
+
+    def release(self) -> None:
+        text_metrics = TextMetrics()
+        for h_font in self._fonts.values():
+            text_metrics.forget_font(h_font)
+            DeleteObject(h_font)
+
+        self._fonts.clear()
+        self._metrics.clear()
+
+
+def handle_dpi_changed(
+        hwnd: int,
+        wparam: int,
+        lparam: int,
+        listeners: Iterable[Callable[[DpiContext], None]] = ()
+) -> DpiContext:
+    """
+    Apply a WM_DPICHANGED message to a top-level window.
+
+    Every listener (typically the `set_dpi` of each control) is called with the new
+    context and the window is moved to the rectangle suggested by the system, all
+    within one `LayoutTransaction`, so the children are rescaled in a single batch.
+
+    Returns:
+        The context for the new DPI, which the window should keep.
+    """
+    context = DpiContext.for_dpi(hiword(wparam))
+    suggested = ctypes.cast(lparam, ctypes.POINTER(wintypes.RECT)).contents
+
+    with LayoutTransaction():
+        for listener in listeners:
+            listener(context)
+
+        move_window(
+            hwnd,
+            suggested.left, suggested.top,
+            suggested.right - suggested.left, suggested.bottom - suggested.top
+        )
+
+    return context
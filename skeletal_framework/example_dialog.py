@@ -6,9 +6,10 @@ import win32con
 from skeletal_framework.controls.label import Label, Style
 from skeletal_framework.core_context import CoreContext
 from skeletal_framework.dispatcher import Dispatcher
+from skeletal_framework.layout.transaction import move_window
+from skeletal_framework.monitor_registry import MonitorRegistry
 from skeletal_framework.win32_bindings.dwmapi import DwmSetWindowAttribute, DWMWINDOWATTRIBUTE
 from skeletal_framework.win32_bindings.gdi32 import CreateSolidBrush, DeleteObject
-from skeletal_framework.win32_bindings.monitor_info import GetMonitorInfo, MonitorFromPoint
 from skeletal_framework.win32_bindings.user32 import (
     # Structures
     WNDCLASS,
@@ -20,7 +21,7 @@ from skeletal_framework.win32_bindings.user32 import (
     LoadCursor,
     PostQuitMessage,
     RegisterClass,
-    SetWindowPos, ShowWindow,
+    ShowWindow,
     UpdateWindow, UnregisterClass,
     TranslateMessage
 )
@@ -32,6 +33,7 @@ class ExampleWindow:
 
     def __init__(self):
         self._core_context = CoreContext()
+        self._monitor_registry = MonitorRegistry()
 
         self._hbr_background: int | None = CreateSolidBrush(
             color = wintypes.RGB(
@@ -59,6 +61,9 @@ class ExampleWindow:
             self.create_controls()
             return 0
 
+        elif msg in MonitorRegistry.INVALIDATING_MESSAGES:
+            self._monitor_registry.invalidate()
+
         elif msg == win32con.WM_CLOSE:
             pass
 
@@ -125,12 +130,12 @@ class ExampleWindow:
 
             width, height = current_width + width_adjustment, current_height + height_adjustment
 
-            monitor = GetMonitorInfo(MonitorFromPoint(0, 0))
-            SetWindowPos(
-                hwnd, 0,
-                (monitor.width - width) // 2, (monitor.height - height) // 2,
-                width, height,
-                win32con.SWP_NOZORDER | win32con.SWP_NOACTIVATE
+            monitor = self._monitor_registry.from_window(hwnd)
+            move_window(
+                hwnd,
+                monitor.left + (monitor.width - width) // 2,
+                monitor.top + (monitor.height - height) // 2,
+                width, height
             )
 
     def destroy(self):
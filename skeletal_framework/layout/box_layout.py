@@ -0,0 +1,378 @@
+"""
+Incremental box layout.
+
+Controls are described as a tree of `Row`, `Column` and `Grid` containers with
+`ControlItem` leaves, instead of hard-coded coordinates:
+
+    layout = Column(
+        ControlItem(header, size_hint = (0, 131)),
+        ControlItem(edit_box, stretch = 1, margins = Margins(10, 14, 10, 10)),
+    )
+    layout.update(client_width, client_height)
+
+Every node caches its measured size, and remembers the rectangle it was last
+arranged in. `update` only walks into subtrees that are dirty (`invalidate` was
+called on them or on one of their descendants) or whose rectangle changed, and
+all resulting moves are committed in a single `LayoutTransaction`.
+"""
+from abc import ABC, abstractmethod
+from collections.abc import Callable, Iterable, Sequence
+from typing import Any, NamedTuple
+
+from skeletal_framework.layout.transaction import LayoutTransaction, move_window
+
+__all__ = ['ControlItem', 'Column', 'Grid', 'LayoutNode', 'Margins', 'Row', 'Size', 'Spacer']
+
+
+class Size(NamedTuple):
+    width: int
+    height: int
+
+
+class Margins(NamedTuple):
+    left: int = 0
+    top: int = 0
+    right: int = 0
+    bottom: int = 0
+
+    @property
+    def horizontal(self) -> int:
+        return self.left + self.right
+
+    @property
+    def vertical(self) -> int:
+        return self.top + self.bottom
+
+
+class LayoutNode(ABC):
+    """
+    Base class for every node of a layout tree.
+
+    Attributes:
+        stretch: Share of the extra space this node receives along its parent's main
+                 axis. Nodes with a stretch of 0 keep their measured size.
+        margins: Space kept free around the node, inside the rectangle its parent gives it.
+    """
+
+    def __init__(self, *, stretch: int = 0, margins: Margins | Sequence[int] = Margins()):
+        self.stretch = stretch
+        self.margins = Margins(*margins)
+
+        self.parent: LayoutNode | None = None
+        self._dirty = True
+        self._measured: Size | None = None
+        self._rect: tuple[int, int, int, int] | None = None
+
+    @property
+    def rect(self) -> tuple[int, int, int, int] | None:
+        """The (x, y, width, height) the node was last arranged in, margins included."""
+        return self._rect
+
+    def invalidate(self) -> None:
+        """Mark this node and its ancestors for re-measuring and re-arranging."""
+        node = self
+        while node is not None:
+            node._dirty = True
+            node._measured = None
+            node = node.parent
+
+    def measure(self) -> Size:
+        """The node's preferred size including margins; cached until `invalidate`."""
+        if self._measured is None:
+            width, height = self._measure()
+            self._measured = Size(width + self.margins.horizontal, height + self.margins.vertical)
+
+        return self._measured
+
+    def arrange(self, x: int, y: int, width: int, height: int) -> None:
+        """Place the node in the rectangle; skipped if it is clean and the rectangle is unchanged."""
+        rect = (x, y, width, height)
+        if not self._dirty and rect == self._rect:
+            return
+
+        self._rect = rect
+        self._dirty = False
+
+        margins = self.margins
+        self._arrange(
+            x + margins.left, y + margins.top,
+            max(0, width - margins.horizontal), max(0, height - margins.vertical)
+        )
+
+    def update(self, width: int, height: int) -> None:
+        """Lay the tree out in a (0, 0, width, height) client area and apply all moves in one batch."""
+        with LayoutTransaction():
+            self.arrange(0, 0, width, height)
+
+    @abstractmethod
+    def _measure(self) -> tuple[int, int]:
+        """Preferred (width, height), margins excluded."""
+        ...
+
+    @abstractmethod
+    def _arrange(self, x: int, y: int, width: int, height: int) -> None:
+        """Position the node's content in the rectangle, margins already removed."""
+        ...
+
+
+class ControlItem(LayoutNode):
+    """
+    Leaf node wrapping a control.
+
+    The control may be anything with a `move(x, y, width, height)` method (CustomEditBox,
+    Header, ...), an object exposing `hwnd`, or a raw window handle.
+
+    Args:
+        control: The control to position
+        size_hint: Preferred (width, height). Use 0 to let the parent decide.
+        measure: Optional callable returning the preferred size, for content-sized controls.
+                 Its result is cached like any other measurement until `invalidate`.
+    """
+
+    def __init__(
+            self,
+            control: Any,
+            *,
+            size_hint: tuple[int, int] = (0, 0),
+            measure: Callable[[], tuple[int, int]] | None = None,
+            stretch: int = 0,
+            margins: Margins | Sequence[int] = Margins()
+    ):
+        super().__init__(stretch = stretch, margins = margins)
+        self.control = control
+        self.size_hint = Size(*size_hint)
+        self._measure_callback = measure
+
+    def _measure(self) -> tuple[int, int]:
+        if self._measure_callback is not None:
+            return self._measure_callback()
+
+        return self.size_hint
+
+    def _arrange(self, x: int, y: int, width: int, height: int) -> None:
+        control = self.control
+
+        move = getattr(control, 'move', None)
+        if move is not None:
+            move(x, y, width, height)
+        else:
+            move_window(getattr(control, 'hwnd', control), x, y, width, height)
+
+
+class Spacer(LayoutNode):
+    """Empty node; with a stretch it pushes its siblings apart."""
+
+    def __init__(self, width: int = 0, height: int = 0, *, stretch: int = 0):
+        super().__init__(stretch = stretch)
+        self._size = Size(width, height)
+
+    def _measure(self) -> tuple[int, int]:
+        return self._size
+
+    def _arrange(self, x: int, y: int, width: int, height: int) -> None:
+        pass
+
+
+class _Container(LayoutNode, ABC):
+    def __init__(self, *, spacing: int = 0, stretch: int = 0, margins: Margins | Sequence[int] = Margins()):
+        super().__init__(stretch = stretch, margins = margins)
+        self.spacing = spacing
+        self._children: list[LayoutNode] = []
+
+    @property
+    def children(self) -> tuple[LayoutNode, ...]:
+        return tuple(self._children)
+
+    def _adopt(self, node: LayoutNode) -> None:
+        if node.parent is not None:
+            raise ValueError(f"{type(node).__name__} already belongs to a layout")
+
+        node.parent = self
+        self._children.append(node)
+        self.invalidate()
+
+
+class _Box(_Container, ABC):
+    _horizontal: bool
+
+    def __init__(
+            self,
+            *children: LayoutNode,
+            spacing: int = 0,
+            stretch: int = 0,
+            margins: Margins | Sequence[int] = Margins()
+    ):
+        super().__init__(spacing = spacing, stretch = stretch, margins = margins)
+        self.extend(children)
+
+    def add(self, node: LayoutNode) -> LayoutNode:
+        self._adopt(node)
+        return node
+
+    def extend(self, nodes: Iterable[LayoutNode]) -> None:
+        for node in nodes:
+            self._adopt(node)
+
+    def _measure(self) -> tuple[int, int]:
+        sizes = [child.measure() for child in self._children]
+        gaps = self.spacing * max(0, len(sizes) - 1)
+
+        if self._horizontal:
+            return sum(s.width for s in sizes) + gaps, max((s.height for s in sizes), default = 0)
+
+        return max((s.width for s in sizes), default = 0), sum(s.height for s in sizes) + gaps
+
+    def _arrange(self, x: int, y: int, width: int, height: int) -> None:
+        children = self._children
+        if not children:
+            return
+
+        main_axis = 0 if self._horizontal else 1
+        available = (width if self._horizontal else height) - self.spacing * (len(children) - 1)
+        lengths = _distribute(
+            available,
+            [child.measure()[main_axis] for child in children],
+            [child.stretch for child in children]
+        )
+
+        offset = x if self._horizontal else y
+        for child, length in zip(children, lengths):
+            if self._horizontal:
+                child.arrange(offset, y, length, height)
+            else:
+                child.arrange(x, offset, width, length)
+
+            offset += length + self.spacing
+
+
+class Row(_Box):
+    """Lays its children out left to right; each child fills the row's height."""
+    _horizontal = True
+
+
+class Column(_Box):
+    """Lays its children out top to bottom; each child fills the column's width."""
+    _horizontal = False
+
+
+class _Cell(NamedTuple):
+    node: LayoutNode
+    row: int
+    column: int
+    row_span: int
+    column_span: int
+
+
+class Grid(_Container):
+    """
+    Lays its children out in rows and columns.
+
+    Row heights and column widths come from the largest single-span child in each
+    row and column; extra space is shared out by `row_stretch` / `column_stretch`.
+    """
+
+    def __init__(
+            self,
+            *,
+            spacing: int = 0,
+            row_stretch: Sequence[int] = (),
+            column_stretch: Sequence[int] = (),
+            stretch: int = 0,
+            margins: Margins | Sequence[int] = Margins()
+    ):
+        super().__init__(spacing = spacing, stretch = stretch, margins = margins)
+        self.row_stretch = list(row_stretch)
+        self.column_stretch = list(column_stretch)
+        self._cells: list[_Cell] = []
+
+    def add(self, node: LayoutNode, row: int, column: int, row_span: int = 1, column_span: int = 1) -> LayoutNode:
+        self._adopt(node)
+        self._cells.append(_Cell(node, row, column, row_span, column_span))
+        return node
+
+    @property
+    def _row_count(self) -> int:
+        return max((c.row + c.row_span for c in self._cells), default = 0)
+
+    @property
+    def _column_count(self) -> int:
+        return max((c.column + c.column_span for c in self._cells), default = 0)
+
+    def _track_sizes(self) -> tuple[list[int], list[int]]:
+        heights = [0] * self._row_count
+        widths = [0] * self._column_count
+
+        for cell in self._cells:
+            size = cell.node.measure()
+            if cell.row_span == 1:
+                heights[cell.row] = max(heights[cell.row], size.height)
+            if cell.column_span == 1:
+                widths[cell.column] = max(widths[cell.column], size.width)
+
+        return widths, heights
+
+    def _measure(self) -> tuple[int, int]:
+        widths, heights = self._track_sizes()
+
+        return (
+            sum(widths) + self.spacing * max(0, len(widths) - 1),
+            sum(heights) + self.spacing * max(0, len(heights) - 1)
+        )
+
+    def _arrange(self, x: int, y: int, width: int, height: int) -> None:
+        if not self._cells:
+            return
+
+        widths, heights = self._track_sizes()
+
+        widths = _distribute(width - self.spacing * (len(widths) - 1), widths, _pad(self.column_stretch, len(widths)))
+        heights = _distribute(height - self.spacing * (len(heights) - 1), heights, _pad(self.row_stretch, len(heights)))
+
+        lefts = _offsets(x, widths, self.spacing)
+        tops = _offsets(y, heights, self.spacing)
+
+        for cell in self._cells:
+            last_column = cell.column + cell.column_span - 1
+            last_row = cell.row + cell.row_span - 1
+            cell.node.arrange(
+                lefts[cell.column], tops[cell.row],
+                lefts[last_column] + widths[last_column] - lefts[cell.column],
+                tops[last_row] + heights[last_row] - tops[cell.row]
+            )
+
+
+def _distribute(available: int, preferred: list[int], stretches: list[int]) -> list[int]:
+    """Give every track its preferred length and share what is left by stretch factor."""
+    lengths = list(preferred)
+    total_stretch = sum(stretches)
+    extra = available - sum(preferred)
+
+    if total_stretch <= 0 or extra == 0:
+        return lengths
+
+    # Shrinking never takes a track below zero; growing hands out the rounding
+    # remainder to the last stretchable track so the lengths always add up.
+    remaining = extra
+    last = max(i for i, s in enumerate(stretches) if s > 0)
+    for i, factor in enumerate(stretches):
+        if factor <= 0:
+            continue
+
+        share = remaining if i == last else extra * factor // total_stretch
+        lengths[i] = max(0, lengths[i] + share)
+        remaining -= share
+
+    return lengths
+
+
+def _offsets(start: int, lengths: list[int], spacing: int) -> list[int]:
+    offsets = []
+    for length in lengths:
+        offsets.append(start)
+        start += length + spacing
+
+    return offsets
+
+
+def _pad(values: list[int], count: int) -> list[int]:
+    return (values + [0] * count)[:count]
@@ -0,0 +1,157 @@
+"""
+Throttled relayout while a window is being resized.
+
+While the user drags a sizing border, Windows sends WM_SIZING and WM_SIZE for
+every mouse move, far more often than the screen refreshes. `LiveResize` turns
+that stream into at most one relayout per frame:
+
+- WM_ENTERSIZEMOVE starts a frame timer; until the drag ends every relayout is
+  a cheap (draft) pass.
+- WM_SIZE only records the latest client size; the frame timer lays the window
+  out once per tick, and only if the size changed since the last one. WM_SIZING
+  does not trigger anything, since every one of them is followed by a WM_SIZE.
+- WM_EXITSIZEMOVE stops the timer and runs the final, full-quality pass.
+
+Size changes outside of a drag (maximize, restore, programmatic moves) are laid
+out immediately at full quality.
+
+    self._live_resize = LiveResize(hwnd, self._relayout)
+
+    def wnd_proc(self, hwnd, msg, wparam, lparam):
+        if msg in LiveResize.MESSAGES and self._live_resize.handle(msg, wparam, lparam):
+            return 0
+"""
+import time
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass
+from statistics import fmean
+
+import win32con
+
+from skeletal_framework.win32_bindings.macros import hiword, loword
+from skeletal_framework.win32_bindings.user32 import KillTimer, SetTimer
+
+__all__ = ['FrameStats', 'LiveResize']
+
+
+@dataclass(frozen = True, slots = True)
+class FrameStats:
+    """Relayout timings, in milliseconds, over the most recent frames."""
+    frames: int
+    mean_ms: float
+    p95_ms: float
+    max_ms: float
+    last_ms: float
+
+
+class LiveResize:
+    """
+    Coalesces the resize messages of one window into one relayout per frame.
+
+    Args:
+        hwnd: The window being resized; it receives the frame timer's WM_TIMER.
+        relayout: Called as `relayout(width, height, final)`. `final` is False for the
+                  passes that run during a drag, when controls may trade quality for speed.
+        frame_ms: Frame timer interval.
+        history: Number of relayout timings kept for `stats`.
+    """
+
+    TIMER_ID = 0x4C52  # 'LR'
+
+    MESSAGES = frozenset({
+        win32con.WM_ENTERSIZEMOVE, win32con.WM_EXITSIZEMOVE,
+        win32con.WM_SIZE, win32con.WM_TIMER
+    })
+
+    def __init__(
+            self,
+            hwnd: int,
+            relayout: Callable[[int, int, bool], None],
+            *,
+            frame_ms: int = 16,
+            history: int = 240
+    ):
+        self._hwnd = hwnd
+        self._relayout = relayout
+        self._frame_ms = frame_ms
+
+        self._sizing = False
+        self._pending: tuple[int, int] | None = None
+        self._applied: tuple[int, int] | None = None
+        self._drafted = False
+        self._timings: deque[float] = deque(maxlen = history)
+
+    @property
+    def sizing(self) -> bool:
+        """True between WM_ENTERSIZEMOVE and WM_EXITSIZEMOVE."""
+        return self._sizing
+
+    def handle(self, msg: int, wparam: int, lparam: int) -> bool:
+        """
+        Feed a window message through the throttle.
+
+        Returns:
+            True if the message was consumed (the frame timer's WM_TIMER), False if the
+            window procedure should keep processing it.
+        """
+        if msg == win32con.WM_SIZE:
+            if wparam != win32con.SIZE_MINIMIZED:
+                self._on_size(loword(lparam), hiword(lparam))
+
+        elif msg == win32con.WM_TIMER:
+            if wparam != self.TIMER_ID:
+                return False
+
+            self._flush(final = False)
+            return True
+
+        elif msg == win32con.WM_ENTERSIZEMOVE:
+            self._sizing = True
+            SetTimer(self._hwnd, self.TIMER_ID, self._frame_ms, None)
+
+        elif msg == win32con.WM_EXITSIZEMOVE:
+            self._sizing = False
+            KillTimer(self._hwnd, self.TIMER_ID)
+
+            # A drag that only moved the window needs no final pass
+            if self._pending is None and self._drafted:
+                self._pending = self._applied
+            self._flush(final = True)
+            self._drafted = False
+
+        return False
+
+    def _on_size(self, width: int, height: int) -> None:
+        self._pending = (width, height)
+
+        if not self._sizing:
+            self._flush(final = True)
+
+    def _flush(self, *, final: bool) -> None:
+        size, self._pending = self._pending, None
+        if size is None or (not final and size == self._applied):
+            return
+
+        start = time.perf_counter()
+        self._relayout(*size, final)
+        self._timings.append((time.perf_counter() - start) * 1000)
+
+        self._applied = size
+        self._drafted = self._drafted or not final
+
+    def stats(self) -> FrameStats:
+        timings = sorted(self._timings)
+        if not timings:
+            return FrameStats(0, 0.0, 0.0, 0.0, 0.0)
+
+        return FrameStats(
+            frames = len(timings),
+            mean_ms = fmean(timings),
+            p95_ms = timings[min(len(timings) - 1, int(len(timings) * 0.95))],
+            max_ms = timings[-1],
+            last_ms = self._timings[-1]
+        )
+
+    def reset_stats(self) -> None:
+        self._timings.clear()
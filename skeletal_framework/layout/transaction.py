@@ -0,0 +1,198 @@
+"""
+Batched window positioning.
+
+Every `SetWindowPos` / `MoveWindow` call produces its own WM_WINDOWPOSCHANGED,
+WM_SIZE and repaint cascade. A `LayoutTransaction` collects the moves instead and
+applies them through `BeginDeferWindowPos` / `DeferWindowPos` / `EndDeferWindowPos`,
+so the system repositions every window of a batch in one screen-refreshing cycle.
+
+    with LayoutTransaction():
+        edit_box.move(10, 145, width - 20, height - 155)
+        move_window(label.hwnd, 10, height - 30, width - 20, 20)
+
+Controls call `move_window` instead of `SetWindowPos`. When a transaction is open
+on the current thread the move is queued, otherwise it is applied immediately.
+Work that needs the new geometry, such as syncing a scrollbar with the control it
+scrolls, is handed to `after_layout` and runs once the moves are applied.
+"""
+import threading
+from dataclasses import dataclass
+from typing import Callable
+
+import win32con
+
+from skeletal_framework.win32_bindings.user32 import (
+    BeginDeferWindowPos, DeferWindowPos, EndDeferWindowPos, GetParent, SetWindowPos
+)
+
+__all__ = ['LayoutTransaction', 'after_layout', 'move_window']
+
+_DEFAULT_FLAGS = win32con.SWP_NOZORDER | win32con.SWP_NOACTIVATE
+
+_local = threading.local()
+
+
+@dataclass(slots = True)
+class _PendingMove:
+    hwnd: int
+    insert_after: int | None
+    x: int
+    y: int
+    width: int
+    height: int
+    flags: int
+
+
+class LayoutTransaction:
+    """
+    Collects window moves and applies them in one `DeferWindowPos` batch per parent.
+
+    Transactions nest: an inner transaction hands its moves to the outermost one, so
+    a dialog can open a transaction around its relayout while every control opens its
+    own around its children, and the whole tree is still committed once.
+
+    A window moved more than once within the same transaction only keeps its last move,
+    and a callback queued more than once with `after_commit` only runs once.
+    """
+
+    def __init__(self):
+        self._moves: dict[int, _PendingMove] = {}
+        self._callbacks: dict[Callable[[], None], None] = {}
+        self._outer: LayoutTransaction | None = None
+
+    @staticmethod
+    def current() -> 'LayoutTransaction | None':
+        """The outermost transaction open on the calling thread, if any."""
+        return getattr(_local, 'transaction', None)
+
+    def __enter__(self) -> 'LayoutTransaction':
+        self._outer = LayoutTransaction.current()
+        if self._outer is None:
+            _local.transaction = self
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_traceback) -> None:
+        if self._outer is not None:
+            self._outer._moves.update(self._moves)
+            self._outer._callbacks.update(self._callbacks)
+            self._moves.clear()
+            self._callbacks.clear()
+            self._outer = None
+            return
+
+        _local.transaction = None
+        if exc_type is None:
+            self.commit()
+        else:
+            self._moves.clear()
+            self._callbacks.clear()
+
+    def __len__(self) -> int:
+        return len(self._moves)
+
+    def move(
+            self,
+            hwnd: int,
+            x: int, y: int, width: int, height: int,
+            *,
+            flags: int = _DEFAULT_FLAGS,
+            insert_after: int | None = None
+    ) -> None:
+        """Queue a move; it replaces any earlier move queued for the same window."""
+        self._moves[hwnd] = _PendingMove(hwnd, insert_after, x, y, width, height, flags)
+
+    def after_commit(self, callback: Callable[[], None]) -> None:
+        """Run `callback` once the queued moves have been applied."""
+        self._callbacks[callback] = None
+
+    def commit(self) -> None:
+        """
+        Apply all queued moves, one `DeferWindowPos` batch per parent window, then run
+        the `after_commit` callbacks in the order they were first queued.
+        """
+        moves, self._moves = self._moves, {}
+        callbacks, self._callbacks = self._callbacks, {}
+
+        batches: dict[int | None, list[_PendingMove]] = {}
+        for move in moves.values():
+            batches.setdefault(GetParent(move.hwnd), []).append(move)
+
+        for batch in batches.values():
+            self._apply_batch(batch)
+
+        for callback in callbacks:
+            callback()
+
+    @staticmethod
+    def _apply_batch(batch: list[_PendingMove]) -> None:
+        if len(batch) == 1:
+            _set_window_pos(batch[0])
+            return
+
+        # The handles are HANDLE-typed, so a failed call returns None rather than
+        # raising; the errcheck helper only raises for a literal 0.
+        try:
+            hdwp = BeginDeferWindowPos(len(batch))
+        except OSError:
+            hdwp = None
+
+        if not hdwp:
+            for move in batch:
+                _set_window_pos(move)
+            return
+
+        for move in batch:
+            try:
+                hdwp = DeferWindowPos(
+                    hdwp, move.hwnd, move.insert_after,
+                    move.x, move.y, move.width, move.height,
+                    move.flags
+                )
+            except OSError:
+                hdwp = None
+
+            if not hdwp:
+                # The system frees the structure, and everything deferred so far,
+                # when DeferWindowPos fails, so the batch is applied one by one.
+                for pending in batch:
+                    _set_window_pos(pending)
+                return
+
+        EndDeferWindowPos(hdwp)
+
+
+def _set_window_pos(move: _PendingMove) -> None:
+    SetWindowPos(
+        move.hwnd, move.insert_after or 0,
+        move.x, move.y, move.width, move.height,
+        move.flags
+    )
+
+
+def move_window(
+        hwnd: int,
+        x: int, y: int, width: int, height: int,
+        *,
+        flags: int = _DEFAULT_FLAGS,
+        insert_after: int | None = None
+) -> None:
+    """
+    Move and resize a window, joining the calling thread's open `LayoutTransaction` if there is one.
+    """
+    transaction = LayoutTransaction.current()
+    if transaction is not None:
+        transaction.move(hwnd, x, y, width, height, flags = flags, insert_after = insert_after)
+    else:
+        _set_window_pos(_PendingMove(hwnd, insert_after, x, y, width, height, flags))
+
+
+def after_layout(callback: Callable[[], None]) -> None:
+    """
+    Run `callback` once the calling thread's open `LayoutTransaction` is committed,
+    or right away if there is none.
+    """
+    transaction = LayoutTransaction.current()
+    if transaction is not None:
+        transaction.after_commit(callback)
+    else:
+        callback()
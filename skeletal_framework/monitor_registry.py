@@ -0,0 +1,177 @@
+from ctypes import wintypes
+from typing import TYPE_CHECKING
+
+import win32con
+
+from skeletal_framework.singleton import Singleton
+from skeletal_framework.win32_bindings.monitor_info import EnumDisplayMonitors, GetMonitorInfo, MonitorSnapshot
+from skeletal_framework.win32_bindings.user32 import GetWindowRect
+
+if TYPE_CHECKING:
+    import numpy as np
+
+__all__ = ['MonitorRegistry', 'WM_DPICHANGED']
+
+WM_DPICHANGED = 0x02E0
+
+
+class MonitorRegistry(Singleton):
+    """
+    Process-wide cache of the display topology.
+
+    The monitors are enumerated once through `EnumDisplayMonitors`, and every
+    "which monitor is this on" question is answered from that snapshot instead of
+    a `MonitorFromPoint` / `GetMonitorInfo` round trip. Top-level windows call
+    `invalidate` when they receive one of the `INVALIDATING_MESSAGES`
+    (WM_DISPLAYCHANGE, WM_DPICHANGED); the next query enumerates again.
+
+    `classify_points` and `classify_rects` answer the same question for a whole
+    NumPy array at once, for placing many windows across a multi-monitor wall.
+    """
+
+    INVALIDATING_MESSAGES = frozenset({win32con.WM_DISPLAYCHANGE, WM_DPICHANGED})
+
+    def __init__(self):
+        self._monitors: tuple[MonitorSnapshot, ...] | None = None
+        self._bounds: 'np.ndarray | None' = None
+
+    @property
+    def monitors(self) -> tuple[MonitorSnapshot, ...]:
+        """Every attached monitor, in enumeration order."""
+        if self._monitors is None:
+            self.refresh()
+
+        return self._monitors
+
+    @property
+    def primary(self) -> MonitorSnapshot:
+        for monitor in self.monitors:
+            if monitor.isPrimary:
+                return monitor
+
+        return self.monitors[0]
+
+    def refresh(self) -> None:
+        """Enumerate the monitors again, replacing the cached snapshot."""
+        found: list[MonitorSnapshot] = []
+
+        def collect(h_monitor, _hdc, _rect, monitors):
+            monitors.append(MonitorSnapshot.from_monitor_info(GetMonitorInfo(h_monitor), h_monitor))
+            return True
+
+        EnumDisplayMonitors(lpfnEnum = collect, py_object = found)
+
+        self._monitors = tuple(found)
+        self._bounds = None
+
+    def invalidate(self) -> None:
+        """Drop the snapshot; the next query enumerates the monitors again."""
+        self._monitors = None
+        self._bounds = None
+
+    def from_point(self, x: int, y: int) -> MonitorSnapshot:
+        """The monitor containing the point, or the nearest one if it is off-screen."""
+        monitors = self.monitors
+        for monitor in monitors:
+            if monitor.contains_point(x, y):
+                return monitor
+
+        return min(monitors, key = lambda m: _distance_squared(m, x, y))
+
+    def from_rect(self, left: int, top: int, right: int, bottom: int) -> MonitorSnapshot:
+        """The monitor with the largest intersection with the rectangle, or the nearest one."""
+        best, best_area = None, 0
+        for monitor in self.monitors:
+            width = min(right, monitor.right) - max(left, monitor.left)
+            height = min(bottom, monitor.bottom) - max(top, monitor.top)
+            if width > 0 and height > 0 and width * height > best_area:
+                best, best_area = monitor, width * height
+
+        if best is not None:
+            return best
+
+        return self.from_point((left + right) // 2, (top + bottom) // 2)
+
+    def from_window(self, hwnd: int) -> MonitorSnapshot:
+        """The monitor the window is (mostly) on."""
+        rect = wintypes.RECT()
+        GetWindowRect(hwnd, rect)
+
+        return self.from_rect(rect.left, rect.top, rect.right, rect.bottom)
+
+    # --- Vectorized queries (requires NumPy) ---
+    def bounds(self) -> 'np.ndarray':
+        """The monitor rectangles as an (M, 4) int64 array of (left, top, right, bottom)."""
+        if self._bounds is None:
+            import numpy as np
+
+            self._bounds = np.array([monitor.Monitor for monitor in self.monitors], dtype = np.int64).reshape(-1, 4)
+
+        return self._bounds
+
+    def classify_points(self, points: 'np.ndarray') -> 'np.ndarray':
+        """
+        Index into `monitors` of the monitor containing each point.
+
+        Args:
+            points: (N, 2) array of (x, y) virtual-screen coordinates
+
+        Returns:
+            (N,) int array. Off-screen points get the nearest monitor, like `from_point`.
+        """
+        import numpy as np
+
+        points = np.asarray(points, dtype = np.int64).reshape(-1, 2)
+        bounds = self.bounds()
+
+        x, y = points[:, 0:1], points[:, 1:2]
+        left, top, right, bottom = bounds.T
+
+        # (N, M) squared distance to each monitor; zero means the point is inside.
+        dx = np.maximum(np.maximum(left - x, 0), x - right + 1)
+        dy = np.maximum(np.maximum(top - y, 0), y - bottom + 1)
+
+        return np.argmin(dx * dx + dy * dy, axis = 1)
+
+    def classify_rects(self, rects: 'np.ndarray') -> 'np.ndarray':
+        """
+        Index into `monitors` of the monitor each rectangle overlaps the most.
+
+        Args:
+            rects: (N, 4) array of (left, top, right, bottom) window rectangles
+
+        Returns:
+            (N,) int array. Rectangles that touch no monitor are classified by
+            their center point, like `from_rect`.
+        """
+        import numpy as np
+
+        rects = np.asarray(rects, dtype = np.int64).reshape(-1, 4)
+        bounds = self.bounds()
+
+        left, top, right, bottom = (rects[:, i:i + 1] for i in range(4))
+        m_left, m_top, m_right, m_bottom = bounds.T
+
+        # (N, M) intersection areas
+        widths = np.clip(np.minimum(right, m_right) - np.maximum(left, m_left), 0, None)
+        heights = np.clip(np.minimum(bottom, m_bottom) - np.maximum(top, m_top), 0, None)
+        areas = widths * heights
+
+        result = np.argmax(areas, axis = 1)
+
+        off_screen = ~areas.any(axis = 1)
+        if off_screen.any():
+            centers = np.column_stack((
+                (rects[off_screen, 0] + rects[off_screen, 2]) // 2,
+                (rects[off_screen, 1] + rects[off_screen, 3]) // 2
+            ))
+            result[off_screen] = self.classify_points(centers)
+
+        return result
+
+
+def _distance_squared(monitor: MonitorSnapshot, x: int, y: int) -> int:
+    dx = max(monitor.left - x, 0, x - monitor.right + 1)
+    dy = max(monitor.top - y, 0, y - monitor.bottom + 1)
+
+    return dx * dx + dy * dy
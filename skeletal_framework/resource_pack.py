@@ -0,0 +1,307 @@
+"""
+Binary resource packs.
+
+A pack is one file holding any number of named payloads (typically encoded
+images) behind an index, so resources ship as raw bytes instead of base64
+literals in generated modules:
+
+    header   magic 'SFRP', version, entry count
+    index    one record per entry: offset, stored length, length, format,
+             compression, width, height, name
+    payload  the entries' bytes, each aligned to 16
+
+`ResourcePack` maps the file read-only and hands out `memoryview` slices of the
+mapping, so reading a payload copies nothing; `open_image` feeds such a slice
+to PIL through a small file object instead of a `BytesIO` copy.
+
+    pack = ResourcePack(path)
+    face = pack.open_image('EXCEPTION_FACE')
+
+Packs are written with `write_pack`, usually through `utilities/embed_resources`.
+"""
+import hashlib
+import io
+import mmap
+import os
+import struct
+import zlib
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from typing import NamedTuple
+
+__all__ = [
+    'COMPRESSION_NONE', 'COMPRESSION_ZLIB', 'DIGEST_KEY', 'NAME_KEY', 'PackEntry', 'PackSource', 'ResourcePack',
+    'level_name', 'png_dimensions', 'write_pack'
+]
+
+MAGIC = b'SFRP'
+VERSION = 1
+
+COMPRESSION_NONE = 0
+COMPRESSION_ZLIB = 1
+
+_ALIGNMENT = 16
+
+# magic, version, reserved, entry count
+_HEADER = struct.Struct('<4sHHI')
+# offset, stored length, length, format, compression, (padding), width, height, name length
+_RECORD = struct.Struct('<QQQ4sB3xIIH')
+
+_PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+
+# `Image.info` key holding the content digest of an image, e.g. for `CanvasCache`
+DIGEST_KEY = 'content_digest'
+# `Image.info` key holding the entry name an image was opened from
+NAME_KEY = 'resource_name'
+
+
+def level_name(name: str, width: int, height: int) -> str:
+    """Entry name of a precomputed, downscaled level of an image entry."""
+    return f'{name}@{width}x{height}'
+
+
+class PackEntry(NamedTuple):
+    name: str
+    offset: int
+    stored_length: int
+    length: int
+    format: str
+    compression: int
+    width: int
+    height: int
+
+
+class PackSource(NamedTuple):
+    """One payload to write; `width`/`height` are read from PNG data when left at 0."""
+    name: str
+    data: bytes
+    format: str = 'PNG'
+    compress: bool = False
+    width: int = 0
+    height: int = 0
+
+
+def png_dimensions(data: bytes | memoryview) -> tuple[int, int]:
+    """
+    Width and height from a PNG's IHDR chunk, without decoding the image.
+
+    Raises:
+        ValueError: The data is not a PNG.
+    """
+    # Signature, then the IHDR chunk: length, type, width, height
+    if bytes(data[:8]) != _PNG_SIGNATURE or bytes(data[12:16]) != b'IHDR':
+        raise ValueError('not a PNG image')
+
+    return struct.unpack('>II', data[16:24])
+
+
+class _MemoryReader(io.RawIOBase):
+    """Read-only, seekable file object over a memoryview; reads copy only what is asked for."""
+
+    def __init__(self, view: memoryview):
+        self._view = view
+        self._position = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        chunk = self._view[self._position:self._position + len(buffer)]
+        buffer[:len(chunk)] = chunk
+        self._position += len(chunk)
+
+        return len(chunk)
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_CUR:
+            offset += self._position
+        elif whence == io.SEEK_END:
+            offset += len(self._view)
+
+        self._position = max(0, offset)
+        return self._position
+
+    def tell(self) -> int:
+        return self._position
+
+
+class ResourcePack:
+    """
+    Read-only view of a pack file.
+
+    The file stays mapped for the lifetime of the object; views returned by `data`
+    and images opened with `open_image` are only valid until `close`.
+    """
+
+    def __init__(self, path: str | os.PathLike):
+        self.path = Path(path)
+
+        with open(self.path, 'rb') as file:
+            self._mmap = mmap.mmap(file.fileno(), 0, access = mmap.ACCESS_READ)
+
+        self._view = memoryview(self._mmap)
+        self._entries = self._read_index()
+        self._digests: dict[str, str] = {}
+
+    def _read_index(self) -> dict[str, PackEntry]:
+        if len(self._view) < _HEADER.size:
+            raise ValueError(f'{self.path} is not a resource pack')
+
+        magic, version, _, count = _HEADER.unpack_from(self._view, 0)
+        if magic != MAGIC:
+            raise ValueError(f'{self.path} is not a resource pack')
+        if version != VERSION:
+            raise ValueError(f'{self.path}: unsupported pack version {version}')
+
+        entries = {}
+        position = _HEADER.size
+        for _ in range(count):
+            offset, stored_length, length, fmt, compression, width, height, name_length = \
+                _RECORD.unpack_from(self._view, position)
+            position += _RECORD.size
+
+            name = bytes(self._view[position:position + name_length]).decode('utf-8')
+            position += name_length
+
+            entries[name] = PackEntry(
+                name, offset, stored_length, length,
+                fmt.rstrip(b'\0').decode('ascii'), compression, width, height
+            )
+
+        return entries
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._entries
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._entries)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def entry(self, name: str) -> PackEntry:
+        try:
+            return self._entries[name]
+        except KeyError:
+            raise KeyError(f'{name!r} is not in {self.path}') from None
+
+    def data(self, name: str) -> memoryview | bytes:
+        """The payload: a view into the mapping if stored raw, decompressed bytes otherwise."""
+        entry = self.entry(name)
+        stored = self._view[entry.offset:entry.offset + entry.stored_length]
+
+        if entry.compression == COMPRESSION_ZLIB:
+            return zlib.decompress(stored)
+
+        return stored
+
+    def digest(self, name: str) -> str:
+        """Hex digest of an entry's stored bytes, computed once."""
+        digest = self._digests.get(name)
+        if digest is None:
+            entry = self.entry(name)
+            stored = self._view[entry.offset:entry.offset + entry.stored_length]
+            digest = self._digests[name] = hashlib.blake2b(stored, digest_size = 16).hexdigest()
+
+        return digest
+
+    def open_image(self, name: str):
+        """
+        Open an image payload with PIL, which reads it straight from the mapping.
+        The entry's digest and name are put in the image's `info` under `DIGEST_KEY`
+        and `NAME_KEY`.
+        """
+        from PIL import Image
+
+        data = self.data(name)
+        if isinstance(data, bytes):
+            image = Image.open(io.BytesIO(data))
+        else:
+            image = Image.open(io.BufferedReader(_MemoryReader(data)))
+
+        image.info[DIGEST_KEY] = self.digest(name)
+        image.info[NAME_KEY] = name
+        return image
+
+    def close(self) -> None:
+        self._view.release()
+        self._mmap.close()
+
+    def __enter__(self) -> 'ResourcePack':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def write_pack(path: str | os.PathLike, sources: Iterable[PackSource]) -> list[PackEntry]:
+    """
+    Write a pack file; the file is replaced atomically. Entries with identical
+    stored bytes share one payload.
+
+    Returns:
+        The index as written.
+    """
+    sources = list(sources)
+
+    names = [source.name for source in sources]
+    if len(set(names)) != len(names):
+        raise ValueError('duplicate resource names')
+
+    stored = []
+    for source in sources:
+        payload = zlib.compress(source.data, 9) if source.compress else source.data
+        width, height = source.width, source.height
+        if not (width and height) and source.format == 'PNG':
+            width, height = png_dimensions(source.data)
+        stored.append((source, payload, width, height))
+
+    encoded_names = [source.name.encode('utf-8') for source in sources]
+    offset = _align(_HEADER.size + sum(_RECORD.size + len(name) for name in encoded_names))
+
+    entries = []
+    payloads: list[bytes] = []
+    offsets: dict[bytes, int] = {}
+
+    for source, payload, width, height in stored:
+        digest = hashlib.blake2b(payload, digest_size = 16).digest()
+
+        entry_offset = offsets.get(digest)
+        if entry_offset is None:
+            entry_offset = offsets[digest] = offset
+            payloads.append(payload)
+            offset = _align(offset + len(payload))
+
+        entries.append(PackEntry(
+            source.name, entry_offset, len(payload), len(source.data), source.format,
+            COMPRESSION_ZLIB if source.compress else COMPRESSION_NONE, width, height
+        ))
+
+    path = Path(path)
+    temporary = path.with_name(path.name + '.tmp')
+
+    with open(temporary, 'wb') as file:
+        file.write(_HEADER.pack(MAGIC, VERSION, 0, len(entries)))
+        for entry, encoded_name in zip(entries, encoded_names):
+            file.write(_RECORD.pack(
+                entry.offset, entry.stored_length, entry.length,
+                entry.format.encode('ascii'), entry.compression,
+                entry.width, entry.height, len(encoded_name)
+            ))
+            file.write(encoded_name)
+
+        position = file.tell()
+        for payload in payloads:
+            file.write(b'\0' * (_align(position) - position))
+            file.write(payload)
+            position = _align(position) + len(payload)
+
+    os.replace(temporary, path)
+    return entries
+
+
+def _align(offset: int) -> int:
+    return (offset + _ALIGNMENT - 1) // _ALIGNMENT * _ALIGNMENT
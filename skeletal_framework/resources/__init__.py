@@ -1,4 +1,73 @@
-from skeletal_framework.resources.exception_hand import EXCEPTION_HAND
-from skeletal_framework.resources.exception_face import EXCEPTION_FACE
+"""
+Embedded images, loaded on first access.
 
-__all__ = ['EXCEPTION_HAND', 'EXCEPTION_FACE']
+The images live in `resources.pack`, written by `utilities/embed_resources`
+together with the `_index` module that lists them. Importing this package
+neither opens the pack nor imports PIL: the first access
+to a name maps the pack and opens the image straight from the mapping, and the
+image is then cached as a module global, so later accesses are ordinary lookups.
+
+    from skeletal_framework import resources
+    image = resources.EXCEPTION_FACE
+
+PNG images also come with precomputed, downscaled levels (see `LEVELS`);
+`nearest_level` returns the smallest one that still covers a target size, so a
+caller resizing to that size starts from a few more pixels than it needs
+instead of from the full image.
+"""
+from functools import cache
+from pathlib import Path
+
+from skeletal_framework.resources._index import LEVELS, RESOURCES
+
+__all__ = [*RESOURCES, 'LEVELS', 'PACK_PATH', 'nearest_level', 'pack']
+
+PACK_PATH = Path(__file__).with_name('resources.pack')
+
+
+@cache
+def pack():
+    """The package's `ResourcePack`, mapped on first use."""
+    from skeletal_framework.resource_pack import ResourcePack
+
+    return ResourcePack(PACK_PATH)
+
+
+@cache
+def _open_level(name: str, width: int, height: int):
+    from skeletal_framework.resource_pack import level_name
+
+    return pack().open_image(level_name(name, width, height))
+
+
+def nearest_level(image, width: int, height: int):
+    """
+    The smallest precomputed level of `image` that is at least `width` x `height`,
+    or `image` itself if it did not come from the pack or no level is big enough.
+    Levels are opened once and kept.
+    """
+    from skeletal_framework.resource_pack import NAME_KEY
+
+    sizes = LEVELS.get(image.info.get(NAME_KEY), ())
+
+    best = None
+    for size in sizes:
+        if size[0] >= width and size[1] >= height and (best is None or size[0] * size[1] < best[0] * best[1]):
+            best = size
+
+    return _open_level(image.info[NAME_KEY], *best) if best is not None else image
+
+
+def __getattr__(name: str):
+    if name not in RESOURCES:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+    value = pack().open_image(name)
+
+    # Cache it; module globals take precedence over __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
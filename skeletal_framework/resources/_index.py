@@ -0,0 +1,31 @@
+"""
+Index of resources.pack, generated by `python -m skeletal_framework.utilities.embed_resources`.
+Do not edit.
+"""
+
+# name: (format, width, height, source file)
+RESOURCES = {
+    'EXCEPTION': ('PNG', 1024, 1024, 'exception.png'),
+    'EXCEPTION1': ('PNG', 800, 800, 'exception1.png'),
+    'EXCEPTION2': ('PNG', 342, 530, 'exception2.png'),
+    'EXCEPTION3': ('PNG', 360, 360, 'exception3.png'),
+    'EXCEPTION4': ('PNG', 920, 920, 'exception4.png'),
+    'EXCEPTION_FACE': ('PNG', 425, 512, 'exception_face.png'),
+    'EXCEPTION_HAND': ('PNG', 512, 629, 'exception_hand.png'),
+    'HAND': ('PNG', 256, 256, 'hand.png'),
+    'PYTHON_ICO': ('ICO', 1024, 1024, 'Python.ico'),
+    'PYTHON_PNG': ('PNG', 512, 512, 'python.png'),
+}
+
+# name: (width, height) of each precomputed level, largest first
+LEVELS = {
+    'EXCEPTION': ((512, 512), (256, 256), (250, 250), (219, 219), (188, 188), (156, 156), (128, 128), (125, 125), (64, 64), (32, 32)),
+    'EXCEPTION1': ((400, 400), (250, 250), (219, 219), (200, 200), (188, 188), (156, 156), (125, 125), (100, 100), (50, 50)),
+    'EXCEPTION2': ((171, 265), (161, 250), (141, 219), (121, 188), (100, 156), (85, 132), (80, 125), (42, 66)),
+    'EXCEPTION3': ((250, 250), (218, 218), (188, 188), (180, 180), (156, 156), (125, 125), (90, 90), (45, 45)),
+    'EXCEPTION4': ((460, 460), (250, 250), (230, 230), (219, 219), (188, 188), (156, 156), (125, 125), (115, 115), (57, 57)),
+    'EXCEPTION_FACE': ((212, 256), (207, 250), (181, 219), (156, 188), (129, 156), (106, 128), (103, 125), (53, 64)),
+    'EXCEPTION_HAND': ((256, 314), (203, 250), (178, 219), (153, 188), (128, 157), (126, 156), (101, 125), (64, 78), (32, 39)),
+    'HAND': ((250, 250), (219, 219), (188, 188), (156, 156), (128, 128), (125, 125), (64, 64), (32, 32)),
+    'PYTHON_PNG': ((256, 256), (250, 250), (219, 219), (188, 188), (156, 156), (128, 128), (125, 125), (64, 64), (32, 32)),
+}
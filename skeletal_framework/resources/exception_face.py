@@ -1,5167 +0,0 @@
-from base64 import decodebytes
-from io import BytesIO
-
-from PIL import Image
-
-EXCEPTION_FACE = Image.open(
-    fp = BytesIO(
-        initial_bytes = decodebytes(
-            (b'iVBORw0KGgoAAAANSUhEUgAAAakAAAIACAYAAAA415PgAAAAGXRFWHRTb2Z0d2FyZQBBZG9iZSBJ'
-             b'bWFnZVJlYWR5ccllPAAAAy1pVFh0WE1MOmNvbS5hZG9iZS54bXAAAAAAADw/eHBhY2tldCBiZWdp'
-             b'bj0i77u/IiBpZD0iVzVNME1wQ2VoaUh6cmVTek5UY3prYzlkIj8+IDx4OnhtcG1ldGEgeG1sbnM6'
-             b'eD0iYWRvYmU6bnM6bWV0YS8iIHg6eG1wdGs9IkFkb2JlIFhNUCBDb3JlIDcuMS1jMDAwIDc5Ljgz'
-             b'ZmFlNjQsIDIwMjIvMDIvMTUtMDg6MDc6MzIgICAgICAgICI+IDxyZGY6UkRGIHhtbG5zOnJkZj0i'
-             b'aHR0cDovL3d3dy53My5vcmcvMTk5OS8wMi8yMi1yZGYtc3ludGF4LW5zIyI+IDxyZGY6RGVzY3Jp'
-             b'cHRpb24gcmRmOmFib3V0PSIiIHhtbG5zOnhtcE1NPSJodHRwOi8vbnMuYWRvYmUuY29tL3hhcC8x'
-             b'LjAvbW0vIiB4bWxuczpzdFJlZj0iaHR0cDovL25zLmFkb2JlLmNvbS94YXAvMS4wL3NUeXBlL1Jl'
-             b'c291cmNlUmVmIyIgeG1sbnM6eG1wPSJodHRwOi8vbnMuYWRvYmUuY29tL3hhcC8xLjAvIiB4bXBN'
-             b'TTpEb2N1bWVudElEPSJ4bXAuZGlkOjY4NDg1M0RDRjQwRTExRjBBMjIwQjY2QTkyOUM4RDA5IiB4'
-             b'bXBNTTpJbnN0YW5jZUlEPSJ4bXAuaWlkOjY4NDg1M0RCRjQwRTExRjBBMjIwQjY2QTkyOUM4RDA5'
-             b'IiB4bXA6Q3JlYXRvclRvb2w9IkFkb2JlIFBob3Rvc2hvcCBFbGVtZW50cyAyMS4wIChXaW5kb3dz'
-             b'KSI+IDx4bXBNTTpEZXJpdmVkRnJvbSBzdFJlZjppbnN0YW5jZUlEPSJ4bXAuaWlkOkY3NDM1NTA0'
-             b'RUExQTExRjBBQ0NDOEZGMDg5NTFFQ0UyIiBzdFJlZjpkb2N1bWVudElEPSJ4bXAuZGlkOkY3NDM1'
-             b'NTA1RUExQTExRjBBQ0NDOEZGMDg5NTFFQ0UyIi8+IDwvcmRmOkRlc2NyaXB0aW9uPiA8L3JkZjpS'
-             b'REY+IDwveDp4bXBtZXRhPiA8P3hwYWNrZXQgZW5kPSJyIj8+HIDWrQAEd/tJREFUeNrsvQe0Jdd1'
-             b'HXhuVb388+/8O6FzIzZSAyCahEiAJEAwWaKkJSsMNUuytZYsaY3SkmWPPV6jGXtsaWh5pLFEyRIl'
-             b'BgVGUYwgAAJEJBIRO6BzwO/un8PLr6ru3H3OuVUP9ATZoxmJwHvgZ//wXoVbVWefsM8+pjF3kt6M'
-             b'L2OI4m6HWqsr7ntD45NrqdlpkXW/L1FKvaBEUWWYmnOXaKhaoV7cIRsUKYwi6jZWqNfp8OfiuEft'
-             b'dotqQ8NUKJYp7XYpKhXI2pQa9VUK8Z7UUpoS1WrDvO9V9/va0BCFQUT1Vfk+7vWomyQUBCEtLS66'
-             b'vwW0YfMUlWsjdPG1M9Tr9qharZJxfx+uDlGSuP22GlSr1ujkq0foit176fL0NFXccayZHKdjL71A'
-             b'zWaDrrrhRpqbuUwXLpyl5YUFKkYl+r4730ULc7PUbHfdcSVULJVpZWWJJiYnqFgoU9utSyEyZCmk'
-             b'qFikVtv9XCjRqNt2UIiosbLq3tPi81mcm6fI/a1YLlKpVKF2o87nUqxV6LXzp2nD+il3HHUqld17'
-             b'CgUKwqJbG+Lv4ySmTrvp1rdKhXKFj7Pp1sMYt15unTpujYdGRqi5skxrN05R1/08vm49pe68l5aW'
-             b'acuO3TR3eZrOnTpFu6+8mqrlMk1fOOPes4nK7pzm3bWbufgadd01ueHgW2hpfomW6nXavmsfmTTm'
-             b'7Sdxl5qNBrVaTdqwfQeVKzWyiSXjDtK64yAT8vepe79x1wv3jVsYeYUB8YUNC4STsjZx7wn4+4WZ'
-             b'aTI9XLOaW5cSuROnE0dfdtsv0/DYBA2NjtKrL7/o9pXSpi1bef1PvPIi7dqznzZu3U6nz5xwaztD'
-             b'V117Ay3Pz7lrXaetO/fS2VMnaN3Gje7cLrur4+5Vd49OT5+jK3btoYtnT9PYxDidOnmSrrvxVqoO'
-             b'j9DK4py7d2NK3X4m129298g5d3261G233blbmtiw0R3PKFl3jy7PL1K1NkSBu8fnZy/Teve3xYVL'
-             b'VHHn4G5+Ovzyy3Tg5oN04dzZytLC3Lp1azauP3v61MT09Pl1K6srG9euXz/a7fTKbnmCjrtp3DZW'
-             b'Nm3efGHX3n0X1m3cvHj+7OmFdevWzU5t2dHAOl86f5LWbtpEp48fo81btvM9ObF2jVuLZQrcHWDT'
-             b'nns+6rRp0xZq1RtUd/dW0mu7e2GTW3ZLHXcexVKROo1VSnGN3HVL3PXAfVlz5z4zM0NFt59WfZnG'
-             b'Jyap2eq557dAkbuAqe1Sz93/uMtLlaJ7vpoUu3NcnF+mYXfPjbjr03HPdbfVduuVuGczds9WxR0T'
-             b'ue20aNRdwzTG52NnC2IK3f2/tLhKZWcrtl+xzT2Tx926DdHUlik68+ox91wntM6t59LyMq2Z2sbH'
-             b'j5up6+53PDPV4TG37iHfw/hb7O432KcYbwtCejO/Ihq8Bq/BK/dc3BcDkf7ofzD8e/z9P39/9h7K'
-             b'v//eO3VDYRg6QC07R6TAjotzckaXlpY2vnrkyP652flrzp89s/uRB76+bXlhfmOrsTLZqDfGUweA'
-             b'UWDYseh12xSYgAIHGNgWHJwzL36bnvh65AxwIa0ODa04w71QqQzNjoyvuTQyPnZy846dzxai6Kgz'
-             b'+hecAzhTrlTYeQBAxd14cE8OXgOQGrze0KiTGeAIHnRBv1zU5txgKruoJ4lDF5Wm7IkX3N+cq+0+'
-             b'kUqEhLgaH7YemszrN+ziMeciW7bQgmju8yGHWiW3D0QkpUrVhTsluMOy70i+EJHLpunvFNhwHACG'
-             b'bqdLy0vL28+dOXPd6VPH33L+9KkDC7PTe1YW5je16qtFrFfoomtElUV3joFbu5HQOiAKeDECB1Sh'
-             b'izRwRg6mKMSJuaVAhObiG7eScZC2mmPd+sxYO013zJ8OqOP+9m0TuWinGhdK1dnRyfWnNmze+tKm'
-             b'rVuf2bBh/bMTayZOFEulOo6v15bMxeA1AKnBa/D6nnkFzljCY8e/8PyLzpgBHPB9oSip2dD9X6vV'
-             b'Gr50cXrt4tzCmvnFxaGZi9MbmqvLU61ma6jTbZc6rWa12+2OJmlaS+K4GMdJ0f1b6KUOwVIbpUni'
-             b'ggNnfAFg1hoGFwdiJjCpCcLEhEEcRVG3GIVtEwQ9t88kKhbqlUJxoVIqr9ZqtZVybWip2+tdrI0M'
-             b'LzTb7dXRbnvZ7WepEBVa7rMJjrdQLPHxFxywFQpFBgKc39+2cfYRUy9IaH5mZt93nnny3qMvPn/3'
-             b'aydPXN9YWpi0SZtCIynPYhS49bQkCSdJUQWE1GbM4GSSLrnzZ2AKEkFzxmkjWB9Yw39LAVSINR2Y'
-             b'pciSuv/KDrht2iXb7US2s7JxfvHSxotHv3P7M+6zhXK1Nzw5eXrD1NZnd+7e/8SWrTseqwwNv+KO'
-             b'u+OAi0F18BqA1OA1eP29SEPhC0Ybr5IDIlSswnoTtaTx5eXl0frqytoXn31qS9ztrJ2bmZ5wP081'
-             b'6qtb6itLk51mfbjTbo+7r4m0GzsQ6jnccV+o/7HZdQbYEG+TU31siwNFQSlAyW9RaZF6E0pV+NHy'
-             b'f1KiYhDjWoflmpuVOEtqVRxhOcApSm0qDMJ2UCg2HCCtlErV+tDI6LIDqWl3jmfnZy4trN20ea7d'
-             b'65yNwvBCfXV1IU3tgntvD+AFA40vjsTcOfxNAYyjybKA9+WL0/tfffmle86fOvbumenztzSWF0Yj'
-             b'ByIlt82hEFGPbBc1K9TMcPhYCsMn5gAaqUH+1p2T+zLWAXYKMAII+ZM3pHEirxLWAmtDWm/kb913'
-             b'2Cb2BRAroh5ckBXvdZcL9enFPUfOHtvz4iPf+JHq0FhnYsPUK9t27nngyutvfHBq6xVPu3thvlCM'
-             b'qNdq8PUcvAYgNXgNXv/fR0cOCAKHGhHccROwS54k6aazp09sW15c3Dn/0P37lmdndi7OzWxdWZzf'
-             b'Wl9dnEh7vUqn0XCWLnEAkHD2LAzZZFIhNFx4xk8FgB0cfBjcgjj7xki6ykhyT4yrM8xGGRJiQFO2'
-             b'0jCvsMEm9eBk2WCLJRbwgvFNNeggfR8bZxj/pEEuAIFBLfcsldtJMpnGCR8nCv5MxLHYm4sMHaCU'
-             b'qtXO10qVpeGxiYuj42vPrdk0daZSHTq2beeu46lNzk6MT0y7D9URfSElhnRiGEb/GTiV3LY67U7l'
-             b'qYcf/MCjD37tx6dPHDmUtJZHyiFAAek+pD0DJtGALGLdNcAxB0Gk0RMxkANQEu84IB0K5DEC4pwT'
-             b'DUyeDbV+hch9JhFgd2udkIK2JQW8DLHctROQR6gV8j4DiiJDZQBXd6U0c2r+hvPHn7/h8fu/+Cuj'
-             b'azec3XnVgW9ed/MtX9iwYcPDVUSq7S4l3UGENQCpwWvw+luMkhARwIgW3FfRRRoLs7MbOu3mtrNn'
-             b'Tl23OD9388zF165sLM3tc97+hO11nKFPOBUVOisGxl0UwqtHWsoZVaSinKFkQ5imkpJL5H2Wwaav'
-             b'BhQLe88iHQWgSkmJEWIwQb4KFLy8TeVPO4RD1JRwOsyorZVIwYNdag0ztBBhJLo/694A4wzmoE+Z'
-             b'4b0gHcC2F0PD7MCykSjO2DYlK/VSm2h9c/bs+ktpcOAVUMuigrP1RYoq1ebQ2MRMdXj03PjaDcdP'
-             b'HDl8dGR4+MUkTU64Nb3koq1mgHrY0nzlheee/YGHvv6Vn3/t1cM3l6hLVWf4a6gvYV8xWG6JRDca'
-             b'MTIQOaAwJk/R+S9ZQKac8TKmXI7TmJS/D31sqU4G1sSdbciZUoEtBnLZl9Woy8YxX7fYHQiuMX6f'
-             b'gBWLI+NoK+V1qhUcgCZtql86s+2Z6dMffuabX/7wmg1bj15981u+sOfKaz+zYdPUs7ifgjc5I24A'
-             b'UoPX4PVfCUoRG9mAyqUSrdZXCvNzs7tOHjl84PSpE7ddPH/mupnp8/u67cbaTr1uAEYw3pHzsEcA'
-             b'SuypI10mNaE4UfKBTV+/IzZyltNRqdLFk1TSeanWVVDQR/aOmcDw9BWkODIKNBKwnrxn1NnH5xKO'
-             b'qKwhHz8wWKUaCXG8hQgK6S+OjDj0ks8wFAQSsgGglQ1oeXcSQUqaDMbdxVOg7COlFgogWI40Q3fe'
-             b'lnpxvdqYbWxfnj6z/fyR59/2rAPdqOQiqtpQfXh88vxz337i1dGJyblzJ09cd/LoSzeV3VoOuXWM'
-             b'kG5LYuqmygkBddtK60Oq54xISrKdAXk4TRWpGciRuuM0H44n1XgJn0+1diWfkXUyfG55YjQkhW51'
-             b'CEK+Fth+jNSiey+Dk/tTN+7pnlNeS8O1rZSvG8gb5WLA/JaVi2f2PfTFc7/26P1f/YWd+6755oGD'
-             b't336wM23ftlFl7MgrwxeA5AavAav/8sXivTFYpHrKCC9Xb50cefFCxduunD29FvOHD9y6/Lc5d31'
-             b'lcWqdQaphNROsUAV95nh4SobOfbgGYRiF0EVpL8EBjxSI0/94Y6k3LxBZ2/fSgVfoia2vFkdB0DC'
-             b'vr21nm8u2ORrU2yxU/69gF2g70/IV6tsltqSSEPYbKnmFP3B5UAl9S5NZ1qJJwxSkjDkto/RboQ0'
-             b'yNGITbPNSO3LPbj4HX5dCThyE0B2kUjSGarPXth/+OKZ/bGLTkouOl1TK8lndC1NIGTEQIEn1ujG'
-             b'cPSSKKjoWshCZtUlyWUaWRYSMOZrRBp5WoloE5ynx3qrq2l93a/AoBVwJMYHwj2DYWSz9cd6l02V'
-             b'IY0ZgyBnmEDTinpzWUnXCsgBvNPK+cNPv+fky8+95+H7vnJi/4GDn7r6xoOfHapVXwSZptUeUNoH'
-             b'IDV4DSIlMOoCYduF7oel5eUt586cvOnkscN3X7xw9qaly5d2x+1WBR530d19BWepxkvOcJWLuaeu'
-             b'aSCjdRCpeRQ1BYf/S4THAGsVWPHcrT8GTVp50NFPI10kkZLNAU1TVhwJkQABCABGd26tGEirUYXN'
-             b'UoKht96CQ0EgQMeYgm07+IxM9js+PvQP9aUIGXiNRFZCHvCpR80zWqupQz3eVGteYu31XANJaRqJ'
-             b'5jjOLIZUwPfuX5MWJdmmTA9Jt6XcxyTAoZGTUTQxNiOqpFpP81Gk9YQR3RavnfZHGa1bpaYfPBzg'
-             b'6bmSj3St0ShLUnycVmRwTsiflmKWrq2Adxj4K6lIailzDHCcXCd0vy+4qC4qBdRzkWZn9syux796'
-             b'7l8889DXf3nLrn33H3zbOz6+efuer5Qr1SbSxmlvULsagNTg9eYAJmegwbxD8d69CjOXL++5cO7M'
-             b'radOvnpo+vypA8vzczs6jdWRuNugSuQMqHt/Rew6rBh77SjYc8HfBGrAE2XU+SbZQJl4RLkbLdGR'
-             b'N+bkja5RPp7vQfLVFuOZeb4ukktHcDoJ70TuyOp+YfydGQWYpkqeMBwJiYG1WQ9WX72KgSfQbKH8'
-             b'HPBnfakr5ZoNf1pZgIECFdMJPMtQASEPGORcONWlx8//aWRCSk8ItOYVKhjylo0H/FBVMYSlyNvj'
-             b'UxWGnd+PHERfU7PNrnQGEEaZFIGurb9ugeRAKUb9yK+PtRkL0kMNZck/BXIPbBkxUKIs8ulQdTWs'
-             b'FYcjze4POX7Jl8aKXUgPp7wew/B7ukvVs88/+v7jLzz1/olNO5+/7pZDn7j+pps/O7Fm/IyNUwLb'
-             b'c/AagNTg9QZM4THZoViiXq83eXH61ZvPnTr+zjMnjn7fzPS5fc2lhSrSUaglFZ0bXAZfuVJQQx1I'
-             b'Oi30dR5iORifzwqU7ZWl5EhIB2lGY7BaD6IMMFIPVN6FVzAyWszXPBlvO/FRgVGjZ1MhNVipeVhl'
-             b'oRFo2Nbk0QBloZoet9ZTsqhITa9Ns+jBE9cCAIRGdh5ujDIXffjA1RrFiFRZb6nuV2MaBhrL7D81'
-             b'4JwJTDnaID0f8mARSIOtUMjV0LvNRP68A8vnnQU/ljQ1qvUnhRR+DwO8d0pyQBaA1cDP+DScyaJP'
-             b'H53x72zO9fPv8gQKqXulzOz08a98zvc5e4JFXzTm07KpuA8StGrdMZUUbcDXIqFa0VAJEksXjhy4'
-             b'7+QrB7711c//8o2H7vjUTQff8gfr1q87GhVc9DUIrAYgNXi9MYDJRBFdvnhx67HDL73z1LHD91w8'
-             b'e+bm+cvTW4Ok5YxWjwvzo+6uCjg3J958EsPLD6VMwwZUCt5cAyH12NG0GoRqsyOhQIeBFvaFtcf1'
-             b'HqZGS70jFT60GjLPPtNoKiuoWE5vsfFPfQ7RZ4uU0ABQSNX3Nx7YQtZOSDmwSNWA90UUlFt3SQsG'
-             b'CqyhGstAjyXkaJF3y8eHv0V5RJdhq8miCx/N2KAP9EjSkNYz7LJ0Y6ARZZYg8/QMBjBSgPHnlrIj'
-             b'kPSx6wIFQJMdU3b8pABLlKcuta4XZGBiOOXKzkVgM1xKc5jTz2o9CedjpYbkUdzmvEi9loGmaIn6'
-             b'VimD7Cyaw/HasO/vIGHETG7BpYZDErAOnlwjgPdQZKm1cG7D/Z/+2C8+ef9XPnz9bW/7s9vuuOOj'
-             b'U1s2vdhsD6KqAUgNXt9TL6/kgId8ZXV1y7kTr9527OUX7z3ynafubixeXhc6Y1cMIxorijGDvBCz'
-             b'3zSlBCQSL1siCW+kjdZ/Atx+TKaTNFDgmW5Ga0DWaPRlVaZIjZgnJ7AhDsSYI92V+mhIDV5fcilR'
-             b'V9xmLjn+kGSGWsDK104C6q/OsyH3BtqkWSRgNWXntwUqBxphiTxZQI5fUleppr4EZBJN4klq0mbM'
-             b'P5xPfp5Cu/ZZNyZ/kIgVSxglLDhj8uNRmoesHQgFeedxBoSJNuXm0Z3Jmmwpj1dV7clmoMEpUI30'
-             b'BFeC/rgpK0rlRAmjdTDKeszSvlqbB9fApwzTNA+RvTOhEXWgEbM/Oo6UjVVmZJ64xS/i1OYA6LaZ'
-             b'JEkWjfbilArOGVo7UqJud2Hi2/d94WefeeTBH3/H+z7w0QO3vOW3y5XKhYH80gCkBq+/98BU4v6j'
-             b'paXlLUdeefHth59/7oOXzp051FqaW1ukmMrFkMpDkRhl1WpDf0sxqngTyWDERi+BbTOaovPGODde'
-             b'xqfnKFCjKTUZ31hLXuWArVleV5F6Rqr9M4a6nK9BestHIgpqmhLzaTy/P486nr1GejyZfaMczIzx'
-             b'rD09PjWAgaovUFZPsnkqK28R7qOxG+UHynEFavBN4GEoT3mCOo1m1lSp854paLkspjR2ZRmSVody'
-             b'JqHRaEhVIgKTUfX9+7u9HlO9WbYo9Cm8gNX3GbptwlR/jppctMJOg54j+xoJiOSieUiBXONUozdD'
-             b'PqUq5I5UGZKB8bVCgKuLeBJlADIY98T5SJXRyQCYcoNyqinaCFT8QKjvVutuPiXoCR4ilVXmOiID'
-             b'qDvOQlbFM1QmjSydM1VynxuqBg64kpEHP/dnv/z0E4/+4I2H7vwPB2899LFSubwA1f3BawBSg9ff'
-             b'gxfLDql2XKNe33rs6Ct3njn20r2z58+8pb08vzFIe1R0hqNSCqWOwLIJqdCH4YFbrYukGrEY20eZ'
-             b'zind4vEG6hF7WoPR7JkCmI+c1NP2TbLcAJtnxzi1g9EZHA2xASuKsS8wI4MBlA1kqhoHfWDHHr3W'
-             b'tiCn43uB5NBTygsgmrKDFQ98QKKNq2nCaUkhQ3gWobL0yNPcNQ1IQa4/SxKlBZoy454k0xfdfVcj'
-             b'bKJkAaM5SgGoQOnp/neUpeR4c17NXYtIGcnC5lFqoRBR0adIkXwDJT5V+SJO/YUcgaAnC2MjkiTm'
-             b'6yyfLVAhKlKlIqNbWCMxiqS2qEiPMSwY2cKjbDpt6rS7BEo8fkbEjWxfFOJzITdmcwwciTIIDiIM'
-             b'8jpYIdA+KyvHYozR98laBJ4Ho/cWX08NCwGerBZi8+U1mkK16jyhFjgxVKb24sy2h7/06d96+akn'
-             b'/tGt3/eO37vx1kN/5By2lbjXHBiJAUgNXn8HyMSGJXKGNknTsXOnT731kW989QfOvnrknu7Kwroi'
-             b'dakSBTRWCKlre2yo+blPk76STE6x7o89rKZsOHEVmIw9ZvoYX6+PUKQ4b9L+URg+VZdmBjylPsIC'
-             b'A6PUN2JEG5BT0tCNKx6h0SZVTZ/ZIBczB6iR9AdFAKA00G2L6oP15AirKb2sr8pqalL2w9FF0J8j'
-             b'8+oLPihMuM5mglwp3FibRVfcT8SAlxM5rFIJhHyYR0rWU8KtOAZW61HMzoNxxjaCvNHKpmm2xj4h'
-             b'l2oPEyw4VDoSnX8VhiIByzVENNF2u+4r4TVFj9v42ChNrJmkNevW0vjkGhofH6NqdYjKlaqAlKpm'
-             b'+OqZlNISBqM46TqQalG32aVWvU4rqyu0sLhECwsLtLi0QKuYTdZuUq8Xc/tCwd1v3PDtU4QMnhn/'
-             b'0QFKJA6GJ7jkydDMKUj1x7RPO5BU/iqrkbGDIClRficyAThft57xwrm9X/3kRz/y/Lcf+/Hb7rjr'
-             b'N/bsu/bzqTuHwWsAUoPX31JUFOgoBXjH5XKFCQ+QHEK0FIUFESh1b1penL322Scf/5Ezxw9/YOHi'
-             b'uT2Ri5gqLhKpFkOmMePh7SCtY72BTvOCvZVKBXuuLJ+jxXI12kZTYb5qkWbAY7K+IvleSQm+jNXH'
-             b'7LI2TwdyfyzeC0kkBYM4SfMpGdp/Y4zATaIUc+73SdKsRuQ5B6mmlVKlhvOxciQSck+TUe8+27KS'
-             b'Iijrp/IgpKk2HBNHkv31FwEXHnPBTDQ/c4o09SVJqCDQdQxCTYVKrYzTXmleczEZ2cH2gY/+bPOU'
-             b'pY/HjO/f0jX12npYI9mfRHVxjFlQXd5/tTZMW6a209TmLTS1bStNrl1HYyOjVKqU2TlANJWkMQ8Y'
-             b'5PpP0uOWAY5IrbBh5PhCjoYC5+iUigUKhtz6rl8rIK5RZa8bU6PRoKXlJbp4YZpem75Aly9ddkDW'
-             b'4CgOjgZPT9F7Ocgzohr5ShSeCiuG0THVaDxzi8K+9K5NsvsSVzXk3q6Ejz/wNzVcF/f+8WpIi6ee'
-             b'v+GLZ45+dte1t3/2+kN3/MaufXteaDfbAyMzAKnB628aCQGIOE1XKCoYQSGcomajMdxqtcbn5+a2'
-             b'PPHIw9sWF+Ym5mYvD3Wazai12lh39IXvbF1ZWpy6PH1hb2tlvlJ0D3athCF10lfDaZlAAcY9xEjh'
-             b'cW1AKcsSLdnMh1XGb9YzFCrDjtXqfGqK+mTf+us1GoWx7eqjRGccbK1h5P08qYo5yO9SbU+Csnkv'
-             b'leiK/x7AI5eRFMVygSqVCnv+JV6nqlsv9HYVeGpuuVShQljiNBaLtLrPYUQFgJoFb00fNZ1Ur44j'
-             b'q1gVMLT5FamxBAa7x/+iTgbj30G6y/3bbnV4miwmFfc67t9W0/3ORRHdDqfTkrSjPWNSv4ERjYJI'
-             b'BV6l1idiFAIWpi+YlbUPlPwhZAfhIVhP/BM5KTbD8o6ei5YQCU6uXUvbr9hJe/btp02bt9Lo6Liw'
-             b'Kd016LJqvKVWz62rc2KCjJGn9TsTyb3Yr4yhyJrGRlKvqqPYM7I2RtOPgXOYhkZHaHRygnbu2slr'
-             b'2Gw2aX52ns6de43OXzhHszMzVOfp2TEVkBrUlKIni4h3o/m+LIucD660GetRmaHM2DSaivZ3m88N'
-             b'atTM0lFw2LCd2Jx49sEPnXr1xTsPvecf/Idrbzj4W+4+WR0YoAFIDV7/Jy94+dBzg7HtdFq02ulO'
-             b'nDpxfJf72n/klRd3z1yc3rswN7ezsbK8rtNYGY+TdrXlPNUoCHQYndCMUReAwYJ3OlQqUNcZUQxB'
-             b'lZYa8bADfYC521+p4XnZxGSqP8x8U9UBr0jgC+wSiyTZ7EDje5qsyRpe06wnSqMdTbWxwQv6+oiU'
-             b'MBE7I95LugwCQeDAx4HO0MgQ1UZkZPjY2BhNTq7h8ezVWo2GhoYcCFVZHojTmzwqI9LR8AJCVjtb'
-             b'U1U+ECKH1LG4n8hmrcQSnWRAmipTTZp0keIiVWFgRdXslYg6hBW18ySRUSEdB1RY+2ZzlZr1VRdB'
-             b'1Hm8+MriIi0tLtDq4hI1mg1qORADREGdA3JKgfMmGBRI1j5I89ogqVqE7M9yxBho1JUo063bS6jm'
-             b'1mb/1VfSVdcdoB279lF1aJSNd6/Xo3Y3yUgHPLgwECV5RBxCxgizqAygiuvg6ehetooBlUPjhMFc'
-             b'lisRmnoqMIl6XGJlnQGCiJig5r5l+za6YvceJnbU63WMFqEzp07S6ZMnaXZuhrcjiu+2L+OnPVbW'
-             b'J4W9zFVfJGmizFHy41V4ndzxY18+xchEmzh1x9R1TkzROXDuc/Hq+AN/+bF/efiFZ9/2rg/88K+P'
-             b'T659stOM6btlIwevAUi9yUApyOYHwSDVG/UNS4uL+5+7ePHm08devv3i+TMHlucubrG9rknijnje'
-             b'oTCxoNOGZtracDlrnGTvlplVkaShSNJOyLNBykg05KSniSseSrgL1Du2feEQe8feg/fSOV7huq9D'
-             b'1I9o4H1rT41RZh4Zn85Ls4pWqsrXiCwApqza5yKUUsFFPOUSrZvYSBNr1tC69RsdGE3Sxg3rHRhh'
-             b'zlKVx5VL5GNYABUpP4w39/TzHhvtgCMe6wwczjnpJQJaHIGFMh/J0+ADSSNh2CF7/oGADJwF1FvA'
-             b'rAfgyCk40HfGLlAwAHEjVTHaQNl4QgxJJeIxMMghVas1Ghuf4LqQiN4GWs/pYXw7La+s0mUXTczP'
-             b'XaaZ6WlaXFhwv29Ro9Xg7QJ8fdjATclqNJPE8v5TVYVIHbDjvDds2kjXXHMd7d1/Ja3buAlj3R1o'
-             b'pbw9qwQP0eALsoanrH9K076GvKShydOdAGkjvXBhIWSQwLFhIGLci3VQomgD8rIi2mTw9ceGSDiR'
-             b'FCrAkWtULtp1YLrnyqto/1VXU6PeoNMOrA6/8hKdcoDVqK+49wT8JZG3v1lxRAWl+0tKmFIv5Guz'
-             b'lKu6YaLGEfrngWXYOU1ZdM4gA61ev8lhS0tnjrz9L37/I/cdOPTO37njzrv+balYXOp1BpqAA5B6'
-             b'E70Q3XAKD8aj2x169cjLB1567qnvO3/y+F1zl17bHzeX19lWk4oB5G8SmsScIn5IyzySglR1OtWG'
-             b'VK9uwCVlbablgXbSRisqBM4I532wYcZ4zrxOrfnkEkSkvUQ2kyzKkkweuUgERW1gVLPOslhoNmHI'
-             b'aGoKBXzUchBZOKCFgY9cdFetDdEGgNDUFK1fv4k2OFAaGR2jURchIU2EqAggJr1BAUcAcSKGig8B'
-             b'zcEsuxCJYnfgWWQBrw8K9PgdxwBIrYVRptGXUq50wNEBZj7h3OEAgDDBkWDIIN5z3jbWz6scGG0e'
-             b'hjGHowCWW+AjDjaWCaf3eDYTUnxcbLMuOoRET5eNJG/DAV55aMxFhGto89YdHNElzrtHBL2yUqdm'
-             b'u0Wnjh+lbz/0TWY5Gk25pTp4kbQ2hvfj2m7dtpVuuvEg7bvySqq56LLn1rvdccfRk742bCNQpqE0'
-             b'FEf8+zAQUkaiEQfIDaleXzhPPTRqhxJdFpwjwQEqX5uYAaPrzjFCr10S832I+VXSQuDO260DFEni'
-             b'bpsdgNidvztJhxFuXfh6xnweTRfmY+XDUo32XXPARYDX0NzsDB07eoSOvvIyXZw+54AwoWKhrCpJ'
-             b'vnaXas+Y1bs00PvZ5sVT3/xt9PlgUeJAHShfYA2ynrHhsou6qDn83Dc+/0+nTx5+x53v/eA/3bhp'
-             b'6zfTwA6M1wCk3sARE9QcAnbLaWF+fvvp48dvPXfmxJ3T547fvjx7aW/abQWQCi0XDVWY6pRmlNyE'
-             b'+5HEczfUJ1/Tr2Cg1GGmTeNxN6K87espIdl8HEUfQnk6dS7zkxfmffrOC2Mblf8xXv0glKI1jHqo'
-             b'9RIRLQ2oy5GCA6VuT47cGa7RNWtp/7YttGlqM23avIUm12xwxnSY2WWIOhC5oBGzk+q5JM6DLta4'
-             b'cbPkjFfSa8t8KlDRHcBbt6YgiGNtO85gom6HOUWJ89BBaWYD2pH6SImNKLv5FGvxHU5Co9UhTH4t'
-             b'FyS9ht6i2IFgpVx2INHhNBt6clrOQOL9nORCX44z1ik04Rx4Rc5wJm7/8MiTRAgRhfIIXy1+jxFp'
-             b'JtD6i27tAHq+gdli1lOSSNFP184UarR20ziDxXee/jZfs1DJCmmSX5uuWw+k/3bt2EkHbz3oIqd9'
-             b'bi3L1G33MABRxHrDgIFSOAPSJyWSVRHfV7h6bQdCAIdibcz9i7RpkQEZ9wVYlbWCODWsKgLHAMQK'
-             b'd75DtVEHkHUqxgFHdeQADjPDep2m++q5dQH9HI3iXbfdMp9n6o6nVClxLRH0daSqkW7rtlpMJgHw'
-             b'IfLFPsYm19Ht37fRndstdO70SXrhuRfoxPHjXP8TmS2JoJBWRWAGhyHUyD3vhcv13QPbp47va57Z'
-             b'//dxV91xwJ2ZKBlaOv3KLZ/630//9fVvvfN3D73z7n9TKBQWB9ZsAFJvIN6DkREWxRI16/Wp40cO'
-             b'v/25Z7/9obPHj7ytvbwwXgyhe5fSkDOSUUmVC7TSY5Ge0qgkZSkYygRUJb1BWUXIkxL49/qvVUAL'
-             b'jM2bRL1HqYDj9VeDbKS6DLOTYnnKaTFu2EX6DpJCGI+eqQMIY61YjJjhliaodSQMFr3YGYtylcbX'
-             b'TdCGjZvoip27aMOmzTQ+uZYqFUlrxlYMW9cSv18OPELIxyk9nCDSmjCWJabGA7DKSvMO2cC2Wm0q'
-             b'IcJBf46O2iggEgJoOSDA5FtEeQxe7u+dnkQ8I7UqNVsNt9/YGUghUXQdmEJZAyBXLFVcBNLlPiGO'
-             b'OhwyAMgsz1IyDEwgS/hR89ZFAYjAkkTFcAuSSu3GCafHQAYA+BUKFQaxqFLJFNydRaaCASW8LYMA'
-             b'EyEuFCJDX/n8X9JLDqSqlbKm4kQ6ClTungO/qa1b6C1veQvt2bvXAULIRI16vcHXLeSoSTXudPwF'
-             b'jHqSon+rxL1FXbdgRbcWVQc2oXMGMHoe9wgIIAAL1tlz22g03Vpi7lWAdHRTap3u+9hFesVIRqv0'
-             b'3HEDIH3TrfTkRdR2YFl06x87QA0RHYeIphKOzgxArTrKa1cqVt1SdHkt3Zk4oMW4+JRBEo7Rzj37'
-             b'HBjvoekL5+m5556hY8eOUH11Neu9Cj1tJ+ud0P4yTVdK7ZEy2PLMSU+50BZrzSAkTN3HLwvOaQyT'
-             b'Vu3pr3/+V8+fOXHXTW9718/vu/rax7IIbPAagNT3LDiVSjCm4elTJ976+EMPfvj0kZfuXp2bXm/i'
-             b'jvPSQ6qWlCGH97voIVa9ukR107yHl/iHz8vWqEpDPmDOP3ch5XoJNiM/9MmI9omI2mz8ecZq80oL'
-             b'RNl2PKghfcj0YBYIlfRYqDN+oIXWdscPNt3I2g20b/sVNLV9t4uWtjhPeA2z6WC4uj1hybV6btsR'
-             b'Tr7ITbmlQjHfp4q5AthXGnWHBSWeqYRIoI2UG+oXxQK1nHFEPQFsvk6zRbVqzYGdpGoQQSBNCMcg'
-             b'VQUJAFbZefJI/8Fw4/MppHPgwaOm1E043Zc68ClgJpHz1CO375ijMz81MWGQgtGM3DEDFBKRGOc6'
-             b'S5lVE1JNyRlqNtvuuIacMe7wuHgcE9POkYbFvt05JjyqPeSIqRSWGDjxvopb45effoSefuwhqlWK'
-             b'mUOC26Llzq86NOQijHfTdQeu5/XtOnBquUgEd0hkvMoHtO1C1e9LlPQQsWoINlQoD9PI8ISLampS'
-             b'28NaOfDvuLXB8QAYUFOS4ZKSUm11WhxlAdwb7jhKbt/t1TYNjwwhiOJ0bCENOK2ZpUmjAoM6alBc'
-             b'i2TQiWT2lVfjwPdc1zKYRuyi14QqHBG66MqtH2qBYCBisu/6TVN094YNdPDgQTrx6lF68TvP02sz'
-             b'l9ghq7prDueJk9w2zcg8mbChMTlj0Lz+7xlnyAipAmn1NFNlJxoqB3Tp6As3/NW5c19dvPf7/6fv'
-             b'/6Ef+l/DMBoIAQ5A6nsPnJBWStIkOvbCc+9/6pGH/smZo6/cEfbaQSlKabRoOCqxaZejjp7WGITo'
-             b'pgrR3AMV6AOlfUjqsZu+mUA25yRnD5pXHAoySreR9I7Nxyloc03WApkIzyGb6eQbJilTkTBanxFm'
-             b'WbsTizZauUbDoxO0dfNW2rpjl4uWdtOa9RupzEaPuFDfhiyPB1d42WB2OW8as4CQrmOyAuo4qrvX'
-             b'dUYociC06ow1jDiMUheRh/PIUVfCpFYw5bAeAAoAVKVaYbUDMCKRjqqiEO4ADAV4UNGLVfe+VlNq'
-             b'Y6kwtZBaLDlg63RbnMID2aBcLbsooeG2W6JqtcqGHxR1q9qEYBxCIBeMM+v2g1RVVC7y2oKthigA'
-             b'611w59fpdmhkZJSajVUGRqwbetd4E4EErNJzJCQYnKNxIA6jj1rXwuXz9OUvfIYi7sUKmCwBYIDm'
-             b'37UHDtBb3/52Gl8z4RyENjflkmcequYh6dwqT+eXANyBo3tPVBuhoDhE1bE1zk8AEHQw0F0IEQ5Y'
-             b'OY0pNwRBOTx128c1Me7YRtz51pdX3LUvufWqMPCtOvCou+MAMaTtrkev06Ehd+5dt7YAG4B9x60V'
-             b'yBuesMEMTkSZiMi4sdh9zs+vopiJF/zSdgGcR6+1yknrbtLm2t/IxATdctshuubaA3Ts1SP0ne88'
-             b'56KsC+4+KXDEjdItp8g1UyC1VZM1SvdLVEkjdpqRe7B/ODuUPZtCUsG1irrLw/f92X/6NwuXLtx0'
-             b'6K57fs6d66WB5RuA1PdI5FQE8BReefH5937rga//3MlXnn+7iZ2X734flQNpvEWRulTlom5BcmZa'
-             b'8M3lcgI1KNnsucBHOUGf2Kl2/0MdmufyqEad0SjMZi21qqqjlIeM8OCFf9KsHmU8KGWjNpjiwWk/'
-             b'FMY79R7GltOm7bto6659dMXe/TS1eRsNDQ1zugapLRAi6rHKFYVg6g2xMQLgIJLCySEdiPcjqkhj'
-             b'IRYUOAqxLOMDdYMiJIWcsQXwxJ1upj6B7YfFgqyU88zRNwaDBQIGRz9hyIX4BGPWIxjYDkcJqI2A'
-             b'zo7UVdFFCZ1uzOk6gAvADIQK0+25yKzGa9FtN5m4QdoMjOOG799LZJ4RRrMX3b5B6kAE0HUgGJWK'
-             b'HIdytOEMfafZcNFbiWs3SE/2+DwCnewrEStSZvh9qVJgUkCn1aaq2+2DX/sirS4tUAXn71YTxn9k'
-             b'bIzeec89tP+qa/lcWp0eXx8Wu9Xozag4rtQiSVh0ClhpUKLS6Hqqjk9y/Qa/Az0e0SmPVDGh0gyE'
-             b'lVkIJWoPkZ5NOFHogNg6ABpx0WcsIrRuHYZGhznSWV5YYCYl7igwE5HGhDZkq1kXMkoQcbSGxmA4'
-             b'GEbV1Btu7SrlIrcGyN9Tvl6Y4hyG0hYBQC/WRl3E26J2I+ZzRqTTddcXjs4BF1Fed+A6evnll+ix'
-             b'xx6n2Zl5rnnBMWBGZ6oK+TbW3rOA1xBpSO7JStKs/y+1UvOs1iRly8uY5k3fiASLRRfpPvHAhy6c'
-             b'O7vrg//wJ/+7qa1bHhoI1g5A6u8rOnGjqLuzC4dfefkDjz3wjZ977dSJt9lem0aKqK2UVG1AjKxV'
-             b'ORufFvLyzqnKuGVaq0zTVu9O510Yr3NmhO7M4Maq1olIz7GIqaQHTd/IdR+pWONHRGiyT/N9QaKG'
-             b'KcilfLI+JqaJW9q6bRdddeNB2rZnD22Y2uZAt4osEHvxbWdc017K6SD3LaeKYJRQcwj1WFFEB3iw'
-             b'V4x0VyLsNvdWTs0ghWa5QRZzzsWQIJ2IWlXRGdEep9+k0A9ZJNHi04ZVkC26XWUvGj6m6vAQ/67X'
-             b'67jrUxF2WhSyEW81Wkx5hnvccgAFgIP3D5BEqqyHOouL3FA7QvRSLEs9C9stOoAUSrXhvyMl1mzU'
-             b'XTRX459xbpUKorCOUMxjqQkh5SViqDJyHmDMnjqTN5zBdOCE9GG5WKPjzz9Fzz35ba6PdWJZj6uu'
-             b'u57uete7aNRFD/w5VdbgWwI1pqIYWqyFyTLAadYrnZoCVVzkZEtDVF/t0fDYCDdFo46I2mfbRXzl'
-             b'oSqTKVAHSuMuG2+v5g7AiCEWi2virgXCQe7JAq2ce9JCqqCuCsIF1xHd37oS9aJGiGON45R7+WJr'
-             b'dZwKb5jXmlmB7noUo5ABFOAvICgK8XAE0l6Pb/8IkXrPrWe3wZRyHEPTrTcA/9prr6ddu3fTyy+9'
-             b'RM888yzNzS5welKag1PVgUz5mqCVgNU/UE/VeN+nvL26iLQUaHN3plcstaxhF2WuXjp94E9+5ze/'
-             b'ND/zD//V3r37f9Om6YD+NwCpvz8vZqS5O/yFZ5/+4JMPPfDz544dvgO/GS6F3MAYUpIVbslP9skE'
-             b'FvpSDSYXFDJZfcj2KTPYXDncj/7O6kqx50SQV/mWXich4+agZqShsi/7ng+s02eP+3csg1zA7EB9'
-             b'tzO2w8573rLtClq/fopCF0GsIPpwhreHLaPmYEVOyJTcJ53R7TijUaiUOQpiRhcpeMEwKmCESk9H'
-             b'XajlDH2pUmVKMtKfgerPJan02sCoFBCFgPbcFsCK+feWt4XoKHGREHp1ELVB0QDAgG123fvxOxwH'
-             b'9xxVh5ikwJEtIjwHSj33WfRhoVgPzxyEDKQtI6asJ0wkKGCf7n3YLmovgTb5lstl1fezzErrJR1J'
-             b'Y7HzIhEsoiWsi+9lgwIF1g8RHHrfrI1ZPgi9RI988xts3K3729r1a+nOd76L9l97ldTzWh3KBm8Y'
-             b'oyla66KYeRodGc9U5WX6sNDUU2eMi0OjVEL6sZNSxZ0nJI+QCjVdF706Ow0AMt0mgz5SzQVE3j2J'
-             b'qECUiQH2iM56CoIOaHsuYgyDbCayzHbqBJSwJFeF05yl0oiLApsMYoVSxBGqRMFu/ULLjknYN4BR'
-             b'xm3oUEivRJKoWK02YeP6MC0oHKZeY1lnakkU1mg5Z8U5DrfeehtdefU19PRTz9KLLzzvouVVrmVG'
-             b'gfSG8TH7Bu+slYKypnKfa7Beq5FMn0KgzaLNGpyuIK594WO/92+vOnj7jg9+6Ad/yd2bA6XaAUj9'
-             b'HS+mqkGfOX3y1q994TP/4uhzT90TushpSBlYYmjRVJqy5xmqkoNVIoNVvTZWETCi5JxpyOnoAkEs'
-             b'aZLNRVN9g6KMOfdFYKupCDFQwhUP+wgQpH8LdFxCNiVVKeMZF0NBjg9NR0cYVdB+5qkn3AP/FG3b'
-             b'vZcO3Ho7HTh4Gxs727PUdftHHceoYgEACmk6pPdQyyg4Lx5GJuE6VMjU3lQH6KVKL0SqFOkb1HiK'
-             b'zsihwRXHWXCfB4ggMkKdB6fFEROztVzkwX1QxBEYp5RCOVHsEwYc3jc0DXFMqF0h9djRfh1Sdheu'
-             b'VaEmzLKyu4ZgACI65r4iZ/ygyI0G46Qbs4I8+pwkfWWyYX4cZWAw8bAAIJqLYcBjRF+lKqfdAKow'
-             b'3N12zOkuGDlEen6ScKVcoJe+/SQ99+xTNDZUo0OHDtGth26noeoQg6SQ9MKcoemuNdJk37r/YRcx'
-             b'XCZnIKnV7rFTlKY2U3avDo1RZXSMXZqhkgP+zjKfY1ovSO+Yi4pHORnQZsZg6oCs1+5y5A7iQxx3'
-             b'BCAQKcbiwnDbAa43mmyh2cdpgJBJGQFqgy7KScDA5PcWOC2NiKfgwAv1J9T6uCZlCuK0aUqb18ut'
-             b'cez2Gwai2M59YUZ6ylBzxH3in4ZiZdSdT8OBeoujdm4kthGt1jtu3Wv0jne8i6674Xp66onH6egr'
-             b'rzAppKrNxz0euOndtpDX13rKkWok+gYP6Q1UhQtOnyZ8b9jYcmP8cBTT4Sce+JmkU9/+wx/+x//Y'
-             b'ncO5/mzL4DUAqf9/MnuYU+M886XFxSse/Mpf/8pTD9/3E2l9sTbqogdbMPzwFbQ4LKkznc+DKCYV'
-             b'urZWezJAsenrZgvoz6mqWIsaq6T+dDCeZyjlbbhSc0htLvrqgy7+OWfuWQW+wOZDXzkFaYn61ZC4'
-             b'JdiEuT6b+7dWqzCYTp96lc6cOEoPff1LdP0tt9PB2++gkXVT1Oo1nQGvMKWYWYqoeXPKTMEJdHIl'
-             b'IbAsTxfzqgocwYDkJ7P1Ao5EWvhbtSpF+G6HgQp9MdIjlHAdCSCGSA0OgYHqQmyVAh5z2gwHi/4s'
-             b'bh6FUeOaUJt7pniOVoRoqcmGCNsHCQJePVJ6cEBS9OkYKaTz/tsdTlVhf0yOKBW4fsQkCivqFEiJ'
-             b'NVaWeP+o5zDhAL1ADrQQRaHm0ukkDHQ99zum7qchpyVFPDaltovkrrp6P91zzz00tXkzpylRaxNn'
-             b'QacBq9o37jU0uz74zQdpZKTmAKrNdUBOa7EoLFQhihz5tVZWmKkIdQjuXXLnUV9YpUuXLtPly5do'
-             b'9tJFdz6rzHoEiCM9y0w81Im0x4pLc6ipohEdPWXOWUAqdHh0hGrueqE2OTQ2QeMTkzQ5sYbTqGB8'
-             b'ChC4wIxvpditf4FreKj7oL7IEVkqtVgGKDRG6/2PemOi92avJ+xKFpi18jwhvRm6+46bg6E5aL1b'
-             b'VmBZqE6vQUPD4/Tue99P1994Mz395GN0/MgRhI4UcG3TZil37xz6VJ+PsmRoY060kGcm4T5GrDV6'
-             b'8gBgNRcZHnvm8bt/b3HlCz/83/6jn1y7ZfsLLXcP+/rj4PX/YF8bcyffrCUjriG0WLzScJ9O0z0U'
-             b'uC9L7nbsBe6hrQxTc+6S81grTBe2QZENVbexwrUKP0gO3uyxw6/81P1f+Mw/n79watuYM9yG1RBi'
-             b'7jdBwRcPYKjMvMBPRDVeA82oOrRVFW+bjbOgUEd194nnie5coPUPEVoNPWXcM8lT6hswpxTu1NeS'
-             b'pJmWNfh8X5WVia94X5KKEbAmJ0ygeoDjhyFidWutk/FgPlX95qZOt796s+OM0lp669330m3vuMtF'
-             b'QSPUdV4sCAeoyTC8wkgjvYeCOiLMQOt4BRex1OvS+Jl0JXWZitAq09WhUgClAwUNbpQlHXsBMkMk'
-             b'xxczEAXynl4spATQplHHcF47UoUdTuUNMcMvjIQxKJwQ7adqtTjawjHEWohnij2z+GJWbKjUai66'
-             b'6IjPDcBDdOW2D48fURPUFqx6+LgeUFVIU+nPwjqAPs09Xu78O0hXhtJ83e3GXDPB+223SUFnhSLb'
-             b'016lnnoaAmAAHBhxpALh71fdPv/ik5+kJx59mMbGRujHPvxTtG3nLgd0bQYWNCCjV6rA96S7Du48'
-             b'zp49S8eOHqUzZ07RwvwMg2+P+8Oknw61Mquzs1K9t2IrShy+YCqTl+U64Dhw35Om+3AfIS067NZr'
-             b'ZHSUe+Mm122kbdt20NpNU1QdGaOa+8Lt3Gy1GahwrojgCoFITQk7PBHHTKl1cE54UCNSf2nP5wKk'
-             b'jqmtB71W3R2nAIYfvYJ7I42FUolrgQju5KuH6aEHv+HAecatfUUHNvrpzfqspHL+VnPmNjXZ342C'
-             b'VuoLVRy9JcwIxPk0oYoxsfbih3/2F39u554rP3v6xAmaGB/nDEC5Nszp6Wq5zE4AHCjcc7ElVccf'
-             b'gNQApP4rQAqe+9LS4rr7v/LXv/HUg1/76ZpBD0fIRV3WjfMcOZMPbeNUBXlRVR3CR5TNuxE1CcrH'
-             b'jhud4vpdaT322nhSq8nTf+rTxTp8EHRoPCRch8KAOTRGKmsJoImG1lDTjgKgoersycMPMkLbgUGC'
-             b'XiGWqemx0UBqBbUXSV1ZGanAjClpEoWBh7FxwQFt3rGHDt31HtpzzQ2UwPAgouLhdzK8TidrULEQ'
-             b'sGGUJuM+Q2BEfqfblHk+Et3EkurBCIwo0gGEQrqI+L1N/kys7C+k1IpMBRcadRtGENqGbi0Y7IoF'
-             b'Yf0FQoLgPiUVZpU0aappOBxXVwgE7ntEdahrwXiBtg6QCHU8CA6cyRRwVrRpFuvH9SY4DIno6uFn'
-             b'lkdCpBdKijLhHqwSq38jyuQ6UGvJ3XdLfZGvqCoAABGpIpJH2qzowOTCmbP027/1m5zmKleKdO8H'
-             b'PkTXH7ydFTRg0LHNortP52Zn6aUXX6IXnnuOLk5f5HRlpSQRFYsZUzaeqk9cWFrI0/5BldkYeZ2o'
-             b'ayXSkvpnoPOfjGgL8r3FFS6OgHCvlN3arduwiXbs2k079u5zALaVRsYnmXzSATFD53h51Y4gjZVA'
-             b'YXRciuW6I/bF9ztAgeuaiaphuGuAZmAbZ0LFPmuQ6kRiPGtIq8Zxmx791rfouWeeY6cB4MxOW5Jo'
-             b'QUxrvPzcGElLe0KKFfakcHKT7D6QWlvMEVoHSvlRrfWeH/7wz2/ZsvUPR0ZGmEk4AKkBSP2tglTS'
-             b'bnAa7cSxw+/52uc//a9nTx+/dqTiPH3blXlCVhsgdfCayRhxWmvyUZKxmc5Y4CMhnTGUg1SiEYtX'
-             b'IrcaEWnKA82WYL0BGPFwuogAquDV4WFWA5+cmKDR8QkaHhpho1pzDwPqKngw0PQqygEFpuAK5VZq'
-             b'T15VoN2TXiAWfE2kbgMFhpXlZWqsrNDK0gLNz16m1ZUl/h5RieicBbwP0M+DYo2uOnAz3XH3e2ly'
-             b'6gpqOhsFKRwmURgxyjB2ADmZEyXpGwBNu9ViDzzt9rLh8wEAJBKpJB4XTsQpHB5xEXrxXBmOmLJo'
-             b'qejIwVCAVs0Ms0RUI8DSQ5oN5wvg5SbbnqTZ0IMF6SIuyOsQRNKmW99rxvR40Oe7QszAdnEOuA49'
-             b'0NVZgiqSegzXJCNO6fE5aSOpMMqEycnv4ebVhOn3OGaCxJEDKURUXIMhowguzaXYF8aO9BzI1BxY'
-             b'fepP/pQee8RFUWikdYvz7vd8kG667Q6+N6uVEl2ePkdPPPE4vfj8C7SyssrgWEY9xnjihSrPKz07'
-             b'DCjvr9IpuVz/sSbru7M5bUPkiLyB9uOc+kVw1dkKVQ8SvXEsKoyI3a3hsIuoNm7eQrv37KMd6LFb'
-             b't14AKjX8noSVN8TZYyeANf5EZ5DV8bV5gmeGcXO56PghKgVRxfc9caSkbFBPigDIlNy99dq5c/TA'
-             b'N75B586fk+ufUNYzJYM0Qz6G/qGcebObyX5vtX7Fyu88XwtM1ICaaaF38O3v/pV73vfB38Y1LFZq'
-             b'A5Aa1KT+NoDNcP/N3OL8pge+8sVfe+Zb9/1M2G0XxtHAkvZ0LLoSG1R1NfBFHq0vZRTzbGy6V44g'
-             b'9thFVMKqKreQE6RZNtEHEw9qj1OMeBShDTc8NknrN2ykzVs209SWrbRm7VpOQwGMOB2niuA8Lls9'
-             b'cTzQNgj8MA1J26BekmgvU9Eyo6tYkcmrAN2KA7NhlkQ1tLVUdQ9RS+tHiLaatDx/ieYuv0aXpi/Q'
-             b'2ZMnaPbiJU6r9eoL9PwTD9KZ00fp7fd8kK677R1CUlDdPwYOt11EIjgf1IEQMYH9VYQ6O+v29Vjj'
-             b'D6mZXlsiIT5wNPri/aUKA1a32WaSBYAPqSr8TYxmykYgSUVYF+kXnBPLKyVSZ6oND0nvlfZcsV4c'
-             b'+p4KUquKWUNO2wYSqUGhlSDtScqJjXwgskPYDqLT1Mq17EEUuFjOqpgx71tSSBEDWJcj1GK5yoYU'
-             b'RAquaUQS8XVb+YiQTFsuk62S+wq9VxfOn6fDLx/mSEyEUQNqNZo0MlSmxfkF+ubD36AnHUCtrizz'
-             b'eQ3zMMOMwiZOk/UjJEVmK7VGGZ4FiXC9FqRSbfywRUN5M3k26lIdKlGIpKyhONXGc1HCII4yAtbX'
-             b'Cyl2EePJVxboyAvPMoV/06Yp2rf/Stq1ey8DFlK/cCQSNu5VglsJdiDuEawVIjVmMULqAsY+tSqg'
-             b'HIqKRtLhdGyiEZoyI1SRHUopKW3aOEU/8mM/So8/9ig9/vjjnHqOTEnU6iULT16tgleCFdjD1820'
-             b'kv+lmsoXUEV2Q1KoceGJr//Vv3cOy/57P/iDv+wcknoymPsxiKT+30RSoOYaZ0xfeOrJH/3Kpz/5'
-             b'P6xcOrcLishCAoq5kE2qW8apDWbeJVLbSUUZwPTNufEd64Gyhnz05I8NlG8fkXhFBxhveFWYm7Rl'
-             b'+3b3tYO2TG2lcRcpIfUIgoC8j+MNHo8uyhSBaPxZeZCYd1GIpMisBibwwrL+OJCzx+DAUPp+oDAt'
-             b'taou98+QLWQj0GEoQJFG7aDTWCbTc9GUizyXF2bp3JnT9OqRw/Taa6/Rcr1ORRfNffAH/xs6cOhO'
-             b'XmOhEMuwQJAJAL6Rn9wLA8y9OTF7oDhmrh8F0oRrI2F5pR1RdMA2UEvoMSEh4rRgGErqBefNIIb0'
-             b'nhpvARxJuEo6hzLDn+hVwb5AqkBtitl73IAkqSQAJjciI7UHGSB3/wBcUSeEdwzZJAjXcvrMSi2Q'
-             b'mWvu83Ai2q06U+RT68d7GAZAke3rsiHFj1BnsK0Vitur6sCQ1l5IU54FB9Il7kf60uf/ih588AHe'
-             b'f7UidO+bbr6Jtm3bTg8/9CBNT0/zGlnNd6nmug4czmnWhnvoUq+6RTb0k4mDnEwQkJ9pkk0OFn8s'
-             b'UbFjm6WlpT6qI1o4FZi1lMs9jpR2qE+IkUgFDhpklFrtLnV6Hab+79q9k66+8mravXcf17bQi2dZ'
-             b'hV7YnVjjVOdXpZokDykr0vL+u81VTuNxyhppONv3/KmCfRDAUYFuYOTu4TP05S9/1UVVF7kdwXDk'
-             b'G6osmHc+Q1VhsXlmVNPQ+JtXUTc6FZiUUbvc6tKeGw994c57/8GHN23dtjzmzilhXcJBJDUAqf8C'
-             b'kJoYH6NWq1H+8uc+/c8f/uvP/HrZ9ky1FGaaaYhskkRSIajNqGPGDysrRvMkVRlpIKMknPHS8RUm'
-             b'y3OnWUuTMb40pMrP7n0jDoj27NlDu/fspa3bdnD6znBTq9R3NJnIv+NZQngg5clXpfGqNFdCRYCV'
-             b'rsUIJDqGAiAsdZ5E6eiWU4iRn/YN7To+tx5r2HV76EMqcW2FQhF15QI0QK21Ss3leSo7LKs6IAfI'
-             b'LMzO0Nnzp+no0SM0O7dI7/+hH6NNu652wFPlYwEA4wtTdMEgMzwKA42aXaF39zpsEQAanXaX62sG'
-             b'0jxay4HUEs9iIvldgY/JOHARhQc07rYgqVQtyygIt49yddhtywEFVLi7MQOPnzeE2lbKTa1tVifg'
-             b'niYmY4RslGGkseyoRcFoITLEuuA4Ax1VYawnGqCuKCoaUVTW2ooosDO5AnVOKKJbIaKgroKIwkcm'
-             b'PJ7dHXvCwqqxTilWYkwqn8d498biMv3H3/nfqNGoM8sR4rOIprdv20qvnT8nKhLMOgw4CE2zMeuB'
-             b'pMj8jUdWQSphcOXaTSCEEunBCrKuIP5k1ngXKlSl2ZRg61shLOVjM4w8D8b4oYQ68Vnp5oEfTkiS'
-             b'CmUQ59EmiJo7DPRrJsZo797ddMPNN9KGLVvdNRxy56c0cZ2RhvsBqcSQI2dNSXL7QZf7u7L9piot'
-             b'pdkMRI/FYsD9WtgXHAkMpXzggYfp+edeYEkoOCWcWExJp0EHearU14r7lFwCVXwxOl2Aa2WJ9NYt'
-             b'N2Nau+PKr/7EP/nln9y6/YrLUH0fgNQApP4GIFWmyBmxtL5Ei3Oz133+k3/0m8efe+KuSpiwZwsP'
-             b'HVI4rPKdSv0GSs6gD1v1Iklz815oSDxLaVDMupVgFxKbebG4kZG2QF/IkPO2t+/YQVdecy3t2LOb'
-             b'xsZG+RlCh37CskGqvWZkVDixOrrIzEBPDRNcCxgp7x56aLEh3cVac7FI98BLjRSYWCpImzwDbtLs'
-             b'kbp7TKFng+OOyZ21pM+MA6TKCPeXAMAMR5GhTPXl6C+l5tIsxa1lfsgDZ5RKDtjhvV6avkgtt3ZT'
-             b'W3ZRGlWoMjrJkR6in059mes1GOPQRR8Oe/kpS+nA005YIqnMxXCmQBsZ416pjfFIB/S5wGijHgTQ'
-             b'6DGFXORu2FPnuUyxJqdCBmHUNZD5hnwRmm2TjmjAwXPvdprqNBT4HEEgwT4YCF1EAh0/RAbFSlnp'
-             b'6kIkEMWHlMEbkRSrSxipNcntEAu7Ew3PSpwQJyUSr5+dhtDfqGTd+UBJgVNZPpIxfgyLoeHhYXru'
-             b'ySfp85/7NFPd6ysNZtLhnCYnxnm6bUACMnBBUMMj3b7veTM6/JLvWE1VZRTrQCMulcg3r2v/NllD'
-             b'uh+WmLUyGI2kUps1GftPpL7vj1mqMadQ2cnwAzqtzBnj9/rIWtOquP4QzkX/2hW7dtAtt91Oe6+8'
-             b'yt0Hw1zzia3VKD1QZRfDqTxJ78m+fF8VABl1Vj+KPtDrw+loXMM4ZRBH9PXyy684sHqAmZJQrrdp'
-             b'otJKYd8QzyDX0CQ/1iYQ5RiNLnH8yBqI6kVErZ6hyR1XPvVTv/CrP7F+09SxZrM+AKkBSP3fgZTz'
-             b'mt0DXRtdQ99+6L4f/etP/tFvxUuX11cjbskV78/6VLZXEafsRiQ/U0kLqMIK0/HnrDMnzwPSU6R6'
-             b'bUZHObTcwzPqIrfrr72WbrvtVlq/YQOnLWIV3oSXmXICywiBAtFDGHGuPSii90RmHxkt9oehRgRG'
-             b'NOuoL8UCQViuKYH1hhoMacE/zqnfiJ5iZo2V2HgCdNqrS2yIUT/iQ+A0i+WUGEABQrqg3qOTvz73'
-             b'GtekIvb+pZiMyAcEEYAt5jOF5SGqjq+jHkZXGOmZ6nE0JJR4FmwNC9JE2m1z5CWYLjOyKBUNNlgV'
-             b'pHxiVS2IY8uOQ4DGUJ7llI8r4bEWsaRm8B5RRkjU7ErNRZiBYthsKIMTkYYLlILP15Qn9wrtmgcE'
-             b'JlKzQsTJ90PoFei9ce1KJJGqXqBzFtCUzI6CygTx7Chlk/F95Yxp0lhxANnU0eta31EjD0AZcmv/'
-             b'55/4OB058jI7SosLSy7aHtbJzhDcbcrnNIJPMzYe5ak64zUepE6TtzpQThBQYMxU91Upw/jRl8ri'
-             b'y4VtLWUNd0gTU6IcikzOpC/xJwCYGjkvZCcyIPY9hAxiaebwIQUNUhPWfmrzRrr+xoN0wy23UnV0'
-             b'jFshrI6YEcSQcfaoH1srE4LhZMEBYvBISJ5vrrtqSwaeTWUEwjnDfKuFhTm677776dSpM5w9IE3h'
-             b'AaBDBqs0T4dQPnstm/BmVFnG6mgbHXJZ7yY0PLXz+Z/+xV//0NpNG042lpcHIIW79p/96i+8aUEK'
-             b'Roj11qCrVq2xYcTTUmL164S++ZUv/Pdf/NM/+O1id3W4FEnDoZAiZKqr9OEEHLnwTWpM1uTqb8hc'
-             b'VVlSb1YZfqSD9zhFpfWmdevX0Z3vvIve/7730oEbrmcDBiCJY1HoTh1AQSwmgWoCBtANj1HkohkI'
-             b'bJaGxpxnpkbZGWqkv7j3B30iAB0wxpA6jDHaIOVaBcgH4vlJUytGa4DdFHPhvsgF80BVCpCqwn+x'
-             b'j2QcsMXdJhtQpKN4HRj4upkOIQxIoViWNBoUuY0wqTilmIg0FNdqXLRCiaSioEIAvGbiQCwgwSPK'
-             b'4dEmQmEOSBpHmVqs4rA8cI9d1UDTlm4bUHTQ+pGnHRRYBVvWNHKRENYIwMO2xaYalY1IlIrG2FJZ'
-             b'U6C9DFRIp+kyk1CBAs2piH4L7l9xPFTGCYCF3igrx+5DDr4FuOGzK1rwXuwX92AivXAmMPl4ZCg+'
-             b'IKLSH63WA7k52p075ic9/NDDImwL4wuRXAgYu7+hF4c1A8kr6weqwhFmjd75XClPetAwwOtGapTk'
-             b'5ZuMKhz7KfO5+pbN6ep9cRY/M1lXuUZjfkqGklGMPg/MyAskIxBoT5MM1JTtBArmAEE/egXpt5YD'
-             b'4mOHj9Crhw+zZNOGDWtFyDdJM91LITJo7xMAi5t90/xRTa3eYzLSw1DflGYrdU+Mgbnqyn3cs3fu'
-             b'/AV2IgtBmA0aZZUYk3/xZOr+tniNuEzgy8Apn1fZOYLLi7MbXnjhxdv3XXv9t0ZGR+dQ83yzz6ca'
-             b'gFQ/SKGfBo2i7dbk5z75sd95+It/8YsjoYMGE8tj28e+ySVSSL0s7ZOgfLptdiPyQxhlUjvkx6jr'
-             b'WAfo373r3e+i977/vbRn9y6uXbW70vSJ1AU01mxQIuOMKsYpFIZGKSoPszFlEgPn+A0/mEhD8gh2'
-             b'GHsWAxWggXEOtV8rYgUGSVlybw/P9SmKZhtTqmXeDxhwPPwPQp+gQScyIgcEBq4buMiT4rbMFULK'
-             b'jHt2CtTppVJnabV4vhHYezyoDsQDrbFIAT3l3hUYjsRdB4BOqTbE59OFRl61KtGMCn8idYmHOe52'
-             b'yVcyWNcPxAo9pyL3OCWq+h0yoQOAITqFQlmG8RGAsZz2kflCws7kgRC9jtaTMAG4o4V+ta1I73Ck'
-             b'abhmZ2zifWFJ2TFLPdE0r+X6F6f1DGUN2hzDWOXPZbqJlE1CyZRDlC3I+nNdWef8/g0yXUD0PF1w'
-             b'xvKZp58StXE0mHMfnwyCrNfrkkILTDZ/yk8hs55lygeRZEQ/Tl+RZ/0JYZyy6E3TV/l424yIIqnA'
-             b'QIdjBkrc0X6K79JYNRoZGQ+Ltl+sNdB0ocmV+n0rh/UOoVeEoCyTAeel3WjRKy89T6dPHKdarUzr'
-             b'168XpXUepkjS/A6SEUgscawig1aus14jORerPxt9xmV+GK47yBWoEWP8y7mz50SEOCvg5tdQWkus'
-             b'HwOnI0lsLolkRJVE6RdMf1+Zu7Tp8JEj77hi75WPjI5PznDacpDuG6T7Jtaso9XVZVqYn93xxU99'
-             b'7E9OfOexQ+PVMvdYGGUxWT9ZXR9gm+YNuYgSsqyCyZt1+7N/nqKOGTpdBwKQi7nxppvppoM3O6Aa'
-             b'pVa7qTON3PYjKcxiKmqpMkwBakro5/EzmKyMtBAVZ2IV54ik5tJTA53wYDniyAmMrkRp3DCo7W5M'
-             b'NecRppx+MqynxkP7QKsOrLDSoJyA9FLSzZ6wGFI16EfiwVANai5dVnkX8fYAJKGL7hL1tlFDqqL3'
-             b'qLFMjbkLXNOi1EcUqUoKajEe+0ZUOLKW62kJj5mXbeO4RQ5HajAAJZBDUlYeTznNFgWimh5k9T5l'
-             b'UBph97GIrfX1EOJjCygfdJeNbTc+5RXw6AdREwg0AEgl3URaY/ApKuuNv6pmZ/UIy5522KeiHVBe'
-             b'p7RqnEONmlKbZsMo/YgHgx615go3pLK+u0rziPh9SrVymb765S/TU48/yilWbH9leYWZaJE2Ksso'
-             b'EBVENZn6q4Cgdxoy2eKcVp51W7OhTkRpJAuxbMbC9Mrg2TY8eISSQpOG9pAyyoWCFqY6WxWQNApG'
-             b'Ng83FDBt/+jBbJ9WwSNQB9HqNeGYDRJbrO4R076rrqW33flu2rBpitUsYiukENTJ0nZHhlpapa3r'
-             b'ZAGPzxL9elq+NDFnPY+BZQfu1OmzdP8D36TlpVWup8oIF66CZveUNOmbnPDi7wRDWSrYWN/bZWm5'
-             b'HdPQlr0v/cwv/bN7xsbGX+Oanc1B3tCbR/dvEElpJDU0uYZOHzty4x//+3/3lzMnXrqpWjCSxkKK'
-             b'LlCqrs3HT/ODZXLqbaadpx6myWY2SdMiy90YGVNeGx2ld9zpIqcPvN89QFfyZ6TvyT06iFAiRE1V'
-             b'CssjVB2bdJbfgQlAB+QDUKETw30wUnvShsieePFcE2Kds9zwII2GWk1HJ9hyo6x7D/apms4cYYDl'
-             b'BiIAzg3SP51YelG4mZdTdxXeT6AsQV1ETv0FCtdgLCFygdpBIUSasMNgxPWaXov7qXzUYLRWYTIv'
-             b'X5hXiCStr8+QjBuXCCjRWlnKDb3MjuIaX05oRlNkzOKspi/mzY0OZG2s9dOAxLgWWfrIyEgLvX6B'
-             b'b5z2kGHSvloC5ZGObycyffRtkhSPxyrP+DJ9UYtneLGhDvuimSwSlwiCDR4MFKK3NKFcW1wltnD5'
-             b'ewk9+vBD1IBChQoUs7pFKMoRVmeOGX9MPirwoZtPTWmNREbDKFQE+UkaNf6kavTaJKRTLBRUA8rr'
-             b'LK+bMSOpWMl4ekcr6Ashg740eZ4WoyxJaF6nOE6+bcOYvLXDSlwWhvI8RqqCP/3aNGTLqFQIaMuW'
-             b'KZlqjQZ4ZbJ6ckguGmvzQEdZlqYvSOLJlCIDw8C/ft162rFzB2sdLi8tct0K25FrESipwkfH/l4N'
-             b'MjUPr6xufF0UKWd3Ty7NL6w/fOTY1dccuOFL1XKlHZBPffZFkG+CrwFIOZCq1mp04ujR9330N//n'
-             b'P+8tXLyiWoqo0WxwikBm53jh1TR/eIy/pZN8PIIOGWQGUqoNs6ps3mi5CMTdvLfc/jb6wPd/iHbu'
-             b'2c1eFNdwSKKIBMMAMRW1NkTF2ogDqqIYzUBlagIhS0TKNAP1ncI89YP3If0DDxKsMjQeMykDE05V'
-             b'RDT1VFuwlRBm4cEwvi4Ws7wOUmE4J2lkLZJv6gzVCIsbL8auxMMHW87b76lgaMo1kcsXTtOTjz1C'
-             b'u3Zs43QVkwJcRBZj5IUCY9bpn3nnCVNCuBG3MiSyOoEAnSWvVCC9Xew2pFrXgnqGyhdBv43Hkmvf'
-             b'U5pNFabXPdgyjVWiEaRFrc3HnmQpW6VWS+OzpG28MxKYPqOlvWh8/XWbeT3CZGmybHRK0BclmT6f'
-             b'OJtmrhsPAq2TSDrUN/BKg63Q27Guc3Oz9Pijj7BRBDvR8pylAqdc0wx4AmaiGp+6kxBHroJff+NZ'
-             b'qWlm/D3jTfqNAj1vk8kimSCPDszrpkEbBSkP1BK/+viRr2Mqac80kHs4lxeyr1sQn3LLlD5S01cr'
-             b'6ickyD4TJVYkOpLesCJIh15+8QWanbnIlPyh4WHR1ktjZdam+QxROEmBycg5xmdHAnEoItb7k3pe'
-             b'EkuKEPJGe/bsoqXlJZq5fFmISNa7OKmk/PrOyqimpo4jzkAXaWK0QyA1D4BdnJ/deWH64v7d+6/5'
-             b'ysSaNR2UI+B8dED+8Nf7Df71pgYpbrh0N8LTTz7+Yx//jx/5I2ouTFQK8rAUi9Icm+uSiZhnEPiq'
-             b'gmb0Ta6d57vPg4wqK3UKTJzde/W19L4f+EFWXEatiUcnaFoOTcIYoV6oDvO/IcAEERB+bw03t/LD'
-             b'CIFT7f9gSjN6NdAnE4rWHG5waPMZbX5n2SAtRPND597DzDew8lIlgajILZQTWEfOiiQLKQ2Zxwfx'
-             b'uHSkD1viQEKSqBsLcEWizNBtNZRBLx7kwtwM/dEf/j6tGR+irVs2a9NrQD0HUsSD7LICjEQhZLMU'
-             b'k4iDYrzFiDzIGnF5I8LFb5v7n+wRq2HinhWbZCNKfKOyMbnBzTFLGFsyakvo0SxP5DmbNpvMkNVm'
-             b'shSd9+9NbnQynoMHG5Wwymo3gR+LYhUYfK8RZVGMzUYmi7I4Sy9x7aSbzwFTkOVGamcMDx8+TEcP'
-             b'v6ypvryWRRl4+IOKsqjQUt9Msr4zy9J9fTWkXMqr7x1B4N+ZpeTE4aFcSl9jqpxBaDPGYpaR8GCT'
-             b'SQmlZOj1wG09GPlmc40ic8YcZYBI2kJhsjYQ5SbGogoyM3OJjr5ymMYcqGzYuJ5rwqIlKG0KpO0U'
-             b'zOrTGq61fmCkjwpTnRac8LVE2h/3N2SsUKdqtpp0/tw5cSJ8bYqDTS/2rHFpIH2Tpq95PVAyiJL4'
-             b'+bm7cPbsvoWV+vabb3/bl0xUwARQ53R2B+m+N/yJh+IVPvrNb/z0p//4o78f9RrVYqjeNqdCgj6q'
-             b'rHifxviUSchVBmtNFkX5XoxAqusMgM12h8bXrKF7PvABuuPOd7qIbYQajQ5rkFlFkqDkoiYHTgxQ'
-             b'UYmVwhHhcfd8T6ipiOhSnVrKLLFEaMQyoyrmIjD2ifQGj832IGq0JysV9p2omBdkGmzSlW77goCM'
-             b'yTQAkNYLeeCeaMdZWavQU3kdaMVCL+Y+E1aFwGC+poA4gyvRhfNn6flnn6GF2Yu0e9dOJm7wKAow'
-             b'+bo9re1lo2Kzuh2vNKJE9Agj7anTXDmiCY3W9dSkGjVY1rO2VKamT1vv9ZGTzSIXb5QZxLVuSCYP'
-             b'JqwvclvSPhifJvQ1ED10pUj7eqS1fdUT2zfeQdfOKCMvq/n09dJYr3zgoz5fbU81LU0209UTaAt4'
-             b'ntV33Dpfnr7QR4fuK4T21S6M3hOW+nIptu+e7xs74YkdWijTc82bUyl9/RAXyitpuus07xvyz5JI'
-             b'zOv7bQY8HqytyaaX6Xwmk42TydJi2eDPfN0CT/XOorj+lKZR/b5Q0n9ujSAwfOzoYaqvLtMV27ez'
-             b'zBLaOzhroqxF4xuQOTeYKJ08yEBSyqpZcleeB1V937ljF6uUnDt3nls3pGTgE8x9ijNKUPGtAORV'
-             b'2gMBzETXEm0iZ8+cvKbd7QVX7Nr5IAge8Zto0G/0ZirAeT8QhqlQiAqf/fM//Vdf/YtP/GotSkPk'
-             b'q/0MJ+9h+6fCBvkjiG59iabSDMRsX6qBU4ho6nQ33823H6K3veNOFxEMuwejw8V9njcKj7pQZLoy'
-             b'l1nQ5BnLCHnDTDlJVYU8NkMahXnUuw71A4C1QTVGPSUUHTMmSiQJpxngjfU6mM+DOlCHU3LN+grn'
-             b'ypHuwziJiN/v9unACDOZ+EFisVJQ3GWN4k7Ix8xzlAIBsJCp6xGfXwzPHEX9uKsqA2LIYPbnZmb4'
-             b'3+X5JfrWgw/QB1wUmXZI0zCxgr6XkjFZPcIXw1lFuifjMQLtnWIv1HqGmuVrkXrFApPHA95bNX1k'
-             b'AN+uk4GcSfNyiZ9tohpsps82+/QYs/1SqRF5DTofIdg+unVAubadb4zO6kzURzlWUnyY0dwsdz+F'
-             b'1g/YEyUSJgQoDZ89e1aPF+sJZwPppoW5WVEzMTarQ/qm2jxiMXnrrY5X8esj4JNokV8koaz2Kslx'
-             b'aj8Wpwn7q0Ie4DxI67UM+skAei4mUOBLKRd10ifSan9h3zRoAfag79k12QTe/nSI1fSk+ABBptSU'
-             b'ReqZogvJuA8mV0gK+7FHH6NLly7Re9/7fhoZHac2HDzV32PNlVTcNkx9loy3zRqL5VDDTBaJ1WPC'
-             b'vGx4153v4n7BZ599ltcHqfAgkSGKZPtLByqXlvo0p47Q0WchVQWM0WJA93/24782VInOv+uDP/B7'
-             b'JjEZEcv0X483IkiVMRjszQJSbOhg0G34qT/8/Y88+PlP/mwZw9bQ5W/zqbQms2qa9sjYRerlqrqy'
-             b'eEH6KLOH7KInd6NPTq6nu9/3frpi937u7G822tmQQ3hzUBkwzsNCjSBQ2mrQp+tnTMyD8SxTUxNu'
-             b'VgxUlw/RV5tHPhQlqtIHPtQG2ZQ74LvSRd+IuXGxXY95nk63FWvjoC9aS+ti5GVbmKSocMNUZtwh'
-             b'EQkLHGk8CLimbMhRgwGhgSntUOiwwnyKhNNEc3PzXMOCJ3n4pZfp5htvoi07dkpfFSkxIeu56XfM'
-             b'vXxNTJ1Wg8qs1q5jMhIlCqTUN5HYZhI9r7vWvh6gacI0C5coi3r8HC3qY+PRdwGOeO1pVrPKxVO9'
-             b'ocq9+4ycocrmcquknP70hs1vPlRmHPlx6DBf/ng0opCfjWjTQZoJ6SXKj0F60aBIv6TrkmRxSO5o'
-             b'e3HTfN9+dIaxfpps4C27GvcgM6CyhUCNqgKXMl2zi6eEAA8QWZoxmx6d81c4YEtsFjX1cfmy+pMH'
-             b'9MBm83Ap48qaPnKD7b9cJiewkEwHTj1bLmv2CnIRaLdA1cownTp1lj7xiT+he9/7Ptp6xU4ephlo'
-             b'5Mt14jTfR0AeRPMaZ+ZkBRkPnuuAYPDe8fa308TkJD3yrYe5uTviGVakNWBZr9T6NLfOq9Ko1Ke5'
-             b'fYSNYxoK0+BLf/Hxj6zbvG32wG2HPtvGcM43Ac8vMm+iEcaG5Xls8KmP/d7/ct+nP/6zE5WQdeJ6'
-             b'zvhV0OSpxWir/TKkN5E0kOc5eRmngXHnoRAnAhkbgdk3B268ld561100MjLOpAjx3mRcNhVlvLxR'
-             b'ABB6cl4UzormoTQ+Wq6RkEjDpEJjdTDnDH+Ft80zk3j4X8ijslG3sDooEM2qDKF+MJ17Ooo6AZfr'
-             b'JO6Yi0YETdGrhFQaRyZawwmZzp0I28gIQYTHhHMflaQILXqfuCG1rUaF2NMHBR6Gk1mFhYh7pDA6'
-             b'4kd37nSRQqJzd8KMsZzRn/VeDD1F3D3YUJgooafJkxC8h+yjJR/ZkKTlAhNkqa4kSyNmpjtzNcRA'
-             b'kAB24llvxuunZr0sMhk3B89APXLpfcsJEfIZMeZepxHpH576lOR1yyAzZCkzIPmYQf/nkSAFluDh'
-             b'WiNGr+j+Oa2LdY8koqOeRFNFF9UuLqxQvb4qzaT+ftUhlRKbmddFPeqtMWnBk+H7k2yJ1nOsZ1J6'
-             b'N0gVNvprROJapX2pwjwDKOtr+mpJlJMejPkut0LnTVEONtS3zSyFl7EtbZbGs+ocedD2qvPkmZP9'
-             b'pSQGKxUlY2mvgJuwFxfr9KlPfIre+7576fobrqfGal0mslBOfMkzo8bzNCUtZ3JWI08EtpLKx/3b'
-             b'dtfp6utvYKbsQw/cx04ERIc7vURTucQU/NTo2lpNCfalgkGEApmQm9/xDKe2/Ce/+5HfrQ7Vjl95'
-             b'zYEX260eT6x+I5vxiN7wIKXRkFCugr/8T3/wP9736U/90ppagb36TuqVwCUREXq5nX5qsTdomZeK'
-             b'gqg0pSItVm91mBp+973voRtuuY37kppNUSiAggJ/AZjQmwUjAs28QpgVo9n/TVOtLekcJFI1dU7r'
-             b'GJWCSbmhNu0azqMHoHpb6Lr1WNiU9SxiqVExE42JHgJQcMQRmWCQG9hzq/U6j2GH/hkiNbCfeOKr'
-             b'auXJNkBFL3GP0vBIzQHvKNWGR6k6NOzOt8ZMJ6QDuXsnVeMYQbmiQfMzc1QuiiID6lGvHj9Bp068'
-             b'SlumpuSh5DRWomKtqnWnHnjii8icjuzJmHU4EdwjRK+jkIvhfL3sjH9PYHMAtNRHgOhLi1meP0SZ'
-             b'5xraMOtV8nUrrCuPe0DaNU60PkcaAmmqJ5ud1BO6PYvJRqz1x+lSZVAYnQMmavQ5B9lPbeapv1ma'
-             b'EHWJRGWYZFYWT5NlsofUUABS3XaHCuViVg/L4dT0GX0f9aV9UWOSRYNZAY2PK83iVGFNUpZCTbPk'
-             b'YS6g6gd6sulOdQ5aZtrzIZ7mdYUwXwJLNdIzmXH2tVE/Fdr2KYub182mokxayLMR8xld3tFUxqYx'
-             b'Ko3l037EBCGrES5+97nPfIEQndxy8Db3/DaFGZtNfbRZXczXSA3lpIeA20wkxSkDEYTh23K24apr'
-             b'r2NFjK9/9cvS6oFG91Rkl9LUZvR5nV/K9z/11SbxbHRR93XPA+ZNNRqL6//yjz/6x7/yL//13VFp'
-             b'aBbDI9/IwUbUAtvqjZjagxerjLaVpUUypSI98KUv//r9n/vkr09WS2zgYbmHa4V83LrPiftOeZ30'
-             b'5JWxracgazoEGmNNZ+TXb9pC97z3fbTRGeB6o8U3PSIIiLyyJ2uk/0EMhQxKi+OOMOugtedVB1Lp'
-             b'x0iZlSdisdxAa3psnCJvhBLpS+qlAlpII4SsBh7weAGeseRAZ2V5kZYW5+nSxQs0e3mGVhaWeNpr'
-             b's9HgnikM2IOwpgyUEyMakLcZaNhVkgkiUJ2+iwm3Y2PjNLZ2vTvvKdq6ZQuNja+hSqXMoABK9Myl'
-             b'16hVX2Equp9b1Wt06cixV2n7tm3aU+QZbkZnb/UVx7XRl9cfckCILIGyQZA1WAahDJYMM+UD6zcp'
-             b'IKcOh498czXyQOuSqn2o8QLuk4LKHJlsYJ3cR6lOLoZBAfW4l6iCAK4Hjs0aJbKk3Abgae9sKCOv'
-             b'aZdo1BT8H+y9d7Sd13UfuM/57n394aERIEEUFhAkWMACdpqQSIJFxZIs2ZItyY4nyZpMlhOPxmts'
-             b'x2M7mTWx15rxZGUmzopnHGUmsWyrUYViEXsFCBKsANgJFvT6gIeHV++79ztnzq7nXHr+DgEuywYL'
-             b'iHfffd/9vrP3/u1fyQey7J+IaCmEDkqexZ8tfd7NijUxerlCzT8Xx2h5+jV+4kR2Gy/cK2JZtElU'
-             b'WtuyHqR0OGPSeZtSXEGHtgmiKDpODv38P5+npei7vjKaI7iId1XTZB1DLmDlJGZFSZHEEo4tMb7A'
-             b'xHjnMwQIanILdd5NCbHCJCEAkiUlxBm6cZCoFFIheSw9EzXceNMN5HrfabMzC5RFOdZCcsj3Lf5z'
-             b'GyNy5P4ixMJxczE5NQ3nrF4Dt97egccf/jlJPfCSdGIt5wHrx7IpbUnw8QSP4h66MdigSz/Q2wvH'
-             b'9u266jvf/st/8/V//M//UWpWOjF8cl0pGrOt2U/kD4aJqviQY1szOX4cXtj67D995oGf/c+LB3vT'
-             b'f+RMJHuMhW6qD5BT4gTkVFG2zOHuB88dZLihcPbSyy+DjXd+hnQ9U6n78l4MXQmdq6wbjSJ4pIW0'
-             b'+KRRV9sJ5kxNGqOql5esOFHgAe04M8mh7x7CBRXHQCAUhoQIND7F6HUkJZw4fhQOHzoA+3fvJgrs'
-             b'6PFR8jPDh4KmI6Eme+GW44GLUxpb7xS+1l4mGWjSw85QYGTWXWsGRg9NwaF9e+Ht7a/QVDFvwQJY'
-             b'seocWLlyFZxzznnwwc53qCg3G00hEHiyK/rwvfdg+qYbma0Ysg6JrNS6MsqV8FCbns2TvVCPQbEE'
-             b'pTlvux86NKQIWQSEy953zOz2NmkgnFZJ/pDqmbSxV9IDFbdK9jGie2NrHSEAFFAgssPIFicw7Z9d'
-             b'KSo20KXJqk3kFE0TpgRf0glwYW/j+6i0iAGn84oUgCdy3nkG8cfT6QehVO/zrkiLWIkk0CEevAmL'
-             b'nTReUUz5GCL0DJ2WTMZi/+KgKv7ZZ1dyl4tVlGscxJnda+HzLpMYjAkpE7CO0BJz4UQoHwWW1H1v'
-             b'1CZP6fC6g4oBSt12qUpTGYLS273qtyqO4TA+qzQzPRiWGZrw+GNPQLvVgls23pKubYcaOHb44AkZ'
-             b'TWu9dxlylOeZROWBzwld7TEZK6SJahbWXLSWdpEP3n+/5JdVZvsUlJkYu4k4WSLAy1huRmoY6h2A'
-             b'Hc9v/o0zV5y380tf/+afYCDn3++kTjeQTyAg9H9747Ud/3jT/T/68+EK+15PKbCulFGY0Qs7MHNo'
-             b'YbDeUaGOWtk9NeP1N2+4Ba6/+Ub685TESocghiOyV1t7dpIJDiAqcawSaXICPQwYdCBIjZfEQAJa'
-             b'JCS0MHYiotMATwsVFpUe3KHNQn86/Buumf7MLBw5egT2fPgBvP/uW3D44EHKEYpiHYRwU0/6Xv2S'
-             b'jRQpors2w1Xq9ujv3qjcNA0Ehj9raGWFfMjuA/ine7GQNbhznjp+DF45sB+2vbgVhobnsWs5MqK8'
-             b'U+0qxRyMHjkMe3bthvNXnw/1XHqPrJAFWxdjsXblQlx2arjTa7eoQCMZgyA6z9RsjRGnyVkOTSzm'
-             b'ZOwq5rPO7G2EsCE5W2zLxF9Hk0QIdkDz14pOiSKzHNOOJSqCYx+YEVoTxb9JzYOnjK6O7PrEn7AO'
-             b'socM4q0oQmOJ56AJSYoswYsVF1/U8OFr4XSGLiNEiikYjk5jRtSeSCZtKOnk0uZHI0/ozs7nYhEz'
-             b'Y9H2QzFrwkDhVSFXKAVev6cvjlKyeNKAQYGxo1LBLbE2QGksAS4zKnOibZ3/SJCCg6/lnblS2DNq'
-             b'HpoC7UPsdncXODK4Yh8mBd0KIgqm5X0PDg7B5i2bKY1348bbmSgUedKeo9iY7NKhiQiZEg+2W85i'
-             b'XiY+tKZnYM2ai2Dm1hl46MGH6JkA+gxjJpcoxBmhsKSSqBFydA+0n0ZJwoLBQXj8p9//w9Wrz3vp'
-             b'smuue6g9NfmJpFF8ouPj0TD1lee3/NojP/rrfz9ctdlfIVRUpKI5OmvoAVPAo0zs2QYpB9fxuRig'
-             b't7eZbt5b4dIrLodWqy1aG2d5Tax4d6RNQj0SK/xVsOmKHRcecnOENxOFGMW6GFMxg7ummOYYPkTx'
-             b'MCOmHD5onVnYu+s9ePO11+CD998nK5ZIibFAhcE7L7HlHY51aKOTBUNO1PHRVFBxLJ12wnKIMG/A'
-             b'Fzk4wURDUVho1G3Lg+Ql2whfEll4+KixF6KnKTYozEMR4anAptd+5dXtcP4FaygEMO9OivNPPfAI'
-             b'yulwjILub9AaCfc7oXR+CLQnYqZltJ2RQoKdoOJO3qtUUhyU9eflUAZLkhV2GLluMBxF9cwxBZ18'
-             b'38itwXExxOwrJ8QHieDw3llukBdiB05guMrC2BMXvfy+TGv4883V0qFH1q05dkPQLRMVXfp9jdqQ'
-             b'oEpKHuadThASdiwO0Fy42AhXGY0ExQXZsjoVq2ftkpFG1OlQXRdAnSHqgnzvudFwkoIsvocmDcDi'
-             b'Ks8WG0tkanz2/Ss4fkL178qscr4YjK0S5D2bidxK66RgTiBZNBy7oDvjiao7CTYf6XKi1+XmTc+S'
-             b'Ddidd30G6lbgzw0Kr0IXrUkK0hR4MI/g4n0JjzHdi9OpUF22bh2JcZ94/Ml0GcV9PshOimyYXLal'
-             b'KhsCY5R6/lwxYqfT7vvrv/zzv/it+f9q44pV530wPTv7iStTn9gihcy3t9/YcdP3v/3v/u9+N9Mn'
-             b'yhCx4MmTg+0q8ghWouoFKYoD2HAvc9dn7oCLL7mYdBU0stOk1SC/PArd8w3zK6OYabV20YOWcp6K'
-             b'Q1CKX6TA90CHXoV6qZojNAZ6+9IUchC2bH8J3tyxgwrTzMw05QbRdNFbWQ4Sd+4MD4Gp2zXfJhuM'
-             b'ui4L60yPjmpIF5lnx/Y59uqiD5KipzRrEzzrg1QbM4q6ftmkIx19955dcPzEGCxYuIAyqOjToGw6'
-             b'Z+QChUq4o2TaPEXMU7R8kyExisqopHmohC7cJpYbFXW0a6LCUNGE0/TOHGiooCmlGuNIMJ6ko4Jm'
-             b'ZkDqNEOIXOCkXITo8Pej+AfSP5Mrds0EFWO6cWYYTmLkSJCKT4NgwzYVFCrstYiPqYN37MGoFGxM'
-             b'zq2FoCH7OYi1OG4wAYfdeySs0CBSsCkhRJcJEV40V5BJJFDGhkCeYKI0J07JEFEMaZ0XDZwKdsWX'
-             b'o1BCl/AZeIXlvO2V1FosquVTyWw1qCt2OUlo0GIsC5JQ/MnjMRT8dii8CY0mLuQWjbuIGReMBaqm'
-             b'iAq9JnBB7x8Yhq1bt9LnfMcdd7KuUKYatTvTawROaRuOGHnBNAAavMiMwg6RqqZg/foriZX53LNb'
-             b'CRY3DqoMub5kZWZecdfvoJ1Xb3pvJw7tOfcH3/l//sM//4N//aX0tLQ+afupT2SRQmeDqfHjq370'
-             b'X/7yP/Z0Ts7ra3qYaWHSaQ9pfVR/0OU2HWJxqMteVpJB0XkBd1BYFL7wxc/BhWsuhFnEgFHF3oPh'
-             b'fz3EYsYbCz3ymOHFYlXS7rW52DDk5thZXZp3fR+8nqmFltohM0w8uI4cOgLPbtoEr7++HR3aoT9N'
-             b'cQgT9Pf1UjGgvZX3hjfQ96nBWFG0B+mIUNMLqIkx7FKga+Fqc9qs+JO5DN24spCV9FjsmZ2XPZuz'
-             b'A561MEEaVnHedlyM8fphbMQ777wDn7rl1vSwtrJdEIBYN6kzt0KRLKoEcdMm2AO1Vp4jNRpN1ovh'
-             b'+2pAZRodctPAl2u3eaeBU6Usu7mH6FhBptcPumviwhaJ+YUFP02FOkl7mZTEnBVJK5x9JPqb4gDk'
-             b'wtemJiJYLD1eLt4zVZLAq551JHA2y/zKDlX8uiASBCdJycYKpFDKZiZqqKoo1gWWXex8dKoyr6e8'
-             b'6OcaV5ojeU7VVesul/VRURh52XA2mMlsUHcJz/qr6IopION7xdSkBShm5p5TsklhHeUgMxE1ukMd'
-             b'xSV9l/9gLFieLtcpr64ZZkdrSdjyB7gwRIb11YWjv3cInn/uRViwYCHc8AufgunJWdoBIvTmZBLW'
-             b'n12LtlcCiQmis8asUXFxQ7u0DTf/AkyMn4Rt23ZQTpkSaSoJtVQzY95X1yQ/UQd1LcN4788f6INd'
-             b'b26768Gf3f37X/7mb/4vuE/7JMl7GxxX/cmgmuMHT2F+jWb/D/7zt//jyUN7Lp7X02C37GafWPmo'
-             b'WFF1MDVAKFaUhY+c/g1jzIeH++GLv/gFWLHybJiZnaFpqZY/Xte1uAt4guVoYZwOneCQkdfIi3SB'
-             b'1ZrizWfQi8BXCCf1Y1JuOtze3PEa2d28/+5OmDh5kgoTxoHnLpHzo2JDWGRVQ5rmCnwzI9NaqMxq'
-             b'RxwEogo6jbhUxnvHbLIqJ0N21wCLLlfrGrWLClbP1JLIy/cMkk9U0aH63ltvw003baCGIXSCcsXN'
-             b'uJcPWYlwCDIn4GiSXmJublLiSbxEgs/lQ0qJAbKwVl9Fg4y8l/wgFrjyBB2NrszFjyFYhVyoGHZ4'
-             b'QmbIzgttuabPOShvGA8WZBtWgRw9bMcp7iH2x8xFVYqm5wKlGjBLCI6siYtC2FFoMMgvTYvt7e1n'
-             b'ODEWGiKZjpzQVpkMojET0aboEF12THDZ5b+2YiCQW9B7IWQrK8iGqFngGvMkVINN9zZhBU1GZmas'
-             b'M8F1EBcMfr+8Vqqy2BigyKqCTMawqiVzR6kmhkxNN+GxiX5tTDeihk5g5JVZ8XWnwtNg+chTTz4F'
-             b'S5Ysg3POWQ0zaRKqPGsMQdQt2BjifcJTr89MDhUkxxIcBTaRTffSxttvhbGT4/Dezg/IoYKShJtO'
-             b'Qk2cCd+DnVm6KRck3fMZNi89E0/f/+M/WHvpus1r113xRHt29pM0SblPTJEiCCFViu9/+y/+bOe2'
-             b'rXeM9PeS40KI3cmWWStSwhRenAVcZj5hWGB6TYxz/9IXPgdLzzgDWq059pOLzMTCxTaQAzgLTivZ'
-             b'c2GHHyXVVtX1lW+yiJBC+Jr2GniT9WMcRWsatr38Krz8wovwwc736IFGfcX8kREO2PNgXSk/qk2W'
-             b'tnixuxWGWsNl61A1LlWxqpqgRld6ukH2ioumNslf58qltzMdS6F4sUU8swKdRX3rnwvCoOtLP+eB'
-             b'AwcpPmHVylUwW8/aFEJOBDhVhSiR4SLODLnwsH2TE52VJrny9MDwmDPCBE0/uMOq2WMQmxjqgrGB'
-             b'kAk61DI5YbOBzh144HRk/0BUuY4xD/mczkwx1diQ0FiSd0k+QApsprWrjoYTX/nKMhTZNkdxiCpE'
-             b'VkZ3xa8n31sLS0cTbB23GvjfBwf6xbFDJ7CSGxbNw5A+e7yeXpln4jihriUa9S5QEe3DKM6iu7B5'
-             b'ca23ETgyoUMnwlBMMc47E1zzVO25eAnlXBmVarZrO6+gG6VgmiuFDnMgYy5+ytyUzXJheitxJwV0'
-             b'ZqYjcj9HdaSIhX2u7Sa5qKHRc6cd4Yff/wF889e/CcuXryR9oSZXV8rOjSVfPxZNSflNnXj88eeH'
-             b'Ddddd2yE7x67G8aOT0DV40WIHW0/q0QYhVa9y1Mbbpc76fX6erHvme37yd/81Z9+6w/O3Zje91Qt'
-             b'SQB/D/edQv/DSeOhn37/j1967L5/tmiAoyHoQPGspyiXs6WDORROxwzTe1oFt9LXLxgZhq9++Usw'
-             b'MjKPjCnpkIgMr5ENDe03PDXGWINYZ1NRVhO6lqMzNT1wHYGtcDKbbaWbsyOJuU06NLe/+DK8uGUL'
-             b'7N67l35/YEBi1wMvnh3BAL4QZ7rsgip7C1a8M9kiakIqFDYzLutQSk87y6ww4avPi2bn1B3HLHk+'
-             b'2hxwNx3ye9LluuwSotqRywPWTtdm58534bzzV6PaMVOI5WEMRVaTd0HC/cQRA5lQni2ayLIpslma'
-             b'Htp1YLZkTTEjDRIpY8dKzDvZr3GxquygDATtcQSDxto70bZZ766F07O7PBXuVNwQzkN4hUkNXgIP'
-             b'o00jobhgfKg4KsLqORg7IZvbAu/aiCEqX8fhjjnvyAE7a2NxRQsfjDKviNKffl5xuQiygwly4CJb'
-             b'04uLRNT9jEzA+Lm05vi6kYEx6u2aFQyk1513xgIYHBxITdJCGB4agp7eHop7YaNibwm8+DW4j0WS'
-             b'wVwqvrPTszA1NUlxN7OzM7SDac22SSyOYZsMmTqKE8G+ood0eJpc7XOAZAjWROG1q3V1pczYYmqK'
-             b'kNN7uSHQbamqZJ3Fs6gbRabjQU5edrVkQGUGLl5z3Kd26hbce8+P4Wtf/VWYv3AJiWud01y57Lhu'
-             b'erWiIirhJZaeXLgeSNdk0fz58LnP3AXf+/6POcNOMqhoL+kqe5ZLLZjqGfH+8eKR2J8+t6MfvH39'
-             b'4w///Pc+/5Vf+VcoP/lkUNA/IdDl8PAQvLj5iW88/N3/9McLe4Eo2/iBBzUMAxXUOlO/52CCkj/K'
-             b'ipDZdPAsXDACX04Faig9qGgQ2yQLfV2GNnRGYMfxig/UaL5bwFRRcoBoSmood4B4sNHOKT2su997'
-             b'FzY99RTs2rWL3m9fD+8jOAI9mK4E31dHBYhyqIUi3qIyd2svCFk23jQjINmBqWbGQxa65sV1/mc2'
-             b'Ic0xDCp4tpVGgftnynjMe3CERAranvp6oDZr1/s7YS49RLZn0b4/lFlTvsslgvRALnBwI05d5Nwg'
-             b'UJaY43rR6eD3x/TjZtUUk16GEfXgwywuLHQUdYJ7rcCv5yQYkfdokV3iUZem+VRBM1XZqoY1NMy6'
-             b'o0kKJy1GK7NWR1huys7iKVF97SzEwt43TYPYoUtSry75GTCNmG1s3f5AmqRwcmvPtmkXCGaOHI1c'
-             b'EcW5nXRhyFDsoB9kNPhy/vx5JNBetOgMWLh4ISxetIAavr7UKCH0xQxCocprKrXkqBUGEHI7uOwG'
-             b'Hxj+Qj0hPk/Y5J0Yn4TjY8fhyJHDcPLkFImR0fqqgw2gQ5dyDvRsiHN4LKatSi2PULdXs1yhCBcB'
-             b'dc3gq9uR+8bnDEW1aQyxYM/J3Razc4mSTzQaJmoKb9UHEycm4MGf3w9f+/o307XrYfatUvfFiT8a'
-             b'nJjPlSjhoaGA69SFfyY1reefuxI23rYBHn38ifR6Fe05QQTipbLZm49GlObRmWkB7n/n9Vew6aF7'
-             b'vnXZVevvO3ftpS9F2k+d5kWqp7d5+hMl+gbhg3d2/MIPvv1v/89ma6KqelN3SXBaZrdqTg+nBciB'
-             b'W2QG6cGKhx2KX0fSQ/vFL3wezli8hHZQKgRF+Mj83Kww8A4KXC/vhoJ4bWFnTwvWBkFKbXKHiKnj'
-             b'6YFD+/fCc5uehp3vvkuFDHOBYuB9EZ8xEudhGhOliQcozW8UposC1VUqTlTlfuHUbkJlo7iKJVQJ'
-             b'+xR6liCMPe1KWejr85Ld6UJYHqAiK0eth9TFwImyXx3CDx88BIcOHYSzl69gCxp7gjPuTjOBHBbk'
-             b'hQdcEEItB0zF+0AKcGxy3ALDgkEmZS72SsKAoClgkQ7sQK7xPfR5q+mBDoQdOoQ9O9rHKNBOtBDJ'
-             b'2HVAZqftYPsTJQN42VHURlpouw77E0pn7V00p/MAWUyrxbCWxGAlGQTRBHVIDtFDQulZjEEXSQFP'
-             b'XixA9uh8gi776Wedmpwm5/ShoXmwYskSWLFyBZx11tJUlBbTxE/C5eAocwz3uEABfHMFpRsLVFum'
-             b'T+jKSdKVia30I18rouOne39wYADmzRuGpUuXpGdoNQchp89xZnoGThwfh9Ejo3AoFa6jhw/A+NgY'
-             b'zAUWWfc2+jiEMMSPhCJKQRY9Wowu072pkfI2gkWbluS+jzXkFLBiT+i8iPrlnomaUemsYOAO8MMP'
-             b'98D9998HX/jSl9n1XH5WJX84XsiZlsvJTRW0IXP8DFAcD3k0Aol9r7v6ylTAj8HLr25PzcdQmiA8'
-             b'XSNtEr0hP2DF11cgJCHR/OFetT0+7yff/c7/9tt/9CefbfqqJR/W6Vuk+ocGT+M1FEWQwqFdHy7/'
-             b'z//+z/4TTB1fjP5uc7hnwF2E5e44Y5iZ8M/apIawb7iTQihoIE1OX/7yL9EDhV5eCKdw3Lfnw01i'
-             b'p53rjkfAm0UduhGm8SjwnOtQR4n6msG+XuikgrdlyybY8uyzMDM5SSw9jJafoyj3yqBHFV961f/4'
-             b'wg7GKenBmRGthetBERLX1eYWjjKQ0081NZUmDK+qdsu0LlARb4ev73LrBlP+R4GsjK1lGhGwhFjm'
-             b'jzSIHLJ37x5Yde65TIBwzIZyZgTqunYLAGWMSi1wmSd3O+w6qZhIleBpMXQNeF66/KCCXRHS4iHs'
-             b'5VoFCfNTvVC0PQNPJB8lBDuFMkGTiouFuTgEBM2xEujP9D8afhjls7T0RH7vtL9yTPV2BfOC3z/f'
-             b'A3ivomfkwMAwnBgbF+++wBZXssubTocfZijNX7gQ1l2xGs479zxYetbZMDQ8wI1MzVHzem8wDNdD'
-             b'xUxzoZw4dFuYIGSShXFdnGwyFUKta2kSOnLwF6mVsstDOLZ3fg8sXLAQ1ly4hjqEVur8jx4ehT37'
-             b'0DVlLxWvsfET5mCCjizOeyMqBd05mSV9FvtCLIxsozp1xJypJeGZzqteTHKjakYPlBhVKZOQRtkq'
-             b'Fdv58PZbb8GSJZvh5k99OhXaWYnUMOqIkIUyuhBV66TZV4XAH+/ijqRD3/LpW+Do6DHYv+9gaj56'
-             b'DUkoxcI5J0vhaLZOomvRcDAvDR67Xn/51icfuOc37vjSV76N2iwXT1/IrNEF15xu/0P36Nbc4Hf/'
-             b'4s+/PXXwwwvnDzah7hnk39ejQWPCda2qzCFbsWr+j6MAQbzxP/f5z8KSM5dAa7ZDhYNj4VkrEgRm'
-             b'ieqGoGQDJ7sq0BQMPlB8k5NvB1PHu2vnTtj0xOOwe9cHRIjoSQWKAm6d7MxMdMpRA85C4BzA30kz'
-             b'rcp/EyfmbP0p1tBdfmDQRS13Vkxk+WMFymxzCuaXEQdcMJ8xZTHxv5aLbdaEUORB8KbgqWVXw9Cd'
-             b'g93pELopOokx6RTMZFn219DdAap1kYzGNvGJpoiYdJXu1oopWhmKAo1SZEINBsPxHs8bZBo1dzlm'
-             b'J3QkMgSdeoogdJumQRN+JXPKFt35oAKdckLu0FX+aZ9x0JiL4mcIwWIz8HNiXZnAdY1BWLjoDNi9'
-             b'+8P0fQcJesLGCPc/84bnwbrLLoeLL70Ezlq2DPrTNIPTJk5gWLx0d0g/n48y3cnPLTbx0ZyWg8Fu'
-             b'fA9l8yXvtM3j9x0k1ZemTRQo506lEBPjdMfFF4XnGE9Dh3h6/UVnLIEzzlwK69dfTR6UR44cgV27'
-             b'd8Nbb70Jx4+NEaTaiy4tFRicWnr8sWhdlX3qw+jNlcmy4pRqH/MExiQfFkc3KkU1dEfp2TQGXVxS'
-             b'I/v81ufh7JUrYdny5UxyEWNeL8GOdk/HMsXZ0fmDH2mLEgp0NHYwPdsmdvLn7roT/vb7d1NAalWp'
-             b'ALtDk66jplqeMXmyiEwk3aPC0MONCI/fe/e/vOKaax8dGlm8C5vC07ZIhbnTl6roB4fgwR9+7/d3'
-             b'7njhrrOG+wE6MxaaF0WomfUXhgZkLYpSQ0kIGqjr+3wqUKvOWUnwCZu8ZjEh6VnqIGeJCIADwzkE'
-             b'Q4vHmlHK002Ii2Z08X7qkcfhxXRT13NpohoYFAiyAtnfK6JtEEneGBeWnTGP+hHKDNOS3JoV9Xbo'
-             b'Kv3dhL0+C++FTKC08ajU8iLPRh/u7E+dHa3NlcBlCr+TwliL8aqHvFvBQxTjKPA6HUsd41yrxTuV'
-             b'OZn+vNBqQxeLlx76ICw4POgpwr7uCFkECDJl/ggX2oZNPC5PilIUOp1gTvexDPKQyUGZe3XNacCg'
-             b'ztRYGIKY/4ZsOSTSZs7KkgaAdlwUQ56dA6jw1FH2dCBwHxNwKBW2lp0cxYd02DmjrqV7dkJSULNa'
-             b'3hHhVH/GmWfQZHpifJwKwrLly2DduitIzzcyMkz/DfdC4+MT4n6SISS1BaKpspA3ZHF4ncWoIKF8'
-             b'TkM6pDhE1vXQ56K0fiHReKcavpDZbgpbyfhPX+fyt5vDiSawuLpKk8GZy86E5SuWw1Xrr4T9e/fD'
-             b'u+/uhF0f7oGx42Nk5IxED0q0DiW9PkijWItfJZQHQAE5iIxCtFJG0y8CsGKMlp5ba+pw5Ej6Jx55'
-             b'FH7tm1+XaBsDaFWBqSov0TlBhoGl6ClbK0qwKSICCxfMh9s2fhp+/NP70kTbT88vElKazUHWy6n/'
-             b'IpHBailOvmuP1khFbPzQnuX3/uBv/+QffusPvkkN3Gk6TTW8P/3eNN1Eff3w7isvbHj4R3/9P470'
-             b'AGUakeFRh0WaTUmaVWJBqCSV0zAKb8tGLDxz6ea4447bYe3aS8henyi6PhZq/nKqEbWRwDLeZQgx'
-             b'iG8e0swH+wdhX5qaHn30Edi3dw8Vp2Zfk3VVdJN1hA4vwXQhU19VIG8Ye1F+8sI9ZKKDnOZR3DMq'
-             b'gQOiWeHIz68mq8ra8xlCtKIjcKLh6qEIBxQShv45FnSKTg3Ejy/4QkoYqDsPGqQgDzJ2f+Mnx9LB'
-             b'OgYLFiww3IiudAAjC6gouLYulaiS6f+lDBUaNZqGnRYJWbAbCpThoMpHK5qWBxS4qAc1XJWpRS1u'
-             b'vO2r+HOqBDqm5kbbAyxqCD12xDOwFnYfiTeDZEjxbq4W+yZm07E7hpedCbNGBb4RmBcTlSmDS0ga'
-             b'HAPSItLB0NAQkXOwMKGTwfIVZ1Ohw2lqpjXHjQ/uSusMK0bVUmk/4nLh9JCNTmnKFdG2ZfTKz8Tp'
-             b'yhnK9XotC6jLCelFY0ooHEmbHfwcHN8z2jxGIZWYY3q61hjF3opz9DOff+55sOaCNXBy4iR8+GGa'
-             b'rt54A/akZ2sqTYb96UyomnmaipY5VuViETMLr8tuKPPS5b4IwoiUXWo5McuI3vQ9MJ4muycfewxu'
-             b'u/12c68Bn2kO9nNlbN1Yet4orD4nLaTvN92aTefQWrgyFeLtr+yAgf4+IgBxakIoXHEcC3zVlV0k'
-             b'BhUxgSMMpgL/xnNP/+obN93648tuvvWncJqa0LqZY++fbiUKevv7cdk+/9/84e8+dvS919cvHEqj'
-             b'f92iGwuznPDjb6AwjvKWKobpfBCiAMOEUQPbIrPQbt7wabhs3aWUt8TJnj67MOgk4ysxPBVxpR2m'
-             b'FZuo9jV5OZ/+BYkSb+x4DR566GGiKPf39bHVgWMBZIyVWaXEwtPP4JUS3DP3gWyFK2NcFm4K/Zw1'
-             b'O0xiUPIECPxhh5H51akaPmuhorGbGLAIsZiffBdX1w4B77yl46o/IT+cwcw2g0gB8FrMpEMHCTvo'
-             b'lvGr3/h1WHvpJTB1cpJJAZoSbMyq9Fn2zevarVGTgIxJyz36CByotj3klCCfseraokaaq1jAUDZp'
-             b'BtRbMdgEBGJCayz7wInGdNBLppaPzMehPtvJzx50v5Z3MZzzJZlZkb3fmL4uui38Cpws8X7G+6Vm'
-             b'mQMyG5ktJ9NWuuZzrSmGIdN1nJqchIWLFtLENIdEH8+TOpsHF5HuQlCJEneuZBqDqSFHg+Q9oJjL'
-             b'FmnHURwlzLlcC4tKD7LPlngsFnBzkHvSile3aNeV7rPCMg3CZtPvhRMuEkbwvx45fAS2bd8Ob7/1'
-             b'DszMTkNfTx81qdhAKB2f3S9EaqIOewrTqxWXwIMOsoUYiE8ec2P0nzXCp6KJZXpmAjbccgvccOMN'
-             b'MD01zeXPrKjAGkXdTelzZ22fxpYQU5CNjZGej+413/mrv6XPFnfhvSiGggDxI9Irp6bMYkdFjXe6'
-             b'J9BXND08MLTy4u2/+6f/dkNfb89JzdQ6rSap8TQyn14lKsKixRXc9/2/+aPdb7y0/oyhvvSBzBQ5'
-             b'3oX1i8sak7x0lEdA6NH4UN/06Q1w7XXXwvj4SSAHjoIyDcqU0qgC8WbrThjlI6/T6oh1DsBTT22G'
-             b'Lc9uIQFvT8UZQ3jgRIjGwhJKW4acTIBYgnllRLmy5mrzCyPrFYMtPLju8lZAeBYKznEPUBw4sieJ'
-             b'znVBAqqp6Y4OgMLEU2G+PKWY44T2pwVhT9AuLmzpd2bTQ3hk9CisdV5CKaN10Tl2ocHwm1yXoFNi'
-             b'ZHpzEIdsJzI483KjaJFI043Kt4jYQr/fII1Luf+CEIS0KJArNSi1FeBaJmSP2m2CqMAiTLyF8wU5'
-             b'tKNFL3gTdANo9Ahvf/gg60Q2D1b+mZduvCG2Q1Hyp4ipR0dbbQ0JiFs7TmdD8wbTATkhhaOSwlBJ'
-             b'jlNR372z+0VJJNp9OHE7t6ZJtF9KIslfm9mLKg+wu9VwX0nBFTIOF2DZv6mfpZgplvesc4W9lJaM'
-             b'wvVdoWX8Z9XALVm6BO666w647rrrqFC9lppDzFFDxqfHFAIUWLva5pdYDjUue866wgPQCAku/0xO'
-             b'/R7NA5ElLY1mb3ren4YVK5bTe8Ecqhgbdt0YMZEgRKswYhygpsBCTvKCbOB7Hh4cgtvvuA3u+dFP'
-             b'oKevSXvDELJI2xmLV901gqnpaoGy+3sqOPTe65c/8rMf/aM7Pv/F/2P2NNRONfoG+0+nCkXWIW/t'
-             b'ePXWJ++7+7fm9zcMS66DqpYKxbf9E3cPauFSyYJxem4Ozjl/NVx9zbVEg658zhRStXymrmpYmzfK'
-             b'uqV+aspsI3XA7Tm499774K2336WcIGTu1RKex6dAJdzimt+h7UpyNEgWduh5IH9G90KWa6DpoOw9'
-             b'Z4FrEI2+XnImokaEiJeZE3NcCKEw1e02HNUVXhDI0EP1EevLXMCcc8WkpeakRQS5TCacAcUH1+Ej'
-             b'R8SsE8w+2tnOJligHXe0YPsfos7XAslRfALnPXEnWlnAIcMvzE5DSq8XMa/u+OqoGU7R+lsnMKIX'
-             b'DU0UCj0ItAfiJh9CZh7WLgr9P7Djt7y+F/gqCF2a3OnFNxyKfRkd3I7FuAjrQR3z5wW1HPL4R9it'
-             b'QhlfWKRqyWXCr6N9WVSoSqcWuVdMESs5TRbJoc1MJKGx1/tC7Em84oLKuowhiyCcMzJOgLY4t2gz'
-             b'V3g/QnYkASs4XhiBIUNx0vBZTLvq1UoBOumLGkQyIMcWbDA6AUbmz4Mbb7oRLlt3GezYsQ1eeeUV'
-             b'mJpAI+a+4isl7gJ8Yaaei7W3pq3K+U4SUeP4QZZmLlPdEWqdm52FBx96GL7xja9nA1younSYvBsO'
-             b'RTCQ/NUVeceS6Ivfbza95sUXr4UPrrgKdmx7GebNq5jP6sAcLuir0j1B+8wC9sfGZU4steb39cBT'
-             b'P//Z76y/ccPdS1et2pcOqdOrSDV7e08jMl+6qefmRu793n/5M5g60VcNDfLhGfjoJDGjEzeB0uJf'
-             b'jh/UiuAB0ptuurl2CxYuXAh33nUX7yFCLKi1DOXVhiJJVETMeoUoRqxesODK90A7TQZYoN5+551U'
-             b'TAf4WK68QBtVNoGFwk9OIY4Cl8bwO13Muy5Tzvoj4YAA3Z5ktmSCACUOlnOBuAMLYgzbEVZhQekv'
-             b'bF2AhKtBnBQ87Zyi0wRcBzn4pqiokAPsohwGOqDZZs+xsBllAieOHyfSA0oJQidkdww5VMldXA1a'
-             b'hdHnVDfjRaAt169WdxGBOmmPVWUyipEdjCrtRfcUzKS1Mm2LDli1HVa0r2mAFMBuf0SvOz2hWzux'
-             b'oKLVWCUAU802TR0hd9BUp95yLvD7RZiKfAGVMaiBerXAc7Kbo583Zmi0FhhaBLSWeus8lIpbhTqN'
-             b'Cl3KbqiLaIi/I5Mk8PXQpLemwsjmq5h5JqbtdD8gFEWu/pSgLKGamVpBBz7olOmUVVpJoawl4Zad'
-             b'xwsfpMIgptvFhKUibP7MmiZGF0IbrztmmVVwww03wNq1F8FLW1+Ebdt3ECkEn1HnMo3bCq2XQiX0'
-             b'eoW6FYlQyniQScWroS9lqjKcPNDXDwcOHILNz26B2zfeSsJlcvB37GKS9Vy+0FeKFsuEmhI14oJp'
-             b'HBGy+/Qtt8DBQ/tgEj08K26Mveak0XWpBdWR9yq77QYRv/DzSZ/Z+Ojypx958Pe+/lu/89vgZk4r'
-             b'/9nTJ5k3Xf+B/gG47+7v/u6uN7atn9ffQw9ug2zuXdaXIkwinbGKKekGcSyio1TbRqTD4o47NsL8'
-             b'+fNhanrG2EexgNwY4ig7LhABXQN5kVS4KseL+BNjY3Dvz+6DXbv3QF8a0zHV1osLuMJtTn3CnAVD'
-             b'd91gqrvi51CFnZnEQEa15kaufxfHCzsgdTorUnscdIkWox4EQdha3hU0Y6XqhsKzTQSwYEsMW5Bl'
-             b'YBIyXp6Rv+78HoRf1dMFp8zYILNO3AM2kAUp8FLUfB6yY2xS11yHHGtO11SZkCF/f56aqiKwUunD'
-             b'UOwWnZAPnFnZOIFyyO+vYFASk9McCtRItOZJR0TOXskkOhGB7NU8f092VGcuPUfeZ5YkxKL7xVei'
-             b'91+b27iLrDGyFGLy8hN2Hwp8O2wxlGPfpWPXe6f4zEGEw3yo+cJlJXLBoZTfFtRoXTQzk/7eIlQA'
-             b'Xx+FvTRZys8cCkNizs9q8CTnG5SphvIK9CfsbfRCb3pmXfpnJIk4hYTVHzNvMov71KmGQ4gTkAuX'
-             b'UrhDLh76nBpsFnlHiHqrIYLL7oQ1F14Ijz3xODEDBweG2HIodkR5UcbRiJuIar7UPqrQy7ERtBAy'
-             b'CtNX/HfUo2194QW4YPV5sHzZMiq8+PnO1dGsyrz4CVoWlot5MlMNpEC1kXsPmDcyArdtvBN++pMf'
-             b'Mw09ZCZuiHktEaMSYoJM3RLpkv4cOlG8+MRD/+DaGzf8v2evXLmtTbrM06RIVafJG616emDf++9d'
-             b'/fQD93yrv5lG2XaH3MRjkUBaRx7XidrrVa/gxLFa4I30yc2khw8/9PNXr4GJqRneL0XulDSEj6cy'
-             b'oddGJ7oEObDxMOowLuiaFUxNTsHffOdvYHT0BD2U7LINsjNh922e4aUQRMi2RLGyIutcyWwrHJRd'
-             b'MLdmJ52+EiJYE1LkCJWhbL7cPZViYJ899lzZMSrzKxgcw6kIoWv/5mKGaFy5x6L3Ip2x0vZNsxWz'
-             b'xZNozPAzwY4TXQdG0mfpZOFuuzP6eRqSultBR61sxPiCzH2hMsiP9zQaEKhCWXmfMQhjrhb4zQnN'
-             b'OYcsRrYL5zk0BNNK2WyH7wMnnXZNURxsShvNxLRBWq2ORaDgz8esPdGIpnsWizMXxAwlgkSS8K6p'
-             b'kwXc8rlReGaHIUouhIHc33mS8CYfMNqzxnBIvrJTR22JHucC6Mk3rz07DSdPnkiNwhR57hkxAwpo'
-             b'mfSBTOAAFUYLzbvSw7RdM6Fgroa24zws/A+4r/HpeW2kgtVE4fHwPOjr7aNdbZC0a/1Q1WqL7gMa'
-             b'qqLQ3/WedPw8uvgR+z3JhhOTaCqCdSBDXvTbW758BXzj176eCshW2Pr8VnKQYcdxB82Gy+5hev1C'
-             b'tElHkRKb6gjub3BZjHmtqQkA6C358MOPwm/+g19nNZ0xHnkHWRozR9N0uW5ekDlncCznJNomrbmI'
-             b'GH9vvvYq9KWpjenuChX7Qo8nb5R8GJlVSkcBrjhmx+Y9dt8P/6d/8jv/4ms9VfZlP/Xhvur0sEXq'
-             b'qXqq++/+3r+cmzw2ONybpiiKMVC7oFDATQV12vuuhSj+33RrBq659hq46pr1xJ6hg6GOZhJpi1vn'
-             b'zNLGFctNg9eCowDEufR69913Lxw9eiIVzT6hnWoUuOpxcpqOd5ktFYo0UYulMbaVfIVT8CtY9E2U'
-             b'A9BWqE67qyIwwSkbS6IdVI3vC8cANW4tED5nCyzZn5nYVbfLoQs+Up2qLzRnWb/qbDIMMcODLI5l'
-             b'ujeakqIR5vwFCwT2TAcLNg1IeW40aApm31khsXu+tngINhq6/Od9VCdkiYJXM1XZa7B3azYMhaAr'
-             b'F2eBjl52CVXh6sGaqI7530GHiQ6hzVAiRbirJZIWmhAE5oGc+oITRyWHPbCRqyY6B1kcxqD7Dqar'
-             b'I2xFO6eaJ17VXGPBwvhw3V+at6LTCJF8z/EhL4ejnmWpwOE1n5k8SWSLdrvFAYpE468on4xXUgxr'
-             b'c1/TEFsfMLp5BWKkSyGensN4hc1ZKXUQQdhUqGfThDY1dRLGx0bJOaKvf5ALFhrkIhriJG7EXE28'
-             b'yQZK55ToigBRABPQK0vVupio+zxHFHacaG/59K2wevUF8OTjj8OePfvJvYKREG7+2qHOWr8ojvd6'
-             b'jzgli1Qi5pbAUt2SRrZ5aqZivG//QXhm87Nw220bUvGfYTKLr7oE+WANJ5jMAMwI2mf0RaYsRIBu'
-             b'3nAz7Nv9ATmwO+/t84YANgUWtvJCjhHmYHpvPennfPulLV96/80dt66+4qrHU4d4egwov/8//FN6'
-             b'uE7ZX+kh7Rvoh1df2PpLD3z/r/5oiCzGKklDdSSCdApzuczgo1bb53gB/LMoHF1y1lnwhS9/hYIM'
-             b'8b+1O7UwxPLhHGM2oXUy7htXQdA67zkZ856f/ATeeec96OkdoA4eO2wvtNYgHUzX+9LlKNO1claT'
-             b'GYMqy89nhXoB15l9DngzQNfdAD1IPse9Oz1gypA5/WlcCdSFQtwYIW/j5JgX+NSDK+xZnE17umeK'
-             b'ElFu+GKMZnwB8hkQPIV2Pr29Qu4IsPaSS2HBwkXs+mw2VpG7cFwCgYQg4uct2UNeEndd4XXnZPmv'
-             b'tq6+yHCqKUm3jJ7XwlHJccMTCht7sj2O7re8GANToazkUKycxKxIbLorUCldfOCRJmGN/L0x78zL'
-             b'zssXpBi+TwK32zTFIYxdY2CjF6EsmeQCw3AI0Yv0wCv7z2XigQnNzRHDET2+kxqqsWNH4PjRQzB+'
-             b'7Gg6QKd5SqY9kgQtes0IQ0mTz+F73obzLArvIhGBGeM6FWWLho6kpl5iLTw7hCApYGJ8DCbHx+k5'
-             b'wsmH2Hgk88gFVqd5r24m1maEbGUEtdDJs8QChEwCUrCd5HYtXLgALrvsUtKpHTpwgPaF6FuoEJ/W'
-             b'w2wBFe05DIZhh+xab1KLwPtRYUEe2L8fzlmxAkZGRmSqVJTCS6RKIV6HgpQCVXZh995EunhFhufP'
-             b'I3Plt95+i53jnYjYfVXQxLztr/FZaDgTbdF/mZtrVYdGj5913c23fi99nYi6Tu1fjZlTXODlKM+l'
-             b'6n/oJ9//g6o947xELaP4tid9iL1GJBDygfXFRZCeQBjNNIH94he+BP2poBDGXql1UMjWOWX2DIDZ'
-             b'vwTI5AQe4SM88ugj8N57H0JPs48U4WgSS9oWry7KFesWBIaKBZZvdPGCwttFkdeFusFN3QaaeQfk'
-             b'CvZQsQhWWyNlBbqo0kImCkihqrpEyhrOWBlP8u8w+aIzB2mQA4w0KJZLlEGEaEUt5oJquDsXEUSJ'
-             b'Zltt8U/LKb/475WY+erPXgm1m95Vm7tjo4d7L3lT6oIu9G9k8IkINwi5QCdJL3EryqymiY/SdnkK'
-             b'ck7FtZ3s4h5DJjVoHErM1OUoXk4a+Kj7LCzOHEnfof9Wi3M27nA68r50F2jiXZ8dRRB9RuEuaqJ8'
-             b'0dnbUBFrmyDU3T5KRlUj/WXm5Ak4cnB/aspadK3I3sdV5p7ArMT0+7J0jxJVYfdnrQxVb1qGKJlf'
-             b'IO71mvrMA1RgyIkmCIFijdfjaQJqOJ7qToweYc/A1LjMG1kIQ/MXpM++hxwZYkFoMglrUFJJIb5V'
-             b'jaHeW8Lei9JQNBBybHIAaZX+vvHOjbB8+dnw2GOPweTMNAmBabKlt1nb8yXhWwXs6wqPkmjnRhQ3'
-             b'mh4koqWfuZXO1Sef3gS/+qtfEzsudcCvTbjuXDS/SyNTxOLeciyQd5SAADA5MQOXrbscXn9jBxzc'
-             b'u5d2f8aYLJKXg1GP5CnWaBiMBkr34LvbX9r4xstb77rsuhvuD+1Tf5qqfue3/9tCHXDq/RoYGIAn'
-             b'H3rgX7z41EPfHO7j+GTsfrh4NTkpFXJiqAadgXzITh5AnKJuu/02uOCCC8hxGFk55CUXolG8wSYD'
-             b'eTAdi3IRpqEdhNDXe3sreObJJ+Gll7alwtRPexFPbDWeFqJz5s8GYMnVXawqpUB3J2q7bItjPnvZ'
-             b'oNQbgy/YlMKpv9xNBqUGy+ESJFdHJx7dceAUqEanvmAbKvqu2Tdgnqchm/DKAajQk+0EcpWk7x/s'
-             b'Z6vZoVkOYYR+8L+R67aECF5wwRqacNGnTSFMup5Vowiti8Z2w88ErVLq0BaNUqCmgyZsKlQKt8Yu'
-             b'n+uq8B6kCQeze6gec+EJUVlTUfwagQqUr5wk9obstsHe7EYr1s8wiBDclN62WC/Yo17i7X3x+eJn'
-             b'32FnCI2SoPs6MGEhpGtTt1rFZyXaslK/puxMYaJWEsY4fvQIjB45QDs4Iv04b9MewZNQS8GOeeaW'
-             b'AufVYMJ+LpsfTIDsZLIBCTj03mX7LA85x8nnsct5FfCyBICajPQZTk9OwcTJMWITYjQOukxY7psr'
-             b'DKKds3tYYWUN9NTa4sxRRKj6qfCT2HmuQ4bOS5YuJWPb0TRVHjt+nBocRVS46Qp22NvuUCYPF7Nk'
-             b'A0SczRBtk8NP0/s+OnoUelMhOefc82hycyLyxx2jc+UGyuf9rjpzaNMiE7N2IzhtLlgwAm+8/jo1'
-             b'Da1OTdOVho6Ci6Zty5RNvijqXN9uzbiJmekl19x483ddiIWfzan5q4HheqfswqynFw7u/nD9oz/7'
-             b'we8P9nAQIUU7p4cNrULY+0xTQfPNhB2Nlw4CIa+51IGev/o8uHzdOphCRbhoIsgTUvJYoiWqdYSp'
-             b'5chipdnTYO0uPkjpC/rTNLblmWfgpRdeogUmThHYpeGN1ZFFNhtphhz17jNU4cpta5GAHWWK82pr'
-             b'oBEX7iPUboGYYqwtiqKmCPU6s3tcJH86m9YcM54QqcKHvh1r+rtCDKgbCkGdtQW2oEj6SqAbfk0v'
-             b'dHXsTPGBx89Cu2cMbwOJEw+iotcMp4YeXLUrDg5dkHTo+9PP5SvZ/QmEoRCJlijZmeFUws4MFdH+'
-             b'G15TlYEKChEK6AxvUGGpzBaKYUGEiBFi8qKrooIVuPiFwsZH2aMWvhe9XP9gRqnqSOHE3JchwLZZ'
-             b'13DhrK3gkHYrTWsVHWYsxEVD2NozGQMJEfxaYiGVvkcLBZiULlzM+BoXUxRwg7yQflx52pceP3IQ'
-             b'JsdPUMEio0gV1/rsSQdCMGK4WWBkvpi5J9fiIkVd74solGfWPDmTORAUr3orVzg4GKRe2HxBhreZ'
-             b'EFPD+LEjMHHiBAwOD8PIgsXQgyxBcQIJoO7/YGm+rFkSHxlhH6n7BdgUAwX9uyLLqPkLFsFXvvpV'
-             b'2PTU0/Dyiy+mSaMnTS2pmKV7CJERtSNR/ZTGgrjsB8zdPsLDaYriNqZBny3KUJ597nk4D5uwxYst'
-             b'pqPR4GcYyV/QRaXoRiKUuadrcrym07MzsHLlKrj0snXwanq/XgJauXX1Zlise7s8wSm9PlDa+Puv'
-             b'vXrL2zu2b7zosqsenj3Fd1M4VJ+ijPNUINKns+nh+35v7uToEJIlHGgabpaKG+utSMVkaC0QpTn9'
-             b'hcb7W267RQxKmaZMxQihOYPIPC3rEQDTLioHFXI30t/fhFde3ApPP/VMusebpi+hg5a68YYdXAoI'
-             b'KOXUC16uuTjOxcKFXTrjrmmqDBt03CiFaBRtFX9SeoDnokUFQphJjZ5gQk3s2is6vFMXOdPKJA4s'
-             b'vOk1+nv70gPVJHYa0quJwVZ3pDg50sXQfrBTUwFop4cbfw/91JCW7mU/w4JSTI5t2I7IkWMENxDc'
-             b'DLQhVjwp4NciHOStWxST0vS5INyjB00p46QDlnYMqdi2p3mSDmoLVVNzwSywmija2gB4EfbSVNJu'
-             b'S1wHL1k0s8fc1APDRTZd47Xv1PY99M9yeLd6GNbSdzDciE4HrFfpmCcduy9oj8L7Cyqo6qYRiu6Z'
-             b'fvB0jVNT5ZRp6LLcOopOBizDi2HHiho5nyaSCThyaB+ZG1NDUuzfVLOTIeXKJAPO8tW86sxlSipg'
-             b'Plfo7wqukq3FRBTN673aDs4uwTe5ejj6/F0oG7UoYvsm3adTJ0/A5MlxGBgagfmLFkPfwADo5s1J'
-             b'KoHlRxlCkf+ZI2iCaB0ZggSZCPG9tGVi23j7Rli8eBE8/MCD9F7QcokaDgCDshXOJS0bMv8CQ+lO'
-             b'93byuRFsjE1uKnizMxPw/HPPwa/8yi+TXRV7/qXGJKqWLCfuOkkPdyLuz0Vdnw8+R7AhvPa662H7'
-             b'tu28nzQk3hWNhzQvIctAFAqks2putnrm4Qf++4vWXfVY1Wye0l5Jjarv1JyketKU8sZLL9z+/BMP'
-             b'/tIwdjTSKZnjXIjF/ga6pg2Cm1yggxk1H8iyOWvpGTRF5V0Qd4DeF8I6jZ9QZpNSCNL37uttwN49'
-             b'H8LPH3ggHaqVpJwKJdhnv7jcvTnR7OReV6EK2vv4aN8jGiONKWdeYLKPWi+p35kX9wKyalI/N9Rl'
-             b'VZEYVnjoUhpqmhbwxkZJ32B/LwzOXwjzFy6Aeak7xSTWkZH5FFOPehKMPkCjU3OLLrVHEvaH0xim'
-             b'3SKFd3JymmLBT46Nw/Hjx2AsHSZT6TBptZHJNUPXB/ctWPjAlulMUW8EoIUufj7tOopNk0ygVPAq'
-             b'mf6yJMBL/EcQ6AwNfDUxloLfgjYaMQfWqX2QpQ+zXgWpzbX4tvF0WokVksZiRDrYyGEiFHJoIUmo'
-             b'YwUe+mhfxCQfiWmMulNqy7FWZxsi1W8VmJSDwhG8EtNjnIRnZ+mXt6VLKBh80hk7pqxr613JBHN8'
-             b'9CiMHt6PBihG/qBp3vQN0fwMXekwrf58plGDktkj92NxfwQdM9RuqZDFKUKlu0Y5gEFd3avK9oBW'
-             b'85THbRMEvwn8NlMTYzAzPQmDg8NUrJrpfCCNlhJtYszMv9IJCj/vml/DgS+COitrGGpyiQ9w5fr1'
-             b'9N4eeuDn9DlUlNgcbLq2wi4TcRljE7WwRJYfxIYTh5wBeP211+HKK9bBqlWrqNHLHNMq+xeaG32u'
-             b'+k7IKeozGKQBxgkM41muvuZq2Lx5M10jDv8M2sdBl+pE9l8q98IGa2igH95+Zesd777x+q1r1q1/'
-             b'tEXBrqdokQJ/6lHQyT2gjo377v7eH8+eGGuO4Kjs8ugOwryxbqPwYIhFAmZnroazz1wC1111JVN2'
-             b'CXISr7uPWAY5dO6mpWYnLzIxmXS2Bb2pqxo7Ngo/+uHd9JBVaarL6H02eSU9k5OsHee64A1tP5kw'
-             b'4IoOtIS0YlaRAzOlvHGls/Fq5TPOTGd7+nYz6UCbS0UJ9RNIhceQuwuWLoHlZy+Ds1OBXjAyDIPD'
-             b'g6RRAZmiohQh4XXk96RFOup7KgWX/EASfu90Ugsw25qB2akJGB09DgcOH4ODlLx7IBWzyXQAzHBg'
-             b'XbMiYZ6TQkN/b3pS6yknD2EThONU5FzLh+RV9S/oEe7/aIfjmTUHMYt9K5zkZBFYsxm6RKUTaZoO'
-             b'G8Tx66Au7pg/xpqfUNxT+SCO5AICuqPy3kg0WnjY6y8U7DOBPYPS+kXHIxq3whDbFijUcNQyPdW6'
-             b'YtKiUVmaNFhEOxgkitcLbYLGj4/CsSP72chW9ydeDigh0OBrqyVwTbu8Ro4qlz7Nq7TNRYCPmIpo'
-             b'Ghs5ZoCqe3X/KqbEMjn6WLBAnfy7iQSLIHWZQnHP4r3SEkImudCH2IaJE6NpSkyT1bz5sCAd1I10'
-             b'rzOcGgG6ID31DOSJUGUZzvwt+eBGfVcdNQlhAi5ddwU1L48+8jDtSFFPRR9LFGhOraSCyi2ELu6C'
-             b'kXqcyjBokuSzZsuW52AFFincCdXiQOmz92XUbC8ntHYjcWXNoxOzAoShMXL+2utugDfeeJPE8GpU'
-             b'm7libImk0Tsq7afLjnA5Zb20qqce+fk/WXv5lY/2+lNXNdVoz51iby29nf7BPnj+qUe+uvut7Tf3'
-             b'NLgD9HowRy82IqHQrgkAEKVb5XmbHIpvvWUD9KSighiz2upoAqyxt2JZ5iR3STocWtCnTuv+n/0M'
-             b'ZiYnCAbI5qGFt6synDzY4Q2F6WaMPuPvStku0ma9FLOgjhNKLReLJ10KV9o5pr+2KKqhQw/D/EWL'
-             b'YNnZZ8M5558DS5ctg0VpYsL9GRZV9HoLHYbs0Pwy2K7LW96Pwg2k2AfpHnP8rHRpAjWhvVQQqyJg'
-             b'yjDGsPf2LqSDY81FvCvDSevYsRNw4MBh2L3rQypaE1OTREHvSQcqwrBODl6KK3cgzgSS/0THYW3d'
-             b'e602S1gc2oFgIdqnoWqu6mH2nuihCGJFux6MtBCqOkVoiIDUQ55ka9EsEQXeMemDmYAu52nJ/lMP'
-             b'VrpWnMUhk11tC26ybdKpxKvNUsw2HBpHrn+GVndtSm0mdqGxA7tHDUMSxApK6dB4X2NhPznODL4K'
-             b'iqwx21uBCa/NB087bE0JVgNXpaqI0LvSrjxkDjoTZ6K5dGhjk1OHXSF6APMeVDNfbBajOqw4Ca7A'
-             b'Rgz3hWaLlYXkPAkLlT/93uTYaJquxmHB4qUwsmARM0w/uptTKL1qZHclea+634sC5xJUn94XIgSX'
-             b'XHJxmtgG4Kf33EMECxKHt800S0q0Piti1yXaMAUGnawWaoKrmrBv33744IMP4fzzz7f1QdbP+0Jr'
-             b'7+was6bO259Xpi6C/J30vobnDcP1199ILGMkaGhunJGn6JltFMJnSaFqsvawPz0bb736wl27d76z'
-             b'btWaC3aEU9SFotHbd4pNUhXSN6fmPX7vD/6wz6cDNRUs80mzpNlY2BQ5MT+VG1rgtU46wNetuxhW'
-             b'rloBM6kjwoRcEipqQXHsn1aJcakewqYpEIYOHqaPPvww50ENDQFFMasAJ7rCqzx0L9FjsQF1WQqM'
-             b'+wUyDtWx3JXsNWeJomqNlKdLJnO00o2EOUFIdV265Ew4/4ILYMXKFXD2ylXQ19dHlF6E5LCw4s8d'
-             b'1OVBUXXnBLZiMJOSrVwldj61TZBlyq7Ry4Mk06pAVX4IOmTmaokaiGZRg8SKpcvOhGUrVsL6a66B'
-             b'yYkJ2Ld/P+z68D04sG8vzM5MQQuFqbXsbfCwaDSMlciTaWHZ5jV0T2G3nBEW9LqHPMUGIR44g4Gc'
-             b'xGhUBawikFso8rnAGxQcBE5T41ow8nE7sx2j5EwpbCeptE5C/TjiJRTxFZKiXIuTe7sD9dxsvv1i'
-             b'zKajUbchoZBHFAVICsvs1BQc2reHaN3MlBOoNIZsXRW54NDd7rNbnZqoqruETj/E+uvKRHJWcKK4'
-             b'gBfonvSQFU1T+udpjA1FF09TvBrYFjC4K8kx3WnHCuF7cc6gn0OyuI4e3AvTEydh8ZKziFzRqeuu'
-             b'6xZEcuFKEkfMyQOmP5RQQvxpp2daBM194Rd/Ee6552fQanXk8Fe7JrUP88WzJe4PLke0Ubw9NtiU'
-             b'AzYH217dBmvWXAia0aZnhgV8muNLNOmU2ZCZqiZag41MyEvXXQqvvvoKjI6O8kRMBK5IGjvcM2fH'
-             b'lbzzZtqmhDhOjw8+u+nJf7hq3bpveTg1p6lGo6/n1HpHzQF4cdPjv3Zk786Lh3ormJ3tsIhU6bZR'
-             b'x3ZdXgcuPiHrC5DZ1j/YD9fecL04UnOXQ3BDXRf2Crrb8lkrI4tvEvn198Lrr74K219+majwtXTJ'
-             b'HBMds3u52C0xMtKQzqruxphdfuicuBjbTe8KPzI9kXFKMKNIPITm6KY9Y+liuGjtxWTptBjhDoKt'
-             b'2qkwzcJJ0tEE+vNEItBjN0j37Qv6tNgSxTKRSWzTaCGsuikRuUahwNP1Ao7IsNRSnbSC+s5x+GDd'
-             b'xt9LRVUexp70mVx0yVq47PLLCQYcO3YU3nz7LepWI+p/nC+MchVq5EJNXmt1yaSrjCyjhqhRsq90'
-             b'z+/kdTSSwhURIGpKalCbeePoAZrTj/F1KKJbPd1CLnr6fxALhxFZpGuMvAKWWGQp5wun0E6EuelJ'
-             b'UKzVFZELOUle3nfMCTGWKCwTH32G6bA+kg7rho+2w4w+2/FYPpSKng1czanN3gxXs4+eMxUUZJG2'
-             b'FD4u4FXeyyiDwIgdkPPaIB9/9HN5L9MXF0EKq5QsNJoKxVVe2W10XwTPDvJOXOsjE2+QODM7dRL2'
-             b'756BkfQ8jCxcWIQC+m5nFr0W2vzJDlTBF4AMcaNv4fnnn0f+nvfeez9ptrxrgrK7s42zk88qWgSN'
-             b'TrnkjlZzQa2qXjh4YH8qJsfgzGXLyQXDhME6JXm5tyqJJyko7lHNaIvCiwSIwVSYL7v8Mvj5/Q/Q'
-             b'vo4bdE5ipgEkZjFvlH14VXm7d/vTBLZ965Zf/uyXfvlPh+aNHI2nYN5UgzmlpwjOlzrv1tTJeY/+'
-             b'7Ee/PdiM0JM+3GlatAbBkr1NBnzBxecsqEBVluZ1G264fgMsXLyQbgY0KdUcFgsZi8UjSZ1kMOcA'
-             b'PK9QKIfK/E1PPgn9KNAzkZ3kCiGeTVY1weyDnLo9CJnCeSiycaRr83zQe/F3YxyZbYeo+5cQQdJC'
-             b'YvFptaDR3w8XrDkPLqPl67mpeA5CKz1Es6koAeLRlTfGHkFgKggVGMVbzkxUhY3FWDjJyAgql41s'
-             b'kCoRb/y+fNaFhFhMN1kuyA9ZBSIgFcJIpccb79fw+6EIew6hup4eWL7yHJoAW3OzBHXhn+7MyXRT'
-             b'Vbr3Fs2SxVTaLjBKEeI35M0Sx0FmWkUN+tMMJAt+1CDEHDoI5oqusd7e9iI65rh8QqXfasjw1LHJ'
-             b'k/EYTwWVYGrdH4krAXa4yMgKSIF3PhfZAGKcqyF4RVgf8TiCJeeWYDKG+x0+tJ8CEFXcCdIoUPMV'
-             b'ClG78133ovN5yjEXBxGdO9NDudzNQw66hJjbm9q4FXrNM7IZJRYmqg2+XNpK/AmdwPeucC/RKagB'
-             b'HMlOz5VMz1TcOkLlFzExu1F0YOzoAdqLLj7rbJKvqJjdKctP91KF2NUZQ1ic8avMEp5Nz94lF18C'
-             b'kxOTcP8DD6V7th96yGPSM8mm5ucqOM286k7LNm0YSQIahHC89NLL8MWvnJOm5zm7HzFN10kisu3U'
-             b'gwYy6lEVjfUHOll7T6+57vJLYdPTT8PUVIuaaZ7QdD/uMuOYgjsJ46C/4yvhOuPEwb1nb3/h+V/+'
-             b'1Oe+9H/F6amPzManQpE6leY71wtbn7z3G8f3vX/xCMJz2Gl5PmTooA1ZmaBLfydHl87MCPOdf+5y'
-             b'uPrKdemfO9YNZlcGZ4cqSOftnYpfa2E1EUUOnn78SZiZmaYbM8rOoRLz0mxTxKJQH6vMAssphXzg'
-             b'eTD2jnbNTiKqcbEa5b81qdjwvgeL6/yReXDVFVfA2ksvhqVnnkVf0+4wbg4qwCysnEBcqXXq4SgI'
-             b'sGhpKrDaSSuTyoshrHRrmewtU4ssi70torMTeWaeiHhWYhoYrvJZ4+WimJKq0SkbvU7PtonlR3Nn'
-             b'zRBMPTdJr4e4OQl3ET5qSPFUVxGBsMyrELs/J5lMep0VehOBq4UzqsDX5eytPKXr/VULLqUOFd72'
-             b'UuLRI8wsJtsQUy3ICexL6FjDGtM1ToUJqftMk8+CUSfUcn0tZZ3hvstZPIW6y0e7v/DHQ+/IiRNj'
-             b'cPLE8XTvNAq4OBo9XaiRNjF7OQR16c9mtg4KeZjtv5RlpkJ5L59lcJmuxH6uOe/LYtFDtEh6iAW4'
-             b'pixILZriCqIcwBhiEafmBMICkYRA/nmcirbYNYVIRlhY0nR6YNcHsHDJmWmqWswkjhCM2l/EOGem'
-             b'JOSQUzKXJQieYy7Qvmn91eth9Pgx2PL8C7R7deIu0SB3fiZMVFKRo8sMSExHQDIT6796qYl4//13'
-             b'YfToEZi3IDXQ6WyheynoDskkZcUuUdjDtZf3phhvg+4L3DePDA/DddddC4888kQq6r3Z8SXmZyDa'
-             b'1CzGSZqTlV6/L7355556/NduvGXjX5oD9t8Xqf+/XVQDZk+OjTzz85/8dn/VSYeXEiGEDit7JEXG'
-             b'6KJ39PcqKgYYF4+mo7fe8ik65NodjuQgfLjysnYIRTCf0JmxQM0FGeXTh9Y3CJueeRp2vvsu9Pf3'
-             b'kyVJkEVxrVENttN2ZkFTZukqdi5pHFkl78DiN5wIYZ0sbtskMI2wZOkZcMkll8KaNReQTT/GDmDH'
-             b'pFb/1FEGl1l6YswKTg+dQJNhVbt8cERXkE/A2lxlH5mtTOnRa9qcYItpo3tEockrkcN768ppH+Nq'
-             b'mwy1KOB7VGoxQWFVZQv5bG7FurMO/rxCEYdOuk2rJu0IdZGuuiEqxJXPB60e5KqXC50MuxmjM3LG'
-             b'j9nO60wdso2TvJ4aowcRsKrYhI7dqrafR7VYIFM0G6t2UmFqMx29rq3DVp8+V3oix1wM+RtWJthW'
-             b'v0Zs0vhrudFBQfLRI/tl0lQ/y0pcRby4bnhz0GBphkTPmD7Hde+UlMlp7LuYSRfGFlOBrPqrRSMj'
-             b'+byxselTo1PAl4Giks0WoTuyw0MXW1cja2xTpUXT5fdb0zVvys/tKOLk6P49pEtatHQZk2JCyGxC'
-             b'p0GowRi2PjPw+b4XlIzyw2IbbrvtUzCZprS333oPegcGJeID7HnUVAIvtD5MUXDWLDLJp5lebHpm'
-             b'Bna8ug1uue0OaFNkiIqhg+maRMbFBSrktF16DoMkNEA2qEW0BSG/57e+CK3ZjviGZud2JreANcvI'
-             b'qFUADe8JJNMe3P3uNTvfef2Kc85b/cqpFuPRQPrixy/cBegZHIQtTzz43xzft/OihX3knEi6HEZ0'
-             b'JB48lNk90Vy9aQJIh3xnpgMXr70Qlq9anjqgljHFlFmkvnYZg87R5xwiV0Nf6pT27N5FqZ5k519n'
-             b'uCRIB1XhHdzkwEO1MfEaiyGCzFriviN8RDiSN6KmMMedUqeeg+XLl8P69VfCBWtWS1Flj8JGb5O+'
-             b'ebtdcwInAoWeHzONLvcyCdAuQjKDwDrfaO53SI6gQ8s0Kc66eWvRY6HPkgOGunyBKqOp+b1AZrEI'
-             b'bysiTeTx7/4MpBCQZXZdaHBkp+Ezu5Ej4oGuTXqyoKZC59itAe2qmg3OWYrBdjW83+uIuFOzgJTB'
-             b'FrhhcJn95Y0FFnKys+5LvKj31Q7JxWLfAWbFBBJ+iRAe6W7SQ95pz/JNoLsFxodsVKnk/YUCcu7S'
-             b'96hDg044nveeykzDw3j08GEynCWPQ50yg5n5ZXutUDi0u2gNVyw7ltK2SZgxlVIjhB4OPkIsfBac'
-             b'+ecJXG3TOFAxzAXA216TdkDgjOCk1HRXhHfqZyFCPdOJBCVwxPIOi9K01QVcB0THP3n8CLnNLFm2'
-             b'AqqePujETm6YTFmphaoSz8Joru68d2O9Hn7Pz3/uszAz/VPYu+cg+L4+3jk5ZUKCUc/pHva8C64q'
-             b'zqsiN//0c/X2NOC9d9+Ca667gXRY2AHrXRDkjuDOLpSYhlyHung+ve2x0WR23vAQrLviMtiy+Xla'
-             b'b3S0uHnXTRoEdVn3ZmTdbDqYaU30vbx1829cdMllr5xiaB/uWj9+xwmcTE6OHjnjmQfv+dYAJpR2'
-             b'+GHAZWpffw8dJLXuEsRRwcuOI2i3lw76/r5euOGG64QO24CuZGo1zlSoRboWnE6Q5t5IN89czT54'
-             b'mzY9A7PT0zDY1y/ODkHIp6yGb1TeoEJ7sPQ1pQpWbBgmFHIoOOXRdgMsIpyDMxYvTDfttXDRxRen'
-             b'wthDivI5YhSxS3LQG66kOZsvSw5+V8ogHxiV7Aa0iKl41BulnKYu1yWDzuRlW+i77HRdh+yKbUif'
-             b'wjWQ6dKxewHPO64OT7tCoVYqb23L58gYvwpvQyw0W8RZYmg0RKGdO6KYo/6KfI0qXeB7yC4+zux2'
-             b'gq1lol0qDd/T/UGpjzLGn2NKfkNgLijc8ZEKHOY6dM8geYHCAW2CU8YfHzBBD2NhTIaSKMNVTm4P'
-             b'312xokDGIQtK8R6cmThJNOxKlxZq9+CK/ZtySjWq3QRKwWZHD5k3Y29Fmrfa7BQ4rBLfIrrQ16oD'
-             b'lHwpKHe9kOElNKutdQ8Uc+xGUG2hNEXEKtUgRkklLmyic4krUgFciF0OGd5pU5ij2tFpozUzCXt3'
-             b'vQ/Llq+C3tQI1526q3my6id5b7pba8/V4o8ZJKssUqjhZz/3Gfju3/4AJian6d+jwMMNMpbOsSGu'
-             b'FpRE4LYgZCsUt48dPw7vvbczFZWrYKY9yfEwlSMnCoT1Qsgp2vqzqDeTM1GAk70TC7bbqVlZd+nF'
-             b'sH3bDpicbnNhDeobWXjHS8Oo1l5eYOmhdO5se+7Zr/3ir/z6/zqyaNGhKPllp8L//MduIIhLxd5e'
-             b'2Pb85q+O7X1vVU+DR1MihqWLyv5ZQg4V+33tzHHaaEi0OaaKXrTmAli5/GyCx4JCdJV26rGgAINN'
-             b'Ehotjr/Z399H4ri9e/fSzY8dCrOQ+MYh7LnRAN2umOml0yGAYS4+cHJEeNQYDslQwq4P83zw2356'
-             b'w83wzW98HS65ZC354eHoHkPWKeF5UCO9ux2IuaduCvRadRGeFgS3L/ZGQQ6sSvVNdK2qvDjGjrzy'
-             b'ZHSQhpL0kOCDwq7ZSGXGPCO8NhhZ3Sh+VQLXOM2zoe8rMQXA0w7T9L0RM2zijLqfC8xeC5oyLMtx'
-             b'fAA1TsP29sJo83VecOPXpALfak3D3NQEzE2MQ3tqEjrTk1DPoBnrTLpeLbJGImiPIL4OO3AILMdF'
-             b'tOKltbm1F22kZCw1xOPP4QVP01JI37OTDj/6vunv7fRZ1rgI1w+ECqjLew4HOQ8pK4dEi+26MQU1'
-             b'UFWij9TdOmbSCk6K46OHzNXdqaGsfq2ieWbP5aTY83SD059OMTF0ZTYbUy2a+7czSnQt1k3E+lQP'
-             b'PMlSCurwrY8F2nQR+SYIjOrtc/bKhpSpLoYcaKZyrAgaMQ8Udsm+fLmFsKYQ8udWZ6UUEyukqLl0'
-             b'vQ7u3ZUmq2M02ZQaMEdsn6KxkeJQk9tIZCRF3hASKRYumA+fuesOev/oG8lZT7X4durHbMpbTiuW'
-             b'ZlZbA4zZeOeN14hCz+cYw95NMbK2JkpLtS6pysY48jlJbL308KJZwaKReXDB6tV0BqARbWbeSmyN'
-             b'UY50H8nPKT7/mCgxMXrozNe3vXwnNtbkCXqK/GoE93FPUR6mJ8aHn330/v+u36cDJTbo1vaUVdMx'
-             b'oZtFPZRaJtsNRRgaGkxT1I10c1FYmdwrGgcNspeJhv9Xeg4ZE+7E6DHYvPk58tlBFwN6vGJ2Ro+Q'
-             b'KdK2WBb9hpP8FlOxGL5d+gsifNeiyIU1F66G22+7jfJm5mp2Zq5IdCgwmcVBeAnH446JICvp7itX'
-             b'bABUo5WpAfwTRmd6DF134FKYJjnq/lvElkJ4Cg9aMphFfz483GWfwO7QXhzhK1oeYyoyxqaQ4a/Z'
-             b't2g8hzd2GsTsdk2wY1DhtWiBnC8ytMDgUbaeyZY8DCdmcoqRitWENmikBpvi4r4ShK3ojcTAEFgN'
-             b'2WQ0VJU5juP0Tf534ouHVF68t7BZ0eKouqkcHV7kfSl0CrUUphweaM4JpidijjI7+OsU520SYpp1'
-             b'YRYqBxXunE4eOwpTkyfTYdc0/RX5TjrXVdzV9VonD9zu+yK9tTIziSDyBBH7itOHM689scXCwkO6'
-             b'n6agF/m+AmWFep/JQaWo2NyhivhzbV4sCwoKI2YoSxITK4IwVk1QnYfQIJAq7xCzNxDB5h2G+UcP'
-             b'HqDDfMGSM3lHpcm/sfDJVKiREInKmIo8uaTJrDUHq88/D265ZQM8+tiTqYEZ4OfQaVKbN5o6yO6U'
-             b'DGf1uqf30+yp4EBqhEePHIIFixan+4wvTpB7OIpuMwpNnpvoprxGne8ZaZLbqXgqYeiiiy+E1954'
-             b'K50pHZtCLQHBaSBljqrnHDEmWDXTh7Tlyce+duU1138nnQExniKEhUZv78fs3dc7CDse//mXP3zj'
-             b'1UuXzOsVSEItRyp50mQP4krmGd9IVXpg5mZn4dprroIz0J9vcgpsGxR12evNUUlbTRMjigK9J00N'
-             b'T2/aBOPjJ6Cvrxem081YNaPEbAhtO8rh6jONmdmiQkwQinYUmK6KeWLB7zM9MwXDgwNww8ZPwfqr'
-             b'ryJLFnIPlxuaYQVfAhw5YVM0J5o+5+VBit6bvqRkvHsj2YIUOXZpb6X3gE7K0zh1oMgZITdyo2ib'
-             b'd5oaljqh9mrFNydpzxMqarR6+wegt68fBoeGJUuHu36Db7pypJwcnjGH66nvXSyoTeLUkPd4meJc'
-             b'GOmYBghstQ451t6uXc0wo/654CwvyUEq0m0teMFskHAG8LJsLkKL5fu5bk2TImia5ip7A6WVK5Ek'
-             b'WiBhwXaz4LxgDES7b6PJuyUXi81xcVobGzvOwZraRCnDUiyUVH5jVkC6fNNu3FBqU2XzZBq9aMw8'
-             b'Z3eZKDZbYlHhr8XeK5aToVxnifhwIe+QNP/KxUxd0/wyndxUUMz3RG7w1HowglLoxaxZ0p1VeeDF'
-             b'z1NjWji6Q30fnRkcj40eJg3RGcuWW/qtftbZJCBCDq6SXVsxg6CY/rrrr4PDhw/D66+9CYMDw7yD'
-             b'8uoxmT9j7oK9UcexOCKBAhugne+8A7+wYRnUczNG9uG9J7uIWPYauOyITpcg26phwcdJDj9HZASf'
-             b's3IFLF+2FN7/cLcgKy4zWeX+8nIpfZFph6/el5qegx/s/NT4+MTFy8457w2iyZ8S7D7/MY5SqAdq'
-             b'TQ1ueuief9bj2jRFRVeZawC5Mxe7DdVRqJ4J5w40bJw3b5hoorjfYZU3iNgPbFlvi5UivdQIRamb'
-             b'3vnu+7Bj2w46cHlfkOM/wICsWHiaKaUzC3UZCfFGH+UUVw/tNClNT0/ChRetgTtuv53sTBA6CAIR'
-             b'6I4q2qEc7KHgBXdt57VCGeQoUOiD6CcSf8DK82OB7C+c3KanpugX6nNwKgBZVHuZ/pjq643PEYtd'
-             b'DsRmEfymcwx/b5y+kPKPURDHjx6htOP5ixfD0MgC6razc4TuL9gxIiojKtSy+wJbspsmVHdnLmR4'
-             b'TK2oQjAPX2dxyewhR5OSOj3gHswCLX1mXzrRQkG0GA+nQkqdZWM+0C2OXNmUIeuG8v7HFdATFDBv'
-             b'QUhRskJQi6Es0NRRInbto9TmRsCv9MGOjR4h6nJPs8Heg+4jmzTv8vSl81khOs+Fv7Rb0uk075OU'
-             b'dFKYKFnKbQ6oKMTnKllWvZ9Mi052y5ViYS4YscPZrkkar5x/btAbfa00rcGSq0s6Ri2wemBHipiZ'
-             b'ojVN4z1sFiyfBaIV6KxedwIsOftskjeEEAoSUcgsRwslhAyGemcIzJ133A5Hj47C8dFjZKPkBDFQ'
-             b'TWdJSnExB5NiTD3uwN96+024+obrWQbS6Zjzi6WDOy+XpqL7OGO5TFYK1kBI85B+jp5UANdeeCHs'
-             b'fO9DnvzxHo9ZH1aJqNxJ+nSUsEyCvdOfnpsaH3h165YvnnXO6jdOFWFvA/H0j81cIhWE7c9tumv3'
-             b'29uvTp8Z2eMgvmpakUKl7iD7jIHoSjBpcy59uNdcex2MzF9IU5Qr1PIArgsmpH2O8yasZMoqf9+n'
-             b'ntpMtG4T+ta5s4qGeUvekxp7yoyFLhZRnKArHl3Y9Tn9dXpqOt2QFdx51x1wxRVXUgGkVOF0oLex'
-             b'g+vwweCjxpJHiRTIMQHqsweFBoOgTjlMdQrB30Km4PTEFOlnWq0ZKgT0sLqKjpuehkRT13WGIGL3'
-             b'wRA1SVVXeHXM+U62wHW2j/OiM8IsJHTfnkiHwPD8+TA0b1H6PJu0qrEtuFhEaYKtUaqj0bcgcwFs'
-             b'tW8dfXY317BAbwWNTWXNttwW6U7gRQvPC2VGlzfxKkBORgYrMs4MiV3hJuCKFZLCYlFwJxuyfSaW'
-             b'OFfY8Eg37OTQcxIto5EzKtrUIMIo1wk/k/GxMev0mVDEBBi225JCH83cSWQE+jM7kW3bel/o6SKO'
-             b't3sgmEWS0sTVXkmvkZeXzFsvD0VCBk/yztt+yY75WETdmxdhfg/kIk7PWGVyg9pgR+O/SeGKcn2F'
-             b'5aoTmIqwCwG+Eo2IMo7JudMTcGjPLjhzxSqoepqpeSsjdliGZISekD0N9bNHeH5gaAg+9/nPwt0/'
-             b'/CEVOiLxqO1QDBbLo5BI9kJET9AKRlOBQxeKFctWkOtKpw1FUm85pueo+mgMv5hrlnM2ObZSI4rN'
-             b'8IJnn6dEgkYlWW4+m1k7FXJ7hju9UOex8PWli/jmqy984dbPffF/T81w+1TQTHnvVHvzX/9XOr3c'
-             b'1icf/c3UGtKiT+1PsmtrwVYCNYStBE7zBF8tWbIELr70MoLNYpe1kLfxFsQd2DrCkO120BX89dff'
-             b'gA927YFmD4cYgsQ45C6SYRbqUEvcXbVCwiyqVDTnuIubSg3AvJFB+MovfwWuu+4GqGvH3mJo3VSH'
-             b'rBkRbZ6KNZggEljLUOkkUuwbVIFOHVUgsoM6RB9MD97BfbthevIE+fhRjhAhFzWzzOo5CklEvVcU'
-             b'BhASCtiBWzb2+PudWpbGwYgRFOaH/14skzkHKdhSvyd1+/XcNBw7fBAO7t1NLLSGz+m/7DwQsig7'
-             b'FhYzXlwquvIbtIZ6Yx8Gc7F3tp9qaMSJ489B7YmyCVDgzCcxxqVgPDOpiEI8ccUy3pldlYlqZRfg'
-             b'dSLIGHIW5+pEFO0nFplAHlucFJ0ynTXTwCHfW8UHjru/ibET0GlxPhTtJjPGWTC4YheNXQ9rnX9o'
-             b'6vAZauMv9zKpyHv2WviFfSckHIXv1G7KFUQTggi9+iuCidytETDyADclwRdRRwp1yfdhkowkGBvB'
-             b'ihm25KkYC8ErwsrEPvQFDVzgMsE9vTU+wSJKcL/anp2Fw/v2pGvaInYdW89HKLBi+zvpwHIkMb3G'
-             b'XGsOzj57OWz49K1EKtHomNJhUQ8ep2xZuytYq7f7/V3iQi/OOSFPplHgQd471nnKjs5YzebMjghC'
-             b'xW4z8+ePwLnnnUMwvhM6PEOnKMFodZk261tUhi4Ke4/sfu/K3e+/ty5KhM3H/atR9fd+LA5I0OyF'
-             b'fTvfuuqd7S9s7O9tkDuEb/rs0hIzPMA1q0zbzIfjlVddBSPDI6kgTEqooYaPyghv8EcaG5sMM6Et'
-             b'D4lvvaMbbfPmZ8lGhZ4yYXz19VfmVB5Vs1As93UU1/2PMrg4LTfSMvPiiy6E2+64Hfr7h2Fycpb3'
-             b'VFLgYiha7pg9umw68kXnrpEZKjskRhDvvFAHMpampskTJ4kCHUicJ/k0+kDLgU5en3qwNCqjIPDk'
-             b'Gu3hq5RXVUwNXBfESilmgWAungxzsp+cp251LhXpw6lgDs9fAAvPWGK6KvmDdmiriwL3Dd4OwRwB'
-             b'7u39OTG0ZX+4Sg5CZp7lJV4wcaQXUTioX6EUgxoydAnFIdZF4ghOYuX5QVfokieQwtM+Qp48pXLg'
-             b'gVBL7oUVPv3MZSGfHUpENxSjwDpUrY1Vh3tDFDePjY2KHo8JASw18ALN+hwL4xgMC5IDplT0ynYv'
-             b'AmAbtJuFzC4WXD+F1mhfmjVKteqkcBqsatm/BShdlGynZLRuKWsK2UngZJTpSlsQdUjQ+u+NFciv'
-             b'WVFkiXx6PkOMYruYpzb52giZjOML7I7kJD2cXnwwFaqlqdg0enoggwvREBTdRUbz23SWkdVqtWH9'
-             b'+qvh2Ogx2LHtFRgaHDTrKi/3eyjtmArJSk8693bv+gBa11+fmlRP07Be4zzABLYUE9izi6GnRr+6'
-             b'N5fUZYT0r7zycnj77XfEYR8oDbgOHfpvmDZt2WDyXrw879jghdZUz4fvvnXHBWsveXkufPwSpUbn'
-             b'41AXO44x3/LkI9+cnRzrGxruSx92oG6/8jV0ZSgr1CN4OOfhsfnq4jPOhIvWXkL7HXSW8JQbx9BO'
-             b'9BoyqJNVx2jrrs2dEbqGP7t5Cxw8eASGRxYYTm5OAHpTQtazlB5r9h41cZVU/+z5dc016+G2229P'
-             b'D0ENs7NtSeJmoV5QdpjBKioqFO84L99HDVSLvCn8+bCItGam4ejxI4SvY24WhQyihVAVxfWgHEX4'
-             b'tYPFp4I5KQdNNS3MLvMsoalDkgwbQlfKZ6ZM54nXsqdEK4ZfO378aLomU3DGmctSo9Ar+szs89a1'
-             b'35DDMhQLe7v2+jsxU3KhyDZSUoN3Om2BGbQqAKYHIXu/iUO2MRJrm4DYRSOayWsemArH+sKeNwaN'
-             b'XNCmJkdBOLVv6hI5u5yBZHTQqiBeaI4UN1bjY8dgbmaGplItlrWy3iJDjc4Oz2iWS0VoFZRWr5nt'
-             b'lQkoHrKGRu8bl/MkhBEm91CIRq3WJ6UqnZgMapReMeQDX2HUaESdbMRrrb2TYAw8dGP21cyHfOxO'
-             b'tXU5w8ussUSALIOE3P+SgyW7RdphzrVo8j9z+Qouq9ZAFs0INQO1NchqJ0U/ex3g5g2fgoP798HE'
-             b'+Amyqwohs24rAx54qqTcMXmNo0eOwJHDh+HMZWcSkco+HBP2BYN2o0W/AHgoDJCVHMbBINDu1LBy'
-             b'1cr0mktg9Mgx6K16ebft9fEvWMiFqYHGlmC21FuvvvDZjZ/5/J+lhreO4eOF/Dxio//VfzV7YOr4'
-             b'saUvbXr6V/p6mjz+h/KAdF3U1ihaili4OSOchmK4gcFhgm5MeChwnc9k36L4cGeMcBcebVMTk7D5'
-             b'ua0E89EDLtgzf7+81MduNUTXtSj3kmBayYPaoNE4Fah2G2686SbYeOdnKO1zrq3U9NIyKOu+TOek'
-             b'C1Zv/BsLQ4tSB3tx0my34MiB3bD3g51w8tgYfU/EwpnBJx2ud/aaxP6rtLCKezh4+77eyGlRDiql'
-             b'48bCSEzrgk8PXMWwrLL3dPshB7NOn1kvz1Bce3IKDu7aBVPpIa5U8U9Fr86+p5JOrEJiYy4YBh+y'
-             b'H6BwrDU6wrs8EZArB75uFCahZBXxTKITGNihniFFLkxmXSXzVjB1j8/s0LJlt0ZDLyCYLkzF1cyH'
-             b'kRBFutc79solxO2gIX6EwZhm+LmeOD5qsGElbFUv/6cQdqZ1atqxdssawKjC7FCi6KZRs6ndDujc'
-             b'C7ii4EPMrimc0RahAA+N8WostyDvxwhrakwsTEDdL4aPEDpkCkEIIJrZroOu+DfI115NGSDqeRLz'
-             b'so1GyZzkHYpZFpGHmekJOHxwn+SMeSNp8bimur8K1Bvee2e5YnPpsxoamQd33HUXFb9KtXwFdGTP'
-             b'oznz8/efnZ2BDz54n5KxOeE5Q58cleIMrlSD4RKR0hPCG/O0ot06NuBr1qwhw4BKUsDVbQLfo3dF'
-             b'nFDMWjr8gHtTkT2054P1hw4dWut7+jiP62P81YD4MSiLU5F6acumXzp6YPfZSwZ76GBCAkHAtNWG'
-             b'7/LY0gBDEMNH9d8bGh6Cyy9fR1MLxqXz8+ANKohisWNQmRhNBhHd9jZ64eUXn4eTJyegf2CemIby'
-             b'15HVDtR20LiYP2QZ0YyGHCKLX/EGw1F6w4YNcOOnNpAxLYfwqXsBZAGhdLpgxzhDJ9F0Ft5U5qRh'
-             b'SNMf4uZHj40SRR5vPCxKLNgLxiKL8v3U/MsV8Ek0yEo8HsQhnP85cOy6L6CDYrJiCne2flE6tQbR'
-             b'2YEWWAsVzDbHmcDV0a5qFo7s3wNwVoDBkfk0dYIdsDJoGkmmMJDvosbLDgX00CgW5GAGCSRsrYXg'
-             b'YsLj/GQbtRmKlGQTHgs8bP6Keth5sKiT6MAYoi4DSPn9ZP55FqfaKf0RSr9mi3j5nrGSITXQRzl1'
-             b'8iS0Z2eoQ4eQ4U+d0Bi6EWJRjHky1IITsh7Q6O9Ky3fBJrqQVU3kLMHrNYGgQzRtDYRy6Anm0xd8'
-             b'NnB2pf/w30H7xYHCF4NkUQijMj2FJk2sSy8UdTFJhiLJtiDymzQEp55gruqZbGOEGJ/d1pnOjtd5'
-             b'HEZTwVq0ZBmb1tKbqo2swdexygXRsxEtFoXZmRace/5quPEXboanH3sUBvr76M/Ohfoj0Fzg6d3z'
-             b'9W6ms3Dv7l1kFKt7PIVuYyhM1WJGH7IOs4jTVhFx5PYcd/SXXHopvLT1RYH4o9Il8/QJCvU5W5/g'
-             b'OdRIo1978mT/Wzu237V8zdrXXZz+/4h7s2bJrutMbO19MvPmnWu8NWKqQqGAKgIkARAExUEgxUGU'
-             b'WqIkq6VWqN1hd/tF9pvtf+EX2w/tCLcdDoesaNvhDkuKkNUarHZQEmcQADEUhirUPNx5HjPP3t5r'
-             b'7TUlut8EFEmVWGPevHnO2Wutb33Dz3eSshjqh/QDL/jeXvP97/71fzzRcMQG2qckg6bE8TgrFsZC'
-             b'SGbfoN/g5Wc+VYrLVB2Rk63IJQ4jSMqo80jDr3OwV2nq6Pjwxhs/gx4luiZl9ohtP3lu8SHuh90a'
-             b'WGg4NTGYys+3SlH6wpe/CC9/8QsUmoZwZKcT9YCUrJng1P3mlC5PW1MXxrm6elNKefn5eilOd25c'
-             b'g5XlBdIzNez60KoXWe2kSE2Pv2xl5OQDM9lnKIvbFMyo0+w9fZcWnA5J5oisO6A6ZCV13cbPt42j'
-             b'LgB1d8BXJdXPFM+ZhdKxYqpq0zQjTgshS1KwPGz2Oespq8aLSSetoNAWaEaYQIO143VwpBahrFCK'
-             b'Rndnl50EPDEGE3ObXiy54mhdeZ2+WzUQzmwYWynJjfpEqjO7aIUkzFEOE3G3ZzRhY22VWao8MYKx'
-             b'BWsOkUw55moh91ZMDvGDdoTGLCJrpa8HcUdnvU40JCIH2yFGZfzZ/cTMfoK2rCgl/T40v8tUh3qg'
-             b'KqyWzSVDnhURJOs0qkuZrD6BtWlp/CwHNUuqvoAEjErcjK+KWYIEYw3pXF9ZhdXFBRboWsaWZqap'
-             b'BCXZzpCdSXb3Wnj+81+Cx5+8CHsHB9CCNdtJmgGISs6KLNRfXFwszfKqifYF2hNyg+xk5ZQLH2Gn'
-             b'Mh4iDEb8XtDW6eix4zB34gQLe/m/EZw43LGmJXeNX7ZTzpZ3fvrjX4FhG0KnS9Z1P68fneWN7YdI'
-             b'mMiUd7J46/qLd9678rl+px5SbeujF3gMjTBCsRQVNz4s4+U1Pv38Zyu1OrPzBNTEW/Vd5ALisVex'
-             b'DGp6Y/Czd96FpZUNVqm3TuibrUBmgQaMqkudMfAiM9abZHN7u0xQX4LPv/wF8txrh/WgGkLFnZXV'
-             b'5iBHM7fk5bcs/0M1ycTDCPVHa8uL5COIuzScnIxEISwzg+qqcamFDlYsuaOptnYIZ8WywTHCUhqd'
-             b'lATqAI46qDUhjkydGiLoyFCyCMdvvRV2JbsoEFxYPrtFglYa6E9NVaEqX+Ms34/yuINClaP7MnYU'
-             b'yAIFsZkuk/aSTDI+KNCLaPngomwd6pZbXnRHt02yJjWAO8BZl6VnCDNFkWlZ/ywSnVd3GWxUGjLo'
-             b'RCfQYXA0cRKLq4Siwjj7ZYLa3t7SLCXV6dnyR2PF/X5PDt5qS5c9UY2vlytPwYxMg0bJB3uX/jPQ'
-             b'yI9oEKFzipDrZ3or/i5jdFNY0vfRCqwWa6FKDKMjwqNhpNwAaM8g/zgGdq8QcoJ6FFsUT4z2rGmI'
-             b'Y2tszMb0efjv+p0ebK6uEGR87PRZcqNXMWzOmsYrEH5WT8XqJo7/+aVvfRv+9f82D/u7ZfrFg7Zl'
-             b'70SJFcmonWxpYsE3vbWzB4vLq3DuiRlyekl8rgV2wrEEZn//g+4LR9w6YrWTIqSl14OLly5RGjbl'
-             b'c1HyQDBvymCwrTa5sSI6/X4H7t26+vyN9688fvTkqevEj/95EScO2vQwaxQgl/DVH33vd9q97S7q'
-             b'h+qCPcLkxHh1t1ZxomDssVrcMGUX9QSfef55OH5yDlZX1iB2XIBhVKmNo722dCOmYdUWIYyH/+Sd'
-             b'UqQI8xRsdkRE6Yxos8PZ2T2aIr/Z7HNve4cYhl/+yldIO4F6ixhsuZ/FKYJv5JyjdstBbg9Zxsa6'
-             b'0G2H+7CM0N7KMhtlNmzjIph642CSrALTmAwG0CkyBRUeq01RDMputCku2KERbaKkYt3wkZlby68K'
-             b'I+ee20CZuzVIxDbvq8RGh77lUsgXF+7A6fHz9bqrlU6wGFr2F0tBJjazyMq5shU9zIc7lyD2PGqV'
-             b'nRVvV68KfaIDw7rJ7R1tlyLJxUI7F8ao7uKEbs3iawc6Wcev+iLea+jLJ7WP8p+jUgHK9UHfyu0y'
-             b'RWG2WaVbBnWJUBhZioSH+sBPhfaqnnSQ+WSLfiJ0Xn8BRmPnYzAbIqXmMxyovrXSzFketXEoY53q'
-             b'HD/eYOrUqqTAp/wq3YPumW6dVMHMg43MxBlfIbi4GP6zaFBrTJXxGB1pQgk3iv9WkwDK6Brrw6Hj'
-             b'J6igRE0mFrZsa2kALKtAGH5YXndmZhZe+eovwZ/96f+tsRuIbjR0yyQu8qWJ5cYVJxgkOFw8/yQM'
-             b'YJfPLbOc0kbd/JvVbkvtxuhZ7qqzOX5hbP6fePJJGPvu3+puLsaoPn6I2tTpv35vTSeq4TK+9sH2'
-             b'+uydm9e/cvbcuevt7s+R3Xd8duohGkw0aMUz9bMffe8fdUPi1NhKIyZ2mrPpTxztXAV6Sc0ucST/'
-             b'9HOfpR0W/r0BOghL/EOOI3CGYs74dXih3O9OwJ0bN+De3TvQKzfhAN3GHU+G+zujh8u5o55ytZiQ'
-             b'xdDePjzzzNPwrV/+Vvn5gB5yRKDVM4/9vBJ5yDG5QHTEqvLOPElUBvzW+jIszj8AZF02IbJQ1rKg'
-             b'6kPF3oGSy5TEuw2skKlRQubQu6gCV2EX1oMsGVmDX9ssikajLOwhtUKVZDIZ2c2IBZHZ3SQRicqh'
-             b'hzq3wT48uHsTzjzyhL0f/swyF84ofogSnx2MGt/6SUS2KSEx/MPuA+punUfZWnqED0fURRZmGZxN'
-             b'TTD7IRV2mfg4qUt1rLueNjE9OhksPKKbNnhQBdrZTFECj/Coc9naWKPPA4k5NXcrfkTLYcSH4GJE'
-             b'9HNydmI2O0VDghleSiJ4zlH1zsEyE3V/JsW6EjGyalfBxXT4PWOK4m4SnY9lcnEd0pQEpluzmbjQ'
-             b'35OzNFRIk42UWd8FAUbo3eC4lc4ypvpxRrZ+kiZM/A2zwJoVKakWSgvQHR+DielZcqigXTXBjK1a'
-             b'JXnoPpPvZYLddh+evHiRUg2uvP0W9Lpj1TcR+XeDarzbsqw3M+V8cXEBQocbON+QSsFtM+TR5R0o'
-             b'NYOEw5EjOILeoijrOXrkCEUA3bp2jdCYCmSjw73TWsmKJVXCDiUFs0nBe2+89stf/MWv/a8mEvs5'
-             b'7KTQKvLh/ADSIVx9641X5m99eGGM3IhbpkA3NAin7ISMAqFjh5KHVMgG5VB79OwjcPrUKTjY3a87'
-             b'DHAiQDZLiY5AQadFihoeh8aor7/5szp6a+x7hBFZpe4vnIhTkfJ6EO2UEf3kqZPwrW9/q4YmQuIH'
-             b'PVGHRF25OFiAOJcLlMTOy7wgRfdjdLZeun8X7t+9DWkwoBtKdFuqLmc4juyWSCgl76nhQhBN8O6+'
-             b'IaL/JoOHxF1bsOisMfDJiK0Szc4wiBQ94VMEZ/Ip1yswVEOwFe9KiI4t2iryYmQqeKqal8HONszf'
-             b'u2MdefaDSFL/sZQcs46noWo4G1RsTHlHumvLDubNvvHWTr0WTb8ptAwntbHNPlU5jPB2qwiyNchM'
-             b'9hYjxFJrBlIeWqigZJHlOEpEkOiHBjV8O/QDo2EQfoqyNQ022VT3B2PiQfoIUUEvUDbNkBJf8uj+'
-             b'UQMSU91lSWFJBi+NiGn15YNCqSPTj7Jhs06h5o8HKiA2N1rLHRPnKJsmsgmUBXaTSTQnbzTCZCez'
-             b'32taO+wjswilQJlKI3Had2azgdpAzt+6BfvbO8yIc8zVHLXhqRNcqq7mdPlQ15bgF774ZZicOQQH'
-             b'w5YynuTeHYp0IgmxpwMPHtyD3b0dtahShxWwz8tqbvgodkvQuSdbYeCmrAHOnTsPB5hSHthbFCRQ'
-             b'0QgxNUOrU1lHqX4OvfL3b77/1lc2VpeP1hyw9HP5UWXiD+VHh07Pv/+bv/xn4WA3yHLZpBbmgSbR'
-             b'FvJA59YCB5+++DT9oiV9V2YqNC4/oh0ImrNkSUlYNLqdHplCvv/Bh9DHrCgZk0Pk6afuJqSgWehf'
-             b'VqEwXry9vQOYmJyB7/zmb1Jy78HBvrhnEe5Lj1lMygoO2UwuLRW0pa+H3dnW+grcvfEhrC0voZli'
-             b'hbliVNhE7NGCmGpK1AgSJNrEO6PqtCDTQhhhOoF2yDk5x4dUC0dILsokRhWsVop3huAOALlG4p7f'
-             b'OGRWzHoV+gpmNVMLFYug26xu3Bgbsbe1Qca3oemMOMArMYK77sxWUcpk83SPABYwGMxLTxNiszuo'
-             b'nTmwJN7qnwslN2XVbNXO/yM0NY8mVsS/7h3E/FPUyayeTaOVqE5uySbU7ApkZko6svokzqEm1AY+'
-             b'ZOokTYepsgZ58oxm8WTCWm8Qa8m60pW3MShUFx2BKKjDisumkn1oFkZqUJhOC5hDIQL70GVlg8s9'
-             b'Bkz3t1A+cY2nq5YqSpCCkYtk8R+Cc50Vd49sJsOkp6ToEqV9MD1b4mIsdFFjf2hfGij6R0JBhbG6'
-             b'trhkCEQIzpevwv+SfFzDKKt8YrB/AFPTh+DrX/8GSwqGVDhSljgSvi/aRDvo9bV12FhdVwKRCMRV'
-             b'NiUL8hjM3ICJP3Xqbx3dPWgOG6ZCn3viCej1x4htTFIZIdxk2zNKAjV+iWGqBRSf7c2l+dM3P/zg'
-             b'c7lhuP/n8KOTHpKiOHS7sH7vzqNX3vjJ13rdRg+brJRgFneatbJCLuTiUDqTI4ePwLnz50vHsVtq'
-             b'Hh+uI3HfSSPhBcYyHjPSPfvw1ttvEzsQyRd4oFC2ED4cTTD7JHE3UKgrcjQ3lK+9D+P9Bv7xb38H'
-             b'jpb3s7e/S52QtG0SIx80alvOtqTzSsMLYCReoNB18cEdutkpSZiOO4k74kNdw8sYwmodW4HFnsHd'
-             b'oKMr9DoxxAAaPpdHhKUfDY3LznUgGH/CFUt1DchxhGUHLmJBhKZJYUJx+06il2fPurqjQyLF6cfG'
-             b'yJhW90h8yorDxYgDxgi/KboOM7o9VdDxQog54EhrWotcOu6IYNRbDH0k5BJcNIpOQNmkCRYRIv8k'
-             b'6v014u0nbtluDwEcmIlx5cBEmBgcxMjddhvMHd6b4mqTnZ1JbQjK8BLoLDmxvBALjJRjM7YPxEzB'
-             b'jGFH9OJeWJoTp/SaXiw5tyFpRLIUBPbrs1s3V2smEbvz/s4HUWYhz/Dkk32hd2aEct9L45oYXaQk'
-             b'Ze2FWjN5Dkaakjj63e0NWF5ahKNzJ6t+TZ7LbMxHnfZzZeXi87tfJqPzT56DZ597Dl790Y9hrN/n'
-             b'9q3CbbKOwEZ1b3cPdjY24fDsTJm8DrR465MdjCmasrvXA7jmCvQ+Ak49QPuzw0eOwPG5OXhw525p'
-             b'1GUva8kQwvJtOdU5MsEFrzHacF158/WvXrh8+d8Odn8+i6kO2bw/FGnUGPzstZ9+c3X+3tG5w9N8'
-             b'CgfXoYGZeUIe0UDU+6iFi08/DWPj/VIY9sr16Sl8QAtQbcdkMRl0d45TFLoOo+HqB++9DxMT43qQ'
-             b'V88u7htFZJoVW9M9VKWwl+ktH8C3v/0deOyxRyjugrp/1B6p/tQdsFGEheLVGfQmRm+8xXsPYGNt'
-             b'ubJusl+IimvCR4Pegu43Egt8mcqoBBA7Y/nA4UM+fyTMLzPUJXEIccQGlB/26G1qOH9Ibmohg6Rg'
-             b'DhBgfnMxC6Np1PVBinebEsOsHPRwsAcr8w/g5NlH2a8sqiFs8Nc551H23cgSPquOygt01DlDO8dk'
-             b'w5UjSogmo4XsPbB0qqjkAoOYggizswvUNF8MtVzS1Af2ZARXqHIILmiR5Q/lw9srB+Og3K+RIV9q'
-             b'kgI7f+fsey9HqQaN/PCRywjftdygRLdfDdmgyTxiMGwasuAhupCdwsbuy6B/7gRSlB1mB78wCoGt'
-             b'mRohWWRzwpBJRQpZlPs5mpbJrLj4/BCbMb+vcbtEYLGxCrLlvhVyjoYpJle0zVBWjH5Xl5bITujQ'
-             b'0WOkyzQWMDdlgm7Q+xgqDIj5U1/40i/A9Q+vw9rqGl3PGqhYCVBSRIfDBCurq/BIOVfUcSWYXVrm'
-             b'57k+q3HU91U7rDhCsQ+yiy8/e/SRJ8p7uEGsvcgMs6T6uXp2NLiYyZF3vRLzk+H2tfe+UCbM0PTH'
-             b'88/DcLaDrtgPwwYJP5Wffu+7vx6VTymUXq7cTKSQLl79jrn7RHrkhSfPV7iD9DQd6hKi7CeCTSs0'
-             b'FTeZbiaaghCGK0Xy3u0bJIYdL1PdsDUtFpmjoqWQuluafUtKWW1q9nZ34Fvf/Bo89+wl2N7eZvFc'
-             b'YmKC7T+k+yMdSM7q94U3BBmhlttgaXEeNkuBisEizKNPNpIHOQU70ZIsdk1gKjY/SGsN7gBSUXNO'
-             b'qokKjvkoDDlvkpBHBK7JbnTcHgabEBNHfdCCVzpmOWRZcCkfSMMLXlr/iRMEHy65go01jqF8/qid'
-             b'2t7cgImpmWrtpg9Q1SalNrtu3MsCkplSOEq/EgpG2JvWicdo0zPyhIMkBUbRnjX2OTLkNCqKNU2S'
-             b'kg008j46e6KkBG5beQlcFGpmlwvGxK+xvbVFi36c0rXjlYmkYbRHbK248EdZMSXTY6leLDsrHBjJ'
-             b'nzBKQ7BdiO3kMzhnpH//+5BJkeFdYU4GR0Gv97DrBSSKgoXoMr2orVHLzvqc3CsRGlncVMTPxNmF'
-             b'ZR5f8keo9iGYy0QeoVQII250xUDkFJS05KByBXxvnRypUE1NT5ezpE/nhxnpBoUO673U8D633tvj'
-             b'/XH4yitfhj/5N39cd23la+zuHcDk5CTo2FUu6G6ZpkTnF5poTijZkqrVdzGEEW6tl2zQ+4nmcYqk'
-             b'jyfOnYMffO9vWcQtAZmyhwtqJaX7PH5kMNJ+4fatTy3fnz996Nixuz+PWPnO4CFMUuirt3Tz5rmr'
-             b'b7325X4TnZ+1UCEZ580OqtEY5kxq7LOPPwZzc8cpH4ncJ3wcvBwUjKGQ2BUx1DQwoV6ngavvf8B6'
-             b'iy53WGDiSDbODMH8wBKNy4leCxf8L734Wfjyl74I2zu7qkkAkJs0jTDHBPsmlhnvqfBAxsyrhXt3'
-             b'KXacfATJbNMKgzVFwWA+7/YgJp1qRQPO9FKOfVCfPfM1CzCiZQziMRed0avHvCx4L0nFCDCiq/I3'
-             b'tcBjOeupVwks0g0TC7NCVFkf7KAPgxTo1eV5GJ+a5iKWTWzoQgGT6JJCFQyrg4E2QMnBvNUPT9l6'
-             b'2XvI8cQGBtGZaLVRSEVoM0HzCW1KDiOHrMpI1eHD7g8xzBWY1U9zvO/grhdZWdtb67pz0qwymYCU'
-             b'mWdBhv+hEFWC5kRDJkdziCM7NW8Hlfh6dJwXLig0aFlRyuURKyh0RfGhfc5JQxAAeQ0VXstdFPKo'
-             b'V6fGo3zEgDlEgzRjVjJL9ga2CsFGruRG2CAlBdgUHrOj3PNUNpJsjCSctuoOq1t7S8/p/L17MHf6'
-             b'bI2gSWnU0ZabamGCSju5v78P50qR+NSzl+HVV18r5+H4COybGeTf3tlTW7MKlTRGFvGPpoqhg+rL'
-             b'cmhVBB/U+iqQwzr6h546fQpmZmdgZ3MTeuPjivjUkFawvIc8auqHTfX6ysrhW7dufeHkuSf/r/bn'
-             b'APlFZJZ90j+a8qG8/dqPf3V7feFQFD1HsOnHz81JNEraQUV6YC498zQEMm6sFvcQzGOiEjrllq02'
-             b'9E2nOkbk0KGuDD3vrl19r7yfrmLB9HDFGshmrgXJXrutnfDBwS48Ucbwb379a1RkRD+UecTWPLLM'
-             b'XnRiJEmwXCl0YVjtbbbX4e6NqwTlRK/BYsYddvZR3TKixo0kYZpJaqf4+oAp1GXJ4aMmIHgfxPp6'
-             b'wVFJGz7CIUs8u8UiqJDWdWlJFOvMYlSrVd4nku4fSRGtE3tKrDY2AcFkxEGSYsFiNciVfm8PNtdX'
-             b'ayy9jHbk7+dD6CRMjzv3ZMr7KBCy7ENE5KtIp8FXmYkLKi31xBM9fFqd0FvWpGS+3/LIfg/U51Ht'
-             b'F0aSkQMfmtniWHhCF6p8YJcHNOPdx2ZMdTwik7K9n3xeoGw/67aDfg9MKMhs86QlT10D65pL7LDE'
-             b'8dzt0OpwmXTayr4g5krckYk9s6jW4E5xuM/KHCUmLDNLg+i1cBcb6r3fhOj2cnkEzaIphIkhEnTI'
-             b'Xkjg7Sgyg3ctQbdCvpCkYV5X8dTYQh5xFqp/Xr/3htmzDTPg8DPe29ok/SIe/sE5lWuDFpLujrKI'
-             b'yokgMYSXPvciTWLDdmCuInxPIpKzV+59isdh0k3MDsbjSJKR0C4p7hFGwi/FpSLzvY7u50jwOjF3'
-             b'ggJYJdW7daKEBOaoLtaZZMvVEBYP77/z5ittAoYqH+6PT36Swg9vZy+8/uPv/9pkr4azqQ5Gwrr0'
-             b'IjcKL6iDQPlkjh6egaeeOkf5L9idZ86nRk+HoIybrPAVHR4t6Mje63VIF7W2vAzjY2MEE4rcV7qS'
-             b'HESKGZSai908dg5Hj87Cd37zO6Sr2j2oe4LQCssO75tkDxUXH7FRwdfCkRmhLMyuQbyapjx0OIiu'
-             b'y82yh3K6JO2a5WCK9r5lOe3+LmlS1AFAzFezS0JNCgG5NXftpDgQclTXVpmV4jPoM4kkyiMHTxQB'
-             b'1QXV61j3BSmDyzVi0MhZWfluGX+CJrQzs0dVv0KmwFCDG2shHdrqMkqxr59p6y2SWKsmoYYK58Co'
-             b'h55ZH1lMuUxCsqzPovsKUfedINEnvPOy2HDzxAVwUefyfvKQr1O0mTTVZgvZV7ior/lJHd2RZu7+'
-             b'FQoP5psnE4TCWcLq9DJhfXt55FqOHGzu0NL7N/E9lILqGPUqchK1eCuKDa+4VijDFK8r5ahldLS2'
-             b'ryVsUldQaygmqAtJUsJLvcYxm50TPT+tVRiCk6MwRhoT1DPzsMLydS+XgkxUwYmP5T1k3WXVVJGs'
-             b'+1lsaDdKkUJ28NTsLO2ScOoOTArKyjTKCgV2ShFuB3swe2gGPvf5F+H/+fO/KmfIGLE4A0tgoiOJ'
-             b'ZTUFFpNnLlDh3zNpG3GGkYiRGCRFIVZhTFvvUaSiv/P2mzwBRpdekNQfX/xDkxKFkBUd4cb7772c'
-             b'9vZL79gbwkN2Re/k0HzCUF8XFu7fPX/n+gefn56YLCPtJkMd0fWgtavS9FSNVAiUo/P0c8/A7Ow0'
-             b'7Ozsc91jqrPY/wvmLcSJVGE1jK4Ytijg7cKHH35Yfm8A/VKkavyduZlDNM0uLab19TBtE+BXfuWX'
-             b'YWpmGrZLkWwas6WJylwAFaiS0zQL/hp2S8Y4jfl7d2seDAWcsYBW4L1UD8vUSrGDEWlpw/RjPeRC'
-             b'/R4tErwqzCXs2/t+aSFTF440sl9wc4CzgBIxrmRluSMtRCssHqZJYURcml0+kLhkBC52LZuEGlU5'
-             b'aIgi/hS1QehXN3v4qPjT0mfQqks3A4ECuQHHbHDTEZheL0algpUkz6zjxXmOlm1lh7YdMMIUjdwk'
-             b'KHvS0fzVAc+7geqhW1+x1YNPMUNHxxD385aoyujO30hjQjuoYOpaPTyyTonieye7KSmMEINBsbq7'
-             b'4ntXQXdxUDGvxso+M5cXIxN4KFj9h9g1JSl7lDzgZCLK4Nw/WNSsjvGRXShancip6LMwvc0upiZE'
-             b'psQbeSKDmM5yYxDl+486rdMOVLwcJVpeqftWrAXe7gRpmZO6jtMkzFMlXcc0IEZuf6Jf4+mlkeDn'
-             b'OUNy0C4oooGROp9+9jl4972rcPXaTdLYRZzIUqXA02ooVvlJrSPm3hFHoONR2lDOzoCDC7xB/vVe'
-             b'x/MQIb9Oh71K+TPy6dwiA0jiDMNTW6/TgYV7t56+c/PaY4eOHLmWHnKsfCd2ep/oF2jGJuDa++/+'
-             b'4t7G2szERENdRRDreFr4s4Cv/C9aHo0x1lsD9lrolino4jNPwXB/YASWUDVTZnfjsnP4Ridn6G69'
-             b'xMPyetdKkYroGs6QWWSnbzWtIeiPSRR8cfYP9uCVr71C1iI7uzsahGfKfn+BXZRIrNAA4tlrywuw'
-             b'sjhf02KjRHlXjVO9+RpW6meNMYhqM+NcmgnCksM/avidWL6I3aFmUCm0M3ozR3mg3O5c7scMzqzV'
-             b'0a7lcKJ/n8DzDUfZgNkx1+kkad0i2wGRISoBT5lmsdFhFK8N5idNTc8SYSZJ9x4YTJJrkF0gondG'
-             b'UF5Wdkvn7BxFwML/+IHM3pyVQCL8XAVyFHV+0LhyI6hzBJ183Wxlnw4bdtz25obqUM7XKbG3Ij4T'
-             b'e2VyRyeORlJpI+vVJLNMOt7sjqoR81GB86LzphglKBBTLGW/8uGYy8TPJE/BDIfmaHIMZcexZMM+'
-             b'SOfzFx05RJUDUUWvdf/FH13D0w13/eBk1Sqg8o2JSFWSzG3OCURnenaNERlHNmswz5a1CW3U0DXm'
-             b'ZPtQIfaERu85ElqXswEnqsMnTkM7HFn2OhJKLQbDg0H1Jy3f+9hYl3bb779/ve79OmKTlhXaa8l7'
-             b'j89HZy4gpAyiwYc0ojFFhErMmROYtRsVFHSEL/975OjRMv1Nw+7mLr0PTWwmOL1Rj80R5masZ+PB'
-             b'3ubk2trKpx67fPlaesh7qU7+JKM66CA8gHd/9urX+x2syBG2ksjXW+14kgjQ8ODuiHQhkYfdkWNH'
-             b'4MTxOYrBiKHupFD8VokT2G8OdQKqN1GkP0cL/P12QGp97EwXHzxgA1ETLrqg8AovSAR8k2F3a4cW'
-             b'nV/56iukVxHWW30N1m8wpJFECKxWJZliFdaW5mFp/l7F2dnh2EhmQe2faBBKSXfF0iXSYpc32I2G'
-             b'1gWjMwsRgQ+74CBWmUp90mpdYkcVrpKPGZhohzpOF4Pu9UgSKFj3bsEo7tj9c4Ag/b7AadmTlWXP'
-             b'FUZ8x0a397ILqXlXqVw7hEhnDh0bbQggO7JjfXAp6iVEd/BYrGBwql2x49H4d0gavVL3RdGxpuou'
-             b'jLNl9RMW9F4NS1NQL+oMo4aGyScue/KCkgPcdEyBlh3Y2dpienvDEBjDxymrG5MwL3M0Pz2v8crq'
-             b'JvIRmgtDjMIvkU+JIPTcmhGGu/JaoLgeUZNJ+YxOCyYMseBMi8VXrh2ayDvXXbF4OFaGndl9aQfK'
-             b'RYvYtRIZkkdhLslAq9OwsR9rXTOBe/R5ctlCGL2acMRGLBqdvVoycSlk8kJk+BDNnrc3N2H68H45'
-             b'bzqcX2VGwcGcIrl4RypIg8EQHn/8cXjs0dOwsLACY5gG7GzjqPgL90f1j9GJs829XBfa6T9kPCuk'
-             b'ES7Z5XnqT4yRXura6lXola8rDZLIbLJaYTFMr4gAOlgcwK0Pr146f+HpP0HT44dapJreJzdJ4Ye+'
-             b'sb527Pr7V748PtatbJOm4SWkKk9UjEkKY7a4wedwsL8H5x87C/1ScHZRG9V4Ek1rN1oOfOAOeY/S'
-             b'EDkrt3gzNTA/fxP2djZhgqKdk5qqar/EtiIdPsxQTDd3Yg6++SvfIk1WJdo0rqPz9NYM0LqHh0xi'
-             b'oRSoB5T2SQ5G7Gqhbv9q55wU7xcDUkOHGW/nFrblCkfx8KwQF31UYpNOsYOSzxU4lFGtjDgpV29y'
-             b'57oN2XvdcIaPT8aTohBc1Hfw3nFxRAsTUrIpjGHZVijcKasQuLoyR/NXAwtBRDfqqalDmuNkhxMo'
-             b'aSKHj+yC9AROiufboNFoAYuS1BslN8hO+yhU3sA2ThQ7n5yztytkIetS34S8LKcA28VFIQzI/jDU'
-             b'7rwSdIa0q0Hm6ubmRn29ZDEaMhNV1lirPoAhy6E4Wqga9tfL4NBUsdgS+QGnENd7YzhC/tBqyKSj'
-             b'qiXs0PRPEeRlMtjdPyCnlYP9fRimlgI+lfyAwaadDhnk4j54rF/No7tk6OxE4hTTw7s+ej9g8SEU'
-             b'WhmrNi4lvxEV1ohOrWkEIWgr5d3EWTpdNkwXSiGZ/Zr6XzIhqWUgVAhKbdZHgwTH0Qgdg/2d8ow/'
-             b'gOOnTiv9PYRRH8A6LjXqCIETTX9ivExTn4E/+7O/pL9HeXHlr46NjVVoMQQLngS/i+L4kRA43VqQ'
-             b'gkhwscKo0hC2Se2fMjEwI5wp7/Xdt6+ARrnJ0ABuX+u1iKmOxZgvNn//7mcmyzQ2sb//cIuUE7l8'
-             b'AkWqBzc+eP/ljcX7Z4716w1MNiDOesVHhGbHNMP/hwu7p596kmA/GpzJqqP6vqXQKh0zamQ2B7w1'
-             b'iUZYWSLev3Obw76i5iuNREsEoxLQvykP07e+/e1S1KZgq3S2lc6eTT+kQtusD3WuAaJUlFbLBLWM'
-             b'EJ9AW/ieOkEFejFaTpLAQYndAaKPQxBqOI7yTeRYA4mmkF1Yq2wngbait/hRn6AMeSTsjKcebiGF'
-             b'cGGqyAyjmyu/ZTedTFYBduLvh7++MOtl2kySwsrAkIZRRt2dZIXl6lQ6HOzB9tYaTM0eLt97q3Bd'
-             b'C2lkbLDiZFR6E8lyh564w5ZiLzshfT9JxcDZA/ysyRGyRALfyRrF3zf6tpdw/XSwKiKeknUWa5lq'
-             b'HghSJqjPHXSNkoMVgKmR9tmEzrobkvs4C/kjOTZxqtIL9dIDPZiTOjGgS1qPkAjUAaGWZ3d3FzbK'
-             b'xLC5tQ072zvUOCKleshGqRIlIdK4wK7EhOTR6wXy7Oz3xijpABNjxyf65edTpQGZhl5pXrulmBFt'
-             b'r7zeYHhgZ0AQSncSZ0FNK65nqstjA4ujMWaqM0PW65pU0JxExuB0SDWhO+h0HVkzloK5sUSBdMvv'
-             b'72yswv7sTPk+JmitAIoPOfaiI0Kg+B8NFC4+9RT84Ic/ga3dITORA003MThLsRzsPpfoEU6cHjE+'
-             b'CBai6kHtytKzewJJHmdOn6XzrdUmN5qfo5KRROYRVLoxhnupu7cuzd/4sFfuk4OHKert5E8yqqMb'
-             b'4N2fvfHNTstQHbNjQJe6LkbB2Xog1DEY7MKJY0fhVKn8w8GgPpwtO02zMacE/lVjzGSWJraeos/9'
-             b'wf0H7iI6WMDN/ZGdptfKw/ilr34VHj13oXS167VACTVX/LGyJdNkjXCokM/22gosLczXQhSMRddy'
-             b'zAB4rF46L7Z2SbzLaYD3MzwlRB4tGnJNrpHw7BntOq5QF+wyJ2SbMFKA0dh1oZvHoMtYcYnIgoSB'
-             b'HfZRGWumKUvBQmVBzhPZXYHBnnWqMnsXiP4jaOq04jRAWlA5UG9rcxUmZ2YYamGrGqhL5ghOl8OT'
-             b'XcqWj5S985ks8UauPxjBITpgTPcbSTdurexD+B4wFJUPNP7wohSkbHqw6Jwz1OpLijMTVPAwP8C9'
-             b'J1sAVaeJ7ATawLlUPPM0Qa18VPfm2JPAzgSBF+E1ximZi0YwUTQWEYRL98pztriyDkuLi7CwtFSe'
-             b'hU2amvT1YtRJTUJBkUlUmYt1r2G7qMjiEJw49slObHVjQ6PiSWBfpqv+WB9mpqdhZnYKDpXrPD09'
-             b'CeP9XiUClcYSn33Zc4F4QAYx7A0KBQbHaJMJXvabPjWJaNXceqiVUgoaqYEsRCFjJIZUpWAho1e+'
-             b'XhZHojJZrpWGdO7MY5oVJy4bNZCSG5iGkssoygdfF3dDL7z4PPzNv/t7aErhRvhwfHxyxCnE5A/i'
-             b'USp3pGfnBZ3OM7jYoaibt/q+OvU+OHbiOPTHJ8iNHfWrxs4J2hAo0hOsicc6urm88Fi5ZqePnz57'
-             b'Iw8OHuIkBZ9QkcJ0yN2Nsevv/OyV8U5jRjGy7JYHl/cE5qldO7z9cnM+c+kyjcabW1s10oMvenAY'
-             b'e4R2hP6ssFFbO+/9g31YWlmxzKKcXSEL2ok15YLtDYdw7uLT8PIXv0zJmoFTNEPMyiIbySWSxQPh'
-             b'phkOdnbgwb07xBDSs8Knf0q6qiBeAgVBx2nHomVZBWNViYYrcDJskrA9AfvZeDLx+/Tx71ICxHVg'
-             b'RLzn/jzxQTcSPySWMjKZ8DSRnbAwMLMxGc+Nf58Pxei95ISuzlRbSM4MNomplRaMvb0d8kDrT0xz'
-             b'MQnEZjYtl5/64oggVEXD3JUHp8h3QRV8HyQjXQRnTCpLcAFchMKvkwyz9dJHUo7dbss5CZrNk4qg'
-             b'I3AqHuzsbDspOGjBC85JIpCtVuOcIDnwsHH0f9576d4P9Xe5wyF6Fo+Biau75T5fXliCB/NLsLBc'
-             b'CtPGJi35q9t+A51ux2WL1c+W7JFL44mwXuAsKIWJorh+JIMgm+i8EbmYlF8MMj4z21QM091EjV2/'
-             b'FMyZmUk4fuwYzB07DtNTU5xCnSgdoCEWHAtmlakRKqSWklmEtdn59oWRxjSzyBZcc5zbrGdCzkEb'
-             b'LrXFcu7yAr3j7+GzvlvePzJ4p44cqwiOIATiQ4gTWa77n/r+67u5dPkZeOfKu7C+Vt1rJienDU1y'
-             b'UkeNJ2FdHXAeVn0+04h/KThijbCgRVKA+qzpqfLZHj0Cd27fhy667DSyY8dmtmEJwAjmorrNwc7u'
-             b'9PUPP3yq6Y/faB9mkUKh7SdTpHowf+ODpxfv3X5qoteh2HM6QMkOvlPJ0HyARbYfChK5UH5MlG7q'
-             b'4sWnSpEZ6EWpy33C85SOSpY5fKcFFuFRk4pLXtqJrcL6+gZ3YVmTmMnqhOjmbdVD4QPf6cHXvv7L'
-             b'1GEMD3a0OxGjTvIiY9JDYpgGb9gOenTtrFOBAp5ufPCcKuzpa5nGJiiu7oL7wLa4waUH5WxLYd0J'
-             b'OQsnzo2oN1hMxlYLoJYywj5LwpTKZlklGUO6nHVTpsCULUM7CrAmB22BxJs7yyLL2jZ+N5+UwZfP'
-             b'xFh/rP++dfBFKAfmZplO++NTxmYOlvarAuTgYuCDhe8pzd7RloMPTZcCBUn3auA8UaRIqEefAEdC'
-             b'bpGoDm2yXHHOwXniBbevMLsnIuzEQBMD0oSrI7/bFwrzzNH0FSXXvaFQ+pLdf/r3LNAP/9tDCnL5'
-             b'vdXymd6+ew/uPlikwiSpzLhLajpB35cWQag+jRKkEXgvUoW3Q4IlJVAxBhPXNtx4QczmZh/NISLS'
-             b's9whCA4NTnfK4765sAZ3HiyV6eIqHD88C6fmTsDc8WMwPTNFDiPkN6rZMd6x3vim0Uz/KoPQhQaG'
-             b'7J4sTVt2Yl65n5WCKte4SkwaZkuK8gKnMGSj9qemoUEGMcBIkrfCw+xWHmmiasnk+vMvvQR//ud/'
-             b'RS/SHx/j/S3bjUFkxDOrZMKasBGbPs9b5a8vO76opr/4G5htdaJ8lrdu3EJyOZ+7YP6iYgId+RPK'
-             b'NZoIr+NguAdrK4vPHTlx8i+Huw8v0b0z2P1kKmIz1sDVd955ebC7NRbGgGnlQJRytQzKltMUQ0sj'
-             b'KYXhlennsbNn4PSZk4R/V9OVZNCeBhxWKBv/rOFQuBq10aGbCNmEq6urRH5A4kObjamjagrsSmnx'
-             b'28IvfevrcPTYEYp9rkm/2aZhedgTK/z51kY4MJSRf+HePQoq7JaHXPYddLOxo3Bg2M4XruyiNuXz'
-             b'CCG7QlhvOSrp0WAt1YmEbAw2dl1IYgqbrRBkF2CnXm0hKzusGoW3lh+UDbJIzhWaCJnirC3MLJc7'
-             b'VYc9513oWEPqXM1srJaWsfzgR5WHyTZ3xM17d3urvL2D2uCIF6LyAaOaCIOjSJua1nKbbOeZlahi'
-             b'OreoMQ+aD6XmsWC2Us6rTQ9Dn+icg4Pcku4XDGZ0E1WoBxYWgwOkKQ9bjaQYoaxwDpAcdjmbpXga'
-             b'EWzznibU5ajYEYk1GZKIllfW4P33r8KDhXnYORjSNNUpB1cEyVQK5NBNZtnQOigtMqEjqCUYCdJ5'
-             b'x0rAHgntq56pRuAkKjy92K0MQk5ZrgQA0ekEblgzu02UQwkFv2GcRPcLq+uwuLRWDtdSsE4cg8cf'
-             b'eQSOHj5Uk23bVlm5ZI/FaIvmhOF0IFlxSeh64sxiCVuqzHSLV/T+NAld0GlE936h8oozM/dw2t9e'
-             b'X4FDx+aU9Zu9mQ6vBYKERg6BCCcXLjxZrsUi/PSnr5XvO1TKeLZIdy3omRO51fxazo6omrUk9mxK'
-             b'WSQBDu9TWfBdXn/u9AlqdislvyIaB6VJGhsThmyjuWWVe8S2buV/5+/cematNOMPk+HXCfmTgfuw'
-             b'kn945c1X8FIKfEPMtMiLSF0K8oETGmXB4YU6f/4cjf64TFaQzLmiBzZSiwwhyiEtpiiZHaMf3L1P'
-             b'F6DX7Y1MKkSWaKoWa7sUpU89+yzF0u9ggcpDY3ip6K3VnYoecojVlr9x9+5t0ng1ZAbKNHZPlIru'
-             b'HI9gi2FTl4jM1rzHdIuTzK4mmKN5Ek0HY4dy84OPwnbOAyE4w1WJWsgOoolGVw/sEt0q9pc0o0hZ'
-             b'fS4LCcSmhiteI4UkmJIIspncZicmbsU2Rx3odV+uMCnCPJvr63D46HHK0QXeP4r7tjm8iwA1qzOC'
-             b'LcBMDKlVO2dHUvcL6uy0qnnUDkioh0GyZlsmKMjk2lYqO9Qk5iSHhgiNZemXEucqZZomBnsH9flo'
-             b'fP6VWyNKmoQGPoKJe5nsk1ksVxuQqEa+2D1vl+forbffhNu3b1PoHuoj+0239gPJwM3McJxpjzhW'
-             b'J9aCmimgk/Uzsd5/keNnxEUGZR8xWAHInI9R4a4OJwDXkNPM04XYPOkEwGGAJN8pXxs3YzfvPIBb'
-             b'9x7AySOH4fFHz8Dc3Fz5Wl26P2o2VeJmhYlEKZubuNwv7PKizixM9KCmSSfz+r0oUUnOFTq/q5tN'
-             b'm8zeSVapG6uL5I+XQ7eyA3kfmbI7C0A8+Rr6nPBz+fKXvkRECvx+0HAgOJjfstKyNVDCjgSfGxaU'
-             b'LOVDPnLO5opS/mwwHJbJ9DiM9bpOL5nd/hWsQdPnJxExFqHNtZWFC9PlOZzODnL/5Nl9H/8XQix7'
-             b'e3Xl0AdvvfGFXhNG3IkJT8/smiD2/87pHP86sn3QtXfQWty4ijXkAgXL8gnq39bWfUus0BoWoPkH'
-             b'9ysUkdk2pWOGlHgZcfc0M3sIvvTVb9DXk4Upva/W9hhSqHSvwVAG5kEhHt0lGNMpObJ76IFp6Nnp'
-             b'PWS6UVgsOEEsfz7OBS2zG3sSFl82G5Sq0OdpC0zNr/5mopXIEtImxb7VKUIA+sCsMLIXkuh6Xuam'
-             b'YHCgGMDmEX+/bOnDwZbZ7NDJ7CvLVGoV72bWkrD+skswIlgpUZFCB4oRrVQw925wMRw0vUXLmYpu'
-             b'M6RxQ+p87en0AXwCuoi+kyNzgHyGMZnHmadj5MDfZ6tRILIXqGLrmojaqmCnfsGDwQH4iJqQJUY9'
-             b'azMSPPtSdEgMBQr8DJyITJalKIQmIfs1uHr1KuzsbJVpqkus2UELRk/muHTZSVayEHAaclP9+Sr2'
-             b'yno/Zr6hL2doaALC6UfiXvD3kyN9JJ2is8KomLatZrvBHE6ySAho2kqc6BPqnixWhOTu/DLBlMeO'
-             b'HYGL58+XQ/coPV/t0F5TtpuO4lTth5gtqyJjFs1m3hnFETF60K5JfAiBi3rtkZl1iyhE+flgv4X1'
-             b'tVU4dHSOnG6AC7ggKfg5NDGyjVZUXRi+50fLhEj5T6k12yphLYYOv1+j6RsJKH3EK1GcQVq+N7nw'
-             b'cpeFYYwzk9NkD7e1MwQODGYEJSszU0yu6n6/cgwwi2pjZemxhbt3ZrrdzsbDyiLsdJD++XH/p9eH'
-             b'O2+/9eLq4oNHD3UjY7pRzTLlUMlBbqG6ixiy6Oz48WMwd+ok7B8IdJd0P1qheWHypBH6ZFZmDBvl'
-             b'lJl6a3O9Tg5YKJvsYtDrhR2UL/qNr34dDh85Bpubm7UjTNUuh5adArp5AV2o9iloW49YNMYuJ7Y3'
-             b'lf1ZdHv84GPR/TToPwtnyxPYby47Y9ag0RRxJNSO/l20KISYq1+CWBnpLJXDCDTl1ffmChB0n0LQ'
-             b'pMRWcEWVfCcQAslIw2/2UIkiOpwfXBYbrKDszCSQxZBjCVwgY+JQuZiyHhb7e1uws7UJk5MzINnG'
-             b'WRyfVWdnZrfJLfnE7iUINAlG3lDyQbagP7+wtp2eOG/EEfakWhvlMNI4CSlDCowVLPOFlFwgPCjx'
-             b'cIoBeB8l8BDwQlvGumhiTUWugjH3GNpCyBwNepeWluG9Dz6ApeVVSgHooJsL0fGZWJMSD8UWS49q'
-             b'QbGTbZoeNXo1ubXu0HCXEjhVGoaRdVHl8BsmmgLpe+CsJBHqkvieC1Tb2v1UuX/ZGrZY90A1rmno'
-             b'DuPgXOnL63Tq6y2U72t5+celSB2DixfOw9yxo2RIWgkmHMXhWKvZ7VflATIvQqa1C4QtxCrB7KLb'
-             b'WUWwFAImDVU1SAubG+swfeiohVwGIdswK5Xuh45JzZkAgTEdxOgMtTms3gCRE3wtODRqYnnWnCml'
-             b'+Wh2nHl7mjdhJV4gDX16agKOHT0CG1t3y+/16tcdNtrkgGPF0pTJO9hOed9ba+sn9w8OHjt6+uyb'
-             b'Zex7OEUKXac/3v9Ubce7b//sK+lgJyCskHU1P2r1TxhrghHDSNRhPP7E4zA2Pg7Dg0RxzCkMNAk0'
-             b'acdvMfGR6a70wCax/8mEm65vbNJ4nUIyBxdWOO6W7/3ipWfgU88+B/s7u3SwmhpeIjF8mE5Uv7R2'
-             b'sA8P7t6k8bzRgMWq8g7RIr2z0rczB4uJf15Qw8usuw+pNMEOM/bt8xqqTOajbl/k3BWUK5lkcggj'
-             b'JAHxcKtDT6M0V+MQukNS3OHZUUIegpobZca11iXLbomX/tyxVgaRiqSMlttaTK7ET8h7rpKCwKr7'
-             b'TK4SO9sbMD0zWxNEwdHndeoUCx0X6yDfv/dpy7YwB6bcKoQS3A5Ci7yE9zWWbKxaGmNxRWYKiuWP'
-             b'7iBTYn1xy59dY6amuTY1ByhWB3NEqN9WsBBDLmiZdXB1cg6uqNbC3yEWK8A771yBGzfK/YnPBz6D'
-             b'Og0Y0BrZKXtUT5BUUoFuEQeD+gNXJSj8H5ucgsnpSZiamKSk67HeGO0KY6eK9IfDg/JsDCrtfHuz'
-             b'7hPLr3Ffi38HnWAIiic/vGHdJdFUxQ4TFXRTBp7wzCpMJ12R7K561CLcX1yhgnX+8cfgQpmspsbH'
-             b'yKEmuGuTnfBV9AzZmZ5QIxLNaDpk0OTo0UJlfohtdInOePUbIHEzfs8TM4dsHxujywQ1TSB9+YbP'
-             b'MDGZ1eYz0v4vxo+gCz5Jmu77ZsRhRVwoQ3Cpvup+UvdP6Hxx+Hgp6DdvQ79hU1lJIndvLqjQkl09'
-             b'yns52NvpLT+4/8SJuRNvDvb3Hk6RGux+zOph/EZLd3z9ylsvj3fYFNKVqJbZP4IRJ+7UmxyUovro'
-             b'o49SxW8TswHbls0m+LVyhRCkSwgM3SWXKYSvg0LEnVKoEk1VgdwghsSuqa7MCC9+7qWXGP4Zms+p'
-             b'uIarXqfx9mD0/pdXV6iw0dKYhaayUJaJJ+fR4NSo3ivB+RFkxzIylXxwWUUhWFfv3ZppJ5AyB8EJ'
-             b'EQVsH0RTXcvOyib2Texe3UoR4a+bNIVX3nA9OIYpjYT/eTGvbN/ENql2XEyRZTGpEEn0IMwSdln9'
-             b'4pKLmBChpWhRWu1qMx16gyFGWHRsag4Wz6BTn0gags/2yTq5Z/0+Yy08wWx1gnao/FB/hEnlaeW6'
-             b'fvexZuCgR6fcr0wxTaJT7U+FpoEmlhrZ4ODIYGJrmVwT64NkchUXE/wzLABogvzGz96C+flF6I31'
-             b'WAvDh57zOmz5ayLhiAhLiGQkdFsZlKKUCI6MnTE4evoxOPPIE3Di7KNw4tQZmDp8GHoTEzA2Nk4T'
-             b'ARZFiBa3Qsd9eQ3MctvZWofdzXVYXVmExQd3Yf7+PVh48IAg8sH+Ni7EoV/eX5CAQ/nMksG8IVh0'
-             b'RmA9WiU01Awm+sy6Vcn2/oc3YX5xCS5dvAiPP3qW4L8s/qB0P5kmiKZwPk/UOCk7IpEc+eqOnxUN'
-             b'qvEl5iAeOcdBrMjW11Hbd4h3VuxQHr1LTfrIbombg5ZDQ7WYZRihHbL4OruYj+rsEl0QZR7ZRalU'
-             b'IVToFosivuMTuM/j5xQhyH10HQld0NA0zzbmqZ9O8PL37ty6cfmJS5f/dPiwJqn4cQfzloN/d2fr'
-             b'+P07N5/tRqE3M41TFXPCHnNuu8xUm5qagpOnTlGRqhz9ploSpaR5MDCCNIvvm2gaUgWDyuGzUToa'
-             b'3DlFBF7berOmtj78uEC8fPkZeKQUxJ0yaicW1FaLlGwsMo185UUxih6318myRyIJYnAdNHyUHuyK'
-             b't/rNIVzYOHq7uD4oX9nZl2ZVt+cYGfqseblRDkNJ8qROH/T4rPvB6NzKkzoB4GeBzhxBBbHZfAP5'
-             b'EGxEGNnUA4MmIvA7NfG8k/C52jyoGwJZSXFysfQPwblRg3jvKW2E01rBQvIUn22oO0YD1onpWfVK'
-             b'q67vuBvJlaTAnbLunLwLhDoZhBFPu5CcjY0GMfoFhR1I4DKANINJ4ONQiRPVC08ODssnq+YQZltV'
-             b'dX8NTR3o6Ub2QyLQdCLerOLqyhNO4o7tdpooyF1d24Cf/PS1ct9vQ7c3VmcRnj6i83RsnMVVEytM'
-             b'iXfC5NQ0TPcnYebYGTj/zHNw4swjcPjoHIyNT5UvO0ZiX5wshuUN7fGnH9uoWiWBtPDv4o/u4UmY'
-             b'OHIWjj2W4SkUebSlAO5gHtMSzN+9CXdvXKO07OWF+7C3tU3ff5dzmgiVZO+5rFEUre4/cQcmSd6R'
-             b'5Rqdfq+8xxZee+st2NjagssXn4JeaXIH5QzIvEtTV/Vs2roG8uhpIoSK5KJtgrchyhDNzJ5ZsGwC'
-             b'DXUqRueMbm+c/62PxYgwEoUSXYChisCDc1FnyBtgNBbHj4GQVB8XXBK1NbSRpS+ZVx+ZUoGRiRy9'
-             b'wlDILsE8HwN/X6CGAi2aHFw89sijkB+S0Wzn43a3QALBtZs3P7Wx9ODksfFoxquCl+JE04B54IlQ'
-             b'rfx/lD+cOHQUZmaPEMRAwWIxahSA3AQkrm2TZfioe0Q94CR8BKM9hqUojTVRJwgx60Tx7ouff7nc'
-             b'TANV+XBLK5gK/1bUaGkENPZ2t+H+3Tvl94cqzq1OGmLhHRQ9aSRbCpzjEMcVuPgpns4cmUBMUJuo'
-             b'mLkSAATnJBhQIBvp0GLtxFPVuLTJMzmSmXCG5ALbjKduyQq6IFARaQ2QVBxKadTmxm2Mw/p/TYWl'
-             b'MneHziFa4AqNywD5XCotPrHOrBFtlrjbl7+7RfHys7Zb09Ra0ANZRL86UcnMSt93oy7mRH7IJjJV'
-             b'JiPTlENqqu27QKohOVp6UIYpmZLydoqKV8PTNP+d5PmDIshmjVwgzcw+MUoti8y0MCrsjXzYKP87'
-             b'M+xXnrkyMS0ur8D3f/JTODhoSbg+5EYusu4mgTcfrQcZaWQ6VVxKhJemB7/w9V+Dz3z5WzDIHWrw'
-             b'MCV4t61Bo1lZnI3dsLIfCxZESbud8jAjcWOA6dgg0TblCeodgsNnjsDxRy7Ap19+BfZ3t2CxTFjX'
-             b'378C77/1U7h5/SqgULSPUyA/BymlEY0bGS6T7tS5z/OfIdsPr9m1GzfIMeYzly/BzPQMnSeB9U3E'
-             b'wOUGeMjPhbCcgwuWZI8xC3JMfB3Adp2crKZ3Ga0syme1sbEBx09M1okLGLaT7yc7kb0Sm4JLNg7G'
-             b'qswWkVMb52SuMcEk+dkOGDBrF9OeJHfOtOWaTE6iPdU47O8PzOiXQ1GleYRo+148s6XBnb9397F3'
-             b'fvRDYjQ/JOLEx2sw2/TH4cb1Dz4/2N2EMDGtdGtZ5umGVCAiN2qgLuLk2bOENe/vJz2EgEfVWuWT'
-             b'3SE8gQxFU8AZU7j8pPC4nV29SchCKNUPHI0xX3i+dIon56jLEu1PksV4tghsihBgwWZDUcrLtI9q'
-             b'2NeLLml0rgCOmCEuNJ6FGLxAkx2GY3RBhNlcm4nsETzDj7NiQpdupIYZdwZr4eGQLE2VH/DsggBV'
-             b'aNk03IXa3irqyj/r2J9Q0JGD5uWon10Ei8hQsXL1otPMKVl6t8JMjGABC6ZqT8Gr7MOIRaBFOFQd'
-             b'TZnSSTlPMJZvAGRXKW6joqcztRhrpYw2XGUFkQkH9h6UCg+tWvwo9VsW1AAjsQbAsCaRPXQBkV3W'
-             b'DxNVmLlJxyRPcPul885MfMDdqcDhQu2PykCU2Jas7iII8S0srsAPX30N9krD1RCtPJvUQaHOqISW'
-             b'wIemkCICOzY8WF6HgzgOB6EPW+XwSsNYGX5CU274M6AGaFAhxEGGibFxavYQmj0o0+7E2Bh9/aFG'
-             b'TQR1dKdk3kH5e5R6W+7j7iGYO3cMTp27BC9/9ZtwuxSp1378PXj3jZ/C9uoyjJXvr9ONnOtUp6Y6'
-             b'Pbf1+HSs35oMPKRptdftwtLqGvzdD34Ez5ZCdfb0GYL/6B0xS5fYgJ0Ky7fu4TXH+eB2U86j0env'
-             b'wE3r8nAjOxInQ5gDnWDkmUiyskALKYeEQMzmfuESxvXLedGcsk0NoZEzTJCQECSvzjKpAiVIoIff'
-             b'gFIapicnyvO0oodUGMmN42icXP1I6zjf0HlRJuEnjs6dmJmYmt6Ah5At1YH0MX6RXO2Irr/3zktd'
-             b'LiYI+UhKZ43a4FRVaFxOj5iPZjh76iQr5/lATsFgGvnQESqL5QEbphHfNh9qRjspfPgZXktt1QIg'
-             b'zRNFjS++8FmKAkmU69QYndMp9eVwIT0U2tZsb1YaL7k5J9VUgOiWskwA1QVDwsewe6+oeWuFmdlg'
-             b'mrrLh45qotpKp89N42IKslG9U1Z7GDxrcb+WhT1H7tHV3YK0W8QWaunv4g2KP/aHaOZZ3tHwoC6Z'
-             b'aZewX+nI5aBDiK9bXhOdmXHvgOywpjQPqLNM9FrMsWMcT5b5iSHXlsEBCW+LSpBJ9Pt1r1ivJQtm'
-             b'2JE5My5fi1zLU6pMoW157zjNTqPpbEqqMwOJGGhA3QckIkT0JdWNwyU4a6JuVveO4ASS5NzBjhhS'
-             b'PMVdvG5QGg5CTPoZtGK2GyyLS/eakoPkIjbw3RNjTjRtTrsTmfxCUJJGrNhuslsazOW1Nfh+KVD7'
-             b'ZVKITZe9Am2jIPqlzHvarNqw0sh1mwohl19tlWLz7d/+p/D8F78GGzsHcFC+JfTt6zaVvIKH6+7u'
-             b'Tum+JwlRIICEvSLRKSOxwz2mHSBhCZ3P9w72CarvxursgmxdzIszhmR9Pgbl9xF+73en4czFz8Lj'
-             b'T38K1r9xB9748ffhzdd/Wjr3O2gDSgcrsC2UHKgyZdPECBYWiO+X9GfDDD9+9Q1YW9+CZ566WP5w'
-             b'oLIBKjwtNxWSks1nSJuy7gutJlWafHLUWun5jMNcG6vhAZojY5THoXr7MDmIAXe91kGg/JQYIm4U'
-             b'EQrg2LwpjYrJJfxUJ6a2SnCkbUxmGJAzGwqIj+gAzbu75JV4/8ECNEhmyclS0WX5HEwiIZMiQrJ7'
-             b'uxsntzdW53oxbwyHD6FI4VTwcfr17a8u9hfu3LzUoU4tkwhQ9gS6L2ExoIyoOdebeGK8DyfmjlMh'
-             b'yTxFmJuzaImqSJcW6tFTocXSNDhNwL6ZysYqvhyWwnX505fg6PFjBGXUm8CcL0KwOHIZp/Bm3dvf'
-             b'hfv379ZIDOy+2mQdnCxfs4vMlhj7GLX4ZHGJYPeDJJR6GBXmJR2/LeI96GsyqycI9yxYflSseT0U'
-             b'pIj+h2VK3NragfWNDVhdXy0FdrcU7t3SuR+wJiOR27F8dqJWl8Mbvybi1niYoYs1GmAenpmGmZkp'
-             b'mD10mLrcClsONU4h64TMBSGqiSE7bETVm4BOVGYKLKpnKVRCsY7BzFW3N9ZhphQp3Sux460ulfUe'
-             b'kAesUUhZ0nF91hXzJ7noR4Zbs2MORjVTN1JNVAJMihGyD5LPfikO6lSetMkwz0L0jBvs7ZuJqzr0'
-             b'5+qmIi4jXPhYbEWwy9bOHvz4tTfJOizKBOVCIA/SgAouZhahsSkd7tzVy32Hk9J+eQ/f+I3fg5e/'
-             b'8euwuY+mrhXWqgnKFUFASjv+CCQ4juVgG6tqEyQjtUP6PWkIsXjigVdJEYEYb2ig2u/3ajNU3j/C'
-             b'b13+bAgJwQhsZI+V+7LULJg4/ih85VfPwue/+stw7cpb8JO//xu4fu3d8poNvVYEE5/HkNhxgRtY'
-             b'mUQITWgI/nz/g2uwvb0LL3z2OZB4lETGvnX6ln1NZneFFLNGgKhxVvBWU2a2IvvZGIJpn8ofbKyt'
-             b'wHR5TiT80Dwvg9P7pWrJJsUkJN4D1V19dr586FCSwEk/gkvXFVgcgu1RnaF2iALHZ/IzxX8zPTvD'
-             b'U26i4iONXZRds6r7/Llamord7bEH9++enz52/Gp+CFHynfAxJvOG0iUtzy88uTx/74l+p8OMFHBq'
-             b'/1YPqeAWf5lw+SHMzR2F2aOHK2Yb6yRCE5DuM0w7EJpa7Kil07AzhsuCFD7TrUTuItEq6bnLl+nv'
-             b'oQ0NNS6OhZMkmltIHWxbs1E61oxwitDUuSjLzka9LiGMiHnxRouMSKA7xRDfVwSX75RHF50BnGMf'
-             b'T49CuOFuvsbUi/VMqAt36BDZZLUc4AvL87CyugQb65uEOddiJF5prHvm3YK6dzjXhip27BBcg3ZR'
-             b'KCbb2CkH6eoa3LpbRZzj/Qk4MnsITs7Nlet2DCb6YzwpWMhd4AMkeyq+c0MXOryKq5sqHNR3IuzE'
-             b'KEm3FW452NuhBqQZ6+s1TiJjANn1GPWErHMc9JfE2Jed0XOy4mHOEfzeXdpvVp0ad5xkxeO0UaF6'
-             b'SsZsr2EQDTiro6RwJBYCNGsVsXeSSVvjVaSwghZ5fN8H5d59/c23YbM0IQh9iksD6q1q0WjgzNkz'
-             b'sF+mHwz9VMKKuF3zddkrFeEr3/5N+OI3S4E6KM9holOBDvg+msvyPYeMvcneGH0vg4NBFQoDw1RN'
-             b'TbHuItUdP9ryIk23Jm33+l2Cv+o1aKg44NTf7aLOsF7bXqz6K2l0YkCz59Jk4VsZm4JnXvoFeOa5'
-             b'5+DdN1+F7/6/f4HWPDBdJvweOrBHvl85VSFzRA9w0WgFqi+N1u0ykQ3K/fnip5+rmq7M3plsJ9Tm'
-             b'pOgOp5pyg8TmIFWd69AbFvLKZoj1kYQcYHEu9+neDpojTxH6IGaueI9HsEZW7jlxFEnmbeuszRI3'
-             b'6M7bACyRWs6tyM40uZHEgsCavGQ2n8hsLl8M3TFqVpiZ64rnYQ6WOqAFNDf0DtrS5O5tb184fPjo'
-             b'X7TkCPRJ76T6Yx9fkRobh9u3rj8/2NnudTsMkTiX6hScE3G2DCC8QQ7KzfvIo48RKwkJD5JBlEJ2'
-             b'9kDmiaYXNQfd7YiJYod9/pJgybHS4jFU7uxjp+H02dOwTxBFIm6PJcfyLkWj1GtGzU652XBhH5Qd'
-             b'ZjZEotani5nAIh+EtShSUIY2RMAp0VZRCBs5gIXmBlcEg37N6EL1ImlTOrQLWJxfKmP7g1KY1mFz'
-             b'e7sKQ5tAIuOIGTV1W0gHED7EjROVpuxptlUIHDkmQcLXBJYIwp4rv94tReLuwjzcn1+A8YkxOHr4'
-             b'MJw+dRxOHp+jwypRp9o6zN4SXiUeweAnJo1k0BgSVfSIi4Lzd8IpcHdvtxxU42rXFKO5fwexy9KJ'
-             b'kOcWXbK3irmLnCE5exihnSewzJ7gfCXEfST7A4tZdtky+ZwqMBlhxEdVEaw7JPhVDHNzyKrhUhtU'
-             b'8d9jKjlCaFfeuQKLy8uUQTRkJiC6MuBrHSrT7gvPf5Z2XW+8/kbVJLErRQjC1CqT2PYevPjlb8BX'
-             b'fuW3YGsfaLrB194pRQjvEXSLoZBDPtQSH9KxG9X9Xx7EXmkYgEP2aE+Mxag0hJg7pU4YlBdVJiiE'
-             b'nblxwCYDAxPR2LZO90AedvhPUIcTkFa/m0pzOQWXX/wKPHnpOfjJ9/8O/v5v/ho2Nldgql+h95ic'
-             b'F1+We7kK8oF3vlio7j6YL+/pVfj885+BsabG/wSG2mMEJ4rl55GbKXG/p12vIhpZixYxDpWkV58h'
-             b'bIJx6u+PT5v0IAXVhAnIILacKVlSQiXJSKtlUfExmYbR66dANIVUKLM6rXPlq4iJPBfDSvqaHB+3'
-             b'VGFu2sSiynw+a5Gqt0yFvrvlH9+8eu3JK6/+hPV9n3CR2l1f+7jWUdAbP4Db1z74jJJsMeCwE1yO'
-             b'XtQlHgn6cmJX5Or3deb0GXNpytGcp7Olj8rSW9JXNbcoGKU0BQkvjF44TVPX5cuXyg3foSiQ7EZn'
-             b'g2GCxoNjPH1dFK6Qu0QNbRwaP020Xtm0RiEH8Jl5YoeanNGrQoIpfzRN0KWTcnnLQU0gM7NrcOm6'
-             b'ubUJt+/ep+K0VQoTdVGdLmljkkwP0RJ2K1dCyBcWIRLF9TyZwt6Y8KkuTTnziXRNztW6ZmY1pcFA'
-             b'q5ql0qneg5mpKXj09KlSsE7BzPQkFfJ2yNNOaithQxwqxKg1e+2HWb4EjSOPo24NzPKbLpNcCDI5'
-             b'uzsxO3d9TsEN2aZFWSwn7hIt9JxNYYNnSIEW0kYgV5kJk/t3AAalZUsSBmY21uk7GKGDizUe2i1P'
-             b'6Ilp9FEIJuqUITBwIM+1a9dvwu3bd6qDBF23lj5j3Pd89tnLcOHCeZgv98UPf/AjIlbUy8ffAzPM'
-             b'ECrE3c83fuN3YTc1sFcKxJCTWXsIvaWaMq3oRTlw8ddImKj6tsiQ+qCG9qEvHMGOtYiS4D3Vz31Q'
-             b'rnsn1l1Up0xALdq8sMt7l3ZUbYX4lU4uzhqJEBbo9GFAcTZIzDoGr/zq78HFZ1+Cv/qT/xM++NkP'
-             b'YWqsQ7AdOCakGe7y85MFvkaiyTL8/Q9+CF/8/Av0vSYupFVblDSZ2kyaA7QJNIvKbLuSOkpIQras'
-             b'JDITtnCKnT1SP6OczfOq4SY6aVJxUFKYwMxZnXmSnYUqao7qSE86TUGC2MrL3NGzy4sLRhAr/3Ry'
-             b'YpJ2zijBqZNgMiINT6h6/em/jULVW1trT52/dBkIG4ZPFvLroOjsY5miiDLdwL1b1z/D96yGdfmO'
-             b'iw5Bokh360EZKxV2rEx0x+eOUeelIV5ZvAsieEmdVAF2VlM6c+ZYbDGGjSoCyzRu4z7lwrlzdChE'
-             b'NklNjFtr9IXTJSAsgWSJ7Y3V+hDkpKhY0vUzsJFkdWRnIpsydJXdpIJTq0aq4wmRveYcnTSJmp33'
-             b'YjgVlR8rK2vw4Y3rML84XzvfiO7WY/VAwIVtSroEpowcFhkCa7nIroYFsjE6Z/AQRuKvc8xq2SSe'
-             b'MJJyWncsDVg8QqTPECe79e0DePPtq3D1w5tw4sQcuQAcPjRTC1RiFiWLiI3dme11VaMUlRUFCsGq'
-             b'LBr2t3dgf3cfuuUh00ND2eIZvAFSzHXHlJyDepUNRJ5+zUFc9pp1YJR03ShtizVDug+JehgKQytH'
-             b'p3GSdxHiiBN9hbUiwWi404uscRMTASEEcGdS78fyYK2sb8CV99/njjsTRIUw9BOPPALPXLxYPuvD'
-             b'cOf+ffjb73+fiC5EqEn2OeMr7Q4OYGbuFPzG7/+nkMcmyq+R6h+pCFGkTgvk74e7LvTRxPsIEQ60'
-             b'7o6hR9/rHjJckUVbikyv3yNxLxJi+hMTdb/BmkIhISRlsWYiZGACMRKbaD4/qAnAOH2N9zpUuNAV'
-             b'vhN7+E3XJzxE8tZEGPAgH8CRM0/CP/2D/xp+8P/9Bfy7f/vHMNxdh/FuJffgY486JURPhOkqjuz0'
-             b'GfQaWN7YgO/+4Mfw8ueeh0ls7AYt99FM5GnADJvZhaLqtqIHrXVnVaG2qExf3IMSw3F/H/Z2tmBq'
-             b'dpazpqoGTrPbePInd3k/ebtbv6YFR9azsfe9QyCiY7BWfWGws8OvqDjOpbKGy+FfGpiJ8QnY3N4l'
-             b'YpQELNYQIxH4Z/JMDOIQQwSWAKuLD849uHmjn1O7lz/hlN7OyuLCx1OkkDSxu3t84f7dS4RXo+pc'
-             b'XBJU85GcQ3U1q8SLg3935sgxmCkXctgeKG8/MMNGTCYBxGuscWJScxxXV2v27sOJqWG3ZmSxXTh3'
-             b'kVJA9w72oFcevk7TOF11clakDGuVp3VlYYGC3YKjmbt0JtUL6XIdajcoOvAYvX4ha9ChdnpgVGHT'
-             b'ydR/iw9VjS1oYGFpFW7cvA3z5f2Q0LZ0gN1ywARS1GfaISW236kv2phANjTKeMRdXtOAWSFRlldg'
-             b'WEMfAVb3W1AhdXORWWpaaWX7zuAKp+aWEw32S+d9/dZtuHPvLpw5dRounH8CDs9OEVklM1lGCStZ'
-             b'pijG3GNwDwyYLkv2juzLiPYzaJ/VEk3eZDvZewqqy0Z0djI8pVRb7qraD6AhcSE4d/TgJdpO08KE'
-             b'jSwZWy4DLI/q9Zk52FQTXaH8y0RN1g/2WmqXI8vyKNNB3UNeee89mjpwmsbJZWZqGi49c5EcBJBQ'
-             b'sLmzDT/+6Wt1ku6WIhYSr7cqsI2wemd8Gn7r9/85TByeI1ZfJr1RKq+3XycbZpRiEWoZOWhTJdv0'
-             b'ehPQG+/DZO8o9HEv1O9xYm+HmR8NT+NJp/VGD8kKG42N189yFiS2YkhSkN3dbdjZ2oC90nwgPVwQ'
-             b'kEbjb4CcLGqRLA1Z04UvfPO34LELl+BP/+h/gsXbH8Bst6YoRN7jtFmtfZ1GpJpgL61vwvd++BN4'
-             b'6cXPwHS/T9MimcZmo7VHFrRnaM2R5CMNHUTnFpOq8JyYvYgalPewvbkOUzOzOtFIlLxG2CuBh9l3'
-             b'4KYrKUsayJlV8B+UXNGOZGKJC4+QqYCF5fhzFI1Xy7RMBX22NO4LpQbIcx28qFONvwOHXVZWMbmh'
-             b'Ly0+srG5fvbo8bmreP0+0SI1MzP9Me2jxuD6e1ee3Fpdnhsv3c8B454knA1iY8KoMUN5NWYjkRL9'
-             b'1MmTdDO2B5WRlEQzkEYD35NeKHHbbpgKLeytqKMqhooJnjdWHuBLz1ygbhDEfp/pt9XayAgelQga'
-             b'YHN1CQY7O7o7UVxYRKMMq4WPuGTLIZQAXGiZJNrWybGJQaeyOthEZQuJCwR6na1ubsF7738I9+YX'
-             b'qGvudbpEgSdtR2pHCqWpyjkkz+YC4S6qar06UbcEyVKkNcJy2cS7NVuy/jtcfGMQXmAas2itvGWR'
-             b'le2WnRE4lqH86sadu6VY3YeL5x+H8+ceJ8ZgS02Mj2uPJvAGZz7cxI9oHDJRn/FB297ZhJl0zO2K'
-             b'ROrSODKNI7QE80lLar1j6boylwvMQl4ElJqb3YJ9NNXZZRhqYF7I4s4OjpEpUodsXnHlv5g8TD56'
-             b'uEnNFoUVshWoannUges3bsDyyiJNR0jbfqRMT89deqYUjoY0hrnpw49f+wFsl8O+R7TiYNoeEopj'
-             b'RHyC3/on/xhOP/EUbOwNET9TBwzUFuEh1us2pm9M1cwXm4HpyUmYmJ6BTpmq8NpmvlcEElPXK46t'
-             b'z/xsiBQD5PsRSjzvSkMpLP3yfscmJmG2NKs4ae2VYrtfJpCd0ogMGXrslSmr35skqJ5MWsvX2N7b'
-             b'h6Nnn4Tf/4P/Cv76T/4PePfV78Nk+azw+R3AgU7mKUkoZibyBr4PTB1eKs/X3/3oVfjyS2Wi6vUZ'
-             b'ls22duBQqeqgXhsoNyjX+9NlAJmbR218I1G2d0jbF0J0+iUz9qU9Mf8+mkWH1rRpPqKzOm+0Dpz2'
-             b'HpZW9BqwmJrsAiHxje+VzyvzZImf0OTkRDUcJlp/I+Fy9kzVaueStzJZaQ339yZKw3v60JEjV1F3'
-             b'+okWqYQsvI+Dfd704N6tG5fT3naIYx1dmqvkRXAQiRhgGEAMnI8ePcIH/ZC6viCHFtPV1S5G4Z9k'
-             b'3lmS3Ov32BGpt316wHE6Oz53FE6ePkUHe8OThWohRkwb60GGIXtrpUilPCALI4nZiNEsR1tPqab5'
-             b'juFL3vnEET5XqIcU7cqC2fNkc0nOzE7CYo3srasfXoMPrl6Hnb09WkzXmJPS8SYHy4XK3JGQQhOu'
-             b'motCtf3KsF8K0gA/N4xEKdcLu+L+zCSMl5G/W16fLKhCdQXBHUcq3TM9YIMD8kBESntb/peICRGI'
-             b'IdVhZqBOLNJUZBEzV/0WQjVvvPMu3L5/n9iVJ8v1QDNSbHUTL6ajTsdGLAnOR1GcB4QoMRjs0xQl'
-             b'wWzVziqOiHKDN6Flx++YfMpuGMmMCsGlIGsOj+ca+6KUHT3X0pjBCVjp2otmMFgYnhR6eU5SNsub'
-             b'6HyogfeQO1vbcOP69dpAlSbl8qcvw6Nnz9AUcnAwhPHJaXjn3fdJ99JDaE4mtcSZUOUXm+XavfyL'
-             b'34TLL/xC+XlbrgnHUOTqP9kNkXY2+B5QctHtjsPE7GGYmj0E/fFJJQ+AJlpbo2WYkiAOFY3InhYf'
-             b'nMVUVoorHe2is8KTodvvlB8TMH34SPne9mBrYxsOyn2Y233y8pzo9mktsLe3TQQfipEYm4Jf/71/'
-             b'AXMnTsN3//xPoEshfTVgdVjOlJTdoS42XLmhe3h9cwe+/+rrpVC9QExDdGonGUfOKop3CTtanPwa'
-             b'1LlmV7EwG8PK+bNbiu7U9Aw9H/68URNkBxN7p5Ew4u3JzDsmU9TGN2pjqibKwaVVK4u6ngmDcl3x'
-             b'jCVQr/x6ujz/sQmjoncQh3pb0wRJilbj6Qwfvv/BhcmZQ99t9z/hIhU/pkwQFNs9uHv72TKE08GU'
-             b'QJyb+WJyaKDkICUQQW9LB86hQ7NVAS+eVsFoUsqoE2YbP3RqXOscwwPb1OBNPzs7Q/Yq29ub8MzT'
-             b'F2mywnA5cfUWGmfwvlnoJF3ez9rqCokXu7HRmzBK9gx33EoL5i4ncffvZsZ6GDknCk1XBU93rZbm'
-             b'5IRcvt788gq8/vYVir1HYS3qk2rEQUNYOy7K6VdN3bslFhrKNxXZ9w7F4LvI1MLDpjwgp848AkdO'
-             b'noW5M2fhyLGTBK/2xiZI1xJ4tyJMwzoRJGIoIeSzu1ujMpbm78Hi/Tuw+OAebK+twNLCPZp+x3oN'
-             b'03SDHjxiXNpQp1Zett+FzZ09+P6PfgJPPXkOnr5wHkKnrWmkMSuxQPvDAC4q21m3cNFFr5H9/R2Y'
-             b'nJjWPVc1tq2ZThoMJ/o8Sy6sC8SQOKHUIOt6hnYU2gNonGYuGbWcGyl1nR9xy0iK6PpgeTWfzVEk'
-             b'zUTXVhs5vmtakUw4g4HrpWFZX10nfdqnP/0ZmJmZIXgOv69+uYa4q3z3yns0aXvae0uEh0RszNOP'
-             b'XYBvfud3YKt06sPYMQ85bIx4f4tie7yfpg8dgZnDc9CbmKz71sDJryE4+yBxUjDyUbLgD3P04Oc4'
-             b'eUabbsg8Xanl/W3UQ3psbBrG5qZo8sbYnbXlxXLZBtxoIsMVHTu2yz1aXr8U2Je//o9o//PH//p/'
-             b'gVim1H6ZDvf26kSFkxjeM+icYfycSEV/cW0TfvT6m/CF558jOJz2hLHRXS0wDK0if/WfjCrrCEzm'
-             b'UvNs3m0i/I8O/hPTU9QMRCUgGLGh9bZM0sxYFKqtExixISl5rukA2QVMKhTNrFVda6o+MVmhLl8X'
-             b'yRNZyWNZgwxJqJ5HJ7bgTHdxRbO/t3P5yUufgrTzyUbJdzY+BnYfaXXKG71z89rlThNZjEZufOUD'
-             b'6HAxiuYiDoFH5/qBI7Y9PT1dDytO16t+aAYiWZhedCQHsxLyriH4CxyvZ2en4OTxY7BYXuuZp58i'
-             b'zJl2XcEtOYO5NWUuKugdtrayzOLJyGYmwJ5f0QLJxFszW+iYqNGjBOgxbNOBrAy9xGQEoUfThEZ0'
-             b'8gRvv/UufHjjJo39tIzO9cirmYr43nvqkFD9tNg2h4gQtTjvli45d8fg6MlH4LkLT8ETTz0Dx0+f'
-             b'KZ3p8VIU+nTzYs0bDusNeyAJprkSTCgaO6N3Yo+gmFAa8/HJIzA918Cp889Bt2lhiPqbjTW4e+tD'
-             b'uHnldbh17QpsrCyqI3bDjt6VkpXVww4X8fh13v3gWmkE1uDFFz5NNOq2HTqLnsywou0Hc3ZppYn5'
-             b'gRRxcQCTk26CYRFmyOAsetMIASk5M80qjG1oiqxQojGYqGscls++162JqZGzhPPQ9EvemYQJJhSx'
-             b'EEQYnrTBDuBUFOShlmhKjR03jXqbJ4ZB0Sj59t17cOT4cXjh+RdhvD9OLg8IdZNZcPm7b779Jr0e'
-             b'0f85YJIepaYu/Dv9Mmn87j+DQXcKDtpAEBoy5/DgRpiPgi7buus8fOwETM0crnvONpm3pWgc1RG8'
-             b'deJ3MSjIDMFnxzHJut8RXeOooVRr4ZOOPBNcHAs2a4cOHy3XehpWl5dgd3OTGg28FuiIgl8Wb+et'
-             b'gxae+8JXYaw0pP/mD/8V7G6vkZi5bVslD4ijeeR9LLlvlO/19v0FCK+/DV/83GeJtSYRNIldIdSk'
-             b'V1LBk8gqZDJvdfcrVnCZAz+RPIH6JGHcqtWZ5noZXC17WpPxysogu11YcjZiWZsxEewKwzGwnpLO'
-             b'nfKMDYg0xk9FaUgmxydKo9rl2PpsruzuhpWE7ODsvrplKll4cPfUB6/9pDQBn6zRbOfwseMfA9SH'
-             b'Pnk702tLS092Os3I7VdPi9agFdITcZheqAaPyNcfI5W6xZTXtFnJIRDTkaAXAzieu7IFZc8oy8SG'
-             b'PnS0/vj13/h1gqyOHD5EegwK03M6FLnQkjKJF3d1bY3cttGGJXA6qHTZLWkdRRTrtSJB85Q0RI/d'
-             b'JrLEiESb1ggGI1ignOHlkFhZ2YSflk5ucWWJDEOb2OV/x+N2MAdmAYQEisDPca8c1ohWHzp2Ci5d'
-             b'+ixcePYFOPXYeRgrDzUZpqC2CEkqA7pbmVnJi1J2Vq8i6Y4r/JEO7cQR2O2wMswOBmiiOlVunkl4'
-             b'+vhpuHfnBnWJgzLV4GctFFYho0TwN3p98JCV92B5Gf72ez+AL+A+oBwqZLESa0SHpsTKrg44qE94'
-             b'/Iz24tdL7VE1yVUP+OBd0IWyS6Rpnk7qThJZa8MhHx5C522iWRk1lejTMCxeO8zaKOF0a9Ry0GJI'
-             b'wlyGCc0r0MSbzjCptHGtCanVtNSFgnLBffTsI/D4+XN0bwyGQ05HrsSam7fvwsLiUi1QAu2IA0a5'
-             b'flt7e/Crv/N7cPLxp2FrENWOCQW1DSdnIwzen5qBYydOk5uEZDdVokdH05iFIFMdEBreb0TluwYl'
-             b'H0EVi4sTA/9ZguRc94PFuOe6sxPI2GItWp2u8a92e304fvI0bPTXYHVpqQqHsZliqHxYiurW3hCe'
-             b'fuGL8PtlSvij//G/LxP/AvkJAl8L4RdJU0QkJXJr6ZVCtQivvf0ufPbyRRKms1+ZxnDYeRRcqGnW'
-             b'99eqUDuwjVvVGmLGFmb3TUxOMfxrz0T026Vkmr+kYZwG2RkJK6gdU1Z40HwmBTZM0SZ5orwnbmA4'
-             b'VBP3mShd2BnsM/0e3ITNkTuS+C3qH0KbOrC+vPzo0tJS6UvSaF7Nx12klucf/MNNZcuDsLy0dHJn'
-             b'fe0EwWPRxdBmMy2UbyMF0U4H6v4mJ8c1vTS7A8YCySSoCSzMTmCcNNolY4GSrRGykabKgzc9NU2d'
-             b'Zx6Johcha9BaGtigdLNMl428IRmPpaeJLr0Vu3Axp3Q2O5nhmpEYiyZqB9l0ugpb4md37dZteP2t'
-             b'd0hzgl1y4kM1fVQ/5XY9Aqntot6rvPbZJz8Fz3/hFXjq8mdgcvYodcuYC7R1UG1X8EHD2AJkTcWm'
-             b'drqArBx0bSZblIaEoGP4d3Ld1/Wa+jkNy8OKrK9KyU7kmkG0/XKwHZT3ub4zLAX2LThzbJoKO0kM'
-             b'kLzQVAIKjm1tcNeVVTtNKRDr27vwk1dfh5dfeqHa6Qi1XwxJk1ImlbZnOT+ZHvzqOxbo68XQGqsP'
-             b'RkkXiV3Km6bh5NhAhQavR+CYc7lOsicJ7OsmQmwSqSJxBaqbP8Kv2KFG52qfeTowKFgOsuwgnrrA'
-             b'J0aZGvWaq7uY8OIkg5ZUF595uk41g5rgC7xHwGt29dpVTX2VszNxPMPezh5cuPxpeOFLX6M9FB2b'
-             b'5fvHwymzawZOVYeOnSw/jtcpKIHt9SQmnRNrxbonO2kCqADUjE2FOCKifJnyc3aBoGRPlNz07IgY'
-             b'kQ97hqUCT3GJHflnDh0t0/0EsW/RdDjkqi/jPhDWNnbg0aeeg//kD/5L+KN/9d/BzvI8jHU6NqE6'
-             b'TDlLQ1bug1iuyfvXbhBMePnpCwRlx9gw/JoUFlWRusbRRzWKzuzTpwAu7eaGsL21Ud7zlO1LWSfK'
-             b'aL/I+9j4V8xpgQ0NMvi1Wgwu8VlcfUT3AqY/BJvZ6PukjL5QzQXwiyIhByfpjbRHILdPS6ii9/rm'
-             b'dI8mxgLlNwa722c/++JLE/3++HZKn5yHX+f46bP/cLivHKy3bt18+mB3q9/vcYosx4RrDIsK55Ne'
-             b'XOT+405splw4tkgGQ2OjChAFvmlkelEX6wqBKdVS9gWSKCuGk4E9d/jPE3uzCRdNLiN2pVigcGkc'
-             b'g1gwBZ2i6sWxPjiyDqwJLBh1GhoffueTDzOnnyHEg+/trXfegytXr5EQtzPWVccJ6Zo0B8dl0OB3'
-             b'gMSKYbmtUNT4C698Ax65eAlifxb2sTANKvWWJsRqxMYOHEOeRhLpQVBGglHfTadPf97p1YOIsO6I'
-             b'BS2T+r8XmS1XClBL0eMY0FYfXowD+cav/UeweOc6LN94BzrjQTvBIHHc6qJs5ATZm2FhWt3chp+9'
-             b'dQVefOEzLvNJHnSvjwPXpbMGpt0neUGnM8aOABzBrT6CEqkdabK26dkC38TMF/h+qWxPdiMJia2X'
-             b'aqRFIC1chYsJRiuv2XIXD9w12+4xKYIg8KB0sBVVDLq3VGuoEJR8L7lc+PdbNLSLwSjQaPHV7cHN'
-             b'W3dgrUz+nS6z9LKkrEaC7zr9afj6r/02DDvjNV23qcWXTILLfydnZmHq0OHS4c+6ps20XcBhjJIE'
-             b'ILsnYoJJaa3Oqc5aqjH9m2gEWXYSXVYSzRCNTAVDhryCuY/zZyHJ3SJwzqxfQ6Hy3OkzBP+tlakK'
-             b'n8NBKTJdLhYb2ztw8okL8Hv/4r+A//1//pewt7ZIpsnCWhS3BTwrOjzN4eSBScZXPvgQpiYn4YlH'
-             b'zlQDYN55R9EI+IyoEGE0lq/C7w1LK1q+xtWdwTn+O3KEmhxAdqxOXkuwc341D7Y2KKc0ui8Kjqil'
-             b'RslB5QDImAy5Vd0myWTKMzw+Xhrj5TXwToXBsQuZ0szGAJrfjczL2XfffnumPza2bfEjn0CRWpy/'
-             b'9w9+kV5/AhYe3HucuvReV00Qg1iUKLU/cLBcPWhbdjifmZkgJlmAfmUjcRy8RnzwMjYJwSGC2q/U'
-             b'pIUo5HQuXml0HGd3bGHERY6K1gmKrZDwg15bW2H6lanUR6btXJ2AU4bRYEIRF2dgPzHZR0VdbGrC'
-             b'JQe6vfbGG3D7zn0Y6/dpP4RwRxaPMMwXilasEnexB+XQ2No7gLNPPAlf++XvwNOf/hxAdwI2S8eX'
-             b'dw/qToUYbx1i7fSanmM+1s8FKb54xtBEgN38/gHBfAjlJXa/RpyaRJl4tKBjBBZVSi/u1EOJo7bx'
-             b'YJs6dBx+95//5/CH//K/gd2lOzDeq7lWEcQ7zUitIeaRabMKP3twb3ERPrx5E5489wQxt0T7XUWg'
-             b'ccQLT/wNE7PikAKLBBCENEGj1oUtGWpxYpcMY59VmNoMMiUPiPcVodFAQ4FQEgu9pavHzwsLATIj'
-             b'MROKPPiUWu0oBGqflBlmrMUOxbKZXbMhCuGi0UMnhDyircl6KDbUdOHH9MG165XFRrd7kl6P3vfu'
-             b'3hC+8u1fgROPX4CVvVpoDwZ7dLhjRz1z6BAcOXW6NiQIAeeouw9Tb3MRYqaj7ls4O6lOEc0IAxcC'
-             b'OOq7oRDyXHrHd2VFCoQGwe28pMEQxwQ5JOunW6UsAEePz0G/PEML9+6SkwNOBnhtUEe2tbsHpx9/'
-             b'Cv7Jf/YH8If/w38L+9urVKigqc877ZGi85pkhzx8Dt94+10SRx9C55ScDGYTNxBNcDYdGBW57Noq'
-             b'zkkb0tS/W8Mt1X2Cn0kNSO3UaV/Gb2F3SVPPzOPM10Xi3YO8RnRokyYHJL2UAzITbynqR99b+fH/'
-             b'M/feX5Zd15nYPue+ULFDVedGbIRGICJJBEbQEkgOAyRRpNKMaUsey+Mf7P/CP9nL4yBbnhlJnqBI'
-             b'z1CyNBJHgQpclKgBKRAkAQYQIFLnUNWV64V7js/eZ6dbHK/laaDXMqgWGt1Vr96799xz9v72F2Zn'
-             b'Z3j9ZC3+tCBhGn5wVl9AeyDA1ni0cPHShZuWlg+fRzThxlHQ3wYXW9wcrlw4f0e/EQGcEH8it5ag'
-             b'3mSQxRqmHj6omUEaZNtOXGgvW8zLqR1spKjCF10IzEYT/zxlujTmnKD0PDML1fGGtO5o2lk6KIQO'
-             b'qL0HZoiJQM/ps1I2PW6k9jjKHWStCCvtzYlSjT3JQqb89ut/9zycOXuBbPJTFkcCo1CbJc+UFP8I'
-             b'wW2VB643twAf/vFPle7pw6Vr2Q/r47I42glvoDvQyz0iAiBpBaFP3IzQ0gkrTJrBlA17dmG+znso'
-             b'WnxYXT4wngO7BoyExoeqbXlWUeGGXn9Yh7AwVXfoxGSHrdEI9h29GT7zC/8N/OYv//cw2rwCM4PG'
-             b'iZ6z4vZBrKGCua6T3VB5z6+88hocO3KUZpSganrnLp9s08ts4YOvSyQC2kzbPSzxUGn1vYHT29nM'
-             b'plbpjelhgjDOKtmFYKxklT11WGDpvnhAYXtPcCk6HaSaVSTFVVBRJCjd2rtQKGQUPUUbNAXak4GS'
-             b'2yQxXgIzllA7t7axTh2BsBPxElBmWikslo4eh3e+/4OwVYqafhzWThHNXMt7WTx4EJaPnaDP34rW'
-             b'LzNLNIBKTCVqvQqva/Bhx/oruBRoKezAZXWBCJ6DOpRDx4aM05lj6ESlZw9V7TEAzmoemzWLaW5h'
-             b'H9x02xAunHuDOpZmWoXIyGrb2N6GIzedgp/5hf8afv2f/k9EphhQQZbYGSMo61C4x5F8B6dk4vvB'
-             b'9z7OXaX42fn5oc2DNPstZ5V+B5lL4tcjU3ZSXTxqQWXXInuyS2aPz5D/AzhCYsVjsvFUAg0rlI2u'
-             b'5nNmS2egGKWJ01XZCGFmpq8QY0qtSlcCO7Po5MZ4rPT/x9ubzdHjR088/J73l4roxpEneseOn3zr'
-             b'r4KzhdWVuxvuOqKmRgYVZTL3RQemmUV+w0EP5udmq7hT2T3JRKo5dxy65SE1saaYSvZ5U7H5V8f7'
-             b'LdudyUyblTkBteblvzfX10h3gkNBM/kExfpbdZDIHUxe3MZkVpU8JTkGpZ2TWLm8P5zBnL9wkTa2'
-             b'VqEV4DkPT08SW/NjpzDNsLE7gTvvfRCe+czPler3FtidoJh1XDs+ZEPQlLQlckjLjC9kzYVYqspS'
-             b'Zc4OqlgSZ1504AC7I8foZnSJWV7T0k2Nad6zs7lObtb4UIkqoM6lMlHg8Q8Jeiy/jt56F/zE3/+H'
-             b'8Llf+V/KoThSHa73LaRhLZFrppRnJRoa/Ow7uyP4/g9eg0cfehBExV43xcQPi0uWVDPOOpcSKxk9'
-             b'xIAPjsDOGzG7AqWareLcLEmWGd+vKSXK9jks0g2tm8C098gbKq/WNin0jN83wUyunNR/rgv1uYxl'
-             b'duGXTq5uDD13qPPvGq6etTBLROZoy1+8+tqrrCesERyRbX1IEzcdw49+6GmYWVyGrWmjLh+4Vg8u'
-             b'L8NSKQaAg9Oj0+uACyLNDA1JYF/m4lKJIjqrgj3uCTJ3Dg7a8vIEUDmK6NRCtigVkyty56ndXeRr'
-             b'NWV8JBh1H6HXwQwcv+n20lG9ATsb16oeMaDLRtlbShNx6133w2f+038Iv/krv0S2TEJsEoNoZS+y'
-             b'0wrOKq+ursCL3/0+PPLg/WWdjQkeJqd/tmuNYo/FLNyQ9iYrm0UXsulGpRBG66hqiGvJuWTdhXuk'
-             b'/BGueTHozlZh52CMPg3BdDIXdfCX9F7eW/BnT9VggQt78vFrtZNSUb2OFSTtWlCA4GZ4dRZ58cyZ'
-             b'wyuvv0aGzzfskHr5xW++9Rfp9wdrVy7e0jQNM3FSJ5k1a+Ktun1w8mwuG+eQqnusSoOw3jr65tCx'
-             b'xtdzLHssVg4/bndzdLmvYMF4sRIr6qtPaUHVIWRlJ6EOQ6jDkGV2Fbz/qxpHRmH6cACZtfxMPQ2h'
-             b'gzqTELf8/qvPfa0cUJdJcIlDeCmHBIpMsrB5WIpVcJxZhI//5GfgyaeeLgfQEHbGlT6M0Sg4+KbB'
-             b'NIYSogtAef8YDTCzMEsw4szsAnWreCC1GqrYKKiSMijWTHZSoWzspbvrD+ZKdQpkV4U/Y3u7Us53'
-             b'trYYQWi1qkIIA/Vo2+UgveP+d8H7PvIT8MXf/x04MFejFCoMFvRBwAPo9N23wdVrq3ChdAO9OKwd'
-             b'T/m55y5ehLvLz1iYm+UK0Dka5OS1tFq1y4FWI77N75FE4bF6npHMoAkqmo2pziPIDJUgkOra0GMo'
-             b'plb3fRVKZo6HaflQUgE2dYINEQAQNkMT3ykWDQKNCF1Y3LRlOBkCyxsCQVRG74tdN4GWwTKxbqIg'
-             b'ywhXL6/C5fIL7+0IafJBcs0SiXtP3HYH3PvwY6WYwc59oJ0Y3s+lQ0cVOrdZpwt8BMtXMg+3yPMk'
-             b'gcg4l0usyDiXKAuCoqN+Y8VV1l5FEiiOXp41CQMUaQWuVcnPkqgQmR3nqdsjLJU6yrUse8nRk7fA'
-             b'5XOl6Nm8Vtb8lLwtsfDEWJJ7H3kCPvJjV+D3f/ufw0yvFHI0TxKyF/MIeTZHOr/y65WyCR85vAwn'
-             b'jh6r5rixUeKOGUZy9wPO31Nck7KGvsNkd4fu2YTngkbPh2rwqx0RP6Gp6ukSC6lp+pVbi3FxnU3k'
-             b'p1JtTtgoF18bhfhThPW9q2SuJsAzs7PcBTMcq7+P7h5GRSlCtLVz7swbp87ccqtm992QQwqt8N8i'
-             b'/xw2tzYPra+tHotRDvzGKNlgLtyikWq5CsMHZ4a8v5rq6cZdkFioBHdAZW99I04KehAF9ZOxwWu2'
-             b'+VULCtlo661MvbpAxqWKR81NFfBZtH0Wz7tsSZxKNssOsmCzUSP/gtJpKTKjXJxn/+5ZuHzhEsyU'
-             b'rgZdI1qBTUTojDOaUBln+FfrWxO4+Y574GOf+lm47c57YHMbzT8rDIBsuynP2tCyqD+chQM4AJ/b'
-             b'B73hrDH4+MIn1nSwT5PCl1mdPHyFxIm21F82tDkv7jtYfu0naj56ka1fu0r0X5yBLS7uI5PTdjwi'
-             b'oeiTH/o4uXC/9NyXYHGmUemiDINRq7G2tgZPPv4EvPT9H8DL338Vdsq1b0pXjaaxF8vBtf/OU6RN'
-             b'8pZYzt5A8RZS9Jevm3DMhLjtk/4JOyKm12fuhIQOTaQJZDTyfZukGn+CTEaa8TRm55OYyDOlCJRG'
-             b'CyR5Z1hsDGLtkoE0V1OZYPHMU7wKhU4f1LHAF0HiAu6hGFm33rEBN4wzZ8/TdUSyDz43U3QAAaMu'
-             b'v/epHy1d1BJsjDOz4hLsXz4MS0ePcuflROYSnscUZC3qGNoG6DrFV/mERc1k3qijmD1mpwHKWQ2N'
-             b'zUpKYwmq6wsnSgOHQ1oqQVJnmSh5XmAO52Yx5IWuiSD1Q8dPwNXzpcjbWCEN4pTt2bZGqazPj8DV'
-             b'Kxfgr//0D2HYn6lz5pC1uJFQVXld/N23vv0dWDqwBMPekJzgg4PiTJMn8RjJ9qzsalwkT+zsEkpB'
-             b'4nwmoER5BrOx57yeru59La9CsCRpdpMhijvT6quDTjf0EP8GvRFTqplWNuOsZt9zM3NsMJtrrL0G'
-             b'iZoUwjbiYAc5jhlyvvXBJ98P6UbCfbeduvut0c/Lhnv29deWdra3Dswwq45gAJ4nCLaq8egpqiiu'
-             b'+usNq4kq5ac0exSXdSHK6F2DwoK0opIVkyzVFWWzqVWrERliBt4kpPOB3OMKGigm5NLVK5We3bNo'
-             b'Z818cSF+xsIBxaFl0BizM3iU+HBchGWzfP4bz8OF8xfoegnDUeEGPtzkocPPW5oSePcHPgwffuZT'
-             b'MFhYgs1RS9RvoO9pyRsRKdwY071/ebkcIAeq0JfG5606MFD167KbrJXlA0oyuSBpFlbdTLkQIEhH'
-             b'bC4D/TysvPaXB3blyiXYLN1VaCv7CQ/LcXnjzewcfOQnfrZU++dg/fyrMIv6HXTQZlF0r1yDC5eu'
-             b'kksCOoGcOHYC3jxzhn6tbG/AejnA6BloW4Uykh6cXDTEOsOjBxRnY9MJHZgtRzPgfWwFskhRYxWU'
-             b'SttvqlErfk9q2cS0shpBtDpRLe9LJdvafCl7NKAeXFPplthRP/Hu1PAMlRhyyW06SejUrKni10+m'
-             b'h+hY7gRxrEdW1WgC5xAuxqgOEdXyQbg7msLRm++Aux96F+ygtVWo5A5MO1g+drLmSrWgzg7sEKy1'
-             b'eJ2NmDmxwadA3ZyGF+pMKqgXpHTj6hAubMacDFXRjt0YbLrvCmQrxrra1Zm4mgS8gTVbGZhlmMzA'
-             b'mq893s9DJ04CnCtF0Xibsq0ydzTjsrY//IlPw5WL5+H173wTFst6zZpKXTukRhipmBNV1sTG5g58'
-             b'48UX4LFHHqEWKamrfNRk7CjSlGx5dGK51fB+hR0Hwue4D6SUu+nNQsjL1m1Xlql1uolp61Fz5qJd'
-             b'R5FiUCfKHU9bOzqE5EEE8tkVEuWeitl2SoI+ThnqjRVZyuD64qymweghura6cmTt0gVye79hh9S4'
-             b'fWvEiTgNcOXylZPtaNQQBiy0X44rrtVt0pTIDF1/tIX5Bdqsp0yJFUhPOYCcY4QPsQSKgRJQzAlY'
-             b'/lvmD6rPyo2q4ivMZRAEPgSRbxR6a5FbhsNxwcUreJ90ysoRcV8Inaa7k9FU/g5Zct/41gvw6utv'
-             b'lN8P1diU/DgmNaVUNjx8MCZt+bv+Anzyxz8N7/7g0zAqF2BSHsxEOT0DiuLAhYOH0v6lZZgvXUyl'
-             b'Q4PalgYRUdp0myv53HFI8BVp/aytzvjrB2p1cxQPPLl3KPg8fPxmsqBZuXgRxuVwQaYexSyUAxSp'
-             b'zU//2Kfh13/5f6SI8QDu0MHup6yJs+fOwqGDB0s33YN7Tt8Bp26/uXQI5wgjx4NH3r7as2gMgsD0'
-             b'QYudSTsum8msBWCKzyMz06Q4quujofvXsG6m4cRUYFNUJKpQiirr+HoEGdaod0HEZF5Kbgcp0WtM'
-             b'c5UhIHsOoRycswbnGB+brNc38vvL0XRFMr0InXWXufAQZmkPLp47D1s722VzmaFNSY2VUd9WXued'
-             b'7/sgRLTSGlXhKsK+R0hqYgmwQezHGGKuuKKZB0eJ1RGig9CioVE0onY7e9winLtEYgNkI2FUXVbg'
-             b'jlfZs0I2sNRPO+yYGlnlIJbA2yGaiJt/ZmExq6CxUFkuHdX5M2+UTnsX+rEmCmDcR6+ZgWd+6h/A'
-             b'v/w//mcYX1shdiDNXUlekWg/oq6ZO6ZeKWrOlSLz3LELcFM5/HD2m7OVrJ1NvG5a1mXxQVUPmVJg'
-             b'TsZVXGxiKjNzzWY3pfBbDowC8wAkm7dUcJkEKcROSKIyAin3a8el/TLSw5saShmGpeDdwgIzSmh8'
-             b'40hfZjsH6uFSO6qNtbX5M6+/zuSlG3RIzS7uf4uvMIeV720IudAuK2aZkTum5Cs1G3QKZoZaBIEA'
-             b'aFH3qj1NctUkWdEH02UrTJLNdsiYW4YMBWVVNc7MMesDQdV/uSnXrlyGNJnSZgTOm8tEbcE9gkwV'
-             b'F3hG30tSO5HM+DFGqn/3JTSJfYVitFPWxChWf0vnUiPid3ZK+9yfh0999hfh3kefoEWTsg1zaahf'
-             b'FvfB5cPlcDhINHO6btnsf2I0/UZ1MPb+aOIMkNUfLXirgxwtZC0x9dQRK4PTaACb/87O74NjNw/h'
-             b'Mg2rN0AkaZgVdOd9D8AjTz4Fz/3VH8LiEDR6gjaaUtmePXcO7rzjDgpqxBkbVnOnbr9NITStbJ1f'
-             b'XOfPhN7MMRNzokVDIDT3zJ09R8vmgcaqSOmEnZO8uItMMI22ET+7WsX3ea5Yl1XLjMNE73sqRrf4'
-             b'fnp8zyYsP4hWmNQIco53iGZCHCRfTD5Wm8AoZ/Z3WLBdvrRSbZykkOAEVYSQlo+ehHsefBS2UcTN'
-             b'aQIHD3PCgDK1ggmMXeFhYYbQMek1mLGxZ9eVboGJ2/75kzAKgzKzdT6ceebnKVnh5uzSmvaK2a1g'
-             b'CbxmiTrPz3IMNnMUzReShI6WYurs6y+XLnOXqn/gHK75paPwkU/9LPzuv/gnBOEhIQLfnrAdZTaT'
-             b'zXMLXvjeS3D48OHyOrEaZCeviQTVyoEa5vK9i6CxRbs7W7CwsFiF+cEON/qZzGSkz5G4iFZmXeLi'
-             b'wou+mb7v4mhAYW2JEWlZ1whqosCx44wk1eIyjMaaABCCHEOt+jNK9LjII3Cv2dna3v/d77w4M52M'
-             b'd6HrNfT2HVLTjZW3eEaNyiZ//iQ1mCmyNiTWXBqwoMC0Z0hLjLryIeeIbhwU6ugpY0+shdyMRMxm'
-             b'QZgvnHMENZ6hui5zIFhwEAPrnmSuBDlaJHT57w2k8TKW2wTTcinckdzD6sYj0mKnHJQlJRUUJl6e'
-             b'OXcRvvXCixRbLUm8wkAz+6S6/HZGpXKbOwg/8wv/CO56+HG4trFLGy9ChXVgn2GuFBQHDx8tlfGc'
-             b'ozb3NDlTLSCDzUG6tGA3c1BBZVaoRe5LAMf4N14wbx4N0eK1ys91WH3k5C2wevkybK6u1Jjysonu'
-             b'pD68/yPPwPdeeA6m6xfUwaLSkXuk98IOEyG/RNT2zLH1ViRLsRnA/BU7rtP8d5Q/lJ2eJ1b4Qsgv'
-             b'dQ26rCY2QY4gkRL8mWOt2DHOPPFawoe0cbo50bzJT59Qd1A1ZzV0juFsTjFUKIs5oHIOaORDDBri'
-             b'q3MMeX234WNlv1vWxIUrVyiILstwnqtsDMF89wOPwHDxIKxP65xi//IRmCtdd1ICSlQz4ySVdjZr'
-             b'JnXg5gMNN9FGGYpgIlLe4EJuwLvOSUcaO67wWYkmcj3bJAnEDGHxRZF+V4slh74osBjtsCKtH4ta'
-             b'sz6jgQG2TIfYoHRJR4+fhEvn3qT1TZ6V5Yt3x2O4+8F3wpM/8lH4yz/6PBycG9KmjMUymTezy3ji'
-             b'e4jXDPO6XvrBK/DgvaehHU/ZtCnwCMJc3hVRow6aGXNciLTl52Z1TrG1kJyrUWD9XGJZhbH1rKsR'
-             b'c9nAUUgRo3dCdsa9dc/BQ7dNFfeT/LPsnPYxsmS2FNSraxs0egkiqxE4OCYTcbNjfuRDarw7Wrrn'
-             b'3vsXFxYWdtsb5DrRC81bieqoMNHa1cs3N7p5s+JfTt9oMd05Oe0I2u6UjWSGzB8T3SDcoFJfZiRd'
-             b'3r8oWHLMarXvbWeqZUs01k2q1jFi8hiy4e4S00zuAZMRWcuISl/9tEJ0gjwfrlj7qKxJsNEcjNn/'
-             b'DTe49c1N+MpXv8YD8gitduCmGRK3M8SL0S0CBbGnH30Mrm1OahQ8M+dQpHfwyDE4uHS4+lzo+ZnZ'
-             b'VcM2z+zmHnoIuiE8eKGh6GPooIrciTU2qwqmb4udEYnQxoP9d9k08QDFr91eWyFLBXTEWD5xK7zn'
-             b'Qx+DP/6dX8XootJlmCt5Uw6qM2fPwh233UY04ErhTaxRMisWzzYTb7yuVRRQ7IdEpOD1SE6GoJRx'
-             b'pvDixjZhzJ0isikby4b9kV0o8D62UIfNSJenEEB8EKO480t2V2UGNvxniQMD1XxY2IUIE5er0qRG'
-             b'LIvp5zbemQQ67Qf7WFb4HLVsl86fh9HuDs0GOfNDCSO98md3vuNhmAa2uJpbhKVDh8zGK1W6ugzN'
-             b'FYrDOZya5oKGTNbsJH9ASQFkXnrgvPY8UCIuMFQrxuCSCoxwoUnXzoUCHJPT+wCpwanGZkRHDOL3'
-             b'lFkozY4UwprFezZbDur5nW1Yv3KJfRgjESq2S3H43h/9BLz68itw7vvfggUk+jRRbdFIjyXHY/lv'
-             b'7MSwsLrpxAnYNzcHbZjWTDyfetA6nZSKYiMbT1dTYUn5bTiAUIxhs7NqS1AZkDFX5nPSz586cgph'
-             b'D4quqt6/Rg1y8fOLz6jKzxLHw+fKVOwPaodJtiTcaVUbMdDDMbB7RZRuMWDK8s78kUOH5w4fP141'
-             b'ljfikGqGM2/F/px+rV6+dEsjcInYHummFrQiqptq7SpQX4LhaqjlETIDns5N5mTKyNCEQGvBaSIc'
-             b'NdUWAA86o3moKZUzGjdQKrPIg0WkVpM2inUDWdXyMv9IWnFEDmtTDzpHzpAqsiGrFYBnv/Z1GCGE'
-             b'2B/U7zPvRtrMYqwzCrQx6s0vw0//fOmgHno3rG9Naww8kgHK6+JGc/DIcZibX1Q/OnWwEFq2xCXI'
-             b'4lKkNOzxmzZoJ6uA0/QW0nV5SMi7BwQwEWzkStUJ66koOHT0KFwtdxBjPTB7an2yA49/8Cn4uy9/'
-             b'ETYuvFrD1ViahSyszY1tuHjpMtxy0/FqMMsHHyFiuWpkJFgySIgfZBdCWT8TOtcrO1SdoKMyF5OO'
-             b'SwLNjmoF3nK4ZJ/d3zPrl6ZUXdID0uupdi+BQG6RTF5xHoVz2OmY/RBZy1XFyTwbTcno8SBEFnAU'
-             b'dbD5UwItnmrnLZ2EfC/A5ZUVps1nJ0JD2nkLx+84BcdvvR02dsa0YR9YXqa5jOpfLKTLBJ1kVcRe'
-             b'hpmhzShkDOkezXdSBJ6mFQtKbjHIgbsA7VCd4a/MioO5yGedJ3cNVOVgAPezrLhq3Po3c2GBMNmS'
-             b'vfP+DmERVdbJaHOdXhL1hAEdWcp/fPRTPwe/+o//O5i02zDsRaPec06cZyeiU8jLP3gV3vXQg2Wt'
-             b'jOhre1BF0kqWEoKCvKdg9xBtvDClAe3IWvbB07BUV6wIqzML4cQf5tKpSmyQiHt1Siau/MRtr2m8'
-             b'Ho2L5uqH9xJncloQssA5sK26FN8CEQd16sEienf2wsVzc3Rg3aCE3t5kY+0tsCao4hysXblyggRx'
-             b'kWG5LMwetgdizDQLo4jZZBjR0UOtDw+Mx9ulQhzMV0w4G0atLDVZ4NFZdmSL8JYcFrnh4g0b9NT0'
-             b'QQh1E9gph1QTzJpFk4SCuKyLc7sTXSbzCgRwVv28GaBZ7IXLV2hgje+tFf0Dz+kyx/aOysYSSgf1'
-             b'6c/+V+WAegw2R9NqFQWJHCLmFw4Qno7drsZHi7lqgA4NV7Kscgpq0y8DXal8BTIFpcuDxUw4v7Cs'
-             b'D7qd/SJMNEuY1qpepbvVCuvgkZMwnryOBpSlS5zA3MIivPsDT8Mf/MY/heGwOrtljqPGKv61N87C'
-             b'yRPHLbhQwNYg2VbYbZjkQOdjDlrBbpz82NC+qWVvPcHqvaDY9KJsqtuyBICvSRAiRa00ITZcudaD'
-             b'DR9EvL6oc8MKFRNyh6UQmXDyKj4DE5xttFIVswegiCQTu61w8jHBJsnYot5tOmUzMybtUDlIV66s'
-             b'smuJwdD4c3G93H3vw9CU5wfd6IeLizC/uJ9Rhsj6pKCsvZxjd84nM7EYlbCQHN1fhbMZXHGY1S0+'
-             b'O11jBZzMpiw4707riCS9N2usvEZ+yByGnzVd59qtRdfd2SHXIS+BLzhbnl03sP/QETiHs1O0s0Iz'
-             b'53IdEP47eeud8IGnPw5/8fu/CYP5HpjVohSY1u2gKeuZN8/CHbfeDAcX58jjUlIUCCTC3Y2gk8Rj'
-             b'BKNv06FS7uN4NKLwRppxhqjJUbiF0sEldH7vns3wa8zO+gjcLJONCsRGTlYVpj9TEebfiwtWxMsz'
-             b'iwGxKTsXkGxxKUL8kK9X/SKlR/TOvXl2EXP6yEXjRhxSm1vb199IIQVx5erR9fVrx3B4XE/zRHWF'
-             b'WArFkM20MBtdEtvPmdkZgnkyY5lTZnQpg09FTRymJlVF67RT2Zlusku4BSFGcy0wyoL5wpWbsru1'
-             b'xU7DYiibjd2XvHKeoUYQTQjPHnhjxb8hw883z8F3XnoZBjNDNvxk9wN+H7TZoVYIcZ6ySD/19/8L'
-             b'uOeRx2F9e8yLO1OltnDwIIkSq8tyNodp5jFbZlCyTa1q4I1mHXhgETLLAoLi11mtf7JzQ+BtJorN'
-             b'k8CivCEGIzGAE4CaVFE61x4sHT0JKxfPQtpah42tHbj/nU/Cl7/4BdhZQW+/hgXUdbO6fHUVVlY3'
-             b'YPngPhZ9CsuNpW45dAf5fH61wVT1aNGEacqxN1cZk7mKa1uGxLJLYRZXBIq8SBZpmDvu+JWN2OON'
-             b'tMfhl5EICxyOiEVNw3EsqWZZVYZYrJReGFWqecjqguGdE0j8znMHCrxsZYzAsFGsDDl8/73yrK2u'
-             b'b8HW9ia76NtwHAs63HDvuO9Bmm3i5UNyjUCF4oUZhEDi/PM6qW0hsQtB6N579kl0fHhlHeY8UUJK'
-             b'BncYJdEtxk4FL98niIYmUydweUXgOibnNOOLQuduIYS4xB2Wxtnkjrsm/Tf6jO4/dBSuXb5QiUix'
-             b'OqBs7+zCk099GL79/Fdh9dzLsG9upkLGqbpb1P3bXFfwe7/38g/g8Xc+UtbYbr2fEH4ISUpZPPI4'
-             b'IJNjP1ArxaRat0cFRlqAY4ssKFWufQMO8VFD4rqH1u2y1Xw5SQzYKUVLdjRluk787CNjNTeIavWs'
-             b'u9WiQpImsu4PCZx1GNs+XTx/7tjWxnrVCd6IQ+rg8qHr/+7hDFw6f+727c21/QsxmLeaqqGjChQl'
-             b'9ti04y0sLsxVDU5qyIiUlPqB6b9JQgU9uTXoLMbPRQgWiTa7yo6tZZCCpwDUjXh3a5tcwmUo2+EP'
-             b'JmnVzUVCLZKYWWPU10yb1cq1NXj2689R5o/xp71fW22l0QBqt3zmT/7MZ+Edj70H1rZGEgBPw+/5'
-             b'A+WAOnGTwnti+CnvW7Qcspgi61qC0+8YwyMby0rhAqa3Km4fHXQSzGVBejcV+PDhLPMcdd1tVDwt'
-             b'dwsDGxcPLpPzMj7o84sL8OQHfwT+8Ld/ldJjm17UmRjCb2+ePQOHDj1AeioJjfTx3NmRJ8D7Ljr6'
-             b'FzlIIJEBNWR5zGF+3HyDCRyxqmzE2LUXjMSAs0OEYfo9oo9jl183UVtXFFCYbZBPM1cMC4xVaoEQ'
-             b'YNAE56wmn8HVtnRPYp0DVkbd1BJR5TCVqE2GK7G7W7u2WmULmL7LhR5BjxO0pDpFOqg19OmbmYe5'
-             b'2UXe+KWVERPb2GHACvYYnI6rFkO27kIwz0sbtwe+T73OjFp8Gj0tNIiTpUDzXd8DN8wySD/4AYqs'
-             b'yQAdxq0em9n0ZmqwpzEhrVoryfxyX1mX22VTHe2UA38QYNxWj8qmXLenf/yn4bf+yT+uRAS2dxJI'
-             b'MSfrUcKgB+cvXYa10pUtlGI7T1oVNWd3mINznwjONzSl1Dm4EdqmHDVe7OrZEVy463+AEgBSrDoO'
-             b'cuL7KlrMhiNMJAsryOhECFwolRn0ee4pqdPVu1JIVlmKrGzMT5ppYVLCoH/g2G23l2twg2ZSq2/B'
-             b'BR3hrCvn3jjatuMQeo12McLWk5qxxlgYbz9wiTAj8zBqYWs1IGQA6rYAVOiaXRyHnPDE8Mts9y8V'
-             b'dwzOiUKEgtlps3KlV5Y/2NrapAq81zBunRxBwO2QyUHuSgcNbrCda1T73339mzQIp6o7ybwkmrkq'
-             b'v6v1nRbe/9Fn4LGnPgIbE0zGnSiGf/DQkdKFnFDyhmVyce/G1wece0ZwpZtuIUJLD7W7ku5VYFhX'
-             b'whnlXuTKCqVxacDiTWUDggQ2RmUrWlKt0fxRw7W7tAQrF85ShffQO5+Av/3zP4Hx5pWy2Q/LAh+V'
-             b'1ygbe/kfehnec/ouGPYjR7ZAh0arBBCdOQYOb4x0f8i9HQ08mfWI9xVFk2i1JAF6UxYmN8zcM8eC'
-             b'qofCEMDM3Sf6/uFDip1YPzoT1WAibDKZnVaHCrbB162XqL1IvGhZ5Z84ekU221ThLjwQ0UE9q2Yi'
-             b'OINP7kbIZTzC6uo1Zm6LU3vdmEblPdx57wMQ+kOY7ozgWOmiAq9BJZxFE8rXCPPgGH/iKO6ykpRI'
-             b'JDBg6BQyRtuPe+ImnHGudjCgh62wUhMfxuAMntvkuhBXTGnBKcSZEFQwrVtzcGMAR0+VpFw5VCXA'
-             b'Er0Lz7+5W63C0Ei5/G9nGuHO+x+Bhx57H3znq38Fi3j4TKfuZ/lnpVz3simjvORdDz1QyoypZp9J'
-             b'J5NAjHU5F00EtuW3o9FIC0Ux0bY+LHMqde1qUvCFmWTNVay30WI0qkVp5OenbmZJTWMjd7Xq/uMm'
-             b'IDUvThZL7sxROXhMY6uA3yn+NSYQHD9+YuE9P/r3yoe6MTHyvZdf/vb1+8oOhnD23OuL1Tm5cYwF'
-             b'Xswy9M3mWCBsJ7yRc3OzqprGzWpcHrDpqFSywxmFCLJycpkdGDktUtTWISmNWDba6lOWrOoRllVS'
-             b'lgNtYgj1NY2p2oXUlpilk6x0qwuOLb6m8hCG6hqA5I/nvvlduLq6RkpyYvRGyYHJHHBY94zt7Smc'
-             b'fvg98PSP/RRsTjJFXsemzhsWDyzB8tHjeripLYyD0kyvFJUmT2uotQFcN8sn2lmU66FVpWONm6fJ'
-             b'RiGbStTD18cROBNFzWMyWNA6xiAIe/l+hJ12NjdgsrleOud98MBj74W/+qP/C2YHHDRIdkQRNkpX'
-             b'e+HCZbj9lhNshClZWtBxD5ck2AASRmjJpqJC84baCUTgCQSZ4SSM3LEbjoznKrFPOUuJ5AJJXTkS'
-             b'CXNlY7aE4aQzOju464wWP0sSIbI4CoghMkdLZH7aQ+MYbaITCn56Kg4GmOyay/parcQTmVfx96AN'
-             b'1u2n74Hd8uyEcl1R+5h1Mp5sA8zi/hbAtUd6v00ja5/LSrWg8y+db4K3OpLr4ZilYNEa2Xjk1QxX'
-             b'5SReTpA7NmjBOXYHFReD5mwpLK+FmSUe679ZBiCGqqLJnJ1fhPn9B2B7faWswe3qAp7nYLt8yQee'
-             b'/iR871tfLx35Tql/+xUql7I3G9sUGYDnLlyCrdM7xPojSj8z7cDbTklxLsUz2iPt7lIEDklMHAwq'
-             b'RWObVXlmhDEIHFEPWsiblBg4pQCMfMKFPzKEwcmOg+tW5TPNlHXeI8cW0LRkEOKFziKDsqcjF424'
-             b'cjbWrs1PynUcb2/fmENqfvHg9X/zcFhO0sm+2hgl9eiC7HBgPphqIdSSS7OESOLm7s0tM88DKIhO'
-             b'nHohQ8c6KrnNmo8+crTmxzr5xEymiQllW7JyqGtBv7fRboUiaeNgZ3YWrGkuS6rLvWEWTYbciXNG'
-             b'FtjZsrl+75WXKdqa5nHijO4H1eUQ2ZkkWLrpFDzzM/8ZjFLtTpC0McauY2E/LB06XinmOTjxsmfx'
-             b'CVOrNfA/Bt24O1Cfq4Az002rCWfD1yS7mZSrWgN4ILyzSRGEoBHKewfuQVmRUkCQI0MzgKWlQ3C+'
-             b'HFK74yk88tiT8NyX/wwm401id+o9K1//5ptn4dabT1QSiMCtElLHhx7wIdGIVbU8aLjJcCcugW/i'
-             b'ZIK092oHNKXXEw2Mae9bZ/7KcffspAASLMfUdmU9CoG7ARfJy/eC/xar053RiDvf3B238M9DeHCc'
-             b'bI6jVkwMKRNUU94vukzvlCKuXo9KjsHnDSM5Dh2/GY6duAU2xi0ZyPZK8ejnCIEz1hBalO4jS8yF'
-             b'zCZVEpi7c0ZmVWYh3WiBFnTjF5hLfPWUQeq6KUlF0IcxQqdaJ2lHtEh1IUQpkpDYFUXEpsz0hGDz'
-             b'HN+1ZfWHyQb/ZXfIQp3bbaytkPC74c5zWr5obv8yPPrEU/C1L30B5qLzwdLONCnevF32kJdffQ3u'
-             b'P313NToO5vmIEosMDqOui0XnbcQqRteTbOykDEEDwVKQojMp6SKoy2J2GsKgz2GMTjLARTTuPcbd'
-             b'yOYlyQcSwtW4jwUJmzRje0ZvgmpLQ+juC/j125ubc1uly9+5UYfUfY88dv3fPTsPz/31l08F1PkM'
-             b'ewy1AQcLIqKRO44BFE3NbSNCYoNBjx/Wpp5acQrjcngMVItTBX3g2GNBTTeFcFEDDLMznG3cIUPu'
-             b'FcJQkm6pQdX3NkVcxIZzZZS1Vm9kKyi30IWrlysziu0BHE9aeP5b3y4bEh9QDIFU2jOzuNCLD33U'
-             b'+nPwsU//HOxbPkpefJW80ZZNZZacAlC3oXMEZe1EN0kTz7JW6f9ZIwZY5JydswMvQOoCmsbR0a3T'
-             b'MQQmW7vv51kOfxHihmZ8WT5avRexb3Bs5eQRAw5944bz+2C0sUYR5bfdfS98/+tfoftPawU34ybA'
-             b'lZUV2NjcgoXZQe2wBNbhgbX8sIar5hQshI00bwitxRpk2LKrQL8UUggD4kaPRB/y6Wv65gnDDpNi'
-             b'okl04Mgbb2JoLyXVkamGjqt6ZPzhPDWw9qt267wW2cevmk+KH11SXU+QYiSY83hN7W00VoNoSOX1'
-             b'tsoGMCFvyZ5Vy0j7Le/t1lN3loN4UIquRIy++pmmeg/qptlwkS5dSO6YyWaNsDcoLzuPrKCi28pW'
-             b'rYkHSedIgaUQPoE4gjkl6Jwp6OTKroUWNy61wAURQnfSDN46NfgkYbUTakEtRkCYqFZAydx1UJ67'
-             b'ffuWYO3qFZgZ9mFS9gOaZ5Y19ORTPwLf++ZXYbR6npOaLcfMuqlAndDrb5yDO26+rYrVGe2hH99W'
-             b'Mo1IZoxiL+WRxQ1lE7qADSxMZwVywCvFn98TW3EBJy8k10jh+x5Px+V+TdmLEJxhrDF7idVc1jHB'
-             b'09OpI10xy5cLr5a78pidDKT8TdlLh5uba2Q+fUMOqd3N66eg99oJGowe6cWgD3ySfiPsHfYZbRwf'
-             b'+n451DDegR7MqOkwMBqPYF7iI/TmOHiC5Q/a2usVr1HXTRM6qFRWTooJgvGlRru7qm2KAsOAc4B2'
-             b'wmQXreqMuDNpoF74xotlA9mtPnCJstidQLb+RCSE7EwyPPOTn4HT9z8EW2iZj+mY/FAvHzlRvm2o'
-             b'jKisEeC9ikkTRbxxXmhuGgtGVhE4yTYYmQFWcWrk5M6sUe7ZWQ15mMUJd72gMnRtboJ6pzVqnxDc'
-             b'gWoHVg8Olc94rmy0SFl49In3w4vPPVvhtQDqg4jWWpcuX4EDp24t3cWI8XOzggncaWfXRUlyrqwr'
-             b'YUhFZkriO0IChHRBNRU1OSPUZJRmhpRraCUDv9I9sRqbigTuUigavE0qEtb8JZfCG6ExkaVGbFvV'
-             b'TCQIqa9z0D5OZzXcTa6tb1D+FHZeNjeI1F3fdsddgOnyg1I0zi4u8NA8qsNIlM8nG1/2s68qZKa1'
-             b'gYUG2x9lyXVLRmiQWp7qpJRc0kFTBcv6vhor5LLPMsxGJXcHpv45a/C1W9L1E34o8cCz9qLMjNQp'
-             b'poHuqu4pdJ7FMJU/+8HDh2Bna4MKAVwjOMecTjPs33cInnjqI/CFz/2fsDjTqyZiKC8YTzXRVmQL'
-             b'm6XDPX/lCtx+8ihFkOhjGa3I82QmmYVi8dTHpOs06SIXum+ZN6FpRIPTKfE4QY1+nRiY54socq/r'
-             b'rrGNIdtsST5LEHd0uTbJzAsimFm2Dl6DBYhubW8Orly9XPbUG2My25u8FQp6eUBH2zsLMpysNPGg'
-             b'9jVZce+sUEGFMVoYDueom6oD7Kz+N4k9ploJY0l+YfGGkKNG1DdKPZ+6waxYlLSc9yP4eKRKGSt3'
-             b'7KQCay0bp/SvNOEGRG0AWHVzX2W+VkDV1urKtVJFnSFYp9rll02Xghej+YxhPMDuBB59z1PwxAee'
-             b'Inp5ghp22JbfHzx6gkLQaldo1FzToSQjDjiCg9dTqwAXwCnSgzPv5E1IsHw9kYMNsNvKPASmtII4'
-             b'EuQ9jtzBH0EuZjx7jU/+If7W7MI+WDiwBDtrV+Hk7afhxC13wNaFVymGWg5NJBFcvbIKcOp2Z8Cd'
-             b'FQKSKBOpTDVokobDwHEvrXbzObcKe2nXqQbIFoQZgkFYmV3xKd8MO6K20nXR4R1nCD0yp52q5Qx1'
-             b'4jm7ozkTVFmZUg15UYaWyTpOw1clGiKyNSeG5OYplZzSow1nY3ObNhJhbNV7FyiR9thNN8OobHgz'
-             b'Bxdrl6ie3j3ntcevy52eTMFFh1WXWaOCfFw/vSCWQNkxMBjFCO7uKtQUO5oeQwNctAYYXEfQlN+H'
-             b'8TlPyaBs6MqETOaYXXyOFMStadHAkaT4uTV9XNL4EfxDDErE/DUq1kO1CMKiabu83Dsefx88++Uv'
-             b'wubF18kkuSWHBma8AeeU5Wpa+2rZB24+cVTF/7jJt4rIB1e88f8nh5Wp0u6jvG8R6ubsFb16EGVN'
-             b'hk7OKswjIEGJLPR8TFtnx5jNbNq1VRRbE8FBzTzr14T0IIqE+h6iTIKr9mo02u2vrlylA/6GHFLn'
-             b'z52/fuLEcAZ2t7cHdeAeHE6ca4RBbsCSHJP6lGXWm8SmcaLcOkjFOREw/KZFabTMz+wGozK89nHw'
-             b'2VXz5CvHwlzdVNFpfDqh/Cjt9CTgiyt7SRHOTlkvz3ZWlmKEF77zUqlgW4qDxo/XcnXZiOsDHoaj'
-             b'ERy96RR84lM/DWOo9jptkygu4MCBZdi3/2B3duRFqgk6+iVadgIZSYwBOKsp57SQshtCZ3PXVtxe'
-             b'vLikW4kBwEdZ7GFYgSvoNFZEvk5DKKMy7wO7jIgMAf8Kw/beuHYN5meHcNd9D8JXXv8uDBf65fbW'
-             b'DrzfG8C1tTWav2Bic2qTbjY6j2xsfin1tDDtUmqVyZR52eAhgzUDbt6qwue4A/V5I8fuadVAUffU'
-             b'sqgZVBgtwXotR3DTfA+jK9qpNfnMhmtpHQXWQtXkZBJpitM4C9pTW/UpIQSlDNcE4sbIFPi/ssbW'
-             b'NzYrm5A6/4Y2x0n5/iPLR2Fu8QBcK5364oEDeh2wCwcnDgbwwYaSMZZYkx8twl4wjQjmQehsv4QM'
-             b'oqajqltyWj53UChT1Ge+uUNOlyMza1XTGHyRI0VYNAcUIVGpxqunc1vjn7eORBFYwJ6sU+H52b4D'
-             b'BynQs5KE69wSP+Zgbj889Pj74YuffxWGpZuisUbIHF1jsSC9OICrq+twbX0TDi3OV9NbPq6aLAW2'
-             b't2bhgqQ1HZhGzzsdJjYBeCC00XlM5q4sQ1MndJ5oMGf1KeRwV4VPk+4Dul/zvtJzRYYasuvBnzUt'
-             b'AVzgbCSx8CiurF6jzKob8U9s5oZwfb9mIPdC2NndWqiDtqS2OcDmgy5zT61QKkQXGeaoXZWT5tZN'
-             b'vE06IqSKVBhJfOiZricrI0pTRiu7tz44JLxsVLkfmPSwWzbBSWmDA2e1BO7YxH8QWjNQFIpyE+z9'
-             b'9MqhdKYc7hevrkAf7URC3bQiPzyZ2YUoTk5lAf+9H/8MDMuCR6hrWt5T2bJKBbwflg8fd5uWm+Vw'
-             b'9SQoo+LgbLtT1exZvfokhkM28lSdVZnKndV5XLVUDLEKB1WCGrOQFQJ07IXUmTuYVq1qZCzugWye'
-             b'YmavvKiOFbKZ4TVBwemBQ0dgt3SQ9z7wcDmgFjW+HQkCuKHvTkawWg6qyMy74Nhujey4KbG2ROQF'
-             b'geeJDHOlrMnPlAdEEFli7YnETkQ+bMDRqj0cxQQZIi7UmWlogmbs1EVlYtfY9LjDrr8nCDkbuaC6'
-             b'WrvQv1S7CWRURTUfrp9JPWf4/U7KNcGDm9Z3ZOdsdjI5fvOtpVubIYudGcxFynX2C8ESA+rz0rg4'
-             b'jaDO7DFGCM7vQqydgqP7CTVdTUa5i8muSArM9hSSjswuJeRRDU2zQ5A5nTa4wyw4NllW8kSu94lo'
-             b'3i3oLN8nf8v7YFSFIt6DUO/NXSNywGNkbRgx2+bnYaasRdERplS7IdQsPlK6qYNHS6c6nrI9kbA/'
-             b'+XFM9X0ig+6NM+eV5WyO9lHXlB4qMbjs8aBepZ45C2xjJPN0KjxkfYiMUwdUkYTt5MsYg+0fuc68'
-             b'JX4liNuHmFF3JAfVqg32HKZVHGZSG0J8GBauiwgDaydDnAf7e/92/urdcd87ru94Q0uZnZ25cTs+'
-             b'VLVAUeOUg1OFK9AQbQOt2qQaaR5Tq4NOvHk45MNNOPYbi6ZWtmDLiblBKb0QzFnc249EtkNJOhvI'
-             b'+uwjpGidWna07fBDXnXAG0yl/tafi+LJ73z/FRoeRwjqCN2Q515W/HCnHLhP/siH4e4HHoL1rV3I'
-             b'g1nynsADeml5WZ0AfCqM5vrqA+qdnSVTqDHT0GAPjMPIOoeKDovBOV0nYJPTrHHfyvAKzjeMaex1'
-             b'sUeFMDtpsWoC2ziIx2jBynoof4j5UxtXL8KR4ydh6cgJWDnzPZgla6ys2sfV1VW46fhRhlcNykzg'
-             b'A/V4eJxcYq0eni5Xhx6oqJCzDJxDrN1TcL494otYtbh2SIqlDBEzWGNF9yAFFZwkjklJU46uiOa+'
-             b'QQdE5IELiDVV/WgNUtxpBtSS84RKUlOFtXHdlUqVZqiR4+Sr+38kwsbS0ePEmhwuHGD9l3dtkLlt'
-             b'snkr3ws1D1V4CZxJsncsCe51zNnFH6IyO8shd9ZYcCJyDS+Uapy/tprjZucckRSig5yN2CHrVBxY'
-             b'NIUgdKI9OrR4MNcFcXXITs5h0e1lXe47AJc3t0pBM9CCbTIaw8L8Pnjg3e+Bv/y934KFobrdMbU/'
-             b's7N4ou87d/EK3H/6LnTtdnsgP+HBNEdii4bJ1tFFkChrMplOKXp7LHCayJQ1Ekg+o1g4Se4X0Nxr'
-             b'wgVdcJl4UXLtDRpkWl+F/9loGUANiUGpZH4wXzPWBsPB/g9/4pNM478BnVQajeB6fuXya3d7a2Yy'
-             b'2p1vIkMmHo52mytdxMQaKd58EeNXP6xgAjzEpFEghhVp0EXL7ms5d+dd6gcohS3v1sHph9S80kxq'
-             b'x1iVimWLiOUisHWqXOXqdaaLiNNpMZ/mzLkLsL6+QYcNpcAKrhwrKymwCeXBYzfBUx/9JEF7GcWh'
-             b'zZAqDwwsnKW4jew6JykgI2sggnu+s/PTcvhy3nMIyNCZnee9YwN1Bs7BIzJlXDpemcdooqibPFFg'
-             b'QQgd1UwtLMDweXDziCC2KY0ZAvM8BG1pUKOCs4B73vEojKeyadXuBjf/ldW1ctgnpwfjFeAdtEPX'
-             b'dDM7Abb5meEhNVXWmgBUlNKKTDlnZBqFfhvYd80TSfgakWhXuzTQoMLkBMHVYTvRwz1NMj+K1pmG'
-             b'oNAybSyle8Q5iFDX1StPLKHKNUT9E7JIQbp1MTMuh/vykcMwKe9tYd++jpODuJ0I2gA5ma4uGzNL'
-             b'Qj73LJV6SKbUoRwHT4bJ3fmoQcZZSSEG6WVlpIXsD7k9/nti3iycoCjPgewj9mzk7B9wXo+ilVTo'
-             b'u615SJrc7T4vzZYSSBLQ3Nw8EaEIAW25OE1jGE3G8MA7H4fZA0t0PyuDN6j/YWDSFxZw6+tbcOnq'
-             b'tVJg9+nPG3dSZ2fsahc7qYktzbe04GtrXeWTDfhwaHWmZdxJ7eB13ld/CBb8BE8L0zgYG1JE4UE6'
-             b'Z4opijpm1oh44NgjfRSj26vE5Dj1+mW9Iwmk/vvt/RUn25twPb/a8mu0vjZsx7tz1RMuVTZLrBu6'
-             b'tvhB5izsSMHQID3wXvek5KdAKbkmOGMjStl8I1uGZKkkQPOmNLFT4jZaNmoUyCFWvJ5eX643z3iI'
-             b'pMWvhzBKTIlnRFE7CHwIEeP9wWuvEYTUMHQUuAsEGWiX65DK75/+xE/A4sEjlKybe0OY5jrHO7i0'
-             b'7GZxMk9qO2JI/zk0J1J1KY6VJ+WRbthhD65i1RdlNTnfNmMsshGqr0DVmyvrRhIUMmkYUhI2lfkH'
-             b'Kl7OeqbcEWjW94gmn6gNuuWO0+hFU3OkcJPhDmVra6fcowltCFn9e4JzTOA+iann0YmxoeMxB5yj'
-             b'YxUjQUxIM+41SmEO7MdX9y4jAGQhBLHgOKnzuthF4droMdTVUsy4zBl0numgFrW3YZagEDYanq3k'
-             b'DnvUOG3b2ztkIKtmY7my62Zm58niB8pnmV1cdLPzbEJMHzYaWr5fVVeojvJ1AltJxnmqujCy/BJP'
-             b'OB2kWOR57Upbc1lP0DH/zfx3OYQuLAdaVfL+4JiMfN8ojyonLYbA2ZN5dp0WeKGxYif4OYORqRhj'
-             b'NQ0cW/3gLyw+Z+cWzCQ1VrQIY3QOLB+Bex54FDbJXd4E9WmP+Sv+rDfOnrVgMNd10B4ZGzWargBM'
-             b'4AgfuxcpS9i8UdP5y9mMVgqAatcVHUszKtsysdt60gMuOIG7RLTgiRfF8SJWWDvY0MYYqy7xQl1G'
-             b'QtAmojwzvSBhiDfgf73J9vVZWeTyYIy3Ngd5MhnIADFCUvNN8J4IOTu1d13hg0HDTCH+oMJGQ9JB'
-             b'OwXv/yu5PEGqafW/NMhOXMyDTp/EhJENF7luxujm8WTEM4+gFORgRWC12ZFkzWCajn5ZyKiJuLa2'
-             b'Dn22dAodg876Guhufud9j8A7Hn0cttDZPDS0GPGQOnroKHvtZYUcxW9J46K5M3GGF3ro1wA1U/Sb'
-             b'e7RhzZnZfEKf7nRqOsQNStn1WiwNqMsG6eSOCj3o3AKCmy9EcCSH3OH2BegeloPZ0kWWqnX56Aly'
-             b'2RhdO1ftkHigPplMSC81N7dcN00lMPDz7xhPbbZus4dMuuA9xxqaTeA9H5YNPYO4kke7nkyZDj5d'
-             b'UQhwDA/V+JUK+XIyODut99jdBNlRfUIWie3HB10lY5grgnk5ZoW98OuQeLMTsgrQdVYAtfAbjXfr'
-             b'OxaCCI73yxs5dOBg2VxnSne6ULqqITNTDdLKXHhk7aqSeQ66SAexvlKavwDQLuhR4i9Ej2dR4s4a'
-             b'PSWzXxKqPuQuQxSsC4vR0nyDc5yQXLcggZBM/9YCzIlVYQ8DNeiwv7WRAO/U8llInhDyD+kuFspB'
-             b'v715DXrCVMYiiey0Gnj4sffD1//mS5VFzNBnDGYnhR1xP/ThyuUrMCrPPDqqpDzV8EJfMcqhsTva'
-             b'gf3gFAUikA+5m9/lJBhZEp2yueULwcqzafXnZGM4RpfGKHKSpNpqX4BZqnLMXYs4MZuO4h5S789C'
-             b'FSUbu/JtZfdt7Wxf50iqgc2tjX3ttB0OhCUS66LtsekqieikLe3ABoEcqok4irAFU9cF8hiXh7Kd'
-             b'TCqbihktQZyck1ccSFXn1ecWcR1UwQ5avWYKABNxZo1loNFFkqErt9UiBhYvN6Qll8rkOy+9VKnF'
-             b'FQRjWnzFeTFSejeNKS7hA09/orxGn+kkkURyaFeDUFfLQlVwDDmZb6hFvsvowWuVXaui1PIOtdfG'
-             b'Q+ZmHjr2J1pQB8/Yidr1qJ8XDayCwqOG2rbsegHOTseRDXT1GwRpD7QIiGMd8s/vpyyeU3edhue+'
-             b'9Drdt5lyGDREe86wWTr1E80hMh+ubDu5Gok2EXz1SQJH8kjK3KodWFIxaxfqj0L8KgfKgI1ak0J/'
-             b'wEmsQsIQD0o9/LPYbjXqLBBJJGwBcTWLLBBdfRqmAu53xafiO1e+aThbCp7VvSYfWcWxKJIMwWd8'
-             b'NQTlLBxYhtDrUxdlsJqDw9ivsc62pMt2MfA5Oeiqa9pMRr944DCL0SQPgl60ljQs6zA2KhStXX/U'
-             b'NQghOGd0L2VVc0E3WM3usA3687UYju7AdF0+cIFSyTocj6Ku/obMiPOFWHhJATScnSW4ti37TxMb'
-             b'sxwqxchtd9xTOv+74bXvPg9zw6Fjhrpuufx7Z7QLFy9dgjtuu5kJWEEDB6PIKeRZZUo7+INKZnHZ'
-             b'JVNHEzqTTDskl0Bgh45CqT9kYitQqYxH3HuK9oz3ZT7o0gWAk3+j67dlLUb2j2xTO9/m1sUVvc2H'
-             b'1KETt1zfMGswLBvJzkLppJrqaScVW8tQQ+w4HFjBU28mWcNnq+pUSxGr9xlGLPeGM84NmSET1kBp'
-             b'AF7dbdh3zy0C51CggkEkM+yO6sPKFUGbkrbBrQsFVLFkqvBAvz8P3//BD4h5RkGNqu0wbQFWTjul'
-             b'inr8/e+D20+/A9Z3xxDQoqatleXy4cMq0tWI8NQasyfYpu41Iil5OpN3VXdK9OhC5UJ2SajBpa2b'
-             b'kNAPrJQh7DYOH9Et+jEzCfXAgaS8NmoHJWSWoNThnrXEfAbOlkPq2uolOHnLbfBVcnTo1flfqhDF'
-             b'eulWE5NqulEdIvrMCqPJoxgdIaEzR0mJ/fMS5yRFNZklViIH/knCckOMUIaOkDAiriSxmgXT2muC'
-             b'ejSK+zohKJhTNJipc9UGzOZK4C2hf8j6pZyqPsOKrXbZCm2mTOGZRv02j7/lw0fIrWRu8WDdlGPu'
-             b'xK3vJRJEX0x4+ZHYbQUTg0dao23H+kg2uew3P5D4kur1om2JpnAL6zS5wE03g94jYlU7sy4PXZdP'
-             b'w9B/B00IfjblJnPZQxFMAMrmUB7cmAH3JdTpzc4twibKYCS7LrNHZOlU73vonfD9bz/v4nwanQtL'
-             b'IYZr6c0zZ+HO226qc0qdgTFcJx8e9UVljUwph0yIFqnjXxjFRFuE9Px3DbuzJ+iGliqi5GbKGgzD'
-             b'Di2S0xcZLUqQNfNKrKxScg4jmoIdxAJR52mB12RpVHrj0fjGHVKhF69PyEvhcpOBxLJnxLtzyxfU'
-             b'VUls8pjlYeAzC6EZgUqEWMEDBzoU0CW4NzNXNylodJOSIX2UyiSIe3q3UszOeiQzswLfG0Y3S3eV'
-             b'urYKjk/Tqp8Web2R3mAEL7/yA5jBQ4cXRiO+f2LXhDEAS4fgRz/2TKnyG4ilY5iUampKGpZlwryz'
-             b'Rm1HgzYc5u/d2xVP17cYNW0087WqgkiuUnnQLdlYkjUFjsYNfiDa8UeReWFQCNIiIpnZp9AO68qg'
-             b'NXGpv5bZ3J9VM9OlIpBdEf4OI0nwOiWOS4jc8a5vbpAiX9l3st+0e+yQglgCO1Pf3IVfxdOsZdgQ'
-             b'GXd4CIWeYe4k4sWNOVTbKTmMa4LvlGdITXUQ58+bmA+MhxgeTpFnkxSMyAa+aJxcN7PkVH6ZKeE1'
-             b'X4h0duyjk9gnkhM+6L7u7OzWw47h2cwefHOLC1QE4UGl890gIQ8tH0BO+yJ/p4dET8kUXed7c9uv'
-             b'BU1bXctipRwDdqBKZkqMTjAQlXvm9q0uICxvCI2hBxJ5I84KSYK9PNtWYKy4Bz3J2n0FZ+yZHS3b'
-             b'B51mnQk6OIt0Vg1/a9KPPjs7DxsrV+usjXR3iWakGM1x+v6HYXH/EqSddRK/UocazEsPrxkW31dX'
-             b'V0gzdWBxoYZxikWUwOTcyTfDphYl2RnJpkadHMQWLbNwNytfwmKFVDwf7PLJ9UGHElPyujAP3kZE'
-             b'rIuFUD8HtzUkg44VUnQMzzp3cGhFtXreU1O8fYdUTtf3siS8nUz6LTk99HQmJCJL76GT1FSxwnFY'
-             b'9eHDH9R8Nuzx4QmEw88Hg6M6DBmhu2qR5Awmg7l2e78vxLRxYbXjHTKyVHZ3jF64wdHoBpdgBTiY'
-             b'nYHvv/oabGxulu5uUDFnxGB5o4zMrrlW3vNTn/hx2H/oOFzbmlT9Ag0xemRmmcGiuDueMUo796zI'
-             b'qBWUNwStGs2sep8kQxIepGRNMe5O4Tv/Ka8fOh7KJvoMXE2FZNtJrlRuKkaM326ec7x5e50SdES/'
-             b'DP+oQC/SBrv/4CFYPnoMrl08A7NOI7Ozu1uu8wTmZgd1mJ1VHNLpnJLyxDMzQnkSGqWuFMukab0+'
-             b'bK00mJ+H6c4WU3yr+arpghrNcspqMswECnZJAYp8qLHzSRwm0KuwnZZDZ0Dwbr1Mjc43O/ZCgWeh'
-             b'UDu7EAcQpkgVTpY7FOt8i8JAxQczVUYWvt+5+QUYzMzqOlD9YIeubMWI9+LLbs3vcRJWF4+6pCpV'
-             b'ebK2CpcvX4Arly/B5uY6TMcTQhSWSjd3/JZbYa4UYRCHrGETV4OokR8dY93ojeTE+NbWv9HdAbzT'
-             b'XZDDJDpoXA7i0HX9AD6EiCzEhrPKRozRUd2dRRZqpuZmSfs4nexWogOJdesMEPPRbr/rHnjxq1+G'
-             b'hdlhdcCU2SITM3A2lSYBzpy/CMtLByCmMcOfSTVP9dJmyjujAlgMorMzjxVHGDGTlsNNc/nMjSJ2'
-             b'xL21SO2LtpThwjr/ZPF7MgamdthoQkCfl30eJdgw8/7C7GbQ4pDXRk0yKEu3LdsJ/fP2H1KGA/9H'
-             b'dlLIwZ9MZmS4p52TwETBWDDBpcUKJk2xCdkioXGxJA4vxM2Hkitzl64pF9MkbrEDUcXsIpF14+WL'
-             b'XSpa7M5Gu2PazCDtib5gWKPjA8aeVpNS9rz6+psUHSH3XNzdJQ4AKcIYm/7u934ItlD4xxoePIxn'
-             b'Fg4Qq09hRKcxCqLbkSHxHvKBH1PUgMgpB+VBxxpJc0rFQcIb07p8H/snuf92NGJ1mMgOKpXhs1yz'
-             b'poPF1/fGczO9N5ZJVKezLlYh1xnTzNw8tOW6HDl+E1w695oTi5ZrXjbBre0tWJif4UPBYfPKHquH'
-             b'QwQxyW40/ZYeeMbYcdhNnRTPI5BsgJ0Map4A1xk06m8IlKgrlP1IczOE43AjGeC8YoLpv5UkUZuD'
-             b'Hskm2skIQX3toLLrEqqzSmuece6905bQGxD9GSHCqrHirjnWeRkSSUL1rdHAT7TiQuf84ewiyyVy'
-             b'l4LuCi3tNPXvI3iulxfpJiY70AZUnskLL78IX/6zP4JvPfsVWL10Aba31su9GXFSQdnUFxZg6dhJ'
-             b'OHXfw/DY+z4Ed77jkfJnB+vnCj1lSCqpJviePqjTijipBJ6BqdYpVWsode4LXSKGwsoyLgAfkJgJ'
-             b'lq11V6NoR2Y2m7IuY6PEI5QDNKXLRwF13dtRa7QFYWa+rLEI9z/8KHz7+WeVLRx5n8MZIaJDBB+X'
-             b'e3P2wgW49/RdCuN287cCEbrQxispWcqiTaLYbAXnKq/OPab0ik4oTWdf7HqMtu1U2WBCvZfOSKgz'
-             b'iW2OjOATmWbvOvHsI2lMzC/jjvKc5KZp8g2D+/J15tLjQtrd3Z6rFixDdjNn/zmXAmkDouzEoD6v'
-             b'ptKPg8xBxJm/bAaUyxP7ykhKHVhOWDCRXyNbEmYG5ztl34PVLVblDTP4IqcGq3WKRDGbcx8RRM5e'
-             b'vARXVq/VxF1OgDV8uP7A7XIwfei9/wksLh+Fa9u7lehLlXkPFhYPwN5TxW54sLRM8H5nWSMstExq'
-             b'aoInqKedcyOPoN5sQowInbTT0IkQUgg2Z9U4KWMrsIsvv//MLDM5bExADW7jga4I1FflAhtE83oi'
-             b'pX85pLbKg3X8ppvhha8Cu480JIac5AlcW1+HI0eWNLsHX2Saza1esPjIGD/SyoOr9CiJkldN7UaY'
-             b'VJECSSAm2LkEPqBwDfZ75HiC8gJhTKHxL9K/kdmJMB7ZHHEh00DdCFAP05SuEDftGuuV+KGv66hf'
-             b'3tdkkjrmxCFE1cVQbA126FtJndMDacbKAYVx8BPsoEol3As1vRV/dulihrMLpWub1a5SobAOq5IJ'
-             b'AsEg86DFRlSyjPoj0r3uweaVV+FPPv/b8O///AuwfqV0ub0Is+VZnJktB/tMvc7VFbuFrUtn4Mtv'
-             b'vAFf/+qz8K73/gj81M//I5jbv6SbL23SLk0bOjopn1cW2K+w0TEBuI23GlhnZa11gGTDyww2cLqg'
-             b'oFIYj8lk4VmbCLlcjNm5OVDjbZTKlOdukqqx7E133EMzwLRd9oOYdf3R/WIDVrz3m5tbcPXaNTh0'
-             b'YD9H0Ascx9AgVFE+Fne4hshkOSbLRcvdbjLIfuKcK8TrU4uQVG2UhD2JcJ/TEKtUpca8ZMfuDDaP'
-             b'oj28VQsrQT8sdNa50du4IFdT5gxwQ2ZS1/uauGdN2kFqs24KVpt7L+zgVOOgCwEfOPEzFN5+Yup0'
-             b'Temc0iGFVvhZLGh0SUb1h1M8OgaFraBDsw3KXKoLLXV0O2bXwvMtQZxSYlfxCK+9fkaZRlLV0JCb'
-             b'Nyx0TZ7dtwwPvfPxUg1jmOII+jNDWgwoWp3DWVSIzhwm6LA6hKSDTV1RUm1JtVfDaXzTo2y97Bha'
-             b'SfOeTK+imv3gnAOSiAUB9gBoTvNkQ3arTr3FTFfMmbzxJvxwHlVwDsxywPaHs2WznYHlQ4coXBCr'
-             b'3ch5PHgjtre2eeZlEFZ0XoJB/L15kC1xJAo3hwQSiotVCYp4yVC436uzJfpLJgKE6oVX3ex51pcq'
-             b'RISwHkY4kCGyJDjT10lvZmMStDkimFTOc2KoMoOQCqNoyc5qOInQz4Cr1lDhxVjvP8408Ht7pImJ'
-             b'qhMalmofk4/7s7NsdxU7BsPqtM5dhGgFQzRaeHZkFqMYR/je1/8C/s2v/a+w+uYPYKF0h/35AaTp'
-             b'hC2k6lwuMfy6sTOGY7feDZ/48Mfg9IOPwoHlk1R86D3KUqE3nWF+cM7gUWZXbKeVnSuCWOWCP1wB'
-             b'XIHlaeguFGBP5L1EgYDaYuklciKwuraGpbsnEg4VNoE6aXK7L9di39JRuPn2u+Dlb3yFOmtxhEfR'
-             b'bJVAVBYrFjTnzl+EI8tLECZ1X2nF3SbUJO/MsDEo9OumACrPMWp+Te+WkjIqMtWySFkIFXKVpu3Y'
-             b'FSy2L2r3JiGv2YyAPdGKRMHR5lyS7KvyBJgqetrvm9vM/3/gPnyL08mA4cpaV+XMQz7eAbnNtU2T'
-             b'jVf5YcvOEFFFZiwYxFkO2g/NDDMPgbubfI6e8x86EJZkWoZOXEUVcapau806ZM8BOo7tgQeDuOmt'
-             b'rW3AxQsXWTMiB1RW81T8v53dKbzrfY/B0rFjpePaosTiljON9pWNJDY9fmijxRQE0Ndkrxul4AYR'
-             b'libDkGuUQtJk4dCBTWqH5bVowtjpRCaoJbp1OqKPqVTYpL/PXBUGSI6+a8qwxCzOKP5iOndwQZU+'
-             b'gFEHx6C0/ogan7l9lDeFG5uEVwY2ySUmJhMMyIJWbHdSsA0+AM/9IttF8dCfZw0pBUs2aSs0jS4C'
-             b'Q9IV1codsXgU/eImg932oBlQvAp2WS3rYig/KTH5J1ZnlAopViPXdjquFkepmnr2yxqg2VY7Ig1T'
-             b'O9ph0oMD2qSCx0NnbsaSgkW/hx1l2SgxuLGVjRfnXtMEc+U9zpa1RS79mWFwFW42Lg0gq9O7XQjb'
-             b'9GU+UecLE/jL//u34I8/96swm0dwYKb8yc4WZNys2+rU0eY6e0P7p53yOu//2Kfhkz/7n8O+4zfV'
-             b'w7W8nyQECcbGg6bzZiX0qBu89wZX9mll7NZ5K6+8lNyaDTqHjLHplkSqiYouuSB0POoUImyCGQFw'
-             b'1h2+1gCF+rEWNB1mfFkjWBTcfd8D8J3nvsJ0gUr4aPmwof66HOTYjV+6dBnGozuZqAEE2WZ13m+o'
-             b'eJmmloMS0YyWS7xgB5DMqqPbNzoMxuAIQvisMBMYX7tN2RWrSUMNZVeoaFL1A+w1LDVwHIWkOiuO'
-             b'Ygk+K06QGwHH041j9+Xr5GPQh2xTk5MZvkXWsgvyxt4bHbaUZS1F7bC8MJ6+t6nZNmTpkU0fE3ih'
-             b'VIU/6OAZsiVXio1H1UkkplqabqBKXIJaGemNjKFjaU+vX6qDMxfO00yqwYA+CWJMHKgniNJwHh5+'
-             b'4n2wO60qdeqEpnXBLu47qF5dRoqow9CUomq5grCYNEZY6MTJPVh1I0r8IKo+yqXbWl5NNxvKzotk'
-             b'FZOw/7z4VumrU4Yx8DqOIW1vwu54RJ1hrzyoIcwovCKbrbH/QocC32FeefPQ8vkG84swR/qxBdha'
-             b'u1p+5kA95RAyQdw+iC7EWeoE6awTQy29IVG/df7mU26pi3FkAk5UTtN+NQGWawI1xHBCTgkSUhhU'
-             b'X4P/h1/fxxkJbjJoGcy1Q4h9c1yIlVSD6xfnBogGYCHeE62fMxMVogm+dzzkEOYOnCDdSQZmQTzF'
-             b'TpT31Z+dgfkDBzT7yfslCptN/fqiQTtBoYJYD58oh/gE/t2v/wr86b/+53B4H87qMClgzDqhwOud'
-             b'TZrLwbBdDuKP/OQ/gGc++4tkojzFOSVqH8X5IQXTPjKhBzT92fk9SufdmMmypTvvQWH0kHNCVyPa'
-             b'80y86Ug1wFsZaihj+iH4XYL9aEvu92EwMwM762O+volgXvT8HJfrcttd98Lswv5yT7eUfKRWTzkp'
-             b'6WljcwNW11fh0MH95b5OjRnHCAj+nAYLIpw5QlJWdJXrNiqszsHwuuqmb0VjyuYKk52MhGr9adLD'
-             b'VZD/1k3tgUXNYvNl+svkHGcqIhGVNegSLzjNoiKN2fKs3n523/T6OqlSabbtuC8C2MBdQeRDIonx'
-             b'YxDRpycGwB4vOBOXie0NrsXJeJc34sreoViEbHRv9ZTKoAqNFKJzBXcLuvbbpVoJFpsd6pxAIJjM'
-             b'+H1mWAnnE2+evVCH48GRDThSAG/IaJzg5J33wrGTt8M2DuF5oeLGt0COAEM7YMDDaNWUVy1lpAtS'
-             b'Z2Jvmxk4d8vsUJKzXQkdMwMWAjo/FPM0BCd6NnKEHZKZLatqdzfZuAqvvPgCfOPZv4Zzr79MJqcI'
-             b'yyHN/titd8Kpex8oD+x9ZbM8zAelfK7c0VrltHewbdZBKKAclAMKXeHXr16BPACFNJAwgEnNs8O+'
-             b'M910J29KqsGLOLRGZwiZcWoGVX2YcSMYIDTGhrGVrY1lxohdPJJ2FVgkIQO0nUh8R/2ZyGjrkftE'
-             b'dXwmrRUayjaBITm2k0nVkiawwzp9baiFV42X4OTkoG0ozciQPIGFQOOE0GRt0yb1v8L1j76G/dkh'
-             b'He4qH+D4cV8EAMPhdjCBWoySDRd5t03oM/7V7/0m/OFv/FM4uVw62nKfUaqR+LBoqOuNnHpc7kt5'
-             b'ju595An4+M/9fDna+igoqK4dZHXGLE6NcHHPefZAcFanfCFWiVt+FB/Q4D22pOiFjrm0Y3Jp/IQk'
-             b'T4cOpTV3uvzcqYr5+rEAvuaHDWpZ3JoFf6aRARAblcg+b3ynFBexq9Fj26XMZKorV6/CkeUDCuVW'
-             b'WLPuPSRZ4MKSZuhcFAlTMCki4opnCBwVYnMpc0Cz/VDSl8VhPlkbSoiCpKjL2E/ILWJIHZ3vKShh'
-             b'jZuPZMxM3ktT6Iwz3uZD6nqDqkJ5QMuD38tggzhR9WcN58yWHgsmOGvYml6zX6pRic4tIheQxPCT'
-             b'i58ykyodC4jjj81yvor9WgcDyu0UPQP+XY9ZQnouRnaVptBC5g2WSvvKyhqsbWxWTys6UCIL7xq9'
-             b'FaOyYbzzsfeo/9Y01TwafF8YZhjkQIu+oWE2T2QKboyaf5mFZSj4M1ff9DWOBFLnHkmZfr4NV9Et'
-             b'eMKEDFiTUf6dKS1tpkgqKZsRDsL/9s+/AH/7V38MV86+BnE6gmG/qRttebHLryb45r//S9hKA1g8'
-             b'fBM88cGPwjM/+VMwt38/WwlZFixAdHHlocPSw9/jIY4stYXSFaQ3RDDcEAkHc78wo2ZubgiiaNfx'
-             b'OLOSBP6gWRI/2Dp3yHaPEeoluy2Myu711bOPuh7ybmRnAqJqtRXW6jEIjTMYDDzEyA+ewZKXn8RD'
-             b'8M/HuAbyQOs32jGQRqZxOUgBusSGYHTz2Vkc2G+oNEJmJ4l3jcx6wmnZKZGMg52Xa9HNcUJ9Bx1W'
-             b'lbM7NOqBHBAhKE/wq9/4G/jXv/K/wUIvwXRnu84sk80zJ/TfiQSteN3b0hl+9Cd/Bpq5fTS2qR2U'
-             b'OUfY3DCZuS4/+7Iy2JxI9wStX2PsxsbnirpU78TkyEa5k42lhw+J7aI1USKEZxJL8D6SwtRNBpvJ'
-             b'PBOp/Y34K5Z/o4XRgIogtJucgdtP3wNnf/BtgGE1FhZX3BQsywm/79KVq3D3qdu1iBPPRus8kh5u'
-             b'4ATKjfPwDDmoq03SoMrIhWzmebyj9fN9JlJbDB0egXY7id32gpTmSedlWsrELsgf9qQNZPosJEBP'
-             b'yDZVg9+3nTixZ8D9/52CXm2ADVNOkH3khBPJatZokg07d9TnoiNRyyqewWA111L3JN1WzXwKLnhL'
-             b'BY4056qneT2zjPVCt1Uyr4KBDPgwtTGwTZJktTDEVv787PkLNDCt7tfi0JxYl4KzjRaWDp+E0+94'
-             b'BLZ3S2eJNw2NZNEev2w684uLSihI2Xl40RrJDoLznsJZna6j5mQl9fdTPZi12j9EaAmhVWhFfcOd'
-             b'X19KyWVFGSusiVP42he/AP/2138Nrpx5BeaHDewvXUzqVXNgIKPVXqkQM8zvPwKPP/YBuOfhx+DQ'
-             b'0RO1q1CX16QzEksCdqwu2YRiHYvOlENq38ElXgdZ48OBLLKmJrCWwi7GTtIqvQq6gOCft5lnA13d'
-             b'j4Ym5FqMDMCc4EFmTmZE5RKPE9NBrEhtWYsmbAnZ2CiaHlI3Jj3WlGcsevJ4l7Vme1ykeW33y7Um'
-             b'JwsnXaUgRzZqxY6FfPvKgTmP+UdK+4/OWSI5koHNI+wpNNNivNaTjRX4nX/2S9BurUCYnymFgSfL'
-             b'2OxsykzJUTkgj955Gk7d9xDDnD21ybFAPxOCVh+X2OUFefwZ13dK6nihOTDSHWbzIZTQQ2ehopZo'
-             b'QVJGI+g8UjdbcWHxVPXs3FrEEcfMLSmAE9fTeLxF8hH0pqsdCd6/Ptx25z3wN03PXE9SRY/INksM'
-             b'YMu9XFvfIDH2LOrZcG1EF9QaGVoLCRJ4O7PI8D2PKkJNWlDRr5vhG5ezdUSUGq1DVl3C/E0mD/GE'
-             b'SbI1Unu0pDu4WUwG8+1UnZkVT2I0S7pHuEHefTUK+z/+H/y+tvIOlVBAj0iEPRuSywDCzb0NTsXE'
-             b'NF/wnnQcYc5zhMxDUFn4iYmofm7jUBPGXLU3Ax9E0IpYV9hzAkdzLkoUwK/cRQw5u1yqIIrjDqBZ'
-             b'OXh7aMESYWICjz7wIA2wN8dTypLCTg3FvvP7DxJ8Q3Y8IWsgormVy/sA2+gCq+EFsghmK5WTi98O'
-             b'5lRhqEg29ViujtYmhLZQuNzxBcxa8beTbfj8v/xl+Ivf+w2YhyksLQzYEZ4pqqnOf9Z3Mzzwng/D'
-             b'xz/9WTiOLua9Yc3tSvyZlDHGzKDUqqjTvw85RGsC6j7Yt3SYtVZVD5dI5NiW+zDWoXo0f1IJ3dBq'
-             b'uiE/xagPa9LkUXwTU817kkypLPq0UGcNdSyRuZAIxpSU4ivWzik3OGmMasGTqPscaJdKjNRY3wsW'
-             b'K+QF19bNRu57UOYaz4xynbniHKRGfTBbMUrScVIz1sz2TeTi3rPgvhBz1w5IHKqzS47MQWWxpU8l'
-             b'15iv/fWX4OUXn4dD83We1yrxwl1vZpfi+xhPx3D81lMQ50sXNck1V9Q5WoDzAlSncXeQq2egL8BC'
-             b'h9is34trSk1oU+4SETtkHdjDVDRXF2EAe9NVC0tS/IqLwrpn1M64dtk465yWYhRnUniNcSa5O4pw'
-             b'+MSt5bk/CO3uCnVvcli3yfSPmEmG0oO1je1SVMyzg0pkokrieXg2v2H1iWbpTLLoDklJDmx8LDUe'
-             b'/UxxQwwO6gyVDJGkEVCiY1YmKE1A2tqJ0ddxkgM9I5mdV5pg90ZHBVb2kQyhaXbQHUhtpN7uQyql'
-             b'62P3VfpkvVTmGpGM4qqpnNkN08XWK1VKZ7CNMwZPVeZDBmEX1KH0cLM3XZWHqUUcHJTxX3Hd5Hy9'
-             b'RPEuzBd1cAigrCGaK7S8bZQn78rqGqxvbpIJafY+5OykQV9b/g67KHQ3H6HDAM4yUmWRzc0v6oFr'
-             b'7hE2mAwqJDZzyPoHjfkVSgx6iGDBVqCQWciS3lkPpiieiY6WbnqyrOJO/fwcJ5FGW/Cb//v/AF/+'
-             b't78FR/YPa+VJS58p18zaWRsH+OAzn4HP/OJ/C9BfJHiQggC9iTBDU+aBaHh38CahHHWA0Ghvfh72'
-             b'HzpULmdfNzvRzuFGH4J/CCUWshJyMs88UcckVWJqnRhUjHNjtcTCGxT7s1atolYlRfbQYxi35dmE'
-             b'j4Nx5r5Zk0yBoD0Qy58sGqtEBIgeQiD43svBg0SH6eaowrRKHgi2LnKdgyCBYrK7XSlN5UsmpWtK'
-             b'06AbRKVrt+RqoVlaHQ/MxCSjYPo3pwuS5YOanlx+zl984Q9gnj8DWfU0wWUemfZQDjuc1dXAzkH5'
-             b'yFwSxoa1nfVnx4p38MHh30PLqbkVoo89hqz84ZZaFdeH6HwsNc7D0/fBdF/sIqNWQopKeKYvdCCt'
-             b'7LSGUjhIx40yBRKDTwNr4yYUPjk3t58+M7pPoIv/pVcu8wwt2UEQJNWhT3ZqK6vrcPzY4Y6/Jr4D'
-             b'vNfi7hqk48u10I2u40w++UMCJkmmU0txTcJ2r4XHBz47lv5kyQX1/TXKdBYJEB6iwMLeiqG7Dj2b'
-             b'oMjLI5EMtLO1efbfff53qhj+RtgiXa9OitGqZHq4QLOmyLMgr6HxybNuxTlthg0yU3bR8/jwow9a'
-             b'b6iYad7DVosuYjkQn67HpowW2FdzcerrWUhDbdFpETOzp2XK/LBURUgfxRnDsBnYQ+SSQDFn5mip'
-             b'KE/cehvsTia1OBOj1XJz8ZDK6s3HG2snLMietKiQjDk1OL6Sc/Dg7lLII8FDWhLaZ6p+b7GvWgl3'
-             b'+EmV9rv/4pfgK3/0O6Wa7iF9jfKJjPqKn7sHm6WCPvXAu+DHPvtflr+fqf503JXIDEgKBM/yEcft'
-             b'qOJANyLhir1H4X0naoTHaJM90cpDkxOxqVSXF1z7Law73uSQKSXJpDL7ymAQCXa0/WGtjFsmtpBA'
-             b'uMHZaq3YWw2RkwOXNWzOZip7M8Q9KxpcZ4yuFLpZxtr1ZU6vjjLQj35OEIgFODO3ANPRjhVGyTEj'
-             b'cxV06laRKnkoszDX/sYVKnuskRSxKNf+pdJBvfm9F2FppjxfkxGMyybTy8MKt/NMRbp2CtWTQQk9'
-             b'Dz0n7oxKUa7vo6s9kiwnfAqmky1mXg7ooKvyDE96NlgSstPypa7RLD3LUvTx753B/J5uzqUBZBP4'
-             b'Zw89djrOOmNET8V2BHQwI3zf9GaZph5hMOzDiZM3w5vffo7IE1jkyhhAPoMQidbW19XysmP2rFlZ'
-             b'2WB82SeC03Hm6FwHQZPGc3DvnR1MINQ+H2e51JFFBrCDuG1E/flKiIRqHhuDFRQpmMwlSxIFBEcz'
-             b'D+onWvaC7W9/6xvV4eJGHFLNdR5SsR5IKXSAZqcBd9HT3eCx+sC3KXUMIxVPzS4erXzNaHenbC5z'
-             b'VN2mmPggs9TPzCyfxJHxrQ6SszoPy2ZBZqFcXVMkBFceTbCKAb8Tq9cLl6+Uja9hj8Cs0Ev9ObVz'
-             b'OnX3adL37OxMqOXHn4yH19zsAgkCiR4dujxYjURgKmzgQxJkmBobPZRSdiK/bHqnyA8pdQlMuQ2u'
-             b'FVeauwCf2QXfMeW3RoX04dk/+Rz82b/5dTgwjMSAwwNDJTXiBVdec2vcwnuf/jgMFpdJvyax31V8'
-             b'yz5jKStjMTuae3Dztgz+AOV/xyEsLh0mce9oa52q+ZqWG0v1OuaQNTez1FOu/qzeoIF+r69Vebbh'
-             b'FXuRsedZuYcTvH+xXzqgQX2fbcvQYFZ2mY4mXHRKhtAJVMzJiSSzB7ANxqWOLla3dJxxYK4YdVlJ'
-             b'IuqhBhHSRtGjf2Nsx8a12mFQhR4sqC+GPhd0meYk1c4nGLkIRDRrkJZOqejz9ZgUOSH47m/+8k8h'
-             b'THdhuFDW8IQreIUV2fEk1oMfGYX4Qr3y91cvntf1pQzVEBzZjqF/kGtZc5WwJnnphW9QJ/jAux7j'
-             b'WZtAtkF8Nv5fD1bvfajQS/JdUbdrV4PbEJQ1bM+dg7GkcMsmaq8Qap1fWiefCR6rkHwPjt98a9WF'
-             b'pZYJH1HANqV0o7h7e3ubpBRNL2pzGhnKS1wgp67VZr32gvbo6ZYc9A9OsM3IRWLgr8dkF0jOQDc4'
-             b'tMYlGZA7Ou6HSZ9fea7Vror1ZsEFfuo4B91SZgbtwSOHaP+4IYdUbJrr66QisaSmJvR0EZAAnQFa'
-             b'ZZQlyx/iapIeBjx8GmaYpdzRKuELYmBdcLblcgBGsf7gMK/gdUFB9AMiJKzbCboG1AXO1VswFpAc'
-             b'Ang91jd3YeXaGlnPGJVdNk6G18qmePr+B8uhNOXqtepm0LZncWGxVojJWZu4GVKnTeI2PEkEScpa'
-             b'HNEm5ejbGvKYsxl4qscXuHjy5JF6Fow2lqHDF2nt8mvwu//qn8FsHhMbAGds8+Xz91FDxPlaeJ+R'
-             b'ij+/fxlOP/CIDVODwHJdixvwzsk5OzOr2O2sNYixbrQL+w/BcGYRttsLpo0rGyPdf4Zsc7JKG6Tb'
-             b'Lg9Xb1Cqeuz+ogh9PdYfOyacAolUOnUpauKUdT1Tfb/aAWplHp2rilH+Q/Dzl2jhntnovX7jTHxg'
-             b'Q8i65jqehuVbZ2ZniZY/1cOZXys2qufBf1AKIDOZ7D4n+NfMYqAKHeoHfu1oYwVe+tbzsDA3qAen'
-             b'GotHgfI5ATEZgxC9+srauHzudRhvrkJ//lDXikgKEfHho/UwZd0iMgc34fP/6tdgbn4W7n/gAcj9'
-             b'ebUKqqbIDc9hPQoSNezRJ/QGz5IUWnFwLDghsHiqtjiJONq2Figyk4xszRSETMPEBZ3v1WdstzwT'
-             b'CPcFvA/loJc5d3TJC6KhQlnBbulUF0uxLcU5FgPoZEK7Y+ScMnGkEKsvbwiF9z8lJmVYvFA9Vzmr'
-             b'LdS5We2qmupUTlrTYLZye1zjA9PucXqBe1mFLXv6HvTAj1b4i24us8tNfzBo0bRgMhnfmEMqXSev'
-             b'va2khuRr5CT6G22no/HpRbiLLTFVbS1BCJXmyV/dOCpplDaenZQ1bjuo03IN3qo/q2HYUQafypTx'
-             b'+hw+EEL2/lOmHYqpUotX19eoW2h6QicNpL8SJA31D/NlUz12/Bay0sHPRhg2YCbShDYZ8BETOkTj'
-             b'zinAHhZMhV/qQc3zJnlvjTPcc5ZjcU/YWtZZR9TYDZ3JKNsgC0mQHqcvfeEPYPXcG3BkcUgMq7kw'
-             b'BO/QJBZF2FnOLx+AubIQyQMPgmqfKBsrScy1mAQlI0gYF5h1MVEJMipjKZ8dXScQIl0RDzM+8FLK'
-             b'GsrYMSrlh4SsiHqzvAklFxETHNstsX9adpBGjyCc3kwo3dtGWdCT6jylg+GkEKrYG4Gr0BW3D+ZQ'
-             b'o5PLAB0pQFSRbbJ5fcg8vxXiT9VQYUeFfnzTcfWKwyIuJ9G1WEdQC/GWvBWhG+7ipxm8yQS1JaoH'
-             b'fh/Ov/EarF44A0fmenRAY4c0bZxts5KR+Nnj70UpwtWzb8DLL3wd7nviI+w8Up+bnDxpwbupT0jH'
-             b'9vzffgne+O7zcGD5EKxdvQIHji923CayA+akKwjiBiNhgHIMdBzQa9em3qBujuLlGfVZssNOCFgV'
-             b'vRCiDCiLkMxiG455Z+kBivqFOLBvaRmGZc1ur2zBEGebkmytnUeVnqCUYntnB/aVjjUnKVobmEHT'
-             b'WpHLqCNE7sKcWkW3CudbqRcthyq4JIOyOAbDIe1JaI3U8HVpGBLNPKcODj1i+0v+zGFP3ZH3oB+s'
-             b'MWrr1w0Hc+3Cwr4KMd6QmVS8zjypQF5oyRzhGk7F9DiqE6WJqWrKrGdJjo2UNVhO3B+EiEF/FmvI'
-             b'XJDU0w4m29SbFMFSZDnELMfsNBldmqwQ5humYAKz7fDQXF1dZbuVoBoFtA7ILBRGts/pO++G2fl9'
-             b'sD6awtZoBHMLswRJYrrlcDjYE9jG0EI076wa786CV3VJjkqft00ZlDYeo5/vVZ1UaLw5rOmk9HAK'
-             b'oZMvLQ7bk90V+OazX4Z9MwMmUESm4XN8hOLZmR0aqk0U/WSsznqi20rUmUZn2CnO0JX8kGjWIjR/'
-             b'zbnSQ6RWub3ywA7Q843sxasFT+2mWhMcax4TcKUXqQKkPKbIh1lKLuXUoc2S5hr4uuJnQbX/zi49'
-             b'0JNSDVuHClroVDOVDHuST6Bjnybu/wk6LhuyMeJnYKRVURuz9U3q1QfkqVhJFjvbG7V5aIJ23JEP'
-             b'1qCGxN3uAnTzSfoc2omZOgSFc2++CgGdvmGGiwuwwoYPhFgzs+umFSvzr4+ZSTCFv/iDz8FdD74L'
-             b'+nPLCg+aLqC1rhHh2HIvp+sr8Ce/+zmYR0PalStw6dwZWLrpjgqfRe5A3fNpBpHQyaYDsQ3Kxk6t'
-             b'LM/GpcmKzCJqt5FjYmIR7GEAghbPykLhdY/+jHjv6FxDRi9pCafE+E2lk0Kof9/+/eWQOl+vXa52'
-             b'RLQ3BrkXFY7DBIYQbc3XHKe23NGBWr5lH7OihTZnkVFhkl3XzEznUOdFKTYddmO16qodYQutOtr4'
-             b'eXgAS9kN7FwhuVeNas24A0vZbKakLWENWX/QpBlkpsZwg+C+6zykGvK2603BhV2FHMx0Xu95VH1Q'
-             b'dBkmZFEE4s3VXeTJwzKOoh3A1M85Z0fpDdpaV7cCobHLwcTGllxpi+8fDaujkD0amLJ11crKiuKy'
-             b'mlnEB0dDfmoZbrntjgprYPw3OyKQABmqI7ayD/Oe2jaLcDFZrk0MHVjIqiTuPKcWHZLloQZL2Y3R'
-             b'HUp7f2XLEQpKfe/BC3/313Dh9e/C0jByRlG2ylUIH2wVjw/c+rVVimlYnFms9FSxQZJDMFsSM5nv'
-             b'hjr7mI624I1XXoFT99xfrsussfycbov278EcLOxfqrY0MZq+ineZCJJUqp4J2skg1b/mBskDarT5'
-             b'wD6B9NkpisMcDrAr/H9oe/NgzY6rTvBk3m99e73aq6TaJZUkS5YX2cZgY2Njs3kFDO4BhgmGnp6Z'
-             b'bqJjGGIiaP5gomcmOnoIhiVi3JhuoAE3mMWNAa8gGSPLlrVYi7WUVFKValGVaq9Xb/u2mzl5Tp5z'
-             b'8tynjpgOySXHiypXvfre992bN/Oc3/kt+OcYPWEPIYmAEdqz7L0h2vBIg1zy5mJNaaV4IOiMWIOV'
-             b'2oexmEcZjBHEdy+vtV5/CtY7HR2c55mBL7asuPHUQbs+PXxk5kvFoOU0FyhW/jtz8lh6zUneTOtc'
-             b'rHmFIJm27QrVudtpFd1Rej8XXvg2fOFTn4Af+Zl/Ab47z5tu0ETXvNEGQpnrlavwp7/7W3D2+afS'
-             b'+mnBSxeuwvmzL8Fh+Xmx2fmACJEtgUhn3E7dSoQ5W9Jpi2tFSZTVKQNvsAYOizbXitODfXHsz0hP'
-             b'pbOvOozoEg+HI5jB3KlU3MzOz8EZIecwQiGjMqtlWl1bM2kDJR23eOlZwCSq3smZ2VQR8bLu0QXV'
-             b'KkGdhf30eatAc90cNSMR8Qa642RyIV9FPlAliddzBpploAYZ2TgbB+LoGe/1u5OFxQUYpYP4uhxS'
-             b'mQb5Kv5L/67b64/0dI/F0DVoeiuUGApNJmVR/wQvbktZXgqVSFw4H3wIu2mZF4N6shWSZq686yIq'
-             b'L8NQkyNPyn92JQAz/KtDSfJEg9HhKLXmq+tpQ2V8VzwDmcRQU8vfgz37D+RhMmt0Ah9GnbQRt5Ay'
-             b'LzolY+6qD2K0czxWwusiNCwmodSaeGdyL+AXVBhe5lgNY1chG3DHEcbZNZyKkgE8fN89UKG3XLfN'
-             b'zhWg2HPlQgk4I8PNKh1Sl+DYkafgrnfspyoyQ63+ldoUmDBEg4t6AisXz8IffeLX4b//F78I+25/'
-             b'S+7QwHqEeR3492dn6JDHrbvlvcZpOy4yCFjiuQFwJAYWBDg71Ah7tcWx/knils5TMNK5VeRqHkOe'
-             b'Z+XoHaOv5ywiW9naTcQZPEaKLOr2zZWw2XQZQqpUrYeDWKeWS0zcZlgTu3iPzDLMlxLtS2QhKJsb'
-             b'U4xNNMmzUoTIAessYTi+og28evkCtNtM9PD5aEOqNR5A4tIQoJBT9IDCzRBnU6kBePSez8LFl0/D'
-             b'ez7yU7D31tenfz9lBq6jtJuvwvEnnoAv/9WfwpGHvwkL031iLiK8ePHlMzofA5OzFm2GWgwNl3YN'
-             b'4AyF+KDNZNzQDWm0vVhVlaIouuJR6SzIKLCgLzo1ciJxGUnBZIZOu59tBpEU065gcdsOnTMpMzSW'
-             b'lALRMq2uDUqxwNZGlPBgvb64qBLYMnDxLbBwLma8ukQUvz7DWuRZYKGDi0tELuArXzRwIhfL7hRo'
-             b'4zTh/LdcmKpJnBTQkiYeyx6Lf95pdSYz07Mw9K3rNZN6lY4TNEpojZ0mmoIyRewZAeyWrdsRbzyB'
-             b'iRCZHZRpnjVvqHLTxFPKSUIkh7uJ1RGhgxK+xaQDrmnBxRJOmFkqoNR2YHdxHjOoKwUeNitXVhvx'
-             b'34WplL95nDb2+cUdsLhlO5mG1nxYZIZgDf1+h5lbrsE0jyDUcadxeIWVw/oe0c84E9MsSnlv9CpG'
-             b'r+kUKPClinRWLF3iwIWxtpwOjhPpwJlq52EsHXgush7Eqdo9z5FywGE3PaBf+9xfwZ13vyNtoP2S'
-             b'iaUbQtACILc8NUGEjz9wH1x88Qi5Ru+7/c0mONxBczTsyEZKNhYnw2LvjR0mU0WEWJEufB8PqVaV'
-             b'/fTYEVuKbJ1v8iEgP5Hmoe1MCQ9ErTZQkaTfqs6ujBS12LJDfGjqp4reJ+qA3JrJZrJDzRxLGw4a'
-             b'jQt8ljBcSwVTHZsdgmza6jZihlHRdBuWyu0abJ1ceK2uXCOxJ7qfUxeadqVqAiWSgZmplF8FTjPK'
-             b'gnQk4zF006n6wsNfhWNPfgv23HwH3HTn62HTlm20Ji6fewleeOZJOPHc0zBeXYbZdL0xMFKOoMHy'
-             b'Cp8UNUN1NWSZtMn8EQ2k9w0ShKWVg02Thmi6LrtXxSKRYPsrDUVteGrGRsiQutXwTAjd0bN1uINB'
-             b'+iz9Xur+5+bVAFaxBFdCa2QzxBBFMCQPLK5w3U34WXOWX6/JwaAmvI6Zql7ftxRAfPAiuhJqdqkI'
-             b'dG+7qXhbT0VBxUQSz67lURe10/kodeYs+3Gawst6Vdd0bykPROYW9Hq98dzMLAxa1XXqpPpTr+5f'
-             b'9jBmeWpAWTnoBg3lwFCaoooh8+keTbwCOTDTsDgqhbwpOsmbOl6EnANVcFjRpHi1VYyNoDMeQ+rt'
-             b'pIEgMqfSTRNr//Lc8tQqZpPP5dW1LLQjN/OWfQboLQxXh3DL3gOEAdO4jG8MbpITapfbJROHK1/Q'
-             b'JGBhKVWqzcqpsZZWWhT5zjpSGDaTukG7kupZtuTCoBRrm0AGqzXNBvD7jz/7NFy78DIs9hy7yrMX'
-             b'WmWFKGYDSPdopt+Co49+E772xc/COz/808wAYz2FVO5SJIQJmcFffvG59P1/A/O9Co4+9QS8f7SS'
-             b'LumM2dQD2Pyv3OlGnkU64yqeZzZeOnWpVtP77KM9kNDahS7shDBQaSQMGCYXzqJwGxlTBEUk8oci'
-             b'hex24TcES3qnNACSMuROxmQTmbDBio1uYwgFluVMG2lUYgUaLCdzz2gsxnrdDqy1cuebiRKe5Rm5'
-             b'uEG7KHOBVGpQIFg71+RrQkVHTZ8FjXLrEBh2Lz9bO0EnVmbGsQEPdR7uk1VS6vQ6GC2/dgWOPnQP'
-             b'PPvQvVnYSztlWgN5A0PlYi4iZHaU3utwMGzIzVQ8rfZIXHgZD0bXaFCDkfDLhu0NIxOMF5/dJ6Im'
-             b'JKs3nvUCBGfYhtGIqCsYrK2nz1Pl9UL5Y2OYmZ8jJ3MqrDyUe2AOKPw7dLCpOZEHSWcYUY8MYWBG'
-             b'XDTZej7U2vVHNZiNhYIuOVDWeUcIYiHvfgGd8vGQ0lmWSZzQQs9pUUwWdMwp0GdaAhqFjOvK4S0l'
-             b'KR6I07Ozq/MLC9Bd71yfQyq+ajEvUQ8HjgkAoucocceZERW4UpeIBBmCj3AeUBkKrwznhJ8v7siq'
-             b'p2KM24m3X1N/JINh67AgVvM5/wgFeH2mHucohho3nzaoUh3/W1leJg1Jtp2ri0EmWRtlwseN+w9Q'
-             b'XAWaywYZenMEXwttlGTgHgrDTnF0pYM2FfTWk0srJcvujc15S9HEBChTmmjICEatz7ZEUj2+fPI4'
-             b'Ma7oEOZsLZCKlV6nYjaceXjT10wX4Auf/n3YtmMnHH7b9xMjDtgnzAkNNk6IFbl++Tz8/m/9WjoM'
-             b'T8PMVA8unz8Lo9UV6G2aJZjUG/Tdq2ivylT8WGI2GsNYw07KcEwLOqmaxXuAXRUm2cZGnAeUqGfu'
-             b'7jIcmKE2/IztVGwN15eMp0hURqc6ZATJ1XJsSGuJFAWmongFlytatZAJUd1BKE9oEouprxQidHJ5'
-             b'nSHRQYezzl5fITunmjS2DKprwy0wR4wLltGhgvfcEdRGE0Te1XwAeI6qYVjI87wrlLiGwJtU4OIQ'
-             b'fzxqAj0XBFgAEQSGNmss6MVnDR1JJiE70/tWJId3iubC9Rfl4DJmCK4gA0r4ActD8sasmJXO3r9y'
-             b'rmUiY5wRruI9yCJ+M691JhZdoXeZbeFoIhOFcFYYeThZscM9avvyHKcIkp3EsbhipluPc0FQcQyR'
-             b'Fz8p6YwDH8uSYuBKhxWcddMJG3Mq2QLOrF+2ohM/TWe41pIIraYLLCdBKDMyQ9LOxWQelT+aa5gF'
-             b'SEff70+txHQdOiFen0MKXqVOCiumdrc7iKYpFfNMAWgI8lKdjy9zGIZqGomQlLeecS9ykRZ6NS78'
-             b'IN5hdfm9RJnHQnlWqyNW9otyWobGQTMVC7Mv1GyZz5XQcDxQ2jtVneAaZritbhe27tyZHjicg4zT'
-             b'ppMOu1FNBqc1Cfaqws6jDgo0JdbJkN1mOLHWKC/KVkO35RqABRibJaNOz55OhSRCD35UKybl58QC'
-             b'XCIJohKBMopZJW0YckQFFQm06UQloCA2T43Y+hX4g9/4P+CHfvIMvO09Pwid2UUSx+oBOhnB8Sce'
-             b'g7/4vU/CyWcehcXZKdq81paXYG3lWjqkdqogVTrd4vYei5A0TKiyCwboi+xd5mmIXVN8eosiFQTO'
-             b'NJk2vIkJxZ0KGzFWrTIrEB9YtIJpdXvofqOWWSUqIW/Q2GfVrgzQ8b05nXWKZMApg6rh9uDyemth'
-             b'ZdtuA7J0BXXWfCxaBzVbRfHMNl0zdEUnd+ngeAbJ8eLpZw+GA+PQANB0Qg8NeLLEpoug1UM/fWZk'
-             b'f8XQpkczqB4qlM5OhOfOFQ2ec+yQDgwPV9zhBeoOnbqbeD18Wp67WO/UPqnTY52Xk3BBE5aq5APj'
-             b'nh9kNmO8ISUewhgvO+3Oi+y04SFqcthAjYIZFYDCTM1Em5w1hr+2UZzPzGKMj8FDFwXaszNzRPUu'
-             b'adb4GatiWQU5Pgg1mnhgt6qcQC2zoUpljRzg6TJVHBh5ivrey0nuNsCSNdNGHbu8B3ZYoa7VOz58'
-             b'Ku7qY0kikLGAz+GajoqrVlFXiqUUEnXYoNazma8kUuAM/pknn1w7depkdqC/PhT0V3lIpQ+QKr0B'
-             b'tqziTl7WhlcSRXTF8BBC8SAbk0hXTCLZWbfyZh6TFyfSJ8dE+2zlReSjSTRlfn90hTrrPFirJpsT'
-             b'206vgQ/9EEPGLAFBDoF0k9ZSS+9448EDrCXtdnpthPOQJr2weStpH3Kln2nrkg4ruo0cAw5qRGos'
-             b'XXkD82BNDMomXfRDkWEQKBpnhZ/Aui8w/0KyY3SgzqGP4k0olf/lS5d4tuOa14htd9SCz3tlWrby'
-             b'OBC6qPsYLsFf/fvfhAfv/RLcfvdbaT6HP3tt5SocPfJteObRh2CSDqS5fjcz/VL3UafdeXVtBRYZ'
-             b'Wo3WuJCJNhVvRrQ5SX5UBYZ11NQDTeEMy4E+HNEVCxcTxqoP3CTkJFJyK2fronoyhJLSKQ5G+T1V'
-             b'sRhKlbiJfEioL7vzhiBdcwSIV+9IoSQGkLVda+ikMx10SWKmACd6S+iisbi4ifMAS+o03lPMWiO9'
-             b'YAUG8okqT5BntOErFIvmZXp6Onf6LsfBy0A8OoHdxLSYEQoWq2r0hbqvm+gIesRrjYKR55FmrsIU'
-             b'5HiU6blFqpGL0wsTS1gDqEUeBydKhV/anzJakPlIhsx9wfp0yh+JWRVjNLr4WLRuxgPUzqUmPKfp'
-             b'8px5MJxQt497SKhzR4YOLeTRWI/1XgZ+lr21I2OjYBmG96b6zPFwhcUKGVYUhIWEtTEHA7lYcJRi'
-             b'UO0ann7F5khcSdpNYooXnaJEuUQdhyAzD/WQrY6ZFOcbx6nDRaNXRQM1ptebmple7fd68Gp9YP9/'
-             b'D6nJYPXVNVKpYu60W0vtTmdYT9a6mU4ZNDkzqjY/vJKRAyLSzJWPd86wT5meix1OJblAoSwwFpha'
-             b'hl60FNtgxuyuLAJhxlGnE00qKN98pGyi4hrdFQjSCRzvHQMHEebOYmbTIszMbSK7nooiwkvcCP38'
-             b'ivUu0RltlhwkRsgrNFKJtbBOBopvyGEc2YHCGcZsKPBILPlvkbs2sHZEsTC+MIE14sYsIleXsXyv'
-             b'Z5tTjy+BrZRlyDMa7MIW2g4uHvs2/N3RJzK5IXUXFCuRCoqptGCRsow4d9t12R08ZINXS8iPUFig'
-             b'APowiJUNQXiu4g29hFHmqJc2zMzOlbgLfd8FthJLIkP55CF8dhPA6lazdwQW5t3Ac+EEsoEDR0A4'
-             b'WTPMetME4KgdB+VWccGS3fUlzqDFTiRBx5ONWAROXZUzAGHMfm86u2nEQk/BNUywNBZ9HJFgIRiB'
-             b'pwslPSjjTFbZ5u27aZJciwUXJXhBeqZ7dH8xDgQ7IFxzyPqSokIPY+eZSViXokqyj6DkI3mpsGI2'
-             b'I80GCS3YtH0Hlo3MBpU9IWgWlVqrQX4PueEppJUIhawlXYwGMPgmVBiDU4G8FI3eW9dWV2LrrZMF'
-             b'dYEu7w2pc0XEwHEb3KJ5AwZpdkmnF1cHtCYlOFQYPDrlSOu/TsWxT8/GxGeZSrZ3E1pDUKPh2Bi+'
-             b'hcJ8jLaLKv6FIuUJoZBk8I4i3NfHscTaKu/DbN3kyz5CJA8K8mREif3HxKEiigzDlWR5BszVNmxx'
-             b'8+bVhcXF62cwW6+vvKp/iF1P5eJy6nDW3Th2s+agVDtOZ0vGS82QHmiDAMPfd174kGVYLoeXLxED'
-             b'bJpmXSQLWyWU4EXPXnhgDkD8PW5sK9eWtHMoYJqnB3PErtuUZxVqFd4S0z1tOPMLW6E3PUOJqRKY'
-             b'Spg1d6SVY0FubXBwGYA68zCrXVDU0EYb5SHwhFrniM+Xtu25Qgpho/4xqiNyATycsdcH2qDxs0rA'
-             b'YvSgA1nxKPMSQBcyzd8zDVaC5/BQ6rci9NsM7sYcrRAhPYQhcJ5OzCJopqpXbDYbWW/hHDSGzDhM'
-             b'V/iXdVLtFnsJBtcYondSF+W7XYpHURQUihN2hqXqoroNJcMJ6d3kYs+HIDH86PCqldIvoYHCUI3S'
-             b'RAglt+VzNzXmvDNmjNXMxMyZPsE4XHBnE3zZTDENQBidMiMI5pDEz99u0f3CnyOCc7wmq9eupu50'
-             b'LX2WaY3/KIN/gOJo6oywt3SYu/Yg+afFM6GomUCYNI1Qdn9uBtbXV2G8tgw9nG1AXTZMiV4JdZnh'
-             b'qSuBK00Mx02UiPV8DbtT03DD3gOl46NnuC5R8eoF6IyFTygaKRMdYXVUUUVHARq51g4afnVWGuoY'
-             b'spU5uLwg7h3jVIjjPRwPs5AaTYyFtYuQH2rI0Z4KmXRjdpCKJuOpZugUC1hEWsbEbgRlSjr1ZxFj'
-             b'WDsJYsNsOw7wZdZceRbcW89IfT7yGkByzPT8AqylQ4pQCg6ZUcQ08NGeusLJqC7dqUR7sPdp2Rdy'
-             b'UjE1CT6q2e3CpsWlxc1b0j54nQxmO/2ZV4f2pQenN4FRq9Mb1KtLPHQvJ22MNtSvaZUSGXOPpo1U'
-             b'8SbTxfWA4s3MsY8YqWH4JujNExdhYa8K5s8socgPFh4qFUY6xHL4ZauarFsYDNY4XbUqDwsHNGKH'
-             b'VI8czC9uRkFV6kYmTPpOFWe3T07oDgosIloL2HhNoq14o1KHXYCGIJEEuyp1KIs3CFNSkmR1A4o6'
-             b'J2nCgmKZVOxWuv1pmPC8x3ZxQv3WKAe83i6oSSv5dcV8CHu+brn6LKPZEGW0HVQPQvHp7V5OtqWf'
-             b'WaArI2WEFUyldXnOEXi2htldtImJMNdnEgzaKEWdlfhiJOqY5UcXszI6N2DtSX6fTDvIA2MR4MbM'
-             b'eosE9YwB2AJKMqui5p1h1Mwo58w6tjoyRQXCm/SPxqGMTfmdFL8+lmHwrEkQiOzcIpv1JG3oXWJp'
-             b'1eOJYrtIUsD53nAwgKmZqkgdoCmQDmzv5DNglDsRn3OCbjiwH2a3boPJ2hXo8KxlMK5hz823wA//'
-             b'5H8L23fvgmuXL8J9n/srePTr98LCdA7zrDmhOoaoM1LxVYzWu5GLpcjemsACf4TQNm/bATtvvJEy'
-             b'6WQ9STcYm3gCO61446QSjfYHjHGyM1yRJrPAKfpiZQ9eD84CAzorUGTmU45zwXHDZDTOrjQI7008'
-             b'HTotV1FMzMgZGLKp9mIheJ2to3BNp8IjM3pt+l00wn85cDOjE/92Eo21m476HRSCrGsiSLy+Oujk'
-             b'kvanejxQRxGQEYY4jKRfB6OJmtqCJaxFY9yiCd8Vp0QjGaaabNm6/dLW7dtIunN9iBPtVynAwllM'
-             b'rztqdXvrI5ChGhRrj2jYJq44AND3EX11kivWkO2LcLCXB8ehMQqmUESky7KtDkET3iwm63BsNhFN'
-             b'7LSLGJXzvSkKl6PW25UsG/x1bX1QTG6FBh94RhAywLZlx860SXTpZ2BaqbOmuJogCoYBJlT8oLlD'
-             b'JVcz6HA42gqVIKbCGjTeyA34UHKpRCHfoN5qkmYsZpH0XivYtmNX2pAm2eFZYCfMW8JF5lFI28mx'
-             b'JfXEHHyVWlxhlLoIX/HfRFc2wBCiip9bKIimTCqsnvvpYJk2h5OhD9M9HMO1K1dIUC0fkeCHiu2X'
-             b'fPF4w1kSkib0odYZT+SKtCpGriKe5BBFYWAiNBHSptuq8txUOlOMG2gyXqMmJ3vj/hw1P80xGYF1'
-             b'JhRFnzO28rWriRAjwlhcu1XMMGPFh6uXBeQ5iLEqLuuddED1Usc4WF/XTbaTutfR+hqsra7A1Ba/'
-             b'8VHQTbdkq4XC9sP7lw6K+e27YM+h2+CFR+5LXWkrdQsR2rPb4Gd+4Zdh8cDt9AbmbgzwEwduhavp'
-             b'QDz1zKMw20vrYn1QEqa9XAsTbKn8DS5QyCKJVxAWgqMBWYrNLMxTIeCrvtLNo8lfa/ruWSp5pehH'
-             b'EM2Txl2Y1FtDiI08WxFnFKW4G19N51zzYEmvPRwNshEsJvDSvQ5MoQ9p40fxNcJkLY2Mx4KlluKW'
-             b'ZklOM+8IaJ9k2cDs7Dz5e66vrjG0Bhpa6sUGTdYvY2yVjeQQmY3MmaJVEUYjZPdp/VQwlTrX1eWR'
-             b'Jn3roSb9QQsozNJXXv06mdehRuCZTOMzDVHk8Wj/1G4PFrduW1vcfB0PKVe9+kOq0+sP04afHpVo'
-             b'Np3YED86ZvI5L8aQLK5Uv7psrirpnTk9tUB9LYFOCJZyytqUMLvCkjMWSCZTKDhnTD2BNiSkLa+N'
-             b'l8om5xnemwS2feGRpyvCPBLLpf87t2mBDjhkHVJaZytT2hG3xnmWsoqoE+HDx4ViNeSKQWwdXPEc'
-             b'876Yp8oKMRoiTSuNpYKlgbK3fl3ONqYlKhvKpo8P2N60SaANEW7aFcEC7VSpOVgbpSqvOwXrqQOo'
-             b'ByPop4KxU7mSF1Zl3VFl6AS+6ubNNSh9jAoONJtsuQy7jtK1mpqeht70LFeWvuEQntmHY1hfW2GX'
-             b'eZeBifQzu+SIorU4wSYzczPZqb22bgOihM/vLGupvDrfBKmbQl4fFNuSHkz0YRuFoHEXLop+K1DX'
-             b'HYgBF1hQKc7vE4XOglj1MKxGEgfeZGQ2UUmb7AJHeWfdlYh9VaAdee6FKa/Y5aWf3U1V+3Q64K9c'
-             b'vkwVvWM3jmvrq+lQvwxb9rJ8vXFAWUyjNo7otcK+3nfhTW9/Fxx55Ou0Ba4M1+F7f+D7YHH/oXTv'
-             b'xowmpJ+VDq43fe/74OgTD0Ov4io8TJSYIGrFaILppFBTiyAnacAEHMOtd70RIQ0qVnW+JeaxoVZI'
-             b'WzPkBHER53txt9nQWUUr6VBnYFcYtZGfRV1/ViYuM81a51NSaI7Q+QOB7Kle7iJz1hCbQWf4dQA5'
-             b'Jig2LGOcYckVAkqOlQF2uWekIubnQlxiwPB32bediTpS+Ee9thBsTqUUa57TpwGmZmfhpdMnYPPm'
-             b'TVkywhIP2Zfx5dDqyen7NaJp9mCNzESsQXSoWdhd9Xprc4ub1rvz6eC9XnlSl8+de5WOE2QvM+j1'
-             b'elcQunOdWNjmKmwMxopHLEeAcHnEdOs6sB2+uFMzhx8swy8XCxVju1EdI4vuSp0Z1E3CG+ppNO7R'
-             b'mV00nS7o6vK13IIztIfft7q6nudMlemGgnAxcujb7OxcpoqmG4Jq8S7ZpHgYIDRWZ1NHXfi+UmKF'
-             b'581ZNxR55sQPi0kkYCyiSoyHL/RWcCYyoFJNUCwfV/cn9d+SQ5A/0+59h2BucTuMls/BdKciHcs4'
-             b'dYfv/MCPwhu/6500U3r26UfhK3/9FzAYXIW2dyU0TWjaokVr5UFvi7rNTOVv4Z/VTu2WkOa9bfde'
-             b'6EzPsbdixZT8qBk+k8E6UeM9x6hMuDtG+E1dLahZa8HcwqIeOlFdy0uYW6bz+3JaM5Vc1Px5PeYU'
-             b'UtpnkNCgB7wcOC3ajIXpWdzN8WFtkVsAbl65u23p5hwyVprvFKb0Mn2f9Dah1sF9zXNTRWiY9q12'
-             b'N0yzxs4So8dpbdR5reAzM1obwOmTx+HAXe82fou2mxJT3pbmlTGOnjtGzHR62ztg82f2wuD8yVSc'
-             b'TMMtd9yVa/ZK7UvptXbesB9V/2lTGxSnfXCsESzuDVJY4kEzIdo205lD7mDG6TpMpXV36xvfRn6U'
-             b'NZm4GtcmniURxR9KOm8QcbvMFBsp3lFncIYxbyBo0GDJRtGm3XDTwkpiL4bDAdQcuInrpd2uKBMK'
-             b'byF2t3jYYoxMm0YXdWb3hhzpEZR+zmbanGwwYT0iwYWREYXAexczHJ3k1zGgooQcgTJds1csTuZs'
-             b'FecYSYq1Cqd7U7PwxFNHYN+eG+DQwUOEIEgaS8WeluP0eQNEw4YuQZpBfCVtHBJ7laYicvnRhx9c'
-             b'vT7WstJJvYYWDfUB0zNzF703AdXR0EAbYXCBIcE8DxC1u2c3BueM/wsImyRX5RlGqvVcKlY8lsnn'
-             b'Gt5q0eb02LiOGMm92CPMycGBkZlPOLgnAlcocx79HBT41oHp6ZlMw0QTWdRLpIWK8x3UT3lf66Yb'
-             b'bdgYVGpXlJuNmkGLqJlMWr2YB6oIHE3Ksboosw6Iu0V9EGOJimiKG51CrrNbdsCh218Pj3/1C6lT'
-             b'asEgfcsHfuKn4D0/+XMUhIj/7X/j98D+mw/Dv/u//lXq8Ic6F9AhtXQDMcNVUbO7svtGdjbI3RB6'
-             b'PR++401p8xPa7YRJEMWQeLCyDKtLVzXW3TOJAbvVmgkQuFkhxo7stloqbldIEfmH1ywM50Ig5o4q'
-             b'b+CBzT9isd/hS4tVcMVmZkGNxwt4ArCheg9EOeBQzRLGuVGEbpNfKQ5DB+tFdNxwKgczn8HOLN2f'
-             b'+bk5NkXNJA5cP6309y+fOmF49q7MUY0mMYqQ23GAJs+J8PumN+2C7//wx+DPPvHrBPW0ux0umMb5'
-             b'0qTNDN0UVq5dJRNe6JZ36cRT0kLQolniw5AE03WWIJCTUrqN3/XO74f5XQdT4cI6HtPFWERE7NKE'
-             b'VOVBoORoRLJywEt3CMqwtJMt1Ro5YxywwQ9QHEIEmcDPizO4dqtFhYIEJWZWfCYp0B4yXCsicxOp'
-             b'k+eztT7POeY9a5Ik2NQJG1JGC8x0Fb0ciqp99Fz8FAi3lqJUghMJ3TA1O19/QofqQEa485u3wbce'
-             b'fxK2bNkKc6mzGgsSBJkfsL4+yMbOxdpGIVbPRBLp7SS1Fw/m2dn5C5sXNq+ORiO4XgdVa37Ltlf9'
-             b'j32/D3ObNl+qg83k9RqTLUN1O2MSxh3qjHD43G6zDxzb3gQQNlj+B+1uW01GC0+9pL9SQrC+btOP'
-             b'QSxW1AyUS82qhYfNLKzpppjfHVZGmUmYmTajUHyr8F2hYLffn6Z4AdrosMrHeVqs6NAl8EKG7fqB'
-             b'eSbnPGP3oj+qs42LwHCxuEUUMqKHspOWKkD0Eeq8bNX2zqjzo3Vxq4pbRasHb3vXe+Fb990Lo/RZ'
-             b'Fnftge95/4/QiHIyLo4It7z57XDoda+HFx/9Bt0HIatkv7CK49GiRquDoVLjg4URaq3Yhnaq5G6+'
-             b'404zFBb4xTGrq4KrFy/AIG2GU6SLmhAtF+m/3U5VHOwjwoZTTOCKHJEkibA1Z/v5gu2FEl8ffe5S'
-             b'M+W2IpivdmMO+avNejHSgSgka2jEAuP34TxSU925kMHXzXrAEqOiJI6QuyXPBZq3VDKOLvGG7p/n'
-             b'cLmDmJ+bL7ldHGLY67Tg/JmTqK5Of9fLG7gkL1sSDbsmKMuT7YOEfPO29/wIfOMf7oFnH3sQnv32'
-             b'Y3DrW9+dDsCQNzfEa+s1+Ma9fwfj9TWInX7u6p1kGFUFihY5jmenflos2X0C/80wdSG9zbvg3T/y'
-             b'UcjR82X+Aeze7cysKLImMvABFKTY5Jmn8+VhF6hX1mEsu2yDRtHouKwRr5BZfGELjsYD9QmlwnqS'
-             b'73mn11V9Z6wcW7rVdP3rKhonlahz3NRDqslwq93lvLnAxJmim8xC4Fw0BxE+i9A+miCPaBwwo/gr'
-             b'5sKu5IZl9MTxM7Bj1y54+slvw7efehLe/ta38SgrNwGDMKIkX1WZR43/NqGaxWxWZuvYZMzMzFw7'
-             b'eNNN8Xo5oNMh5dvdV/+v2710wacuBXZuJlovxLJhyAEloW0cvU4i3bSZD9Lpi5u+tO0a0SFRGwxv'
-             b'FFqmK5F6XsgMHIyoLEJDp9L4AdZiccWDlQzGQqyvrOrBgdU/tu1O+mpiHbW4yMubB7qfYyCdiGyR'
-             b'/OF5AZF7OC5HoylpmJNBMHCIpLOGcoiyx5qhAjbhVVdme0E21RxsARuifhuQjB5ynh2UmdF4x91v'
-             b'hz033QrPf/sROLjjBujObkoHVOqYXIfmU7hAcSOfn8dY6EBVdDkUY8YiUOhnbG1Ut+KcDqcHoxoO'
-             b'vvF22Lnvpiz2c8KwytHo+d5UcO7MKRgN12Furpd+9LhE+yCTss52VK3UvU7NzGX7HZdtjaK3US2F'
-             b'2SgD5VhOK4ajPVX249QFUyBd2oxQjKniThPCp04FmieVt6Da8xYXnNHzRO5y8rXD7rYCUA+4Br1c'
-             b'soZKHrdhxDrjOZehwk2p+vXkapBtuPA9YXH/8ukXU/d5Gabndxt2XzSFTaXyDAcmENCzdgg71d4m'
-             b'+LGf/WfwG796DO6/54tw4779cOeb3krfdG11Bb70mU/Dg1/5Imya7rPlVDBdXWgEm4orAkkPKAy0'
-             b'TdcaP/YgFXIf+ujHYfONN/N2UKm/orXfEsajlmu6lLhjd9YmLDSJRRpV27TUNWprI3aOxsMzFMgP'
-             b'n+u0NtZX16GT1gVC3fmZdipPmPA9bBNLVDLn8migdsVd3Eqw6bBN1wJRHJ0reckRKftbuV+xFFBq'
-             b'UeKKy443BAmOuid/SIYVdG1hkZBeYs+efSR+P//yOTh+4jgc3H+A5DbYgyFrET+jzLvpnk5iIQVF'
-             b'+/4keDb/3dzi4qX+jl3QJ2LPdTqkXnrh6Gs4o/qpouueCFyVyaaYu56KKalRRWrOFZZU1iHUSsUl'
-             b'Fhjbg3gX1UCy8u0GjV3mUjFGE4gdNlBQxQndGYadVAP591Mzs0SgGK5eI9IDJdASjVwEtl5ZSozu'
-             b'QC91YNnOJFcTCAPgQYoHbhtNJqMjwoB1B9AoBS86pFCqOVHyy4HEacT68DvXrAKt6WVsMnXEvVjt'
-             b'j0wonJP37AvrsNXfDO/94EfhiccegqXUUQb066EcrDHNk9qttLjX1uDlU6fTw9otWgyeCYRYbFly'
-             b'UKL1jub5Ih786TXf+u73p8XSZy846SqDcWmfwPGjzzKtPeaDD21nUueKcAuJhLFqm18g5wyagXpT'
-             b'MTsO2VR9DpfWFLk9UQd6muegjRLCZZ02DAYRut0ejJfXWXgbSBwrxqwY5VGzYW72kstejl4hWfEH'
-             b'LC7c4qYvoY8+lPmYq+w9NVAsK6mjWqWAUtKxPkCIuZPeL1arJO/CtZc20CtXL8PZtOEcunM3X33B'
-             b'PSue63D3qKaxJgvIJDfvu/2t8KPpoPpPn/h1+JNP/D/w99u30/29euUKnDt9AjbN9Oh6ZAPlMhPR'
-             b'zj+CkTtkKDCAzJdqWEmFyuvf/n3wzh/6aH6egrAxyzqISit3SqISqn7UGXQxRY0uGui1hPc1BkwN'
-             b'kzvpmkLj4IocjijPCf46GgxIYoJ/vz4c0oGKzzqm8iKKghTy4fqA51S1JtJq0oEkCHBAIxKkUEuF'
-             b'76+fDorAfoN5D+NYECFGCGokmWBcXGTP0dAIzrSGLWANvmN2wskQfaT54OKWRdi0eTNcvXAOnjvy'
-             b'HGzftj0dWjnfDVl5E9b7RTC60iiaxooNAWrdq0nHWpGP5dknH7ifYmWu138efale7ZebjFK7N3up'
-             b'LBZx6a0490agIWgwjgSuQVdhVY/7EllObSpTfDvdDiurTREhfC8Pqo0Ss0PO9zBDCuMSF/OMgsLv'
-             b'0p/1Mc5Z0zKl1c03hLq0eqIHzkRi4luiEQiwurpGGw9i+RmegfzaojeWqoYXP7hYuhqCnooxpjNU'
-             b'cYqStxEPFoM3D5g3szbnPcCGcIZ8BrTyBh2tdi0H7r35Xe+DO9/8XfDkE4/Ct+7/CkVrYBBetxPJ'
-             b'ePfxr98DZ44/mw6KCmrxF4s8fzK8BBK7xhw/IffTtxwM0zXce/gOuP2t38PDezCzNmP3FIZw+vjz'
-             b'0Kmy8wUekJQGnP5/h3wcMX23C/3pWerWvcA+IecbuYbOJUd2gzoUeLqenjzJsgWWIweBUdkMvDFp'
-             b'DZHp43kgHutatX0iJs90ahMb4uSaZHcMYgTWE6r8fbuT7bKkdsdN3hqSqotWLDZGrPaNPDNFNuPM'
-             b'zKxC3cIcDKnzPXf6eINNJnR5Z0yRnRGHOij2WMI2w8/5jh/+GHzw4z9L0Q4nn3sSTjz9KFw9cwxm'
-             b'uxUIjdJ5gyXzIZzJR9E4aORiEmMt8Gqvpfe4sGsvfOzn/mfUIfCspGp2X/SM8XUOzRlqTqZtqXZH'
-             b'33sUfzpmIHG8iFgNFX9MU+XFDQ9QNAcbEUAm9FKDwUrWQSKjtdUlRMG38myU/AqZweqqtpn7en3O'
-             b'gB1Mgh68gTwySTpd5SwwQgOUJ8eBg+ISo4qGWJifENURXYtz73WGJXq1TBqrsum3skYdTKWG4tCh'
-             b'Q/Qcr60P4bmjL3CeVZaeYMMQjRhbE3tdmZdmJKxSTSquxcWFxWNdNM5Nn+96fbW233jjqydO9Hqw'
-             b'9eL5a478+6LCWd65siFzDoqlNeKtQDuWAdr1CwbPWHM+SPJFQIsWHPoFm90jmRmMB8lcSm1fdJgL'
-             b'DbPKaPB6Oe2QFr18hQkUIbKJ4oZ0XIY4pEtAfY1EQ6PQEv9uNBxnw0VKwhznA7zqlDmGs9HYXofL'
-             b'VmAYlYYOauxY6Ktug56CNxiNQhEWY55vWViNfSL055afF1InvAA//T/8c/jXv/TP4Q9++9fSgfQC'
-             b'vP7ut5IO6fmnn4S/+8x/gk5EfUVbPcM0EoCwegxKy9ejVRm4kTstNzUPP/jjP5W6tpmcWSSQLzvf'
-             b'AVO6Vy5dgJdOvpC68gzFVByxMd3vEpMKRZPT83NUDJDztsrY5FDi4shFtaHJ5pqZMakzUTysGJbG'
-             b'Qw8dFepxrYN+8MXwVtwtBGKhzCk8eGQeikUMw8c+msMXOy381nqsEeaBSS5e1q6zMGEotHCFezyL'
-             b'wbO9FboaIKv08sVL9HnqOsPF7fT7l44f5dcQLZR4vxmvO7DmrRbminxotKjI+MGf/JlUjA3gr//o'
-             b'dymCw3NxSSSBIi8qvm6M8XqyDirapoDOFem6LqUidHr7jfBPf/GX00G1n01YvG7OmWoeDNjVfMzB'
-             b'sDfVZFXp5DZOpUBqZVPdEPgFGwXkxkbcShzqEaytLtNaGI3QVaKj7jfYNVXdNru+54N2OFzLlkmw'
-             b'QaQPkenqgQodnCFOpy6qTAFs0W4cIoPQ+ovVViy9sBYgQRtxhi+jM6gMO2vQnlOrU8y+/QfgoQce'
-             b'JPbtiydPwq4bb4BdO7ZTtP2Ei6qiHyopwhIdD0zAybTD/B6233DjxUOHb0t7+XWE+6rXMJPCk3hu'
-             b'YfPL3d7UGCarbVlAgWdAyvhRAZjjATGpN+Da6pris4FnUiIERVlcq8teWbVwS3N8O8UaxAkfiJ7Y'
-             b'VSEU8a1Y0YtpJ2HkseC9pHwPgTaq6dl5WL16VZibOXbCizJBdAKZWVRz+5vbe6/u7R2mGo9RIApj'
-             b'GrB2244GxuyRVJh3GlETy6xOaKRRQJtohpZF9CoMH4n5tjla0vZnexdDYnCGpcYVvSzqmqGen/+X'
-             b'/xt88t/+Knzu078H933xM/Qzx2sDmGpj6iZWkEPK2gI2JPXMMmMVTCat4OzI5QoT78Va7eF9P/Zx'
-             b'OPSGt2Z3EZcZXh5McCAfnmdPHUv34CIsTrFQk93Z52dniIKOIODMwmYqIirjlm73YV8m55pV5fR5'
-             b'5Ye3BQT3IWONUkijJ2H2aP1ahlhjdhcA8iGUpGnewEJO1HWhMkgd3wP2xssaP44uqfLQGqFgikyA'
-             b'krpai2u32gWUSHSCh6KkEYfs1pE2la3btsILx57PsDgd+Nnx48TR5yCOVxC/ZcXCRNemwOxg2LcK'
-             b'iTvrdM7pQK4DH/j4z8PC3Cb400/+JqwtXYTZ6RYlM3tmi7Vihi0dR+WQGJrtqCQSZJzW2/nzS7Dn'
-             b'1jfAz//iv4Ldt9xBTDnv+yZHjP31HM+lIhibsGbcTCZJBHUvd6USUb1k5CRdC/03BdmR7Z+8Mm+L'
-             b'I4XczwoG6yswXh/mWWKVHzYy9B2McofNqbeRu9pR2pyRCdjWUXrzmA25SaR8MBKzI6mGfEl9dh1n'
-             b'6zEvkhGbKmGNYxvaR8ekExlseBNfk11U6HEVD750jTCkcUs6kOa3bEnFznminj/91BHYumWR9sKS'
-             b'01YXMbUJ8WySTPLKx7Njfsv28zA1Q+bd1+2QQnrpq+6kUHM0PXVidn7x/PqFld1tVzj05cHgroYC'
-             b'00Dt9vEi4wleB1MFsrgvsJUOBqZFPlQcLyJ78QTuwto7ev730Zt6JmTvOOOQ6CR/kMXn03NzMFhe'
-             b'1ljyGKIeFkJkyISQMngl25ua3YPrcc6QqtihmtrnVIGB0dYEV7oj54oawTuj5tb5pMYNBHpP4oMY'
-             b'VJRZbFBK7IBxOSsPN9gqKIIzHobyA/Gv3/a+j8Dy1Svwl//+NyGuLxPM1mrnrgedkbO2WKrxQFEE'
-             b'QbByprEK5IAO0Cvp37z9Bz4EP/QTP5M+Q0XiVM9aIsumiiyufP6pJwg6brkpkDhz/CLqdfrN3OwC'
-             b'+cmFuuYO0sC4TEGX3CZNW412DhN0U3GtnKFF+hDyZpsoNZ8Ojok1lI3GmBMaM5184MfcxTME59XL'
-             b'Tma0kQ53SUzNERe+dAM2wiY2STJilyMV+tatW+iArtlcmCQR7Ra8dOI4XDj9ImzbfxslBjgTQul5'
-             b'/enVitFExRRWnXRbgTqJCt7xwY/BnlR1/8UffhKefvSb6fvGUKFRHXYG1FGWkLPxJFPr8ZPj4bs6'
-             b'GMMoHZjf++Gfhh//7/5H0kVhigGKh4Pof+QhdFBYpxLO6H1zrkSONGA8EGNDVuFBoHRJkTYzXoUS'
-             b'QSH95t+V8QNFpaTfo68ne3uRQ4Y8z1jQ9VuZPTRMB1ar7WlGhc7/oc7ZbI4Pa+3C+RphlzKTCq4p'
-             b'yj7Dt1HTew08fvDmzAxOglolw0tSyS3DtOT2OZlpKr3es00Yxq5L/lS2M0O3nX0H9sPLZ16Cfq8L'
-             b'5y9egBdfPAWdbo8Qim6rXfw/eY3lcFnX6HjljU7NzAyXr1099/SjjxifzOtwSKEB4av+L32A3uzc'
-             b'1bnFxTOrF07u1jaW9o2ahbxkk6gVi2dX4sg2RDRjkKF3iByhkedL3f4U4eVe5jcgDEAx5ax00EfV'
-             b'hOeIBxn2OaaBRmh4sPlYhq4IJyGJYu3aMlM988KRQ4MOCe90RoEPI7owpN4/VV1j6M1MMYacNRao'
-             b'P1hbW4PpmU1cSY0bJqNRAs2gVM854rcyfmSs5am8wc69gdKjgTs2OIVZKKnhOuHURVpFq2yCitfo'
-             b'+z/2c2kRd+HTqYJuj1dTZcQzFvIPyywmeWjpEuND5oMameJ7HacOd2kI6YD6KHz0Z/9ZKh9n6R45'
-             b'I/QEjSbgzbwewHNPPgG9do4Qd7xx4kM1v7CJGH39mRmNco8Sy6CHe9Tk4mIPVTZnVcLQ37WJYUXN'
-             b'+KgmcTY+wDl6I5r5OvsOoqtFOsiwe9LDhwfeCPegyXAE8Y40VSfetwk/tI4TsUQOIflFQhcwws9y'
-             b'mBRBbraeSlVwOqR6vQ6sro3U+xIr++VL59NB8mA6pG5l+7FKAyO1+m74IARlr0aOb9fNmgf6WJjs'
-             b'vePN8C//98PwyP33woP/+Hdw6sUXYH1lGToIgfGhX7OGqU5r3KWqemrTFrjpDXfA97z/Q3DwrrfQ'
-             b'va9pftNp6rjo2Zyol3aIoVDnWUGoc27vjcdn3dT8CVjHuiMw124Dotk4lKzxbGToCr+Q6TlYXcnX'
-             b'kWFhhP86qbDBfYI8HxG66/eyhCR99ksXzmcHDt+yr8xeH7WasW7duhW63byftdpe17OL0QKEDOU5'
-             b'DtB0hZ3K9HQJhaWi2PBDhJUnwn9HHRtoICWeIZPBBG656RZ45JsPsbFBC549egx27tzJxCCGyVUQ'
-             b'z+vRVRL5W+xz0+v3e1NLN+7Z/zIeeNcrpoMOqRPPHXlNL9DtduPcps0vnolwd0mHpRqLB60ElhUc'
-             b'VuMZMFJ5TCrsDonOMiwyGAzIfXhxyzZSuY/rms2cIwsSndZQwJsDCT/BF6iLdTNEEbbUZE1dLWNZ'
-             b'/BPcBNEbDRdiULGajtkJTswMQHy/GD9R05nS73dps8CZCcbNk5Vn+nV9fUUr9FJVRXNwBh6uGiEm'
-             b'VTyi7s7DYGq8xeRSqfh5Q/bSJNHBbqIvRPFsN2q57BUrVWOtG6TnWINQO3jnB38atu24IR1UvwGn'
-             b'X3gGpruOoExkJ0m2lLqscVOB7gt4X5bQKXpqE3zw4z8F7/7Aj5M8YVIzCQTEsFc2mSyOxIfk0pnn'
-             b'4dTzz0K/0yKmZM5RauG6gtmFBZianU/roEMPd6mNgzpua28jiv1oiTKSipuvHc43W5QhFejX4dqQ'
-             b'OkZcbzIzikzbRagM3UOyJWFh4uWYjUDygzyoadr0kIByPMpzHGJOjXM8BxTfvAJBybEhJrU+vyQ7'
-             b'Vzh1sQgwOzMNC5s2w9LKmWw35XOQI47xHnvwAXjXhz+efnyHr3XJSovapUVlseWuODByUaQRGSYM'
-             b'nAiQ/q47A29JXfbd73o/XDh7lhiYF146SZq2tcEaUbUxrRaf1Z1798OBw6+Drbv3ooCSICfD8FG7'
-             b'LLF+itGpHMJxGrTKKhoxT6EhvAXWEXkJPFQrImc6DUscas7m8ldLr784ZOBMbXVpCcbDoWrYUP4g'
-             b'cCnuVTgLxLVJcCd7B54+eUrNPMphD2quTPllqdjZun0rmrHSrDITnRqKyGIzZhJzhV3nQNJ4ZZ8w'
-             b'CTfOpCfEiu9n/mAUjUOIQV4L4zCEzVsXYfeNu+HE88coF2t1ZQWOvXCM9Wh8aLOOLtfOfkORX5rc'
-             b'br9/bev27Wv4XMH1PKR23nDDa3uBqSnYsn3XCbL8aJVBKtnbt5mqyMQDuYHCfEOdFJoudntt2jSu'
-             b'La/C1x/4OuGbH/6xj6VrVdGaEruOMvjnlFKXs43ULsUau5aAKj6oJPun+PQHnuFguzs9mwfz6hjB'
-             b'nntZK5XdrlGBj27UtOlMIsM3ktDqybF7QhrGCVW/7XaPGT/BVEVRB74N7Fq0XFYfEk0Gr62agti/'
-             b'8NTevpbbMDI2lXQAwwg0zuHye6ShHr77nfBL+w/Cl/7zn8DX7vkSXLnwMvTSIdiuclecZ4D5/eF+'
-             b'i+7v/dlNcPMb3wTv/cg/gf2ve2P6uBVVdHlTYn8yIXWoxoqI8HD0yW/BeO0qzPTyxojFAGL2SI+d'
-             b'TZ1Upz+dZzwCf0hUhmYmseMzXgpym5C/8/qgk+CSdCRV6sx69DAP1ldJLOysIwnHskzk/ktuGTGy'
-             b'Sm5XlgdErpZ5ThbzQJnSmds5xgLYzLaWOSkJyVvkpl8MgeuC+vvi1JInmSyFwGIgPUs37Emby4nT'
-             b'mSHI6x59/Y4d+TaspI5qZus+LXzkHjmwRi6hwL6SnRSN9Q4PYMi3jt1CJligdGZhy55Z2LbvNn6O'
-             b'ao7pYP9NfEZSl4rztxo3ykng+VDNa8AGPMaSfGsISho/48AMU8UqyZdkYYgbIEHJUPE2aUlRBCeR'
-             b'LRJj0vSi4M8dKPxy+erlfMRX7D2JbuVtcT93dDhhcYBFDhWto0F6Ps7r80sdC1tQCSUf1xSu5S3p'
-             b'kNLiKgvgCpoSQH/vNFyzZqs0mVfHMl9lsk1DohKMvsrxfiJ5as6xYw8WNR04dOggHH/u+SyGQSkQ'
-             b'oj1sDu1dkXRoJplzTd47w+pVu3P5a/d+eXS9cqT0jOmn6uw1/deegk3btp+p2WssB95OjIVudp3w'
-             b'0SmqqQarda3plivrQ/j6gw/DlaVlOHz4NhIwYoKuZ8onGPNIvXmSbQRCv2QmnhNmnjgcBK1uIMSm'
-             b'voMhCOymZufmi+cZ6WYg0z5D/pm4WMn+w2UXjOFoCL3U6rZ6HeoEyXNuPKYFjMwxjFYWzY1q/kWT'
-             b'YdCHyG02bVgeDOTRFDErew1MzpTzRpdVjmsPrzTQdDyols9TXpldMEJFnWFv0w74yM/9ArzjfR+E'
-             b'xx74R3j229+C82fPwPraap6F9BD+6KV7tAP233wT3PHmt8O+Q7eBS52UBMx5ww6Kurv7DULWdXj8'
-             b'gfugW0meUcUklUAzmMXNm8Fh5PowQKWEUfEmM2abKDyW1Gel/dZK6c7nhcdcGs79CqSBwgcSO6LA'
-             b'Ilu812O8B62KnSHygxpqTkhl49islSt+/d4X1wmSKNS1Rp/UIsYUsotExBidkQjcpRgTdmY27uVw'
-             b'kfT/d9+wW/U2sgljB3pl6SI888QjcPd79jOT0zXE3dptxBrUBE42RB26R/VTBCdMUEvs4HmYWvm0'
-             b'CQaiWS5hfxO6trT22NWX4l50plKEwMq7V/cYeAWUV8SB3pDNPPgGibwqujwhiTB8p/Cpgbyh4elZ'
-             b'Dk08eK5cvkBi9ix0ToUzWkTRPDqL1quqwO2eLZiWL12AS+dOp3vQVQGyF/cLYePiWt6yBRYwWiaA'
-             b'IgBEQWdXdhehQcZxTrLNfGO+rBiS80UTxaCp7oSOCRCVxHgEtuvKyAoWoocO7of7Z/qwNhyl57ib'
-             b'ZTloKtzyDWKNyIBEuhA1mSF3kf3+1JlO1Qrj631IXTxz9rUJrdpd6LT7p73Y2TO2HMSZ1TujjGYN'
-             b'AV/aSape0C7Ft7rwyGMPwdXla8QYOXT4cJmlaHvp9KYrnq8iUlA/O7Ke4S4rukLv5mGQCUyLDSgM'
-             b'D8pFHE4rm4v93WKx8sfI7uVr12AXVomTUYZiIMfOS3JRJ1VeqDnAoLG5+UX9OVTZQMvMG+qiA1GK'
-             b'eitXqE6i4L0KEHMMt2RIbXSk8MYB28xi2APMxQ2ECucK6dWB0nJpRkMQQ6ok04O6ec/N8N59h+C9'
-             b'H/hxWLl2BdaQjYmMrm6LOpKp6bl0YE2jFUd2dA/OOF04fdgs3BI5hxQR/FPPPAbPP/0ozPaLy4Tj'
-             b'im3n7t2ps80DXbXeUSlBiV93oSTORqUo1zrLUPNNXI6kbenQ3BA1LoibVel7xysZjq55DiiU8Ey/'
-             b'zTHmZJTFejC7cdKAm5hr4q5dHLuzY4qpdvmwGcnBFCyTTZKgS+Ksg1D4A2ldbNu6DWbn5+BaWoOt'
-             b'CoXlkfwiZzoOHvyHL8Pd7/4AMfQaXYqzTgyxkUZb6Akb5pci53Ats26EHOOLuznejMrYofE9B3bv'
-             b'iCZyIyqa4IvJHMCG2HtnGAS+OCcYiYVmLRUb/Q3IiTeOfFb1GkuHFou8Aw81nEVdu3KJ/hw73dX0'
-             b'7E5V2QkD4VqcQY2HmbWLrg1kBtBtwwunj8M4FaNdV+fwSKGz+/x+iLGc7vENqbjo9WeJpu01foM1'
-             b'bcbzUFiKst84yecyzzbb8pqpiTP2XLXS9HVu64zJIcHPddqX5mHXjbvhmWeeJSgdGwgksLVj1nSC'
-             b'K0J7TX1Ws+q8F6G59tzCpqsHUpGK4ufrekjBa8wAwYW7aWHTSfywLg5YHJm3ei8ZJzyIU3uj6FQQ'
-             b'i3YcR184BidOnabB/fzMNLn14pyHhpOhKqp+KP5RmkJqsHa1Y9KJaaXtd5kymnwUV9Jmu2lRYsVD'
-             b'QlIoSZ20WGgtZx3G0uWLRLvFDQ1zWvDmTmi42s5t9iRvaiurKwT5taquGpZqmw7GCgdq0wXlOGkN'
-             b'tzeZVBKLHY3yXqm8ZqMJKmy1sIfx4W0E7xVzJevyB/zAETUVfV78VOqu+tBfFNuabJmEfl8xtOj7'
-             b'i9O9bDSVQqfcphjnkBxj/7V7Pg9hsAKhk+ExzzM29EfDQ2rMeVfRbObF8pU3xipvaBKRruVM0KMy'
-             b'f+5WPliz60S2r8J71237TCmOLNSMrkGkog0U2VtsyUPuzxJ5HkIxSQ1i1ZW7KZxJkgkuU3NFkI4i'
-             b'ZyK3hRx9kElENHykTd9rBx31sKD7mtYVOk/cuHc3PPX4ZXJiERbkplQVP/f4g3D8mUdg/+1vVz1i'
-             b'jEJrlyF9pZAzKARvoyqccdm2NkJRZ8DCWI2mSIoSN6O/bmAqavyJRJOwHZYV9RoPTQ39DEZTZGba'
-             b'0v2VlevFYybvAao1DIUwpF50Jf8WGNFYunoRhqP1tAdkdxOMXJfsO3RbIQgXGa8oNQk5FRdLrWPP'
-             b'PQMtn90dyImiYuNs2TdCnlvv338gZ7fxPlW5qhAsQj6PwU7NIyMREpao4lm+RxLwyfuDzEUJ9pZ0'
-             b'6jqqxMCrKXAR0h8+fAs8/fQR0OgKJVgVQDT6wMZrJRWYDG957cwvLl7eceNeyja7rofU5u07X9ML'
-             b'uDZpTi622921VG5MVY7hChmkuabSO5oNC2/6k08/TbAZDspxaLn/dbeRiehwOC62KMFYmRjmUx5Y'
-             b'sY6CF18eQrMCnatHJ3b+rlSszpcHjQL/0kY1MzNDkBMmhoJEWyiDKC3SVLVeuXiBtuBOWsjjUZ1d'
-             b'Glo9WF1ZS5tIn7DmNlrujGtKmt200DVVbcU6luJUAOyOTgwhm+yr1yoUnY8r8IfdMJywo4zTuwQm'
-             b'FilgVG810HyvEgOQHZgLVJTdE7habhV4RrpLhMbabacu7xJJAg3Xe6Z9NyWkxBI8d+xZ+NbX7oV+'
-             b'pyIKr+frgR3c3p27AOOo6fAIxvIlSv/nzbylLrZCDLnkTa+lnSOWAa3UlSGNmiJWWCNH04h6qMVW'
-             b'NOoZp5T9iggzmWDaKvNVKkjqnGbsvfrygS/wTKvV0agO4CwwWreBeJWZKCHsNi2iPOdrQWH9Oaex'
-             b'LAcPHoQjTz7DIaGZro/u7Z0whC98+vfhn/7yram7nW/MOx2nHEeev7loXfWBI1X4mZFOJ1b8cZwa'
-             b'NUs3Jh2Ai1WjAFF4TmnioWQiSSHpipZN+upClBA3mpDHBjaEMJqJfVnpXMB49rYMjQRwPcbEF9MU'
-             b'ukLTH6xfg+XLl6DtWyzoD3ToYAeFxQweKChYx+uAZsc1s3gHy1fhxPPPkIasxRT4DMuyk33qQkdp'
-             b'LaNYdsvmzWoXl+fgwRA8YhM1soUeE0RiCJoOoFpAQwCLrkhzSkZ2YfOqJIOeEZ8+8xD27TsImzYt'
-             b'wurqKnXlYEYDZVJY3HBArJ6Yyo+Eo5m5+WcuXb0KcXi9O6nXYjBLz3AL+nML1zpT01cnV5amQuV0'
-             b'a4w8ZM+DQmdEhvnBQw3J8sqKWq4gM+7AwQNZOBvMAFAqBamUgwSbCRJrams5vJwJZJPFEMpNzJV2'
-             b'uR14uHV6HXL7ngxqU1Hnm4/QCu7VL508BpN0U1zwJDRFViDmw/Sm+lRNddPmR2y4tHAQGpyfW+Au'
-             b'oDKzp6hWOgJz5FY+lE2JKy/VsojdMVffzrhFi0txMdX1jYgJha6kM6u8sfmJasTLPEyGsqoyhq74'
-             b'sORhvxdvFtVqRRby+maFDcC0cmC2UFR241f+5jMwWroMM7NdWB8EmrVkBqGDnTfsJtgNK1iXw43M'
-             b'HMIIPfU4F49I3iTrMmQneKXGGUI7yxrQr2w9H0xEB6YmbkJ/56hzr3k4PlK7HZ8e4sBJxRXPifD6'
-             b'ICkCvQ5pbOGzAawLI+54HQluMzur0mID9WIhinwtFgvGkK10aIagA3aZV+TNBgupPXv2wuz8AgwG'
-             b'q4Vun675wlQbjj/xANz/+T+Dt7z7g1D1Z8ibUtG9aHOTWBeGB3ksuhhR8IVo4cBgCg2nydFRCCTR'
-             b'NULZo5ktNUxiG4GodXFBDwZHEOgT6d/iUkPwt2gimyncwMWROG6IfMGZdPDMO2nGz+s1TR/00vlz'
-             b'ENI6wyBCco8ZjTK7NHXzKNKVBG+8AuNR+r5Oi5KRTz93FFYvXoRpJIdRV8xoEc5j68w4Rt/GvXv3'
-             b'EgGDkshrRJi9gXSdBsMq1EeXO6hbTuQMNJmdN7ATFfSGMrOKObjT+XKfozcHNndX3U4HbrrpZnj4'
-             b'oYfSQdstTF9nkB5nMs+gUtINEYCIoj8eLZ87Q3pXdx0DpVoXTr3w2l4hV2ZL/enppaVLYRfOM6ia'
-             b'FHdvEG1SHuhF7a6ioajnGPItWzfD9p07qYsSG3kZ+5opqLoiy2KL0TC0XCEJRMFloehqVOAYxdRT'
-             b'cltSa54OqampXvbk47RerCeR2Ybf100LEjupdaw++vMwSJV0iwPzIgebrQ7W0gLoUwU2HgzJMgVp'
-             b'ujEWZ+0MTTBRwkmKUKGZe+s64Zx1WmGoPhbvzMiHA9iDyrC2bDVqJnjOFbZknnsV50rnjQhSqlY2'
-             b'q1TmF0v82Mulmeppc8QilO7P5S7qzHOPwbfu+3uY7Xe1A6GNv6pJf7QDDU6FkcUMPK3a5UvmEcYe'
-             b'SopScXfAzSMwxIM0YHzYET+n2RMe9LHWJFZgBp6KqPFgEmo4iYjzponpza2qYm1P0IpXrr9IDpzx'
-             b'9VGBLeQwunJtot1xmk7+Il8IoJsVhkri+tx/cC88+dhjaXPp5c6W5xHTaZ3e/8XPwJ69+ykram7b'
-             b'Luii32GsdcYhnAvvyow4FmfmAv4p+y8UwpJ2y64hCo6xmGo2J3Ch6BRdsUPKkF+tOqmsP3NaPIoj'
-             b'erNzktlI0DRjEVyrwW2wDglgGH9OZ8BRCtj0dfniOVi/tkzXAg8kXCN4ffMMEAldPUop7nayBgrT'
-             b'a/GAmkqVzROPPkjOJCjBmLBbSYvNADwvwn63kzrfA9TREBsZmMQg+T8VFwTR4P+uKOaEDiHArOyV'
-             b'0gkHIZDVka9fKeVCZNjRyiTwTTFJaVKP4fbX3QpPPPF4FsnrIZeTEvCgdI1nvDjZOGbSnjp+7Eff'
-             b'9QMf+uM6PRRxo0DtO2kwizHcr+krbSqd6anR1Nz8+VpgJGcWWuABbOXUDsix0y+N5djQFUuqmw8c'
-             b'TK/XoZZaYIPI0AeISM3EDeiM3izN2CAVcA1lkILgy0ERNdWjorwYdJqeX5jPlbXLQt584LIlTDqQ'
-             b'VpauwqUL59L3Zk0JGk9iNhZuBLjisAIjyjO6b6eDd+nqkvFMk2gKhqmcoQejI0dwiqEXfYdBbnxJ'
-             b'FS2HMeP9gk9HOy+ITfliwym6iMXEiy4yvdeZYb8yomS+SNBCVQbl6qHn1aDSMg1FC5PXA9L4V+Cz'
-             b'n/o9mKwu0Wbv2R6J2J7pOu7cuQO2bd9K0oQYjS2MM1oR45jt2LaqkbrJsC8L7PKsJ1XKKAz27DOJ'
-             b'XfhwPFDz3zrkuHDUxuBarUE6WYa5Yl7HOG9CJmcRVzsWe/NGFAv9HYfUBNMYwaWe1s6xQajEt7BR'
-             b'LhTavLPMPDbGxde59dbbSJjseeMOXGHjBnrt/Gn40mc+BWFwGc6ffB6upo1YotUV8RICg7DizD2F'
-             b'WMTeecBfYO8Clzkd8Iso3MdCSLIu5IpixmBmZV6RBWUP8oxamXdKXvHqrJcd7XmUEEV3F4u5LPwX'
-             b'knZ5LidMXwlaXl+9BlcvnGeOC1sJYcI2kgCMIwoSKXIXg1KZikTul86fhaNPP0F5W1kewcgEIyie'
-             b'rbF27t6VCu+tMEidRjDQWxBorcEfsea6piiVWavpWINJkNZ0asvldDkqxlCBs3eJywcQEqSwKdix'
-             b'bTvcdOgmOoixe/SedXp8iAsZLboNe0j6tZf2/mcee/iHnn3myLunFhah25++bl+t2W1bvwMnXQ+2'
-             b'7Nxx6sXHRcxgjFSlACrpXFASSJ3qXPDA27t/P5k4tpxX2m7gTsFrOqWExOVuSAe6JoojMlyW7f5s'
-             b'6KJTBswGr3BW4HvYuX0nPHvkOY5Wruj9VxI0iO4TowGcOHoEDh6+DZZGa+nP2qgXoFkHhaVR5dWB'
-             b'Fg5w02dYX12hmRsK55yrGxRb5xy8gqMXYqGZMh05u3BEo/jmOVKMDbaeEziwoW0oppvRGHDGDbOX'
-             b'rMvgjYs3CxX6i/sBm/TmLJu62AWBU0xe6fMQjeQlR4IjNf+ez34annn4PliY7hiDUs49Sj//0M23'
-             b'EOOIokOELUXVXSjmwABqKVVSFp3CHOpGbeBO9OxDLZ9HNilLATrdLhUSSEpAdmeVNiKE+dC/D+Ea'
-             b'iurAzcvl94hCTJpBYbghZTvleZhjFwCiXLP3Y83xLOTdR5lKUg1ncXMAE7QYrQMCKMwXmJnm1OfW'
-             b'kw3RzhtupIMcRbV40EeuzMdIAEpF09FvPwT/+IVFeMf7PgQXT70A4+EaLO7Ymd5rR621aI4oGjHD'
-             b'gpRoDzC6pShnRyz3udhzedYuFUKSIAbSBajUwdCaZXOXzjPqHCVqAabkIF33Rc7hmeUn8KIWXy5q'
-             b'mm8JAi3SFeqaBqtw4cxLeU36HISJlkFkxUaBhJlNCSQsb6dnepg71amp9Gy34cFHvpkOuLOw0G8p'
-             b'3B5DceLHZwqLnIO33JzZckKdD6ZklEDTGE1SM5gwzDzO8GIM7bVp589avAytOYHEC+Uo+jInNC5T'
-             b'ZDyAHSA6atz1htfD888dU4RLkKaSBFSIagKhBg6kdIOV1j9++W9/4a7v+u57Ot0NrvPfyU4qDlN1'
-             b'8hq/XKoYFxc3n5J461yd5M3MadtqcE6pyHOvSp0L2oagiWYdrPmoDO5CiS0XtwMTEFbukBG2+lzd'
-             b'ZZYcz1EoZrn4ocUif6NFgyK9G27cTQ9+5bLpY+Vk5pLtc1KxCs89lVrkMRqwdtOBWnHERiFmTFhb'
-             b'gf9/QvTWyzyYjg2NkxAl3IawOsfD4yi+XOISr/ALmAA7XwL5REflfJPQaA6zjc1Zoauznc4rvM1A'
-             b'K+7MFCtam5Id5QzdOW5wb3ZUhVbVBJ5+4MvwxU//R1iY6hTWWSuz7fDnTs/Mwf5UqOCgOsqhIzPG'
-             b'yI7m4rRtDyLT+eWYa9DoGKqiUYzc69NBQ2mvaQPCLgc3ZGRgkvURz4li5dWGig4cXM9pPSDZQhzn'
-             b'nQhexW+SHKSzyFVYdbm7qjKsK+4GfJcnMZpORFzQgyHHgHakNMeSGBYSykZinB08eBNpXrIutzj4'
-             b'42fupLV6/5c/Bw/e+wXY1HeweuElOH/iGExSgeWcdMZ10S0JsqDdp7FJ0m4uaLSJBJsKOlDoyq50'
-             b'llwcGSVe7vgYgqfCcwNEr/MrZ+Zkng8yZyomhRIb2DaU7cBYMOnzlK8tHtjnXjpFHo1YOCLTHCH5'
-             b'WPS/xCxGgTYWzFn3CESQQJbn6tIlePj+r5BLfCbFFBeYwPcTC8uFxUU4dOjmtJYj23FJhBCPIWKz'
-             b'kwIDETOdhM2lnQZmBiiymCDWRcApECETWgKUaCSd43M3CYxMOO5wcf62d89e2H9oH7muONnzSmIY'
-             b'S3qKSW/gL9yHptJze+LJR9///BOPfje+rUl6vevx1VpfuvyaT7r2sA8zU7NnolXKQYZQKl9EteL7'
-             b'4Tmqw7HuIqRFceDgISIgjOoBm/AKHhobC68MGUOGEg2eLnEJYiAU9CZFE5LrywIXKijriXCQvj11'
-             b'Uls2byHSA9kNxULMzAPHCs6cfAHOnjoB23bvg+HaiDeRTD/tdbKFz4SsVlp0sK1cu0z6FnS2KALX'
-             b'0JgZ0YA/umKGqgu3xEyoCzjDT/k6BUMrL/CdZMGIRusV/8XYQMhs0amR6EYTqrMPFQZ7azSlVGMN'
-             b'oeQZVZ3uZ6uq4eKLz8Gf/e5vQ2u8klr4TuoueR5Xix9ZDQf27yUjThRNu1jMCQUCi5IMyjPF7Foe'
-             b'Ne1ak0OjpWDnqnWS7hFC08O1VWj1ZoikM5kMoE6bloPaDJUZxw81Q5QVHWIkHU33c0LdVCdTyKsu'
-             b'X4EBc0ryvaGumsxOmQ3GVW2GE6vMFBRoKzgGDVxT3C82T4ahRrAoJcdO4JZbDsNjDz+YnQS4e8T7'
-             b'jDMzfAEU+f7Dlz4Lw/QZ3/vDH4HhYBnOvXgUtuw+QLlc0XYf0anSTCQaoGQfqdhrI5g1zvKGIej4'
-             b'gI/CZIUyK9I4Ci/zK28cKIq/ohR3QanmQTuxaFx4nTGuU+NanpfS2gxRBbU5B6pKh9EaXHj5JQqP'
-             b'JNF1yDEa6AiB+xF21CRbQZf5FltSpb/vk6Sghm7Vhoe+8XV4OV3HhamWPkMSpCizUTQheMPNt5Bk'
-             b'YHk17WcVB8BSdMwk1wFscO1dw1URDD4AJTkvljmvUvLZZxSiieVpEvPFQgmC+uJkveek1lgftP56'
-             b'y913w6ljx7PkxYloHbSDtdZaEkrreO+tRsvd+1I3dejOu+6vYnxFovh3hDjRm9/02l4B28d0kwfD'
-             b'wTbSD6jLtVdmlsSZyw2oY2DVtGOHaA979+2nTiZ78JkguOjUrVtYOyFaxytgb7ZozCSNZk8qihCV'
-             b'JUilkYGi1CYoLfKZ6SnYuWsnLKXuB9N2FYtXGKOGen0ZHn/oG/AjBw5BN21Iq2sDUuMT7DepCdbC'
-             b'kESEitbW1gn+u3LpPGzfeSMnllbs41drV1AMZ70RLlrBStRqv0Q72DkHiPy8OGo0TEw3xtGHQtt2'
-             b'roE3lxM9qt4kFqzB5nfTZxABZ4GoRP6C0G0N186cgN//jX8D65fOwFy/nSv6yPT77KcOrW4Xbr/9'
-             b'Nvbvq9W1AJjc0HAOUOmAyHtYU6OYBpRum2qRdoY3iP01ZheJOlXDFayO1nOAOWtSMnxWk/VVjpfI'
-             b'kGZVFWNYG2AZSF/Vpqq73cpD9IrMZydEcqlYHKxmuAgFEZSEgmZfGGeGAOFEs2RsruzGjDPQzdu2'
-             b'wPbdO+HksRdVWyezQZqVppfupv/7jXs+D3WqRn/wIz9JG+S5E2mD3bYL5jdvM0pfhh6hZYgpppeO'
-             b'RdCrqbOxaiTyeu7owNm5mi86HslyEoF/LHiyc83BcTB5WK45dH5l+GcDInPqR1i+P5LJyGi4ChfO'
-             b'nobh+grBuCR/w0Mq5OKAcsbYMHmq16P7N9XrECSIhw56JGKczFe/+NfQo5iNilzfxSIoxFx4I9UT'
-             b'C61b77iTMrVUTG6Ztl62taL70qxLAEMKAfVYzEBJ7lLroPW+dsFqVq0PX92wvCokGUGPWjlWJRU8'
-             b'e/bsgX379sHpk6eh3a30wKXuKNQsQ/C6j+QAxkjPyXS3DUcff/ADJ5575i17b3vdg4Azve8w1c93'
-             b'0gHzmr7Spo7WNS+88NxbW76IZZV9xyeOs2JaqazShUT64vZ0KOzYsT1v8Nk0OPuoMZYa1FLJuEs0'
-             b'BqNFkW0dsXVU6kr8QQSZUwktlh2vmSWIBe7hVKWiXora38pxcZcH41hRdVoOnnnsEVhfvgbttLhR'
-             b'yFuxaHOUusLatNZ4QGFlvrx0NX1dYSV+VFaUwCgKu3mnIWsqEjWpukIzBUPZVacJXzokDUo03psQ'
-             b'rdGmV1dM1ZOxPCBYgSfEBqEuczREcxMKTdnUgJG93VrpRi6dfRH+4Df+T7h84jmYbrfo4QdfqPcU'
-             b'hTCawI3pQdm6ZWvaUAcAZtsMlBsWlBzijZehY29AL+GHMo/YwHSiBFWfBce9mTn2IMTKeUhdPK2G'
-             b'Og/OIx8gQRynVSyeh+s5Gp41/3Sg1NQ5UfPFhJ9Ac6i8IQc1vNVJeLouLfVic1ak7kAh4Fc4G5nD'
-             b'cYTekOn3r7vrLoqX10wlXSf5viErdabbgW9+9e/hz//499JnXUmbSgVLF8/C6eNHYbC2zBlLUIyP'
-             b'ocCl0ZA8gE1go5mnOEk/hgzjqfg9lso7Ggjby7qOwsSLRg8oDN6aTWRrA99HhZ6USg8biiUTqGi1'
-             b'VXgb1teuwdnTL8L6ykoW0qbvRekIadk6Hbqeg1Ro4n1BQkGsx7krC6WQw1nUvV/4W7jyMtog9dht'
-             b'vmLEok3SAscpt69LB9SmxS3ZHNsVn0UyOMDvY2idOuzgGnH2EnvjN4hr5foEvU4Gso+g9HTje8AP'
-             b'a9FIRhesD1tey2QmHOANb3pTudXadQlyU663k7F5yEQY6skGK/2v3/PFn5cNNEqi9Xfoy6OB5Gv5'
-             b'wuiDy+cv7D138tib++2OQkG0pGMOZhOHcq3WK6aipv8N10dwOLXGCIMAWxkFMgTVsGswESa64Xpv'
-             b'NlFXBIEyV4mFOVmYLRXPE7jaiyYVM4f5tWB9OIJdacOcX9zMCa2ZnRWCsKgy1fRi6g6+9Y2vsdNE'
-             b'SeXtdttZV4Wi4DH644fcPqfN7/LFi0RLVxEid4EuWteIoBWqykZ4CCwUZ7Nt5QeYLVyMkT5IGoYe'
-             b'5t5ZGwEduOazqipstQ3ppiGWA8ubmI8CEYkELSj0AQSv1HD19LPwh+mAOvf8U2mz9CzcFOsYr2GN'
-             b'SP296013gRLO+AELMkvD9+e9Ok17SQxX42GZNDJVnu5Hxcan2M60Sc83Hg9hPFyHUboHLTJ6HVLl'
-             b'6yWPSg4+nyMZSGtfB60ejW05WVy1yGg4UJfmZA7K17IOsUGFJoIFvx9cG56LhFyMu7I5eI6lcRJJ'
-             b'wv+2MrNGpEOninXfvv0keh5PSgS5dNculmJodqoFzz7+TfiT//DbsHw5dbPTqUMYr8PZk8fhXNq8'
-             b'kZavTMIoWFQo/7/ph1B6HklqFtaoK4xOVzmdccg90zw2HVt6lggUzmCZSZX5ZiYQ1Uyi4VUX2FIM'
-             b'KmYL5nigoFD2hKyqlq5egpdPnoAwHDBFPN+UNlpxMZUdO+BePzt5e45pR7RllDoofOKnei04efQZ'
-             b'ePC+rxCtnAo51c/K1D1ScTLV78Ntr7udDkFQ5EMISU4JPl5WrLh0aBK3dZOORSRunjVnGLxSmNTG'
-             b'NsptUBVm6UGJism8NJndt8jhfe/+vbAzdebYKDjWhXm9rwJPZH/LkpCch3IzqfB58qH7P3zlpdM3'
-             b'4nMm8/Dv1JfHKva1fOGD/OQjD35g7fK5xQ4zkbyB0nSszquUlpXLDtn4vfPzc3DTzTelDWScN0rv'
-             b'9GJ6Fud6beHN69WhwH1mH4YQjfO3HJL5gntlqAV6TaeheKXSI1+uqSk4eNOhTEVnqC+YmHf8qe10'
-             b'k79+75dh5epF8k9DiAVdDEbpmmB3SJETqcNso6NCqsqw4wrp7y6eO0fVgSTaRnU6CQ0rGV2YlfE4'
-             b'07yiFh8IxaRUqyyGfWK0Hg9WrV+IDjFuIJs02GZFJCn+e7rtivFl8CWGhN0fkFCSlj2cePTr8Dv/'
-             b'5lfg3LGnUvXeItYc5Q4JWZ3sXgLpUw4cOgi7du3KiccKdbBbRF3rUNmZ+SC4qJoXq9/RqBLl7Hua'
-             b'dRINvepAC70mez06rCbrqzjtZTg6w3A098NV7bKLt/Ol08zR87XeJGR94WGXSS6OI+MnerAinT0w'
-             b'2SMUjDr/uZbDnkkgTsM5nbMdRCyZWdxNkv5rHIiZdhd2UzxjcN41ShXaCLmzmUrn9PkXj8B//H9/'
-             b'DV546hHYPNdPHYGHUeoyzhx/Hi6ePZMKxjWFYIuFV2T6eJ37WxLyhlLvOKNLknXAtHhrCVhmfqGw'
-             b'ASOzyUy+2yuS3WWz0i6OuwbbxfNrFsu0SG4g586chsvnzhLcqfsRP2ttn5m7g9GAig3cf8h7M3VM'
-             b'YnWIjOMqHXTj9SX4m7/8U4jpYG+bTZhmrpGJMEhrT8XPXW94A8zNzhOM5tSXMDKhhyXNXGxALAJ+'
-             b'2Pgomm5KzWnAtkrQEEt7Y67sBX51FiJ3pTnnfLyMMrKIO12PW2+7nYTNFUXw5L1lItdWxjiBBd9g'
-             b'oe8Aw6vnt6RD/L8BZEdi0fwd/Kr+9a/8r1RhvKqvFg2Y25/71O/93+sXTu2peHZAm0sIyru3GKUz'
-             b'juXIqrn58C3pxr6RGDVRdFCCoYbipkBVeAB1KVe4S5hBSjXPkIu3OT/GEyvK3IRe3qnJKrATQ2Do'
-             b'aH5+Fp49coRgoMDWIwrbpO/BhX3lymXoTU/DLbfeBoPhODN96Nr4PJgVrY36adXEokFRIA5VfVXx'
-             b'0L9lGE6CuuQlHcqTyT52oeHLJ87KsMGzz5IpGuJRE5XgGnGJrhhSFveuDE1YJq8rcBRn5/F7SxsY'
-             b'znfSg/zA3/81/Mknfg2GV85Dn4IDaxpGU/4TWwhRrhx3be989/fCzOycHgAOmu4Izhye2SggNgyL'
-             b'1ZxTne5ddlTnzK7W1Dy0F7aAwywp8uyLZHE1WbkCaQdiD7z83jTzTAejNbEPi7UPqDatqiqGlPKQ'
-             b'wVdNeQHRs5Fo4SrOPRO8dEJzOS9zgoZw1bAiNcOn4mchw83IT2jxIbl1+xZ44fljsJ4q91baYHPc'
-             b'Ahd56maQ7xn+m8lgBZ554vG0cWP1vI8y1FD3NUyH9vLSErGpsDNvpz/PWUKx6OBi1nJ5i0U22Kmu'
-             b'uDuIGXRkf8JYYK/Y6MvAmlE1OoDsDF8+gy22CuOR0ROXZ85YWF5bugLn0wE1Xluma47PqmNhqzhK'
-             b'EMOzHtM9FDlMxW3fJOSfWqXFhua9937+M/D4A/fDTK9XEAV18ciHOBZb23duh+9773u0aGicuEqD'
-             b'Nxomnu14TWpumierV5+6Pwi71DflM7nlKWCJs3Gfxa0iC8KNe0eUfSMn+W7evBlefOF5GAzWCNnK'
-             b'zXRQo4Jg5+IYhDrOxXaryuv79LmLe+9++zv/sGpXQ7wPeI2/E1+eKLav9ivd7OPPPvWW40cef2u3'
-             b'xbY3Qi3mKxbYDkdvqsTzVo4q3Dvf8HqG1TiIjEsGv6Hlh1jgBMG2C44fjSWIhYqcOgYrDMZO7cEX'
-             b'1pqTSPeQRaVYES0uboHDt9xGHnygUxJHTlL4mhO0qk9t7n1f/jxcfOk0tF12Q5efNhlm6x3cPHzM'
-             b'eqeqlS3/l69dhXMvn6HcKbIwwpgDqVyFNu2KvkszrtS5mYWf/OBpJRqMet0eSNEVV3VrJsr6DanW'
-             b'nXlIGrRycbeWLiwWd0Fye8ZuZLAMa+dehM//8e/AX/zub4IfXKMcKsToJ5QJVpHLO6XZxly9DdOG'
-             b'ccOePamL2p2NeV3W78SiWC4OEvrA2fGJ8JhKXpU83Bn3z7ZSrtUlaySUC6D9EtVWqUAaDZbzbCp1'
-             b'P+PJMHcMoeiXZBulKhituoRq7rMrR4Y4Hc9YA9lhWeuZ3IkxXTtGhbbw0KrUsJXd6lmvE2Nd5ivO'
-             b'buLicJ0hMuzOsdjCav+Nb7qLoGYy6QXZtMMGsXM+UNA1pRtH8NXP/QX82Sd/Ey6fPgqb+uiigHEn'
-             b'A1i69DKcPXEczp56kWao1iRYNkA1inbs7AJFEqKCfdmIQzTdMTQo4V6SClwF/6UWSqDNXMVPXgGJ'
-             b'Rc4ly53TGJYuX4BTx59LXeGp1PWgKBevyTiLyPmVs9g+dz/4LOKsacLIBpkqc2It1ENowxie+tZD'
-             b'8I9f/CLM9joZAfLZHUPmdrg2cFKBa+q7vvvtVOhmQkZstEY56DEYVqWn1wkE+frCAhLKiHWoUcvN'
-             b'wt9TT0IHOosCCUzc4BhPTyuHnXpnWM+hGO3irLibuqCbb78d1tNzKZ1/Hkt4deuR96b+pxKakn7u'
-             b'lTMnbnrsga99iBIxcE/7Dn35tMrhVX118q8P3f/VfxKHq+1YB2UA0XPcrmiuVLvcsdTcEsuHR4bS'
-             b'9h27YPeuPam6GehGKJBOYBNT74pzTGQxngwXhXIeRSzsCvUaoGT0ZJiQGTA0G8gO1JVAhKozyn9H'
-             b'cQqp0rz9jjuh0+1D9ssNOgiWeQNuNmvLV+Hzn/1L6OJKjWMK06M2GdldqXvodXs59I5iIHLVhiGP'
-             b'g7VVePnMKdJRSQUukRyeLYjAfFbNlnHQiCF3TpJ5mQEkVZT3JtYDmrMqz3RdEwuRF2RdfNBUpxEb'
-             b'WpQIxQkdH7zh8hUYXjoLp59+GP7o3/06fOVv/xxm2450JcEaN8vrCnSFm246tO9MGyySTugI8i3u'
-             b'ADxvXq7MPcRs2AHfo1j2AFf8AyNwjhl/UHxgsBiiicVkTF1D2qJSEbFCMR0Qswg7s/dqvc/iU+Yo'
-             b'9yzLHdAdpaCy7Awd60J2kR5AqPOBhcpkeGs0bTS3arGwF8rDT9errQajec0Gmq8UckXUTZaEqakY'
-             b'uvX2w9mlYzTKXaFe9/R5XK05UrlizutjptuCU88+Dn/wW/8W/iF1CulG0tyw38YzeAjrqcs8f/oE'
-             b'nHnxOCxdxayldeo0vIpTveoRxc6rOE5AyUxDT8bKM/JaOoRsmMrGtry+c9futdLPs+Oo6IsV5EcO'
-             b'9cN7unTxfHqfx+BSKvwipmRz/hOGjiLj1nPMDRZFjlN2sbuqyADY5ffnTOhk6rAWZrpw4dQx+Js/'
-             b'/xR0fU3oiDPRP0H0S+kP1tbW4M7Xvw7279tLc8/MSM2FRGY+1by+85w0w5UZnaGCWeZ2vhRlyuB1'
-             b'EntSyCyikSpIEft+5PrJzHMCSR1kTTpeHPl7o3agjl140Jvw8OvuhGmGK4ll67MrjOdDqhanHvph'
-             b'nmZapCFMxVA3vd799375fxqvrfeE2fmd+Kp+9Vd+aUNI2n/lV7rJa1evbvnM7//Or1fDa/O4dsei'
-             b'lbA0U4bwpEYQ09dRuplvevPdcOOeveTVR9BJTlVj8S0Lz9S3ymnYm0YFSNtt29ySoV7mNQGK3b31'
-             b'FgJfDjVX4sEDMUknBPktryzDqdMnCf+PwYElyVEQXrpRL50+DfOp89q7/wBlFQViDbWpHabeoMpB'
-             b'fp5D4QSuwINs+doStKs2aahEb6V+arEMpi31OzpoRBaAa8JMKvJVAoZregBCE1rQTB7nG5BT9o4L'
-             b'hqLuNBF3NFqB5VR1Dy6/DN9+4F74z3/4STh/4vlUqbf00C95XU6MRvLwOuYi5cChA/CWt7wth+kZ'
-             b'Q1In7IlG5EM00QT5gYyGEKLeZp41O61KM8V8dwbavRlwyMrCTgpZpZfPgxuvZt9vbw17uSOvKh50'
-             b'Zxp5hpMq3ciyqUmdjWVDgQjFTkYPWxZ4QiOGAmh+lT0B82fw4iauzDnz74IUHlEd0qFkOFNA38zs'
-             b'LBw5cjSvUxeUZRfZ9qchVeCFQAdz6iKfO/IMnEjd05bFRRLVE22eO3o0WF1bXoblq1cI0pJDmfRe'
-             b'7JTv1JLbwMQgXn6+4Xqi3ZQ3z2fDlF30ULImQ1PYT7XEBIaDFVi6cgUunjsDK8tXsmDcy8zaaWcn'
-             b'+kYshDB1ASUOOCum55y640CuEnhfcWPGYrOfDuuVtD4+86n/ACsXzkIv2ylkCy31Gcjw52gygk0L'
-             b'c/ADP/R+hhvZb9LFQo2XixSNK4u6RoihWDGWKPZGwDE/xqTMHmJQXDRKJeqaLiXGWkxIbOJ4IdhI'
-             b'tueqaJ1gAsVS2pNOn3yRSGEoeqfOKN2HWg1ui7Fx5KIiMAnk/IULN+w+cOiRXQcOHiGEyLnX/FX9'
-             b'6i//L1ByAf5rv9JbTTfuqYe+8YMPfPmzPz/dceLZzDfHq/GRUiU17TM7B3TSg/Xud7+HFg4OrHHR'
-             b'Y+cB6mFW0kLLBBbUAqfwJWMxRbCZbrFU4dkhwKvbuu4UxpdOKjZ8DyEG5f2hC8aRZ4/ACE1vG7OS'
-             b'zPqj2Ud6/8ePvQA3Hb4VNm3eAoPxiA4kJFAgxTV/NhEHBsLEK5+7BZzFra8NKFARIz7QYNUpn7wM'
-             b'nSURsxAlfBksm+GqWK+oT180Bpzgm+4c/4UFLSackXFsb+jGSH5YTRX2tXQ4jZcvwuVTz8M/fO4v'
-             b'4Rv3/i244SpM9XvZSYBnO7h4p/tT1JUChwaKsBu7x/e89/thftOmrBOLFtaEhnTA5ocVWrhTxmMu'
-             b'MCozWfYUbkh3iTqpVFF3p6Ai6nCqqJcuwmQZo8Illj4XJnSw15ETgplyy3ZIuMlleGdMbD7gGZbY'
-             b'dmXX+Pw+s5VSRaQPYa150cbx0B/hkckox9FobRJlrhB0nWskjYfy/Bmbanr/Na7TbXD1ylU4c+Yl'
-             b'midl/SHPbtjIdnpqhmYyKhrwmWGGBqroY/fEtx6hhNqtWxZh88ICdQ/kociyAmQBriwvwSB1DoO1'
-             b'dXJvwEOsMC4NVKxzj9oCVCrwceoqE4unn4G2ZTt1PPOp03MyHAxhKd27q1fOw4VzZ2H4/5H2nsGS'
-             b'Xfed2P+c292vX5ycB5ickcMgDQAiUgRJLSWtwtqWtrTlKu1+sPeDt9Zr+8OWy1X2OpW95S2Va8v2'
-             b'WpZleWWtqEAQAANIgMAgT8DkgMnxTX75dfc9x+cfz3kgKQEUVKMZvnnTr/vec//xF9L7cCJDlUV8'
-             b'HY2OEQjRbFYGeSdFBSJC19BC0YB0HajbSt0UMcVqFh9o46RqZgz+3R/+b3Dl1HEYbLd5NOm9sgV5'
-             b'LyMjeuzkXkkJatmypQQ6MPcEVdaxBOyt09aRqJ2N6PI431aAzmxfMjhFi0Qd/IqHl8uqEFCAKWDO'
-             b'v4qZOCw7yigTC/taxROPhQsXwOHDh3mMbeoyUkIGJ1zPYDJawXbCjs7D2OTk4MOPPvbHIZ2XgICU'
-             b'v+WvRu8X8gLhnujDn7z5d31vNj1+fTScUDKcIs+MdCkJisdy6aCkgL91/bp0MRbC9PSsOD57Ibd6'
-             b'MsSzUV5wc1QSSpKpsbRLqGQsJFqC2imz3UQxkBH0Cwe3OmZfGiW900gFXSxThbrzscfge6/9AFot'
-             b'nEdnNW71bGmlwz6bgvef/d//Bn7nH/3H0N9GpvkkWdIT2zsFqzapLPToME2na96kyq4BbTRVS1/D'
-             b'jm1qZgqGh4ZheN5C7qyoA+tlsqwTqLQXi3Lv5wAlbMdhwqXBfHOys2eGWhvyorTxEBg3PpIYnDHB'
-             b'TE+noDQ5QbBlnPF3J27DwQ9+Anvf+zFMp6CBoyOXEmys0RiOEXnYUaK4Jn4mRdjrWAsBM/fefy+s'
-             b'XL2aqtdgahFy70JOsBawTVU4i8kpiEGo99m2xPtMKsXAkrr2mIKJ6yFyKb3/8Rvpr7uUWFh/Txx2'
-             b'ie/UsAW/nrOKCilR0UcdPojieVTR2DgUuxIMY2RjIH8fxbWVhZajuANE2ufiOLyKKuQarEuOygmC'
-             b'QtsK5sqDONWblM/Zm63h6V274HyqgGemZ4iwqjshGovV/NrLV6yCK5cviVK3k0IkQj+CLtKDuD/d'
-             b'06MH98C2ex+Ghx/fBcvv2pCenSbMpsA/3elRaJqcGqfR4uQYX2vUJsTPg2e2lc45Fp5NHLOlr1c6'
-             b'SnOZ+MqFUy87vkryj7K7RSmiQOO5GeIsdWfQDqVD5Go8W8hpxN0aCBDACZwdOYr4c7DQa0pR0evU'
-             b'lLTxPdJOsq9B14eMDR0YMhMLx6H03iduXoW/+KN/DReOHaA9VBQELiniC5CGRtEV8q8m4fGdj8Cm'
-             b'TespgSvWphSHjXavQlFkMxhGE6gRe11QLWOjPGhRqnHOy649Yyqi7a9CNMEO8+ui8xjVWVqEDAQl'
-             b'XYuiCoilDZq5dtL1Xbx4KWzasg3279nLfnmVgF9UcxJBE4UyvXX2jvf0Jw/tfeHS+QsPrt1+z16Q'
-             b'3fzfSnECs/+Xt5BqwM1LF1Ye3fvhS0PtprogSQ3uRLFc9wUh25Q7lZ4PsG3HDpFyEdFN3TtAuQ8p'
-             b'SashB1FjvWcoKFXARvWUOsUs4gXh4mLW59Ylo7n5OkO9ceXInxU5NQ/cdz8cO3oydUtn04PoaZxS'
-             b'GbSNq/GB1BlePXcC/t//43+F3/rd34MFwwthpgbZR6XKrubkgXyMLmqC9ZikihIt6PvDsTdVIbdv'
-             b'wvjYODTSdUUvKtxpkZySM6SHyAH5LCWjflKKwikFQwshWyfQnOzyqZYfsjPBEUgKEDhXn0xJaXp6'
-             b'gr2zIqozBJi8OQonD++HAx/thvFrF6C/4WBeP3cdgR6KmqpCVH1es2Yt3efL16+wVXvN9w7HfIPD'
-             b'gynx70zBqMOp3rvcPYHar8SsX1cUJ8rPCtngxNBRBCOXrqgS+gIy5l2dAkhnEnzdD9MpQVW9GRp1'
-             b'BSXtRuVweTMH5DEHg1TwNatC9VuV+ckcEyqWWELfIR+zzYqmudoZJ8x4X4IMovETevF4NSNUaSAv'
-             b'fLnCAtzuo1wlHw2Agt0inv95qfvZ9fQueP3V10g5wOy7IndUE3fGUiAehs1btsDx4ycITdmQYK7K'
-             b'BTg6jDPTqQB5Cw7v/RjWbt4G9z/6BKzfvAOWpvM4m64ngokYJcmTgIjjoF4q9tJZmZ5UQVN8X03e'
-             b'DFSiqEA+UVkBhXd6jikZQcny0ZQ96M+V7PbkbntRQQ90lqXTDJHucxvRdypWK7sylDEjh+kQqbsi'
-             b'VfOKbeGJsyaITewmOxPX4bU/+QM4f3hfOtdN2gXWMtQgqyFzigYCRt21fBk8s+tJ+rMzG2FBzYoa'
-             b'hY7iTPRBeV6mkejlHkcbX7MivCu0NB3HG1sBzIGyFILZcU4x4+ZIpWnyYwkwfF69/AweqIrSfwCK'
-             b'Tw8++CAc2H9AxqECBpHYXsw8s7RayC7iYWpy4J0ffe8frL3/gf8IcET8txSgqP6rf/5PabH8ZX75'
-             b'VO1/8s5bv7H/rdd/awAVV6VqUxIhOFeggnwxpw6kO4ZL3l3PPEvVHWXmdBAJaEEIpSi6XvKwu8ok'
-             b'eVyxc5kjJeNcoYoSrWqPJqckXDTniwtWCZ8jgBpPqAyTwQUcP0A4616WDuSRI4cpuVQ22qlsDIMP'
-             b'BR700auX4cypU7B9+w4YTkGjF7laabX6jMuEDwipoos8ExJ8PXVuXTLSw6oGrQQmx27TWGV6aor2'
-             b'AUEUubkorTLBd87vmQ+SQXL+c1NSHt8QDDcFmW7qdqYn7sDNG6NwO/3CRXRnaiIF9fRZU6c8evoY'
-             b'fPDmq/Dj7/w7OHngY3CdCRhqNggpR/WVr0zyB0mmWzZtont86Ngx2VEKAi8ddKx2n0n3fs3dd9HI'
-             b'JVIFV5BmY64MMxskWCCHYs9mhGOVmgEmUWMgQgoAATEo4aCI7Ezqdu9A6EzbCIlzB3P2oozmKDl5'
-             b'fg0dr5J6RB2kqvbii+VNmRxHuBiIWaGE7ehxPIgPOAMn8vPAiSaY2zRyeExhwMcClZm1E13h4upi'
-             b'3sGp0oeOsbHzWLFyJdy5fRtGr1yhM9YLDF4gG/L0O+4b5i2YB1u2boLrV0fp/uNnLa0iMIG3SDqo'
-             b'C6OXLsLhfXtSd3UgJbmb1DXPHx6GwaF+uv/4WelMI89RnQtqdiwOYiKJzzVy5Oj3dI7xe/Ge4AgP'
-             b'A3xMf8b3EUStIIhtipqesgYkK1Hgszg707WpBx50HJ2iir0qruDZn5qeMc8sHLv3Izeu7skuTsjh'
-             b'yHdMcWcgFY6jl07DH//rfwmjJw8AxjTeYXuzxVCzURp3pddppy7rW3/nGySBRAaZuk3VUZzAsnUv'
-             b'6TNzLY/rzCqolDYqVOSF7K1qPRR3CuAOxYCQ9+yuYE+Ve+Risp/dfKNapqgYAvIJPY2OkdA7f/4w'
-             b'XLxwHq5dvUYxSfld1nBABrWYc7N2PukHXb565e6HHtn5R32t5gROTvD+/qK/Gik7fGmTQ2wePvjJ'
-             b'm7/ZQmFgLnZkbFAY8Qlr37sMz8NZfreehc2bt0Bfu59sjHVPRejAmN0z85a11IzLXAunXZNuHKHU'
-             b'qXK62yS0i6GI1J3H/MUK3oZTWSDRk6PPyd/bTYF32aL58PSuJ+D1N96kwINeMqoizc8m711Qm+7a'
-             b'2ePwB7//P8Hf+a3fgfU77oeJdIa7NTsR11q9ptfGLqo90JZZfiUcKEc/r4+Ut3vQnZ1MN2o2BYia'
-             b'Ar73bEuOyCQMhH1t/vdRvLx0ma29Le0+gnj1YDuP2lrpz1NI3JSqtUYCrijYtyrkec3CrdErKTAd'
-             b'hBMH98LFsyehlT7fUHqYh9sN8tSha6ddghB+MYE/9MjDsGL5cnjjjTfksaxs7IjoqgcefAC237MN'
-             b'JqYmObBHqWoBClO6rFvo1FdIorVveV5ORxEfdWBACywEsHrH6h6V5yfGJ2E4BdSRefNoVNmZHIe+'
-             b'VGABorpAjB6BvX+CFD34njwpYc/S2Ig+W2BEhhclbkZtqaQUjwhVMy7ULH1DihW+Ekp0j+5DVA8u'
-             b'0bSsmo6J2W5uQcf7pOwsm4OYIt4yU0nRXzqJwH3M8y+8AKOjV+FWSlaMYONrSmaP6d59dvJE6tJH'
-             b'4KtffQl+8pN34Nr1W9BqNgRJ6wpQkofBPn4D41fOwk8unob3f/gaLFl5F6xLz/C61GUtW7kGFgwv'
-             b'gA4mKryXeK6l6mYVDEdVONrvYLJAyHyQswKRR0wKB6+Dig5HsmZBSwlSQPCFPFW6F+02C/vWUtDg'
-             b'+0YfKNxzU9JN/66/v02dGN5X/HO37hInjMVDcfzeTP+7QYXTpx+8Ba9/+48hjI8SupESr5f7EVQ+'
-             b'je0pvCCXX/n6L8HKu1ZDh5y5+2wSQGMzHBmTsgj7S0UbZ0vXh8jfspgurrnayNTmZMzFGqELdfIR'
-             b's9I5yyHmuJdzajRNQR0Jkqg32cyoGrsrJkhSDoae8E6bcM8998Chg0ehT1X7VU4t6lpnLnfNSPfp'
-             b'/03cHF2+76OPfvOlb/36v4TJyRyif5HlUj1x4UuK/bXgypkz2/7FP/m9j9u9iQGsftCXx+yhbSXI'
-             b'CC7yLvHe0E/IS/h7/8Fvw9DIfOInkMwbim2mCg111LB0oTk93ibjA/GFrF3M+BSDuGm75Iq9i8Iu'
-             b'arOatyViOVqKzhaDwcWCbCwQd+H0BNFzQ8O87//gx7AvtcGods4QTGdkUH19fIeYc3vQhKdeegV2'
-             b'Pv/1FBwXUkdEvIq+AXpwafyDO6eKK7Re4ISHyhROqmPq9FxefpO5eGBpfq76PX0N91u4J6jlISab'
-             b'EGTWy3XBnSGhtrBjCNJxpNcbwCBUd1LymoTrVy7AZ8ePwqF9n8CNK5dTNzcOA+l+4fwfk7JitTCw'
-             b'VD6SQCq+dxyjIP/kqWeeJn7Zn337L2BiYoI188Q5FxPv8hVL4Je/9as2fyd8ET58iggtSI9Oidxi'
-             b'londinZQQcRNcYeJ96nVYBfd69dvwMWLl2nncuvmdSJVvvTVr6afu5yuDV77/pEFgmaKRMMgbUbv'
-             b'RClirgwXyLKZR5IVk1PlHuv3V94XM/m8pgbxheJOoBbolgr6CkAofcdMusbIyWGAaZXFfE26C0zl'
-             b'HaAUDs7Cr0iqx9fFMQ0GyVYfdvSj8G//5E+KvYa314lC0Hzq6SdJWeWD3e/DyWMnSBQZO5JQ5dGj'
-             b'7ga9VNE4+kQrFdSl8yk4j8xfBCvXrIc1GzfDilV3w+Kly6F/eIR2HxgUkWaI8kJOCD0RsoSWitvi'
-             b'vgkt1qdnu+m8ta1TROkpJ91tIyWU2V6HCgBeQcq5jkwmVUANFWwyWqc/4zNMhoaOdovtdG1wqzg9'
-             b'NQEnjx6GT3a/DRdPHoK+9LT24S1GorXwJX2medE+JgploZXe44pVq1FUm/zIuoGVJ/i58tRhAnV3'
-             b'DRgc6Kcx5ED/ACxevAgWLl4Mw0NDZEMfpagIgqQEQ2LKciOIwr/siMmCXl3IPRQmsLq/jQXyU89I'
-             b'JltH72xSpBJ0oLJMBNhORWxXEIdiafN//pv/K3XfE1QYqzFPCSQ0KyGdnAmfC2H+yzbf//F/+t/8'
-             b'z0+mz9QtuBtffifV6X25xRaOtPZ9/M4r0+M3BtAErI41BVxmbIPpheGijvYwDbHBQwn7dEM2rFkL'
-             b'CxYtSpV8x/TCKDnXYGKh6kWqVYUtkyVxQaEJFgMUTrLF8NVHW8aXAo5zpFPVmC3qrozlQDDDUCUj'
-             b'hDyC1uPDkA7kC889S6isQ0eOQH86gFDAwXVtRFyoFNzb6U/vv/lXcOzIQXj25W/CPfc9iqJhMJOu'
-             b'C5rXOYHk4YNPk2L8OYGrXScdCOkAYhveE3KmZ3dQBAI0hKfgK2bL91U8N280WIW9vw9Hh3Xq2Dok'
-             b'2YRWFayXOAkzU7cokB+/dAauXDwDF86eJsdR3Ctg4B1MD/TIyIBopkk3QRDsaNbfHVx2p7e4dt06'
-             b'eOLJx6A/dcd/+v99GybHx2lxTn5NNfuF9Q/1p4TxS/Rw4s6KHrvIJEj8Q23Q1jxdD6LvSIocYt+i'
-             b'JEkMmmiOOJve78nTn8Hp06dg9Pp1QoBhgEE+1KYtm0jRHit4ECh9JWRMLCIouFOQrPnneG9jFxrV'
-             b'CZKKyehiKy/6b4FUR3TU12REnwgi436ERiQomJyuebfLauoMzGhZIKGOvK+dOryOkSxL12p1rNW9'
-             b'eyGMXlhiZEktL/NdBKOsSp/7ueeegzdeez0FyX7q8LLLRkXf++47u6F/sB9e/tpXYVNKVh+9/wFc'
-             b'GR1NP7PBsGOu4WVpzwAFBGRU7QraskPpjF2D43tT173//ZRI+lPXOj8F8LtgyYqVsGTpClicuurh'
-             b'BQvJAwtpAYi0rGVv1Ku5eKrFkboPf2bI3oCet/ukFIL/kXpJ5MKGihbqNFuFfBNQWkPwZbPScV7D'
-             b'JKvGb4+mIuYcnD55FI4dPgQ3rl4i762BVoOdoSXyepcdhYkbB+qBxc9ftzsDx04cITfvqKLCIecF'
-             b'7wpXcTk7+IxiZ96fYia6fy9fsQzWrl0Dq1euhoHBQXodnCj0pDD2ajAolhyV16Qiz4lKqgUnnEGd'
-             b'5YWMi4x55F8rd8pnZ4nS9ZkSTY9h6XVkybuhoUHYvn0LvPXWu3TGo4LNXJYm81lsUxDUjsa3/amw'
-             b'vXzm+INHD3/67PadT/wAZqZ/YXV0oVx+8f/q2alq/0fvfwvfBC4W0XUWK4boKm1oTG2cLrYmHbku'
-             b'KCEUwBV7h0BVFqovZAffOnOvXW6DWS4+KwzQs1oVml+OS0WnVbksIV3IiS+qSoAKnRbvlUi4dbb2'
-             b'oORFYqnAOwZkZafP/fWvvUzB9uChQ6Ryzl2UVF+mesC7q5F0bWZvXIA//4Pfh31b7odHn34B1qzf'
-             b'DCND8ziAYfeTghdWi6HFwZMeFtSRc1yZ4btvSoWF30u26w0vvKvISQmXwk3xgold7kTr6RS0J2F2'
-             b'/A5cG7sN1y5fTd3SFbh+7TLcunE9JaoJOlCYyPBzjeD4KQWRXi0dbGCfKyaPglWumLgwEC5evAQe'
-             b'3vkwbNy0mUaXr37nO3A7Jb52X0sq0Jp4OPj9L778EixKleQEwoZNVVsmBxVYNwySFEy3zDpZZz5i'
-             b'2J1joXD63Hm6B7dujrGoLe2imjQua/e34b7772OYN7sZEh0gythLXceIv0aW3xWPoGTFyqO2Brvx'
-             b'IhJPlc7NdoZhyLh7UHV05MVR4kkFAb4WjlYQws3yV2JpIlJT9D7IPbpBxo8Mada9lDe0ucKRVFcS'
-             b'SmiGXA9NoAB5qT41NQMP3H8/3Ejd5Xu730sV/bApZbtCeexHb/6IxqQbN26E5SmhoBTY3r37CLzj'
-             b'G6h1mBGUTpR9aZRZiQF9OnvNpqjFQAdmbl2GE9cuwNE9fI77UgcxOG8eDKXktWjJMli0aFnqtpYS'
-             b'9WBwcAT60O02JWraieDY1HHxEkWtBn8OjyoDKZbYnqVRWSGPzwPeJ/xG3A9hETY1OZmKpTupo7wI'
-             b'V69eoe760vkL5FyAkwOEoQ/heaFOv4ZYmFgY2p/kyqL9HBpPCmzb96X32eQE0tNJjsh9sXmBKpLI'
-             b'sFru30wqzqemLsOlS+dh3549MDwyDzZt3gw7tm6HpUsXU9E22+X7SxMlMUmkM+GdgQPNRFUI7Fk0'
-             b'O9punojXWtRBNLdzHjmH7GYuCL1aCfey+uim4nbL1q3w0cf7KCYw8dcXyuuikCJAJ514kVACJrB6'
-             b'unrnze/9/e2PPv4DBWj9QuO+7u1TX/yb0429dPbUvf/9P/vHH7S7E/34kadnOoRY81Sll4bdkfg/'
-             b'qArMNgY9cl793X/wH7I7Z13PJa16Hn/gKMvn9oT1zgyjH1m5WHTQ4uf8ZUpjdPUXcp83NY5ZFYit'
-             b'HtRkrZagxcHDBRbVRCgrkQQJ+c2VRgNHEulrr776Kpw4/hkLbTd84RDrTNaJ5J6ota4IFdV1rdRJ'
-             b'LoXVazbAyrvX04M7ODhMHWofQl5pls1Ldx3uYMWOAdAW1KiMgCO6lNjwoUTVgZnZaZgYu5N+3abF'
-             b'+XjqZm7fuUXjpMn09ZnpKfZFIguHSsQzeTSh3RE5GYdaFPfzGJVIj2JDgPYbCxbOp8N7bwqCA0MD'
-             b'6T5Pw5s//CGcOnmCVODJ8C+wBhpCWp978UW45/57KJERQKLO+xdf8c+oZcSSt2nOnK9d0QLj+75+'
-             b'9Rrs2bMXRq9d5XFGxe7IpFKP6KTODDz22KNwz7070gPfo8DXTB1sI3W+FEMqhoiDCGmy3FHTRqes'
-             b'zBCkUhRH1IrBFcoxoTBEAriRkiPzpRpzHJCpA6tYYBiIX8XoNtwDc0fYo7HK7MRtCASgYOSoLVTn'
-             b'8IpUXSmTXcGpAK3SLURCSM55RYCdJnzvB9+HPZ/sS2esbWoYSgfopaq53dcHr3zj67Bq9SqqjMdu'
-             b'34FP9+0jrgxqUrKOXyXE5iqj3IBRppTIIVfn2uUF2WUQwZ1GYriLilSVoxJEK8WGwdRFDAzPo93q'
-             b'UIoPrf7B9LUBQj729Q2wSHOjEhi4Fz+lHu92uh1Sq5lKZ3xqbAwmMDFNTPCf05nvdqaoiMa3VNGu'
-             b'tcEdeOWzhJoSqZ2ovSihNmqxGWTcx0heb5546MDN57aW3RdysFSxBIN6T3bysWAs0es3gN4DJkod'
-             b'9eE+bdPG9fDwQ4/AklQskPYduUfzeE/HgErt8UJ98Er0VnCZgmrqYAaTriAUO1l0mjC08zIGDKWm'
-             b'DMsupvfQl87Gd159HQ4ePAIV8TgbvF9VDVUXslaofEbkSiEikCL6yNJr/+x/+P2H5y1ech56vV+s'
-             b'k1KJny/0zenqfvrJx6/MjN3o7+9vCY8pQGnrpbYT3Dk3bOE2O4NL843QP9iGiRRAXWFLATJa06Uw'
-             b'CxlmB91YwDsV0ZRXzXwjatpxlIkoGlJmbpcZefbvonEkiJHebMhniRS8keSHB6OTgtydOxj8J+gh'
-             b'QMdeOjwMDCWu11hKDDr5rYXmS3sjx4x+jvWBjNOavgMT18/C/gsnYe87FSWvqtFHi2tETjZTwsdR'
-             b'WYvkXJgM6WSE2UuBDrs5JBCSpxDymFLgR7FQDLRY4Sq5UhFomGAxKbUxuDZknEmHu0sdZh2yaVwt'
-             b'yKxAX6/Nop3QS+nfL1m2FHbs2AZbt21NhUk/XbfpqVn48Q/fhJPHj5FZXJQkT1CS9OLPPv8iPPTQ'
-             b'ozA1PW5qISAFibqLsmaiOIj67JmluniKVMQR2rmz5+D9d3enANSl8wjeFfUZkk9nYOWqFbB16yZW'
-             b'o6cBO46o2gYDJ+kYNPhzrOZM+yYKPOzgiteYgD9YuBAXqhKfKVEtD7ro75KyehRJKeQJVqRA0WW4'
-             b'tQQLHe3xDtFJ1wSmjo27HSIuQszoLVcaIRqKhIozKqJ8ZZbn3uSjAkP9vYBB0KAzBdLnn38Obt+6'
-             b'A6c/O0P7kZhn3XQNZ1LF/Nprr8Evf+ObsHTZMhoBPv3sM7Bl2zbYv38fnDp1lr4HgQchBElSHORC'
-             b'3c2AJBm9s85hTZW5E8ABJok+VM1vslNujZYpnWmYvjUqxQXzfBiMKEaTeF98pvUGlVYSFQXuVOSC'
-             b'1bp/5c4qkheSgwFMrg3WGGSJKQT8BAEbsMFqUK1HLK7k+5zPBGMQhhB2lDUZBQY62ziaQ5JwLVMf'
-             b'BET19TcISTgwNERcrKGUhJm71aRnGVXF8VxO3BmnhDqeEiwmNES6HjlyBM6cPgP3peLv0UceoWcM'
-             b'FS1UApeAJTHrT/BqkwEQ3rx5RMNTrUFcpmuYuL4PQr8peFuFTqUzUjHv9bdt2wRHjxwW9G2gmEXu'
-             b'094bghKcNzAa6nNSEk4J7cbN0SUfv/fOt174td/6X0AdBL5skuprt79gG0W7oerQ3o++2W4UFuZK'
-             b'sNQeSp+y6PJcVvyVsPqmkUpQ9eB6DnQ8yoiI3VBFqdwmeYEVAYKnB9X7XA1omxqLOb7OqU1J2ch0'
-             b'zAciCSYvOysRZ8UqAQ/T1PQsXLh0JT2cp+DipUupYr9JUPAoopYEecU9UHpoUUaFAAlqeifjCsTn'
-             b'4FNljG4ZWdGICG3mkVoSuyLOOpWCvXQCNNKL1jnmQ+BsHEGHo+I5NZC6dUUdDpFTG+rSWhdrdlY4'
-             b'4GIrmCcVHd4o1gGadtHyHg9x7SmotlJntGbdBrp3a9aupYoPVdzJiiC9zltvvpUO8DGqeBGoUMmo'
-             b'ZDY9eM+/+DI89PBjhOTjClCg8GKVbiZshWK7K7zAoOB5NFOXefbUGdj93nu048FFbi0uzipRg/em'
-             b'nd7vI48+lA0A8TM1uBOgB0taEgZjiBad7LDwPvYEWUcqKGIng0RTglUjEi/UZlPCo7eaUI66MEJo'
-             b'NYJK6lhySAIr5BOSEdFfIQsf07lu8D2o45y9KeOnfMEZ092IF403Z2fSlS64tsSOdE9QyeQb3/wG'
-             b'fOfbfwVnzpyiERuj4xwlYNzNzUzMwKvf+S58PXVUS5cuIZHlBYsWwHMvvAD3PXALjh4+Smrr4ymw'
-             b'ekGZ+sKw0YAGOLqmRJpB8iiFBbXuMp05yuJEpWqoGzX7yHmXhYEq4xbVQlaCghmUodd0bfA9CUUg'
-             b'hlJgWrzr1OLe+cwJqrS0idYVBLMZlCdH9PE6ddds2KvUCQ8OD5PN0MJFi2DegvnkajA4NEg8s1a6'
-             b'nggkcqrDGZiJ5FVJHEfLnQ51XjdTAXwxxZrPPjsNo6OjMDk1Be+/vxvOn78AX3n+K7Bq1Soau6kG'
-             b'RwY6x6w+L7FPfaacjAlBQEtCPcxdtsSpWHhXKYoWos9uD/hcpOd8zd2rYdmyJSkmjqZ73+azgyAb'
-             b'ouJk6x4qjF2YY945kIrvvbt/8uvPvPTK76cYXMdfwF7exZkrX+w7U2V/9ezp7f/tP/lHH8Hk9YFK'
-             b'BCtRLggBBN7lQBpF7QCX2LSfSB902fIl8Nu/+/cpSeHCkZF7BfQ2ZikPGQSJPlugUVMlduNBiHVe'
-             b'3UDB5cWmHkqb8QUbQ+gini5kEKlY7DTSRcSWFkEely9ehkOHDsPJdGCupQODgYtGSelmtFusrecr'
-             b'PhxNkWKhkVmDyXYhZoSg3nx6BxIsgwQWrOQwGPbkfrJFhciUSCsfhcvjYtbXK7kzJdorSwg5k2VR'
-             b'0EVZiVeQFxJelA+iaLh5EVIl59z055EFC2Dd+nWwcdNGWLhgEVW1xNVCmDqpZER4M3VQh1PwwpFS'
-             b'Q9FUJNEf4dmXXoIHH3qYaAZmQV+zJxEH+Hy/XYzZH0ob4ZA9ovDBP3v+PLzzzu7UKQZiwSu50AtH'
-             b'C88TwsaffuoJ2LBxPZ1L3l00oD0wzEroQpBlaSwW91RdN7wH3MnzyMbRnqohCSBIEHUC0eX9CfWe'
-             b'gfkqUcfBCF8XwATD0J2MFoPsmoSj1fBGgmyQYsltiNgFu4LY67ztGaKIzdrgqHT8jS53XsK/imoM'
-             b'WnkyRcR7hMvwv/zzP4dTqVpv9w/I+MkZlw67c1yWv/L1r9F+CkfEOCBuyGgYIe2nU6HwWSrerl+7'
-             b'QZy4RsW2Pb6AyvdqHoGpxQrtMaI2PLzYr6MqoXpTe2EjPm+FhFeSGHtFmA5h3lm6OQWui9nenHZC'
-             b'tQosx7lLe8ffy3JWTtTYWa6Nz1zNnTGwey1ek4ULF5FCyvKliwm+PzQ8j7zicNypvmcIl6fr70U2'
-             b'yTGPzEuRGmUzbioPFE8cjT9DeiauXrsOBw59CsePHqNx/fz5C9K9+DqZW+Jos1bxY+wWRUhA0ZL2'
-             b'7IdgQtyZIJVDR22+Y8bDkfGgPBdFIavnFgFYH3z0Mbz+vTdhICVjTE54pnDM3ah0H+rpfNIKaHqG'
-             b'9pwtAa1MuVbnH/7n//WzG7bd8z4ZjX7ZTuoLIy5S9XBo/56vTt25MTDc9GWDVeDnCyFY3SylyDyT'
-             b'qgb2rmkSGovRJSIX41Q6yZk8P4Cb47Dr51ruQWkVFh2YZ4o2HV4U1LnC1tKUUYGsp8ZdSP9Amxb5'
-             b'e/fth6NHT6Yq8xwx6XE3NDQ4wJ2J5+RSaTDF99Pgz4ZLV0zWDbXMds6ehyDjRoNsWAKuuGJEWSQZ'
-             b'a2DiC6Fwyg28IyO9NwvgTgjJKg+URXVDQXRWN00b1QWVWKmJPe9FTYPY9HVNyRKvPRYTCxcthLXp'
-             b'Pt21Zm0KUisoeeMYAkdrXRkjonU2FhpvvP59OH7yBNEPYqwIoUXgl/Q9L3ztl2hfNTXNiJ7KZaRk'
-             b'KdlkVTNJzRQdURCBYc92LlevjMK7b79HC2oMZgTssPjFo5leOvw77tkBGzdvEUdVVoHHHQdeawJf'
-             b'FBpoQawGvIxREFpMmpOkit1kVQHR7CMCd6WahA2xFa85yJHvTjQzPdpxNLwpxafWNnNkoAzYUZxg'
-             b'XVYryMxdE/81awe1WtGJg8GPpSuxnZQzYdwgzqn4kiSe2m7CL//Kt6hjOnHiGJl7RpEUwldCaaCp'
-             b'8Ql49a9ehRe/+gKsuWsNVdLYgeLPm79gBB7Z+VAqPh5IRdw1OHv2LJw5dxZuXhtNndd0FlMWvUyB'
-             b'HhrPie5JxWrnVcguzfR5ZO/mFboQeWTJIsdZs64WhFo0WSw5N6JIThMX+fdER4tRFPWjmUpqIkM0'
-             b'XYhswYIvhgTdgcE2LEgJadnSpSQhtXDxklSkLUhJfZB3ljiqrLsi/RUJZavqNwyciKKk05BnMdp+'
-             b'XOXk9JrTCI9eh7U+sZBfseplePThR+HApwfhwMFP4dt/9mfwG7/xm3D3XXfRuSZSM0jXWQg4m7Nx'
-             b'5UwtxxlEMpj3mpNdPD8DtTknRRMGj8Y7VUXWTkpIG7dsgf5332dAGTDhlxGg+XyyLiUrvdM0AvgZ'
-             b'jzNTrf2ffPJ3Nzzy5PuVm/o8SuALdFLTl74YgTe1C//jf/Gf/ODMnp883/YMCNAHE6sNEAXiksIx'
-             b'O8NItG53Gn77d/49SlRIusOdjvnJCEycKrrAkONQaNMyW1tIlyJW6aUhoKAreywtFwJkqK7pCNa8'
-             b'M/CCHETVY+yi9h84CLvfex9u375D3QFCqNXQzqlXixxoHvOogjGjV7AYboidCC9dCzCHJAqWymnQ'
-             b'DJuVNFx2apXlo6LmQEmLMeMXK11qxiAVe1aNzrpxOpZwwm8IBNUlRQkcNeH1xq5Q7A1w/IPd78jw'
-             b'CCxduiw9jCvSA7I0PZALaA6OzwEmJux8avUIS6+FHc2tmzfhtVdfgwuXRymJUWIkxFcPmuka4AJ+'
-             b'y/ZtlPxZK8yZxqGpPKiOWMgSPyAWKJS0JcBjgrpx6w788Hs/pHNDxFQjFWZzOFTUX7VyFbz44gu0'
-             b'RyLFh3SPWwODtrtRGC7fJ7YWqKo+Iy9iFRhozl7J+KqSTUsldh3sGtygv+fERmAK7IRQ26/HKECV'
-             b'6GEicCQ+Ee1IAoueIg/JpI5qvib494hIi52ZPFkw3h2YgrwTRfXskZih17mIc0anMBCRAAKwW2jS'
-             b'bqSCN177Luz/dF/qEoaYxuEZSuFJwqsmxOGup56C7ele0t5DEiw+6yw5VNHiH3cyY2NjcOXyFbhy'
-             b'6TJcunwJbt68AZOT02yQyCRCHmd6HQk1BC0IsnvyovDOFAHa50q6IkUa6yylylfNOxl9GldSpg48'
-             b'SuZCAe8pcRZrlnKie4w+Un0N0smcP28+LEnd0eIlC2Hp4qUwMn8kJap+2gmTHmkdRDMQTKgZ9RhB'
-             b'EHdO9zSfU7u3AlXlrUTZBgT8VdYjVCQI55IcvRE00u5Lz9oNePfd3XDys8/g137114gk35V1CcfF'
-             b'nlFp8rhczqaywJU/Jo7J0WWaB3WOLlNxVEqJrUiy27eXgv5P/+wv4MjBI7Rro7F1g1VnAPT7uABD'
-             b'M84m0Q1a8nepCF6+7ug//uf/Ymdfuz0evyRnqmGL9r9OOyn9sMunT229eOroY02Z4WvVFk30kws4'
-             b'k3+XLKNQ5eXLl5HiABRCotyAxbzQMx8dX5jHyWzeRdl3FMx7c7MVSwZeh0NXRCBLsIQXJBsG1mvX'
-             b'bsIb3/8RHDvxGf3vgYEhY1vrnJckm0K0UQLzHBjijAcYya2NSnOhGCoHbvkxcOHIp1YpnDibvsYc'
-             b'I9Jcg8LSWZj96rOjVgO1U1M/bxWZtFkCOZVhoiycqWtKzw5WvlyBNuhn4Y5meOE8mp+jDcOi1C0t'
-             b'WbQgHbrB9GuIqmccCZGWYPppCIQgFQQhYNNuLf3eTt9/8fwFePW734Xbd8aIxa+7E5Q9GRkeSgnq'
-             b'G6kLuxumpiZl7OS4QPDiPxN4Hk/jCe+KvSWjzRreGegCEWWoGPHmD38E4ynhqS+XL2RqQCD5IyND'
-             b'8ORTT3BJEhiwU7X6CUJMmo4uCngl7zB0NMaDoUa6VyyFRN2TFzqFV+IoBucWj5uDLIylimTx1kCq'
-             b'61H8gxqkeh9o/IdnhoA2GKQalaECY9Ak5Hl/RTdUJwtqcaOovWgMi1ioicRitBw16DndezgbHytZ'
-             b'hs4VoREr+MY3v5U6owWw+913mT8nyRxN+LwYmP7ox2/BzRs34cnHH2PrmRgsAOPrzmAhk/5v3oKF'
-             b'6RlfBvfcex+h7W7fugWXcZebEtdo6rLGJqZgcmqadpnMJxMpKM/jNBz/Vg2x/ah5b+RNNb2yDtRX'
-             b'oqSvogGSvaPsmGu5rtQFyw4bXxdlj3BntCh1SAtTEsKktGDBPJI0aiNAKd0jfF/4/GCnMjuDv6Zl'
-             b'fOsFgRdzzHKcaJzq1YEst8S3K2ZQZtEzsBiwGkPmUX0hER15j4NJdSJdr/6RefDyK6/AmiNH4dOD'
-             b'B8k5l64BRBuHRymlvBS3pKQvJoUgihSU1AqDWNtbuuyYEAubDyt4PDcObK1Tw/atW+Hw/oMEw+8E'
-             b'jmnQUE5rdqPA8yOaY/Twt5oerl86t/X44YO77t/5xGtd5Ex9KYHZL9B54cz08N6PX568cXVwHkqS'
-             b'RGe+P95ngVJ1RlF7bzyION5bt34NIdY6vV52efWyU3Ia5J3xE4JtpvIiXhd5Uay6nThLOhFcVePD'
-             b'IAgjbwtA4rTTBceF8cFDB1IV+T0YTw8OwuMxRPW6rPiNnRp6piL3aZjm0PNhQQrqiOAbTkEerQ76'
-             b'+phBjpDzSmRv1NYCx1EoSItGhohmnJyeIr7KBCqcT0yTxcH0zET6HraQx7EVVkZYpZvzZtROSkVH'
-             b'uJJh5HDX3Hjx86CyQKPdoi5wYAD11IZgaKBN1fHg0EB6CAfpMw4iYrDBBM0gc3dC7wH64XRp8c+S'
-             b'NLIIDXmWiyz0vmY/7Nu3F975yduk5I7QYJA5/Ew6cCtXLqeFOzLqp2Ym6broXs2VSUEKD4R7s1VE'
-             b'beTrYKNKLijw2rz19jupSh9n3lEdQT0cg3nrBfreRx59DIbmDZMGIiZYZPfruM0A7TI31oqTIMTA'
-             b'vDDf6JNFegOaEM2llbtw4ezR6K4u7oqjriqIeSSpqPe481XbjzpkU0mT9VHos+oA4k5MDRypWIlG'
-             b'zI0Zy535UfrvQRGsJaLVifAqyI6lLIAEeSugi256nWe+8iIsSgXk9954DWZmUyHQHuJCoOLPiNoM'
-             b'B/YdIAuQ5174CsxHLco6ZuWWyAUBSn71yJ7G0b9fsGAh7XDuve8e0ufrzPZgfHKKngOcWqB4MSJ8'
-             b'ES2LgKSZVBghiraDz4FcY8EaCA+Sd7NEc3FMkMXkg35HeNba7QGq7lFiDGkumJD6B/oIWYfFGVJk'
-             b'EGbfFIIyP+sMi5/pTqcO1hk610FlBH82NuzNQQ2r+DX0ckICwd+pOoiTcxdUJihmnRBX7q49y0ZF'
-             b'STJeRaAdyylhoYNIuu077oWNGzeJ0ahMc30oDA6jdZe8X2uItJaz0XKtyvpeEr0UxzQGV/a0kJBd'
-             b'ISmhnSqO/detvZuf8RQ7W74qDC5dyThlyo5IMzV8TQm1md7jvo92/8ZDzz77Gu8ev0wn9TdlNRnD'
-             b'Hdrz4dfatGAPUqG5ws4gGxrF7OhDVX9fXwWb1q+lllnNvlzsybIUDOqokPMgjT4H6oplgyA77bIV'
-             b'esheS/LvCViB/16Wgk64Puxq6WhRvOeTj+G7r73BXCzfpESFPw1n0YtTMkJPmNWr74JlS5elw50C'
-             b'fgr0XmR7okiM6P2jyrMgpTpho7vhQF0XXR9B0dGhxf1Pt8d26un36elJko2amuLkhV1mp9MjsEaP'
-             b'INCVHBBGtjUJoFHRaAhHAYiyQ8JqEx8+tEZIgRardrpegjQkVFnNIw4cNUWxq8+SKKpW5Wj/Zerw'
-             b'yHr3QLs53DP94PvfJ95MJe19oBEiK7gjHP2ll1+g94O2HLlbyW7KxIKnKq+yDljFLjNgRrhSeEea'
-             b'Dfj4vY/g0qWr0Gq3pfCYoxLGcP/03u67/15Yu24NqVhgVY5FBA19RcMQhDTLJndASQm1+xpohZKS'
-             b'r28PUHhA5YceyXJh2TjNVhK4oA4sMEwcPRyjRB6fkkxNLaaWSOrssngpwpKD8GtY0y+YuCvEkHl7'
-             b'FZ95ryTHGKxLNImx0twz1pbAbDQjUY+L4qIy95m+McdVWYIWcXDSfZqanYZtO+4hNN8bqUM+d/ZC'
-             b'KnraEnT556IaP5p6/uW3/yIltWdhfQqWOAqmPV2jKYg1geLRtQIqvKgCdyKxk67PvPnD1L0gQpTh'
-             b'3d7ABgiwwolLV84+Aqvo7+pa9lAiGYRIxIoDJyYe7Lbx3CM0HqWxaFfsvZCbg0gudeXeBeryrHPx'
-             b'WWg2E5l4LxMiw9d5xM/jKi80kgCfM280AL4gagvrCmduCs7G1F5WGyHmXbrx3LxwzBxTcCpBj3Y7'
-             b'gk4E1jUs3J1kfCdddwmyURfkglelhp6muCfJzQoyyJwnvY5RCkG8T/0phqKKywcffJSud5vuhcH0'
-             b'nTNVfl1rOBEIx/c10HJw8uDer9+8dGnl/EWLL8UvAUdvYBXyN/hywJ0b11adPXH0USLVyWKt0iV0'
-             b'dHmhK7NQvRj40C9dPJ8NwWp2dkTWv2U1nSN7ENxJfti4zhWLAzEQyxDlkNnTqowtLpE6jgiG+WMt'
-             b'u4MHD8B3v/MqS8+3UneRWukty5fBhvXrYPWqlTAy3J+CDXvUBBHswurBKcPcZbsBfDe9OkgClJRM'
-             b'SbIn700NAyvBfuKCtTZLbfx32Knh62ELX6mxpgZvIZSqoZkGc53Lh9gTToNYG5BOYoeEVV0sLbzr'
-             b'PCYUIAq5CWcb1OweH/mB4Ack0n7u+vXr8Pp3X4Orly+lbqzfOj0KcilQPbrzIdj17NN8vFEeyLOB'
-             b'ZaglqMgCP1ZaHepDVMtDJeguEd7E991MXeGFSxfg0NGj0IcioTGDaILs7ioyr5ulPdqOe7cT6hDv'
-             b'D474SEKnzg87iPl6N72XVv8wtOcvpcTkKrZvx2cekUidFLBxZIfj0UncL+H7EhWDICTalOFY0LVf'
-             b'Eg6ONHHngQRrpGWgnh90ZHkPZvjnTDZG95KZLKpnwhxuRXpG9SPVVyiq4Cyw0jp1vgquMPV0l1Va'
-             b'PueUq6Zelugiaw/Opi4H9zC/8uu/Bh+9/yG8nwIQ7vQQ5KRIUdyjjU9MwmuvvQ4PPXINHn1kZwpQ'
-             b'faYs44S/paM3gKxioKLB+PNqEjvuiYJDZcEN96P9EhhBeFK6SFQRVAa5eHP85XMI5kGF4AOmW8as'
-             b'1CGgIAcxi1bHaE7FwYRwpU6qpUyO5kRWrBy8nVE1I1Sdz2BC094EkpWHJsIQojXo5T7KXi3EbDgq'
-             b'nEDTIAXV8/P23kOxj1ZRQcmrOV1KvFG+qXZHDGrAYj5mp2wHc8QOdNIcP4cYpoSX4h52u1u3boVP'
-             b'PtlP0klN14ACxyUq6Tz9cnIuonhqNdKzc+P61SVH9+994clf+uYfQirSv/i47wtAz0+dPP7Y+M3R'
-             b'hYsGWyZxZHPWyNVv+Lw5G1VKAe5ec3cKNv0EWYzysEUjHxYzde/s4uqC1BwhC78bokQouU++z5tT'
-             b'rlxe523vgYrFhw8dhNdffx2WrlgOWzdvh/Wps1u4ZAlBJGmn0pmlAMPIQyGleZ/x/7VwCipGtViA'
-             b't4sXZGSpqr1iRCc24CwaHOZYfkfzYKl5ZKmIcUxAlXRqagcRFfEUjd9UyeHNNOp8gPm11GCvVk9r'
-             b'45b0RP0du88gPJsgHSrCu7EjO5Ku2dtvvZ3O0iSMDA2xfQKOR2Y76X72wQsvvQTbd2yncR/+WLyW'
-             b'tBeLztxuwfuipapBWAR0TXRv4uRpQVR6+smEYPowBUoGGHDtoiraTpCKBNJIBdMjjzxMdvUIDsHv'
-             b'b9BYsBZkILA2XHo4/MAQLBhZkq5Hqrb7BgA3KQSeEZc4VKVARF/TI0dujNQpyBaFOC61JL1gvDwi'
-             b'nuKjkRIqUHeZfm66Lq6RuovQIKJqqGeJ3qDwXDAUnbMqnINXxUWHQrJjFjmOsg8o1f+5SKklCHOQ'
-             b'coL8CwWYBCHNEVSgtGG73SDLe9OsJIuYQB3Q06nguOvuu+D7P/gBjI5ep0IFE2KPEK28g/tg93tw'
-             b'5cpVePGlr5IL9XTqToJoTjolL0f2UaP7LOoUtA+Tch6nAahFGaXI7BU+Sea6rIalOk5SPUsoDDDF'
-             b'18io6M5Z0aZBt4Y4h1NklJWeALcEIOMFoetlrMogLvUry30GE+GF6imdkipTaCHJzY0YahZy184A'
-             b'Vd4MCvWmenV5oHvuDABm+ytD3PE+qpbrE02GCcQTDQqX6tKlt9g9uSJu6V5fLYpCNMcBc1L3TAtA'
-             b'CbfVK1ekon4ZnD1/IQsDWrES5rzXKIViRZSNVPime/jpno++tfPFr/3hl+FLNaYmJ/7aUV8jXbT9'
-             b'H77/Yj07BX64JbfMZThjA6Qt9gWRkBMGtt9r1qzJD5RV05C7ICjszF02Va5Azbhq6dqC9CwZtaLK'
-             b'zCCinzwGDMIDYCFNVCq+cvUKkRnXrd9AAo/Iku8RrLoj7X0QhejKjOWiKVqrLI0vKpko5Dgwc8E4'
-             b'xwY7AAgXKEZGJerc2DlldFdWYdN1q0DgpYVHUhQOhFivK3Sb+BeSiEi9IWZ7+RikWlMtr1pHQloh'
-             b'KtxbCJdSCOCuE8EQqF7+5ptvwuEDhxiSiwAJ5LyhuV36h5u37YBdz+wikczpySlCLlK3ggrNII6d'
-             b'joEQiox0phwuxAH8sArtEuANnhgc4ez5eC/cvnkHWm0RYhVtvFgM+nDc9MCjD6YOfTEr7bcGCNzT'
-             b'C9F2VbPddM2bg9A3sjR1TwvRLCMFxxYlMezmsRMjG5HA5xTvb7fHBpTdqUnhpjXYoqMSuK6M5Aiy'
-             b'nIIsKn1gEUQGhiTiOksgFGTad6cCEXu1OKARkmqpuULSCM9cT8noYLqAUbX41JIixCJAz3W+VqtQ'
-             b'sMAIZvXh9d5n6mdW8zA7CEfj2+neJBE3f/vf/3vw3gcfwCd79qYOM9C+xxFKtSIx1Avnz8Gf/um/'
-             b'hV1PsypFl/y6arZot0QukkPS2XTBmWNsrM3ONI+kfBZP1R2Ovn8aItV8rpU7Zfs6yPYV6tjEyU86'
-             b'1GALvoyW1O6IYhg/D6HWzjQWPg7O4klQu3TzdCx2Nzq7ViFYociQjqbzRnhWZfmo8g+aEERsWYvY'
-             b'Shy4A3VeNSNKnbV0MrKLBbm38HaCkONKFt/J/msOMnXBl7E+FK7mPkst6bRM1CiwONyyeQOcOnXG'
-             b'LEDMvEDm8vQ+fE6y3GT3oL9VwZF9Hz1//dLl9YtX3XUKet0vlqT6R0b+Gm6Uh870zNCJo/tfHOxr'
-             b'mWst2V9YKzxXb40+WuSAO29kmNSYaRwCLrPwC5dKDT022rBlO8M7K5VHkrbdtKdU283pnkiCr+yg'
-             b'aNRGStUNePa5502cFQMrO+s6q069wMWDzJTpqEceo+giMQqJSfccUjbKAfPZw0VY+EHkVVTcsTRp'
-             b'pIAlC/docu46GnDZHdi61RycOClK4hKZH31ozfQQSit1V1y7rPbAY4qa1CrIbyd1E58eOECV8tjt'
-             b'Mdp34UkjkEdKUKvXrYXHn9gFd69fQwFoZqZDHCJe5tc2lvDK55LRh0GiJUmqQV8e2fI2DC/hZEoO'
-             b'x48dY8ShBRKWqQoCl8VztXjp/BQcN1OSReXtJu2hWImEGl/8c+qe+hcsh6p/HvRkbFyTTBTrIKLE'
-             b'Eo9YOhIQetRB1vrgaLCSMSM4DSa8a2KtyZrGdjXkJMp2Fg6a7UEIU7WhnmIxtnGQK2FPS+lZG5Pb'
-             b'GXLZANJLoaR7DIK3yxjXiJyEUGTHaA4KzgztVJ/SBUGqqQ+X8voUzZX+d6fHyNDnvvIcLevfT8nq'
-             b'7OmzDFRo4vc3yaoCd6rfffU7KVidhMcf3wnzhkcIIOEEgdn0lTkWBJddDehzuewHZyNLCNnvUc+5'
-             b'qXXXDJUzsIk4/0JOVkHsUJSkq6RDU5yn7ojFhRkJHO3euEIfFHd/oHY+hX27KwVCYxRqSNbEgzmW'
-             b'7SLbZOaATkyz88TJFwauxZIrI8ci02uoqwq1deFMioDifYlbrgJtIMcT77LyvbpBCNjP1FjK3acT'
-             b'hLTiGoJQXnj9QZ7IMJ1iwaatm+G93R/QeFSs1KRZ8zRu9NqhGSeNidGI3o3jY/OPfbrvlWVrt/yr'
-             b'GL7YyK9ROf/z/zYdxgtHDj9869LZjcP9TRvPxQImq0xvQqpooMR9VHrwVq/bSEibXh1sr8LCsnMd'
-             b'e71ZcTir8qPYQ/PsVgQ9CwmmaIlDlu6OO5Oc7LwRIIMg0VT+niCqOlrhEkEMAiuj3NH70orOZUa/'
-             b'c9F0AaGwZTeob/S5i1b4fMx8BfznVQCrzEwBQSqWWCzH2XGkIoSRdqiZ8Kgz6WKm7lhXzosyvBeA'
-             b'S7YgF6dZ6XjbrT4aG3722Wfw/nsfpgr5PLQIfNCi5ffk9AwsXrgAvvLyi7B1xw4yd0OAB8PFeS8i'
-             b'BAyBf0sg9mDWG4aNiGJ5LjJBygmjnts7SoqHDpyAO3duw8DAII2Kgwlr5akhXqqHH36IkFz42XDM'
-             b'R/wqYLBJp05fGxiBvgVLAPqGIDZahMTyjq3Olb8UavXAiZSwcJThaY86y51TKOb1NlZ1BUhGu/e8'
-             b'V+gJXJ/FUJGukJJnd8oQqCAdsapY0xOERFntfmR0FTRah2Cvh0CfVrrm+Blu3rwJ0+hqnP4aofnt'
-             b'/hb0ozgrqrwjQKdmdYPKq3e8KAm42hb6NpKRM+m97onZCSDUM6nAXA2/8isryQYFl+Wjly4DGkyT'
-             b'dJbYnqDF+OmTp+CJJx6DbamrCsTj6dLZoIIgelPOBnlmrXGKFjYzZFqfgxgsATnrXAqumPPFHbGw'
-             b'P8dnjsfK8nN9EcRtNaHPoIc5YlSKkNTOz7hDYPJPMZak17zLMQmrsoOS5yBYkRml84UMMzOEskD8'
-             b'PfvqUdGlxp5RYgkrRcuelmHytSQ1FodVO6NY+KNpAyHrFkvEc7m1qpSfJRRULZWTP56NefMXwZp1'
-             b'60gZo90QhRDvi52okPFLVXbpHttVhP3vv/X1x55+9l+R7uMXmPo1evXPb7l8bMHh/R+/7GPPqaeO'
-             b'l+Cpoq9RqkQnEu+6m2mkN7Nhw3rmk6CYqeyuoBjcOB3VyTzezDOEZc4LYWGsq0y9jjFw56MyJq7K'
-             b'SbNAlJXKFaT2HbgOiZC1/VjZQSofVQaIMEdGhUxtvUlfyCEslAssKQrEWmHIpZq7tPe8h8rLX++8'
-             b'IYDybfXGkdG9gpEFnYPaFKhirkgl0VGCEt0sXVw7p6WOkEfRxLDZhksXLsIH730AJ06epDEhIuMQ'
-             b'hTl+awyGU4f95FNPws7HdhK5EVVDWK+vsirf1JWLGTjXEZKwHHOU+FY4gcYo78flxCUL81MpWfaj'
-             b'gkUoNP10yEsBehY2bV5HXCzyokJhVnFxxc/VTQm9ObQg/VoIrj1MewHODZ6CJ8KQZ2amCBFGYAtU'
-             b'g281oDM1wWCM6VlWFYgiBBvApHMCm0ixcGzsiSuqFAOeIfzRBQMS0ddxBEn0gp7sD2R/qyZz2Lmk'
-             b'QoDtrcEEPvVsZufdBnUpx44fh/Pnz8Gt23fYZZUEPlGyq0ljuCVLl1DwWLxoPn2uHgFp9EyFzMgp'
-             b'niUfsk4gh2lBIqLvGCbudI02bdoCd69bD4c/PQCffLQHbt26mTpYUY5Iz/fYxCT85Xdeh+PHT8Ez'
-             b'u56ARQvnp/c7yd0zqX2oEo1w74RXaOAJXaxEbwgxsz0H3k/p6MiJgCpxDp3SVBn9GHzWAeUCTlye'
-             b'tYoQ9QUv6D4QRDBA3vlFl+WVnChm6LNe4Phsz6bPp07+1BhQOzilhIMkVRB1fUIzG90vmB+Us05T'
-             b'4xq/3yqKcLXwlyCos24QuTefk6bphWYZNFdux4L4aRTuEuojq0ha5haKsnodbTrFxR3Ath3b0/0+'
-             b'LmsVV8wRimslE5Zyl4qmk5fPnnjy5o2r65asWn06fgGebsOAAD9jHxUmJ93JQ/ufbkm1rKKuwRAs'
-             b'Gc7IXxLJD5QYSVXdyrtWEh9DgY1axHitlJyKTfIYojKYpQZhDcDip2LVD9WJDFoTJpR2NTHGfGF8'
-             b'IUcZC43AoorxOqT2qsads7+b04pzwqQD5ysZBQUzp2NB14r9X0or9OxkBdlfzM1FB7vs6mrPq7kE'
-             b'B4v+TBDMLbwid7zLBGfrSOXieDW/ptFYk8zgrl69Ch99+DEcO3IsBe1Z4rB1Qw9uj4/DcAp2T6Tk'
-             b'9FDqVhYvnk/WICSua8Z3apcSMsQ8CrrR5epUr28QSSoT8sUGvQ8h822GMqciCdWrz505AzeuXyMV'
-             b'A+Iw9XKtoPPuwdQ9PfDQg+BTOe+Cs/0DqTxgV4WWJ/NTB9UcIMUv1Nerxc8JYefoMYTq1JMT4ykZ'
-             b'tqnb7yHAoYr2dCqfJYZYcF9kZ4mBMOjyuyauSC0q92Bj4yDgG9bNc6gc3hFeCnZoghwkigUpztey'
-             b'QxWQjZcOQ9Q6yIo73Zd3334fTnx2mmSo+tr90s14KtSm0nUcn7oBl69dh6PHT8KShQth86b1sCYl'
-             b'cxYsqQVNk3XrNLgWDuJCtM9SXl4UWBHVhcCJhx5+FDZt3Aqf7PkI9u/bC2Pjk8Rhw0TUaDs4cuI4'
-             b'XLhwPhU2j8CObVthaKCfujow3mQF4otnwqREz6CkWZluJV26mEfe0ZCaTqFyeZLiY965yT3zyuHC'
-             b'a2v0kcKdW6H7kEdlBsV20UjW/PLOuiEvf6+2glk8OhrtRScLCvu2pCE0Ah5/Fh2YzkXEEoTHlVAk'
-             b'72KsaQJIZUkOc9TzVYADdOJbCOhyN+ezHonLyEPQu+7BmICqrahgHhz54vlG112k6gwPj0AvxQ/s'
-             b'mHuCp/Z5fyOKOoGSrTpmYOScnLw1cvzIwecXrbr7f/+5+WeOffzklZ/rHXXj8sV1/90//b291eS1'
-             b'eYjaQWkMInFmx2KBbIcM+8QlbKrg7r5rGfzqr32LAnpdRxM3pFluzTeiVgl5l6WfuTMR6LXBM0Mh'
-             b'oBqtAwtirQFRkXj6wHnTpVfJIhVOhJgTBytJSP5hE6UcjK0SKZExOg6QFlcgebVVeR6KzaosIwM7'
-             b'a7rSNiRLiRhQSTqwCHkJrMtLV2jOlbBR1QAjCwPnZaksckyOEybJIBECrZGS0zXYv3cPHD74KYlA'
-             b'YoWO/CkMQvMXzIP779sB999zDwlqYgLxIsVPccZ7IdMKqMMpGVEQarKndMbtAQrAPks6klI6IvHw'
-             b'fZw5fRbGxyborODJRtsCKhI86+fVwVlBROTj2Vm457574Mlnn6GOjrhxgcm2tKtq9sPg0jUpAw5C'
-             b'rFo0HmOBVzEUTGcQbVA6M9MMOZ+c4O7YRUHXSSEg+w4dXfPBEWCQ7n9EPNTVtXxedh8mR+DU7UWR'
-             b'uOKHtoZ6ZkIUugXwE+SsoUIJCW7yc1DLeJqvcU8CXKAkNzE+ReTXCxcusXVGB92W28wtVISYcFvq'
-             b'2S6950WLFsD2bVtg/bo1PIJFA0in4qN8btSGXcnGOnLW4otyZYNpF4qyxCJjdPQKmSN+euAgTKRO'
-             b'CgsgIov3InW8S1M39+B998OOe3fA4PAgKX7r+IwTiYcMxGMOG9jIKuvCapWvMj3e8AWZO2n0CqPV'
-             b'epGl5m4z+pyEVfNONf6YMRJtRBgVJ6fvVd6vkw6XY7YzX7sqOpnCyFgWCiCFvO8ACvIKOviTwq5M'
-             b'M+LyWzhK+JAr5bIXMkdmlTVSqIOM0U0eS01EbQIVjdKi4r9aoejEyX5JklYenjc1E/7ZqPX52mtv'
-             b'wNEDB8iaJKpEm+3pYK6PFhGH2QdsKn2udY++8O1/+J/9l78KX0BwtqHz8J8a9bkWnD5xfGdnYnze'
-             b'cDqksyibUyDetJ01BEihwI3VJUJZcRGNAdCJUVylqAkfMxTSedOfy9YaGcAQZWelSwmGuzvbJ0Qb'
-             b'ZynEuyrmrD7zZRDFM2fPAAb7NBSM9wUaxZkEkStGfLpLUAuS/NmhkM5XW4JYoP+UT5BHeJp4laWt'
-             b'ewv4PKTcUEsFiU8TlNlEe1kqg9ikp6TQN0DX6UbqnPbtS8np8BGWeyEfo5rGZWtXr4Jt2zenQLaO'
-             b'/KAwwOAvJQOGuugA5eFie4tgePco8isuluKNQZb2npITliSnz5yFQ4ePpo7pprj/6tK8JssTVJUO'
-             b'MtWkQQzJsvDiGCv2zVu2QiEonroI1mPspf/RNzifuiXwlQUTEINFHtnV0JudofFLb3pKnuVYmBRG'
-             b'o1RkxXkh2YqWGU9/esKpqW3PWpOkVC28OGdEAzVuVJVtMLkaDgqoTEJ7IrG2N+8flf4KLO2DVhoL'
-             b'Fy6AxUuXwPoN6+G+B+6DDz/ZBydOnKR9GgFYHCtZ4++NFksN3bh5B976yW5S9X/44fthyaKFLBZr'
-             b'O1q2Rs8OrjoCqqXzjYYo1fEu7gqnpjowMjIML7z4PDyQ3suePXvg0KEjcCcVHcQ1S50eEuV//Pbb'
-             b'cODgQbj/oYdg+/YdpIhCiFoIotQBBq3RwrEOzjqQIC4GNEaFPH5TBRNFsQXhGPKUwYn4M3829SvT'
-             b'MQ0VPuhqHXwxDhPIPGTvKkUNMoUkZnnrCGbGGiTQ696armuJogsl97GUfqtk58yWIrq/CSbsHjO1'
-             b'zUAJcQ583JlCRMgkFF+6SEDZSYhQt8DcdbcquuA8TOJnoRLLek1g5M4dWcKqlqmNrh/QIeHQvv3G'
-             b'i9PrG6EQehB+GR6xbpdj4kBfH5w9fvDpm1curZy/cNElc6X++Typn7G5ilw5nDx84Blfd1NXxdV5'
-             b'FOuMWFosgDMoM3F3MKCkT3r32rWyW6ny8ldHT0pQLbjOCqcErzDTHOsMjBvnIliiitZVinTxprZt'
-             b'rpPGYci+RajVxoKsihwMQpyVZath+L0dMEUOMUAkgNpp8SEKhkbSYYlXRJpyGwo+gslkFSNQ9XUy'
-             b'dkOc29TXwgdTySlFb8sm1WbhyPdBbUEkp544egwOHjwMZ06dhE5nkhSqUS4JhTTXrF0Pq++6i2RO'
-             b'sFqfRW21mRneR7jKoOk0ivFgezdCI6obZ3QGewWB/StMHztvrMDRPBItUFB77NKVUUpOqFyB3V2s'
-             b'2RZjoD1A3UyodeoW81JfgC1r1t2dOoPF5HGlMFcV6PUIQe8bEgsEfq+oD0agoErRUUDGguoCZd46'
-             b'GhCiqKl4CYKyg1LvHR+5+NLK3eRk0IfKs/V8Hbt2zzXRqthpaQkdBDnI3LMw51w4lwEG3KFmqVjk'
-             b'FuELo+bciylBrFq2Aj75+BOYxc+VEpUzaxsZq5PFegXnL6GG3nW4Z/vW1C3fQwoZvdCREVzMXaTT'
-             b'yXdDDBmF6qYRU/eipIKN6hrTpNn40gvPw86HHoaDR46l+3wURq9fI0rDQH+L/JGQb3fg00/JzA/J'
-             b'oMPzhul84P7TFwAFKGw2TMrKZX6Y1AwyAlYNh5A5gC7bjoIJ0sYsD+QK7zLdGcuHNt8uvVe6xzFy'
-             b'cmXoYjV29cpbdAXg19wPcvcyhyyryU/fh9m38+sGBVtZAeiMduMLQemMPixdyWVs5zIoCwpr+Swp'
-             b'lt0mTLA6065tVsgcJ1doYubN5Wzq1tfh/nPJIpgYG6PJG/mp1azQwhRTBXBJMxM1TziYunl18fGD'
-             b'nz73+Au/9Efubxj5/exOCpFQ0+Ot86eOPNluZdRIhsNBVvtVwIN5SfVo6Y6aYAQjx/wbXTYfLPoB'
-             b'MPmQvKPSu+FUe80gqbFA/4VSp986oyg3hLsdMaRz6vQbs3anShXNEW51jLwqOFssChmgnCDXIZsn'
-             b'crWfkUdRD6TjpSfN2TG96IjBNNyzWZyNBdxc8VBTHtAqy1CGPs+gZQbvGmxWiN974/pVOJ6CxbGj'
-             b'R+DmzVupCu+DeQsXwqpVW+Gu1ctTh3t3uj/zqJJHm3XcyRD4wDnxQBKxSlckwlKTyGX2Pk8FRGyz'
-             b'CGJY/SPqDFUKPnzvY/If6hBctUHik1GIpGj8tnHTeliyeCF8/Ml+hp6rQ6/LvDokk65ctZodgqtK'
-             b'hF+5A0DuaGtgHvhmW947B/UGPeOoizhDSQQ7AB25ZBPBQtFAOHkZzRdZTd1723mY+7I49+LYj6YF'
-             b'nWkOIAKi4E6PkaweFdJRDQGyeDHt9WqWDtILGX0eq5DIq+5f7TnLOwscnbneLGnjLVu2DN566y1C'
-             b'/KERpKpcK3cIPyuCZHrp33+y/yBcv34DnnrqsZTohqljNr5VxWdRkaFmfaNBE4uznhC1Q36WsOgI'
-             b'6fMNDLXhqV1PwM7HHoNz587D4UOHycpjOiWpRtPDxMQY7H4Hk9U+WLd+I2zevIk8qzBh0vi2F/Ut'
-             b'pG5EwVFeRmDRErACrRjc4HnHIokmOPWZq7WCM+V13SmriahRe53mXyfLcOlYvLg424ggI3D1jAZ5'
-             b'XivjqdmM0nawss3hR6dyzHkDPtOosWfrAxqpVib/hEUb2oBE8Z7zNG1RQjgr7ZfjT7N0McPBzMmy'
-             b'PXXJtXXGhc6C4SGbbqrBJOmeqjOFWcrwmUQ7ow2pm/rg/fdTd9SSQau3EakR1wVRrYAN/BIOqj/9'
-             b'cPc3H3/xlT9yVbOA0/0sR/ifqYTUgEvnz20avXh263ALLWS7cjEya1onqQTJFLMrPOCdTiAL6oH0'
-             b'AXqzPRN+ta7GiIYCnw4FTFaVG4RJTw9nFfKiF4pFYDH31UZJrY010ES5sLoM1pKMAqCIaDpRRVAb'
-             b'Zobk19KmewNHxKyrb75SdkIcdw4Kv3TmJqqyqh7KLRPzhLItRzSIcrS9GxRYP2q5TdAzjxVJlSH9'
-             b'e1QdP33qNJw8cRJGr16jBLFi5Qp47PGdsHT5Spi/cAntE/ESI2ILK29ssauSIls1ZAxVs2uxStoD'
-             b'j+w+3427ORzGaGTApphInj1zBnbv/hBu3RojjbWqioaUxG+cnp2Fjevugl1PPQHvvPsuQd4bjcoK'
-             b'ES4OmGyLslaLlyym990A7tC4qg7Q7B+C1uCQkIgDSRlF4QtrPRFU/zHWBUseF20NQ0diUPDF+C+K'
-             b'BQ0pmJsiQpRJQYNIxJgIEVhSCWrMhVLcVUE5YvbocmVLxx9HhCUCNCjiK1jBBRHMG8ncdp12tqma'
-             b'TUXGoqWL4Ktfexne/tFbcP7CRWi0GJrfU4QbiJ0NcrdafXDh8hV4/bUfpOv+JCxftZyltHQXqvYg'
-             b'pkxQCx+pMG4ESWTMJicqAu+pcb82TWCVjRvXpiS0kYqUs6fPwNHU0V+9cpW4VTdu3IZr1z6EvXv3'
-             b'kr3K1m1bYOOGTTDYPwh1d0YUI5TEHKyLsPtSaHbayB4yPzIWHbj+7uaM5J39ORRkVAUiKdcu6Cu5'
-             b'HM0jqchIByXPMJidTxCqgOdAjTw8nKZQohVCMtnaV0Q+d60mEdBRXd/T91ZseVTYaRBiMZ2TzvQE'
-             b'dKfGYHbiTjpwM/QMeJcTre7e9WjXOuJ0bi6s3viYrsCRFEKb8NOoZSOBm0+XKPqQ00MPtm7fBh9+'
-             b'9GFuAtRSyIEZ0ZqCCttI0s/rT3nl7PHDz46PXl02vHDRVVf3fn6Swkr7p/5rD8DZE8cf7U3ebrsB'
-             b'n/XxZMziQshLz8geTSRbIrL669evpws+k6r0aAJWweCQplghi2jyxCv5C2aDrICxTJpzMSs8R5mr'
-             b'8FmpitFcsD0Ni5uC2SDYrFVMEcGY5zJqqGPeaxQwe1uaxyyMOmfH5QrItFQk9n6AwSa6iAULVopp'
-             b'F+1DBZKYm7CKNGbEkB6G2RTkr1+7DpfTwz965TJ9hrVr1sETjz8BS5YuI18oLL0o36AaQKqayfBR'
-             b'Kj0vn5WtwMFAHUxLc1al6bWBgh9XcsAo+FVc8eIiv0pV8yeffJyC0KeUKfpafSI/BNYJoCbiiuVL'
-             b'4Yknn4CpFLgwsTZ8NgpUFn4FTN7tH2yT2C11sii26WtWSkcuTrMvXb5GdvNljLOYADap66rrWUNt'
-             b'MpzZ5c4ZnGkcBjNiJOkAGbVFO3PYmaGkDyUmx9dVidehzqARg9dTxOiJynRFkOhA/lGeNOxCqIsA'
-             b'w50/QDE1iM6It7qVj2LeyZxAIIQiLq6ffvopGqudv3gFHEpUAV/PpmcEHUsGMWx/fGoafpiS2q7U'
-             b'+azbsJbOEl7nCklQkcn6TlFD4k+W51VimllzV1Pb89kQUnSk595XNRUr9zxwL9xz330wdmc8JdGz'
-             b'cOHihXRer8K10evw2Wen4OTJz2B5KmofuP8B2LR5PQwNjbBLssqg+1jscyB7Scl40p6wOJcUO1cc'
-             b'PlMZ6Pt6uh4Ic3bUYE9gxpPHWMw+ZA8bisDOcHZW0MeRK1EUkGuWrkfwKQmlZ6KZ4ik6KGC3jw7R'
-             b'jXRdkFDOoB72fEPvNJwsYJGBnXojdSY9FE1uO2gPLYBBpFhMjcPMxC2YunUVAOW7ZD1B1ExXzGli'
-             b'9t+yPX7IYz9L7iHk4l/XEBFM783oWM5EnQygRmcvvfelK1bAksVLYezGTTljAbKigHbBAt6QF6Vx'
-             b'dHqOJm5dX37k04933vfoE3/Vm5n5+Ulq9PKFz6+joNXuh5NHDz7hcB8V27LwlWLZZ/kiEJRO7Hmq'
-             b'tj0wgmvFqpW8mFWvHVdbF2WcVxupxcy7cloBQEa2xNx6Rk0MlTNNMBqTKFFVwAtc+DdMmkf55d5I'
-             b'fgrpznYeEEMhbpQfSCPc2s9woDSeqKKSMXMzDIWokBLlx3jTHuBvw8Be510VV8iqndWQh7GW6+Sz'
-             b'lImiKNO/vXXrVkoCTXg8Jab5C+ZTYUAFSfpZU3jTK4FCBzHri7oa5sGWcqt0J8AjqyxMauog0Y6o'
-             b'IREL0hgFrL4UKNGd9b2334dTp05BKz2QJNEURYBUeG14LkaGB+DZZ56A/v4mXLo4SlbZDQqQmrOd'
-             b'2WngXcHOENGJ5NAq+yCSnKmDfJ13ilEgtOKVwcrndceQUAb1j4zExOREuyYhjlY6xomhkCXj8RKe'
-             b'oxYlqF4mPYrYre68zGBQK0o6/z1GWepCv2K0Iapzq+pDHhEJSkuLFyGtRsi7R68AYfxsDXYcphF3'
-             b'08Fjjz0I8b1P4GzqlpCjRX2iyxBoTboYTDEwvv2Td+HOnTG4PyWS2EiFjAqoVgEyhLc00svqB15I'
-             b'8ng/ajH8dEZ29iI6XMPM5BTdo8GRNmy7dzvc+8B90EFC8vXrMHr5Kpw/dyGdgYvpvfwYPtnzYerC'
-             b'NsKmjRtg0eLFTBinatxnpZVYaIC7PP6KTtFtPrv5Fig2Nwf2XWejQAW1uAykCuqg6xUgU1JSpJvD'
-             b'SQxRUbyQ1z3pRFbNwVQgDsEAAnl8X0pQ/XRdaZQeWKewO8M7RL7GQKLIWPj0tQdpPIrCyrPpdxT5'
-             b'xeSC+06kZkB7BAYGRqA1sgjC5E0Yv3IOfG+Kz628QfX8slGgSZ+6sh5OtzhmAJx3c+kI5uArycll'
-             b'l3Tev1f0c/ByN1My3bB+A3x45Qq9bxzbOhPE5QRXC3WmMo4l/11fei6OHdj/Szuf+cpfdeLPV5Ft'
-             b'LFy0+KekkFKgbFw489lOFA2tlb9kvKIcyJyNeoSt1OvCvHnDdMAwGJHMkM8zzxK15oR2HrTNK4EE'
-             b'Lgsjqiad6U+p6KwvVB5UWToUV9opu7oShJVAXvFhQnvv4M20ji2umXTsZauhFayOAWPMiUwVyCut'
-             b'/l3Jz3bG0NaDTQRYIeLaLiTkrtLpgx21WitUmwU2Ec2Xhn/1D/bTSIXtOXjshNUZtUW1uKiKGrwj'
-             b'/busPK523HHOahCRW25OpwTFnDqowKnyhEIwLTTsli5fvgS7d78HN2/eJn8fTrYxGwOKlhkm4mdS'
-             b'ghoe6qcdwFhKUKTcrCNPn60DaoGx41iTrB18oBEbXgjUicP3PD12C/obbQL3RKXne1ERMGkqXyh0'
-             b'M2GWvMBQAkmchcl+hAXnZK9Ui2uss70DqlKoGkkghQsOxArFMrU3fM/IYcIOhfT7omkv0ufo9GiS'
-             b'5r0zDlZ0vrAxdOaEW5K8jaohgsVoD8KamPye8V7sfOR+6Lw3C+ev3iBydrlLQQksHwqzu/Rv9h3Y'
-             b'D+MTY/DY449QV4pdbqUnWFUfII/VvL4n4UiC8Hq8d3OeYarWGxwVieg826X32ZFJxKKFi2HpkmWw'
-             b'Y8d2okGg4v6N1F2NXr0Chw4dSmeqDVu2bIHFS5bYfSu5i26OOl3MXkowFwUHIRP6Pz/6UqCPk10c'
-             b'xLIDi2y9o7JiqM+IPKHASEAvozzEsqBocXtwhBCmaP9C6vp4YtJzN40j6lRkTU3PUGdJ3VKjJRw5'
-             b'TFYtoiRgEJ+Znqagj7zEJkl01fRco40Mdlc4+ms20z1MidANVbBw/QiMXTkN3bGbqWNWIJs3DUSv'
-             b'1nBegUbBdPV0EqQFoS+AbN6DTbs47ohjulckdW17f3xfG7duho8//pCtdipvJOOSu4bAr1oEHbCo'
-             b'jWJQe/b4oRemJ8YHWq3W1M9z7G00Bgc/95UWjJ47vf7apXNbBoREpBmRJophrpK3t30LC2quWr2a'
-             b'1JPRJ4mFREV+RqKsLxFuapZYwxzbdXBz0T652i8OpiuRiIEWqAw3RUXtBrXfWKGg5TjCdPHAEBK1'
-             b'yVVAJWPLHnFoala9DrzIoD0b/rHu0r7NuFUq/6OL3LJCc9phRXPr5crTZUh0yFUtFFVZND+akIl0'
-             b'5V5KRTJVlFT3Hggq6NVCAGzIdRYmNHYtQbeftQAbdHwSjPdjaKH4OY0ygDkQ+zndtnwefK7RRwqZ'
-             b'5x988CEZIiKykLhL+kmc+vGgLtwsbNu2GVasWMqVY3r4UEVdRwTRTNqciYkqwVoPAT4oFXDljjJE'
-             b'oTsNUzevQP+8JVCl1wui7eZEyopBEj15vTyipQAhRZAWSpU8sLRvIqt0RxQKHM8hn6siMi6rMDjp'
-             b'IGMsqnm5b1g4ABrr4X4Makv21K2iT1JnRjrr2nQVVfQVlJtlz4M3FKOF0NrZ+Jw6ul5P3AhSUJwd'
-             b'hwfv2wFjqaOama2JC6b+RVmvS/ysfCTl9zPnztHYdedjj8LIyLwULCfpM0cRSFbvKqPV2OwtgxEM'
-             b'oaf+Rk5cmZXcHovJAZoupm5iJszy7i79LHTvXrZ0BWzbvoNGodhR4FQmqLeRKdYUBa0HU2txZtuT'
-             b'4wYn1CxpxeP/OsOxXVYQDNp5idiwpwTVtAkJ3qteFIAE0h9QNb89DAND86HZP5w+Xh+deSI+4/lI'
-             b'n6nT6RJ/rDs7Q5OG7swMja2xG0dbG/yZjXZFXRM+C3jGYrq3Ldo1ByJ+4z62O9thZ/BWg/iLeA1J'
-             b'qb9XwciyDTCVEt3M7UvQJ8ooTlRNTDDWqVI6nj8wRX8lPkPhTxYKdKkzsIQ39llUyxGJxwhWwvUC'
-             b'ujzfvHaNwFGxsIlQCTdH6vcN+9n4TCKIavTimc3nTp18dPODD78Vf87IrzF2Y/RzBlP98NmRg4/2'
-             b'psf6qz5ZkOJST2xRo/hK2NJfwAae9OtDCkArmN2QEoTrlUzpUiZelLKdN/mjTNz1c4zwtDfkGCuB'
-             b'S0wRo6CxaAaM7WRrAFrtIWimqqbRN0iLSaxUaFdWeVuwkgOv44REBDP0uurOpgpmLFW/0/RAdFIw'
-             b'wu+pmpGCTYMeOk5mHNprg5i64GyXoKMHD6VMCdumMwAhFK2zE0mfzDPTkbBysXzuwe2aOyjhnT5f'
-             b'YwVXWBek5L5oVRF1Wa4E8qt2WSj0yyBb4JakP5clrJQgvHfPAdizZy91cGiCFzIjgCutyLIt6GOD'
-             b'Y757793BDsAVv7dOh1WefRSeSKnsjYnWdgO1SGSJBFPkREUdciclqhuXaPbvsXto9NF+zPkqc1hC'
-             b'1sOjcJWq4m5Kql4lcJRegTYeFXtJoYUFgiQwoXLB0WMMoFSCpHohahGEBKx4l9mbnSJghBNgEU/Z'
-             b'uNupU8Bi/pPLD7MuyumMhAy+CdkB15QGImTF9BiKnVWgguFOCnS4h7pv+0b48JMD6e/65dhH82fr'
-             b'QW3SVFXgRDh65Tr86Ps/gqeeeQoWLl5A5GlnpYYgFoWk7M0RIGOvM7rTm8RZrLN1vY+qXZeh3w08'
-             b'LwIqwWIrQNcEndFpmqWosmVPiEVfqeoqRfcWSrK/Ktfo+RfBaVRTZ8ya+ErReBBRpy1OTkoZi85I'
-             b'3bRSrVo0lWm0B2ksF1L3XqVYieCbHlFaWHpLtSRDOlsIVMGxLsZOpERQ0q1r2bHVZFjaSYEZ91Fo'
-             b'UYPKL+TVJp5aFSFHZ0WWK33eLoOlUAQYfxZTLPqgvTDF3N4M9CZvclcLJYJRNEgd/JQknVIObAWi'
-             b'+9cgSmcFDSaojUee8lOM66S4OTTYDxvWbYAr5y9B/1Brzj5Q94lBlIhUX1Q1yutOxx3ct+eVLY89'
-             b'+Zb7OUaIjcF2/1zU1sAAnD52eJdHiCy07MX1xkWZkXvpLLiFZFFDtEBYnpJUrUsbE2XNvlM0ihHB'
-             b'2RBiZqAXcvuqYmEFvFcCccgirnJwu9RuD8PIguXQNzAPXLrRgInJc+cU1JFLUD00W8eb3wtsPEff'
-             b'G4lrMzS8gLurVMF0ZyahnppIF3GSEhdX3p6QOHTTm3IN8ND1mJxY8qujzeYyc78cVJSeQkqYdIUq'
-             b'RRAraxtpiuAuax1FC1Sqbajtu0FenaiH2/6sMJUslTEKcdpMJA6FEGe2xeUdED/4lWum7mkP7N9/'
-             b'kNB76uUTwRUz/KBvl0bBWzZvh3kL5qeDXWfeWtAtmfoOebG6zlcTYc7mKiEuKOr3o+NELBrq6fF0'
-             b'3yYISNEhp+IW8Tf6UqXL1u+16MWlczDToyBZk28UWzXguajlfhIYiPQCp8nig6wcfHEfRWkEa/3Q'
-             b'neUnosNOsFAIzTpVrfYsiYQINkU6ySNoxGFCy1J0MGMIG5cA5CQKhSqJ97o/wKCGLtNtGLt9A1Yt'
-             b'XQSrli2Fq9dvp8DWmBukQhb9JHpEZPoBCgr/+Ec/gl1PP0VGpVjhNxDs4SpVI2L1j1jQMky+zGdH'
-             b'4TnIxFx1UaKtldXuTfdNhaAzOkJ8uGS35RQhLAt4X5DxFfFnfE+Xlc3FNa0gmXJMqSre9VStptip'
-             b's69UkE67FrQvFqmuOUA7pkbfAMUWpBT0CIDSpiLGVwIYEU8zTDpY6GNxwwmG/bPQYRqdrKkLSucM'
-             b'90xMumd+FhY4XSmGsIAygqvoHOG5xHM4m16zhUhIhKcrCTy9l6ElK+FWZwpbVIOCm5Cv7IGcGMxG'
-             b'sVKx7tOU5MUkyam49lz0X+Z6Mq2IdrqIGJ7pwPoNG2D3O+8a2lqtWGo7v97k8aLC/NOf+9J1Orp/'
-             b'z66x86dd3e3Gnw1Bb7TmGBWG2V7j/GfHdvY1ZIcjLXPlC6YPjQ8qUSMRMlo6fIMjIzBv3nxWYVYo'
-             b'ZWBNMqeKCvqAhAxhVt8Xp3BOV8oVFlYCSmoEvgrd9HAMLFoJg6mSqLE1T78Aq5UeW6B7bJtl94PV'
-             b'Oop90gMr7qZeAqt6ICHajVSFqzY0B1BZegFVxbh870zcSpVMqlZmpnjkI+rDNKJqEuFMnHIDjQpQ'
-             b'k875PKKphN8UQ0ZKRhv1MJJw7uzcGeIv7+TUCC+aX1AeeYiWX8jLKwqsrqhwzYsHCkmW2mbWxp7X'
-             b'8aR0VrqPCkIzRILuO+98AAcPHqExhcJgswqJqgSo9ExM1dYgbNy0KfsIRZ+BLjF7CAXhmgUd/UUg'
-             b'fUGFrpP+WVC5F9ZL9AKDVh8xuqNhhnTFoONJlgjHv03abTlCWJELKyaUih8k0sHrzHBpIJbzdRQS'
-             b'sJB0Wako6ztW5N48TZ04f86ejJNclocylXxXOABkniEUqvuF41MhNZzhzW5O4TNHAEHIr0j0HYGx'
-             b'W7dodLT2rhVw89advHMQMrjXA2PjK0cLb7yskzNdePPNd+C555+GpYsWpm5z2qxzjH7hNABm2Lcr'
-             b'R4FBu/1gWp6ld1wwFFqwdYCT13Rx7ogJE5aLBUdTggb7e/GOxAxXY/YzIpmuivcviGCmpJeCPycV'
-             b'3hnGWNGupLSnRdV2LHKaA20ubpp9KWnIGBlHeKmLQf3ETqfHuyW5lkS/SQkKkZZdPBepsMXONtQs'
-             b'fowJisbA+Hcz6FvWR8hM7KL03mHcw4JvhrhlTSoGcFzYm9YdVY+U7vGe9DXZqQDXGD59DYujkSWr'
-             b'YOzyWUKUsmWGUwUmGye7mFcmaqTqlCktorDWndKzWf2UNBMhpqnOYMJ7oJHfUhr5oc5ko69Jz6l6'
-             b'/ZHJqqJqi2iOsaqZ8sz1y+e337x+465FS5edCz/DY6oxM1l4eqQAfvX8uQ3XLp7b0kYYq0AcHXt6'
-             b'5GSiEjFRJD6oSowwf96iVHUMEjQ4CkvOuRIE4IxT5AvhVu0ASH6k8JOxJX5QWCkrWuDlRcYMVg/9'
-             b'85dBR1BkFc38parBbgllcNBOPDRI6wx3Cl1cZhPapsFZ3vts1EWQ5oY8cDxTrvoGwfVSS70IbRc6'
-             b'NFrqzU5CZyr96sxIgOAWHqshmruivhnab4dgY6pQZ3sAM0iM1ZzKlrkomsTqn5I1caXnTIyWoEpd'
-             b'QW+ig1Ue0YlyhosFLt6BoB1191Bn7UCoDMXFv/NcAM388DO+996HcPDQEVryZjtsP4f5rl0R/ofj'
-             b'shUb1lIR06E9jYwv0vsZQBPKEM0uIeaNtpjTRYJII4QeOwWIVZ6V15LEvYqEeov/NCYlRBzvHGON'
-             b'r+F5BOimZUSNgUdm6On3KioKEDIxkWw9eozKwwevBoHyc9eUyaE9kfPS8aSANWLN3Bp8J7hPKNB5'
-             b'qJ0YHFt++zCXhBaF0xULtIDSLqjzKzyg8JqQ/mD6Cxx3KwBi4aKRlLRaMDHVZegHTgwIICIBQ0Zb'
-             b'OJarHF9vLNImUmX8wzd/Ai9+ZRcsX7IgPUdd0ayLYGKMagzqotHPQBRcXMzqBOpppPbq3CPW2XE7'
-             b'KF+yFqBINPsbU/AHpZBIR1/wFlVNnVcMTqxoeO9MbsKOqTG+DnlshufbybugM8PrgCZ5kw2xgDHF'
-             b'B7y0TeqmIk1TGMRDY2JKdj2B4nt6vnF8h90QniEESeD+CJNLt2aIOa0LkN9ISYWfb4pT01wcNXH/'
-             b'1GFAEMUnlChLMazdZr83brJ7dA/x3+DPI2AXIuoQPDQwH1ojd2D21iid71quP11jeexrRSAXVi22'
-             b'a9baRwtOdTSIBVE56/3YIAhXI/OGBuGu1avh0MFDhfRoMBBZ1uINZhUTxN1g/NaN+efOn921euu2'
-             b'/yekJuCnkhTEPAesqj64cPbUI9Pjtwf7B5pFRRg4QKgfDFV2gkZy3HIi1HbJ0kW0+qllNFIXGlBB'
-             b'7KTLRTxBiX1lmKbSnwnEnkNBt8qrIpZ7+sqC5WugObKY4Z04yw2OIdj4mo3/n633bpIrSe4EPeKl'
-             b'KK1QAApatphuDodDDpfKzmjcs1vjmt1fZ3Zf7j7AfYi13VtyOOQMhyN7pnUDDQ1UF1BVQOnMfBEX'
-             b'7v5zj6i+IwkCDVRVZr73wuVP6B6BIZEio8PuPqWK4pHG9GxG84vLlErC4QUtBx8NOiY9M4NpZga8'
-             b'mM9epx0KV2LDeRqXQDC/kmR0M+Vx4Mmx/Jlb8L7vHezAy1FV42YxUg1YfBg1KIM93+fGbyhU8Ag1'
-             b'II1Qyb8EtWxfjNbm1OyAXJeuRZw4rDp3VfXdF6ThnGJGDZBSIuI+RSFq/ss//2tJUJ/R3MLiecsV'
-             b'XyO62YhbRPAzcbckKXG5FW3Fns6gbcikbwNGpGYlFk3Hrnwzq5eflmu8urZWAQX2NRwo0gAmi83O'
-             b'NLfdd6pGbiItNKWJIZ1I/Y5mDaIxhOACo5RdeVEDb4Lemguv1DMSHM+QfAzFt1m4VSXIwQ0SCul9'
-             b'o9yRW8IdmmIUIslGY71bfCfsiQPmKtX4MMh4c2Vtg3Zfv6LFtbEYjx4e7cB+PciP4zPDKhBGCePi'
-             b'cJoxUZD9Synqzib03//nT+kf/v7vFOgyUUSXCTh3Xfj/0T5s3jtVtFj2kXadjGjRlkxvveEsRiT+'
-             b'5PQOvbBKNo8D06ccCRWFhHQ90I6oUySvCht3UDnAaBWFD0MOgwAyIo0XFiWhD4Yj5dRxYmgQtDbB'
-             b'4M7F2nojG5N4j03FAFIQ0EA3y1XmkWCfMEo0exG1pNfpaC/JjXdQk5OJvC53dlNOVuXBGi/MEzcP'
-             b'HL+4mz87OZNkx1OviQB3hirPxl0HP4ustC+8uKFMlc5KN0NpAkGDUO9PIFyzht6Q68zK/PMqQAbO'
-             b'ytYo5EbkXSocXQHYvvzm7Zsif2WDw+SLqVjJ6dhrh4ZIyq/x7OE3f9ul9H/r+fxekjqbnDazv0BP'
-             b'vvnyPw0lgIADkKBszkWncJCya2960gFUd+vSRXnTfW8W7rnaZ7QAitDYzzf28arkXavpCCVp08JS'
-             b'zbRIi+uXabi8Ia05I2mEhNhXQiU/uHyDmY8xRKWcRR1gogrYUrnoTJpbaAmss16T2Ex3FWyUJ/uQ'
-             b'BL8pfogEDjqWz8fiptxl8QM+WlyTRTlX1uxCnEsFxGrYgu7qQXyOisBTub3kFg1mUYLOGIKuHXKL'
-             b'ofVgZmijESyFrSPj4kLeMyeU8vrTkwN1jXWNv1gFbm1WD3KfjV7t+uueWwuXGUav/LdcGf72N78v'
-             b'CeoLml9YasDSwWGsIavVeQzV1oB/+GKpsjY3Lwn60/gXEZ3Jcvm3AKmUAWlhk5rkLDDfct/293Zp'
-             b'fX3dx3464lGibODumpff6FD03PXgTv1/cCC6NTS7FevKcnbDy5ySV/I+djWTvYCFuxnQWaANwfl1'
-             b'ep0TKuJOrLPZe6QzqavGp48TRBcqjNo6koQ9jYl+VtFacohvxhkMMfo0jDuIpY1NcVPmImlz/SLt'
-             b'bL9pDOyyBkkBM8BszxyhE/g+AHGclgr9f5Si5O//l7+iW9dvyMhKAAixfo5wzrwveyepRnz9ufbQ'
-             b'uGr8mWUXyGK0K6tCeG29tETOivd8nKhkyW6gHD2rqTdtuCTxKEkHNiT3megSPLGCFFasiC9oX55y'
-             b'dFHGf9JZMhLN3GtTh0Jwio6vKooGKOJkbPu5++GuWJJjVvBVFzsAoZQnJztOgG4GjOjjSQ6mNhlw'
-             b'bt5Z8X6M79Px8QHNzy8IsnR6clLO2IJ8D18PJvbyZzk9PZVuS0ZnAOoIIRikcI4D/Fbn1y7SZP+V'
-             b'7m1DNYGMGLHrWjqgkIxO56mlhokmYH+Ozjs4p7VagFqI4qnT9Zs3aGFpwa1LcjbQT695w3EHLdlX'
-             b'r9eDzz//6xJXR8P5xcn3oegDWXqb4v2gCy+ePPxxF8G+b1A0Kn/SV3dIqkKnGZ2KCoDO5GEb5CqV'
-             b'4yEit3RZc+St7rkZoyWrZFVqqPOFKD/yg6V1GfOxwZ1Vwswn8K4M8GM5UOC4zIAgChB95aA2QGve'
-             b'2evxw1Na6lE5DFNG5AjCq3eJeu4U5aCI8d9AIe0CbR7qHFe6rDnqFs3cbCaJjkdNAi3lAMK8FhkZ'
-             b'lWpIFAf4mswk6ZmauOjgYd8iAqM2Ros6atFl80AtAnj8JjNzlVYxlYxwMC7V1GtJhhnz7q5dhVBj'
-             b'WuiT5uhimzI+MotxljCZn6evv/qGfvHvvxIDxLrEx2NuiS9EJ2MbEII5QZdvbsosneH+OQJgkTQo'
-             b'LSwu+Yy/M1M8Ck2hokXcixcv6M7d23LdTfnZ9iJcUQp8vOuqDE42I05yN9jKDM91Jm8tnInopnQe'
-             b'm+S8h+TJ3LofwYnlVFGPuZJ/dXelMjtnpQusLHZGlg0U7YepQd3t+qlSBF2vQb3Ps4ryxOi2IrLq'
-             b'cl0CD++YB4HWL16iw3dvS1Abwqqe3CAwAiGZYDebozk9d2730COgTUui+unPfkl/+1c93bl9S86a'
-             b'6V3m7MpZKBqCOwYkamR0bMwjSdnYpB0tbJZik8FOUcdzA3vWM3Yj0Dg0Wx7rPN32puuwL+8U0GXG'
-             b'ilF3op0QtQioSXLpJxUC6AQAIbtTUDtsxNUn0HlhOsj3gUeBMmGeaPEpe9yudrMSuFGY9xAd5qkO'
-             b'k9R7SVD63mYyOjZkr1Jdzo4Paal0dcdM4C1JSJ4eHg0G2zNnIV+PyjnkxMYjR05snCgHNn2Kylni'
-             b'eDC3cpHO3r4p12nyPUWO7PQAaTky+eg9Np18buSgomUiAKjMkkRhAdkNV/karayuilL/9otX2u1R'
-             b'rHQKnwHGOnlA0Tw/HtCrJw9/+OLJkx/cuP/e7zOPPM+ZHpqfRwmyh2/eXN558fTDwSA2wq3Bnayr'
-             b'tmwHa/JeHg6+OKsMmlhbkxts3i/JZ/vmL1mdWV3WCIlKv3bgNtrkENbsulzd3DKtXbtTap3OZ5uu'
-             b'USWVm/43I3EY8skgiSmLgHZKjOvK4eXqhLsCtqzoIIqYe3NiDVLhKXxWxw38JHfuYkmuMaj0o6lC'
-             b'nUsVxxyIIGQ/U50YStXGS1d+P/zxh43rKj/o2hHNOBLIYRQDPXSCw2BeTdGJnMFsFQAWYKSR9ag9'
-             b'WO38cM+tXJClbD59p92vjZVzQ0QNXVVrNnRgTg30X6HV43Jonjx+Sv/0P3+qrHeXX0GB4qgNrfoH'
-             b'AifqlRsFZXsWQQ3RpOCCCwRzYcwK6LyXOj7bk9Fe18i59EgEPKJ5vfNGeBjr5RDw55ZAg7wgXSnb'
-             b'i4Q5mPUpYiuFqqifTLShVRVxszjT6zPPoKpabjuH7Hs3gQKCM509WQUP+lBk4Fg8O5Oxmcly6Viu'
-             b'a4J5lYvK1WzbE2OIDeqz9cikVhUE41qcNwcGjOdoZbMUBmKTMBS1D31ms+5aYK6YgCDMLZM1mX2D'
-             b'JloGY/7sX39ZrlWk9z64S2dnE/PjO6fGUPfP1RXaGOOBqrIGH+u55TUaLW6A34iCAVxHNWpGMQK7'
-             b'mWGAeg3uxSBWG5SA7jtBbcH8znonryeXdAO71aWxtCM2jlB9H2pcmeC0Xe6ddDXVF8oANjO4c3Zj'
-             b'XiWcSPJggI4g+bqB8yYTgr0AIHrlUgmiryQaTkzMF5QdE8ebErdYY3MMxQlO2BzLeNQ3V4rE46OS'
-             b'zMrP5uKOpwzyrrlQzTpx4Tg5Xl6nyd62UoME1Qzz51zRu8mnHsEBFEbJcFqEu6+T65Ca9Fi2mEF6'
-             b'rYelM75+4zo9ffaM5gYDBU+Ib2BXQRfVF8lR3fzZjk6OR1999tlfbVza+j3H7vNJ6mwCOfQRvdn+'
-             b'7t7b3dcXN+aBCgFCJ6LCTQYnhxq4qaPzGIcl2+cXysUWwzXsrYxPFfI575bQwNPbWTUFc/6FAEzA'
-             b'ZLNcfEbyLZfgOw0dEmanFRIsuUW8EWZ0fOOYPHdcKtgxLymnKisiqJr5OTo5VnLdTJSoSbpAhnay'
-             b'D46xvnlsZwlHxnzl+3k0ysg23SupAraMJXpdCiuSrvfuRaDOtqhMDUFXRGWHGoj4Zg7M76UZJWH8'
-             b'kVois4s46l9YUvbQxZVjzzbqpeVfXaejs0Psmfgx6RT6H3u3nq9+KLlp6yMqXpLR6O7rPfpv/+3/'
-             b'0ZFL1zk60LajEgAGgMo3ASkgyPBhXFxZdQsCsveM98CCtJsXLtDO612iBgVfPYbVG+ik3JfXJUlx'
-             b'Ip4vAY6lknp0ob1ViSUwDIW7kpzAOUsqd9Q5/d6AFeRaiNmU113GytTMGysE83eyCWCvB1W4Wgll'
-             b'FRbSIgxaIjsXClWhOgMOHVQ5Pqs6iHUlEWjG0GjPKcnUOdguDZQhWspzwABjRCniQoTArk4t5uaX'
-             b'aXW9Fxnp2ekEnUV2fUF9PrEj5aMzyFDvh0VDBJVBFPJH9Itf/ZoWlhbpCgvTlrghkkxUyeltEMuN'
-             b'2oDa2+RqTl2KkdHiskw9enRIfF9F1Ff2QiDi8r3FON5A+aIxKCi7Gci4wRVQ+FlL2LXEXKXb6s7V'
-             b'gEsd3MVD20hXCxyoKiQHdgwA4kh6rjN0JacnCsqII0GSGqlZqBo8SuT93/RYzoIo0bP6CINtOrVg'
-             b'mU716xL26LqHU11OjlNcUEuiEyPZmZB5JycnMpXgYo4RhKIZyACcWe/jMz6rw5KkTt7u6ClM1Fif'
-             b'JJ9+aQ1hwB8V565qddknbCmZ8WMywwiN0xxPUqj+V+XfL21tKWK6V4FmUxeqe91wjtbCMYfPTyzX'
-             b'4PnTR3+5uLbxf82Oj86LIO3u7xH/ev12j54+fvhhMO/20FiswwbdbqIeoVldjZY3xyrV5JDGBIZC'
-             b'Y43sM0mw5K3Cx2JT9dRgoGevDQtivqFzi2s0XlhRWwlkaN4pWSfGLXVwplmSAzLEA8CH4oxHQnMj'
-             b'OjkriYZ3UaIIoAZGXM2I9lxJarzbmZ6eufI6gQvAI0CBg4q9QS/aaKpPiLlw1q7Il+EwITTzw2zJ'
-             b'OCuKL+VqNJaxY5Hk36un6BkjnsXDSCv2CY8NJSDrgtvADcZHEbmdHnBY+e+BBBbjY6mqQ4/CohWM'
-             b'BBcK9gIRrfhwPBRm/D/90z9L5Sz+T5Sa5KHV6jqDGRrHVTIbDIfmDgSdFFC92ng3wr+Lf13ZuiwP'
-             b'a9dweUImBztkmO3t7e5LcNz97hUd7O1hFxqVC9KpJyt3tDkZSASSXjm7w6suhhM8hHL1JbPvQUKx'
-             b'8ZJaFKU65kqpctT6yi+xr5UExETg6SmKtdA64ABopO+bny12Cjg9PKDD/V3hN73dK7/K7yeHb0tA'
-             b'OpLXY3kyLpKENtENXKZH73tXRzjyuWba6TGSVQottXrw/SFIwqrMnaSzmivP9c3r5R7IDrXHpCOD'
-             b'U9Q5hY6/9mf/+m+09+6dnIXOrNmpSazO3lSl7ghR1pxCIzfE+9Ohw9K5khbAEQNM+h6j4Fp8ZLfY'
-             b'UP1A/gcecw1qBaEBMQGEkdWry4jPyfaUofJ+zMVYduu50i+iIwrNaDGe83WT4jlWBzceVbKKTcA0'
-             b'h69LkhXDTLqsjs+hkLjPZCpjwAROzsMhDFmkzaluDBK3SqHNiGoZ2YOewntz62Anol6vhaOooSAG'
-             b'qY0Jd3bzNGA+FSQru9yAsVyHMzQK8zp+jrHGaEIiciPXyjyrkwNLaOVC8tTq8sXLtDA/79B7nwC4'
-             b'88Csuba6z+bXHPJI/9GDH/Wnp50U7l3nvwY3776n6POFRfrVT3/6IfOCupU1ZFsQ3SDXr64mMycP'
-             b'GhKK/7x15Vq1O7dqLdQMmnLrhGrKupaHQuXhRX1Aonk+c2fEc0te1jPJr7fA0wsvQZb9rFgg3Qwn'
-             b'pYnaopdkJAvOvtpuSDUCaQ7RwRor5JOlfM64g2LFbn6wuBUfqOaYfRZJRsEWtgqdTILeg9V4bIKR'
-             b'VZHGik9ugI3rYMv4ynuJDs8MrgeXAYE2Pp1UYLMJIOUceKdI6J1X/TZqFTg8g0SEUBgdzadjDNOG'
-             b'q5pyEriCIo94ZMHV87/+/BeiVr24MA90ZocFcpJd29rKIl27con2S5GjdtPxnG8XFxSjUafVopxM'
-             b'qGqbgyp03a5dvUxLSwuyl4rmjhyM2aVW3V3uyuu81WRR3vP+61d0XAL5ejkU3PmK2WBWMASrOvTl'
-             b'GRjIONcIrAmGjc6UBnkgmT42+DjoBRuRTFOOkK4dq1azbA+pQWCmHsXP1E08PXmQJjD++tPjI+nY'
-             b'mVPC+zQOPur+F9yvr4NSBd/H+dI1sugzj3oGo3n1jQJkw4jjlUvUSQfEv6vtu37eHkAZ2z/JuUYA'
-             b'mysJ8IP7N2h+FOmrB08FaGBB3HZpglIsyeS0dGRsC/KP//hfaCxjqdl5XzgDHaNgTJlcfDZipxFZ'
-             b'EYSRbUnPmkD8hx2SKZb7ve6YBaAUOx+/Z9PaE3X7iRdqMkKLqmMpXXCnRHaLNz2UHvj8C6goGYE9'
-             b'NKCSUC1Xco1RoZFDs/FqNv5h6lWlBgjdyemxIz+Z8CsFORNsy+sKeXw2U7PHge6seD89LAlFRpn8'
-             b'nAnEvXRS4znpxLmYk30u013E5qPEKp4IiZrFTApJ/n6JX1w4M+qQd+rltVg9/aCckZGhHgGIMdUV'
-             b'h9PadMsK7OAMF8TwqA7SsUECBgJQrfw3ki3HWjbk3NjcpOdPngERnhDXolvYaLcS/azxneFp1ncv'
-             b'nr3/8tmTK2vr68/6xrpj8Mff/Vb+wBfl6bfffDRmcpnDNqF4C9n8c+KNmHswB2BufkEcXvni5AYr'
-             b'IXBwMz7PfeOFHtxrJLucj0q88Ok3DxKFVGcaz6/IDHvCHRQsNkKrzw8YtkiA9ypZJNVLmqnUSEoO'
-             b'weaHiv88LDeR22oPPnwj5aHRQNlPpr67sHGl+BJl/Tzp7My9qBymaVWt3Nze/MQqtJYSxn9Gcib3'
-             b'nFLibfCKP6Aj1Z3ATDsgcEpkLj7r9T1bJdThmrgSgwb3JO6aSHQpuFpHbIVsTfUDQZwFYz/55BP6'
-             b'6suvaJ65GwAHdCEDzKIh8t6dW3R4eCTXeRBH9WeBUR5RpPDBDbSiQQqQVVNT48Z9dW2d7pSf9eln'
-             b'X9IYHZF3IBbky3vbf/uudFN7dHFzXe7T2dEBbZeEtHbxEi0urwjfSAcBCqaY8v0S0vYALrWCmXVF'
-             b'+B76ipUNnZzkbPqGzi9rrBsIoyjuVvS+9MJjEegzVYa6qXYLMGh2VrqlAzo+PpSdQoBit4mzZhg8'
-             b'mlOroLUkuk7p5GhCR4fvKOwGQaaNxgvyeXkyMJIuFXpqSFDqazSQ5/ht6ThPDnXfYT5oMTcusVy5'
-             b'A5F2784NQZc9f7ZdAttcdQPIutOYspdWeY13e4f003/6Gf3DP/y9c+iiOwlEhSe7qkCkxtsRhW+p'
-             b'uhPUGkTctfPRa4QFClu+KD9NrVGGsoeE9JR4GZVAzKCvvocunO4pOTGLmkOO52gZkujE28sAHDMv'
-             b'lEKoXYgAkFL2vXNA7HLJtph9bOjCLCbETNXqhX2iAtoYnmgk8MC4M+hsn1++hdUjTk9OhabA3zo5'
-             b'1XGeKFeIhh9PB441jomC+inNcVKa6a6Tx4SM5ByW7oX37OPye38yleeBUccd7/Smx3CrMNWfKnbT'
-             b'mf2QiUnZyDpk514aSEcKWYxdU6hcNl+M8/RqbkjXrl2np4+eoOjyaOTKE+73Z5ZJQd0Bjg7err5+'
-             b'tf3hpWs3n+WzBnX+gx/+ULuM1A93X393N7iKW8C8Xi9un6tpWDVlKw9v+eDr66u0sKBKvRlTkM66'
-             b'EGp0+XK10o65UV6gSkx1k2Z8Awd15jVld9rtXBdMvVxKb8eseA7I5b2MR/PSDQl3oRzifjLDEnsm'
-             b'hDod4+j4LhqDXn3AZY+gHi+KpuJxokLXT/Vrk7pjVlWM5Hyn0M7cGyiuiaZGjJX0PJqmHvleJ+o9'
-             b'cBUM4wpNe51Xi+VENjFMEG9lCa7yPfDX026y789pH2Yyr/uumnPbmrALLjQbMa548uQx/epXv9H9'
-             b'WzBFbASjqICRrUubtHVxkz59s4uqm1zipaIx9T7v7nxHc+XhXV7ewM6t7nkidpyXty7R559/pmoR'
-             b'OUBForFwAXT32bMXtLmxpt2sBLAJ7Tx/TkdL72htc6Mc5gXhvxHGWjJyiVMa5KGDdhhm3Im8Vaw2'
-             b'4bGSznVlDpX8hghpUHv+CTyK4XvC1b9xOwIUM6LBs0Wz7ZSO370ryXxf3qvssaDeEhrHUQUxVKNC'
-             b'05dxsAQgxAx0OiqV9NHBfqm6B+VsLNHC0nLpspZlH9e7fU6Skfzz5y+kWxxSddk140RDUY4GRpCe'
-             b'0Ucf3JP7+PLlDtBt1hEmB+iwod+z56/o17/6Lf3VX/2EzvpTW8Wfs3nJhsCgztGPxgV2/y4gw7R7'
-             b'7OQMDpBoJEHxxEMSk94z64j4x3IhGTvr2HTakWBfzr90H6l7L2VLm2VJ77QMDWea6LoQ3fYl5ESh'
-             b'8TWw2Fd5rZXg6qLIWr7qVATajZIQpZPpxbyQiyUhH/fKO+OErI7VA3kdxibxPpwTlLozaJKVCDXV'
-             b'Pc8MwAsed8r+qpxZFhZgzckZBAx44tIx2ph5XJNDVUWPwa1OQmM+a3sj63RMeQ7OkIhzAOQb4M2k'
-             b'UB30gslEuZdXr241osa2BugrKMXfgblvZ+U7lmf22bPHP3nvR3/236cG6OMktbezI9n9+PBw82h/'
-             b'93IEKzv4UpfOoTIyILYRcFq+4RvrF7UNZY5Qygj+wclh6ixqPaRm15Dy96w7YiNgWpXBu1JpxPkl'
-             b'SXxKBA1eAZhRlwVJEh2pA2mrOfhqRaVL5TH7uvAHZzQJwBRmdjfrK3yxKjsoWS5Fgiw9xpKQbU+u'
-             b'HBwczGwJoM+2uyCXJZIuTDzwYARiy2EslxPQYymZT9EAcFUNxB1M/qJmyaqabuO3UI3q5BLn4Mg2'
-             b'1Qir5EZTPtb5tRE4FaLP5nT/9vNfyGuLjEv5KQOoUmhe7sUq+r3S+WSMmAzEkpoDm3CgueI7Ojqi'
-             b'3Vcv6fTwkOYXlvUAtsoSR+VwcjECXTSKGCd4dkDFVirv12/2xN11bX1Z3YnFQyvR8cEenR4f0PLa'
-             b'hgA1RIcv6fWJ0pBMXLtHRGBpAqRkM7qOsUJkic4ZPRpYyOCziohL59RUgiUAfgbK6x0cvKXDvTdq'
-             b'N2+j4hyqy16qyg22+7XRdzSvI9ewrMVcNMuakiSP3u7S0bt9Gi8s0fzSqu9z+fnmQuzR44c0GPMS'
-             b'X1VIYrbPComu8n/z5X6OBtod8jTh/ffv0qQ8+7vlOjPgpjd3XhsT9kmASJ9+9kW5Dyvl6+8pkALg'
-             b'Hwn6UdFvepU04OtLNG65DdJSFP2TdqcJhZdwAxnK3fdw6p1qkQsLF9ltQUuOUOS5/1eq+9GI50zs'
-             b'23vIWhkbPjTecLa3Y2oJpcZ4NLrxoY3ng+90exT1plPaoQjP7jPHcSSKSHfSayzCAiOxcWEllC6O'
-             b'hN/ooJgQcZ6mztHkKRWP9ZgCY5MIjgfcOfHukqdZ07Opx1juUkXYuSSpKVVQV7BGIyIumy6iDb3P'
-             b'cZRyBRlRRcH6s+4CBBXazjzTCxcuKBE5mf/UecNCi5mhwTRwUcHP4POnj388XliQwslO1uDyjVsU'
-             b'x3P0xe9+de/o3d7aYhdB9kwwhKkIMCMN5sYPiYPZ6sa6ys30Z175OTlMcLGVLOmixBgLJYMBf0/m'
-             b'hw8sByy2WmZF80ky8c2aDmJoBSX14WQUTQLEm5MRJyp+D6Cn6qjgdOoPk8CUMWNm3xaGP7ollezG'
-             b'TEENQru2w0DLnhoLa22Ge4KuqiKIZslnuSnVBaR0HUkTrFR//CAiqIrSRT+FkscUVhG9BOTpTDkY'
-             b'XIFxxcks9whUZEZnIjwN25nkrmH9AxWYqtVJNdLUe/rLX/6a9vcPZFFvcOLqLKKJ+Q6T9tg5tD8T'
-             b'fTIy1M95HXVdEPelk9p7RxfXVulof4+O376TatLkfmSXllWVYWV1ifbfHWuitREq9hp8n4LoNRJ9'
-             b'++w5/WjtfUjyqMtwgPrE251tOj46LM/kpnQZMgLMtiNJGElVZQxnpkvLDJNJJHS+r7NQFfxDoyZt'
-             b'6tGubAEjSwYeHezv08HbfenABbzRocN0hfpcCyLchARrCXMBtoTv4uIOfKg6a8GKs/J8s0zX6bEq'
-             b'FuhOdUDbr9+Ue/kOvlLgQ5klRXKBJrGDcEUC9NsflsTzxZff0F65d0yxyI1VBt8LCUClqPjFL39D'
-             b'G+X8b6yv0tnJqfydPusI2A0Jusqg9a52IEjCqKovZtKnpowz90VSc8HkCTsZNwrJyLopc6DtBS2Y'
-             b'fezci0zaEF11xH41NsUBKAbghybIo2WAP+qtQ2GcDUwWquq7IeeAcFSUYfAxYXavOwI4BfscXIcs'
-             b'Wp/B7dd5ByUq6Wcnslvme88Qd+mWGTQhKjl1z84FIMcv6ba5ExM6SqZRKfBPQ+fUF56IdeiYWjf0'
-             b'1FgFNdpc1dkFG+K+lhXg0bbajJofllaWaWF5sRQ5u7JGytn89wwR1aBpc80X4/Lo7Dx7/PHbVy/H'
-             b'DHJMNtl48uABvXz4gJ4+fHBvOjkJ5AdaOyrlPEQjTlQ4rrn1lre/sbGhqDuqek8ByI4Ybd8R5bC2'
-             b'fi+pcQ0NZK68UPhGlzIcz1Ejj6pJrQPaKGCPFbAUDoqwE1tvVsVmRje8aNShtcIgJRGy9XiOvg+b'
-             b'CRBD0YgJ77+S5nOV4ZbEqlVbxAxX6AhJorJ2UYYOi9RA8aF24ND5LGjBCPRZBHSdoA1nbq68aOXP'
-             b'zL8Pgi5fpbNiMrLspaLP/7miDSCZetUasmupGZovmABs1ODE3LEvv3pADx4+lk5nlpMfw+xGj6VK'
-             b'KsFo6/KmVK2mUdYZ2AGRPOVWszjS9vZrOjvT9xpxj/j6hV5VGKzLuHzpIhxrsxtNVtNF8Ka6Ie3s'
-             b'7tN3O29caNRFc0kFK5nTsrv9siTFfYq9Xm/naUQT4baRR6jIO7NuMIQXbFVSbmWOq/aio53EaiTR'
-             b'ycE7ev3iJb3d/U6eN/n7bli1OQxhhfute4kEPlIjMWuSWf4K51VbTNGfEOTk9HeKOhsKMEBf4/Hj'
-             b'ZyrNBZSh7tNYrTtAASUQa3SurS5jHIeIUQqr+WFH79+/Xa5nJ0VPO4ZUDdkoyX86SfRvP/ul6NmZ'
-             b'VYm1SsZdCug4dayHz1O6CDZhZO4V6352AmgiD2icOGRXJYosmnwiFB5sbCLITldcSI6yHIrrLRBo'
-             b'nNCG6sMkBFtWlIEOqaJAM/6uw5g8q06jrC4ygFcKODHUI8eHGdMfPGT3OEeVTxlC/J7IMLnorhTL'
-             b'EEaQsfUgqr+S4l0EEMKczqkQd0fyXmQsCNUcBZYq75PPMZ/F8eKCFLb97FT2neIIDT1WIT0DlCUY'
-             b'A743UcV3qzJidv3IjJGLjOLAR0t1TkON7Crg5aGitst94pjATuHiYp2owbdml8yqo8Nge57yWTs6'
-             b'2Nu5MUv5yurlK7S6eVF+xWFpy6i0jNvbLz/oZHxi2nlVMLRBeno1rqx1lssZ0Xp5QwrH1Urexla+'
-             b'aLYZbh7oXXCbRKtOUNFUDKtWmowyY6a3Q7prsGWEV5d15xFzdnV2vggi6xNNbBI2IcOhC1b6AW9c'
-             b'N+X7Yh2tBDDY3dq+yfgJtg+8fOWDJw8RI204+Bpr3vgH2QpngzUn3XlRgDTMQFE+dtBSclVwh98a'
-             b'uknGFezsGSVhiQlfr6MRHf+Uvxsa6ivXDIvPWHkjDVSYSXil43z1aod+8+vf6agU+yU3LCPl/jD6'
-             b'64MSuKIcDBXXXF5ZkodLXivWsZR5B3HgOikB4vHzF8qnCjbbbkYKkJG5cGFDVKQ18eAzmDCmHCxU'
-             b'uuUvvnr4pPzc3hnzFiB4X8KfgUeVB/tvaOflMxm5SVdj4IQm6GfKlZsHxFtGlWcOxqF6ziPYwyMJ'
-             b'NupnpYp9XZLim1fPS+V7IEdHoNvMoemiOVOYb4ITs7VemKnVjYwQZ07foGY/FkxxvBGaxZzGJxYK'
-             b'peZxjqpvPH7ynN68eSeAgxCasaU9kyBfj0YDWlwYe5KWxMkFWymeFsvZ/uC9ew65zi51FRwMxEGU'
-             b'OW6ffPIZjeYWqqKDacaZSK75lkkSzLJ/6MGx08BczsKwk4SSZEIxA32EO6GpJEsReGXSKinPqFU8'
-             b'EH1RC6pig9B7/OIpxJANAzkxwvE2gBBMGP/ZexYuoVMYqrKHjP65gxElGFOjUHRo/Z9q8mdJITZF'
-             b'+bn9fEShzgAfRlTz2Ra1nlIwzi+o6C8XOVHRyHzGMgAqYl0vjf+ZjgkZ0cd81wx9eezVxY15MCdE'
-             b'XyOnWEDPzdmzJsEIzxLbG3PWYM6+bn4YvOOv+yXEC0yHLl26XJ6hxmm6h8Ib4KsWB8zehROk2Juc'
-             b'HC/vbr+6wiNsnrzwr7h1eYuubG3Rybu37wnHAl1UsH1LAL/G2jzoL3FQ4Zno4uJiqcRWZIbNkicq'
-             b'YxTJWV+Q+c+O4c/wX8kNHr8lpzdC8qXT6cqD3+dq62HBKxhPwTTIvOJPrgxNEJuUaqW6Dyl6kEEf'
-             b'k2NWhqvMalR//tkzuCipMfCivjpbChRbHV5nZmSX9OhMAaGUJKY/WNUQYVceMGa07a3siYAiMg6G'
-             b'm471CmoI6Mw4qfGhkypVZvhTqcSGI1MvxwpXtPIgV5TTOdK0yWgJn6YE+5/96y/o5OSMvVswbmsq'
-             b'Jk5I5ee/f/8uLS3Mq58Q0JvMsVlcmiuff6LEbgOF5NrOM2Dl6avv6NXOriz71fASnykqf4ID49y4'
-             b'o+vXLuvcHRpyBkis9tZq3/D28Iy+/vYprLqzz+n1ceqBtMri9XSwv007L57Qm5JITg4P3AfH0Y1w'
-             b'AJblraGZKDv9gKhHwqyACEZXHr7dp+0Xz8qvkjCP30lAFSCKC3f2qiiSrVYNjYxRqFJS6CalcwgY'
-             b'b8WuERkObnPgFhjmL5ar5YW6/ZYE9fQ5ffn1Q6FUNLA6TDYVzq8oxJ5W15dpNAagyDtt5VWx8vzm'
-             b'xjK9/94tXBtbeWQkAr1esSSzT774kp6/fElzpeAV5wGAX4K1rtGsaVRgeDY7k20CF13iis3JjTmI'
-             b'PFmAZJpoMoKsL460pNB0NhTUcXlPJkHNY+1+2tfzBOFofv51bzkT1CpPHyhqd5isqMzQDUwa51yU'
-             b'mceEQpSdNSPlHskKSTHXnXoU9+FUw3luLEQaYrG7HVP1ucuOHp0J+EGtgziBHcl5VssUPdM8IeLv'
-             b'ZcV2Rfvyc3aGMSoer2RQfebXjVH4JingO9dtDLJvjrnxBkPMNp+yRBUuHlt9Rluvmto91c/Kot6c'
-             b'VxSkBH3F1LsotiU5LfyiS0rx++rPzsKrVy8/Gi2ulGS9KL8Gv//VL/lhDuWwXRsLmq1ZBjdaSJYt'
-             b'jZFtJoQLJWiNRYVX9xKpUT1ulVaiK33riEmgmkbtsH+D06wEJ6keRo4yDLCyzpj/xhDPVeJGGzeP'
-             b'ISiHuUEbk+kUqWYWxrYwr1ylhAsuoAwQIP0aCOKv8mbMBJBbbtkbicvojMyl3Q3rADCxltjY9Eo2'
-             b'jKpc0XWunu53MkcoalerDgtGuqCcKJHPDhrMxzochL4EAYKtie9FrZcCi5ofsvFojv7lX35O29/t'
-             b'lC5mXhNGrtwJGTeWz3f18qVSzFxCR6IcKEFAlj9fvLBZqva38mAPgo2JTcxWKzt+D19+81g4abyf'
-             b'Mt8Y87zie8oV7lZ5jWcvt0vQn1UXXiQoUXbIgPGXw/fkxQ5dWF+hrc3VEtw0+JhUiz+1MWJfOaOT'
-             b'g7d0LCCDOZpbWKIh65yN1cGXq1arbsk04AzZJyNYHUOxEeAJ27Scncgv43V1AGGIEgU6rwT5Jwdb'
-             b'5OinOzhbLcuO7pjt1E+P5JwwBJn3SNw9iIUG5LNCM/BzaRkUPfwiJ8cnpWN9Tk8ZmcfoxagAGoFM'
-             b'2F7PSJR4ri5vXpDOK6fmsFb6uXB1rl5cp6PDK/Tw8Yvynuawc9LAzmCACIWRn//bf9CF//2/yLhH'
-             b'9TTrbtqW7qLGQarEMOxXEb8hDu1CuWajUc+Q+dHlrHYZYi7pxNPUuEyj25upeoUQvAFA4l3NqNxz'
-             b'DqJifMg6itkQbZFcpyRUKsds1kNLMyGBqXqJqEfwfewi1h8AXoXoe1JdXRgQghysoao90U0YDXGn'
-             b'ogYQP8BUyny3DKgRrHvhiytWQb2rvquoz0zGp2L6mhWQwMXK6VHyWGfgid52bC603MDkfG0dqzuy'
-             b'mc1al28wv6x2M9QUZhcvbpYEM9aCUEa38ZxPGjW7a4ehSPzo6eXTR3+SSnc5OVbbjsF7H/0pkwrX'
-             b'3u2+vjmAGZ3Gsegaa1LVGtzSYHTCgCYhYXJVz1BI9z9CcGrNs8xOQBNdX1EyXcDhwcYpR5flYF08'
-             b'gZq7GWByEVKV6UoOgCAjzaoomVQX+OS+SeB/k0MfjW2avPXNja53goiuegbNVFw3par5BvSHIJF6'
-             b'CCxi0WvlZkh1DBHgRuzsn6TERPnZQc3MpMV2BW/ylh2ZqvpxwJ2XR24ZdssBRNkBYT6PDkKtA5RD'
-             b'5R0DlD1kDzWapwffPKJP2XqDq+6cmoOveyJGIK0tL9Kf/OADVNMB7qoQ7y1V5eXNDRkvnU2Tq9W7'
-             b'jw2qJlkGl/f72RcP6aP37tGlC2s6Mu0rV4vn7qwGcvPGdfrss28wqq376QyocQLKtC///uXDx7S6'
-             b'/BHNjwZuLRPdCTI0jsnGpg88UhBCLQcmHv8w0oq7PQaoiJ8YG+2FKhnExHAer/L70y5PVbYHXayA'
-             b'ij65g7JZywd0RaYCEBpXXd25Dujd4WFJKtv09uCwFB46uuUugQP94tyI1ldXpBBkybGhQMXryCZE'
-             b'Xe6/OzotRcIuvdzeLvdARUYdTRt05CQA1phdRJeD3OrKUikw1qVTgDcJdPDSOX1dLiju3bpOR0dn'
-             b'9N3OviSJAEJ5cBHSTpChP/+3f6f/9X/7z6JOoZMOgKZAXyB8T8/+TCwpFkbY0wC1iu4+AEBgCiFm'
-             b'Eqpj8qmvHMTTC6ov1XstyYgrY4zO8UnteFQJwtwHjLzLfaWMG92KxBKJ7kb5SHXRlCoChKENeTir'
-             b'2okmPMjve9Apkg9FhglVazGQYJhag35ui4dWWL7V8Q/Jn2vl3k0h/9DKkQ2QGFPjlh3FPSIHS7QJ'
-             b'MaQj14TIjblKrkApG/cnHy33jmANKXgndQ7cU57j5cWl8mtZVHy0CJ0AJR0VXIYCyl8DzdBoGEuS'
-             b'evzxu/19LRDEf4urktl0fXJ8tDkUDL/NFRtYIubi7JEiS/KugkdXVlariytaSIq2ELbd1nnbDpMu'
-             b'yQ28wzxlnDcpciNjT2Y9xGxdq88u6QzVamdw3egw7GSWC6EuUWdZxwMxUwVoAASSEHFC3yzGoy4p'
-             b'xVoC1V5ClZUhAmpsxQx+RXTvIUXtibhthO4YyJbyd1jWigo0AoeMbBqyr3vwdKFB4mXnn8rPmM1c'
-             b'sT7AzJCXrvKzUoITRcaYL2GiNBRRy1/+x384mIRHdV0ffQ4t0NDyMz/68H55HU5IyaGm7fiQzRCZ'
-             b'M/XNo2eCqKzeUtF0r+DS2dFZ+dx/+PJLunH1Ct28tiXIMn6ok1lGlD9fL90Uw59fbr8WGxbzuUq2'
-             b'dGUEE6lf19HpKX3xzVP6s4/vS2FiiCnlmvUNb6sa6llBQBAJFn7fqSk+BH9WrIMLjf5bjFbINIrL'
-             b'3tEHE31w/owLwHYQ5Y2dAAYYNv/Fg0f0YnvHybeSdNhEjgEJp2d0cHRE22/25AjxWJUTF+8wpVCD'
-             b'0CqTiNnCwUAJQVT5zRoeCg+thQa6eH7/t29el/s7zX3VDPR9VXLtStWkm9H7927S4dGJ6HMKSMXr'
-             b'Q702LEb8+PFT+uMfPqM/+7MflaR2AlJsCZ3DMegeOCuluOlLtTxk3zoKjYRkhrW6OceeV3IUXiDG'
-             b'ouJsC3DFDCR8Byb1M5dR0sJCFVv4urNe5GyiXCObCHVqx6yJUPhWugdSWLxyrawbyHZOeUeGnbL0'
-             b'kuXPUx4Fdip+HIAk7JzCkb1jyNSO2BS5nN1vLGkAN+HfoAkm5PqMSQCLRrgN5zpJOrc20XE7xTpi'
-             b'DDaGTQk7/OivFWCzY3VxdGqTgh6CqQc1Dr9kQthwqlB3gzmRynv44CGQkuVadEBTN0W/bNBTu8Mm'
-             b'erf3+t7q+oX50Xh0Itf6qy8+o4fffL1VAug4U3AvHSXOQrHcZ5XJrQUIen6rjAyyi8lvsUsNnLVy'
-             b'cYKZvdnOBVwNYZlDO40ghmpOLoQ2WboDyLsoCVAVGIJndjUUjF2oNgw+ZsFSHLp1wWTnbf+DEYLs'
-             b'dXivMusxbwe02XhMIN8pF0NvWgep+WBmgTMdCWbsNiISmhkragXXK2+CiXe9AjxMDknsPzAeo0jV'
-             b'1RKHVaC6sgcAhFXk+acycpR5TkCXlM5oUgJA9nY8YizFFaY+yLxQ/9V//Jp2d3d1fIJdno9rGSFU'
-             b'Kt27t2/Q+tqyKDBTq71nsiZZ0VFXty7SPO82+t6bv9COGpErOEkzG//xsxf0q08+pa+/fUZ7Byc0'
-             b'YUFWCNzy57h/944QxPnn9bDaMDfnFCqIh8c2O2/e0qOnL2k4N1evZ4jO2cI8GUvhWLnvkLeSMQP7'
-             b'+pQibSj+PlEIpEIH6JQNL3I6oatGdm70iGvmcOaAA5isL8f5GbjW2nEJkL/59At6/PKVdnFsa4DA'
-             b'q7qGuhxnsA+7xBLLdpXL+u74jN7sH9Dr3Xfl1z693n9Hh6XQUIuODsoVdTyqXmD18g8g48SoqyuX'
-             b'NmlzY1UtyKli/X0PlxuSMc4nA2fu37mO8XXfCMpWUAePlhiA82bnTXkexnof5LP1jtqTe8E77cmx'
-             b'ntWo9zQHA6R0utt2dZtYeX0gjPP5ETRh3ztKj2I1DVXfr867BE1WqjTDfCIGC1lRK+eI39toCJIv'
-             b'dr0AL9ieVwa47bgev0egfG0UOYhKDZmxbJPMiWdS+EYDGaSqBEjYe8OgD/uazj2nrEsLIVS1eCNE'
-             b'26gu1+dPO9eZc7WkLxagVlXu6zFZ8p/fgtXc7cHMJ03HNeM2VGUUR9W6nQc6T3zbhYsXZJLRwflA'
-             b'AUC1k7PiTs5gZzFuQMcHB5e/+eKLK8+fPKXnj5/Q4NHjb2lv5/WNAOMuAlomQClBcgf13kHQYIjF'
-             b'ur4TVkXu+1QdzU3uAgiOAVZqroHWNLC5mWlaReNayqy6Dba4f694PIHrM505ekiDUMCi1FAjsAAQ'
-             b'WGlXbdBN4sNkW6AArOspqy6AnjPLhqzAht6QdKk3Dc1q4ZAUumpdUzJo8UBlXTrR7eoB8AKpMHZo'
-             b'/em8RXzuwaUKrh4vqKOQHEej8GUdRepuTJfD/B5Y8VoAHdGMx9BtRn1drsgfPHhAX3z5tTiLumRi'
-             b'qDwgfs9bm+tSbbPPjao094469B4jahGxMD+i+/du0yeffa18tlBn344KTTorF0uPUlnznvvx85f0'
-             b'5Plz+RxajUa3sGeOlY9re5PREhkI7EHILQ8eP3tJS4vzdP3KVkl4Jx48LOC2BMIIx2EDeDhyuOEw'
-             b'ETouc9nVBXW1zDY/IEWEge9ncjGmqmEyQbBLHg3nSkLdp08+/5KOTiali1ygao+LvUSoNsuWEGWm'
-             b'gylfJ8UYSPUh+jipqxRLo+VRu2iQ3Y7QFs5oc32ZPhQwxIRC618csk84vEnMtdjkPc/1rQu0t79P'
-             b'z6BIUXcx2onyvZiU5/znP/93+q//9R8dmJBD3YfylIaLvenJMc0t85h83BCcMRGIjXdXqFhpI5uK'
-             b'e4MhJgF04iSkdjUgwfcJIrMKceeimAtDVpI5FUPUzgE+XChMJhNF0RmQKus42kwcJZZ0qgfaNa+r'
-             b'zuPJA3YPQ0KbEPWS1Bsr9di5roFqTmIfHZWlFhpDUvvrHjt0V4RweyPbqyfXSlEaCIonCAFkTwy5'
-             b'KnS4swKgHqmiDjMmBaY0c049zDmZGQVpcH+XbHYq5W82NjY9NQpauMN4FapBKURPcDl3UPJnf62D'
-             b'xfKQ3Lv54ccPcynC4j/+H/8nXbtx7SLbn0t1hC4pNJwuk88QpFqfmqo4lsCw5EoGIeSGqR9cZLNl'
-             b'2+T25/quJHs1WhFopi2GnZS5rZpqdahr5F7sCXpXAkgQ+lQhN0XghWxVLrhUmFeLojpXY7MeyDyt'
-             b'POxBsuuQZDeliKPzZgradXSyv5l59yQBV5LRmcq6zOqDbZV4wpycUq5PADhWEURe7kxnaepL5WGs'
-             b'mmZmlKhS/sbZSCI2aW15doaDIiq5Uzg+PhXSLj9UMr5N6dwik6/l3GhAH9y/pbDoGCsSM6TaCWPM'
-             b'I4lxxlJJF+j9926jE9UxR2gq+woVCO5bxNJLrBwwS1GcYI9Oezo8mZZfk5LEMtk7i8YxCqoGKbVm'
-             b'UM5cKIGFLbS/eviIHjx+6mLAvd2r3HDcct2BNYpl8ph0QBsGdFfc4dvUW/aDCd17DE6FMD6fJTLb'
-             b'pwYcwiQ8mE72q09f7dCv//C5dI0MtTdB5mS60FHd4k05Lpl4bdbOX1TLo/oPJCib9AAw9I3cTZVo'
-             b'DGCGYJxbEhTfox/9yfsqz5VsT5wa9f7sZGIDJSTzdyO2kTgu3dRNWmXzSxm9ZTdpDKCtcEHzavsV'
-             b'ffb5F6UbXoKmT5V8ygleY4wILnGnMy08AwYZHcDXMufvn8OYqYq4KUJSDQdF9mzWe4yJouAPTk4y'
-             b'hXageTEJ4c6HwU9ZbQdcfFVG3l3nckkyuSBdCRgvlcxcFET6AUaQpjQTc4XDZQgNqBCxigWImy9Q'
-             b'x4Rntk0eLtDUiE1nB1sYqAqCujZ7CVXNRiJ/K+pt6Lpcfc1isOVqpOAlICyXQCNIDarP1zVBjSNt'
-             b'ldOZdkNK4qRthX61GQIC2t2os7pleEHJO8IZPXv41Z1XX39OT8qvuPv0Kb159epqZzpTuY4syLlO'
-             b'ugy0eaUYl7Gw7NyYlpaXfbTVAidsLJpRKUQngoWm0wMr3FtJwh4BWRwEReMX4akSfoM2TwGaW8Eh'
-             b'yFokRxyc1Bie4YFpZvTRGO9oeQMeLJv3u3aVvP8EPa6qBOw7thjRGakWF2EXJCRc9jTqp1AYAHkP'
-             b'n9MQjxV23mu3FHWOLgRDRiQN1MhOdc7Ue4dn3wOYosleCo8nz+l5jOJK9TbRl4TQSefxm998ImKt'
-             b'gngyh1OjCIh9w5TeKwlqcXFB9gOmO1iprHQOl2P7C0ZP3bm2RR9/cFcKHuZxyIjRRwIVcu28UaDA'
-             b'TBXCVPV9cZ3hmwUtsIBgpGuZrrHHDuKa9dW3z+izrx6J0McAnBuCWkH00Q/0w5oixJMOZKlkTAyQ'
-             b'hoybU3ZTRGqEgQnBpDNr7sZSnfdHjFA9K9/3hy++pD+UoN2NBioc6mO1OnXIMPecye5Fl9XfJ7/P'
-             b'8PR5h5iye7+lYD1oRYWKgOhMYdP3bt2gH374gYxfMnaiuSpGV11OkKjVzr05t81y+/77d6Qwi5Ao'
-             b'sz1hwsSDO+Xf/vZ39PrNjvLoSO0iAhZmCaoibEnCWoq1IgTtwHfYIJPm1m4DxGuPMQBkhdh0hkYM'
-             b'7r2g42Kqg0qLJCaQ4RMAPv1sBnHV0Ehf9jL21h1tT13DiwrUAKKk09BJywycwezcOHLbEEsWuque'
-             b'Smzg8b+sEUz+yfhyKBIygGyC2MP4OkAiznUDc/TVgPKzEvh3SpnRmKiw+axwVDPMAA0kVkHhStZR'
-             b'EEio6i/ZXaGDF6vJpKWcyKyd5erKMo3Hc2riGhsSUK7rAIvbsrEIBo7rafvV048T28HMjSi+ePaU'
-             b'dne2r2qVT3W+DIJojCYKmVCn1+qWlXkX5xcqJ8oh6uYia8krukmew7d9XRB8aWu7DA8aOVeyInZb'
-             b'7sE0m7n/irTbfYKfUmVbq+JCUGmiBHg7d1kpu+V87zb1hiJiUcvkIpxi+pjJx4zasWEkatD4ZLuo'
-             b'3oEUqn+o0HLzOjCiZEJiFBdhmYdjh9UNsNRWEiOZjMt0VtUq4A2liUoP9wyKAAK5n53qg1mlrnV0'
-             b'xqPXkuxevHhOX371lUitJOgoOqEvqObclVJtX716SZfReOCokbryRG2K9LmTACCVbKmMr1/ZpB99'
-             b'/CEtLYwlOHYY83Y4nI4ATbk1IdIkwL/62Hg8oTtIGaj8/nwHZJYSeKAGwsl6Tb/949e0d3QmDrWi'
-             b'gI7DaV2Qv4ecG62+FpiSGymoymhvlUOCh4UK7bYfxDsuDppPnr+iX/zy9zIeY2KlKEln65YIwBa1'
-             b'9xBiqV0TkdhwYX/1VuJdYgD0l58hLlByS6DOTooHIF6KmVGJAD/86D7du31DAAWKthyIdFGzxJKC'
-             b'gTvyBKUAahyAqzJMFPj1hbVlun5jC7JcfG+T7rxIFVG5yDg9Kx37L36JgiMoGRscvg4TGhY/Zb6i'
-             b'FGa5rkBMDNgW96Fq+58Dq0hQbndxjeircYXYjoenJfxeGa1qHZ/yr04bsIHGhGxxBeLOyqsyoIz6'
-             b'VmXbB4HsIooQAFz489irQr4mXmAJbV3R96qNmbN7ZWWoR0gTBFUW4YX1vU9+cmszgQRtE2of02U4'
-             b'NojP1lDFAJLJaFdd0UrwhtamxelctT1NQ9WoLHVFgmIjq/CxFZgyCQjaVLBtx/zionS1RuxXVG6V'
-             b'rnTCd67rF2Zqnh0d3L96/RZdv3aT4sd/83cc1C+6uGGGfD3/OZo9dHInU6+ny0VYmB/LuMbm+sGQ'
-             b'G6HdOwFhF+mcmnCw9jeZbTed0wlUXzrsYDhog2yXSW+aQh01OKsWVu2opHLIDXPfZspi0zDQbsyJ'
-             b'pMpTSSn7UlYKPzwUYrABcdhWSDT7LDk1pM/KaRJ4aproCEk+HxBLjW18hPjkQCwLCAEEIpS9zbgj'
-             b'DMSySrXI2LX3QGZaYyZbxNydzmZsEPulWBFFv/3dH9T6A8k0YFmuCsmJFsdD+uj+PR2DNvbk/hDh'
-             b'gV3ZuETrl68IHMdJ2CZkWwLBxfVl+vEPP6atyxclAHPdxqhc7f5TRewh6ZqMFGJzqSusm6jq3ebn'
-             b'1MGptnPJ/ywSWTOQMjnZ7x8c069++zl99fBZSbaRhqXrl043NxbtFoBzDYIKLza+rY5sTUXFeSOA'
-             b'70Yw8BNgSXwIxVIiDunFzn55/U/p088f0tkkSVIwHblZw1fjgH9j6zLdv3Gd0gQKAj26Ixmv94Iw'
-             b'Swh6soAH9sfCJJnyCowcc7YuPgmC8ic//hMpPITwya8es6PN9Cwr1WJhcUUJwAmSWTm53YgR55VC'
-             b'10n2vH39qsDYBVTkI32DuWfhoT369il98/UDNTYUmoaVuj1G1T1Njg9dAsxEi6MDhhoQByD9voMx'
-             b'RYgMweqc2sCDYIwA767QWnBrF5kQGBMUXYaycyJXrkiCArTdsznREtxo1fMo6yqApcTYUoTf38xQ'
-             b'w/nc5IBMGFvWA50aVGZzNrUzrxMb4VQmXUVETpYwsxTvMZkO9HXHb4K7SA4cBwRin1R6aTbtK83D'
-             b'BLHl/GDQHG30nSv3GwkqmmMFwHEdyNO+7vCxrFGJUErw/S+d0Dy7Y/B1itGpKWopj3NndBWqWpZ8'
-             b'bXZebd/65T/9j/G//fSfS8wuVcbJ0cEFXiwKtwjWyNlaumx2wzOF3eLiM0mWFXgFnolKP8MtVIJ3'
-             b'DN5Gp9Qo4eaoo6lgsvGposYkcHZVPp7qDieiTe9k3wClcNMTjLFJEqGyoQ2JJy29mqLJmIxhozO1'
-             b'cY4yuuxlbisLTw4yUBfnGzDD15nYZLDxQ0jwzFJWulcXhsSZaaUkXZAgxcCpiJ0DI7LCXVTdPERA'
-             b'0DvYZE9l3CkPPoMMmJzbeL9I1zDQZW/E+Em+czrzPUnd2wVamFugb755QC+evxATvZRs5k0+7+ck'
-             b'ef/ePZqfG4qCdtVpNLZ8li50aXWDltYvSOBeKoeYteoC+n4Xhe1VjeKjD9+jl2sr9Pz5c+XShQH2'
-             b'46EJEo2IZyZ37pT/7W0GruAWgZ4bSz64ND+W9+T7HZLCI9DDx9v03c4eXdnaFD7XYjk0AjdOyTvE'
-             b'WhliNWK70FCHO6L/GHRfFQ11Ko/eUIuM8poMBWdNwScvtmnv7aGi1LiI66I5HpwD7XBwW12ap7s3'
-             b'rggsenlxQcRz994dluCYoU4CwdJGdSVCfidF44UhuSZ1PmVxUSZe37h+jVbKz+9LtyAweyhtZAjk'
-             b'ujAxw61LcmJfLn4Gt58/BlG58+REsGV3EAqDX8q/3717iz755Evs7UPtENEhMPz5V7/+NV0ryZLH'
-             b'hCJ+POicJMr5uJ+dlMB+ClVz0EVUObYRPE1YtFUpKIv8qVEJMRX0tuYNJhxg253EFjgTDLuiF1k9'
-             b'9lhSDMs5VB6dfaboqnCdoIEFpBWhdIHRoezHY6znBuhhRQlCz5RjJhb5/OxwpyGoQ45vGFFHIG2N'
-             b'sK/2KzPlhfYAZZnvCeDfaghrK5GIoh7FRjY3Z+hCmraqqeiEiK8jUIxq8jHbknDOmT16yebC/gSo'
-             b'vEys9KzML87ruN4mJ9GV+yp4LqgOo9B02GOrxNPDg/2rV65f31hd33g5ePTgwfDo3cEaExMVvtyj'
-             b'WooNN9jm+BOFOOKhHc+NUKEnyBAlqWgj8NNVHy42InYVOVT1dBuAiosFQs8uWBut6MNeOFzK1zKO'
-             b'kYzHoAjtHIYeUFEbjxlib6jKECzqqL93qJBgWJZgX2EonYGSbdllUtUEbOSkn4mTe4ItNL+/qYw/'
-             b'OvjiKRdD5unlZ3GySZOpfD9/X4/RgD/AEQfEknufAACYniP9RYwLpNrvdHfDSg/Hb/cV7motdKo8'
-             b'H+ZE/aYEixG0+TKG7sb54o7u8oU1unrtEg6w7QIM4aU18trmJUlSPW7naklWJ6fHdHr4jobRFAKg'
-             b'MN8rv+zW9a1SyW/Qk6fP6dX2G1HLnuUIdfA6XpBZvqChqDFGVLUHG+PISIRgYmhkNWq4eIAhGZQ9'
-             b'DphLNaOvvn1OT55v0/rqkqAWN0rinGcJny42VWfCHqZynFSyqk4J1FwyqnFi+f3kdEL7+/v04lVJ'
-             b'THtvRaeQV79KqFU3YPkb47OYbi0/D+Vnffz+PenceY+4sTpPa2vvC7+IYfVv3uzR0clxiX+nWnAT'
-             b'4NJB77cRhyWcDgKtlCR35cpF2rywLnJlNt6qU7vgoB4ZOaGDYBj8pWs3pRvg4mrr+m16+fyJSPF0'
-             b'FT2lVS/I8gb3ulRe6+ata/T48fMSIIeaYGKu17F8xr39d/THP35Gf/kXP9IdZDaR3IFSO0vxcnb8'
-             b'jkbLG5jmWFxokGZu1pcbUnSj1ACTvtDoU7okda7yQ76zMsJrg1TNDThBBWujFG4WA3vpwIYgEOtz'
-             b'w53WYNA5gtIlx8TzKVb7dCvMIxJ+1o6Bx+scFxS40Qk9IIbqBs0xi+3kp7Kjjj5RENdxjku6RYaM'
-             b'll4rtZJXBLKqiUypcsBDI/GGhG8tDPhLii4MtThA92wKGTlTY0vqDFh5xhMNmh0nlSJpRYtwxGIz'
-             b'O4wYJ0ahE3SYVGQgRsvPmZyuvtvfv7KwsPhy8OTxg8XZ2cmCCBz2JvzXys4D52GVt7evmZaXlwCH'
-             b'JVdEj65KDQaJwRh1EA6h1dzyzaB4rQgTU3RIZLbqWGhG9ZvRJWiQh90SgcGazcE1oesRJCJ0vKSz'
-             b'kcSgexYm9SkRFgaCPlqYqSSJYE6yJKAYQ0U/IQkLYIEt5mczHx2IVNFggOSQ3FrcbLPF08hGgdwB'
-             b'CSte5Dz1ahkwQ/TGRghOGVBj25dEn6GbX02Ar02mCTrM4MgxvvlsOPjJJ3+g717vSmAWykCIbnvP'
-             b'P2NuPKJ79+54YjLslOwTkvLyVzcu0MraptwHWQqX6zlaWKVbS+v09OFndLq/qyrcofNuWrT1GLRR'
-             b'DuJ7pUu7fu0Gbb/Zpde7JQAfHJTkeSYrwxnGuzoChvePSdawGWPXiRX93NyivN+T0rUw30oKAFSP'
-             b'GVwSu1/uNDpQOgMPwHb2DoRjNC4ZdbkE8osXNuQ5np8fSeIRsqwzFYNz/noQSdPZhM5Op3RweExv'
-             b'S/B9W7oeNiGUzQQfNpbySkZ4hKRMR830IPhC/IN798t7mJMCIWBsxOdjZW5AKzcv0c0r61JlHx4d'
-             b'0sFBKQTOZjICVQFbVY3mxLI0v0Qry4u0tDSvQqVpJvJV1KDFjMfiiB9Z0LPAa0lsd39Ao/L5Tw/e'
-             b'6phtMKbL127Tdy+fqm15F4HWDb6bCJCcYvmtO7e3aHfvDR28O1VCMoo5G2syf+2Lr76m++/dL0Fr'
-             b'Tsm6XXCYPQtF88hvviSpmbl1G3o1h8qT4vfbRYAAc0uEwM6Y6vvk8VhsJgVQs8kuCWVggVSVUZpK'
-             b'Wa3W7fUbcE4/cek2iUW87xX6zkCL3q5rkHR4DmW0p4WpkIMDzBg5wY2HcDnQQpUary3eX4k9z9lE'
-             b'EYpJRXmlcGbDRxiw6n2YwN0XcHgU0Ixs5mlM8D1QBNE4V4sYA2AEdOcpuAR4co+01IBJUAGHCAGH'
-             b'VJ3orTiOGkjW1lZ996y75eA8L4O4dx14bIAPss3K5Pgg7u6+/uCDH//kN4OllZUL/eR0baCYcsBe'
-             b'o9su1F0wEhfuI2drlmtRJJSJ1cE0C/YYOZGTvqrYeaCGveE8AydcIiiSmS/KyGAgc9XgenBw9JQx'
-             b'WXNzQ8ADoeNI6WJ6HWN1cKxVXTACXDS5koSJvvbNiNLY8i4GGY3UO1AFDtfP64EegiturgrrEni6'
-             b'6L5RHKzPJrzMHkn1xJ97EIdCqowu7aLCm9bxuEpHyE78tSylhNQg+4wAdQnw/eSz8CTy6PCI/vjJ'
-             b'p9rJJZ0Hc2Do8D7ZVuL27VuyX5DxYVYXZL2PWTyCltc3aXltnbnOknRY825u5UKJlAvSnd14b0CP'
-             b'P/8d9ScH0ukqDJzUShwJkw/YuBzKm9ev0bVrVwSJyEnq6Oi0BOCJVIszQTolt1PnkSYr7fP+k4VQ'
-             b'5xeWZCzzzTffiGWH3f9UBfprQYHKWyWasE8ZKICd4e1v9g/Lz1DNwSEIuzx2Gw+HOlaG0SQDVGai'
-             b'atBL58HAmuTjmpEor3dI+jpeVomuYFWuAYkQ5rkwun/3Bl3b2pBuxZXRTcFExqU6tVgoiXlxbr10'
-             b'fxeU4Jmtqws+0rVOnFFofa+orc7BSyaF1SnfETXwdJZpvLJBtz/8MxovrIl/UxjM0dH+juxNGTl6'
-             b'6fotUZFnQVPhscGTK8SWLxbl3/ie/vGPD5zE32ejM+t461CewT/S3/ztTzCexvnHPJWT3fS0PDuj'
-             b'5fLvUM2gJlYETVy5UVKoxnnkuo0K807oLCrmJTTL/hBy41wdMSo081Izl6xqIuEcf8wsZOA1ELVb'
-             b'lKnLEI4GveqOmgs4j+mG+DdO4gLsYrkm3mPNeu/8FG04cNdsvS4zRan2KkckidGdjAM6pizdluyo'
-             b'Ia1lskmQB8A2aQagCcG4NrrxqPdN2Qpxokb830fx+i248oY+tCQH8Eus0IJS/M0BMIHvwe6bWo86'
-             b'k47Cf0o4L9fn9asXt6eHb2lw9drNtdPTk8WVCGFEwA1zY4gVQBjNRp4F5EY4EDk3sjAz3x8QJGRy'
-             b'Ds6vMc0yalAdho9KVH1iJKjLcznVh6EnR/oY+sVkTrTTATIu67iME+2gUzdLaR+NPIZFI7m8UFKH'
-             b'CbTKRrDtoTOmsm/ZrQ7kwZIZ8lReT3gTQuxTKLhwJGT0EsX2XRcGgIFDuqgH2o3Z6AJFZgt4llKJ'
-             b'UMk2nxkw8dX5HYmZ2iVj9gWvLJ9LcuD9V4STsCHj2Fqag8NeCchzc/PuXWQdG3/deukkrm1dFoXl'
-             b'ymyLgF8n2tjaoqXVtXJgdJTHo7bx4mqpusayY2J+U5xfpRs/+DN69vWndHq0TyPWBhyOdAcJexLx'
-             b'AOPr0kNfjRFACwu0PD/v5OdAJk/VNTYxld1OWUnKP/jgPRo/ekzPXmy7OacWb4ZOJQ8mAQr08nNM'
-             b'+sZm4Sy9VT7opDxHpzyqOzpVPcYQfe6foLLCh40TGe82O8CTZy6pmID4Agg4KLoj2KgqQE2fAQc3'
-             b'rtDdW1dJuYlWdWeHxqs0jwohJ0DctajqEUQZ3h8cpZZjj7FkB/3CSjSVr0k1wHABMCl/3rh2h67d'
-             b'/6gUGWMpDmR6ULriRebR7b8S9RXeU12+dpN2Xr3g8Qv4PMEVlFUBpRcS7bWtS7T9ao+2S7fOz0cV'
-             b'KM0iiTMcL9CDb7+lD35wjzY2Vl0xIaE74qB0crhPSxsLojAi998Sg2wMsgtS1/1zqtDpho/pDgJQ'
-             b'2a6eHamZ8uQGIVh/dzmvBn1Mjfmn2bhQVOUbKYJE9R3gBfysmSiVR92rWTckXaC6C7NZ6PTsDOhn'
-             b'ksmKiFRLvFOaiV0bEQGI5h7eQTRZUcpaGM9AC+JEORI9TRFDEDv5E7GWH6DidR4sEkowJaHcOHVT'
-             b'Y+XRqhrnqoJDzbTBiMfBUNmhSmuNhmOnk7j8DESfdY2dfZ9ur8vnjn3hdrZfXNthCsOLx49WEpdf'
-             b'nbvON5DTSr5yqwiMkPi/58qDl4GYsTm3LgkVtadoDxx0Xyvkc0oA2Uz4QGuUcQ3cQ6fHRzS3tqyK'
-             b'EeWBYOsAVmHWcYLuJxQ6r+M7GwDw652Vh2TEum+zumTUGa86WSYgjbSamvm8dSZOuCNpkQeo3Fw8'
-             b'tnz9GUh/sojGri5BJ0z3XqVameJhkKdAYeUD5/2kc/6JBrMXQjHm3jEb8z65ikFsVJRrFaLL0v7s'
-             b'SCwO5EGF9I0IlUoXdUKff/GlIG2qVGX01py/9tatazRmsMRkUutTPLS8f5pbXNIRIWrNueUVygwI'
-             b'MA1GDqAlGQ2XNunun/41PX/wBe1tP5NkLvyI8D0idgY0N/WiCqDQ/LqlzI0amQVu1U0LHgQ4IN+/'
-             b'c0M+57cvXgmAQfmgPcYK9nVB/IsSugiZ7oTkxMbguGfVpNTDHWDZAvkrp02SdFMRvksmiaSKIORJ'
-             b'Q0wrcb/s8HFy4M75xpWL9N6d6xL0ldRI3hFb6DTElGnRZVdFyU7hsN1CzI0qSVJ9tQ5E7h7kSVHq'
-             b'KNdlws/2/ArdvvshrV66Uf69kwDY246Av2m4QPPrW3TydgcOtWPa3LpO35VExSMlI586jRYq5qw1'
-             b'eP/ubXqzt6+Q42i6Xmb3y/u78ix+/gX99V/9RLsiiB+rTQODhE6ks4yjBd83K/dQidRZVAuGjWxT'
-             b'9C69jvAqP9Bk1rTgSvXvckURhhDrpKjpJiowI3kHVudZTVosh3N2NlUgS9bVgvpsDaUz4tgiOrAx'
-             b'+hSEr+FskihUpI78/CnI/cNhJwlsUAoI+RmkZyzBudukx2w/JfEZz+705FT0M8XfriTEyCPIVP3w'
-             b'NFhXPc2a79tuseFCelsEG5rKza/THOzdm1myy9/Njcfq8i1G7xHTtkaoPNe72JtXGaZQJ4eHH9y8'
-             b'c5fi7uvXixFK0X2j/CCdmWHwYZehAr+mMkCC3FCHzODCnx0NqFqzmmQI1V1DqFh7T8gZN5giEHsa'
-             b'EpR0p6RQ/p7RaF4Wi4YWlIMv/AflE9hBm2IZOZMxzRRoIuVP6Whk1tjsGBjB5FM6SYY8YppJ1YMH'
-             b'WUaFHXxqZpA10RY+ieIFdm0dJPOjmpTxwTZBzwSCZMIF4IqnF66WwoDlM/TWPVVemiGYkmllZfJE'
-             b'L5IpwvXoSdWIAhQDehmPPXj4gA4Oj5S3w48lV2g2xi3XYXVlkS5ubtBkCv4IEIf8M0al81rfvIRD'
-             b'L+yWEuQWSkJbkRHXLIOTBi8t7ipovEw3P/wx3f6oBKLxEh2Xw8bXU6DUU6UPiKgrcz/wHnwDBiJv'
-             b'J+PU6LwXRUdGX+TKWJb5LiUA3Ll1nT64fYfG5bmcsA9PQtE00w4K3AR1aIk6ehKVDUmeA62UO4wB'
-             b'B53O9dnzasTgh072PkzAZcCNau8N/T0F6Mepjhy8wnCuo5iudzCnY/uEM7p14xL94P1b5c8nSO62'
-             b'86ucLAWdYFgRIrylBtCxBKk+jjSAmwWEw9h0RJ1AjdCiqJdR8qRc7I2rd+iDP/9bWrtym6Z5QNOk'
-             b'BZy6Owcni8a5JVosiaqPLAHEKtRztHn5qnSsZqOjTfjMeTbcISzOD+jGtStAEkKkOuS6WC/XkN2f'
-             b'X7/Zk8W/XHvrVAAWmJwc+ThQylbZLWXR3nQwFXyRzMW7EqgtoRitGA1UnrqFhxkSWpuegL7L6KD6'
-             b'76FNk5Oa0znR1pyboJ4iQl7ycT/Hnty8hwTFHrKzLrtvBexIXB7omkKS9URdndWlOmCSpVJiPZRP'
-             b'ElQzBDzBI0SOi7LP0f1URmHcT06E1qCCy7GqVeR8znC8h2qqbaJcuyJXRGqj7OeGsGD6NxJosQJU'
-             b'kkq7zXHSbCZuAdQmEeM2WaUcG4qLivW+3X99/btHDwaDt3u7m4Zeao0Hc6UXO2k1uBmeXrjxcOgO'
-             b'u7YxswbC+Asu92P+Ta7/7+lZoZHI5CFUXKMwsXm0xt0TH7YJ7NLL10wEsDBwPTvdHyiiZlQOsSwj'
-             b'wfqXZOf8LVsqxqrFJ0tKHfsZ+OGMkU1ISFJnWttNWqn2AZqGDCngZTmQUsKBIIWgaxBTGHnCU59i'
-             b'rcQcQdoQnVM2gIn9W3TOlxOlQ2WEMyeJd2Mj2a3hFgM5d3pyVirXL2Xk2RvAwrhT8nU8etpSj5+U'
-             b'tYuLUNgo121z64oELmHnJ05aizS/cqF89oEKcsYIyarsOwD++2l5/fXrd2l+bYVePvyM9p8/lnvT'
-             b'mSdQbwTsHuMCrTRNvDLk6EHDEEsM6nEmDgrQHg6+N64wWm+Onjz7TryUeN8iYzmQsIMrkX8fwVUr'
-             b'Y9cvhJrJQBJMAuRbg2mHroTM6Ta0wqyxgfTauIRHYT0tLczR+3fu08ULyzrusRIOKi2G2lL8B1B7'
-             b're5eruoLBDdfK3J5TJaCyV+hSAH9Q35WN6bljSt08fotWrlwsSSe0jFn+CO1nKOgaDbdryTpoBbX'
-             b'L9Hp2zdyncdzC7R17QbtvHpeusCThohd4d4MJb95/SK9+u41HbJ/W8Ro0J/vKHqNv//kU7pakpkB'
-             b'ZVRRXPdBiacCk+WSxOY1OZjZY+xAB9FnJIHrl7FXkinMjHeEYySCmexSdaxM32dr4ywZ0rHzhsbl'
-             b'cGxZZirwpjZClYbjqEnsqRy1jL17MOQprOpV3aL3xG5we9EEjEpzELSlC3PD/DXos6jWOx26raFY'
-             b'yPCZms5OJVHxSkE4cAmmkL0CaOIgA0AzbAjpwTmQlM1HK+LZaz9LbS1TQz8IuaIok0/FjGMYQVNL'
-             b'sshhs8kzocpgQtGShTpyjhSZagpoPmfHx0uff/7Zcny9u30lm3BmX50TB1h4q/K5dexVL4tx/TIP'
-             b'zcmnuWYLLhXnIDh8UblQLRSU6qhN/n6q1u2RqlR9UAgzo4ukC2JeBmfkpI6arHZh7HqTr7GZbg8O'
-             b'g3wYQcypIrCiYWYqwV+qe1HnRxfk8E3b5wQzcExanfSQdoJ9vH29jOgYVjtLDRzEVAuSC3vauChA'
-             b'BgdMaT88CdUJocow4ED0YFjJlBYUhBQgzp0J4AGMFBmgUTqBR48e05vdPXHDzThcEcthPvCXLlwQ'
-             b'hXP+s1ZDeki4871w+UrpIObgWFqeh/klWigJKqXQeFNVErapQ3ewOmBLjuHCSumo/pJuffwT6hY3'
-             b'BKyQezOR6xszvKr9rzN/EMBdniU0ShemKxp8m8uV4/xoSO/duUZ/8acf0pWL6yKJNZtN4EtknLtQ'
-             b'JXSA7pLP4wRy6LEJaTZVawNDtza8PQL+0xyXO+gLioOCIDunKh90+xr9px9/TFuX1sCPI9cGDGSj'
-             b'FQMoqQu2zyVJK+5APbhR9gsajz24i4yjy1M5G/yccpLmfeHK5Vt0/8//ju7/+O9oZesuTbv5UmB0'
-             b'SqAYdD4i1EWmCu6q1FSnMjulOJR7LuN2Jmcu0Oala5LAXG7KdAywRB+VgPjBe7eVqJ7N06Be29Hc'
-             b'mJ49e06vXm0LeMjMQ6365qR7erCvsGkuAvsZHJZRoIoEx8xJpiJonWaY7ijSziXXoJPnGnR1Sl6J'
-             b'2b53D+dcZ8/ZXXy/YPBlKQK8JS9fmKRajIMCI0G+n7lsW4bUVgKhN0/VwVk4mbkWJqqZOoPGJ3Q4'
-             b'ebzKiL2oBX5EHBYQBcjsQlngJMXxzSzhCbut7+2nyDp6XIsYYn3vpqna8AVd+zdoYes7dIyNTe5O'
-             b'jV1JVgl9QrESqrpNbtynA9RMnNpTfu7p0cGF67fvbQ0Wy/9IRTsEaa+3y5zcryS7moPxDoLMhnn5'
-             b'Z0GE4Oibg1lbmOBkcmV0g3carNOkPBRRCC9dhlIDtRQhPS+/uJqeKTFWlRZ6CG9ibFoeaj7KA5/n'
-             b'DqGDVdre8VgeciEdl78/491WNEmP5n0xLH2oleRA5JF6qVAmvOB0kUmV3pnwYlR2WzYobQAZzQOW'
-             b'4YOV4LRJmRqR1ejLSd3IRQqtMhgOQE/JrSr8OPAl44eQSZduRql7Hp798iz7008/RTCv3YRUPeVg'
-             b'jMtBYS03yq17qnZCaxe3aH5pRZMKc7DmF2h+eY2mQeVVRL6nBDnRmktVx06mGJ0CUkhg2FHM7zau'
-             b'v0+rG1v0+vlD2n3xuDx8b+U+B/h+Ybblqg5mXWC+YaHZZ2rCTy6USdjrWeGwtjSmtY/v07vDE+Eu'
-             b'vX6zqzYjpGO52FRtEkJzcNRdqx2nqCYoQHfVat7flalbhEZAmXds5X4vLgxLUtoSC23uorialbEo'
-             b'rBjs2ae+QZmFSso0112DaPNFtdeNRjROZo0ArUGWkmKLkVIYXLx8gy5s3aD51ZJgBkxl0M4iuWRZ'
-             b'gNVMuT8mW4a9sCG2/GANxuXer9Pk8J0QvNkzamPzEu28fCqJxClLQOZOzlgyaYGubG2Ic7JQMlCa'
-             b'Y5IvlizMm7p27Wr566kTXw2FydSLMSu0C7k3S+MoxPhkenboU0MPGT8IR+fkxoq6i5zSwLhS2K8J'
-             b'chTdTJDx5UxUuQ2d3PJAHWIdlLKRm52otWMZ+yKRPM7JCbzBCkZv0QmeUEGdc63nbuS2ZHo0nZ3z'
-             b'mXLVij5RJQUZHLwDIAe7KsgbSTzlolqUR2Y0wnupYvJQrXe5tvp+B/iaPkOXNleenENV3LwieIFl'
-             b'XMoUOiixK7iDn9/FhYWqa2mu343rcnXEwPsxHMNsMl+S9/pgbXV9IffMr1F/FSduWhsYsrtmesYV'
-             b'6G2Q1rvuELNyprIyuqVaTVjSObyc6rLSCJeC2B3U3jIaIkjBGpPjg/JwzZWkMRRzNllGxw5zZL20'
-             b'ZmbGlSqT60aMwGMewSDKrkGRNliOB/WIMhFYyo3yQjDDNR0fmBbfiIEUEIlNUEyWqpwXuu3iNVQS'
-             b'XPv/jTeRqC3T6Ny82hyR7QF1ToqNgTACsiUjiS/VCQVUYmI2WAJhqaMlgTx/9oJ2dt4Il4jM0Nfa'
-             b'9PI9d29fF3uN6WxqVl1yTRdKclrZuCCBRAJaCXJzS6vlrA5MhFptEHjcOhxgDwjG+qBa1McGcMXI'
-             b'ORot0sW7f0Kb1+7Q/nfPaf/1czrYe6PIxhwUFRmjj07cXgJlr+t85e+p6VPtzgOWy4wK5WS18cE9'
-             b'Oj27Ttuv96SjfMdKDiI5I1h0UgUbiL2Av5eb6x8g6kvJNCNhjqfZXEoT20Gx/cnC6hJd3FylzQur'
-             b'tMBIyl7FSc2mIqa6Z/PADXUXS88GpIleqWswEqoBDrCQZbP6kaVyXwbjBVpbW6eVzcu0emGLhvOL'
-             b'4lp8JlZGMEUHRcOkbBTmLNLviuo1cdsSJIcCDDrTKp7PeumgwnKgk4M9mpbkMZqbo/WLl+nNq+eK'
-             b'Bk5VkURG5GendO/m9VIgvKPT6Qw8SlV5F4Hacq2+ffiYXr18RZcuX5KdmYyAO0OaJTn384trEvQk'
-             b'cPH4PCNRNz5Oye1+MPFIWkR3oJ/YEkZI2wz84GKzM8+mmXLiWORV9rVjjLJ67GI6VZ5nlDC6Pszn'
-             b'GkFbPffJJUEgmi0j+u4c8TiQJcNUCfUuPBsdpGGjY9vxJKO0NAq7VYBZz3NA0hiKuMBUC4jyvrvU'
-             b'e9OnJsnBbV9ya0zqu2/6ntGkakUy4jJFrBi0k0FjFKpdiemfYn0kO/nyjDLCL6Mh6c47yEiRH7E6'
-             b'qbGxA/KTaO/Nm8XBbHo2NH09F5GVdgteMWZvYW6lphMGsIShewLlKhBrowuZxcXaMQBpU5d26oTD'
-             b'iKTUN9Aak2LhoFEe+P70tFTzY2jyldefmVGazm4ZgCC8BLTTKg/SudxRcji8PtysrzWbqOyQoIzQ'
-             b'ehPQVAkjJ9Whm0kgyG7W6AQRV/LN7fQSVYmJfSYorQdI2qsga/Cq1azgUxtsTS06NNVTbpCRomqR'
-             b'6OzspNobiKtt9sv6xRffCOJ2MIzYw5ETnlcW5kU2R+3gq/wUw4QvbF2Df08Wsu7C0poADGYJUP2o'
-             b'XcugdNGCSAzZte1MBNY0G3OyRaq+9oTfaklWG3c+pPUbd+j03Vvaf7NDB7vb7CHjWmUBYrky+rLO'
-             b'x0dgEJvFLsOg1r4HAi9IRX5L5T8a0O3rW3Tz2mU6LN0VeyEdvDuiw+NTOjo9rkraxiuzYY1YDkBf'
-             b'MJGPcTKQk3OQMVpeLp9nbZUWF+dFgWUwUPK5ggeSj4ZCK2SbqlO1Ew8jlElEyz3AN8lcWaeqFJ90'
-             b'8BfH8+U8zNHqygZduHS1dDqrQpgVlCXD6ZPys0wZ20ZRvl9DbNJHuYMgTAKPD7uOLqBThGzXaI7m'
-             b'V9bp+O1rKZDmFpZooySqvZ1XFT6P88BAzGF57m7euEyff/WonLERkk81rmSs06effUWbJUkRrDsS'
-             b'KmuBObGU0xx7Ro0xis7mBQrHa/wuex78TOEtgkzMY/0AJCeeb1bpEJPHQO50a8Wlik/PvFPTfdrU'
-             b'/z2JgSF23xz8GYgEYq6gcpzFmgEm02fTTUTNBBNnixOkxkZjZ1VulBTS6KYzdMESVUdzMteC/kzF'
-             b'jIeKAuxiueunhy42fXr8DjtUg0OEigfApCpjvZMb53QfcmeTmMvuHFE5sTWu2e4tGNQrR5988D8N'
-             b'yhk0FGzv2rBWiKcGsm4+VgPn6m5vv1oflBs7cnHHUElyADM3lb0BK5RJHH3OaRsYJYm5B07IzhvR'
-             b'LmFaC0OiqsFlS+JQOweCNL29G521w+TMFS96HyEGEGX7DL01fnjb2RjEIPkBFiSM8AnUhFDUAHiE'
-             b'NxoKV6GZtwnqLgA6mqixZrDxjllyUwPnDDDAQ2UVGl6TjTXMVoNgemZeV+7cI0v6DAOx0Nix620V'
-             b'ortUjPB6oh7K7wr/Z/Luy+3vStKZA3E5YOxBAudlZWGpOrmLodrVrl64hGUzybx4bnGZwnCepuQq'
-             b'luCOKMlVBYJAMOX3Ax+dEFoB8VQLEKDIzmSMOKDR+hW6snmNtkpwmZbDdfxuj45K4jopv8/Kf09O'
-             b'Dikzx6MLPmLLJv5J1XnX3FgT1Y7E3oCM4HoFziwvjml16YrqxZX/d3B0LPbzQiY+ORFUqCAQ0R3y'
-             b'Z2N7Ew7cI7HY6ErSGwqRmUcYS0tL8BkDgaI8o9PcmHmHugDXyju7SabrK5pde+ohlxNUMRsqCxPm'
-             b'zJTXG6+s0OL6ZrknrJu4ri7EspcdyJnjkaY8L3imus4kSXq3iDGXanekhrCz9abyJE113zubnWHH'
-             b'qxwcIbyXZDNaWKHZ0Z6MpeZLh807n/3XO42cm4JM+Hm8dXWTXr7aprcHp+W5GvjX8D0clPf/Temm'
-             b'fvSjP6X19VUZ0RvqSsbIDAjiez8egCcVYB5YjUjJVTo6CX6iVwdjUXX3DW5eKECboN5nKjuWzuup'
-             b'g5NEQC5qjJlpB+uxCnYYJUGlYB0U1xczJxGbnEKGmV9ouhSfM4Rwrjgy078QGrg33BWyS0hR5c31'
-             b'Os6UYobpNqWokFagh3dehBlmmlIM33/1vhGkO9/VuBV8OK/Jlxs5rxDqji5Qy6BPPjJUAJipviTx'
-             b'ptPiQoFWlYUVmvNLtSkiXI/yMw/evb04mM6mQ2uzcvUC1ta02TLmVJf9coyN/9Io57osg8Nrravq'
-             b'a6tqWPjcjr1Ss3kIsFwnh+jygzgKylHhrNxb1DPILuaqIlsC1NkkVd8PlXCxgAlnz6TKvDwmVK+Y'
-             b'DAmn7DPp7J+ncgcCRp9CrnShS2oIbZBYcq5B40WMHUTMzu7wgCGPP1f/gRxxSI3bqsJlJmrXzmTO'
-             b's2MZJYnLZYrw1+mkkn/wzRd0fHRC3byOLzoEdL5ua6vLYvXOST9RRWetX7hIy6VSFhsTHvuVSnk4'
-             b'tyQaezMQqLtGZLqTbjGgMNBRjl3Ham0Rq0Aw0H9JOlSulIYyapNbORjTYHWB1lYu0po4wJYAdVqS'
-             b'xukRvXn+gHYef0mjrloa6FyZfOGdzD3XrLltSJ6hQxmq4nePa87XaXWpJK3l0oFsogpOuSoJmN28'
-             b'JEWMqKEpaaoo/fREkwJEcAXiTjZKy+0BaLThCHyn4DYgmSpqzGYgXCCdlR+4tnWbrt7/E5orXVMU'
-             b'F+UOu4ekz7DBo4NKzItXEZnYLBBbRtxEcCMTcHUR5uBLbnW0nTn/z8RJLbwN5hflepzs7Ughtry6'
-             b'KTvcg/1dFaw19phMLCK9f/cm/fr3nyvEmOrekYFVrDby8NEj+suLf16aFjvHmIIEpWgMx9oRquxV'
-             b'h+ud3S6+CwrWGsSqdSkTCMQI/UwatHvZuZssmiJYM7zq1AlhBsAx9s92+jD6NlNUAuFUwCedKVb0'
-             b'uM/J1fTzTNXRk6GI5b1PRbOQHK0bJRmSicAGU9NSMJTILCXP3y755AAm1vGTuIWfga5wUs6O2HzI'
-             b'z+0caBVCaGwiG0BEAypRQAS53X11qmn+BvthE8PN7g/odGrZ6etqqKvja/f6So6u9A4uoR8TIrwC'
-             b'n+aXlrmTSgOZRaeq0UQN76Iqald/Ih33wQSRAQZ8gQIWdrYMTAZ1bBfBlbyqQDYIjIZU91WSUACM'
-             b'QAUzLQF5PL8sCgYz7IG0Sp4Bw6izY6tmEpaZjHoSOHOoM9jekFohYCQXUSmacR4gkAYUaWD09lmM'
-             b'CGrTSfMTUqx/pkaiu9rTG7ACfkY26029gjMyPq9QHHl52qlGm8ojpepMrGYzCpiIKoETQnJ2PHcC'
-             b'3z56IsEmmHKGmVCWA3Ltyk21kZ9hFc9SRSUhrWxcFOkfvj6j8t+8h1BHELNh192Z2GsnFduLcLFV'
-             b'/TNA9e0aNQr3HCT4swmZdDBCgNSNjtr06KiHl88yDijdQT8o3cP6Ml1bWpGAs/PoK5obohDoM52z'
-             b'vnGScCUfWq2hia2rnCsyODE6jFly+S0TaY62X8ToIyWD12avHNXKGwfMeYLBrR9CrB10AqhCIPsg'
-             b'JXMh0PmetIeHVpJFPr/H01mgCzfu050//UuadXM0Lc9I6IPrNspIOw5cE3BaEiZL73A31ZukV7AE'
-             b'HutupM9uT5LgsTZDouIfzKixwUDpDGqahx7LLNB5NDdapLnlnk7f7cr9X714WRCixwf7sCpHUC0P'
-             b'0OXNNbp8eYNebO8qVcPlvEjUUL78+mv64MP3y9keoNBVsI2iVGcODrERVkpmgzNTioFMEZQaE6hR'
-             b'k8i2qVAzU1fiQKE5NHXxoGoW2pE1epioshkprFMjiOf2Cr7i3qAX40i8KUGRdt6vCHeUu8dQn8Nk'
-             b'tBHZHfPXj3Tfk4Bsls8MOsygQwGM/VWfYFNia/4Gwi4eeUnMUXkXz18wOzupLsYEi5LYmHZSFQDP'
-             b'LVqWGsxIRuEXrIyCeLh3WdqhpxycIEzOsFGagFIF8Fmo92KlitjnKiLR+rYBHTrrJ0tgd4Vz1g7a'
-             b'dfTNtNQIXz1AFbBg73HABWSiFzqGfA4+XE2zDLyR/QKf18UKFdGEttrV05l7w1478E8iGGsFLP3U'
-             b'm6Z6oriXC3UOZLDDIagzqgoYnVtjY45vi7VsdZT53pBDjyvRwnZNASrBFZETzC4ZEPIWBWOeUKaE'
-             b'nGGdHbBYNP8sVWXgQ9JT9dHkJDaBqoFGVan9OxW83d3do729fSEwK8w5eGW3NL9AmxtrYvQWIBnE'
-             b'BM2LW1e1qhR47FAKgsRKGY2DUiAVNJURaQ7u1to27nL9ko23LFlrwSGk6qhzf/KvSU7IdG1mEIN5'
-             b'HMtyPdPyPq5/9Jd048M/p7M+klKrYoM6qpwO96YJjQ5zrodGxHz76rPToGfPCXlkv9LBleQp11Gv'
-             b'7QwzZS+AdCcTGvHf7JBmKeZi9G7PEGn2i9y2Xq0KJjSiGx//Bd398d/QpCQoAa2gIFLgzqyBCesZ'
-             b'HA+GQJ+SI9RCV3e7UkB2SO5mbWGCvPhMmkizFkaQMXMNPJhGmvD8cH6FxsvrlKIGHQZSjOYXnEsU'
-             b'0OEwKOv+7eslKYTqRMwNjVTiAzo4OKJvHzxSA8Dw/5L1pr+2JceVX2Tufe658/jum+rVRFaxijWo'
-             b'SVETRA0tsds9uFtCu2cYMGB/aRgGDPiDv/i/sdGG0R5guWFYrVlNtSSSYlNDUWSxiqzhvap683DH'
-             b'M+5MZ0SsiMzDFnVR5Kv77j3n7L0zMyLW+q1mRsRVeTnUzC7OHFWkaQfZIdGyQSVsZHnw4ELr5Ayo'
-             b'klStqO3UiHaomMEFgbvwCA8TFkXJq1vKIbdHhAQNmpbbR/jUJK17QJq3ybIznmMkgpOmH0SY1i3/'
-             b'jq8dq4c7rLNdtBl/cF8WIYi1y5U/Kc20JeZmSQ+Gsj4gTFRStGUmNxeRSGgsHBEVoWVDEZKkJeMX'
-             b'1JLQ5Hwaymsw24wZo02409HK4V+mVs0hIKA6lxDDtZEa0j1RuiFa2Aww10LFjf18FWbzsVJOIC7Q'
-             b'QLjOlWkxVDVmdoSI8Zc60GRq9RRbSqHXkmiPQZ7pqBeq5lqNm7AFoYM60PZM3bsnF8/kxlFZ5ODI'
-             b'Gu+X5uqZjs2Q3QPtctX2tzRfG5KnWCnjNtiT1g6oh7rJdVUU4P0mBD1GGwM28Ezxy5QbG90cg5JG'
-             b'xGO412rQGzVwO4+HobJAGGrJkozRS0awofTok95c2prR93XnzqeCpXFCQwARpPysF56/KfMdF7KW'
-             b'N37lxnOlctrSG6r8lc3dXXlkNXcPYRnwQBEi2DNmk6KUar39NsODRcCaH7k1wNr7HrR6FUIH8rVY'
-             b'4syCDKGKeOumLNr8Ol9+jV5866col1P8fDFU/qPl6cTqI7N4cQs2dOaaq9tahE7wrxgMxYTcqKgU'
-             b'CoI8OrhUPvhMMTjrsj4HnpEFb1XEIN1eXwrkSKXQQcbOi0y578b7N+iVn/oluvbK2zQDaFWzv7Qa'
-             b'ExwcSNe8WCdkpi1x+k9go2lnw2DVwPUg6jyDgJJDk6mVUoNDi42oY0Cnw2oUtOTL71orG5W0IHlu'
-             b'Uw4VTKWQaslwXyKQGGh7a4NeuHVDpdImSkBfi7mX77//I11g+XBSKm0LROXHgCsCbZFlUFyU1WkE'
-             b'Bf1AYEYWfJn6hYworwbV6OpMEVeJGq6KfGR9SpqEGw3dxr9/0JYdixKi0CEWqirkQ2PWg6OKe+yg'
-             b'pTMhQ34R4uZDagzApM+2dEyW03Lt4XFjPxPAs2K8LRvNyGZaqCrUNhAg9GgSU+RZW0qhwNdrmE5k'
-             b'PRR2pKmKpWLv0GEKTUp8bcFFG4tEe8ZhfA5NHrurhGtlagCIsEI+gX/UumhGsjePYg7OqTT/qKUB'
-             b'V3SV/IzehwYhV4Bj7X2qA15YfWUVD8smbjo0A0colhzqGFchhBYz7gNAxxDh+5JGjzt/0CoUvhGi'
-             b'noI65uZNzrFpJnI9tDVsV26C7ItRSNWA531TkyuiOSgvOSfotGPLU2wITw3HK1RvkCeNQgDRaRIi'
-             b'hn84uUkiMMl7ECtl1hRNwVGxoEPYb/OKc5FFeyk3bnJPmLZ4OI5dWYGA7uaEjKAoPeA7n3wiPeDB'
-             b'TitJN4TtzQ3J/hHjrgBuB9rZ26fdvQNVo7HRcmMbvpbkWCKPCLETj7UGghHh0V6JjccmqgenRhHV'
-             b'do1PLSQ0r6fldKabrDAVAy3KoiRBc5jfCXmcW4XEFItX6Qtf+UXaOL5FZ4tEs+USAhyHAMnfs9ak'
-             b'qYtEYt20E7LpbGGojRY/DkyPkK1xAFOwbO/z1ghCSo5VFFPTGjNmCU3eUa7AXltUg/yMDllhqueb'
-             b'hXU6evlteu1nv0Zb11+UClJNv00IKAgT5C3lwZOvVYCELKJgAXfZAakRM5oaPx5B0IeyD14bWVgR'
-             b'N872Da+MGmsKfrO2hkvVzZUet2k7Dk48uiqxEs7dyEoWufXcdVFEEggQlhLAIaNPHj8VT1uHv2dd'
-             b'DNuwGJXEBBczxuuMVA93loxdi7Bcu0FI866In+CSbyeU59ptyGi9qdBq7mZlLWwGzDizxgMFrWYY'
-             b'vxVTbsDZGQZsrZyEO2gznKBy8aixy0jq1o2R14K+U4F3yJaJB4AA6YGV8Bp6eMCkwAPlxt4X3x88'
-             b'qzbzuq2LqqKz11bBx8kO6pZwnfAZJF235DPJyAE28URGOjQ+T/fsya2CFIuUAQkYmDCGVh/u1dho'
-             b'H0JVEJIh6AzLpB27tXJQ7FLGDm1tPlf7eW/QipCEHS86h8qjETw6vh2MhVVAZm7QImmVBdX6Cxz+'
-             b'6AgPQsDYBMa8jNeCC50rPNQApkY1sXC/ADluDlVKL5tTCisKJ910gN4QhYm1pQD4DI3LyfiGxgNL'
-             b'6rGgtHA5qp68dBMS/JCVtUlJGywbVaMlvt9j743zBd6fJABHbdUZEb3xUnF77/TsnJ48UQq1b/jw'
-             b'UVy9cgiPD5h/ZeHdO7yi3EB+T2UBGY3HQEV1dd4Tqotcs7l60J5xOidb1AbHRHnwHLdHIE2ONtvB'
-             b'w8CL1Hw5E5hmWmrLggflvHkLZb4PGDiruouvyJQPhztXS6Xxy+XrF2l8eJ0uykc9F8qIPnDy/gat'
-             b'7RaChVnIRqf+KJySO0Mwkc+OrPKMaL2Z3iXk3ER/Zjf1rkhVcV/z6+aZDv9zOlsI5Hhe/vesfM35'
-             b'3y0rdUVztljgM6KNoxfotZ/+FXruza/QYm2z3HYjkWgrETuh2vRcbz3EwB/XAWMVksXN1DmGHQiT'
-             b'0TS8tajfN8CyId6l9TVth0lcz8JndLnTpjgFU3llL1QVL7Ym7WHJBCur2fr2jqQ2S1QH2o/8WrdK'
-             b'hXzj+rHOKITO0VGHZ5Lv/Pfe+yFb8V1FR67g1Vlqxw/0MEdmE+jrDRsvA4XkUR5g27kCEIdGY3FK'
-             b'VatDV+CX9CtG3dhs03cvUkjVIyVYJrS4hQuoHEHe2Myorx5L7bAMy2U1zYKu72QMN5cnl7lHN65j'
-             b'9gYKj9y2PI9e2DqI7Dhrl5F+1lzBBKgbE5Ta1EbY5GrcJrRJXclnBl7MDTMqcz2cYGMPOKSl3MBm'
-             b'oyvD7b/NoZYOeL708RyqJyskVIEWsktNMoZu+OW57fvQd4PiULCLR5sj6YkvucdHb1h+cTHpqb7K'
-             b'I6PLydsZgLMVmpmcKwituW3STcfG//jPMBL1IKqvoZy0JfUUtOMkXobeN0PnoInowMzDyXlahuCI'
-             b'9ZfYgQP5NoOeEiSee6jtgFxl4z6Ut5pUYJAJtG81G6tBN3lasIXRWdlrvDQ92KLbm5shYiM5D5i3'
-             b'sCw4yYMTpPrS9lF0nMq9u3fLjbGkza11lZ1joMmg1OtXD2TxyWjb33jhFo0lvVV9CRsbW/A16ULB'
-             b'xYPMIOqITgfJIIgHS95FrhdLjBMksl1YjUwIDd2cMMzn/+MMJ0lL5vBHmXn1sqiP1zeU0zjqvFJn'
-             b'QK7cc4xcKovb7o3P0f7VW3T+9AE9+vRjevbgvjzko6DhlgnRLg2dxisCj0/JecUi4B187wh0ToOn'
-             b'KvTUxTrV60Oxhk+axJgQs5JQsfHSLA8qb54sjBlt0OaVG/TiC1+gnfLP8uaFR9mLT0lD7vhwIRlF'
-             b'JlJp9FghrCEo87KZ8eYaJWFzAixyCbOQjHRjC9/MqPoZE6ZzIPgDyXxD1eOTIWIIoHRwu4wPOaNy'
-             b'vTbTHk3OngnJe4eTm8t7OTt5opixrLOUF25dp4ePntLlQufKPKbQWIoxffrJPTo5PRPf2RJzFuNa'
-             b'chtsfnkpykLLZ7ILYp5GfQYiRDn6eSyb7DXL+gp5lY9p6uWEWZbxBE2IJNWMEdvxnjNIIBm/U6bZ'
-             b'pjCUqqe2GPnnagJ1gt+J51FceS4B0qY6A48W1tjJQyoR7LzyLbVyG7wwgLo1DFosBOX58aYxLZ9T'
-             b'lXPTCubJ34PfD7Wy9ANprjxCqXTbHxAh6w81tkN2DR/RB2zuNndfIsA0uo82h+imJWP0tSrm3KDS'
-             b'giaQd315wwPHLMh8I3SI8FXcfI1bzv7L5UQfOjml8uxjHOpD7AmMOazIvxPKe3/YqdIVcmVq1JyY'
-             b'0AaatfbkcrIqC3XEiZ/bETzBs4eLAaIpuLTIe6F26st28oTB1KShfvLP9RRBbhzMPuhOYPHpzY7h'
-             b'oPS4kfrLZXbXeS6VLN4ovZY4nbqqzCNLwNSLTcvKqj4fwidhKbJ4RD4i/h0GTW0oCXduf6Kyeghe'
-             b'+L1yJXHt+FiICAvxRWXaPzyirb0DqTCkldsp3XuJMEsZTjNRgh34XnyTt/ikHbeETyprYrJFU9v1'
-             b'lraODEvTigHaCV9B1VH9ugU+dqpQYgr9dCbCCc8l6zWvy7JzNOGU5xkbtHP8QtmsnqfJyVN6cPtD'
-             b'Onn4admoy0EmaySL2xO8uo819NrD3JJLc1uJUmiMAPKMWkKz4VxCTQDmnyfqOou3sUMQZgJMiGCw'
-             b'63hzj46uXKfDmy/S1uFxWc/WRFkrVU1Qv19A0rO8zyUqB0SWG3GeB+O95HUFh33a++H4CJExS5s8'
-             b'uBhFrpM/g+AeWljnYoFqAsGZ9llBuWsEGSGnhOSeLP6FXCH243UaLTdpPj2X79ku9xffr9y+FeFG'
-             b'Oe1slGrqhVs36Qc//Fh2qBxt8EA0mcxknvr233hT7lNj+AQkvPKz1ZfNMLeR3uZ1QvibSsQzWsXA'
-             b'qonMvObiDWiXciVHWJNSaoICqaE7uC9Ig1yrqZvqs510tmfhm8rJC1WAZWKvFNEiXJbPb6Ton6Dz'
-             b'+mSgg9zhZy9B8Om0XRiqsCybaELWDH1dpgzmNASmfTBppwUMZCShetWDzcI8lAQOYjIRWAOZjSaA'
-             b'sY1DPurg1PnBCCZin1FgglgehqUnqidqFOI2Ugk2CkqVARqoOcQH0yzEfjxen0bAY01llxDl3gaM'
-             b'WW6JkeoGDF+jcchSWOGrDcNQoZGNUzlU1n2lSjSyXr8IJsmkSG0pxoPUbm1Dc5qWeD05w8c1+JzB'
-             b'XQ4peagcgVTAH4zJjtUwq5uaKZK8lsm1qkso341CnuWkY0gPVawxBcJL4FSNlbVwHPxUa6deH925'
-             b'grOifwLoCsohW+rGYGDaELyNxhaAy+mU7j95LC07b7km7V/fOL4K20ygtbKY7F25CrCqzjs2trbF'
-             b'g2LtO0vLtOG3Vb115qYblSxyfPLuRnra76OzHcULkjMMx8Gju/moZkoojsBgybxs0MxZ62C0lg1/'
-             b'gVlQlAwvSSzFhjUXw2knWVS8+PN16XeO6IU3D2l5+Ro9vndH0EuTk0fCN+yj4b1ClUfn5Lla1Y9f'
-             b'50vZ48TJZ5Cm7gyhtq1zQ4NWQQ3YZYOS5XljCv0Gre9doevPvVg2p5dobX1HFqpFSs5kC2b/QHQB'
-             b'3xpLzPwUARQhcyYXD7BPy0Z/TrYekt8bhtzq0C4PmLtq33/Az9MKv5eKbe5el2QCE5ikO2r/PNSI'
-             b'c7Tx+edvbu0guWAmAordwyv08LM73lJlA/BzN6/SvYdP6fT80mduuVzmuBzRRx/epjfe+iION1Ap'
-             b'wogsQhFu96+t++Iri39oQNYrxleIBobBn6nU6FUzgKcZkSj8Hzm0dXVmmeFHk7ngorqLgvu1QFyJ'
-             b'OlsUGARagREQACWUdP6cd6BIxGAqyujipjx4s1B+97AY0LVIVW0sH8eAIFjbDPWeWUwnWnHnWpkE'
-             b'gxEZGNeU1LC0QImjMvgML1eqllaz5liJBc95VStTdAWs7jHaQeH0aj/ge6vPoj9Myb38T+ZSTmIx'
-             b'gESpnkrlGRcUslONqYmfiyE2f0l/sCKGsiwQi/mythlCFU7UE2vdITUnJ1fDp8d2kMx+tPVibYi6'
-             b'YAeozGxrZ24e36xrG3ulmpurkIkBnJzzA1hsMrWXFfrgcDn+2IjCFoXs6KaAEw6p6U9+BucvDZp+'
-             b'CnFHQBsFeywqtYqeIZyy/OTVVEyci+OCkZCpWjmb9mOuzVJ92LpSxp/jZBebTBu9QTc2N+ij23fo'
-             b'7PRcKBPW0+VNan93i7aZ0bfQ0xmjbIREIRL4IDSDuDYGEsgMyXoBFCkTfeYSneeIqAyuGEdRzZ/I'
-             b'z1I4pGaKDZLlFaF4zK7WtINSgqJL5i5ReYAOP0VfP4ESYEzmeVksmAAhMmSplDqNQpF47kz95i5d'
-             b'/fwbdPWFV+n04Wd0yozAR/dpNjlTRx3EEM5GzDU2Qz+zzhE+Of94grTS25tGvFfxlifGd99SohdG'
-             b'tLF9QDsHV4RXuHlwTGG8IRXgPKMy6npUJAEmYkXKdJSdmCIPbvI8HCxwXZ1dukjAAKuN3WEJUKeR'
-             b'S4YVnKQPp6OEBcz1e1JAxlFwX0yA6io24iOdAQEkjnuGD65MKZmca8Wwtr5JO/tH9OzpQxphUsGL'
-             b'MWeAvfO9dx0OIJaitTW6//AhnZ6c0c7utmxolqqQ4YBnqPPGaGMlmiS3gX3O61GTf3ZA7+CjhZol'
-             b'D6tKgrkZJnrtFIyQAaetvoARQsJrdZwbBuGDZSGF6NdlQBCsSd5Vlq+zW+ug2GFe1NWpLk+pMUL4'
-             b'ZoscKvUU6gaOpBt59pbIbJMZric0NDllaK0lSn6gMjkbV9OImnaoc2tH0kqwFhgW22RzTqk/Tbkq'
-             b'bNWs6RK8pvQNHNooLGHZgAsrd7O2shV5JxL0cpruy8l7QYGcf2Z0CSvT6oqoZb5WKqrGms1mLVhk'
-             b'xUTpCqQQG6qElaANe2jFMAbjXtt9D4OWot4BLSeGyaXMMfj0p6epoYJi7UGFQTHmVMnjchF6wGOX'
-             b'ftOYMINvyJjVgNYD8SM+CgwRE76Xy1155tEmMtWboZCkV56XnhJM2Rt58tma1Dk1BrKQmwwha4sl'
-             b'kKqRzhkA681OuAhIv92gjz/40EkYERJvZvxdv3rkbYadgyPa2t1DPHuUlhobeZfLBIm44YC4ZbEG'
-             b'L5lWHDYjSMg80lmHmoI7tByEp9f3UGUGNecmbcOqlyTWSHGTWQwJcdjWaghejWvFoN4sJhRoXERZ'
-             b'QOYLgaDKDIezn8r7kA2OSSNLfeh5drV94wXaunKNrk0vhQ94Wr7OnzwRNz5/Rn1fgav6kfRIHwV3'
-             b'DSm+oWkBRAgKFNAzKB1C/l0vFdN4e5eO9g9o+/Bq+e+H2qJikj5XfAsVbeiJXc2qEXM5dI7054uQ'
-             b'xGYlFjia1UiLob8ZObTF1NDjrQ2WUEHhsCVYI/As3UelPX8oOrVaYzkCx8YzHokakkC1AeHadqoA'
-             b'XKaZj+Aywj77tQ051fflueRqajqf0/ziTO/lshkeHW7T4f4uPX167hlG/Fons7mAkd9++w2pnpOv'
-             b'D9V4Oi/Xsltfx4HJooCqNcYXz1jJD8HXt+z3l82B6sx8QEtN43tU+ai/m++/jOcgZ6qig6Dw37zU'
-             b'RGQXIaT8Yym1qMJEFq+UFouPDq3wwxiICQxKPDtqE2gsOytmWL3Gi/mlXleKSLBIK4xRcntFTXPw'
-             b'CWsMFUBrrD6rdlZm8fnHCDgJcvXQksjUFD6fIZUhem6avx5DlrmUvM2oNw8RWuzlAe/LDTpPUOzZ'
-             b'HLHS5UI9yVgiLCoHbhGotyH6yd0wQ9WGUkvOgAWaLLeFGm4SLqJxzEJTupuyxoyHATj7i7OTshAc'
-             b'aight6piOzhZ6Isdgk5ncWJWiOjcUTemymGVXTQZOEF8kYfK3KOm1zxY9EjExrJEXxju7mS9fKCR'
-             b'TOrqfaPoD469ZyFNe2swVMkxPldO6swerKfti7ys8dccJfLZ3XvSYolUc73Zn3J4sC8zn64s7leu'
-             b'X/MkWBFfrK3DGNtVrpc8HOCdheCU8xzrLMcozQ6zCtVroYzEiEF0gr/KqPraGs2wUUcLHZBuhp5a'
-             b'VdYOGgCfaAedLSkYNAiHTxbTQeeAGVw5WVxYgp0V0satLVabiZJrY5sObpWF8ebzAiu+PDmhJw8/'
-             b'kXagkOOREiwevTz4kJucPwlpczYKiyoJWSyyvrFB6ztMIL9B62VTihtbparvNKaEgbADhC2YHybJ'
-             b'TkNfH9R9eZ9l8RbwMXtycBxbCkA11JwrtzqmKkpC28HaynIIslsg64xRJNOEU3wHj2JKVciSVEUn'
-             b'B4Z6Jq0sNygcpfXcaWVi9HGJuciDV5iSoF02ZknMXszlKh8cXKX7lxPnBcYulcPTMTapgJRrEoUq'
-             b'Z6C9+eabblGxL+s6cCtxFDbcO2Qt2WCGY0MYheyJ4pSd5VrniQa6DmYzqfBo9QZWZaJScEKTbBBc'
-             b'PZhsTpOz+0RTaDY0vJGACBFpvyLvSYQpYsbuPIlB5ntSYS89h6tWITYqaKLag84nE8cJibWBPDfN'
-             b'xAotM9BacLoWBmtseKVua6iNPWrCffZvzKlu7hrPEW3Qpb+3R04WWqXmFwxu7jJfVCfPfYNbcNsM'
-             b'u5gVpxZTqWzXnwkPrNlFK6G5CV7IGvNmbRAuVCaXl81GBLisZY80C6728CMkv0B8hM5Pz1XOF7zs'
-             b'C+BXZXvAM3qz0aZN5eLOgd4H1kh73zBfmukUp3o7PZgQoHbXckMkh6pPkCuhLqxYnNSdH7Xd4Dj/'
-             b'6MoWbWNh0WhKWXOZWyt4uUSlZpJ8PunypsntGVaxlYVqxHMeQry0JHKGWplpLK18zgw+vX/vIT19'
-             b'/Ewc/2YaZrn78wySLe99Ol/SjZs3y4K6KWIXq6LWyolXn1sTkFgrgdVoSwyDS/USR2qTNsBt30Fp'
-             b'lH0RlDmSKJy0lSXx5vCqdBZ/joFzNb+Sn4HtBGwS6U6MfAu0EVUA4LJoSwRN9jkmtFFIBuyaZLJQ'
-             b'CTEe8pyy35NxvEbH125Q2t/XUyg/5EgnVvWjtiMGiznAwckOYkpW6WitHAoYlMpxJrkb05RnZ6WC'
-             b'4O8ZjbfKn3c1pToAiJyMgh21MxH0gRb11kKxUdLmBOFbFnqYpj0Yspm9pJwboK+23Mxb5WpWqK4G'
-             b'ERcZqidAWWcHgx6/b+JRNDZ0VduG4soyIM45mbwYVokYnD3HG9S4fC6TpVoreNNiePHJowcIo1zS'
-             b'8ZVD+vTuI5lNafTLIJ/n/Xul2j0/p63NNaWbeDfHIiaSmlXL5xS7WC0BQQMQk61hNk9quAsmoPBB'
-             b'HhZxGy8kDyglT+r1kYNt6qnmKyWzw8goo865TT5v1he7/6zPLc+HPU9x5PzAhIOu0twjxGBQCsql'
-             b'SLB/RA9p5EPWoqzDrqLEnElEGCHV5GScXrPPeshTtR32QpDto6sSsG4ZH5oP/xmikIi63XQJ5lkZ'
-             b'bLNZDsjiqkGQlqWWLWZkqCWM0XGyge0AJx/1/aK/uLy8H0YjvwHrjR2dFEC2QaDUykiBvMTpSBcP'
-             b'MOk680GFGkhoAzsfaPY+/6nmvZoGKQ+uLFapZrg0AEP52Jm8MD2n0caOAyH1JoC00zMFs7SzVuYp'
-             b'rpB3339V09nppUMJno3Jlpy6kKnN0aonvbwCCcI4HsPdYJ8TK9i4TQk8T4D0n9DaEwkwt7KkgjBS'
-             b'efZ5WF+qH37Ixc/Gi3l575/evSu8M4OHcveTIyo4QoIrkM3tHdrbP9JFCmqz9XLiX5ofLValIi9w'
-             b'rNnpo4JMVUmXhKeXkWvj/pqsC5K1C2QD5tgUbh8BFOy5NwlKJNAPpB0a1mQeaBkzir2pBApPg8bm'
-             b'ISKNCOIIVz/li/1HUg0JNXsGs+sAJEvNqKmvR7v+XVLbBcewxHHvYW8Ck0UFlkLbLzcEEXmciqD/'
-             b'+B6ZzaUtbBgYfgi78Rgb1YhG62MhiHPSrcwWnFfZI2lFFVyBYz7SzNJXDFRXq/C0OstMlhYcdKEU'
-             b'nl/XVR8XmG2GhDIqSjacGdqANkQX3BI1ydRdzQfzwybfQ+X6Gsg1AMi6tODPYUB1E2hzZ5suT0/l'
-             b'x+/sHdBseknTsxOlbJRfc/3aIZ1cnOmiikDKi8kF3blzm95+602Jo8/YMWKoWDKmo48k/XtdfGns'
-             b'C+RruVyAAN4cDkX0gc8k2mfporAECXlociYz+bDGez6pAl4hTDB6SjAUk/uVstoHrARE5ZYTebCj'
-             b'0k9wSdOyIZA3mXw+tqjKxGxCNTtYcuXFcTN58FynHCqfLyN5oMbdZ+el8jVQujz54Tdhrt7mBLo4'
-             b'xawbjtEC34fX6SE5pUTWh/IczPkgEZ34gArQuIN870YcXDP2nuQRQY5Hkiyz8by/deu5RzooX3o5'
-             b'CKITlDsN+qLR8/MPmVxOGjRN9pvTw7RocB2kUsRV5dXZplYBfrqQJ8yucGrIIIOHUO2hNnCU54G9'
-             b'HTybipsugbeyWxa8IbhxUeGdGVThXP1OTY/VYsc0kRg3Sui8ylNxAbkXw9V5nqliw/hUe664SEOT'
-             b'KJ0GvZn6vkP6BeTtaO1kyI15EV5Kb7eS5evgGg26cmL59M5n+rDh+ZuXz+X569fKZliqqFmi/cMr'
-             b'MmeYzfUacxaRxGZgY8uocFwR4RUVkFYeh1b9RVbOSKUDBz9fc54ZSY6X3SehSs+tH63YGbQEG0ty'
-             b'WKGCa6uRZ58ByrQwsCF2KsIZIW+khJ+l9AHH+nCFBz9QQGUtG67PEnTBHnzq2gBVh/p+rZceMIGq'
-             b'Nj6k9IKObum8YpqMmkuVywGKxRr8M6b8PT1vWhsUufoq/9RW64h0i8bg3Cb42Hg6WBZWYp9TdjWi'
-             b'sy4btU3Gybmz/47qQMIPu+ycO4WgqgcrQ5Vl2rKQ69EtQYATfUEJ3t6T68Izw1xnHAGBhJZssFbe'
-             b'63w2lfnfzsGhIr0gfrpyuEt3PhnRZJacEcifz0cffkxvvfEGTKh6f7mECwsZG1p1c+pUUDUM2Ixq'
-             b'9cTPxgjR6lahcGvVM7wcl0VNcGlVEqunKNcEWmpzSXM7VqdGIaaHBR+RVBiCPLdxaNpqqeYo/ScE'
-             b'n+zg4oyN0ON9LA6DW4LD3CXzg40cGum5ynBCMztv/IuhosFWkV440Ay1RkhEbe/VYdLZyYcVfrmE'
-             b'qd07RalBIbWe1NC0+fD67D6zJ7NUUrP+6Pj4XIZz5iYGDil3kBTlWNUeuUp2+aa6nFyuSHA9pw1S'
-             b'ci8nwW+zE2lyAUDNb9HGj528yS9wrugLb1PU3NueFpOJiCjMUCsQ02yxGzWSwOZdrek2YwBufpdk'
-             b'H5gfRGPF61TeQFWm+BEpV5MqDJsEZ7059UXpyR6g+Zw/eBh9o/+YGM0Bj346z/ymkwoqxYWVEyNO'
-             b'XNyqOT87p8ePn2gkAKkjnSnWV64cScUz3mCF1YGIDDRxOoq/Jg/2XptTmLzvvsZLhHqaRxymSuCb'
-             b'Fu+P+4mWiD4x+T+fKlkiz4w2g+gmzVP2FM9kLRGPuld0Di9mHL3OAXjz+aV8PoKYwikwWB52Nu8L'
-             b'ZkY2kMU95dT5FudV/nyEBc7CElPudXEneGCQlVXzdExjCH4ame/NFGYIKzT0jCO8yqI6m9FweSqQ'
-             b'Zl4oOU13vMFxKDsU1zZ0swdK2BbRBNGPnKIHVXQ5iy03cGZPqNWNLaTBDvFQ08IekNWP1Yv/ag51'
-             b'aJCohyVM4mbKj02kjhHNrbIlyLpl++aWLOIkUsOD09echenHmxlXOaz82zs4osf3P5X7iAM5r129'
-             b'Sh/duYsAvkDjspnf4wyq0xNRrQo3z5SJVkVi8eYNb7S2JSKPoA+RHm5gomXKukRylIV6mVS1l2Gl'
-             b'kPuo/HutvjpvcyU/DJhYqzHDglJjY4AWmB3cH2cbRqqG5Ga5gBbOlXK1Usk1M41qJWRzqRhtRloJ'
-             b'J8vJZTO3D+4tsxQG82WGFbN6aMYauo5nm5lhg88r0SCxev5olfcXoADWiihCXUoePkvo0JDP1Kqj'
-             b'w71k8l46nR1HiMeMACLLUbeM27sHz7p+NEvJ+FctCzp6/98eTzvV8LmHEzzzUNuA1UOUa1/Xh3ix'
-             b'AlVzcvS/MdWCDzETEmyTDNVczWFGw7A6rOefOr88lwezCw3s1nr3tiiFGkJibTxT95i4IdQjlbRS'
-             b'hiE5rqhysdt8ooojUdMwTpt8Cu57ONWResub6HxBaxxVwQ+GYOiXSqIYlk5zD3DaMOk8p9QQE3KT'
-             b'aJzdI/X06YngkGQxgF9lZ2ubtsrmxG3hwyvHUGLpDcDtwgCZaoCiy02tYOrp5qHpoUMeVh/Q3NwP'
-             b'2R5Q23TMqNs1GT3ZsUkBM4IOM0YlG/BBSy9SV177iIUVswtaXDyjybMHNH32sFzfZxSWM2mLqYJJ'
-             b'H0guDCQeO6dGPo8FNmobQej8oca8yz3HIFORousci0Ur3KDsO+VGyrux1wSyv+wdMaNdGdxzyBUs'
-             b'/2+W2vOcj6vjNf4adeUwEoWqwQblTZ4Blu9bL/dFz621yWl5fw/p7P7HdHr3A7p49AmlyTPqh6lC'
-             b'SVv5cKpWhQwJdGwefjOWRqhbs3mbmsS7LEDaARuUqiOlShWl+qBR54itkMA8GDutY9NFVbuZVSWY'
-             b'otX8jDk3ys3gCQTSMVgbq12g/NCd3UMar28rI648X0cH+yCLgyxS/sdlWVc4LJFfo6nFBks6x7ld'
-             b'26GDxKTz/Cb6+Tl5zI/m0vHBdCbXmEkV0QQXIPLz74swB7GqkoUevDG6rxO0GWYHhpXgvOBihjqN'
-             b'yDiUDE6z8NxVCDkUJ7faRGpB2LnJas21UaPz/qwbgzjxyqFH1l4Hs6L6ogYpZzNWyiubk0K9LTXA'
-             b'i1OPQFK/Hfom0WKFkldQsdms+LAhnYysny2/voW0v91eqJW2kytjxchRbnLW7HtSzSWUSnx93j+8'
-             b'e/fBeH3rCZ2e3wiIX3Q8P3JxLFjQKQkwMU44zVTUddEVLHU21BDH4XOwFkDwsZs5jxskUK5/Z0U7'
-             b'T7bhkZf0TmYvF2s2uSgn0y1z+SkWyUp2K+9zak79WFABI3UTaqz4pAhpumQ7pdo6tgRmNx5zZZQq'
-             b'R8wHgCiphT6B1gPPkyR6mqO6YWbtYkArApef6daQJVMbW09VgqwqoUgPHzxWy4Ch9MvPPTo8kIdh'
-             b'XE7ruwcHYIdpLrdIumGwEJsBqjdVBmXvK5t6yQCk2tZrqBGolkVdSSrd1mrITKDRZ9TL+SA0BnII'
-             b'rLLFIvKfBmw0uVRNk8m5MBoTxBJKbe/9sNLb7Y6WsAuLrI2I/ogYvCNmLBkUcsno6vG0RNyJnc88'
-             b'69oREXJoxs2Mk2KNsTcO4TKhhDB4LT87CBCsW79WeBopHsQ43XXBh/l5Ud5v2YRPTp5odbW1S335'
-             b'J8+zEk7n2cQOqbb3bEGLNvnne26pWB2LQ7eOBrf7+L6bS8x4kAOS7MoDXn+0VGBT1YYmDl5bz7Z8'
-             b'GgzUBEGpyefO4B+K+Ej4hOpz69bXaHY5kYPJwfF1+uzyA3mt66w6LffrPc6bYjk+6b129+49ev21'
-             b'LzjIWe7NUEMl7ajPMxm2UQQxgi9scuACD55VdqOoFR8DAFKdb6kZN7o4S9R6LF5BeCPfI9xu58+L'
-             b'86ckjZqfYQ5jXFvTNQLrXe02QfVHbSVa1zYz57qtIVMzh6nrlWyMqGa9qZt0reS1QgRC6N7UNOrk'
-             b's0frJPi6jFwwObhl90hXv5212oMR/6vsP5iQwiftwWfk2TULhh3Tz0xIGqiylknXd1v9g/MDez9Y'
-             b'ZqsSgfqRA1I52D1+9Gjad113Nt7cuZidPKgIIvSaKdRyrX6AUIWUf39Ryk2OLl7f3CqnlE4V+jl7'
-             b'9EENOUxe6tZ0IgsIJGSbNOBOqhJRCzxzT3NqfVb6YKlfZ6k3aacUclMuLXFatHaPLL5uzkt+wqam'
-             b'HTQX74huYL0E8YFGAU+JeE6AVOGhcTt4/XHqMi+2zLvr5DXOhEHHD0wnnLq55sDIz+VKS//9fDHF'
-             b'qcsWfXJHtpxys7nBB3r48KHAWPm1sEJqo2x8R/t7ori7cf1FWZRldlP+wppUUZVtqAsY5LBoLfHC'
-             b'T7Ivq8dJ5eRJNgr3mLQjZX673aBqHmuZWKt1Cem+qLfmIAlk/z6RX8tpdUnTixNpb9pZUuXlyGuC'
-             b'0q6PzTBcXscS8QzZF5keC7R6uhS2yTzDy1KdTcvpc1ru18llqdQWgwAw+dQ3L18DDl52+uTFVM5q'
-             b'QcUp41IN8LxtfX2dNjc35bPcLPf9qFSsa+M16tZwH3CLeOjl1J7TzNsxwmQLeg7NGIQbxcOI83Jf'
-             b'ltc5mZ5RGI1pvLUnGxYLBGC+97gPm5ERWrx62SDjz+SVs/rNBgjaUnnda9LiguqlUc8Zr7N3U79T'
-             b'7z0SvDno5QEiGtvIg9JF7PvI0FqdK+O40uRnYL18fgw3Zt4ihQXt72/T/YePSdasoVSe5fs+++wu'
-             b'TWYzVbdZEnc2pM7QKMqUC5gE0qyn9Ii0XDGTAy0UGiWaQpRHep+k4IdBblWPekW+SYdxrtExQntB'
-             b'zAcLiTpkXVk+GVNcFqKIBC2duyixGq7Np6QdOwCDUTkmbPyygVJGkGPNz+oEF6bkGMGIlWd9LnPq'
-             b'BPVc3dwCmWEt1GTojLRyo+mYCjpRE51TozNWI+CNLpLhCw0VGWWrXkC7OSnzkf+MO2zcXVgsdS/g'
-             b'dc5amIrqik3sU+2HJiLPCKz5vnTa33j++fnaxubp+ZBWIKomN3bjlx8Y7USvGwMbetfWx073tTlB'
-             b'DnWYaqoz6/23fVe9Aauyz7FAIa9UVblx1ruAItQWojDkSmWXu0W5ydfVST1fus+kQ3xFgJnSKAby'
-             b'1rj9Uf7OnKXU5T8j9LazEPGXUgGRpNKOhCvWQRXFP1s9OlolhtS5Oz/gATKfEN9osmmy+m1kp77g'
-             b'qiNBpJSLPOX3ILOFrhl2Do6N0g0kSstuOp3T02fPZPEMQOzvHuwLMogfrq29XVok7clHMn8GnO9D'
-             b'xoPMD8BIacuo/QMMgjpfA12jA32iqUOrqrGdFValojwc/QjVFuY1OMhIqmypmBbli1l7JGDfRsgh'
-             b'RPSaMRNAONDOW9Q4kJ5ks5dYgHKdGK55dq4k+GdPntLJ2Un532d0cTGhWdmQ+HsGm/PgHtWRQNcE'
-             b'ZtJKBHbyuBl9sCLaXoJiGq0JVWFja5N2trboYO+A9ktVsLu7Q1vb5c9ZJLGmEuO0UBf+MhnIs7ZW'
-             b'UrZUbK0+ewv8O31Ms7J5j0qlMN7YLdd1U+Mvs7blKKVGYQqmX4KpHW1Nfs99r4ouUeYJimZoEqOD'
-             b'dwZss4pG9JdNKAGCrgetjK5KgPwvoFWmz3MnLeIA5aHMnVNlN8oMqLwvvgaHx1cEQMum373y+e3u'
-             b'btPTs0utbbs1kaY/Ltfx2vGhzmAtYgVlVMpVCs6zqb5s6qLyFbOsHT47Ubf2fjDTg9GoXxNiTkdV'
-             b'Lp6WGQc6VcCJ0rHT55V/Ja8BQqKQqBs9QLP6lm/C+Xwqilx+r0xDCcHAyT3gsHpQE9TXqEf7UOHB'
-             b'BNo5L+Ty+LEFZanYMX7Oxaxf/i4fqNhuMi0HLDIxWWPSDeaDgoQn+n2VK7mkoa5nKEK9kot13kUA'
-             b'w7QYu5wrhMDxbbEqpK2CnZVnkDdRqcA11VFoNwnYKAdqhdpVy6jAtD2MXK6gArdrx9ce9AfHV9Pe'
-             b'3v69h+VCjUTREZwJFbAxeDnYVEDS6iin0cmFavS3trehDEQrKDUyTtCCDVxZ83Xsg62AUqc3uAs5'
-             b'eLvFFSmxqbo6kwMHj9Tih3zh1Y5+WPywyoyk/Llw54BSkaW3H+nNwCc9y6paKnGgc+c3yc3jiy8M'
-             b'vLA5wnEeGiDuEguDLqjctloKKmZNTu78GpYgVLMvp4vBUf6WfhwC4UHq6gKadDjJLcjJ+YQuy+ff'
-             b'xx6k8I6OjvblVHl05ZZJCZVUXU57hBTVYCIRLMh84gwNPFVP+r2LSNR3AxFNICTsmr8EC1eAW958'
-             b'aVjYI2YkxmKLyDaaX5zTfHIuFVGEry121YbiFvFBk0B70s2hl4WEN6QJ3b/3mO7fv1/+eY+ePn5K'
-             b'p6cnpQqZyobUwW+lke0d2H/ln6H3sEYjL8jgtnW8g1Av0hykpOrQA7Bi3JNMap/NTunk2Qnddbal'
-             b'VvA89OdK6+Bwn64cHdL1K8d0dLBbNpt16ULozNMoKIjTCDWME2gT+d2LsyelwmI125aQwPv1rTo7'
-             b'tsVbqNNGLdGNie8zM0bL+RCg2lHfeyaZDcUjhSaqJjjxQjY4RMl0ruDLTmdINnSHWCOgyyTpysFo'
-             b'CcHnlLyYL8pBouxXdPXmTbr9/g+k+j3a2ymHixMxnaeoYYm3P7pDz10/VmFEax6n4JJm2zD5fXFy'
-             b'dJWS65yLK6MhVxSQYLow4PfcOWddKmqLD24Sdlmu0RoqIqd4gH5uVoJBOgRghJJ2DyKnZAdQPoxc'
-             b'k5QLmCDRj4i6YHEQ31RrvQVcJgBitS0+lmy18s9SAQusF1BowpqTG8yYopcgBBsQj0E6kzXLTVXz'
-             b'VepDiE0lFaoIzMYhuZWPh4psS1ZzWKijpEZreGPoOt/w+D5Uoy+U1h55UyFQFLLHwFh8Iq9n16+V'
-             b'Taocb1ga+oCrjN5TOVOb1eiSDOXkJYS2cR7QnC7LzslD+hirE929QXJC63TQhzA68yKoyj5icQeK'
-             b'aSXdNHsCpW9I9t+dIG5+h+pjIZlPXQqVOcPHwacQ3oD4FNdhcNxj4DmYxFbc/kvkyRgsMspCIgdt'
-             b'xgwNdfPMssio7FVu2EEH7BnQxJr8Co+PlMO9SDNl05STmoomepkTLeQCB9+s3EjhPW8FNapUnUvr'
-             b'09NT8QmtcXSJRIgH2lofyYl1e3cXgWihtvWadl1jAEAJPoIxMTUpmjjVNKV9h353MBVvV2XQok6M'
-             b'5HOTAKqxBhpGD2Sbl+vDM5jOPZpgi1nRbxTxQLLIyAltckEPHz+mu3fv0qeffEIPHz6iZ2VTmk9n'
-             b'cg1HMmtSD9aIyRsheldAbQRNTZ7UcjiAYM0UEvPChVyd9aZS9CGxqZUCFnGcA5XgrggXrki5xXt6'
-             b'ck7Pnp7R7Y8/ls+VRRS7O9t07fpVev6F58s/b5QDxRXdMCRaPDtn0hRaoQkxYIUj46Dm0zPq1rdp'
-             b'bbNUVky3QODlALNyBOl7PkeeEfh7Gcmy8twshzroD5WmT2jp2Oww5sq501iPhc+k1S+WatteBDGE'
-             b'mRbUYwaXQ7dDBBh8QOQFd1HWje1Sce7u00W5jw/2tsu9u0aThV4bXqBu37lNX/nKW/JZtyrLjJM/'
-             b'UXYyBv98bjP1o3UX9Mj7KZ9bFNZjDSo1WnqA2tXAvBGzYa6YRNRkkFhEF6n6T+/nbi1KV0W7EPDX'
-             b'NSpA6ZzwWjNfipjGBKARz4nikdSsLjrCpW5euun3mlId1SfJB4XZ9EK6C07iz8FFK5RNydc81ZFa'
-             b'cbi3Ap1I4UrsUGftuc6egmXphYxug7H5gpu4qxiOPJ/v8vzCZ1TWJeCDYzbBGdWZpwvb8Kz6Zop5'
-             b'Rjfq0s0XX3zaXzx5zImsd/m+3ZDE0eSLGhnaA6c6vag9xABqrpxNpsLTSostdxLHzuVfjnKxCotc'
-             b'q29G2lwHj7mBKDnxmSoUsvH2OgbXYwXsVKg3FfPZ2KORMd/QtkePfnQA2j9oa8VNm25lRsW08E1I'
-             b'hs+x5tNIWwbVUEAomXlZ3LRskFDN8BayQS/oH5Wny0mLtA2UcBJtVAA+y8tIPpbOy6BVFL/Wx08f'
-             b'a/uKH66yEV/ZP5SZFhsnhTC+1E+Xh7xdZ/Jat0Fg0yJpr+iMIfrNxFDd4HFZyB0KyW/ABBtC8Gws'
-             b'0cTr310uwJeD2VcQjAtasHdoetlwuoIj/NUfpp9Zj5M4457u3L1HH/zoh3Tno9t0cnJKs7K5yYaP'
-             b'dFumZlTVqFYTempemEWbBhv6mrCC21itahLvI9pcKlriaKgLoYU1ilAgOGSzzaMaQiOzFV8WQiKB'
-             b'yXn89JQelIrvnb9+j8blEHX12jG99MKL9NJLz9Px8ZHMi/hQJN6lpHgoU7YmLMxKXDily9k5jWf7'
-             b'NNrckc+dj1t8EBNhRKdetYgiMIC8zVUMH9AsXMTMmSY7X6lS4H/LyzmqIzvAZrR+IjLlbN7cQfln'
-             b'M1QVr4RQze0mLog8Hhjmgq06vnGLLs5/IM/b3t4eXdx/LKdwXuCflevN7WyesUqf1PXLuBZ+ngL7'
-             b'clBFsO7NQeAeUd6zoob4vkmWxhxsoUw+kpAWfhzpYVUUsdYCNwZgp4KQXoUnXLkNQu8f6eGc78te'
-             b'hUm9VKuDtOrEX9kpCydCRDagPZsbUHBCPztnJakIYoxnt/NyzyNAMHnshvk082oeX/bUqJXq09FS'
-             b'CHl1f6vtnKEeTuSGH3LlVbqIwuTtpKkJfo6utAsOZTXIse3aF2WPyLHNyoveLauhuXitOGAIGWlj'
-             b'89kP3//Bg35z96A8LDc+U51TIlOUU0PgdQljCPD3qK6dy/Alyw1ZtFA+SFbXzYa8gpVfObbnRr9v'
-             b'n95Qx35toGAIlXxtXI/Q6IhWgIRhVcJvWn92PY83t9Di0/50BwWdtLs6OKeTGSfRioyK1dH2yIBZ'
-             b'GBbngH49mGedcb5QgUUsCN62gbFysJPRXHvVdnJLi8HzY2ocbqrmPmrfMk7ASfu3J+WkHnF1+V0d'
-             b'HuzKQnRweEXnDzitrK2NteU2gOEGzA0cpJVcgE1W7/3k+TXJblQAIzOqk+SRKuT4FY30jhjeJrR8'
-             b'5jQtldByfqFRBQYzzlX9xovCSEgcc3r88AG9//779MFHH9Cjh0/kNLrGJ3ARMGzSEny9YH1uRIZQ'
-             b'6+g3/12w07depwFZYP5AJvTWIwQpqpn1B6oaNWvsPYXabs5NkqjNlvJK0miQXZf/FW8iPYcVZl3I'
-             b'Pv3kPt25/Rn9x2//Rzq6sk8vv/QivfqF1+jK8RVZ5DhlIAMuKkIWQIdFpVk+28X5iYptNjdoNN7U'
-             b'oT2up16fBSC/CD5MOGKHvPL4tLeYe1rsXsbsIduGk5IveH5aTkNDV4++WVncTmOgUtoHt/5Z4brk'
-             b'eI89MZs/e/SAjg/36P6Dxy6+WswT3b/7iK4eHZVnd1YrBINghyp/jzgR8ntmRSRXQ7JRDjrfzehY'
-             b'LJCtpVQv/TOZGYPeb7MoDi/UA4m2cUt97sb2wTYq7hBQry0uVNkDMuoSxApGOYmo4EQxKCnbmu8l'
-             b'BmQWZsg92LnSjyu6NSFqTKSaigDx5pBXJf+Bmmq/8gtdUWH+Q0NFedpEXLkXMuALFkZoQIPQLkTB'
-             b'vIjmK9XuUUA7d7mcyiHI7BvaKR9kJhWN+umdNqoGX6oCKZlV4+CwtrZ5Oor9k/7bX/8DOj05+Ywj'
-             b'G9IwQRy6tQpzi/2T4LyuAibkIl5clMVnsSe8LZaCWs82Rz1JRd/oICs0jz961OSgWZPHi5MYsM+8'
-             b'4vBu9+KcrXcORVkiLxdbleC8LI4sIhiQzaNkAqirUkLwF+mAcxS1WBAFoG4gslFBHaUEc1X7deZ0'
-             b'T+jjInZd/h0W4AE97KVx5UR+rlTvXh6IAVHP0Y1tK4NJQsVHtf3nPqry8D05OUOvf6D1jTFtbY5p'
-             b'e2dLuGkD/BgBeVtCf2dhSI+AdyxCvEb3UEBpS7FDi7FzcK9L4FP2IXswnkprtrZN1CLteUw/u6T5'
-             b'xakSv3nRMKwRrjv/2bj8/ovzM/rRJ5/Qe+++Sx/f/pimlzNZqLkdtlbel7ZdgrRTNQcvuppMm8fJ'
-             b'KxjNFouqFrMHBsZFa0P7+cmqpvITlqi0mvZ98/jHSngweHKgZp7RGMGr+hchrVFD9lwy3jnBX26d'
-             b'8nnff/CU7t97RH/+F+/QjZs36LVXX6FXytcWZzQNQRJvAyjoZu5kw30epjQ9vaTl2iWtbe+X+2uM'
-             b'+VbWVNcBoXxcXS0WfjCztubQDLM1cBHLSRq8jaSCqB5cOBNopDoTiuT8udCYpSPsIZUoQk6zYJL5'
-             b'/HIiB8irx9fo4uRZee2JtrbHdHIxxSggiMrvJ956w6Xuxih00zbaTcl51XrQYhvD+ob6sdKgoF5W'
-             b'v3aobEx0JZuYdQpiG2ypghFeLkYSUqhqQU4HEMXdQk3MQugHdSOZ8drm3QgozSIbz2o9kdBYtAw5'
-             b'aFRUyJ61Ao/moAbr5UTgsY7CAtbIGH+6Y6SaoeXA9VwDOb3DFJ3kTiBpOCUnrxJLtAcQnJyTVim0'
-             b'K6Ggal/R5+ayFAUDZPp2dOP7lsV1FleUW2zHygzUAAAKueaPf3tr+/wLX3x70t+8cYPWx6MPvr42'
-             b'HtJk0kVzxYU2QbeWfSZ/VphlFjUVL9LSMx0GT72tku46o4rZpI0tRiNXJ3WiSnuMqTGfUSORtIyW'
-             b'KCICsgcmUOPUANoJRIt5KTd5TmFxJLqvqRrOyduRwa4a+9FbrHmoSagSAY8wQwk5g1RfAahaCSmo'
-             b'M/owOQImq36krO3B5QA130LaOoaSMnVOyo3qhsjhlQHkj4Th72U5HFycnUKtuJQhPbeLDq8eywNj'
-             b'bTvJLCJrRYywuKASxKlpGKp8PGejg2R876APxkqyZ0JLNzuGJ4MJZsNXvtY86GV1mvztHCqEV16L'
-             b'to1Pnz6jP//+9+j7P/g+PX32VK4bq+a2tjaQagqicqgw4M7aHdzrD+BXcEotWXpp8pmYn+rMxe8Q'
-             b'5AQ/CtpSOOVZq8pSWvtoG1Pncw73pZhAxNjkqWYceXxE6/+g1DS+gIAR+jdXlz0MnZk+vfMp3f7w'
-             b'Y/r2t/6MvvD66/T6F9+Q+ZWwApdLzFQ696xJtcrS9SUrbfdotL4pqcoLVPj8urkSsfvZjKpNrri2'
-             b'6Y2TyJs/V9197/NVSQ+Qk75K2m3uk21xTcBYebhpVGyPJUi3SxNXQWWB7taSHCLHpcI8uHKVHj34'
-             b'TKqpp+Xw1ZXqn+XWDx49pMvyPSxL57mNxUWE3MRlGMjVvDsQIPEsJEi7e+xINJPDK30bgYrD0mNM'
-             b'CNEs+lwnmXWyd4o6tSLIGtepICekocZQVFMjPHiDm1Qp6/0+2EEtwa8nOgASO0TfeC1Zjs6qV4m5'
-             b'abpFOZl1pOGBZuP11dBZw2dVy4i1pA2UbLFM7VxolYpBKTdt4Qr5Nbp8avLFErxwi8XcI+kNkbWE'
-             b'Atxz8EJDt6HGYpSb7hh7rcqmvrm9c//oxtXUP/fyy2z4/Hhja/fe7OLpcwy5rOo64I1yVR1p5hP8'
-             b'COVfTMpCJGeacgOJXJOloNYCCa0gwmhg3YrR0SCw+gEQsDs1tAudfefj5iaaO9hwP1iYYsX+6+vX'
-             b'8DaRzw8aosbhakJRSDDrLlXRYy26XtD3g/SmByTCSruwswZ/dA+B3MgLS561Pr1J5bOH+UlbkFsN'
-             b'C62k5ISxXDSmtgbm2FSp7UVLrvyLsnBeXPB8Z6oVWfl7/KDv7x/S9uYOzYCt4Z+2Pur9JkwWmmat'
-             b'PKSvZlAgBqQkx86C0zJUOrDVyKKdIS6Za4uAFW+4dkuI1Dv2bM3Oy0n5TBVh2ZJx+YTYyZyAW3p/'
-             b'9d136N3vv0uT8l7YazIebZApMjQOwIYOcTULCFSJ5KnNwQUq9d7LCGZcaAqx5XWBONCxTJ8PLuXz'
-             b'G6+NZDgdMLAfkKqr3slBqeDY1HkGKdU4IK2i0grB84dSc7AKTTiiUra6RrtU5yKobT16flSeIa4g'
-             b'GXn1zW9+k77zne/Q5z/3OXrr7bfo5q3naXN9LA+/JPfaTFcsCHOaLZ/S7PJEhBVrW7s4TGFmVI98'
-             b'vl061NniVIIukkZUkQMCWpzS1sOrN3Wrmk0x74xKKrDFPKfQIBXsHs8uCBJSxMaGzFv2Dg/LPXGX'
-             b'djY3yj27Vt6HXvuLyYROyqZ1/dqxwoQNJZYre9P5m74eVGqOVECLRZ2n8GbDrX9Ivq3xyy3pPvCM'
-             b'GQc7ngfxoXKxABA5S2dl1K35CIBjgNSiU3OWlLUYPT1BIbb6c3gtYQ+WhnZqbhvDjJlIMmNrS1Yj'
-             b'ND/Pw5DaCCbHujmb0IC/KwcNK6wsdaERWZgEHeo9I4astgsyOljRPWWVWVi5pInaGT4h125Z7tcz'
-             b'iC7qs8jzwAEeSuNCwtNRGaAeD0UrY59y2Prgr77z59Q/uP0hf3hPDw6vfPTp3Q+fY2OiQI9yKwZs'
-             b'bVfN0LtcJGZscYnH5TJr+HcOxtJCMCapKz097TU3N1Fwp357wnQYaQ5Q/6U60wr1Y8udVbZGIAgV'
-             b'/oo2hEc2JyB/GExKasDjeGaLezaIo48dud+MsjyO1FDXoUfN/z/iCzNbyBxFvBhiVFx6ZLxIkTv9'
-             b'nT1uchYw8BDUNiMz7WWq1Wm9aslLfGutCSdO0dTlcz+j2XwoJ+dOpecHB7R/cKgS+ralCvVigGzc'
-             b'ebmVjOufvfSLbTMzJP+gwW4ix449hogRlWrwxGONqo+yecwvT2lRTr8dzL66dCtLjf1Lf/Hn36Hv'
-             b'vvNO2WQ1ZnxcFiqLI3dOYs0XkB66YZdiYyq3+OkMQKwu3HO3PHDbc3tnn3b29kVFtrW7S7vla2f3'
-             b'oPzZnlSfHF/C2B45PASCGXaQ+4h/Jl//JN4eTYZdLGbix5qUDeSkVH5Pnz6mp08e0enJE5qcn9P0'
-             b'YqJSZ2YksgAgAjdEBrvtnOrdmr6rYT0jgJBzecrPSMqt+0HZzN//wXt0fOM6vfH6F+n1N16XuHaW'
-             b'92bQ10ddh42kvN7pM5ou5zQuG5VwLUP1wGjIZNYNLNsnWCNQqFE4RjePoxIMFV5q0nJrAVqVo5J3'
-             b'4LIgTlCLxVCfzYxqJWgkC6vkdsoha7l4RAf7O3T3/jNRS7Kd4O7dz+j6zas+7A/W+gtDxaRhAadY'
-             b'EUQWhKpUfRhZSQM71ZKAOS2eDd7ERkFbd9phUUWuLKaNGMKEBIOJplLFVCXM44OBfSUzbKHdmfK8'
-             b'iqF5sUS4oa51soEBwSWxMZ6JBbCuK8WCJxk7mhWtVssVCxCCeUYWxk7BM91C43Ss0Fc3SmdjV7Yh'
-             b'kg0Ng3oHwGYEdfF8jasliZyJsbGcRJqy+jYnJAaHJsZI2as56gHBRVhUN7FrN577+OZzz1N/fPMa'
-             b'hfKgHt648dFHf7n46lYeIYMpu9w7QzIYmiDDCIPaxeWUzs8vaHdni6alqtrOVcVHGDTLmxtig27P'
-             b'zSkOpTs1s49cwasZfXtLpjR9fQUXBg8qyyvZOhVzn60lwB8PorRZDTfe3KTldKGNZ2TVeBolcEmS'
-             b'nCobFGCkSwVS8olIKOYw3jE4lk9oGWo2xf0gDRXJt9xyycboC9HnataGzGCOtceC0MSlSBZPWTDH'
-             b'eY2ePTvxPvZ43NO1a9doo7wfm3PISWRjrH1zW1Cizdt6PNA92syK0tFWRwUEWY5ugvfJLUSB/HOS'
-             b'RRHwXF4sZxenpYqa+N+NQtvQhfH73/0u/cEf/CGdnZ6WzXWdRuOxnsJxABhoqC2IBj6is5AOYgw9'
-             b'qS0kpmMo/8xCwh+XBfvo4IiuXb0uC/nV8nVwdEzbu3tCRGFLAn+y3PZdJHLKsqKdsutWZKMy0HGy'
-             b'VlWqXvygJDmhkfBMgSNCytekVI3nz57Ro/v36d69T+nup5/Q4wf36OTxI5URixeGpCLvsREaBzJj'
-             b'lhdzdGDtgClbht1CjKTlv3Ny7Scf3qFvfetb9KUv/yS9/Tfeoo31LWkjWxSLHNjEoHpOk8W0VFU7'
-             b'4q8ach2kB0jMzawfHIE11LTa3BzP7fMwAnuNhdUY9NRSrWOjuCXHkoVQwcTSduwQ3SKG7wUdHl8V'
-             b'z9nO9iZ9dv+xct7KZ/LZZ/fpS1/KNWE2mDEUdVDMsMbkVT1IdsylS7JF3UZa7fHGwQc9YzUOwBx1'
-             b'2IxEDDAshcXIz7xAAGKoIa/W0ckRlXvyQEPlsikNpY/q0+Qujtgxek011jBK8mcs2bzcNhETPVBD'
-             b'NY/VrmFKYCXBW6hhY/S1+i5XW4k5nALoF7pxQQbfQItdqm7VjdkRDD8WQuP2LQXKxZkc9mMXGmN/'
-             b'oMlkquDvjvz96Ko3NIfz4LR+auwoL37+cx8dv/gi9aenl9TNMx1dvfFX5bv+y5pDbw9n9CGYbg4J'
-             b'Y1F9zHnwd3Y+of2dHcHN8CIq8dM5V/K5VQQmLw8J0Ez7d+a1iA1E1UC6vae8WjR7VYNUxVCjEXTp'
-             b'paWYakgDco/I3Pe8oF7KnEaMxpAwk3lVUNKacVdEFlmNv9yeiCOdW+kNOIffRU/AS7QW5WZfZNDh'
-             b'l7UB4UPIjgJVKKBboxpTr/U2KlBXT6Jn5STfwTC3WSqRg6MDj1y31x8RgpeRnsq/oKvYDg33s16x'
-             b'UdbRbuioBu2FRjmlQoOuAiJjJUkw1mg5ndJIWkvKgeRWxmVZwP/o33+dvvMXfymL7Wh9QwbxyVq1'
-             b'nsVTT40ZrSWTLfN7ns+TEDQ4GHD/6CrduvEcXbl+k17+/Kt05caNUh0dyiYkJ0np9avUfCIzGwza'
-             b'p3Nt2XY2UKayCI3VQ1deG58IOwTfMfONDx8mNddTrZp/2fc0OZ3J++9Z+TU+pP1bx3T4wmv0Kr/2'
-             b'gQ3H5/S0bFQPH9ylz25/TLc//CGdPX1Ik+lcjPMMoSVT9VpSNMI0RaEXcWJFzEyOqn6K41HZ6Cf0'
-             b'+7/3h/RX7/wVffknf5LefOMtSQnmezG76VYPIPPLE8URbe87QV0sDTDoBkBrM0DHPhDn6xhSZWoa'
-             b'z9A8+VJ5QoRTQfAU2+R0v3cbk7613lBR8T3Bhw5WoW7xYbecvvmzmTNyqFzPp09Oyj3Ef2aZRxro'
-             b'pwVAs1F5hBzWLMvIyzWF196LyLpzsPMwwfJVDqQLGYdrfM5CKmEFAUSdWSabqw7NzxtA/+9hPIYq'
-             b'VIy5ivRa4wMN7iVZEyzp24j3WDM8sw/It5Bz82xWjVID9PcWrG0eFrRpM1fHyzVVp6RENyxVyzgj'
-             b'/321qtHNP+I1pMrrQ9eDuwaKaspOTUGCW7nXJ2p6HpS/yNe9ij/qoTzQj8X0sPhiufzR7e+WNWN9'
-             b'bZ1iuTlefPmVv87lYXUPSg51c7IyOwbcAEPtSg0afphgbl3wDTbe0As+JN+Igp1dc/SEU82WqtJJ'
-             b'8iosaHJfqBj6nA1bg6C1plWY4cC2oXj1s3gQlquAsrtcdE4lQgRIPyXCItUYbKVVqE8q4YQlgNh+'
-             b'zecUA24eEVp0aAvy5rTkXrimkMbYbJ3e1onNXlxTfFOufWVntGVq8rQyzcsix0ZedccvpYW1tbMr'
-             b'zDyJ8kB4oVR1PWSw4mGKLhOXjVl+8NIjxK0HLRLhNFTpf1+RzUZDyE7qjjJnmpUFeTm9pLWo8vou'
-             b'qNv/flmk/91v/rtSWdwtJ/5Nz+ZRnwtLkVU+bsZj9ZQmb4Xyn/N9tL69QzdfeZle/NwX6KVXPk9X'
-             b'b96izb39Upqsu/k6lfd4IgRrHZJPZwth7vFitL6xTpOLC6l2WeHIixSLLfjvXZbvk1kiE0FKxcHt'
-             b'PN4Y1sTro9L4GSfuCnFC41Z4Ec0+NFeRxWzObeRe6PPL6bJUcId0/LkrdO3lt+jLX2VCyCk9uvcJ'
-             b'ffCD79FH732f7t25XT63Uyp/hXh0GLOKeQLMloKOcUpZh3gLnTFy82QzrouZ/g/KZvW9d75HP//V'
-             b'n6NXX3tVWk7cilbhDKT3zC7keJL1PU1Rdkp6dq5dMGGTVEUjl18Hp9jnGkdBuQYmQvofmqoprQSL'
-             b'qtJV22oZCVrosiCIsYvqQTo4OKTLswva39ulew+fyn3KAojz0zO6duWAFvhdy2YjJDD7ZKNPTk5y'
-             b'hFor085NUmm2OB6Ll+GKwuyAyY65On+Sln6v2CTBcHEHBVgjPVD0WkkI5aSTtrB5pvgnLfLS2+sG'
-             b'/eXNT9fVJlqgmU2uOnhCbYGHmoVlJwaPOPLNQzdp23wzxiEGR9YZaKiphwEtUTkALGvwrccNDZVA'
-             b'40gmhGMuVcHn61yu68XFxaXDCTKO5dqljC64kvklKc4uI2alG29fvvDyq/euXD2mflLKtDCb0s7O'
-             b'zg/Hm7vlPj5ftxfhYYO5Dq1dBJ4raPDZ03JSe0GHyRdnJ7S9twfLTfVIuMrHaQrwKw0AQraLd0gY'
-             b'4CU9Xcbo6I6QmxmfrRFZwwNjI1KvHp7otF4F2mKzSqpaEQnwUmMk+OQmN557uRSSKebC8hrYd9Vv'
-             b'jD0TSsy5snHN9DS40Bt3sZijxUmOmFK1UARtmqoqLOti4UNrS8vMVhaj144WhyoDS3ldymgjIly/'
-             b'flXsATP2KDh4VGXZjAGS9rfQugcx+QbYBLxq9vya4LEOEaZkbceBQB07r6oCJMt8Ep9dsht+pjBa'
-             b'OX1q+OH7771Lv/lbvyXoJp79VGm0Avsj+texz4KSkTYVZ26VRWOeB+GxcU/61S/+BL325t8oVdMt'
-             b'CsJYzDqoXZrHS5IGRSIsalmWUbM5fXNLTq+8nU7LQidKUPiIZMY1VBJCsjiL6VTjzzdLVTKdy+07'
-             b'5LnMEoQgMJ0BLLym4hggs/iAw6fJyUxnYqwom8x1gWOk03TJkRUHdOOVI3r+tS/RL84v6LOPPqL3'
-             b'vvsd+tH3/4Iefnq7POxTWpeU4N5N4Dk0oYOBPMjRqm4e9jNh/MmjR/T//tv/p3xWr9PP/tzP0dHR'
-             b'sdzXCS0q/vvL6YW2oMZbpXzcQGsFyB5p/Q4QznTuNctkMTpZBChaweR6MIR51yo+J1jAgBybLoEa'
-             b'9NG1QIpwEhtIee7K+76YXdJGOSRslc/+YHeH7j8+AYh4oCdPnpb7/EpZ7QeqmnMYtCNEXXYvOFeS'
-             b'qmHc7QE4ALteG3MSVB0a+r2U+5/vMQlWHDDDYxEFqPgRz/cAgQXjkWSjL/csQ7eVXqF0f2vV8vXg'
-             b'ueyC59ID1kEjLuShEc/YzCZQkzVLbYvJfWJGMzc1XqhWCDnsxOyOXpOaq2AnNibMNgE9+Zrp1Vv2'
-             b'Hg5EYwNmkXoP8AEugaBjc0mdNWY6F2we5nuj6H7CbDsn+/0k647FX3rR2AqyvrVz99nTp48vyuG3'
-             b'39jekoXnxgsvfrx9cHRnev/01dF45FLhBq5eIyyQCy8fdHlhF0ycQA+aTZus7ac48hTJmBu8TKYm'
-             b'0Isg462y8WQy4Nj4UxwFHyqlNwYkB4MgjQwpeTjgpjcOVV6pXjQt2Fp/gaxEhkENiBM23crCAN8Q'
-             b'K4t44eF2iqLKgqBsZDY1ArafT1zzhatxqAlRzObr8Dh63Rhsg5KLm8gBrzY49QGns7kUMyKx2eV7'
-             b'NtbX6dbzNzXuwgLLGH7KwXqjHgZQfP59q+2KukCRxqR7ZlSqke1kZkZUrGpathtUH35GHDGOZtRp'
-             b'xTbqNIbim9/8Bv3RH31dFkmWD2c45aMJuCMc5+pMlT+bl79/MSmV4ZUr9BNvf4ne/PJX6Oatl2We'
-             b'Miuf96Vk/pQveV2dbMzcJpJqmMGeDANeU0+LJIOSVvM94sMZ6DkrmwgLKnL5LGaTmci/hViN+IU5'
-             b'IsjZtiBG6PEYSaNLNSXyZ8QHlEEr8l6o4jMf6Ffm3Ug+N4YvL/leYtSNvP4sM7Gc18uG9Sa9/Pob'
-             b'dHn69+l22dDf+Ytv0gfvfY/OTp7SWPBOfX0MQqMYDBYX0yQRj/S5ePfdd+mjDz6kr/zUT9GXy+e3'
-             b'Nh7JYUqYivyC5pc0K6+339ihUfnSA6eR0kMT3Bhh5h0wJ1M8GAuKFCSrVZpSHvQe7yDJT21qgTWK'
-             b'LDXXvEQhI85DPTFSuY7W5DrsHR7RIR9sPrtbNnedsTx69Lj8lNdUmWnKSMxW1LKVamdFBzXUOuJz'
-             b'zk2JFTxWYyUyI1RFncGy+f2lAIRbzh6EGMDFYw+mbroZUFg9ZCaf5yd8ftqeZIqKte+zi7yo+oiy'
-             b'KjGlbW/IuNDowyHcCqHOqj1ivgnBDOrYx+jY1H3JiSnmPXXnagiu6Awu1mjoFG6laLs7imc7k2cl'
-             b'KTIJBxiB9PJIZToDB3SQeyyx387DBmMFKDTynWV5QK4d3/j46rXrZ1IYCPyPH6q18fTqree/996n'
-             b'77+6QWPsIrFKOXNVg9kWo22hKAm9l+WFspmUpdVc4nFUNFPIq4egZu44wMJzTzJO95URZ20UF/UF'
-             b'MLS4EkntBCq5qMOVYcFSb7sGLQSZcnMxKNLqBZYdf6E6CgSA8WuROZtUSDOPCEjA7shcbjlUc5uL'
-             b'FlMdIOb6eyBv0UFtUK6anXQS/ERWUv0ncBNInS/Oz+Xi88d349ox7e3voVcf3I3OC/MS9AfxZMis'
-             b'aZDBsMvQLfWzU+BptqwZbsPF2ltmYUICFilrpLMoI1kQMEhbQxeMEcdalNf4u7/z2/TNb3yrnIo3'
-             b'lCKRrPeca05YCr5W8KyJJcfHt16kX/rZn6cv/sSXaefKdVqW1zEt72E5bTKOygvkKodbnpPJXPKH'
-             b'tsupm7l28h6G5JXyjDet9U097Xb6MIofRRRcROub24K24f/b2Npy71bEjHSJeHph/AHIqgpOVvot'
-             b'5AS4QBaXxpEsBXfE1dtkPkP1PZPTeIDSk0/Sc/bvlL9zyYDaeXmO1nbppbd/hj73E1+hR3c/oR9+'
-             b'9y/pu9/5U7p35yPqS3XIG42qVANmlW1LhVYsERtc7ZXP+0/++I/pgx99RL/wS1+lF196XtoxBLRP'
-             b'z7zC6Rllrvw3tpFomxUM6qrT7AummrSxGTICSIZPC1VuRpsvaEtPB/vwQoZqcnZTqT2nEBcsB1W6'
-             b'SdUBLBdHeezu7dDhwR7dufdQrtGjx49Vct9Z1EnCpkE1lryZfRNmV2Zc9Z55aODWbaZ0A1m1Tc1i'
-             b'zSnU1FzyvK2E6DeY3Ek37DnagOITXGolvVzUdOjgyl4D8+aGnGHDiqF6viisdJEsxj0a5HeFtNMo'
-             b'd3P16LlHqYkZrAyfKtBKEJ4lg1g36uPoYv3gzNMIVe/Z2TPgo0K9NyOPf2fynHQw5+rm3JDYPZoj'
-             b'eBWXEcK8tb//AW2My5pS1rLN7R19wZtb9NKrX/yz733j939dmFzJ4jMG7KrmcM4Nv013Q34hzFXb'
-             b'2b4mJfH5+Slt7x1UojQ1tN0En5XtpiH4BuVY7lzx6eZ5qbHtQNNY5ILHJKeW64qh4VBL5TD4PMRa'
-             b'uQZws41MVGyZnAgt4M+kPeMlcPMCMfUbJVbRvJ/SMnmsi71FqsnEg6RiKve7kqctaM8+L2CFUnYP'
-             b'll1I/t8cPSHdu3KDXL95XcnSZpgbtGKTjbPvQFNKQO83ysy2JeLelYz1KhkqQb1KQ/JSXvOneNGe'
-             b'i1Ciw4PArRtOH/6t3/pN+laporbLBlDvlc5zwBS2m/0huijVzNGNF+hrv/q36a1y+u83d2hSiqBn'
-             b'k8G9GCzv56pHnmqu3M8u5O9vle+9KJU7k/iDtAp7vbYde5/WZWNgBSe36ZjdxtdLTd1RQwdDG5FR'
-             b'54J6GaMrc+rMRk9+vOlJm2rQmSO3d6eTc8lG4vgUU1P1Hbd+uIU1Lv9eM3V4r1M+HFd0YzE8L+aD'
-             b'V7ibB9fpK798g778cz9Pn/7wXfrON/4Dvfe9d8qBb0JbG+PagncCmluD/ebnueBoY0QPH96n3/iN'
-             b'36CvfOUn6Wd+5mdcIJQQGJnzpGxWxIsAKopYKwV5n+3ineC1Svjvq8BnDwJNDUJqSLWdnHVmzFUJ'
-             b'39e9kRm0V6WLYKdoIP7d29u7dP3qMd29/0g2+4vLS5oupuUQMEK0ePbqxp975BQFn582WJ+V+NTW'
-             b'VEOOCbL34ngy68bl4B7NUE1LeuBKZpmJvu0xxsurpTb+ookiMnVvsE0PkACjpoRGEqGVrc7eYztG'
-             b'8nmRQa8tFaK+vpXgQqrJvTAYuCo6+7wxuyc2YlqTWq+fQx70Ok8mnM029RQH+1T58WLl90xaphzL'
-             b'Q96KNU0CtX5ZO8xzm7X816Pjo79+cucDOVz1k4tT/aHLGd249dxflvq1+megNONTr8ItcxU5NJRv'
-             b'vpm5kor4z+ziQiqSYCmlUSuuAJJESqkKnDNVUkHO7qeq+rxalpoR0AGGpudpUtVD43g2krO1I6IZ'
-             b'VAPGdjBoBvy8GGqcsQ2ILem1pr5SpSK7BKCyrZwVZzdQaOZoUiBVs1q0+Vv0t4v6PDhaKFqDFZ4J'
-             b'fu0cF8/fu14Woudu3dRKhaiWznKyt4fZkGDJVf/Jet4W324ZNC1v0aSqpsZ0ckCW7KtpqZ4tsp1P'
-             b'wuujsVRQ3/rWt2lna0cfLLlvkhfGyRZTbguXxTysb9BX/87fpa9+7e/S9uEVOpuwGTWINN7ozzZf'
-             b'5AWWq/PHjx7QurRdy2Go3Ls86+Ind71UTGP2PJVTLJtheTMVVWascQC5aRtngIhrRa6fcTIyRvUu'
-             b'oLLocE07qSb6UW7oJvzzDmWAzC0Onk3xzJBncaFUoRPeYLFgc6ClfuqDtsYhvxfKQ3mYJ6XymrG8'
-             b'vWxkt17/Er30+tt09/YH9Md/8Nv0w7/+KwrLOW2WhVpPulWZx4uC5PdQlYBJ67P83v/w9T8R6frX'
-             b'vvYrdHi4r5BZDOaH+YWGTALGTA2kNBruCP5DDT1cIrlVvzKSnZOJmSxuB16faHMttJcxKm/yhbQ1'
-             b'F8B0UwEAe9w26OqVI8maOi+LHectsZx5i82/oNgbhSW476bZcCAPz21mUINR8k0G8x2fm9kULSSX'
-             b'ltvrX6EimD2kSuYg6c6Wc+8exwpXbWOI0L1xOnj1FokurZ6WquqPaly8+6bCj0WGD3VMEE3J67ta'
-             b'buw+rZ/JnodqCRIbhN1jOKQkFCvGD+S/fnF+Ujfa6t6Sn3l+ca5jiK6v7xNZfHVQhk3P0h6SCuZe'
-             b'evW19z//9pfkIOyVFKdJPvfS578/Wt++GNLFlgqXoshQ63kt1dYoHlz5xeUJYVrxMhnXaxBsz+bu'
-             b'nsw3rUrKyH2iGCqeNxo6xHYAQ6nExtwbKkXAlGEZvzvUslewH46rSV5aS1lrAoaGFdjOjKIReCFL'
-             b'HQyc6DaRXH0t1LQsyLuSTReeanR0rNus4XVUKmqbX+UZqgo0eoaWQwEi1TZj+WzP5WCR6Kgs2gcH'
-             b'B9J2CsDqDLQU+oRch5B8q9e02d4fHnuINW101CgpY+MxT2STJOXFKUlAlY3JZ3ib5YT/7W9/m77x'
-             b'zW+W6mYdrTJVEXZ244eIgNVM52WDeuHV1+nv/eN/Rjdffo0u5omeXM4V6CEb6Fxem8xyeNAsYoUs'
-             b'G5Sc7EvVdrh/SKOysK4JAqjDQaPp5zeompxbpqPNVePKgcQuov2ZtfxcmZSriVg+y4y8JxMx8FLC'
-             b'MwlO1F3fot1dnefwQH1aHrTZZCIDdRbdMEJsjHnTsOAZV0dD+Xe00CqDY+NZDcb+Or7uV196nf7p'
-             b'f/15uvvxh/TH//536f13vkOj8rPXx+ppDN56yWhl1pM6v17ewD/88Db9z//L/0q/+NWfL1XVV0Qy'
-             b'LcBlniUyxJTXQQnuU/+jRtFbmzb6ZpMxdzJSTgTtPCLgjnDQlA4zvzbuVsQeh0ESIc9yWPohOPii'
-             b'qLimUakup+cKYd7e2qLjKwd0+tFtuWIcfyKwWbZC+Cw6OcrLfUtknEksqCF5t0BFFhES86V3cnw+'
-             b'xX87Dt4taS0YEUIsT7Rt1K4xtN3A2qQnO1yiEtK1C6iLZjMjJ+1UBBHuxKYdGF0EqPHyCYSd7DO1'
-             b'lvuZTCiCxdYtFCuev4qQyy5r7zy0NjcmcGWqAo+XtEMznxjyCFYEX7ZDOUyfNcQoOwCa8buqFv3P'
-             b'cAk3Nnemfb/2o09vf6xQhZOTE9/B19bGn+wfX/9ocv+Hb66ZIdfUeKHu3vbBZNOflcXr5PyCZqXM'
-             b'ZXUSP1xPHz+izZ1dxA3Q6skjU+OJStVkTIbCMVxQTVFrpY/B2Gs4BQlusAvoldcLn521lv09qo9o'
-             b'CR9Y8FBHNasHR+DLhWgyg6gZNrryM1RagFVoVBnrNbXUPV22USUvmesmG/DgpYpVidXUR7kOM+dQ'
-             b'kB1duSaeIeZctac8Rvf0KXoel6qRkMYbQ8Ux6TUXGXsGQcIjU9qTZuOt5c9vfnmO1M0kEu+PP/gh'
-             b'/d7v/q5sjpT0s9Xs9RqlkFDRTkoF9PNf+1v0q//wn1DY2KOzJWfFdoqqYcViVuk62+/5xCUClvKz'
-             b'RmXz2+LE23JPjfoxTJP1lKpqqeiQz2ARKbJpBZc6r7QtEjAwdj5KiMMIvcN9zToQmnlFfRRwujZR'
-             b'iEtzI8jg6qvb3tksX2ri5nY4twefPn4oMni+3c8vL4hHY2wanYi8nS0MBMwYt0pS+XdrdP1zb9I/'
-             b'f+V1+vDdd+jrv/P/0ScffJ+21oJ8P7lkP/s9anQWvv4iMik/7/d+/w/o5PQZ/c1f/mX5e4sBSbpz'
-             b'DdRjO0pGq7kDdcEqLD2kqMR/wGKrVQgBMxa8XWiVoyf5ioAnUWpM2gHGZVO2CqsxKb2FxSjrpYq6'
-             b'ce0qffTxHZmzMd3GeytY5wl+ztrFCPW+y9XETyscgeyYLa8C/OCKrkFu4s1znfX6zNK9YwEG6FZe'
-             b'FlwkZVLw3CQ9rCJWYTfwo2F0nmdtzaE1SM36AhGFUuitajKjbueLv9/sufGXtlDoBpRFnk6QavJ2'
-             b'NjpKUFpQzHiWoyi5ndeXyLmlIjzLrOybQJ1cZ2t2OPb1IVFVEPL8n9v4OwefvPT8ix8Lr5GBvAx2'
-             b'9P9bX5+9+Lkv/Nk7n7z/5lqHaAZJkKySxJpBE6yClD8TL0PZqDbW96U/uUDLo1/bQBQ1+bypUr0b'
-             b'3FGsRt6QWxZWlUKaPFL/aACqBZLWZAtIhjO+DgtTzJVVFaos3fOtLHXUsqsspjzU7rXJbI09INKM'
-             b'jNI6NTnL5tvwjT020NLcZIuS+89WI0eio0Oce+5tgSCD+8vzS3nYb964pb+byI2L/Nf5IRdSBt9A'
-             b'XGUMdhjoQLWApD8kGe7asFtP3hGaktgMlq1tNihV3jJ5ykZxeXFGv/O7vy3qnZFQ1XtxVPBr7bpa'
-             b'DfMmMi+v9Wu/9k/oF/7OP6R5KCdmyfzRzZRnRl05OTPWaDFVDBFvoEfXjiUcjwUQNtPKRph24zWt'
-             b'RMOYidGJJS6ppZUFhMAe1ADjAQ9OxURVqUf07C1a4aZVs7EHFmJRNp8B36OiDkPlyZ/Zerk+19Y3'
-             b'JGaDW2+XpTK+KBvHsJjKdZvPpgQdT9m8gsyxluWzulxq3MfLb/80vfzGW/Tnf/z79Ce/95s0OX0i'
-             b'VVVn9DpUKQM2hwjJdD/mA0lP3/qz70ho5K//+j8oVfBWOVyqyIMDAudlcxht7CqVxNKGO/3JEsqZ'
-             b'oaxLqNKDbs4BCkBCdlK07Cm7sVMySSck9Y2OSlBDvQp7yn8WSdWQTLE/vnpVJOlPT8/o9NmpH5LD'
-             b'iv+xtv2CK1WrPyp4iyq4c8U2ECNbm+G4mkrNbI8KBQrd2vJws4t3ZlZVhdWZlZ26PjRznQTQdiPc'
-             b'yz+m4vQk27Tiu6nMWNyLMTRBo10zJ+z80B9olVKxAk6w5GQLHLUcKbKkikTkh4LsJPfJ5NSVwgn3'
-             b'e4dWMM9qGThgvNGMcNqKeRp88zcgd4DdZf/K8feePXk8UYUuj2zKSdW+uN3w6htv/dGAFoYu4lGI'
-             b'yxmmXNm4GrOr03HLQ/Ts2TM9fQX1FLCUlv0vAackbcMsUS2AvO2cwNT0P3GD8WyFTNabGwJ7BtAT'
-             b'7cJQHdJ18NcQ1lOdH2i6agQYVDccI15nJOtKyqbBf00u3qbl+mk8+4MXQ4MDQXKlRRE7jdsMd9S5'
-             b'iMPo4zV4DH49u7ghOjaJImSdM1ZSrtHB0Z5mCDnAd/AbPjGGpRu5uknIAR05dSvAu9ADBhpsTmWk'
-             b'i0aAojiWTAs2uTKwFUN2Vu794R/+e3pSFjzOe1oGm2LFWp1m5aLNyz//s3/0L+hX/sE/pylt02wZ'
-             b'xWvEsn7+nNjH1HVaCfRlQ7rx/Ev04iuv0cHxdVrb3IavQlWB0XoK0smpuVQWLVHvoc43cHJtyABa'
-             b'SvCQyZzqQuUNZRycHIyJVSRGkx/HCmGW69k3pM6Khcmh5fNgoRw08oK5hYxs4oPicy++QtdvvVw2'
-             b'5RtlQ14X0QurE1lUwRsGfy+x3yas0fmsXIu4QT/3t36N/qv//n+iL/7sr9Jk0O8XIHAMThNISNvl'
-             b'YnvOsM8h0PraJr3//sf0r//1v6GHDx6KjWG5XPq8aD45kw1LNg+gvkTCHtpFNIh8v7OWO9pm/PsD'
-             b'AgBbuGxAnpW1IIOF7+EAwf46r3wgqmCRCwd4Hh4dyWN2yknMXFl35OGKvg6F5K3a7OIH8vmaPceh'
-             b'kfQ7ADjXFpUv0qDP+jhHZnBdNcSvHCyzI3tDplrZkYk5wG8MNeZVNtZmjWrhCRVA0JDJTQbe7mg5'
-             b'wsgc0IpsVbDVaG5jFWoNza4W7Zpk3Ojt0kiVMp8xzxXGaYIIphyo+MBqbfHgsRt6IDovB2lW30bl'
-             b'ISFSqeaSQclVVddQ0rLe6/mXX/nu8fMv0tXrN8rXcxQ5VMu+lpMTeuX1V/9062DvsvYzrbxMTXZZ'
-             b'hhih/pPf7KNHT0QmqiOuTtpCWva39S2yahyuSSu+IiVImBghrcx3fLBvjCn5GpzkEBqZRb1jrOUV'
-             b'XaYeGlKyn1JCWKEBq5EyNpj7FmvfNOXtnnEaN+JJVoIY40q0nKtg/HcaaqjetLbIBmB4BFLDyr7J'
-             b'RCgD+/u7tLu3JW0Ql5gmPWnnwWYS1uK0ZsSgJ14hVGcRVywXSny3U2DNCVoCMKo3ES9ahEht/sFM'
-             b'Dn/vvXfp3e99V43NKa1aFDI2VeZ6lfXn7/4X/4J+4e/9Izqd6+bEv5NPY+yz4I1KmHplkd0/vFpu'
-             b'0ldpd/9QEmcTqOUe1RFruzi1JA6KXjnVawhSvdP2VS4ePM05uNy4Ey8H1egFqJXaw4dmK0F1mNsW'
-             b'cJX3EmYrDnK1xYy7EdT5omLDcDthMtaDGXu8KfP7v1k26aNrz9Foa4cvqobymapUEqF7Oiuf5c61'
-             b'z9Pf/5f/iv7Zv/ofaO/W5+np5cz9rhmcoiG3CjT9DwsTHjx4TP/bv/nf6aOPP5a2raU8cLwiLSbS'
-             b'2jP/Y6S6UMozhdjs4MN4/JPFI0h5VmkYzOu4BnxSHuEgq7H35JHlQqBn1eN4XV7rfD4XH9rVq9fk'
-             b'93N23WymoYYZa1JwWEP2SBu/D9twLwoNfqvVHiAW3TxNjTcxuM07NEBmWuHf2eGmrifkfLocFCNE'
-             b'7X3ZqppRyduaZyMqdaU0OLTcDKepDSxrJNwu56amLTisgBgsWDBQdtGGqqJRFVs2GDoqGR0AN/ka'
-             b'BrAUHheXZzqbXtn07VPr6FmpfJdD8ogb87/WDao9zkWAmLkf09Hh8bV3l+J/BD91bWeH7ItNk1df'
-             b'ePn9w2vP/UCGtubUAVuqDtw9jKBi4Mup6uT8nCZwW/Nv4CiJy/MzPfmi9RWbhV971UODNiHPXzH/'
-             b'lP3OWs0kzZFKVbhgCA9pSw4EA6K1ruJKA8fUbLlh4Av6JVUUiY93VOdd1TgN8SJQcOKDsdBcXELw'
-             b'WZmRrz1JAy8TLJIC0fB+ApBqIcrJNVksBPr2CT4ddq4fMy4kjuppLEfcKB28Pci4ghlSVoNEldoh'
-             b'QMu5PxB2OoymgmR1Jj4bXqiHmc5P5ITbM934gv7o61/Xlx1jdc/bAgE16KTsUD/9S1+jn/2V/5zO'
-             b'ZhqVkMzzVjbT2WQqJ7T1zV06vPY8HV694V4Ybyc3JzW9XmZQ7FyZF1YCCWuBavDWVjQhIYROP61L'
-             b'Uba2FJhydYYQPJ7bNn+KbXZZG7uWfZCfPMeuLnK6OPS43yOiIaM/rHIeL4eH9e09Or75PN144SW6'
-             b'Uj4T6taEW5ibRYd/9mS2pMtloFuv/yT9y//2f6Sf+du/RhfLINQOauYBmSqdX+vdJBJ4jmj/P/+P'
-             b'/0uCJjmPzGfD3M5bzMrzlPwaqFTcsHtq2uFrmPCcDMh3i9jMDWmW0Da0SJ0Brz1hPit/tkTtBxbm'
-             b'mOHIvd4HN567SWMmekwn0l7uvA1nPDhQ2nPXWFWoAlFh4FfqOL+kwQMca7BqA3P11neNW88wHFug'
-             b'IQHf45WcF2+p2k6iVXi5gdHivpWcL8zqmoZKoLqRUCMWdxZfu5bY84CDbLNwNa283MzWjLuqM8WE'
-             b'9yNzR9y3CkhoI5vB88NDxdeWC9np9LxWeLy+d3WzZV7hSVn3B5NtpWqmtmemhQHr56tF0NrG9vLW'
-             b'5175LgtnOFOMv/QoY1+saV/fWL7wyhe/ybOKLCNtfaNMOFfQaxNdzC8DuHz+v+liQU+fnUIsoYs4'
-             b'e6ZMhy/VWKLGpGtu7pq2S54h1bRMqIEkYkHKoSmNU3SlXMJNoSbZiBNrrhsZRZS4rX0/+hwr5F6R'
-             b'/qYYgAlTNgnD4Lf0DGRk+Q3jsSS5wZpAxOEnHAwyg1Wp7c3WZMNQqtp0nMRY6cbv7/q1a+rrMj9E'
-             b'rGQQfi0dQtvkdw+poRaERnoN1AluNvVXqDue2zxCdWblGS9WKbsRkof43/iTP6X7d+/B+W+UGaMX'
-             b'6Mtg+sbNF1+hr/3aP5b5E99TvHnyEF8C9cprZhMtL8JXSlm/tbPnD4ytMUZEINzoyczXWGizGxab'
-             b'dqm37JKrjrT3nTydt84nQ/WuoKfvytJQFytP00D0RMXopFpHhfBjoZ9oJRsnDqZ4j3FHhWwtIYMC'
-             b'1zZUEOUlew6fK5sVV1mZIbjlOR1trMvQerSmCKPLy/LZ9rv0tV//l/RP/5v/jjYOrtKzs/PyPUkO'
-             b'AWI6BYNS/XBRpO9bG9s0nyX6jf/739KdOx/T+njsn4WcNZmmkYaGqt3CTQ01hhZZCNU40sKfQ0O6'
-             b'Rteji1UJmySdtsdBmKB6XLgoYXtnm/b29sQEfXZ2qkpCHKEpxJUodJemtwdYrxhiZZHaATs3CI//'
-             b'n7Y3i7X0uu781trfOXeqeWBxpkiKkkiJFEWTlDXLku02LNmKoXiQu4MkiJE8BAjyGPRDHgIkQSNT'
-             b'dyNOXtJIkADdbtjuhi2ZHbutyJbctiTKlGRJpChOxSqyqm7deT7jt1f2sKZ9KcmafIWDKpaq7j3D'
-             b'9+2911r//++vbbYAx04e1t3gthiqGMEUnzVNuLPZZ3TCEmiTH+zfkYGzo2UcWVCktaZRRB2hjY1H'
-             b'xcmhCwfNbWW+vqRth6i8PrU7cbtWPJioEnly9iCrTstGPZsXIovXWKHDD+bDSj78lFQICRQNHX9m'
-             b'ofGSakwNdy5Onj17fXl55fJRunazzaVYXTK11z/ybOotb3/nn8/LRsEKKuAbKyJ7eyzHyVpodYi6'
-             b'vcPDslAJyfu7O7WakpOuW6wJfSntM++DxoNIwJ0AIMo5kL0U5N6dekLmN1p6rAGaC0MGkkEuxOik'
-             b'46GeIghdey54knPkOAAn6iKr9kBOFC4XSSPZJCtF3d+oxGAUsnwwcjD4WHJBhxQQLpSbNP+8C+fP'
-             b'V5As2kVVTzFMkwj1xFxOeyxcya0UVLUOO8vz3C8PsnlDFEhvlkbn32azaSyE43qjZPf/jeuvwzNf'
-             b'+SosLy6VFg3K6UvZjBIrPoAP/vzHYOnsJciJObl1k022OXcpL9xLaVOqm9PZ2r6LveuMCsxY4q6t'
-             b'ZZNPoCZYQFVtqijagV+VcIHi3Cdb3EJokCxWXJsUuFW21jkkuvyz0j4kS6H27Do5vMnGU8+ggdtL'
-             b'UddGZDVkrQzrfYeBN69Q+XZZxXnm/C1wxz05pPRiqqBmHLlC2tqcpIV9bzyHex56HP6T/+IfwmPv'
-             b'+wjsp0PNeDIxcRG/byU/K9T5Xm79zaZz+PQffBquvHq1YqNkYc0tv/mkVubctiGtxkQtapszqrUC'
-             b'NMaunt57hzbLItAZVxG1dVgAxyFYjEdmN3IA5Yl0kMnRK3luViJqGn8af3JoD0KznyKCy2Qjy6SC'
-             b'RminUJ6mZS34NIW4Uk0Md/BnMTLbg68PZyQm196TdwMUNwROSWcBmPIko4sEIZdSjg2emhzuDXSM'
-             b'IjR12RykzZxDLTueqaJsVGSiImpKO+SMrFgrv/RH21ub5QBaW+nYWHLyxpRbsoXZF4YmVunqta3J'
-             b'wZyQUfQBXVU05iLn/G13vXjp7nt2TqdDSW7550fNLHCPfEPc9ab7v7J0+uL+JC1UVAax1emMgr4Q'
-             b'gyxIm8x23fWNzcJTq9DEUOKRx/u7PDir8eyWX8qyXeddkkoCOeqhtvVqyRjdnqYfqngHeFFmOV89'
-             b'YWOvdEb5QMhFe5RWC5p0WE7UpFlD0uKzxbC+/qCVUGHyOdWPtgbBWlbSNtB+MZ9ehCpdKj7J0Aqg'
-             b'uKbG31MUaLHgkE6fPQMrJ09wVVHbgFmgUGIFBHjJsNBi5C+hjXO9+ItklcUQeRPrS/ZQb8+7rwtH'
-             b'obuXCHAWG5RsHIS/+erXKmYnBKsw5F5mXE1eaHKVdN8Dby3gXWGM5Xbl4tIKnDx5Cs6dv1jjDSKZ'
-             b'xLZ4MQbqPwrgFgE1FAetWlTK71BBRNQOoBH1Ro3MUQPqdYHxyuDoFzfu+FYOWl0oAti14NtnUanx'
-             b'RlgQ9WGbE8vvbQhKTQEnWjHkhdAT6jUaGVeT78GzF26BW9LmvnTiTGEIFp9cjv7IHqPJFA5G6b+X'
-             b'z8O/9/d/C371P/xPYfnUuVQtzQohg7SFwy2e2rMr/MlMjX/qM38Ea6lCznOhyHzC2mmZ1jh4fv/n'
-             b'nO0lKKVCOoncGuJ2V6WfSHYRsyJL5E2vPLosmNB4GQ4IlM+zZzp5vgazaT1bE3IWmcj8qWmJkVPU'
-             b'OUB6NKO9xAxJ27pGfEQTLjg0j44IqD+GUPKwgKiCDAUA9G4LDRKX0qqNUeEFoGtdXbfd4RuYyi7q'
-             b'DRZSNSzCZohBbrYvByaGDhBqy5wUJecqJe2QksvgckG3SK6t2ZfonS7IgTRqZVTENOl/29s7ZaNC'
-             b'BoOX+3jQ8gAhoOG3sG7iGY126c57vj6fTEqAbja750dohoL5jUl/8cKl269cuvu+b4Ck1UpoHp8k'
-             b'pYLRC4LnQ1lGvLd3kC4kU31kBclhurAyzyxwimtk+SGCR8G7TCUSpV3Uk4YOGckqEpXBO0xJwTnp'
-             b'ySrom4cOQUS6UTiahFAfwFR8ArMt6jhCU5gpETiYtBPdat0k3go6JfKsM+rpWcIbg6P0SSuhoouC'
-             b'k3LX9+BoNCrtMmlFRUXw1yTeQbdQs23yAWEwqN4oiFqFSsZXWShK9Gw1pFIISp2XSmhWvDNz9bPl'
-             b'TS0rOL/zwktFHs5yLTuLahVR6QeHh3vw9b/+IpwYIiwPa0R9oUtPszVhqJBN87mQ+bR46GvvZ9CN'
-             b'pmwVQXwiVpXrjQYGAi0Lu6Y1klXZis8Ri0FUhZEThhlzzlflKG4M2T2DGjNFFVvbPqjzWHXRoFeG'
-             b'GTFA+JJlJhAMsVUXBokjr/di7nhkT9rZCxdguLBcFvEs3T9IVXbeWALUlOJxOmQ+/tPvh1/4+CeK'
-             b'jFwbB8EOZajQlqqm2z84gj/4gz+Era2NAteNcr3mmUE+mMxm7EWrrbhKvmfwLlormbQ9zHixnquH'
-             b'2DPAuC8erYqy6ssJvFb2tkCKJyofbC5cuAhnzp2Hg1yFlw6CX5o7bZcqFFVDN51v0sFUASTdF5U5'
-             b'K9Jy1MhOcIdEm4ES+N/bxJuUnxnVXG7RNt4g5vF6wQk82q5PgQ8oDR0dlqZt98mIgRzqjEjERIyz'
-             b'c9e5jMGF3iMVTUvNOaZULTDsUCANmfaim4y3XOVnkK6H1bUNp2iNOs+vb2On4xvZ7CsdZpjWpAHc'
-             b'+9YHn144dbbE8MhjUPu77RcuL/dvfujhz1/51tPvXyyZO71dEBGazBD1APF7nZlxN9fW4eL506XX'
-             b'DIy8z3L087fcWkIS0RnRyJlk62BRkEOB1W3siXJOalHuEE9xUTwvHZnXSRztpP7qhmSsf6az0qic'
-             b'MqVNCKUY28IaCRtcil5AaFxDH9AouSsWDMWXNudYyQ2kvh7nlTB7T61OsgIux54jBxmqMZg3lswN'
-             b'yxVVvvhmk3kppQu9u+zCVUFTIrA5alykq1FMgR0WxWCJggdHWC6L2AC+dfkl2EsnqaV0apeLM3Bb'
-             b'JDJJY7hQTaLZN/XZP/o9uHH9NXjiAz8Lt73pgeJ3iun5LeY8JmTIL1k6s2D+a6RH50gC7oZEdLEL'
-             b'UT1gtQ9fs7SC2hi4FYg2T1KrA7rwTERo0xCM2GnizaDBbIhG75e2DR6ToCNSCwA1h6nBQyWeAW0u'
-             b'ZpLegXnB5MQb5cDRl0Xj7NkTMD3aSJd+LJlU03SIOUwn2bXr1+DyC9+G1175TvFRDVDsbtKeo4ZN'
-             b'KPPKvDFtpYPIU089Bb/2q79WxBQFlMrWBJpP68m4oG4EMWbVv5IP2NSpVeKgUkjyZlQy1nKbuRxY'
-             b'ZiUYswzOeQObz+t6U+JnpvPymS0vLcMdd90NV169XE7puWqEaGpPCWqUVGF1MaF4hyLfK6jrlbKu'
-             b'dYFmMVdwkmP103G3xjEoa56rsUWVUyhVVvGCoB78iKKefAzxivp+yfoghydd6sAO7mXdEvi0C2dV'
-             b'2LZ8j2AKP8RjkbDu/eGOrYWxUudaiehUjFU+v7u3zaKRY4d8tnuM0kFmbXOjtrj1XrV1sfreUfew'
-             b'YjPKlJScMH7q7Oje++77GvYTNtIzDAlmszcOCdMLfOjhd37uC5858Q9jxv3RMY4eeh4U85b4hs2L'
-             b'4vrGRtqM7jfYYDpF7+1sppPQhZofxCeuKMBGRYKAtf58dpUY2NQNDtZ3FiNfJDuZOiSR5WEZd9AU'
-             b'Ms6E5zX8YANNBMugsU0pqjgCXFIp6YbVm2OcjinQHSjXTl9kcR3KFkPnRSNdWCY1+0u9KFb11b+7'
-             b'ULh284qe4RPrwrCy7joOwKtYk1la1FLVJfEJmfVWZhy1vZF9VjI3KKeyUBexF7/zooYjRiVuBDmg'
-             b'l4nKeD8tIitZVp6+Z9oQn/3yF+C5r38lbVL3w91vfivcnn6994F3wG33vQ3C0mmNos9D5qicPVDv'
-             b'i1Co1atHLIxBdKdXXnA7T+4HlQerelGgucopg4YWLaBiMQH7mAyPcpFgTbMmYEsSILXJHesSoIpQ'
-             b'TB3rUlAFbIugi18I8gkP+HWmzyZdB2uvX4WXvvMNONrfhsPdXbh57TXYvHEdNtdvwlEWLKXqZXkh'
-             b'swy7UlVL+7y2S6MzWlbMGLCIKWc6Xb++Cp/9t38KH/v4xyE48Wl5Jena6NA2cc0fY75ljCJRJ67s'
-             b'6r3QFeXerIYH8rqzOGBaPyJnic1KNyBDfKcFmjzQededd90JL19+EUbjoxJiOQ9WSwllG5TgIgsj'
-             b'sg3FsRZlARcVHbVqX92BIjSEEUkPNwBBXWSLAlhSxr0oilFLFQUn44tOeXza3YhyKGsl5WUkiGbF'
-             b'UTEXtNG8sk6gZkmhcgwJhLfnwLhk3kFFg4EHKJDb+FAl8/mzm7F6G5tAxvpXclzM5s4uHB6NKjs0'
-             b'Cr5O7oHemYmdQIMJ+mcu3PLCysmTr44PD9yMOScMZdnpG0ophHve+uBXTl68/dX5xqv3aTOQTFSA'
-             b'mntoQ73qNw1FI7+XftCZkyuMKqLyAvdSNXUmle29pMCSBXGRKtmCteVic5SoBlQ+uUepkDhVtpMQ'
-             b'KpTFLRj9m6QyIcUPVaWXP0ExhTmaWINkaNjZBa9eEU2u7B2bD+ocDJoSSKu08noEMC49YeD+fIxq'
-             b'hGvyuXXzJg0KXFxYaNziXkxV4KFIpX8/ndVog9l8UsGOJWUUy2wilGqnhrjV+7ar6qpYfRP93A4e'
-             b'RVacvs/G+jpce/1aUZyp678nBZHm79GPCLZf34WlE8tw/o7TaYHMmVf1873+8vPw6gvPpvdzCCfP'
-             b'XoBb734z3PeWh+G+tz0Et951bzrE3ALdiZPpGw81ZsGGxuSqV67apBpnkra0zDTJGfGYWRIsVbqo'
-             b'GKWRIsSTyPLpSuWu/13bUTaoB0XRWL+7LydQaTIEHv6Lg15j0aIN9EvQIHYNWbt2DrtGXVYyiEbb'
-             b'sLN2AzbSY231Kqy+fgVWX30VNlavwWHaoHIiMvS9CjjyDPLU0kL5rMv5Nshst9MNr7aZocjBdVPm'
-             b'zzA/5Ryz8q1nnyvhie97/wcLUYa0SdHDfNKXZGPpCuQssC6YCbpWS0KjEFJSvU/zzKGm3MYCjq2G'
-             b'z1iD8cSArUq1vlySfbp3zp8/lyr4JRilavHiBY6XUXO6Y95hnauCHhJYuMDRPRa3Ieo5MC9b4Flj'
-             b'oV9wxRM5xgddm00hutEmPVLZecu/pmtzJWRmIa3MqxTdbU4+zkiuUD4M6InBNxicJQzRWowx8pFa'
-             b'm08GVC5dLj4c+3kuOrOx34XyLPpgf7e0/wOr9ny4ZKns0329trZenl5RF5cOXDS7B3Doq8yU+UCY'
-             b'/2SSKuqH3/K2Ly+eOj2LR0cOMZd+doTujZtU+rdLZy7sveXhxz73zJ+89FvL4hh2wNdaujpZYhDj'
-             b'VpaSTmA37ahnT51Un0q+Do/2d0pqr3h+RAVTwKmiSYxiugs2gEbn8WZoZN3A+AQf0AaILham7llB'
-             b's2Z09qDGPv6u0V18WtqKUie0JGLZDImabBqz00jPulZ3IpsnmXfJTSPfw13UcrJCXxnIrA2JFTII'
-             b'KydWKkmYkIEdkraJRTSRKdyzGVXUTV48utpzzpiRbPatPrYaFjjMht7cUuGec964ighAZnJU6dc5'
-             b'EPD111+rrZYsIYcat5ANe5FVWrnJtrN5AN10UAQea5MNOHPpDCydXi4V21LaezJYtXBLDjbh8jdu'
-             b'wotf/2JaVJdh+fQ5OHfxVrj1zjfBbXfcAxfvvDv9921w9uLFIk0fZAoDLprUtlFmIRuReyWMAKtN'
-             b'0Zr2urjUdYcrXpH9x7kK2zmERtszBA7c6c8fJMGbcr2hnRo7NrK6Fp/Ga2tV5DVmVUV3lA53u9ub'
-             b'sLl2HVZfuwzXXn2xUNB3NlbLZjSfpVNqmQHV5zPIcSQL6XOnhSpvp7oZiOqtzhxqay2/xMl4BtOj'
-             b'cTosngZciIr1yX7FIKZSvhdOpOvsmae/DLfffjvc/+a3lLiMgtbiRT5X2yEbjfPClTbG3OJdYDVi'
-             b'jXCploNMy8hz0mHJ3JoVUoV4GfM4oV5z1R6QDwUF55XbzYP6exFPrJw4AbfecmvB7RB/f4MI8wYV'
-             b'wNFsbK4InHGFyiPvzXrSAKLRkrzRufV5vZP7tJqVwc250c0l0cm+W6+SHbMCOHmxtrk1lw7BdYGc'
-             b'BkDaheTafEGKYOJk6sj2G6yHZnLkj3ItD+zsz5VT0OcWrEjDKEkqZQ66t7OjkT2ATg/AFeBsTrC6'
-             b'vlmUo6XFGVzgCDraDfABkVBn5PMwhDfd/9bPxbRu9NNpc38P+n4M3+2L5ggPPfaup770x7//W3V8'
-             b'KnHsbgBWxB4z09zz7jBPd8r11XW4+847Klqlq4Pu8eEhHO3mjep8MZMBWUgaiDAhBBdDJdWSYEdI'
-             b'Zz+dJvoyWSEEN3dExZdIy0Z1DaxsEUq0vtl0XB8E7qLpDDiqBzb2s8RoAEiP1vD4D3THnDJG61Sx'
-             b'p2q/cCwSupwohXIcWN3Xw6nTp+DSpUtlA1QpNEeil6WuzJ/qTKpuUBV7lIfXuQIrwXEh8N5fZwJA'
-             b'ddBegah5sAGa/1W5jTVi/NVXr/DNUzfSMjug2vYrrZyjHiYHM1gMi2URmO33sH6wDcvn0iZ0bgUW'
-             b'V9LpfoGqaCOfsAZDjQaAo01Yv7wG11/6Rrlw5+k1DNLmtXLyDJw4fQbOXzwPJ09fhNPnL5aN69Tp'
-             b's+m/8+M0rKychqXlEzBU/1X+zIdNZ8D7XXzP3SiJoPlp2qbRITjpYSo40ojyzICcNtC1YzISLO8M'
-             b'6ZGJ7tO00E4mIxgdHBZT6t7OFmytr6UNaRV2tjdKp+Fgex2m6f+bTQ7TZjQtoW85huNEeUmpws0n'
-             b'1L5+tsUUy2y4GGzY3Qm8s0+fySSmz2UKk8MpzNKvNKsn273pHpy761z6DObp+8wdf0da6h0fCGPJ'
-             b'CPv1T52Fc+fPw3QyN6sId0hyOm2ZY3bV65Sr0KIMDBVxVDxPeV2Y1sq3L2y+IUeHT8vPzUnGmX4y'
-             b'o2ndxGJfKn4xUJfrNv35xYsX6uAeXDcDHbdTBgTBWnQaHxocQEIYoiEYyMFVMDyosLBVkZXLpqNw'
-             b'T5O2oxiHdeMSSnR0pPPQtv5VoGWHZ2ndEXnBBBhmi9pM+Tqn6tUszMMy7TxUEvuA1ah8BOd5mrS6'
-             b'hfoh/MVyhhKYeBZMHByUA8MgeEKusRnzOrOeNrGtnb16EAbzk1IEtzYG7a1GTlTPAaonzp7fuu8t'
-             b'b/53s9FBiaJvNqnhsPuum1Temh98x8N/ceaWW69PN1+/Y8h0ZL2pMXKbKJRTciTV6pVqam19K910'
-             b'h3Dq1FJtc2TzYNqsDvZ24HRO7e2BUUtsYvP5KUHaZkF3D8LQ2FDF70LcYlT4rFysWsEYIsh6st7M'
-             b'6Wfl6IaVlsFicw8r200JJNEOoAmlqjATNIxDleqlKdh+dIgTgBa9pO93VLLH8spS8SrlVF/izUYD'
-             b'31gR1LSueUPOn/NcPnyWgyNWfFXe2ApVPB8d5vGY674q9UZHh3DjxmoZfNdKhJhAX4PyhmlTPdgb'
-             b'p0UQa+x1Rh6xoXWyNYXRzgS6pUGqmIYwPLkIg+VBeh2oN1FJ/K3w89oayqT6fh+mW/twtP4q3Hwx'
-             b'L2j1ws7va64qM5twaWk5bX4nYPlE2qxOnk5V16n0Hp3MuP+0oZ2DlbSpn06b3MrSCVhMlUH++zln'
-             b'Kbcm8msGlYMHZvJRUaqV+ilWRV2U/COOH5mnhbVEXaSbNoOUJ6PDonraT1VQzlKbjI9KS2qUKo+8'
-             b'IY2PDtLvD8p/Z3Pi5HCUbsyjQvxAbpPlQ1emkue3NycQLPAMo7atqhk8al+X5ekh/VumiOSDTzbs'
-             b'9mkjmI1mMDqcQJz2lcCSE3hzDlaqUgaMaur357B7fQ8u3HU6Lf5UsFZ0rJ1SDjvdQnr+R/DUpz8D'
-             b'v/qpX0/v3VLaQP0mAUWtOSxeq0lpM/cljbW2SWNvbcxSvxT/07DMTYsPiukycwbQdsF5oKT9yDEx'
-             b'+d+cPXseVm/eYB6n5zZGu3gAHdvvGKMPTFWn/M2imgzWaodOgdRiZkWp0hxpp5ijA5uEI6lHiiKZ'
-             b'sRiOKX6lHecENiKpR52FR6OQoPgF+0YBiBbT61SDRr/R7YO7UlHTJTwfkI5h3Xgk0oGSesS7ebC3'
-             b'1QCywfkIK2waYW1trY5RQEJsowPqgio+FcDLB4npdA53vuWer915z73Xjm9QtZKazL/HJjVPJ9jz'
-             b'G/c99Oif/fWfvvwPzp5YViVNcJj6uo4LbLPn8rkrPprX06L29tP310U+1mpnPD4qKaYLy6d4XnWM'
-             b'9wZvjL0Qc2a9uKKJJXQoHk3iGwxTAk4EoZUTGYUYhGXlSQVC5CU3FvLbi57EY3P6Mm+VeSOknVd9'
-             b'VoM6E5KhqTjuo7QFggk64LvNUqCcJvNpNrdPItrsLriLRo2RYEmYNU2Wwx2jDS3zv8itFuyqzNff'
-             b'xYEhn1SoFgNYXV2Dg7QA54Ud2ZuFAuLNbd4+bXZHcxjm5F5plXX1hhjy4SEexWLyi+EQKEvS00a1'
-             b'cnIpbTJDKGIx5AyskohcN4mSopsJ62nxW+p4oQgsq02n7pjzmUbbcLRBcLNgXqCcwPOCTYEzh9Ki'
-             b'mDObcpU4HC6V62kwXKw5VDmxl2Mo1B/Sc+wEVRhyft9LdTeryc15jlLbrbGcLkvvvQQJ1ufeqR+k'
-             b'zhELJjlU5WSuinOS1GLekPPrGfBEM3DrLbsCSuY46Cm5zGn6GuBZrBDzbFvqayx5+vNcDc/S5pS9'
-             b'UFnnVLzhqQIesjQ+S3xrXEu9svIGku2c8/0pbL6+A2fvOlUN0o6RGHnWlv/u0vIy3Ewbw5/88R/D'
-             b'r/zKJ6FPFU25XkTglN73eaoQF1I1lMUOOZQyZ2iVQ4Bioub1sBQWCmk9K/emaXPLh53FwQJnooW6'
-             b'Gc2nDIKuG5QdMjEdek8Xio0aoIRGzmtEELoHOWyV+KqIWDAgfk8fhun/Lmr3xuWKWN4UkZNqO4Un'
-             b'mF9ImeuGN7fZjxN31K1swDtntM6i3qOk61TD7HO5daTrkrjHo1NaWrXVxsxHHwyoHZnaluGtKYup'
-             b'0lMbHdZDWECzIXlBUW3HxnSNrPMh1risdNw2LdBtMF9sKvbhgYce/pNcueSQwzdsUnmG8T2/0kX2'
-             b'6BPv+fTTn/3MPygXDfcQy6YQbKOquUnc32dlQF4Qrt28CQ/cf086FaKSp/PX7vYW3H7yTNYoqewZ'
-             b'+Vs0MiKVabLChSzuWaSbyHLiqG+6w5d4iq+YW9lR4Puvaj7UKGdwF5wRe+2icsomBY9af1bUbpXu'
-             b'C43/h0i4dqDDR2X+sccI+bVYGV5Padmwe+HSpaqYQlOBWXRBLAtDNfKGMjjNC0cP4yIfz6ZagaSa'
-             b'EL7TAWZX5OpZYjy0dlaoF+HVq6+XFrABXslJ+NPPnBBMj2qrT28KAsMWBWRKXW3x5dZPXmgP9w7g'
-             b'IL+2hTIUg8FiWkCX0oZ0YqFUPN4PFQX+GdD63PmbLxxT3hVVWa+klCIWKaf4rIrbKzdoNqPOeCiO'
-             b'DpNUZ/U8MWARTmBlo0TILDCfLlcnNGB59tICzz0HZTNBdSV03AJSkaiKjkS8kBWJkmpbqlu+BvPB'
-             b'IhtiD3aPYD6aV0P7rK/tvjmVzxdcXHsO6wh8Ii8qR35/SvIvzyMwBJXDDyFtFPsT2L95BKdvO5He'
-             b'j6mr9OubkbskuVhYWVmByy++BF99+ml48v3vLeQT4s+31MyUE4n7IojIYNjqe5qzL4aUQJ/f1IX0'
-             b'uU6yV67rCj9+Op/wPCeWbDRkMU/tDBkmqxy2aF5nHrHKnmUuJVEVTD/iez66uQivGSQxnNH8ns1B'
-             b'NTazLFEtVuceKRBbc6uaRVja/tHubzlwUxtfbxuPC5T1AZzeIyh4L5cArtd7kNgDmbXW5yyy8iDk'
-             b'D1GWCjMP7ZkTtAADjSqpY1XY291SIHN0LCSRmOe9Ibf5dnZ3S9u2Pt1oXr8Y+cAYWFpOeugoau+l'
-             b'lfmDjzz6uXG6buIb1v90P0yODr/3JpXK9/sfeOvnT1+47eZ8tHnroCM3kBQ5ZmAEj/dc1CH8zt4e'
-             b'rK1vwN133Fr8K4K1yf3NnE7aLayIzEDVWc6UYsZAMjk4Ofm29DujnJBY7onhWF4MtjJlzuptkjRt'
-             b'JiFCCgkfc3/uPA41sdiRKdAGoQoAjaLu6VWoEZsLw+2rEJVSTAqsNbugGKaVtECuctMNk8opv7Tu'
-             b'eip+pXmRkee+L6vN0qKXN6y6iNfKq2RKZYpAaa8MnEGQW2/plHvj+vU6NBUVp1DwoW6Y+zuHNW8a'
-             b'4dgrDBq8GIXvllVcZeg/1FdY2HK5+kmb1yid8CfbaWNN5UZXBuhdmWtm13peoIbpRsAh1liI0rOu'
-             b'3hESjEvepPn0Hbv6fIpcQ+aYLLsH0285717Q06qNs3gmK5V4MMEPCN0S+U2BTm9ekBgR70EYcA5Z'
-             b'OatwJZIjv5nYkNuJswzeTVVREbRMMuiVysaUn+0wHSCy0q3j1xOdFysSOCKGkLVRBUfIiasFQMyE'
-             b'91zZTLZ72OsO4eSllTxJtOw4vn9iDaeCHEL3V1/8K7jjvrvh0i23lrw4Wzx5gseeqlyFBq64lMRf'
-             b'vHSzcp2Ug0OBLVdhR51Jzcq/0YU5tvPdyEnSZ86e4cWSgcqRDxIUGiQZcKsswLETPfoEXDdnIkNs'
-             b'CX2c8FiVot2S4PBdMkMiJWmAo5cTubYkAovDyAy+Op/2n5Uz+Lr9qpXLY7Pm1DlgcBE7zDhFM6mj'
-             b'5JzJZ3vcz1e7neVAllvDuZU9PtyvY17pXGl2X6228md3Y3WtXFMD531suIeRU6cDuNRxgvF0Bre9'
-             b'6cGvP/DgQ9/qSmhqfOMmRfi996hcfp255Zabb37HOz/3/F/+6W8uDTsZJdelU/T9SK0xBKqSJv+9'
-             b'l6+8DnfccVvtF3PFki/OrfVNuHTnigImMbiFm8CZL0m0di7ewEy1UpVYmGBUn4DbAZSUbKU62ELl'
-             b'c1ryz+scJh2dd8nxqgl86iUplaDl9vFJsNXw8GBe2trop7kOqhvtMEBeiorQiUJQ8m8C6QJLguIJ'
-             b'ZjDOC3sv4YZFYRXV9Fyko9DZWFA4bCxuyCfi3e0d2NzarAZOFPlorxlZJS14VGM8pC0RPW6IZabE'
-             b'9IWBEsuDVmWda28MS4pw+oOjKgqYw5xvJEbulHYfZ4lBzTXKZtGQNl8sUfI14TiT+XFYq4tcJXZB'
-             b'qBgdBKlmnFxYAJ7U5PmQzkZjJEtNdddm0Uaw0g84XgBZoiyn6Yz4KREp+T9nFfpbjjWzqIRxcWEE'
-             b'jkOphkiuKrh66DloU+YVvcw8QxBeaGkvGrWA1L6hH68s0mynyH9/tDVJh4IBLJ4bVvl4OdAI8lwE'
-             b'TljIMZ//3J/BJz/5ybJwlWgenc3WU6OEYhb0ciFSEFNTyl6nwaZ5LjgrINlQD1M6o4rMMJQcosAb'
-             b'ERQcmHrdmMkX1LBtjX/x9zWOHqcS9qkXOgZGUhK7hCGSz4wiy9KyE4wT2aBoezuemVWCRlQ6P+qM'
-             b'2qV+eLeKdoC0Y6MeT/T6CSdcQAa8W5SLJXyyHIMcgshlahEYa5DUDsUUm2LJSOv05hpX452Ir5XW'
-             b'IinF43S9XF9bK61aBA8iICey6/X9LIcJHpvk++Lhx574vaPReDJLa0xLVBThxOIQvt9XWFqEJz7w'
-             b'4d//5l9+7jeLW3wWGSrpUiOjgTTL04h1Ics77M31Ldja3ocL506VmQzxzZfNhv0knfoXFhiLRha3'
-             b'0FUdP8ourwFZIj2Pru3k0DLcCiIP7tIPGKENr+IMJ3RVoZyIIjgwCroKHc2rINs1KmmszsoYGGtE'
-             b'AXBkZfNReFK09rCdQdr7JLwwXflaBWzKbLQoXCy+qXmoPI+981mxApCBmWXjKrHx5AL8UGkGBVWD'
-             b'FUa5vb1dZO1dWHSnUOHhpWtikjaSUYTFWq/wAVJkNOQQQ1IVB6XDA3q8ipAcpEbv2KNGarzEYDdU'
-             b'8ZblG3BWn848y7hhKokk7Ja3Vl4QS0HX8cm7LiLBycrL3++NQCFJoqIgk8VdohtYzV8qVxEZVzYi'
-             b'MnqGDKEllSpxOwZrVRXcBqIIGa+gcim3gSPZeyVJe08Yx0NES2ENmqckcOS62QTxNDExYoGGcLg2'
-             b'Lhv9cGWo3rBQ8qhieY15Vpbj5V9+6RX40he/BO//0AdgfnSoJmhZ3Ht+PkWangVToarzuK6u7eou'
-             b'z/ZmjvwRgZqcRGfTAFtzAgVl6gUBScmhLJKrjklhzrWK6B2nETVrS/VavNYg2b2G7pBLumGggYY1'
-             b'm6q36wygmQWZb1uUn53DKDmHOEl6sVWPhMbNs+gZJ1hwEfCVYxo5gJP0AHbcMgHiMUQnIiOnZCbz'
-             b'hM4mk6JGLVQiQtEfWiRJ7lAMBrC2tQ37+4dFsRnZOxaV/BP0AFwOb/klLtRrPJaA0xNHjzz2xB8V'
-             b'MROufNc9aFDmD9/nK6u93vGuJz937s57Xxltv3b/ML850Xbmcm1E1MhzxXdQ/ThyQf/y5Vfh1ovv'
-             b'gmnsHWMvFgnuxdtur8mwbohX28yosMrg1W6Shkqk8e6eH1R+ROfIDi7WHb3kOLIjW+Wc7IWKwUVQ'
-             b'+0waUhWd4UtMwFGybKKdmDxyCfgDEq8ZKYrAnbAo6uIO4I9Y2Cz2mvZJwaF3yFBRb2jpYp1FyXJZ'
-             b'aNayXyOHHPYcFY1Fvtz3M5Wy5gPF9tZOESMMB6SSXqk28s+fHE3qxeemfeC9Irz5BQjKfhTpMLo2'
-             b'h8pfOcE0f9POdTwUI6R+lQAuVaBsmAOJi5DTJVqli+RCJ9G3eXzAh58DSN4qaZCdXJfClSZWMVIk'
-             b'vza9YaidT6LZS9g5AoZfJJV4j9HRsUEH2NJjRfb6SRs4cPyCttzIFtZgUAsm3AnOJrjoDVTFGc0C'
-             b'7N84hHP3nAUYMtmCZ2MoadM5+2t5GZ7+8tNwx113wN333AXT+Yx9Q72+vyJ6qGfFagDNZP2C4yqt'
-             b'vjmPbyUFG7UtJiK6yNVrgZkGTvd2mUtFsMI0e2XHUVSIL3E1a7PmegCW5FqCqFizqGhhfzgAM/G7'
-             b'D1fmNWKEldayKpFdC8+oIvzzkJrIFyR0+5JDFnmflx9VoJkjyJOdGWygKx1FZYOCWtbdOKJZGtGq'
-             b'Lx6X5MfuznYNre2C4rvI9x5DTQS+fv169cZ1fDh3th1xGFJZlOfsPaxrRRbL3PbgW790y513fHs2'
-             b'PnKAgmOFUm79fL9HrnZWzpzd+an3feh3jybRcPFMfYgaayDy8w6kCxSZtHDj5hps71ZyriFBEPb3'
-             b'tmEyHvFNEwymqbQB661rJhWIaZIsNZLVheWN79y7j0ZKBw6UI5451JubvRxoGS3gFgitelwctQg1'
-             b'pL1JGh/Ci4UTM1jLmTgimxw6qW1HKgPQvy70nOe2yrL5XXQASe/VMnljnv3kqAdwURQ5x6ssftQx'
-             b'wJTVaBw/Tvlm7uqJa2tz0+Kr+Ugnve9cGczGvQpZzJ/BpwsWBwQH2QzSZgBrZWpCECpCVmcJdTEG'
-             b'jS8HlFwvyS0kNxNCG4ijESJKvcDx33lgH0Cui/x6B6zB419LfMCgGkqxdgjK/5sjDjBwhcn5ODpq'
-             b'MHJ6icBorLoCMw2Wj4m1TRu9ajrYwSt6eTLYdUhg4XzacgFgeK8dmINgdiAY0JjzqmwegxYeygw1'
-             b'mgAcbhylw8GAcTq54q5GTSK7xnLSwRc+/4Wy0OQZaDjWqCnzEarzwTK7mMdy/2ePVFY1lho8VOgw'
-             b'knUaqkydF2OpvpEcaTvyNS+5UEFnunYfB12XAjoVMs8wTYhHLlPM+59AWZB2iNCeYGP61+RwB5hW'
-             b'Rp+by5QOEHWOVcrDHxEUcIIvSqVFtoFIN1hmQSWnyuH166El1jBRFppUxar3YzXn9cZ3RY7Ugl0F'
-             b'L+SIHg2spebbOHM8lIj466trRSgncOnCZWR1aGB7TnD5WYG9b6P0Qb/jsXd/erh8goriNK9T3+WR'
-             b'nXbw/R5Z8BDTRvLYuz/wu7h4ahKjk2pyxiOG2GTpSKVT2imFYhDh6rXVKgWWRN7SVulha2NDlTvk'
-             b'MD9+YCB+hTqwjCoyADcLk4G4zGRIhRfWS7ZMneh8RFEzrKwNJ38nakvLzNNGIhbFlA7jhb0WwbUa'
-             b'oi6u6ComAym5OVkznnWAWiAmYPPfCzWQUhWPkiosL1eZgLE5+ZXv34Fme/mLNbIfS9t1vPrmlmFu'
-             b'9wVHPVYJfhHrpAVrPFeWnrjh81mhE9kzn/7qwmnPxUv7PebJmBtoGKRjf98TPoDasEO0saMqkswW'
-             b'wnOpcOz6CtyekxNWsZewd4o/CmwOL7V1GlFHg6o6rBsRatAcOmFDpemzwAOs1SLzAdmUQQ41ZGm/'
-             b'prEhA3hGI0qWxB7khd+9I8htnKDnH2da1fZVfW+yYnG8lRao9KjVdV+8WyXmhNfePFMeLAzgxo0b'
-             b'8KW//CIscK6VbIJG02YuG9/b0kjLfD5d3CPTPxjLJMWBqHURydFhoiOBMXtQYNB8sCVvMg2eiQcG'
-             b'LS2L/dwER+SMsMQsUmDhAacQRxekWWeCseHQ6WgBo2M3YCMSACJ/qTpjcNTDluZko8F5q9nfbDly'
-             b'+UVVIQcthjq946PO7uu62Dtfpvv/BEMl9h0OSt3b3uIUcWy8VFaZUplXb2ztwMHR2DxkhM1cClwl'
-             b'KIf9WCwx6RpaPnn41oce/pNM1ydOb/5uj9AtLsHf9qB0An3T2x76mzc9+I6/Gs2rybbIWku+0bQO'
-             b'bUOwEzQbbGXRHAwHcO3GdRiNpzWhkQ8P+dQ+OTpKi9zYiOUaZNjGO8t8AflYUX1MQUUGkudDvbf7'
-             b'sCoOI8uHSaXBmtoq/f94jFJMthhqL9sN+lEuDD0pgDPsOXyKtGs4Uh2Y9UVKyWJFGQVoZXVoclCy'
-             b'CAyI4IQhZLMzjuwgHsAjm5BLRHTOHMroGW5vlM+ALABAbi7kKihIKiyjlA6OjkobcABBq6CggXCd'
-             b'643XVpxVTrYBkSX81UuYFyRiubXqWcjzWrwmM3Jkem0JRvHfoGM8+FwctMGuDoZl0wExBaOqsYjx'
-             b'QajkgrqW9RrCyWI92fQ6SWrm2JDAlXqJR68/L2rVZ5zLIoXPviKOBTGBhSR1RyaCM1EiWnsoet+J'
-             b'XhNBF3V5/5DbnIFjYILwHUnaqNSIWo6rXLOL6mhjVDiMolAMrFyM0agIeeb81b9+Bq5efrXgtWrL'
-             b'UziI9cgT3cEpzyBECFRu11g3sHo5RCV4yD0Fqu6VW4tfTWTvoXtfo86ShGSOZgNRpJDF6iBXwoAu'
-             b'xTfWqJ968IvO5B/U00jsxStrD9tJqAlhdPOj2rN0WVIGl5Z5k6n4gnWNADT+RTL8quTOz+wCi0pI'
-             b'uzfSKg+Nd5Pv5whmwpfN2KkOySV4Z9/d/v6uRvYAepAKGhsw/f3XXr+mfkDbcL1pGZ2cv3I+c501'
-             b'ns7h1je9+eu33//AC7l46RaXv+cj5N3wb31kZdTycnzigx/95z0OueRG21lVfRaK810+kkrLrT6N'
-             b'zP3KxIKFIjO0rJGYFs/9nU0Y8qJWHdy9bRhB/Dro5LSdVR0kGH12SAe5LYPihETlhpbrbf4ubEPD'
-             b'agHEbUDgMhx68AQuiWBHaKMYwA3Xyc2xFM3U9LfJqh4NWnOpvGi4/uDShpWyrOpBTyBAbV+KgVkq'
-             b'uhpHVpE6VbXF+CA3uJBTY+141Eyk8VEu+480l6b8E/EpUSUjZ5NrUfZxzaMtzkjurbEKp209txEd'
-             b'PpVYT/hSYQRb8NGZA3kkyAQa15pVcHHT0OGq0Ru0UTe4XD31cMymgi5yXM/QpOgoks9LepIZ65PL'
-             b'jxz0ln8vnwv//1K15Z8VOdE5cGUXwWZMpMouUhJ2g9fiNqiFMZrGFfmwgGRy4MhzFj34oalk9TPh'
-             b'RTGLUfbXDmvbr07dtIUbecfO7bNZ+oef/8JfVH9dZ4cQOah1kpdGBk4uVR/6nLPoMGbEqb4uRVnv'
-             b'JfMTaY1NnetwgPoUrU0aWiKDT/Hl7xXkxhcGqMyd2TqiqLViyAbnaev0sGBZc2iCLyGu8zXMFATX'
-             b'bpVKhyN7OP2cyDYHUYdauKJgmjzTlKuO4hSI2kYH124u66L4MJ0nrJJ9gBWTBR1RkndzAoJ2X4LL'
-             b'Q1NQboCjowmsb24VHBbfPC65wXnPXJdN1sZx1jr81E8/tXzuQlxaOQFLJ773YzA/BvP7niq/9CY8'
-             b'9sS7P/PH52651u+t3RmGqNUASkid7KcuGkNvorS5vXL5Ktx5+20F0VO5XDVSKdN1c6BZt7iic666'
-             b'aEV36wVuE5qyhNA7pUljuy1czobUPrNO83nAt75CM0giJHjDcMmtq6oLQN+vRcUyqVQp2qmCGEYq'
-             b'VOOmpYcioTVqMuIxe5cawKIOWZV4IQNxLrcKrqg3l3y+V3reJANa+Jmq/aPMlFAFCvmnzSZTmE9m'
-             b'MFga8qLcGWOQI1K6WFFCoIF/0MRl6GEQvZZETsKoggbdMBTMawKW4rEBMSlG89BzVRV4NhGCVaBs'
-             b'5vLRUCpPVjmxKrmkrrV2trUcyQm65ZpHR7NGaEeBLm9KAgIbsr+ZeSOfSMUIP43VvjHssocpsElV'
-             b'+JaksTZyholOQGRCMWy0zcEBWKKbH2toqHv760KVp3NDmB5Mynxq5ZblIvooBxh593kuvLC4BNdv'
-             b'rsIzX30GPvDBSkvXMEkywY90QYJUogHVrSivryp2gxMTkOHXIGjLCnxbEUxQRUpzidbJ71w3BUxs'
-             b'FJVNG8HDO6t9gSzqHGw9qTRnvlZCBOufIHvnLCGa4BiAVdZR9j5E7S7U+jqIcEY2GfHniXJaKjbJ'
-             b'N2OhDgUE34gntUqIbzMypqxNiVLrEFeIhWySDx3psHF4uF/WaBf+a4pa+RzTOnD1+mrxOWVWXwE4'
-             b'BFBQQGT5vV/jolqQ0nVz+vzBI489/q/Hmxsa2/I9956QTXc/wANmYzh14dzaE+//8O+Mpr2NtDny'
-             b'uPowuoYmLC7tbALNBOTdvQO48tq1svOiS5fML3pzc51nFlR8QOiihtuQ6NaQJ4QLCR/TqCiiJjBO'
-             b'0fJSgjczLdAyVTew6DOuXOXmam7J5yU342rRRvAGWjAQajy0U2s0F1qUgiCKKY/qPEPnZC5bxv0s'
-             b'Ye1pK0N+RgeNxL1y6aI4ofXmQc1nIpU17x0eFrp1EQPgwPksanUX5lYxAcoGCGr2kwqBwCwDeGyC'
-             b'S9CEQ5u9wCmlgjD1+OaO4MyTXNGXzju3YEQiplQHNwPQgbG0hF1/EaVqStfoNN110wxNzabULKMu'
-             b'6baB239sFnbkDZnnEcpmF0ztF8BUmll4kFWTaUG4cXAIV/b34cpueuztw7X039ePDuG1g/T79N6v'
-             b'T8awN+9hzPaBqggzJWfAtoYC51GJwQ5wwaarCnGWoMkouUNoHqb8IWaj72hrDPOjyDlXNleSJIMs'
-             b'Lc+Jvn/9zDOwkRacgkJCaU0Sy+07vY+J21+BK7gQTeqPLKMOTuUqC2UssyB+FWz1EKMtBYsQ1HQZ'
-             b'EOGAi/FQUVMwr50oOqMLLCzCotjOvPV2c3QJHxUSY2P3UDNxtJkxRmtLapst+nWEtEqTtnW1FrIQ'
-             b'BBztgurnHnReyW12qgbvaNTv8t4VgztEnbuhkAV4PJL1AfkYupfW4RzHEUW8gg4zpwSNerC6sbqq'
-             b'CePkQxjVKsHdHIUzVxr/eDKH2+97y1/efs+bvlNutSw//z6PEEJdSH6QRz5+vO+jP/9/wMqpHS2N'
-             b'weLLZZgucsqO1VT5D/uScz+Aq9eu1XTeLhj7Kf1+cnQAe9sV8+7BiMdloQgmzEAdGvJNEc1vRCyL'
-             b'L3L56IzBFFpvDpLLxOL/SQsp+gqKbECqPUNoWo7g82LQLlbSCofVhWRneCEuqCSZUOMoiGGbxC1Q'
-             b'7WeLMCLwguxikgNK79x4YjIbrIZR0r1NTatkCzaSj1qHguefFj+VWVYkxjwvkLPxrHp9nNMd5aTr'
-             b'ZSCOgUgu3Zn4xo2R9EKP3nDC7n89eMS6KSL/veOKRhJcl2o/qDpIo51CvTtA5jBlLUnX507aEHbS'
-             b'xrs2HsH1/UO4ursLV3f24LX0+9fSIWszbSz76QVMMDaCy9KEoXook/fZp5/WgqBChw9mPVzb3oXV'
-             b'tCHljWoCBTyfNq5BSS2eZ7ER1L+3OZ6Wjeva4QGsj4/SxgnKJFSbDTkPHYLO6+Sg0Miqgz8sudkF'
-             b'ohtymwhlQAPYv7kPoQ/OxBnUqF5N2B2MRhP48peeLr4ZlQBx94DAhYk6v4weZ+U+j6ghjBLxg85q'
-             b'DWSGfv3MnGzEMrksdVsAIjoOcHEdKsJAa2EBJ/mi+PLK/do575ltamXsQCZ/J/CqSXD3oCeAO/ad'
-             b'jAwIXSs3qMVEK73iwyJNQSf5HJ0wwczEYubme4Fb/tSIdEjFaajqWypk/oPdbW2zBpnDufDVvMBk'
-             b'Ys36xiZsp/vCRDrkkoYNYqu0INYZ5Gtumv78PR/6yO8tnDxZIoD+tkfIhq0f+JFOfLfdedcLjzz5'
-             b'vt87GE21z1j6tAhNP9oaKVGrcizV1CG8fm0VBmEItp7XVt7B3m4BUYonpQ7aSEMIGwBsQEa89Nw7'
-             b'thjUjK2XSAXr3bbMOZnlNEaVQE2VhirrJavg3IYVVUDXZFhyZUXWsrDjnVPxVYOh+mIyU4xPiGKq'
-             b'Q8ImilyYhQGwVc6wDJ2i81oIeBOtZRG6WB5lLtAh3zNkIXh4LEA4/flodGSUDfE48d/Nb9csXQcB'
-             b'bVEwd6zMekx4oOWRJvvKvhvUTKj0dWll8OfT+3wf72Ek+6zy7HOQubaERlpWJR/aBoWB5zksl88C'
-             b'nvRnNw5GsHZ4BKupgtmaTGGU22/55qX8iOXXrekEbqb/fy0dqqahXtMyx5PevW4aUtDx+5DDHvdm'
-             b'M1jdP0gbk5h0TZrLe5uOQcsnk+XymVSfvsfObJ6e2wEcpGt+wjMmmV2gKhTdwYDcAcQdmhCF+WY5'
-             b'RU016A2pueU4SvfmxlGR4ANaG75USFxRZDr6s996Fq6/9joMBwPr7Ur+Gx+gEA1QHcnmS+V78WET'
-             b'1KLgoaSo9zNnDKifSsoVSX+tXQI3D+EFM+gG6NaDY6kJtWXfG2mkyYGKpu5FmcJ3JmABX5UbOUZu'
-             b'46hEnd5Ui43hoEK6kSseivK8nXAK/Ki+thnBflKjDKzBmtauVEEXuP4vCqoIYCdTZfJItQs2xkBD'
-             b'nCkXJ61TL199ze7fMl5gpTeaFgBdSpXCHjIH8uylmw8/9sT/CyU2qPsBHsMl+GEeMFyED/29X/q/'
-             b'ZrA4i9Ghp1hwIDLKUHA8lc9WXmKog/jsSn7x8qslGgBZAZhffm4BZk7UQTq5D7iaiqoUJD8cq+5x'
-             b'2+s1ykPUNuIZkpsfHRpfT9l6gbeII4N/RvWCkc6BqOGpiGRYOXposQB4rD0oPigko7rbEDW4wEPS'
-             b'9FCT5KPJzIEalX4t9TtVO9mqBOou9+1EiuTcR8Ig69h7Idggw/HvpdMVeGVTiWVRTkXB+shNKmuf'
-             b'SPXQQ3+JHP4Q3U3uejpoFn1NRAULfws85FQBiw2Zao8+tkgYUx3akQnIOIdF5pGutb35vGw8e9Mx'
-             b'UDolhkJHr9drJaZXD0gn6sD0b6bpUHFtZx92cx6XVP8knA1fNvLsKP2d7dEYNg6O0u/NK1OynwI6'
-             b'kDJYdAMFsMTzrpzwZ+kzWk0V3erRIcxYhCEnX5nNe0WjyuvlDBDpDcIV0srE8zetpspG5MnuFPpR'
-             b'VDKC3UcsR2aVXCZRqI8IvWexlevXk21oW72OnNEo8TheBJq2XTgmhyFrPZHJ0N1YSTmenvYiqsFA'
-             b'DuqKKuLmc1N0mz5qCGKFVvduxOCNt+bT8+37xgJF3GnyZSaSa6t2zeeEDfmGnEJZOgyofjhAX0XL'
-             b'mijYL9BNT34/OtqH0fjQzuuqbEaL4yiK7ABbu3uF1TcsCDJpa3KlrZUqGngA2YcX0ho/J3jH4+/+'
-             b'N2cvXLge04ErTsZ/6yN0gwX4YR65dfLAw+/68gOPPvmnB+nk2UkbK/KiRGQXPD+x2h9mMOkw3ax7'
-             b'e3Dt2g038CVNkN3ZXC+ZPOg0BcX1TnbWKCDTaMZJPYVr1QQ69/HGu+aEEyya3mJBpHMfjEscfJ1U'
-             b'P+zijo/CCAwO0CiqMt9X9vMicouva1+4FiPyiVPmW94nRC5hGBzRIHqcCp/2onhOKPCQ1fw5Qdtn'
-             b'3JYobdqo2VkmoYUS/xAkIqNhrFQSQYagmhzfI6ScyZJaKb9116mdGUTHLxO/EatAA7l0BoetiXDs'
-             b'xMe0itJCBJvf6HMIwMoygHl6ozePRrCeNo7MPxgsDE1Vyp9Zme6RtFF8mkOdW22mSvMo+wl9xYyc'
-             b'hiwt6vT+HfZzWE8bSx8sIFMSpZWWHWxdRyHQcws4Rmf6HgwLwX11fx8O0velARorg7A5x5uaz/Pb'
-             b'bG4r16gYzlFlzCZgKG37tBbvbxzWasofesAMrDmx+eXLl+FyepRqir1e4uGLJIt2NKyQi7gJoqgL'
-             b'0SXuRj086QRf2tKCRpCKm6vmYodpnHj1vo2aFQVqniV+jpp6GzlOB7HBJJuPAJtDlca6c0aVqcyj'
-             b'pd9VzXo59DgXPr8el2PVcWJztHVL7i2Jq9dOkMj1KTqEE4+ZBRcWK2A3itw8ViGOfT+GDcd0ba6v'
-             b'6ZpG2imS2bX5F7Nt6NUrV5pDmHYsZEyivjhQU3Ftww6h75biY0++91/0sykrg//2R2DX5Q/+yKvF'
-             b'4jD+7Cd+5Z/OB4v9MFVWZVlvSBGOCi5EBKdayU/2lVevQg7TiX5ekcvBeZakb8GQYYWRE3uDV7n5'
-             b'2RFLjYNULBRM8t0R+7fshFLYZthXNZr2zJX2qgNOHRJG1KoDXPy8HhaZywbkfL6BXJpmr5JXNEsg'
-             b'V0RBzYX1e6DN3ZqRDqp6DTzhINb33bcC6mfQsfwc3QDGvGdwXDoPNoNSpV+oG9Yknf51DMcnWDm1'
-             b'Imsvgk8k5qwsqYJVLkyGemnOk9hCM8mRFYKovsiRRrz5n/jAIBglGWMdc0yiCl0q+yEfUPZmc7i+'
-             b'l6unWYEfRzCFZGAKgPDRolYntaoX7p4Il7aOxjWIMVT1WqZHh2iS7nFa+DbShpIrsJpv1TEQVsy3'
-             b'QTcF4ANdJwANNuEhuhM5t7/y7buZPp/DnO0UbOFDaGdyQSp0FDWYdkPbuaHn1THrTiyywxzrvj+F'
-             b'2f68eKL0hK3SYlAPXkYm6RyDTCkp1BG1JJRbJWj3wBhyqL7GIDHrDdzQMFCtEdw3Edh+QdV+gWgK'
-             b'X1GwaqOe/YvY+RF0UGtHc85FaGbx6PiawDQMy1HiQy2YkhAJmu4ANBYJxl1pBSqVkhFOxDDdiZEZ'
-             b'qVkPA4rsPyq0u64VXSvlD3KPAWynwiCrvGu1bkb4zh2Yakerg71UxV+/dq12mqDO5aIL+9D+D6HG'
-             b'xkjIaib73/fgw19889vf8fn5aFRM4T/IY9BPx/BDf6Vd8O0PP/r/PfDOJ//8xnPP/OzZdNEK/sZB'
-             b'fsHzDwMH5VWVxwB29g/h+s2bcMdtF4t5TDxQoeDhD9LjCLqlpSJVlwVCE201FdjHtEPDs6uKGEOE'
-             b'KI4tugoKWm6VxDUQea6aqQLfoAIjh9svJ4+5IfzRCNqqpmb/hVfISUS3eBAiubkeBZXg6ulVFJGR'
-             b'pbZsXCT/Mz3SC60aI+pY0RUNNxOPxwqIabkuHBksG4ItLuqB6OptVRNf0RzziI2xtwpAvNkZLCXZ'
-             b'K8+PbV+d46LZaI9MqCBzyybfRozTVnXLNShVUKak76dFfSPfJHnIT53Gs9CxQ27HVAjoBCzMQmjm'
-             b'ytU9qCtElfEswumFzqTiYHLwPnB2lUSJSGXW1be/45t5HklZg6Z+pSaYTpKFUFKx07/ZOhzB4NRJ'
-             b'WOS2JxIYossZngMYpUCDy8nNDI6Bj4vnO6LKjovJd/sQzp887cRHnS7W+b8XFhbg6pWr6XEF3nTf'
-             b'vTAZT7hirFVxJ2ovtV7U9zMc4x0ipxFrdSq5XwKcRnIdCJGL902Qn6snVZABPAvUd5MPtlEO0UJA'
-             b'd7OxVrxV1b51bgV6KCNzyzY8SvXhkIUlauNAQxg7f0pgcK1vb/Kt0vl2LdqIQT1+nBeBLYm8eMnU'
-             b'1Gy2gMLpnIyKWCJHpJBuvA7XJqrU9P4MU3Fx9cpLRZ0HwQIQxTyMLKGXw7fpFftyGMnhhu/+mY/+'
-             b'n8vnz81gNPqBt5sQmNn1Qz3yB7O43P/8J379n4xoQJEvLEJy5G60k7N1UNidHIvp7DsvvaRSR03N'
-             b'Tb9mrf76+qqetgQ7ZEY+1HBCkuOspZHVzSkay8vfePV5dCqvbJQCeCzeuIl3NsWhvwANwQRuQB+s'
-             b'Iii9+GCmXa5aiOXeBcHC7nwBrtZkTcMc1VlfbKIGiMnRTDVRYoGVdOhtslru1wtbBvaulQHWexe+'
-             b'YonJmM8boKzP1Jn384JNinQ8/I1zfvhnoem9TUlJdQALEVpVGdp7LkcADRkF9hX5hSiCnrqb6HCU'
-             b'mabrkacb8bDvYS3PhYYD95kCpwiD+YcQqzqXuy25F88SHafYstlJIXpLFAP5EEaC/VFOoA3qx+Jx'
-             b'jCKS5LQZ0Hw3kUWJqkWLsWFkCv28VGrpT27uHxRxCTq2nAl5yOwJBM08lFwF1TetUzQZNau6Ml9t'
-             b'djSDw51xkZpHyejys5+SlTqAZ555xgjyZAR3G5katis4SJiVUy4JwHl87FBpa4HMcEs7TczJaqeI'
-             b'dm27aAtrNaN2QopehaJNk6lpnFr7XmZnsryJJ4zMbBKd948cx8+oKKjKZ3KvjRwL1YsbZC4cNDyX'
-             b'yrpSxRMaPlx+H12woVRkRdTAc3RUuniqojbWGTLNeV0iwPD2H6rClqNUOFy9diMd9BZKN8zIFfW4'
-             b'SL6mwl4/n0Kumfdw/o67n3/ive//fRqP6jzvB3wEzGDAH+GRVi945D3v/eO7H3z0C3ujqWvlxKJe'
-             b'ySBJOanIgJRE/p3+KHsrNrf34fVrN8vvRZssLZfD/T042Ntmw7b5Xkj6uygYI0PiC3hGLkapplvK'
-             b'gW0xUS50bFV7mpyrJbzvSQsLLxp+B3yQV1Uc6m2nA2aPRQjKL7RTh/v5bKwljLpZBhaElAs7KiZa'
-             b'vVQN3qTcaL0FOEbLsdLIgbL3SUuwr5WC3BO1Z1DmhLPZXMnfsXfGzBLFEHWDjv6kyQtTyRBqeGUm'
-             b'BWe+ty1Sxs9Rr5mL/rJhtHud6PviEfU5BOloQJ3HldZuej1H6YJfOxwXJV80smPNOuM9nHjCjSiz'
-             b'OZ4z9A4oLJEGYrRNf2dSNvPAMNqqHJRE1Vnfe0RGQ8EQhfwcokmTXfcBuccnlaVD4ql8PH8Wk/T+'
-             b'bRweQuxYacm8OUST6kc+TRf7AKm1tUk78+gdcPaY8lpznHj638HmIfRjnqu5Mox4OJ9ne1euXi1s'
-             b'v4XBYk0YJhHtiEc3mqDJETbErKyJvGh2D0uwlZaao624w5X6HMg6LRpqGcht3aIM7Ns4Hq3Y5RDV'
-             b'3l+eKiMtOmyCU31GWdATZHgDYNmIKehgv+SJPSIxFzGYOwySM3B78YnSWcgYhhiaFJDK59vdgsMj'
-             b'hsiWa8yKSPKkdG5Rv3Z9tXL6pEsVPXw7urYrRwjxfDD///uTGTzxwY/8P0snTu31qbru07rygz5y'
-             b'vwB+pEf+x4OF+d/7+Cf/l8MpkkWmYzH45cGYSb6jDSrVCFgX7VcuX0n7Xa/6+hq2lS70dOrd3dpI'
-             b'RYWLFpCLOdQPrWKXosooySvb0Mcio8sy8vBZO7GhzLPkxK/S1QAN01pzl3hGoSqa0BDi6/7caYCd'
-             b'igEcMsRLT5FJ6iDVGjFjT49rocTMatmv0F2JJHB9ZAwWa+GG542sVyoCcqc6kx3V9mxa1HMMA5Fn'
-             b'wsryXuPpg+Ta8CmOfHIIEwqKcIPM7Bclhjr49xPbU73j5IH7MykPzCJGjhZuyjSfLJTflGk6OOT5'
-             b'zaS02YKx6FGnkpXSkedKg6AbcTM7k0qAOX2gfDjGHYmpUsQhPNfq0GqFMocqajKJ8uycsq96rSgo'
-             b'ZdXBgUnztCKCRdX0kYM6AxzEOeznz6uYjqHNvxLZP5CargO6loy+gcHNBtm27Cq0AteaD+Bwe5SD'
-             b'UfS9IVZfosxP0uv76te+VnxTwcmkleQejI6ieCZBe6G7NKIp31Q5poZUdNejHWQE4KwHTHRWZo2i'
-             b'YAtGIJZOA2/cwSn8yHUAfP/J5nDAr5XkkKHKl+gOjR4AahuN5q4plID9ScyC1J+prMLg6k47SUSp'
-             b'/iSCRGEoltiAjtSeSSY0n8Dmxk03RpE2NLVQ6r5WwPlAeuXKNV1zAzlJY7QDZ00kjxy3VK+ffIku'
-             b'n7m48+4P/dzvQiabL678UI9QGuM/6mM6hcc//JGnHnziff+2+KYEttoFRRY18EUBmYpqaNAV9tON'
-             b'1ZswGA5VkSUtmvFoBPu720XKTp6dR9gM2b06VRR38sF6nwOiRWvoBRhEFuHSTDXIEE3ieYzvpzEs'
-             b'RZfJaiU0lZF4kITmDGQsMKda5zLccDAC6TQVoOBlKtWjsr2OEwKCLvKRvBRX8oeCm6+Zz8TECizz'
-             b'9cQHSWaNsriaAEJ2kwJJddWMJPOovDVG68I2zHXOYmJZfRRDdQQXRW5vEuKxaA90dkzHztOTHDpM'
-             b'DtVNcSttUDkaoAhpSOxcNS1Y2lDAuBeS5GQiqxKd476onhzYNt+UgyJ+YOp3dCR2step0GNHrVB1'
-             b'K9e+kmNUY2fcgsPiJKk+hNOm8vIyOwupUjyA3ZwH1tm5HcGjIK3lFsSf5m2zRI20hqIt0qRtogGM'
-             b'dsYQR0wUYHAxyXVIOWp+EV5+8TJsFrbb0PxsciiLdu3JNYucOF0ICSLvbaOU1NekKohA+r7rwSu2'
-             b'c7wqFbdWHPnPJKL5K4V8KwZbrWxaY6qmD/i0XApOkg+OzO9m261ixaThaHAYdKGiZsCILqHbukBG'
-             b'5w8WU+M3caa1I3c3inUk1q7F5toaxNwl0WTxqJ9zqXL1PEjl81tf34C9/X2GMLT0Fi9OchdNZuqX'
-             b'++lwPIN3PPm+f3Xx9ttfjqOjIo77YR6hNMh/1Ed+cxYW+1/89b//jya4OIs9Kv26tHo61DmWhPyp'
-             b'ii7WPKNMWP/OSy/DNFVe0t6oFIJcTXWwsb5WaBRBZluMb489GbFc5NbRm1yDKv0yVJWigUTtIrKA'
-             b'QQQLqLMutHzI0eTT6Mns6BtdrgeDLl/IKV+4VakZ2ryhEn9faVtR9KZWppkXtIlziqsShKyV4dpT'
-             b'GCykMfBpXtzT4biHOaDR2GVD50l2adWg9dVlmysij753VHibMGSasqrinbpQKOboI6wd9om88Vha'
-             b'TO6mD7JAcdWpIztEXW90phaNxXaYbsbDea+ihXTlwZxPt8Kj1VwxPhTEaDectn9iDfgsz7/v62bF'
-             b'7aKVxUEFJqtSU7A1AKeWlk1QgQ4K7BSQoq70YZFS9VjWPbZGCp5JoKbA5mqzg93JRNt+8Rh+SqtH'
-             b'qptcZHRZNJdtRfzEagalY0BUnY30HYz3JoVuUJhz0bfb63s2Sc/jm3/zN4VQgOxlVBo9b2axfNa1'
-             b'fiF3aCIfJ8OsPE1CAC+zN2sFBLmTgy7YUdFiEfzhXxiYZU3p/X3Mm1PP/5+MA4L7Popnwsbg2ygG'
-             b'oY1DMXalBYg1doFGaUnaXiWxUnBcRwMh5YNeJcO3UTV6v7J9QTxymQm5s70BBwf7BqKWpGIOjSxV'
-             b'FQdMhlDb/i+9chV0+JAFFw4fgxoJH4pdJXI8SyhdtXR9La0cve/nf/F/Az4U/rCPASDCj/U1ncDb'
-             b'Hn/3nz/y0x/8Vy9/+bOfWsiKqYzgTzdxV8CDtgDpAhPrhRwKUX0Am7t7cPnq6/DW++6DPlVnWo2U'
-             b'KmYOG2s34Pa77q2n/WgRGOT6wFI9CHYEvXQsONUZkZqISwUkrLvoT0BkmTUUtPJApUHLEJjVZE1f'
-             b'GFWUYLP8Hiz2iDdicqcR6UnzjYnoY8pcrIJWg9wKkk2FgZgeiBoc5SGCQ6rE+n5IlAG4eGoNtWPy'
-             b'RayllMaOe5VVaf3oW4tNwH1NaY1+CWEwB7ocLvPxmBPeG6NB84LAf3dWECl9gtlv8nryz+mUgJ69'
-             b'UFn9Ni5y7Q4cHZ7VSQOH2aD2AOyGbPwecoUdrEFXnstyN4CVhXStz7lNyoBf4oV4KZ/pSv9joWyQ'
-             b'+XPrzb/vVFfgkGACUkVlI/bSUpOoB/7gVLjCM5lsmNxL99HJLCl2OW3BLaJi9wnaxYzOy2rwY+Vz'
-             b'xvqX5/wdssF3tDuG5TNL0C3nCI+Z22TrIWlpeQjffu45ePKnn0y/X6oiHEnsRTPal+54iHr/huC8'
-             b'W41hvmuUtkjoo8lY+ti7dvdxHheZcoGgaemiReIyQBZUVq8KYsRjgGi+fiNaLD1H1YPPYRJCuNTl'
-             b'HvslviQtStzhW2aEzkAsOCt0966GNcqMkKTlb54oLFHvXVFOb29t6PUvn0MgVAI9cTs4f+Z5vnjt'
-             b'xk24ublZTO4KBCABO0t12oPPEQ9sM8ic1zc/+p5P33Lx4tc2r18/nrr4A30N6AekoH+/r/z+fPyT'
-             b'v/Hf/5OvP/2LESdnEKfMSzPadr2A6gm9xMXnecagZu+EwRCee+EVuOPW22BlaaihbnkBGKYFYDwe'
-             b'pTd2HS7edgdkW0sIwTGh3GwFmVkXvHSXdDE7fqQkSwrSU7zPaoIYzPBIDo+EfLpx1AqpwCLYxWyt'
-             b'aD8A5aQRVv6ZAa4KGIrKTK8tapSEGjwoAOZIOsPTHrn8m3Ky8VUfuSgELD3jgC6bSk6KvBjVfbsv'
-             b'rStqBtcsjc83HX+PENCma4EXgS4oPaLkj8k75tPQwGJFwBl0jZnros1FcYiySBauSa1uiuu/5upG'
-             b'ihr1mKv9rfG4cPGKFByqjJxq+iDzKF1sRzP0Nimvv62C032Wf5+u8/MnVmDA6C7irC3bzAlWhgtw'
-             b'8cwp2Dgc64ZcU6sHVQKOUU+pQYju4seJoLTw4A5RNVY9tER+vgeyhCN7p04uLwDNoiNASMFh1A4U'
-             b'8YV8L7K5lN8oSuw7ynCdD2/UwcH2EZxfPg1znGtg5Gw6L99oYWEAo9EYvvE334D3f/ADZVZdFXcd'
-             b'33OhocNokCYr9hpbQrZPyDWELW6nzlOiMgAttoNcpEavZA+NxOHnUX9mUHSebnDBWWfK1Ra0E6Qh'
-             b'gGp/IQl1UxhvGx/SWIPrbNEDop3YSzelEJtsNeD3S1+nbOhsjyBGpLE9zHieDBamOIebq68zDsxo'
-             b'+uU5daFJeyA+bGaQ7MupiiIdIwg0mStJ7JSZasDwyFV6uucGS/3P/MLH/9nJM2dLbuCP8jXox6Mf'
-             b'e5OC9D3uuPfebz7yng//8298/o/+85WBLUa2BER1JOb2X43k6JXdl8kGz377BXj344+mFz01FQ17'
-             b'cTIuaeXESVg8cUoFYlF0/V45hJaNpEN08gwUkVSiUbSbG8JymrAJhAuN/F3k1EEvVNR0Va808Fgm'
-             b'rfRkMC5xAJFMyRQt2VQ2KWvR9ObR4gNAVp0RGsFZRCZysvG4mSpXjRZzky/oiG6RkJZXZN9O78Mp'
-             b'Wrp7+nXKtInIG1tZgCLahte0UUUhhiX2RQkabhMN1NJoS0VC7lOhNgZbeu3gaASyIOcFcJ5+za2v'
-             b'vuCNmB3m1F6V1MH+Pt9aiqa8A2wrGPnv8hzmPZwdDuFkpvpn6oSIHSQrSeR16UY/NVyE9f4wd/id'
-             b'sTTqTDFIrI18tlplinhYxhr19XZKDhFzMSlHstyS6QQ7WYiwiIbG8ix/qaQogM0lCBuaCSI5uG9U'
-             b'31JXqrOuLHzz0RxiJuGnTawnn4zAXpzBAJ599lvw6GPvKpEORF5wLfgq1CgOle2gx7n6Qw13DsgJ'
-             b'JaIz7JPJ6MsBLAjCCJyp3u7fJo4HK9lG1He1cOk14oSUTWrHFozuGgf0rDJHr4ktI1GFH+xfKht+'
-             b'by0/nzenKd9kZjeoFhV/9FSkkltn8iGmFzh0upHWb9wonarsj4ra4eD3H50JPtjsMieq39zaLqnq'
-             b'KqOHY903dAc6SY1Ivx6lNf3OBx/+/EOPP/H5vIkvpsPcj/IVMpn8J/HIz/SjH//E/xpOnN4ZlP+O'
-             b'ZuBkOaIMJ3PfMiuooipTQrmYr1y7XrJpMvkWNO+I+7L9vCCTogxBA6hfRWWT3I7yCH0g/06SO3JG'
-             b'H6DD4x1D2fiJbSOh1kyoUOO1mwgRBKMuksFzy4LcGUw0mowZg0sMlYG6zH7Z6EtykxE6llgdgmrV'
-             b'xVBNUZghRj05OwaBGqM1jNs54kNw/f4sq55MqwRdMTOd841AS3hGByX1lQh5q6hgCJ2Sz1/2qBFu'
-             b'bR1Mzh9GFnkH3vDYnAPrCx/nhji76CMYp4wMIuh183yytQRhaSd3Iah7HlXFlhdrgrNLi4BZnUpo'
-             b'OBjqnOoy1ryo9HeWBwOby4H18ytgtcqjRQlr8yRUc662ptgfRX5N89lpmUaRvvf+eGIqVGemiy5b'
-             b'yzyMfv7HRAI3vyHDznPsPc8+ZgSj/UnNX4ouhJJxQ1mlu7e7B1euXIbFfF83aZZRc6GQhSwgpBrX'
-             b'tgI3igH1OUWbVTZex6hyd1QIvmd3gpr9NQrHq9vdvxVMmNxvajtxAaGek4ku74miU8kFn7XoMGko'
-             b'3E5ys7bIQmlW9AUOPHL09Aop6JssLXBp12qS5plxjkkaH+4XyXk9xPZuhhYaxmcXgq6n+XN+/uVX'
-             b'6z0klSbfYbl1CC59Ww62oIljEQ7SIfbJD3/kf09r0Xw+OYT5dPQjPQaZpfeT+erhzre97fknPvRz'
-             b'//dffeZ3/ssFzliRE6FqCvILjpFLd1BzXW3lBPjGt5+HS7fcokxAuRnzTZCJ3Ac723D6wq0wm8/N'
-             b'KyXBXcTxFq7HTwptdMldKpc/Vn5HB5qFtmVAvooK/qIUpZx3t1s/UZNbtSSzuJF6iOtVplw3115d'
-             b'50aitnROqaJIvSl8kbA0lJyiEcGk6VabiLKx4wvcTsiSNCtWgNlkDv2c/U7a7us5OwyKom2Ws8YE'
-             b'oBscFULVupItZENvaq2ZbpO3NgSJwii4DZbIigVywZRmWWY1ZSgn+9G4h1lmsXWdZZu5914C9yJ/'
-             b'Lp2zENQ6F6VLXU6avbaeqkL1zOJiqlRCFe4EofvRsSNmrSDzTX3m5Aoc7h2yiTeqVLuTjCzyPjMZ'
-             b'AVKpWAYkcm17nUJRCD6nTAqD9Hym+e/nz24mRk7XTpW5aibxgyVSCtKHGISMqpglNaFn8UhX1Ij1'
-             b'mjzcGcHiqcVKIaFaEfs5Wf4uz33z2/Dg297On6tJvHuuIEIU9BkP7pm0TrHlMirZnwIzuYJeW3re'
-             b'iA5EG6tQIzIrEFS5y8GgSI3XTuhSpLDW3nVI8Nic2FFnVLJOtTUpg2foTDDjstY00h4d6QCOGdQC'
-             b'6UET2fyu/svQMlrI2UdAuZn5gJU+p+kMNldvltEJOlMVufmax1vlw+pwsAAvXr4C+wf7NSMM7JCs'
-             b'UjM1WfeO61kDHPfHBLe97cEvvf3hR5863NhQw/CP1O6L/RR+Ul84ifBzv/wr//QrX/jsb062rl9a'
-             b'QUdNCKDIEXK65bK4cv9ukHFJeyP45nPPw5OPvjMtkqN6gyAzz9KCkHHyS8snYLi0wkoxrs6CIUPQ'
-             b'Y3HQkcTLxdHpqTLKqYrauHZkZZlIm/0svc4PeBPBqMoiJF8RxIamXEt+dxKTqkIEFJ07WfmWFzmm'
-             b'DUd6qBrNw8O5XaQgzfJLp6c4FBlxsAyZqieps7jIAhHgZM1C5k7/PU6VVF5EggYnHUMoibvdkRDA'
-             b'GadR/VmoyBjCFkxZTnXY2ZjKczKIGgWUvW4yVp30yn0mVyZ35aDAzLRzdA1RL9bsK4cv4qo1ilLp'
-             b'+PsbkFV83O4J1Z8U+IAlFVjwuVZc8apiMt2k/ayvC2jHkdRUIy4xoKMnuLYSzwWktStROD5lNUqg'
-             b'JLJYJvL3y/Hes1mR3p9PFQxK9e2usd59NhTBpeGSmt6iVC7o7QOkqrf8M6eHs/SYwuKZAW/YYh6t'
-             b'85mlhSVYvbYKazfX4eLFc2oQNyJ34JExWvSI3geRvURoJJWIJkN3mK1aJZioRBh+gWJjprafK5EY'
-             b'UQ+ewgkkj9uC4H5Put5IB6SGHqLOjKAZcTh4tPQDArrNgVwcRlSsWxt3FsBxYR1SChTCa12BoNWM'
-             b'BKPeuHY1FfLTOhoRsJZT38r3DS7mPc8Sn3/hpTKLBE0c4E+er3WpRlGz4wzhNu8W4KO/9Ml/fObi'
-             b'pfE8FRc/zleocQQ/mUceIp+78+7LP/8rv/6PpzioSms1FlWPj8xfasBe4OqcpZIlsmMIL1++Cqtr'
-             b'azBIN5dg98WNnUvajZs3Kq0YbO6BnMTZzPfJyu/AfdfQtIbETxB0E1RvVUDz5bECSdD4ShCOb2SE'
-             b'WS6NfVWpNqnXifwwFutMl7wsO5KDapL5NBxLDJgNHKL1oUPlujiTvguJQ9C4kAbFL6ZYl5iVjXv5'
-             b'tVe47NziCKIMhallBpJrG4kcV9cbkxropkXO94TBtWldEB60cmty0A9kL8cx1hXjgmob9ijPZGIU'
-             b'xyoLTFzFJa83iuAkyjifKxTxRzHlmrdq4kWyvk+9JgVr5QxVlOIN5WWekd7T5eECLA2CtowlV6l3'
-             b'G09x6ZNrExfPkOuk5jmDzunqTDQovDU2m33+5XAytvYSS7JBjbxoSbPBgY+JbMrC8Tviu8s/XEVL'
-             b'fP3kmfFkb5KqPWNY1C5dr4eZyXQM33n+udLWl9tD7h+ZEypajOqgX94HFAUnma2+Fhtivg9KWtfY'
-             b'NrGgqJ+JxT7EIAEwq4ch1qRlHlzbt7PPNdoVGWNwnMjggNOugY2dI9rIPYyua6BsfQtzPcbrK+Kt'
-             b'6A4+vlLXCJ/gAlGjQgKycnVrbRUmJYKD1PTv8JY8PwRLRsj/Lq3BL7x8GY7GY0uqFtqPwhSCRuOU'
-             b'GVTsdC09nPRw51ve9u8ef897/qCfTeCHCdb9rg+0FvyP/8hXR3pSH/74L//2bQ889LUM3Wx4btIB'
-             b'6eoPNpimRRIL+ufZb38H+nntWUfGyggUup9OYHt9tbSbvBMpCnZJjpg6Eo+OPd67k1fk/S9akiZZ'
-             b'8q9csGo+FIOsznW4Vxv9AP+NsfHiIJdTva1J9U3DAKpyAj3NGPkC/UwH2h8jINHc5uwDX0AOpobg'
-             b'3OhuMa9tLnb9c9aXVjFsrByli5SEBM1R5XpyzNVFVmkyotub+0p1TC73ys2lGg+L3HKeKu7d/g2z'
-             b'jVwKaQXMKg2A3EFC3vVsNqbojAjk8sFclp7L1iLOTiooJTcOByd8FmVTtlosDFyYoxOAZPAv8sC9'
-             b'WC1YmbeQ/vGJxcVymBB9GqHBVzWzCB042ZlBc8skcosLwYQT4o1RxghGfe5ZOSvEB9tO+RWjncaN'
-             b'aCB0ivYApqZgRd2Y0CYbNsf7U5gezbmaZNMGSfxUOnwOO3j5pRfhKMfwALfW1UZPFr9Bzk/H6kZ9'
-             b'znouYd8QeLUZOLtudNdpbHizGW4NLr6J/JwasaGXtzik6D7mYKqq2E5YfcqWnnR0ridUG4dXk41R'
-             b'eYHBPg86Rmv3RmFW2GLQYZeNzDjfa29nC/Z3t2oOmvjtQlAsgZBQ1JrAES27u/vwypWrlXijaLIg'
-             b'GJkaXcO9S0JshC3517Qt0c/90if/pw5xOjs6gmlW2P4YjwCZm/eTfKQ3YeHMxYNf/o3/6L8ZxUFP'
-             b'qoqL3Idng2RxlvcNKKzs6j2mCmoR1rZ24aVXXoWF9D3LUFaVsfUDOtrLUcc1IFHaG43PBNEUbiIl'
-             b'j6Sx8tJ9IxeoaFRzr9iJWk4XFVupoEQ22jL6bC312HreiKRCI4MJolPyaAy9nmrcqVRYgeQ8NPkE'
-             b'TqQ08GJRRZvZGCLfZNTVbW4Ocy9W0I1cWzuhlPzkxBjaLmL5bClU5NTtkoTlpN0cIY613cWPUWYQ'
-             b'0R10nHIP4JhP2kcx6H9I1UMqyIj5cwn5hI8q39bMIKgmZBQRRbCYmGo/8/MNyyqIHBfPAvBUFXVw'
-             b'ZmXRLBaABoFFL+4IXIXVjbsQ/7USrP1/JUlEqwyRq1XLSOfDEZmtYy5zO3L2A0RlFhbxSJ8rSvPQ'
-             b'YBOv5uPW0fiTUqVwBRK4jRXa3YAXbfbmpPt2b2fEfj3UxbaPkdtzHWxtbMGVy68WVBIIAJgFUEEW'
-             b'+yYYEF2LuQapRorgYCzVtgF0rGIJevi186JwMaMlgmv1eiwzzvPxosVloF+QXeaYwAPouOrNQYgh'
-             b'2uYn1Z9XKEoar2czUpOR58DGOppw9gmq4GJZP+aTEWylg3zg+bLmUrFAStFd4PPbspdqWIy7WTRV'
-             b'28fi1wqcndfZkU4OhyD+tAgHRxO496FH/uyn3vvepwqQYWH44z/2tnbgJ/2FuAdvfeidn37zIz/1'
-             b'1NVvffkTJxeD+iCyV6Lk6TgprJ6e57nUrJdW3qiee+ky3HLrJTh75mQ5ecmiLj6pjfV1GCwuw0I2'
-             b'Cva9+Ww06tlaeRS9ydc12SOwqsoFZEZSs5ubMkAdjZFGFJRWTLnROrCIdC8ODCa40DwtdMq3aFw+'
-             b'VeINWDkUdVhLYGorlWVxZVNPpXWBiQ5Aq7MwbOX39hz4BJVjCsqBwVU6vJGN2Z6AaIZmwReVoXOE'
-             b'Jire0nLRE311Y/VmY18ZyU1GKpd2i6nfoRyQE9wGC+hbWFCynSxipS5oQX+G5F3x3IJ78GIwFc9N'
-             b'kA0BXEuzGNAHtRqbp80mLnIbk+cJgYf50VJPRSUo1/uQ4cxyAsWedNZEysBDo3WjkeADki4nmunF'
-             b'b0QfeLNnQUngVnC+b8b9HBZyDL2ILI4JWKu5HpR+LZ8Xkfl5SGJAnK3DS2ByhTI9TK9rHpR2IZtp'
-             b'LO9xHr4P4NvPfjutDQ9ylUCcnZX+zbSv91Aw4zxyFYbM1vPmUQwm9W6iONDsA/ZcfYZvXw+tguij'
-             b'0LaNQzDhOzoLtHy2LorGLN3RmeiFHhPcPWBzCMII4FmgPq4mcAUYWfzjobUCdOV+Jh4XYYjvM9Qs'
-             b'qdW16+UwNnAzpeYAiI7Mzu9hPjxsbO7AlWvXUr2xqDEmTTcEbQ3KNJqui3YwSL+MYoi/8MlP/c/d'
-             b'6dNzSFXUjw2LyK8pRwD/pB+DdJEuLS3SJz71H/x3sHjicN6TutqnaYeuCzBYz1c8/HKcjhwLkP7d'
-             b'1775bGkDBgEglk2n1xJ84+b19G7NCt/PZxOhWnX5lBmkBxyMkyVYoiitBrSYcuWsYVMVlbC6wKY5'
-             b'dyKVizo4/4RWEXHenKwQwzFXFre+pGHs4ujr8Tc4nBSph0UOnsTtMlSuX9SOgPhQ0KWXBZLbqyb4'
-             b'YtSpnt106fsc7u+zqZrnHQqs5DYTiwcIrZ3ke5K9O2nKYlEVjKBVlx4i3OsWkrOPcDEuInwXa610'
-             b'ImoSb35PZtwW8xgoC4J0rSov6NDnh7VKlYgJ+eSYeyaKRVFPdfyeIrlYCfLEDGjyuAR3ZOqq6OgH'
-             b'oPMy5SXmpF80s7PE1HcgVR7xocWSoeX0WxctekPaLLgTu5Dc0RHFqz2C8Tis1DWxCx/imuz33Ibv'
-             b'4Wh/VFumImNWuwQVCfq111+Hrc3Nwu0MPBcq1z5zCgUQE1jQ006Qa5Uon5nOWdEpLdDJ4awkATte'
-             b'crgZs/kwmAy7eOmEcE+9Ch7IAuuco0Xoq46yIdpeQq85dzgTE/Ygk9ftqWNjTm6iBWSOj+4zJOfY'
-             b'dQDrfE1s37wJk9FhsfrYzyUwrYlvSTpoQHpKzz//Yu06lM+wa2YL0g6WA1yfDj/iNcxfe4dTeOjx'
-             b'9372kcd/+k/gcFyq64Io+TEfg+WTJ+Dv5Cs9v/vf+ejT7/u5j/32X/zhv/yvzp9eLAFtUSOLe+X5'
-             b'yYc0ZH+VnLgzdHZra7eYfN/1zkegn4/ZjFo/3S6zyqYj2Fi9ARdvv1MHgkZAIXdxMe5HTJYBHSqf'
-             b'Kk0aPX7EsDN64TivhZbtnjAenRjaMcZCMExLNeR2ugBX+bqlsqqtVJ56cHMsMLq5+lG0hSpAvl43'
-             b'lICRAa7syMde/Q/SahCpbz7lSqZV11WztaqwkI7FONT2RJDhr+Ro9eYaM0OuU1SJPyvybAPBKhhA'
-             b'h4nhU6nQFtDHjFvsgu/RCy4qv9a8wWzvH+QEaSVp68/nFil6m7Lzc2EIWvVFZ+iuCiupPgmmMbfR'
-             b'elhgIG2nizJjttRo6jaG9JtZjLoJdhjUvlorYmJTJTWVgDDxamVRT/XBPWc506Of3fHltJg+y6VS'
-             b'vfUav2BEfpfLocZ2a/kS07UFl1OtEC5bU/6+UFZShTI6mMDJc8sSqMGzpCpgofQ0RoezEop4y6VL'
-             b'Rdhi3F7iOUlNkaXegy9MlFKrflLPmI3wahWkYinnsUJpE3J8i8SVqMIWDHxtytSghHEQ36HkhSnh'
-             b'wwy1SAZwVhtLIMt4c6Z+Eedgg+EjPviYaEjCBt+gfGXjX/Sz7Z6KUCIHGO7ubBbbiL1u1DgO4GsI'
-             b'mU4hs93BcACvXr0GN7c2C85unvUAwVLJSQGGUVFm5ODT89xiXFgZ/eKv/uZ/i92wp8noGFb6R/8a'
-             b'UD//u9mk+Gr+2L//G//Dt575ysemm689UkjRHfdjQ+daBj5nobOgvKLUHcIrV67BhQu3wN13XCr8'
-             b'Ly8vzzCcfOJfXNyEsxdvTYvH3A2brTCpMvZaCtvchKwUD6ZWKX1cYiOtHoDIZUpxFRLI/EyOT2xe'
-             b'DjBVIHIkOdgmaJu0ebGA/Rll1eNSSRJewZGsyXmPNI1YMwuDxRzwDRDQ+5F8KkdnMnHZlENV+B2N'
-             b'RyXHChtjNItc0kWcfVQLMLTePHjprHmiLLDQ5BO+dadPlZzkXyNTHA/aCKTagpSkVTDrZKluTi4t'
-             b'wlG6cfs2i7HJ+omCs3JJqlEracMOkVPXKRexcMlmcGplEUKq5PNn2msSbjQBj6hP02axO5uVf1NJ'
-             b'0qjvBYEoxUCTVZu5TBmEdzoT1FwhtDaOplShU36lvzub5xZ7rPEM4jMDcmZsMiGFnz26Nmvem3rX'
-             b'wvUAcLWgxvocc8tvnDaiwYmu9u8ZlVU3ka4shi+/+BI89lOPcRGCbcKAdEtYTZoPKEEPDXz4c9y5'
-             b'6IIbBUgsoaNywWmbH/mQGD2Oq3eYRhep47cLbdHZfRh8prz4F+W+001eBFDWdkc4hiNydBkAD72O'
-             b'zptkmODInD2STD3+QBbYsLt287oJZVgAVfdgctMvsvknVrP6aDSBF165nK7NQVmDs74k7w11tIJN'
-             b'Cx/9aITxXnv7E3jsZz72L97y0Dv+Ynqw9yMx+r7nJjUdTeHv7Gs0g+WV01u//Kn/+L/+nd/+R/96'
-             b'eaELdDSqgzygdkDNZb8sDAJFzZtZ3vm/+eyzaaM6A0uFRgGavCu09L3t7J9agYUTdX4VnGGzHobY'
-             b'sxKtIsBop331dYAk10YbZoR6SlRvlyrE6oUZ3G2GHMcRuYknLRQDeKIqhSzFV/51cDHP1iagZuGi'
-             b'Y+IQsJkXAsehx0aGX6TiEvcBxkiT1l3NQupZ0lx9ZDlHajYdc2szuNNl3TULJDpWaT9o24QxUVIf'
-             b'kGvFgQze0Z32vRkSrUpER6BQ5SC2BxrhIOKxLCn+eQvpOjrq59pS1bm1I7Yjq6h6JMUUBRc3bmsX'
-             b'2UwvimcmwLSv8uyg55SuLMjRpbuKnWGa/lmGvvaILcSVO7pRZd0+20kG6RKCQu52ITi+pAqdJShZ'
-             b'K5bDRu+y2ICc9wjldC3MRoOgoku8i2pcQjP2chBjHd6HHHpcK8Q5lpbfudOniy8MAuoGUegHqapb'
-             b'X1uD3e1dOHPuTG0Xie2t8YrZIlfnUh3LobniEYuDZHwRGdGf59+kKkSyagu9vtVmxxZC6vTfQQDT'
-             b'nfNLShVv6l39PAmbWRQqJZyUGahCK0ZeZaFYjLbqB4z8HkdXQZr1sj7VqAfwjjfI6WQMa6vX9QCn'
-             b'+XpQOajBH9jV+8e2nLR+Pv/cd+DwaAzdYMGJHTu+1IOCnHWEUIJru3IgnM0JTl68Y+MTv/ab/2O+'
-             b'hmpH7Cf3NVhcWoG/06/0Rjz+wY/+4XNfffqfffMv/s1/tri4UMGJMugEcj4DFwSIqP3bkklyNIFv'
-             b'fvPb8J4nH4d5OpH2BbDp2jLp3VtfXYVbbrsThsvL1cnO6qSOU2bl5K7GOHAcr0jNMBG0kCWTEnlq'
-             b'uT/G6A0mEt6giy01RmtbvKLSTMxQqowvVgNZZEZfLigk1wIhcggUU4BZ6miV+ZbNI3rjBWnWUzGw'
-             b'YnQeFevfz9J7nNt9BDbPMlJB9W50ulFIXIYsct3/z96bB+t2XXVia+/zzXd886DZlgdZtizJlmVb'
-             b'tvGA7EZg4xGb9hRjx21soEOACnSRpBq6m0p3FR0qELqKpukAJhBDNR0aAnSHDEXceNAsPc2yhjfc'
-             b'9+597873G8/e2WvttdZe5zpVyR/Ykhzf52u9d4dvOGfvvabfoNJEUvFBKCRF3bQh7KMnRD00DU5C'
-             b'pWzKIQPKOxNSJtjMlAfyQZIEM64Ick9l5hEE+JADblTh0Vh0/gzLvlhqeBJxxcBzKCVOSIr3dVAC'
-             b'aRBtwJSZTtPfL6bkbGs8RT2Zwv1j6SBVuIwiFmrs1DmZm4Ysm+SdhNBAXB31n1J1ElBQAr6TFlod'
-             b'SALhBfDQYjuNmmkF0QB5DLJNLc8NVB3Mc9XBaCsV8ApZXwROjEJUBwRpGY9GYzh9+lk4dPQwjMZj'
-             b'Ve620Hd1p2UwhYKcjAGnQKEF/BIbe9EVVZLoGi6937zPTbArKrvGhXu/IK8vbT6TjrpC/jIK5YXU'
-             b'b52UgwYeC8AwFvW876iyx3vkg9oSZRJtPi0RGFGnhBKdIibTERHxrY5jJS7FTqfQ2vrGZKrb6sIz'
-             b'p8/Cs+mTNP3EoVs1+IJKJql+JN/Lml5Lh6xw3nLH7f/qyItfliLdDrhW+283SI1HO/Ct/vCzFvyd'
-             b'933wv3rioftu31558pp+z6s1OhiZei9zHGOfIN/sdPtwbmUVHn/iKbj26qvTRhizrlYxhsNWIMJc'
-             b'j5w4li5UpbBaQYwFFf0E439jevgCRAh1zjDE8RZ5XTHPEeTEctE3eTTFhc8oUjuDfqr4UMqLzEtz'
-             b'mOV+SqZl9O6EDV+WSIY5OyuWW6SVBGOUq4Ms1RPVcp3bIVU0PX1rJMdQfZerV3JXrgMDJ4qsUm5P'
-             b'epKlqg2TXwbgzkpdudgI0HJ96f0b+/fAfJLoVD9TIbKhgJtKC0WXRmCB3+J4LIn0BANsLI/TcN6w'
-             b'zBZfFNhraZsKcbmKKjEE1rOOARZ1CgCrrGy+lJIvTJpqmbHitU/rZmcWYHVrjxB22XYbyj2JLEnk'
-             b'wcD/LfI0zwVysiHx2+072OysL+o6CCw8201BEbXbEFFIb4NJzUKQDBEKgtRUBFZLuGimxoZuopcK'
-             b'hBF8ZEuPCK9USYXZglITwFARRGPw2TOn4Yabbiw0jCgAolAkyVghPs9sQzkXjE6kE1sWZfi6pqhr'
-             b'tIjSIifiBRjFQRbbYUEBFRwQWeZJgCnRXJQCD/cG9KMtGjNCKoR110CvRyNl5UoCG401jVFTEc80'
-             b'VV5XovkMLl44CyOSL2JUayjVugjyilKEHE74HwS47e7twqOPPlb0KkOzLalgXRdK0sJvDZ8P90z/'
-             b'wLGz3/sDP/hraNv0tzSGasaPqGTXb91nPZvAkctOnn/Hez/0C7vIOGXvI+eMyjeZYkZtdwhSyltX'
-             b'S9+CB1JZunZpnUAV4rabTQlRrSIdTqNdWDt7LmW1kUpRQfU1SMewjy8iqB2fHS59VTI2Gh6GgiXT'
-             b'7E02oIum3WRaJWbBOdfoUvFAOhQTNSFgqp8NAzM8ex+5CvZbrBfJFFB0k9hwR37PXgbF2naKCt+N'
-             b'0WhxuXJ4yMxrmrL+KbpiVl4zt2gicmgAl1zDzbXiuQEYzKATpJ0mIpw584FOiYA09DyTdXmQ7sE8'
-             b'nrTLXCzVlbZOiwtSy1fqw2RFZMU3zqoXBHMo6BzJl0F2DGUmoIYGhPL0BHc/vzOEM9s7sDodw3q6'
-             b'ZlspyVkfj2Bldw/Obm3DKNRqdSFBKHOPXCE8Q5FgkmxeDEQ9I+my1lyuUGo+PKPVOVRlf56lh9wK'
-             b'r/g6Bq2EcxCr1Ro90x08FIBJ9OJiAAoCEjCSN+1YK0vvCX6THmXmYJwCVRvXDrbMqqz/WHGQaVXY'
-             b'8luliqqqfGMmJWoQDlxTrDgWrxEn3CXWDyzSXKCo36wsEcz0NRjgT9HsU5i/8wqjzuZ9fj/bSe9Z'
-             b'NiD0hewqUjbe6X6VDhAh5LjVre1E/nFx4nXG4NRq4kTjVUfvomabDiKbB6qSL66eh+3tDdo/2a4Z'
-             b'zJggchLBAspCCovZDwx3wKmHH4Xd4STbcsA+YQYEp1We5tL4FtsIqhJeG32vgo3hGN76/e/9pwtH'
-             b'Dj8Dk2F6bbO/9c9W2yoTfws/ELP/ptvf+Tv3fu1vfuCxr//1B44szadsd8xVTYGYlyE+qMeKtKdk'
-             b'sH3PAw/Cm2+7NZendVBYryhSjDBQpZt3+Phxo9QLakXged4VGtpvBpgpMvgVKLRXZ1SuHAYCSw7G'
-             b'IiCyioVVnsgcDhZhFOFMsWmwHTvl6jk1+xNIflm7zigHZHxFHWOjJPKh9KNDgacp3pWG3OANAdLC'
-             b'XfIqHY72eLbkFYGYN3E+0FD9mr7ckhTfa/AXV88Gz8y0NSkAaE9BvcyLkK+RaPEKF49GD9DMBeSA'
-             b'jKUFiJt+rteC7XpKKNYgAriuKN9XpY7O7LDolFysCuSydiR4s/AvU6ezngkfWFuzCNvTSfazYqJz'
-             b'YECONHorKC0llatiUnblvVZTAjOuma9FViHe6xxWZYkirz1ENDJMWfhDbRT/RffreqbzCG+4RVLB'
-             b'OJn/iMxNdMXKxLx3Vd1whaYhgBJQWHRUtYS97THMHxzALEz3IfQiCZZubm7BpYuX4MRlx/PengaT'
-             b'BIgNTtVQbpfXEgxtQUSNnUXeMqdR+H5yrZRXBxZQURXkZ5C9HhvKQ4697UpzxJfURmx3VH+yNidJ'
-             b'oGAXow3EXjX6wEwaiz5gYFh3VARd1ErXKHWkX99aX8vK5pLYhH3yWJL0hTJakA4KtglRQPb0+VWa'
-             b'QyFXzrFIspD7i1efa0o+cQtyZxLhqpfd8OW3vOuOf0m28HX9LYkdrcl4Bt+uj6rVrj/yI5/76f/2'
-             b'2adeO91bv6rT7dECm4xYSLYCFVwUJeVsNc3y9EimbHfg4voW3HPfA/Dam29K35gYIAN5sRKSamdr'
-             b'ndjKB49kRGA0jphR5E9EJYGfV3QmnRGWFCn/JgcokzqxBZHRL7U2M3ysVD5ELBZi3G8jAd8EYoh6'
-             b'eEUjb96EZNgAXqlSem6FRB/VsgPloSjolxohQ9nNaE39o2IoSvOxSIii4jwu3EpEgYUczT35elY3'
-             b'BE01oMQm0EARUabVHwIY9BG/j2CUoc2kys5v1JNK3OncPvUJV0whe+0WtBBGL/MYgRyrJ5Dn5Jqv'
-             b'gQsNCRrHmnJBWiNOBHwKpcFKK4leHF3tig3rhIAuyDKXj0Sxncd2WS1AB9zgLD4ZYlSZIhlx1LFA'
-             b'5fGAESK5N1B556Ahzjtot2G519NKS9ZyHkf6ot/HhPam3paZmWrLx30TgCW3aKMe5rkbgsrrmXej'
-             b'95ADKHqQoa8UBs/VC+fh8stPUoB1Bh0b1TwvNuePkp7x7NQzAqYBiHDanVVQhPumGRGj9aKRIpP1'
-             b'I35g4lhgUHExmjaaIeJqG8wJCCmqSed+pGQB/RQfKA3u3DrMgdczjaSo09QxJ4jkr5fOt4ur55TH'
-             b'6EVk2JlkWbDM6KjM6vRI8K7S3thISQLq87mqTYEP93t/boEfg2kizlSvvM4qBltgjjqG7vCHPvHZ'
-             b'/6I3v7Qbh8iPa39L4oZvp0P/2/WJi+rwFVc99b6Pf/ZndqeupoMeL2XFAcpQqaMviLEQhWWds71u'
-             b'vwNPnz4Ljz3xJD1urk29Dq1JLDSVGJvrq7DH0knR9L6dhVF6U/R4AzfXEZMvKCpvuDYCYNWZkTcD'
-             b'djC8IG6nuX2KykFqt0rRWxYTkL9WgfjN5GDEDTE7w+BKjxZgzFRHqQwV3eQK+k+BIpKJoj1BcOpQ'
-             b'jKsTA+DWxhY7IVSNloe8t+mkZsdeb9D0xVLbgh/0UHPFqTijCL9Z6dypQy8U63iFXReVoBCjFbXI'
-             b'bTCpeDFbT9f34AI65tac91p1C+tzlascAjpwmyNousAwdaYRhDjTNm9UPpHTeQGlQt7pISfrxRuO'
-             b'XX6Okmm7qpyoQapige8Hmf0wFIVnGGRGGUHbc95w+wQggTNFFLMdINIqBKNgaSwW0hPOQg4+gV2N'
-             b'YyFd8HzCqn14o+pSBiy6X3g/4b0djqYp+Zw1/YvqWucb+OsrKyv8VJVW4tFYwedgLm7ZrjBGTEsQ'
-             b'H6qSSslYT6gO537FFW35x9I2thW/L3qJec9XylIRUWTHfl+2urdoXMd7FawcWCw8ozLogyY52AUd'
-             b'FzheDyFGhUIRnwl93oa7cGn1QplKGk+roHU671tRYTcz4ElKMO879QiMmQeJ66dDSvlFQ7Ry5Tzy'
-             b'/IlethWt6wo2hzN4y/f94K+86NU3/jWMR988Uvlb/Gy12h34tn6kTOo1b3rrlx669+63PPB//i8/'
-             b'ttCvjAK00SGzsl2GNS1dnVYqUU899CgsDubg5MmjhGxRm3EhmqWbfuHcWTiWNk1nYS5lE7Mi4WNa'
-             b'I9BoSXEwCobJzURB11CXEERYVDJiUSEWgZTSq1cF42ih5M1sqmSqViooKFfIuWItFr9JejKW5zJB'
-             b'LIhJowxnZQ7iRRyzMhLjkmkH2Nza0t/B7DhWrsgG1UBkP0VSxaxFVxgFjqVhnFpDKPJJVBh440h7'
-             b'JYp5nXON92bwIQ1CoyYDkZlLTlmKTGb20GHwi3fFd8ua/QUPDSSX1wDuGqr0MoPz5kQQ3o5jmoOg'
-             b'0xo6cs6X9lPRKs1DZ1FziDkRqAvktNihc/yidmBk+DU0hQYIsYeJhTH/JHGt9MttzPzUsdoX5CxL'
-             b'6QRGBiqoUsivoo3XUHApLeoixLqvBe2LagNW2uPRGAb9dk4qcC6X3qdntwHsQOBcajKa0DyIKkuw'
-             b'yuahgW5U2EUodAan9IqcCNQQ95GpXQkU2lc3ckBqoyNvtJlwxoYcuWhq1vzrdQ7azmoNRkP4FXUb'
-             b'tdfVNpycTyU5Lvqm4Nw+OTCuFl2eQU1Ge+lMe1YrTlynbWADWV/sNwLPXwkRKqr+GGDSef/wqUfJ'
-             b'bRfn+uLZgca1UWxfhFgtSiSRIVns6r03reHo1S+7+44PfOSfwHisALBvGfBOpTu+XZ+Munnv3/3E'
-             b'P5w/evn924iOCmz8Vs/U9yerNAdVoMA7oJUEwS9b5Lj59XvugY2NjVxRsayQ9G2Je1VPYfX8OZjs'
-             b'DnPryvi75AGrOI5yRlU5RVyBK+aHkWcNnqseRAAC/77jvrk3Tp3WXxYtHSgrpENpVrJePIhqOvG5'
-             b'5RW1B4+VJFpX46YQlQ7c6PR3/KwDt3xqzr6Z/Miw5qg8Gg+F1+h1hgDaYgkEQ1eBf243bW1vsXhv'
-             b'NN00Dp9kCRKKbTkPA2swGoimjVHUNVjaSpyT7T3gjDHwvyWLFAqABQqqfFaMTZSm6cMDW0i0fUsP'
-             b'BgcmEBrSsIBXRGvOsSSsMg9CwQMGpjJEXmN62/Cx63y6U/YbS3aFGmfBVF+kuFIH/l2sZmYc1JmD'
-             b'Rgdh/j2tDpy6IFLAysN4UFNBx6rWpbqK0GtXxi04KrE8GpdjPYCFOG6LJ1VvkB4t3xdxtOUZllhu'
-             b'4L/F9gVnYrNJbWahXq8BPWZaW3t7u+mMG6cDMrfw8jVgxRRfVLuDd42zA4yvmLyfID5ULhopKiMA'
-             b'zZlZsdsAvf6FBuLL3pV9GHm/xZqdbmO2YkGYfY0qKyIszMkc7nWWJssohqCIUVV5EV1ORTEG4x1n'
-             b'k15Q3U5qlY734NzZZ6iSlniL93uGp4CsnxgNmjbSuRkEeZuu+bmUGHzj6WdJpy/WZd+h40QUmovb'
-             b'51gs0lN0LyrYTqXYuz/88f96cOTodp7jtIlq8a36bA03t+C5+Oj3emvf/6FP/PS//pVf+jedEAaV'
-             b'kM2qaJj4hacg7RD1f6JstAWj6Ri+ete98KY33gpttKSfWYOzLAcyHg1hdeUMHLvscqg67XyoywxB'
-             b'gpYUtrFI75TZimcl8gI0jPw1YZp701ZwsbQTirlOMBWQN7VP0ZDzzivKJ8S6tOMZ/VcEXJt5i5j9'
-             b'ZSIgFFh+URzk863Acn0sWTtw5SEHN3KkdnZ3Fa1EpEZBAIp0IiMDNKhreVZaTw0amYGJCzYrRqsL'
-             b'VtQyZDbVtJ+PTU5LA1JuOSZlnoHJTwdJtyGo+EbR9eQ7ru0UUKdZkX4JvPa8M0YMnLF70Vw0Wo9g'
-             b'FDEK2ZvRoDHyDMmzR1SZieI1FAKwyPXQbIdBFSRAUjmGpLMdvIsNj686Cmkzqj8QIhwxmYF9UxGB'
-             b'i0SpMvkeVc6pjqFApoVv51WJvMyKoqqIxIY8nbSexkNU4uhrpaPTGUYSjsYj2NnbhsHiXE5EXAHP'
-             b'iDiaNtvVnTYaaScGNLh9dkC6x3y25nHmxamDrm9AwWXWpKr5EIzgVJkLZdV3p7JH4lVXu6Ly4Szf'
-             b'AQxiV7lnJelwUIhfJBHmzXoSwi4G/PGQzAsRci5wi0rpC1DMG6VjELzytsUdfJyqVrRAmpEXXwWB'
-             b'QRKYcDooyF6aaQvIB9VnsAqmeXsLLm4P4Ybb3v4H19/6+j8BlD7y8LeqLvH/CJyoKv+cBCkkoL36'
-             b'da/7y3e878O/+B++9Nu/dGi+DSGVkVUrLxOyUyeFbr7xwOZv0Rvod0AwBlza2oY7774X3vi619Dh'
-             b'LvOjwAsQN/h0vAsXMVCdvJJslGeCZonSk+fRLGaDVd7c5ZCMarUQpb0j6hUhQ+zyrMjntozsCdHN'
-             b'EghohT/qSWcraHVRyKhZ1YIPqzqy83TU4OWFAyIumkXQACxWlXrm8nsyPGU+i6DLAgfGICieWEz3'
-             b'hntD2N3aofZCiKJzVpTFc2uGh/xycCp1gN8bH0QxFskjH8HwcZzxjMotNs9cG2d16Gw0CmITUtoL'
-             b'XjPqMh+Sdhvy3pd6Pdjb3cuHvXcNBa4gw+Qs96kD9gBNYmtgDx3wBeUH3orncpEjytpsuy6tqTy4'
-             b'LuAFQuVJxorcqiCCNzNyAUDUKiqrtDoo1NyiGQCCKDvtFqHFsqZaSAV4TWZzmOGPJzOiDUwmY5ik'
-             b'RA1VxeswJUi4Ve1WmHuowZKOgkjcVG4fSqx4J4meHbW+uc0KrACvFSpXnijDRE7ENbc2NaEQdBpy'
-             b'8cYkaVYdP8EVoMh5sRUNSY9lwkohVjutJANXyF51E0VSKZo2s2sQGRWUoCi9kqwK2MlZfL1AuF2r'
-             b'kJZjVEX6wECHoiJhLdYLxD0U4UmdaRHK1huB5cq0kanqq0nuaDrJSXZGapqAR/qW6JvA88wg6jmu'
-             b'4d6QOeVI33kILm1uQ7vbpSAme5ZCOkt1OUE+syVPi2dvuMdHab21lo6c+4EPf/IfYtsQZ1EZRvmt'
-             b'/Wi1Oi14rj7wYn7fez/wz7/x6MNvO3Pqa+9cWuhzeR31kHDs2BsFo60SO6DVQqvVhWdXVuHeBx+G'
-             b'G1/5CpgRFDiW+QRL+wyHu3D+7Gk4ftkVmTcCxj7cywFZNmsW/HQU+AJUpZUCRWYoumB0x0x9FEFd'
-             b'PfOizvOBIErGBpaWobYBijEaqWdRoKJs2Kh0g5m9NGSapLvkm1wqRcxpDCuimKJ6EQy0FnkdyF+Z'
-             b'pgpVTNAcTIpob1qss2lNG6LriiGizAmC8SQCw0fTdmHM17129poZZJordh929tdgEfoiTRSNcaKl'
-             b'o+UWXA3ddLC3fd7AXpMHoAPQBQFIsFyNWquACg2J0ysmOuIjVllIvXPaOgaTTAAjLVs8e6oYJi73'
-             b'hKopPGCqGga9NvT6XVhcXIbBXIeSg246BFptrxw+3zDnK8+RTfycovBwFoR6feMUsMJeClzbE2q7'
-             b'YfVbSaAJ0irkuO+LwkNkQnS5voLsKxc5y5dxJRiKkoQi/zwf/AjwUHdkBv+AOcTTtzbWN5lDJ3w9'
-             b'nr3Kr7mcqEbeP6rr6Etr2oM1srTI0rCPlOpVFFX3iM4wc0UUGpJPDDU3AEDhAQYGnojZoIBnIthA'
-             b'1ZRPik2ihyac0WgkyvzQBRYgns1g9fxKSkKGmVNW87r05n1wRUwtd0OMl52OaMrHEW6+soKcI0YO'
-             b'FiNPsR5yYKo7MMg+NkfdHM/gw5/+zM8fe9G1j2bibvVtiROtvWl8zoJUSvswqo/f94lP/8R//0+e'
-             b'+vNZvXt1yzC2KdobSQ5xxgV2hcXgkS9TOojaA3j08WfShu/BS150tfIzMEMIQUQ+Hezt7cCFs8/C'
-             b'4ctS9lZ10oEbjGCl0SvjzK0WFj/DVkWForhtNox5CkRQUExcRueF7IsRI+vE6UMxF0Ns1lWOJhgD'
-             b'RjkYaF5S5mW6QZxV7zbcrCh8nwiWfpWtuYNWAHTApsxte3szbYoxdHtdbo3mqpFQmPhY02gQVlHd'
-             b'ZGMR/86HTCWZqFeAgTb4Ymnh1AzHtrwkcM7YS6gGAR1odbBVISjJWRQrglh9GPsMoSDQiJmuTapa'
-             b'Wtw2blf098yiT5nrrM6akTx7CqjWwGRJ6t3j10LmkJFpdNVS+HAFBfgRXdR7UUWZ6UxpiQwGXZib'
-             b'78F8Ckpz6bPTzuLLQWd0E5jWBThgiZa5xsjhMiDhUQEsWGWlwNh10E7JZ5xvQTjQg8koVVq70xSw'
-             b'xhBS8PIh6/ZVfLyjvFKWz6qVw6YyjWIe6iw0PUviVGIaGYvbemC9TeI2oQhxqvBandK2rWW+yC32'
-             b'8ZSJpOK8LS7X/PzqnhtcEYz20GgTC+dOZmO5Yp4VLhWvNWuXUlTConqvgRHrrQk1mBNN3MdSdRcF'
-             b'G6uc74oUkm0py7xP5pGuJGoCnonB7msBEWWlEQxQKHc0Ssl1VVUFas+zo8B7C5Sc7RqBkOgKKUk7'
-             b'f2EVHnnsCQJHTGe5fUh0HpebhsFlibk6cIfFeLPh3ux22oTmu/kt7/qtN7z99t/CcxvCty9utJ7D'
-             b'EEUrbDKdwuEjRx/5Ox/44c/9u9//13+83Ao9zNxzhjFTlQFRvVY+BSJdhlPKlB17LiGH6oGHHksH'
-             b'QB8uO3kMZrOJIt4kK6hS5rqzuwV+BeDQsZPp3+1CIDVDHg8CH+ZNiwtAZG+cY+kkZ7wcXAFlgNFY'
-             b'Ev5J4CDnvRL4tLcuJFTvi+x/zC0RYbRTYMJ+de20LC/ZTgTbdHfG3UwWfaU2BgY0REHeZ58kal5n'
-             b'oMTW1kaudiC7qlp1BIKfp+uOr0MbYk4su41SMkMaMwl1/31vYhLFvLFITpXSr2HPTlVJXQRdVSKe'
-             b'kUtBZBYLcm02m8JkNiLlhW63goWFOejNDSgrbbc9i9N7VY6WLDioPHtgHhwnSKm6nY3rVG2OYDie'
-             b'pIQS/54qFmxVKxmSEXzcfqxTIEFzuEG3BYsHD8LcQg866e+Zg1YTtw+fYxaiwuqswn2MTY1DzwmN'
-             b'5uBiGZ7u2IxngiFmW5b0xNCa89BKQREOdmGagtVwawyT9N92bFE7MLLHiFdpLVcuLalc58ye1uc+'
-             b'ZSJbLmdEbf6vyFuRMR41jWY8U8qAFPHCGo6GqsARQ1G9j1qhWo8x24oLinxzFq3La1F9ymg/VUb8'
-             b'z1btUUWSvYi36s7yopFm/KqkLc2ND6USRKPD6TSYiBVNEQ3wqmrifBHIFak9GW0QGCKdi6vnThPc'
-             b'HL23nCFMO5arkPujuhrOaFuGHKC290Zw36lHaV3kRIScZZW3JxB04MAoCQftH1q3bdga1tA+cPKx'
-             b'9370U/8AX0CcTr6tYaIFz/UHm2e96W3v+IuVlZVf/Npf/PE/XuoEw1Xiw1rZ4hmFgtez0+sXHxzI'
-             b'unQxZXFfvfs+uNXfACePH2ZEjjMCECg4C7C9tZUy1RmcuOJFKoyqx75pn0Rl2UAZKnOAEkCOyApF'
-             b'Y0YINHwManeNyBooEnqcAXGl6KIuuKjqAF6lWtUUr+GuK4eBVwVtFe1ViI5THpWgmLxRf47RtPqc'
-             b'qGFE2NnZzUNcy+90RWopzPLcz8s14rafzKP286qUTO+cEedl2LmHxvRJWO7RbHjxirIoP6lUwPga'
-             b'Bc68A27JVB11+i0KaicPHob5pT50UnWBa0Q4XViNZwv2wEi1yECA4prqxOaEv+7T43Z7FcwtzaV/'
-             b'LRAcfzSepWA1hfFoCpubeynzrTlHCWQCurTQheXlOVhY7NNBgUErpEpfvLQENCBagy7O9D3pUpTZ'
-             b'HcviRHEDNnCImUGG5eqa1QNCrUGvvdSC7mKHgtRkO73mzXGqXqpcFWleldtd6jRL69c3uGzWelyu'
-             b'T5Agx8TZnHy0ss4hiFq8KzQM7lRYmHcs6IZcPIVY5KtMIunN3ERg5U4SMdkLlpJgOUWucBXFKsUx'
-             b'KT1wBPG6L72pIIVNGFUkGwo7RhUhPAf16Kx7sLCoWTOxzurx2dfUcMDS/5Gi+dnT5J+HAcrCMD3L'
-             b'dcn8VwwWrd0M8QSrTO155PEnYCslVG1q82GV7dlChT3tyLWhoveGLX6sslq+xcE4UuK0tldPP/Oj'
-             b'n/qZxcsuW4G9Ydpb7W9vkKpHe89xlMpRfC/dtHfe8YP/7NxTT7z+7EN3vnuh16JsENsr1DZyRYHZ'
-             b'qUGYVDmgiCzyvEwb+c57T8GgfxMsLixkVFUoemS0FNJNnAxHZJh46OgJkqsPor5QR+OZkhGCoY6N'
-             b'dofOpVgq38kBiQvfV8WZlZBcUeGhJMTq5fdrtQshkKjPYrGeAQsuI711o6ENR2BbCfWVcjXnfb6A'
-             b'QIwigiB0RAtNpHUKP0NB/vQzOIy/cOG8on2iKkdnZFKY4lB+RnM0Z1ubYpUg2ykYcVYHSiCWyqAQ'
-             b'FoUl79SsLlpilDL6C4RbW4fRF5IqrgmsNHse+gsDGCz0oeqkZ2g5pRDUYUT30c9MmzYWdGQDAxei'
-             b'JihZ5FUEb+tymPI9xqA16KPddh8OHVmAjUu7KVhtpwDVhsNHl1Nl36LjYxbGUE9DccMFQVdEKEIK'
-             b'sUhnRdP2BQ5ONB91BTgjtjJqhMmAHFEKiRnWLQdsXU9Js68114LOoA+9+S7sXtzNlRWCA4JTA74o'
-             b'aDcfFfkmbbMSXKGoKxinyCj3BJ87HXq+rsrrZL4fXknk6jgPZqYl1RGUGR8U77QamgLsBdQDDRh3'
-             b'cHVDoB1CXZobjlVGWN8ve9s5hbSDWfeNlnnMIgMQJVGWZECATjFrXe5TsNe0zYMiLzO3r0i14few'
-             b'uh/vIQ/qdEoEJ+pc7L2gLoNBmjaVY4S6olqdLQ8PPvw4PHtmhcBlhHpWtRHRYmRCPvPmkKDvugy0'
-             b'qnOQRW2+d/zg3/2nN73xtn8Lo1GDpP9tC1KtysFz/5GHGfPz/el7PvLRz/+rXzl73WjjwrWDTkX6'
-             b'Y+QW60tFo4cWmENP+DuQhSxHkwl89a774Y23vBbmBj1CE2Z/lKALBxfh3s4mHdzY+sPyODsGOxUc'
-             b'BV/EK7XKgizk6J3AliFzOVSpW7xgiqFaQfeYo5AXh9pHx0JmlspBJXjVOr4JKNaJGF8D4kh5x8Pn'
-             b'bKdO3BBvDe5CMZbUzDcHumEK3Kur6wTvj6wzRrYn2KNPpf9oZ0Izjq7PbVLRvHNgJHRsjJEZgzOK'
-             b'7MJFkXaYQVDqnECg9rGoTgsEn51MKPnAnjkhwAbtFJx60J9PVUGbQgJM8GCrC5fIKoHkhBbJpXm4'
-             b'n4mQVfH7EoUBVxKjYpkJ7HjMJAnkr8FMD7aDR/qwdLDLBwqi8MbE1AeABlUhp+UzTeyFI5i7Uizl'
-             b'5IR/VIjITiokfIgqNCzTg6hqxZytF8g/qA25I1mbGR1+Vbpei/0FGG1OYGdtNwVwgDbBk61+YEpI'
-             b'6izfFSzswBUNPJ+Hi5Rg1QxZz4cv7yWW5XK+Ll3q9KfX66s3lnaLXdSZpIA61dPMrIHShXMqa6U7'
-             b'JhhVeZp5FgBTrizLHgoMsZZ2ZRDX8P1zF1f8oFV1Q9rCvkBunDNoRBDqh9cKVzspkh667Kq7u70F'
-             b'l1ZXUqEz0cTNa7fbFUWJ4Hj0nRNaMRYHhuT7FJTQZfexJ56ieSkFYqaHSAIdVDOwzK8wca/E9SA9'
-             b'3+ZwAldff/Mfv++HP/qPKgTYTafPSXRo9fsdeL584MV58XXXnX7/xz/99373V3/5j/oxLEMcQ7HD'
-             b'q/KBGkpm5aKYFJYuOaE5081Z39yBe+4/Ba9/3U3UrlDEoHAH+NDa29uCeiXC0RMn6SYGyxOJBWxg'
-             b'JfIDw3C9EmNL0KR8LxYh0Gx1z5UetS4DVzRVcfXljeRYi8u4sufWlBN+iTagLac+E+00ODJj3Jf+'
-             b'eOCAGY2WXmSpAdWmTVX89voW7GzvZMRXndspFduV42vDSqCVMm4vVZk+ry9BRhxOq+IICjzXExfi'
-             b'oFwja5Oe/W9EfUMPrhCLbiDOmbDCxq+nSqk7j9VABypULvGBABFTbt0QUz6wNIyrmpsy19ysKReZ'
-             b'BxKVOKsZrhKWI1e+lb5HrSzMzI2SBBjzOCsY4AfP50TYieWI6PBAuSBKMlr0p50uAsrfdEihoZWC'
-             b'rrEax1eNbUpq781gHKbU5sNEAqsHAcGEULHWXCgJkKDePDCFIGY9uBQ4eofa0Boswta5bZgOQ6qq'
-             b'nOrtibJDkMBtBlPRKUU6dwCUCB0IbNJqVUXVANS3mgnHAIcPHWJCdzBKEOoIxR0Sp5J7QiNQrpwv'
-             b'ZNiGMnssAHOZORd6gjdamaDCrgQkYZmlmAUy1RE1ckuWclEu/SSAl/ZrPluCVML26wXRruAXmcPi'
-             b'/hoN92D13LO0UgRtSTPN4FhDk9VmslaZOjOHUGbudEK2O3B+bQ0eevTxtP86VFGLiLAj13MRUa4z'
-             b'ok/V2SOBcGZ1fo/b4xoOXnntgx/93E98LgXQEdDs8LlBMLTKyfvcf9DGTuXlK2+8+a/e9f6P/Oy/'
-             b'/9IX/8WBuQVyiI18rClMmdK60ipp4JhDJuOhgO3ZC6spUD0Ir7nxVXQTqBfscyZaCVIsLTq0Xl49'
-             b'fwaOn7wcgDNmbTbHhie0sVdghn0lEkP7sNDOa4tRZzLAwpueDz1VRQbVCYxqH1KsE8owhnv73ivb'
-             b'3uI0SpYbTfejEHHLG7N8n7xQsRd9YfUCqdP30rULRBz0ajMgemK5TZhPuyDwelHH04KSE4aqOaEy'
-             b'UwBoiigWgVulirqSzBJsHA/hFEi78z3wcx1o91vUCiY1gHRYZ7FcsWoQgqrPyEFwKsKrELF02FeC'
-             b'/oKsS+bFe8xlOaKaIYK1iw0xUZW6iU6RllGlhYrSIB4MXsRZ6VDjrDVk2ZlOygwG3QUYtDrQb/eg'
-             b'm/7bJV5U0TdUZXyp4FglBP8+SQfYOH0O6zHsjHdgdzqEnUmqdtkfCW9VLc8ZRZEbDNIsKuqwNfDp'
-             b'YFqG7RSo6u1ZCpItXkNiAeOtEpLRV+S2lS/VDyYw/aUutAetVLVNNDho63cW0hrrUJBC9KRaXrAC'
-             b'sSI6VaKqeD8ROMXYzCtZPBgckxdTzVAClRiZhtpAtMtMLUbYRy737KOUoX65ItnnKB6DAha8cQsu'
-             b'ai/ltePZU3HyJOudAtTubgpQZ/J6qbwmjsRvcjxrl5leEIi/UxKzoO4xwd7c2YW7U2KOrtHOt8ss'
-             b'TkxplLjcKl/jx2izTNI0rc1Zp7/+wU9+5rNHr77mPCCxH2bPWVxoVeDh+fSBF6zb7sK73v2+33jm'
-             b'6aeuf/DLf/Xjy4N2zno5c4B91tF0wzwTS3m1YBWAm7PV6cKTqfRdXFyEl117ddq8EyWw1lBSYMz6'
-             b'Rns7cO7Zp+DwscuhQoV2yFYJ1DYxrHaGQ+VjiJ0vpb2hHHVByLgMbrBOxDlx86oFF7OBsMlSS84f'
-             b'iDFv9OzwsGa3XkXxsYRUQ/OO2n4y4/CNl69279IbEtHa9KVz586x4nnheZGXlCtW8AKoIBiyZwsM'
-             b'wk+H0nPnQyTEUFxWjdZfMLJEBUzBiYhUT1E6q+kqVOlQW+5B/2CflC6zHNRUDS2dmXfprMmLArZn'
-             b'ncWsMdhKb7SXNvCglR4vVdzYuuykNdfyohySXxzCdbHdPE3Xei8Fgb10+I9S9TJJwXuKr7XypqcP'
-             b'BvkWy4yUkYY040/P3UmHw6A9gKXeHCx0Buk1dKFTtenIUIV3vHe16NLF4psWczaNGXZLTA3Tb863'
-             b'2hDT44RUCeFr251NYXOyBxt7u7CZAhdK5iBwR4KNmOGV2U9UqS+kXS1ftgDDtT0YXRylcNDWe6mq'
-             b'kkJ8NdqXmc8ECniYuimBRYKf0TUvrfnSEp+bW4TBXJ/3V/EH053EQpREfg0FgetccdJ2scx6yB0v'
-             b'FluX/FKLWn6hF2b9SJtMseNhAfmAQaUKytO6aTtrfmjmQ2LiCaXQE21H74pBJZGS03rb2dqAixfO'
-             b'03726jLgyiyuYbpZLHuc1YMkOHsFo8mMAtQe0gyqFudSooAR8rQAz8iq0mTK8hkDW+7sTAO868M/'
-             b'9PMvvf76L0831xv6ps9JkJqBg+fbhyMOVAzv/9infmZzc+Pas6fu/L75Lh4gUybA4SKreVEY1JGQ'
-             b'72gm0zZs6jbc9+DD0E0B65qrLofxeKgbxjepfTAcDuH8yjmyoe/0u0SOLNoxRp5fZxOR5xOObbKd'
-             b'ioU6YzFQKkBaUU1HYNvasEQ/M0twTppGxtslMrzVm2xTNjGIv5AHFwr9PQCoiSJVHTyDw8dHEvTa'
-             b'6lq2oIZYhLXZxA1fB6oIeG53OOVeGVJIjKo4HkLQ1yPZthUMVhKjy8TlYmtfSKOkB9gFGByYg7mD'
-             b'PZilrLzmmVWAWIKbszI6WQ0eWPOwwuCQAlE/BaVBu5MCxHwKED0iI+P3qsjGjnJQijCsz/O7mmeP'
-             b'+LxUtcxS1ZI+z+9twB7zlIp9pwzW+QqFPIfD6uhI/xAcSQfzfLtPQckLORXRkoarK/WmakNqaw1M'
-             b'68YzTyZS8KPrnF5KD8WU0wF1YL4Ps7lDsJkqq3Pb63BxtANjyIoFyuT1hlxKWV+eX4S0zwZHB5TV'
-             b'760OoRUqRtQF48/mWKQ3V8bBRVVpx/ZUbyFXUXi/SoejCLhOU9A/evQodLtdmMym2ip1YJGMhYTu'
-             b'+L07cIqYzclBrbJfpdXMPxv2IRFd9l/+ZjHUYhQp50gOerWOBxRrbNCkzjmdt4Ih8ztj/y5gKuW4'
-             b'c+saW3qbmxfhUgpQXj3mRGFGjFajhQ4q6CPEaAS48/1Ebt/d9z0Alza3oKo6DE6SysnovCuyNhR1'
-             b'G37tWLlvjcbwite9+Q9v/747/sVsMsrn33McIlrBPf+ClLSiDh87Pv70j//nn/3nv/AP/nR04ekb'
-             b'epXwC6Z0AOLcSdoRGcIWDTciGhmXnDnc88BD1GI4cfRQKodnDfJuZPwtZjezlIWiTtaRE5elTG+O'
-             b'DmbHihS5jRALX0P69QpRdSRulwMU21HIH62IvMLICY/Dh1PtCg8lt7lqrraqLDgbWAg0lvlMsbVP'
-             b'zxYcz65MeR9iUTrXsXdQpWhSPWhlJ1KUD9re3uJMi12NoSptqnRaI0cIIcukMeaMg6pwXKJT1WqZ'
-             b'I/lYiI7KkYGi9C29uUIizUimScrC+8sDmDuUMvJ2DeN6qIrMtXKIikmeZIM+5hnPwHdhoduHpRSQ'
-             b'FlPV0vMdaEeua0WrNFZ8IARqjQVX3JYdryNs0VQ8cO+mg3yh3Yb59Hjre9swdJNSYNclUCNgo50e'
-             b'ezElRocG8+k1zKXPfvpaRkiq5bkcXnVu9QgqTlp7+DprKPboxSpDGs61EqtRFaNmkAUuBJw2H6r6'
-             b'sJyu304KCmc21+DSXgpWuPZbouqeHw/fX60KDdjqTNf+UJ/QkGOqqKT9VWatUvVkpFtxMsBqrtPv'
-             b'Z7h/dBp0XWXPywgnTpxkp90MuohqhRO0apNKsuLAVZvJb+ZwRXWJVlCTVXdwDNBRR3pnIPIADbmS'
-             b'QvAr3EgjYwQmgDbBEdaFu4B/SvcEjOpFroS3Lq7C+qVVM3h2+1+5vrRKmJWuJNZi2uoYmPLAQw/B'
-             b'ubU16hxloVhXnKVNoJIEVi1/VNorwnA6g8Hhk099IBUHnU4nTCcTmjM+1x+tGcpbPE8/MLOfnxuc'
-             b'fveHP/qJ3/+NX/vL0XDjaLeFbH9HpW2/W2VrAMnchYXtvJH4ECM0T3OLO1O2cdutN8PSwgKZIUJV'
-             b'/LujSpMhMmoMl1ZOgz96nNoSU37cEIrPlVQPgTVcVGlaEGLEVBfNsILucbFwciIfus7wvQJLJTkJ'
-             b'RlrJeW2xZTV11bRk5+jiLCgDUWk1CM8EN1wGMxQLBMfzj53dIQxHI4LCBgZ20LCYLYMx4CFvI05Z'
-             b'iDYEFjUtRnDRA1h7hRKDnIGPgwa4BlorFsmi0A6weGwBOqjpmGqAwO1N4YF5vhalY4hGezV0KDD0'
-             b'U8WyBIvtAcy3OikTy2ZvJELA3mQVH8yOeSje53tEhFpujSBAIbLsd2Sb76w6HWF7vAMTRMgBB5HA'
-             b'yhqY6KQD90BnHk4sHkr/xeCYqzo3DaVNLZjWkL+WQSyhSAqJ71Y7vc7AKMfKKdk1964qVuD2rIJR'
-             b'2mKCVHCzlISkry+lAL146DLYnMfK6hJc3NukFioFjugbbVpB0kzTfhkcGRA0ebad55Okvg/s8qtB'
-             b'lsWGsRrHdmqqoPoHukQtBvXTyteGgBTpvaZ9DVdecUW+hyxB5ISkHk2oYbqHmG16kfMSjlMtyaG0'
-             b'7QpYRNeh2O4Ya48MvmWUa1FbzoACI/4boC5ecbxAi4Myv0apEE1TJih1wGCYucW2tnIWtrbWmfwd'
-             b'1XXBR1GVjxroHGvTRJWo533FOBMcUzz0yOPw9Jlz0E4JeKgLOEjaxdLJMB1NbXtK8jpL121c9Xc+'
-             b'9dkf/9FjV171VL23R3ZIz4eP1u72Bjx/P/JNuf6VN9z7oU/9vc9/6Td+9Xdms91+xcJ9QW3AS5nt'
-             b'OdtTi1aX7aFx7SJfAIPb33z9HnjzrbekjdLLgSpPHTVTVZ+e2QTOn34WjqRAtXDwYB5Gyupwhmnu'
-             b'bG+eF54vVst6ANmMSo91Blx449djmbaQ508CpIg+D861xSEzLTk4qAVTDn3laXjQMW40njWZpV9B'
-             b'O2Vgm+vrdDBXhngMnK1iECMpKuRSxBZn/Xyu8gEPxhMpH/yuoaadZwk5s633kaaFzY/IPT9XwdKR'
-             b'BfB9oLmT9XDSjJDRd4FVIHDOtNxegMsWD6aKZQBdIHdA8i/DgTK2MDH4olYlcnPIhiQ79OXga7JY'
-             b'SRyo9ZXWx2Q0Tve+pop8Vk9hB6ZwdvcSoDk9BXjxxkrrA5/5isNH4Ug/BVgylEzXD61YnHF3FQ4R'
-             b'c/Aw8CNJGDsDFVW1lQ458O+BDxrvSiXjYtCWMF1CnMGGbCeB9hcUsGquQNi+BQPWoVafgtVafxGe'
-             b'2TwP4zDOsxyZFyl3NaNMp+n6Lx1fgM2Y3nUKVBUbkwri1HGLTkYco3R9lg7MQypiM5fJixAwk1jT'
-             b'656le3L1i18Bh48chvFkwkGgVi6dd0UOLQNlo7b1vUoqOQ6MwJJlJtm0NoY1FDi8mhBy2867Bh2E'
-             b'moHOzKm4UxE9KFm9oSisdsixaWBoUKRyBlBiiTp8F1Zgb3czrb+W3kdvOBtGTN34aIXicQcipOto'
-             b'PT/6+JPwxDeeobPNkUzXjJPYIpdWKAihaGGyPiBVmumHdtONvv19H/rRl133ij+PyIdqUOyf4yDV'
-             b'6Q7g+f6BLYzX3HrbH11aXT367//wt39t3tWO1KKrltjP8WHqGxmUuFMK7IaUqki/bwxf+do98IZb'
-             b'XwO9Xps0suTHFJ3FRoe4SFfPn6f2x9LBw5RpR+vsKhvbi+pBVIisLBLHvARjC1oWvJO2hi8AgrCP'
-             b'b2RY/m6fxUfZFNHMyrwqwDtVjDe6X8aoTSf+6TkvXbxE8wTMoKIgoUxfG1t9uOlpQlUHgkmX1iK/'
-             b'p1iENjOEfd9S96x/CEaTkcmFU5eee7EFC0cXILYmpMzgWFYpi5A6VW6mvnw6dKn91unBkcEiHO1h'
-             b'YACqWPDwb/W6NJ/ptCs12oveqe2GHt5ypgXVUFA+XScFtHYrBbbpFC5cvAhVrwfndjZgqx6Rqj0J'
-             b'HONvTCs40luEy5aPUvVW1VE5PI7RaPRe27m1iolAp9MmAWFyP/acRUAwRXrJ2EEqACGuGsATWXmk'
-             b'77cR5JD+3p+bg+k0XT9URU8BK8YigkpiuekenphbhoVBH55ZX4H18S72inmwHhUQIDPXmZ/C/JE5'
-             b'2JxsAY2YhFjNciWR22joi9VdaEN/sU0+bqIw4hmVg1sLfYzarQg3vPpVDZWRmpUuQKDu0m51Hopy'
-             b'a1SRYzAoO8evw6l+pVcXgLzvAxQ/bvE7kMKkrNcg821W84hQRIxzpZNb63kNBgiuEZE0UIPxEnNc'
-             b'oaLVxoXzZwmpTDqRMaj1e6P6dbEkk9LxAMOd4yQTVc2f+MbT8PBjTwKhXYioHYw6itfpmGoIsp5n'
-             b'Fjzmrk67C1vDCbzt3R/8Z+9893t+l1ycZ/Xz6vxved+C5/9HJNmZO97/Q78+3Nt56f/xP/+P/9lS'
-             b't8skTUMEFOdRroykNeSCY52uGvZGE5hLB9rm3gi+cuc98PpbboRet22UqmujtQXarrh4YZVQSMuH'
-             b'DlPbrGb0jfOichH3qS84I7RUDGCNRB3PargfrTymIqqKTpjBeaNVZ/6/cuoDoyKfxoHUO+H7FFkl'
-             b'63ekCh7icpqeZ31rvczeIkOnVaHZZTtwJhIGcQJmkAG1SJ2Bd0NBPQUoWn3OQcOIQwa30/QHW0QL'
-             b'x+Ypu6d2JnNgxLNKZoxEG5hGWGp14aqDJ2Cp3YMOzprq/F7683PQQ/4fi3m6GExQ5kAq9gymwnFC'
-             b'kOX61rEpnieyJcDC/AKsjnfg4mgjBSjx5UrfS8Xe5XOH4YoDR2gOhcZ33ihG0EZrd6DTS8ELSZGs'
-             b'xeiNz1RkVZScN7DSBWa7FbcKs8iWzlKCsSaPIkcUCqeog7bxKcD257BdN6XqCrsGyvdJa2ex6sC1'
-             b'Ry6Dh88/DRvTYQbZuJoty1EjkRGByOXpBmr9bZ3ZJi6XU6+RoNwtP/CwdGIxVSNTDSJqASMGoLMJ'
-             b'vORlL4fLr7yKXpfnk935fTL2nmdVzvglCbpN1WXEfNJzmy6LwaqKi5EIC6Eom2TmBe8NKJwvcTmO'
-             b'rMYSGG2Z/QSDciNFbqm8XG7Ti0GgKgDifUDB5g1YW1mh16hCsbFYnARde7IOOSCxAKy1VAskGtuG'
-             b'p0+fIZ1SNAVUxQuXLTfUDZrnSVnySQj/XrwkSWlja28CV73ytX/5no/9yC8SrxLXSHx+nf6t50tJ'
-             b'9/9O9A20Wd/74R/+udXzZ48//NX/6yMknVRHBQE4seUwkkkeBJLqiBjZ7WaABd7o9a0d+Npd98At'
-             b'r3k1qaejqCMYs0M5xImcl35n49LFVKrvwoEjx6DbH7AxGoAiAiQOcDvEK5E0I/pAzDit4Z0ROYnc'
-             b'28/941CyaUXz5QmIlaaJ1soiNgfrds/nUUwBcJQiLLLqcyDtOcdwdQQJOHZN8zxIwiAlRFwo0oBc'
-             b'RHJP30krqrjnOmcDY2xAdHG3TFNQ6h3swMLxOZiEEUP/oYiMar8/EBKuW3s4sXAITiwdhi6DC7qY'
-             b'oaequNPpqhcS/09bwtrFIYpCKHppOGuUlpzMDgvujWWIKnqsc1urMIpTqg7w/nVnDq5ZvgyOD5ag'
-             b'Vef3HhlxVXVStdRK9Q36QDnSvdHlkg/DfC8Cc4QkofAyszQoLoWiC9cFiuxUZVTyveHvCKcNgyPq'
-             b'FmLHYDyekPcU1LmliZXoiw9fAY+tPgubqTqMnueRahefM6RZWnet+XR9UVX94oSqaPF6IUmd9Gf5'
-             b'0GIK3jNKBqkdJfUezwExyeulffP6N75BZc1qdpj23hC8jf2HkHx1rRlgCc3SuM2cmRUzrjRxTdQs'
-             b'wsqEWIBSKvM9JYkjw2EjFXgdX3EnJBTdPzG4JNUKIz1mg4icGRUTfzcursLa6nmaHXkn992x+kVJ'
-             b'AgM/XyHpR52BB04S8dmxxffMs+fg3gceynJTnCCLCgm71zUUUMgjLP82O/TmFzqqkcR9/PEf/vTn'
-             b'Pl91u2lZp/1PbcPnWZCK8YURpOhGUpQPozve+8HPnj+3Mn/p9OM/sNjpFIg3z3FE1604XHptu0m/'
-             b'FluICNW8cHETvvL1e+HWm24gTx/MCOVMreuCiMsZayQDskvnz8GhYyegM5ijRUTMc1/aciAItZB1'
-             b'wWRIGYwTZ1T9v2L3K5YMVFmFrA0m/jdBZITYC0Y6dUHAGmAdcEPhV5iBLrUUfTDzswqsvXs9ZU0+'
-             b'8EVhgFBZLRgNZ4RKa6NVtLrZOp55FOCt9dOxmSbPzks7iSvGST2G7sEuzB1JASpOFFYeJQuXeVTI'
-             b'IIAF14erDh+H5W6fZk54WM7PzdFAXiZ8SgHAYCetWe+0TUQJRLtFgYockPF6eWTrd8mVWBQJvLJD'
-             b'HaDk3kaqoi7tbYHrI4QtwgDa8KKDJ+Fod5HAGZFlh5C60Ol1UyJUqZZe5pXWDYQYqgMEmYkqZF0C'
-             b'PbeKa+HkCenbzEEECcqgjsDIL8/P4WOZr+EbwmDZTvulmxb2aDiiSibiNU374Krlo/Dw6mkYMXCA'
-             b'DmlvoKYOr8EMegs9mG5PIUxBE45Z+rNwYp6C2DQlGZ7nStE4F6NR4Sytr1te/0Y4nJK84Xhc1h+j'
-             b'lpy4IYMzAs5s6SKzTWfqFJEUE/NDX/aGzIyLSDIHJvltJ+jSkjDqLNk4+Mo6LczyPBeOAtqJYFTQ'
-             b'HUPis4HZxuYarF9aYy4hqDV8Xsxmfylys6jWqM6gz21z/C6u8TMr5+G+Bx/J6ju+iOjmfW1FsPj8'
-             b'ENRgLN0C2nfTGma9xZ1PfvoLnz905NgTo+fIof3/E9J7sv7oCyZI4bAbszRsXaxdunj4f/jVX/53'
-             b'F5986NYBzRwYkYQeVemwQe8UF0Wan6V7opX1j4wWctQ/X5pPGd4tN8P8oEebV6ChTlWkeVrBHCLM'
-             b'AA8dPQ6Ly4dhjLqAlVfTsshByhkztMYgSBA2ggTUTcULP0imxUNnDIQ+8OMWt9hCfVDufH5fIerB'
-             b'nC0QjAq5mNLxa0I/rV468DFD+9If/D6cPXeGWhKzOjTkbuLIw6Wn1qE9a6kvlIroSnvKHMDio6WK'
-             b'mLIF66AyTjjnqxY8HLhsGWZuQv927H6b7b2Dcp9atYPD3WV40YGT6TXkSqvb7UC/N6eXFqvBVqeT'
-             b'VUXIT8yBUXzLbbQo9itO28WODyyccSpxW8UVc0a7Mx7BXU8/Amv1Nt3PA52FVEGdgEPtHCyFktBL'
-             b'6wdfV1Y7j01NvciK6zHPpThqK69Ke1s+i3/WzhfbEqVdszOuTCnFxjyCUbwo3locubiqEI3EfFUm'
-             b'aa/s7Q4ZTenhzN4mPH7xDExashJ9cVfma9GCDmyf24Xx1pTlwQIsHVuA9nKLkXBcFeHMEgEhFavU'
-             b'pee66uqr4T3v/wABkCJl+hWP4GY6cwEJqqxeQfR8BB7EwhUr5ovcvgpis8Hnfyzw6kyXYFfvEApT'
-             b'hQER0gEQJJ6IMWvLTPauitsU8L9UtDJTdZKfpve6dv4sDPd2CQhTTltpTxrtJk6CCHzEc+mgcy/H'
-             b'gsYYoNpw5uwKBagRJme8Vkm1pqq03+IFbex8E/oQWV4JRWzT7+/GavyJL/zUZ2/5ntt/e2djHdzz'
-             b'+dxv93vwQvpABvygP4Arjx5f+9SP/eQnf/2/+YU/ma2fe0m3jSZhnE1WXp0q5QZRZlZ5JgRGA6KL'
-             b'pIC+sbtLM6rbXvca6HZa6ZCuVcASM77ABwlZf3DraXPtArTTYugvLcM0mqxLB7KxZKOxsTQZ2eNV'
-             b'NVznI8GphaxjIda6MnNyV0iLzqh2aa9e/KcE/cZtA+dDaUVZijy/bpzdVy2nj+GNjErWBMtBG4Mz'
-             b'VU/sXAyquGHeF8+OxFNKrbvx3bQypB3bR9P2BJZPHIa6NVbbBNGXke4eKXNMargiZfqXzx9Of8/2'
-             b'FwtUPbVp40m22E6btZ5OG21POsqcCPfGhsNqFICMKIvMGIBD3BqT5afvX9zaTGtkB2IHiHP1ogMn'
-             b'4AAGqGnmN2FLrdvrsbV7EXp1jumjilku3lUgWpKQB9oUbEgAtOZ75ilwjlKARAPKQAKfXueJghjN'
-             b'7rqtXPqr4oYYPZYqIbCkVj4E0cwOq88BbO3skLI9Aj/2lifw9OZKhuaHslQosLusEVgtVDBJv4Oz'
-             b'v4XlHrQH2CWYNrhG6O7c6zuaySDibJB+9k1ve3shXUulZFBoQuS1hpZe29mSZGRJKB/LvSlq9ixT'
-             b'Fn0RJJboHZqWNQIWynqDUdulyoPSncX2GyJzJjxD1r0TApY07EfpulxaW0nrcILjomLmIfxFX7hT'
-             b'VtNPfXKDVy6TmCuiXNGZcxfg3gcepgCTbX8I0ll4Tr5SoFORhnHatkWJM4+o1k4PNnfGsw995gs/'
-             b'ftNtb/1t5EVG75/XZ76HF+IH3ojRHhw/fvyRT37+73/ELx55usZhbjo40djOt5zqipFckC9kSCWZ'
-             b'oi5adNraQbTM2voGfPWue2FMbS+vdhiOc8rCxciBDw/s8yljwvZfJQKisRi+SYtPnzmCLqLIbr8k'
-             b'neQLQkrswUG76FHN2ArNPOaBurdJmdNsPJpFrzJjBeyur0VagTRDSIt8eflA/js3jUjcFFVniVEY'
-             b'YXBwkCqemiqWMi8rEHjhO4n3lEn/ofwzt15jO6QK6gC4bswJgCuoLfIfwuCD0PKph6uWjsPJ/gHw'
-             b'4xoG3S4sLyxkCG/I6iLR2IF4PgCpcqCq1xX7ECOUqhUJBraaM0/Vo8teYIqPSl+8sHEJdnZHcKS/'
-             b'DNceOgmLvgNxlg7sbhvmluahOxhoq6iAPOQ6+qb7s9AKyIouX0MMuJlWwRYhMdMW6lTVY0tzNh4X'
-             b'PzC2ZZDGl4s8iXB5fprJ7LWZkzJajbUI873y9BIwsM/1BrQXWunnjw2WKAhTm9mzbYgPZQaZHqud'
-             b'gtSBq5Zh6eQcVHOOoPjB58qG/tQ58cNkEdfKNAXPt73ze+Hw0cPp71NV0siI12BksQqMPGMi7bwp'
-             b'Urs0QAEl+eiUS2hQQxnez4AP2mNgxGUFgCChSVB43kEDLumLtBlw+7mhNenYU8qxEGx6T5curMD5'
-             b'lWdzQGj5Mht2BmWhe1SsfgqKM6hdSHFS6KSq/OnTZ+Gue+6HMUlltbJeJACTn31BOdJIIJh1LIou'
-             b'FVW1/UEfdmcuvOWO9//0629782/sDUeqQP98/qz+y5/9cSYUvsA+08Ud7e3B4tLSuaOXX/OVe+65'
-             b'6/t9mM5T1u9aZfFZ3lGMenAJgVIOdMyisZW3nbLljc0NOHnyeFYe5gF0QxG7odcVyaQMh9L9VOGR'
-             b'ivpMHcyMm2aBjDuWFRKNPIXcah9d+vDF/NEpp8MZqwNjWGig6dGIBjtu+9FsAk+S6BsoqhxU0aU2'
-             b'vffNbXjiicdz2wsyUVAqFbwG3VQt7G4P0+Gc+/8KpydGdbZB8UIkZvSiQHAr03pA9F73UBcGB7ok'
-             b'bFqwJ8zXQQQhQt1HkALCCTjaTUEp/Rurp7m5PlhfQrpKrGyhqEGZUVRe7SqchAwKSjUBZ4CRWr6q'
-             b'WNtPlO+dmuPhepmke/v02TNw5MBBuGr5CMy7Nr2ffgpM/bketVCUMGobJ9Iy4motWFdYXlCO2p51'
-             b'Q9y0eAA6rYoIto4VfZDzMRYCbMzSSBYY4OyBKu8lGti1tApJqSKTghH9hxDxUap8difD7IvnXYMw'
-             b'HXld4HoRXKKoJQjACRNA4tohKjdVVN/z1u+BV97wqszfsuaGUfsAWjWobCS3ixV4xHqYWbqqKjM8'
-             b'Tj4iB2kFsboCBY8i6cLVmM65BAEbbCCKxZTTPL7oWKrvFSNnkaA7Swnz+bOnYby3k/2k2C9KuiHB'
-             b'EtAsJFzoINFUU6TskikUaFRIAeq+U7ntyW09IuQL+0yCr7YngxGjFoX6HNQubo/h9e98zz/+/g98'
-             b'5JeyEeUL48NtnLkXXugf3W4PvvLl/+09f/p7v/mH/dmo7USM0hvmuVCunSuoPMG7xTyU91WGoOMM'
-             b'6tiRZbj15lfTsBn1q2TgGQ0ZV3vH3Ebo9vpw7ORlaYN2s3KBN0dW42Rljo5piYm0TbTFvyCLNIsV'
-             b'JdpgNMpcY/EL/L1YGhiZlSCSRbX6+3je1chW39rYhN/74u+mg33G5xrPvkSk3XVguDmDi09dhF7V'
-             b'56DPaCrHpFYddDfft2eRS6wdxn4CB69aANeDwsOisy6riWSF0gAvXjgGJ1Nm30v/RoWCfr9n7E98'
-             b'aYekg3UyGbOmIKiwq+gAevZk0kPU8GMkcQjs4EwFqnPFyjwdDJc2N2FrZxvmUlCqQub6zM3P0doI'
-             b'wkPTMNjweM6Gm5LRYvDH11TPcgXgc8s0iBMzW9CgWSK+rmkddECf5XGM6y4x2blBGjKEHatrept1'
-             b'VkDJ5xcbaPrcslYmIV9GmaMOd3dhnILULO2BrZQ4PLT2NOzBuKj4h/wZFBLOw3/m4mlKyM60+JXR'
-             b'cBduvvlGeOc7b9d2OUQjlqwDXE6WYra5kddJ9jMKOCjRPc/bhLoR1H5GiarWrFNk02SvyHpkoImI'
-             b'6wYDW/Cs3B9jCc96wRSzkn8P23rnz6bqKVW8XDwXM0/hhVgKiZHQ81I5Fw8dTQLwgR5/+hkyLgQG'
-             b'M5G2iUpQMSRfhWkZrcjcLnH7xp/DLvbWcAZvuOP9v/aRT33uJ3ARYkKyO5m8IM736md/6kdf8EEK'
-             b'e94vefnLHhlN6+GD9959e6+dClxs5zGqpnF4ywJnR1OFmwuZkluAW9vbsLG+AcePH82ZsthiZLW9'
-             b'3GIxXizZvXcGW+lAw+F5u9crPC2DoHMsbwQG8QNsIx0ticq2Csx5L7ysPHBmLJeLZvP4kkV7MzqN'
-             b'osVXiINeVaVzxYSB4Nz587B6foVIsLEhfJE3VKfbpdc52h3lOQi3tvAgrlg4U5B8TgCxhtKPz9Ne'
-             b'rKB/sJvFbRtQ7yKUivORKxYPQTcdYoupguqj5Iuc/Vz5zNgeJWYYJqEso2r6Fe1AdoRTzlumBnht'
-             b'zzkBBSBStA7cMsyt28k0beZUXfdIJb2CXqcLC0uLWRWC+TzSgvJOFBAMJUDanAIpD8UoEoy6eIHH'
-             b'Z/h/0SQMfAjVqqqi85s6alfBAUO1gyvEUCGeZ1gr825Aye5yoOG3UQUiMOET51EXh1swdrUChZyq'
-             b'snCrzetUBRpGTnzijid7cP3118Htt78jc4yK/Ll5vKjIQRpzMmVDKkBVlm/MNiWJ4PVllcXNVhCh'
-             b'WDvzUW8sbgnq/FQg6KY6B7WkCUV+TNTJ+frubW3ChfNnKEnIAJGmzYyAaUIwiUvua5sNbdJSl4FO'
-             b'GCUffuwJuP+hxyhJkoY1mV/abowrwB4NxJbMy9XgZqpmX/3m27/4kf/0C1+YzurZZDrNIs1QRAee'
-             b'z5/fEUEqnwc1XHHVVV9u9Ze2Hnv0kbe7OKukbTCbTVOmPaO5k7DNqddeLFELCZdvPrX+tnfh4vo6'
-             b'HD92DDpYUdWZfGgBEA2BYR5Tbu9s0s/Nzc2zokGTHOwaWiWyTkV0NooTCHUYFE/kxBDR2BAIMdbY'
-             b'HGSodcMO0VhMuUY2GTkKSesAkUjIF3vw1EP0fjUR1NkdZms1DBZ69JDDvRG0oCoQYPELqoyZoa0c'
-             b'Q/aEWjoxD7EVdLhdi9hzyCiAudiBaw8cg8V0AZbmF6DdaVElABGMaVu2J6hige8jrDwL5rbYKK6i'
-             b'oFnHwD5cZZ4XtVIVYE2kZEQyc4GxT1KmjD+HyhMLC/MpAelDaayVw8fxUN8ZxCXFBoWCRyVwRxls'
-             b'Ok4ydMgPGQ2mLsyZS6NEcE5AvLNJV1QV+6gaSY1miaIXdYblikQCqT1gBZX2ByFNkbeWHvPiaBtG'
-             b'MZvZ+OAKqk5aoQBqWknt4MAzSZRmmg7hNa+9Cb73HW9XW439yRYYB11dotJuNdfXiQoEW8tIq88z'
-             b'yVq4hhrchH8YwWg9FreDaPaTJbV74xEHqtZf9h0w6IZALykZXTt/DrY31qjydvtVZCBqxa77jyvI'
-             b'6J1a1oDM1CSRSUkftq5PPfIYPPLEU2kdZ7FY8MV1XFVXGl0aY+Hh8ixZBK83dybw0htf/yef+sLf'
-             b'/5EaWnvTetZwF/5ukPp2IkDSTRru7MBLrrv+b5aPX3bu3rvv/t5OOlmQ64Isdzy4NGsy3Cdi8rM/'
-             b'DrUefKWKrXgwbu/swYXVNTh25HA2Apzl4KZGokYaxZl2Hb6WacrC5+fnqM1j+WhepFZEMsZZsCjP'
-             b'DrwpQAr6wfTLc1sgGskXZx6qYQgXZW4gXXwmP7uibkG6X+mAOXToMKyvX0oV1TnS85vOSjTNUH5y'
-             b'd4LeXDdVVS2CMHsZckcmPpuZglrGMwgEULngcI88jqTCDdy6y21XgBODZbh8fpm8lrqpuqG2Ssio'
-             b'TVXHZt270vgwfkw1w+FZugfnT2QRLoGE1d8paYlZUkg8fPLZ31JUGc5WeilwI3qv1Xaa8YIAcwLw'
-             b'DEYAKbUiPL2qnpgWqLQaI3AwNQwzF9WuQhGKQgNoeVXZp8etGZ7vBXLulW8TYzDcIWfI4LFIDek0'
-             b'yJE9Db2mlAwMYQY7MIG14QbMfPFbU0MBqZZJJw4ygEfIrukARFfht731NnjjbbfSeioGm1yFhSIY'
-             b'K8CSpnalo+vvXNSWXuT5jVc/Da8VSHShmTBqK9eZjkQJ1uoDZYw/Pe8FsKLHrgx98/rO58Zwewsu'
-             b'rq6koD6kJKg54i/gJQ8lAEpy4oxsmeP2ZCZtuzwLTBXOXfc9CN949mxamyxNFkOD7O+cK/fPFeqD'
-             b'7n8v6EAPGztjuPK6m//ihz/5mY/PL85vToJNEl5AiO7vmCBVoWzPkPg9r3jlq+9aOHDkyTvv/Mq7'
-             b'upXrYp+bWlMmTcuZuXGtVMl9UIVHCRZ7wz1yrD2aAtVcyqRTxVxgxBI4nB7N2S4+LZZxej27aMWO'
-             b'She9LksQlVlKA5furRBY8aIprbnCRxLIuXAznBGkVXM4I8Pk95nbO2nFicSYtpxyy+TEiRPwyMOP'
-             b'wAgV8l2Ro1HnVJ7P4cE9tzBIgWxGAdlzpimHkFMrjQzVncYZdBY70FnqkJAsHUBko1IqtlY6xK48'
-             b'cBSWKnSq7WoGQhkiauhhtYQSPNLq0FlQKW+9Aa56njeJnpvjQODRKJB5cFg1OUxivC+Q5JAPAKyo'
-             b'89ehiMRaxKa2MXNl5FmhnjpZbB8v9yGz/dv5MVlKKL89p9p6TttpUmWVJEGtMYK0Cc16kaMyiBgr'
-             b'W8Co15jMH2O2SY9Z642I6P0ujKoAF0ab8Mj5Z2Bl9xLMkCslwZUq4xavnWxCiO1OsnTJZWJKBMdw'
-             b'/OgBePd77oCXX/dyWhOZy1cxrD7qntH36MyBzetBW5UxGGvzIpEJJi0BRvAV2HgJQmqZYfUqbfXh'
-             b'QakSKrXnpHXtGgUKXulxOgPWU3DKgtzF8NHF0tYQwJBzxZC1eESBOhdLQA1qWNiC3dEEvnbXvSk5'
-             b'XCMJLbrTdQARv1T6vCKAOYDKmcCv2+VNCBt7M7jiupv/7IMf+08+Ouh111vddkoMWy/Is/07LEiN'
-             b'FFl09Ytf/MCBo8cfu+vOO7/Px9gl1etY+r8+FtiyLG6nMHCnZEf8aysdLMPxFFbOnYeFxQVYXl7S'
-             b'LFEEP5232XIRmcX2x+7uNsxmNaHBpHVQAewjTjntv7tGaijByO9Lg0qrQO3hNXM05bJyoZz26J2S'
-             b'CKP4u+vvoJ0JtikRjv7g/adMS7FkoKjvJi/RtwHmlwepssLAMyNVgYzQqri3VQSaahKQTRXJHMPH'
-             b'ecNJIwp3LTrNXrF0GOarHolgotZddKVFEvTALUZ4Ajhx3AKkll/VKi0baZq6fQP1Oir9wDHPTCSb'
-             b'SMQTKzDVKCywcplTWJAIcllo4O+ZqxLLYVzpgcZVByFUa66oTdupymuj5XMrNvPXqgbvs5gAFlNE'
-             b'MHptGMijKSuyqgJGzFlWccfW3iyT00M6s/ZSwHlmcxVOnXsSVvbWYYJCsy2uesXiQdTMXTnIUbm9'
-             b'1XJEnseffg0CJN51OyyldYMJC1WhrbaSUsFIAcm9KBV+qdLsm3WGMuJ59lrQrdGAjEy5J0g9CWWu'
-             b'iZhU2TDLF/QCvPBskxL09bgUKLYurZH3E3ZkCtk8msQUjEhlLKuRwULiS1UoIVk5Bq8BybOlRPY/'
-             b'3nk3XFzfIiECQtQG1qh0bt8MOWpSVuxPeS5e5Sp7eziDq191y5987DOf/3h6nRu4R3pz/e8GqedT'
-             b'kEJSJapAv+jal57qLR566q6vfu3dHSxuYjSlfq095GhK6AI0AEZIOVbQblF2ePbCCvT6fTiQApWL'
-             b'zYBUCKRFqFracyinNN4bkUI1bl5rHCcZpLbqbBUSi6FfUV53OktxpoXoxKPKF/Z+0WtyZvbsmkhD'
-             b'Aw8kpYT0Po8eOQJz/Tl4/LEnoDT4CyLOmxoGFQN8z8FgqQvtfovmOGh8h48jBxRyZfB1DQ4NwHdc'
-             b'5tL4khUTRCD9PAanK5ePkCYfuepSm1asUbzJcJlvxUKaInQrfSnS5rOZtPSEfSbTYiAh1j4Glsqr'
-             b'r5MXHUghfvK1LdatplLU5MAjNVk5XkBIuhz8YiiHlmO34NxyBBUyVaItBiTRTNQqUfR6I8/ODA6G'
-             b'55mikpBbPlmVpSgOs4sxtr2ZP4Qzp5XhNjyyegae3liBs9trKThh0KqyZoQAHURKC0or0TFqbJYO'
-             b'bNxvJ06ehHe9651ww6tvyOAXVlSQmVx5GdFUD0LoLTO5YPZOSRyjyrWW/RWV8OuCgCNKRRO1DVgc'
-             b'cKO10jDwxuK/yJ2UYCqo9H/DnW24tHYORrs7xpWj2OA0J9EM+ojs72U5ihxUvZ3KpX90Oh04ffYC'
-             b'fO2e+2Fnb0gtPulqYGJD1AhM1MzcK8+fvXEFyB8tbIWnL61vj+DkS1/955/47I99LK3vjd3dFPgQ'
-             b'8DP/3SD1vAtSuDGxLfeia1/2wGDhwLl77r7zba1Yd3W4j1qlKQscDsfER5CZiXPRcJSq0gaE3PbA'
-             b'LP3c2fP0FWz/VZVrDMpVfsiV9gQutookiKawvb1J/edOv0eZkpfhky8um8BzMunLO1+eo7R+QFs+'
-             b'DZ8lsIx9X74XmWys3AlBRPmiUO6zZQhu0Gk6hK647EQKqn147InH8wHeKlmjd8Y7i08jPAhxTtVb'
-             b'GpDGG3ZY0Ro8sIo3avMNDs2lIOVNe8aztl1NsLhBqloR1dcTSR4o8G0ERpB4rbQrKeAUJ6hcxWRi'
-             b'Mmb6s1Az8gkKKIUzbpIl4v8GqiwctDttRXmJ0WRRjy/mce6bGP2RQC7Y1pXxZiUBSZKFKMGY0Xq+'
-             b'KuABIWyHoLwWNcn0bHOhiDp5/SZ4CycwFq1HHBgJPQchRJP0y+eHm7CagtNja2fhyY3zsD5NiRO5'
-             b'NHo24HQNGZ0IXonbmS+XK09Uk2inA/V1r389vPUdb4UDBw6QFiAlL61WcQFQLEMwHEERkoWiJWck'
-             b'CaPMngQMoqi3AnvwzmgdGpNES9a3B7hdtA1XYZk/Z3nxrEVJqvMz2Lx4AbbWL6Y1NCE5thgLQlAB'
-             b'SioPFgs3UGdRrkGYzyAlpoen50DaxNPPnoV7Hnw4nVO4ltu6TjOEn5XyvVf0oiL5hBflmlYcu8Mp'
-             b'HLjipfd++id/7ofml5bX8Gc7vT50Bykx7nShju6Foife+GjBd/AHbaiUobz1e9/5m3U9feYv/uh3'
-             b'fydOdo51KSCkQ6/riRkv/Arnoukjc37E8M7IpVFeQAFOpQpjZ3cPbr7hepLpQUBFtAU467Xl9VWr'
-             b'1FAgZNAZkro5cOgoH6J1oWKAEBZdcxosmWAoA148/Gpt1hXyrLY7DNpJQQEFTcHdCDNhCezFkx4V'
-             b'uWHD2RhuvPEGOHToIPyH//V/h5ULF8h/q5JhPW9aChYMPKA2KAbXbqqajs3B4EAfhttj2Eufs2FN'
-             b'+nytWHGPvaXIX6xU03eJe1SBeOdkpW2kGNTTABUZA6YAOs1VELbFcEbl2VYhkowQclfQE5bnS7U8'
-             b'gbHoDtIWq/PlqCrWCWT1jfQ9bBvW9bjMR0SrzTEh1LNUkOpBenVP9qaKEVAAzcE8W4QIjLp2BX2G'
-             b'c6psLZ2llKI5ACX5D3nI7phKQGLInpGXxG3jGQZG8U6VkoIAl4a7sFNP4MylNdgY76YKd0rJlmtR'
-             b'c5QqJ2pJ0lPXSjdQtYQqt4zRcT6w++8rrrsO3vCGN8ChlKQN02MiSTcHaEcixJbvR0HZs2+XbymM'
-             b'OooBn8oNyXt3DIZwDfc0CAwccaFsFNawzB10Vwi8gQm8AnmXgIXVO1XNvM6ZGS0BCKuX8c4WbFxa'
-             b'hcl4T4m5tVJHGAfrPatlRDb9BAUziT2MCsSCdfllZ+v07wceehweffIpEooFDuzeeJtp0LXoY+uH'
-             b'FaRHmtvPG7tjOHzly+78zE/9/McWDh47NxwNaf6J1Rn+6HAa4QUZoeA7hMxL0bbtgIQSU0ayuLSc'
-             b'M3OSus/tuqefehyefOzhN//1n//b328P10+imjf1zuNMNdWAFYxlhhLVdj1/2iCA22ecDoATRw/D'
-             b'G2+5CbqpGquDWJwHw4kwvsG8GbIGWoROu5c2+tFUrSwwqbOQPKLx2CDuC2ORo2XmV6DBpxBorSco'
-             b'D36jcHec2Ui29elLHz1GllbJKEOsqHq9LuztjeDrd94N999/X6oIxzAY9LUv76BYXqusC+MOM586'
-             b'z0nGSHis8oyGfr7ySshEhN8sff9wqw+3XHYtDKJnIIYH0LagVBZyiAcicqP6geOs33GrT0igZDPe'
-             b'bueqNRqbkFiUq4Nk3yFk9QUjG2Xm7FbVRo9gr+raQZ1io4BTuILAirymIOKYMMzeT0qMyoFPhasi'
-             b'H8ZQuF6ixeiiAWwI4os5S7P0l0k6iLfSAXthdxPWhzuwtr0FY3yHlTeqJzELmpoqXAMJr38BbyC3'
-             b'CgEWaONy8uRJuO1Nb4RrrrmSrg96vIn1OgVcITNIVeYY7agCuRWLwrLGHtufeHn/sWneqeK8gnh1'
-             b'hWMlUHGtIo1yiwQMIkuzOnjWhuSqJLIupS210r3aSZXT9salUsFKAsg/D8UmLZO0c3tFqxoQvy9u'
-             b'DdccZBSyjwlU+vp995+Cp55doSBCv8MtSTWHVKeEmH2yIlvFED2ipvOgTvcZ0bf4791xDSdf+sq/'
-             b'+uxP/tynlo8ce2Z7a6dph/MC//j/TZB67JEHCYG0s7Xxpj/70u/9T63x7okWViLTcXa2ZEVTJ4eO'
-             b'480TnbEaDAqUyJIokThYywt9eEMKVIuLizQLE96RJS6WFkhu90g7CRfT/MIBOHT4SPbygcKBUZSf'
-             b'oBBdKGBXkVwxZEpXgN65bcKHsRebEPYuAlfMCp0TQVnDCwFQOwRyx+WWZbfbhdPPPgv/8ctfhjNn'
-             b'z0Kv28lVFavMh1rMSPh5WI1dFAFEkcBK/hA3CHKGjt+bSwHtppPXwIHWfMruPdtl8GGuFSS3Zun3'
-             b'6mzBjuKZSm5mCHb0xosoWE/jQtDUe+yUpe/UxKnc+6qqDCkzKvxbHJdzAcnBXoiuMejxHKEcqB6K'
-             b'wWJBu4H+JPB91SG7M1W0XE+fDzxETE5TpYTsl9WtLXj8zGkIHQ+j7CjE3CenKgwVayRKkFIhYQ+q'
-             b'N0mtK++pHY7IyMNHj8Atr7sFXvqSa2nOhm11dXU267FUYE2lbzGdtNWlUzt5BqVIcigiwFhN+ljc'
-             b'bp0vwcKYi0YpJiSxkKBACu0ZIk8VUzTAn5i7FyTXlSrY0WgPNtYuwHhvNyMZDZ3ERUN28oKyyGrv'
-             b'mbPlyixMkthgV5oj2Svk2e3u7ZFI7NkLF/P8SaSegrSSOTCqTJPMLwuaSpx8sS3ZSYni2sYOXHHd'
-             b'TX/2kU9/7uOXXXXNpZQJwnZKHr4bpF6gQWq4uwUHDx6EC6sXb/vTP/ziH8zWzl3WRrhwValacOR5'
-             b'gYuq282OltJL9woblgWIbaGFQRdee+NNVFlhoGpAlPkwEEaHL7UVrUc8oFGW6OCRYzA3t5i5SUZb'
-             b'SGDR6kcjB0pDE4zZ+yyQ7AyUXgG8EYrAbpS+eV0Ixi4axn1Ug0OXrXjp+zjvq9Pre/TxR+Gur341'
-             b'Bf3NDAtnaLeYtAVRO+Dfy8i63L7L4q6RhVxl86VDI50qrfS8yylDPNhdgIP9BVjs9qHX6qnHkgvF'
-             b'yyffD9FzdIXH03I80fKsOsKHgTd8FkJdeTP6BhWeFdQeGF5sUxw2H57BgXE7Zri1EDqjdhhZvw32'
-             b'qQvw31QJPZZ6zTrGym9UOYGZpPW6Ox7CXlpzl3ZTxZTWPIq2YrCcpGpthtca288uC5ZK8lUwjtl/'
-             b'sxKVFQ72CprzWdsQr+mxYyfglTfcAC+7/uWkZj7Fw4+BICGyb5LAow1aVmxnHFf8nu1R6J916coB'
-             b'rz/PYbsWqDY/VuA2gNis55M/89CCi1ZKbx91JGoSAq647Db0KgmlN4OtS5dgd2eL2vBONQ0ZaWiQ'
-             b'sxZQJXhVQeoq2M8XXLnYeOAjIvJz9eIG3HP/g7CxuZPpD16qSigag04sOria5wEnBUOuvrXyBqyY'
-             b'a7jxzbd/8fs/8ENf8O3u5uFDR6hz8N0g9QINUo88dB/s7WzCwtw8DNL3z62svPFL//LX/xA2104s'
-             b'pYykDqL0HFTeRvvcIAKTwklwLF8jkkqBAhO6w970quvh6itPwqyelqCiMimso+bAtBONjE/6mF9c'
-             b'guVDx7ItNBS2vurCipJ3zRIOgnQCfmwzGSvtPCtJYw9EUGkVG0SNfaEaCWeLiUr9oVAeabi7DQ89'
-             b'+CDcc+89sLW9SW28jC5jFQJnZXB8Yd3z62q5YiQffG4BeVYTwBkJVlJd14HF/hzMpWA1l4LV8twC'
-             b'dJhsW8TiI8HJPc90VJWdM06E+WYlKg9Nk8/IumiShBgmvgQecA12flH8iHpgKJofSsvVRWt9zjmE'
-             b'E7dYoGvjRffOCWm2UnsXCr/p+Wepkt0ejWF3OoKdyR6sbqZDdTZJFVQNMxbkLeojka0svCp4R26V'
-             b'AWsk0uGFLdeYrSaw/SqOsVNUZUmVxBVXXQGvvuFGeNG115K813g8IvNFIR7nWU7gy1MIp6WacFkh'
-             b'PDAIQvhdfK2VcFsHsGmAAHBy5c/gFYOeU59kscxwoZDGNbDXjCKMDd6Z2QU0a5oNR7B2/jS1rj0Z'
-             b'CILuHzGPbJLsxatJ1GkEcRgAdAXl9nLkvVhVGYT01LNn4IGHH4PJJItYU3ei8kWZXx4PDDRepb1M'
-             b'AsFnyXRawzBtmDfd8d5f/ODHf+QfXVq7MJ2kpXX8+InvBqkXapDCm3vx4mrahGOCfVLrqj+AJx55'
-             b'+C2/8+u/8kW/u3H5XNcbO2fR2XOZ6e8zDNeieAQJCCKVgocNzR1qeMmLr4FXXveS3HKY1SUj0+zM'
-             b'3oGomns0V0hZbBcP5KUDsLh8kBYtid6K2jXbjNcsPiskzRibG0pg8UGEJkOzxaTdF5ez+ShcmNxX'
-             b'Uu8cbUhJG8hliSICQKRrg7M9lIG697574NQD98Pm+lZWbEA/ImeQUIEDKRTytHcG05DZrwyikIMt'
-             b'D7nJrwpbaemg7Kfnm8fqqt2Btm/BQi8lHanyaiPaLR16/VaX7dRFoUlPcNUK1EPPpOE6g4il3el4'
-             b'phDFMFCDjlO1jtLZihIvm5NB0T7Ee+EzSEPNOLnFRVD9lqcZxs5wmILSHoxTkrM92oWdVDVtpopp'
-             b'hrMhlw0FgS0aYizwaQAxa6w5ufIgfmA6K6zZ+qXKZx8mA9gqxHlZPwWjl77kpXDzza+GE5dfRiCH'
-             b'YTrAK+YUZiPNwJbxoIADcqINDhT9r0E6zwCxWg1WYcUgHV2B/3FAEk0910ADZslDfu+uCOyqa0Cd'
-             b'q/Ka7eNz4c+JV4wm2GRQy87mBmyvX0p7aMJ0Cq+Go7ov1DPEaaVUcd81SJVc7At4fUUQkQ7sLkzS'
-             b'3j/10CPw1Omz6f21iTtIbXGyw3HaypSgCjyni5ZHBsU8Fed/yHEbhiq87d0f+pk3fM/bf/noiRNw'
-             b'4fxKWjvVd4PUCzlI5R5vZTLhfCgh1+PU/fe88t/87m/9ymjtmbfPkV5dXvAIFECYKFrKZ1a9Y3lk'
-             b'RstB0+xMwBboJYOb/sTRQ3DjDa+ChVSlYXB0xszPinoFmW0E01fiMUw3HcDLR45CGx9jWiux1rEY'
-             b'Kyj/xIq42lcjVUFUryKt6BjZJM69siF4GmwO8mjmAVk7zbk281CyQjpZN3RasLWxAQ+fOgX33/8g'
-             b'tlTpCtGsyIsqu2ObcGfU2kkv1ujhcn+IK1dqRxqodqhrPngDVOneougrfmKQ6qQHW+zMQS8Fql5K'
-             b'RgbdHnTTeui12mSpwLlwA8KMSgfB2NU7RqQQ2ZZV8gv/LXKLzxuEpFwXr156Re0ga9n5FFB9t5Oq'
-             b'n0BJyNqF8zCejekQ201BCdt1sZVbx1g1jTHZ8TxTUtkgz95FXgnNseHXEhsEX8cqFlhxRwbqZBty'
-             b'wm4SHQKDz5GjB+AVr3gFvPxlL4WDBw6Q+saU906WXMr32MUCf4iCduRenoVBK8lcjDBDFqaNgriL'
-             b'JdDLPAznonV0BuGa54rRRQNkCkqaz7NO4zQdixdbA8HqiiAs0SpGqXq6cBamKfB7VyDpzlRFIZq4'
-             b'bwTQRVycrq84JhvNWM/gIfwaIlQ3N7fgvlMPw2pK2jL/ScBF2jvgx3I6h1KwSHAqLxY4cWulpGFz'
-             b'bwdmrd7k/Z/47E+/+Z13/Hf1dAadtHkwAf9ukPoOCFJh3z3DIDXa2yUV48ceeWjpyUdO/eYz93/9'
-             b'Az0aVtbUz0dfKhT89I6zVD4o8kBe7DLYSVVgC7yBJ+kQOrC4CDe98jo4eugAHU7SvydFpuKAoYem'
-             b'wh6iVVxuw8LBg7Bw4GD2HhLlb1VWikUWiWUYaGHzZquE3KqtPoMa9BmJVOwrio+RVmeqaOrEoD7P'
-             b'ljwb1mlroqbLg8TB4d4ePPHUN+Chhx+DM2fOpYC/Sx5V2JuX+UK+nFk9PfKBpjp0UslFz3brNQRV'
-             b'AC+2DV75AsVRrpoV0VGcgbdSwOmhFFG6T/1OTzPnfgocg16XVM3bJNsjUHpQWDleOvx9sbzHVg3d'
-             b'R24Hk1hnzG216WRKv4+KDgjzxkAzTZUI/jwGCEQ2ohQU8samKZGZkT08Vws+tzspkWKFd+CqHlFz'
-             b'ysXS9ldgnUSu8lnCSQ5Xr/YUFaHCMgo0wO7ekBKzbr8H11z9f7P3HvB2XdWd/9r73PJ6l/Senrqs'
-             b'ZslFxjUg3AgYY2xsYzA19CSkkMZ/hiQTkkx6/pMMk5AwYTJAEgglQCihGEy3cZFVbMuWZcvqT6/X'
-             b'e9+tZ+//Xmuvtfd5zP//mfwnjcA9xJH0yr33nHvuXnut9Vvf30a4cNdO2LBuHfmEodWJDXR4HUjf'
-             b'UdrBVu+KbUHCsF6sPnjbJlE6mCDNl4oDGSOalEtnKgOahYywhDuGKttuVUyb5ywWMopZLcKDOCgs'
-             b'MnUVhq8NZU+LszMua214GTrEIfzQxA3A6ZgSS99YiZcVRA6mBErpF+N7gTNVZ909/8STz0DJbTiS'
-             b'PI9ZZOxcbNS+hrKzZdyM35SpQMKn+9xtYCpVd9/kOyde/eM//XOX/8jzPlp1gQh/G1sMrSD1Ax6k'
-             b'zp09CWdOHoeL917e+dXP/f2fHfrOV17fnVcsH86F3b7ipqbV0YguGrLxQKIEAxEduIWq6ILcts0b'
-             b'Yfu2zfTBb4o9hbgDZPtbJsO+gei1hItToa0T+odWu8yug/iE8hiGB/uyxp/xg6cC389aE0GjMk5D'
-             b'r9GEnpS4gNhQxkp83V+pjCkf24owOsZmqM/ZuQ4MSvjzc7OzcOLkSSJXTE1Ne8afy2xyPNAIyvCc'
-             b'SYbrZlklKN4cbFNhAiqHhR4sS9QyKOsNhDmw8QyN8k4dPL7FOCZDZSzM8NDSJVFxPECTis+EQWwK'
-             b'bCRN9+rCNPVDtfjYGKSATAv579wHa2obwLpZFZwSe3IRcQVchMjRE29aR/eQDpSQrKVEVB6mwU5C'
-             b'gKKWZdo643SLGTgSQXDGbHh4GLZu3Qzr12+Avt5eug6NWt33YckOXfPrY1NLL7PgxD8J2VPEcMkA'
-             b'OAQHXbCBCxLGG7K9Jhtk2l4ZaZUNdH9P2+K8SVlmBvICriUDC8iIjEdTZtDVKD4fSxu05eoyzEyd'
-             b'h2Ztmd5rK0pAs9KLDXgmbOW5RIGLVWLHAqG3Cpk+kd9AAhx75gQ8e/K0uyc025yYTFdMZ1yq+T2m'
-             b'v6UeHGCF8M/D8anHbdXcRqfQt+boK9/y9tft3LVrf6VWdeeRo/v2hyFI/UAP8/5jDxqKtLb8+re9'
-             b'/S09/f3j3/78J3+pt6B1qMoJf0yZqIKzXh2GjWfZ+ZOlfLPh51GQeuB28BiUjjz9DMwszMHFuy+E'
-             b'7s4Okq3LzlNS/SQDnLQRZR4EZbVqGSbOnoLO7l7o7huEossAmjYDMM18YKSWLyrCCHm1sa8mH67w'
-             b'YdPU2A+5lk4Cqibb+rDBPUnKHoplu6w6YjM8bIpj2XNgcABWrRok87up6Rk4fvwEnDx5ChZm54mN'
-             b'iKU+JElkD5oJYSdb748Uh22BOwv0f8g3s5nXp2zYbcugI4kL8GRzvFSQZCxHgSUlVl+TNwu+V6JS'
-             b'zc13v+gtNqpenddgHA6TJLTM7GTQTv59z7jqZufILEvSsxmKzeJqo3xaSAsgxBNjgxIvwz+JuJ/Y'
-             b'DKIAi/gu/Kmurg7YuHkzbNiwHtatX+vumx5auDHDazQavmfHiK6wr9HZRdTy2IM3I5Rc3wcEJktY'
-             b'E7MaFenmmboeZyASS1RG3cqZiom+WVIyDXSIjDDC331pRFdl+q+SduD75gG6TZifm4K5hVn3djZo'
-             b'VEIk5StiUyZj4rif4ftB6GtFLmdmM8UiCgTColvCY0eOwtj4FOSLbeFcVPCqEv2wwJxTv/kKfD/c'
-             b'SOuQZZLS0W30ppfKsHbb7u++4e2/8MaRdeueqpYXv0f884N/tIJUNlAp1XjBi1/6HxYXF04f+vZX'
-             b'/2uXtrkClwY8ikfqxBBktjH158YwlrQgU193NxrO2IxPzcHSg4/AJRftgjWrB2kR96k9hN0oKX+4'
-             b'M6vFlRQyGZZbMJYWZ4kl1te/ilSKhkkBoawiH1wp19vYhI2ePuI9xOU6rnF5IjmDULNBLJT8NPVw'
-             b'JNGSgFVI8jyZ79FGiskIRG1wF4so4+7317id/OjatXDVFVfB7NwcTE5MwqmTz7o/z8NypeoHXXNJ'
-             b'cHYNUFOWBIsNt1g3pGAyxpGcgSEdIY0lQPoaN/2jz1bsH0lwITWW9hmnzio6wIsUICyuKqJ+grDC'
-             b'xKFqziSMiQQSq1QkcfO94yvHSWzXy6wa98lAyzmrCFu1US7uVWIpXV+E+iL8FAMO0kFG162DLVsu'
-             b'gBF3vRGIDFSOrNHoQMplJPxZsNFEjxII3LozXSErEgokC4hlvDgGzoIByCgtwWZsZSBatfDMj7Fi'
-             b'ge7vE1lzTabMzWqTaOFh46AwQJq5xzM8S5ab40K+MDcN1cqyV+qiWEUQVWDD6HpQB4aAqsImgb01'
-             b'OXjE12bCxHDsB544dQaePHaC+HuIWEOpHWZHSaL/l3EGxZmkkjGM8HnUGfWpJQLLXLkKOy9/7od/'
-             b'7Kfe8Y72YtdMtVr9oVybW0Eqc+DCUlkuw2VXXPneLdt2zv/Dx//6j2oLU6s7izkqm6Ru94nN5yLa'
-             b'iOeyC15UGiWBAAqZzMXvtrCO/ND+Q7Dtgs2wfcsmqlenLMNVUhYxWbhpBl4pslZ2AJ6ePA9dlQr0'
-             b'DAzw5LkNKjKIU19BDu3dd8UpWMoOSdjJ0QcW5zOEQahsxoPIb/z8msM9JTC8eFioV2vRyI8HWn2p'
-             b'TYeGM8ZDZCmmymdeq0eGYO3oWrhk7yUu8M7B+bFxF7DOwPnx8+A2CZRl0aAnWkJkAKsSjKTq5anU'
-             b'TFTgYWF5nX5OKqGGPZaBg+WdFZ1XVhHpMyjh72ELJpVxA6tjf0CL3XkOpAgGAZETCQPoXYj9KFSH'
-             b'GrGhEMoHcSVNWPwVQ1k9NxEouxORjeXdNS7qVMTCHhf2wgwQaaO9vQ1G14zCho3rYdOmDTC0ahX5'
-             b'X+Hv1OsNspmJ4102iA5CQBcjSKGQKBWcAFSA+hoe+vYoJSmx6RAcdAhhgQKhdQDphgFsFhzYDK9S'
-             b'5oF0mn6PB5oPavQzWoauIc6qZbNKZUmsgFWMKdzwLM57E8vwXpnv6TdBILLbDFlGcWZjcF5Pe0Ws'
-             b'DSIbzfe0z3Kx91R2QeOJo8fg5Jkxd08X3eewnc6ZnLxVHOrgE4hMTYbkYjYrpXHF6Cz8GaSGLLj3'
-             b'7fk33/HfXnj7Xe/s6Ois1yo19u5qBanWAUCN/+ddf+OHB1atPvKpD73/Awtjxy/t62z36E9qtRjP'
-             b'UAsxQYc6vZRIQOjRknM0U081dl85+vSzMDc3D3t27YDe7h6aqUotzz2xXTdkVLBSygqNZhIoKFgu'
-             b'z7vd4hL09g9BZ1cP7eKaqZ+GB52xBwgJVhw8FeWW4kVJ7OcoaFIzWHN/Ic4WESkw4N15JoQlxXEs'
-             b'F6KbKWTcg9nB13KgRGVSkyntbZ09sGP3AOzYuRtq9SrMz81Q/2psbAImJydhfn6GEDwkIU8UiVnQ'
-             b'g4cCaCJiB8vlmZzf7Wod7C4kiwzGfcLYs7EspzKv2/Jipa3I4iP2OoZ+tnXQsXRHxodK8WCx9dmK'
-             b'anr5PETsEcmpcYOQQlBHmgxJg0qSvIP3GZuh8jEqKNu6umGgrx9WrxmCdetHqZTa1d1HkmdUCWK2'
-             b'VK3WAyhXqejK4q1lxbVdhXkma7Mlykgj97+T0r0kCMQVQ7uWyeEBEi99Qh+stY2eZ4Z7dCooEWPJ'
-             b'zwcwzCvFbdjPO4XKsxL230oFH/6JohfszeAM5Pysy55qFaagiHeTpe8HixaAwAb0PSZmkQjpgjMk'
-             b'Y+Nsn58JM6EWir2tc+OT8OiTR2GpzPRyVj1afm+z9jHinRXmyDjY0vweBzEPSE7c/d+EetKxeMur'
-             b'Xv/LL779Fe8tVZdJjPPDfLSC1P/HgaWCVatWH3rTT//SbZ/82w984OyTj97QlS+6z2w9wB69Sk3M'
-             b'2tjWWtlgKxEH4XXAs3iPoDxMzMzCwoP74eILL4TRkdW0GDaDesiHN/lwe9FbxtQtQEl9r2B2agIW'
-             b'5uehv2+A/Hxw7UvlAwOBKRAyO61UnEWxJhAOUoj2oRRolTR3YwYSRnzFbiIsaGnokwR4BZfJSPIO'
-             b'aTS4y7DxqBfmFqBqpc49vpy77mtg9fBa2H0REOVgqVSGudkZkm5PTE3CgtspL5eWoVats4TcRudX'
-             b'sbPHgossvvw9WlCFJ4V9L22zSLaMAETsJlj6HRYwiHRtVrBF1JH4Lkk/JlqPa5WEkiQG15w2ftFG'
-             b'MkTq3yfrsgBhiebc1ztcto7/9Q8MwuDQIAz1D0Jffx90uSDVVmz3vVAs96W+nJrWGhCRQzYKfLi8'
-             b'5O/NxLPgsgBjq1awCCXjCiNkXuERy3BcltQm7EACfNcE2zEWMPDsluUheM33SZYZaAOZQwfSg+Fs'
-             b'ONpqxJ+VewevaxFJ97UqzLrgtLQwR33dJAwXx8BLg+/Uq7JcsNQQkWPe242kOShCMZoy72glDyF4'
-             b'oSoQXROOPnUcTpw5R685lyRR6GAy5UwdHYtl5EJsSWyYXfTzjvm8739hwOse3njsda//8bePjKy9'
-             b'FysPOHKBANpWkGod/68HTtoP9vef/slf/JU7PvC+P/mDIw9+822DxRx72dhQL1fZYYpQY05XQswN'
-             b'l0a4H4I151ojhYcOHILN69fBrp3boJhPgotsIB6oaHkQ1w0VsizvW4QlwDpMT5132dUSDAythqSj'
-             b'zT+nWcn2IURMltUnJREMpDQb5I+EhGc6ng8AA1pl4DIO40pvJ0zPy2oVencQd6WsjNTKCy+C35I0'
-             b'/1Oc0/EsP4+vyUF3fz8MuIxh286dVDqr12puUSrB7PQsTM9MuazUBem5BSiXyy6LaFDZB80bm1aG'
-             b'kLVXG1K5NPEdjYSDqI6gWQlQkc9o44Azc+Owv5Gy2i+IIYyQH3jIlDMgyoYM3wvi1AseaoyPi2aa'
-             b'hUIbdLosvbu3x20yBmFgcBD6BwfIr6ytox1yGJDwJbhM3FCpLyV5O14n4zKnHLMTszFFkDxxQNVE'
-             b'MYnMO0lWQwuzDYPOWcECkcq1l55rIY3bOIwdBniNnyFUWZ4J26akLFYIA7b05JxVKxZMAKscQYgO'
-             b'PuCFIWljM7xHr9rDx1ycnoTFhVmSz2sdC+P+HdRZ/R8Ezy5DOkbfZ+JNklXZkgWEuSn/Floq2eIJ'
-             b'nD0/DkeeOAal5bo73aJHNMm1oj5jLiC7AlEmtFV5E6X8dpBmn7BXhvQL93MltxZsu+L5n77t7tf+'
-             b'/NDQ8Knxs2egy21QWkcrSP1vD6wbFzv1wi133v0TI6PrJ772mb/9T92JoXKbLLg2wGcziqSQpdhQ'
-             b'+suywPxCrunDfezEKZh0u8HLL70IVg0MEJ4ma3onVtWhzMIGpFLSCj0C92EqleehVq9AP9LVu3q4'
-             b'l83MwVj3WWFLDpKpJX4HHHbkvHM1rEoTOKe3z7ZhxFZ4QhJndBAK6IxkWYfGtABXsxUi3+9hdZxi'
-             b'E8MkF2T/dTQxtF6RhvRoBPIODQ7BDrWDAjQq1mrVCpRKJbfbrcBiaQmWlkruepRgedF/rVKp0hBr'
-             b'HQUE9QbDsWUBT1lcAd6tWLOaE+LiLhwDkqJzbyyWa3i4m4JiQtcgRy4MRUJIYcBpb+uA3t5+6Ovr'
-             b'cUGp2wWnbujq7qa5JSShJCwBT60njzTJLLO+MvPU0S4mb3P+eZui0jSBXxc7NjEAWB7L8H1Dfs9M'
-             b'HJWGmEMGA0wpVXnJeJT8C1g3wI0DGNabkXgsU2YOiP3RII1eTzpD8PeDz5qCP4e2DAndkJJT89hE'
-             b'vVJ2G5RJl32X6d8Jqz8FYiyyfZCBc/mcWghBE69100Zln7+ixs+DQVQY5nN5WFpehiePPQMnT58l'
-             b'xa5OciH0mWBdHyn4AoLWK5y3PTldJRAUi9hiqrqPei1pq/7oK+7+9RfcfPsfV8sL9doPqUCiFaT+'
-             b'icq/Rq1mb335K3+t2NEx9sWP/dXvtjWqfe0FtKKQuQyI9uRU+sr2aFQYOBS5MrUtUr88oGX0/NIy'
-             b'3PfgQdizczts3rjBN8hNmlGShZSFm/Cw0heK5d+YMaRu0Z4YO+MWv04YWj1MwgqTgctpHVVK5BcE'
-             b'KmNhrwL4MtpgR12bygxlxZKRFXZGmJFRKpLElYhLZC+sslRsEUpxLZ/9kYxV7D6fBvJzML4z3kLE'
-             b'GillecVhoa0Ig+3ttPv3Pkbso9XwpAcUHNTdBqDqMjFUYFXdDhzZbdjvwmuN5RVx101poNtQxgIq'
-             b'axLpVYuKKRpYuqUSntsVtxUSutaFYgf5XWEPCTOlnAtAaKhI5pekoPSXjWTwbBNerTeCclFx+StS'
-             b'7SPaQJxnFcdS2jTkbPAsU6mIIGTmRq3M8MOQXMT+CJDVZO55rSILkswPRXptTVC6iThI+kkGVCA/'
-             b'eJQVD19TBpV1GRYRBpteiuJNeaVqIKfYaAGPgTltVGF5aQEW5mcID0R+T6HnIypAkQ2lND2MLEIr'
-             b'NHiZSbOBSsnD7za4TcvHhEqj7jU+e/KsC1BPu0DllXu+dGeiWlNIGYHPGQUkMtVnlOCcINBK8HGW'
-             b'KnWo5DonXvH6n3jrVde/8HPW3dM4npLDLK11tILU/98DFztUS11x1XPfNzi05qkvffIjfz5z4uiO'
-             b'nva8W23qUG8gfy1Pi5ENjV8uxRgZAI0T6iYjhMCfxx1azS2mhx73sxYX7doOPV0dBKMUCwJjo9SX'
-             b'at6pzUjNY1NfTPVwxzl26lno7uuH3v5VhCgicayIAWT+S0friljuMoHsEHl0RoDNXoWos9/UoZ+m'
-             b'sjYNANx0Brbp8Aw+sX6PdUxNCw9x4KTMyLM8lrOyVHsyBg1oc4Ym0/zedFLOP2Wlno5zLS5AoJts'
-             b'sT2BbuXl33iaZELH6aTYk4c1PfH9DBUgrnalXJoN9UR8oTOlPyzNmaAsU0ScANXgIMLwVHFZ5ZKa'
-             b'lI6tjl5fOswyGO+hJWII66eUNWR6oJgh6TRyIuUOy9ib6YBsMiED8sFDraBISNnND7aa6GUW7h0A'
-             b'yIztGu7z+eeLlrQywiTKUzp/hrgCS64pyCnfE1W8qTGcrdO/3M9Ulxdd9jRBUnp6Zh6u9mVoyKL/'
-             b'gRnvgjLMzBKq4EEgGz0J40amMZRHbU1Nz8HTzzwLE5MzLtYlbrPRweMMcdYN1bB+1inrVKgZ3WRY'
-             b'OegduTWLOXKcDc4t16F/3dbHXnnXa9+2enjNA9VqhaszraMVpP5pkQqWyyXYuXvP1zduetePfuxD'
-             b'//1Pjz3y4K1d7lOC7ryYv2txebXCqWG3xNCA9Z8GbVSc1uclEu95/LCcn5yG+fl52LVtK2zauN6X'
-             b'onhxCHOqxveTZJHRImzIuPKmLMlamJmGpcUFGFqzBjq7+qgclWbynmCNrcSNyi/iKqiahGqRGT3V'
-             b'knHp0Dyn3Sir9ySrDFA+aX5zlqaDd6OONAumd0OQykOQntNiLrCOIPbgBrmJ2YaUKQ1nY76vpQNk'
-             b'lQJhophd6L6GgZA18kLfNmyeGPXzkbwkUm2bGZWRBVmZDEqPynY+a/W3g4wCxIxF2QyKh7MNIvaZ'
-             b'2Bshp2MtduE2YLNoABw0u85aLjNmTBEZVhrwXUHgkPWwUOG+JBEJSuCZXydDXRK407D0x/dbxiSi'
-             b'B5bhEiFjjOQaZdSCNlEMno3Zh8wHSc7npd6eUNGo1mB2dormA4O/FkhZLbK8rPQEgylhLF5K+dlw'
-             b'M1axjYkNGw8WtbjPLpaET7ns6cTpM27jiWrSAvfKTBTdWB3Uq0LSAIHZBvpMDFzoweW7Awnd77Pl'
-             b'Guy68vkfvuv1b/6ltnx+fGpyvLW2toLUP7OgolKBVSOjZ9708//xlZ/5yF+/66F7P/fLBZ3maFaD'
-             b'8DgZ0yejgi9M4OEw9sZmLCFsTChcrHNZlVtMDz1xFCampuGi3bugq6PIu3OvWGimRhTFsuKFhUCx'
-             b'RbY093MEL23A9PlzUOpYhMHBNdDW0UkScKLEC8WZFpyogQpPYOyKxrsCscRQYTGLVGixIEjCY5A7'
-             b'LrBdu9A5IItaktfAw5WaeWhEDOedqZxcmjXOi8oyze6/Xv5tuKfk+yNB+acZDIo9rxxkgpAfUtZs'
-             b'3ohCFE6AMpmYzgwIMyHEMFmbZdyZChJLrjXbyvOSqdKVxHTug+HzJ0zaxfeePLCw94GYJG3YUTcJ'
-             b'Empy+W023A69GqxQNM9oeZ2MjtkdZWmRVkGbBCGNQzTBzPAb4mYIJINXnoYeeJM241KroneSgqjo'
-             b'C0ECVviiRWNkL5wJakkuUZK4AR1sTRPmp91mbW4WsAxG72fC8FqTNa6MmCwRdhDUN4lMCsPycaXi'
-             b'dQgmgsaX9vCxx8Yn4aljx2FhseR+v0C+XDJbF1SLouDloWXBVQEraSHD+QtdZd5XlCs1yPcMTt/8'
-             b'mtf++nUvePGfNZoNW3cZVOtoBal/kcOQcstWX/jiW9594Z6LD334fe/506S6sLa7vegWjwo5nxJV'
-             b'IqjadGiYBmlrxhRR7B+86kiHcs35ySn3oVmCXdu3wcYNw5RqYY9MMC/ibqoE34KvLU15Z+fdg0Nu'
-             b'hC6kyyU474Iszlb1DQ65xVrmingWJfjacLZiZLkxQakYLMe5dClkhETmS7SX2xMuKVVh160YcaQy'
-             b'IUZbFYY6o4eOfF/TQoH9HSM29yJG4cFpu8IxSIW+TsJCjOhanPigp736C4NRTolQxGcs+N60JcBl'
-             b'Vc0Sfh8cDPMVMXshqwWmTNACKEEoQ/FQjNShoK6TsGtPOOMB7mmRhBlp7rk89bckSwUd7dSjehJo'
-             b'kDtHSr8qKRgVvtepDDELH04wPiZma5LSZiXjDPYVpUDMRmVjpbjf5BWAJhgkRjKCsSkbBHqUlc24'
-             b'Pynpb4pSTmatwNuSKFg5h4dbpLy7/vV6Bc6fG4NKaYHk+B67paBcKpO3mBceZa1lbFTR8jlRwMu6'
-             b'AfA9rDMOvVgyxMC5tFSGo8ePw9lzk/6+xh6ukXCdcmk0ycx1qTAXZnmTGWFVKrp584tCoUWplkLn'
-             b'yOZHb779rjdfdOne/eg/l6ZpayFtBal/4UDlFgaUqV906WWfvvPHfvLMvZ//1Pvnx56+tB/da9H0'
-             b'UPAxqQ1TlQFCw/NVVA7KiICUzbChaYErwFKlCo889jhMz87Azu1bobO9zbunZrXpVgW+clB1KQli'
-             b'infZDOF0/5vHEopbBAbXjEBHd5+nHYgLMWcQhuXUigUV1qwceoUMUiYHcTetmF6uiCKQC1ot2Y16'
-             b'5ZgJQ4whO1M67FY95YJW5WBfL308T+SAALgla3fwCCry7XELTx65fe6xUFWHARMlw+iRhJEUpd+Y'
-             b'jZAsXeWj3QYAz1b5AVDjp0y9C61OgqxcB5EADuy6P5tN6vPJzIwXeWjOqHxgRvJ5XvsgI9kLhYVm'
-             b'I5jpqVyRei46M/SZRVoRGdstbs16lYa4dYbkTZsKw4PkokoMEk0MSgkLXdj6xNdEQ4DNTIr599X4'
-             b'viQ9h5RTlQ6UcxuyMsXSjjQIaWwghGjOQKVH5Yfgs9m/l6AzzR2tShYXYWL8HJ0L2q1QSdg97jPP'
-             b'HodVfb2QdOWYpJ7BMwVCSiZtk/m8rGV9hk+I1i61WhNOnD4Fz548RUO04jJgm5ZFGSo6GgthPXZa'
-             b'swWM0JO14U3z30RVatVd5wuv3PfXN99x97tc4D1XqSyTuKZ1tILUv9qBVhSj69bt//n/9Ns3ffyD'
-             b'//13H73/a2/sacu5XaB1WVXdtwZS9T2Ecdn9JbDSmlqgli5janryAYoqcNf47OkxmJ6bh90uq1o3'
-             b'OkwLg1iAaMbYgIbQExN30sRmhnlDTUeRsm38zCno6i/D6jVr6UPdzHhdWR7wkowgeqFzoz3aT3ka'
-             b'hUibocnDitgUb0a7epVxW2cmHo3YqOxsPmRGVlhphzJsZCLmuIeWWq7xS2ZjqDyT5Dsg1TnKDvES'
-             b'tHd2+dkil9Xmip38c4kXIKAlvdsAWFLneSCuSbx8HBdlI0gfciPW5BOmGCmEZIdCoZ3wRfj606QJ'
-             b'Rbcxwf4JPj7BA5UfX0Bn27rLXHNtHRRctPYbkwY2yotFosLnhL9ohKQeS7AUdIhUX4NmdRmq5TIH'
-             b'FhM9nCjT8+Lp4CUFMmjN4h3ty12FfIE4f6bRDNMRfu6P3ztlIGs+zNaJGdqJCrb0mu8rEdwYq4N5'
-             b'J3DpT4ScvmfGuYjxaj3FqlDt0id8j2enp6G0OE/vKQ7q4XWquw3AwYOP0jnv3LqVgM3Ur4rmU8E+'
-             b'Q4DMotKDTMlbUt0cVg7cz5w6cw6OP3sK5hbKtMnx9Hu+Z6m3ppn1CEHCL4rAOMBuw7mFqkOm7L5U'
-             b'rkH70MjJW2+/+1cuueyKj+A5L7jNYetoBal/kwNZc21txYnXveUn33zvug2PfuFTH/6tXG2ps6st'
-             b'T4uMoqZ9w0tSUx+8sF+AxoYxNRPYbEp9kVyuEIMKYvvdwoiDhA8dOAxj4+dh544LoLe7yz2Wl0sH'
-             b'5Z8SL6mcHzzlD3VQB0O09MAP2qL74CC0dmjVGujs7SFZtGRNfm6HP7Tsy25EBs1tNwqCMrslTqtW'
-             b'0EE2hB+lMsgnlXDOJx98zTgpk/k5YR+6f9cbfhef8GwYBRJvTGgwI3KLGgYBDD5YOlO5HAV5XJxR'
-             b'wefl/Dyf5RsW3kEYPaJccMA/UQGI702u4IJdbZlWaJyloSwJd9mcfRF01KT0s/Qa3OPjbAtebwx2'
-             b'NFtXbCdMEs5jEW4KOW0Yvmt1v8iiAaILOoqzEizF4nCuzlBAjPsdYxruMWpEwdesfqO+DSS8WPsy'
-             b'Fj53LjgIe9GG5b4hZnXForuXXGA6evQJd3552Lx+I9R5cdcsyjE8aOszjtSXS6XPyOBZE4KWDapI'
-             b'ED81zX5pLH6QCSSRFhru5VkuTZOSzj12aWkB5mamSaGJCky8zrlCQr2h/YcOwuL8Auy75mpm4hkK'
-             b'4gY8QcJwaS3wXSwjy4gnyAIZ7nkiK3Npyc88nRsfp5/L5YV76ctyCc9dCRzSCLg2yOI1oacSJcQV'
-             b'TdQQP95AawBU3Z9NXTSX7nvRh667+Zbf7O3tO4nzbkmutdy2gtS/8YGMLdts2n3X3/hfhzdseOzv'
-             b'PvT+98ycPra7t72NBvdIis4lAUS6mLBPtTFLoQ9v1qQwyp59xSVHH+7T58ZhcmbW7S63wKYN6+kD'
-             b'gDtkku8aj4exoX2dsTtXApuFYDdedItWs1mF82dPQW+5H4bWjJDIoCklRR0JF1p2xJnZEMtDNipr'
-             b'AQ4Q7EcI3EnW2bJeaT6/lT0D6eV4AYqleS/gjBKwTIYVVFJR5hhS7h1MMXNsNmvMVVNQXW64BckF'
-             b'K5ep5HLtzMNLfasHsTcY8Yn95x67VveLESro0pRLRwmV5ahXheEAs6Jqk/oj+HXZqZPJHeRAhjkT'
-             b'Fo3jQoslRuoN4rkTU68eLdUxYIriEDwSCcu3SMrAbIoyHTzfZkMqVyDmFDSnxXMA8t7gtSpQqdG9'
-             b'slxUNGIvhwKl2xCdOfE0HHj4ETj29NNw96te40UkMrPH5HUhUUg7xWSt3jkgUO9LQ4CtevEHxAxe'
-             b'+URSW8VqSVGD+vveB04vITfu8zI9NQF1DMA0C5XQY3V0tLt7exoe3H+AVK4b149Cf38PBQKi7UOT'
-             b'ez8RaGWUhEQdB8QND4i7zwYGkGMuczp+8gxUa3XKnIi+AqIkTIKQRsRMXp2pIyvQwxS9mlRzlss0'
-             b'DHweFCPh7FN7/5qTt73yx9512ZVXfLTuNk64gdG6tdS2gtT3yYELBJb/tu/ac+/bf/k3X/T5j/7V'
-             b'Hzx+39dfXcy5XSKVFHwvyvDgFEm8tbSTeQhxhW8phAFTqu8zISAptEHVZVCHn3waxiam4cKdW2HV'
-             b'QB8HlozFg7KZQgXbDaQ29MdmZuZgenYWLrxwJwXSudlJaLgP1sDqEbfIt7GtfRQmGCnhaBMkzFn5'
-             b't5EzUTaqqnCJbSIbLQ45E21A+Z2xDqaM/hGOPnUUuju7YGhogCCcmFFYHvTEfoEyhh1kc17wAdEt'
-             b'N21UKCPC7KjRWAZdLZPdPVIf6u45i9R4z/kFli59LvSRsOxDr6BWcf/G2ZYC2lC57KdBHkGWhn15'
-             b'3ijx3Dik22PJroiA11qVYals44E+RuStVadZOsyoDQWkKt8HXuSSmjrPWBkWqsSx2ugLJu0l1l5i'
-             b'hsylzxzLvROmoKChJP69tLQEJ545Do89fhjOnTlH3Lnn7dsHGzZudN8rR5sOZSNNXuT1LAv3dPzo'
-             b'1RTnvlUo6foWVHZmSQbETWBnKR7mM/z6cC5obmrSvbc1T/bnGau2Yh4mJ6dg/4GDUHGLOxLd14+O'
-             b'spyDGYAqO2quoq07wjeM2MW7p3bZGAbM02fOw9PPPgsLpQrR8BXKylUzI2FXnCWm4d+hu4UlTMNC'
-             b'C463yNpLiervQc04zF13z1uuW9h08ZWfuvUVr/m/Vg+PHK9WKsGOp3W0gtT33YE74zWj68+98Wff'
-             b'+Zr7dl/yla/8/cd/ozw7vqHLLZLkhou7ZjGUE6EAffhysWSmxJ3VhMn4YLAn7rfu6xOzczD/8H7Y'
-             b'6D7Mu3ZsdwtmkZr5VL9PogrQZoZ7JJPp7u+lAeL5xRLsvXQPdLpdLFpnYAN/dMNmWqgDQClkeBAs'
-             b'RUilZiQnyJR/pEfGA69eRq1ofgl/0iu6beQpKEPy61yhCAsuaH70I39DlO/tO3bAru07CCWEWhPs'
-             b'DRFMgGaEvKABcklAOlFvjm14cdjSL2VNqKFc272G2vISoYoSpgdoJFgjMQKvGWKGlLfLyCXsture'
-             b'q3Z3TVAggxmeTWWmx2Uv+RyV4wrYU8Hv5/IuC6rh8BV9v1Fd9plRfRmaOISKIwT8vkfSlQoCAhXs'
-             b'LTwayb/Pwv+INkYJZzaS1YIMiipfkps+PwFHn3yCsqaZ6Vl6b3DzsmXLFnju8/dBpV6JMnu2VAlA'
-             b'1aBYU5n7RgZi/b0YkEh8D9D1YJdpzdm6T8Iycm/eGGHpteSyo7m5KQrMQJsEvzlp7+iAsXPnYb/L'
-             b'oNDpGEugA/19sHr1kB8NYOyRBtmACXGEKfOY8eK1Tfy/xyen4YlnnoXpuQXvwIxsveDuHC1tlBUz'
-             b'dz7HjCmonwbWKyod0ovKkfdZDhYqDSj2rz59112v/Z0du/f8pbvWTRxT0bq1DraC1Pf5gXVotH++'
-             b'9PKrPrhu3cZv3/ulz/36kwcfem0BlV6gV8xUSi1MQRyGFXqrKPKCpihT7qGyWi5HAenYidMwOT3n'
-             b'FvUtLmCN0GKeslWHWNWLEaIPpIaUgps2rSdX0aX7H4C9F+2BkTWDtChPjJ2FkXUbfd1fZ/E6wMOr'
-             b'vMtUWX9TExcniDJ7q3Jh922Ze2eYQyglTZr/qTbhOZddBqdOn4BHjzwO58b8orX9gm2we89OGF6z'
-             b'ihYczAYx20F8lAYMOhAWFxFYEQeuyRJi7bNQfP5mw5DMmQxESFCQg5r2CjM/c5mQUlCjuAKRsMse'
-             b'I1RdNj6BpN6YIgWnkLQx+BiaX2pSeY2ufMr2ImQGaUMmECX4kBGKRCdfafIHa5HM0LT8Uo7LuZjR'
-             b'Yb+s5rK/Z1y2cOzYMXj25AmXzVdokcf+E5Lkh9cMwy0vvcULRJomiBsErBv8hTkQBSl5mlHrQSTo'
-             b'S/AxYejXhHGIgEZSwABen3liJjLvsqelhVnapOAC32RxA5a/J86PwSOPHHRbCqS3IJnEwOhal9HT'
-             b'tZaeImSqDlLak6F5IIn/9Ow8HDt+HMYnpqlci70myj7xMcjni+fcdErXyDKvLw3avSiIkM+b1742'
-             b'SQTlrio9P1YyKk1ln3PjSz50xb5rf3Pnjj0nJsbHiDCRL7aW1laQ+ndykEy9WoWurq7jd732ja87'
-             b'vOvir3z50x/57dLM+LrOYp5l3+y4pLz822TVbqJmDR+g7EwRU5pT70WD5Y2F5TI8cvgIjE1MwM4d'
-             b'26Cnq4u8rDwvDUJwk54O9kFG166BU24Hu7hUgocPPAo7tm2CLZs2QKVcgjEXLFav30glM5mNEWVG'
-             b'lppklZDVxZPJhswJMtRsX+pj48QEghyba6We9uC+/oIX3AizLqOanptzC24VHnr4EXjcBa2NG9bB'
-             b'ju3bYcOGjdDT3c1Ud29VgQuyzM4aJqlLkTNh9JCnfJvQHKfeU876LMywEqzJVR9bCg1+T7xIA+Gc'
-             b'ckATrToCPSHIun2ZR7PrL3XCWGAghpTRVNJGC3TesNDuPk1ZJo4ZccqydN+7wV08im/mpqbh5LOn'
-             b'4NhTR2FicpwyJsRftbd1Ukmx7oLXwMAQvPSlt0KH25DUULAjMoNgSMv9FqaLQ7A0h2guKe80W1uI'
-             b'BxRk5vDoHDMiUBJ5kAgogbrLKmdcgEqpvMdZtTGsStU0D7h//yMuaBkSouD3erq7YHh4FT+g9u+d'
-             b'kTm8+KnQeU3nNO4e46mnT8C4uyYNdx2ItZd1zuaTUcFtW0eVkQyvQ2YvpkwAI3tLFxVYi6V6Cv2j'
-             b'Ww6+8lU/9u7nXH3V58bOnSYazQ+btXsrSP2Alf8wWF36nCv+anjtyANf/PTHfu/44f23d7cn3k8G'
-             b'd7jkH+NZZtiLAZE9cLlMel7EASN1hA4BDldWXBDzukAfsvOTMzC/UIL1LqPavHGdW7TaXEBqeswO'
-             b'y3Ol04SN6o3r17nM5ShU3O7w4OPHXMCqwMU7t7nXvEwy9dVr15GcmtTVOvLVog0Hu/JKpNLsKxXK'
-             b'jLHT5oGeTG4XqyXmEGJZB3tQXe41vey22+ATn/4kzM8uQkdnO2V+Tz71NDx9/CT09fXDBRdshq1b'
-             b't8La4RHo6i56M0X00zWKZcHCSPRNegpoqWdqADvdElrI1HmxykX7cAST2qaXuKM6k/bk0i+yft/t'
-             b'1dQhwIZ5JjCxZJTtFUFMYHTwGAqpKT+W3wRoVvgpthfR7CuGr2VpfgbOnj3H2cI4lN3iiD9TyLe5'
-             b'BZuJ/Nbbyg+vXgO33nYrdPf1umyrRou9sRkDQmuD2jM40bLjsE1U2AQRO5EHnOnValG8QQbHpaLj'
-             b'LQ8U47kjFHZqaoJm3mimDd+fxG+a8i4FXlpahEcOHYA63lwJbybcPbJmaAi62jsAB1+Jwm5jeRHY'
-             b'lRkzp6XFEpw4fRqePX3W/ayBAiormyn3epn8YVjJo1j8wzpF2V2FEV8mkmAGbupNysJ0GCYHKFXq'
-             b'kOa7lq5+8W3ve85Vz/2DjZu3TGPF5IfdmLAVpH6ADmwY9/X1HXvFj735zsP79771m/d85t1Li1Nr'
-             b'e9oLVCZKGVAqQcraKPe14qTLRHUiH4Dgh7jcpoQlpt2uuQFPPXsCzoydh+1bN8PoyDBRDbCvYwRw'
-             b'g9J49yHbtH4Ezp47B9MLi+Qo+8zJ0/RBvXj3djCVsgtUJ2HNug0uUHWyZM/wzAxEi3mAYKZIZpDk'
-             b'BSRLcMI+VCn3PSLVXDIIy4ETCRO44+7v6YZbbn4JfOazn4VSqQKFQpF25bhYLZVKcPDQo3DkyBFY'
-             b'NTTogtUFsHnzVli1ejW00XxU9CHyYyzaC0ayEFrFsFrvQ49dpGDhTbJ35fFP3sXWZIC4PPhrYuZD'
-             b'XzU20i+UCtoSI0BYzfmGiqKI4DCubCBF4IElsAJlDClUK1WYHJ+Ac2On4bx7LydcllxB910sPOVd'
-             b'cELZtohweLAWFWybtmyBm256EXR2dUIJHWQTYT2mmfKiR3RRb4oVfErGCbhvabiBZiA664rTLmT6'
-             b'ZfQv9lmjIfVmHaamp2C5tBgHwAXDxEKVhYUll70fgCoFhDzvn5CFmXP364g3SdQqFPhANh3u/pp3'
-             b'9+rJ02dg/PwkNNx1wiFtH8j9jFXk6XliRCiz2kj3N6G/qmOgYsPMugt4OfdZKbj7seyup8l12O1X'
-             b'/chHX3rXa/9w1Zrhg+NjZwHFEZ25ztbC1gpSP1gH1qxT07RXPXffX2zeseub93z+U791/MCDL+90'
-             b'WVB7Z576C1R+YTmRkd0rxF27CZUJlisoFUCrSnmJM830uB32sgtC+w8/BqfOnocdLvMY6uumpnMq'
-             b'Fgl8I2xcNwrTswveTqmQh5PnJ0jBdNnFF5LR4LkTJ2DYZVQdPb00P6QyYNqgiFKMzskM3ofSZVNK'
-             b'Kj7ApalM7dvgs6V5McQFpOGec3TNapdR3Qqf/ewXXMawTDbpeWYT0sLiHmdmZh4mJ74Ljxx4BFav'
-             b'WgNbtmyFdS6grhkehraODj/rRcovD0/1tiUmQHBtxn1VyXQyG/UFdA/JjnmQOU6ahf6OshlHW+OF'
-             b'EF7d6OX+3h7FhMXQet946svQgG8OCdk5GiDFEizOBk1OjcMpd83PnhuD6ek59140aCHGgVS0LPe9'
-             b'MC/LpnIm2YtY6k9eculeeP61+1xmlYeKW2Dx92JT02TsMiwJPaIhn9hV+H5jlo6hhT4i/xPEI4gU'
-             b'XTyfsH9XhrnJCWg0GwAZI3Vk8uEmCsuVi0tL8MDDB9xmqkk9QPxcJFyOXTW8Frq7O6nvZ4yvHhDZ'
-             b'32X601NTcPb8eSrvNdwbW+BzS43Yh6Sh1xdsYpjq7wWH7IcFEatk+Nw1b1gSF/zRibvqru9cxb2e'
-             b'DbsO3fDS235z9yV7P41uyXOzsy2sUStI/WAf+MGhrKq/76nXvPkn7zqw+7I3fvlTH3l3ZWlqY1db'
-             b'wpY/HrqaFUvwSsEgWEUfSP9BjMIGywIJDAKiIEPV3PjULIyPT8KWjRtg+wVboN1lb1jO85tODetc'
-             b'pnXy9BjMLC54coJ7nHNuB9/mFrrdF26nBeacy6hWj6yH/qHVvn/AViOe9i0uxew/pTIcPiEhiOpX'
-             b'+gDWRslytnSGj+meF32jhletgjtuvw0+/4UvkGS+s7OT5MKerJEj2gTJzt2iccZlg6dOnSIl3uDQ'
-             b'EKxfvxHWb9gAA0OroKu7lyTN1I/SEHbthn2p6E9+bV5EwX2Z1AjNKQYk8ODchJ1jFS/kCmwoHxk+'
-             b'L0+ZSLm35SXYimeC8Jqin1V5Zgnm5+ZcsHWL7/kxmJqZhvLyMosOcpR15POd3OdscL8t+mDitW8S'
-             b'mknB9ddeC5fsvZSEKFiG8jNAJhMqFJMgfGdMeHYmY/ComIRO/UUG44pnorKBn0/2KZrzHCy91V0G'
-             b'PDsxDghO9beVzwalRIcnhAEADSkfePggLJbLlLkbpHHga8lrMotcPzpM18ZjqBSpTScnp+HkmXMw'
-             b't7jE8u+EgldDGFlgg6kmmXLic+F8nrAIA6lepBG+JCiMRE/ht6FPtliuQa5v9cT1L73pPdfd+MI/'
-             b'KxaLLvGbh56u7tYC1gpSP0RZVdMPJl5x9TUf2Hnhhd/64mc/9ltPHbjv7nbcbZLtB+5gm7F5rCAs'
-             b'7kpl1XGKnE3DCC+WMpq8kDOOhozcchqePnEWzk/MwtZNG2DThmFa2NCCG3e3aGU/+9hCeFycA8IM'
-             b'DBebvZdcSLvd6fExt7DWyVCRSAmSzdEHXjPyyAZOmrgJ0+IXSOkZ/wvNZTkDMQNja3ecY8JXssYF'
-             b'qpffeTvc85WvwqmTZ6CtWOTeizAMGSyKu2rMIN2/Z2dm3cI2AQcOPEwEiC6cvVq9Bvr70aJ9EPoG'
-             b'+qGro8sFvQ42KMxzgGL5vJgqJgJTtUHK751YU5aLKwIKq8CP8903Y3wQRAUiBlsswVWXa7BUWoKF'
-             b'+TmXLc3DAv59YQFKi4vkLEzZFjvC5olFyKU2VA6aaAcvpSrN0RMX8fb2Nrjxxutg566dLgut+Owo'
-             b'yfSRwgyQFfog+TsRKR2i8aGQQiQzNjK4raVsqwLoN2HUFy7qy6USzEyPeTFKFlxvBJpuqJQ77TLf'
-             b'/QcOw1KFZ6RI2GPJjw3LlmuHh2CVe29Q/IDwVyxxTmLvzf28FRk5IrwaqQ+WWvH7BoHQEoORYXsO'
-             b'hjtrXxZVLPvnqJsxWMy5zLMJJt+Rbr3ymo+95I67//Pq4TVHay6YouK1dbSC1A9vVoVk8t7e4y9/'
-             b'3Ztec//GLfc+8q2v/2p9cXpjMecWoGUMIDqUznChMMoHH9qdpyKu0Myc4/KU9E2sYeIz1uhRluxr'
-             b'7AcePwonzpyFLVs2wujIavpkj46sguMnO2Eem/G5JMzhIOusq6cLtm3eSDy+8uI8PS8u+rm2AkmJ'
-             b'iXuXpUNDzD7CIpCwjXkghvvSpbZ+5idVnIlZb0hoiLeWJ84gqvlQTHHffffBwYOH/JVIRNZtGQwL'
-             b'AeWDd3cOxQRUckth0e2CZ+dnOWYqku4X8kXopEDVBp3dXS74tUOxvQjt7k80sMTeCF77fK5I50fe'
-             b'QInPjoiQbT3SqemCUMVlpVgWrVfrsFxZhlKpTAO0aF1fXi5T5ozfRwdg7Pd5l18Pz9VUYsp7UC+W'
-             b'4tgLTItYhlMm2mhgY5+xQ5htIE5pw8gIXHnlFbBxy2ZAyoEXQXCPSBJacT8UaTVotjrnIWKtWNDB'
-             b'wg8NoQwrc0iGfbe8/D0ipuZmpmBxbtpTNbT0dnzpU7MbNG54ZmYX4bv7D7uAU/UqPprv8rJ/FGog'
-             b'Jml07TqYmpqGE6dOw8T0rAvADfJr09qzHq2N/TtCLUESNw8C5JVergpQLu7pshrTyPnzsDEO5DbQ'
-             b'rdnA1gv3fv3am2//w6279nyxWa3SZ9Py5qF1tILUD31WVWtWzBXX7Psfl+y9+qv3fvlzv3zo2/e8'
-             b'MV83uc7E9ziEfSaLf8P4WnuhmGf7jFywkvdWFXlaTMMIjlWBKqp1HmZLFZg//ITLlsZg5wUbKFjt'
-             b'cjvx+x54iHa9ivslxmVpR558Cro72kkxiEq7arUEE+N1GFyNJHVm/klA4vKKNSI0sKE0JY1zxRmf'
-             b'zEnJa5RMDA0K8ajLDtZllDm3SN9www2wecsWuPer98Lc7Lw79wKt5lo07bnAtQiLEEJ6cZ6oyCZ4'
-             b'lGAiMoiC1xzMzwttIQUZ7Uw5UwLG5lCmShmev7aR6q486QO7fKkJ5G0KmrSIK4LeKlaWoTS6UOQS'
-             b'qNJhfo0LkGAa4nPF+B2tw1C04YWZ5szqCLYtwEUX7XFZ8SYYHBpkPmT8HRBElrU8T+uzQG3jiIMY'
-             b'UWYaORD+SSoKdm8m9JOMHjCZ3j3f9MQYjStg0LJGsn2W4Cd+OBoD8MzcIjx44DG3QWp6ZaX2Vhmh'
-             b'F4aZe6EATz3zLMy77BLvJywFomCG1IM8aC3CFJXYaEAZXCmtz/IgjkbgY9eqNYBgDeJ7kClR7D1w'
-             b'uNxoQKF7YOL6W2/9/X3XXvfe3oHV9dJy1ZdLc0lrcWoFqdaRPapuFz44uPrk3W9869suuew5n/jq'
-             b'Zz7x2+eOPXYFytW9ZTrP27gFEDMJUjOFSSq/mFmmlqvQz/IgUi8Hb/rsAxdMZP65L01MzcHs7ByM'
-             b'rlsDF+7Y4f4chcnxKfZCSv0Uvwt4jx85SjX5/oFeSFL/eDOTE1Cr18ifClVUND9LkFhDduaU3XEZ'
-             b'kACgvIia1EZdhZKegnf3JZ8+LfC/6DqLmVWzVoGNmzfAnXfeAd/8xjfh+IlnyauK5mKSSP5WGdnG'
-             b'CtQUkw7wIFUyZgS5fGTp8QBq3gLbQvBcmorur9HDkmeHuM+Ev0QmjOLJJaemhVoAQTUXCA0ZMC+R'
-             b'I9CiQgZ/KTvlJzR+ABtLh4nbnKxfOww7dl4AA309dL2QVWilIcZybQHHWlbXWa6p6kD6iIKXkDXJ'
-             b'RkLFHmKwO+RMuejOd6m0CAtzM9CoLTPE17ALtYnGi0gSSTiDeviAyyhr9LM5yNN9LH5kli3Xqy6Y'
-             b'LLssC68lvkUpEzHo3FVUF/ojoTEB1iCGma4w7M7D0IZnuXTGVl4mvksV9/ttnZVLr9334Ztuu/2P'
-             b'2to6nkThCo6LtGaeWkGqdfxvsqrGchN27LrwKxds/9WH7/3i53/hoW98+Weri7O9OASspC9F3kmR'
-             b'XqB4lsUG1R2EXbkMJlojRoW8UOK8Cu/0z5yZgNmZBehzmZFOciwdTkJprVavw8GDh+H5+64hlZnl'
-             b'0g9SBHC32j+0imjtJqy7wT83DK6SSI5hpEJsiJAavz5rG5ciqzLDwMzoa9Tq0NvbA7e+7FY4fvw4'
-             b'HNj/CExOTVFDHcuDCVtThBKP4QU/2I4YEHGWX8hT+r4PnFwaojQmiZ5LtMDnOADZsMBnB5zZsjL2'
-             b'gBgPJQAolYnLJKgImUnWSl6FOR75Fr4+GlB157V2qA82bdxEWS+pCN3voJKRAq0JgB8Qwb0P8CL/'
-             b'9+Vbw4KEgLkKnSorLbjQOwzAVhR95HwQmx4fh1Jpge3fEy8VVxDMKS3fn5iNz88vwQMPPQLLOKel'
-             b'kxVOvd4OQzGwFkIWaENc1NTzC9HeipMzly8VX1Me9BX6vhDZ5YZCOrnv0/rSH2ZJur27euEVV/z9'
-             b'c69/wXs2bN78AJLip6enST3aOlpBqnX8Iw/c0bW1t8/f9LK7fu3Ka2/89D984m/f9eSB+17enjRV'
-             b'G36YEVjKnkwB8MqusSAeTiZon7ycV1RMkqloFcZHcO6m0UhhanaG+gBBao1KvlRTX2GpXIZDhx+F'
-             b'y5+zNyCQ8GNddxngxJkz0Ds0CF09vQHkpCEj25ZBTJYFe41zwqUnxTb07AvEpb9UHOukgc+quSZL'
-             b'u7dt3w793d1wfvy8C7JnYOz8eai4gEnOt7kcM/qC8JsDpg4Zjcc1+aFda3RY3IIAhbMiLKVixkYO'
-             b'v0HCbDNW5BxolORuTNAWXydxMgxOspz9culQCZtR2eDiixJzfM96ujpcptoPa4fXwFD/AKn9kOyN'
-             b'AWdozSghnCRDVUxHwPU8hZXECDEpDPz9kCmx51jwhmGiBr92RbJx7TZOFZidnnSbhJLvB1IZ1IQg'
-             b'knAIRm8ptNuYnpqFhx551AeFpBgEOTKMazOzYaGHabNcQ3ldlr3LGLtlIqFcgQ0ByydSPlBqm2ES'
-             b'AsrXm+51NEG1ddcvuPyKT1+z7/r3XHjJpd/FOcFqBX2lWj2nVpBqHf9HB+JxkB6wbv2Gg698w1tf'
-             b'ceQ5V97+7a98/tfGn3ni0p4Ey1yaFwodpb7hUx/31Cq4uKqQtSg2ywMpABEhIeedViESrBXvTHHB'
-             b'xv7C+YkpOPLEUdhz0R5vTGjZrt3tqGcnx6G+vAx9Q0OQFPKUsVjZGgfWGoD4SIEVp9/I/w6ZWFCJ'
-             b'mdhj4jKV4uylWUcWXwNWDw7AmlUDUF7eDlNucRwbnySFn6HFHIgHp9ml2Je9WL1nFJdCVUAD+aFb'
-             b'lclmhEVu4zUO1vQQIMDC5vZGkCb02PhsA6UhZJccgBUPYgNntg1UfboAizM569aOwpo1A9CO2YD1'
-             b'A9IkiMkVYHDVMLR1dbJKlIOc5lkwvk58ij47lQwKvGrPSJ9GhbQ2M4Mnoglv+D47NQnLiwv0HhOg'
-             b'NrxT/jwQCSWoroK7R9BK5sH9h6jER2MCKpZeiQ5ifQkOg3AiCsOMnbzl94d6UZyVZzcHIYhmKoD+'
-             b'LdPcwwo7Dag0LFShCDuu3veZy6/Z93+Prl//HTwDBMH6km7raAWp1vFPLwE26vSh2n3x3k9v27Xn'
-             b'6w9/52s/8+0vfPoXl2Ynens728i8LiGjNuMb/TbmDkpYZVat2F1CdLbnBrrY1kdFF7DzlZS46Dtu'
-             b'AUX1VUd7J2y9YAup0Szzz/IucJaX5mC5vAQDa4ahw2U5JKG20bU0GrZDLFUGoK6fqUoDjJV318oL'
-             b'DaKbgpdP4xLW6xbz2alxep1txQ7YuKmbLCmWFkowMzkJE26BnV9aIBm4rw4pbl14arvPMlNPVscs'
-             b'wMZBaZXJ3mxQyTHoiOt3WkGklSsTPbhA1n5DpS0lvS3uFyrPqg0+TlhqQsbekMuaRkZGoK+3l7Im'
-             b'GkTGHg5nW6l77lXDI1DsaKd5KB34UjZy6oIXmQrPKyIVI4aHCbvKgp+3U2L/zoR1zNBrLsuYn5mm'
-             b'XqBiObfhYeqQFTLXDh8LhSxzc/Owf/9B9m7KheySLN1NlOvLtfBzz4zVYusN6eHx9IKw3wMIV2d4'
-             b'h4a/Q9eH7gn/rRqyM90Jrdt18TdveMkd/2Xnrt2fGz97hsQ4WBJuby0rrSDVOv4FSoA1bD7r+Rtf'
-             b'fMt/3rbroi/d89m/+7WnDz50S65RgfbEfShxMDKXZxl3juXpiXc0lYl8zhoiZSDlElvsoyip91sb'
-             b'Fwnr54W09gTxJ598itRPmzZt9Hb3MoNDLuo1mB4/C53LvdDbO0DqL2MzgUfFxVOa9tlSm4JYjlT8'
-             b'85Yl0MClOEkWO7p6SXBSc4GR4LJN/yCIBOrp2QKbtmyEhaVFmJmdhYkJF7DmFqgElbJ83yo/jOpN'
-             b'+Qw0uL8UehzAfR0t6CNmybEIgf5Og9aJRy4ZCBgfKj1pP1CrGaxKzmE4kIqnl8+569MNg4NDMNjf'
-             b'5wJTDxRd1uQhs9abaXJJkq6TC1qDQxiguv3AK0TJvzwlvUbjBQmKe5SxMmnDOYtpn5IAJv0i5QkP'
-             b'i3MzJI7AUqTmXo3McoVgzZFFJ5ZKxDPu5x86cAiqDW8uaN0y4/uklnujlunuEMq8ErBsCHoJXcsE'
-             b'lak8TgEc2PD8UJaesAW97y8af38p38NquHMv1ZuwanTDY9f96M3/5fJ91/5td09vveE2eeic3LLR'
-             b'aAWp1vEvXQJ0H9zKchk2bNr88Jt+5p23Hnjgvlu/85UvvPPMU4ef25YUaUfuydssQzPSifAKOaII'
-             b'WBWM74LRt8oYvkFGgMHlQGXFS5iDnFsYHj3yBP1904ZRyvaC7Tv+LW3AwswkVF0Ws8plVfli0Xsl'
-             b'KV9Ck/5QJKepFUR1CN4+DBblDEgCh0BCMSNCCsZE3WVK9Tr3ZPygr4fAG+jubIferlGyMUGy+tzc'
-             b'IkzPzMDc/AKRD1CMgagbLyjJefht6PL7vxFwVsjtbDciAdxP1zajUg8k6/IIJOmRFd1/nZ04XNzu'
-             b'Amg3dLtAigPFhVwxIIdowFWFFIJNJNHssh0GVq2Bts5Oksj7wApBqACZ8mIk60lMV9k0NmReSlyc'
-             b'WbmAknUkQExMTVAWRQIP5ckRYQbOyP/zDrcYqArFBKZc1vrIoUPEFkTkk2WRTDSiWQnVjWb00YoE'
-             b'jRwVUzLEGZhGA2hGTHqrPm9Fw0eieLhA7y4OLFdqsOy+t27b7vtftO+Gv7x4795PNeq1ecz0sb+r'
-             b'Woq9VpBqHf+6BxKicZ3ctnPXZzZs3vyVp5488tavf/bvfn5h7NTG7vaC25HnyIgv0M9Fih2wRCpM'
-             b'5MuXtch5leafka/pYMWRsoWFX+Q0HH7sMcjnExgdXkU+WpoXcFp+3A67USvD+LnT0NM3AD39g37X'
-             b'LB5aKphdcKCEIE+3SfTCsmxfb9lyY0UvCF94rgADQ2thZhI9faouixQhBmdp6IKLr8tlH21uQR0Z'
-             b'HoC17j+cx6rWkARRdsFrGRbK+GcDKrUKkTVwBgrLbcAzOUbAscihS8Tby/fX8AOVKL9oYkBqL+Qp'
-             b'IHV0dRPdAkt5ODiMGQf1yKTMiFijZt0XEdkh2NpIhsfH7+juhf5BVPElxE6kZ8NArL1kXokLrvWI'
-             b'KlARSsy7E05f1IpsxnAWS/NkLhiWF+ZhfnaKGIIkrUfTRGOiAEZko2LVgSVe996Pj0/AgcOPQbnS'
-             b'oHKzsZq5k15GnqY2/Krh9y2UnAG4xwQrMupmCKQ6lC8xo2vr7vAoC+Ov02LVvdZ8e23T3iu+cdnz'
-             b'r/+LrVu3fz6fz9WxkrDkzqfgrn3raAWp1vFvdOCHlIcVl5933Y3v2bVrz99/91tf+7kHvnbPG6rl'
-             b'2b6OfEJkg0bTilN9kKNLGS1kJZAptUkZSBkuY0U7+1QyCuPFAbhePHLoMcjtvRgGB3oJ/BncuaUG'
-             b'5bKqeZdVYa+qp38AOjq7o9pOpO4ZUG0oB+o46RRmjQBYdGEDMgozRLQTQVuRWcwCqiXvVssLYxrM'
-             b'Bn2AxKwJey5YcmsvogdTv3uYQdrJk6oQbe6aKZkkpuTNVKdZoAaXNYWuQJxD1DEQwSJPjr34d6Is'
-             b'5JLg4OrRVSn3uvxFCxgfrVdkjFQdpIFiS3bnve569fQMUt8rtRlpuogWtIQQGy0tJJpmYb+snBTa'
-             b'uwXpX6ZQWVqC0sICVF2gxkCQ5Pw9YawK1iIiF/VeTP7+QGNPtA45/PgTUG826dxT3qCQHML6ewU3'
-             b'DfKaUCWpZMQ7zC3FcQTL5UqlshL42G9LPZUKStUmdK0anrjq+ud9/LKrnvc3G7Ze8HClVrVVdy6s'
-             b'jG0tEK0g1Tq+n4JVxS0w3d3dp+583Rt//prrbvyf37rnCz+9/zv33t0oLfZ04rBnWufeSI7l6p48'
-             b'LmUiJTvvzGyKtay4CkM+3qqddrqp4T6WhuVaAx468Cg8Z++FMNDXRwsf9YdwaJh6HCktOvVaCWam'
-             b'akRH6Ont83M7hmG5ScLUAh0ViGqlfblXwulgSAjC7rOJr7gVii5QjcK0y6hwsQqLHvbdrAmBNpfI'
-             b'PI4JIgfbSFmFpkiSXECH1bzw/LqiWyvEgI8yNRIbfM98jQrEdeUHXbmNRlZgsaYaMx0VRwGMJD75'
-             b'Nuhf5e1HqH/G4gY2SPJKNiMWFiZmX2woaANGSIUSn5UMi58bS3pzs5MeCmuZViFF4KwaU3t5vgz7'
-             b'4gXAwdwTp87Ao0886eeuEx3JIZkMTfM9ZBLDmCeyxgWAlaaRFNDoOSJpXkQtnoSuyRG3DnnoG9lw'
-             b'7MZrrv2Au88/OjQweLK+XCElLDL2WoO4rSDVOr6PD1R7VSrLMLx27WOveuPbfvz5N9/y3ns//7mf'
-             b'OfzAt+6uzCx1dbiFBUlCiqf9PalbSm+KmuQKIi2B20estZPyjF9scEeOAl4qe7lsYd5ldN898Dhc'
-             b'cfFuGB7sAdtEi24efNV+JkjzgOz8zBSUXBDp7R+Ezs4+2hk3jWQRijUTSuY3g9uvLLhU1lJ+3koJ'
-             b'HFWGxdxiObhqBObdayLZdFpj5aON0nYpLSU+I9OkarQxu5GsS2dk5wmXMa2AVTMBRmbO5HWgGMNw'
-             b'cIU4sJbjWSrDIgJrRJvG1iEYClwa09XXD339/fS9tMmMcttg40i/mRAKvQgLdFDPxS6fZFOiyMb/'
-             b'xLNrZmYGyksLdA1DbMrwFkEs2iGipsQAEK1gnnrmJBw99owPTAlm68gdBD9zJNw8tnenAGtkQ5QG'
-             b'hZ+3NNFBNQjsSUZklRzfn+jpVHEbLBe0Rzbu+NbVN77wgxc958rPJDqZxZk8FM2gH1tSKLYWgFaQ'
-             b'ah3/fvpVDai7ILF2dOOjd7/xLW+9et91f/7te+95+5GHv3vH/OJMfw/y/gzOGDUhn2OEjdYh8zC8'
-             b'oJDSC72OIIPO0YrhrzlfgkLlIA2+5GGp0oAHHjkMV122m+gIKAIQmTIZ7HGtCtkNOMNEpbnlKvQN'
-             b'rGJhhVTwOFBlBmEsu+5mh4MV98r8AKqfwWmSHF9D/+AqaG9vh8XpCZfBlam/pNjfXPHvG2BadxAT'
-             b'QHa1Do+vfLIX5O+Km/qCqqNsIPE4oOhSoiKOSagX7FUls2ASFJqAludt0NbeAT0Dg5AvtDEGy4QM'
-             b'TNRsnsrA10BBUBxawQjZHLEOQ8+Hz4vmm5p1WJpbhPn5GRf86lBgg8AUTHDrjZbrJiK3qPfn3jed'
-             b'0Mbk8ONPwomTZ6iolzCxnwInZ1NaZ3CA1s/Y4S+SDxO9pU2eqzK0saISofHZmJYst2GgUq+BKnSY'
-             b'LZdefc9lVz3vzzdu3PSF1SMjTeueAOnxbR0t08FWkGod/86DVZ1IzqtXDx949Zt/8i1PP/e63z/0'
-             b'8AM/e+i+b7yuPHWut6+9CILK05nsoGkatNDrJCrvQGU6V1KasiqUwMhjyS3ElUYTvvvIEbj6sj0w'
-             b'sqqfRAueTi32CElw8cXHXSrNu8WoQlil9q7+KJSgW1RmvVSGUiDIWsO9MeudxwNJl4GxLvLki20w'
-             b'NLzWBcISLLElRt09l2bCheY8wXA5U+Z2FcigsaRdWZWaiExUJvMCPkeVrZb60iCWNKXvxGo571zs'
-             b'WYHondXb6zLKrl6ieniCfRpwUYak5p5/SBgiiFgpUmvK5oEQVj57QeK9zMhhaRPl6kivX5idgjrK'
-             b'w5VXxym+ZspyNqNUJoCqMBiM2Q9mT5VKFQ4eeRLGxqeoH4UBM7XiyyTZLUAYumWWIp5xk4wPjSeg'
-             b's+jBk/BNZqbLQtll5Cgj7+gbnLn46iu/cM21N35o285d9y7Mz8PS7Dzdz/lWv6kVpFrHD9aBPSCo'
-             b'VqGzo/PpV7z+LT9z3Yte8hdf++LnfvbIg9+5u7q80NXdlkAxpxkCiwy3gpf+Zns2EIduUysqZl8q'
-             b'M2yNToRulYdll8k9sP8xuOo5F8O6kUFo1qseP+Q7/b7NwQstCjuQqD0zPg5t3UirWE1ZhZgHkqqP'
-             b'swnNz6+5L+V10yYYKVq2hKc+Fxgh5kChoxuG2ruozFVeWoKyC4yEFqIg4gUUxIBjWbYKWngZcFVs'
-             b'l+HFCyiYUIHowQUx8dDSsVwomWPCZT66PlgmVVi9aneBqYso8km+GN2VKStKQ9kTAv0izmd5Sbgv'
-             b'naoMtNb3Fn2G6dFXDVhcmIHS0jwNsSoG4NKwLr+pnDPyhkP4hQxuNR6hlbgseXxyFh57/ChMuWCP'
-             b's1wpbxDQDTrWOW0oz7JgPGR0SV5D0QU6ypBpds+fbVIsuKzOBSeXURuTh8EN2w5f/rxrP3bJZVd9'
-             b'cs3I8LF8oUBCCLQ6WYlUaR2tINU6fgB7VinV8FcPjzz2urf91FvPvvjW937rS59/09HDD71saX56'
-             b'fUfOQFvRW3zgctaUwpLN/AeCYZLioO83Wa8R9orANIGyCwIPHXrMLdx7YO2aIRcgUs/oCcFERem0'
-             b'p5USR23y/Bno6OqDnp4+8nLyiryUeznc1wK20KBXyJRAMbOzNjLirGKXXP/itQsGvf1F6OnrheVq'
-             b'GSpl9H0qQ+peq2LQKYeVqH5kFaMXFPohXJSY+dkjFagHEYykAllBMsaUgwpapbf3dENHRye0tXdS'
-             b'acvw4C6w7N9y/0r6QiHSUplRQxTFCZ1cYLU+1U142Ha5XCKfp2at7EUyIt0ng8w0YINEZakyliGk'
-             b'LKQsLCE13fGTZ+DwY0fd/YOqxTZ6vUoLHJgzWOYpZrY0/ss0s+bPDRWVJEdP8nR9Ku66l6oN6Fs1'
-             b'Mr7nsh1fuezq5350ZHT9N937U25zmwryLgvKvtbRClKt44cns3KZTtpswtr16w+95I5X/uwlV17z'
-             b'exNjZ+46eP833zB79sSlBbcotOew2Z0yRodl52xrL/w0yIgHhKyNO/km4eUK5B9030OH4bJLdsPG'
-             b'9WtpwFdZb5qneZBURBlSbkSMUhnJ6i6AYAmsvbPT7dzbQMZraPZJ+wISFd2sAGhNpKlzMBUHVpvZ'
-             b'g6eo9NM5aHPZVXtnj1eFVUqw7DKsqgtcNLeUpsHaQWbLLAsWxL2WbEUgkt7l+0ZgvlyixAW5vaMD'
-             b'2l3WVGjvIFK7DOg2M5YlXj3ns7joqGuYdAE8tsZIoyDhtpmsTdE1KS254LQwBw2yZTdUpqNrpgxD'
-             b'dTMAYs4C9Yqym38Pcc5o2QWRJ48eh2dOn3MBvsD9MCnHivTdZ0o6gHOZvs7f12GyGCmAlsqbNRfs'
-             b'mjppDm/f8+0XXXn1Ry+54uovdnd1nMEhdSzn4UYql2sJIVpBqnW0gpULVjgb01Ysjl37gpvec+2P'
-             b'3vw/vvO1L7/k0He//XMTzzxxTbvyvj2eUBptN4L7qpWFXLyBuCynfSMfjetQwPHgwSNu19yEnVs3'
-             b'QE4bKplZbVntx4O63FuRQWGT1mBhbsItukUXTLppXihfKFIAMNzvkFJX4MgZCIttlp8B4XGNl1NT'
-             b'SSrhnkzigmE/tLmAZU2TFne8JqZpyJ5E+Hv4uGRbjr+PwVbAsFp7SGpO0/m2uywpIcuQhDiHOfea'
-             b'yfgQ6e2YSWAAo/TFBM8nyCChRCLuv+p5giuMK9nRmDIZ5QeIUaK+OLfoAu2Cy5yqFB4SCWSB68c9'
-             b'JhXVmn6o+nvkf8rTMabnF+DgkaMwNbNA5oOGNyhIf9Dch9I8LiAU8jgBxfJzmn/z74dROeo3mUK+'
-             b'fsGlez/xI9fd+L4dO/fc32jUDfYOq+UlqNdrraypdbSCVOv4Xw9s4uMOtqenp7xl246PX3TZc/7h'
-             b'8MMPvuPLn/jrX1aVhc5C4jMYww68aIOez+cCaVvZOENEzDj8X+rFDORuajQcfvwoLC0uwCW7d0JH'
-             b'R5FN65T3FpLfFaCr9v9CvyxUpJVdZoCA3YLLqDq7ukkFl+gk8ASDQyv3WlaucxLAuHekWRkonEDk'
-             b'wbHBFGZY+bYOl7l1+OxR2ah4wwHfRpMyCGTqAQdmfP0JonkwUCWa3X9XnBGr2mLAtFbF8pqyYQbM'
-             b'J23iXMxSe8hkkNT/8YIWDLANt+iXXNZRLi1Co+Y3Ezg4Gz1abPDi8ocYKnJpkC3kjfSO3Lk03PM8'
-             b'c+I0PHHsaag0gPplVDIVA0op7bI030ONecwAS3up8YIULuEi0b3WsLDgNivrduz92r4bb/qdrRds'
-             b'vRcDN85A4X1HvMnW0TpaQap1/GOCFTbYMVj96G13/M7q0dH9f/Unf/jBenluRFsTaeaczSQghoqG'
-             b'KBBeJebN8wzu9I0K3ou5JA8nz46RJ9Xll+yG1UMDvlejLWF0FGdGMncUrTl8VpC6DGe5tgwVF+gw'
-             b'SCHDrsP9h/Yhknt4WrjJhCfe1RsFmYaTmGys4LnJHBa1nGy0HxQrEQws+ULOB4mikpriCgodXRfg'
-             b'4GCjm6yX1CsabPX9sdTPs4LK/BwEjyVrVWYQmeXdOufnmZoNF7SXoLw0T7QRa726kQaUVSY0cq/P'
-             b'pjaIQFiyEqgeNuQ97grnE5idK8GhJ56CielpCrpY8vP8R09FJ9aijeVUHzKjHB9fS9XdP+0usHnF'
-             b'pdv81N3PtfdP3XTrXb/xvBte8P5GqVwvlxZo5KCYb2t96FpHK0i1jv+zYNVwO/Rdey6+587Xv+3V'
-             b'H3v/ez+br5e6FTT8UKrLHHSQgltWtDHrj3fYpMALggov+c7lOmGhVIH7Hz4AF+/cDps3racFvNk0'
-             b'wUZDc38lGPOBt72nnhWnSdVyCcrlBZhzqzYilooYtNrbKbsSV14TgKo29KkIkMRIJZFMW4jBQugb'
-             b'mlMZNqTwPSaUW3NJixIVzZYR4NMxY7P0cw5uMgnLJTxrMigoLlUGp2RgM0a2W8GIk7BIAvuHKJ0v'
-             b'uYypslwioQcZ3YqKj5tWEnNVELUo8C70kbknNHliI7qv51TOBf8qnHTZ05NPn3B/b5IHlGWVIwkW'
-             b'tQokcpQm0iPrZIVYxXIJsqOzA/KUsWqouG/Vkq6zr33bO155yTXPu7+EGbF7rtbROlpBqnX8MwQq'
-             b'v1e+/JrnfsNlPL/4sff9t/e1m1TjzI3fiOd9fwZi6YyrVMHjhzG1IHxuXN6wTIgZ1KNHnoLp2VnY'
-             b'sf0C6O/pJQGDCRmNjZw5FWeiLKn7DGVftPanLqtYnIXS/CxhlYpt7TTA2+H+xD4HJlCUFXlOkdeu'
-             b'iWUEvTiVsT63fF7MBRQgq3xNpmqD+EAyKB3qi6R4tF7NpkXSbiEGc7bOkAXfyr+p7MlhESXqzboL'
-             b'StgbK7v/PPLHuHPF145CiHxOc5bFoF2tgmmkgNi1mAKKHYqSd8Q/Pw5vm0YDTp8fh6PPHIfZ+SUa'
-             b'JUBhB4o6dBb6G64LZ6z4PpjIoye1oPFLSsNletpd++W6e68Hhp+98+WvvXvnhRc9XK9UgiCkdbSO'
-             b'VpBqHf9sBzaz913/gvdPjY0NffOzH/udAhaHtN/9GyZwpya6wWojpAYrbQlOtjQNphomF2D/5tz4'
-             b'FMzOzcG2TZtg8+aNpOjC4V+2E+SeCZC4gexHWLMnWZu4y2NWgI9dWpoj2TIGT5zlQRFDsa0TdCFP'
-             b'OCB0gxX/LGsgZBbS+BFinA3ZiM9QBNoqIgoIdu8qYKK8PNwEJ0kMLOLOG8wWWb7PoQLy2lvXYwCq'
-             b'uuuMpdba8jJlG+QXZQxnS9rbfRBh3D9KTnnRhVFZA0uek9I6nAlyDa0QINxv5nQO6i44nT13jswr'
-             b'p+bmoUkmiH7I2hhRW3KGCUKcYBoJJ4fAA9P0V+W9uDADTHIFKLmEu3vtlifveO2bXt3d1XkI+07t'
-             b'hULrw9Q6WkGqdfzzH560XoEfef51v7s4P9fxyDe+8qttgNkUiwGsCma0Otizs/IriACYjVdPoYEL'
-             b'b4HVYS5Q1ZsGHnvqGExOT8GeC/d4Zh0PvfoyIcu7A8qIsU1cWTMZbh6V+xBzRJ5by6TSszBNC3Ch'
-             b'vc1lWZ3QVmgjOKp2i6nge3KaJfYCPWU6txioh5la5S3X/SrNA8XID2SYhmXyg6eb++zFcI/Opk0i'
-             b'qzfwz0bdjwHUXMbUqHmrDrYEETk5zTuhfBz8TJK31uBcCWn0QQ2pI0yciRHa+iFcb+nh8x0kTDTT'
-             b'Opw9PwHPnjwN0zPT/n1K8tRblGacZb8mJeaYWoZ/NQU/dIGOlHX+GdAsnkhgqdaA4a2773/DT/3C'
-             b'GwrF3NPTE+OtD1HraAWp1vHPeyieXiVFmVvEEH3T1tUDL7379f+pbiA5+PUvvqs7p5lKoWhnToOf'
-             b'bjHLFTRjjAzbfXvCAK6ixfYCtIlNiBU7EC+qmJ5bhO/c/4DLqDbBtm3boK0tT6o7zJA8jNTbsxN+'
-             b'KQy5sqtrVklto32F7/t4P6lKqeSyrEXuW7msxGVXiPZJ3HMXiu1QaCtQMCPiNv5MyCa8NUiwTOc4'
-             b'ofya7kt8mjMtMlr0tHmEntbrDXrNGJAqJGtvktJP1HGWnY6VFhBrEjI5yz0uzYLE4Joc6nqMIQp0'
-             b'eBYwiM0JXgf0rXIBueaC4fj5STh5+pQLTvPekwpl8TYI+Ol9zOUUQYEJiSQZpJRs6QdTn8VyD4y8'
-             b'oYx/fxH9tFCuwoadez/6mrf+9E+tHh6ZnTh/pvVhah2tINU6/sUiVTA6xPWp0N5JGcjVz33+L7uF'
-             b'rLH/3i//WhdKoZHrJkFBpNKJZ/R5Xp+JmvAAm82YxBpvEeHtxi08feIkTE3PwKYN62B0dC3kXTAx'
-             b'1OdpRgq6UtEMD7gHJguqECf4CcWenHpEIndHq5E6ZjM1pr3OB/UfKtpoCBc008ZFoZhwic8HPyne'
-             b'WX5NpCpkO3N8rYbLgtIaglCKUxx8fLkuxyIRw1mo9IKsCq5LPvgYHzSNT+LozBPW65FHU6I5wUs8'
-             b'H9D9fqVWhYkzE3D67BjMLiz4Hp8WhZ4JZhlSD1Ss0gT+fQpidJKK1ZoQUE/oZoxqSqK0u2BfMhqu'
-             b'veXlf3L9C178znw+V2sQdqp1tI5WkGod/2plP0OMtVqtAte+4IXv3rBh8+xnP/Kh39b1pc62fI6J'
-             b'3TrgdsS+QgeNnIrOrEwhCJBWwQIpXwJccFnPo48/Cc8cPwXr14/C2rUj0NneRgQMnNHCQJCE3bxY'
-             b'YniRRcKlR8PE8TDWK/glXJxVZOuphIkaImFwAVEbYLK4C2aS+aXNELyD/br2QgcbZPNA0muC86Hn'
-             b'U46FFCHw83NQbTBleoVX+iVK6LYqcBEVD96CFaUhV++UDRw+LG0m2p8L2lo03TWamp2H81NTcH7i'
-             b'PFTKy3SumFV5XyiO0jYTyAmM60HAWtJEnGMzLFlnjh9w5kiydxxYtu75MLB19s3dcONNv3TLXa/6'
-             b'n4ieSlK7YhSgdbSOVpBqHf+KwcpSg/+GF930nkJ7x5Evfepjfz5/5vgF7XnvR4V24ti3IPQRz+AQ'
-             b'OYHAtT57sEps18XCl7E8wd5CUx9mYXkZph99Ap56+llYs2Y1bHCZ1VB/L+Ry1s9YBZI2ZxmUuJno'
-             b'+spU8kSUEhgwuEeDQcGPsIoUnP2PpGQm7DwuSYpPX8hoGGFEoTKDZrIcrLTYuAMEBJTylof+pbCK'
-             b'0NuiRL8uI7BYw9fJ+DkxycgC6cP4YIVzYvi10nIFxiYm4Nz4uMuaFr0/l9AwrGWgK5f3jJc/KBs9'
-             b'wvxjJ0zBSP1rZVWkVPtIck7cwoR6i+VqEzbs3vvt1/34z7yzWi0/iCzEjp48RNJH62gdrSDVOv6N'
-             b'AhUqttat3/DVn/6P7775kx/+4HueOXD/i7uLOXIA1kKd4GxHBU5fZkGOozuMKQIa6oU0s8RZz75D'
-             b'599jLqs6dWYMhof6Yf06F6zcn21tBZ/hGG74Gxsk2VqJEUeke3tck+bveUk4UdxZpp0wNJZmiYTo'
-             b'HaKDDW64NpRDTRhi5RfsJfLeDItnklCBl/iBZWEfJn7QGRitJFJ5zYgpzKxSIWQoPwrgIa2KAj1a'
-             b'okAugUq1CtNT0zB2fgomXOZUqVb8uePgL7sFe3itd7gFDphBwyjnJQIXMCx7jJgkFUKj71throWI'
-             b'q4r7+75b7vzj217x6nf3dPcuHXnsUOuD0TpaQap1fH8daKGwfuPmp9/yjnfe+am/+eAf7//ml368'
-             b'DS3jNSv7giKOB00zaCARfAuc1icG7Prrkae02BsmyyaFAu3eT52bgNNj49Dd1QGja9fAmlWD0Nfd'
-             b'DW15TdkOkrqBzQIVBQcfiMTFNtF6xYfAW8tzULOhA+RNfjl4IrnbZ1splxKD9y1nSiF6+xYcL/ma'
-             b'lW/R8YRJ4MZfgTBnZOUaaYgdNZuxYVc8UIsilRRm5+dgfHISxl1gKpWW/etOuJdkeWbKMFEjlEN5'
-             b's6CEsceBSrPgxNigBIxeWlF+jv9quGtZca+xa3jjE698xat+Y+/lV3wcv1NvDei2jlaQah3frwe6'
-             b'ALsVrfKyV73uJ/pXr3n4/ns++xu1ucnRdgwa6GPFpT7qIyFmR+tgPWQDeUGFnodI9CQLIksOGbCl'
-             b'3oqft5kvVWHu6Al46plT0NXR5oLVAAwNDsBAn8uwigXfazIhIeOFNtN74jBBLDrJFaS0x3gko9gm'
-             b'QhZyFn545Zu8JO0FD2wJYmVGScCuxpMyNJfNDCsflM1aUKho3c7/P0k0ldUwV1uu1GF2dppk4zOz'
-             b'izC/uEgvCOfNiA5BVvcmhD3aILDrLid95IesVOwNCs5QSoB+joB7Ve69agYqun8dFRccbVvP3PNf'
-             b'dOsfvfi2O97X2dczPTc5TtBfFNS0jtbRClKt4/v2wCY5zv7svfyqvxwdXf+db9/zD7/3zMH7X9Zb'
-             b'1FBIgDtTqZ/sZQyQ7yPZsC7GGp/vZHkOrA39noypk8+IXLDC3T9yKmaWqjC9cAaSZ8+6gNUBqwZ6'
-             b'YWR1P/T39kKH+3cBg5ZiK3O0u2IihgnwWK8W1Pw8iQzeBh8nm3GsjUw+jzTyvTGkgycUUBkqK/qQ'
-             b'hDMRTlK0jUQIOW08R7R3970v/7ulpSWYnp2HsfFpmFtcgkqlQiVAFCzg0LNI063yWScZbnAZUwwS'
-             b'dZD7S7QW+YW/tpq3ENHZkseo3Wsg+bz7+XrahJLLTjftvuy7P3L9i96x+6JLHy4W2wAJEq2jdbSC'
-             b'VOv4d3PI0G9Pb89TN77k9rs2bt/5K9/64qf/g6kvtPcU82Byft6pmQqVQWgMNoJgudZkLKzABYnr'
-             b'L4B4A0ZWHD5CQeWQpUB9qXK1AaWz43D63Bh0tOWhq6vTZVd90NvdDf3uz/b2NgLFomQ7YYt6n9Ho'
-             b'ECwlg0CRgGVwLDB1wkcVNlmUTMhE80PNlreKgzEFA2b9ibU69otEnIGZFrILl8pVKJWXYGZ+HmZm'
-             b'5mFhfgnqOFdFkv7Eyy6Qmahz9LoMl+JEz++vjxdzGM6mZLBaBeUgZHiI4Z3L9Af5B1xm1JHvctcy'
-             b'hXzPwOIN+27405tuu+P3pycmFpeXS9Drgj+0kqfW0QpSrePf44E2Fo16rXnLna/6jZ0X7/3OZ/7q'
-             b'/b8zdfzIlT0diCay3vWXeD6G1X0QaOTWJAw/olzJ09W5Xmeza2oSgHKeiaQYbCulRPJvAqhh4Jwv'
-             b'0aAwhpC2fIGGeDvbitDT0w3dnZ3QjWaELtNqd9lBoVikPhQq/6i3JD0p8D2b1Ii02ngbD86EsNSH'
-             b'NvSQIZgD247gjzeMCzYNw9emCdV6nQjmS+VlWFwqQXm5BrV6lYKSBETv5Ouys8RT4hORjzOw15cp'
-             b'M/5NmE2xdYnoUjBzkhKl4ghls5kTyOC28PwSmlerNuz/w96VxUZ1neFz7yyeGXvGux1s49rgDduY'
-             b'xXHAlASbAoWCUNRNXaS8tKqiPlRtI7Uvfe5Do7xWeakaRVVUVZVKqhIobSFCJaGQAMEOBizbBGxj'
-             b'O97G41nuzNx7ev7z/+fc6VtVtVUSzo+s8TbjayTux/efb2EpAVB9+w6fGfnS6Z83bWm6Lq+9UJDr'
-             b'PTNmDEiZ+dSzKmhX7ezu/dt3X/rZkXcu/eXFq2//+aVUcrGxOhZlrpPD/+WrDDypqCNJtlr6kTzd'
-             b'03UVmG7OdfkfIyOuagf2mOWSedgmDxNHRR+zgvLzADZ5wbQyWYctrqxJI61qCQ5BYaFgfGVlQRYR'
-             b'N2J4C4sbNgSuhsH7E7KlkgLT1oMKBZiTEeAigAfDYrkUYrgFV6ZwFMSNPevkWc5xWC4nHsXPBl9T'
-             b'oehSwy3xRYg/gugj+Yh5fZ6nZRlakceQREoVol89qdaGtpaJ2yUKcDQek0mXJCpqzaifKcApFA7L'
-             b'gsq1bJFVN3eOHzl68hdD+4Z/Ey4L8fXVZblmNGPGgJSZz9Tkxc1Z3DBTw4ePvjyw/+Cbb7915od3'
-             b'37vygpfPlodlQSCKJVy6WXOrxEyqo0w5eaDQu8N16TzTBmAlCHDh5u9hVA+nunRGniNLrxjVEReX'
-             b'UT6kFhcspyAYhLjeTVzrcWJNSmAgEyvEB9FITIoalIdIkEZpMFZrNJsECDbJ15HZBDFwllImmO6o'
-             b'wpxAC4J3KQoRixY9zR7hWgKhgC5B9Fd2zK8F4aod19Jyf8xU9FkT1oh4Si6i5BISoLKC5SXzBRav'
-             b'b75/5NTRXw6PHntdMMy15OqK/hlmzBiQMvOZHLjRO3mH1dXV3T/11W9+f3jk6OuXz//xJ+PvXnre'
-             b'LuasCAgGINnBy2O/kW2psDo0mdqcVmgW9Vap2nhP+5AwT048VzAh1XiLq0QpJCdAU6yNU76diizC'
-             b'Gzu+NieDKyY52IQItqruEI9pp4hSeVvJE5nMwWM6QsqS6e0qhxZ7q+Cagxr0dJAsLetsbmsRiQRc'
-             b'D7PSVeEwV0kPDBmlq07sVJWJtjKRuRnO0jyL4qKUeo8zZa9GSXuAOUWPpYt5Vt/WdevQyLFfD+x+'
-             b'+o2qquplANGcEUaYMSBl5kkaONOAkNW27R1XO37w0y/f3HfwxMWzf/jx9NiNI0E3z8JBVPvJfDla'
-             b'+kH1OKc8QM4DMrRW68W57QOUbtpVga/IHfDMymV4ym/5gGQRUFmW/lZlXKX2Kl92rk6YCIQCgEcc'
-             b'cwm5pTUgJKunmg7ZwqtyHPzzNFkESdXyJGRHQqa7rHyjs2RFHIFWAhbVWansQFbKprRBF424wArl'
-             b'uwC0NsU2WVj1AXzUEZ/fzLus6qnWmdHRY6/se3bktcbmlnRyeVWCUzgSNZkRZgxImXkyRwaPBjnr'
-             b'7u0/171jx4V7H945fuXihRcnbl47bjupIKRWQPMv8iFLZulxZTblHm3KqALdv/2jEIOk5L4pl2mD'
-             b'k28jZj6ylB7ecK6VccoExXVUkt8BpTICAaiYLmBnWh2H52sBPEtjakWJTEn5mKRuhKkAXoRFLdTT'
-             b'9VacVn+M/evFcw22Gv6IPVqkbw9K35KSo2OAL7y3mckzxwqyuq0dY88eeO61oQMH34jFyheg8TeX'
-             b'y0qmFwgY2Z4ZA1JmnvSR+X8O1EK4vQO7zvbtHjw7PXVv9PKFt743dvXyyUAuG4+BiAGCa6FrSQa3'
-             b'eqrGD0UXUoquMhuQTUlfkOdhESBBi6dYmeVX3HMV9+P3HRKkcMoPVPd926+BZyXeKRVeyzGIVrEw'
-             b'XD9a+jXV+s+2MLeQUwySPICSrx1AI7CHrAnOyFAT4iJjIsDlJdmAjEJpdTcJ4yXGYQRCLjutwIQb'
-             b'FH/PBZZKO6wYLCu29+y9+MzBQ7/a/9zoOe4WU/IcLpspMRWbMWNAyoyZEqziMloJVG09ff2Xevp2'
-             b'Xrp/+3j/jWvvfueDa1e+vrq22ARB4tDqWshusrJISGbc6cMaWt3J+7WqsrdJE2iptRovEUxYuioD'
-             b'j3CUbNwXMiimgx+rfD5OXiPPrxhhfi8W80XnjCL5dBGhEh5wNHZRvxalp6tVJV27H5jnr/wYHdG5'
-             b'qL3313AkLlEFhHjtAQlURejPgjJFO8Rqm9oe7O/f/ebwyMhvtzRtvZpOrrOwAP/11AYKQMyYMSBl'
-             b'xsy/sQYUzApAo6Ghcfz5b73wo5ETJ1++c/v903du3fja3PTkcNFxolaRsZBcZWFzL/cbAHWPFB35'
-             b'UEAssR6fe2Aau78hY6ojqjRRQlWo65Uix4w/ps+d/DWgRcWDOnmd6tyx2NDTcUMKFJUYg1sqbJfY'
-             b'nmIzNvNLHC06j9K5TfBbFel5eC3AlmTslPh6DqpUxGVGE7Vr/Tv6/rpzaPh3vQN7L0VjsRXY4qU3'
-             b'oZreMTUaZgxImTHznw602AK7ikaj8wcOjb568PCxVx9OT+1578rlb3/4/rVvpFcWm3mxwECVHQ4H'
-             b'CWhsPN+hIj9P/lEAwiQVsS2l5uPInOg4yJXuKZJ7U3aftFhxxcRUpYjfygsTkJ9zEQ6tEuGGql9n'
-             b'PmBJziMBBzZ9voycWz57Up4pf7VI18kLuuwRnF5Y086lYtCVa9OCVOlF4jXZlq7uf+wceub3/bv3'
-             b'nq9KxKeg2TgYKpNiiFA4YNZ6ZgxImTHz3xrwFTkQyxO2WH19w83RL568eeTUV16ZmZrcN3bj2onp'
-             b'idtf2Fh8vN3NpVgMquCDAfQyeeiVgsTuoG1TC67KsqP4QMlqbLm8A/CQqRJwnkT9S7B+dFVZIac1'
-             b'oqVOg3iJjJ18TcCHPAprVatCC1mUlxcw6BWlSdeWTIrqPhAJ8RWpg0omWhBZY3aAfpbaH6LB14F1'
-             b'HmQQBkIsWlG1Xt3ceLurb+Bc/67BP7W0to0HBXpDqkZ2MyXNxBBAa8aMASkzZv5nw6V8HdjVU3WN'
-             b'j/t3D57p7Ok9k8tnK+cfzQ4LdnV6+u7Y4fXF+U7XSQMsMGgKjkBaRAjdRjYdJEmFno1rNpSIIyiA'
-             b'JyrIqEiQVocoh2cyxkmq2i3fY6RDWi2/r0qRJksxIY4iDlizQRiujDLSnVUl308czeOYYg6EEFZ3'
-             b'kHRYLBRZXlxhwUVQs8uiuYbm1jvN7dv+3tTadqVtW+f1eDw+A+dskEPoumAszrOobQTkZgxImTHz'
-             b'fx8X2FU+LxVp4Ug42dPff35gz97zc/NzFRvLH+9YWpgfejgzNbj4aGZXcmWxM5dLJ7j4/nAAYo8Y'
-             b'CwnEsKVS0PabauW5UQDXaVQdIsGLRBUB8jJhA4elK0aUoNzmlIGBugr/XIthriDK0KGQ0SaPlo1s'
-             b'Dt4EG4J34PeCn+HkgQHaLCOuORJPpCub6mcqa+omt7Z3jCUSlR907uidiFcmplLJtXwoEpGABgDu'
-             b'OgVWForIHi9jcDJjQMqMmU/AwOE/yNi5uMGLDzabW1qu7xwcur6xvg5nVYGH0/db0xmne3Ji/On1'
-             b'1aVdy4/nutPJteZ8Nl1TyGSYchJhV6Ct1Xg25PzptZ7HXKrwkCZj29MpE8qjhLUfpNbjXFeR6FJ2'
-             b'ADWoXA8wZEtFWtdJFucJsC0X/xqjuWg8MVdb2/Cgqq5xfHt3zzsVFbFb7Z1dDx7PzuZ7d+1lj6Ym'
-             b'WcvWFraxkZSsklvYwMvMOZMZA1JmzHyyB8BBCi6yWcmyItEqNxaLzbR19c9UVlWfb2ppZg8/mg7X'
-             b'1m2pE6DVnHMyvatLCx1zDz/qEM/Zlt5Yry84mZpMejPOCy5W6QpwCtthVhSsxpIJ4UEmvoapERy7'
-             b'sZSpFmOISIghQ/hsAUSCHQUDUktoBSNwTpSJlFcky8vjH0djFbPxmqqplvaOaQFxd1tat88kEon5'
-             b'cCiUCpWFpRl3cX5WGmuh9dYRoAomaEghN+IHMwakzJj5tIMWGHol08rhTT6Xhc/lq6pr5mtq6+bb'
-             b'uzqvp9aW2dzsPOvdOcimJ+9ULC0t1H+urb16ZWmhcmV5qSG5ntyyNDuXqKlrqOK8GC8WCyFgRCCu'
-             b'cD1PPASkxl0AietySMrjXABYsSxclguFI5lweWwz72SWElXV8w2NzWuxRCK5sDC/3NnRuZZOZ9yl'
-             b'x4/Ynv2fZ/cmJlh5LM4ikQjLbKYk23IFSHkkADFj5kmdfwowAApjylODxhQmAAAAAElFTkSuQmCC')
-        )
-    )
-)
-
-__all__ = ['EXCEPTION_FACE']
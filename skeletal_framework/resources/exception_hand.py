@@ -1,6186 +0,0 @@
-from base64 import decodebytes
-from io import BytesIO
-
-from PIL import Image
-
-EXCEPTION_HAND = Image.open(
-    fp = BytesIO(
-        initial_bytes = decodebytes(
-            (b'iVBORw0KGgoAAAANSUhEUgAAAgAAAAJ1CAYAAACvl0iIAAAAGXRFWHRTb2Z0d2FyZQBBZG9iZSBJ'
-             b'bWFnZVJlYWR5ccllPAAAAy1pVFh0WE1MOmNvbS5hZG9iZS54bXAAAAAAADw/eHBhY2tldCBiZWdp'
-             b'bj0i77u/IiBpZD0iVzVNME1wQ2VoaUh6cmVTek5UY3prYzlkIj8+IDx4OnhtcG1ldGEgeG1sbnM6'
-             b'eD0iYWRvYmU6bnM6bWV0YS8iIHg6eG1wdGs9IkFkb2JlIFhNUCBDb3JlIDcuMS1jMDAwIDc5Ljgz'
-             b'ZmFlNjQsIDIwMjIvMDIvMTUtMDg6MDc6MzIgICAgICAgICI+IDxyZGY6UkRGIHhtbG5zOnJkZj0i'
-             b'aHR0cDovL3d3dy53My5vcmcvMTk5OS8wMi8yMi1yZGYtc3ludGF4LW5zIyI+IDxyZGY6RGVzY3Jp'
-             b'cHRpb24gcmRmOmFib3V0PSIiIHhtbG5zOnhtcE1NPSJodHRwOi8vbnMuYWRvYmUuY29tL3hhcC8x'
-             b'LjAvbW0vIiB4bWxuczpzdFJlZj0iaHR0cDovL25zLmFkb2JlLmNvbS94YXAvMS4wL3NUeXBlL1Jl'
-             b'c291cmNlUmVmIyIgeG1sbnM6eG1wPSJodHRwOi8vbnMuYWRvYmUuY29tL3hhcC8xLjAvIiB4bXBN'
-             b'TTpEb2N1bWVudElEPSJ4bXAuZGlkOjE4MzQ4REM2RjQwRTExRjBCN0ZCRDBDODcxODJBNDU0IiB4'
-             b'bXBNTTpJbnN0YW5jZUlEPSJ4bXAuaWlkOjE4MzQ4REM1RjQwRTExRjBCN0ZCRDBDODcxODJBNDU0'
-             b'IiB4bXA6Q3JlYXRvclRvb2w9IkFkb2JlIFBob3Rvc2hvcCBFbGVtZW50cyAyMS4wIChXaW5kb3dz'
-             b'KSI+IDx4bXBNTTpEZXJpdmVkRnJvbSBzdFJlZjppbnN0YW5jZUlEPSJ4bXAuaWlkOjI0QTA1NUNG'
-             b'RUExODExRjBBM0NGQTg1REI5QUVFQ0EwIiBzdFJlZjpkb2N1bWVudElEPSJ4bXAuZGlkOjI0QTA1'
-             b'NUQwRUExODExRjBBM0NGQTg1REI5QUVFQ0EwIi8+IDwvcmRmOkRlc2NyaXB0aW9uPiA8L3JkZjpS'
-             b'REY+IDwveDp4bXBtZXRhPiA8P3hwYWNrZXQgZW5kPSJyIj8+XsFJNAAFWsNJREFUeNrsvQecHeV5'
-             b'L/y8U08/W7W72l2tugSIIkB0TBGY3typxo5Tfylfki9xvtz0G+cS+7rGjnHBuFeMjQ0uNAMGAwJJ'
-             b'CCQhgSSQtFpJ2/f0MuU+5Z1Z+d7cOM4X24DnWQ7acs6cmXfmzP8p/+f/qPLYNnglmPKbkMmm4NDB'
-             b'MZg8eBDcVAoWrzgGnEwWZqcmwLIdqFaq4EMIrUYTLDcFxY4i1Op1sA0F9XIZBpYsh+mpSejuLEJp'
-             b'chJKpVnIZnLgpDIwOT4Gpm2Dbbuw56WXYHhoCOr1BnQuGADDAEhli/CqMhWAY+Bq+D7uvwN+uwWT'
-             b'eMyWUhDgV+/QCMzNTMPM+EFYOLIcj92C8dG9kC8W+FhtXD+v3YapQ2NQq5agp6cH1yYFpungutRx'
-             b'vW1o1stQ7OyCIAQ+H7PTM5DNF8EIPXjkgXvBUwZcePnV8NLOHTB2YBQ8fKJl2lDs6oKVa46FaqkM'
-             b'jXoVMuks5Lu7wcBzCCFuDBe8OjcNpZkp/Nb4uQ47xNcXcjnI4KPte2Diz57XxiMG3H8bDMvGJ+Hy'
-             b'4KNRbUAL16VQzEOz7YPC91J+GyqVErjpNEAbj9O0YO/uF6Baq0MX7mOjUoZMvoOPExcNTNfBYxuH'
-             b'VUcfDfXSBOzfvbMwOnpgSf/CRX0Hx8ZyL+/eNbR3357FvQv6ulUYWEEQKstygkql2hqfGJ9ZsKB/'
-             b'bmTJkvEVq1Ye3LL5mfELLr7suYXDiyrlVhs2P3I/rD3pZAhxHR1cG5PWBdfMcGw8jwGeozSfZ9tJ'
-             b'QQuv1VarBXU8nmJnD6TTGWg2qlDCdaQVDAI6bAMC/DutjYHnO5NxwWs2wcBjpHPY9ANQR6wjPX5e'
-             b'o9f4DfzMWQZfIw5+nmiND+D5Hxxegp/dA1ApzUCgTFiyfCU89fhjcOa554Hht2B030uwd88e2Pn8'
-             b'83DR1W+CRStXgVetwfe/fQcMDw/DsWtPhMOT+Fk3LEjn8jA7PgGpQic8+IPvwzkXXADluRnoGViE'
-             b'x9SAJh5XZ7ELWngNjL60G4496SS8L+Aa1cq4XyZfALaDx9/y4PChA5DC79u4zrlUGgpdPbh2Tbzu'
-             b'K9DRuwCm8XMT4AKm8G9huwmpfBbqtQakHQuPzYdquQK4UejrWwCje3ZAHvcpk8+Db9i88OWJQ9DR'
-             b'0wcBfhbHDx+CBu7fyjUn4D4oSOwXayFee/yBp1si3uf5W/wcHcBr4s4vfhHyiBFdXd2Qws9LsdgB'
-             b'/QMD0N3Ti7hRgX/90Ptg4dAiOOGEtbDm+LV8D3j4gfvgpHUnQW9fP9z1ja/AUcesgeFFS+CZzRvh'
-             b'tDPPATeThsP79uI9NIvX88uwcvXReB+bht7BQb4fNXAb9Nmke9EcXq/F7l68j9agVqngPTSLn5cU'
-             b'tNsN/Jw2oFwu4Wc0i/tSg96Fw1CZmcTtZ8DF69c0FTQrDb43tPH+1sTrsYHbH1g0AqWpKdwG3vct'
-             b'Cxz8HDaUgz+38XKT642WwEJMzKadn7l+VnIJJZbYT5uJHywTP5j4SVLjB8ZWbXnyyfM2/OgHR40f'
-             b'eGnlof17jmlUywPtRtNUCM4W3mwM/JBObG/x/T5UjJII5hZiRgr2HXwRXtr0EDyA4Gs56XB053M7'
-             b'Fi5a+oyVTo/iC7atWLXq+/nuvnHDdRHr/WTxE0sssV+aJQ5AYokR0iN6WxgBWs2mOjQ2duyeRx66'
-             b'+MUd2y5+6YVtp6lWI20GHtimASnXhg7bAIVRuaLXGQGEAToBWZejzpC3Rds06DtyJzhqDigER/eg'
-             b'dOD5oyZf3nZUEChQlgM7Njx8qHd48RNrTz37e6uOPvaBdCb/kpFOhwojhMQSSyyxxAFILLFfkCkC'
-             b'9XQaypV6cdPjj1760vZn37Z901MX1atl13FMBnxKySkCeYJ83wcvbGOEbyK0I8D7804ARf8C+uQG'
-             b'BJwJ4DR7EIgTQOl8/NG2EPwVvhp/bs8d6t83uf/qlzY/cbWVKVb7hpc9dewpp9655vi131u4dPlu'
-             b'hY5HkkpOLLHEEgcgscT+S1BfMVfAQCBuVSsdTzz64+sfue/7f9QqTa6wQx/yKQdyxTQEoQAvxfIG'
-             b'RveKwJzAmAgHIYF+AD7+wKCvDF2JpAyAwYW4MKQnKs4MSC4AH/Q8iv4NdA6UDy46Ga6LH8MQ3Quj'
-             b'na2O7jj3hzs3n3vX58x/WnPqWXde8oY3fXLpyqOesFOu3261knOXWGKJJQ5AYon9p7DfUByZz01N'
-             b'9D54z7f+cNMj9908c2h0yDFNyFom+IEJjXpLwBzB2lQC4CbxyvB7MzSBNhH4HjoIIZP0CPANpXjb'
-             b'YaCJcn7AeQByAIikR76EMlUczQf4RIW/DNHh8ANxMwDavL2so8BuNnJbHvzOTVsee/Cm5cevu++t'
-             b'b3/XX/cNLXpS9ic5j4kllljiACSW2M8V+VvpHDz70P3n3P3lz3x0Yu+uNXmMvjtTLrQ8H5qtJnhe'
-             b'gOAeCplPMVKjE0CPAKN1ByzL4qh9+bIRcGwbMpkU5Isd0GjUIcDXdvV0Q6VUATebg0azCbVyGUoz'
-             b'c7jdFkxMz8DE5Az4ocduAboM6Fig82CY7GwY+H2A70U/264NfW4HtD0P9j3z+IXv2br5vLVnnvft'
-             b'089//fuPO/2sJ5SZfHQTSyyxxAFILLGfadRiZ7quccftn/ire79++3/rThnOcG8R2u2AQd61FbeD'
-             b'GkYIbQzJKd1ObV3U7rYAQX1oYAH09fdCxiUnQEFPTy8/h6L9zt5eKCPIU6uenbLBxdd0LRiAJv5c'
-             b'r5TAw9cRJ6DQ2Q2Hx2dgenICHYYGTE9Nw+jYQW4fsqgkgQ6AzQ4B7YjFGQfHdSGXU1SOsPY8/dCb'
-             b'djzzxJVrz7n4S2++8V1/my8U9qvSjLRWJpZYYoklDkBiiR1hLPKQAq9Udj7/4fd+ePOD3/qdhQWL'
-             b'o3WftAFYN0Gz9ykqVz74fgvyWReWDC2EpUsXQzGfBQuDdB+Bmgh9lOqfnZ7kFAElCSqlMphM6lPQ'
-             b'ajXR2VBwcO8ejuotoMhe9qNanoVizoWO7CBnI+h9y5Uadwhs2vQMzJUrTDLkwgERC0POEXC5gN6r'
-             b'mHGpL9h55sG737Fr65bzLnvL9X+9+vjjvoI+ix+02sm5TiyxxBIHILHEgEHUgHqpBrNT46l77vjS'
-             b'J7c/+sMbOzMWtJstgmUQgn7AtfwWAiiJy1iODUevXA5rVi+DAgKu77U5fe9JGx8CdAhWiGAfavIf'
-             b'YbuSmn5IHAFNADRNE0LD0GI7ir/ovcKgydkIJVQE6OrI83PPfd0ZcHh8AkYPjEGt0YKZ2TkR90FH'
-             b'wEDnIqQWQ/IDcPN5/NRWR19Y/OUP/eMXVpx02luvue7mPy729u/yavVIEyWxxBJLLHEAEvv1Ndtx'
-             b'oFwqubd/7L2fq43tektPPoOA3sRgXHEkT6l8CwFzDqPw3gULYM2aY2HhYD9kEfgVkfhCD5/vM4DX'
-             b'axV0HGqcym/7GoxBMgiE5iwKxP0C1Bkg9X38FYsEyd8F8Q0l7x0ogzMJ7VYTmtpBWNjfCwMDC1jJ'
-             b'b+tz2+Dll/dDqVylagB7GdxdgNtP2wqyxSz4uKmx5564/OP/tOuk9ddc/2frXrf+S4HOICSWWGKJ'
-             b'JQ5AYr9+xlqYNjQqc+73vvH5T1f2v/CWjrTFksG2YXIbXmiGCO4etAMPjl97Alx2xWUsWUzs/rbf'
-             b'4kifQNtHsKYInaSWw3Y7lhoN0EEoz03B4YOjDPL0OgZ4lgfSZXkl0T9lBvhlkVSnkp3kJgIEdoOF'
-             b'goh8SBG/gsrsDCxfPALLRhbB6IGD8Nz2ndDC9ybpT3q+CiMpX4CMY8HsxIGBr9/6gS+O7R8944KL'
-             b'L/uLXEexLC2IiSWWWGKJA5DYr5EpBEoEaPvLt37o1ucff+CG3nwaAdzjNDr39tP8AIyUlW3DNde8'
-             b'FU448QRoNGrQqDcQ+DHqZySej6MDdBToJ9O0GcT5e9uAbqcfstk8mJYJB/bvhcrcDGcUCN8Nkgky'
-             b'lHYCgpj1z0E8/ZXKA/SlnQT6mTwAbhnEn8k5MdDxWLx4EXR1d8ELu3bDvtEDojpIz6XeQdYU8CGF'
-             b'x5tBh+eJu7/2e/t271j923/6l+/sWtC7V8SIkushscQS+7fNSJYgsddS5K8QCL22537qvX//6ad/'
-             b'9N2be4tpZvZTPt4kcj05AQiauUIRbnzHO+H4E0+EudIcOgBNZv2HOorndDsR++gnQ/r8wxA0b8BH'
-             b'p6ANoReAk8qC4aSgf3gE8jQ4ibMGPvhaKIheIAG/9gxoToCSbcjftWAQOycar2kf6O3xXxoEkstn'
-             b'4NR1J8Lpp66DbCbNw0PESZGsgpOiIVcmLOhIQ2l05/nv/9t3P/zMxo2XWalUoiKYWGKJJQ5AYq99'
-             b'9KeIvt1qu7d94B8/9fwT999UTFlEveMI3GCCHkATATWVz8G1N98AA4uGYG52Wpj3BMgq1vJD3GT+'
-             b'vq7O6/Q9RvQBS/qZLOUbMr0fOBpPuWkYWbYKlq44BtLZAngE0ErGEsZT95jMr6BNCoKaR4BvzWQ/'
-             b'jujZuwAWH6JpYFGpgJwFmgQ4ONAH6887G4475iiwcR+k3q+YxEjvR90EDr6fNz068pG/+dO7vvf1'
-             b'r/6xS5MBjeRjnlhiiSUOQGKvUTOp5l+rp2573z98Zvtj996YtRBoPZ8Je54voTul+HsGFsLb3n4z'
-             b'FDo6oF6tyUAfBnpK2lO0bzH4Q2hq+T7QGv/A5MEoq8+QbogEMPX5EVXQQ+/AzuZh2dHHQt/gMPhU'
-             b'26dSA5P/QF4YhPyhUxrgeRMiRcBcAuYdhCJGpKL8fSBlhCY6ATTm86S1x8HZZ50FbtrBZ3hgGjR9'
-             b'MODnUzuii9vscZR5120ff/+3Pnfb34TsjCSZgMQSSyxxABJ7TQX+IZPj/CDAyP89n9n26L3XZRAM'
-             b'W60GzJXL3N5HKfZmuwF9w0Pw9ne9C7q6uxlMw0B67YEG+ZAsLzkAoSjzSdkg1BkAAXrCYQJ1FQF3'
-             b'VMM3xIEgIR/gnIMJvYMj+H5LIESHwufeAHpIy6E0FAomG5zul04C2hWfSgFgyPOCkPcxCHWWgBwD'
-             b'dGpq5Qp0dRbhmmuugTzNpcffKd4b0jBo8/eubUPWBPX9L9/+95/4wC3v99ptm2aUh1EdI7HEEksc'
-             b'gGQJEnv1gj/wUJ92u+3e/qFbPr3zyYeuzWDgXq028HeaXIf/Jwa/m0rBRZdcAjY6C7V6VV/6MrKX'
-             b'QDckDp7k+qHVqEGtWgLdwccCQNVqGUQdWEGzXsPtN7UXoKJ/eIfoNQT01GnQ3TckToASQKcUfaid'
-             b'AdIRIGRnNj8PEBIHAbSDQZkAkQGidsJAPIBQygH0unarDs3qLFxw3lmwfNli3OcGZxrIaSAnpYmO'
-             b'T61ag7SpYMsjD/zJZz/2ga8FjXontJrgN2vMhUgsscR+vS3pAkjs1eu9Wib5APYn3/ee23ZueOh6'
-             b'qvmTuh9F8EqL8pC+fz6fgutuuB4GBvqhUi7zFEAViAPBQKuZ+AygGEWbUbudUPbBshxIp4y4l99O'
-             b'ZQD0qJ9oBmAAUifgkoIhI4E9z4Ou3n4I0AE5fGAfjxVm0p8vIE8kw0C/mnmASgSCgAYEhbpvgDMT'
-             b'YZTsYIt+E/gtUL4B6044FnKpNDy+YRMo3Fc6fupMyGRc/NcAB92IzT/6/jWNWiP/9t/9w7elMu6U'
-             b'7lNMLqLEEksyAIkl9iozE0Eakforn/rYR3Y88dD1Bdfm3nz6IseAUvhh4IGDTsH1N94Ig8NDUMXI'
-             b'ngR7iHBHiXoV+jLd12tDu14X8A6BdfkdN60FfAzmBFi2qz8xpnQF0ORA32f1QPpXgcZTnQngKYEg'
-             b'SoPFnn7oGRgGHjugpYIC3advhNLXH0Ex8wGp1MCpf4+fK1kBKlDMtycqXUeg7beaDVi5fAmsO/kE'
-             b'FjdS+DzHBjx2k8mE5JAUMynYtemxCz7xwX++o9Vs9hBnIskBJJZY4gAkltiryqjP3/c95zMf+OdP'
-             b'PHLXV36nK+sw2BNoErxaJkGbD8ViFt71rt+ARSPDUK1VpZYfSOzOtXAlCXlm2vui+CfpesXOBCv2'
-             b'8RvqHD+3BYKW8ZWpfcA9+758krQXQOl+pccJ0rYM24LBkSWQzuRYj4AhOpQsQQTm4nyE8ffE3Ccp'
-             b'Ydb1M0KN+1JukCKCZB+IdhA5AScetwauuPgCPnZqE2RVYiUZCdIZKLgO7Nn8k3M/+aH3fVkpVXBs'
-             b'h9/n530kllhiiQOQWGL/aRMlu5//oaTYbnzyn//h1ifu+do7ezI2a/XT3wjkLC2oQ+B24003Qn9f'
-             b'L5RmZ6XnXoVxkM7MeErF+wpf40Amm9eFfN0ToDQpkKJyUgdstxFMKWVvo/NBoC/jgyw3BabtSgo/'
-             b'KgOE4kSALi9QWaFN2gMdnUwYpBKAqXRrgQpiMSDZYqj3gf6EwM1OgT9PWIwLAnIgoZYdpL+U52Yh'
-             b'l3LgrDNOwW0GnJmwaMxwGOgPegDd+SyMbt144Rc+9sHb8YX5fDYHmVT6P/zI4sMyzCR7kFhirwFL'
-             b'OACJ/SrQH9LpHEIp/FztaTweFwHu7q99/o83PPCdd3SmbAZGivzpb6FW0kll0nDV1dfAsmVLoVKe'
-             b'E8W8UPr5qCOA4LXVbkG74UO+UBS2PUGoHtLTbDRZWIeU+KQBD4HfdMDJFnVmAB0OPSSICHlE0gva'
-             b'DXw+lQrsI2SAfdCqAugwBNIa6Ddh6uBBEFV/0P8K/0AyC0ofS6ATCgbvHzsSpFVgiHMQhkHEDJAs'
-             b'g/6pjcc1PNAHl190IXzvh/eD57fBsRzRDEAHptnyAUN/ePLeu9/gZoujN/0/7/4js1md1yr4WRYk'
-             b'0J9YYokDkFhi/z8cACLamRhN/gdgP3oRInsOfvzdb9x012c/cUunS6I/LSb6eW0fbMfkSJvg6cqr'
-             b'r4Kjj1kNlUoFo3OHCfScvNd1eYqsXTuFwKh44I8yNDlPmvH5OQzdCJgGRve25UKu0IEvRHAn0EdQ'
-             b'9RBobQRlv9WEoF4G0wskutepeuYX8F4benAQDf4JoNDZC9MTk+KIMPN/XmsAQskYKEkjSLcAiNiQ'
-             b'iqP/UJ5H3wVU39dTCnWMT86D12pDVyEP6885E57YsBma9QZYxFlg4SEf8Aggj+v18He+8fsjS5c/'
-             b'cs4ll39T8ZyDnw3uCfwnlljiACSW2H+BI/DvD6zxfI+BktL6KluA5zY8sv72D73n1r6sa0HgcT2a'
-             b'InLXcRDcPGbdr19/HqxetRJKc3Nco6dMvxTOQ+6hNzFKlzY8JbE3KfMhmNNPFgI9AbKZyYLppsFy'
-             b'M/w7n8V+UjxMKOS2fweU63BEbpv43riN2lwDnDiBH0SqvzrOl3Q/va+byUGm2AHVqQmBdmNeb5C/'
-             b'OLKfVySMywLMK4wq/5orYGjoJ4VCf76eR8OL2s0GrFi6BFqNFmx4ahOTDmkZ8rm0cBnw9WkIjXu+'
-             b'dNtHli9ftW1wyZIdeID/Ed8taR5ILLHXiCUcgMR+Vej/Mx/Uf+9Rq1sqBXu3b131mff+3a0pv5Ym'
-             b'IGvj34jRb5jyXKrRn3PO2egArMfIX/r8Qz8KraUeT88JAp06Z3KcMPdM0wATgT60HHDyXZDuXgjZ'
-             b'3mEwMkXwTZv9ZKrbhzqdD6DVAckBCfG16QKk8t3ETgQf36PVqOt6fcQM1HJ/BM7olHR2djPZkJX/'
-             b'QDT/mU4Y6tkA4prI+AA9Q4B4AiwSFIhcMP8yiNCYnIhAv0c0fyCE6elJGB4agIsuOl+cBJpsSFkQ'
-             b'5ZEPgM4Lvq4xt/DTH3nf+9vNFrUMHEF4/Dce5JShE5R4AIklljgAiSX2CzcnlYaJsf1Lb73lr74J'
-             b'lfHlHbkMeO0mA55piGa+77XgrDPPgAsvWA/1elWn10W9T5kRWCpIp7OiuucHQupDrGwjgKtUEYxc'
-             b'F2R7hjD67wI7U4C2F/D0v4DKA5aB4OuDGUpfPoEwZ97x34DfI4XPSfEsAtOwpGZvRroBchxKp/op'
-             b'BZ8vdkA6l9dReaRDIGx9qfErOb5IcpDdA0NPFwwk7W/o3sFAhIJi2WDNJ6DMCDkt1OLYlc/DqSef'
-             b'LPMMtBQxpQzo5S7u596tz1y6+eknrwQ3Ne+w/BuPkDkSBiSFgMQSSxyAxBL7hRox7Oempxa//6/+'
-             b'5M7Z0Z3HpB1TxvjyRD0euAteownHHL0aLrr4AqjVK0x6MzX4EmC2mi2ugUfRvtDlDPACE0I7B5mu'
-             b'Qch0D4Jb7AUPAV85NrRIWheB3m/5wngPgecESCeCaPZHrH/6ohKCgcAPpgtmKsP7HXMBDO0IGBLx'
-             b'y3wBC+JAPvSl10BH2EYccQsh0dAcAOEmKHZ6NGGB1QujH4UIaMTaA3oOEfMjarUaDA0MwCknnQAG'
-             b'/o3qfqYSnQR6bgp/8eMf3vP2sFZl56rdavyfD/x9eXZG6xckGYDEEntN3GOTJUjsV2Pq32WeK8eB'
-             b'8tTk4Pv+6s++ObFr+/G9nVmR+MXIvJjPIW62oNFswsDgQnj9JRdDq9UUwp0GWc6cq5CHBBksueuz'
-             b'xn6oHLDx9fl8B+Kwy2AM3NYmWYOm12LWfOh77B5Tux8hMaW+jYjkF1cVDMm4I5AyYdBKc2xsWi1G'
-             b'ZdHdj9QG6YkWb8vGferq6YexvS9yH78MC5qv7XPLXzQfIPTidkTRLxCBYMDf83FF5EF2JvTO0fGr'
-             b'UKshguw/rteSZYtgbOwAHBgbB2VbnGFgB8CxYN/uHedv2frc8s7Ozl0+ayL8tFHpIp/LgBtNNU4u'
-             b'4MQSSxyAxH5d8FpJkEppbgQ7GwHEJ0BLZSGVToONUS+loi3TATeVBhOja2U1/u9tfgimdQRtijjV'
-             b'//Ycar9LBW37k+/977dO7tp2IqnYyUA7UvgjUBblvmJ3B1x/ww34fi5G+k0EUTMGP4jY8gTwVgAt'
-             b'/NHNdUKm0AMG7iuBnGHYIpijy+mcEnfS3PfP6fioFY8+KLYDETdBaRGhgLUFlDgGHnHrLMRgF8G7'
-             b'hn+W6JpmCGTzBVwbQ08eVBxF247Nx21ErAIm/2lOQFQ60IDOpEJfxchLA4RCZern+JItCPXWNfVA'
-             b'tA6kjBCPDG63Ye3a4+Hw+I/EGSKugBFShQPKM1P50uzsscedsHZXA9f2p0+9AVMTB7nzIRkqmFhi'
-             b'iQOQ2Gs/QJe0M0biNkbEFKoGQZg6tG/vcGV2auH+fftGZmdmRqYP7u+aGj/cU6/XOv0gsAxlhaZj'
-             b'lRaOPLbzqONOvLt/cHgDDez5t4J91qw3rJ9yEujbTC4LX7r1X/5284/vvXxRbyez+8PQ4Fq/tLH5'
-             b'0N3TCW9+8xshi+BfJcAydOR/RNugH7Sltz+Vg1yxF8F/AQvyeEELo3UHGtTv76S4g0Apqe1T+55h'
-             b'GJp/L6I9UcqbRvSyU8Csez8i97PQTsBZAJA6PfEKCKDx22yuoAf7GEeI9igWKpJ0frS7wRFigqGe'
-             b'S6BPQygVflEYDKV5wjTi1r8j4/HoNeyjMPEPmCjJJQ3PhxSu19FHrYJNW7aD6ZgQTTyyjQAapdmO'
-             b'RqkERzoA5CSQg2XrskoS+SeWWOIAJPYaNAYPBD87lQILgb9eLaX37nrhmOefffacrc88ff7E2NhR'
-             b'5dmpAWg3U44p6WXWy1PEKLd4Ch1z7BBEX/jJvfDwnfl3H33KWd+69C03/+WS3t49MtM2RhZw3CyE'
-             b'zk9rAZiuA/d940s3PPitr7y7vyPHAjqeT2S5gFv4aLwvke3ecfONUCzmEPyrca88PlPL9RrQpL52'
-             b'24VcVz9kewbBN1II/pTKr+N2XCYKmo4taXddAmACHwnmMIEu4IE6rPNvEPud+AAWtD1vnuCnh/DS'
-             b'ypk8KyBgIr7P6j6hZCTYMYG43EGOQShEAplEyPMIzBj82e1QR5QPIpEA5t6Z/B5gHIH0nAkQlUPp'
-             b'PJDaP2VB2GHg7IB0MNBaUkslaQLIeVOxs0diSpOTE87o6D5oNhqynvi7bC4PS5cvg0q19J93JGlu'
-             b'gxHyJEaL5zTgPtGsBTsLKiMZHzq3NNY5TKSGE0sscQAS++Wa4bjgZLJQm6t0Prd543mbnvzJNft3'
-             b'7zijPHlwpN2smzaCJEWBKWoVo5u5kpS0RTdvBDFTtfHmbQrRDW/iOdyeafjOSxvue+tnx0ZX/7/v'
-             b'/fhF+c7Ow+B7P+UEHKksZ6ZTsO2pxy755m0f+US3a1gEZCTtQ0x/k0G9AV3oFFx15WWQwedWKxV8'
-             b'T4eZ8USWCyTvDS0E72z3AFjZLkh19EHDw/2lTAPuJ3UVtFotBkLbFICnCYKWjeDeaGNkbkHQ9jg7'
-             b'4bXwX3xvjzMEwMN5LMeS1D91B3CKXQR7iGOgDD32N9SxOSOxVhnUtfooWnepdJIrQrMyrQcT678p'
-             b'LfYTZ0W03i+1G4ZKtx6GsTCQlATmI3OebqCULiOIzDBPSKAhRwiyc3NVeH7Hi+iwGPO5Evyj54fQ'
-             b'3TcIK447Geq12vw5oSyQGfxskSDiGxCI2w5Y6TSumcK1cskBcWcmxrv9RiU7NjaWm5yY6KtWK50b'
-             b'H7k/9/K2zY7X8ttT44en06nUgUMHDkyg43Y41dlVpjINlZYMPF/kIFB5JbHEEkscgMT+i4xAwiJt'
-             b'd6+pXn5h5ylbn9n8lo2PPfzm2cMHhjGeR5BHIKeoLJ3SpDpdZ9bUcwZmfI5lKp6+x9GmToGTY0DP'
-             b'7sy6MDe24/jvfvGT777uD/7iT450AEIW+pHo2EbgmNy7Z8lnP/SejxetIONgZNsOtJQuPodq/Om0'
-             b'Bddd9yZYPDIM5UoVgcERMh4YWkYXuC8f3AykuwYAUkVAyEYQkyFBFNV7IKlxiuJ9Yu+T3C9F475i'
-             b'dcImOgeOje/dEtIfRejUCRCQDG8AceTP62fqzgAQOr7Sg3d4eE8Q4zMIQcDQAE2a/haTC7PpDHj1'
-             b'OZEiVjLoR/HEwCgKlo2EyuK1DHSUb0QOgt4+zzU4opxA5ZJQdxKQ0+HrjgEH12vr9h2sk+Ck3Vih'
-             b'kM8mOkhDS5aNKqcIGVpXOUH4XxPCduPfvn5obHImDWaL1BYDd2Z6umvv7l2LX971/JmHRvcf32jU'
-             b'R0pz033fvK28oN1q5P1W0+Q1wsfWH98XcxxS6SxsIAfCclqZQuFQd9/A3nxn167e/qHt6ULXoXKp'
-             b'tH9uZvoFy3YPmW4mpMxFK9DlFi/5HCeWWOIAJPbzID9G21lolkru9s1Pv/7xB3/4WxiNXWx4LYvA'
-             b'r8MlYDM57d3iITg646xkGpwSVMPoOYQ2t6bJVDqKFg0t8xulsEPtBGx97L6b91945ceHFy99kchk'
-             b'FMXShD56Xr6Qh6bfzn/qA++53Z85NEK96x45FrY0tlF62rQUXHvd22BkZBBKpRm8+dvgg4zSpawx'
-             b'lQl804WOhUvAynSCR5mBwGBE9T0PbPzZIMDmCX8K2nhsjusysc2yHOYX0LFRJoC4AET6a7eaGClb'
-             b'DMSc2TCFNR91MASsN2CwBLGh9PHido04q+Ez4FMbXi6X1/wE4QJQIqVaLTGXgEoPUcAfak8m1IOL'
-             b'ojFB4haoeFaAVjOSYUJGVHox9O9lf4OoY0/RubFhYmoG9o8e5Jo+Fy/Y6TCh3mzDwJLV21Yfe/xD'
-             b'gVcRSWR6TdjmLMeRvD+KxA10XCBow8zExKJ9G548ZftzW87b8uTj6+uV0rDympmgWUdnQ6f9cf1s'
-             b'fA+L/cJofgG+r+tqfSE6Ok8Im23PaYxXF+07tH+RF/pne8T7wHNI5ZVH7/lGaXDJ8h0Di5dvXLZy'
-             b'9TPZfHFb4YSTt+B1XDEdV8oMSX9CYoklDkBi/84Jp1Q/3nwfu/8HVz1w1x1/sX/rxtNytoIuCqYR'
-             b'GDxfRuT6mkQGGviDaP48EfL4q82RsmXZCK4Gp85dfFDk30DgLFdrYDoWAzSVDrzGdOdzm548f2jZ'
-             b'ihe9Vshp5kazIWCGN++7bv/YP07uee6cYtqBZlPa8Zg6h8BQb9ThkksvgaVLR6BWLnHNXoh1wABG'
-             b'KX3DyUFxYAkL+rR5zJCOomnztk7bU0nB93hgD72OSH0mRrvEjqepeRTtM6mP5ILxOCllruKJe6Dr'
-             b'9npun26zU1rTX4f6DIzcGqgkI0KgTS2HHKVDlNn32fEgzX5p+QvmFQb1v8L0F+GhaAe4DBG9F72V'
-             b'wfx+ruXP0yu0oBBLBOvZgcRZwPPy+IZNWqRYHibXHkKotT04/5zXf8N0O6phuyLJCspazGsL8XVD'
-             b'2aJKaa7vyR8/ePXTjz30pkP79pzSLM8UHHy/NP69i7gFtNFUTsiHhmR3/Li1EddYj1mer/Xr0cea'
-             b'+GjjNmx2NEVvAWJtA7/QOLjzlBf27zhl+8P3QIjO3g/7F+3uGRrZsHBo5KHhwcEfpPO5fSTjTJdt'
-             b'4LeSD3tiiSUOQGIRqKUwctu7Z/dJj93/wz95/Iffe2shZZgLcrbcMBGg4to1yM2bbr6UPibxHWLi'
-             b'p9MpKGQLkMm4kE1b0N2Rh66uTgYv6m0n0lw6k4Kxg+OwcfOz+H4pTWQjZ4Lr7EVlFyBFrYT4sGoW'
-             b'ZHNZ+P63vvbnT37/G3/YU0ghKLbwffDvLUltNxEoTzvtVDjt1HWs8gdMmDPjPn+PADjbCcX+xSzs'
-             b'g1AupQiQlHoQzgv40vMdBKpAVHwY2cQhsKBZK4OFjlHQVhpoRXSHMxncSgjcPWAa0vsv4wV83jY7'
-             b'DEQWxEiWOw8gKhXIO8dlAiXAzEqCNDkQ1ww8U4YPaQIlq/kaIURpF80X5IyMrvBzLoAlfTE6DpSA'
-             b'rGJZpHjYsTgKpBJoKnDdFDzx5BaYmyvz8UfVAXpqw/Nh2fEnb770zdd/FIK6CCYpn7sLuYMC1wRa'
-             b'SuF1c/KWjRuue/JH911rNit9NBg5m7KhWMhKSYVbEA3NeUAg1/pFdKwmPnxTnEjOTOgOCloNUwmR'
-             b'kjsW8LVcTgIhPZp6hgM7egausbL0e8jKNmb2Lnvp4O5lu56yrn3qR/eUOnp7t64+du19q9ccd//g'
-             b'4kXPpPo6KqHRhES4KLHEEgfg19aI1V8rl3u+e8dX373x4Xt/LxU0MyO9OQQQXwvg6CgfozMCRwpW'
-             b'mxgV0s+d+Tx0dnZB/4Je6CjmEfjTDKSubXC/PEV0UVxMUSYBJJUA+PY+r4TLkrkIeC0JXX2uY+e7'
-             b'e2HbU49efO8Xb/2HvixlCRoYidus808kvVqzAcuWL4NLL7uM3wuPBLFYcZpd8TwA3H/bgZ6hZRC6'
-             b'BZ5lE+rBuGYkNKRUvH/UGZByTRkMFEhU6rjc7SDMeI48RWaX4Va34nF6naSBCbD5d76MAcZnUWki'
-             b'bAvo0/bIUTK1cyG9/aae6qcjeRUJ+vg6va5isSAt/q/T87xB5jdIf2HAan+gFQ7l/QNNADQkqjZV'
-             b'3BzAWQiWEzZh7NAEbHthD6QwgvejsgI5IXg8ZVzjt930W//iZgtTHn5vOSl+sbIz4Dcq7ob7f3D5'
-             b'Ew/94J0vbtl4QdioOVkHI3TXYFEjGcXscWmFy0pKbz0uUci5VkGgnSGTwZ8lj8gx4EFIWv2QMkWs'
-             b'lkgaDBZLNkuyQ5MrQRQTI20GWioL1ySfMth5alfGCwenR8/Y99zGM77d8v62Z2hoz0lnnPPDo487'
-             b'8du9gwt/5GSz7aDtJ65AYoklDsCvhxHBzc1k4Zmf/Pjyu750+/tKY7tXdxcyCBpUL8UbqmXodLPc'
-             b'UQNuFfOgjTfZhQsXwpLhQejv7cao0eL0LKXKOXrj4TsCYAQ0AUeTCCjkOYQGTE7NYSQukR9HsBQb'
-             b'4/PSuXwpqp+bKRdmJsaGv/DB93ysywlcZvwTsNNgHtxevdGC/oFBeMOb3spwzvV2w9GRtuLIH5w0'
-             b'dPYN41VMrPP51jxKnTNWanY86+vj71wrFQOIaQhRjjgONrWkEdNfD9EhB0fa6AxW8KPSAMkLU9re'
-             b'xYi4hc+1cO2azRY4yp73cvw2gp3H0bWvtfZFVMiAaJQvAbqJr61Vq9Bq1sFSP+0cGFq0RyJkPSdA'
-             b'lIJ03380I1DWnAcB0XwC0Kio1f1iCWL8iG94aguXPZi3wG6DZBhmS3UYWHkcLF9zUp1aDC03z89H'
-             b'RyBz/3c+9xsb7v/eb47u2HpsykJnLe2AlXPF0dFth4F2QngWgdYIIOcNdCbJwnXv7iqi0+XKOdHl'
-             b'EP6ZnaUWA7xL8sstH6qVEtRrVVZ7bLY8FnwifQXDEk2FgMWQTN5Wm1o1A+m4EIon8HjnFDqE+YwD'
-             b'fnly6Y+//ZXfffi7d/72wqUrnzz6hJPuXrTyqB+sWXviZpXO4AWcsAcTSyxxAF6TJtF4o1bL3XPn'
-             b'V/9+44P3/lGXY5jFtAk+RnktAuBQ92UjsNFNu9X0uL/+mONPguPXngiFjAsTYy/zMBkfb5Zcww1F'
-             b'olYiUelpjwbZ8N/xPj0+PQ3Pv/ASS/JSRM61YE7VG5Dv7C5xdMnOhJf92ic++LH65L6luUIagdiT'
-             b'zIHuuc/k83DF1VdDNleEWk1P91PSfse1eisDCxavAt/EqJZAmIABJOWthEovqfFIfz+MQFMyFzJJ'
-             b'0AArlL58yiYQeASe6OgTqdAybQZ9Uu3DtcQIOsUlCW4fJIGcTAYCdAICk7Pm0G7WWEiII+xQHAnS'
-             b'0XfcDK+HRPOs4gMpdMxCadjnNH6kChhENZMw1MJGGujJGdHDg0Ld5690B4XoChhxplvEgnySL4Qn'
-             b'Nz0LM6UKEx0FRUXQiBLjbbcIb/u9d0Mqu+Af8McDYeBt2vST71358He/+gcvbnzs9IJtQm/eQTBu'
-             b'MhhT+d7U9XkqQ0iUrvi9JE2vYOniIchl8pwFSeN6DSxcwCWfkJ+nxY105waXPExmKLIT1UaHgPgc'
-             b'1BFSLlVZRZE2PDo6CrMzM+AbdN1o0I8YjoF29jiJYHLWKtJTSKOjgQ6tcfjFrafv2rrpdLAzf3fM'
-             b'2pMfOfPCS7+45oSTv2tnc1NgO8ntIrHEAUjstWMO3ngnxw+P3PbB//Gp0e0bL+xJi0hNo9HWACS9'
-             b'+oHXhCpGrYXOHjhx3clwzHHHwyBG/kTEmhzbCxTsGxh1kx69MoKfiuwUy9/63CdPDoKHwEnvW5ks'
-             b'Q4P67BF8Wu2AHQO6UVupPPT191+Gt/l78I/1b3z0/R/Z/th9V6QdIvk1MXozpbrNzG+A889fD8NL'
-             b'lkKlXOX+cp6cp9PvLbzpF/oWgWdnWNufe9xwz7JdXdBqVDGCrUVukG6tl0wEZ8pDad/j6Bx/ScBO'
-             b'Ub1tuxxVKnZcWiz6Q2tlItiTU2A7Dkf1dFw08pfyIBTJsx4AEScpWsX1NHTqW4AaQSidEYdJpwl8'
-             b'XG/iHMxMTEpGgB0U2n9f47MWBA6l5S/uBgg0gZAyISI5CJFWYKjr6fHkQe34zJSb8OzOPXxslPJn'
-             b'bgOe1ACBfaZcgZMuvwIWr15HL1kxMbbrc1/86C2l3c88flxGeWpBIcUZmdCT895uCSmwxVkdyYpY'
-             b'uMGOfA6Ghoegq7OAgO/AwOAAv1/I6ojhPNmRGxmY7aD32+BrBzzhDvB6cWnJ5WPqLBahu6uDs1gD'
-             b'C/o4M0BDluia2rx5E9TwmqmUa1BHh7bO0bzB8sihbi0MdGaFjxu3kUu5NGHR3vHkw+ufffLR9T3D'
-             b'S/efcvZ5Xz7/0iu/kCsUt7XlYk+aCBJLHIDEXr1GY2Zf3Ln9tDu/cNvnK4f2rBjoyLPQTQujXlLr'
-             b'Aw2k1AZnZ1JwxqnnwfHrTofhpcuhWi4jeDL7jlP2HKsq0YuXlnTdg04397YkXgMvBAnMLZitNOCp'
-             b'zc8xf0CR/K8vaX0PnYDigg4oduRvxjv+ks2PPjD28He+/rb+gsOkOyYgUr0av2q1Brxu/YVwyuln'
-             b'QpkEaag2HzDyMAI28F6f6VkI6a6FPMpXV8L5xl2v1jiVL5XlQLfU6SE7So/eNUQUh8CIwCmNUTw7'
-             b'MwjMgS4BUCcD1fxF6yfgFjrgpsOAAZHHBIfCZidA5WgbwR83CFHjXsAuQsDRthGN0FXCj6DMSbtR'
-             b'l9ciGAvnD98z4mOIJCNnDaSUIaURJsRFqoLCrAQ5MUqr/inRGcAnEe/j2Y2bhTRJHQ+Bivke5VoT'
-             b'uhYvhxt+94/w2piFR+65E+79+ueWtGfHocsl9oTFI5M5xY5fjiUATVmRVtCCfCEHC7o7YNHCAejt'
-             b'6sRI25ZMED6/Xa1CW1W1k8UFglinQcJ0zWPQpRoue3AZKXJspO5PX7R2UgZR3EZJa06ll1NPOgGP'
-             b'Lw1zs7MwNTUF+0YPw/RsGSZn5rQTp1jJ0uBWAsF1KiNQ9qo7VeT196sTw4995yvv3vTwfb+/+qRT'
-             b'71p7+tmfWXXMcY+gE9uGZORxYokDkNirKulvioTv4w8/+Ft3f+W2W+x2pbOAAE+qeG2MWA1dFyfQ'
-             b'aeM3S1ethtdfdgWMLFvOI3NnpyZ0GtfULWxRPVxJ0zqr7YW6jU1pBTwdSSsfDNuGw4em4eD4NN6s'
-             b'c0wk5LIAvqDabMI5p54ODt7Ey9MHz7n7y5+FrIUQiU5Evdli4l3GcjiaW73mODjv9a/HCK+h29tC'
-             b'DUQhs8BTHV1Q6B1BeLAQoyi6syFdKLB8rUNRfL3Mr5GIUN/EQ0mv+zqyNnWUTnr8MuPAj7XzGbT8'
-             b'MI4klY60SYvAiDoHuHxiQ7tZFzEh3H+/VePIO9AcAuH0STmCV4pkhkOlq9VtdDCakhIP50l5oFv3'
-             b'5vv/fT3WN+7NAJ+4Fka0Xdyaof63aYB4SI4LL+w5ALv2jsqsBV3zZ5VBqr2bDrzjD/8cKjMT8P6/'
-             b'+Qs4vGsbdGQccF1HuB00D0GBHrtM3Q8hO0j5dAZGlq6A1SuX8wRBOsleCx2foMmp9zDWJhCuA0SP'
-             b'aIaAoVtL4+nHmihqQDwQKlQRVwLEkQvlOIkXoNsBefZCu17jqD43NAjDg0PcVfL8C7tgeq4E9VYb'
-             b'DowdEq4JtamSk0VOh2np7IzBjlEOPx+W6WVf3vTodTuefOS6wRVrHlx/+dXvXXXC2h9ZqUyLWyET'
-             b'SyxxABJ7xQI/xWtUM63UC9/8wmf/efND3/udBTkXlGvzIBuKvknoxcHIk9LPxa4ueON1N8DylasZ'
-             b'KCmKMnRqP2rjmp9EpyfqhXrsrCEse8XBeBBx0/imTmntFjHgaSZAwIG7luZjRILjTj6dt/XVT3wc'
-             b'dm56AvqKGdbMJyfAsKUDger+r7/8ctbbJ3D0Wz6z7AnoKc2b6+mDjoXL0YGh3n98LzeNAGjw35kE'
-             b'R0Q9jthFOpbAmTkHxOnXLHuliXIMhhrk6Hh4zoCedkcAK3N6KXT0NdlNT+ozpf5M7YPc/sglAnIE'
-             b'GuIg6UC3UipDJpNmoiW3IhKQhYrJh2Vc89mpce50AD1RUJMloE0iRIbU+7mFn7P9BNxC/TPD+Uha'
-             b'MgUhOyTMbVBSiy/X2vD0lu08xInOjaFHE9N3NQTHdeedAQf37IBP3PJ3UBo/CL2FDJ9yXzs+XJAI'
-             b'ZCYCAW42Y8PaU06AQYz4Xdtm4iSNRwbuGtFyxFy/8HTWBficEPcjYLEhrVSoDL19U6tGyrHE8kCh'
-             b'7twwohmIIm4QBuJUsaCALzkFdqWozZFIoUTU9Ftw9LIhliHO5Ltg4+YtcOjQOExOzfDY6FC3dUZc'
-             b'BZ4ZQU4LtICLDmELRrf85PxPbd143qLVa544/cJLP3Lq6Wd+Gx2BBn64khtNYokDkNgry6g+Ojl+'
-             b'GOrVvd1f/9xtX3v2sQfX93cWebwr3RzbbRlrSzc8iqiXLlsGV73xTTC4ZDGz0DlC9TW5j5FPsSiN'
-             b'GerWOS1fq3TbVqhTo/PpXPEAKK09jjfarduehwzXvCM9e4ncOnoWwuKlK+Hhu74FG+6/G/q7Cnwj'
-             b'bvGUP7wFU60Z9+HNN9zELYckIsSdA/h3Q4moD4F+pmsAfCuFxxWAnc9x/Z1a1zjNjvvs4Y2eCgmp'
-             b'XB5avA1NUlR+pDobj80N5+fg8DFQxoIdB3pfautjUp4hfezsO3gMSAGTA2UOgGwAt4X7AFroh0sP'
-             b'+JpUVFoIg0hygCN6E4+nVpnjtL6tRL1OygygY94w1i/Q/Zk6La77+zWI8QhgTQTkv/hS4khls7Bl'
-             b'5/PkEEI6k5UIWh87OVaLlixlAuiXPvZBSKOXVki78VhjUQwMuT2UgJ/KIytWLINVy0cgm01x1wOx'
-             b'8/nckn/CnQY2SxVzFoh69UEEjCDqDAjEQSEGv8GiUCLiBFprQcoD8zMTQt1dIB0RAvpRYoHWhFQg'
-             b'tFsgpFAifQZSTqBsVwvBulquwfLhhfgYxPOQg63P74DRsUMwNzMH9UaVhaEsy2V9B5awBhoDbXAG'
-             b'yTBMNbvnudO/+uFnTn/47tWbzr3kmluOPvHkOwJlJDWBxBIHILFXjlGqd3Z6aslnP/LBL1YO7T2j'
-             b'I5PiyMzzDK6X0q2TQJEU7c69+Hx4/cWXMNhWZ2aEwR9L0Mq9zWCmv8FtfXECwIj05/VceZBOAENH'
-             b'oHQLpzTr3tGDMDuLUW8awTfwY0Z6AyPOU045EyYPjcGXb/0QZEx5DUfQ1MtNvejlEpx6wbmwcvXR'
-             b'UMEbeDQSlyJBltpB0C/2DYBKd0DTk8FFFP0TMY0AIYwyBiT0Q/K+rTan7B0nxU5Sm/T2ldbXiWca'
-             b'SITNIGREwkHkRHhMGmMo5yFHhKEe74vF2Q1f5IQ92X+FkaffqnAWBTTgMZCaloB/eOSIXnEIquU5'
-             b'2Qde/EAr5mkA5jZJDZ7aWVE6fc7iPGq+m0GcMF+iaHz/XC4LL7w0Cs88t4N7/lU4TxKkvaD6+cED'
-             b'+2H80H5IYyQvREgh63FEThyLZh0KWRdOXXcKDC0aggw6ES0PgZ8mCbp5SBfSLJtMRFE35YCLDh/N'
-             b'ZKBWwBDXgmR7yeXxW3V+kIPXoDIPnudquQqteo0HMAW6AyJU4vTw5cbnxdfHLmx/JkeGKnakAjU/'
-             b'l4ivSW7yMOL5FPRcXkNfRjy3m1VYsXQY1hy9CqrVOry4azfsO3AAqpUaD1JkGWZd1hEnw2etCNc2'
-             b'obrvhRO/+q/v/drqk8+++9TzL7plwfnrfyLXRuILJJY4AIn9qgzvP6lMGva/tOukT3/glju9mfFF'
-             b'uZSFkXObyWctr60nvHncUnXjzb8BK5avgBICLQuwaMY1CdwJmAS65UxY2gz3HMBHABZqUR9hqBs6'
-             b'8o1k/loYpZHYTNpNyUyAQNj8ovmehTPPOgfu+OwnwatO445Ld4DSY28pPdvT1wsXXHABk/gCnqqn'
-             b'xBHRaXDDTkPX0FII7AJPIaT6OYkGUcTpWwpsBPomEQYpm9BqcMrfdTMsUhNQr3mEDYaK5xOEQVSr'
-             b'DoXMB7pjQZMFidhnxhG8oYmK0ZQ/k0sBBP6t2hygxwG671C2yYvq61NlxAx9Yr03cf8a9aqcgzCM'
-             b'RXCMUNL6vGzhPAuAeQWhzsIYKoI93RkgWRn2lRCQy7gmW57fyWN1jbjOLscY6E6IoN0GRzkyIIi1'
-             b'FWQENBND8Xjo53WnrINj1xyL626Bmyuio+nw/rmkl0DzEJj4iGvbasu6+JJBInneUAssUWbAJEKh'
-             b'IrkGxQz+Qqc4SM1mg/+dnZlkh4MyPSHPRIicJB94QHMY6A6O+clKYaQcSOitWz0N8WR0K6SmHuqp'
-             b'lKRrQcfXqFW47fX449bAqlXLYd++fbB//xiTCInUqagLRQ9lIqeK3pfErkzLUC8++dAVW59+/KLn'
-             b'N2/44hnnvO4vu3r7D0cdJoklljgArwFTan5m+ys67a+kze/wgdHVt//P93w5LE0tSruiykYAQyl3'
-             b'yww4knUxUr7+xptgZHgAZiYPSVqbFOUQ+XnCHKdwo944SV9HqWW6CQfR9Dvd629Gg+i1qAspz1Gd'
-             b'eXpyBmZmZnUfvzDNCTypG2DlUWvgpT074NknHwLS+dfvwml7AnsSGXrbW96EN1sF9XqZJsJRbkOe'
-             b'hf/5lgsdA4sBMgVgJUCKGC1LXo/Ak853MpnNtaQ27abyjAPUqhdQp4NjI+g1JEI1tGRuBKg6tRxy'
-             b'GtnQkbJicBPmPKnP0UfEi8fvEqAYehaBV6+Aj4+ImS8peTXvpR05zkdzEKYnDuH225zslzwDgamh'
-             b'iXG6t123/1HJ29QdAYGKm/xlDbWjQftCC5XB9bn3R49y/3wKAdsLo5VWcc081GOEqcOBQNXgUgaV'
-             b'aUjgqQ1HrV4Fl115CWRzeU6H07S/IJRMBKVPaBxz2AxFx5/31+LuD9MQeaFI7Ij6R3mdwJIWUtz/'
-             b'dssXEh7ur5stsOOTK3ayzDStTRmdgZnDB9GpqMfEv1BPg5SMiKkPP4xbImVljXiktAp110TM8Qjj'
-             b'KkpUzmmS+BJ+iI5atQKWLVkCBw4dhhd37WFHIIT5QUucfTHEQevI0whpz3nq+3e888Vnnzrrimvf'
-             b'8f+dds55d1JiKPQTomBiiQPw6gZ/EIJQm0lgr1yxUO4rz+fg0P6X+z/69//tS82J0ZVpR8bahjr9'
-             b'zElUjxvK4Pobrocli4ahMjuluwC0CLzpS6o6tDXnT1qwlDFPLosALYzgQ0e3MbTpZSL29UsYTVFa'
-             b'OJVxxJdQuvUKH/lsGh66+5uQdwyp6VOXAUiU2GjU4YorL4KlyxZDqTTH+2aFDgN3m0f32tDRNwJO'
-             b'Rz9eqRm8Cbd5n5hoiGBk43tXZmfYEQDHYIAh5ThyXKgNjFLNFIEbRBZsCrCoWGpXt8XFhLI2ZxS4'
-             b'rKAkCqVD9IJ2TByL6tsUbQcI/G2M/okdH0YpbNINMBSvheJpeJZO/WuAwvUoIdAZ8ftHIB4x4DXR'
-             b'z5Dfm0rFTkk8legIkSDmbHC5wYaJyVl08mYhjQ6Up6/qgEAzyuLwBEKRDebvDVHXo4FMJAZ11dWX'
-             b'w6nrTpYSUiCzH4CJfKaOrPXwAJ0xULp8IcQ9PbNAd0GETJQ0dOuoEDBDBnBDt2iGTBIMuQxFcyFM'
-             b'6Ojuh1Qqw7LM1fIUO3WsyhzoLAWPVFaSudFcgWhCYmCoeEyy/N+MMwaytiJexV0lyufvG/UGH9Oy'
-             b'pYtheGiQs08/efwnMDNXZsfFoC4H/XmRchLuo52B6vj+lV/48C3f3Pbs5k9d/1u//6fV0mxZMhSJ'
-             b'JZY4AIn9Ao0GucyMj3d/+n/+0zdqh/adSAN5PK+pB8HgTQpvdqVGE/JdnfC2a6+FxcPDUCtNM6AF'
-             b'mmTG0TXf2PEm36hilOdKJBhNnuHRrKbUuhmFIha2vD6IxeYVv45q/IcnJ3lQkNLKcLYp8+u7erog'
-             b'YwPUpw/j7xR3Iyhd+201GrBk8TCcedppUCPFN6rhUy++5fE+EtEv1dcPxaGl4Fk5kQnWXQpUf+ca'
-             b'PJG2MArNduShiZGj7TrQrJOevcVlEOpMoEwA997bKY4uAz1K70gNem5rtBxWCLQdGewTahEZac1T'
-             b'7Fg4lg11T5gQrXoZwnZTZ0t0ql2TJjlzgADL7XqBZsgjaM5OT3DbnGOaeq0DHbxqhnooKX0eFkQR'
-             b'OinfibfErWtRliqM9PYNiVgbbR++/8P7OcXN2QleS19GG2uNAEPzBLiMYYqz2KjXYWRRP1x+2cUw'
-             b'PDgIzUZNOxuiusjgjs4BjzcOhNFP7aZxoiyULA7/jTJGFPwTAJspMFMWp/2V5kKwqBCur9dqgOH7'
-             b'mugYcGZBceshMGkxm89AV283zE3kYWr8IA9povdX8ehlUzs+QVSMikmF8TV8JGkyknemrJBO7YMu'
-             b's1BWqDI3x9slOeIzTz8dDh2eYMLgwfFxWUtDHAk+Nl8xd8LFfXn6vu/85syhQysvvOrqd40sXrYr'
-             b'KQkkljgAr2IT5rE1H9q+wowV6RBYPveJj/zLgRe3nFVMibpfqGueFKVQzX/Bgn6Mqi+H5RjZVDCq'
-             b'NnX0JjdJU0+lE/BrYfRHtd20ldHtXLrdCvQ4VRUeURaRG6qhU9K0Tg7eNHe/tA9K5Tn+3g8kEUwK'
-             b'eew04HP37t6JgKdLBroOTandQiENb3zjFQhGIU/QlZazQI6J0vFOGrpGVvBoXxlBrDhSJcchhcAS'
-             b'mHqOAbX+URqWuAikzZ9KyTAhitxIkdCm19Q5IyCAKW1/kRKgALgh9XVlakKdF3c+mBr8qe/fQweG'
-             b'Sg1tiv6rczqFr1glkc+CZty7blaY6vEsBAOBrAqH9+7B/dLTGcVlkDY5cQV4LoARkf/0KFxLaWEh'
-             b'TmvoCYNKOjTIscjmcrDp2e0ctaeoQ4IzF6FO/4fz9S1a16jFk1pDcR3POO1keP0F53JPf4PAn7ND'
-             b'QgylTgAWTfLFaeAOCYrWaQiQllWm882OFQ1PImcMv09lCvh9WtbWoAFQlk6th1z68OtVqE0dZr0G'
-             b'KlUZan4ssLRXSnki39UNuWIBanhtTR0+CA0aA01rYGo5ZSFLgE4IxIAv+kgqzgBIZgU0gxL09WXq'
-             b'cojwB0TQyuex1cNDC2HhUD/s2f0y7HxxD1RoQJVtc2ur347cR3RW8OTv2vTYOYf27/nxpW+56c/P'
-             b'u+yqLwS1JBOQWOIAvCot1lR/Bc4LoxspjfK94/aP//ULGx65Np+yuW7rtbTgDP6PFPSOOu44uP76'
-             b'GzgtTWx6nrMehlqLTfrYQ57YJo5AKpvjbfuRipySm3YNwa08O60nzSndISY3zED3zhtK+u/3jx4Q'
-             b'Jr4/T8gSARwTapUyZx+I6e9p1TyaulfDqO6yS67CqHMAqtUqvqcZ8wwCkhU2behZcjRYuR5otHxm'
-             b'r1NET2xzitI5QkcQaDVrLEAkBHzS17c5tWuhM0IT+tgZoLo1yPhdopYZoQdwxLC6SCOHwUPo+Kyb'
-             b'T7r+1I8f6H5/AgDDdiD0WuBXS2CS16KErU+McnIQbNJeIFZ9PAJYolQimFXGZ0DheeEBTIbShEMF'
-             b'cT8ia99pByUSzuEJgB47pqEWMeJpheTIERa6FkzNzMHOnS/w6GUvCGLxJlMT+yIFwoAVEYVJT1kI'
-             b'Av7XnXU67we1B9L6iGMnkX2ohYakbEIih7juYVMGIKXSAHYO0n3DkMp38tqk8kXWEWAQx4vEzWbF'
-             b'UWrVhRdB5xgfdj4NeXQUatOHoVk+BI4KdOlKaWDX/BN9TjOFbsjkOqGEz584OMbjoukaCnVGQI7P'
-             b'nL/Go8FJUq3QXIEj2iVDNZ/dgHkZBslmUPmoxedk5bIlMDS8CJ7dvhNe2LUbjz9gTgbPbghEIpo6'
-             b'RKoTB/o/86H/8fmxAwfWvvmdv/1nyjT9JBOQWOIAvIqMbpiUKq5Uqgge7nyf0SvEevq74bFH7rvu'
-             b'gW9/+e+KrhmToww9FrZSrcHQosXwxmuu5tYrr+1rglcQp6ilDhwg4JYgnSuKVGuo9X5B2NeBBg+q'
-             b'h7apfdAATbAyIND1ck5oE8AgyB4cn4DR0TEuTTQpjWvMz6+PwNE2tb49AhIR8rx2E449ZiWcdsrJ'
-             b'UK83ecJfqGVtacY9gZHK5CHdO8DdBSTDS9kNumGTdK+FkaYfiKiO0vPiPVbjoxY2n2/MBBKsb2Dr'
-             b'2jcR2qg9jEhtnn8ENS+6AOZH8MooYRE/jGbbs/QvZyEQCDFSblVKRG+L+PXgoqPBKXqZM3iE0ySg'
-             b'SvtDJEzmRTB4S7YpXium5ysu0yjf17MAgEWIQp1qhyhjEEQaDZL23rT5Obxu6+BSP7/0NcYJG6Uz'
-             b'PcIFlM6GCu77lVdcAuefeza0MbqVsQKOHkOk4ixQICE+vx+PA0DwtlJZSHcMoKNiQ7ZrITgdfXze'
-             b'sx0F0XQwZEyz365BvVbn9kwzBL1fPheqCEQDKw3pnoW40Ta05g6L2JGSPkeq8ceqgLR+ofAuiguG'
-             b'wMkUYPIQtfDNCT9Cc1ZMPQIaVJyokt/p9H3sXEA0W0GyPvNJgkh5UMigVD6poAM4MDQMVyxZCtue'
-             b'fx4e+tEjUKo0+FpXWrzIYMfKB9dV8Njd3/xjdAyyF1x61R/gZ6/1ygwlEksscQD+bzmAV2QXQCqd'
-             b'hl3btp709X9930fTyjNCX7OyefAJcO17ybLlcB1G/mkEWLrBW06GgSiK3MN4bIwCx81pzoC+X+oR'
-             b'sUKtllS8j1EetWVx6SDQ41/NaJkCvknbtgXTs7MMFF6gywLRoCEVjbOVVDQTs5S00hULWXjrW9/M'
-             b'dfpGvaVrygLABBGA+7dg+THgKZsjSupaqNdrkM1koVqusNANzTawSciFCXfC9meQ1zwFmkJXLU2D'
-             b'R2UMku0lVjzxBnya4JeHRrUs5DtlRLAXOwQy5MjjbIPBUbTPExTFWfKgWZlk1jvLC3PUqJiUGCWg'
-             b'BVx0ox5p0qMncWj/HnQC6gxaUirwtcb9/AQ/mfbni1xzKLLD1KoXMClTovBAk+goFW6nbJiYmoE9'
-             b'e/fjOU2zTr9Wc4jb/qTrQ7spuE42buONb7wKna8TeXCRgJgZp7Wj19F7elwKcMEpFMFG4LUyHegA'
-             b'5MBw0niKOqHZaHFGxFJNdBirfF6q5TrkCx1Qm5uDfDYH7bgNU1Ym0A4lt9sZFjjFPnSo0GGtzeD5'
-             b'1JwAdYQDE121SmYKpNBxHV5Z5JLAzMRBmUKoR0ArXSoxolkJQkfU7YJa9VG3VYZa3TJqt1S6DBBN'
-             b'LAy0a9fA6454FMcctRp6enrh8Z88AS+8uBsMUljkUo1wF+gck6zwEz/49m9NT09lLnvz235TOU4j'
-             b'Zkf6fnJ7TSxxAF7JRmm90twMjCxdpmfe/4qzEvjI5HNweGys/5uf/ui/OI1SJ/cnE1Odxve2PXBN'
-             b'nnICl195FeTzGWjQxDSqdUuuX8qk+ENlbpYBlCJgx05x9EO31Gajyul5qt1KF6DPoa9opvsC2iBh'
-             b'qoqiUCW1+CkEn+ee2y7906BJXTqapdIBs7xZ2haYYW/SvuL2X3/heujs7kVHpXKEfn3IvIE6qQYu'
-             b'XA5mrpcn/vENFu/f1JZG8wxcBBXRlA+Z0AXoDNH+y8x4C0E24KxAq6F1+RFQaNIfgyfJFVspaNbr'
-             b'UhrRg26UimfJigOgletkkFGbOQAEKJZtQgPXMcDI0NZp5UA7LjyS1ohdCNHp53S9BbVyCeamD7Ok'
-             b'samH+7BjZcj3Ir4EcccFJx6UBvPQlIE2oZ4noFvbQiqjtDx4lnr+o3q3ipv9GCxbVDrB0JpoAz6u'
-             b'fyabhmve9EZYfdQqjKDLMsTJkKwA8PnymZVPLaJWugsKfSNg53rAQdD1ApNVDexUBtqtFv5s6HHP'
-             b'Hl9vbTwAivipTEWlI7puSZfB8Nsy7lcPABJ5YKVnKhDfwAW3gOe6TWqONXbI9HDpSP5oXnVSp/oJ'
-             b'pHsGhnnuxcTYKARExIyElCgbpCcxKj01MdQtEEqXZI7MZJEXaGiSpKRJDN01EeihUCLj3MBz3tvT'
-             b'yWTJp55+Gh57/ClcA8X8BgJ/Kh2QgFF33oEXn3r4hjtqtfzv/fngzYZpzNJ1kMsX5DwmlljiALxS'
-             b'43+JAkzTgFdCWw/dXKrlueK//tNff2Nm77bTMw7e/HzNBKc6a7sFvuHCG970ZhjiNiYEVKqRM4HN'
-             b'jFvc6J6WzuaZxCUxkaSYqe5umkeQHiOxFWamNyUtHk+ci7TZJWVNTPny9AzMVao8pY0IYwJY0c00'
-             b'ep0hA2WYW+fDgt4uWHPsGqghWARBNBRWiGYtjOpTHX2Q7VnExD9SF+Spg8Qgp3q+m2LwMfj80ChZ'
-             b'm7dNbXrUikhEQEqDE9mOOg54AiFGbfVyOdbCJ5DjqXCc3RAGfpS4jwCYuw0oknRw+744LaS4GHoN'
-             b'aJRnWOQo0D37dIjtZoNfQ3wKqetH0weBnYfSzARvg4BCT1zQ3QfiKMU5GkNkiv0wGjoEnP2IeSkq'
-             b'mqIXctbksSefhr37xiCXzcSRbKh7HAjYac1NkOE/lL6/9ua3w5KRESiVZqUEYRha87+NTpqSmn73'
-             b'QnCLvYAnAqP+DlyrDDoa1N5JHRQeNKOhUqQwid+nczm8RmeZb0DZDepIyRSyDP5MBCV54jDOr+ly'
-             b'A4jDxHwSkx0Mvz4L7XJD1+qjXnydozK0NgKIZgWfRzzXNMI6g689sHsncw0MrSg4z2HQixiER3A+'
-             b'9HCrUOShucVPf9ZjCQZpCubyBGUAnHRWpjeSmiH+e9aZZ8CCvj647/4fwexMiRif/DqPZ0EYUHAU'
-             b'HHr+6as+/Pd/cduJZ51zYyqTrp1x1rm4r3k9GjuxxBIH4BVn5KGX5ub4xmYzsexXVw4Q/X7DuPXD'
-             b'//zxl7Y+cdbQgm7pdWeGujyHotNrrrsO1p1yKkZfNek752S7Zl2Hkqamh40RPmiGvRE7ESSSk477'
-             b'10PNFfAx2qE6qxnNnldGXHPmvmz8dw6j92cw+g/jO6upb9KaDR/NsNdz6U2Owny4+JLLIZXKsmCP'
-             b'wSptUbIVAUU50LvoGDAz3UACv4rb2WSCGwE9cRKozc2jOfS2w+dJ2rRMztjQOatihE7iR6QvQABR'
-             b'rzW4nuvksjx+V86zydmeQMvtgiaIxZEniRkR54Cx3IQmRfxGyKz/EAHOiNvNmCovpQfDjzSG4wm9'
-             b'dHwzU+MwM3kYLNbIl6jXiCLbuCij5vX9w/g3fJ5DrZMfxoBoMNFw7+hhnnZH0r8NXAfLsCUDA9LZ'
-             b'YOuOAsoAkOri+osugcHBQZZcDmPiHCk44jvZedZZyA+uwLtBVrJBhsMkU4ecBARyUuujuQUE8kzC'
-             b'xC/blnXi7At5L5bFDk8Dr0Vq9yMOCq0Bt2sqFZNMpbwhaoJ8+TAxsAO8Ou5bux63mMbdDlq5UdJZ'
-             b'4hDReaGPg22nYWTFMXDg5RehVpqKo2xuV4yuQZ41LM6dodtUlVZtDPRZMCOHlfaLnu/LJ6ler0MR'
-             b'ND8mlFbCeqMJy5YtZSfgkYcfgxd27gAXr0fSWNDVCFwKBTP7drxh42MKzr7o0htM06wnd9jEEgfg'
-             b'lbwQeAPb//LL0NM7AMtWrOSo81dlJkZ1d9720T/f8sh91xZTKZDR82Fc0yfxlrPPXQ/r1p0GdQRG'
-             b'mYBnxGQxAv9avQrptCvDWgJhAZLIi01jaQ0dkylDR+wSPdINvIog4eEN36RxfqZWY4tIeiCM/gP7'
-             b'D8HogcMchfMNPTR+mvgcSJpeatwhq70NDi6Eo445WmSKI5Y7rTulyfE9upceBU7XILQ0yVCY+wYD'
-             b'vWVakZfG9VRyhrg+TxGcj4BHmY9AyHhU5kinHAT/Cu9IvqMDqqUSgyE5TdynHqXuo/pvpAKpI2lD'
-             b'k0K59x+3hd4DtGtlXA5dV9bkMwIGjn5pHQLJHEQSwwSCJQJ/LtvodD8E8SyCqD/d10w0pcFQiPDz'
-             b'RLhAkzepnCADfQJ4ftceBkGWzCWQpaMKRBfA4nqHz0tFKfpz118AZ7/udVCrSY8/7wM5Bh5AuncJ'
-             b'uD0jYOW6ILRcbvOj6JqAnXgFxL1I0WwFP5TMBMjUxhSPbm5yJojnOTiOqP3RucLrw+eSCfEuWqwj'
-             b'EGXYouJWNCyKnRZqtUzlQaWyTB409XkJo3bTaLzwEQ5poJ1SlkLGcz+weCUc2L0dmpU5TtuHRwxA'
-             b'CqKoX2sZxDoK+kI1dRMmhJEyZKjnLoTc2sodG5qvIZ20Jp/LYkcRLrn8cp74+PzWrTGnI2JiZGwF'
-             b'4y8++4YNKfe2089dfyN7iWHCBUgscQBe0UY97cA3tl/uhzXKOJjpDGzfuOHC+7/9tX/oyrrcdhVq'
-             b'oRhKqdKNd2jRCFxw6eXQUi4YLg28aUHQrHLKmEl7RJhKZUTwJQqoSDCmhs+h4S2Wmmf/g4ybpXQ0'
-             b'gWqLorBQD2QhRnqUj+ZQyWDBnLlSmUsKLW7Hs4+4vUeDa0Q9DbjFS1589rnncj91s9mWND6x3gOa'
-             b'CIiA0tkPmYElLPvL0XJEFAtklkGbxHMQiFrE7jdkkBCx/UlmliVzA5HotamDA38m/QOHZsCDODQ0'
-             b'ma9WnuUUMaWzm/WWDDkKwvlZ9UorIIJwD6h2TRPjwhCjfgRUH/fB0OBPjgRnNnAtpJ9cK85pbXoC'
-             b'wZnpw1Cbm+b9ABVFsdpHM/RAIs3VIAlb7rtXerCPkol3ZqzDKM5dGsHmmR27YO/+A1CkaYh6SDHr'
-             b'D0QTBPF7B9e31qzBmpNOhDPOOgvPe12r4lniBOH2U139kFqwDMzCAh7XTOez3RJni5yuNoI3dcSw'
-             b'zoSS11I3A0X+VPaQc9nA6yzF4ks2XofkEEhHhsWlGBP8uMJkaDGdKFNCjlqoVRbJEU3l0FGrTus5'
-             b'AtLhQQ4EfU/cDblQTZ1NCMXp5OaCgB3RBUNLYXz/bmhVSzJciZ0xTYmMuiHDMM4QgIqu1iBeZXoi'
-             b'TUoMgkgfYl4ICsJ5mWAiXJJoFUlTX3jxJXxcmzdvggJ+trijiFtBQ+jKu3DoxS3XPnDXN5+6+E3X'
-             b'f9DK5OanSCb2i0jjcudKYokD8J+LvBFUNj7xOBx17NF6lOsvrwxA6nkmglytMlP4+m3/8h43qNtE'
-             b'xOOJdAz+cqPv6OmF3/j9P4bO3kHS/uOULd3EmnMT0CxN4E2vwdEL3YQJyESL3eIbWL7YEUdXzLjW'
-             b'2v9MoNJRUIP68kMRfpFaatQkJSDZxteNHRwDN42RXr3J+yc3SEOLDOkJd5pU1WrV4KSTT4Zjj18L'
-             b'01PTultAQM2jjgYE2ULfUnS6igJ5zPXS6nNEsCJRH3JM0PFRMi1GD7pRLBpDKWrP0wIxiDLk5BDx'
-             b'j6cN4prajsEa9iSh3K7XoVEp6fQw99zpErFuO9PZcXpPFgGi3DB3RTTw9568P2iWfpzKhxhENOUC'
-             b'gbEK0+OH5PUgwkP8PkbUnK7XKpQeeNmmERUhdNArdDXRYgh5MM/4zCxseXY7pBFo2kFwBGlO978H'
-             b'0prGY39HFsGlV16pywKBSDDjv210GlM9Q/gYBqdzAMHQZtBtNprCkaB6N64nkQYpc8My0/x6razH'
-             b'kxENbsdsN0OW7mWnAQHR0hkR6spgzgOXWnw9WlkPXhJvN+5LITClvn7KAljZDvAqMzoqh1jASpQo'
-             b'zbg7V2ZXaVlmJY5xOpOHwcUrYWzvi3gNz4ERVWq0kiI7ihDTNOO2j0glI4ymASrRaYgmJWqtbOGb'
-             b'+FEpTI9oxuuHnNL1F17IKpTPP/cMxg4WdW9yZwx9Bjrxc/KDOz7/j0uOX/foMWtPeYqySYn9giwI'
-             b'XnEt3IkD8KpyIA2MHktQLlW4/S74JXnrdPMxUxgVpQz4yic++v6xHc+s6y2kmcktcrQBK9pVq224'
-             b'4tIrYMHCEWgEGCkbCHR4YyQHId3Zx8z41sxhvEd5WlhHBHkkylK6r1oyG6wCiM9z3IyufwbsLFCt'
-             b'PCIainOg76QBRd0p2L5zF5TRSaDxrvPEP01sCzwtzmLopIAPaQTjdevWsUBPyMN19N9w/1r4Hh39'
-             b'iyDdO4zH4jAZ0NBkRY6EWyKcwzKzLAIrBDDiAlCdn6JPKgFIiSBA52kOgSAnxxDKSF4aDWy5NIq2'
-             b'zOls32jNzzYIjaidPiagUc2a27w49y6iQQ2So2VypayHk8ry9qMuABWJLNGRY8Q/e3gco+IKuKYZ'
-             b'j7mNFO9UGGVKgnlCJokAqSjC1BMQ9ajiUAskUU190+atPGCJMw+kkWAJEBo6wmaKJ4JhT08XXHvT'
-             b'TcyUp4wLAyAikm/YkO5fChmM/I1MgRPgDHSsde+wA9HCqDxbKPC60T63fCkv0W5RZiMM23xuyqVp'
-             b'Pg+0tpYpHBDKGFEZwIwGSKmIUKfVDCESKgLO2FC6Xmm1HupASBV6oYIOHGcGSECKxgxrkKZsgCHz'
-             b'e+PzpVtC9PwLGlecRidgBby88znwmlJOkGtUM/x02UTFTbDR/8M4RcEOh57FEPdH8tuY0oUROxBC'
-             b'ypSEhgHnn38+1PH62/fSbiawWioe1wBu4Gcev/ee3z1m7UlPQTI86Bdr0ZjsxP5jmJcswRFAzJ9z'
-             b'k1vKorTwL+tho8PxyHfv/N0NP/zWuzozeINv+6w+1mx50Gq0oVatw8pjj4Pj150BTeKcUYQfp0o9'
-             b'8DDKT3cuAOVmNDBBXGP1Pd0PHTedG5BJF9jJMfQUQI7Im01O65oSumqlNIlS6TZLNeHntpHsrLTK'
-             b'Rcpq1K4mMgKKU7Jc4yYwabRg6ZKlsAQfzVYzjrzkLUMeH0vgD3aG07ukRsdRo9fmtD+lm1mXIAg4'
-             b'5UyAzpLIlBXhwT+BzAWgjghSiDNt2W9+nsUysjYCMnUCEB+igaCczue1Ep8Q99SR51lHevT+8dAd'
-             b'n0YPl/U9RRj6gRfErWPCITB4+E2o+8xb9aqAhSYaRvV83XzGffyBnm8fNe7NR8gStoZR2xg5HAjO'
-             b'o2MHYXxyCjLoxFimiicy0v6YupTAg/hwu6+74ELo6OrGCL0tQEYT/6im3bMI3N5FEOI1Yjlp7ojw'
-             b'9AAsHp1sAJdcmGCphMBnY6TP5RjqxvCl7504IvS+KQTclJNBZ6zBg7SoJY9cHoroA06R+xDXmiKx'
-             b'HUr/I4iTcqIMEwp5sBM5r2Y6CxY+jlBoirNKNOaZ2kmVlpMmRSGhBcj2Q81xIeetb2gxX++B7nvh'
-             b'NdL6CWbE/jhShDHqzzCO4IPEygimOG/zYyP4cxdosiI7MzTDAl/zunPPg0KhKARc/H2NnF7cYMax'
-             b'YMujD7xt17NbTqZyCzmtyeMX9PD8eDpkYkkG4OdzHvGL6qAtFp7plhveL8Gof3rLhp9cesenP/L+'
-             b'7iyCf6vJde2oX7yC4L9gYBAue+N1kO7oxiiNb7PxgBgioPkB6cY7kCn2QrlR5WhelFylpom33Hk1'
-             b'NDBYkS0eyKIjz5npSem9J3IdZQ4ojal7z0m5bq5cY9VB03b0ON+IQBihupC2yOEgICIS1Tnnncvf'
-             b'K30jj7oNWug0dC5eDamOfpYfgCidi3+v440zm81xlE8dDBJhBtwGSOUAX783p8nx5ksp/0a9yZEX'
-             b'OTHUCUCgmgozGJVVGFw9dEaIIEedAqaua6uIsq+EHU5oGeneg+67r1dKktnQqXlOh2tnipjyrUYT'
-             b'svkOfu3/Yu9Ngya7zvOw99zbe3/bfLNjMIPhYCE2AiBAAKTAVQRIimJEbbZKUqxyUqqSflhmORWV'
-             b'yvlhO4kdlxTFsVWWFFuKGcdMJEqkLIkUYYlkuFMkRREkVhL7DAazz7f23vfek/M873tONxTLtghM'
-             b'XEV2k0POfF8v9557+7zbs0Cy+MWTT8ru1iWpZxqA8tjyNnAeBeicMv6rmBX4+c6AGjNpB0aDUn88'
-             b'kW89ezJRBLGW9Tx2jzIGIyzRsDeSt779e+Wue18v29ub5hcQgj9U/ID0P3qTTMJ9AD4/vAOAB6BM'
-             b'M6rr8AaoynPSJAsmNQhsuDeBB8BdAxU8dEPyRkuK8B0BTQ7H2Oq0dczBZHHK6+miJLS3+8fuDk2g'
-             b'Cu1WUH+/Rvnn6O1X76yG698zSl8E8MHueEkihADYEO2mqOlUqvA5villaXWvrB++Wi6eOUUGhy6l'
-             b'mfq4ueqfuVZp/8rs87J0bZgMZOrX4OdwLnpdXJLWRudwWo1lZX2PvPWBB+Rjf/D7TISh16HNj3Av'
-             b'ZtP2//PR3/vZI4cP/zSS7MXjynVTl5GELboAiwTgr5wAmEHOM9/8prwxbKQIOFf8AoQNeGd788gH'
-             b'fvWf/EqzGrcZsLGx5Z7SuJhXr4QN7ad+5m+R8jSYehDxTdVM29BAXOOBmW29EyooILEnU1aGYDdI'
-             b'VLwDKHCqSY3L67r5uWhLg2C3qxQ46JzPfaF0PprJqTPnONuMZjpxZk97V+9NjV0BaaBQ3XrPnXL0'
-             b'VdewDe2NKojPAY5AQoK1dvUNYYNtpM4dQGaoJFEhIiiB8sbZPz4pRDxUvpzPExiWQ3NWk5BcwW0A'
-             b'+0HG2PkRf45xARTqvI0JiulQGuBsj4ZqV5vNfADirFeNjAzRH46hMDe6CBZMqoHmGZB39PhRTY9H'
-             b'PdnZQPDPJJIySDZLHHUEk9mcknoGZtrDdrG59UXKJcFo7aZ87jNfkqeePy171laSz4C2t12aqSPY'
-             b'LC135bY7XktRHh1haG/Ht1dl9fgtIRFoKpgPFX5NE8ipaevj3gE4E+wHgCmpvdBqsyPkLHlR4aia'
-             b'uh3i3qrnvF64Z4txwS4NlCYrMFOK4qWdtVjR47khwUUSyaQDSY3JVqOzUmsvUXK4CusucyqRYpU/'
-             b'qXjDPu+RVrNr5n/eRiraR8FarO07KNuXL0g56jFhq6z74Mi7qJlPgjkfAlcSr8Ncl0odHefVGufU'
-             b'hiv1ZVD9AGWQoFt39dFr5OZbbpOvfOUr+BQmK5BTboTv21OPfP3dG5c39i2trFyqFuqAVygBUJDm'
-             b'4rFIAL6tB9DJ58+clX6oHBVpfuXaSdTKD9XrB9//6/+4f/7UtXsx9x+MLWAI6xA85/vf+145ft0N'
-             b'Mios+Bt9z1nlqnark1D5hs15XHAjrwxE563NTeQ0AnPY2DHHbaPTQM/2aapOxyNtWeoIobLWtiPH'
-             b'GRv6yedfYJs9BsJG3WRnaUKj8+4qK1j9ALX/5re8WUWLKj2miLwuQvW/fOB4eG6LFT1EfNCiBQiN'
-             b'yn3o8JZFYihQVR8GPdMxxwHNUJUCzFdh3kx2wEga7RCsgAsISUDJwD0IwT88D8HC1AJJKaypr8Ec'
-             b'CixdY7MwSEnNdDQInzFSRz4dlqtOBObllu5g2EtcQA3SyJdoEQzAHrsO3hsYrVI+ulP54CyJKlUz'
-             b'XXopY3HJit4bAO7shQ05e/6itFtt0ybwBlCzoChqGww1vXe/9z1yhAZLPSpGArg3LZ2sXnVDWOu2'
-             b'WgRndU0sSh21MHlj1a74C4gqYT2dOUMjWNfhPOkiBbPg+2B8NCJdVMctWV7RQbIYTZl8ejOP4ujd'
-             b'x0m7JlpRthlgQaUrVlK3cQTGQHkrJBFh7ZmaenUH5D2Cey+sQbPVUbxGaWMTZ66AHDlkpseQSWd5'
-             b'RbaHvZknAlEXOZMr6gHkeh1ckgPOjLqqoEGMXjKOnCTRAKPRYiYJgqBiS16vJ7Acx6+7Tr72tYel'
-             b'mc3QBiwuBjuHd4e9O47c+OpPhMx2sdleqQdGhyH5WzwWCcC3FZQpd2piNVcOCOgpcfvg7/7Wzz32'
-             b'2X/3N9aXmjTxUYS5BlSoj918481y6+23S384lsbqqszp+yRlPmx2GQx5QrWTQ/gmbLBj1+OGOG/m'
-             b'i/9ttZdSxU0AH4IS2szbOwQIohrMsmgdXBFcD5GdcyEQ7aKdTtZBNpttmzCLi45rIZj1Q/V//XXX'
-             b'ylWHDoYgMbZNUzUFgKRurh6WpYPHmMzgvdAK5jjDK3fdUVVuyiCDaq/ZDMEdkq+VYRUKba3Cb57c'
-             b'+KlW//3tDWUQZIQLyjAEERr1hE+ZgKrWqJn9q0hSbckMnU8EvSeWgOJD+DuolVIkQRoEjiGUBtFV'
-             b'ybSjgXY3TJPOvvCMXD57il0Kz1a/gQO9cv2dtYK9YQUqiyJR3U6shvWGMOcoImxkTz33fEj8ClIS'
-             b'xWSBGYyS8ZJjlX7HnXfJ61//Blb/oFIimCEBqa3ulbKxxA4Mrn3BNn+N1xkBXHn5zqr/QkGXYS3a'
-             b'IchSYArXOfxbE+IsvHfObgrGM6j4WclmQMiPGSy9ATzVUliMZW/gOUZir9bPpRpWUVwJeSgFnupE'
-             b'1de7q4rkx3tazY5rudRZJqMlqQMbK0FHMp7CUcT6W7dmfd9h6e3sShGuYz2OJDIdd1WGsfCWSFeR'
-             b'AWDAWZpAQTbbFjriBiJdVKJ5lPMGpdQkG/fi3gP75dU3XS9PPPoEKZl4OhJdOEx+9YufeeCGkAAM'
-             b'qcuweFyZrqp2uRZjgEUC8G09sEleOHNWTrz6xiuDA0DF2GnJqaefuO3Tf/jb/2Cp7ozCokEVm/og'
-             b'VON33nOvvPs9P0BaVgvgPnOfk9RS9SbAMubG1giVcV5mMtqcquGMV+R8PwQFVGkwwvHGa64MJUgJ'
-             b'VSQA/V22KxHMqlSh6mY5CoHhW8+eok58LjOVNR6Bc4kxUJlhTiMElztuu4VfwkR8tyQA8q+tvVdJ'
-             b'lTe0cqo06aDMr81aKWoUqnYE7Wajpdr9UKBD8MtUGhi8c2rRA7SJxAIshUadojT4fbOtNDZWXqMh'
-             b'gzsCOCpaZ1lAlM4l1c5m1bVQaXuav4+0fRwtfqz/vLxnr1GNXXKZw9wcLoxSmLkRfep9ag1nMfjR'
-             b'FMmZVLAhyKlXrzRKlac1sFw4r+dOvyjPnDoZzgVKjuZe52Yyt2ifowUPgOMD73onkyZcQ7r7Aejo'
-             b'6rJ84JgUoepHWx/ByRtVqjQvAyQD7EhA8hjHXioGQhNgIbK+v7MdEoImEy5ckwhgVCnhiiBMdqzY'
-             b'Mq/JpNDR2ZyIr6UAkVdvQycqKTa4hsr5F5rv0MCp3ZVyd8Q7EQGZktM2mCIuxYBeIyZ5Hd7TWeye'
-             b'iAZ7YB32HToiLz77pMpRS/aSPn7mTYlybrxTxVFF+Mxmqz2XLEZWjV4qb/LSTiIgU0GSOjpwcuMt'
-             b'N8uTTz6dKKZY62Y9k1PPPvkGHDrfe0FZuzJBLSSSpHEvlmKRAHy7j92tnVCZ5gScveJjhrAbjQeT'
-             b'7r/+5//kn5fbl9a73TY3VqrbIXuFCU0IZG97xztpgCO+Cbk1biKZUfMUhOyTNKpWM9qxQADjlmab'
-             b'ZI0VY25CKG7GHZcZeIqz3kw3SIisKP9cRVYweThz9gLxCi5thlYNzamrOfL+p3LXnbfJPffeG6r2'
-             b'iba9Mw2KYwTstf2ycui4TFHJmUUtOfsGZiSgEViGUK0TSFjvhMA1UlZAs6nVtVRsG9eIFRjrqAZ0'
-             b'NQOUDXZ2OErgLN98230127DnVenER/e9jNiAiFL3kxEE3tnRiAE9mhehvS7WngYVb3f7suxsXTZ0'
-             b'vgb73Jx5VQ2hMgMmlQKuXGk4gioBAmOJyYAHD4FBXz735a+ycs/5PpXp+NVUSwafHZKh/mgsb3vr'
-             b'W+XA/gOyu7sNQqEeLxDvYa1rKwcFwOjS6303maK75WU5JFYD+ie0ZNjrS7vbpYwvAZUjVfmrOBYq'
-             b'pb3UoUMkxH0yBufw2t0h6ZZLK2us1qm0SKS+T0qH0fMghlbq/0/HyviA4FNIsqIAUU4QoppGIUlB'
-             b'9V3AadGpfgGVF2kXPaIsdLe7wnVo04NBr2+ZBP31c3FfdZAU59rhQfLojA6o9Fr1RIjD48y8Fnjs'
-             b'6CQ1anMiTtbFSOMMZ+Mdc9s0wSuKMoXF3rNnj3SXl8K9scPOApINHMbl82eve+jLX17LzSho8Xjl'
-             b'H0iety5fXhgwLRKAb3MMIDrXyzPQoF55QaAsbKD/9v3/8n2nH//6m/a2Z+2qLBq6hE3mh3/0r8ta'
-             b'qDaHkxAEofqW1RL/2KXQXdKUJs9d2pAYVFiJZNpiDT9rdupa5ZhSHJXnIn8dznrlmEFWZ9IaTL2b'
-             b'qdVdvLStM+koq2rzcJrnYFNn8NXNcSlUXa+65gSDuEr25ir9mldoe8jK0evFh2Qm8zW2gQG6w3OI'
-             b'NAfzwBRcEPDBdycQEwE1fJldaYHTjHOgdAiTGgL8CnUEnIQg1V7q6mbcH9E7wBm1i4mG1Xg+jixS'
-             b'PuOpfKc7eSmT0S7n3bnN2ePGr313rcL5kxC0Lpx+PhzHiMGrirK+rDAzRZHHxCtK2JrRTZpBRxS7'
-             b'1ck4j8ubF0MyVZFmxzECqHzZjJ0YK+u77rxD7r///hCQB6YqaFoCrVXp7D8qY1xLmCq2clXsQ4IZ'
-             b'/jMa98mWGA+G0mg2yPsHawMIfBgvUcynpgEQ9sm4FjA8Gu5sSbG7y46Cr4dkobctWZQvQDKTR4dE'
-             b'P9fwKjUhydXWF+uEbgSogKAAknmAEQyu43jIRDNngpgp9S/ecl4R9xhJVdVMVCheQrb4U3qqkEC8'
-             b'dxO4EJNCJuCvih4U1nnLTMffZzbuKWg3rTbLpXUwHK+ns+6DM8AI8TKVmUnFeyS8JzQq9u7bF67j'
-             b'Zrh31TcBafpoONrz1S9/6WA4j62FaM2Ve2D/XiQAiwTg28wAnFXSYfOp15OE6CvyaEHq90tv+8LH'
-             b'PvR394XKv4agS1qcbliovl5z573yutd/T6gCB5LVu6z+tTMwm0WiOq47nblHW1vOYYuRSvmaBCpb'
-             b'weITfW2AKi58Mdrd1eQZDypbEf60c62M1NrWWyXWkIcf+2bYsEtpNRtJnx30J7rhAfBF1bwQxMN6'
-             b'HTp0WG577e0qBZwl3TXO/qH0ljVXQiBWND8DQagivSiivqjK9OV1JsmL84aFb70BnfoJPweVGmbd'
-             b'6gqoHROCxUoV/WH7LyQEzVDVErQ2UX54TgrhmGC22EGR1MKNyRE29IJUzNzugyxWgc6SJmvBQ6dg'
-             b'e+MyBWDqeW6GM5KOPcngYiZfzTTodYZcpcAmRpNUC2Eo+Xl59JtPSiNr6HzZ0O9TqObZ9WS3JPz7'
-             b'Dffdp2MrKh/Cyhnpi5Nae0XyRle19jOl+NXCGlYh0cLxrq3vC59TauU9VdzDdKqdkNISUo6RKtUo'
-             b'aLUa4d7sG5gzU76HK9UEJ5oQR7Mq4lhmSSKrZFD3ajX7bqmHQUnZYB1tROqlmKmVY5cgV5CqUfVo'
-             b'JQyzq1o2o55GJ0RgAbKZKZXYXB+CVesHjsi555/mZudMjNGbjoKf14KY0f/VhZLCVtGdwFlKUaUR'
-             b'QlIm5Clb8uGjYZFj8gCFRHgsAJmOJKmcFs1Lly60s8V8+soFf5PjXgM9d/FYJADfZg7AADMdjl+x'
-             b'DgCDZP/Syu/8i1/5J/VpbynLTaCHcqhZ2GAncvWJ6+VHfuzHZABPe1RBQEw3Wor6jptPZh56STdG'
-             b'Oey6YarTn6LnSyYIUbEMP2lRaEUrLjFjmmQ5K0pT47ZtCcNo6mUXs9g80qEUaZ3Z65x5CODX4xBc'
-             b'Dh7YTwOdQX9gCjUaGH3YBFcOv0ryzkpIaoAqn3J+LVadA8WuFbhuvugOoLIfD3pW8RXKIS8rbqag'
-             b'qOEagbmAQFyEYDYKiUKtVSfCHdgAAMpqhkbDc8ZEx/uX9noybd8iKGOOj89CVV+NByboMsNdyLwW'
-             b'gIG6ti6eY+dE2xKZvUbxF5zvW4LhfETEZSmhUPS/pI6EWPX/8MNPyMbWbviMRtLipwAPxh6NjNcO'
-             b'dMfrrzsuR64+QkCepOsc3r+5JJ21gzIej0PStcoAhIA0HsHcp0WcBhIv3AJo/e9uYwSgGAGMAMDT'
-             b'h4jS8soepeKFJBBjFYylQDlFJwWMC2A3KHZkFsVRPa8yC94sAhxB2wyvGw/7TPRoExzujQxeC5QW'
-             b'9uwYZRaU1ZMgVwVFW5uKnYyC1sy8C9kxQgLYUIOscG4A1fok7WzD+vD/zU6X6wp/jzy6Dc6JM0Wc'
-             b'StQrYCehriyKqjCGgZuZRc1UJI294b0ZOMXug+PocDINCUSlI7uS/1HOwmg0yhcJwJVNABqNRXdl'
-             b'kQC8rLtI0fXQPH9FDDyUiyQf/Fe//j+cf/LhO/YttblposKsZxpUQmEs7/mRHyWQbQzBnXZ4Tmsl'
-             b'BLVOQivP+6qVmSmu2uGh/oHbnviZbSqc4oqpKroxFtIjwAJTpnz2Cef/FtwkMymaEHAbbfnSlx6S'
-             b'YaiGAc7yCdJkXYVY4Ynq5y8vdeS+N98XKlVjH1SKXWOnoQ3b2avE5y3SvUBBq6jwp65xE1jOQmCo'
-             b'8lYV+mTzq2yEnBUqtdlqql9P+l9YGyoBhqDVWuqGQLUr3eUO9fDzmprTtFohuPV3DBfBktxolHr+'
-             b'ZrfDxAQ1HhIBdiisygQ+Ai3xTnc5zaOxjhfOviC9zYtSb7hZK9qAetptsMSApkVGPbPEzRsLwZu3'
-             b'AT8qRKeLG5vyrWeeZ8s9M8S72LjBmVFNZXLOb3nrW/g58AWgJHCVU5UR9MopE4EmK2qs8zTcTwiq'
-             b'AEG2Wm2VVA6J5fali2RKjEmX1LEMzH5AsUQigHUE3x/BHEJAAIs26jV2GgBkHe+ONXEsqhSsMwPV'
-             b'lWJ6BVYtQ9RJW7PCJARvQj8HXGNX8F5lIlHqa2rh+MpiyOoa98AkVNNtURpqYeZJTZOkbnWWmSRH'
-             b'NeUo3MTvRUiAkDCW4dirTBLWRSQqU/hkXe0MRwAzLXpoSNQziDRAA23O2Tl7GxNV0XvARUfJwjwf'
-             b'XJLGRout3myUiwTgSncAFqFtkQC8nHjNimkYgo4np/3ldgFqodL6048/+Nc//uEPvO/IWleRzKVX'
-             b'/f1KKNX69vsfkCOHD7N6xsQwry1Jc2W/CqpW41CVNNi+pspfbF9L5DFr2xkzVG6y5pqGygqVH74Q'
-             b'zjbmmBygwkE7+MKLp6gsB+Eh9W5RRTrYDG/vqq2uorFr5kynwQhWr5lTnvZkPJXb77hdDh8+Iv2B'
-             b'iq9Es5ZJqKJW9x8jB7sIVToTH0PyMxCFwIt5MLAQKvEbTZDqYf0LyvlOiTTPeC0gPYsKkIhxoxe2'
-             b'QkIFOmFruUswWTO8N17TXV0NydQOkwziCOr1WRs+BX9PpgBBjlkIlsMdO1+9Rs2QCMH0MLV8ET/g'
-             b'qjcYMHmz5rWKy9CdEJbys8QizfxteJ9scVw0nVFiYD0EqecfezokNuEzm7lRBZ2JPlniQKniidx0'
-             b'8/Vy4803kcqn+A7FfkzCwa2Eyh2tbxeSCCQzEFhiBcx2/5TJBZKtcfh5g2j0iiOWysYooAIur+8N'
-             b'zw0JWkgOpuE9MD4ASLKBkZioa954Z9NMhmbfjcxMtFKjxVUzJHypLoveIiWTFshuW3JLyd1KjY+w'
-             b'iI5208J70dWctKlAqXLELfgxsBOgZlSRlurn+vKzb0gyQjYvCgDyTA0TlzK5A/skE613hUn+R7xA'
-             b'9GXIMmMhKIuEdEeOzjRxgaYF7Jd74bujKpYzzY5aozk8fu11vfz/Z7Ox767urSOFeryzoFouEoCX'
-             b'cRPBwKasJrK2Xn9ZegAILBtnTh/4yAd+4+/n5SgE+wak7ZQOFXYhKIi95s57QgLwLrIBOHcMlX/7'
-             b'wNWhzILxTAg2w0I6raXw+x7BcM7arImTbK1Mj0BJf9rKWvU1WV7eYx7sQmEftEJ1Iq3MAATTRk11'
-             b'z51J/+YuHPN2X3Z2egkM5qLQilcVNNR8aAMDrAbWwGtvvz0EiZGOIay6xpy5FpKYfHk9bOJ1kPa1'
-             b'Wqyp7S+12cDrN3Q/wIANjgIoFmsyvz1qAbD1HZILAhvbHZ39Qw0QaP3cy9bmhuzbd0CG/Z4Ge7SG'
-             b'd7b4fARXqs3ZjHqm6WIcf3L/RcVsJgMeTyWzFnQq072yFXpbG9LfNf/5ylr6Zuc7o5vlKQiZ6HAS'
-             b'hqli59lpgAdQ7MLlHTl5+hyPRTRUWXWpqoWSqy8CzJ/e/e538bw9IP6ZBhfgABoI/lDSQ5CEymRY'
-             b'k+XVda4VnRXRwp+MZZoBL9HggWB9mVNylIMkISQSlSZME4ICG+wKmLmhslScMVKqmZaxQkhdQioS'
-             b'rErgnupEoCNfEenvSNvE9yJS55wv9DsWcRNG/9Ml8srGMA0Euwi8//Q5qmhJg6sQcGu19gyoJ8qs'
-             b'cVCOtJFC9pLEWdQCWMkBBjLN2JUoq8oSNZ3+S+ycRQ2piEN07iXGWUi0tsO9sbOrioUJQOspaLV9'
-             b'8423XsrzRQJwpR64B7Y3NuTxbzy8WIxFAvBypgCeVSmqzupluHhlIVh96Fd+8Zd2zj53c7tZl+Fo'
-             b'LLVOnRXIBHroIbjd/8A7icQeo0JbXpXugWNSX9nLf492d7ixQv2O6oAW9FWvvDLQ1GyeqRVXrgGN'
-             b'lrcWgrxR0sz5DlUakfHeqlLvTFxGWCk/98IL3KhDFqLt61qW2teF1zY3WqbQ4z92zXE5evQ4rXed'
-             b'iQhxrho27vb6Qam1Vw2lrQeKeT+53/YzjiBEDYHQthdryY4nIwZZALJyzIxDxYu5f8P4/uCmawXs'
-             b'ZM+evbJ96bwsr6yxtQxNA3QD4NCHbAuJxiw++eQ0F9kA7NaHIAIJ4NxXdq5ZahSznRyOYePii3L+'
-             b'5JPSwBzbdOOdS7Zxyv2P722UPx27xPU39XnTumdDPwSorz38mGxs9aTb7iTMhjBoONPXz9jVuPb6'
-             b'E3LowGGOJiIjg6OBqsa2OcCitXZdepfOSbfVCWsF/r6i/TFqgWwxaXLTMdcaVWqj1ZTB7q5kYV0B'
-             b'fkQHgV4BEP3p9WRpbZXBGx2FDM39aHVXxWrfmc20AlAVfCjsViDxm2CMBErmPOgPuI7ITDFFPd4P'
-             b'HmMI+FlM+BkUDbJvpCbiTqt+UwlMg6lM5/IpaRCXqLMQR5ogKcgljV7UU8ibp4ZBGTGqCGvWXV6R'
-             b'CVgq0S8w+VlI6l7MWg0zOgnTv3Ce8KbAdyuj5LbnsU3C+e5ZW9u4541v2krzosXjlX+Ee/jUE4/L'
-             b'o197aLEWiwTg5eIAcorSfNuEklB5fv1zn3rnY1/81E+utFoh+I/o8jcEQCtsSqPxRN71nvfKvr3r'
-             b'shM2Wt9ckubeq0njGoUAN4Ux0dIqwXA0woFxiwXhOFs1XD7NW8iLz0x/zWRnAXzzvkxTSwVnOW6W'
-             b'g/C+LjmfOW7aziSAN7Z3VAq1cnMT0yp1S0vOoj3P4eg111AythgUBpJypK7VusvSXjnARAAze/YN'
-             b'XI1VKI/d0NLYsHPq6Q+0w5BrApOZgwxAfk7UJXB1bU12tjalDe3/UKF2wv9jRg8Q2+reA0wmpsOR'
-             b'qgpCpIcHO50J+WcGfizjqMRpsAPOYNRne5/r5SWh85HocGxSU0S/0sdyNYXxLvnJc7TDn2WxPaOo'
-             b'd5v5l4YrcAYarEwLfzAq5MLlTbbiCSJkRDSpZYLmQlUKVHk4x1ddey3n8iqyGCvwjElEFoJ9vbNM'
-             b'PEMD9MywGcLQCMJIkxDw0cKHMyOEdkaDvrS6qvdPu+Rwr9KoB6OEaaH0wDEkpushCd1SmWSnx5I8'
-             b'IrzMmRnJnGuiMj1Q/cOgqY7kA+ZOjVZE2EoFiqfFTrq44V5DN6eckq44nswp/tl7joe7vA7t9hJ/'
-             b'2g/Jcae7xHsHeB09plJmTEQN7NPJWGaCxNqdydKoYGbDzIFDbkZbUcHQzrN05cxCOiVonktfRf6n'
-             b'vefFC+eYIEbdAXYJgEVod5/78y99TkWyFo8r8gCW5anHv2lYj8VjkQC8jDEAqvLhzk7a9P5KlT82'
-             b'+NG48zu/8av/aNrbqvmlDgPZFNWRx3x9R15/331y35vuk15/R6paV5aP3CBVa02K8NmdsGlXsFqd'
-             b'KJUICmtA8RcDVair5jTsjZ6uM+KXdAJUvpbc6lpDAXCV6cmHYxnsbGtwsuq/cMLN9+zFy3L23AXa'
-             b'xnKvSnubJhViHvH4s7q6InfeeScTkFmJLWQwNPcdFt/ozFrQAG2BWx4qUiDQq0IV6IQSzGO+EM9F'
-             b'pwRVVM3oYu2lZdm6fIlUxO3NjRDo91G4Bpa0oOKBu76Eef+oJ+PeUDpLK+HzdN4PZcLR9uXZBm0u'
-             b'ddZkZ9BrAl8RkqcCTnTWo1cs4lSi7i7OFSjy3e0NzpAzW7fMgGHeuOCumgN4OU1u/JyfXNQd0MpX'
-             b'Ox9PPvMsRyl1ztgtHmUz/CkCDjoah/avy7333E2zpXguYgkIujb1kCzWOkscJXl2TfQsaRgV/l0W'
-             b'IwZ66iyAKQEcQwjwoE2CGVBjYlQo+BJASjBOnArc1DsrPJDJYNe6J7HKrizB8Qk8S9xAuI8oL4zZ'
-             b'ODpdRPDHGbvqMtQJ4qODC0+WyHtU5lCIBGgxdmvspuoC7OdMSjn8rAvnN3FJdkDxEmYMlK6PJUhI'
-             b'5l2VOj/2NdGejLEtvDkEFgTTZhH4n86N4ltmFegtKVFdjcpknUtiUy5eumiAyOQsRODisRM3fOv6'
-             b'G26ShRTwFWwANJty9oUX5eLZ84vFWCQALycD0BY5dc+/DSBgNwS4j3/4//7bF557/K49oFkVpW5M'
-             b'vpBJKG/27z8o7/2BH+Tfy6wprb1HQ/BfZeAsx0O2/LERQuIXm/hwZyhT6rf7mXeZHRM3IlPSU2EZ'
-             b'cy0xYBQ36Vi6W6kGGtuEdEOlDhK4h0ATPn84mqpJSyMLgcJar7ZZIhBlplk/CIHkta+9PVSlx2Vn'
-             b'e1uSul74/8bKPmmuHVZpWlLB6kyo0JLvLoUKtD9gZYrKHYBrgv0mJQMUngfOO0BjrgqBCl4IAKyF'
-             b't4fQz25IXOp0RbQOCEBp4TopbbDJ4FWEcyNiPHZCTJ1Pq0TPqh/0wEkIVjna7mhxgxMfS1mvG3c0'
-             b'CELn/MzJZ2S4uynNPCoq/kUXudyAY5Vy4yudZUfGgdg4JmowQOluq9eXxx7/FsFlSBDroMrFWbhz'
-             b'ZtmcMWjf/+53yOrysvRC8uhdVKTTa9yGzgKok+G+Uaoixka7vK5A+ZNHHxKSYogKuS6tpaWQAG6x'
-             b'6obBkbr+FXTzEz+XzGl/nSODlHBW3oJjFeUebJSirBIkEDjemstmUsMEdY7ttRXBhiUYEuhwoMtE'
-             b'TExJymeUa4bhDxODWj7TFkoB2YL8jH/HxGDErtCyJmK0tcg4l/dRTNvrCEEildaU/JQJExLvsC46'
-             b'P1PRn0piDmhdAu9SgZD8HL3eX7iGu7t92drYJUVRGSyVCnmF67C29+CTcDus+0V1eqWKNvwBAHPR'
-             b'AVgkAK9IFlCjQE75V5rZIVg98fDX3vbR/+s3//5Ku5HkW1F9Q1QHY4Uf/8n/klX+Djzs9x6RfOWA'
-             b'jMPvOq2MzmeguKFVOA4VF8B2rI1CpFSDkjJhAajpH2ql8XAHvVSjYZm8bHhNJ1TP3MzmkMxoc476'
-             b'aMlPpFnTVjda5URFh4OFAx058ZFj6DKjQNWSL71Wz1O55upraHKTMFxsR9Tp7V7B7tcr0A+BCK1a'
-             b'7K2Tkc6vSwMdIGkZ7u6SAgnP+Wa7q251UYkvVG8NMAUwLoCQUafDChbKdEgiMOcuQ0KD59TD7/xU'
-             b'aXyVVMlitxJJVEpHh0GF9kNLnvLC4z5HBc4EFjj5r8y2N5z+KCQXGxfOQIomScdWScJ33izYJJX5'
-             b'+6bMmeGqR0BMzsLP0Rp/7rFv8pVwxANjIiodeptj4z9o06+tLMlNN9+sfgZ8/1wTGnYr6pKH8xhD'
-             b'zKdeMhHwlPptMsCyOwPaHboYzSaD+WDrkhpeISnLp6rsiKSvvcTZvVdKSAq6vhwnlT3tXERhHZ8E'
-             b'ciiPnOvYoxmuJemetjbUcsiU7liUYqkLnBJ1ZDXPzJDkt6Cdrqo0cR+T48kqC8jsaJXED0BjAM9p'
-             b'Njsi5uJA/4nKWxJlHQLnUvcs6vur6qWqZ0JroIwtfRf1rKJfgzBZcXNYALUzLpmw4p56IVSfFy6e'
-             b'D9/tltFtzWEz/O7Y0eMPj0NwWowArlwCAJzMxsWL3B8Wj0UC8LJvKASrrFH/T3aXImd92F/+0P/+'
-             b'67/YKiYtcJUnYWMGoA77Ciqkdz7wdrnhhhOy3R8y8DfWrwqbf6gI6xk3SrSl0eImfxn2tqGaRcWL'
-             b'2S64/hGaphQjBOIxK9Oaiak4Mwqi2Iz3M997Aqjg3jaRATTcI3owgtTCsfdDZX767Ivk28cNU7ns'
-             b'EeGuARuJzNGrj8jNt9xCxkSMgSjaGt1VaSztQSbELgb5+Jg7D4fS7XRl7NWUB4GoCu/tyPfXY8Gc'
-             b'mFRGCCdBH6DV4nvjOlD3385Nu7KeErVlSKI81fCEdLVI6SLxO4Ygc9OLs1+lkU25fg1Uy4M+AWgx'
-             b'0fPpf1T4pwA+oJxY619egoowXTmlL7r485ngTDTwYQSOfgEhSPcGIzl1+iy7I2btaJejsnXX9Qf1'
-             b'8bb77pWVtdWwhgPTuIk0QmQPLal316UE9Q96/Wi/g9MfKn/ekyGowYa3DMkVFBXZ8cG6UFyoE+65'
-             b'Cf8QNQ8qZhmNg4xiF2v/SJ20bkr8TgAjAY1+UilZ4RdUfMRiq7nQZLYWxmQozURIZZEzjojUlKjG'
-             b'+z+NPuxz4WMAOqLMJT8YB0zQsaCYVp3PB1BTTJkPa4rvG+6dWmaUPLt4iivIDdwHfEbFqj2zRMLP'
-             b'PTd+D7wlEqlFk8c8IaoghoQyHH/DLKHLyBwJr1ves/fcnr17n1kEpisY0MI9cOniBY7Iut2lxYIs'
-             b'EoCXnwBAnreJDbZW/4+OAfD7zsqq/NEH/8+fefrhr959ZM8KZXBRNWODwDx/ZXlF3vKW+2Qw3JWq'
-             b'tUdWr7pOJlWTwR/AOhrkhIDehsd92PQInKo8NzpU69HnqsoMwS4qmoMqOze6Umxh0imQkqhNm94b'
-             b'pSp8xtbGZclZHWVW1SsN7NQLp2UyLFiNx7ZrnQY4Ss0Ta1+iXX310WtkeXlZrWXNNz0PAbux54B4'
-             b'CL+E4x8OJ2FNVlgttUP1CTCYVmoN6W1vU4gGYDNgAkDha3faFC+KCnz0ffeS6IgqUayeBQS3DXsM'
-             b'GBRxqWJSpE51Mwl/a+la9YhcAIBDUA6B1C+mQ0O4ZxIL0Ojjzso0JGEbl84zaGZupvqmukKeym+5'
-             b'+c775NYUk4TMRJNmfAIGlLwujz3yiPR6cLRrKiI98uQNRwBxHFyrZi2T62+4QSYhSBZJ/dECEsZE'
-             b'raVQYTbNxTEkK5EhYKBDaO6zhY/j5j2RJX4iOPauAGVC2QuTwY6Yc68dQ7TzldQZkbnfG7OS4FPK'
-             b'Z5tFLro1sDTmKCBTYRwEcH4XLPg7E62KngiKDVAbaiQNdIHUrCEkaENZpoqkyG5vl4lhLdxjVDeU'
-             b'mZOf8z65PeN+Hg+R8Eyj5I/5NZh7hgE8adZUeepHMIGvZpbGUWNDz3XORlgkMUiikBBQ/09860l+'
-             b'z+s19dwAkQb34uqefc90V5YujibDxcZ6pR4htxoMews74EUC8Mo9sKGiPZs595KN/d/3wPz5hWef'
-             b'efUnf/+Dv7BvuaN2wnGTILDJyfe96wFZXV2W3aImzfUjMioz1ewPz0UwBJ99z/q6bpyYfdJYx3P2'
-             b'TV30XI1x4oaGzbdmHu/qBJglT3TysF0kM0VbE+FsOtKXcskSJx2/3drdkTI1n2cbpPf5zBBIVCd/'
-             b'3759aQ6OB3AOndVQ/XdWQ6CqOGNur6wnMSK2coEPaMFmdsfEdzLeiMP+bkgCOlRBVDvfqOilVAdS'
-             b'y0R1C6rMTItQt7EybIUAo5gIADbHoLtFzra4ucCsPXMEbKj5Yd2xOjBDAvqc/YKoCmfCPjj/8+dO'
-             b'E5OBw4Goaya1pM6nzxGuj6oEWkvc5waJKCXeOKWJ0aBCv7ixIc88+zwTodLwAcZqlwjXQEAehMB3'
-             b'46tvkGtPnJDJpDDWgTARAxaD7wk6ZDZTIozOjzQHqmTWAbIZqfNR4lbY2YjVsi21CvEY3J0DjSzy'
-             b'3yNSTrspUwoLZQRLksJXGb1OlEFD4SHnjJfvtPWNe6+KuvmVejdUZULkx2NHUleyEyQUoVpeW4sD'
-             b'CAZ/Z/4B3s3U+pUGOK/sBz2Pvln/6nFFyoJiPSOIz/j/zlQiZym9QWmUdZO5mWkTz8n8NmL3a1pM'
-             b'5eTJU7TwHo2mITlp8hwg9HX8hhu/sn7kRDiIRQJw5RKAtmz/+ddmeI3FY5EAvLyHT17jYmY1/6EH'
-             b'NvOP/M4Hfv7SqWf2Hdq7YkhzYTDEJve6190h9z9wv+wMQ4BaOySN5f0ylQYDHgIb+NJ7DxyQS+fP'
-             b'y9r6nlBZj6UFEGCOUcSE5ih5nGfGKiTsQsPtrfCrkUKSOEPOWSU2Gx3bq71hCLTNDPof2t+NKItr'
-             b'aOlp+HP24kUCtDRgVIZ8tqASWQZAeocgceSqI8bN1g0egS0H6r8UmgMtre9j+7rT6bKCI/+fdLYx'
-             b'KYutkCiUZtWLjgfoe1A7HA8HxAug3d1aWtUKGomQbcLY7CFO0+yA985evooJoboclwZ406QB51aZ'
-             b'zW5m3gUIB3B8w5r7UP1PQ0VJEKUUFhlcSnRwbDvbm3P2y2YSlNzjjFop81LNxkk3p7+YrOUGNMP6'
-             b'PfPsSQaJzlLTHOp8CsBeMxFpoZXcbskb3/gmDdCFT8ZE0fEZs+Vmd00TkHmFmhjsDMYxU7WTebLG'
-             b'XMfDjHsiaj7S49LMffY6jKkUzW8WuV5mtr2QYg2VPgCmQMRHy2iKGEHTAVU9nSBreng++lp4mUPz'
-             b'GZAxSiLF7pUmOOhOibFQJCpOjoZhLWoEsSroNWcCrHoTuvbRwVKiml8U8Qn3ObpvrU7bRi92r2fa'
-             b'GcgTuNV0B/zc4ZrSI42UJhPiNZhslOrNwJQu7Au33Xn3v5NJ+N6hO7N4XJFubeV78vRjj/DeWjwW'
-             b'CcArkwLAXCJsBBBL+Q+NALJQlTz8lS9/76N/+qm/sXfPEoFXjna3OjNd7i7JA997P0F2rr1Hlg4c'
-             b'kxKGL4DwhYqB1rZhY9sNFfjefftl0O+zIzBBMHTCdrUPm0oREoHc9kvy0FEDFmO1ATZlOZcqFZvb'
-             b'em+yrBmpScAXZLGyMSI3Zr/Pnzwt2zt9yevKR9cReDbTVXWKOUCL/rbX3CwHDh8KG7sjCK0gWrsp'
-             b'eaurngLkgA+JKxhC4wAgwxCsgAyHFDDsZwvyvtXNDmBLUsVoSKNWx03gASZTzobb3WUZ9XcoDATK'
-             b'GtDVE+oYYLMdmTqyS3a5ySzJKnQEfwDoEHDyhvoJICDlYZMekYJYpXFBpLnVw5rg2DECyE3sJgfg'
-             b'0flEJXPRo9hm4VGPnm3jbKY8p39zdN4bh0D+9HMvpPa2GELdJysbrU8R8w9fdUhedf11VElM8+cq'
-             b'lupCv3kP0F/CrUXZHNN3yLwd3kzDPt7HaYYvNk6Q2D6PLAejOfoqnStFcLxZ/FKoZ2yfq7MVPH8C'
-             b'QGazThliUADxPUCnoBpP1WrYPB58NKRioFV8RklZQkccgqTbzifsRGTkZcZCKGyWga6SWCKm4j7K'
-             b'4tnavMyNLoo/ZfN5Gh0g6UKgngSm1cB7xK4YEoZCqiTupN8n87hIzFIVMzp37hxZPXMqApoQdVa3'
-             b'9x88+Gg57qsg1eLxyhf/Yf/YvHxZtrY2zF1y8VgkAK9MbsnNrqxE/rIZAMVkJkX+bz/w/r/X8pNG'
-             b'N1Szvd1d9Uen6tkkVHFvliNHrpLNYQh+hw6FJGCNQyutkHTzxHOhDNiH2l0IhKC2oasAJTdUudTL'
-             b'r7mZDKkocE956p5iKnGDnNV75l8ftczzOAqolB5V6WcDBX3h8gZn+3TmM3HXOIt3Pv5ECB679sR1'
-             b'srS0wi6Fs423vrxOKdopFeysgocUrQVkgu6gSY/uA7oecP1r1kJCoPP6Cc+3lZz+QIEskKyEDx/3'
-             b't5VJEZ7Y6HZCMbXDar7WDH8HQC+WurHdnehi0eo1bMR5nc/jKIJUwEFIqHY5I2YlL3NGMVCPC1Xs'
-             b'mZNPsztA2VhDkMfESeOqotNjgKks84jBvHIROmnXNwSaUyHRAr6jHc4PVWppbf3c5Gv1bTPp9Ydy'
-             b'9/e8UZrtlvR3p+rH4FU2uYxshFqLx1pl1pL2M9HhaJubZvhRrrayKtjNqm+fcPkVu0Fx5k/nQzAF'
-             b'sqiyF0V+MqOiVkbzm0VWT0OomjU7MtLg0KpBKz5nF0j1ASqTgI6o+sjJp9sfdAzYnlABhpIaGiEp'
-             b'hLFVeDpUIvGaeqNj3Qlr+zoF+ymmMue4jN2bCJCNSYSLQy71wFjqrvK9mKC7mcgSFQ0xanE+iQCR'
-             b'AmhEG1okTzzvja8+9A21ZrYOA4dB4dz3Hjj2WKu9dGZnu7fYTq/QAwXS888+T6DxEphPi8ciAXiF'
-             b'4r+ikiv5S7mleacrf/qJB997+omvv+XgUpPVi/Oxlellz9q63HXnXTIYh/fprJMfj427QIAMlcug'
-             b't0u3ObQPQQFso2Xe2yWNC+jqVrclYyi3LS9RiCUGOZ3nhk00VFpRbU4PVIFkmG2jEkVSESvAC2dP'
-             b'y87GeSqVxVYn2Q5hwzp3/rKyDZwh6E0qtdRpOwOktmZz6u5HJL4QmNcKwX6fDMM5NpchNlPwvSZw'
-             b'4qs1GMwhPNSqL2s7nu50Ew2QmA/D2hfz+xB0YeHK4EFOuCZINt0lir3cHWuLH0ELyUpIHIiPyCLS'
-             b'3CrvGJNKlYGNzm2ZASjBdBgBbFaM9f2xFpXytvFWG5cu0ka4ltvcN3ZWoqxxrCrFNAZk1j3gtcki'
-             b'WFArUoxy+oORPPTQI8qycDN0RmUSt1FgD+/fCOtw171voBMi7IGjbW3ldF5dOFgjd8P7Ni1BNcVH'
-             b'UyJkgItItRmqLyUCPnUbJHUHMq/HrSo5OhYxRIna9gLrgvl+ZfN7MDdcHb6TfD58DXRkY2qUZkIE'
-             b'NJxPpj0FcRjoHOnCmnrfVNv+AI9SftvAqfiQipLHVRppIUmNSRfb/05lfJlQ8FoXcunMaSbOmlnN'
-             b'dT7sf7zZBpM4i7ECFRc541AhJqQxhifI7fVRUZD2DAQ+VlzaUbiul0MCjUCEsZczO2JQe2+543Wf'
-             b'WNm7X/xwIQB0xbbpUDicOXNmAf5bJABXJgugYcy/JwHAz8aDYedTH/nwLyw3ZjhvbHC+QVyz3Hvf'
-             b'G2Rt/37ZnjhZO3qjVI1l+tpj16btLar9QvXS8XwI30AYBxtnA85tocL1uSKrE5LZSwqck8GQG1RE'
-             b'QHMWbpSuOI+OgKUWkNiTCQGJSgcLgSRssEt7D4aAkluHuWRQIpo7Sg+Xqt7GCi1skO1lmM5ME/Ar'
-             b'lE/ia01pZKHCm5TG3y4Y+NH2HG5vkvdeEZEtHG2gUizCvytzeBvD+CcEPUggA/kOaV4XEgtoIkx2'
-             b'dyyoyYzLHY5zuH0pVeIxjmUutuudgbPG9HbPKW1s6nQIYBXklnum6GZQsjw68In0ti8z+MfrTkDf'
-             b'nEwvwkDFQKgBnzx1E/uZ0Qgl0RahV/D1xx6Wje2QCHU7VnkbOC9p3et9Npn05Zpj18nKEhLDsUkT'
-             b'CtvlEEzi6yBTDRYF+faaIgE4GVXqYmyni16l58EeTuwGmStRdNLjXJ8eCoVED6TY0XAAZRrvXh0d'
-             b'IfRTY2XOrlShbfLSbJzp/gegIO+1GscmoPh5wwQ4EwjKmJjkSbwIXQJNoCs1VLJzAMC25mKuYCI/'
-             b'huTP2bGSlLAKMSJD2bp8nmqGmfn7kZpJIIkGbXN4YPckI8snvneWuie0Gda2hvVVMknjf69dIeBV'
-             b'Ll+6RNplDeh/XKtC76Fp+HPNjTd/lk6DCwrgFZv/g1Z64eyL2nFaPBYJwCuMBNDNE5KqfxEH0OzK'
-             b'Zz78gf/6xSe/cc9qI1PpGXO6QwWDOfnr7/seGYSdoHPohEh7jdK+AMVBsnZ345J0V1fUdLcYp6Ri'
-             b'EjbOejNsSjCDGYdKDxxvCv1EWpnXVi0lVL1WubNBsJns1K31n5k0aUZsQdRJxy2AGIBxw2OPP8HK'
-             b'hRavnHMLKXJsDHs13EFxBB3/199zlxw4sN+qQHx0Fs5hnS6H6I3mjM1T+tED3+Cn6gKHoCEweQGz'
-             b'IiQGoLUhwUHAKQliLGU62NENvJzZHCuFbQazm82A478NpFDNrldm9XDuFGUO1T8I02RWPaNKZHsY'
-             b'3H5va0TGgz53++JFTUjyl9rCRn64t+5HrPJ1lAI2nQIqdYkzA8s5TRRDsDx9JgSlkAjRSS/TsBTp'
-             b'5RIpZQSNVvLq62/QiEe72SwpOUL6GIyLens5VL1LNqs3wSO02ms1jnJy6/IgectpAlSpQRKzxFz9'
-             b'CMpp4vlT7yBcX7a1bW6uCoVImmomuFNjQpLTwnnC55KjDxZKqHazmiaItEY2Aya09HEcFMECK4XO'
-             b'gzUeC44NyoPewHd4zXQy0oQhgiLF6Ih+TrgnjlrA5PDZ7B6g7W5LNi9d0PGB8ymYR02IKBTEJgfw'
-             b'L6H6x5rGZCcmk24Ol2hemJooRT8DozEibX/44YfpoYBkHgqPBQCI4f5eXT/44rXXXfc1PxklOuHi'
-             b'8co+sGft7myGJOziAgC4SACuVA5QGhNgLgEIGX1/68L6Jz/0gfct1ZTKh80Xrd6lrlKA7n/gHWFz'
-             b'6YaCoC2dfcekqrdpjAOgHUJDa2WJ8qWocjEfL8ZTVlpAJEPQol3TdnQZgrOngIxLVrpKmVKuOAFZ'
-             b'YUOi6Ur4DGzElfWTcwteqM4GdBeMjWlFxONLA+T9oLdD5cAsGgrZjNdV2QwFH35z/fWvklZITvqD'
-             b'CVu8aE9njS67HmIKcgy6rTZllCFj7OcqNOjUczQA5a7RdK4tO2urR647K8LpaM6PYObm5qyV773M'
-             b'zGms8J1C/AWqbiEQttpLdMJTtzYFEcLkZtzbVfMfV6W2PQIdZt4YlYgvrd1vzXJDjGPNc4lJkZ/x'
-             b'6mMQM7QZ2RWi6HzI2V7a3JDdfo/BX4VsqpRIxGwGoDMkevv27pXXve5uBtvKNP+N58ePgbAN45vD'
-             b'/VFpx6VSO1Ta7pJCWrDTQ957GUcpRhVF98lMbzJLcBGo62a+xCSASPtChXtMrS+2vBGoEfTRXUHF'
-             b'DxVBjgkK+44wgcttvl8xOcw1G9B2PhJBU0wsTemPxwEQIB0ZlYiP8wKwDkmqJixFuO96sry8MqvI'
-             b'ozKfV2neOgWChmYh7Lk+fqavPMOKOP0ura2sqblTqZ+nHZ/Z/aTUwCzdd1L5NOqhjXW4X86+eM4M'
-             b'niJTRmQYfn7HnXc/uLRvfRMSy662qE6vyCNXfA1pnNUiyVokAFckAYiVwdyMqd6Rj/32//a+3XPP'
-             b'X7fSrmm7MGw6KLZQXB591avkxptvlv4kVPAHD0oWKrZJoUCosGuwslV0f8W2PFqrCPAIbINejzN0'
-             b'uqbBVAVvis15HNXoPJ9fmkyx+qkrXU7q3jatCGhSGhzkbGGYA5GSKOeLSmwSNqrnnn1GW7fsKKiJ'
-             b'DQMbddqdcbXDZhqq4wOHj1DxT90Cw4+hNAfEvihFLLaVp6NB2MuHJu/qk1UsqH0Qq6nKic5mDbcG'
-             b'CiGMa8a7m0xmyM2uItshAtaqWVnoZzY7DE6mIMhrACaDlKZOWKmfA0BntMDNFDsxHhhiO1cnXzwv'
-             b'BNTtzUsyGe6EYCgcCahQzDyQzrjuNl+P4LiIElc8QZbIE9iUup1V+dZXH5PReKrrbME8S+wFEyqC'
-             b'QHO4HjffehvFkSAUxOqbltR+xpcHqh4jAIwE4GaI88WsPbbuSzXp8QzISoljF6vUgIgOC65lnBSo'
-             b'WZNjxwajEmpYMMd1+v61Bq9twc9q0jzJw3o4vHc5KfgaGN7k1Hso03eGNLzMGufGePBmksN+WWlA'
-             b'wUoTKxgW4f8jHoLg2HpOoCOTtHDtIChlbRnpQWsiJANAfuO9oNmxdeFM+HNWmqlN5ExXwbwJoqkP'
-             b'0jO8X3eJnYg4mlBDoZlvRjaDy2gy6GaUSXwvz128SF2HnAZIVZIermpNuf0Nb/wDH675ZDRe7KFX'
-             b'qgMAs7Zp8R/VaVk8FgnA/6e1z/krLEBzm5UD8MOqNn8JBoCb/pyGN0BDLz71+E2f/Mjv/lynkScx'
-             b'Har22xz0He98F6lxEqrj1vpVMq20XQUHtqEFclDq0LZFCxI6AM1WXXZ3dmQJCnuhKq85rSA9g8Ak'
-             b'BRry0fEfaAOYnzqqnFZnmZxwX80iVgR7VUYV1M0zSwJB8BgYTVQvPstqaZwuJnRTVTpHhbEO1Nc6'
-             b'K3tDlVtjGx0gvubSHsrjeNOJ1xGITzx8N9NK4f9AntVVUV3Nz0VWrX6Tsr6h/lMHN9LkqrlKrjIX'
-             b'Om9iMOSoa6sXIC20nfO6ugwS+JdpUgPt/2Lco0FO5vLE50Zk2Lp8LlTYXrXreZDOWsmxyk8Sg/zc'
-             b'MirLSWQCYMysXRYcP+x7z13YkOeff5GzbJrTmXlQtG7mPQWJW+tkvOqGV5uHQkUqH2OKn9MACJ9H'
-             b'YJmdZ3R5xPqDLULnRazFHC1S8RdqLpQhu8E9xG5B3fAYOrYoqEDZZIsetD2MF4rJKLxnU5NOCCeJ'
-             b'cvv5nWHCYI6P9brS5wCshMlQFWUTq5eC8DiaiBiFSuf74RygBkkkTOxcmUJfckYEOLLZtorec4SU'
-             b'RXZGpp2qnY3LfD/SMmWGc+C9PEehwVrkkP/FOXuzco4W0HNbhDdsRyRsxmaPM0Oup+HmGL7HHUh1'
-             b'Q8XSvuetlbXLBw8eeWg6GhMjsXhcKQxApqyUhfjPIgH4T7phMIMMmxM462GHyzYvXdy/s71zOASm'
-             b'lbAB9TY2NnrrB3Yu1FrtrahG5837OzPOd9iF5MEP/9b7xpvn96ysLHETU4E2nZm++W33yzXHr5Xt'
-             b'UdgYjh4VX+8yuOJ3va1NqyQUGObLOoN9o9ORQX9Xue7g0KNVDt5/2ORg50t5VKd0LRW78dJnS7kw'
-             b'HLlLG2PSb4/lMnRkQjAE7z63CgabFIBZFzY2ZafXN/S756atqHeT4UWiAtng8Prj114TkpMlKvUh'
-             b'KclabWkgITCGAPADfu6TE/fcNk/Ox1E9viRd16BECdtY4eNLXcXXRkyFQu65GZcKGismWhlnNPdx'
-             b'dAL0bMUKq3y0wJXG5g0cqJx7sCkA6qMEr50nEoGdrcs0YIqyylrMmayw8zOaHSwMI5ddZDaSSTPq'
-             b'iiqLUA4EEPKbjzwi272erIS1i1bKVa1KXemMVbq20JdXVuSqq46EYDK1jozMqJ527SCzi6qYQdiq'
-             b'ayZMtPEVou7FEOygOWaU5S05GqBMLyEBE0noBq/nCJllBH206nHeJZ0itVKmb4PpBFHMJ1d1R3RV'
-             b'MN/Gv5Ek+0KlWAsTZZpRD2xEZO55CIrO8AY4tRJo/rKwK15JEcco0zmlQBVkFrPwk1prOQku0T9i'
-             b'1FOfizybyUl7VbzkGkWPBVhPh2OBuyISGFdUMzqhZJb0zZKWKhps2qgIiW9eCb+fzz/zPOmJBAVy'
-             b'NFMxEbjx5tu+cNXVR16s6EWwCDhXrgPgZLgI/osE4C/PEIWGM3m7rS3m8Xj91LPP3vGZP37wXZfO'
-             b'nrzvwgvP31RNJ2u1EFG2nvTV45/7WNVYWr546Pj1X3j929/1v9551z1fZCgDGAvtyPAeZ59//vpH'
-             b'v/yZH9u/tsz2U2auX1OqnLXkhlffJKOwkTbWDktrz0G0DLg5Y3OoN9SfHckAZpUQxuEsdKKzTufU'
-             b'rhaBrBWSgjGAWRFwRBvZGbebfveVjQWqee53YbWKIr+x//R2NhiS9H1q3NQwCz995owFGkPHO02S'
-             b'vFnplrGKDFXeoUP7pJ4rDYw4tryp3YloHOArcyTUeX9l27CzPn1lVLmk225dCG9+6y8xnknCPrEL'
-             b'oPJ3COhoQ09HqFRrJrlcGT9dZ/VmOaczbKDPw79L8P1BFwPIcNAz8J+b+SeE/148dzr8vDAXuBnr'
-             b'wCUCmONsG+tUSWxlm679rGg0Lri2gsGyOH3mLK+7Ny36KfwLkEBlur4Mvk4Bdffcfpusrq7I1uaW'
-             b'pPvOLJmZ3JAjnyuWAAG6Zmj4XIMPZ/s+OvSV2tIHELOutDU1CzKAHJDqU3WzI8NgqiMK8PbJJjQF'
-             b'PVI9c8UVgMFCB0aINE0NC0Ajn0zjMhIBSCtnNoUxxUldbZhMKctAhYRKjayVOlrieKu4plUUMYoK'
-             b'vj5V3qpy7JNyn1JAK7l88ZxqE/ioGqnJZJQATuJDXnEZcJ4szTArSzjScja2isJOBvh0URDKOi/n'
-             b'zp6Tra1d4oESMBTy0uEkbrzjrt+XWi2BKhePK9PEFckW7f9FAvAXgj7+QF0OnPIsr507derWk888'
-             b'/f1f/+qXv6+3vXH9eOvyARc2226rLp0QRDDrVOqUz1w9y4rR5cNnHj7/o7/37DcfaNV+/iduf+Nb'
-             b'Pzbt98WP+6wqP/3RD//saOfyWqOuXGvvFGQ3DRvi29/5Drnq6BHpF7l0Vg+FlW5x0wHHHVS4Yqry'
-             b'onV4tU/H0u62KWCRE4hVhOAw4t8BbBmbk1ppMy6jtWtVWnq2exkgMkOy08s9YyehA0csWPDSZEgD'
-             b'eGZ2s5lxslFNbe/0lNOcqhufAnZJsRZ14YN63/FrrrY2fU4AWrO7mpz8/DxCwmhxbk60aCadZgju'
-             b'9Lu5OX7soUv0nI89Am9aepjvO7azs1ythtF2LscTzn+LSoMLnmNMQb5JjR71BZ8z7W0p2MzFNrxj'
-             b'cBv1tmku1Mw00OqKZqkLUSUTHg38uQXu0s8Y9ZBhdoY8R5K079gJOXPuUgjmPbIilGI5Ay06P8/G'
-             b'h859XV5z22sUiOdkrlPiNSA7MeBlzs4F559sw9uIxxIPV8tn+gmkAQqDNTAnSCiRCKNSV8Cn3rtx'
-             b'3bEkRay3MdufakIEqhVldmsNSjFLZRLLNRUoUlOmRFaYGz+ZTXJl51RpwNeGhq4X1h3XBDQ6Yjks'
-             b'+cMbDqEACRogjbEq6Q/7nNtn9F8oY2NIzp9+TrYvX2C1nc1Zd3hzdSzj6AbSv+EVS8urfM+peWNE'
-             b'm4N5KUk37wwwN2aIHZ6nn3qKFrSNWscSRgWK7j924tRr73vLR43/uYg2V+hB7FO1KP8XCUCsz1Ah'
-             b'hyoafPJBb/fgFz/76Z/88mf+5CcuvnDqjslwN4f1KyqVEONDMK5x7qr0KJViw5caFDzKi4Z/j7cv'
-             b'rv7LX/zv/81/s2f9B6694eYvALi2cfbUiS994g//5hKrzyIZz5Ss/uty6213UFgnW90rzbV9rKow'
-             b'9G1GxzvIloaNa/vyZVk/uF/6W5ucP0KPHK3dsspJJyqtvU0EdHjvCaxcJUqiRkOfTOlmbG2XSQgP'
-             b'dphwnOM8PnN0BoRtrgYfBeNl1BbwTD6gQTC12bozHX2KATkXG6nSXerI0WuO8TxpplNrStbsUM/f'
-             b'JalWG5dYSVWZOQ3BV97PirG5bIFyszKHrHaSJFedbdpxQ68KNaqJwCx1XCvp1ogRCZ0CRUFtWBNo'
-             b'r9epD59zFg/zoHEI9JIMaLTaQ0Dd2rygiUGWJaqZLokGo1hRxoY2E5zKfm9OiX5OkVCBlyN56pmT'
-             b'3KNq2UxGpqy0GxTPGR2Z4XAkN7/mVjl69BhtnyvzYPB5NDqMFERV8uN1QFIBOh7O0ZnTXeaZ0CLR'
-             b'rPy8+qN1DMjSKBTESVXE0lQFc/VKKAoDBpZMGmYGUMoYgZcDx1RIvsI9hmSA0Iqs0g567NZwVFE3'
-             b'+mXFEQLFhLKZYQ+TTLgVTgb2c+FYoBiPmQTBC6MJhozLEq6l1VIHQGVkVDRnwgf3dzc52sgSQ2bm'
-             b'+FeZCiCbEjZKoZW0Af68aSVl5rY45/GjEgxR99+ryiBGKecvXJKHHn6U56gCU3rvDYaF3HnXGz66'
-             b'sr7vYtlfqP9d0R3fq4DW4vFdnQDo5oZZeYhnzScf/cZ9X/3i5/7a41/7sx8cbF441Apf1k6oXrvd'
-             b'Tqo6XaYtvNiuzjOXNv3M6GL8OYjg0/76v/nVX/5f/u7//OtvDkF88smPfeS/2jr/wvr+1WXV/M8V'
-             b'OIfgdNsdr5Grrr5adsaVLO09EmJCqE4BRAORKmw8aK/ivbc3Lsnq3nW64gGAtATwHpzDpuarHsFz'
-             b'4WcQ+5HUljZDFwOmVUZNjB4mEkV/IgWr0r+PBwNaweaRomZteOAg+qMxv0S50dlInaKKnOIHsK2h'
-             b'7bu6uiqdToczZGypNcyzXV1bntMRW+3CTdCkh8mRNuGUyrwKvFkkuVkGULmkPB+qamvvejWyUZT7'
-             b'mJUhxHyyWKE5DdpTgtMaDEYx0BGAZuIy0KAHgA3c+2pSkn3hi2HU3qNiHCmZ4fW7m5e1LS3qfJjZ'
-             b'cVVW0XvrWjBIuCqpDTLAeFu7xEXMeH/thIr02VAlZrQzdjOOOQOqMBnNEv6wlKNHrk5aD5VhE3RG'
-             b'P0NVMDkD5iFX3EBGgR0DT5pOfWEdI3Z2fJWCODIRBHbgHYjaT1TQjIF6Hj2Cn9VozTvVMU7UoHBK'
-             b'JkQXoTLRoMgSUdXDWd+i4nhK2SFZZG1UPlXUaPkXo6EaIsXRkPMp0VVgYy0lYFxmJLYWjJGy4xjO'
-             b'n30hXFf9rNwlsWvbGWa6/Eips3C/QHkTNFGyTWKrySnmIEFnXZwcuJcCY0WTuVMvnKKvA2yAmcxg'
-             b'LdEJabSqu9/01g8iSc8X4j9XtP1flAtw5Xd1AsBtEbS6UDk/+tUvvfdPPvxb//DFZ751azUeqKFH'
-             b'+GKChlf1cKPkitTHHDhX9HIzVIUN0u8UJKbq9xlBPpwrh41pqd2W/qXT9558/skfv/rqE9/4/Mcf'
-             b'/OkVKLk5VQiMLiN5sy73vfGNnP/V1w5JfXmfjEMVD2nf/u6ONEMlj0A1qQqdw6IaC5tot7MkQ1D0'
-             b'QmW6umePDEL14ymQM1VGAqrz4SDR4WJLnZtgWcwJ4mQqfGN7PTn8aNGGiNXb3bZ9d+YACMGb8+fP'
-             b'cO5MydYQIGvW3o5U6NKQzuMpRE32sRobwZY2y8kIQPWIWTDBkk6rRrSjx6GapZlRCL4wagE2olFX'
-             b'+VsEZIwPWE2iOsyt8pzYcZRTBhd6x4e1As5BRWdq5KrXuHYaPJuk1FXsnKiaXQjoISmBrDLwAZWd'
-             b'jGH0Q/zvs8p3yVRGZ7eXzr8oJUxswJ+XORyDZIa6V9llrp8lN1FbvkpzZTFHP2+YChznmH4JVLWr'
-             b'rI1vBkyqT69sDCQgx44dkde85pbw/BGVFbMYmFLWalcZ3Q5Ux7iRx2G9IXJUqSSzx8gHx2iMD/YM'
-             b'TDgKa8Sgj65BpUkBzHeccfGVjicaFHMN9sVkyr/XWMmXHCco5c5ofWYENBv3VAmwGVHyM262vgav'
-             b'pyUzEgZoPEyHygoxyipMr+qNlnY7KgX7UUlvNkuKVoBMcIaDvvQ2L4XvsTC5KF0pmcyYI2oyZMp+'
-             b'leoZrKytG22zSto/6nfhtRMwN37xc1gDqi3C4Cok1E+TOltTjIkxQobDiRx+9e1fuPG213xWJsMZ'
-             b'nXDxeOXjfxX1HRZJ1nddAuAtk8fGdPKRb7z5w//6N//bk49+9Z3VYLuxtxk2+rwVAtWIHGa2vJH9'
-             b'V4XxgDVzJBK7UZfmUktWQkVw9dWHZHlpSU6/eE5OnjnHjRaV5Gg0kcFwR574yhd/ub+xOTl/8plD'
-             b'V+1ZVr1zzE5DQBoNx/KmN79Zrr3+ernYL2T92FUyHGOzrMvu1mXpLq9w9ookALPmWqNms2cg/gcM'
-             b'Vo31ddnZ3A6BsqZCL16RyeggRPMVMZnazOrBVE8aoKvyM8wTz5toZUegoTPDFa08awziG5cuEIhY'
-             b'r3fSpurmgl5kA8CLfmVl1ZTdQpANx4tOxQQdEJtF0+mNrekpN0aoFDYaWp2CroVAUIudB4Cm0KYv'
-             b'NcCA4iilJgMI8KSnmfALwG4qfFOqv8B4zHZ+EdYNowsVASyIoHcGHsTYhO1uVIsyCWs8Ia9/Mtix'
-             b'YGNVHdgHo5FsnH2R4EYxx0RnyVKk/mWWTFYxGXDm7hdxE96bPkOiqBOr8dypsyGgT6h7P29EE0tK'
-             b'Cv/gPcP1OXDwcEiy9kgvJE9M5CJIcm4eHcVoWq0m2+TeQHbqBunZJRGZw3hYRwDaDxyRgIkyNaEg'
-             b'C8iUyyd7ZTqTunAzgSJU9+V45oELNkjlncn4+tSR0g6PuQpW2slRqqDemDGpimZAuObT8L3K0ugq'
-             b'YlAkjZIiMr8YaWcM13PmbqQBfPPSeaVtGiJTk+PMUvn5aZMyaGhFjCQo4lDcDC47A624tA6VdX10'
-             b'HOaYcH3joW/KC6fPhSS3m5wNceYgWn7vu3/g/QK8QjmQhTT9lav8VEVysRTfdQkAWv31Rluee+aR'
-             b'1/35Zz/xdx774qf/Wr0c1rsh2Lhul9UP5uld32SlBMvaaQHxk4IVDTY0eNQfP3pM1la6cv2110g7'
-             b'VO/Y+ClkEraC506fDdWwS1aqzfDez3/z0X3nT58S8P7LOftdtP5XVlbkvvu+h+10cP6l0QkBp0n0'
-             b'NTbfCTZ1q/rRkgUlr93WKh+7x7jfZ+DrLnf5O1WPqylT3LjaRFZ7BdfxGZROrVKLM0szeHOgt025'
-             b'CK8bjfr0kEMgpUoRWAJZR3Z6alziDGKXGTCtsg3QUczFy3qo/u+867U877JSGtmUCPsWEyueUzmW'
-             b'ujT0WHgcBY8banZAW2OThNYBkgF2HUg7q5Ompi3nnOA+yuEQJGZzYgTKaUUU+yRUVQSwVapWVxH9'
-             b'r0GIXRUGORLYElWQwTerZLR7WRwoiNVM7Y0yor0djlhSlcmK1hIAdZbhvVFJVM4zG94oxyxZ0t6P'
-             b'fgEAyrlaR77+2NM0eEpKdJZikUlgmSzWs7fTk7W1NW2lA8hY1Q1wWIWEp0+Mg4Tz8GZzCy+FVq2p'
-             b'9LlCuz2VqRIicYVkM4NXOCfiO6bmxIhrh3Uc6+gElX+zs8RkiuErqzPpYnA0+geDI96TI4Iqzcgj'
-             b'B1LxJ2rzHEcNHM+LBn+a9xDgWiarapg6TXqb4f4ueM7A3eDP8sryzNOCSYRy8LUbVk/MBb3fRS6c'
-             b'PyP93S1iesSYJwUhErgHsyTTzHEPRavC3tHR7p2YK2Jm7zcPWo1YGmW6ZDaS8rzHers9eezxb4V1'
-             b'baW1mIb9ZjIu5MDx6x+5901v+V0JSbWpDS0eV6IALL2hoRcZ1ndHAmAC8HmrI2dfeP6OP/rg+3/h'
-             b'ia987ofzyaCxBAOUmjNnNk8EdASWYdOG3Cw6Aa1QFR44uF8OH9gr1564JiQBbW4+pOeFP2iPZuGm'
-             b'evHsWd5b0O6oRZpRWK6ts6fl7HgqzXpN+ehsnarwyutuvkX2HTgoWxMnnbXD4RhaYsUQqxYEIyL2'
-             b'Q4DohGQBFTVkeRsNDYadpSUZ7mxztouuBjTZsWEDmFUVEwZx/I4qY5in+2gx6w14liXBFTGXNlZZ'
-             b'rAqnFmSNzMwoX3G2mjdbWvs4M1KJOjeZtkJL424fPXZYrr76arIc6ADXWmJg5fqVY9qjosVPtUAI'
-             b'7WAOj9aogGrYYGDmHLzKCCKjymFh9EWrpWmNi/Y/xJOoO58xgaNMa66UPj33wlwElfXA6hXtan6m'
-             b'gs4w+gDuAmp13CfCZ5VAmlfzmwZnFrIN4R8XxWLivRZlX8tkABMLQ5kTtNHAUpFtQSEZowOieh2G'
-             b'e2U0UdodAW4JVa7VLVXwcPXCjXbw0CF5bUiwEJgZytAZqcygCK13LHBWEvmO92s060lrga1+s59F'
-             b'm19MfpfdD69Wx3wf0iUBLnRkQ2CdkBBiBu9NNZGZXWnn7NRPgFx/U5wUcy10JtNr1kmKgLfPpaww'
-             b'2A5QUaQioXYXMBLh78P1A19fCGrVz0Ii2GJXQh8YWXVCYqLzKEffDMJcK3UIZJcnrMOwt22aDWL2'
-             b'xi7ZCzOoGy5GfMT61GR1/QCBgD7O+yPW4CWOgVlq3yPYqJVARRbPI19/WDYubVDR01kcAoh4VOby'
-             b'Q//Fj/xKe3m55wcL578rWv1XtUXx/92SAOA7iTnycDJsfeVTf/x3vvDgh/+7RjVcWq7nwr6uM4c8'
-             b'VhalIdpLGYWAi5n1NcePy3UnjnPWvxqqbgiXYEMqh/2k3x2DAv7e64+J6MZ7TqsZXm370llWm+1G'
-             b'M801zVZEbgkJwDQEt9rKfql319i291aBMp7Q/lZb13BIQ9Cqt1thA+uTrueprR6Cf1PNcRrhd6N+'
-             b'T6qJObsJtIc6oVIbsrpl8JPKqi9J6nR96PmDAYAgagh3BEa02/M5Mh4q0NFoIM899bTOMNnG9yZ+'
-             b'MtsUIx9+apUz8wcADGsqYVxMR+S3R6tYCN/QOdEU4lhNgnterycjmorWsoWqLTIBqyhti823ltXT'
-             b'OpWcRTviEcD9ZyB1SndjTVfLktRu7qwtDwlixDETtuHr0cUYhoqsHCczHwZIyCCHpAB/am6mskfw'
-             b'ozeEfqQsGCCTwTbp1lvAtyQMSaI3ASPM57/2jYcZ0POsLXUEw/R+OjqIbXqMht5y95tkz9512d3e'
-             b'NvfGMhnXtLrd1NGprE1ey5tqj0u53zGvSW7ShWqeVBomRHjt0TUpJqa/j4sI9z6fmYS0m83umfCE'
-             b'9y1GurYGPkSS5/UHSVZXTOGhMjqht44KkgUkb2WlSSUBuujKVCryMx5sU0pYuynhOiPG13SOXpn6'
-             b'JNT/xDps3oK7VDO3P4zJNi6fD8nLIGwBVVofb10rnxgydvmc+hnAKz6JZTk3V+371PUX02pwUarZ'
-             b'UmwkTRsXL8rDjzxihkwV1xnnPhyPZc/xG5+47+3v/G0ZT/n9WjyuRPDX78BC9e+7JAHAZogN8LMf'
-             b'//h7/vSTf/QPLj33+F2r3boa2RRahWBzoL67tUwBxNl34LBcd9Otct31J8RPBiEA7FJdD3r4cXxI'
-             b'kZME5tKbC7NtVLLewEE+opNNKQ5dSN0z9bUIjK86cY1cd+P1MgwJQGf/ERqfTBHYl9cYfFmRhvNA'
-             b'tQ/UOsBxY1KnMml2OuG4xmwxI4g2Q/CcDkes+HP6lLfUGz1U8GMY6BjwTIN/aSqALlWv3eVlHmdl'
-             b'gCUEXiRCUazIYOsaWrLMKh+faG1xtsu93ixXATBrt5aZxIA7DmaDfv6UvHIA/NAmLU3ZjUlY2CDJ'
-             b'fkAAhkMcGAi5eQ2YaQfeb0KwXlODvRivn+MOE5bxij+gK105NcEXYaJAtUQmAnV9PwLOwutheUwH'
-             b'Ome4g5AAjHdFFfzNntda0RfOnVYEPZIRL4aJV+nljMeUW2UZXxtXK5uxLhQ5oF0MowQCYb4V7gHq'
-             b'72dKpXRz/Hjay2Jtch1dHD50gDN9Jh1ZZjgDVehDxa7jpkzpopXqM0ik9+W5hTEzTrLEQYwZwBHK'
-             b'ZKgt8cz4D242RndmlsPvQjFNuAaug4vJjQnzuNhWL3QUUmqlr4yKkgZHDJilBVULnxQ6Ah0VCozT'
-             b'oTIDjLmSOTcnFa0HRYaBmGaF3ZcusjLC57zwzLMy2N1SxP9LbDp8+j5UfqYFQEXG8F3rrKxqOLcR'
-             b'g7MuWVK7Epf8MzITw9LDUgzEpz7zWRmMJ7y+EyY+ubTC9ZuEo3zLe3741xqre3shc1/g0q7QAyyO'
-             b'6W5fmvBQWSzHd3gCgIuc5a3f+T9+43/6/Ec+9L6Wn2TNWgi6o5LiG03Mgi2QoZYYhCB37Pi1csON'
-             b't8hr73yddLttefLxh2S0u6mqb4Zg9mIoukqFU/I4jA1/v3x5U86dv6TocFbQXmfkYZPtDYbSCoEt'
-             b'i/SqSs1M7r7nbrZe6+01qYdAWdksGJQ+BDe4mS2vdGV3Z0sR7dT+b7LSja51pKrlOidlRT1RAFEd'
-             b'HgHDvlVquiFGF7wYzLQqcqZl3ki6GLElu3HxvFaUrCyVF63uNiogREtU52wubkp6Ec0GcZqQFB0/'
-             b'fpybPFqweUhggMEYhWsAEGDOUUhBjEOc9xYTtYrF20wn6hgHYxiq0hHgl7Oqb4IhwGpQAyjodbCo'
-             b'reGzwEHHDJvYgCIxHNhJ8BPTuy9t1qzCT9VoHNZrwiSrsKSnCGupdsMiSZZGeZuhGt1R6VxXGire'
-             b'KkCviYCOGcoUVCvrtGigjrr/s9YkskNUh088fUqeO3mGnPUsUeMUTGiIMmowAJuwd31Vjl9zTDtD'
-             b'LmOlKt7NySlrsJJcf0btCiR+eZ4Ab5EKqneyTzTPqG3Htc1SKGei4rx/iQeCtv2tdZ76W5UmVmVp'
-             b'CaRnRyECH5F4F17vp8za5N46Cpndb0zmcB1CYCzpv2C4iRSofQK0TnGP1A3oJ37mg+A0ecG1Gu7s'
-             b'0gSolvAHMzBfbPvPLBtcIlIsr6yTQggAsKpdmhCTdbyI/LfOWgRxRlwN6K9f+PwX5IUXTkun3WLC'
-             b'urTUIstnHBLhG+68+7MPvPP7ftP3tvS7uni88tivsC8++uUvhX2/JTfdcafppCwe34EJQPiitzty'
-             b'+czpG//FL/3DX3/hsa++dbXbCoGlqYgnbLL13DTAMxmHCrdV68ib3vYW+Z43vz1UpW0ZD4dy8tmn'
-             b'Zdzb4SaFNrSLiKYk85nPVTlaoYCeNAHKvdbQysYZEkgUbR2lYTHjRFDds7Ym1157vQxGIejs38Mv'
-             b'/zRUOJjpT8fT8AfI9Ux2Q7WCYNDj/2v7HJs62u9UAHTahEXHgNWh088eh+dHMd0sScHrBqqcZWza'
-             b'Na2Mq8rE3Kqk8Ib55WDQJ1aAc351guUDbctxUZjSiXrXIxtyM6ibobtzOXrsGM8Z6w36Hz3ibVyu'
-             b'oEBt99PnvdKNGp0PnBMStUmh7V9gCPBvgCNZK08LC1llcmOrZwpa41y9Mnc9HHPNmSVzlqR7XWz5'
-             b'iqqz1ZrqikcMRaZKceVwlzxzmUd9h9ddunCG4DcAyJjEmGa8N994b1UkfxJNmYwbob4PVsZms/fk'
-             b'WCNryPOnz8swbFCr7WxOTtjbWCUzqWUn43CP3HDtCVlZ6rArlDoLBkgbwroYwjeRl2mVtuaw2g3Q'
-             b'DMRk7CxJjOp3CdNgi5XFo5/voVYzbIKbr6sgnRy1D0QSnVA75jaGMo2BaCAdv2LOEidvmAG06ovR'
-             b'Dmu4LD57zr7VW/cOgNEWAI/OvAJU+lATkbwZfj8g5z/PvOkKSAKLeq9mXHGUJ1ESGblTSNAbrZYJ'
-             b'EMWVtGWZ0/ujlkSm44jc6yio1ajT8OcbDz+solxR5tprYjYIz3vgh378l+qN+mi4mP1fsZiAqf+n'
-             b'/vhBece737sA/30nJwBA6H/xE3/8E7/zr37tn0l/c1+3VbN5PCqOGkU4sB8jSCBLv+nW10rIvmXP'
-             b'+jo9uIvBLhMFtAiduZA5q1IIaMpyU/u0CiWy6OfMP7wpn2Wmo8+9FNK7aO/S8lSo3X/ffffJ3v2H'
-             b'ZNBcEddZoagP3ns8GrG6VRvRkhXteBwSg05TBjs70gwJDtr7xWiiQL5wnK0OfOt7YrZjKkuKjQ64'
-             b'v9xpSYJqydDNwCOw8naaICQ9/sjDBk0cVVc5oUe6N/EZ8KwhT3ryxXMyGE5n89fK/rg55zkXXfn8'
-             b'TL42VoIGOHRZBEoKq3yq0lEW1hvNcahaAFOdRU/LqcSyDN3rYlwZA6AyxPrE1PhyU4obc83RVcD1'
-             b'd5DJRYeA4kjO9AKiIY6qMSojzHH2Xwz7VunlEtndeN72xoXwfj5xvlU8SWfjZRT5ieY/oliEqLfA'
-             b'pr8p72iyoD9zJp986fIltvY1LvvUfaiqiEFwRlssZe/asunXR+58HFbYzH1O6lQxCNE50XQJ0BGp'
-             b'5ymJElN6pCqiCVslhcLSm9NlDIQ6NwcYkF4JMVHmqEHNg8iysKSSHSBrfyTHSXNf9NadKIrIBjC1'
-             b'StBxh1sJIFkxsVIzq2Fvl50c3B8I38tLK/wMJFfj8DqsYZ6ZXHNYRwA2y3BP1zN5SafLGd4F7IzM'
-             b'VwlcqhLOnntKRhaOARmtq+IM4yJGlyS+xUUfjIwMns3NDfnkn3yClr5w8iy8YiOQcOwMJ3Lrmx74'
-             b'vbvue/MfYc+BhfPicQUerY782ac/KWdOn+Yesnh8JyUA9kXGBgPRnM99+pN/69N/+OF/2sqqnK3D'
-             b'sowsLXENpfNAYvWqo1fLO9/9Hjlx4gY2BoaTiVYB4VvdC5U/vOgzVyX+MivJOPz0uqmp57wGNGw0'
-             b'oOCBdx7nkmIiJ5mfOe2hHaqc6kxuve01Mg2bRm35AA1/okQvkNuY6YL2hs2X6n6Q8w0JSndlhboB'
-             b'9UytfIEBQGCbTAY6lkBcrWmAk8q/lJIUKzWqjEV52peqnSXUolWw3MycrptEGdZQ5XRW1imRm5nI'
-             b'PMV8bBas8r15cr7NM0V0s1LD7H6kdL6pURQxCqBWu1fWAdu75oyIjRfroLP6ipU5ugUNdBIwJuFY'
-             b'QDX9p4W1mpkAhNgxNd16b9enmNrct9KK1I4rAgCrSlvLDEJh3SeDjbBwEwPwxcCXSW9rS6pQldYy'
-             b'ne96s471UX4487M2dKqMM8OCSGo7Rz+hqO8PDEQvBIXt3T5BY87ayVJZN8la3vHRbjflnnvuZidm'
-             b'VoWXaawDM6jI5VfmWplm8MSHUNJZJX1dXAv7XJoFmT8AxZIqq3VLnYmza2GNHuBpTDGHVTDa5Ay8'
-             b'hbFJzJEwShFjPdHtcdZ5oX2vXUdn+hU83vAdnEJ7AfdyMk2234W/dZaWDW+iCpaROYfX43dUWIY2'
-             b'Y0hmLp07LdsXz3HEpD4HMfjP8AoumWHpxcH6NLrLsrL3kEQ9oty+H6WbS7K8gjsVBxvuNQo5qZ/D'
-             b'gx97UHZ3euwuTYm/0BHgIHyXV6++9tRP/uz7fh4bECSZF49X/gFb6c0zL8gnP/L7vNcXtf93YAcA'
-             b'DnujyWTtE3/0h//4G5//5M8s1TMHC1oEBGcVCx6jfj9sDF1593veI7fceoesrKxJvzfQuXUmKevf'
-             b'2dpQPrXxe7mfV3FIGhnd1qrMXZIePXfhIjsCNISJeuLJfSx6qYdAFDb5G265SY4dPya7YUdot7ps'
-             b'+TOQg/cOcB991RuUVEW3ABUbMAHYlNFuL8Zw/2vwpq63GjLp9xjQp5gCY7NF0CqtSstkRtEzdDJm'
-             b'5aRF6bZmXu9eA6jzaWSRyczD3kdUdTmRk089wSosqswSH1GUhtzWmhHeB4cOXSUHDhy0yq6mHuoA'
-             b'/xUTq2pLDboTpfXRHQ7CO5AJTt1mFWdVhbqcQRwYiVhVqqzvmOJOYrNkUABzqjTmpBEiGkRgFip4'
-             b'MAcUda7aDpWNAJRtEN5itBuyq4EFhSzi/hgANi+8yKDkk9peZnK3xuWv3OzeSR5GlanHiUkyG56C'
-             b'8H71R0AnAPS/wgCRrNZ9RoqpWtTaOCBTbMSeqw4wIZQqWsmqjkBmVWhlx66XWO/jSmztWl0dRUVR'
-             b'I51XmHOdigNlZlKVR9ngmLBYEgVaJqdcwBS4fJZMcHpSGqpeR2jRhlrb/3oN1AfCh+RPWQZ6PS0x'
-             b'DfcHALjEDKj/MLMnyl1DPhfHGN2qLfuKjJzYYo9i/PqdvqzsDh8tlMUc+Ox6eJOCFsMhOE1MgLHh'
-             b'uMEAi94SEfsqpaSOqQS6fNWQCTCUPT//+S/K2XPm5GhjNSQgeMGk1pz81E//3N/ed/SGZ8OXN3wn'
-             b'6ouo8opH/4wF0kd/90MyGAwW0srfaQlApPidO/Pide//Z7/8gfNPP3FvN3yRJuA+YxMxdDk2z8mo'
-             b'L8eOXiXvee975ZpXnWAV3d/d1S97plxfVJuD8LPB7jZPENVIVsVaXhJ9Tr/wmbnoac+VYidVxQ2z'
-             b'MuBR1HUXN6vgpFIZ17tff69U4OrXl6k1n0k4brj65VHBToPzeDTknFnR4W3p72zRiASb6ggUNFj6'
-             b'9iZUqPPh9/V22CTHffv8KiH8I90vBlTgG7LS2v8m+4tEoJrb4OBtD3vbyIhKCnjqt2rdBKVQQYgF'
-             b'x5J2Rq+UL5jpKOBuqiY0IRiXCFLGoqgIZstNrS8avmjgYSXrrTU8UboYxzJVxIdrazlRy8wGWS+p'
-             b'jheglJik2HNDiE+VJ08vBl7Z0lq3RlMsRzIc7KSKX9JaKkAR4D8G5CzqvnuV69VBhjkTZmmO7mfy'
-             b'eKY86A0fIlZ5Ctv5oEA+8c0nyHyI3RmttHPTnclUg8Hr/PvGG6+X5ZAA7Gxv6WycMIdKUfY19Vmo'
-             b'ShXx8Un7IWOHSIO2Gfsw+YiOCm6m/++0MndmIKT4gMJyBTcLuHluKpGVJi0un3U2LInUYylNkjrn'
-             b'+9iJE3NBvn9plMBiHGKiui66miagSSERiUIjY7LskxWvD4l8jwBKNdeJY169P8++cFKm7NgkpKMO'
-             b'NeyfVby3fZnso7nJtdvSWlpSeWPz+4gYgZgcV05m+gxGEa2H43vozx+SL33pzzQpDQdZ8zEJ9NKb'
-             b'OLn/R37qf7z7nnv/oNi5mEaHi8cr+6iH6/fHv/e78uTjj0oT6pch0Vo8XqEEQIFi/zmDv5d2uyWn'
-             b'n3v6tl/7xb/34a2zz1/XMcDYeDJVyU7jGU+mhbzh9XfLu975ABHlQAHDQU0AgMOfaobqhZocNeMz'
-             b'02w3R7pI74mBvbS5ZobWIGbPIenomSKfUol0GB87Bam/EDbc/fv3yYkT18kkbOTttf3hNS0eM2RO'
-             b'O80OMQAImhS0cbmNDET66ExgEwSFsZiyTczijm3XgkwF72fo5LgtJQiZ1yqQ5wVxHYb7yqx9NaHC'
-             b'rNRzM57IxsWz/PwyBLWa6baj3d0I1WNnaTU857TUcwtm0a3OQHURAV2JyswqL7/GpKzyZdJKwA7K'
-             b'gE/wpJrblCZZDNc7Z8Nzghbz+Lxa8njn2mCtrI2rCYFSCOEzkFFZDwlEoUEfhj6lHkvqBjCYhV9C'
-             b'QwDVNbjm5cQEYIzGxecUcilU/7g/MrbKowJc5MJnUR5+hmyPLJEIPKqiMqAG+czU8bAeqA4HfatU'
-             b'fJSXETObjzbImfkNZOEeOqGdFe9TsgG1Q8gqd5ZX+fzRsK+OeKEK1aQjJKjQRWh41fbPdOTBlryZ'
-             b'CkWvA44FKv2HshVeSoXMTBt/do+Z9yM9Jmz0ZayX0nAdimOIAECRqMmvOAHobE9Iu4XoUMQiatKj'
-             b'ywfvC53NFya4o4kIKKVIlPyME8jvxYvPPSWjnctSd1Gh1+iqYnLJzpIdY2tEp0h0J+Ct0eh0tSMT'
-             b'AbR+1il8qZEW82dp5HXZuHxZPvenXzKDMUfdhJphhzD3f/Xrv/fBH/yJv/mLNEpaoP6vTPAPa3/y'
-             b'qSflsYcfCnGio3vO4vHKJQCd/0yAFW9VhwuB/NRTj932m//0H314++xz17VocjKlghk48xVRwUMC'
-             b'+n7oB75f3vTG76Gxyng0JpDPW5uS3HK0FMPGijknxgSOmDlreSYDFjHrXHMJY6WZUQAHG8hmqEDO'
-             b'XjjPKiTRp4wS51M09gS63XTTXdxcJnnYmPOW9Dc3Kau6tLYWAkBfZ7dFxaAOzio2J1irtrsrBC+q'
-             b'L7oGR1TTnoAwR0czRR3orFUBWzabRhAuVECHFEGY7Wx5FXvxMxtdDxvfXGZzcQLWMmuT6nOGu7ty'
-             b'4cxZpZ1FMJfx6BU976hTDyE+fBGRa1ERzdYvc7UZBYsV4IivwxrQTMlogf8ve+8da9t13ol9a+3T'
-             b'z7nl3fsq+Qo7RVIUqyRbEmnJam6wLMsZ2xrLQOBggkzyRxLACQIMMHCQNskYEw9m7JSBPY5jY1xi'
-             b'x3YiucmWZUmWLJGUSIkiJZbX+323nn72Wlm/r6x9ngO48kq0cY70wPfuPW2vvff62q8I0K8m+u9c'
-             b'4YvBksgb1zjQFayU59T7QBMCaCawfbEoBELRL6pYjQm9oJ07nc5yZ8bQ5Zj5z0Z7Sldj/TfBgHjP'
-             b'2IXt61epWW9KsJvjtvNIgCwYCAOBY5dXh8UYldNegfWCgQVJ2vZ7/SFTw1hhL8xVsaGivEkSMGN7'
-             b'5ZMnTqpzn7S58Z4t1pd3Cv4DgG1JkxQLzzEr8xkXH7oIkkOUlBtXAOqVUl3jvWJR5DUkBcfSnCgi'
-             b'CwMpaI77CM5n9UiWoS6kw+K07c9diTBTrYhSmu/p+oTiIkZM/JygyVWMWW0vGHCSKaJDwccA7Idz'
-             b'EmIG4OHztzeu0iQlc4WzZMOrNHNQsSaXk6dABWWgJWM+C07MQ5mdn/Q+EfBvoWM9pwZPgvwvufPy'
-             b'yT/5DBtgYV9Bkj6dBvUTmVJr/ejVD/3Yf/TjrlGf+hjJL2LJa9/5LyBUNqTf+o1fEbCsVBWLx9+X'
-             b'EYBLQfHK6Vfu/l//h//6/9q7/OpdXabGUUZ/+yKkQD6gQ+ur9KHv/wDddvxWGqQAjTmc50pHfOAt'
-             b'yHFbEwCwFPEH/W0RQVETeU4C1NveQN3RUdby5+5ooQ5lQP3z2DVUymAkjAHMaFHxgRf/6MMPswCO'
-             b'a3ep1uqlTWqUKuk6t7nZZhizq7RZNNJxTVNAmoCH7pS5wNLDU57aI/i2lw/QNF3skGSdK/vlGK0L'
-             b'7XSEoVx7Qewb3k+BaqFqOXP1lIIoz5NNtU5R6hzcGVcggZF5DgZe1DGDmdtwooFKG4hznBeY/BRS'
-             b'SZv9LFqkRUPm9AgELHDDin2zbNmLCp+DgqIvBKkvQZHXQ2lbzBIIY65w+dzVpB2MwII57GQ00pox'
-             b'vW6s9sacOCjILAUGVIuRtQW0LawgPlxXEkhLFYEy3rdTC2ShlkZnwi8++9pXF27WSrZQrIlAOo/t'
-             b'Hj313Bfpxg2oMbbJlSEbAOVeuoIHIf/8LW9+lFaWe7S9vZ07LhyorT6NMVvjkiZylDsVYS5Yiz8A'
-             b'n7NCaYesXeE42SpLAewxNqKmWg+52jecQ8GYC2ZumBEVEjUKCu6D0FJN5ZtJgZfGsS8zHRMIfXQA'
-             b'vHgmV2OG9KIB2DlpvdtQvtRxHHeDkNAGAWLm7r2Ofq5dPMOaD3n6YoJMJKC9mLv9dj4kyS8jwLZr'
-             b'3DmZhpCBgfPaCmWsbIttCtRst+hrL36NXnr1VR5NZtyQJgu700gf+bF//BNHb3/DV2iyy74Ki8c+'
-             b'PBpt+sRv/zptb95ICVhDOlKLx9+DBAAbcrqxrp47c+xn/vt/8nPj6+fv6rXFJrdU5b1a3TGw7867'
-             b'bqcf+fAPUa/dYDMdB/e/mvKxM31Plca4tVfjagpGKEUUOpcnA2lJs9cryh3Vo9C2nMyaEXxY/S2q'
-             b'bbvO0ZUCx3NX1m0f01333M3ywmMo/6XgPRwPOaFBoIS8bm95hYb9odiupo0SIjS1FDg5yRhPdBmc'
-             b'ItOJ3QG5cpujIUplQ8qDlsqf9DVc8TGwSapjbn0X8juRIBP9+a1U6Y5TNdbyMlfOlgH1Ot1y931E'
-             b'f/ac+b1JwDDmQwzqKy+dhTe84b70fk3WKLCkKccz1qqfidMiz/cjdzGc4giitZiDCAVbm5gBZvo5'
-             b'xsNGEJ9NNJiw2I3I2tr4ZTIWKVtLjjiAMSo+o8hSIrabgtCAVRSl8PSVQU162tVzZzWAFsqGMLCn'
-             b'y4C7kOO1gkXzulS94lgR7GWeXogQE0RxmG3ojF4Ys6FUmKPoIYCeOnmCBYgYsBmqubSg4kM1QnB2'
-             b'LnR8hf8i+USCVQiolBM5dFy8VOOFgjIZ3AkbZaVgAk/gIaaFThIHNXk/BgqqNTJooybzy4WXdqdK'
-             b'aFSQgWEd+xWoohZ/n+loN/1srAwaVSYUGj+vVKPdmetmSeTGfF6ukTBvw8CS11cunNYRl1Aund3L'
-             b'zqmDgDJzdN6hKgly7TLLZVVsgPk9HZkJo4wfSD0CLDmWceD29i594hOfTMlTQ5UEVfmQprQ9mNE7'
-             b'PvDh//1t73rvz9B0d2H2s2/Bv0Ff+swf03NPPcW6C3G6wFfsTwLwjcYAqKPWlVdfOfGz//N/+38P'
-             b'rpx+tNOQ9rBwvmXmvrl5nR5+8CH6yI98mAPAoD+UNmKhm3WUgCXcXUEsC11uyhXKNFUhhQyns02u'
-             b'U2BZzHNDJ2jlQp3DUnC+ePlyBssxJ1ypVHCEAwAI9eMsBak7776LqVag/WEO7XVfKtUaV6p8AOra'
-             b'0hqHnWo6xpLVcYBU76gQ34xpcOzOZ/7zClI08ZagQZJNVVDdYXbOOgSCkEeVx4YtZBual5koqdc6'
-             b'WrT1Qq3kA1fxDKp69Wtplx2lp5cZZV11O1z2ugdam/UMqLKHlZY2ZUU7b7azcDY0tL1R5bQjIe14'
-             b'f1OCkWsxbh8bcjsqLUtBW9bupqKi6Xl9D5Xs4aQE9KxJn6b9TZ3JU56/G46CRwnlWBDxzuVjpcr5'
-             b'tZKP1WjBuArtMsxLxhjNbH7NcM1sbe5oR4VDsAT3ubYmJ4Qp+HZTMDx56iSNJiq244yCWPLYq57W'
-             b'PKi97iQlNK30fLNmlseMA7IB3hzb5IpKH47T51Z5waA7Gc9IYBcHSZPQ1bm5FyfGzPvUz8lceSIF'
-             b'zLrcdSqN2piuMSReDBJVL2pb/8BOkZGZI7WiyPiSqVoT43O9teeDrGw9Xa9XL57mxLjuLQGLWd7X'
-             b'nBWj2jZzN8RJARB0ZNRbXeckme2IrZWH68pX93+wwkFxA/jzux/9GG1t76Vz1RDtC1ybARTjko7c'
-             b'/dBTH/zIf/DjevBEC0LaPgT/Ol0+fZb+8GMf05FTJT61eLzWCQBm09/gx5UzZ5b+t3/+E/9m99yL'
-             b'jzaZZzvV6poIMLBRf0Rvfctb6Hu/53s4oMyUBsgJgjrwmUa4tebMjBuCOnvbG8zHZR35Uv279e6O'
-             b'NvFzQgkU1S/rLXo6c/Yi+IiCCzB0vK9UAEFLbHWW6MGHHk2bdArwa4dkVgxN/3abhlsp+DjQ+/pM'
-             b'NSuV14/qHEh6memWAvRjPvEkdxsMiBbUN90MadHWZ01/bn+PBWyFuTmqaUZcO/U+V3OTihfF7oMs'
-             b'gWyVimIAagzImuoc1YDt6hwYK1W4EE09T5Xn5oSByFV9AAYHMkCqUNCl44o/b48yQBcBHd58axlN'
-             b'L+/l50YZitsgK+xsDq2tX6+WtvbFsxjNhGZAnYdSuwNe2+d6dBCWGY20O6TMfvC+VV7YsBGuyl7I'
-             b'EGwuC/FUzvJZMEoDPDo8V6/doM2dvXSO6mQquy4/T3wGZAlmjB85fOwoJ4aWbLEi5SxyF6vR9Pla'
-             b'J2UxCIXTcyIqXPyZJDtO3fkUM4BOFgIvuzEGykA7p8fndNQDtctSuzoy0hE3QYzWiKrnkV5f1QhD'
-             b'VQ/5PkoJ93AnrdFU3fVUqEgptBOWaw3Ug3lUUCHi9ELMd5vNNjXYMVLTKnWk3N64RoOdbTF44i6N'
-             b'rGFpOgkuZjqmd9X1nhW+0/E3u0tyr+ups+6KZXjzLAm2kq57evGFr9HZcxek5UxGG5Y39Z2VvQ//'
-             b'4//0P+msHdwmWCcvlOj2YfDvePT3R7/zO5qUeh5fLR77lQB8Iy9i0aD1H/21//Nf3zjz4vtWmoUA'
-             b'tzh4RJ7/D1Kl8u73vJve8773sEkMAF6ECrvC6+aKklukaigjFcGMN9atreupIheeslPBbwScqALh'
-             b'zsxeVOxGcYFMSWK9eq20dd8TdTbd98G5PnhojbrdDmGa3Wz3RBg2bWzg8JuPPJzKQFPDuGI2nin9'
-             b'uSZWrLMZ26wGC7NBqYi59U95xulCMHk1DhT1ei3zsRG4xhA+0mMRERqX8QBSWE+zDrqpm5mgjTFA'
-             b'uPVP9jqXg22cc1KpFdq+p1KDJOVqjXJQUT+V3FXSnXcOCV9RpYI67rlsXWvOb06Dro0Ysg6/UkKD'
-             b'CQEp8pqrylTVj3auy9x/rvtA+U/gTsalqxd5TbgDgDPgKXdb+Gt46VAUpnpITu2DqTLBsXNjnxPs'
-             b'ExxjQvYGe+pRMcttdKeVdPSmojdl7f96ClSD8Th/TR471erUXV7Nojtsldvu6ijAZVlhqc5LrnaF'
-             b'828dFgMI6tUYxQOAefumixFFFAnBP+YRmQoNldMs4hN1JBIDzSWXCr7jBHOUNuyBJDZZeS+oUJKc'
-             b'AXQuvLlWGgg1nbvl3opI/EbxOGAmCUCd4yFdvXQ+7QvSxfB6PeOeccHlTpB1X0oyj4xCn0dsHoau'
-             b'FY4zzPWBtNFQ6QaQ+GAgqR4Oh/Spz3xGlATzpR14rLI9mtK3ffCDP3XPG+7/7Hjz2iJy7Ffx32zS'
-             b'59M5uHb1CgNDoRexeOxnAjCbfOOCf9GiX/25f/0TX/70732kB2lfpd9w4CjR9izpjrvvo29/7/tZ'
-             b'LW82E8MSFu1xpntPFYwnyByzpVQwnjuiClXakkx5KVeyTvno0RlTmrIHACqoqzc2aGt3l4O2hcmo'
-             b'CKNSjVywm9x7z73sCT5B/oSqJn1KM/0bssONdptBcuNUvdTS502mClwpiHnnOXBUdWRW5rOgyYYo'
-             b'0wk10nujfTstxThHTI8E+AhXPebSl1NFarMqvIDhyLTgAwNnBBEuuABSy1w8aQahHdXhrwJ11QGw'
-             b'xIIrLJ3dW9LEtrRhlq15HRT+FKTjXL3adOdVCcnlWXgMGvgVKGY6N6wuR/J9S54vk3rIG9BN6Y7q'
-             b'B8B/nw5pNthi4JlR/qpKvTDkGB/PeLCXVznT7jI7ojoHUb0QBHRemLSMJiheOxqGBfTcdQAVb2Nj'
-             b'QxgaRdVBiJoAeX0+PqWZ1uvRRx/hpC6PMjRxMhfKiptGOZhDYwIS0qWOImAe1EjVKpJIEc5RvQGl'
-             b'GEa9HiyYVZ0Ln6mT1cUYc7LI12TwGXtBccJIenFknIkmB1w140yBo04DtVT4s7F4McANMwQ1Gkay'
-             b'Ugqg0PQKsvsAG0il4xkO6OK5V8jzNU/aXYrq2ietfm93SXT/PzdBOyfA4ASDC3iTu4g3V+1R7ie8'
-             b'spmq/89/9ku0ub3LgNaylK4jErrxNNKRu+7/9Hf/wA//d3tpfxC8xeLxWj+AU7l+/QI9/+yzzDpa'
-             b'BP9vQAIQdZP9Rsz9P/P7H/3+z330V/+rA52CZXy5lQ3+Pig2wzG98ZFH6YM/8EMSUEpH9XadgWKs'
-             b'7FUKQn3U32VDD77X0+ua9ba0PZ1I+sIAiKlj2ARtrhu1ivPKGFBKWGmiINFxZb076Kc/e/yevN1q'
-             b'O9OqHWxQqDaPHb2FR/a+0WYMAPvdz8SPHkArkaytaRu0qoQqHXmXkfgAJgVS3n+ujR23bgNXd9Ja'
-             b'jqpzD0Q35v3MpkPlmAVMQgbdyWdKclVmpHbIrXD7FoUmI/wTdBWKIssjC29SNt52p01r62uyKbIQ'
-             b'THquysuasQpwF5hB8+Y4m5J1WrGZsg1xTYITz/RYHKhQW2BSO2cv64B5MUYgvs7PIbW6FQqh5TBV'
-             b'kIdHfTnYTvFppB1Eo9nNqYUxCK3O4ktwVaz7uc4FVUHXKRjOqTNc9HM4DOtUkakpKVde9Q/4PKX3'
-             b'O3v2vKDnyWuiJEG4yDRDx9X5+sF1OnrrrTTBteOkA2RWD4ZnHAPICEOqmrpXlpKwtdpR10ywHGBC'
-             b'gE4r58znc12q+BCp1r8S8CwjnzsWYvS9V+MobsPqucZ6gpLJ8qs+cLeBjbVAzYW8skVdUmMrA1Li'
-             b'beqS5Gfxn3TcEPpZWl3VkZ7Jcct9iPvn0pXzaS9I97ivBIosUbekKJhmgXWslNkD7Qtc782l5ZSI'
-             b'99QbYg5HY94ENm7yAm5sNmt0+fIVeuqZZ9GgpOloKh4OQYCC00a7/OCP/Ng/XV5dHcCoaPF47R9m'
-             b'rf6FP/1TNoPyfjFe+YYkAA5BbH/PLLfwn//sp970G//2p3+q5yYF5vKoalEFNhqOhumGu/O+N9EP'
-             b'fuRHU+UvnH5IcLJmvAZLhnqFGRtxYCP0dc97XQjaJHWSze9ubXIQhgqbbf7OWZ82+3/p5lNkwRcO'
-             b'6CxP6wWVHaUlGdR0hWlzaQM7dusRuv2uO2gC9PLKAd5kRU61ZDAhxHYAACwyFU83XqcbXVXO6UzT'
-             b'ZE8dz/VZORAgPwTImaisQUsAGyBGFGxvi+orfUajUcuBLNpc1hDZeB2sesdDndu7rCJoini1ZpNH'
-             b'Hiy8U8SMkA5qBMPYgzjlBGBl9UC16XLlz8OArI3AmgCkdMFQquKiq2xj0WlAJc2BH0Fhyp8FXXXP'
-             b'VLFSJ/1e2Bkh6oggpQUI7hyUdAxj0sfpGpqN4S0/li6FM8+DgvEZSDTgyBi0etzduZ6CRJnlkUll'
-             b'XaH9Xvpwk3pc9HHuOqHKLlpHFbFq3nA7m98J1FQFuZFy9POiss+EOE3iejmcgv/y2jrtbm4Y+oKG'
-             b'UMFDB0lZHwieRR5nQH7aUW91Zc7q1/jnSKga/DxgPiDExGOYoGqMrsjyxiL5Gyr9f2XDSPdGE4qp'
-             b'0DuReAJz4vWW4OALsN9IcS2kyPoo16eb66IAfMdNOlAItbMBqeDl9QP6PoETdbTpC9Wf2rpxlQYp'
-             b'wa8XNvDzjFFxqu9QIfJDBZjljoxiJ4L6W/RW53M/xWIolt9R3ldo7h797Of+jAbDsUo5l1lOezSc'
-             b'0ZueePJXH37i2z8OwGyz6Cyixn480j50+qsvpGvgBndgF3P/b9QIYL/bWWlD3Lp67eiv/dzP/EJt'
-             b'tHmcFJhn1SeC5YlTd9CH/sEPp2A15T82p0PFiQ5FLGfqBiYbC2xkyWhRRBVPWoVYNIxUCUD+i85H'
-             b'yYxuTPgksP73Ky+frgREFFnMnQRtOg7TZvjo429mdba9aWQkf0n6ep1tKgBa9M2DEsk0/8gBJZg6'
-             b'oQLsSgPQCUqc6VbADzTqPApAmxgmOSJ25A0rwy1Y0O9k45sbLYCrn562s3WdxqnibRe2Puqn4JBg'
-             b'NVOltEJDqJiZLryivmUNtT3vpB3v9GccqiDVi0odWPdCzH7YMW6WjrWQator/RG4jFlQ9gJJMuMU'
-             b'0eEz5F6VAQtRApRg5CopYdDaZhKootLfSrT9x3vC548xj5NMYAo0Ulev5dY2Ktphf4+DsNNK2XAM'
-             b'Uel2wVuCpsMjqzRjVGVDVb4zi11tdzvVl+j3B7SXgjgsn5nSiWMOlKfPQYWa+inQwFeh5qUjQgry'
-             b'ZG2LqDV6em6z07NJQ7YljopFMDAbdynw/3Qe6522XGtODIEYQAW55JqOwFRzAp/pg46HQEudiFmT'
-             b'6DzI+zJGAtdgIWMAPLdkRslU7LhtnKYgCLj2oVPQ6S3rNRi1k+OpP9hl0yjQSDOOAh4WbNYkY67R'
-             b'oE+Xzp+huqsGONbWD6rcx10itTr2plfovLoAEjv0rR89xqp/LGyVKYI0p+PgMpslcuu/oCtXrtHL'
-             b'r56hZjvtLSWUJyXB4LFfd7X/vR/+9/+n+aR98diHIjElnWdeekm6kNPFknzDEoAwHO3f2D+dzOF4'
-             b't/YL//Kf/YuNV7/yptVukyV+UclyCzhtUqgIvu+DH6J2o50y8EHeLHG/QvGPAwmi6URsSQuuhOrZ'
-             b'htQpAjtEsRfNPvE23QyiHW9bew7UeUQbuDJCgGJZ2CA3us0Wa5SB4LyZPfTII/y9ikYX/W1VP3O8'
-             b'kQpVrxSr3ig8bhOJMRQ8aWvYBQU/MFUvBb9Wwe3gwnk9JlC/YKFbZ9Mh8YcRJgSkdVEZNry8xjwN'
-             b'chDXlroQH0Kehxsmguly6Tz0+32pxoNYBBdFBZhzgrHn14GmBixDC6JCJN0O1mpoNlmal814yqAj'
-             b'BwXlqfCKY/tmlwMpc7014ILdUcOIwObCNn1XcSLmnKuMrYj2BG7Dl5M95pv7zMTX/wXl8ENCWMWk'
-             b'BAmfAkx/mBKmAV8/0VwhlU4arEWucrXkDJOR+QMVupytZuOc+Ywg1JGcbF7bpM3NlGQ0amKqxwZJ'
-             b'hcH/dbOLXOGcOHlChJw0uRA/jBavV1CZWxsFRPWc5yTHy9x/mCrl5ZUDDJzl1nw5pvHejI2QonYi'
-             b'zAUQIwLPVVVJ9WZLKYEuJ1usx6D+Algv1uefGxmASir0yYkiQyqaoFlqQwDL9CFoDirJSSsYPk7p'
-             b'f4r3ALCu11gRil769/WrF0kPRkdvcv/I2vtKiTlW1Tufj6DUUc5TG+KOOEfNU5p/7tq4OUltE1r6'
-             b'zGf/lGapAGii7U8z7Vj4lByX9I7v+cDPnrr7jU/DUEpwNIvHfhSJGxcu0Gg41Oty8fiGJQC+uY++'
-             b'yilg/PYv/ux//uVP/8EPHV5ty8ZbK3L0xSbw3d/zAVo/coQGe8ObqGfB1Wn58KlU1SzJJg2wW9qc'
-             b'+ptXKe10QvGLqiXOqF0Roak1ata952DnaU5RTVnpPKeMhs+WwD0aT+n69U2phNTfnBQ1Lx3+kufg'
-             b'Sys9NjtppI0GGy0ju1VSmDL2PuPEyShLJgZn1T9ZYoDNMCU0LMLiBdgILnUwffeUFAENi88UERkJ'
-             b'/s6LQQzTAKUM5eBEivYXXr/p2PvcKbE2KvkGrR8+RibiYtqxFeZMFogRE6iMa2a1K7/D7LR0Uvkr'
-             b'Q1AqPieiQFyxQkHQixwzeQlIpHNunu8DiDgRLngwkKFywZ12IrgViADLpbpIzJYYa5jPvDcVwJgp'
-             b'Yc66PJrkIbkY7G1z5wJmCKiaK0DpPO8/si10adiI/PPAoyaiap0FSFlWVWb6Rjt7fVaca2JUw2p5'
-             b'Om5SHrsT0QpqpsTp2C3HeAzmtB2eGXbAdoD2WpOO0IiTYs+B21gHSCCgi17N7yW9484YAlizw+ff'
-             b'W5ucFRdFJAjrXTN9gyC4Aq9aEuIgWdMxgVBVpykJK5VSa3ieGOeSAAboigFX4RqKH3HU390W9D80'
-             b'JJrdTBv16vbHXYXgWL54a+MyDdP5YaaJE9qe1/tzfqxl2gImyORMxRD3aTqO7soSf94sGK/fWYOJ'
-             b'E4fcC9ROEcy5Ll+7SucvXKJWs0mZCgKXSnRw2kt77/2+H/hf0lngdV089umRktDBzlZmtiwe38AE'
-             b'YDrbB1AL3OOWV+jFp7/wxB/95r/7pysdUdQivSmdypV+7/d9iO669z7qp8zPq5EIkMZl0aTewVtT'
-             b'jOpmVzhC+zFtuM2lNRrwXNvkR70GQ8/zz53tTXE+Q4IQqrmwWOPWROUsU9KkBQxQ3W5/j26Aw6+O'
-             b'aNFV/GH2NklP7PZ61G33qD9KQVfBh4Y0RvvT1M0wP3bVXpI941EN8mbqxRqWeBOqZ6Q277/pe49H'
-             b'E6qzMU7IlrDiCUBs6gMLWUaA85poX9Ln8bWOEry0nHmDLKpRiLbEEQhupM2v1+nQ5bBBRHNyuDcJ'
-             b'4WgbOygozubPSFCctJgL7Rlw0DKTIhKP+um05I4A88qZ7lWoO6DavUIgSZrr3L0o0rnnOXYh4jW1'
-             b'urABkBQBwEdsfhSz4huD1jAOSVUuAmdvqccZhsvgM8ez5p0bGyLPLOgHZXjI8eQOigXTONeaJL1+'
-             b'rEw38JwqS7L9sBcDIPYkMJEq8w4wfX9FuuN73v/QgwwC7KdrLii4taAKIArLU9hdc2KrOIWoF5NT'
-             b'x0TPFLfKQjcqcBQ4klnocxcFQMpaSlTxXYYDwRcA8wGQJrAk9WZbhYE8P59dIwF2hR4//CgA7IxR'
-             b'rG+DVftBTX9k3cHlR5LWWVrKlbZX/wrrznjN6AyPUkufi+sK9x3O6dWLZ4FGzsY+xkQxa2aniVbI'
-             b'wlGW5Gk3B526tB5Lawelc+KismCoMnjSi99Aq3ZvP/vsswwwbdRVMIiEMrA7GNOT7//Qzx87der5'
-             b'mM7H4rFP3X8AtwdifLXQVfgmJAB7kKB9rd80Ba/R1f7KL/70P//JcnCjU3agiV6oB7pns59HHn8r'
-             b'PfCmx9IGMs0tP4DHRuk6WDl8hBqrh9MmFRj1j2rHBEuQFBSpogijvgIEa9LcZmzBhBXUMleaZL5r'
-             b'RiRR1QO5va/qZgwkRHDvdlLF0krxZcabvYBQ0ubObndiKPPY44/xHB3vWag9KCm74CYzUXv/jAHT'
-             b'3jhF9bKOYq0LFUD4pQdiiVYoAqIqaTIAcpbV8IQmJxa6oCWh6vYaNMaKMA/KAGDAVpS5MlpqqLSl'
-             b'C1BqICoEUIYgsLdDB1ZX0lc7w6qJeFlprVazsHVahUU/J9eLrzZNyUjkRIXNiUjGH9hEC5VqZvlY'
-             b'U9LTm501FoAXiDLuMCCbUzZEyf4IkXEPnMRMh8wzZ34/M/9Enz57FihAs5kCHZzxgo0ecKYUDzKZ'
-             b'jBgLAUU5FkoOlaYEqcyrt66Ni5oIaLUYfaVB71xeG1FFMC8Jz9THlbV1Bp+6IrJqpPWtvapVcmBL'
-             b'1/jJkydYaIaxA1rSBiOepn/3OJjK9YpOU6mLPp1MlbLW0oDsclVuCYrZ9YrD4iyt3aSayU8KPRfy'
-             b'WeV4wM9lTA4CMGNt0uvHM9EPYPBfzAJJBqjF98B1jAQP7n2lYTComnS0u0s5EbTKbhYkoa1Fn+/P'
-             b'zWuXmL4J+m6pXYKCKpEvk1LOzpRUJQP4XREBKI60srrGipykIzg3r1upiVO0Iw8Aqxa0vbNNp19N'
-             b'yUetyXtQVOos7u/VoyeufdcH/8FPhnSPzKaLofR+zf5ZS2I8WwgqfrMSgAbTh17bkwoXv5/+Z//N'
-             b'/3juhWfe3G3W0g0q7TNUgqPxiE6dPEnve/930ChVsiwl6qUaHKcqvrt2hFKZzz+PaB9iI8HmwVac'
-             b'dRnKKyfeaes9apZfaiu4UNc2Z/NwY79pF9Cp2YvJ2aJ9+dKZszQAxzptrlHbyxwEsEfPPAPyTt5+'
-             b'h6Km4VrWEuiR6QNksLd0DqLZ804lYHOLv15jUB/PzLn1JU50NS92xzI7n0qgo4raiKDBCUOITFec'
-             b'pIDYTt8H1ZdXzra3tmwsstLbaK+v4EAFRAVFWDgBg3WaDV6zoF0EFpxxIWOd4tzaCSVLrhXPvgQT'
-             b'BoWhYjeOPdYF2vQ4ZnNf9MpmEBqk4BuAYWAlw0JlVlW3wXN3QDwL+L8qMjObjebsXl0Wb4K5EvjC'
-             b'QYfl2epVzwfemxM1RcFTxgyY6pxXRz+tOJ2fnx5rWz7k52eWpQZsmkskEQSfeupLAo6PEmSC8tMl'
-             b'KEqrHK30lQNrjA/Imgzpvfop0MDrHGJFXtn0xrBzQljn1zOLwNFNPgROmQjGh5f2OnFbX3UwRaZ6'
-             b'NmRtChMmNiFNbstjFMOCPyEfcU6mjBYpnpJM02rDuMtL54CdKLXlNRyobbFu7kjkJuk+h3ZBu7Ok'
-             b'tNzI1/qNjUvsylgzGWrvKnXPSrtQFA6d/S5rVkrihJFIuo7h3jn/fV0eHwjeBoyGkk2RlO2QjvUL'
-             b'Tz+d9qBJ+i4NtTt23CXcGk/pHe98/785cscDr6YsOdOOF4/XevZfoy988pN0z5330iID+CYlAN2l'
-             b'A6/tOzY79PFf/6Uf/OIf/84/Wm43aZgCfoNRP56r606nTe953/ukQtT2LbL2MU0oNJapvX4sxZlO'
-             b'2jSgo19TL/OgPgHEFCSI8EwnXuZ65hmeMoNpkM28Ageqmw2psYw40nDcNW/4EpVo0aKzFy6lgFKm'
-             b'gBIyfcs2sVn696233EqrBw+LHz30/9mhTulU5nOPSQW86FNShSqprha3UZXasMsIOM2MeYRDAF12'
-             b'NmtJQbHOGv8zQWFbSxVVLLThG6LHD3/eGQyAZkPzcdMtU4OWDr8l+CvaXX3bLZBhjozEbDaeKEjL'
-             b'qFaqv++qealnrwC1J9aZBlDkEc6FnUau9GbliJMARusHg1xJ4JNERm2BU7LTZFMacLBbfK75wGZi'
-             b'HIN1gZSy49Z/yCODbOKigR4qiHg/5w2d727SCDB56N2dG9rqd1Vyx6taVsFecRSZKX+TMJMYHAWf'
-             b'IYHK7HBZRXJWTli8KqpYlHHbzWzWbIBBg+z1lrgaJu9yAtLudFW5skpgbGzGHR6Mi1K1XSPpJiBo'
-             b'QygFLX5Skyru1IdSE7mq85LBjGygI14QFFy1RtrlCbm5LsdfKPiQ7a+RTLFkb6SlpSUFKtJNvhVM'
-             b'p9XuDMtZe/0MVWy08QgSPVwDVy9dwLYgcr857qtvh3J5QrxZ34I0j+fJiNJu1g8fxQVdCTll/Y1I'
-             b'VT6RtZ5ZL+DS5Yv01Re+JoDHWCXaIRR04Jbbzn7vD/3Iv5LZ/+KxP5GnRtcvXqIvfvYzdP99Dy7W'
-             b'45t1GuL0teO2cIt3b6/3qY/95n/ZqYl1LnzMwVlHsIcO+3d+9/vp1G2naHcPIifiZofWcdrKae34'
-             b'SfLNXtpspJpElQnQICoInis2Ginbb9F0VMubvWxvDNGn6UyUxhCwou4Z3qqKGLJ9aKHCLVH5yajM'
-             b'Dx46RC+9cl7NhYzvLZUJ2vTHjh1jT3C40bFSWCQ+HlRtQm9LQYvNeQqu5huwxoV9bXruZDLkCmWm'
-             b'IkHzSGmnYjfBZF911svIeEAbsZkyaroQSmTwIjKUquJyOtaKz83Z+Eg8m4KvbT4BCFRsT1cqLkEp'
-             b'kOnPyoHVqgVt+vgC8xMRmyDteMyKo7IAjCKJ7zAdOgaduSzjq74BqtzIr0dQK9XpDS1+dB1mUz4H'
-             b'mImb7irP59NagffPnZC8ocvsNpgnOIMcA3WXljmJCCZFnN5h1O8Lml5ZBdM4pRvXr/A5z0mSttQ9'
-             b'zan0afCzytvlKlQnPX4uYJLw36PiJbjljsSnZuMCaSM7lVs2YSUEmLvuvoeOHT3GnTBVt8j698Zd'
-             b'2dvbZc48Av5gRzoDbKVspjUAh2LcNUICIEkhEkSMkJiGp9cYRkZBaY9+rh1fqkUz3xeKos8GTb6S'
-             b'bDbTHqwvGDq9tN4macwgXid6/sglUPXjc7vdVf2ekgiA5QH6X2kjAp2L7eztUMDIK4tFmsOT/T1k'
-             b'G2G5KueSNcvvgjCCQA0O2SQoKhDU5bm/df+c5gb4lK++8AKNhiO2b4aaKDcW0+cPppE+8L0/+JMr'
-             b'q6sXp7u7iwixX4EnnbdP/97v0WgwzGDZxeObcB5sRviadHR6PfrdX/6Ff3Tl9NceabEQiM5MS0/D'
-             b'tKnfc9cpeuTBB6ifNjgBtE959oebvJcq/3p7laso3NQC2vMMCqyD2oOAUYJY0KEpi854VdyrnL0Y'
-             b'Wc6ucIqEZzaAgn5cVEpSJcsaVGXuYspEn376S9xOLhVoVGnmSy5w8sQJVUYjBrLh/cEhRiubtQ20'
-             b'7yiAxCi+66wvvkutVpupW4WanqAl7tgdDej/sZrDEMv9TlTF0HFFPeXAUjhV5wui017UHE36uyyt'
-             b'qhmLfFenrVqV6/VBxWxN9UU50UbxYqQ+nOmim5+CkwHdYmYrwHxINuYQKiU5TrymfR4j+HSOkLQx'
-             b'iyEqYjtIFcb8flSxsPUl7eYwHtAzDoINk9AqZinf8mYGhq/mz6PxkBMsJFNVZ0fb3/p9EPyZT6/m'
-             b'PwiivO7ToSodu6xJ72JVzbODogLPfDa7MUe7mIOHSUlXcyVpu++NpjQcTzPy3GhnOuXhuXZZiq48'
-             b'/OZhgEVzkylTgkTaguul5Hun5OcyIFIxEV51+TG3XlppVla36doVjwHpFiAhaGMt2MJ3InTMRoOf'
-             b'L/TYkHsDvHox+zbmqt+SSqzj0tJqnqHFyqQhm0MRVUkEzRlSMXffmCdOHAevXblIVy6eoZY3AKZc'
-             b'T8wOyZ0aAVjOA8OCXpnc3UjBH9iItYMH+TOi+G2pMFfllcDfoYTBUcEjIXSnxrMxnT57nhkPkZMU'
-             b'6ZKNJiUtHTl5+s1PvuuXoLK5oP3vU+c/Xc+bNzbp3KuvciJAC6e/b2IHIL42i48TeeXsq3d/4v/5'
-             b'5R/v1AA0hjpZndukqFQ7rQa9793vooYnnrtxoK0JF7zorlDnwFEG4nDgJFOb81mulXnEsBAty8zO'
-             b'9srLtf/KPNaRYb05YKubn7XFS5uDR8MDpOpmMKbpNLD7ms2+M0UMfPe0aS+n6qecltzarKsinwOQ'
-             b'C1XmeMxVCDYmBG28mmfTqNALQ/BLgGXtdp1GoEJDNT/GjLTZSBVdnwVTSFupTFnEzDwFFjgBBlfq'
-             b'fHeaK2Sns27eYAtvVumMzmcVPtsF5xzTos6oUVSxbLIGqmyMMz8jjqIZwOI8jMZWNYGsLIiDGnKX'
-             b'xNWbQqOMYmhDOiIJzB/3OQkjlTUuWVa1ZLS52AFX6nvmDc9PV8vXTrvD34757do2nk6G/O9Ge0lp'
-             b'gEX+3vUUbK6cO0PTwSCtudE0q/FO5pZT/HNGSHMWvzkAzf3MxJ1i1PWq0WA0YiGggk2A1F9eFQD5'
-             b'Og4iO7u0vCyS0WGuNc8V/IiTFVyrTJXVpA6jmuCc0k2JgZ3AgzCOxFGmKyLpQSfLlBlnsBhOVTmC'
-             b'40xHBjWi7AY4H6sLZ10fOed7qTrHNc9UQ8XokH4+ru9pOl+tdleCZ6upyZqOmJyARbnDke7lDu4b'
-             b'lZeGWuR4NKQbVy9Qk8Q5ColO4RUDYvBKs/g110/TIwCLJgpfA+/ZWlqhZrfHwFIG90a+BShLbKh2'
-             b'BL4/Y10AoExr/NxXvkLXrl9nQjA0LtqtOidNo7QHPPnO9//cyuFj11NpSjW/4P3vyyPtZWdffppF'
-             b'4FjZdfH45iUArniN2i/NJv3mL/78f7F3+fzRVr2uVYRsGMPBLn3bO76dbjtxC9Pt6vUOa8lHXADN'
-             b'JWouHyJIEkOMAwBCbv2rK1xUaT1QmtBWha48AEQTFdmRxEB52z7mWaQAk9ToRRG+zkJMFg9CK9rR'
-             b'8eMnqNt9lsawzg01bX8i8ojozqFjt9LJ2+/kYAmQHQPLvM866KjqGDwVKHuTz6DjDnqYkJsU/Jeq'
-             b'P6wNKFbqqMaqdZBinY2owYj6CSdTqD5B2RqkoNJOmxzog5HxAiUblyC4c+B3c6I0QTdLSBKHqDoJ'
-             b'KsDDlrdO2QDymKYN+r773kDPvfhyql6DGsBoqz7Yph8YJ8F00dBRUaP5cYNpMAqwL8w8+6jjNVrE'
-             b'KiYgqOiQVPhgbOCXZaxEY7zOniPPnAPjKWCxLCOMmOVc9RsyZmOWqrZOp2Pj3QwQNFI9khdm9oM6'
-             b'F+JNc3Et/ClrxYs+Zdacj84Mg2LlLeTEV8KrzgHpKKDdblK306TxTMcKXmpWZ5MDpvTV6OGHHxHR'
-             b'pDnnGlxr0/EkndemdA+CgFlL57ITHndX1LJa3BYrXQsJ+ONUWTW0w+VpeWVVAKvp1wC2slIeJ5yO'
-             b'6YeowlropERIEPdFghgBLy0QRivWWULCBowGbHuVcKGTEO0X5b+L/DGP1bx0aXx6jVFg+TpKydq1'
-             b'S+fFqluTMG9a/6HCslBG8PtM+eTEYg7fg/PWTckU+0uYzkaGNCh410DCJG6DPkIiekRfe/ElXs/p'
-             b'NOaEFyPK5oFD19/1XR/8eajS6YWxeLzWDySkgxFdPHeOO3OLxzc5AYDm/msR/F/68nOPf+FTH/+H'
-             b'y62ugJS8gITQurz95HF61xPfyvMeBCm0QnHDYz7bObBM7QNHaBrEJKXaF9XitpIH4tdgQ4+5itGB'
-             b'no4HRfPdK6o8zs0LjQfshc7morZxBWtw9tx5nmXW2AxnloFgqBqEW77CQZ6FVrCxpOehfc1Wxahg'
-             b'WXNdwESonBjRz+54sjHNJkPWAAAfOkzEGGc2xWijxpVfwe5xKpPLYw9x+0O11Ol0+TlMj0qfW2vW'
-             b'GBkPy9TC1O+8hUVXbVwqheqt/W+ycrqRBq2AUTVK9CxzsiS1kkXKgqmag/6Q1g6s6Ty7rFziqCLO'
-             b'O7V8DamScqFQ/JdeC6FU+qC6CxqtzBDn6vrmZgr6c9IqnHfyM7S9VzYAAFy17lLG65nqm9Ex0ZVA'
-             b'h0B+HuasYL2yPPRaC1JV5m4J0VwSoWBGr4ZSpidvHgxREPfC0Khze5k08TQNegnqIg3c7rRY14BB'
-             b'n7GyGV5aXtGKNzJwFtdAJx0bWvlM+/Qiawz1RatLkVQCHwMAIZD53a4YApWcHIo4D2UHwKzey0mC'
-             b'd1UaxHLLUSpwUTYssnYGqJnQuGhDd4CxW7UKj2BjtUK+EYCp45096q2uCpbEgKQqvFQHKHhvl7Et'
-             b'zs+p8kU3F/Qrl8wKtRFUn1JHKemzVw/fQvVWR8SMyFg3Xtv/lcNkMLVHtfU9f+40Xbpyme+5mSv1'
-             b'XQON0j371ife/csrBw+fCQvDn317YIx1+fw57oQuhH9eBwkA/W3bXLoZ/9Yv/dt/4qf9tksbHKmk'
-             b'OFfkqTJ867c8Rp12i0aKOAf9i/ng3QPUWD9Gs7qo6oHzLUOiWgZOuXmL0hQlm60e7W5e0upUJ5hR'
-             b'toYyCmq4pt/J2ofekPF5fqmVBKqCFADPXbig7U+vlV1kN0Jpr8+oAxBW+tmUhdIavAmDxgVlwqJR'
-             b'1z02UgMzfRb6wZ4yk/knRgiYSTthCEAVDVoFjZR48fjDC/UNrAHmVOusl58LS8zJSIBZhXDrZyk4'
-             b'lMM+V9zKN9Q5vSVEYnwzLaW9LiwElVKl0sTkdSIgdsLtbpNGEN/x2myNylRgAKHnY93d2+OgFcqY'
-             b'15KUY1+vN0l5f4qsD9lPCbP9MsRM//L051rvTIHrixJbet8xB5uWGMQ06lUg8JIg7u7spEDXlQSL'
-             b'RAvBOWmh49y3oBypnHgZuYy02vRzKo0hz5m5I6Fcf5cn8l7n+KIDEOdAZFGvR0OmF060HTY2N+j6'
-             b'jU3q9JZUeTHON0gYRd9b7tHK8pK69QUF9HnNQCrAY6vT0e6XJE4F1atZu44D8E+MhQqWr3Vc8ZdK'
-             b'4UNCWFgY9WIyhZ/XdFTW6fa4C2HJ0jKsc6MmV17cGvlIwdlP1/Ty8gF13FRcgDOVxil7H6yurckh'
-             b'pASos1rn9ffBsCdlbsdfuXCGr7eaU5xFThKEXpiZJ7HCYGTeSjTpX7kHO+1lHgcEPTcFzekFKK0U'
-             b'GgY5/cXfa5Gefe75VOBLou5NJhh7RKsXHn37k78UkVxPFuj/fWsApE10+8Z1NWhbrMc3PwEIf0sM'
-             b'QLtNX/jEH3zfC5//kw+sduqKtpebcToc0T13nKI3v+VxmqB6N8oaC9oQdVdvoeaBo9Qfzmh5fZkG'
-             b'jJIv9fWFYrL1BtWKNYaQMSNurq3EXVfMTpHQMM/fK49YldkiMn5sFLJJot2JChIbyMzk/AwNjzYV'
-             b'/AE0YNx5++0Z3OZ54yhUfCXwnJ8UcAb0unj9BKFIMYq+5OA9AeK41WFGAEBHqPCYDpcCHyo50P+m'
-             b'KYhhYyrZQU86JE5R3FFNm9AR6A+3mTp5UwJtFR1bBpd6k1U+CdwG16DImgHa+hauuM+uiGT0Saqc'
-             b'3VBdnjtzlh5+6GHpemREnGMKY7NR+S9wspH9ByIrAdbrnjsOFnxJRxKkVXmj1cyceID4yihSwzif'
-             b'hQLHgn735eVlARRmASFNgGo1DZrW/fCiC4/q1rpAylJgPn0O5l4FZmxcJKMSo5GWOgYoyFzlVL85'
-             b'ZLggb2Z70Fxg0xxD3lcVtuRBEzp25Aj1UvICUyKg4xEcJ8M9/t5owc/51ch6pX+3e70sRy2jpLHw'
-             b'1rMev83z5fsg9+kPdjhZw7USeJyirBY2G4o56GmeLHgc5zMNEi1/dKkEOBdEUNpJsjQY9Rkb4Nga'
-             b'uyEukTpuESxOmPteisZHtZ3uja1r18istexAXbbprfahzErQFN56M55EkLcJyiRkjcvZHNq/sgw2'
-             b'Amqe5ij99vr1DXr17DlOvtkm28v5Agvg0B1vePreNz3yObzXwvFvv8p/z34crPq3eLw+EoD4t0Bg'
-             b'MpBqPCz+8Ld+5T/rFRJBGJwUiOf5iIJvfexRtvccc5tUNog+5p2HbqPlY3emik+mcGAG1FttEP1p'
-             b'NBrR0upBmu7t8AZRZk1dZZaz/apW8V5Q/8HQ/SoBiuDMFUSoNrtCaUWeBG2Nli6ochupciN3s044'
-             b'Y5TKwJXmoYMHBVQXhMPsWYZ3ok8W3X1UXzDnYXleEmU/tjUmURUEtgHzR+b5B1HMgwgTVMYw+52M'
-             b'B6yqF5U/bS1PZ4AuEmMfsCkg6BIMoW/YbbVlZUwBrIrT548BsnJlnkO7OYlfF4KKpKSquaVyxHPB'
-             b'wehxUOxjoxqdFxMnaFJvYQOVeTFVqG9e60J5+TGd00bWXOZvnI53b/cGtbpLIhjDUroS4NlwRpH5'
-             b'rE+PDsNoLCC/tOnbGIDtd9WvIagCU+FqLC0bZiF7I1y7cJbKtOYiAeGyf3zQ4OK1yhWPButNSCC0'
-             b'u6JQLjlXmqW1BSibJZlsMjoXHBRrtQovYO111fc/dHBdrmeMeLImPokCZGhx4Bvs7lGr3ZYqm8TY'
-             b'yED3WPlhf0BLvZq06Ymy6iUZ4DX9jTX4nc8UOlyLpoUfTclI7xenIk+MHdAkuMlrHTJnP+ikDewX'
-             b'6ThUyhOV74/TVnvkcVqr1ZlvENLVyxcFt0LSYcP3KPQqjySARp+JKiLeY/if0vwtlMmwevAQiX2R'
-             b'ynZHOd8qXpg1FIwyGZQtdPqV0zRMiXirLVgJtoFObz5M18x7n/j2XysazRLgv8Vj/x4QJ4thgfp/'
-             b'3SQA0+nffN6FquWpP/nkd5/+ylNPrrYbOXBCCrWcjOmND9xLb7jvXpqOJrxBT0udEddb1Dh4nGap'
-             b'ChruDmj1wHoKjlMG+o3iiDorB2g0FCGYmxTenFV9QWxNnej4894Enrui8JwmAmKKQ+r4ZvrxMpNl'
-             b'KhG72NRYZdCofxyACuVNl5HbzYcOHWTLW0lACvn7fFs5SrsRgEEW1Umb1zQFrnqzyS1x5onXBfqP'
-             b'eapXcZ6S3f8cjVk9LSUBI00e+HXpG6dKLDKFjni+zBTAVANtbl2n9K35ecEET8hpESctbaEaElVT'
-             b'bGAX1CxIVQCASWARGqXiMGgwUKa+mc4SFPIg7VrTWa90WArlb0tlSWpIQ9kT3oyQHCcwZZgwM4LS'
-             b'n6WVdVXUk6SD58+hCrSOXBbEUUUCbTtLElOqvj90GLqrK9kOwd3k8ki0ef0S68h7U9rP82HLJ71O'
-             b'lSlTMeeM7DIawEBqOUmc0+GLSjUdjie5mSb4AZfZBnxNpMApsrlB31vWu97qsqqkYF4CXzMaziV4'
-             b'u2qcgOf30r3BwEEN/qQ+FDgsgEcZmV/UFT9TdSCCoeT0Gtjb3qIOfBMQiGt1RfF7Pq9yZHU+n7gP'
-             b'8Z1CIfiQTrvH12bIDkom9BN0EavujyWewLPA8bKmfhZWzc+rNroM3qhGWUJN9HMCUJDs7nF3Y1oG'
-             b'ZRyIoFOw67/K0aqRQvoz6Pfp2S8/K66TUa2MFSi7euj4pcefeOcv0by3xuLx2j+glTKeLmb/r6cE'
-             b'oNHu/s1n/ymAf/L3P/of9hpKW1JOEgBG3VaLnnzyHUIhC47Vt9ChH5YpmBy+DXxbGs0wj+zIpqT6'
-             b'+6mG4rYytohad5lmUJuLVbs7qjdvvoTm2pneLGW5relEc5yDf6g2kSDo4jLKxjFIwWlWyojBu5vt'
-             b'V9G+Xl1dZeBWmFEV9Geqq48KPiU6jVpLPhPz/rogW4EhiFrCsykO6I2gdEHnAPKpXoLbeDhmIxW8'
-             b'j406JmyO5Dgoqjcdb/JYh5AqlHazwZoIpfmkSwZCWfgwfdZosFtFM0O/UcgNVaOyQc/wyKFD9PLp'
-             b'CyreYnKyqp8AJkMKEF/80rN095130pGjR/Q8K7OCaVy1bM1iiHqGCqYEB+j2QBMJcIbSq9U1iFZg'
-             b'QHaP63QElGgCcul4G802MaEwrS242XBOhAojkglQuqSiVNlhqpIPMBHa6f3Gs1HukFhIFJ6/JkFK'
-             b'FbPfeJPZdRWOgMGSppTnqiBDc8r6sEvGOhlo0aptb7K86f3uuecuprnybF+loqO13/Xb1Wu1fF0j'
-             b'sQAzBclfVLAg3aRgKJlMGefgIMZeUJAm+yEgMLI2goIrIdCVErpgbBdviWHQRo4TuW3gD5BIFjUy'
-             b'VUcbD7mMs3DcsYOioxddapb8jYquZDxKugbgauhVsTAa/iLrDNuxeJ37R8pSVdF6DYEBu93lVcEq'
-             b'UJU0lHbc5uZXzRL4/ZC3njt7jsWHLGkx58rReEYPPP72X1lbWTk33LqxiAj7NftHZxL75E2z28Xj'
-             b'm54AhPJvNo/xqSp44anPvfvMV556/ypXpzPe+HFPTlKweuiBB+nkiVO0t7uVU3KEstryITpw2/2p'
-             b'omgJEhmKdeCiF2K6A11vVotji9wZB7RG2lDCaKgBI5BZyGBO7g3lY6MBo26pkIzsaBXGmwNTel4d'
-             b'SUk6hpdf+BrtDQBCa8umrEG15mo0mvbpjhT0mimZ6e8OmUrEM3PsbUgCgMpn3jnmrFPeWM0oReSL'
-             b'RXOfZ8hOrU7rBX9PtKpxLM2WAP28CqvwcbMkaWB3PSpDpvGxzkAQeVwWh1EwmM3rA5lOQMnfA2sx'
-             b'g1d7hrSb/p+h2sSV8PjxY7T01a+nYDNLx2SUSTXGcVD7bdCZ02foX/zUv6I33H0PLXXbdPL2k7S+'
-             b'vs7HdPH0adrZvCFqhfgfgI2pqr39jrvoxG2n2KktxgYDz0gNXYD1GKv+PNrmHYDjVJ8BAQXdBtZv'
-             b'j+ImxyY0M6n0mpiBRwvGhg8pK8oZclNzziMNnDx9qugCToNnjKGqQJUJwRr3pkNgfYi56tRQEpym'
-             b'uoIFZM5duFJZ+pLXil7HACz57MQEiRH65g4Y5L5J9yDa9P7P+QuIPsCYK3rLTivdQhEZZufNdB2L'
-             b'8FXB4zYfhcGCxAMdPlwL40mpCUfJapbAILCEMQK8d7nDBjAmgjmOAQkWuhZyb6r1bijnRJFkfAfg'
-             b'pVM7aTc3quN1rjna2bjCbIxm4XUEExnbYRLEGcejHh1m423qv4VOX1qdZSqgh6E4gTJWINA8lrDL'
-             b'3DoAQZK7l195Vfy4FO+Cz2OtjWZ39tZ3f+cvIhUuau1FRNin4M8y2dNyYfj3usMA/E07XimA/v5v'
-             b'/Op/3JiNC9h7siOYIotR/b/jiXcwqA+VNgp8AJEm6SZbO3EPxdYqMQ4EQc3X2Rcd829w3ju9JqPC'
-             b'Ub3lKoH968G1nygGAOW40vWiUxldxSRYsIylFgGVhjy/m1diEZKHWFQVj77emMdBN6V2pye0Ra6O'
-             b'akRUtXZ1OMmBvM7WuBOu1jDpRKCHABLTB3mGL2jx6UR8ATiAM499zBQvIN4DJ0ODPAMnUzlUGhNM'
-             b'g5hS6NVoRtX9rBUs81MvtsF1Aeh5ZyQqUmaEz8HdePPLvSV2Bbxw6RpXe5ZUiFqiBCoIFMGm+Jln'
-             b'npFOwadKScYwF/YFiyOJzrqnKTohjQZT1NYOrVN3qSsUR11ZYwOgGmYJXdT4TpzqWM0NAED+DjVt'
-             b'F0q12er1qhGEOvsBeIlEAloJXkEORc3TjWuXaHdzg1qNQsyfFKfodNZfzgHLmO9uUc1VMsAiKytB'
-             b'SuR9q+rVU8UKwDy+1+2kRGBX1tW5LOscVCwIyS13ecxWF4JR0fHPwPgAol/ULU2CWpD2UODjQBWk'
-             b'yxMVsMqeEui+FLJGECEaDPZ4jLS7tU2bN7a4+zZIyS2sn1ksR++FoBRR63tkloaObCBKhc+GCmEj'
-             b'XZerad1rjRqLGIHlAOAqrmse6eC6r0ruynLamA7pHgO+x7tqbMKQVKVZFG6uAeAq/Il08hSIGQXI'
-             b'2gFbIbg83pDPDtlNsiKnyO+DalHcSGvxyqtneBSBhIf9MNMvJuOSbn/gsT+5440PfR5ds0ZtwUvf'
-             b'lweEf55/nhrpBC0v9Rbr8XpKAIrG34AGmKqHcy9//Y2XX/ryextQ80Nq7QRlNmWr3zfTkaPHeC7K'
-             b'N2mpbcTeAWofPkWlF1rdeDzg+SPavI7pT20Otgj+CBiobHiEMJMqiW9s8MnD/EggZjqTy9uYWrho'
-             b'ezcLu7CueYUwZp60LxTJfbMiPKPT0wZ47333caDmqqxe42DNZj01xxs3iwKhHZ+OG4A3btkWXj0J'
-             b'RIiGRwOg9g3FKAggsBlwEWwdK8JDo8Eeawt41UYtGWegVZu2uMfDPdH/zxLFISVNeylIrFAermrg'
-             b'4M92FZrfLG6NXuajiiUxla2gY0dvofOXrlYbuIZHn813iANDHVKqKcjccvIkCygdPLhOR289Tisr'
-             b'B7KL3yR9RwSO5aUlBrSV6iufWQAKqINPhIC4ylw54vssLfc4SOWkzVwAQ6zQ5XoBINGIGgy9yQQ5'
-             b'cV/0plqYR0UWwCt7yEBzByy8xVxhZxVABKKAzoAq1MVSLYAlMWikhGPtwCpd2dhM94Ln82/XFAMA'
-             b'S8rKenz9liGL4wBcCQVA0ilNvz+UdnqtyHr8lX6DiE4V6hgIff5rly6nALtHp195hVUCRXJQXoM5'
-             b'Oe6nul5XM21727XA98NUxlYTCHOx/XCNdlMCzkyN3W1+7W76Lu1mja6lpLKd7lWoHXZSUtBZWWE8'
-             b'R3flINNh2Vo46piJgZ1GMwhzCYLLfgoZChbNBKnI6x1jBcbF1YsuUh2Of3NVpV0bMc5ZHimGJCpL'
-             b'BtfH+YsXaKQS24y/UZOscVqPJ9//Xf8HY1hosmhN79cjnZ/Pf+ZT9La3vWOxFq+3BGB3a+ev/SJs'
-             b'6p/9/Y/92GR3o9eu6WyQUbUFtVoF3Xf/AxJo1bQbm2fpW3Tw9gdTEF1KQUwCIjYyV2tmd7yQKuxG'
-             b'qpynMQXWhgRaISgrWMwZQlzofo4qW9To1T7XVWCwGCslNvXAY3AfA7GiYA4gCSoCQCHrtzsVU1lZ'
-             b'XabVtMmVQSovDjCKQQilKgBqUoLRwEz50+g1Spsx8jG0UnU4GQx5jWbqAyDqqhAAmEnr30tlGtmu'
-             b'VK11EcSnUzVumdBkbzN9f6m3ROK4YDQ9Zclk0V5Am5bb62w5i42wZlN/fi46H9a+xgNJy6tnzrKS'
-             b'XEXf0rGKq4IlH2eqqn74h/89euixx6mRNmWu5E2wKdO3MCKZqSDNTPXxtW0O5bndXe6sFKTrTi4L'
-             b'uPDzSsoVHs7hsL/Lpi3oEhQsVbubAlWL/8AoqcaYAp9fA9AigpQA3rIyUOawOxer0bOCzMg0CpQi'
-             b'WMSb0fVBEwQ/h6w0WClApBupyuQAA5kbFWayzQ8t+HvuvoPW1w9kEJRTRWQO7IUlqinAdrs6ovBZ'
-             b'5xcYC9ZaSM/p727R5QuX6OL5s7S9fYNV/FibAeZUEFfB6MQ71Q1wjKlopMTj4OF1HjOg2wNGSq1R'
-             b'cOKN+64JWlwU/QDgWQacaIpQy4Xz56gBdkO6jmbDXTHuSr8DyHewsUGDG5vUXtmg5fWD1O6tpGui'
-             b'J/LNpYwA0NWal6QOyi4BJqgCi6rUV57rKPAxagcQiQkXCQW/n/VfuGNkQkeOsuOiJYimvfH8V7+a'
-             b'sRGG6sAecOjEHa++5W1P/DoNtuc8LhaP1/KBIuvq2Yv00osv0rd927sWC/J6SwC6vd5f84TWaePq'
-             b'5Tu+8mef+BEEfwRH8OmxLwLs88ijj7PjGZTjpCoTO93Q6FFj6aCY28CsZDZlZPmAN3PRT0diAbAQ'
-             b'5pNQ04NWNHjhM4CM0iYGed0Qpaopola2nrKOOLvFaZWbwXHRJEec0oSgiS7VQzMFMDaKCfGmMYDN'
-             b'krHxMo0ozASfANOQAnKiE37tBO1EL2prgdHXIvwTFUCFTQabOxzqkDzIDDhwdQf6n3kOFNzpgAmS'
-             b'Z+lkZiiUJa8t8+A5+E55rCFzUm13YpQALrP5nqtRyu5OqkRhH+wrCeRgrwsyOvHqwY4g/uq5S3Q9'
-             b'beYwWipVsc/mvlCUC4rWRyfgwz/6EXrT/fcy1Ws0nUiNrSBO502JzbOiXwWSExMmTG4Q9Btc8Vag'
-             b'MqmmBfAGQZ9ud5kFeAQI51gOeB7eDyQ6UeX+5hT3Ych5tPwBpHRW6YohAa9lMMVDqrj6bj4QRUOd'
-             b'S5JVIdrn1POyN73SSgsv1D7vs0aCi1aZiqMinCRtAh6UIcAyObGyrFalAh18yyQcGgplShK3rl+m'
-             b'G5fO0+mXX+ERGVs5R3Fs7KT1wdqvHTpMjV6Xjh4+TL1uL91PLR4t4B5CsoqkknEYnBfJa4UaWWbm'
-             b'As738upSpt0ePX6czykEqMb9PdrZusEYDVyLo90dFvUZpettuLPFXhBHjt9OvdWDvPEDxImEB9e6'
-             b'Jc/eieIjHD8LQ9x6o7KqxZSeU+PzY/+oQwFTgZOi6xFyv86snoOxCrywcrAvXbp4ka5cvcpeHTx2'
-             b'CJJYjKYlfetbn/x/WwcO7sS057hiofu/P+3/Jl2+dFk7mosWy+suAfhrWzHW2vTHv/vRH925cv4g'
-             b'lEfZ/13Zdmhz3v/A/VwJz1Qe16WqEi3Q7qFbqd5bpamGBVRvUOSCfemYUe9i+8uOfJgNWwXP2CbH'
-             b'oh85TGsVTjq/tVoNn++U9x8UICZBvUJuszQrQIAwirlyha5d3WD8gbUSo4rkYPNiKVrMHMuoMsMi'
-             b'MWyzROb0TyXpgCkKWvz4zOCVjgi5VyifsVeAoc0jb4iFl+Aq1r8TrqzLsWi+27wXrXkJCCVN4aDI'
-             b'AkF+zshI8Qw2BlHw2871q1TweolpD47FBdMKcNIl0Pk95vVfeOYZDlAAVUZF3xdqYMPfuYws4/y2'
-             b'J95Ojz7yMO1sXNUOy1Q0EGKVAJB9jouZi42NW6iOrfScetrM27J1oxvDHgkFt/GxYXsGoFFVxQFD'
-             b'UkiLfKbukSLc4xX6LjQ04BBYsoZdByfU397IwE/raRgrQy+cquNjhP7551ed6opWZtgAzoSFL4kW'
-             b'+cZun25sbYsRkNnXRqMxyrxbulYuC95yZUwiEOSYX1/XFri6JabjwHXZT1X+qy8+nwLZeQ7CTThR'
-             b'ps/sLa+x+NEdd9xB64cOMUYDPhOkQDsRNCrtSHmMRiyjLYmZaAzYGhj7Q7QDeIQQjRmgQTadtzba'
-             b'/avr8p7p/t68epkTEziKMrw0/eziKy9QvdOjW267g7pLB2jCAkLSBRIxpXCTSJL31WjOZXhvUOyE'
-             b'sEsa3Q5rhEgi6m4KJF5wfpJseZpjb0RmJVy4fJGNyWqN3Jvizy3aS7PH3v6ufycJ32L2vy8PbsGU'
-             b'dPnCRdlLF4/XXwLw13p2Ool7N66sffb3fvsf1pxwxgvlFY/T5nLyttvpxG23pQphwgHTe+HV11YO'
-             b'08rxO1JgLJR/W3Kgk9a6Z8czOIx5BoBJSxiz9Vp9yoE2y7eYPWsG/VUmINixJ1pV2wPVo89C8TKb'
-             b'xHf2usGikhkM+8zDNuOWqNxjbEyH1te5qh8D8e9ClmE1mDGL16CsRbBM75XFh6NYqPJYBAVnqdU3'
-             b'VYC9TLuS3ZQTmQzYU7U5s62dTQYpqI2qNqkmQS4j4VX7IB3X5QvnU4C+To2ajb1jnq/L9hqyvlqj'
-             b'1aXnXzpDOymAwXJZRg/isy7ddMeJA6PDG57uu/t2mgz2WDyIBWJMBwbfM6hjnXN5Pu7MUz5KN0PO'
-             b'Wpn5/9gSgHKHngQj9hEEVOKXO0ppTeupirWEB9gDWOUGtUtGEMPrEdyK5VW1pyXaSlVqOYYDYFHx'
-             b'zL3XhDBkHIIZN7kcU4SZEU1DwubMVKnUR2UEGK4Cz9tNyRGMiTqNPGuoWCgkuIgaszZMm77SFcD3'
-             b'L/h7qhIft+0b3CU588rX6cLLX6XNaxu0uTug5bU1uv+RR6i9tMzUURYdmjPBwb0TLVGOSuVTkyxm'
-             b'S3gZLQmwFP8OWjVrskfK09dOwHxCJJ0MgO5KXawGHTx6ilbWD9P25gbtbaY1H6V7qRb57+enY1o9'
-             b'eFixKmWmiNIc0NZa+U7RJpWukPwFVFkkT410f0ICfDydVPbBem7maZR2vbHxU7pvt7a36LkvP5/x'
-             b'E+aEOBpP6da7H/vsPQ88+OmYrufFY5/if7o+r1+6SFtpP/KLBOB1mgDwzPmv+Gg26fOf/Pj337jw'
-             b'0l1HDvRyUGFAWbodH3vzW8APTDfhmB3u8LthyrC7h2+nWned+oMxA57EdSwola7G4CRUf+PRXtrg'
-             b'eyxF2mi0WTGw00PrP4rsJ9uaBg2cbo6PTlX73plpiFYcTgVKrK9rtRw4yexh73PArdDvBesIPP74'
-             b'Y9x6J2uLw9641BpO/exRS2EDh0hPljZVURtREvS8iaEFiQrOsW1rKwWovgLuqhazzJlDNQd1otU/'
-             b'6W+n455leVOLiNl0TtcBoX0HIkHcgajp+5hifsUEUJsF1q7n6r/RUH0Aqb4qHrmOWFJwe0eq/u+7'
-             b'715u0Tsz6dGOt4krOTJJ5cCMgQZEbZgC6Wipt8yCPkgGvPK7EATava4cS2lYAOm04FvDn6CO9j/J'
-             b'mvZ6SyqgJBUrEhHWAsAISbsr6Bg0kcyo841XBLlRxbJOQF5nuYBlVBIyeI857KryaN0mNv5xpeIF'
-             b'uE7lBHE4GuYZsjXUomIPgjyd7rn3HvaEKFUJzyI3LI7j3CgDCc5uCvYf/9jv0tnTL9ODD7yB3vTo'
-             b'm8mlYzp07BjfJ7D3BbZkJlSaynbYi5APj2D4vyI+xaJQ6ZrY3d7k46qxx8SUxyEAydWUy49z4dQP'
-             b'ovANPs9ek6gQzCOhyAEYnT6f7tO1oydScnKY+pvXhPI3Exrq7sY1oUCiK1FSNvcyeV/RHTD9RZ3N'
-             b'k3SpqjQeWJ0J31/uJgG5mLs3Yu411/HDWqb77vrGJjMAGKujNsNIsoGVuOfBxz5GcElcyNLu3yNd'
-             b'qxvXry/AlX8vOgCCqKFnPv2HP9yuS3MVARCBeZpuwuPHbqV7771fFf1k40N7uVhap9Vjd9JoUKYq'
-             b'siWCONBOT1VTN23o/d1dFgOCDn4TlsBqkAMlPXzKcFdMaJA4lMOpoqhFxle6lLLxEc/qVa/fhxzy'
-             b'8DevIioSXFRYNX3GsRO3ZfldM9PhqiIFfbQ4tYCW17OFrSigBZ1pT6BNgLbppOSf1RWnwPIGeM9C'
-             b'aYrYrCcCiMNsP9CUDBFtDoZif1xKVwVtdcUKgO5YKH87A53Sk0Z7e6Lkph2FIq3PjcvnaTrcYyBl'
-             b'tse1qpW8oc74MzF6eeWlr7LTH3O9KWRMAiOoGcUtbW50Oe68+15Zw7IyXCGVYO2nc8R4CiQSqnCI'
-             b'zgp0DOpqNlXGUscULgW4LfZFEOGcyOOiwe4O9ZZXuA3NgMv0uiW4ysX59rQEkb0dPHeZKo8I6QMb'
-             b'ZbDGtrqVQJApJEVteecinefRPmsJWOvYgpSZJtmISZJJ0rFKYJtjXOyD4VgAdzaeyJbJGtSbDRrA'
-             b'K8DL840iKHhOc66EWGRBLzz3Zfr0n3yKThw/Tt/xHd9JR285xtc3pK5x7YzLSpEwahsIIFtxi5Ts'
-             b'd3d7g49p2O+LJsR4wOd0lK4NMDQYCR/lnOTZvyLjGeuQ7jckbz5dF8BbYJ7fXVrl44IkM7Q6REFQ'
-             b'rlNcTxhhrBw6Qu10XrYuX+TgjySg1lCVQZb7LbVz5fKc32nHwbgXXn/OTTHcL+l74foEJsjEm3jO'
-             b'56vhjmVdIbN9AhtzXb26wcfK4xVHqiwYqbt2aOctT37bbxCLRC3Af/vT/U9rPR2lvWFnzjl08Xj9'
-             b'JQB/VfRrs0UvfflL3/ryl59+Z7PwWVMf80io2Z26604G8w1SYPeKSkd1XOutU6y1qBal3YkNAcY4'
-             b'qOaGqDqgssfCNzM2mul0lxk0F6FBjwpLQXBhpsY23Eouc/FWbdqRM33nzEBUKzLVEM9C+Ax2rvGm'
-             b'+twzTwvQsNGc06uX1j3oUGtrazkRyPp5qs3uGMQUWKqXrV1HM1aqM0lVnvcioE9nkoxMh9ritxms'
-             b'gpnQq8AsPAjuQdQMvdgSA4AHoN1skmem1sXABu3U9ljMfErqb21Qs1B7X+0smCNiJr/x2KSgncGE'
-             b'Tp+/JFVdcBVbIge8mCpWETzqpsB8+MgxTs44MUjnaqa8but2SD6glXkK/MsH1mREUo3RtUp3bF9b'
-             b'eHXZI6EhwnLZk68+P2Q1Bv739vZOuja6nLDBOtdoj4Ibac4F3pQg7G6m7y7iS5yoBLE/9mqslEdI'
-             b'JvBD1bw/zklOOqUNSnwuMx0znXQdJwUVLhrLuS3VJ6Hmsjxz4C5Hm245fouMj/AaL8DAYHr7CFLA'
-             b'Emxs0MVLF+k7v+c76Viq9vH+qKZnpZ1Ol5UI2WmTq/y6KAWmczLob1H/xnXa3rjOKH3uqgDP4eU4'
-             b'8B15LKIaEuz2qEkZ6THCCZJStT1Dst3fo9GNDcYV3KgLULeeknTgd8Au6HaXqLuyziwDTnKRvNa7'
-             b'dPCW2xjvcTUdC8CKhTd5ZxndRBP9V5EuASKS4g7UfEh7ALi3llcOpGLCKJEhjzCyTXCQjoJ0G8Sh'
-             b'cZIS8XMXznF3TsCZcv9jVHns1J1PrR1c++ruxtVFBNjHBAB7K8B/C+nf13MC8Fc9OelG+rNPfvzD'
-             b'YbDnyxo25mZW4IMwyINveijd7KXw3FHtokWYNqflw7eQS8F02lenuxQQgTxH1VdjY5wZ85ebTeE3'
-             b'AxSFCh7VEd4eGIAaVyXmEe9vonU5CxrW3lfZW7MTddm/XT0DVL8Hb7O81Kmc6cwNTlvsqCJFW728'
-             b'Sb7SaaNSZGNRqUzFA4BHHqEyWVFpWqEfWeXo1ZRlXrM8UlZjdKQ0J9n4ylShoKIPCqJS9Bl3DGoN'
-             b'ARXKLDfS9QtnRE63UCMemzN7qix4nVTBoFR94ZmvpGBzlZZ7Hf6ZKOZLKz+ozwLed5I28Pd8x/u5'
-             b'/bx9/bKKKfksn4vjExU/EgCgei8wnVH563s7W8yBZ9EarDeCEFqxSJjSseN3QecJezu71Go12VqW'
-             b'A5UK/nDCo0hvdgdUFgE6DSsITk4SKQaVOZkds/0C+YyTINVAkEve3O+k/R81ofGmnaAAC9Pc4+TM'
-             b'3AZZRAqHW7B0NWbU6LqIFG4FSuVPSWu1k5KXG9dSIL3tNp1d56tDsSXELAII7TzxzneKvfFUZ+0a'
-             b'sM3XAkkSAJsz7tLUGDC7vXODblw5T8OU+BD7Rci39s7gKuprqdRGVpnUgMvNA0tIzaZXsRLcWTPR'
-             b'KChQAlOQAut4sMfnfufKRWqmJGBp7SCv+YGDRzk5AFbgwJHjVG/1UhJwLhXafV4bR5WaoVcxrmyb'
-             b'bDcF9BacrE6hyRGEwtgd1AVNwuYUOxxlfIFJeSPoX7l8hS5fviTKm6UoZCKxH6cs5cE3f8sftFYP'
-             b'UDNdO4vHPiUA6drZ3dymhe3P34cOQLqh+lcuH/riZz7x/c1Gkar8AVP2PKvcTei+B+5P1fIBKscT'
-             b'rjpgJToDvx3Vca2TNvoZtxUh7oMNC10DBFe0KGczvFdXUOLNFlfRqL53djbY+GMGvQCAgaYjcQ/T'
-             b'zcuAW6b9b5rfTlHvHNLNWY5brmIRHFQsBu8CelDBrnMCMOT2rFat6ApACY2fCZS6bj45lYgxJwHm'
-             b'MGctSKfz6JhxBTWlJJrKgLRxwRAAjVASEgncTOtT+VLPWq7SsmWBGlfY1lkFEaD+b1yja+dfpWa9'
-             b'JlWzVxCXBT5vAVCSnVFKqs5dvCR0y2izVG3JFjK/EZt6KBrW6JYTxzlAMUKwDHkDJ63+zQdib7DH'
-             b'bf1Gs5ENmbCZd1PFzzWatvINKV8Jw1QlOMZBZrKEtR/uDdidrtlpi7xyjGpsI9/jwIE1i3KZCpmd'
-             b'DJkeJrN8p4CAihminHQFh9rsmFS9z5HPevZICoJqGeRgSdIyRyXMyZ8XBUK5nbQLpLx2E7m6Wc5X'
-             b'R1boMBU+jzP4vplLEGOsAIpo8cM58Ktf+TptpOq1loIb3AFBC8Tx3XbLwfQc6ywUiozXcYWrTJ7E'
-             b'PyBQ1QcR7QReL1WHjCZJ7H0VtGOZtRKYAYFmQUpQN87v8PnavnaFeiur7AWwfOAgrawfYfru2Zdf'
-             b'kA5Ybrd4HWk5PSdUoQAKa9XL9wMllAsDU2u08J/NiKxfpSZL6Un1Rj0F/6s8dmu0CusTsBRwa3lt'
-             b'+MCjb/3tOBqnCnXR/t+/DgD0L2YL5t/rPQEY9Hf/0ich2D/71Oee3L524ZblZsFApBjUfC9tHA8/'
-             b'/Aib1cRYcIWCYIH7s33wVgpFI20UnvrbW7w5OBXrYWSwm7GELCxiIZdbdHopQ+/TXqoY6mkzHaNy'
-             b'wO9hEMOiNugITPjvTgOvyfxGchktHpU/bgjwqK91OrNGaxjt7CtXN7LZCwemOct6+Lbz/FqDG1Ma'
-             b'EYBjzJU7u5BxQFIfdENQOzHyIaU4ZbEb/k4lTSYjrhpZt6Cu+gDgSteEGeGU2zQd7uYgGfNGV2Yg'
-             b'G94VOvF7u7tib6wNf+M6Z9ZBNl0ROtq1jW3a3N5lpkUwDWFNbUyqFZ+B87i6vs6a/2jnSQDzkgRA'
-             b'fnZ3mznmUJJD0EHb1yudEkqHCP5QU/TeZ3YGOyl6SYyA68gAM6XImZaAaTuwzgLNy78SA8JEHEkA'
-             b'jQC4uQzo8+pOJ0E8GJVU28bRXAHn9AC9KRKYBsRNRkViveMVSin5jtgIa+5D27u7GvAtMXV57FTG'
-             b'KQsAHT16hK1n7dNYPtKJAiSrAcIDI2hiFylj5C0ZwHm+duUKPf3U59Nr+pwU43vAhKjZ7KQkq0Pt'
-             b'3gGWiua1q8m68XpiSUCFU6MqeAFIR83xnF6AwDK+CT57A+V7LGpSUMi3Viqhq4S5dC3ieEBbl/do'
-             b'M90Pm9cu09qRY2zec/vd99G5l1+k6WggvQjVBxEgZZRxn9cENMh5CHq1d5aXmfpJLOsbFSM75/pJ'
-             b'6gKgrADi7smUTp85o8hzMAIir+04rcEtd9/z+VN33v2cCWwtHvsS/Xn0KZ3NRQbwOh8B/OVZMPa2'
-             b'57/4+ffUSrHsrSNwBAmsq6srdPTWW1NMkGBTphsVN/XMN2ll7Si1est8IaA1CyERHhEwKpm4AkaQ'
-             b'BUqZPdAZ3TylpZUVVvCqNWs0HYyEdmZhEH+PFac3l0haXRr6W6hxITu7SRt1TmfdizkLlxzk8yxY'
-             b'TEJKOnb0GHXSpjpImztvqN5VFKQgMwT8k9kJRTUeYMte35CnAa+g4kTcvnWi7FdjgF3JID8B3c0E'
-             b'tK8qf1ypA/k8G6liYGWbKoYnqoIG/MV4lDb0IR+L2KO6bDfrrFoDQAyfnda31Vuh5z/zLB9CrRq1'
-             b'6mHFm/3d06I9+OCDDPCbzkrFVxQMGEMShs2ZMtVP9OnnQW3ZpNDlYo12UtKA9wPanTJ+QOSF8e0x'
-             b'TrI2L3vTt8VnglREJrCV7Q4tp2SysqEv5oR7pJ3uZWElseO5szIVXNDukJe2dHaTrBKCrDXhTLSH'
-             b'NLmNGvzNCqhgbQLIMUu73Ou4RToLPLJKX3Bzc4uuX7tOB9fWtDtQnaPu0sqcFr4mj5nrHmwZOWh+'
-             b'7YUXaPP6Bhv2+HqT1g8dpFtuuZUOHT7EI5JSvZzHw0FKzBqq9Oj52AHMrPFYacYJF0soEzH4FpgB'
-             b'HrUAvLm3w8GStTh4zcs8w416LZrQkXOWnlZgPNEzSEE4Ja+XzqR1qTXp8K230Z1veCOdfemFtAfs'
-             b'8HcsVQiJrx97/1B1yaLiL+AcKTdYaTMzuau92FlHxX2Y9kE9vWZ7d4/OX7okDIaorpnpXI1TRXrv'
-             b'mx7/PWxe5Xi82P33LQG4eV9ZPF7HCUCj+Rc7YCFLHvT7S19/7pn3NgupgVgBL1UY6FaeOHGS2jB+'
-             b'mcXKchcOZd0D5Js92r5xnTd8U/RDsdHsLFE/bTQwAoJLFMCD2ICABMfmgwzep4oHMqcQF+FgyYEJ'
-             b'bTwB2sUs3CKVoJn3YHPLbmIcFIIdSJZztUofcqWGRha+trRNMXPHBup01swqfuoC6HS+DDEfVOpI'
-             b'hsC/Zp652bXmFmrgljpDn5zqpM9tcOrMImj74FSOmJTfPuAAZpWYULlEY91asgh0F175Gs2GeyxI'
-             b'I+RHbadn5K3LgjdopZ4+d5kuXL4ugEmV5Q+e8riAA2FQPfl0EEeO3SKtf7UlNlMckV9WcJfOP9i4'
-             b'Ra+BertZyTLPOegtr65qt0GYBCa6U/N1eS/TK0Ay6I3fHSoHuvSmK6trWYkP6wTePHsqkGgRMGVM'
-             b'tQowjzZ6qGcAmWfaqVwbLhsqmXiRldyh0o+U9zXvp5t2OKnlkeQxWNXltCtTS5FMItmBv4UUR5U9'
-             b'MF+DRArmVKyBKQh6A0OK8VEZxbQHoj9333sv/7e11GPkBgCkHOIQ4NN7tLrLwrpwlQ0yAjMq5QJY'
-             b'm8xySPdiWrsj3Z4cTSlrh8QVHTI2E9rZop3Na7yerFXByZJ0u+Q46tqtKeZWRTj8PEZJN/zVs6+m'
-             b'RH6PlpZXaTLqS8Ibqjl+ZDJSUCqrMDYM+wF8jYwhfD43Pvo59U5NcEl1P9IaXL1+nYGZEEcqVVuB'
-             b'sbxFg+5+4I1/zPdYbYFM38/4v1BW/juSANSa3b+s/08vPffsEzcunbtzpaX0Mm2ton3/0EMPcWsz'
-             b'snQts+JpFjmz4MA+ng7Y8lck7j1v1NASx2Y1m46o21tmxC5wBdP085XVFdpLgR+Ib1j0TgY7uQpC'
-             b'hTdl4E6Z2/2kIEBkCEGRxqRdCD9n4UpzdC5SyhvP4Av7mc/WsNxUhHCL0Qa1oxvYXS9kWiFvUFNp'
-             b'2TNQL3hGtPMIhFQalkT6VKrIkhHy0ayLyemaKQXNG+I8cMXm51pqcHUDWM6EXDzrJgxplNZH/Bi0'
-             b'hT7X0cngtmga+I6++sJLsjmiYrQuSRRkQmHrgDCSAgCC9e133sttZhNtQWWI7gxbxkZJ+kbDkZjU'
-             b'1HyuoIOFz7IUNARrB7i5xjZl/jr+z+1pbX1PJkMek/RWDmTq5u7WJo8Y8Cfq+wMcipECq1EWWqEi'
-             b'gRyMhFoWSA2h0n/LjLpklHjULkDIHvTmJClzZJznMDdjthWWS82AapFBrUxtRUdJqaiWLvGq+hrL'
-             b'YkP1Et2AifoxOG2h05wuXqnzf1GOpHzO8J4IZG99+9sEs8LdnCgulcatryQyJRBqW0rkn8sKL6OC'
-             b'TKJ8qf4JMeTjZAGulChibFdLn7O6fpDWjxxmOtfGpYspiR8LZCEY2yWou2YpXSCVdTYMBY8v0mps'
-             b'XbmkWIm57p1eb6YGGM36GevHvsCCeWhCHErBvT7MGyTZ/a0YDiQO6f46e+YsO0rGmiQLpHa0p+55'
-             b'8JlTJ099fjbYW2j/79cDo6JGSztiizbA638EUJZ/6Ql94enPfXfNzQRZHevSZk03WGupTWvr66mi'
-             b'CqJdHgWAF1yNegcOUn8wTNUPQIBDaqZkgEX+QCGcTUUaMt2cu7tpY08bHlqpoHchmUAwGYNHjkou'
-             b'o7MdVyFhOuaEQtDwoixnADyABxm9bj4s2R3Ohpq25YgR0ATKaUzlKufQVgIwatTruiXqhg2ZVa02'
-             b'guIC8NqCcXElK71xBRUnWSTIxgCG4HdZd9awBkFn3jHzzdlyFpxnHCdVKEfwsM1JjdXi0tsPd28w'
-             b'vNDet9K0r6ol3tSdoCQa7SXaS8GIbYZx8hXjQIUEPxUAlBFOqipP3XYbdbsdGqQA74tald9nWWHK'
-             b'qPIiioStV592pyCtUUruGMzVWxL0+Zzd4Pb2Ji0tLUulnoV6gpjVNBuyzjqfh/tc4QsyUqPTY+qk'
-             b'1wuGUDd7ziJEO4HxCEXMuAjnrKL36vUQFeGubf08ShKEv5+nUUbTzFf2hdJFB+na7qf1iVGSOfY7'
-             b'qBeaFAa24e322qxOGOg27pYY7h24GWIJZOGpj1jpzvPx76bEDkcDvwxjcRT1eh4H2Vn2JuWrLXUX'
-             b'zYFBMSdREg+MMpDslpYIR9Hil0ZKoaMc+V5yT6RkO074nWqNNh1Y76ZztUZXLpyjneuXhJmjjA8l'
-             b'KDC90c6P+FVLJwWngB0yyYSR3JzLpDo+hrmkVX0q4BYJgHA5U/Bs0M6T89m9M/pK3wEJKLqIly9d'
-             b'YBCv07EM3nswHtPtb3z4DzqHj4xnsCdeKNPtVwaQLqc6d8UWj78LCcBfJISRbqDR1sbyV77w2ffX'
-             b'VCiE29UUeSZ81113UjdVZIPxiOqNjmDPgAUA7z8Fm6LdZsBRK1WuDHaCpSeD1tLm1mrwPBzzTICa'
-             b'Otjo0k25u73Fs/dyOssSNk6DjYjChCzNyptHEMlTNCBxk3NALVVo1IVMEYrWQ46y4UmruJxzsFP9'
-             b'dNGNpeXecjZpYWvgZjdltm0xtWAPda0uy1ITilnmgjPjQZV4vMDpRbzIEgo17QmsTBZ1PlsXZTUv'
-             b'0r883zTL2SjzZp69YxyS1gna/JupqqqZEU+0o6iq6qjzVQQmbMAXLl+hzd1dll72yngQ8JUERCRf'
-             b'ImHgmNJ57PgJSV44UYmKO0hr3e2JPoIau7Sg5hdV8384TMlTM4MB2QJXEyFTbrTCH0ZURu2LOWVz'
-             b'tuy8Bvw7zHuLeg7E7OaoYEGhlKtTJExroCfB3RNhfZhcYrRES4WUWB7X5s7KTPCOqhEOVdiFoHK+'
-             b'8vle1Sbl+dCumJaKLWFau4nqiO4AI/dTQteF3DG6P06OzxdqZgSdiELEqJop2cIPcb6QOGciAQdZ'
-             b'OaeFSRsZvdPsrhUPk22xXSWS5BQsG1QCklMFP2dZTIWYJHn1AJDhhd5jnnE93IpP1/WxU7dzcgsK'
-             b'oMFh+HQUhlswZT9JJZ2KbpVUXaOkIzJHPifEwZIrxZni62ANAI6J3kiflsRVzBFOwp2oMvpag66c'
-             b'PUvbW9vkTfxTJZeRwL/hjQ/+ESc0tUXw39+oIl4pi8ffhQTgL8qEU3A+/8LzD21cPHsn2v1TUGy4'
-             b'aJxR3dfo8Uce4Tk6bICB+rSNL6LSSBvGcGebQV3gDTdZPQzuYAPm4oMCiCwdAZQphSkoI3sHmrmc'
-             b'jNggh1TeU6j5qiKWOc4uW4ayGE3aMZhq5apWeNBZYpFb0vpaABInU5VSFW+AHD6V3w4qm3UPxJFY'
-             b'vdS9V1qV6bzPzfO5qvYc2J1tUErZK9nyVyoj8T6Y8RySTVqsqhQUIR+/i2Yb4+YCQMxUQLRkwfmO'
-             b'hTrwKQI6Wr2YW6Q2la7R5Ss3UrU6YcMlLweezVOMHsfAsBRAl1NwfuPDj9BgNFSBpCCjFTNzUa38'
-             b'YEmZoewBFmy4XA1k8SI35wGv57FWb2Q9AWAqximpWV5Z0Za0mP8gqcPsmEJVUSBYAnw56u+x4JC3'
-             b'ipCDXl0Q7ippG0jjmmrYayc5fz+vP4uqFcFLYrRBm9HPpSfBVUEWvHhYAUuCRNIB0ZGNJam4ToaD'
-             b'sZ4jlxkIrKqXApxY5YYMhMvWxJWmsOAAVGCqMi50uallnhEMSlWGAr8+hIzLGA4G3FkQLECk/t4W'
-             b'uwjyqIuvc52Vkylgwvq50OunsizG/47cepyFhva2b/DopeZdRkw4U83MSn1K6cT7K8vBq7wyf4Yr'
-             b'9JrS7oGPmb0SGSwrUtKmGGBSExm8GUmZHp5HhJevXBbXP6dqmooLOnj81Ok7773vM+Xuwvp3v6v/'
-             b'2gJf8XcnAZj+BWhYBP0Xn3vm7eV4j9XbJGDKJrS81KWDB9e0SpDNl6WB053PyP+UEPRW13geLg7r'
-             b'6oKX3hOBOvZLdtMbDPY4ICMwtlPQmQ765NgYSHj00WbnruKx52rCU1YBxEbBcruxGhmYlzhXF+qx'
-             b'juQkwKJ3PJGKu7g5oYim5QOnuzjljZ2rrhSMMLoIWSdeNOvNtdAm6CKy4nMr1ilFynujianlL8Ye'
-             b'03HaPCUIcoWcbhxu//OaRZ3nq/7AHBMAVc32jWvViMDl2y8HkKjwRfwfiQeshs9D9wCCNWjHOq1S'
-             b'KUdk5YcrzRHrxLLL0m7He8yyW4AA3zCrb3Y6wrvX7yet/lJFZ1xFhSSY9GxRj01sGlWHRCt3KPzV'
-             b'eoUGTe0A1Gu0xI6Msyz8EFmkqWA76ObKqhr9VBYJ805zoIuZ1UMekzhZmaCzajFhijwmCUT5+iEq'
-             b'8gSTz2+s9CZwDSDUIzDNolzb3Hmq6m+toiVIYaYPEKDIHM80CappNyDQIAXS3vKBrKBpXSn8GWOE'
-             b'Aunmbi+fawvwQZv9Xlv60zChnZ1dWl49kEFyzhZnrpvF0B4G/5rGvyQ+JTNa1NVR06csoa2UQmFB'
-             b'FLR08DDtpWBqX9Tr7+TaKRR3YB0dCf5yLRdZkld8KlwWlnKmoql6FPCokFzJJJx9NsCKTjAX5m6I'
-             b'e2U4HNCLX/86dw1CDCrN7Gk3/fzh+970ie7hQ9vpSbSo//cvAaCiTQvq39+hBOAvtANOGfQrLzz/'
-             b'RF294RGgGNc1jXTq1KlUJdeyU57MRdGug23oQb4JJ6lKrcPKM93gQ0b9/3/svVmzZNd1Jrb2Pifn'
-             b'zDvWPKAKJEgCJCEqSIgi2VJYFN0K2+2x+0GOVjjcHR1h+0c5wo7wm8PRoZfuNrvdUlgKSeAgChAI'
-             b'kMRAjDXXrTvkPJy9vb817HOKlN94H6oiLwUBKNybN/Pkyb3W+tY3lEweA2lMDoyKIWxAxggCws4f'
-             b'Uya52pFd/NSFmMaHJx8SCjLGmkiGP+p0W1lzblkvub4p5EkqV9xokc2Ru1owxecfXgdtnbbXctgU'
-             b'ljsucjq8lmgQte4yo07KsdJIV+Fms7yqYIve0NC6V5pmW/E022I74g2tVzOOBiZNJjSik2nZ7cMl'
-             b'jonCyHaZm+70d3DQbJ6+ce2Qf35y+rQvtxnfUDMnCSl8IEzdvkUXLh7S8aOHDFFjtcHrjyBQa3rW'
-             b'sgawxyiEdOf0GuHFwdUPCBCsevG4o90dDVqi2rJZGfFBujYheMXa5IXy5gZT6yn1egNBbAyNMda4'
-             b'aiSrGJQ7YK4IQctewY1oNN9i9WxwDaTCrJVjphmSKtWtCPnMyWAtenqew/6IC3LUps9CjnhVoFJC'
-             b'cETgBsiFjXkXlWbYSiObCXuKojAHAzJYjvjtUt4cKVcBhED2pSA0kytBppwQYMGjwf2FnAq+j1Ho'
-             b'A3EDYaRGPFH2nnjKldLTdHbG3JdOdyAkWVg+L2cSyMRFXJAwIH3IbRjuHtD0+EiQP8tlsJWF7inq'
-             b'tsPIltqweyvoiqSZ/4OqOyRmvJDVhSVs6rVx6tjJP+PNC8LRg8cP6cnJGb9+jiM3j4v0Wf7yb732'
-             b'b8LphImz26/z+WIUL07owvWb24vxzKwA3D/cD2PXe/bk+OJHv3jnNSABFu+KAgLy2BdeekmIY9Hk'
-             b'YNDwp8OuxAdXGOZULWlxOuede7fT54N5PhmrJWwqIQhRqZActuDjeT2dkKQLO/U5V8MbTgKDNAk7'
-             b'foFyff6+mHX949PT9D0LhgJl9yckIaeapejE+Rjs5hJbTqwtCtHI14tLZY2rQx+TkkJo/CUHMfsd'
-             b'QE9dCIGRNdZa6K1+Bc0zYICDC3bJLGyGj4PIAomDVABTriQdpto0dNdyvXmFoSRFKAtwiLFxkKMc'
-             b'YkM5q0BlZWjGnBQXnw7Ax4+O6TQdgK1Wj6dXrkEqXWt4qYkMMzUAN67fTtel5CIvaoYWvz40M900'
-             b'rcNoBpG0WAF5DbgJhZIZlbDZGwwE+VBmPaxrLQ4W7+1sMmFIGk2hU0033gvY+6JoAhEyC165J0sp'
-             b'7loIEQ/LYTMW8Kj7aKdyTi7Glc/kzmZxco2VEGMCJkFXRYlZNluCHFGhKhPzVJJCdvfuXVkZqIxQ'
-             b'LIRV4KZNBpFuMFQmSk9JDH26jvuy4tLXAaRtkabWPoqg09wAV2WTrQlWH6n4RjYSWvDPDAYDsS72'
-             b'Qq7FekEvvLgBVooIFVGvg6yx5qkZx/VHKNJguCvPTY2zgjYzpDwMjnD2ZuFD1O0P6PT4MX82W+yT'
-             b'oB6VSigMelFj5n24nLdBFWU+hHh2yMqBPxLpny9eusoui1WIDbWIKQ6CiA6NK5LOKtgj37t3TyKj'
-             b'sQrU9xMITXfn4OgLr379r326Ju2yvT31z+FLLK9PaXY6zjkd269noAH4/9uHgXH82acfvTw5eXzp'
-             b'sNvmSd9pwM3+3g7duHY9TSmVQvGebwAcTq1BlzPdrSiVRVdlcRsuuN1+n+V/IU04tXJJJqratY5q'
-             b'x728n/bUStPMzHa4sTG5KUzZT1MJDj4knhVK+rPgUZEOsRiYmdmASvGcUchCA8FiVABNQcuc/3S6'
-             b'KqSgsieB7rO9sumbO2ieawt5ZgU10Ah7Pa42/BGLYT3YmPi0YZVDnuqjchKcyec8yw3vfvSuMt21'
-             b'8BI1DGiiNBLqtiboR0l3HzziQ9zCgV3eIytJTiETQMDY4d144WYm8lhdhK0rezGE2svAbGpRYCCH'
-             b'A7+gUpSmKH12RhTCo+eo58gkty7/xf8tiHUz30PpOsEzIh8srvZtaKdJNKpOHmgQyKM7rb06/yHo'
-             b'9yPy1ghpUSbj7Dmvt1jIyww1BSJtXHJErcuISJV3/tRwBuAnzK9Hkh995jo4Y8drvgGgalYGKHJh'
-             b'6xdJ8lNjaqf8CVYFFLSzs5c9Fewayj2F/7bLCI9L1xyE2VDYx8jr/tzsrvUzwuRSUe+sVxJdDGQG'
-             b'ITohVFSr6mQ3H3jlInLDEo07KyxiY+PkpMfxonYoOM3S7JRDg/KhpkGMnljIlTZRpLbOomPJ7w2T'
-             b'EtPjFq2ONOD1RzM3EU4tnEXFACRxzQ3mgweP+XMqsmRZ0c0WK/rq737jLw6vXr1LyyX/zPbrHL7S'
-             b'PXvy+DGtA9HW//cZagBgw/kPv6Fdevdnb/2jiqfuQS52mKT3LxzQ7u6OmujgoCiV+U5cpJlhXJk5'
-             b'jqiMRLqWJmcYgSjJScg76u4Va2tR8+RnP2merlsSBoKDnX3BqSZj6U4cUwHkSt3+iObHTxBFnYNe'
-             b'cla6hsHggGmniUkOTTMAqglWTuFFiStVdzbA4Oz9L9+E/SIXSE7w81LECknls72x6aBJiwuH7miw'
-             b'T1PKrClAVC3nvO+24BLAuGCEQyFhmnugIOulWMGSJQs6n0l8pPpphup97ah2Mpkx+ZDliqSSQVfU'
-             b'axKGXR2vI3q9Nu0Ne+n3TwSxcO3s9gdHPOfkdeTVBnTW+PcAJ7aC89s50wFeAd6Y3fXkCLmhublZ'
-             b'A4iixGqIdlk3JoQpf83PlQmjOpE7cTWiXTYVcplAJ+uZSjwBNqrf9+qF4OJTpkS+YQfsyaDqYHgA'
-             b'1RuRnBuoGQDWsKbiv4F0LzC/Ql5KpftzLeiVPF+Q0U5PT+RedRoJzKhTJWl5payhgGi0EYTEjVrN'
-             b'3GfzqdRoQOEA21+XQwJi7VzorNUFgjJh3gEioiHXnU2nNNo5lOu8kescW11+iH5/R+8bpcmmCwN3'
-             b'SXBUsJozaSC8H8DZwefAVC29QZ/vp0JBD27i6/ZI8Q25BiGKCVORWRpeGl1PWR0StBnsdEep8eim'
-             b'YlLV5DLbURnHRRtD/Cz4Ix998gm9+/4HqqgIeRWD+OQXv/TKn1O6j9Zb+P8c639BD+7eocOrN2ir'
-             b'/3+GGgBI8n71S5LaFvTOT374LU6kr2J2+cJBfenyJdZpc+qfTlISb5oOEEwWVkgVNueBKE39Ga0m'
-             b'M6bx2X2tUNcyatjGsglIOsQ264qPZTQjgNIlSlZlaUbCiz5PKTnQhadfZX+rdEz2/oGOnzzmA7Xl'
-             b'OrV1rZm9hMjeBfBxt7MMBjhIFjMf9E21oRwcoEw0sTKtalvXRro8F88qNGx2N5Slh/j3dPiDWe1s'
-             b'HxzETKmlagPJaU8TzfFZepw1FxyfWdamYdCD0dwNdZqazBb06NEj6rRk71unG8asAojZbtfT7v4u'
-             b'9XttDmBymlRX6M6btHmQBk8LAuBghus9LcYnAluXXXLYX4d1nrrZXyEd7KHx++yprNN1g6VxqzVS'
-             b'5EdwDfARcG+kt0nMfOyxnJjteBsb+eEF+ShYdmbNnO4FdH/M/gBRGk6D+IVsqYxytYq25kwCnGMj'
-             b'LjhqYXb8mh89ecJrK4TwsDzRCe8j6ipBGak0n88ZgWJ+B3MQCkbEEOSzuysEQBBtg0pVtU1RFYzT'
-             b'BqqQBL3glGkv3TW/HpBHvUhFOWPBy7iOFcuQVRRBGnTE+TrxrjCyY9buk6ykIFmUyGKX770lDIAG'
-             b'pSQNOtLHV5y9qD+3UT+P5Cy2ynQwRJStuRW1ckUeFu0TGHS1EH6Fl5If3NXIX1DfCHxmHh+fsjS5'
-             b'02kJvULNtsr+cPPqN77xl+RTc9nZQtPn8cUNKjeaM7q4hf+frQaA5Xn/wBuKs+LsycNXQADEZAsz'
-             b'jpAmO3x0oQBopwNgoft1F/Imlafw2tOb8pTnjLFrmepGk7fpig+ldVYU4HcCTsbBg/06H0VIEowW'
-             b'pRpyYIuEvoiXuezpRU/P8L2GspBJitToBBBxOx2OFTW8eXgBKcvx1RJM/Q7LvPIkKSNdNo2xfqP2'
-             b'iKtZ/7nwW4St/knBKAFla1Mp1oGVATk+WMFbx2xvvZRetPRHD+5Io6M71pywlsluXvltUaFtsS7m'
-             b'Xb0R/hQVcdosWNYBy8jSB/nG9RupaIxkv8zwNnFgi8QSq/8C3xdtGk/n1B7s0M7+lXQAp+Ix2Bdp'
-             b'W/q+J/c+oY7KF9vs6W5Mcc8ph7ymUGQJ02V7NMqhQYYjw4jIqcVv9mnSlY7Xwm3xy9F2zlWwfY4q'
-             b'J7yy/aVw2/1miI9B5U7vTdcoOiGnOtaNqkjT0qR9NqYZ7KoLIal6W094eV+Ci7m42pTvo6bTRSG6'
-             b'7R4cqlJFLKF9tqquraGZhwHrZtfiJgPqiNUCa7RKnBHT905nM07P9IqsOGduf7ZGqRQRk6a0yHT6'
-             b'ipuIDXNQxE5YjRPEipqRrRaNRnsWRCHXM/0OuBsCodoAsm8M6ILy1E1TE6UQyanFNtecm0oNgXAe'
-             b'jdK9B5KuJX+GGnepw7tIsizWuO6upKOjIzITI/Ga8OxgeXDjxbcPDi+9XS029b21/foN7/8du11W'
-             b'1db855lrAD799JN/AM4p6cnR46vHjx5eHaQPPxvcYJKGq1mvQy9/6UsUAX9HCUtxSgJ0qSDgsKgq'
-             b'TfyzONpGix/tIy3UXSHQ2S5cd9qxkkmuYs18O8uQwDK1whi1+/euqS0nibJVM5m873O1sEtc4FLx'
-             b'7/SoAUlkLb/XRgHmRd60yfjvley1YyYgePVzj7XW3purXC2d0k+IspdDnrqdxZ+yaqBSUp9rXCMh'
-             b'fZk9LnBz7JHLOtf1KZA6A64Z0vey1sAaZb0WO1kSrobJCo3z4FT+h+uCqenalasSCGPWyDEqeTGy'
-             b'EgBe+p29C6nAdWm0e536B5eYae1Sk1F68W+Hem+vTMVpckaz4wc5RtauyTRNxL1+j+ViMIvq8H6/'
-             b'JmPYvSNERcpweOC46RaTR2EZzZK3HEbTGCUVAYrNRoCh6pgzI/huiD7PqLExacbsrKhrCytBoY56'
-             b'zgFMsuOSAzDWsDc1NAambuD3OxA91baZBbFq+E2Cx66KfH0WgnaAcJqu8Wh3mCbbFjfEKMBAPPb2'
-             b'D3k1hkatsHlbfxF+KxrMFRPkxPobqBoUOLzeSo3UCnJgGDf1h9kPYYVAqtU6NRbtRhGm7DkArwzc'
-             b'T6U3AmrdDotkUF+Hufuoj4BQJIpsWGTNMs6N0fCQ7Yg3y1V+Lwr9DDNvgwmRZuIkPIJ1atafPH6c'
-             b'BgYvv1dNt+D0+bXXvvn9uFqsx7PZ9rQ/LwQA68pl2AL/z2IDcOvW53/tD8EKnk+mn69Wi1HRLbPk'
-             b'Bh9uHNqXr17lQlioGxx38ID62yXzAWzBXbvs1bt6FFiWkzk9KNIhU1WOPbwBI8mhqjKodsGHAiR5'
-             b'7JSWisT6hI+vPMHWk5LMHl5tTb166keF5r0XDbLT3PCTs1M+sNtsjCITJul/QwFbLObZjMeZlhmP'
-             b'r8FDXgt5bBbiWEPqTqHO2o8nqlWyNEc4vC0Wt1oumEkdbU8d6whfc3JDlw04fJYKZ8cg8uAUBq7V'
-             b'58482o3hn67dw8cPaJ4O1F53kK1kJShGyHdoWoL5J6QKfu3mNSG2KSogREyVVmH4KztUlQPqX7hB'
-             b'ncEuSz+RY59+FT9Ou91jnsLw8i1aD87YHGR1+oBRl6h2wMPRruYfrcVljmorXjz5RSpWXGS63fz6'
-             b'MNEt030xGLb4NUJlEBroh2eBfjMa1gpPrPfpsY78LayVc40oaSLVr5uTgrzDpWYKkM30cEuE94Q6'
-             b'Q6oDji6FfCauMlnNe45/tpvBa3ODe5NT94CctVq0Xiyp221xQ4FArOUqFex0nbqHh+yvzrRS7Nxb'
-             b'4qOApmyDPIjJKS2XokTB/TyfT/h5oJibTh47WqAFxh9AYmCrvyPIFgKEev3sQ1Bof8iOjmVX3bB9'
-             b'Rozk81Yo0mKIVmT9P5lTI5lqyAaBkFEykA99adSDkJsfkDyxrgDvo1JXxsJWVGSxzq5eR+Japuv2'
-             b'+PETuvfgEYJN1JUw/S6gE+k57l1+4Q3fHlBRbYlp54cAAG2Zbnf/z2ID8IO//LNf+8NW+lB9+P57'
-             b't9uF6N8ZApVKQQf7u9RGoM9ilhPPAI1LHECHC9UqHS44nNebVfpQtrIuG3K/VkukcHzgIZccxboF'
-             b'Zv5SWPNVZCZ/YDvXyIQy3hliusIe3mJbXU3IcmoEZDTioK7tRSaI+dyoWC7dwcG+HFze4OU6XRzf'
-             b'O0VsqSxXOZUO+27zH7DZvZ4uvRoeBX6eLF/iPb1KuDgzQLztecXgxXC+BXtdcAk2q3qqZ/Md8A3a'
-             b'ZDG12G3j2U3PjkUmqOl9jT4h56NHUgmck0kTpMm1F4KmdzKdbszLXtcQUogr9WUoqN/tcTPmYj2p'
-             b'csMBKaZrUWf/CnUv3EoVZpQagS6FdXrd6fAFgW2ZJi32tu8MuMkpe+k5XMLvqmh99oQRIhR9prmh'
-             b'WUsNIcyDYjbAkUm52+tKY8JNDSv4WRfP7oFBo3bLVobJzd9f1v3SpJXkNf5Zp0bA7ooqxMY90biI'
-             b'v+IzURMAN7YxZ/RALsxHn3zMDVm339X0Prm+PrvURf5eJqniPSzUA4Hta+tkSSBA7U6fo4FXMJvy'
-             b'bepevEq91EhBx+8QDkQ63QYhzhYkxENQI/vpczUfn9BqckzT+Rl/5shZLLJTlMIzMVBTuWh3Z19+'
-             b'Nz672rxKM0ASblQUdTYGezGln9NGPSgTPxN4nd1LMSth7DMaXSNhWt9jfj5mB+wVHQnqosnPx+V7'
-             b'IVAjp6EOOlAPgNRYpXv7UZr+Vyt4aZT5vcGj7F++dvTa7//BX7X29qmV7rHt17kQABiNm40n22vx'
-             b'LDYAr/3+d3/tDwETfvj+L76CwoSjpixcJk0dHhxKIh25bN8Jz3YEAuHnlqs5s7BxHlRrIeyt04ez'
-             b'zazitjLH05+lBgKNBqZ/FBt+TC2OKJ4ghMHYB3+2Xmy4YZBdv+L9USReYC0HJXnFILtEI3IFlRA6'
-             b'swxW5zlA4ru7e7xX5aARV0OUJv2DDhv+A6QHl5CsOhotulInv7X2HAbVy5SJVQOvNuB4B94CioaT'
-             b'g1uKecGPuUkTfdys2AOAgWYlK8LREAYwFq3M5Sr9fTE+ZaSAsqyxdl4XJbUc4l4LFwoGXuvD+/c5'
-             b'jAltURXcU5OtJc6p5T/t7e8ICcxii702VEgBBApzcJV2rn2RlrHkCRJ7/9n8NPUCI5F7YIUSZEIs'
-             b'0/uHAtlKE1h77wpD0HBXDJj6N2D8+xyuw9ZFabpnfkanU78+85mI6tvvRSEB+ZxTXTruzYrUsz8W'
-             b'eSIPDWdAiSvWlDln/2zqDEnLC87lZMbQ4AA4S1S0nALneNp+8cXP0+t/+1Yd9BRlumUPC1tD6LXF'
-             b'682UTV8H9TDxr5L9/yq90HLnMu1cvCkESmqTQ9Q21CAwi0oNFhMcESKEa5waTTh5+k5JvdRA9PcO'
-             b'aXl2RNPjR6BP8vvASBPuH16lZf+jvN6p52KnKxZRDXASoxZfyFUXqwl/dvqtkbFvhJzLhkEVf6Yl'
-             b'eU8iq5mkaOzPGHIzKWuOUHev2vjid/eGfUViYgZVjEdhOQeGorDboL4/mP4t9AcNAj6b8/S6r127'
-             b'8e7e7vCTanraWJttv36z9d/xORZCaHhgbr+emQYgzBe/9oeAytfT2QWbUsweFcfaEJI0deczcpZN'
-             b'1kJudrwGQPEs1FCl08FBNU8HfpunCQ7waElghFdSleSKC4MePgFsK6wMcH5sfK/54ufxVye4ho+9'
-             b'N3g+SvESjnPIOnqKAskeHT1khKJV5o2pNhUCl7ILWVS5GKfQyWoCREUU1opT/opMLDKCI6YsljK1'
-             b'O0L+K3RqU+MgpxmFYn4EqHKpULToz1Hg2v2BQrc1sx+/bzo50/2pCqkMuq6dfHP4ETc+6Xcv02t8'
-             b'9OhhngS9q0kTzsXMwubmKjUiw3QIj/Z2eaXDE14lnI01DJZ2LtLera8w/I8JbAk75fS+9Hd2uEHY'
-             b'rD03gTNer6yl4UNTkN73NiDo1PSdPviYhvhzMlJlzAcJ3huoT0o4B7oankczhsm1N9jNhZlJaKlh'
-             b'WGoR9VTL/Aq7Rr5mVLjaN8Ywo1ykSX0CnBrgGInS9vdMpVS+S1REAemM7398h2azRZqmR9KQ6OsI'
-             b'sda/W7gUt8tBmPEb82BQYQXur3V6Dv2DmzS8/nmarlPD3O4yEbXT6fFf8+lZjqTudHu0nE0ZsueU'
-             b'RhDxeM3Vpe7BlTTt7tHk8V2qZif8Odyka9of7TY/4WSq/9PTJ9RN0zHWNPh3OFyOdnfVLLGUJjRd'
-             b'll5vmJMcmVPrZW0h712R0TcXGgQH9hQIT6VYcsyy9fBRFBaY2gH/t7pmI6vhV0R1RkWMtQrAuWxy'
-             b'tUgNJiSAkI+GSDkZcpMa0xu3v/C3uE+qxWJ70p9jAxCqbXP1zDYAc0wTv/KGLqfjVDTuX2+1JN7V'
-             b'IG9AiwcXDiQnzMmkyXkhQcYpwMcgE+HDOMf+EoU//R1yNmjQsa/EP1MhpiCuoDoamLX6JTPNcbAg'
-             b'KRB5Ajz5FIVYxtJGXOxMLmhpgLEeZSxC1uXJ1uhLlR5gUgQBj2KF2apj4nOKLh4P6oOg0kE+vBia'
-             b'r6ihvNaEOwsHUjYzIFYn+062/MV+O4qbocS3orFZsAnOGjr7WKk/ga9VedmG1mWchadwThzMY7v6'
-             b'7VMuStysuJroiIdEgWaHxnSdENrkdVQNGRo2NEXWDHt7+wyzY8oU3f5am430YO1UBLqj9FheIj/D'
-             b'kosXOzWmv7faLTo9fsKWv5j2Ma2iQVwsVuleaFH/0gtM7lqd3mM3Ri6qQFm4cBBbBrcw/VeaEKhQ'
-             b'Pq+NClcXY1I9vcXY1kMsf89qXeUwnZyfEKOVY9nsUGxwVGImpXLx0EhgSYbW+19XLNayoLl88PCR'
-             b'CAzAbWHIvLB0ZW0viowMOHUBZD8M5SjYWmKT/mrtXqRy7yot07X1QH+KNhW9FkvbOPsgTfBOrZeX'
-             b'XNDE4KhyGy7GorCXvAZKn7GdK7do/NCxY2UbTa4iR4aMeEU5+sMdbiKACDDfBtp/XXtws+t0D6/8'
-             b'GmnaBPkDJ8RsekvlnXBUr17pEBoIjGtIKbXZDdp3Y73QPzxMzXiHXy8jZS5k1MX8E6Ku6GzwwKpt'
-             b'PJvT2dmZqArMxRGfv/T7bn/upR9CXisoyPbrvL7ill/x7DYAFy9d+hVCR0HT2XRw9PDOy2gAsqcm'
-             b'DDdSYd5FhKvB3b6G5jitTh3QsCtulYCfV0wk4tCY1N2bpSeS8MytLejUhf0+wj9gjIK/SKWE0I2v'
-             b'UwFhwyK/UT9znY2jz1a4wakXbCl54qKTjxkKb+rOudkoJFQIhZHZ0Nk9TwoHwoLgEsi51pHUDa1g'
-             b'6Je5zBvLLZCktPVqxYWTYcnKZGYypQTe28vzAKpRMk9iLImHIhzQyVXVAVGLg7KdDHY2cyLbqbIH'
-             b'gtnT2swVXTZWiS4VEEyAa5moNix/jJnFXRsx8e6ED9X9wwvKiwhUmctgFE5FP03ga1ZUltwgdXpd'
-             b'PrxBAETYzdHDezTa26Pp2VjsWNPPwBgKqhIUk7Ldp8HhVToeH6XHl6kMZD9EBuf9v9r8uryWT6+7'
-             b'3cvPF8jCcjynQZpS4UXhXFfRF4XWcS2ZUBqFdGhx0KGOq62MxhlqVYYFDflMBhS+gDfpHGvWNcc+'
-             b'Cop1cqqeB16Y0IHq1DqvlrXsZwG0CDI+VQ1Y2iHufea6dIbU2btE5Q6u3YRDtHD/4X7CZ3CO0B2+'
-             b'bdN9l+6z7mjAWRBroEepCHJDs7J1lRBy8Xx3Lt2kMdZR6XoXlVhH49pCEcBJiqM94eiw+mPNwUPD'
-             b'9Bl0Kq2Foyb+3oIDJClXgC+hBFRJA5waNP3cZxWKXlJt6zNSJyZx2nBSw963dEzmQwMSG4RaaZLM'
-             b'FFQeLWYUwvNZdZwazuViTb3UUG+CZHOACNodjda3XnzxJxg22p2t/e+5IQDpPVgtqi3/71ltAN7/'
-             b'6Zu/0gAgFGQ2WE3Ho65XyrKXiQx7ZESICmnO50z0EKssIWO6lKskipcw/U15wkczwFNx+pC3wGhn'
-             b'B7QW7+vRvYMHwLvOVFDYb7wQVze4y9k07TR1Tqa7ULu1FMZsj9Skc0eqtdAZ+NTkPbEvVai39hep'
-             b'p0XI5qpYx+wCckyH+BqSvWA+/EqOciVPaRyXW6nG2cxy0qHvS6/7YXELDCz7W+VJyavNLA5mp9JH'
-             b'Ur22V3/38VkqmqmRKp0WICfSSd61KqFPHQvY6hgNUDtN06PDEa1R+DFFFlFjfX2dtaPkL54iUyXZ'
-             b'O9gjopoUWWlzskoFdX/ngMp00E6nc1ZkLGYznvqRCAjkB7wKQLJAgoDeYB0yTYWmj0yA1DkgkKgz'
-             b'3KXu/iVaP/6Ug5gwgUrUsznC1BM91goVfiY1E6Ywxu63M+iZ8j9LyJwZIhnn0ytcz31hyDnyOSXR'
-             b'JHq+tp/2rO+3PXWmruUiRjq5Os0rmE6nTO7MqyMtjoDOgybpmU/FarUQwmdOAQjpMyHSO0atUpMT'
-             b'VCKAQmzPdpKmW/BggBjhswFVAH6OLYPbQGqWfA9wcVfPC9n3B+Yj7Fx6gU7Tm7g5e0QtXZPAD9/3'
-             b'h9wwG2wOhGE4aj1l5dvt9mtXbn1tfJ21sfGaDyJGUiqLzTzaqiEF5EQMRaqoXpnB3MtXdHDxOnWH'
-             b'u4q2BF2LmOWzpW4qj8dWDU68FY6PTwRRUI4NlCDrdM/sXbv9/sXrN9/jzI2tNe25NgC1B8n265lr'
-             b'AN75+zd/ZQWA3e7iMKzXPV/YdjxwYer3u9Qd9Kly8mH2UYxA+AMLhnaa1jfLDVtudgZDlhpBeoQJ'
-             b'ES5+HJiDIrkJjCZs1AZVDkY5VDq9Dq3nC1UfEMfjlk47/81KQ1PMZ92O/5JXAU78SCUMiKeFUvfC'
-             b'gWqP38js5163J3wFlSx5JbxhUmRTHKTbiaZImPnpea82Mwnkgc895GaV6MoxK2PKXadpFhMVmhs0'
-             b'SxusV7ysL1DMCl1xFEqjyqp4hZdhfRrTtbL0PCmGUpyOnxyJb3vhcyND0SaimPfTGXLFWiJdr7t3'
-             b'7nIDwAoAF3IhKyzsRVEF/I5WmpQOL11kSJoU7mUyZ/qxwYWr1B5eSA+rBk3zCYf1rBbLBtReiI0t'
-             b'vObbXZqMx6n499kWmKHx1IQsVxsaHFymR0d3qfRV5pDIjr2i6fiMBvC6x+0QhBCaSlEOomKCXUs8'
-             b'9V1QHogGxDv1IUdzV7moOQqF1PoyqmDAm6mAeNlr0yH+8ja+1lNr85oKwY+y/LSqKg0SMmmh7JGC'
-             b'Bd5o44HH7fWEPCe/Q4osdvto7uauRe1UkCfpOkE9g3tosUrXtQjsVnl48RJNz055It+k5pObgdRQ'
-             b'AFngIJ/5LBdm5wrljQh7P7XtqQm4TsepEd8sxpzzwJB9q1WrWHIDLPc8Gkjmxug1QsMKUivQOGvE'
-             b'vEUJq5zRmQw21Aod89bIzpTNe9NbAqNP99FIrMRDzAmJZI2AhZXpmsvpmgvFfrla04cff8TNrdhn'
-             b'C8l3kf789hde+bvOaG9Vsf5/6053Pth/VGvw7YrlmW0A3nrzJ7/+vhJdD5s1FDY5mx0HQzcVTTPm'
-             b'sQ+4DDmOp7n1bCoHdPqz5eQsHRhpwl/O1bCnZD9zy6sXuY5jOy/ebaO4KdAorGm14TVnr5w7Ljvn'
-             b'IsY62CWoalsnBnZq83qOm1mP7ihZkucqcTME7BgseU9GR5ZYped657PPeNovC19b4GqYEEunsFeP'
-             b'cuCEjbiM4eCGMgC+9czONgIgdN543mC+A4JdKylJZYiA+3HMYV3iOARFPQca3mdBd9RykFYy2WoG'
-             b'gKwMQlYEKG2B//3s5AlDqxTqySk3DAzv+5ykh8lxMBjlyFcXSpHvpe8bXbhJrjeUnXyawpeIik0F'
-             b'idc2S3lfMUVGvP5OSeOzE9Z0AyVAgzfCP6dCxRLPuKLh4RVaHd0RH3lXPxcmm+nhD8OffrulEkZf'
-             b'G8cECQMC2zuTwqLY/AadhENtyWDWM4oRSGH3zXu48feNOf7H2g/ACIR2XVEUR7t7ioCplFJJhz4X'
-             b'O8psduE5yHu6DiKnLMnIiACQutx0tdNrxfUEsoBmGQgS9PmTNOWi4QTZEagY9uQFfPXTY+IzJ6E6'
-             b'9ZQcswWyKB2gwujtXaT54wWHcjFRr2HZyuiWmkah4cL7ic+GmkBonsGa1y3UyFCUhlquudfCHrMP'
-             b'hheeiZkguZhtjY3fgYcofYv/vYo1298UKHXTIHJaJuXyWykIDgij09RkFr6s1zOsHCjo+s1bP148'
-             b'ecyI1PbrfL7AL5rO13T9+vXtxXhWG4Df++4fPf0H6YP/6Ucf9O6980OKnZbmfLdyBjlMeYJ39RSu'
-             b'0jlWx6eJt9UdMlSJSXCTbo5AFhdbsZud+LULqQm+/iv2vzfNdaUx6apoDwbDRtGla8gHKQlRzlgl'
-             b'CUUJ9XHe5TCZOhtAU950dWHhOwU7q230EI+ZMIZDCDv9eSpe+7sjWq91bVCJhKnQXT7g/ahFQJzM'
-             b'Kj7ANyx/NGMjz4USzwVTFQeS2N6fvXiqrKfOyQKaloaJ01mUraabBTusswmAhh25GsGxa4bpfrHe'
-             b'8HXBcy4atjk6tqs0zHGzs58m793Rrlr5iokNk8OoRcXgkMlpcKUL8FzvDfh6wjq4jSZgJYY2Rfoe'
-             b'+AFMTo85rQ9NS384FHY/ijmaqt4O+YOrdHb/Mxpggcz++LryKFtGQeOChPcZzRSu7TBNyXg+2L9P'
-             b'T09p5+Awe9IzQc9Z6qKvE/20EMfsDNjgBejOWkyeauWAcDcop/A5K/BReBho+t55522233WGPuj1'
-             b'DGpGwCuZIPcFmr/SiK7squnVDTndF60etVPTBXLsOr3fiFQdjXZoPp1QXEZq9/tMmt1UmhSoeQDw'
-             b'WtispkQNH0gJ3dHii/tFp+cNGszBDrmTDoVFuq9TIzYYCqsfMtF1ukcG3QH/PD7f5bCr778mFabn'
-             b'308/T5mXImsQiQlvBPV4QW24wfTaKsRmJybcFlNFbKpVeh575BBaFBSxyYZcjmqbLSUURtsUcSwX'
-             b'F//5bE5CgZS7m6WM6SpdvnH7HTSbcTv9n9tXkYa008nx9kI8yw3Ad/+rf/r0n6QPzRt/8R+KP/8/'
-             b'/9f0mW1LgQ1CjsJBL97+rnHwSKFgWA8TR5r4URhNd817whA1dS+oKYvswRGGwodtIbBolgTGOvMd'
-             b'kKfXuGFSnkERi5y9Lil1gYxvDAC0UOaykd3y4a7/Vm0C7e7v0wsv3KSf/+IDzaqvU2bwnZjCxqdn'
-             b'dJAaAEsfENhdYEnzWifNp69UCYDizzvwTaXkyEIahDSxQgrpleAnqgdHk/R7IJdDcpsViGUqDHCC'
-             b'G+JwjKLB54hWojzhRbOcNZa0ohh8TYK51QniIYh1yBB1nk5lmFUuVuCExw6c5Jab7G/A73Jq1lqp'
-             b'AMCfQEzgSn6eKzR87ZIW6fl2U0MA90QQ+nAoD3cP+PW2079vUjMFNKT0ku8O+V5nsE/7N27T4tHH'
-             b'jBqIPN9MnUjT7cReFhySnFmAOpIea7i/p2iA+PCTGsqYr0Be+0RLjvA5hpm5G85bB1YXNcH5MyJh'
-             b'qxEhXKpXBEnKImKAgVw59c43pztxZjRTnJILGlCzfSAGsUaagmZasPdA2eEJHsUY6w9ueOBVcXhI'
-             b'Rw8fUgupioW8F5AGIjdhtZ7rJ9BnbUI0HkVoNLMk1tat3i51d/ZpvpnRcDQU7/2IIt4SIqOGL3Hx'
-             b'ZWvXJd8cQLPyva7NKa+i0nWazyZivZ2hwpituaWO16gUF3RfE4pz02UniSlpvKB40eKwScyKWPJI'
-             b'xp+smHty97M73Lz4BrES98Bg7+D0ys1bP8Oq0rW2BMDz+MJ5fDpOZ+TZmIeL7dcz2gAsT5/u4Dqr'
-             b'Ba3G4yKqf7dGiPAhgsNdJts1k9Ocyn5YyqOQYMVMc81fd3ZjaPp6UFc7LpQL/c+Fyugi++HzFMlG'
-             b'QzJRAwoFrA5OABPulAPQTGxxeoA55SbYdOtyjKjFDWuRwV6bdfhycFaqHScliDHbHFBrKmBsABQl'
-             b'I92rw14FhQBkcEAEYGIE5RXsbtdLnsxQHDqQNKXfwUY6MIGxn1cQ1StEay54xn8WWDQV2I6yztPr'
-             b'P3p0N03TE+p6KYqVKi+CWdpmjbvL1z2q9AzvB/5XhTykKeNefQ+q2tENfA1vigln03LBmfD4axFE'
-             b'C48HB18A06RjVEjWGsiYByxYtkp1wZvJ+wkJG/zm0/vY4rz2DUPQcBWMKgqHVh2ISW8wzCx0G2wh'
-             b'sevCAVAVHVxkvM8O0DXZLj61bxZUSIsx3kNPme+RvR+yGU1NKPSxlgc6NVeKDa2hZ1LrhgmKYJiz'
-             b'DFCDmwI7RyoaRYIcHRzs0M7OKDdx/NmKgoJR2U3/N0z3zJoPUqxMuHlNvwNoAN4TXptAMQAyIAiR'
-             b'bKLUZgtp0thsMne+jAc0eC/8QW1R2YNt86N03VbkGvcCYHhRRIRcyHH/F3lJIVG+oqbQdUm6+WbT'
-             b'sbxmjaQ2pr93Fqhc2keR/3/Ibot6r4KvgTRJTckUWot+pjcxuwj6piWlmhPhd2JNhx2HK9WptCJ+'
-             b'X65du/nTwytXPmGOgt8SAM+lAUhDHlQw3ChuSZbPbgPw0QfvPfUHIPrcu/PJFZGzVczklhyASuRa'
-             b'kOyEguFp1rCTaturyMY6RW/w1IQpkGTQxDPV9eqBy1MykAEQ21AknUj7+LBDsei0GFpGE2BTKj9W'
-             b'3VcwETHoLpynjMLnpL5ItSe/rPLlQGBDnPTn+3sjSXHTFYJI6JSVnV774wf36ItfeDEdzkGKdBQO'
-             b'APv28568JfAye7pXXLhBWmwxr0Fti1lKFbO236bDoHarOSfQa1mCvlmvOR/iqeHCBF2Iw3zWlNea'
-             b'eDNS8hnmNugWsqg+THLUAMgp8hA15Cao3t1Mb1DMooWzaIocgzdIeHTC1XA6CQNihtf8Av71iIbe'
-             b'LCVbAGQukMYqrAnEX963HI1PnqT7Z8A2sziwV+m57RxcpqPHHxOlqbSN1ZIiSbyCgYqgLZ7/hfEk'
-             b'NMmPGef8vlbZjtoMSXBNndoyOnX9M4KeU+plVhpkIyRDDWqGfm4k9HFMqincTE/jyYzfIyZ0gnSY'
-             b'w5WMWSCIAKysO+0d6vQ7fP3yPUkx296yZ79T/gmePx7XScY6O2EuV7xKYhdLcGpg8asGVt4Mi1w2'
-             b'stb3z9V8gPRnWPG0eqPUyA1oM57xZ65O0nJpmhe1DkfxRiHJSghVpU1hUO+tIiMBpPJL7zWDgtEQ'
-             b'XZWwHS9lTqVZD0W939jxsdWlnd1Dgf/NQIlqAyhJonSCkigpljLKVdEK3BuFBZB8iesHt8qbL33l'
-             b'9Vb6bM4X0+0Jf05fuF8f37vPvhHb8v8MNwAv3Lr59AYgHdr/8d/8X7+NPXCw2Z3tPgMb/ETV34MV'
-             b'71T+EXW0jBbUG4QcWMWlWPxuQtZ1c6Fj5UAlcDjIfqHIoTQmJC5LCQ2CDTGkTiDYRbXmtedQT3G2'
-             b'DhByXo37KxnqqZQ9+QKR6uYLt6n9d2+rv7pXAx0ZK9NTpuOjx9p0aFE0LoGmyflCGfVesgCgPedV'
-             b'bzB2e1UXXGWjiwlNxTvxbrvLBzmRFFfs17u9YYaUeeVRVaqScCLJKwRlEdkfKfFJEAXXFMVp1jqI'
-             b'ZXitrdw4uJyuZ+QsbroYjRjWoI3B3+mvPmJmgUqoEyKjDnA6DHj8gidbHP6YYjswr1ktWYIoyE1J'
-             b'08kpIx2zyYTha5BBfXpeRX+HilSQ1osxX0uvxkGAipcgSqZrw6x1ndrB18B6pD8aceM4n0658KHJ'
-             b'kbAYbfaKwviVksSoU6W3ZMMYVf1QQ9BeEwBt/29JkhZdbVHNeD/wn07Ppkpa1ehcMh6By2uGqBLO'
-             b'Bdw2A6mpTglDZoIt4GQ+odHOReJknJh7GWa1zxBGhUag1U6PVfFKALdQh0mXC0lcVN8KW5vFhl1u'
-             b'Ji5G2Ytzg9NK1zw1+KsxSUw21eFH3cEgQ+i5UVK3xml637r9Ye33TyL9EmKqpvp48/23QGBZG2bd'
-             b'vpIzpdFVCTG8EXwrx3pLbLHTgcHeQKcR4BZhTYxCInv+/oP72ihb2+OZAHj15u0fjM/O1DBp+3Uu'
-             b'+//0GZuMJ3RwobcVAD7LDcDZ0cOn/mAFfff07BomBBj2cA55IeYigCMl0S5KQIiFnuCDl74XO+Gy'
-             b'raY3YCmTSI4szIYPlkoMZkjd0+Sw9aytd5rbzqxgttwlZumzJ0AqCBUnxJUZmo1mAJSPcXEuNO88'
-             b'JsxlO2NBKnS9LAEsCL5JhWq2XMuB6IJmtcvBNZ5OROpkzYmyl6NN3NVGI3LXfIjDq32znCkxqoGA'
-             b'6O5YCE6SNTDo7zamcS1CJvGz/8/IRSGELgtrCTEXcKes61r6Rzp5CSS7mi/pvV/8QhjdsZns03DA'
-             b'y4dnI0nXmiU2L0KAjTQIsKedz0TdIHBwxYWTw2OwL1YHQTDWxamtzf4PID+CEDhMDcZ8OpNCiIZh'
-             b'kxoBOM+ZDWMM+bUPBjt1BK01K2w/WypKQ4wwZNMjdYwBiLDRtYzXguzNyyEGvY7SMAX1rpIExfgU'
-             b'QmAs96gG84HvrYIbjWlqQibp3sA9zhupgkuPyOiYgtZSoacUSTRQaOw2m1ovjSsOJQGgfuz4oT7A'
-             b'+mTDBlPyqcJ7DzIqrhV4NUABFuw9IHyKGNfiB4EGO1T5vs3cRye8AM6X2KSmrOwwSROpeR5oBAK2'
-             b'dN3gFMK3VYrI7kIO2fK27tPVinB6SJEBkTx6Ja1aSQ6qzKkU87D4bGcNGZ8tkaGCbHBZL5k1hhrD'
-             b'gNMmRt6aErLYk2MuQGLLTRIkxs6Gu4svvfzym4N+lzqtYnvCn8OXUydVljlv4f9nuwGYbaqn3tjZ'
-             b'eFI8fnD/Ood7qKabz1ZAskqcimqv67SgsgQrHVL5QI4xT+ZsKauJvfhmLg6AgQu1FeVgEglKYQOb'
-             b'suT5ApA6JwyCROcxkc9IE+15QkCYUDoRU3FpZyMc/IDtWVGQLKBHVohKmfNeC0uaetol7aZp8mz6'
-             b'iBGHrGHWngJBN46T9NTERXecpMY1TqcesUWrZLdNUfepWpBJ+BBwM4SByxDGN6Fp4C+HISbDAn7m'
-             b'pmhQDoYEtCxZN52DUHQ56vSxs+uaVxaDvi/wZYBWPx5Pobas0/1CzFbCleatV+vABirk68ha082X'
-             b'iKLVIozisZhPqZUKCdCddWrMvKop8J4CSmbJHzwRCpGSIR0ShM+FK9lAaD4dk0OjkA7o/u4+rZ58'
-             b'ymsVvHesN4cnvPrNg28xTr9vd/+QHw/Od7FhZOSUOOFU7YH3HWS65RjPY0fNoZxOyFRPklXIro+C'
-             b'I5l+XtuhrNRA4pytvIjvz8HegWzYtcvIhVbld6apD5UgBiCcwl8fRlf8zuMeDaUwMH1bSXFipY37'
-             b'ECgHlBSY9Fsghyojf7NYctOJiEWWoILFsq7qNbetb0KOytDXEoRDE6M2tFL04c8By+ZBuidF7RMZ'
-             b'QTubnNIoXe+oTSeMnMzXgJQ/ku/95molOznqJO9rD4BoPxdr4WW3O1A+RNSwsZBpGV4Jg+YlwPdH'
-             b'FBMr/O/k+IQbqjYiyBWLXKVrvXP5wsd7o8FHi7Mnubnefv2G9//esb13pUTn7dcz3ADcfOHFBqxT'
-             b'0vHx0ZX52enN0tvEI9M6ilqbNdmVZtrHzBy2EJaQpgwcziAo4SBxzmUDF4nExaEzz6l3cmaL0UjU'
-             b'Io3DscrIgsTUonhsUhFAqx+9NhYoTDqlRCUnQcdeaNHhSdkXagesz1cDRuR8jixB/NIrX6JP7j3K'
-             b'drLCqpb43/sPHnHOOk813un3FLmp0NM87xvCWjXHWQJllOiKSXN8XRoRs+x/gOdoaIFZ2TqBdeGt'
-             b'ACnidHzM0cEumhOb0+CgmD1t+CoEr7psOVThYTAcDDL/IOqqQ1wVGwIyvDepQ7h8+aIGF8WcLYDi'
-             b'g0YChLX5ZMYmNCA5rtIB0OuVjM6AAzBJRYPVF8z0lxha8DqwAwcbvtvvcKMwV9UDPAFK36PlJqoD'
-             b'HLqYFk93YgXslWyEn+1LsQlB0Zxa3pctjaOr08hALut0ZTqOlD0Caj8HNX6iGrbO6gFHDVRG4edY'
-             b'yvtcyM+++eZbdHo25+vrvGkrlFcQXEaZuL6jgKZp1MeaF+CChPqEdM2BqvB7DWIhmyqp6gH/xMjX'
-             b'WhAWJz4BFDsi30OuBhWKZKgixCR57ulpTa5SSwmD0jyh0URjV2rsdPbK8JFjibMOP3t2KOqlIVEw'
-             b'gILBk7cQK0MQFG3LWRP5faqDlBgVKzQGmkgtnPU1qAwzZk6FqgKi5EUg7SCke+ajjz9hdBAgRqXP'
-             b'HYjl5ZsvvuG7/dWayWnbA/689v+rarW9EM9DA7BuIAA45N/72c9em56eHHTZ176W+jEHANr9qqo7'
-             b'cyWlhWha/SV1Wn2e5GIQ0hDvY8Hex+aTISPdk+YhuXpqgnB13JtO9nARnPHk412mzDFZUVe8oi4w'
-             b'GNt5nT6ErOe0iMl3hJwuJvWkogtpSgREXYWoZCeXSXEguIFI1G8wvY1Qxvti5TwYqYxJcwZtMthf'
-             b'Mldis2o0OC6YGRxNJ2Ma4bCFG1xqcIB2oFEgbayiOptRrK+L8A80CZAoP5+Kh9GQTVLwWlA8ZpOp'
-             b'ynRiTcSKlOWTrGRQXbbFGrP9sBIiUcxxbfD+I6gHkD54InETWfUA3f5qvckxtch8kOaP1A8CFoMt'
-             b'SSZkI6AOkz/BEcAKCKjRPBX+YFJML8FJcIgU/V3BvIE8zPFzrrjZAwNZmPH9mtjHKEXJYUW5CJqW'
-             b'zxwYo9clUqirZQwWHpjNgmNOsKvTCoejEU/qeG2tspdTIINGBXExNx973b3jZ9i0aKGrEy9KF9/p'
-             b'UdnfY1ge6zNXGhcg8vTf7XVZejkcDphXgfhdnu7T9WXTKLBJmDxrK6BG9c+TdtD47o2gY6qcQPNc'
-             b'6QqN0ynT72ezr85Am6yg057nBpy5Kq6m16ABQbhX22vzaQS9SDnAitThMTYEf1E/k1hr2bWjbHbl'
-             b'c1Nnw0VOGtVzplDfhuPT04aE0IiOgW699KUf9Uc76VJvCYDnhwB4mpxNaWv/+xw0AIVvHJTpn997'
-             b'6yf/RZGKlge0VgicDHb/wf4+Xb5ykSFa0enGDL9GbQgKiQVkaZmctxXHlEbVopsyQM3FarhVI1Mp'
-             b'avwMiEVRCX+SvCJeAWY4Ek23bwljynIHpwCrCyPFZcN7yvwA8UuXwwSFBnvCw/0duv/oVNnmlRSt'
-             b'9DRmsynNxmMatg8FDXGi1Z6PT2gHeenRZ+OXQoeoNuJbe0OaTs/o4w/f5933rc9/jqHdqEZGUeVW'
-             b'O3sH2dgI8cjFr+zT8G8nxw/zqiSzA7zCtbpz5cTDYD4Aasai8iy2qw21xt602bFxaRhBSP+93x1I'
-             b'ccTzRNALk9Nc7Z3vJIGOs+BBQiv0e1naWaZ7A4z3UqbTQmyPYWuMxhCFutXrKJmtoNU8NRKYaEEw'
-             b'KVqKFMl9wZbJ1lSZtA27ZC9NBRqJwe6ePh9fO8zq+gOw+SYcK/RfKpIU88qKr4Xpxl2tFjFUxXgu'
-             b'hdn2siQi5vdXLpx4D5A1CtZqCDVfi1bFITX7BxeYRCk5AriP0mcIDZNrU7c7YsVDWEtgELfE6bqB'
-             b'IDobT1l5g0YU9zWoF0ENgYTnEDNfwKB3M0Zqns2SnrcRtj6vAnTiLrz+XBA0iQmOOm17bzcGx1Bj'
-             b'lcTriKhQfiEoQqX3hmv8SjSu0iiE/HnnNEuL7k6/pzsYMm8G9zAaeBj5cMiQPXfl5FjYmPdOzY0c'
-             b'LZZrOhvPGLUKDeQOhNKvfP2119NFZcns9uv8vsJ2vfJ8NADm988hQNPx4N233/weDvbAaX0t/juS'
-             b'yb765a+kQrlPc2j11T7W4GrIsbhIQDmwmvOO0uk0zEpyI/Q0YUrd5dcCYJVT8fRYmTu/3GyMIKgz'
-             b'XT7U6gV/pCapzRLf5FDg9sY1s9+NDCYbYMgIP/fCdbr74DHvgXPUL2Jh08F8lg7hq5cuCrERj5em'
-             b'NYc9PknqoSPLA5DY2kUq/P/vf/x/6N33fsHEpN//R78nYj0ddjZZiyDeCGZCgyhUr9noMR94lejC'
-             b'vSAJMulJsl/QCYnLOdCOoOiGy/QDZpqHKKTMSh0LfWx0F9n/XpAUMPiZ0e/rvTpPwGVp2AFb1uJ3'
-             b'd3s91oGD4AZioITVrBkJ4MqQ/gYGP4JtgNYgHAhFH1kPCLjx7DmfivlskQphwcl9m+U8/bzIyYw0'
-             b'hikVHgFADhhVSY3SoLXLjQeuN7mc+Zgb0rDRYldfifx6XWOKrW+ZvMzOE2x2DyRRh5DGNi9WKzqb'
-             b'zGSVw0mWoV5XRbnnY/490thevnYjve+4rvoeVdJMwBGxM9ih6XzOKANcONFEhVVF8+Wa+SL4d06b'
-             b'WEozhY8eeBABq5Vgzo5iketsGlfFQ1S1iKybgBpIKJetiWbTU0Zz0GRBzkXp3pYGI0cf8etisqKr'
-             b'Pz+4jkADC4Hfava+yfWojvwl2/9HM+WS+3V3f09ksKER8WxNZpQMgqYfhWPVEEyYWvTo8RN6/OQJ'
-             b'20ZzBDcPHRvq7Vy+v5rNf/7J379Rk3e3X79Z+D9dcEYAg6PtjuU5aABWINMRsePXR+++/fWj+59+'
-             b'vqMTou1ycWDdvn1Lonstc17jV3lCU0gVRRyEr/ag5NAaLpoGXXMATTqAghYJkMZi9qJVjT3podrQ'
-             b'q+PfQ6WHtK/hcS3ozoiJuluE9Cyq+5uz1iDWTvDCZ1DtMnbF6Xsv7I4kfMiUAqqnx45+DK/xdjrs'
-             b'AHd7kUEiyAgTldMkRKAo2Ad//MuP6N9///t0dnpC3/n2d+i1b36LWp0+R/KyVjmoaY8lFGrqGSlU'
-             b'XKn2XiRcAkSbCx6Zdz/V/ui2yDfLY2fad5XDxezmFyk7BBe1w5qjWusOmB276uhCfr+yPwETMeFH'
-             b'sJTEZTD4l0tWheAaFUYcRKNRbTQLPjBa5Hnal4RArFpW8wX1e11aIyMA/72HgKkdWp/MpWn0kg5J'
-             b'0bTglTQxRU94HrHZt+guxWswkJkCpb8v4SOBidXb0kig/1zoQ9Ro6To5UlYslbhQqgpDgKsgKyDE'
-             b'z6bC8+DRIyHIKo/F+5gJg8JHd/m9ANTfH/QYiTEMHc8L0s0uyHfpmuA6zqYTaqfHm0/GNBzt8MpF'
-             b'EgQrXocgAZH9ILjmrrgJINho2zXIngWKyvGlk5YW0H6r3ZWG1ZuoUtCEihu+Fl+/oFHPM/YEcKnp'
-             b'6gpCkCf8mFGODZt2KWeCYpbbWgOSWYiu5gB4C/kBmgEyp4b6WLMnnwmvb7Ld7fVqgVvmdB89YQKg'
-             b'XM9NkLULgrRuXL768ee++MqRPLft13k2AUePjrYX4nloANr9kfxD6up+8qPX/3i1nHPOu9c9PA6u'
-             b'CxcO6QtffFmMN4hq6Ft3+FaYo3EBUnEo0qQXLNFObYHZEx9QuPIIQqz1wfgwgykvISRe2M1sg7vI'
-             b'xCxLD8PvXM7mbFribG8Y1WJVUQZWKmqjYoYocpYIoc8OTBj2XLl8gV76/Iv0s1/8kqHXoO6A+N/p'
-             b'6RM+k3jKxgEXlAMRKcsBy1QMXv+r1+k//N/fp1sv3qZ/+a/+FV26eJmWkEZy8VcfenUsBAEOUat4'
-             b'zchlBxHMN/IAtN7nPXSG37PlZs3NyAOsWuR6hXf5v7pS4pvREIWGFWveiUvhQyHrpfd8mCY97HuN'
-             b'JQa4GCRM7NSx+uBmwAWeSiF5BIMc7n/YT5Me4hSEt7DRuOdVKvTw8MehDGUAXieUApj64LOwuwNz'
-             b'qZY0XyCkoREMQpgDGx5pdwWMcjQ1UO6zemLP8Lfh+Rx1VzA3oaF7fOqfY5ZPUq0UUXkbSwz1Ogt0'
-             b'LesdFB7uNdJ/m02n6nuhXBUzqldiLGdCwO8gPWHs78EBiBtZQ7HqJf0ProgdqCiWK75Wo50RzU7P'
-             b'mBgHPgBuB8QsL9O1Ah8Ad/ZmPpeCydI3lYOGhpuhd2qLKwZEkEzi94Doxw6F9nkQUIyG6u9vtsfm'
-             b'6gceijNNv6kJfF2kozOPACW/OiGVYgXIDo1UKyl8kOcYLHIZZ0FZKwJCtkWq14P59mwiAE6kipv0'
-             b'Z3fvP8o5A06tv+fpnty/cOkdIE5b/f+5lv/U0O5u1X/PSwOAQB4mdRw93Hv7R3/zT1qAl6vAUx4+'
-             b'oDCneeV3XqPR3g6NT0/FMEcb+2madDGtcMfuVJbGrP0FTzYs9atEW48pEV17q1DbXobFQ4YOUXgw'
-             b'JYLJC3tdTE5MGoTqwCx8nRmuBEn7yydGnWnPTmocCVvvZqNzOXo30xctPI1UoeBE6RBUymQ2qY+P'
-             b'jpgox2EjQU2HTE/uoFcf0p99/9/Tv/13/46+94d/SH/4ve/xb0BQjLgCWYKfTEBBCzMvUSlmeZkU'
-             b'0KKO+qU6VY5NayhmIx+Z9rXI6waFrwxgajP7SdcLgUXLVGDw35lp31j882Fuca7aGLEQzjgbOuEu'
-             b'lzNaTE6ov3udWz1eDXHg0VrRiZAbkKgkRIbn0TSAE5Aai2k6lAslJsJtsOylv9I1QGNRMNfDnOAq'
-             b'fu3i7iixzVzeqnodgaYA0/1oZ5/vD6BUWA/kMCfpAHmvHtvW8NjeX9YiMeYcvrw2Ei+fmJEEuTmM'
-             b'l1Ax25xRkI1YGnO+g6MGF4PqPAEvzHQ0ApDQQX8PjT9bQPCU3aXe7gG1h3vcqHBiHa411j1FyYgT'
-             b'CvUyTfxAjaDIWafvAXGSX9tqXktwOWvD068s/bn5wvuO6GZr1lEofXDZ8RKeGiAHsnGVkzhnXrMw'
-             b'aVA4DBwo5GqDqaCLsnGawkkVAdlUyGR/NUaXHTzNkhhvz2C0n36ukxsIDbrMCZbUkGuyKZg1lvho'
-             b'prPh9ORMzidXI1XgGt34/EtvwHGxXhRuv87jK6dibr+egwYgfXBwKL/5V3/5T04f3rndLhtyqfTf'
-             b'umkC+/o3viGToel1dYCGsYut8E3yI+S8wIQik/dhesLkDCdByJ8EEgzcHJA6mWGfyEx/L4Y4HKHK'
-             b'tiqyNw0K4hvhp52mfzLtsEbjribHNH58nydykxlSeFoCaOxmMU1RjkGaYL/52jfol5/c5+Q/gzBx'
-             b'yNz95DOazxfMus6qPhDN0jVD+M3/8b/97/TuL96lf/4nf0Kvfu2rPN1ygI0X0h+fzaGgyqssMp1N'
-             b'gFaNvARyFZu4pMcGMiDGMB1ZLWvBFrZCpQebJC+anbLsfc3v3iSPsjYoVK6FQi1hdDHvWS01j5uM'
-             b'qlIDJSEQZk995jV0MtTOtsylZ3MaTgBkj4dClASk25nSZUtn/F6gRliRVGwSJcqSkB5njiS41Dyt'
-             b'JkdsGCSNj/IjdA3QG7TVpVEJbun3YFVVgDyoB7+hTiy/czEz1QViNozDZ8mmkECbhkv2PXWeRSaf'
-             b'udq6Gg8NdOqNt39OJ2djJucxspTt8wv2wJffAQVHxff47v5Bet2QO45zZgGQoXZ3lB5wwA0bUBTA'
-             b'/AGOi2WhE3zg94/vBXgWAHGZT/l6QDkBlC1u6gAcVzTZ/3XxRePBTTH3Pum5rSsmNzY1/EsgOOkP'
-             b'OkDUlFgr2nrHPg8WCGRnAt6PzXomslSVrGaFgK3QcgEnakRVclM33DngYSHESv0uqE75VMUK/x4n'
-             b'jWvkcyQwQXc6W/AKIAc3kYRrIUb7pS99+c1WaqxajK5tv87lC2f5fLPtAJ6XBgDEK5i7/vgv/+y/'
-             b'jPBzb3cUchev7a/+1qt08dIlms1mDfRZmf/qwe/yZlqgeGj11+s5k9eKoi0HFR/isi4oeOreSMKZ'
-             b'Ss6ETS+RvzzJVmb6oXAhP37tWOZqvp+uAdQfH+fHhjKxS0KANOpHmeDOLHqJcjNSxg11SzFW4Qmq'
-             b'EALX6dkZPTl6TNdv3OLrgQYHsrPTdAj92z/9U/rZT9+mP/kX/yP7CUzPTnPRjraDD2IYC1QF64ZW'
-             b'msy8rZ5zcJEQIotOuy46aqELop3I+FoyHdsh72vnNoNx85GuhEvsfWHvG45OmQ0vZ6ylvtk/F5kR'
-             b'zjwIVz2VsNjBesKVzAPAdgZmNh0OpxEkA9/GUjSySU8c7bpdENpkiwtr282y4tQ71ro7xwS+VZpk'
-             b'2fQoHd4BTUpc0QYhTbgHo1fmume5JPbmmGbFlU4bHKQUtuhX1EjSfPEVjaYMqB0hjfNge3LKjo0N'
-             b'SpM5N6o9LXM/gihUWIYpVBK515wkDYrjpdpJk6yKYGz10he/YFCTkARBsita1Bns8uMC/kduwkb3'
-             b'/eA6AF0pvSbzpceYjU+ZZOnVRQ/3qK3VshOikUtDzPAsmgivzRTLfUsJwtpUot932ghAusnrvtWa'
-             b'zaq67B0hRRgrCtwDhhKZuoQRGmJrBLVKlhUAF2w0v+pG5Cz7w3nlbiBpcEZttrxuZHo1WoZmW+b0'
-             b'gy6R4kVqvh7T2XgsmRO4Fprd0ekNx4cXLr6fbha+H7dfv/kvNopLdQDy1+0O4DlpAFBnU0e9+/G7'
-             b'P/92p9MSspIG6mBy+PIrX5bCaWIpmxzVzxvft5iNGZ4EQ9vFIh9CMazVggZFv6UHqvp+Qwal+3SW'
-             b'+bHbn1jrso6cD7sqQ+iTVFx7mFBQLKqKoeDeoK/FlrgobDZyGEh0cJV5A4BoMZ2ZXWvN+lbPcgzB'
-             b'aapteZdNccTvvmB4FLvrogVHuJIPofd/8TP603/9r+nOJ5/R//Q//y/05S9/hcbj40xMM85Czg7Q'
-             b'AiHOgBJB65Xh7qMG2ZAgJd4kkngLykL3vKSFrymFpJxPkH0TXH184s/PJmd0Ar10lGwDsVb3st+3'
-             b'Ri7Del5kfVQT44FSAP0Y+siHKodDtQFZT5iBjSe7TA0k0BDwAZDXgB1swQY2KyF+eVkLOSFc8D7a'
-             b'0Bm8H2tDJAxiNkMYvjZCJmS+hFdfCCOEZmMfXZNYRDLqHHwAnKIkvqkR8dljXvweXDaxUkpFnpzt'
-             b'3ogaXcvlKL2+jd7/KHSmoXeNQB55TwM3CWDKDxCuA+dLXRFwdG7RpbK/I01GqMQgC4RIft5CPkVz'
-             b'VXITeEyDnZ3UOC2U7Ik461Ve54jpjk3mdfiP3N7GHwnsQ2CJmZZuGK24Up0AyRwd5ebgnhgOR5rI'
-             b'KI8ZbB9PRS7elsYbXEHmC2h+BjVfQN4HNr4qatSF9HmbpNflvX/dBHglLqYPJJ0cnwmhVu8RXOfV'
-             b'qqKbn/vc+6Nu787seJtPf27FIt1Dd375EV1Kw5Dfyiyfj/d0sLtDDx89+NLpydGtnbZXdzkJnNnf'
-             b'HdHt2y9wGA9/sEsJ/limKZCtYL3sB3kfpx9idvpHwS2MFLXOED4f4OoTz/tFTJ9QA2BfDKKTmutk'
-             b'WLdhJNJHsddEPyAL8CkghlpdhidxkDJnIARdF+iuU02JmpGulkFuO/PdvT26/bnb9Pgnb/FrMwY4'
-             b'priPPvqQXrh1m+7fe0hvvPEG/dVf/Dkfjv/Dv/iX9PJXvkLTdD0QD7xg9nTJDoOAiMNGkAZMK8z+'
-             b'Rvxr+vcZctTTtcOkhQnLkWTG8/P0bO/CKEmRe5VKeXkSW+zUwKV2LXZZR28+vriOg/T4V69eoUcn'
-             b'78m0St6Sb3TidcxgFxhbtf4x5AnZq64e+/Qu3iPspKsN72Txd84CYBOZJcvIGCFR5Qib4ADGxjoH'
-             b'xLK+GAShkcD6YDMfp+9Z816afQCCdD3tTj+7TEZlkQMNyc0cEv9Kn6V6lP3ujU0es2ET3+C27Y9R'
-             b'g5NcHvexUlAzf1VXaoMb6yhauQk1f4Cd8krZpedmK2TI3MygnAVipd8IG+AqVNnSlr833V94zbBS'
-             b'xYSP69Lf3WVnvcXZlBtbTNCsmBjsEJQ6BVsGp0dJ07vLS1j5Pd7YDJqqpy5XZFJOqAdgnMSSSrxv'
-             b'fK0KjeYWfb7jECXPKA0Yi9ipW0Pojd+gSZqQe8IHvrCmVHkXwcwEqcoyVdwj0kgVGo7kRM7Y9KLI'
-             b'lsUuNzVZ/69nEcsk0zV7cnQqcUR63oB/AIOkw0vX3vLpuq6r+fZUP6cvNHiPU4N1+ebt7cV4bpq6'
-             b'NL29/caPv71OBzLywhebJSFKEzDuK2myBYQMI5KoExezzNU8xJjULSZhUS7cztfSKslkJw77EURT'
-             b'7Got2jeQWP26/POhtgCNFjhkk64Qr5Bfjuk4xAZLniSLXQAGmRItPpd9AGJj76kjboYXOc54Qx01'
-             b'OjFyIUv+0p/9zes/oB+8/iMan01USVDQP/vv/5h+91vfgXeCTHCW2odi0e7RdIV44PTzlkanTnQo'
-             b'4gJli9EKJj8uqmUr796N4Wg5CxKuRJqKFrOsrdA9rZz50WxXMjkLhed0Ms6+Kl4hVYG+ZerT9F1B'
-             b'TWz9kCOCA0PRgIBXvP9v0Rz2r0B6LL4V79Ea0i4ha+GgD3r9JShJbJCBFOA6oXij0PKue7NRuZ/k'
-             b'uYP8iYZkPj3jhgicgRgpy8j46bEdrmQ6zOcTRm5gyhTs+jixDzaToGixgOaPo2x5mYYdIzDBGtMs'
-             b'p5Pmp9KizdN8es3Hxyf0zjs/z6sIZygSX3KX7+FKiZQHh/u0MxwIGmKhPOmvznAnfWa66XO1VoXF'
-             b'nGYTkcWOUiMK4x2QJ9EggVvg+INacOMt/ZsZEAVTfD4leODYZl0DcQYAiStk2XK5sBpzRKyUY860'
-             b'cGqSNU9Nan840u8UsiO4DYbYhcrkuJpG6OTPXc5R8oqAyf1o+Ru99No9B0FFpQYYH8XMhyiHblGj'
-             b'YUdDgXjr+w8fCPGQKN/3WEZcuHz4s6OHd4RQuf06p/V/QffufEav/vY3thfjeWkA3n3rLfrkg/de'
-             b'K7MPvbPgO979h1hPi3ygp09oN00owXTSTxVhSYaDXnwwGNUuZVq4hAMlCEHmDNQrWTkM1PTDUskM'
-             b'QuTQn3QALGZzGi/HNEuFaP/CIfX7owxDQmaIYtrS+FYXQ57MLObXDE2isur5CONmInLBdpbjptAk'
-             b'/ny5EDvfku1ul/R7f/AH9Du/802apkMSGmtM64gCXoWSdg6v0+DgKr+O9fyMFkcPqErPt1XYYeW5'
-             b'mOAaYELG/lV+X9UI+pHvxF4YBCiDqJ0iIEqzpLyIQRHLBkeuoZF3HEUrcT/K0s85uUFWC9qsFd6r'
-             b'U6KtMWSKxrSHwjNKz/nJ40dM3IuKyoRY57Z7hsVFk42ixpC2egjAMwBEMhgrRQb9HecLwB+Bm0Ce'
-             b'EtN94TeaCC2ui7o8ybbScBhEch7H54IM10mTcqtbs8fV6RHIlMHLsaBM4gvW+EWzpKkh80wapTob'
-             b'wGyYxQdf5aPGM6GYjW5cjp0uMp8An4PrL9ykwWiHpuNZdrhbpyKKqX692khjNJnw74JZEtAgqG4c'
-             b'+2Sk64i3C4z/9IPwUpDQJzHfycoWjY02cIdhcZYhtvi6O9dmBKVagUAoE7mY/Wz4sdC48vvE+vva'
-             b'iXE42uX7bTIes+kTe0EYedCMu8hngl8MdfPAqxjvn9JZFKzZxzqnJys55VcEwwKi08d0ytto3LMk'
-             b'Kz40tHMOmTL3R8liwFO4cfPWJ1duf46q+Wx7qp/TF97TN998W2Xb26/nogHAwXPvzqevIGdcpu/I'
-             b'5CtMLlcuXlTWdFSJl9ODHnKcFX8YR8hmzztjOfxRKM0kJeYo0MLuosxItnSxymxZK51kFc7GRA7S'
-             b'ySwdjD99/y364L130wDYZX309du3aO9gn2yDa6x7Z4ZCLigMHPMkTbWkPq8s1HaPiwKugRDG5Bs3'
-             b'VVTtfcH8BBTDb3/rm/Tf/bN/ykWx4iLXTod6+o6dS3Tp5gXq7F1IxbjFDzvcucCkrsmDD9Pvn7On'
-             b'AdCLmNGImOOHs++hk0PaF75m9efrq+Eq3tVFXRs2M7kxCBilc5Wu2+7uLj18Ms4RwpRlhyrp4uIV'
-             b'VMKlPguZ0k8ieUvfB/JfP90TeMxWyZ60fJ3YYa7bz1MvJml4BjDTPH0PPAJKxCSjKLUE9l5NTjJx'
-             b'VCpmVXslpL/YaUxXNE5lYkFbHnyrkChl9VMUPkP2tldmoymFjhnG1qJktsGiQScySoBFLQczDCKN'
-             b'VCCqEZf0swu4FoKfUjjdgWuToM8RD4pnySuS9LsvXr6M0V0IcZXwWXo7h1R0hrJeWs7TtWulxsjx'
-             b'9e2mphm6f1wnXDe5lwvVXVXZUyPTFOwVu9hIu1RHwSrw42AdBdUJr1Y4mCmSXB7xzEA4E3gKpOx9'
-             b'a1PNf5+TAnNcs9l1uyxHzeRAr6Q/bYhy+rT+PwmZkpchE71rmDTWCoagF57XiMrt4EYnXYNVuv7z'
-             b'+VJtpp36ckSCl0l6De89+OX7Irfcfv3Gv9iCebGkhw8eSk7H9uv5aAAO9vf7aaq96m0FrND0oNOh'
-             b'fRjDbCrFj+XDxgcKtNzp+3oMmcvnGAcJunsZU+RQnqXphsmB7U62a1W0T/PmVfKTCqYsIsVoqHQi'
-             b'H7v78Ud077M7NB5PuNh+/evfoBdeuEVYW5SdHhdeduSDpzgJIc3pNBHUKCWYr6kJjfn3FYo0CIoR'
-             b'eKIKqZkZpom8Q4EoQ5YchxzExe/Kpcv0X/83/y0tpmOecDEVrdPB3t6/Rr2LN9JjtGmTcw4crdPj'
-             b'Dy5eY6vk6YMPmJXPiggzXXE1JOueSqtjk2JDQ+X77JhUwpw0SvVOw9Ye5iSEggl52Yu3X6Sf/vxD'
-             b'0dw7cem1FQv5GjtuQdNfmOVwphLyegfFvcsRoHPq9Xs0T1NhPzVLiOpFsYU9Lu4JRiFQ6BHug+UO'
-             b'ds+aKgdIezkZ86TrgRSsl7pXJuYQROZtFFmfj2fFTnjp/e2lAx4qBlJzH+eaNr+uNgSKdS4F5Ynd'
-             b'1a7HWRIY83X0lFfY9fugunjDWCxpELp8TKEorObMaHslawYsZArX+uLFA1Z+kAYDVZwl0OcIZm75'
-             b'0nWdjE9o78IlOnvymBY0Ybb/ciEGSKvNSkx82DZZszEMsVBlgbdwrYygVbImS4c0EvHabNQkPBPe'
-             b'zYNAmFGQKGFUTKqT6RtRwDDYEvknZVdHU65w41Bt+HWVUWx8Y93mS6GnBps/S1P1ehdFvl7SYzZc'
-             b'Kkn5Lhp/nCOXNSr54cOHtEQD0En312ojKoD0+/qHhw9eevVrv8S6Uhqt7dc5jP80OT2juA0Aer4a'
-             b'gF++//N2agBaTOhTuQ2sV7vp4EDWdsXmLFErR2DSXoxtbhSgCXcNAhQb/pDPRiv4sDOBi0QWxKQw'
-             b'r7ot37CybYDaeB6L1Ey8/tev0wcfvE+HB7v06m99lV588XO8BqgqQSngDx/xWGxTX/G/j4+PNNHP'
-             b'wl1ibStMFiBkUcRFJhw6JrKt6eUvv0o/eftn9Nmnn3KscAjUsCUO9J/+0T+mXiqI88mZHFUwaUkT'
-             b'f//yCzz1c1hJUdiymUIqsGgCOmnqW509ojA5FkkWG7xs+KDljMJNxa8Lxbae8IIRIGoHZNfgEngL'
-             b'wpGpnbXjMehE6piJjun39OxED1xVCQTdt1JtWqNWCrLndZVeLZ+VAkU6cPEXzSpuAKEXj6kAsI4b'
-             b'bPWWrEacdpH4cxDPIJfEa12kBq7VXvC9s9wssxrDqdM+jKNwcEddv0TNmuBVgStzIhwjUOnycj5C'
-             b'auLavR4Xx0xIRhEunGriI0+RTDKkKpv6eFeJVM0aQOzCfaP+BFnT+FjL0PDPIHcePTklAa5EOurV'
-             b'zClP4yHm1rHX66R794BWU0uyTI0OHqfbZ44C81VgB9wb0PjkhIY7u8wnmU/XPOGieWIb38VCiK/O'
-             b'PRVg4A0WMtVEjXWJgyJsfFFEsRLTTIZOmekQdSNBdUQwvoAWiOyRcnPpM8NE1kSP7t9lXoNkMdh9'
-             b'mq4I20xr6JV95oL6aig3gz0fXGzkc1hH2sjG0MLPq6bg1I7a0enpiSSNVgW/z8JtCbR7cPGz9Jqf'
-             b'LPlabQvU+ZDFSrr72V1e47mtBPD5eV/v3/msmz5VpUht1EEvBA3zUF94p8U9HRSAC6so8HGsLeCo'
-             b'D7tWC5yN4oCHXacc5o5lTGA5w8HNHMDqA6BSsxJPD+/fpx+9/jd07969dIAe0ve+95+kx+7wB3+5'
-             b'rDTm1WxIdafthBXsgh3uPmu/5flLoTGHO9LdvlOiGg4pX7Tpww8/pAf3H/HNHo10pq57o0GfvvDS'
-             b'5xll4F13SIdSen3Di7fS9ZBDz5IG7bl5Em4BdLOtwX6agE+zBBJQebDvd1FZ05boJ7ZFQaV4UV0Q'
-             b'DcIn57Idbh2KVBOwDK3BdWATF5LYX4Gu68z4wjdCWKK44MVNDnPNkxegakzvKLqdVpeLSUDmAn4V'
-             b'6/3FuTEyhFvxmgiyMxDJ2t0e75C5ckJmuphqcSjkkMdUupasBCOURy2u4Alk+N5rsQ2ekRSZ+JWN'
-             b'H7SD0YaoYA6AyTFDhsjZkcFY/4q21F4Atb2yDa6O7P2Rnf69e/dF1mj9q2LUghrIaoBXD0i767SZ'
-             b'QCuBPCp5TfduTE1se9BjqBuvG+9TKz0OUifhrwCZ5Xo2Tf9tRpJgWbCcljLuU4/XhgJkXwNtVPGe'
-             b'45JgFQAUIKqp1WY5Te/vhuoUTSm0vJ/XNTwQGjI3RJ7ohbOB9zdQzPv4wsk1ttTGwtl9Y7uVqAoe'
-             b'JQMDOWmL+6M18YaiRPUryCZE3qy2fU6iRGN9NpnkREVOq0TDugl049bttw8uXIjL2Xb/f26FolUq'
-             b'urVtsJ6v97XXu7BaTIeFZqNzOitKV6uoffRtN2haYeeURU4qOQs61Ou+VUcMkfFHljqVrH1u8dTM'
-             b'+6S5eOBjIoDqANK4t/7ub+ne3XtsX/tH/9l/TlcuXRDv+bW4mfF6IqqKgA+YDRdiHmJDEOMTNSpx'
-             b'xtK2g1MLRMzuQTZJiVEKbvB7H37EPu8jMLc5ZSwVuUrGwz/5539MozTVLZF2mJ7DOhRp8rhGFSb/'
-             b'jZQtdm/DwZh37JWkn+IA7gxpCkgd/0X13hJ17NgOFtatleajG0+beQCQEGroCg7DSoETb2ZDysCO'
-             b'ynnwalnMB2c67Gdnp5llby2DkQo4nEgR8SBpKyTSLSlwIvcKXIitYVqm61OlotAf7jLiskrFyrVE'
-             b'x94GO34jhEZA2AGKATx7vi8qVhQEW747W//IVIq/wKsAZM0t4UrUBmIw7fi5YNXDGyZNC0Txh3si'
-             b'JtDusJ8tb6uNrGx4p8/SVa+yTqfID+U1wFMoC9Wqi+ga2+kofgb4TPDvd16RFpWhKo9EkqulCF9I'
-             b'0z+aZSY+MjLRSgV+h/qpAQYBkG0R0utdp+ffSs1zt9fl/fViIrA9rieCpPBcVpN1/fmL9WTuMp9D'
-             b'458rSSdEA8INGaSnHRgLzWvGP3gRdawPEwXB6O8yubPSbCWnnyFPU0hbHfwA9jJyEHIWhipLbH9Y'
-             b'EVkLJ7zEWKMqxrMIgvBwOqbLxtxyf+mzjDn8ixQZdNy4jE/PdJUQNfqgYG+Ay1evv3V0/942A+Ac'
-             b'v3D+Pjl6IhHS26/npwG4fuOFS4vZpDVqC5zHBYQk+QyTlLqNZiY6dm5ILoPHuUyapNx24oNHSGhq'
-             b'4JNd6SLLu5AZb8BjuzdgqBEw4mY5o5/88PU0/X/Gsrvv/uM/pKtXr6XDcMwTfdHuZV/yaGq1HMUi'
-             b'5x9rrdUyNPv8a7HRWPe8aJTGxGeVgb2GshQEJFhWAUfyrunC4T69eONGKkoL3tviCO3uX0wNza4Y'
-             b'w5AcZmYIY3rvpilQqztC8hLF5YmwqWX3IU0A+xlQI7I25EmPvel9nUOQ5Wf5kFRRYNQsBiUY8uEa'
-             b'NnSwM6C26sZlterzpdBNtKxgQtCQnNgwCVKi10YSGTFFggjU391hFIAnujS+ogFqg3XOufUFy7wQ'
-             b'i4xXudGoWxDaNmoOlLneOj2y4oKlZaqXB9cERk+F8DFgo4wGsZeutyso2yBzY6U2tVHXHIwAlEVt'
-             b'bWwufFr0nd4M0ecKVk/91DRvqg2K8LMbZaAbaqRPXCRpyvkwoyEUq92dUWps072tpNRKoXD8qzQz'
-             b'cm+g+EMJguanVLIfJHscfLNeSCyVj3lNQ1RzaJpQrCNTK0DLHyX8p9qor4I04kFft8tpkIoMIKo4'
-             b'iMd/cBKQNUEqYWpWRlDzOEvrdPqz4v/gFZmxbQGinPl1mjJCERr77+yDYeZb2sSz74jKBqNyjWTV'
-             b'0FAXQfKZ7q2jo+N0z7Vy4iM3uukxL1+/9c7u7iEtu9sG4PwoABiUPt1aAD9vDcDH77976HWvLAVa'
-             b'IMf+cCcdpB1agUCkxMDaNU7kfK5yedLGwTyfzph8hN0syspqLTs56MjZ719RhsATFODpFk3Ojunt'
-             b'NPk/enCXCU9ff+2bdOnyZdZCsxEwT2OhDsIhSxd0OQIXh8jRgzvp4F2phr1O+xMpX2hEA0dVJMRc'
-             b'FGTlQTSezBQ61sk8/bVKB/93vv27NBj0aJoaH3QIqRTS6MLVVJjKDAEzaaygJi/NBjX5e5pE24PU'
-             b'MKwn5PQ6cDEv1FeBbOJ0OX5V2IjSWBRET5kimxzLcg6M3Gb/FpQ5v7+3l4pAixENS3UjZ5n05gQH'
-             b'2FodGPUXRyfICkPQgPtT0Vqs0pTf6zCqgNe85uRAKXrVPDB8HdUAiBuqbputoFfgTDiTz7mc3Bib'
-             b'oS3OsQFO0H/upMJYqVQMTU1/dEDN/PHcTGqzk62IizrzwSm0IHbMJiv1mSNB6gYIebvTqGEjQPqG'
-             b'PBVTz2Q6T0VoJSsA7TC9i43kO6foAHGg1f7BQdbYoynCCqy9U/J7jcYpKokTPgQglfLrTT8HNAho'
-             b'ARIXhXHfIIlqgYwNnzyD8xnv4IZEApqwgil1NSXeHSBlztX8ivj3ktope3YJ1KRLkkhgOACaVbBr'
-             b'og4gM2oDg5bBqYokxyvZ5848J8yYqiKF+eV5V1TbALv6H7LHRczfWWjI2IqmaCaVD1CIsST1hqNl'
-             b'eq3v//KDd7VJ3n6dxxfO3yXLSrcIwHPVAHx259OBxLxK+huIY5DxDfs7esiKna9ztdFPn3kAwmaf'
-             b'p6KIItEdDjkcyOKCcbhgKowqIfSqXzZyVzsVh4f3PqO//9sfcAY61gGvfes7dPnaNb7RSHfKPtaH'
-             b'Pvu/q8Ur78ZL8QPHdDlLjYRXyJ2ixYdajHCwpSnVrDfPz4nVAmnyX6fR596Dx3xYx5xBEKnXG9Dt'
-             b'F79AS/ZpL7golYBDWwOJZFW9MzcMDWJhdjHMkamB1RDrKAoA41VIouKuWCjLvKvIibrXQeeMfSci'
-             b'YEnRgUCZo2CTqlOzFPNxkEA7R4vlOk9ctvuurXHlt7H7YBTko2hEsSJvoEzTaavXZ79+Rlh0KQ7N'
-             b'+nBvX1YiuJyFICbr+ZKNclBU2N8e02W6DzqjIS3HJyr5CxkHIN35c7ZBJfyBoM+dnyemYQ728Xld'
-             b'gC80l4DJ4TchoVKU1zr8s0YyVbdHF2qdvC32+TcEtcLVe7SZbmirJq+qDHak80WNTpvZkDUA0jox'
-             b'nP/Fl19Jr1wIhkA24PqIWGPm22+ElV8xO9/zfYugHzbtSf8NzZblbTCOZv5EvlZnZKMo+PWvV9RB'
-             b'jgSlxiG9H+wzofd6tVmmx9ywYmeOYCCLgtAIPvVH5H8H8gDUoIPPftFqJEcLaRbPFPkU8OIovepU'
-             b'rEHQZkqgKPXSIF0r8T1fUrc/0ohwUuVBzFI+Z42p8o7yW+VlH/Xw8UNOlxSysgQt4f3Y3d+/85Vv'
-             b'/M6nnJS4bQDOa/xnDw44odJWBfB8NQBnZ2cHQo7y1LLDTM1OornvMXS5YQgXEL0QAGXygPTPqxl4'
-             b'UD6/V7c5FnX5InMHDD2C1O7+3c/oR3/9F1RwQE6bvvV736WDS5fFCEX3ijgI1+s0b2MvHMVpDtBk'
-             b'r9fTQh00l0D89SWFTrNxdbIQQpl6v3uFj/UkjRkyLeiTO3fpzr371Oq0sjEMCsyF/Qt0cPEK7/Nd'
-             b'0ebGor9/WTzsG7tkY7ZbwqDRrXm6Vic0n64dP29FHDhhDhbAmqvQRA3UD6jmVLiYTXdy2VSJoK1B'
-             b'2EAnhjwZ4neB3LVM17DTbWXeQTbAUQkiNw4+sqpD7GQLsb5NhWu9kR0xwbEwPY5re8588MwsnwsT'
-             b'vCXvO5qCwe4+Lc5OWE7oo8Lp8D6oJOip1n7HrM5ki2COg1b1iE2eQSJmSWF5pxMw3jM0qoUTa2VB'
-             b'lWMOh2qVZYMUGLlpMsN6Z7HF/OYYtB5rT30tYlGjhVnel17rJ5/eYUMomZbreGJ7Qcqg4WK2Mxqw'
-             b'XHW1sShrzw0mCJRsy5uuF0xxAGej4DrfTte0Q5XGJuPaCToe1eLZ0BJzatTpWgs0Gg6s32CEBR4G'
-             b'ZJVYA6DxYp+E4Jn8KBOyaUEpXxtbL+GznT6d3LRlhCrfj8LSn89mfGszgTQXa6WS6mch6KLH24qH'
-             b'RB3D0kLLTVB0jj+jVcyyBJfvjKgZGpJqOZ5OxeAI10xVIbi+excuvz+fnM3PTtZbePrcpn8nvJXt'
-             b'1/PXAKTivecM57P8+fRh7/Y6etBIChcIcTkxTU04zDo16j6QctiIFFDeKkaq4WRNuZtMzujvfvg6'
-             b'/8wmHU6//bXfZtOUeTocYx7zhCVelJtsklPxIdUWmJNkBwsUYDafcYcqU0mhITDOlIuNiNPGQaN/'
-             b'5+Ca9M/v/Py9fPCwq+BGPO6/9e3f5RwC8B44yKXVp6K3w17pTqd/+JGzkY5rkLSUX4ACyml+ZpSO'
-             b'sJVNpUXYyFeuEU2rU6lKq6KuNIKK5urdgKfM19e9Kqa7quECCNvZdQhsaOQ3MIYx8h1lmD8fuvCk'
-             b'R/qec7VxEjghMPvBPhn7+/T64eOPVUin2+Z4YCgAAgyOStnbLtN7C3Im278qCuNCauTG80w84PwF'
-             b'c97jnfcqN2bL9F4i7rfgYiH3S2SVR6T52Rnv/KEs4PhoTURkWFJ3ybbLZ3mgL58Kx4kN21nKaxhS'
-             b'lKrSkB8h+cWaJ8pfs/lC52BVrXj/lJ7ONQrhzs6IIXisAqJOxzBL8m1tWAKsnztMGkXxw+oEk3tk'
-             b'aN3sdoWbEDQX2rsm4S9mqSb29fDqwNoAxRGZGmjKKvveEDR5syV2z5QBEFpovDAUPPiwBG0ybeUQ'
-             b'zRLUzIaKUNslIxMgSLPvLSBJ4XuLlKqy0LO2LnZU1uuLBoGxuQqImZcZc/LnwzR9WtSwIS9oag6v'
-             b'XPt09+CQDZS2X+e3/z89Pt1KLJ/HBiAdGpsM0eveNJIeWOkQ834lkiLeTZYM/fPHFHChBgHZoWJu'
-             b'XwLVtdmx1cU6iY0biXRYvfHDH8tOOxWIz33xZXrxC1+ieSoCUYtmtBHel9pgVKT0fkYDLKqUG4/0'
-             b'QFOGlkOtdeciKtG9ma2tGnM7bXieSQUHfvOztaN7D48YpmRCXjodsYbY29unV199lbXvTH1KP94a'
-             b'7VMo2iTa8lqFFWOdwpfLObPsPYe5dNu9dE1azH9wOY/e5flRFhOKuHiqnQJdjcRYSpvFvxQ5L0En'
-             b'ea9ZDdrILRdrOtzbo16n1OYk1IRBm3TVbQgqCLjWSYBRqAlzINp1h1T0d5j9Pz475e8VkqhMZ6EQ'
-             b'8gPvmJU3UDcart7Hx5okmSPrId0MK5kGkZ3A+nV5/pDGofkSXXpkCDk6/1TefV5nRJcJf0BcJuBz'
-             b'pCYWxjqiBIzZSIkZCnj+WnuqGNWCOcpVrfWUZCQ0NCVCcAQ5D7/DaWSDOvRxcyZqiJs3b7CLJWum'
-             b'dZ4GkRVBO+ydn74Hu/dOr0+r+Th9lpbpQ7PK18g8LMy+OmoxBu/Gqw0ur+xY9kp8fUK1YiUJODhA'
-             b'Any7L5My50x45vUsFlMu2FZo0Xhw/DWpkx9pfDY32EE9Fly9PmOb4ZW6MzbuEV/HR8cM6xeS5miL'
-             b'EeReYMWkr8vl/I5YNyV231napZNmHI88nU6V5GjNgrw/+/uXfnZ2csZo1Pbr/BCAjea1bL+euwag'
-             b'Hbh7DwKxsxc4uZysZ6YjmFR8tukVMxvWDfc7/KGdnJwy+Q8w4jRNatjNip7e0kF8mkwK+smPf0Jn'
-             b'ZyfsCXDt2lX66te+xlBe3mmHvHhs+LTreZ/tanOWGLPNj+5+wlG+Bi0bacWmQUPkY3xa/oeDf50m'
-             b'43c/+ERsY0uz6Y18w7/8ypdpd2+X7UeZKtcZUntwmL6nEKvbhuepOdE5HVmCpuzgUCsZll2LeW9s'
-             b'aNRVxoX9+XwKuV6a4uCVrp4LzpsnPWliX9BlgcbR2h4h1sxrU0egoMHMqbd3yNa648lE9fGU2eJC'
-             b'/IyS7R4UBALXQGsCW/Ai4ChNsuvlXFuUDaclLkGIzAgF6f41NY7DHfYNcCuRAOaBm2KOxHXqeeAU'
-             b'5he0XuH/sshoTXfQEbWG+R5418iOl4ZhNj7lNVTB8LXaQhcl8xDarVaeIEnlpxZ1TA09s7HpXdRi'
-             b'JjdbhqsBrx8dPeKUPCYQFma7KysE30gixB5/f/+Ar2OIG10htPl9xWtBfyX8iDTxr5bcQHH8r/f1'
-             b'hB/pqcNWbrO6CbSKyTLO9FphigO9PwWB+YE+AFUp211a6yVjbg8iBrhhkSa0LDq8dom6O/eFPL7d'
-             b'VuP0OR6ORvw7KDYifqM20GTWvUZdDcq58XntRvZ59eLM2Iybzs6WDStne73cfGkPuUyfnXFqlExm'
-             b'rFKQ9DMl3X7piz8fjXZEgrr9Op8GIP31/7H3Zr2SZdeZ2Nr7nBjvmDeHyswaWEWyioNIqkVRstTu'
-             b'BgwYAvzgFwP+Af5zfjMM2IBswGq3ZdpSq2VZI6cqFos15nwz73xjOnt7r299a5+T/cz0Q1ZEoURV'
-             b'5h0iTpzYa61vfcOLxbPt9v+1XAHYppWyHDMt8chZT/vCB97hdJqezEuxrzB8sMS4lgfFERjQRip0'
-             b'z3adtL/86ksY/Ozu7cro6Ib8/h/9RNYq30u5t2Md7GD1QFWL4VmZ4gJhR5//tGBrstjF49PyH8se'
-             b'zuZi2bTs/LOoUKtPz5m+5x1CRS6uruXv//GfewYz4lE7NAPf/vYH1ehED7z5jdtoAlJHOL/q85l6'
-             b'WAVkzqzvUNBAWyKUiymvCwOzdAuVGY9m1VK1LgNiYLRt6nfNuYfn80tcB6FRS6hMbDDxS9Ol1/vk'
-             b'7KJqt9vGYGybuazyq+xus9RExLb6BdgEpiPYWoJCzaroKIUM2nV6OKyuLonv2DXplgtbFzDC2HXb'
-             b'IffdgDV1G1MdpA0DjGjLO/DkgWtcDjVXwhNvPMtemyQl18XYe8nqT9fir1HISqhrolSJZeKEH8gT'
-             b'SYlUjdxHBqNva6S3rg1WgE7PLyAvdGKpvf32wzu3IS6N0v7Bvnzjm98CWuTXO6hUsZ2haRsx/Gl9'
-             b'dQUzqGqAlPoVkLsWVtMffi7ywDMXkkldzeiirZnW4CveOOXvFyAFgquvjZ/KMDvjhfCtd/tCNkCl'
-             b'mSoFX90bgbiUPzk4vCG1CouFVdXwHqorTNFiKpTMfIjMlVgK/dpN9/8a59u5/eTAf6FPnwzVHdTQ'
-             b'HCN+Xp6fyWl5boHoB6KjVCmys78+Ozv/9Bf//E/4rG0fv/uHNpRK7j7Y399ejNexASgTHgFpK/6R'
-             b'bYGJ1PvNJs47GK9cy0RJVpDAEbbOCbt5P7z8YPXpSqfl1WIhH3/4a9kt06gGw/z4j/5Y2skcDOY+'
-             b'vW4QJ5ysPGmQTFZDnFhxcewr9VBTS97HX35q2eC+rqS+OrgUMGTmAsSadNf/nkY+e/ClXK3WFlST'
-             b'DNJWWPT27Tvye7/3Q6QAAsrXgjffgSwwMkLYg9gqy17XH6uVrUuERKly4OpeG9a80fRmJo+KKBi6'
-             b'X1e5pcq/hMSuQOaV5wZINWMdTM+81tEPWcorqz996Il+s8kIE5nlD6R+xZyl6st1l5yqo15v/tS0'
-             b'sR7QOgnCFEifd3nfFO7WZzWemE9DWuhUu5Y41EICXR7s3okgdbAEtqkwRiNKdvTTdzQoVe18As9j'
-             b'5+CgcjeUkzGbTQGlB8pY/Rcq4RAStyZWZr+wyQQh0B8NVyCODkSHumN1AdRrv17r71/jZ0V+PcyV'
-             b'quGNfd3GpB2yf3jEtUdEk6PNZKQUNl1f0SbbkhLVQ8G9/EO97r23gxdp7whA/ESCH22PA+2juf5C'
-             b'qwj73wYNgqITG/VnUL7JfCaLF2e4Vso/ULWP8XXoCTAaD5ChwEaZTyEqP2MBxY5mADSc2iFz9FUA'
-             b'v8c5CjEbIoDGUR0GKxGT3gwxVlMfS6Ts0xlJNkIzcnlxgRCqAJMra351VbVzdOPJv/qDP/y0dULw'
-             b'9vHKVgCnp6fbC/E6NgAyyIFH0W3tf90HP9DyN3O324odChbU4RNsOVCo8a3TaPCwmYQCp0l+SuJS'
-             b'udKPfvJj2d3fAYEsu+wr2ESh++AVwmUsjGSk+3ZPIom2S4yjVq5OX8hXv/mwPMW11MDRmCvpykhh'
-             b'nQe79gqhGGiiowYzE/nok88GJ44d2BkIxxR5AGoBi8mxHODqOhaq3W/qvy9w+i0/V0ly+jVqGayF'
-             b'EfwJPfw61dIv7GAnXL/pVmCFW+CLG7QQLs/mMmdFvgffIsyJUi142NnWYCUj7VFSjWJ6pQd2EyAn'
-             b'TNwlJ+7MO3APTGmt6XNXi0vZ2Z2aj1O2sBYYuzTm4b4uz//qfE0kRmC9DK16Z0ZFgJJDr1tPVCz0'
-             b'LYsR0paLlUwnNp2m1QINVwR6lMC30N9Fs3t7rRojq8ZTg3wCXWuEyvIPA3VfrnyCDhbFsRJcK7pS'
-             b'4WabVAMna0MWupcirBW5evDgK7m+Xsl8busZI3/Sp57BOqDHldem4TrT6RgrJEk9/yWOpng+ljxo'
-             b'/hGKUEiNxB7Y83pLF13FMiiUwaB6LYKr5bpcxxaeAUYkXBlcT6WHNmrA97KtVjardWWaaAHNI12h'
-             b'XMhcQ3R0RaeoXspV5pi871B0q1Fr53M0s5MQGCWdqgzSlEED4h6au55D6H+P50UeQvDPdepJghUB'
-             b'GWxp9HPVMfPBeAJmrXy4f/jZl199calciC1B7dU8FFm5f/9NWwlvH6/lCiDXbO06wbukqiGvN9Uc'
-             b'dQTYMG0ud+bupul8vi+t7mTcTevBoQSdB19+LqNJIz/68b+S23fvlcPr+qX8b6kOdhEpcCikccSM'
-             b'ez8YmTwWbMoJySYMxXkzCWtxYBCUB8lyIfQe5SA5znbl737+G3ny9BQFWDhpaoFVBcCtW7cZVmgH'
-             b'/mTnoBSLtkKt3uj4iKQTNFQCSnYq0+1ktsPcHSdPrWm1mmmqlGHTOh77oRuqoQtWyyFVRjb8D2i9'
-             b'3Dv1yYB7QFOX6MoBqgJUv1smp4vTi4rm+GSuW4Bukwe2wJ2ZOxFpcetg9SdQ6NUcGENtRhoWz9Fk'
-             b'R9bXl9YYOVeDcswwyCuoXAyVg5X3Fol5cBeL0K2nhTU3ILDhz10iF8Fgd6tdvyYeKqXPeVGKre6A'
-             b'KxJC1zpELzsZMb4UoFs160EG0k29w5Ld7x15JPqa5zt7ZnxDSZ8wrtmirENl6OtPu3fvHtZhio6Y'
-             b'B06UpjSA6qew1mAgX+cQ+h8OrjUQcjAF+9LLyJl2/ZQzANKmsv11ylcmbLfp1wMq14TdtD6/lVkk'
-             b'02lPUxUDpIMj4/2oERCJoy5vTPRVCDz0fQ3oWJTfgMjDCJG9misVbE0SfYUY+kjr4Qs1hRHXL6G3'
-             b'E5fcZ1PgPCjv27PjY1M6tN6Y6Wc0yNvvvPvLN+/dL43JVgHwqh56vyqX6PpqS7J8PREACoqV5Jeb'
-             b'DCa8fg5PT17UQBkfdpM3CHSgU1bvZr3GtA7m9dmJ7O0fDFjucLGVh189lJPTE/nTf/2v5c7dN2Sh'
-             b'nt1k+9tk3hmpiHD3/v5NTvKRhzCJiCiarZw+fSgPPv+t5VLn6u7P/bfnFogxzKQPKcn0N9Cidnm1'
-             b'lt9+9hUMTxLd9kAy6jLWC+pImMhYVrJRHM2FxOcKTzqWjsm3My39RiVeOi3rNDa2oq3HqO6RJy0n'
-             b'uQFpsDYJ0u/5c23HfGJtIIGMITEDYeiilqiprrXcyHuYnjVoZiw//MH35clP/wqs9w2fevKdCfff'
-             b'OkVenl9Kc6+pxjYGmETA/alZijMDlQjoTaPb+/qawBGM7PA/fPxXwrezrhxMxVGaAG30tFAlazWV'
-             b'16FvUlem1eX1Nf4bsccpEY2K9cXbrRvBXxiRBBZSqs1ZrqZH9VnVMCS/PXJI1RsKu/PGXmP0EBrR'
-             b'+/dLSPomZJ/rqoCBhdLTDwyi/+B737N46rQSoWnuTmke9QB1/on4s0m+rsnSOyPISyiWuxp2sGKm'
-             b'02I23gg4JtbqgdynUsBICaM2QTq16T083ZnDvU9th5cLJW9uqvpkNt8x9oivlnS1BlOiVib8fv8M'
-             b'gSCY+6E90INjkx3BE6YokjOUA7k9Dd6fyolwL4YaXy0DCbL0X8T38enTJ2JBlj0fSduhG2/c+3B6'
-             b'cCCl+9ue5K8O/5dZaWCvLrZN1mvZAJTHVfZdr1qHisGL11cLduGElzc2iXckvtng3ZZDZd+MPMqX'
-             b'6KSkaW0ZRi1STUS04P/BH/yBvKH+/st1dfHPdISzQ6YjTBt7n3P+6xOvQtknTx/Iw99+hFhXWoVw'
-             b'So7crdcc0+qol8PQPDXAeOj4dCFPnx0j/lTNhny3vCqT+v27t+XNN++BuW/7fbNIdotTr50gHqk0'
-             b'UFPXVjo9dyBCrYGKTM3OVV381AlP3fSUTKeTY8fGoRKwBDawltDX1Dx7IUMfNCtmFtTFeq0lgVa4'
-             b'GWZOXoztUNcJcCPLlZn5rGNvN4TdbEcvdvVCWGsDdzaQCVrFTsPRNHVVYWC/OZmnQeVv9ZaucWDq'
-             b'okY6G4X2xbToCax3s8wFD0InWlrYgumgjntlgp15miQnyGq7Qz96awZKgd3d50TKPAaEMkXuwwd5'
-             b'87wPbI3j3g0ECPi6M6f2yshv8Jt6E+bcc1RksJoRkgMPbtwoP5dpSkoS1LWRqmFSV4tdCqHKYz1t'
-             b'UobojvslMbpZLZcDkKk1+CWBXYc2mhqDrVbPeqvhqqid8Mh+nyoD8DWdcTawpkG8r6EziQ2lBKm+'
-             b'AtoHqCVz8HtpsAdO5FYoky9xygc3JIYaY51yH8GFQCHrRo2lj0HDVgPJo7hzHtgIO422J3Rq/sKj'
-             b'R48stEvlaDSE0sbx5q2bv3r61W/RbG8fr64BmL713iCcaft4rRqA8Wjy3HS6naW2ienAV5tVDfnJ'
-             b'oEUnc8NTB67VAm5wODBCqtn1OjVATsYDRr9ZtePvvvsNfL0WRicKqUTKpyxAvxpAcnZZpv/DQVJc'
-             b'Nt18KQ6j0lF88dmHcvrwS8sUCO7xrodaw715kqERv+8wXW5U/xlN5OPPfk1pczJzlwEU/sYbb8jO'
-             b'bCZXiyubQrTOtLa7xD+6W1aPBNWF64SspKvpCMl0ioYkTNRLNAar5cbIXmBtM744cfyspL8AJAWp'
-             b'hJORrQqGkrAwyG1HAbKse7ez7dn/PQRve3p7D6CiiBaZvHEyBBn+UZzJbTtlvKYY+d5GcwXUd8qn'
-             b'Uq9aAy1+pjysZiKweOk1iE1vJk9zWOzlrQkwyP0leV5tUEI1PdJ1j+2xxyRfbuTq8kx2D47q767d'
-             b'pr/+aK9KNfCSeuc+c4rs0yFrlG601xSpdNGfqYx1vV4vNFGRaBX28oPwJl3NoEnTBMTZVA407trf'
-             b'PhghjWgfxIauXiveb94z+foskKcils2gTXaLRENrpDJ5FfAE0LhnRd+0ecwW5rOhSkT/VU8AEDvL'
-             b'/2qDdQmtfGfkVTafFuGc5ez0FJ+9GBPivDOtevs1WoIUNNRCnWsGgLBFizJQfcAgiG1iY2RYQj/s'
-             b'uDySOdWwoxilb3I9rLG8tpUScRsigWp+hHyGsbz9zQ8e3n//+6VrX25P8le5BtikLcfidW0Adnf3'
-             b'lg7nZk6NQcz6MTubXOjbzYNFCWMtI21TTd+zD63C1Ao/drmF0U7gJxkFMEZCll78EglVGT9vPt8D'
-             b'fJoZAqQGOjo5687481//Us6fP5SxFuJEEpL0O/JQK1GooUFu6euWsJbWo1N+ki8ePDK2vqauhQ2+'
-             b'r+Fzuv/W21IhDDQM46p6QHHQgzVbhjnqSWMFXolpOm0DVVheWTwxoE/bVQOAh5Y89c9P7BpqFrzv'
-             b'3HwmBbHRi+5gWey6aafYhRCqlCvT/S3EUPkSsB+mvNHWI94VddV0Sd/hdUdDHvfJj1KnbC+sPj0P'
-             b'p1/X8LuMURDNzMQ7uCpuIEdMREw2mArXiE7G9S3vQ1rmlwiEMpgOtXHUXfccWv8ExGK2ezAw/8nD'
-             b'QRwFtNEpeL2syYF14s4DqWQfb1X/PNb3wCSDCl0vrheEr1M1H8r01E8c17W5U/MfbbbAjNc2VY2Z'
-             b'1Do7trUxim6vwYanCS7f7Hku2hxroW/Mccv+VNckGos9alDwEZFcGqMGiEoHzwNtopWbkDYZiFHn'
-             b'+nqkdAoagvWiv4eUbDuaGAdgF6uAXPf9xkOR+rvVREhXfNpEOu0vMGdB6FvhgUi9xQLvQeV9sDH2'
-             b'QCjnXzgClnOqusne3CnLtUYmawMoPboHC/Kd3RePHz58cHl+vg0BekUPva77B4fy3rfel20GwGva'
-             b'AJTJPJmZR5/ypIcGDl3Gs+Y6mNiEt4PD16nmDfzB9TDQfWJareXq/Ez2Dm+SFR4qxBirK2CuSWmq'
-             b'81e3Nz1WdGLO8BgPgN139g7l8vS5fPbhP8vq6kJGnJpCimg0hNagkZNdrlOFDMxuQg+p2wuWLx8/'
-             b'Rc65GhNBVRA9HLX8ffmevf097rpt2miVqOfxwW7RC2LfhusBzxmK4CUg1EZacg4imO7lVMYuPJAp'
-             b'rVDpanWFw3tSrlt29x3PSA89GyyFnvzWJTuAm6FPLYoQJYChJxQGStRm83H1e4eFLhudXMfuiKJ0'
-             b'pc+ToSyZun1lj0cEEUmdnodhQr7Sdmg+wZrWeCH634vFBQKVlkBHWhQxRUR0X62NpPoOqEwuBVs9'
-             b'6fW9Loe6sv4V2QmQmE4N0qfbIxCKxtAReOtDn9/7RyAJL45Lu3VZxYHiEboxVGOdLKmiAoHkieT2'
-             b'18kg7uvLa7m6Whjpzhvk4IgIWx5dE6yyHOzt4x4GnuKwuErtYKrVr17citd1pKE6Vdqhm7tNLXQw'
-             b'51ECKQmT69IUqxWyFmRtOPX1632sckL9e5ByYQSULfupuvh1vStTtgCo69U17IPh0TlifoI2HMo5'
-             b'icyJpAGR/h6VbjaDJZutATN9LLkmqLyIzLhra1SW5flO5ofVaEiGzhVEaPA5piR0hIallYePHsqF'
-             b'RkHPZmw2Ba/1xs1bj7/3o99/Ijlvp9NXNflnOr1uG6zXtwGYTmdrTFEemCLG9L5W73PojTmJKvRf'
-             b'plowtrnfjfwwT5DE5brxcSmgR5Ut7Oxh/cBvdPqNTAXgbl8nEHeUAy0wm775+uJEXjx7XBqAY9HE'
-             b'8hH3+9mNeYKF6mCC6qyoiKeK8aTA+TuAqwMlVZ999gUOSi1S6ty2HkT62sG8MVa8fpN6rO/scWeZ'
-             b'KgQaE3ERNWNBrOqoTx7s7HDDtUsbfI1mvfvHyJMUG+Sjd6jwHkELtIROa00TmX3OvbgIIfmB7U3u'
-             b'J/3AbHtfK9jeOYJBPtKiOQrmC59CX/yDB8zQ18CxbVeGJoVgS6GYjU2+5X8RLA1Ovz6lNaZWZebr'
-             b'5K/3w6azcKbxqPz/G9vJ2+bGVg5wRmxHxgOIpuLA0iKYp4RzLcwpxn6Wcio082H/8BbTEBLWLtPd'
-             b'HUYoMyQnmY0tonCj/VlicmOoiZRuADRAkaqzIjX15TWcnS3K67cpXEmVprLjCE/GO/z2y9d++1vf'
-             b'glHSdWmkQFpTBAEeCb5N75s6j5z29il6g5LNFdMsh5eY4seTuSxLk61TNOSNSrwtRV8dF/Uewvsc'
-             b'k6VTNmZHjIKeMi2D1zXYqc+qauTg4Aau0cZDgspfnmvzXhr82LS9P0HjAdbWeNYkhRiqwsC3/j7R'
-             b'A7FwxUNSNG8lCnJ1zkLJ/WCRB/JMrFr0GjBu+aI0g5XUy3tPPxuT2c4Xz5483nRITtw+XlUDoG/h'
-             b'd777/e3FeF0bgIP9/QWkOjxk8cZHc1/z87CazzBiVQ9z/eDhEIb/OC1/k+09dSLTorXhtNf4ljD2'
-             b'fH1htIr6AmQ3tFEd+OJMzp4fo/h7HK6b2uCgSFZYrSnNA+3w0OTFxmZjG7t9K1cb5VA8LoeKkal6'
-             b'17WGu0tNVlMJoE4tQAc0wW80M5Z66P3hU2ewtkcCWyBhx0yCAFtlpNxRFdBhx99QGkb/tFIw9V9r'
-             b'ZJqq9Y7SUIpHi5lqKxxs9+uWqHQRzLFPd8thmPQXMC1NymvdL9Pp2cVV1dfrz9Hn3mb6NajjnVoe'
-             b'0+I48HkoeashaSvUpHa7btg99wG1VdKnpDNtfCAfTIaUjFWn3pVJWhny5ftG1OdnyOgaeif28khv'
-             b'puAnrxK4xix+mzL1Jkb+6uuc7+/TdrmXfSrKoVPxkiRRAy7oXGddYQ+385XFJIMGkByT8hx1naOo'
-             b'TptzDaEaXIWeO1K+595bb9rrTXRGLI2EojuwM6ZBVpAwWJ9QttitcK+MJlNZrtWNcYzPh07nukZS'
-             b'Eu20TMBqhqMhQmojPG6a6l7ozU6DuOoOfBuF99UgZ7O0qGBtnqAKoP1zprIi9tmI+DMt/ub+yBcX'
-             b'Et0ESfxMlr9RP2nuoUBEL5B8mTwxkQFgO/t79Tz5T+HkagMcTDHj11TpwscvTnFt9DW2YYS/7MpZ'
-             b'9fY3v/Xh0b7adF9tT/FX+HhxclpNwbaP1xEBmM8vzSo0MFgmYFq9urqQ68tzwJprEILMYzzQqlPD'
-             b'cpSYp4zj3jSoqfeJwvGL1SUiUHUaMUawwPrVtdnKLUTBLN9/fXkhz589Kj/3UtJqw2bB9uOZrGyz'
-             b'KA3cXHNqoh1pGLDjxZULLAxoIBKi/2RdDtATlbtFmiA7eaz8h5ocaQHTw7Yy0tuRuKIA035nMatB'
-             b'JzDsuelOpvvYhtHJbCa0yGo0rZoC6bXKnR2Y8EX3nTIO4zWKaVuuVZ3MUTCS6eXFXjs8CMrz1EMe'
-             b'EcyJpjchV7Mm90PIDGfWQnB4eFPuv/m2PP7nfynT5Lg6v4VqZmTWrjp1GuITaqYByGA0YYFjH/fx'
-             b'aj8bPYdYIePOpISR062y+K0wmeUy7IFV+hc2BnPnVCdfzY9YB0dLPPyo4uS415QAqAFVeD9SL8NL'
-             b'oQ9jaoMVRdWMQ6FRGxdn2QfzjOACHjts6QmEiq5klzMqd67ct2cvjoEANGpI5ass3/uL3UPKadgt'
-             b'xejNt98G3wHNRArVS0Nyz1PR6xGaSLi/s2jj8ppGbQAaEj0+m7wFJQGq4kXd/Fpc8A4TuV4/LfAa'
-             b'vIWf15i9NZCSzu47vQaKsEGBob+jNBiLK3dl7OWzvddkrmFJKPw51BWRvq5MRCFXc6r40loDDApF'
-             b'l8xJylAQKDoaQ4dSplSUBleJ7x9zOtAENhBxWMhU+fpnL57bZwnJn7bu049bO53+VhU7m7S1AH5l'
-             b'HIDyRizVgXGrAHh9G4C//um/P5/MdjdlVGh9z6//KOR4cXZaiseBTaNJakqZ/q/u+/2/7figfE94'
-             b'AJQ/15CODL/0DtDk8vrSUt0QgSvImD8/eV4O2RMoC3AoqHKq9d8l/VqiIbTd8EBV5XPn0aAdnf+a'
-             b'3gDINV1OYtMCVor2r3/zCeBnjUwNnBCT69jL87x16x6CjPyQLB2SSeZKAYPyQSNRlcCmB6wW6fLn'
-             b'us/OPNwIzNt+tIkwPNKJTg9l22P7QsWJZuXg14NsoWlu02p8BMgcGeotkuKGEChUaFxbBKIAaBgc'
-             b'WQmVGWC+B+Vr1FjJQ24sAa+ToaNQzfxOvtvO9b3WXbiWVpDO2lKwUisuzUP71bEhoXGLoh26Omng'
-             b'GGCw9Hq9kFEpbub0N2LzZVJQLVDCYqHN0my2Z+RSphfO9P2oqYKxZgtkZEVcyKQ0bDH0dsOwACb6'
-             b'4BLJeqjlXH3mwVFxKWVD7//ckwp1cn345BlWGKORFWxvJJxnAUVn+fNpKa56X2+yBfKgCWtGIJC6'
-             b'E6JXWzj36fonx+pNADQFcrlpeR+uDbHSNUD5/7VBVwIfmpou1NeqEk8jYEq93/V5jaK9dhAE1xub'
-             b'8jXQ6Xph914wBEi/8xzunFM0YbmiKFVcW8OHLs5e1KQLdyZEg1iFN2FA7s29okObKpWjpj6TYSD2'
-             b'IB8jV7NPRwkUrVCeztnZua33Buoe/bzt7R38y4Mvv0Bjsn28mode224TthLA17kBuHX7znFsR5dp'
-             b'dXXQuvNXsmMA7NtgCWIxuFVqrIzd7OlugDjjS7r9nMkwd4/18hirfSvlZGALayEet3J06yZZ+Bb/'
-             b'q45fWsy1Wm7gTtdy3yjVBQ47erqgaYF9+Pmv5bocUlH6+N9qD0TCm05Tpt8vB3qbK+8gcE+ZYHt5'
-             b'D9aoq+UC0LQeNh3z5dVFTeV6E+au69VSmFZXHTphqQmQ/g6wtCGJzLATXi6s6GXauKZN30zpzx2X'
-             b'wj/am9L7nocip01rGIw67odqLVSNk/WsxGCNkZL0III1ZFpwduez6gbok55btgbG3y5LsfFi5UTN'
-             b'zF0+zGgURm4nZrbTmAlUA/dDc8bT3bNPt1oktPlREhHWH02wOFi9XkubSLtuVd6HiU2XTGicTCfm'
-             b'w1ee3OWlhtPsGilP+yExKL0GTWT7PcH9Kjx1MPaSOp/wgzvMxVDjZHPsde6GIpi3gBtHKeJxXd47'
-             b'4UpM+vwmMuTt52phvn10IJPyHi+WK+kJbumlmGJPbRi3Y0z7wQOUAKu3KPJLEvP0ZkfzOBnDKln9'
-             b'N1S3r/eVolD0VcQ9ixVNypUHI9IX4RbrohbS2U35wjWRCL//JuX6YqXmn5VqQdg3+/pZ0wCo4KFK'
-             b'xqaxFV0QckP6gKwmxnqfGYkQwliutnwPUG2P8B6iuXLbYxL7NLxIkzi7jmTJFMAjasfT/P3v//DB'
-             b'2994j14d28fv+qGfn+vra/nFz38hWwXAa9wA/Nv/4s+O/+O//99Ori6eHzSZ9qG6u3bHsdSJh3hm'
-             b'l/1lm+r0BtECMJtPbd/fWLHRwjCf79I0RQ+/lttW81qPNoqBwLQzmXCHbuTAat2aHYY2yL+BmYrx'
-             b'ENStMEFqxgjUcmjq73Q7Yc4JLxu1lP93PFGpUwvkwAhhHlFr4SwdbWDRMCRTODRoACLYziHr7lrA'
-             b'xB4pA1sDceAA2NhsFKgTj0LDFQtCUSgZErjKWcjkTAY6nHW9FtyDcGwElYPDm3L2/LHpn1mcG//i'
-             b'xHhkN2cSL/pUErDuqG/BfDrtJ/vh/rrqvAM8CzzpDSh3GMgN0ei1fZRSZyRFoRmMNT+RE3KZM1VB'
-             b'0rl3hN034Aes1lyt2D2gTYA2WimEHj2ByU8oE/Vez1PkIaTKAXXFmwFF6iATfck/kWRWeOIP5H5V'
-             b'GuqoUOSf+QRayaqVmYb3SKdQ3MO16Qi2KsBqZGPFq1yL2zdvIm43wO5Z2JA15oSoIVHrBaZ7HYUV'
-             b'tm9Hk8G6J3Gtkcwxj1p/Vayoy2Gr03mXKqE1EV0SsvCVeKmIQuJnNllkZDU41PtY3y99HimS8sEV'
-             b'hnsMQCZaGg1F/nb399kctrimMdAhVJvkJlCgGqsDgFQDJSofnD/kfJJItU2bq86/tqIepRHoSOH3'
-             b'T/mes8sLWcLhyBqEECd4jqP5/OKvfvrvzpum2SoAXtFD7+/JZFfuvvnN7f7/dW4A1jlch9HkYem2'
-             b'vzFmchd0/MmDPlJNAtQP9PLyCljefHdfpnsH8Gx/8eK0/PcO2NujMtmNx3ZIQZfMbl9lhQpn+47T'
-             b'M97BFxMjoqXQw9fGLncWtxnr9IauEQegTqSr6wt5/OnH5YRdVmjSd77uYaAHtp7Omtb29NnzGmzh'
-             b'1JaUTTNN3xyqCoLtIqKx7rGjx17bSFZLlWOpxjuRrBbGYG2bXatNocpl0P9eKPytGfCLa3GnU28G'
-             b'QBwMPdxaDWFpLoPpuU9MwLXSktpQcA1VQI26lfp1OXlEgHMJ1oDvXTGA3AR63cM0qLxOtSu24hH6'
-             b'REEqKXRK19+F66DKCe6Z1+U16/XUBkwd7/Ta6bwK8idNhTZrStU4rdn2Z0UI3vgangBYHecZ6lPx'
-             b'iGymOeoA1zqU77HLXPkEIk14vSrRHJrri682zKBXi5mRKTvWdfpY5FBZ/jqZLxQByKH3PcJ0uqm+'
-             b'C/o89PffeuOOwQKJKYDJoGrfoWujrBJJ8ydIaHq0yW6wHlnj/dwAObL3s1OvDV1TlcLbrRYW46ue'
-             b'FXpvcu0SqNEH2VRWuOZuBy287kBa9OeL20iH3ro49N68gTkLitBUdCiY/bQ1Q7kaGrkSp0/vTb0e'
-             b'FGZa/G/s+CNQCKBvyW+rCnFVLwC7763wx2D3yfXVEg6kcdx/XvWzWprixz/40Y+f5u3+/xUiAAID'
-             b'psVqe41f6wbgz/+n/0E/3I8rSUr6FLazFy+kefctMuVNAWz7+/JBnWkDcAOs+hu7t+A0Zta4G2i9'
-             b'VSUQylSiMjvVD+uk3AaT/CUWptjEQfZ8ZFyusdr1MGq7hB2o6b97JKqJxow/e/5Ujh8/0NOSMbJ5'
-             b'4CrXm4agwVAm8s1bcrlYcJjLdd+ZebjpCTWfzzFNKVzdaQOgqEaZbkezXTv4O7NkVXa8StLG810S'
-             b'pBKSCwFXivm0e6Rti7VAB+XBojOuAnNo5eL8DAQyGSS++btgzdRILpXhTQOc2GunCN13g8nZk+U6'
-             b'My7S1xQ7oDK6ZlFGu1kOB6bZySB+NgLRsULPv9cmTKFY2MuG2tCpdbLyKbT4a5Oof6+wdar7WJNI'
-             b'WkDSCEVPC1cDtr+x3Vd67WY7gJYjPRYM3ahhzXXNdH56Kjt7OyiooWYB2Ku+vDhFQJU59CUSPo1k'
-             b'iP+lCZKbGwl99JFkl0Pd92cSDtGEEuFS22p4ADSNxLpmt9ClnOyZ6jVUmP7Nd96tqI79HFUzjECS'
-             b'3cAvwmR9mnSoLnaQuqnqRVdJ6rOg94ey/hGPHdlEuBmSpffpagwNatqQa2McmdlkIitNlgQSUJpS'
-             b'dWBUV8mGPAfskSI+i+7tnyuq5x5+tp6aj3fqTr5PBdwYguUrs/r5CYNsA6mS30BfjcjPoq47/Br0'
-             b'kr6Xv8dhfzRv2dYvx0+PSb41VDLAvGgt84ObD3/wJ//5tWzh/1f3KPf8068eyK9+/svttXidG4AP'
-             b'vv9DefT5b69efGYmLLbqtJ2gxsOaYK0z+ZQeIKV6twdHcvOtb8taZU5CW1earAi88NdGGNKMeWXK'
-             b'u266Gw5k5hDmhiqYZIj3jsrvWVw8x04/SFdRWWTal6KslqQPv/hULs6e42sDc0eNcOiyQZf4mUMZ'
-             b'Jj2ddJtGqhueVCsSOqAFFL3s80hriYTqaKgSNlUw6J+1yXavrZP7dLrpOq4qJuVfMwxSFAVNjk5W'
-             b'uiZYreh/QE5B+Uez45EmqJan64VMJ3Oiqp79Gk0KmXJ1T6tGLBIZLWz7U11hBNr4huz+9UbdunF0'
-             b'JPv7+3J8/BQTNKa7xiRdDscmwDH2syyuNYK/ATtfvJ8rsPs7QgyKwmyQd98Y+tGOjSwpBgUjpz3Z'
-             b'tdAC1rgRUDDp39oTxohgqPmLJrvB6a00VollZr63a9yC3DsQ+uQIsh8bubr1UdSoNd6I0NmwphBp'
-             b'4Y2G7OB9JlkwetJf5P1ffvbRrdsgx600xpnBNpkmQolrJqwhphPZv3mE6GgnY8LLgQTUtFlYUE/5'
-             b'vZvVhrbYV7YrrzI+TbdsuDqwwBvLa+iqXDVTax/JpO/IfVhpIVSbZBXOKcqgcj/NDdA8ilIw1T9A'
-             b'38PFi0RUxLT9ZydnslMaertOdg0BtdOnwxqEgOINxUt+uUEFUhOpZkkNDf46I/vhBjWK7c7uIR0x'
-             b'pWr//R5LocetwPOIkSTHiBRA/fOWxM7Q2u/b2dv7zYf/9A9Yj2wfrw4B2CzzNgb4dW8AfvijP5Cf'
-             b'/d3fXP2m66pNPUjM5VDU6afLoUrtclc+nKVAHbzxrqgnmOrGd/YOoF3WyWgSR2CST3f2jQCmEajl'
-             b'f7u1WQfj4Fwzo32QygYWucrqlA1eiszq8lKWZ8cobIGGQtGMweXk2WN58uVnZRIvU3jbVvmbsEGQ'
-             b'YfSsO7UFg4r/6i//D3n08CvyCczL3GZo28HqwTrdmSJwxMuMESI3KJROogNpihbDwb3lmwT3Obil'
-             b'lalvrcY4IyMNKtSOXas2K57oN4Cnc93ZU0cNj3kSrLQIJBoaoUB5kJLUKc53qg39BXJo66YfBkIo'
-             b'rOcyak2RAaRFEt9Xm7b0X40O1vcrRoO/ufI2Bv9oguutwSuY9iUT3bB4WsDpTn4Ewc1y3P2/teAj'
-             b'Ipc7Y5Am1cVPAnTuWjybNsADQILLP7kQaC0FLwWyxanT1+s429nx3mgQY5xt+vXceaQN8jWH3rXO'
-             b'MeyKRCXqMjAtN/LZ55/L+cWlKRy85YoysJo2qedsqrHOU0NT2NBq8zSazg0Vg/dABzmc2SF31hzL'
-             b'qAbftWyiTO3i8dudPT+935SICPVKQ6vdjBWMTueq6FD0SS2ym6qGKO/LalMRMfOt0Hhou6/0te4g'
-             b'5tjUG0BZ5jtAqwwJbIBS6F+/KE2jMI9BaDwFbwNePwQHRd7F0bkD7BI6fw8bhBpFb8qjx3eL22gO'
-             b'lCQNXv/1coWGvapqgt1Td++//cnb77y3jQF+hQ+95x5/+UgurrY+C691A3DjzTfl4OjohbnGZdo+'
-             b'pgGLPtqHPdgkNS6HhpQmQNPjZru7cnlxZgE25ftWuutVeFfTuXKylD1NDBzbPh+EuPkMCWbIEsgB'
-             b'bHrz1C+/c3kpi/PnpZBc04jG9MA6lT5+8BkkX/pvC34ei3E1v7H0scidv+3ACSjjhB3Le+9/V/7m'
-             b'H35ujUIMnPgT43MtrCdgX9vIimlrgDOXBmV32aF97qnpDKjrDj3gVotL+96rNfT2SljT5MHF1UX5'
-             b'IkU7NlitDDjS4mk6SjZs5xMccHood4RGtYDq9WlyV1EB5xD06YdEPKTnPXooS3Y7BF3DaIhToL1r'
-             b'joRkhOb02bwfylQ+16LaSaV5QR2icj2GIHlyobkHdrgOmkTY0AwJpD4UD7MGRtEkRK8TH+SBq+tq'
-             b'X6zTflsK5OrihGY7nc+XRo7jdc7ck+v13Ds4tFVLoil/5RDYJKukVC2IUKCoj4GnLUc2jNmJcrle'
-             b'K/cd0PdI1QtuajTTpgRoSqabIadWJc6VAnz7zh2ZTieyUH6Mu+Fle+/Q7LVW1JWMqYVZiza4IiC7'
-             b'Sb1ODq3rFI6VgV5vEkhBfmXx1+ZpqZ8hcifacQs5Km4Fbc5UiZDt+cHsJ5paYtNZs6qvz8J3Ym2W'
-             b'9T1u3AgpWEyyv//r0qDBBTA6rN9rJ6yJtPwCDwKIXL95MqCughSRCMOVXI60Bu8xrUxCqROR8Rqb'
-             b'pq4azGdsrA6ej7WhXS4W2xP8lW0AGja+W5Lla90A/NWf/49qKfpRM5rYfp4QpxbuJ48fmS85DwYj'
-             b'Tdk+0hLsNoDxtSjohxGSrs7T9YKl5o1HIJNY8Etn9qDRtcgZEj71yr988VS65SkQAHMeK9Pz9bWc'
-             b'nj6T85MXcn1xihtyBG/1VvoRoxf9VSq8pP6gCnSCK5OVHtC6x3ctfJL8soFQNsezmhtTfp9OpiOd'
-             b'XlZmHYwdeWNafN3bgrSkBa0cujpZa8FQP3idTqbqaFd+91R33aU5EBq/VPc8l/UZVZvkKekLnlSC'
-             b'uK0vPG0v9zKqzKk31fhjkjbNOUncgVEP2/e//U35q//wtyZtTJYjzxJYD/3kOBBXCHnd2RSH970U'
-             b'88lEnF2vzRAIgMoBKK9ViWu2YklgrQ+NaQAfM+ZXqrKEE3e5b6J6IFAVAU8CLRhqxqOBTSkZ2XAy'
-             b'RSHUxhOcCU/Gk1xtkH0FFDi1mysffQZDj5jgkPMAGiehBU9YtJWUyvUgD3W5IU2wAgluvre+efNI'
-             b'msRArNhUzoqGWU13jlDIgJqocsJXZrh/lrY6g8kQ11jaIEYjBiKDQf+bYVO6asGaAfv9FjwK2AOD'
-             b'v7LGtVHiH1wEFX0on0ns7zd2HVRhsFq4fjHJoP9E0yepX3FUOhD+sKs6fZ8OYUYliSu2TCVMooDS'
-             b'1gh6DdVmezSxNEol9Nl9zPVGvftCH9/Ftcl1uWYnJ6c1+dKIhxG8orPTs6/+5v/6KaWD28fv+qHX'
-             b'WgnOb91/r36Oto/XtAHY39+Vo5s3v0wkTwXPZafrVyVOoYA3KIp66HSrDh/Anb09uTg/NfhZPdAV'
-             b'MsZe2JoGEMi0SOhUpdD4eoGd6eLyUsblIFmU711fnpQpW6eMNSByLcJK8HvyxWeyWZzjwNH9Kdzw'
-             b'3EUMfxbIDqdVcNf7jNcCi68dAV59VhqaxjeQqYqYDPSIFqdqOnxO38FsZVfle0eTeW8sE0z7ra8L'
-             b'RZB6crdjVdh/Op0iAGcymVkuu05t51e9G4qmHS6vZVkahd39Q3ISnAzXGdlP3GXNBV2Baw0b9WP2'
-             b'iVRqFLLlJBCuVlOagVXv4d6uTaWulIhGuKRxLaZ2czdMBlnDf9cc/cQDatzqljkRKFh6PRAVa4l1'
-             b'QBaSwb5GijSHwQ6SzRVtfJsa0ZzpZGhrek6FeZB6WL5Pr+WsHEqBErGUbCK9vLxAwZzO92rWjZPK'
-             b'ktCxLiXTubO4B/rN+v45VM27adI7q3I1AdBBBs+vyO7SFwSe/N/97vegWbfXQKIeGgq65jVtlZV2'
-             b'ec2J364bjJPUChiOiUakVC6LKXDsGlpUtAAR0MKvKIsiaGoxBJtkKBcoB+X9ociaOFkwJW7Zm35F'
-             b'webRpXtu3Zv9Q8Ewn2EAtEL9SXpkyD0/HBmJLnMNdk5YI5rqCiVHl732Tp49lhDojsjGkM1IpKeA'
-             b'uy6FOE3/+t/8l7+9d//+1gTolXIAgnz2yW+3MsvXngPwJ/9GxvO9c1YRgyB5aD169FgWq+VLOfMZ'
-             b'DYIdjApzn52clG6xNftTtYrVXa77glXXFLKyRWD8o0VgWn7X1YtH0l2XXw2GuGA61Knm2aMv5cWT'
-             b'xyBDmf2wntgtDmwcCNx/4+CK/RFVCU6hTxoDTKyJcqOp3Ln7Vvn+n1VCVcqhHobuJW8oR0+z8wjY'
-             b'rusPm0psi1Lz0NsYDGIlKRCHtcoFlyoXnMnqWh3u5nJxeSyuPNBJfDzdgdSr92jP1RcfAUybpVTX'
-             b'vSSUHFI7DhIgWwMPP2JeQyCREHtTNhPjtjEbW/Aa1EmxlIRkjZS+xtX1Ss5enMrR4aE1BGpzW4rP'
-             b'TFcQ43FNQHRyIpLnABUaYRDEyMbyEczSVeOQR0AGgLpUZKUKxw3N0CILiHhTeSFtO6qJhKpo2D28'
-             b'CVdBLHqUR8K/n852rQCyOcssMEiOT4TXmV/vagBXrcH0x1GYEOv9D2lheT5/+3d/i2ajbbkaMG47'
-             b'hRfZCnF5bppmCQfAOGjIyudH0/quLs/RBBoUvjIjn80GhXs8HeO+Uokm3B24+9c/U4JpBwXG2q4p'
-             b'kThtHJTXYXyKBi6YHkiULU6JDoodFA3VhjiQ1+HkVzL9tVFQfocTX+Ep0Ph6gGZUfF7Gq0ngJrSB'
-             b'ayQ037TipseCNlQbj1d2Y58wsPlzEm72RotESKKMyod4cXwMqa03iEbyzTLb238+O7zxVLQZrEjg'
-             b'9vE7rv4WmrV9vP4NwG8+/EieHj8/H0+n5XO2CWkQE6twtum+GxT+SCc9LQpKslKYe6KsdSw8tVps'
-             b'bBpGUAzlabRlVdi3gXXuUrrFpSwuTkrFuQK8C61/OTmPHz0o/34OYx+ExeSm+rZnwro5D+RJ8B63'
-             b'79dI48Cc+o5JhUOCnfoWnG2uMYUqGS4E6SONOfTodGWWsKn3fae5DRBM1b6T+e/Qf8eRUwl0DYKR'
-             b'GluNBKnsf8TeTidyfX7cG/AoLaGZlH+n5qTHHX+onv6G0qpN6yX9z2PsG4HIVHYQ9gh9N04CcN95'
-             b'qwx1daDvzUTXNV2u+4VAwx8ctJ1AZhWqODMhwwBRzNrUdB3jeFtDO9TmVgmg2C2TFDiyVEH4/Wut'
-             b'XS25PtgM3PAyEBcQA1fmca9cibXbyebqhuDwhr1+oveL60sYAamcDoQzgCpdRUy0sdJGM9csiKYG'
-             b'muA+Yi5FrNZLbBg56SvisLt7Q2bzGRAeTxKMxMth/pMV0VjL7nxH5rM5DH7gbV//sftiOh2ZY6La'
-             b'H3PyVYkp9vbJwpS0KVHEbA3dvnFjlhrmg1REQerfWFcs2Zpz839Qx8zIdEcrwAid2qwrodQ8DVJF'
-             b'UiA3dAtfIi6WGyB1vXF9eSW7ewfiltNq0a33r03rhgwa479fr/kKxd0D3YTKFS+4hq4AiqFecfvo'
-             b'dXX1U/MPtAE4OZXVco1wLr2/IDfV9+Xg4MmTr744efjZJ9vT+xWuAHbn87qa2T5e4wbg7//mr/XD'
-             b'9Xg62zlOFye3WsjWDHJUmc1m3cG1DHtKBJMEFLrFamP+4ZYZa0NhY/JBZXc7gQ1Ofbor16llcS6L'
-             b'UgRFA0ySkZ5gdlIOsc8+/lAunz9FkWqYLhh8JxyN4Jd5CBvzPxJ+jGY5XHfiueYZ2HljznwXpy/k'
-             b'9MU5ppUs9vOzj5vOHC/PZfdg3/6IfuQ6xeqBZIz2hlGsY1sBcA++RpLbuE5Uthe16cZ2n6tyDTJi'
-             b'cq8vuEYgAQ7jZPnvy/MzHPia9W5nsU2kbTMGfNzEVGWAmO4GXu3aPNgk5ax/Q1889Q1zc3kP7r35'
-             b'ltx9+x35+OPfglkvYVNrbELj1MmivOcutXfPfX1flYymBV8JnjolekaAFpa2NDfr1bKaCgHtiQwb'
-             b'yv3WPdcI2J4Hgfcf3VaD+8ucJ0Ml0iVGRA89+HeUAOgeNjH3TpXSxyAnkimJAdn/5sjCRDGFewCE'
-             b'XnKZiVxpI7JervuGLJuCA0hLzDXp8f69e5BXgvjK/XZStUxrKyv9c0hA1TNBn6ne+7i3W5ouWQNr'
-             b'aAJTJVUKW4q73mutTtTg55hpFAihapesDRUNqzxUaoWJOdUkvzCI+dHPoZppWXtcDaFLk8NcDkIX'
-             b'B4c36kpI3/fLi3M0cePG2KSdx0QPbLS7TPIs3QA37NSAlFHTD5Ap+jPqtToh5/49oVug/tQFHCMH'
-             b'skGspzq5fffeFz/40z9dy3JLAHxlj3KPLc/O5Te//HB7LV73BuDP/qv/WqeKp3//0784Pjt7fssc'
-             b'2CKKimYBbADjlgMnxmoFDKi3HWGHPZ4a8Q8ffC3q0chnSI1TKSAKk7KAr2V98QLyvVDNbLKcnx3L'
-             b's4dfyPL8xOSBweBcd+XDBGFrRZsQdE8qhHAZBgRPfIYVRfqgC1XwmLQJe6onv503ti9PFdlM3LGu'
-             b'8DWIukWkr00sHfgLk3LALmSCKWvDBLOOqWwtvmdD97nMiQikOUUVYqx+BJVm7fa9nIrnezd6dnol'
-             b'5iWZTKcMtuksuCjTDDhkZgLQ1jbE6q+QQDXLTHUTBsPYVN43V0ReGkbxBmOYK2EtE26NjR3U+nr1'
-             b'PVEPf8AEmb8PHIC1rNOm2t+qwsMgRKmhBkGG5DvSvRATvKKOX1gEaICTmTPQNIPMgjww9HPf+oTG'
-             b'A2uIthmEU/VwtL5wZBeEpk6YOXi+fb+EDtz5i6+Y6GNgAYJeMGlZTZdMbTIO9netOGeqH8wEQMx/'
-             b'J9d1mXIjJtO5kWQVFVICX/nsqC01UhL1zzVeemPckg0kfyOQa8cj8/+Hq59aIVNGivsXTelKeqvC'
-             b'0IdJ6ApNaOtNNKvzpppfnrLzD8NLGRTWf0UYCzkKVhOCQx+EYILBWFMZU23M+CVdZlgU3TZpduWm'
-             b'AAlJpH6d7Jo18KFf2PbHPT0g5cwym80+/vRnWw+AV4oAlH9uHtyy+PLt4/VuANYrLVJNd3h0+5PT'
-             b'r377HbB39SZQBz8lX60s+a4ap6AIbXBgWNrYmh/4thT8UiAnLTzNYQh0fQpSWYLt6xoyOOwiM2VI'
-             b'OrWsFoDVo04eG526aEbTre3gpEuZBcHYrhOHQkfdP2ppVyfGTIc026UbMqEH5Wx+KPfeVqLY39Tb'
-             b'vHE3NcN94cS2v2/2xpEufsg/j8Z0H0+mgGmjy+LAgjd3Okjj9Nop+XGTmAiXbIrTIKAuMQ9A+iKV'
-             b'UtXrNyjAlLwxESgH4y9gCqaCwCKBWxDFsHuNfRqgDJwcOxQyK9bj1mSc3fJClldnNnulTJe4DKmc'
-             b'7fc7ubq46ve5tANumcNghk9m4KScgPX1Bdfm5vCHVYzPhdnzCSify7F/j0yXaI1TMPtpS78r13Vj'
-             b'U7QW34vzc9nZ3aPlrZM1Q78fUe+CUiAbheCzNQ7WD0YZNW1FHcIAHQpsLPt+xPdJGxZ3c6Q8P7+U'
-             b'k9MzI+ZlK0qYpumrsAFZrUHUcqCSI/X+elgFwdxoPDa2/qiFH0ZsjEODa7peV1JrAMPfPDIy7YRX'
-             b'uHfGFrOsnAugM4YqqToDTaqjHJnKmuRkULt3A2WJaBx0NWUmD2bsJUxXpDV0JncmkA6r36vIlFn4'
-             b'pkqOjfzMJL53wTkW7uGYh9bVlghosNLGVjl1s5MtItgxPPh+tPja09MToGubjeUQ6M/VYeT27Xu/'
-             b'nqo8t9vuqF9lCzAwXt0+XucG4P/8d/8LDqlO0rFO0g2d9bTsrBcbeXb8DDanXeJOvca0GgoAi1fd'
-             b'e+suEVPyldnWYpjSSedCGuy4hXA0YUGStQ4Pb8uNo9s2r26SMXvLwXL+/LlcX1wwglWT0VYgsOkh'
-             b'gXIT2j5GtPatMpACGkTdUQ63AZdhSkjXPA2cdCeEjkGEW6xsl9kl6tntxIvZJ+iRs/HgbgaNdsfi'
-             b'l4y0hVRDZWuX19O2ERJBt1GtfuxeKmD20nIiM7F6pMUsIFOTHNjkTZKbkA6HRUgmW51rkczD2Dxa'
-             b'3AHPEAhtMt6+f08++fTLcv0amsD4oW+GOBeXl9XwyC2B1Ys+NEu+72YLrc2hyyyl6gpYapNUkpcX'
-             b'fxQMBrugqRiZayAmRQ0OcjSEcLbC5xonbfvliIJ/cfJM5jsHpfmYkSWf6zrAd/P6dNQn4OLs2CZ3'
-             b'S2aij4D0iZUVCWorw93tlMvcK4tSfM/Oz01J6Xn3OVWIHZLGMrF/8zsf0IsgC5mXHH2tQV0zQyJU'
-             b'nwqh5j8adA4JnfEBIl3XAvf8DVEGfL8Mcga6alMF46aqmEh2X2faTIcai90ZJ2Jt7m5YOwDGbxAp'
-             b'fFkanb39G2zSKMyjP8RmeWUNedOQn5EoU82czqXX8btBEB0As5kNEOlKNP4hAZfmXooQSHQ+jl1r'
-             b'vbfOce0bozUyAVJ/y71vffDo7vd+LLLeGtS8skd5X66ePJb86Nn2WrzuDcA33v0mYObPP/n4ZDg9'
-             b'6z5PecanZ+eAsd0splR66Pvj2PbBcGlzM5j1kpGqxqqe6GGt7nGXZyD21TSQ7Jzq8uMcjowWSKO+'
-             b'AXpAHL7xphzdobSu/IyTZ0/kyVefGqs4uGUqDw5mCARxIyM7yI2f1BCavi6T4hRWvsais8S/QHc5'
-             b'PZoU6l/DxIguhZzi3bDG5GRCQpSiH6lav/pEr0WuGTcMGSoHtCIsIIBJ9VTwqVONkvT3zeb2nCz8'
-             b'xjbWTegI85LQpcYxQri/UhciVwImBUPDED31LnEfb4UtsYG5eXRkUjIR2nya17px35ty8J5aGA4R'
-             b'CVjVdomwsvHgs06SGoFcj/5QiV9SU/16qyM43zErfsRAJUQLIxrZ1iZglivXYjNIQ3QpHuNmZzv7'
-             b'FrBDF8IY+tyAEFl/FT0YT0ojc41roD+zN3sO/WtAkYtSF0LRIXAr1Ds7c6AI647uf04ihIGNezUE'
-             b'8GASPROikwm5dsF+XKd4fc1CB0lt5jQYSn0lymdoqYma0zE+V4ouwAhKG0i9l7i2CYi/ThWlccmp'
-             b'+THE6igZuLoxeiyzKDryIfQ9hlUxPx8U9muzszPfq6up4VoEvU638lwfW8/xVTbcODVkFbhft5tU'
-             b'iU/+2ijys+RyPmsP+uwOE0+kGgQFsydFdrgC8pCoiKyNzZNnX3wMJG77eFUUgCgzKEy2FMDXvgH4'
-             b'zg9/vxSgHfnVL3928rPs7GgTFCEhbrnibE02sX5Y1xYOw6pmPuYghpVJgw5myKHXyWs0k/nhVDbX'
-             b'52XSeFzq7gYA4zBPvZKxhHA8S8c6uaFLLJPekYyOHwHKzCzacC+kbWj2dDw9NDrXcycehrbWOD5+'
-             b'Ys1K7G1g6+QS7HBWNzwZIAkZr2tEm16byOHoFmUgexImF0bY8Fq17RDmY65r6aW44EBzGd2v6r9M'
-             b'9oXZDQiXvptVo6TpBEYqWRuo0EuiTMcu9IS31xdS6KNzffhzQC9aQ+KOb2sOrb19rVSehKLhblEL'
-             b'PrvvvIM1GxpmFLhH96kt9kAMd+p2r6h8TUmeiqZAApfMJRJtWWfmSSn3xkW+ngi0Ow6UYgKYbmdE'
-             b'Qez1K0w8Y3iT5T0Y6mGs/RF+PqbmnGqOvd9zscYDkwvQeONCxCCEqriQpg+2cUWCFtqd+Ux2d3dZ'
-             b'jFN/LWtBDPWS1JRJ/Q2q84e5T8I1Ub9+87o1w6Fus67PJRBV8vUW5IH6GfClOfF0FypGZncYd4MJ'
-             b'f6UBVY+OjBUOCZg0K8LKr528jODQO0ObU21g3ZrX2P/WyFkjzGsxUOX4qiC6RJAOi+ij8XmlnDAY'
-             b'yuXy2yBS47yX1yu5Lg0cVDnk0+rnazSbdNPR6OHZs6dbE6BXCP+rjHlaztvt42vQAKhLnWbb7x0c'
-             b'fekaeviVlQOqbTalAVhW2nRM7u7WmWEP7Hg35ja2XlJzTdg69mE80DVPd2TaHcnq6oSBI9LH+5LA'
-             b'ZkQk7rKzTV6AjnlQ3rzzpjz+4rcwoRlmvTskbwd27i1JGdfq5DA8regYrSXlucrABpckp+fnVc6k'
-             b'Z6UegvO9KUhHPjELduIbEvE6MyBSHTjdS9ztriM/wiHkWJ3XGLVck+hMOIbfEZsa6CMi1anQ7GGd'
-             b'IW+LAkMfEocv5gxI7Kc43zRw7RFrqIytb+wgZiOUrGnS6cumVb47KOAWMuNxutEd8dx/HzENRkSL'
-             b'YQR2fKC0MGaD81HvucuOOVfmeiKkrOuJLvQ8ARvWN6ZLH00rqS3XaT3LroYEwRwqMvaZWE4by2Re'
-             b'ZtNloLwt1p32MNY3VuxCVz5+z9rqR534NjDSyfZ3oadY6FVWR76D6T4c9DYgTlqjquOs7upbNsu6'
-             b'MkK4T9pUz4HEBjJl+wyBVKsBQZ2typTQaDG/G2ZoJM+txOdMaiIfX0vdh3dV2eIySgQBivlpbHJk'
-             b'jkCoAVuJvhA08a8rmkC0QX9Ak715rVYJplyoP6o34EpcfQRHg+j24/wQhjWwIXZypscPJ9gmn56f'
-             b'wv9CJaXO/4CN+Hh+9s3v/eDZ7sGBrcW2j1cC/6fS9J0/fbq9Fl+HBuCjX/wCxWA0mvxyxN1qZPFV'
-             b'KdK1Tu6XZzLZ25e0NFtQhfrtUNPDoRRClYBFY6abubnUTIF+Cipz9O6htKXZ2CwuMZGk9aInwuVQ'
-             b'C4yHg1RqOavZFKY5EYVByOaOwe1s+zHWg3LsgDIIWH0M5vv7MpnNynSxMHOXykkwUpk+k5WiG/pa'
-             b'mLc+1ulpY3n2KlMzG2R7eRbPalMLAm9YfNRuGNplPC87lHGgbzqDdB0hHU6I5YdoOIuHzNhzM0ga'
-             b'U6KftjS5yZz6GrfwzXEAXETGCw+uHqexm7eO5Dvvvy+/+vUnkPbhejoPIAaqMDZsP6xQN6o3Vwe7'
-             b'Oj1uIMnMzouwRTn+N1OTHisR03bS1fkNca/e49F0SXfNitd0m4GLY8auXJtHLeaQUgazEg5072vC'
-             b'qN4b1bKUEjWpe+rW0AUqEwzgp5tgZiBUdr4EIdDy+37+y1/L2dmlzMuUn4KZRjWuHSAycfvopoya'
-             b'kSy7KyvsLrxrIkyyeDnNHGtkz9WCkxo00soPSRvzUFCybKOBQpD3dXXFgOyF9aq37XWcnb7+QEvY'
-             b'/AIpCEKfgkTTrAA1Coieg4hst6S2tVSEPFERqKnegzmSGEpnvmBOoIHcgc7VKLF3C4aqxDMZJHKQ'
-             b'6GqTZ+FBThF1F0ZyI3Jmo2bfq80XmqM46scEmD7NX/zqH//+Knrg0fbxO38o8fKNu3fl1o1bWxLg'
-             b'16EB+P4f/hg76sM3bn/15//9rJxki3mgjlenkscPH1gAThZOuAJWv4a56JGIwB8GdsSQyfA3ApOl'
-             b'wnVMKDMDNYXIR/NDCdMO9ryaXZ7Lz9OuM+WB0Uw2KJNG7Gb0o8Yompl+vaxs5FynB/NDjxVOTtX5'
-             b'zWVEb737LRlP9+T8/Jo+8O7rnrkWUOOTJeWBZvOr/gf6XFSd0I5j3evC+16ljkhJK4cV7JGNPyA4'
-             b'iMmk1sM0rNlkuB1qqNInK7IbTvyccqv42QobzIk4BTWmXehz1PFvW2F/vD/Bldx9HoIesBvIqMZy'
-             b'eHiI16mTtZuzZRbVRw++lPOzE7lx49ACgRra7qbMEJu2TL8reAJAXggot+vd6ugDCaY5ECFC8Gxo'
-             b'YBakDQ3JcR01Y3FgOyvccY9KQWypJNACqYV0urPLBs9g+WVpJpVQqFyUyPVADH1aYmZ4U2bhgp4k'
-             b'9Evu7GSSxFYMnEuDtpfq5pi0EXb0wZAGyOrKD3zzrfuVc+r+E0LrW/0N68WVETzV8EgDpdQbIFiT'
-             b'lHDfRFtXNHTL01jfZI6YSrzUJ9EtqE7wpgnNQa65Af70OxIEregn5l0YoQ5ph0Qz+ibRnuv19QXS'
-             b'O2NpBqejprr1Yc8/ilBnWIOU+ihvumXGbPwRvT+RWqknQkpsuPsmHlG+IffrPcoBjbMRay6IN4Zn'
-             b'Z2e8nkQAwStS59HZ6eXp2UKln9vHq3no53J/pwxaR7e3F+Pr0AD8/V//1AJbNpsn8/2Dx+ls+Z4Q'
-             b'LtYDfsk9YIy+0+uM9oMpmZQgMuqd4KNTsFrfRkzoIyaFeYJ6BGSOeaGdWYFt1zKeB+xCzateIeEk'
-             b'i4szwPTJY2t1DfDGfXn86ce0PGWhC+Lea7TNt8OkVrdgE+QXv/xH2Sm18rn0BCoU0sael36z6q+V'
-             b'kBVBvOpABNsgEGhEd0M74FTaJa5T1pTA5arfves0PLKDf3VxCpWE5cS0psNHg2CkxbU6rZVCMd87'
-             b'qIUtuIUrnf4m05lcnVIKCdvgDolrVWzlUkax146c+WDrgZirKIwkRabzVfe7UFMG4WWw0cYs0z1v'
-             b'bbviZNJMawI7yCWh04cdrxViBCOhauTKs0DxjVYw1L4Xl1jlpZoQqG9Jt6oYBXwHtLlbm2uk0LQn'
-             b'E7bXbHtwISRXBQAQd2j1HUa2tZCubdxS2UXvaLpiU/cimbwAcUWIkwG78l2l8M1mUzxHvHc50VSI'
-             b'6IwaNJX3UU10OqyLOjaj9rrVCXKc7bploCcZnwkhQTZ4ZgDg/Q7yvGY8oX9A+Rmb1iK51Ro5BWrk'
-             b'c7W4DnDIJJtfAhMkQ22cXFSPNMGmoUJAQFqNNW3BruPu3iE/K6EqQtw86Ozkefn9Xb1ftKhHXwHp'
-             b'+9Mx1joZZ8g6hKYGS+FcoOtk3fczSyM6miGeIUBSIYOQLFDJtP/guZSfc+PWzcd/+J/9UVrqZ2/7'
-             b'eDUMgPJGTKfmgLl9fA0agNtv3LMpoh2dzw9uPD89ffRey906DrPSEZoEjzGi1FXrlNvp9J+MAQ2o'
-             b'kiz3zdosZNUrHnvdxpLbqtAq2A6/7ue12Oqh3pi1LixRExUFNG9BESqHzmw6N1WCFmruUTGRIALY'
-             b'tO05xLrnTKmfCGeTRu7e2pMvH3xVnuaYB3s232sY/1giXwBrv5FqFhuNtKVFVxFaVRLoazNt9wY7'
-             b'W4P83aXQgpEymyGXygntdocRKzrlGjnOmhVrKPoAFOd6ORcARcZPU75HVRQW8uDrfGXANQqLo6IU'
-             b'88m4KgPc3ta1/wEchBGkjEnfJ4XI1ZNB1wLtxCZ2JbKrKqHL1VIZxTVb8Reyzz3m2QmUvTcAEYwQ'
-             b'6NjHAKqqKeAqYpA/XxnJKtXUfAVNmCv/qLmOxzrbS6C/wYCMVx0C68LFzK489KYuj+oeXOT42QsU'
-             b'ncopoZrCbroNUJuDGwfcx3s8dISb4rJ8LnaaEdMdzQ9fUTMjkPaGPYjtdSKqFj0ewHmz4O3bVHed'
-             b'LEl6jWFiaqJzALpqz2yOPIa+wMKbyZ1ogrjaEl+/kNApg2TGviFLclkaAGu1Gq8ONV46kIvhTpPG'
-             b'/0iQFuIn5ECeSif+dvjnPZDM6ndrDy0EFP9nT48xOIhLDbOdPYc37zzcvf+O7F5vJYCvlgOwlIvn'
-             b'J9tr8XVoAN754Pv2vo/GMt0/en7cBZBvPFBmtVjKlWpysxnnrDAhlsk45eqiBzlfZyFA5ttNa2Ci'
-             b'Bu5VHmntmlkYkCBI6RHmDj2wSkGYTSayPL+oufDY9ZPANoIzmaIEayoK7YANDouGnlUMEhbT5PyQ'
-             b'GyFRzgpxDYLplYSyKK93pcZF7Qw6cpVr6V8qQc+NeLJyIBgB7OFJLRj/6wHZi3puJyASetX9b+cz'
-             b'FqOR4bilMsry/ep/Pi5FzZuGhmQw/A4slTv+PLoteOjKQK+OYtFxAq5/zuYkZSIzsbLWM50X9Yes'
-             b'S0NzevpC7t27XZqsms1n8jmF+mPTO8LV5oIOe1wjdJvEgm/NItjv+t4q7J1CLfLBDYnEfA4CZZfJ'
-             b'm0yjjlsCoKcGKk8D8boTmCH1rj7SXxe6z7XZbX7735dr0co1/8o16E4IRHHuzK7XjYZjZZkaWVXd'
-             b'+TTKOm+6lyKlFaU5gJc+M4PUOAprgBHuDfXK0ERM7MQbM+VRx7+NW9uG0DNa2ADGwBhh9cAIsWZV'
-             b'aBbBSBG0agAkKMJCVQv4GIGN1ia9RGJ026IwzFzwK1W+5/riHG6F2gjaaqOrfJkYPLmPPRNJiq4F'
-             b'cY6Bey3UGOWYq1WCe/8PvSR8z/H48ePyuiz4S9GoTBLjcrl8+P/+5f8u2xXAq3voZ+8Hv/fD6kmx'
-             b'fbzmDcCDLz7H/6MT1Y2jmx9+uun+bNqGSuBSnfaTp0/kO82PSOYCUwT7/Y6a5Gbc0i428TCneUuM'
-             b'vW2sKgU8USwwwleEBSn2nuvdCjnmerA6M79h1rijD1ps18urenDBlMV36rGphcfMX0wTD01+mS7e'
-             b'+9b78g8/+wjwKIF/MNCtQAoCRxDpmxMmzdF8VCVxCodKa69FC2w7noHxrtPbZrlh0AnhTD8khdKy'
-             b'lCqxy8xaOHl3iZzHAJh8Xaa/iUxJ5OuZ1l7k3MAoEZnoc9qpFuBqAQU55jopRjqp6eu7e+8+2Ova'
-             b'zGWdAEmU7OC+uEETJIFJaznWJLaW8ceBhK5hspE2B2jslPAWW6bz0VTGbXadqJdsn5zoUpcYbuOw'
-             b'YyBLUpuJy9PTcm/ulII/t/14+Vl7BzecOQkeCchyyknwQBnK4Wzx0VrATM7cS/fxtT6VuktQnyBh'
-             b'zoS9iJLKBfeXKNdoVt77iRJEO7uPjAxp7/XpyQs5nO9ZDC56nNIAlQKmML/aZ1cDKG0W9b4EdyJV'
-             b'fX9maHWuyIlYUqJkGmN5KqRJbhs0F6taQF1pYBHM+loSGpbr60qNZR6F9LwdRxuCy38XZj/NbAW3'
-             b'r+itlOk7Ibk6CfpzhjmVEzFDqGmCkKlKT9INtAsaEjD1vp/Pdqw9yYbUWAMfZG/34Atdz8lm6wL4'
-             b'6jqANEBkto/XvgG4c/euTcbzHXnn2x98+P/8hR6UZsmpH0CN9fz8i89w0PkslcohppLAFjvVUlRW'
-             b'C5N66aTSKCxuzOaccpWJ5ezJYR6ZalvXhpnyiPZExdzg5xnjmEx9mIlwUqeWHjr6HCsEiX8p8Yuu'
-             b'Pw6OLpi0Sw9qdSq0AyhWWBlWr5RwLa6u4L8+mu1WSNQO4Y6JarT1LZO4uqj5RK1rjUwPf2dG17Ks'
-             b'qWpKHFQGe+PM5uQOxLa6QGMzkfF4ZIdrDWiJ5ZqOK2yKV5R6nbonqXuyobnaJfNHsGQawLypGrCU'
-             b'Zm/ays1bN+Wrrx6RS2DTv0kuRU6eP6/+7w6nw7a1MytZff1dNpdDc6Wz1USkoZDq1PU52xRrEymI'
-             b'YmtOyzWxkCscvhJtvNAiYZ1j98p877CuNwyFkJooZ+vnju+tDBpJa7ZiGPQc1Yq4R2XcnU7qzyIJ'
-             b'MFvBsTArm1wTm1Fveua7uwhuggtgyHSC3IDwFtkIyUSqpFUbK/ScGIEbyl0F6oJMeVxiSJBfszjw'
-             b'chDP4BhZ8JIaHLm9cnbybPb1BwstmoMWTcNifc2VWr9O6kqzuSiN+7R89m1bkSHxRfaFKi+aUKOx'
-             b'3UHTV1yZCopehUFia6j0DUO2knFfgq/7ghX96I2Nb1iSDQ3X5bN3cnZmclhyPRLXVbfvvHH+3nvf'
-             b'QnOyfbwyEgBCy+CIun28/g3Arz/8qELjlxdXX+n+11PcXDN8dXllXvfJHfI2ZQK/kDiZGRNcjVjE'
-             b'Dp9Ud5wy8IkDA64aylS3sByqAQxmVD2gdBeqmvMwhCYj4V+bJGZ7e7K4eAG2u0XgphoQU9lEMgze'
-             b'idVAZjaZynQykourHr73uU+RgPOTc7m6vpLDnT0UOm0+RhriwpAchf2r/cC6q3CsQ8Bu2WoyprZf'
-             b'EYyNc6BT4GbZUsdMHwESsgCu0Myn0qOAXCz7iF8xNnt04lvdDac+vDPEKr/DQe8HczDCnELx9+/d'
-             b'kS++fEC73NQHwJSvXSyu6RWfa8Qy3udJQ+16iyQ6cEAakuPob2Bvp8HVEU0gJ9dNqil0/nyFyhHh'
-             b'Ad+/hzIo1uZaqMoLKEzdgk4sdngyntc42exEc79nku2lq17dzZ3SwHhmGHmK5tTc8YAYlSI+kQkV'
-             b'J+SHBDM3Ukh6NpnbPcJmRmh5ixjhZBO6BAsUUlto8b13GkLvcQDHs6HzlCrX0yeXY46ghAD3JNmq'
-             b'zUIimY/BxjGnQZx1MOIfpvoktfDCTjoyAdGJJkTMPK/AUBpvokM19umyvOTjESuJkBhKBVWo/umo'
-             b'bJGuNlv+NaE263aNG16v6pmRbG2l/IXbb7xxcnTvLhDC7ePVcQD0PVleb6/x16IB6K7JqF2t5NbR'
-             b'rd9MZvNSva6is451clPHtcvzc8TgrsIaxCv4wyNS1jXzWRoeYyl4A4AsMjGakcnyUnatmtdNK2Qg'
-             b'TJXDTb3N9U+6HKqOGrt8Zdpn+9nzUpyPg9u/JEr9em1zJUgxmzxwMtfipWFFh4f7cnb20GyHg1vN'
-             b'2rO8vDyXs9MzuXHnnkGNKgcrH4ZIaDXEzgomJV8h9HtMf2l6WEUDQQC5b7D7neLrNrB7TeZAT1RD'
-             b'fRZ2dg/cDB+wvKETqZL80mC1ED0jIPMAD7lGEGf61VsjItWbITkhEOz0Tm4c7FWzH19dBCYUPn3y'
-             b'uBzaSxTTbmMM7xAji3AEex8Tp64EkHjYYDptGFSTzHeYBLRcUw7zgAxoqxn7OvhK6PVJbmVbA4Sp'
-             b'EQ9yfXUhOypPUqvYlcH+Iy3A3nhQfw4r2eUaBdc8GQgjDwiVFmtphXHjLaqvDxAgmEuTOCaE7xJW'
-             b'k+u5e6KSXEdqXcxm1af4zOesDdI4mzFTRVQ9xTBbFLV5OXTVejpWTwqL5MJKLZFM6VJACdUEqt7f'
-             b'NNkJZM5Xt57ABgzKkYFHBjMItEHVUKcaScxDQd/HxcX54POZXtKER65uvLFO2dY1memAZqlM+d4A'
-             b'TM5+T2dzDeybvFTbHyXVqhoo15hjW+lNZ7vyxWefHJ+8ON66AL4y9D/J7v6B/ORP/u12BfB1aQC+'
-             b'8d637UNfJpr50yfPyql5Ll04sAQ806+fnJzKyemxvHHnLu4LaLLLh3OUdyVF1YBHmpdwIlCGeMqV'
-             b'BKegQKxZH4ka+43lhHPKbUhKcy23FTDblebo8yI9+GvkaGuHozDrvYaTGHxeNdopV8g4lOc5bsd1'
-             b'Q2xTcqw2xJtSOM5enJLQuMKErvtnPZQCC20i0138OSLLvActfGfZBUMIRtgVrwwp0aYJEjmWrHIt'
-             b'dlSHnXNvVTt0cyuvq1UkIYdKrAJ7v8nVjhfxwMMiU/3z2Wt1LAae396tq1xuXApvojWuObU2cvzs'
-             b'KWBW3aun2NVQdhTHxnzsbeXhJL81C/tm4EonAy5ERqFLKPru+sgdMHfaVrA6iyAmQTN4tH35u729'
-             b'Q/IrAhooFGFXFojU/bz+Xzw/keotH0hc660SzJsguc9CbTmsSVyUpvjZ82M2TtY3IU65s2ZC9+5v'
-             b'3L0v4/mc2RHCAC1h4I09ZxgbNU2VIfpuKGE1Eyu+Hw14kFTjiEy/D/dHoEIdG1A2UIwUhrw2815q'
-             b'ejKnpzAaakF+C7M8Eg2SGIhtWn7GfKOpKz9Im32VAKLRZMMSGWWE9zRlOn7masrk9syp9yDkPZ0r'
-             b'4lLTAWvYkFuCU5wI1dEakclC7ogiRzgX2snVjaObj8ajcV1LbB+/+wZAVVYVhts+Xv8G4Jc//6f6'
-             b'H+Vwf3J0686n518+/30YlxGm1ylPUYC7d29bIlqijSdIgS1Y35AiMWQm0j/e4j3DgCwmLKDJzG0I'
-             b'OVZXr5Brqi2OEninS+9qR5vRyWQmO6UgaBxt5s+UUNXuJB9SAacNQrTDLyaDKOeAaMuL58FkHuU2'
-             b'oWizcn52wUJXJtPJCpHHASx1sQNdmkGqn02eOOwxbZemhE0O3Ngae736v0oYVD8BnXYRdywdGxWy'
-             b'82m0l+uEZcUg0xzJfFa5e/XQ9UzzmcgmoK5LrOhbZkI5vBvTgncM9zk6OJSDgwOLe6bFMSD28ryX'
-             b'Kv0sRW5nZPn2ns6gEb6m9PSpvqNvgcjQ4MVgYX/+cbjINui5c3icUchoitR3ObGBCEaW02I6HnFy'
-             b'zvVImkAlIZX5LmyMnBcBpQfhIwuPkt6ylvkSOaaX1irc4KAhbWczOT2/oMY9VYmjo0qKcNy4fQcN'
-             b'nRoqOdFg+CxB5kPC34jBDr35jk/I9rM29rxr2mbn8Bk8CBKTJoPH9fJnJY/FZqMbaAsNSWm3qQ6E'
-             b'UKeoFK9bWjz0IIUSP7Nh45T79xXeB3U5Yh+kxEwOvLe+NqhBRJXaw+vQB1aFnAdhRcNGzJuCXp6p'
-             b'f6cmQEgE9e8hSXQym168/93vvJhOpoYWbh+vZP+vCafbx9eoAfjWB9+t/1EOzs1f7h48Pk1DFzn9'
-             b'sK/k+Oljid95nyYtuUaOmvfHqE7rKN1rM4WBOy2d9kzmZq5k0NtzN5uqa+AKzH7IT4D8dXJ9dY3D'
-             b'ejKaEySMddLY0HpXpJ/6Qy02aWCQY65+0f0CYO4TZdw2lZwYQw/t6j8LtSmm9EgLa/CVRE28GXid'
-             b'C9PmKANEuE2yaVgh1g67cJuQVDuvHudK9NNsH5fiZXojdOsFPoBhEPSjB6julE/FWP1m1ZtovSzV'
-             b'QbBOvFxPDLftwkwFHO+d+Qg0TUbc7tWTpzhkza3NDIRWq405PO6E+h61mVBv6Ihkh4o61EaP5DCH'
-             b'iO1t7wZxumZXqwVG1wmQRJb3XRnyofy5Nlou5bRY6EYmlHi6Yx/QkeQchw5s90YDlEhO1OKkUbKS'
-             b'XYYarVkV44kkz/3JPUG0lzpG3J9qB617azj0sTj5KkVvI03x29nd4Tqheak50b5jvVyiAWrYBNYs'
-             b'CjH3PvADGgYq6XvZjqi0YLPh8lckYdp6xZs8bSK1CcVL6FI13bFGylA7pA929vUblRwir2JTuSv6'
-             b'O5Toqj9rZ3evz4ugIZI+N/wuXfWwLYK9L9/nrhL3Ut8AVllogBrEc0DM20L4mez5F6EnEZgqqPzu'
-             b'No5w72n+yHTakkTMO7tpruc7eyslqG0bgP8fGoAtAPD1aAD2b92p/6Gs5p2DGw/AV4p9choif9br'
-             b'3t8/m1Nb5sGMggaimg/73OnnPscck0psOIUmI+4xvx1e51mT+M5l1jJKtxxgyk62wEE3W7FpoBk1'
-             b'NlmvpW5+8yBkRwbErkqwY6yorh5+/4ffkY8/+7xMG9Zw5CDV5EUNUl68eIodbvDdO4JwjHVtBMWW'
-             b'2fBmQKRSNGXEo1DRDAn7/o5GOvqcGzucdcLW/zXugkGykVKpy6sL2VWJm9vpIlwlU5ZHbTW8ATix'
-             b'uwFLVY5Xu7VacDufPJNPifZl40kr337vPfnqq4doTFJHEyXuanPwopCqi6Nrv/sTggd9thyIjuS2'
-             b'AHnaGpV2s9pgwlcjHDQZ2uBpcaQXv06oWDWpR0C3rqqA6c5OTTSE019IVYnSNg0jCTqgNKqtN91+'
-             b'xrR7dXZicbHlZ43VYS8MDjgx5r11RVxbAVa3e0SL83z3AL8DO3g4FiYZhUhjIvVj0AZy1KMCXG2J'
-             b'Z0Q0DItS+R9klpGqxVRNpdyQpyGLH6E9ijopwTCaG6IZN22ssKeOfhpcGdCHw3M0MmWRel2VsIrw'
-             b'H5oAGYIRgHrZ0F6uy2xaVzEvhTzxumrj1lTb6sYioo1+itWbqzh646lUiayOytlqo4GqYFi0M30j'
-             b'xMOfWG0UnTo/vxB3hkTjXRpB/dtS/I//41//dAEy8vbxSh56xn/wez+Sb373h9uL8XVpAJ49/Lz+'
-             b'h1rO3n/n7X/4xV/H/84KvIDEp97tH334kfzRT35ChrBBkXAGjAl2t5i2OEUZ+5qTUUqEHAPNSyjX'
-             b'SmYT63CwIgJ7h7ekuzgD4iAOKdJDvnEY2B3iounXa3Kf7/w5DVVYYNDJgphU/pmOp7Iz25WTkwvz'
-             b'SQ+hJysFlcEdW1NCO2SbJvlaIiV8JGhpehkkWV3XJ/wxDx62xnqANplyMcHUpUY/aXEOxYPz0PUa'
-             b'HBzcrJnqyBAQW5VMZmMhHwoFo/PRm4Wl7n4HcLY5NA528dzFVl1+eR7vfuMd+b//w9/a90epzny6'
-             b'Q09+0GZ7rVpoMR1EI41V8R7JfdXFTxuBzZpWwAlFxMKlzEPAtOkJuEmAjn/dEwq73Nv1ZoOQdOrE'
-             b'6kQ19NfXeO5qBpURp6whVuNBMExEEdNIajW2AskxSe9DzxVLSLlGQPs774Z/8FBaLbn/DtXj37Ui'
-             b'mOjLc1qBiZ7ZdDrBJbIBCrJcG6LRwD3RkAldlWHdwkJuKJk1jjEOSKW++8/mR6DvRTQYivt2d9Lk'
-             b'KoVrLPMiaOksqZ9b8+p3wmAg8mEGVH0AVwg9cqbBTyoDNULIwI6Z4T3inIDMbIVKvDV0popwnNiX'
-             b'GZPs8b/iolFrZKLmHcRMHsJGnj59bI2er1WUc7FcaUP4/OjWnbzaSgBf2UObq8lsXtc628fXoAGY'
-             b'TKZ9A1AO2cObdz7ZAClOmOgS0+eePHkmp2dncvv2HaNaJdv7t23+T4pQ4kRqEy58yhWCV5hfncxa'
-             b'n24YKBLofx5JyHLmmu5vdWqhYYlp/M1rvJQA2dndlzOVqxFxQOoZXdCGt28YdgFOPCpT1t7uLj0v'
-             b'Qh2ahSZDx0+fy4tyCO4eHtik3xisCfPUZIQr29smROV21LkPPzeBgSk4Cnus3JzyOtv7YkXiOnBP'
-             b'/3N7YjZNel3Xa3rRZ2cN2FWo/v9MMhx42kpNYx2kqfUc8gCd+nim1soTGCTh2nPi02qobo8oVs72'
-             b'ps2vNjOJ099msyr3jK4zFpYPgCjhRHKfrQH8OmVCwYnJdms40zEtTofb0JvEVD+D8g3L5cqm/PEY'
-             b'WQDmbR9qTrwv+M3J0SB6JjkbLB4NQcJL4FqooflNytWyEe+f5yho/sViuRqskLL0FgIZZlDzvTnX'
-             b'LWQs1p9l10t5Kh5TrSRZpEVGLmvIV9iQ3BeqQiJWFWNmaBJWHLweHT0ke7apsBmI9HwwMycgLT51'
-             b'a8Og11y5BtGNetgYhAGaExpnnJT384rIUqaRJ/M03NOgtppsAxnYlZ2/4m6KVF4oQgiiatiQyxB7'
-             b'oy7fm4jlRIwmLzcURvLNsn/j6Ml7334fBM3t4xVtAFQFoAjkNgfg69MAGORmj6ura7l5641fTud7'
-             b'l5vuckdSV1O6sofn1IlSLXEXkjXC1L3Q+cG1jPrMPeSI0HqiWUpnu/GOLmMDH/C03tQpRug+Vv3C'
-             b'tBnhRB7GGsSyJyf5EQphHqbjBend0/o9ALNO7HDSCfWt+7fk57/6yNYC2XMK7J+Li0s5fXEie3t7'
-             b'peCrL/sYhQe+/4hOTVVXDvmbQrdsdPD8ycgOlEI5OS2HvkAP0ottVop9w2IEwlx/h+5pn0cjs0Ua'
-             b'rjrhDuI94NrOh0iVXOcFsgIGlZkl9HTYyM58Kscvltgru4UrjGPKpAXPgGyi7ABJ4LJ6w6txk+7W'
-             b'NRMBu/Jke/ZInkWD/b41dh2nS5t8DSFosA6i9EsbQ0o1JTS1U4OCYqzmSFPzEfDIQC3eKVYZY6Ad'
-             b'ortKek3prY/FUglJ3vQmKtMmV2i6pK99XZ77/OAARj/HJ+eYovuI4kgznlZGVJL4PSPBuRi0YBZb'
-             b'bcVJR4MfrsYYM61NiRppgSPC3TvskMX1+2YTHNlEZa6cFL3oGNedaopl5veEyviH8RKvQ/AkzoHx'
-             b'jpoJqUwS5NLBUgcuCO2kuhLafdMNmki+NnEVSiII4At9IoCD5krDkez/fTmiOtXoayYXlmtyzXVX'
-             b'JQACAUoyn++e7R/dkunVNgfg1VEAMlI1t1HLX6MGYDPYqUGfPhp/NpnvfrJ6fvJDFN0O4yamoutr'
-             b'dXjTSa+HoJEEJ3ZIBOaQWwRp4I4vkknO/b1OQ9hzBujEo8un9MmUwp5Xiex6BqssFtjHtti5erTA'
-             b'BhAr1gxOrvKpIqcabuPCpKoHDGTnl0NYdd6jxh3N7KDSQzmyJKv5TsswpLF6tQO9aCo8D4kTZPiE'
-             b'YnlgWopiwgGNQsd9L3zNqWm3PWof2KO7YdXWgzFeC5Lb1paJtEw9IIKRH+FHPmRyMdXp0ff8OQ4m'
-             b'tdzDzaEe2hn8hFtlir1z50gePX1qBd23ueV7Li6vbF9dFRWdJcOxYBu3w+x/q7yTsj79FlgtZzO1'
-             b'CZSeVZkoUJAVXBXhwthEX/ZX9CB7nn2wSGWGzpXnQVld+QPVquuBhewEwujnJ8fwqBg58UzzDTyE'
-             b'hmz3rr4PoRLpuEHAvaeIyGVpAg296Zg2aK9R34fRbCKHN46sFfNdCGHsSoQZ5C74PJW61LtZEuoP'
-             b'JKxmL+rkCWR3WAxMWWSYk6JX8F3I7j5IsmNi4mb17Y91Yjc5L5sLvl/rbi2ljZFmIhWRcJ8GJ+xJ'
-             b'DH2QE1Uq2dM/qxtgrFF/1qAkugVabobZVucq+xv0BXYNwiAbonyg1ss1lS2h8lKUU7G8Xlx98dFH'
-             b'WxfAV9sByDsffLcP3to+Xv8GIC1fDtaYTWebW3ff+fjTR5/+UIlOpP3hw6gMXXjn8+ABnJ5sVTDi'
-             b'blMPDWXzCgtRxwPLHAMbBJhEHmQYcsiSR8Ag9MUmBE9MDQnu/Fa+pnE0ohwOe3s35PzJQ13Ycu5y'
-             b'rXS0A74XFw0kc7ky2Q5L8bt964Y8Pj5D5G92QbZK0MrrPH76RN7/9jcr1yHSB19fe5d84iL6CXZ2'
-             b'Zzp2V4Hz9VoUrBGh7PR3faIFGkVO66onn0xHddqLoak6ek+z6y1x++S2zKCl7DI3QqbuxR4H1yFx'
-             b'ijW27wgBR++//4H8yy8/tkbMG7ukUsizCqGE4PkFybgRSmRM7vlvK5/kssMUqFuXGsmrSIBO0roy'
-             b'cAmbTtGJLnrCPITIKFk1BtLrOlYYvQbWOOmwE0961MKv90f0zARVbPh9WLkdmdkFGfbV9MVj2BUb'
-             b'ol7tVnkN6p1vCH6o7miJunbwGtqmrqqcixGYXohbmHbE4H5wysaaTJ8XP1S+9rKmqaGlb1OlkDXI'
-             b'x3f4iK5ue98FFv+U1jV4p+6hcjfw51/3G7BsUdyznT022qnGADsZVdEB+HK4zFAbXjciYr6DSB4E'
-             b'LNECu0qE4frA32eoB8yaYp8XYC6ebpudmezZ4XNgvayjH4Jr/fzFs6u/+F//Z2YvbB+vovjr+/Xf'
-             b'vvm2jG9Mt9fj69IAHDELwB/T2Uzuv/veP3/4d3/53zShqzaoOkU9ePCVfPubb4P5HjFJb3D4qAwr'
-             b'ZTcgo098bCoMn5MZlijEBw0RDlEzFIIpUGLgin6P8EAjtgtNdx2IMxnhBmsnTu8+eJnuP9Vddq6M'
-             b'JM9ytxtdSWX7811556378vDJC8kg6zF10PoDefjogR34wXahXRdA6EqbFSdWTtfRp0Tgotjf5xpR'
-             b'TMb22giPOCw3XeU5hNAX59l8v+5VUezVuyBJjQbG3psvZ52NyNdQBpjp1e/SxMjAFhjZpE1NW+tt'
-             b'YO1rlOxXA2iSsf0xsZafv7i+tAlVm73QM87Vv0BfVKt6bC3sMRLipyOfcscUfoZboKsZbPoNlPe5'
-             b'GgPyQphGAaPn2iOVwj/H88XuWZtBrp9srbSRqzKd7x0cYvr3Aml/L3CS9JVQrh71VueS59QznMgb'
-             b'J7fNteE5GTqk0sRgzW4IYYAiReQ56H1ZrZ8r3zRUrkZwBKLcL3Hc4POBokpTKqgdsvE4XL0A336P'
-             b'eqbHgjc+bdsMMtobjtLJlAZC/4lmbARMGg7hltRmig2FuHc/HSEzGyTwSbhuS+X7FXGq8dBZ+vVE'
-             b'YGM/sOWSAfov9CroQ5lClTom3z/UJjZIJwMjIbwq8o5SH0/sTcut2288f+udd01dsn28shWAmpZt'
-             b'SYBfowZgcXXx8k1QCsatu3d/tRapTv4ZwS+tfPjhh/LHf/wTme/MJK02gHEnWjwJH7o+HDG6ILpF'
-             b'dPk2eSZkoduxlQgWNL0DG42D3P7Vu39AoUzrs9HKdr+Z0GKkGx7g2RgrApu4j3SbYJHeHS9QDXB0'
-             b'dAOHjbG0PaLXpFS/+eQTubq8lNFshztlY2MDtuw6ce09yG7MlYddLrXo2PUmMwjS79U9aAgyMEYa'
-             b'utCnvkEJ/T7ZXd1wHWPTb2l9F+6Rtty7Oivd4Wo71ZsKS2dyDzJ915VzcXb81Bj5BuAaF6Jc52dP'
-             b'n6K4mEFbqI54Dl13yzXXBZG77WR+Dtlg7VaDl0rxyY3J3RJ15r4BBj9Av77r6n48uKUyPfn1j5WL'
-             b'oNdyZ++AxPRWdvf3qcnv4XZc2XKtz0+e9bp0seAdu9my9MFJbAh8PZR6G1t9/cvFUhaLtTWZbriT'
-             b'Qm0sVuU+sNUQp3ZKRGOQal9bfaHpu4A2TtEusb12H2Oc8bONsMdwqWhOmc3IJmu93/T6wzMhGN8D'
-             b'UkPwABRdGVs6Z5aarGf1tivP04K16meg4z6ephahV43W78vE6wNtiZ30CaMhNgXCz6BnblAjUd0s'
-             b'az4C76w4QFACEzzN1yK7DyC5hPQRZCYGpLfl+R8c3Xh05/5dc17cPl5ZA6Dn/LYB+Bo1AHfuv/3S'
-             b'H4wnE3nr3Wcft+NpGYaWlNWbbvvFixNZb5wxvH7pg+zhMybzMi20y52aSpaLKLg5hUHx62rh16Kk'
-             b'BCTY7mbCtDU/NNahI9N6FajkxlLfongoSiSk6174Un3ngx815c8Wi4XcPDqU/f1duV6se/Y8jVKU'
-             b'Ba76+8l0F1NRKFNhgzWFSblS6ojoh2pjCrlW7G2OAavqymCzoQOaSd+MVW3+7iBY1alJeoOhHGil'
-             b'nMt7MiaE6isQW0X0Mq0sYSh5dKOboVkbCWJBQnVf1OL71r035ObhoZzqzj+wKaMFq7BJc5JcJj9A'
-             b'AFm31Q0w8X0mwo1mQP9R0qBOFKZ6MKKkyvZ0x668ilV5n1U9gHuowjzWUCEBUtn047nUNTObQqBA'
-             b'njLJ4CN9T06fPZX1xTmeAwoLCKndy451uGRd9Wrwab3J9PEv/79yQ/4/9t6rSbLrzhP7n3Nv+ixf'
-             b'7b1BA42GI4Ehh0OzI+08jDZiQk+7G1IotKsvoCd9A30RKUJ6kCK00momNmZmZ7nECCQBkgABEEB7'
-             b'b6rLV1alz7zn6PzdObc5hrZfpvLONNFdmZV57fm7n2E7dC9iTaYkLOVpfFEL18SQQ6STpNSG4NSD'
-             b'4WAIc4srqWMjIFAcr3C7vpDrYAUTwxV1lmWRZaC0OezeMEbBcONF2RFIK/Xj+G8SDJJYXEgSSPcb'
-             b'fpd0nFTXYTQe0ftRfpoSCnXdU/qqJLVqM80NoxwUlEevSytfR0SZSSJayjpxkmDg84maBAwOdLFT'
-             b'ZUSxMokwc/9rOC5KCRTvCxYYC4vLg5WVI+GemSUAL3OjazXbDk8CsB8WzfKGi9R8s32/3lrcLfbX'
-             b'l+OiG14bhMWt2+3D4sIyB3oNBq4K0T5QqyDH7fSpgNAyqYpj3eud8ItdnEOSYjypBcrnifAIR/Ei'
-             b'MREi2d3G2agGECcANfK5j6ktsHqcgViB4L42QgU316xDrzeS8QNETncvHCdSAVdWj5GZj7bVMfCx'
-             b'Ba3QsZyaujgxZZlSwgMiqoPBD4VqJoigzxgTQe3OeoPlgwv2IkADGhRCwoDWaMwJbYqTjEGvJ2st'
-             b'O8cpziDRGxPXOzIDS7kAKI5AOOFGEgYahSyuwmtXX4cPf/IR2GoO6tKEc2BX0gcw6rMQXh5NhiTu'
-             b'owErIyGhqYDSEg2QRH4mY0HPT6ndj+BK8iFAUSTLgkFG1P6igU34e/+gA41Q9RtFqRvlg1j+P+sj'
-             b'PoFlc7HrNBKxn0w6HTa6GYLiFFRtL9pVl8ZL8YyKhr20pq3VwJyAmRScCiejK6a95iGpqRsbOy50'
-             b'e2C3iNrWgoOx0g1ifqKMRmzs2hhxB7QiZYxmPSTCRRAHTJYmUeZZ3ToRE2Clf2Gl00U+FtNpciCU'
-             b'yrpBPG8+pQfdHrRbLe4uSbI9QJqdPJteKn4VhzKiw2FVKNir9UQy+aF2voPokeGFWouURkxaTFR2'
-             b'LAtYaRKQrIV/eT49v7AwXl49QriV2fbyOgCZ4LVm2yFJAGqNxgs/IFnYam13ceXIw/XdteVquCHI'
-             b'5c04koc92A8V1lmc23OViIIo9bmmgN1yknjNbHIrI9T/tOAWsD7c0kaOxG/lfof/Ite78EORLrWk'
-             b'CY8LWpWwAJwMsC0sovhDgIEhqNYJm5OIDrkpIFETk1seSAXO4jsA83MteLK2RVQ2wSIyFzwsNNvb'
-             b'W3AJ9e8nBvIG0HxSwQ6EczAJva4DE9Zz0Tklq76NSQUPwXHjxAIwZd64p4CJdDdvbTRT0dhESnoC'
-             b'/MM2+1QQ3Urri1R9J10MyOJrTsFzKsbkGZXPXR1LLItWq0lBAKt9osNjQLEKKFRKo4vKhHSNRMMe'
-             b'gxIGKDw+DPYYBLGyVPEcNDLCBMoLTa/enCN8gUoYK0UygtjY4Bla8wuENfGCfkeZaLzwiA/Ac9zv'
-             b'7UMlnK9KrUIBGD8TGQDEPrHKKHBk6IgJATMGk8Ru9E7KypRRvjfx2iO+gVHsydrWyt8rQnskQN8U'
-             b'RMAHM6UKWfVqICeoZzg/1K6XObwjieE80mK9gFcKxRN4YUAQ2A+dJMcy/nJ0XjWrc/LsaJu+gEK4'
-             b'9fxsUReGAJsMzouKhzFp9OQFYSNdFMF2hpJQTMKrWQKdZqUhVVl3Q9kL5GRID6VPAFQVErIM/pxM'
-             b'xxCdOsVdkUc0CeiKH47nz8rxkugXtjZCMl+t1Iboo1E2m5ptv98Nn3cqhGZui4cnAdgJQe6Xt0az'
-             b'5Y4eP/X50+sff61BMyFpDYdFb/35U3jjjTdEbWzCD6q0SgtyP0tzeCOUv8j/R748apNLS1mNbLRa'
-             b'0tJEQVfUms0r0jrkyoHwYmIjy9gxQRPHzzCpmtC2u9R0zLNK2uW40F2+cBYePFlnsZ2KVqK8oD1f'
-             b'X5dAIm1adMcbT6Q1nISOuBtCLD0WNQIRaJGgYiXpwHNYUDIQAroA8HhlZqoXVZKaPBmZpiLwKoLg'
-             b'5NgFJ8Bo9pJVqzWRUx1n/iIQk06HFdEdEVhC4RjPbAQr83fcv61wX3R7XdbZl3ZypInpLAavAbaU'
-             b'kcboTRSSiRa8hQjEhPdVajWq3ibjIWMYvIutdSv3Ax4bytgi+t+r3LF0ZGg2qVx7NIeptyhIso9B'
-             b'BnsbOzDp90LgykXshveDvCV8MpziClXa8wKK8+IJwbr1lkSKev1hpLkaa9L4CbUJahUebaD8tdaw'
-             b'zkUth7SiiuZBVAy0AtoDwRUk4SodKyklAdv/qIwXVQhpZMTdIhCwKlEEBdTBbBcW8CKAaAYCKHSR'
-             b'TaJjpUKyRqaEalcjp2QgE1ouNX8kcfYmefkxRsNE1kOc36dGCt9nuS2bOkvl7+J9aCPGxcSku9c9'
-             b'gC30HMlsHFvgcdYbTfjowx91f/7Jz2Yc9Ze0Iabl2IlT8C/+1X9LY6PZdkgSgN7B/t+9GUJwWj5y'
-             b'5KPwJP4bfUhpwQgP6dNnj8PieEAzxAneKFQVF2xoUqjsKuMEeO5fIXUy1MpH0KC1Jc80DCoCsIoi'
-             b'JlBEFDMtS3k1thRB1AVN5kUlLIve7gokiy5mXgOfExM9E+eUIGApZCFcuHAeFj67ARvbuxI8hXoU'
-             b'FqxnT56wtWxeY3Q8dSWUV6/2rJ7a/gyecRLoxVfAyaxZpHDHE3VnK7XUJUDHmjSipSGh+9n5RYRU'
-             b'eBG3Srsw5WEt8+71HPiIXC9iUpSarWrxa6BRr7Cls5GkDLsM4drh9arWWeiJEfnlwYICDiW4yq6M'
-             b'hwOqGCkQUat/xBa9JJ3L9E9O8jSQ+Sgqg10FHAmgJDUDPLl7Qf+LJkkyp6fmcV4XGh3fR739Xaiq'
-             b'fK8p2wOXUepZnK9HDEAkGSbjGfx5vV6D3nAcJy1kUy2AS8QukMeBSQ54esFUC0MTWzcdwHiQQV5p'
-             b'CpJeZG8JS1JhpoVhjwnl1kd3PrAi38zJnRckv/XMty8kgeFbIBPDIK7iJr19HptFqI0LCRhfT5Ml'
-             b'doaYI4h/hxH8jY8Jpfc62Zf/pfGAwkUhJe/Ol5QF5RlyzEWwcr+rloHXc+WVZMxJL3ahMtWV0G6f'
-             b'J3dCV2nWxtGFcLb9/mf/FqnBdnYiDlsCsLSy+nd+iG5nl19748b3cZEtOb9hkFsPVTEGsqa4wLFn'
-             b'QEGLqwFlGkmLFGf6OAPOGB3PM1OTKlZnYkB2WjWLMJFK8nA1yxxiVRRked4M2nNzsNft8CJnrcxo'
-             b'3QvzcSssBBenu1p188Kzv7tHoC/kL2dSxbLAj4W93W3Y2d6ApSOn2L5X/OA59jrxsmcGAaKTVdlQ'
-             b'LV5BLFmxtY8BNReRFToH1og50pQ6A4x7SmhtVq0rwndNSOQls1CamPokS+tTMuLFgS+1Q9j+1pP9'
-             b'rQjpJLH2aCKDbVekmY1Fqx7fNwnBYtDrk+TyZDyhyrWgcciUjicpEUCqMMmoCKJ+PGsZ+AhAiyh8'
-             b'LsWjP4HOvys2h0q7IjgCxER0SZvchgSMu8U8c4eSpC7+z2ZISke9DlXahJ4XdklSDyoZHHkTKXQa'
-             b'4AykrgYG7+bcApw6fRL2u7fZE8DK6EUwKURn9SovrPoLrF9RELYhT6DGqElRRLCjIXVMJz4ILqpr'
-             b'glbeVlT44nV1ZE5lxZCItQxTF4z1/tkFEFkYDrssUAj7JilEYhs+hypjVKDkAaCjAaHYojCVFRMj'
-             b'FQhyBkqzfxMTdC+JhPE6XlAhIbF6pjVgyt1BUCZFog/qvYv/wCoUx4V8al0SCbJmGpLCca4+JLPt'
-             b'977h9amiLPzs/B6uBGBl+ejf/WGoUk+fGT2wlUbPFf1W9N0JK1Nn/wD2D7qwvHIktladWLciXquY'
-             b'SmvZuyjEQu3YYiIufwmoJiIBqXKguaoA7YoX5Ud5Bi0ceeK3O/KyJ41+QRcTuU+wBEwDZOc341QT'
-             b'UGDxkSXAFdmVS2dhbX1LsAReVOWQKTCGfm8AS6u8WGfVZhJd8dEolisi+riRoKrZsAUXMAwc2CaP'
-             b'crWROy0Su9I3xtY46Qug06CioGVGPBgNBYgFon+gh2FKRVcad7xgbgOlQOQgqrqBBsTw9/n5eVhe'
-             b'WoJna5viQ8BKfkS58nKx5DoVIuqifQAo2cGCyDwYDSqicmcjUyEK6kfL4tiZEC0FVRTEn9ewWrWs'
-             b'pDga9aHebEMC47PZUm9/B3bWn0FuFYNhEpVNIqt5AVGhwS7JUMsV4SBmmWaJFD+24dU8wko3hn8P'
-             b'cQ1ZnkGJQEcOhKPhANqtRb4zBGsyHfTZGEoZBQgKZNGK2A0CNegRAGVsnrsiAgI1efV6bgsZH1Sy'
-             b'aMediQOjBlzr5NyH5GB+cSlx8r0XTINJSZXVMY6JN0/yZnCl0RpAyr987PsnuWtfet3RKAMBiZa6'
-             b'eS4JXWrwp+cEJbgPSGAqSSrzd+WV6sHp0+c383yWALysDe+LufmFF4qn2XYIEoBOZ+/v/BAXpEaz'
-             b'ef/IyVOf7z66+a1GlmIMPty7uztw8dIlAXBx1UeUJVBOehoZkMWr2JLSopOpGlkR/e4V+a0ytRDb'
-             b'gGoZKsIuzsf94H1swMGul/likbzbdaHS2bLgwqyoC0KpRY6B4sjyAlSEU40gMg4wzFHHuXUuQD5f'
-             b'qYPasoAwGKhSVzMjrFS9VHpefNRzGQWAmujY6FfA3QTe6+7BHmIvQsVbgagBgB7plUb4WRs6LgoH'
-             b'M6BNTJJYglY1BHQeLFK3pMYIwrWGEo3OxH3AHyA179iRo/Dk2RrkSPnybKozmQidUVTlMmIo1CM1'
-             b'LS0UvrRm+CghG+EKEYHvS5VfIcRCT4s/gkkn4eVGqwWTcM5JmliEfvQz2QtAkfnMDujsboa/M/3T'
-             b'ix2xj0wI0UmIinec8Kh0MVe80m+SgTMe46Dfo06XmiFx7uOjV8IkJGQD7E7ki/LrBVXleB6Rxqou'
-             b'eHyfZExHJCMlW0qckqyudm/4nKXgL0pE6TyLvwZhEzAByrmz5kVLARMW69QxkkWMNIqTKqEABsnv'
-             b'oteBVmuOPRl0rwxEyqqJYkRWgIbpudFsNI4mSjq/OnaxoH4LhoCheG4K+QTHDbvoaUT/Dc8dsozw'
-             b'noMIlOVkMlyH6fLS8gg7HLME4OVsuGY1yIJ7dn4PVQKAvOC/bwsJAJy+9OqnG/evf8uIdnkmevbP'
-             b'19bAahsUFxakclVyAhLRjBcXDiuoea++YsDub6IF76ZSAUMGySfUMJGp4MoHswVcKPq9LlW8VQqw'
-             b'BpLWSmopCyGLFjpsO6JcQSZdAGrAqqY8JDlSnsUW0G7W4O23r8FPP/0yfEdVFmTuMjBIEluiU/IG'
-             b'QICYetl7EbNheVTxVafZbk6dEDWtiV13Dby6wLtoeA8L2ImJjCiZi2LgnKK4za5QGJ0wDx3x1iGD'
-             b'qAPAYxpT0meDv6tUZzQ4m8hFx4CH1yOrZqlljriJcA373X2UMSQsgFFHQOmlYKuWAmSs5qWqLHU5'
-             b'FEFf+BTooaTupiI+eLR1BP6JdewExyXo/2CsvMWgHzyrIoo8NN6P2+tPob+7Tfa/Gi8LaS+zdC3P'
-             b'wAvP4xZNktSwJ+EZWYfeSFfGEfakwjTXqKXACQQGVXxmdnf2YGVxGSZOnATp3tNgrVj7TNr64T5B'
-             b'7wrUxiDdCxuDfIRpaMciSj0XbDwUgh7aChsazRh2+gO25mXTH37/dMqdAjcZCb+f92JCrBxDY5Fo'
-             b'oRj+Oze/xM+OSPeyk2KRVA9VQVG7IyZL10ywAyZWi7ZExWXNjihnIXoTxFwJx281AVc7EaN+Clm4'
-             b'7tP0fBgVuaLWo6/Ucj9LAF5iAoCspko2OxGHLQE4feHC3/9KSABee/Odz372N/+eFaIsC3egu9+g'
-             b'P5T5t2h/4UJFY9ppHAuQK2AxlQXOpTas2p5m7PjnRfIVF3UvAbSCGvpZHm9MbAWTgJDS2LgEZsMZ'
-             b'V26sF3Hmr+MHDkrE0mZgmPHSkuaKKye1Qq761B5Y4XK42H751Zfw7jf/gER4CMFPldZYVPGMVF5T'
-             b'WbiZLcBzTEFQq7qhVjQCn3Kl1mnkQZdn8wyVlmpKW7bCERc99mQuKJa4GlgVmWWNxhN4ofQ0iW2h'
-             b'Bm/Hjh8TnjdrN+J5R4pgUhQsYpscA9pw0CUgKEh3hbjnpXEDqByzhHzyC0h+v7EyNQLcIxsAx0lG'
-             b'vdWU3VTkvInVPQYvvC7b62uwvfYoXL/kEYBjIiuB10jFX+gOxirXJOlouk9FkEZHAg5v/TqcPnkS'
-             b'Hjx8FjIT+U2l94eAhKZYOzshKbucDJ0M2Ih9iLw6kzAGaorkIkZFA7lLNsjg4iyd7z8RlUJZYjzv'
-             b'qCWB2gpI08yyKLGcy32BgFUQCpcvdWdoOOaZkZBXaqDqfV7xCSahbjx18rw4NaofgY0mWFDGn4A+'
-             b'L6JQ6QuZCHACDRFmmRIeEA+NwslzaCAlYpKQcF6ZAJHWZr5WrbuctCdmNMCXkwB40iuZbYcsARj/'
-             b'Ax2A8KjBxVde/XGt0Q7RbZKrzjnSn+7fuwtbO9thoWxQtY7obYs0P6wSDMuRUMvTZtEprLwAex1k'
-             b'x4TARZQ9LosFIu/VvpZodAyaIk9zsFHnHW1yO2pFq+su0ccKCfo2LahU1UKUglWaYCGUwssXL8DN'
-             b'u48ZACW0L1x4t7d3YHNzC46eOM1ip+RQNuVjyGRxU933aEtsYhzUliiDvTjDLoz4nXsTq3QvYEcj'
-             b'gLXUWWcIoxWnQ6ZBMnoenLZkfRmALb9rI1DN2FLruwQZoI4MXrOQsOAIxIpGvpfAsrm5yceFCY4i'
-             b'wul65QQOhJICoXGl6aHYNnOr3kapB7yovd4+NBstqQYNDPt96qjUanU+f+qwhNiH8FqdQIDVGECw'
-             b'7T3Y34PO+hOoiu4DCzOVpIrlWguOnu8Ez7A4pVNG5TsVslEwJZ6H8H2tdpulbVU4ydtSyuVJn6LE'
-             b'rZTuioviOL29PWi2WsyO8czNxzm4nh8Tx16Mqmd+u7A1JDlh8Uu5v7GVnuWRMqidCwROTod9ukZW'
-             b'MSlGpQNYhAdIR2EEk/D9lWoDfBmwrwLI4ZcH3T0Y9LrUfTHexe6OMk9i8Z+VwH8x2ZA035ik7RFz'
-             b'U8dWVI6TEcW/aKLjpLuEM37W0OLkm7UjUGI6KxrNpstFP2G2vZwEIK9UZ+P/w5YAPLxz9+99gSlc'
-             b'03tzS0ce+87aBZX7xZi+tb0Ojx4+hDfefCs8rGNe3HDWn3E9Q0JA09Lo0kK0peUiy3KlYry44Vme'
-             b'Y8o8FefmdiyLr0rYauVoU1/fk1qejX4/Rlqnyls3Agiz0WHPRhBdZpWQzPK2S/MtOLq6AM8396BK'
-             b'CQcHL5oHP38Ox0+epgqMePk+VYTOTUrzXB0zu2SeozS2svmMk0paEM/eulJV6iJHWwV4rFU1tizN'
-             b'YWV+rsHcKSagNE9WRYQIvEsDeLZbFRqjle/yosPDbm4Gdju7IuWs3u06CxftgnCOh8MB1MjISFD9'
-             b'1Ma3EVrX7x5AgwI+7/tce4FrYGnV47gks+m4U4fA0hjKkAyt1PUhQIzC9Vi7fxtMMY7yylHMhs5T'
-             b'lmYPAjjzIspD75P7R1vkUJ7HK9wgfM6AbGcZDMr3nRWTGr6nBsOx8NUFo6JBUCrgdkggWAxIaId+'
-             b'CuN+CK71ZnLDDOeExJNQAMozriQTHQPFihBd0PA9xU0CJ8qDwM8MJhXF9JdXcxAFb05wMaGvVkmL'
-             b'wUW1QRMfGtLr8ZZovcreod/KOMjbkkojs35M6iJY1ugog2KjEqJM/BVT4LwqBlq9W2IK4gW4SuWD'
-             b'TW2BmLCFG9y/4Ccx236/CYCwScwsAzhUCcDJM2f+gZcIvNNdOXn65vPdJxcqxkS1PVcoCtzFat4U'
-             b'avQBZPkbg7aA0CJ4iH6fleO8YAgiGri0yNE6rpxjFTQp+ZPje7E6xI4EGp44Y6Jois5fvYCXCo2S'
-             b'amQiYENqMYvbGdrVXr1yBZ6vfxiP30mw21rfoPbmeDwAW+OKJlZRErgU8e1LXfZk06u5EIO0QERd'
-             b'kFpnLR+bKgS6yNI30d6VRh3AFqtZ1MtXlz5pt4rqn5UKkroMujhL8OO4K+ZF0chFqmGbRXAZqsph'
-             b'ixb9EJyKGaGhUTEMVWIX5uYWxZvBxUWfrJ9DQoABGo17vEgTIlhPFQWVkmZFQhkTPPSe4LGOJQQ9'
-             b'Auza84scDBDoJ4wIoidOx/D88T0aweSeK8UooytgPyOB35WbIeq4B+Ij4MQoKGZykGh7mAgVjKKf'
-             b'ei+SxhmPMaKrYgbPnz+Dg4MOUSILMgzy0D04AFSrQ8AbqLS0WAojhTIPQRh9BJAtkMnog1grRSFe'
-             b'AKI1kdm4KueWmRdKZTSCW8F9QC2IcUhKM1W/VJxJSAr2Q+LVnpsXHePSMEDkidGsq1Fv8hgP9z98'
-             b'EZosoRa8EU0CztRMSVjKRPdJbt07UJcoPpYySNAx0Bc/P0/dAZalkKc0Y26qYhCmE8c4BJWZpuef'
-             b'2BZTFCfLZh2Al7pZwdLMtkOUAOzu7/2DL2KAPX3p8kePPv/hn9ZDec82u1wBrK09gzeuXZMgLXQ/'
-             b'k9p6SltTzj1O2tU7ICt3qyN12CUHNxQ5IZU19XRXtUCXREQQNDTphYVsLPKiLtKVvFQnmTgG6sLH'
-             b'0cyyIY8ReqB0BZBSNdduhMU7g0iGstw/P+h2JHHB76pFNLsuiU7bySJu4pXN4BPKG8chKHLjUVpZ'
-             b'VeCijnpOqPhufx+azXlQ8Ji1NloHs/5BRkwGF+V+nVRhUdsmZvCZjAFKuDKIUqxGm8UuGbwQR13a'
-             b'544DClfnloIbd3Zy0l4AVZAL1Tly5p2OOsIxtjA5UBBZOK5GO4+URBIpsobEgnDsUBPUsQaNLKuG'
-             b'BMuKvn7sX8TuwfNH92Ha75DQjYMkpqQgRwo2LJGnkAzucEiix/dZUTKysZCU/SEeB74VA7mNwQwS'
-             b'ndCza+XWxgb0eiHZaS+CD0kLJr2on6GCN9y9Ut8FqYWnDibh2G0ll+RA2uqFi4kizdsLHmlEAC3O'
-             b'y0lmchplpDFJmRLf38V95nEGy083iDJZ6qhYm9Q2DbfxKWU0rNeAL2I3BxOQPM72nQxRxHzLc5AH'
-             b'SOO5SEQ1iWWhCTJI56gWzgsggM+5aLvNAERI9zd1eCzdb16ElyiNk/ysLJI5217OZmY6QIcv6Wu3'
-             b'mvAP/WnUq3DtrXf+s6k2Y1DVmeCtGzdJM52pbMjJ74XXyq1Ire595JJT/UDUrowBQMggMOKNHtX/'
-             b'IM3ofbmKc7KgilWLZ1MXkgoWZ73UdhRqYbyrud4rbBqNM/c5E7piRgFwabENR1cXaVZKVrWOQV+P'
-             b'Hz2BTqfDank0qnDyhxcplUVVSqMV/wHiixNA0LLoC44WLKOdIwUq2uBaqNWbEVhIIdyyKM9U3QSF'
-             b'Sshx30fUOv0304VUUP/OR2nkqNlubfRoN0KroxEKVu/FJFZ6luavlpztCnJfEwwC/l5WSk6wssVK'
-             b'PhwPOSbGDkiyNnZSlfdDElWQ8qMnHweUGKZ3YdtePgtnkNVGS66lFa8BTkC2159Av7MtzANIUscK'
-             b'ILNSTatJlOWuBQkhlYKOMgGcJg7GJ8CoMgIsJn0HdL0N6QJk8UZEnEslBLN+v0/KetTJclyhI4gq'
-             b'o66F3KsyXjEqq4tGPsWYNYiAaabWi7gVJEEkI8dPnQNRCixkpIVjF9SVcJMhdXjU2VHnuDoTyqpK'
-             b'J2V0f3+/I2MGHnFg5yy17R17FCDt1KTug44KqPvh0sjER7yLYF3kWaPj1FEInbuckltuEoiKp0sy'
-             b'1QaSHgV2PUbhXnOlQKQG1bnNC8afFDJimv35/f8pZtnVYewANBvtf/BFXGxPn710vdZc2HSDnSMg'
-             b'9Cl8NDe3t2Fndw+OHz8RKvEuO7A5Doi06GkA9uwvj0GMKnLtzYqqHs2bxdKXHnBnpTKwcW3Hxbuz'
-             b'u0tz1QryrKWSwb/Xa02SJo7yvN6mrkKcjbMhCncwnMyDfaqMxfEWa74zp07Bk7XtCKqqhHOAIMB7'
-             b'd+7AO19/jzoOhdDEyD0LuN3uZRZNKYyABJHiSAYmYnxEfHfUFQiLL4knxX4bW6MQYEvlfqNor3ip'
-             b'K5mSaHtSsYpegoLQzAsYLBMXZSUHEtAsS9awNIkVXIGyFgjAScYwGbWRp7TvLn4mV8Ih4et1oVJv'
-             b'UGVZiDVyTp4ISWzJpDlJTEDwzOfVPFIxacRBUtFVppqBACYk4o7Ctd1efwajgw6xQxh+4ARUkYlD'
-             b'oWBDJJm0UXOgiLa0nDxmnDzaLPlVgI1tKNVKwBHV3m6HWv+EZxFpaLqnHSplViiADfsDrlil0+Wl'
-             b'O6bCh6NBj3aTpI0lgcDux1y9zfRB8qbg8YcKR4Ei3z0fCyXYqC6InH+k9zkfOwdOymxK3vBn6FWh'
-             b'LAOt0Gm6E+7DWjW6OhJAVkdRPqrtUeJLADwR1WKlSManFCYNkjiw+6T8J+dNO3SeEnwbzZSYXqMM'
-             b'ROk4KZxHRi8s7W1iwmQkARR9D5dXq540C2YjgJfXATAzfMWhSwCKXwYQlTacNc7Nz2+sHDtxa/vO'
-             b'5pGsyg8+PogIXnr69CGcOnGCKSRZJbHagLXjeVZZIQQyznppARNQHnHDC2kXSmvYFfzQE8+dAEqF'
-             b'zBEtLCysiDZ8ar7j97XnlqC7swmRxhTb3cIH9yzcY0Uml5YxI3WKKanTSQJydHWZApwTMNiUZtUZ'
-             b'3Lx+E9546x3Stq9Wk4OiExwAfs5oNGSgFVgROpEFlM5PHir/MQHZKCHALoDw+nVYnCiIJnYGRqNB'
-             b'SLCGAihDZTed/WcvIq01yHufVPaEoqX684qh5JGFMDbktSEyL1S5R9zdOp2DkFwNYL5dZ4qZir9Q'
-             b'J0DMecLParUWna9C8RVuQjr3qmyHIWduYVk6Pcn9TxkhKDWck+x0EpzB5PNgZws2Ht8nDYZM9AIY'
-             b'riCitFi1FAzoc179JYSOSRAEq7MHNkHSfr4EUKZbJlVDrYexsu+RBXOZ+y52u5aFeIbDEXT296Mg'
-             b'ESd8RZq2exYGgjRBoH1BhUFMDLDT4aSTxTTSBHjDc4PXvNpocHIMbLqkmg/el5UMgXQJSL3QVEnI'
-             b'Bzs3tfDdNcJX8LgLDZYo4Q3XZhCOryaJv5oJqQGVjwlbqS3sVQbYR55+5PkLToWeecN2xMap0Bck'
-             b'kSwxsjJlK2uTlASU5qtTCm8gqk+G9SGbjMbGZTMvgJe3ebqXs+rsTByqEUBBpi9//x+s2lF849Kr'
-             b'1344mk7j5N4JDe/m9Rs0+6QWsuPF3aFtqdCZCAQWHloUmCB9fMuSr0QRVGSzE5S7k/Z/wRgBo7gA'
-             b'0QZgVHxBwDldoDAQ1pGKaKyMExzNgJ0q4yFdzovKm1RDJfb8C0InuK/oUb+6sghvvvEqAbUUlYzJ'
-             b'Sm84ZK1sasNPo1sZVjKTUJGiPnxFaDQkl4vOf7L/QAA6VioktTY1+KGAbaWykj+CmfDyHgwWOHYg'
-             b'TXqlpKn/mkmoaxuzARX919rWEXjQKbJapWfBxYCLY46155s0clAjJqw8B8MJ/NVf/Q2Mpz4EoyZh'
-             b'tpAuiG3uegggaNCDDomUcGCrPs8YQT8YUE8DxwN03NJiZ8YGIgMMV3uILyBPh3m6TzQIooXuuNeF'
-             b'3edPeX4vo5ooy6sNZMv8d+dZT8IWhVTQbDDlDZTc8kokSKki3QvLX5KLzqs1aGB3QxUbXxhrGcW1'
-             b'Qm8wiLgKiFTCKc/qyXwyo0TJ6+tGW/KTkPQMqCOD58yIEU6kx4ruBjoj+umAwI8xsXGp6sYE1hEY'
-             b'tgXVsL/aOauH+7RWr1HyOKXRjE1+UfgvbP8L5z6OoRDEuN/hjoR0YZxgPxgbYiKQ00XMgS2N6kwc'
-             b'N0U2oPgoxO4Rp9bCDEiJkfklP4aokWDjkE3JiC+8a/bn9/9nth2yDkD2K5AfCIk788prP5miu58v'
-             b'i5wAqe0hZ9qgJSw90NMS0psNBHS2RG1HrAhzogmwzG1mRStcfNctB4apLNDWJTpSFMeJLnYcDUYE'
-             b'wBJnNvkeqy5n4l7GdKhksBPbz1HtzMf3Vqo5HFldYoXDgtHRCNp6/HQN1jfWYXlpkXTpaXHDYw8L'
-             b'd6UqXG9soeL8tSIWxpb1EKjdjvN8sWp10m43RgVTDfm+4xiFKmsoScY6J+h2EVEVu1ae8xcljIRS'
-             b'BLViFela5HRnwpAwfD3BqsJQRgnecFzAw0ePCaHuRJQHL0ElBJKf/uwzeL6+CX/6p/8cLl84w010'
-             b'x/N2Rscz9Y4McKRyW1phB0Hs/IxDpYwcf+3qkDMg8tFRF94LukupjZYppAfbW7D17BG1vgmnIcBQ'
-             b'EwNIQpT7EpLUGRH1idA0J8yUjM+fBCIFnjkLpQ6MzqU5icHfJGe6CMRM5jdGKvG1p4/CMfbDdZjS'
-             b'vUrYgc5+qPIrVL2rJoST1hSbH0mrFcWkPA9/MPhjd4zUB1HRLyTM2I734h6ooE2mePLOjoZ9wr+Q'
-             b'u6Rz2pwX1oV0txAvQZgEA8NBn64D3a+2Ss+miYJQXLnXK3U48C6OBlgASLpFopGgCpplxosmB6Jf'
-             b'yM8u5RAhqSaBmZyduKMVtxXmQBlG6KEWjhsTwoipoXUEuy7WY7JJr81GAC9xBDBDAR66BKCzt/eP'
-             b'vqGbd2F5+chX1UZ7An5YsRLAqiEwbm6uw/bODiwszLH9q2M0OdKdSFM85yqYNMvHRZTqVbMgasuL'
-             b'oqBh5x6xB06t6Yis15axTsg9L7gYwEiaF9vOwhgw0b5dq5JC2v5OJFdtiRKohR3rCyPvf3GuDc1G'
-             b'HUYTT9U/BpB+fwDra0/h2NFVmEwsaQJUQ6U4cRMK7tqaVv15byAmATQnDwt7Tuh1kVSeTqLlK4Hk'
-             b'EFAWXm8QZiAO76mCjlLDWbmC97KAG6acCQjRgdICVWVPgo9oH6iVMqKyCdAWjuFvf/wBjFH3X5wA'
-             b'6WoYXtjrrVZIfLbgf/lf/3e4dP40fO+734GLF85DtValfaOkS4M4cvZFgRCXkrzRJNEfR616J9c8'
-             b'I0ocjlYyslD20eAJr/nO2mMy97HaY47VZqbhl0bKtgQApNaxyhsLRZQ6Hk6TnUyohqnW5zjihaGQ'
-             b'bInUxIeSP6tjFhWwAlBbHEz6bt++A1ubG7AwP0/nD7s5rfm5BPBEOQxyw8wBouyujawXSo4RQGm5'
-             b'/UqCPqolEPsSat7kI3Uzuivq2EPvN+uS86FHoF+dkfjSXTNSsXuhwArFgmmjYT/30FdB8BI2qhjK'
-             b'yUJ3QFfS/ReHQYj3XaojjeAFCs/mXDScM+n6OLEYhlRLgI/aGk7oaHp9ac3IJtNx+JoZDfBljwAq'
-             b'sxNxuBKA9tzCPz4jCA9jdiJ/3FpYejzZeXYxq3Dblma0B1344hefw3e/912qbrnlmQl4iYVusIIe'
-             b'j8eEnPZiCoStYQyCaBOKQZFBZKIhME2JgRW7XFIIjGCrEn2Q+OEVAVNlZIVqBXzoBAHHNDD7gjSp'
-             b'NypEoh4EEN3r0Aa1Hiq4hbkWPN/qxKwYZ5S3b9+Gt995hzsRjgFd2C5G/jImOy5K5XpWRZQuQ4F6'
-             b'7Hhe6JgwGRoJhc/HxbrdWoiLv1GAYng/fofy1SnYaiCQ6tmUSJXGcLegiOhsqa1QrVGbJ85EIxbc'
-             b'3w9+9BO4e+8BdXLI5hZE8lUMZFj8KaMq/+adR3Djzv8G58+egm++9y5cvXqVueMIanScxGHi5+Q4'
-             b'skwlXixdZ/ZGcGTxK1wJ9rvB6z4Zwdrj+9Dr7EQRGyMCNAUo/MyXVOmS/pz3JRnlQoSgCtae91EI'
-             b'iWv46L6nOhU+OVKyOZTYJ6saHwZq3oHIgacOSDhH/cEY1tbWYHFxQUYqKaHTtj+qGTZIETAXSWNO'
-             b'CjXYxW4Eyvt67ggx7V+CcCGVPyV0SV8fZ/p8bWV0ljGfv9vZh7mFBUlKXRRcqqMAkSY+IeGYTIeU'
-             b'lCIIWCS6ONkkIKfSajOp0KfUcfMizKNDACMjB1JA5JtLqJPC7IFEQUyPbNmWmzsFOkrA41ahIn72'
-             b'WSODcl/5M4MAvMQOwOzcHr4EAPz0H30DFujz8+3u5atv/u1nP3h8sVYphBJmCdW/s7VOC/g0PMkT'
-             b'quaLENwr3G4PCwNynytYGTuZ1cqTjw87fg62OhW0BeX5ty3ZovoEfDIC1uOgWAmVpCrPQQIaeRs1'
-             b'5pmOp4Y4JlUe0g3wJXMgRD+7iaNOwjtvvAp//f5HceSAHO9H9x8QGwHn4bRviJMYDiGvNYSCBqS3'
-             b'jpUXKbyFpAABZYgaR0wB2Rw71kLgUURyeqOZtXqtSzsa/RJQi6GLc2lsrkqQMr7EkPCFLKSW2smg'
-             b'LoDyRJMRTnSZY6QAtqgHown86KOP4f7DZyRmoz4I2hRRFUYj4En8RgwieF6fPtuAf/fv/wKWf/A+'
-             b'nDh5Et54600Cgy4sLML8wjKMMTJMEw6EjGBUe1/NiCwv8njvjAddeHr/Fkx6B5woAESVQpp6GO0Y'
-             b'ea5CJcGIiHfVf6D7SHEUGQcrUgMs4nW2UWaZ7aXp3imBD6kSymwyP8J7OrMShwR8B5wkjCcF3Lxx'
-             b'A669/lriv8uz4QXj0grBWIPedIwjkT60FxYlMItmhRPZJ9UR1vGPT1bLBAhFb4ZwPHWc94vvgfpd'
-             b'mIIZHO3WHLM7vDo+Jq2B/qDP+gDUHciJeaF0vHq9Dq3wWnd3m6SAveJRTHp+nE+S3nEm78VvAb+H'
-             b'tCRKkskE9C2iE4DVxNUnNoB29YiVa0rS2C/KXDsmUtqZTs3LTABmKIDDlwDk2a+e++CCcOnVax98'
-             b'/J/+4t+SNKxlMRusana2tsNCiDSlOmnnM1p8SoumBmpcEhBgh+16QnyjBGpRCACQ1041BlFrW9Wd'
-             b't/L9hej9Z9JfZzPZaaiuGlBvt2DUGUbH17iElgDcEb+Q2Sg9akpVZfRBB15qjqwswOJ8C3b2B8xF'
-             b'Dzu6sbkFd+7cgbe//h6MxpP4wExHI7DVGhscYSt3yoBHdGJDTMG0cJQUOVGAK0Su2En7lF1bc3ZC'
-             b'tIJ1EE10BGZlMlqw3okAD4vDqM9C2VqdT4JRJVwOLI594vGzh8MC7j16CJ99eSMEhBFR1DAZK2K7'
-             b'F6RbIEp1TgVtUuVcCwlPFi7YMJwDPB+3bt6kAIIJwB/84bfgzPkL0KxXqTLOQuJkiUBQUNBBGiQy'
-             b'Q/CzKrmB7t52CP63QyI1YMMpAYZqNY5BwXoOjpTEuBJiX16Pxy3X3QmeQN0qeUxhYtmpLWlOFKXN'
-             b'rElGuNe2tzZhOOjReQdlchhbAs5xFEMu/e279+Cg1yOWh8oZE8zNFzG4qXhVTkG3LS1+Zg1QgLTc'
-             b'YTEpq5MExEmngu8HHNeUqZX4nglhYAoatVASK4556PPAH2VioukEmAf6M/kcHGfsh/usd7AfQX7c'
-             b'NZOkjfACOvww8EtG0DJWMzHhUz8QIAfRUBiMx8kSxCS2ijUJz4KJMdp7E6ahcNxBAyf7amYgtdk2'
-             b'215GAjAcjn/lm6aFhxNnzv+kOrc0cX5AQ2pcRzCgr69vwv37D+G1a+9QlcuOciLYQdxztAbOpT1c'
-             b'EJd7jElARHaLUiCB5HjejbSoaHHrFPzHgKRu/yAElybKhokbGrc+adEySSpMawX1IeRFPgUB/mqd'
-             b'NZY09R0PBiq5hVajCjt7vVit4nE8ePAA3n73XaHWiY0sfuJkRJx5NtTgSpESl7D4ZdUGtf3Dm3hc'
-             b'IMAyI/szmY6J3VCrtwmfQEHPWgKYYScBZ/xTJrzH6t7nVlrhmSCvGcglPd5ITSQAJoISw8L6+PkW'
-             b'/PjDj6EXAj+K1pi8Rta7EVUenetSUsEiQ1kyHoLE1UaTpqyWxS7N9s4u/MVf/Dld63qjFhKCeXj3'
-             b'm9+Cc2fPwtLiHAwGE3J2rIfkAIPy3vY6PL57A1wIYpmIHmmQ8SZ5yhsljJvofwxKhPCCYHeiZqc8'
-             b'ujS/Zr69EwlfSExH7tjoBEhscnGk1D3YhUFISBBkh9fUQpVpanKfqFIijhi29zoEoLz66hXq9igW'
-             b'YdjrQ73VkJRE7mYVrIpx3sGw3yNJXgT+4bOC30cjFRpHceDv476ESIqJlxfFRiNufpGZIgBBHWsV'
-             b'k4KAgo32nIg9ZdBqL8TqOyVPSMMchSSePT1yqwKW4iporOgU6A2hF8UkeAQxT9RngUcyKs2MV4FE'
-             b'h4j6axXaItLVIJ0M/tJC3EEjHVJSjcK7bDwd2VyEgGbby4AAeBJpm7EAD1kCUKk1f+WbMBidOH3h'
-             b'ZnNh5U6x/fgqVVOW23YYvA4ODkp8eq6SrD7lomJmxbUP/16RSrIwHLQtjQSmwhvmeTr9W8Bw2iLE'
-             b'CIGLI7sMGkZsGwXfofSvixK/pW4qv+ZV/FarKwE0mZJuf8meFzsNJ44fh/tPt6FGdCagCu7xw0cw'
-             b'GgzJVtXF0YVGkymp/BEiXrVcpxPCPCA1TIF5XmbbiiZXAxaVtjWSAPQP9sJHMsfbai+lBLwy0YrP'
-             b'xK6HZ2V4qIXghMIwJlSN17+6BV/eugO7+336jIoGDdwn0dpPyHqfFvpYkfLbcEG3kUIIGoFjVYij'
-             b'hcxV6CyPRqgTsQ4P/o//C5qtJiwvLUC1msPly6/Qv1eWl2CCfHjEmJACYkadFECfiEoljX2g5CMg'
-             b'AjHU0LeiBYSn1kpLWapFTH4ynX+b5C6IuhI+qgGWPSoFWCrnfW93X0CnVpJLE9ktcYItLIvp1MPn'
-             b'v/gS3n7rrfAsMMYB39pot+NgddjdJ7okdkPUGMqSboKhoMxqeCyIhElEQ49fOkEZYW4qMdHDzhqN'
-             b'mlBVM3auSuwHwYfgqCrpRVgBIap9chZtupG+OiQK4IR9CATLUJSOVSkXXrKlyD5xppRBlYGUBUlF'
-             b'UyIqior6MVYMlVQ8y4id9MLCghQIU2EpSL5RFFlROEvOibME4CXFfw/57NwevgQAKW2/zlarN8Zn'
-             b'Ll7++PbGg6tWXbqwcs8MbG5tiruemntwu5bsR0O1B4UsCBhIcV3OlcLFKma0IFrWCgDxIucqoGDe'
-             b'tUk87Ro6pwk4gUXhDPHG+Sbm2aeRNrgimZ1EaaUgabw2Ip3nHQsFYRVjpcJGAOPpE8ehXrnFFDRM'
-             b'VEJ5tB8Wc6QDXrpyDfqoQOgTR9qKihtpHigND1MODOImCc1oe1/iA1XjjDgX6pZgzYf9felm6Ky3'
-             b'KAV7nSAbqRR9ZEogD7w/msDdOw/h7oNHsLPT4epWrGlBBF3wPDtN1sqy8SK0Y0tmr1aoiFajp2ru'
-             b'QzoWp/x6AYfh51RCEOj2ByQqhAHoxs37NJLAZGFlZQlWQ2IwN9eG8xcuwtGjq7C3+Qzm6y0mPCB4'
-             b'EmWmJ5M0tDGsSw+qpWD5/iAFSrESdrHiTtx+pZ7xiEUqWKQdGogS15j0kbKfNUn62jErQPKkCFz0'
-             b'ci9Xw7W7d/cebG1tkZ4BWf7q7NwwUK5G8saawHjCAlDiG5KzRGPMCFBakcSSTHtIbyIjtgkrNsp+'
-             b'h/sLnfsqJKfMSYda6Drh8ROS3ta4Y+AKsRC2MBwNSMehVqtEBoYhzYppTARtHKWUWi06MjAQZYDV'
-             b'5lpZEibae5vY6SDWkDzX1kDJKUQ8CBwkS2ngfQFTthIlKex8a3M9z2W8MdteRgLAehLtxZXZyThM'
-             b'CYBShH7lDRLed/bya9//4od/89+1slQ14sz08ZPHMMBEArN2y21Vyu5DxUPsAJL7LaTVp+xsy61D'
-             b'1BcABsapGb3yn0VHlIV1PGMPvGqJq9FK+JzFlWPQ7+wCTEaEVhaYGNsOx55jAlcZ4eF7SL7xHAh9'
-             b'nAXjAreyNAery3OwuXPADIdwZEj3+vhnH8OVq2/SYuVKC2diFXpJGjQoK7qfvxt9ASjgZ5lo3Wci'
-             b'g8uqb0inm4ZjQec9W/KjgQiKMiJI4+PxKW+73mzCk2fP4Mc/+Qw2djs0d68i2MuwJkEEpGEukamw'
-             b's3YlGG6F1s8asKwoIkbhInVq9XxMaE5kVKTIKKADdQ34NaDOSYWNheLNxJiQza1deL6xRcfx+ZfX'
-             b'odls0L3SbLWgWW9QAoZ+FGfOniMNfZw2TIY9EZJSYRkCobMOBHaNcNyEx5q5SI3kK5OLnTI7JGoi'
-             b'5n2q7jnIZbC9vSPodhQl4qDjnElJpCRyJGAV3r/X2Yfr16/Dd7/7x3Aw2U8Ta9H454Ql/f4IAaEI'
-             b'8DQ1Kc5tFOVR0KkLyW+vh45+C4wPgMQGwH2qNKvCWuFnC8dvlXYLJqF6RiZGs9mmwI90UzzXrWaF'
-             b'oKSVaiOqYva7fTJ3Ij2C6VT8HZgp4SXRUh8J1VHk3WAnSGVFRHGmeC5BEgAWocIRlIuYHBelrKKD'
-             b'pngEZHS+M5iA4hAYAxSuq+33+9ksAXh5G8UBk81OxOHDAAx+rTfiInL+0pX3K4357nSw00awES4U'
-             b'WQguz0PAuX/3Jly6dJXbhp6rfawqcuG8Y/AmASACdTFa2IswjlqKOhHm50piGtvbuGDiiw2kjwmX'
-             b'2qgFXPiu1vwiVBrt8L5Q3ThZn6gy5oWqkMWEO8o2GpA44YwLwUuWWEN7UJBE8RSuvf4KvP/Dj/l7'
-             b'UQkvq8Cj+/fhYHcvLMINGKuUsilkjJFJ2zUJnERQtNjGIi7AhCodcRAxz9HZPeomVAF6IaGZTEZi'
-             b'/xuHMXRe2B0xS/15ObZ6qw33Hz2Dv/7++2Ffq9BsNGLrHNSJzZccP2WWW8hPrE/tWXWxA9HAh9iG'
-             b'54CvFZ2CyawwDQpp3TM5QaWQdc6bLHhRHTIP12fqEFBqiXe/u9el+8dt7dE+fP7lTbo/lpaXYXm+'
-             b'DZfOnYTF+SYcX12GisX7YiRiSapAJ2wPr/NreMG5UYGD+qItdVO0C4ILIXogMPWRrZEz8bmQ9kfS'
-             b'kABOjjC5+fmnn8IffuuPIrbDC+hUsQjl0UETZ/GQ5Kynw5AQVHPWqhBFTRvus9b8gtxPOEYbU+KT'
-             b'03PnGBgpXRHs7DRxzl54Yqv4ao3pjsDAQxz5qEJfRnoLXJ0jY6Aafnd/b5OsjKvhOAqfRgqllEQU'
-             b'AQWUp2h+UBqrE/BgGRtgxAMAmUBeVBJZlpgbJDbe0oVkFkoWdF4dCi1fAVc01548XQznem+WALyc'
-             b'DYus5ZVVuPz6mzCDWx6iBKDWbv9ab8QH/MS58/dWTp76fOvu9h/5F+aDBWw8fwavXnmdFiEX3c84'
-             b'8EZ7VrUAFfgVUf0KdaGyVPky8lcoTlJl1qt1WjzIdx2L68mEqiAnjDLEBOS1KgxloSIjFaOLCi+y'
-             b'Ttr/0X5UUW7ipauLnhV6oJVgvLo0HxbJCOOiROZgrwP3792CN7/+HowHA1pQURJ5EAIH6uJXalkM'
-             b'/twAMCQchMEMK+NaqNItzkddCQcJQoMK/9/d34Gt9aeEtC9zNFyMalYWZJNaruEn6Dx46+69kJSE'
-             b'xb1eUU+eSOUDAfjF9rmcY1CBnLJAS+lbI4vb8YhjilWm8+UubQhMlvQTcnHOQ00BpIUS3RONaKST'
-             b'gC8e9Ls0560jfRLBk2iwJIqJU6lwDf8CjWJ2d/ZCkNqDB48eQKtRg6WFObh4/gxce+1KuN8Q0MgA'
-             b'U03svFbrhCTMZXzi0qhGkh11qdTJNI6z9jrhuw56oOo6Bmy09mXRZkv3ErE3Mu58oN3t2to6fPXl'
-             b'V/DW22+SUyAzOjx0u/s0tkJcA7pnYoDHZ86LbgIGVWTE1Eydngn0AMAqXamdfGeGIDqZMrW0LaJC'
-             b'qmOgIyWfBLIiqFOwLtbZOPqykhyrYBMeV2dri+SZM+Hyk2umJrAujVjKWHyrWBaTwKEZKAsCYgKk'
-             b'zBHwyY+i7ISpx0K7mFlRH0wPBX76dDRqhCRwfmX1KPxj3iWz7XfrADRb7TginG2HJAEwv8EDVW+2'
-             b'4NwrV3/09Kuf/1GrXhN3r4wWsq2NHW6JT4dCHcLgX3DlSbN6RmGTHLDM2p3QtJgfzmguI0hmtGNt'
-             b'YAUrvHAFD+FChK3R+fnFqK2ObXjvSlQtSE50rsSlTpSsFPxU6cwL3Qy/ZaomPbhYh0qwGqqo/pCV'
-             b'DdWi9s6Nm/DW195l0JRHH/MazC+uisMdwBClWjExCYs/rsOj/pScC8kMSCR9sXIcjwZUpSHtaTjo'
-             b'Ugu0H6qxu3fukX0stnKr4Vy36nXUbaYKiqh5JW+AyKUKx7G6ugI3bj8IQahH1D9SShTrY2uTwE1K'
-             b'KIBKMHwNE4gszvIdGd84UtWzUAufw7NoAysrx+DI8VMhUNWhUatANwRNpG8dP7oSkiUGZpKXRNh/'
-             b'LAIz8YIn4aZKFVB9st8fkUAOggXH4xF1mLDNfhCu7cb6FoxDQO+EQIxhp3vQZbnbsB/4/mfrm7Cx'
-             b'tQ3Xb9yCc6eOw9tvvQmLc/Pkm0B0UY5YIJOY1MFQ1z+VIlBqm2G5IUbWp1oUIsbAvEB+s6JUpLLL'
-             b'NEMP5+7HH34IV0NSUqFRlaHEBq+fjk7wfPEtn+iLnp4rFOnJ6djwGaFOQKFjMBbEoUqeJKaVjgcK'
-             b'1+duGgL4ZJ6flLC5K4LnFu+vTAy7OBHIwv2Yw8bTB9Db3aLr5lPKDOp7wMQatenme85q9W/TuYqS'
-             b'2s7FRomSVHW84QUgYlxSVCyP57DrkueVmCxoejYdj7PjJ082zl99AwDZNLPtJeEA5IGZdQAOTwLQ'
-             b'Cgvnr7shZ/zKG1/74G///P/8n5Arnsv8DtHIT588DZUTzpxFspXofKG6QRnerEaLgFM/7xKLOKGt'
-             b'dZbOCzMuBtNQ9dSrGbWonVik4gI5v7gcP4PsfadTqIVkYYBoeZ+Q/TLlLyHdWSYXBYossGqZV1oT'
-             b'7p9YkGIiQrAs1NEPL546cQxu33tM4wk8DjzeW7duwg4CvxaWqVXPpj5GzedC0G6LVHGNOOzzqy0O'
-             b'wLgYYyAP56YVKsH+AcDe9iY8f74Oa8+eUSX5dG0tfGZBgRHVFlvNGvzZf/UnsBoqX5Q8zsUExplM'
-             b'Kkle7MeDIbz1+hU4dfo0bO/uwc7uLmyFQDkdTYiiF8WVqOXuI8IcK260aGi1G2R/jBUtLuIrywuw'
-             b'sroMc+0mgfba7Xm6JpgYIGBNMR3myDwj4nG2DQJIszr7FlU5y0BQPxnAUrse/jQ4qDcRqd5MbAN7'
-             b'HCZXLkCBx1Mgr70Gj8O9hTFkGALk2rOnoao+IN76QbdPY4K151vw5htX4ezpk9SFQFXBqJCgMr8S'
-             b'xCNmLbcl2WgJQCEIdvZ75PSHiVtmxN+PdASyWG0nHCSrP4IAOR88fARffPklvPPW2xTMU7YA0Q45'
-             b'WTOL+mXODpt4n2Kr3ghCBq89gk6xs0JJtFGpXFYIROoejtYajTnaF9TXwI5EpZbTPYG/j4qLSp9F'
-             b'ky5P3YUa3QfoSriztQbrIQGoZGkEZSQBZCAoRIVO/RyV7Y35ByS6jc79rSJLyCubOy0Re6Ny36J0'
-             b'yEJC8h7LoGLyjTCVeN1QMXTU69YBabGjWQLwUgNCozU7CYfpeiMv/dfPEEdw+tylj2sLq7ved5e0'
-             b'u4cGP7udbXj6+D5cfuWVELymPN/HWW+1wpLAcZSQMn5uH8pM3mWC4Pdk945cf+4SuEiN86ALVbLC'
-             b'dWIL25xfgM5GDg6FiAyz471JamJOFi8ef9qEpmfItMy9ZQETPBguy7g+v/7qJXj46Am3U3NDtHhc'
-             b'YG/fugHf+Pb3oJgOpZpOs9HY+XQFI7MtO+bhOGFvZxvu3LoTkojb0O11YWd7JyRPXUqOMCCPQuDD'
-             b'ChkXw1dfuwqXz52G06dOw36o1EitEErCP3FF5gUV9eRX5mtwdPl0CJ4XOXAOh7CxsU5zdgQg1hvs'
-             b'HIdCRfudDpwMCQMZCyESuFmnfbdq7WptTBzcaMDnBrXyB1MGi8m+aFu3KBkReeFiahChhEUkkEE8'
-             b'Hgqv2vQcHMBMOGjivlQwmI3h1QunQoJiiCFhv/Z6CP774X7jBACDbudgH97/0YdwZGkB3nnjDThz'
-             b'8oQASREgWAhAM+d7yHIfyKr7JLFPxOgmJH63b9+jwE4mWV7YDwS30Ba4kzY7cFB16qaLn1GB//fP'
-             b'/wOcPHECjh49RjLASqlkIGXytEOnPjzcBlEDXSLzCTUOuwKs9e9gMOyR+p8xlWi/m2HXCM9PxsqX'
-             b'jVY7driQDWARL+P5Pq8h1RfPh+PnEBPQ3c0Q/B8/IDVPBfN5Scg5ceNngRInnzj/lFaRrHXqFcTR'
-             b'Cwr/+OQ3QIO0kMA05lqUABKWwniBE5okvCWgXewUNRp1xig4cSJ0zKpZX3s6t7i0SLLis+3lbcfP'
-             b'XYKKWFzPtsMwAvhN5kSh0j52/MSTS9fe+uDRz9//s2qtQi1HXERGYXHpdHaltcma9EiVcqSYpxl+'
-             b'if9LQcUKYEoEbfwk6s87ZQRYrnZwRtxotLmCkCpWG5D41mpeJ4/z0XiXFw3jZKau1KYkAcuj8+yF'
-             b'hMR4FVFRaziuWMmutlWHZqsBvV6oLF1YdHEUEKqVWzeuw7e+98eyLy5K6CLCWwMlIu1RJQ/57c+e'
-             b'PIIf/X8/hFu378B+t0c2uywzXCFqFojt8HA4oRn3t//wPThxbJUkcvd3tohyVYjvn6MxShHV3by6'
-             b'IIo63GQ8jBpHuCvHlxa40vSsucAJRA2OLTbYxTHHc4BiNFO+bkYUE0hmVuOYEzCFINJBfd5LM3fN'
-             b'Jz0bMDlhAkBp9OBNQhqwpa9UmZFiwPNkRZhTRS8jHgxO9RDgzhw7Av6YhyvhPPURQLi7Cw/v3YW1'
-             b'9Q04e/ZMyCOkuhfVRGrxU1AvZOYp2goIrkPholobnjzbgGdr69TtMEqEVIlaSPtmSq1rDwquZFOm'
-             b'7c4+/OV//E/wP/yb/55FivR+QkGffhdqzRbhP2qtOUkWBU1fFNRJqtTrfG0VQBl+uxV+hxsXLs77'
-             b'LdFFbZJvNSC+EDKmEgweCJIeRzIINEQNho2nT+Dx7Rs01rGZDs3EATCaEfnSJNhE8yUjWILIwiEW'
-             b'T9lOmdJzvv9FajkzWcIFQXy8Ep3Vs0ywFe8F8tIAxRE6Ag8fdHbn93a3SVVwtr28EcDR0+fZQXK2'
-             b'HY4EoNpq/ka/UA2Vxmtvfv1vbn/0n/+sVU2yofjYP3zwAL7+tXfZMAUXh4Id2LBCYZoQK9lRHInV'
-             b'souysyMMWiHo1ustrsZ52BgW5GoEchHFbMxWqpVaLRbAqAWwsHQEnu/vJSoSmKQzrEIpqhNAnYWs'
-             b'NAi3Mk9ndHshHQFs1aMe/9LCPHT2n7OpUcGUpyePHsPa4yewcuRYqEwGsXuAx4TiKvXwZ293B259'
-             b'9Tl89vNPQoC6T+1lnAVjFZ5RdcMLIpogDQY9WF1dgj/6xrtwZL4BVQSRhUoNhYXAmhjQsYrNREpY'
-             b'pW2TSZvw1iUBoXNQALkWluxzomYAu6/x2IM8b7Kk5WAsGzcZkW3VkUsS5ikr7kEUi1GQIbnTCUUs'
-             b'9fglcNIbCtFRUDEkfYulRb+seRC17SURJSdCAW+2QsLVXFmGUytLkNXYNhbn3pbpCVI1A8vz4kw5'
-             b'nOtc5HrxM2xIZD+/fhNu3L7PmJbMRM8KSjrw/rYQQW/8dxuFr7SFjyMe9Ev49LMv4W/f/1v49nf+'
-             b'MFT6EzY+Mo7a75TogQL51BlTD9zGa8hAWCceBJzIokgQGXHluRoXR7dCE5USLV1PVJ50ZPpYpfu9'
-             b'huJC4S2P79yCzuZzaIZ7ExkOINchSmFHcKiNOho6NzGx1W+irK/Sco2MQjQ9dOT6rWMFHH3pvQBJ'
-             b'jEkMvYzINuM93WjUSBsks8m2GUWPsmr92Ktf/xaMBv3Zqv0SN8T5+GkxOxGHJQEYdX+zB8qNp3D+'
-             b'wpX3bb09DhVplaxTEaSEc/Gbd6DT6cD8wiK1msnZy1vxczPUYuWA4aRqlOqK5oK8QPIPw2I3HNLv'
-             b'IADOS6dAF4zkVKcu7Vwp1ENVZbKw4IUFhKov4lczLcwJv55rGUtB1EUTE0kSVGdeOM7qEodz8WZI'
-             b'NsjpTjnN4f8Pul24feMrmrlPUc4XA0s1o0V3c2MDvvr8c/j0k09gZ2eHpVyrVai0KzAphMDl2E4X'
-             b'lQXbIQj9s2+9B69dOhdWzhEaDNBxE+pcOiqxbBLHwbgQi/iNzuRBEdpyvnQWbtUCFnJJFBzJG+uB'
-             b'W6VjaRvf2YgvYGc8of7R4l7EwEOjGufimMYbHVH46A7v1a3Q8bE7w17vRkWJ8HPiZ3pqzdP7pQKN'
-             b'OgR4DLn61HOLm1wgJaBg9wM/i2fnIoksdsXcTpbFDTscCMIM/7x/9zF8+LNPSJIX8RCaNxoRDHI+'
-             b'jVk0wYnBP4kxRkEpbJH/h7/6a/KTuHD5FbCVGvlBoNa9UzQ8npiQSA6GXQKH0ngoa8hopKDjwGeo'
-             b'Ee5pmskTboDBo1xch98dHITPbNE9j3NyfM4IdCqaDmhGRaDToiCWypN7t6G/3yFgqxfAIGWHJcvj'
-             b'iOr3mjyrpK+L1EUbbZd9orvKPN8ZbRIl0SZloERcv/epc2FNvEcdKBBNXRW9jCV8SJwHR8MDBHkx'
-             b'ma3aL7MLAH4GATxUHYD6b+YAjQ/1K6+/9vnpy6/9ZPv2p9+p0Gybb5nO/j7cvHETvv3t70rb3oUq'
-             b'pUKZvQKRFEykSn3DfpcWkzoBlkqAIqvc8lJZwUN/Ul+LanrakiTOc42SgMHeluD+CnHOy0T8hOlG'
-             b'jPoWoJLXKki4zypBakS10DN18eypU3Dn/hMK3iBYAgw7KGDznT/+L8MiXyW0/ObGc/joo4/gF59+'
-             b'zi3fkDAgaBBdUdA9Dr8TudaIcu/2h/RZ7719Dd64fD4kGVlIfPa42hahoqig5jnA+9I81sai2UV7'
-             b'Y7ZSFhEf58Q1r4xLMJH2aNRiWSvPVJRFNzwwgvqmU+0jij3a6VIlzUj0wjsBdqX+rhH9gUyDg1dH'
-             b'Q4gtY8lZCIRJqHcJD1lUbbTcJVDRGeOjGFFie4g1rZwvtmTm/Va9Ao+5jmUjos2dXbh17xF8efMe'
-             b'/V612iDDphiAtPoVrAqAjzN8HxMCNh1SgJu2+mvhPhxPRvBX//H78C/C64tLS7B89CQF6olTUypH'
-             b'iQt1PqyKMKUkA30Gcp8qbNxwPs6kD352SArYilFPlkEUKzaYONcp6cSKeWPtEXR3N2lkRDoCsT/G'
-             b'x1oIc0ATC6XuUVLpQDwGjMglp6CsmgC2LG9dhqZgshX2EdkLmDxrr8S/4AwJ0WkRf76wsMT3iMg6'
-             b'O8EmdPf3lgFplDMQ4EsN/yavwowFcIgSgPFv0VJrNJv+latv/dXjX/z0O+16Lvrk0hZ/8ozU50AW'
-             b'cHbu82khT4azVM2hExkFNpTPFftSR4ImDV4uBMSFvzEaDUkxsB4qKaJ7RbW1aBsDC8vL0D/YKfUG'
-             b'kpWwlTGEk4VLCzhbqnC47ZyJLzlXt4ODAzh16jgcOboCD59sQoZMBwJi1WFzaxv+73/3/8CdO7fC'
-             b'Quhhv9OFQW8QqskatYMVEIfmLIqUQ1Aeqp5du3QaXr18CY4tL4IbD0LVx5bBasoTKd2Ki2DjVQn2'
-             b'WQyc5SqZ2q6iyOZEs92GpMWFYFAgsM/bkpUsB2LCVejC7ZS7LaY82D0h1UErnRqJV2T+ouE7k6SB'
-             b'EdxsE+tK2jlFbHFbcfyzpSsE3iYfBhXo0aAjiYZ1nIwU+n24RwbSzFiSGatzaKnIMQhy9d2ESfje'
-             b'9e0duH79Dty+95BMrhC9X6FZuKEEJhP1SB87LC5hV8SYyscZOUv9RpU/GX3QfVOrwdP1TfjBBx/A'
-             b'n3z3D6HX3YUjJy5ArTVPrpkOC9msAu25RaGxTunKUieFVC+tIHQcyQuPUCug3oi2uQSwDf9W8CmO'
-             b'BXC8kGXM7MDzsrXxDNYf36ffz8QQSMWcEsLfRJVJCro2Sx0ObfdbtvpNXgO+lAyU2/o+jSNUW0GT'
-             b'GO/T9zgn59il31FnQnQDdD6O0th9NBQK3YP57WePYTgbAby0De+9xeVVmJtfnp2Mw5IAYGb+m27Y'
-             b'nn/l6pvf/35W/58NFJHyh5r79x48hN3OnojjFEk6RCoHrLi73Q61LtkVL8rM0PsdjROqAHG2mFEw'
-             b'wcUV0alYZRdi9qPtSl2GkNqG6mn19nwI2nvChRYEOiif2UrQLC3khhcqbe07L3a9kbSFFKoxUcym'
-             b'IoBD1sQZEFr/gw9+GKq+DHIC44Vqslal9zEYSo7b8pwf57rnQzLxyvkzcPHcSZJwRde/OFc3pXas'
-             b't9HdTUt0J1x1kK4LH5Jlvrvltq6VaspHrnUewWAKtote7Arf94kipxa0LDZj4xlmnwZG+nOyYOl6'
-             b'egnltiQupNU6i7okGh5hLOLMG0oAyqSuB9Ipsh6SBK5Ofyx3QaxJ9je2VLA46ZRwO9oRoHE4cfDk'
-             b'8TP45NNfkKUzBrlKSN6qtYySNv28ZKssev/gxaNCkf8+nQntEmmTQKpgvSOx65WHKvzBwyfwxeoN'
-             b'ePuta/Ds0W1KGpeXj0C10SLaH3emDHU/pqQkaSI+XhMPlDcmV76M5+mUAJALliVjLWurpBMw6g8B'
-             b'gXI7m+tEERyH+yoXyWIrSnweSsmeVP6UHIvLYPSCkk4RBePCR/8EtbG24mugkwITVaGMyGBDpGCy'
-             b'mZc8qd6DmnYaQfkrXgVVo9AfgjwNiLUgY6fwvp3tzbPbO1ss+DQTqnkpGwJFce2cM7MOwKFJAHAh'
-             b'/E03DNpnz1/8xdzqsYejncfnWhVxvwt/9nZ34fnaOpw/dxqGlFwUUn07qia5g9CIBiAg2vs4n3fF'
-             b'hMBdldzGcTe64YXVjNr75PrnrcKbidZG7yXFcRMDx3zIYgcHndiS5Na0LaGyeb3JTLKGJcEXDahY'
-             b'QaERi/KcLS+ejVq9HIsp6aFFGIEziKXHQGLZXCjaGXtRaQs/O7q8BGdPHoM3XrsMRQj8g8FIPj8T'
-             b'gBVL6Zqom25KFRWIAJC44UkVDbogi267KWn9akPWaCpAi620YIXDnqmmAPBMnq6FU3Mhkxz3cmZe'
-             b'WBdTEansRN09Xscs0S5lHmw10ZBqXjQVo6BMVIczVhVsXlBS9CZp0pOIlFDhnJj5qICTBnLVRqKr'
-             b'HbKV7c1d+OSzz8K9ZWC+vUDulaNpn76uUWuAZfUjSt4yYVQ4H33tYsva+yQHbKDUpdB2uhr+SLKC'
-             b'qVhWacDPf3GTvBfevvYqmHEPNp70KEHEThYqJzZDMoA01jxnMyus5MfDAetgtFp0/BW0h/YsrY0g'
-             b'LcZMFnSv7uw8hc7eJilRIg3WkuiPJeEoQ/Tagt5LnS3nhdUA5Map1FsnYwwvao0qk63Yi1K3Pl4b'
-             b'7T5Y0IRcxxjamQN6RsvowLIVs9cWlrzfa+KA9NA4hmFFxP7+wdELF67UK9XK0LuZa91L20iEaqa2'
-             b'eGgSAPRm/222xsKxg7NXrn54/YNH57y0LRGhjNK+Dx48gIuXzlHAZ9U07gYAVc0VQek7QX8zXYws'
-             b'XEMigcI52rLHhQ/59rg+I9YgaQLwz3GRrMwv6ORTZH89SVoij3o86FHAMlZNU7UKSSpwzJUuqQLa'
-             b'ZK1LwwvPAdrnFaJwUXtXHeHML4Uqw/N9Qh1INoFt/YXFFnz7G1+H1aVFqGQ+AtVY5ZArJnZNY6+A'
-             b'OJGTGYAXD1lW/7MkBORlll5EW2GxQqZFXSmOEkCtlHU2S/z8aCNgROTGllq48KLpiorgyK+p6x9Y'
-             b'tSjmM1BoV0bbvQ5KID9d/O0LVrygnPNM1CBj/esj/1xzA6PdF5VOjvr+avokgLKSUyG2v88dX4Xz'
-             b'p/4ERhOAbn8Mu7s70B0MaF+++MUvYBquEYtAhT/VnNvveG6ddonkZNnSWMYpIFAQFiIEZaXKZb8s'
-             b'L2/N4KeffA7d/X347jffpcCMAXm0vwvdcC/s4ldUqlANyQhRWkNCOQzBHDU05pdXGB+DGg/h2eru'
-             b'dWie3kcPD6dVMlpnT0l5ksSrhC5h4oiIr0EhyawTGWKrgFp1xTQq2Q3M0NB/GAHOCGtBRwMR9BlH'
-             b'CeIuGLEE7AiJYMZcFTCl0+SkjeYVxyMUQPSvqFRzgUNIAhCux7DXXXp87/ZcvVYdulkC8HIQAOFk'
-             b'V+sNOHry3AwGcGhGAPDbOUBloWJ//e0/+MvP3v/Lf40BAqlZGOMrWQ5ffXUdvv2dP6KF0YqK2aDb'
-             b'I+nbersi1DtGM6PMK0r+oomJ8SXZUOFHNertOPtV63G8UWshIONnuchbhlS1htdWT56GzacPYToY'
-             b'iia8AMKUviQ+A94Kx5lXGiHVOXa5I9OaGmzvdeHDD34Oz0MlSaZGpc8oO7GzyiGPNNDgZbFdg1ev'
-             b'vg4Xz52AuVDJYUVHIwSsDa1wnCP7i9u6Vs1/JRmgsYURNoPY08SxijfRB8BI8OHWfQFSJ8fgha9P'
-             b'te0v7ew4rxcHQBAmQRGN242MPKYiHR8Wc2ESeMcYD8UZGE3awJUwDF747AnwJcRRrvSdk3OhIjhG'
-             b'MA5JkjQqxokEQZK6VxaJ+jnpNRUwmk9BmowmsYtkKrDYrMDy3An6RZybXz5zFLZ2d8mICFUXN7Y2'
-             b'YTgZipNkNY5SyomAOifG/owtc/HFylp0JbwkdmjR/OWNO3S9vvXNd/lecROoZhnhNjCoT6f7zArZ'
-             b'54MqigzWn/ZYwhfK3+mVXMe0TKJyZnytMqXbcvvFyRydsyIrCHyZr1NnwMaqXb0SeOQmlsfRFLrg'
-             b'+yaOiVIiBuIEyBMeF3Eq03Bc2GFBGm9kjWjHqKzJ7Xh/qTuBBQKOPBAzY1lCHM/vsN9fOOgNTjTm'
-             b'lzZhOqtQX1IGgCXh7DwcpgTAuN/uYfKjAVy5evWHtbnlwaToN2KsCQ8rys7ubO3A8kKbcQDo5EdW'
-             b'r6h336MZv0XEdfg5gqBM5LSr2ImFwaDL9qAIdCqckAMUgWYZYSwzZSMVSnmu2J5bhumREaw/vket'
-             b'WKNzYxwjqHyuCF5kog6IgiWVWpU+exCC9XanC9dvXYena9uwt38QKpNqDJy0dlLAZ5oZWe0CAvx6'
-             b'0KpX4evvvA5Xzp6CxVad9P6R6hcF6jFIF2ywAtGBvUgqiZ4rMMeWelHXwDlFxifOvHMmei0g2M3m'
-             b'jKL3GDSM5fdjSzgkRUj5s3k1gucysXUmHIgYJRXi0IiVG7oWQsWQclzI8GDQ68psmiWNfTERkxxD'
-             b'rWmjwC0n3QD8PTrfAvnT6tKmhAEixTF1Yqx4M2SSGNAxyuxYNSOUSM64AJDkxUejnpjDCPaDrYDx'
-             b'PehRMOWAE/Z/vtWAxYV5Th7COza2tqATEoFn61vw8MkG9FHSl0B5Fepw2ZItso6v1EExsVXKUtdO'
-             b'OkNAQlVf3nkIne4AvvnO27DQbsAUtS9A5K/xmL2KI/FxYdIiMgTSZpeAyf0p6lyoGJYmWYQXKHzE'
-             b'CUC0v9YkzUfef8QwSNJG2gqi3VE2G1JyWDSRIgppwgvo6MCI0qNTT4Kc1QsVXyB3q3RyyroCnMjU'
-             b'azWoVWswGh+E+yCTTg+yGXq5yfITJy5e+dz9mg6ms+23zAOmM6rl4UkAst+uA4AB+/ipM3dXTpz+'
-             b'avf+F+9WUTOX1N9y6Pd6sLH+DI4ffYOEbzCA4awTC43JcAhFNoXW3IJQt1gUBTXuUfGtUmWqE5qo'
-             b'sEZAQYEEP2OKbf/+CNC/IJqHJo3SRD8LC8t4MgnvWwwVfB0MyQND5MZ7w9K2RtTlkBePAQ9bj/3x'
-             b'BDZ29uDDn35KuvATqsQrYfGuJfq311FBFhXupnjsYQG7cuEUvPnqRTh1dAmmo2E4FwdU0UhJmmh8'
-             b'sWTkIGFNUpr7Za2DQmlRYW0dYmWI1T2aCYVzbkKgR9ZEe/VYCGTLYEkitgb19mJsKaNgEgaCarXJ'
-             b'bWx06QsVFmvP+4inIB326ZjGOEgXm4xGCBKRhMfBqH/ArAxM0LodWij6e+g1MCBXv1FYmI2fxuQC'
-             b'zXmMjEtIUlcqVV8q4uO4xYrtcCTgA8sE0ynhOpbm/Sp05PkcqEIh+//YX7LfTViAqDzjOeFTUBtV'
-             b'35NJrICOLS3Rn4unT8PXro1hJ9wDn391E9Y390hdEXn1nAgwXRQTLrVDjtaOkqRFJ0F5XtjmtwZ3'
-             b'Hz6Hjc0OfO/b34CjS81wXYy4GVoZt5hkm43TEcFVMFWSuwpMgeR7xglP00hvICYpvlylu9ie13vP'
-             b'lUC2ZLurCbRnyWRLfhO29Fx5dUJiPUoJ9np8ZKilSZcR1kdu4/iN7z2B1hqn1koAJc8GNCiam2uE'
-             b'hHufsSMRfupgc+3Jyb1nj8J9Npyt3C9xW1pajkXHbPsnngBsb2781r9cbzTduYuvfP/5zU/erWTi'
-             b'My4yv7du3oI3rl0jWpsTAyAMuu2FhQg8QrAJ6Y5blZQVmd5oE8qOahMyPWkxPsBlUi3yYjaeDMKf'
-             b'kFC0WqBigQw8tARIm1s6ArtoravtWcftTKKbYYWFAMbwvv3+AH7+4efw+Pkm9Ptj6lKguFGWc5Bw'
-             b'LolkEOiuAJHVHRMtcLFZg//iW38AR1FaN/xs1OuEXajwfF3BhorGN0ZGx2KL/EuAQQxw2AF1tsrJ'
-             b'A3LUw59a2Ke5xSWoz62SaUelhcGjToCpueWjZDmLSZIRbwMgoJ9JyYbMZq1QIp2Y0jBwUeSTq8y4'
-             b'wGtVqc1BdAsO+4n0IAI4hvcuHDvNlTZ1YlhZcdLrkeAMgzNz2A6LNQbbfm8f+t19cCEhwsQBK7qp'
-             b'aP9ngsQ0pWTAS1VbEJefEeFguUtEbWsvmASXqIPU7c+0PJXEUc2fDIMZMUgTyFLtcTOgUQ/E3ACt'
-             b'jguyxcXOVT1zcHp1Do5/7xuwezCEr27egZ3OPvT6/XBPjkloCCl9TCm1AsY0Uaraiask6VVQl0jw'
-             b'AagQGRLZP//rH8Db1y7BG5fOwuJck0cVMqIhNkfY6QKTMic6ClF50IndNas8Gm/jGCj2HzJNilOy'
-             b'YyFhKrQad6agZMZTYieYGGU0WB2rKcTCRCZNOeEufOrAvNDZEftsp0BJ9ckgIS51BEz4HSNdjFaj'
-             b'+kIyj3/B9eXjn/zotadrT6CYjQBe2oZMgD/7r/8lzLXmZyfjMCQA2e+Q6GEtd/7ylY9/6LUNHRZ+'
-             b'fLxD0Lp//1Go/sckAmLUEMYKil+gwGOsMBGFkLPNbLXSkEVQpGgJRV2l10EWxVpYHNSulpwIw+/k'
-             b'+TSu+5wY5ASMIgvWehNWT52HzuYaysSRTj+28pEDvrPXg3uP7pIoTK83hNF4SjPI+XaVFmExCSR7'
-             b'V1zMp55pUeAnIQAUsLy0AO+9921YnQv7N+xDM1Ry4/5+8jkndoJiqHhqS/bB2JoPiQcG2ULtXEmo'
-             b'phL2txFObAMWVo9Dc2kF5laOkThHtdYioBdyx5FuiedlPO6Hn9dgSvPjIlSoGHgqrJisqnkJoRB5'
-             b'/gUkIR3w/NDTGMYBJRCI1fDexQBcYMscGQoY/AtxisOATKMDrrJpUlydI7EZK/Kyxy69TsF7FVia'
-             b'FrsD+zsb9Jn97gFJvO53dmA86BId0si8X+YzPJqh6jqXCJ1FPIeqChmrkP9S+9lB7J5QV6Fggaep'
-             b'jIu484wnwqaRATDI0IgBlQZu7Eqh0NVyM4Pv/sE1Sszwc7Z2O/Dzn38Bo+mYDGpwTo9gNUpdGAEq'
-             b'4xmW/PUloSUW8cnpeD7/4h48ffw8JAIX4dL5czRKSVUxu1Hi7zPWwrFltlemgo8VeHKH0nTPRE0C'
-             b'5dPTKMQKNaOQfn6mjpmWuf7CpIGyEJJksOnfIrJUGrsprjSpBGd0H1ZqDWGmMIgjfaSCcrRBwQle'
-             b'NXxwOyS3jJEQr49w3+E9vrK0svyv/pt/C8PBbATwMrdmswnD3uwcH4oEwFaav/Uvu1DhHj994ata'
-             b'c2Hk3LBGCzjND0NFfdCD3c4BnDx1AsbDvgRwK6IzvCA2cb6vfGtslwryfzIekDhKqzUnMsAQ54+i'
-             b'fE/JxjBUlCjfyhroST1MEeG4lJFn/dIqZTr9zjb0Q1LyxfU78OjJOmzv7oegP6FWepWEVNiL3Um7'
-             b'NDUoWTo4K6aEwF8+ughLC3Pw+pUrcPrkCWqDTwwLmOR5PbHFjai0hc/FqqUIiQOEZGZqqPUA9YUV'
-             b'aC8fwywFVk6cC5X9Itns4j6begstesjmFc1p0AkQKZvYmZiEz0K74CyrctIi6Hqj7XWjIj+GAHyl'
-             b'K8bjFB2FRHlbTwEY/RTwMwlVjqMhNAYKe0GVHR4DrtciTjNF9gZ+H2IGMNFRtLjKDaPbYIlCh4kd'
-             b'JjGLJy6Gjx1D+5glT4UT4b3d/V1KPEb9DuxvbxDeYNg7oO/AL7WasEhXiAONSRFVKk9uL6vEUUKX'
-             b'R4R6ZpNngQRULxx3LyMXArQSRkSSIjJpkgAaEhbk3derOSycPgZnTxyDnf19+Nknn0J4AEJS06du'
-             b'Va1akf3UNrzV1hR3vyjwMvYBu1qd/hh++PFX8OXNB/DuW1fhwpkThEXBawzFi5dPMSTWQ3S79CZR'
-             b'YGOr30BUMMwAojFP0r5wibYomJAErpRzY2x6ngBSK1+4/qD008ilZfqksiTw/kBF0BqZYRkomwo5'
-             b'pXNQRypLAmHhO+cEk+FLCQJ+RWdn5wQGptEMA/Dy5v/SmWNm0Gz7J58AkFPdb7nhQnPplVe/CBX2'
-             b'L7buffGelUUP26C9wQier2/C6dMnRCc+taHVQ1Xd2qhVHTnWHmo1nLdX1ftHQHaiKi+zXOwyoBe6'
-             b'sgJUVUxZ2fh5eaiS0ZcAf3brxi787Kc/C4H/Kex1uHKu5Jn4D3hCLLMlgItqaQqKQwR5LSz6F88e'
-             b'h4tnToVKZJ4SAQwUextPZY1ycY7M5irshIdtf6LnNRZh7uhZWDp5NhT4i9BcPALNlROQNeeYJhmq'
-             b'SBKCYd1zsFMJRljdY9Bpz5HXAB5brVanBAlHFKN+N+QUDXpgx72enE9XwhNUhe7I9EAjCoxltT8e'
-             b'U8i1w/Y8tYMzep2MgsJHIoOhGpKP6WRA38vt7rDA+xEDOuWewL8TeDCTwQbRHQpiUxQFjyAwS0TA'
-             b'IgkdIfVrflWEklZh5eR5ugaD7j4F3O3nz6B/sMdiSeHfKLakAg5sVlOIXTGLFBmhXzISPwUwA0p5'
-             b'E6yBhDkWs/HSdrciuQxCmZS5PZ43w8HNWk4ippMxnZuji3Pwp//8e2DDNbl5/Rbs7u3B2uYGdZT4'
-             b'vlbxnBIGRUcFElupGxD+vncwhB/95DN48OAhnDx5HK68eoVAcaMBJ8SuJKxjvY9S0CyOaKW7kL+o'
-             b'sCcukUWp9c84DmCqH6k4FnLrlhZ9I0wMPY8lbwfGWwjwz/MYxUMpeRDzr4i/0Ky0pKLIzImMqZ2g'
-             b'dszcyKiQcZGj8VBRCDgyJJ6d3e3Fj3/yYzr3s+3lbNhpuXDpMpy/+MrsZByGBACrld9ly5otf+n1'
-             b'N3/0/Nan71WxvY5aAKHqRLDUvbu34N13Xhc0MYdJ9EEn3/l6kysubDtPh4RSp6GsGI3wYsyBfNzv'
-             b'kXseQDJmUQVBmqHrvNBJsRI+pt1uw2A4gZ/+7BP47NPP4Pr1m7QGVSs5LC3OR/Agtr8hfpbhwIQt'
-             b'R2yLi9rfN959G84cPwJzNJsMiUJYgKb4vc4Jppln6YR1wH3OQrALfxpLx0LQPwP1lWMh8J9D7QSW'
-             b'YwnVPZq3IKVu1O0x7Sqcrwl1SpgemE24feoIfzCl40Wnu8mgD9PRlPaLK6GQvITgyJ7ukygg5MVi'
-             b'1YEqt5XkXcP1wc4CGt/Q6cIANGUGAVbneI6wI8AqdYx/wPeivj1eVxxsIHDOiKQyjh0ooHGEj252'
-             b'oCA+6thMqMNCUsyTggIpnnv8vAmKPTn2bkAhnqnPodpaouB1cm4ZbDEJi/8m6Sfsba4RkwSTMgwz'
-             b'eZa87CnlKZg+ZmJslIpGEPtcJEeDAO46JQMECZxODJSsJIQqV2ujsZKRAEmYDeQWTA7g6sVzkFVe'
-             b'gYP+EG7cuQPXb94N+31ASHjShoh4ARNn6jheyKQtkdcrdK4frG3B040duP/4OZw5dRKuvHKRquhh'
-             b'v8+z+phuZiJ/7GNXhF4zSU0QI79Tl2ZJfIwKPkVFSBmLiOqeF+0MyoOEzqgqmeofAJmg/x0/wwz8'
-             b'k/GCYUAgj0WyOP7zsg6k7o20HyJ7Aeh+SJ7BJupW4L0Y7r/W5ta6LdDOcba9lA2f+yPHj0exqNn2'
-             b'TzwBGI5+N23teng4L7/2+g/eN9n/WGc9GdIIqOQFPHv6DMbjiVRABVWfOeroiwodY4kL6A66UG/N'
-             b'0+8Z8WD3Sn9D1HaWg5KPceFCFHCz2YqKezoSyEmVr0Lz+Z+FwP/97/8AHj9+RotPs9mgwKZGMSAN'
-             b'SbA2Ot1xy9vBkeWFsPCeIMbCsSMrcPb0cVqkPc3sHbWSrZrZ0Hwy7EdeA9uYh9bySVg99zrMn7oA'
-             b'eXsB8uY82xeHY+mHz0M99+7eLlEckR6ICnBYxSOYr4IgR6IVZjQfH4cFv95sh98fhPM4hLn5RRgj'
-             b'7gFtkMNxTPyAW/ZIyXMTaX7bWPEqBc2UKFiTELhRqtjWsig9XAxHUZCJDWpkTOBcrKgVuoH7NhkM'
-             b'SNjFTXhUgEkDtdkLCZbGyVUR0SDD5jZIuzORR48gN1GHxGuM/hGFoc+CCJKc8ignJBjzqyfpvC+H'
-             b'RGocztfe1mZIfLrQ2UGTmyl1R6y1yc0sFpaCcwAQS2OuXBn0ZiLgVBVwfEm4yIKOkmR8JSY5BHwU'
-             b'0yMnx4v/IVnncIw4JXnn9Stw7sRxGEwcfHHjFmxt78JOSAaq1Zx48VluReuBte6d2u/idCivk+/D'
-             b'2sY2PAxJwFd3H8CVkFy8cv4cdaIw8cEYGJtmIsqjDn2ZiWIJvH/RS0Iok+rOJ4h+hV0wU9JF7YYk'
-             b'ACTMCmclV/bRHBGvCT+HJkk7G7H9DjuHz7srSTpDKbAY7QqIZoTJwrM9GsHtu/dZ+0AupHZQGs32'
-             b'5tU33nI4VphtL2fDpPxYSACoMJpt//QTAPgdZR+xar106ZWPWoure+5gfdHKeBBbyAf7B7C1uQlH'
-             b'j66An3CFlWU2IrcLQWbPhSDoRJkP3zMKAalaa/IiHAJMLReDHFIWC2G72grBxIoyXkFAMFQ0PDjo'
-             b'wIc//Qg+++xLuHf/IeB4Y2lxUXjMBdPJHFMA0TegKIZEV8NRwPJ8Cy6cPQntRg2Oh6DfRhticgrE'
-             b'kfSEqXfS1Cw8AuMyUm+rLyzD0tGzMH/8LCwcPx/2rwnZ3AIMQpAchSp1eHAQNdixOh10J6RtoGpz'
-             b'U6zECdA3glojp86A+f/Ze8+fybLzTuw5595bud7UOUynmZ7EmSE1FClmcpfSaleWd2GsLdswYMNY'
-             b'wPCf4C8G/MH/ggz7635Y2NiFVl4lUBYlU0yiRFKMojjDST2du9/uN1Wue47P7wnn1iiA5EyPDLvr'
-             b'Es3pft+qWzfVedIveFVFrDzNRkiOenzJkDiwmxvawSmQQ5kQc/WjvXuNCivJ4stJkRZ92aMdKnMd'
-             b'6BJMqUoLbJ3uvWexlQUnTjD3McZG1MDBTo7m147qfDrnEQAnDEXFSQYWawFdaiudCm23KwKeTXbM'
-             b'nnkp3QIGFQY+HwRMXAceOSBRMJS3cteddiKiLkrQKz/TG3KsQWJ0mJKA/d276drupf2MuTVeqHqh'
-             b'UxdDCT6lagQ0829+5Ip3ztmdeh47LUsLE3lyrqHexcyMF2tjNUaSBojj5G2YnsmNnqMzn/4IjWc1'
-             b'3d7dp7/+8at06/addNyB2kjENHCX6uIoapACZEWS0ErJz/3dQ7p7/3v0ze/+iC6dP0Pn0vP5xPmz'
-             b'1O9W3K2ql6rO4xpGhSU9sTF40ETXNXoCqowl98XEfxrYaFAcTWat+Dxj4WTNaemPsQr/NZjAEPFI'
-             b'rddqqWLgilAjrYxfVBaKZbiDiIj96LVX6a1rN1URNGTXxXna34c++ok/vPzks2sMwPuMARj0u2Je'
-             b'tt4eAwxA+70pP2HxOnXmzM3TT1z8zvXv3/6cBeoy/YF7309eeYXOnP408+TFhMbz7BHBh4VoVkRU'
-             b'IlOSKq69MHvnsUBWfNMFDvx3tNlLpwt9xeZC3/76N+hrX/867d57wFKqW8OhOvyhWpqzmFBtEqRp'
-             b'O33iBJ05tUMX00KaihTaSIEffYmC59N1OvaxepIrJx0s87QoBYAKd06nSv8cHTv/JPWPnRJgXyyY'
-             b'JYDspz48kHFDOo7JaMSLdMWL4ZI9ALp+QKP08/5gkBazMbX6fa6kYd7i1Y8eZi5GVUQHAD+EvHFk'
-             b'eWEN3JMxdxUMhy/2t3UzJzaVN68+A0y7FAR6NptBEK5aPPpAn4UDvmX/XkcuKvoSAIJkMGAzfBb3'
-             b'upQcpPML6VxWAZs8ylAQnbTLRQcA+8nGMth3LeMIVB0cQJwII71TXUfGGOimLNXj3rFng6eNdA+2'
-             b'TpyhkJKBe7eusQ/E+GCPk8MiU8nUQyGYPqKo6JUK+mMBHObQF40ug55nUE57NFldvTY5kBJl6qEz'
-             b'q1sEt1o+Y5mSOBhZPXf5PF29fIGu37pDN66/Ta+88ionu2zfC70KdeuzZ5RdJNElS8kgxhjTdN9/'
-             b'8OPX6a9+/AZtpYT1/Lnj9OSlJ+ipi5e4WzFPzxZjVrjiN9BhyImhOSox20G9GdB5qBU6SdblsIm+'
-             b'tMu0c6AwvSgOiNL9WAHyK6BPrJvlARgMhoIHiLURNfS8sjuF6RnyvsDM+eEPf0St0oYikjQiwWlv'
-             b'bB/94sc/9X/2ep30vVoD1N7PDdf/aD5aX4jHIQGIZfneMkbspD+gZz/4kT9+47vf+JxYmkatDBy9'
-             b'9tZb9PH6E9SIvDpetMfjgxQAN8SpzDz3FCwkwDzP81H8m2fVOsNmx8ClBChUGeBJ37j2Bv35175M'
-             b'J4+fSpV7jyt61hxIx3V4dEjPPPMU1YyW99TfGKT9Fak6KdNrK7J2olNXMqYewTOe8xRUfenvQK+f'
-             b'ukjHLj9Lne1T1No8ln4PNH6kCSqw8TxV711aQMgoJS012/oWNElfIrT80c4HiOloNKXh9jH2aMcI'
-             b'A8EfC/T44ICrfAAT6yCVbgv2tZMpL/4Q4OGWKCqrlMx0+8P0uxGL7wiQS2lntCJGQ5TNduDeCHvl'
-             b'ViVVFboM7D2AuXNZsRodKwaa+1ol4i8QBOJ9oFNQCD0taNIneIdaF+hU/U9C7uw0SUBgRL9TLn+h'
-             b'4wJuMdeNQxxz5GtB2nOSkRISAfU12vP8yqWh/FXRkeNazXTF5dKx1fHx0xepc6lDt95+PV2fKR3t'
-             b'PWBPCCn6GxwEmS1xEDU908F3pkWhLfBsHqXGOcBViHGvXxljB9m/JZjagWE+vZeZO67vaP8hz7jP'
-             b'7Qzo4ukP0geeukS37+4ypZDBqQdH6Tq3+B6wAFMQueqgLAeMXTh5S/udLQK9+sZ1ev2Na/T9kz9m'
-             b'W+mTKanFCH17Y8jPFjLekH0LBBgoqopLMpqhKSYah8BU/byKGUUVryITBLKxh45b1Bm6MRKSob06'
-             b'hKKtX2ejoIzTeEdaJyJRuFZvXbtG9+7cpl67YnbLUpULIM71yY98/N9t7Rx/dXR4uF6138fqH+PB'
-             b'WK4TrMcmAYAj3Xvd2ukLfO7SU38Wi07jQFJ7DqR3U0V+hHYoqtcgsz4ouKHtL4WJzotV4ARdg063'
-             b'n4KQVAFAf4NrzdK5DICq4QzGFTqCCYIrUMi//k9+mU1TEPDbUMNLixsCPRZCKPyBNcB8cBLOPObL'
-             b'08mCKz6Ti5VvgSyUqDrmrkVnn3mZTlx5iTrHzzE1bz5b0BTtapDctApFkBfVvFIQy/A8SEF6ngI9'
-             b'AIw4FwAS210YFE2VFrfkmXjV6VAvBeb5eMrvZ2OgtE82g+FLUnJr1KNKB1UPldJ0rP7xDapakNVe'
-             b'6VzuHToACCasVrgUIB6bEHkRV4GDXDcdw2IugkZol0PciHncDKjzWb3PwH1R29To0MzS+0pU/2jb'
-             b'RysypbmL5A7sgcILkIxYxEkr/xpJUTqntNADyBfUzhmJjnQ/KIcJ3F+eIxdyXjCXgehRWMg4ARGo'
-             b'8KJXgERiln6/c+o8Jx/bx0/TwcNd3tXu7RucOPEjqv4ES1WmK2qpvPP8n7OBQqvjqGj1qNpDClqT'
-             b'vhC52rQEGvqdaeObyiHvR9+Hc59P5uk70abNS+fo2atXaO/ZK/T2jTv02ps32ITo5q3bOloo8qw8'
-             b'ywUX0hlKTx4naA8eHNBX/uwv2DHw7JkTdPniedocDqmL7xyzaiq2swZ9FElYZPCg426TV2AkQKhu'
-             b'qZbSJO6VjWVf4PGJASZ9tI4JyXfK8CHR3BuBU+mxsUxQxsk7DHzNW0nfiKe0k47xjVd+TLnRV/pU'
-             b'nUArJC1S3cH0Q7/0qd88BBB0sZapfZ+iPz8Pw62L9G7l4dfb/wcTgCG76b3XvZT03Isf/M7WsZO3'
-             b'6/G901aFIpAdjcb0YPchbW3tCH1H24RcICmKWipFqQjR3ivSigqkPYLk6HBfZGhTFYu1Hqpy+LnX'
-             b'YC0qqIHaacFYTo6oW5gKnKD1sSguFzU/1BIsBXQWVsxjUJ16Fe1hjnt6/v1gh04994v0xIc+S/O6'
-             b'pEkKEMVC1NKAlueqRTsNBgrDYj1Nx9kfDmh6uMfrXNGqeFHtVJUI7pAAoyCE0+31OTCgDYwZMDoH'
-             b'GJ8DYd8bbNAsvYbUIx5dD1mwIwdbp5bIAph0jUKhcqyDiqiwpCzMVXQuzpTKWqqyZUpa2pVgCrDg'
-             b'cqdCOwFc/Ss/G1eTEfxItli1URQNORAjENRKMjOEvZXGqjronLAIUPXjvdxsx/hnqS14Re6X6XdL'
-             b'HVPkwKMsBp6NI8CkcwdNDGMajBdkbKTWzEHwAkgg2JlyGVl6d+P4ST6k/sYW3bl+jWbjA5Yphs89'
-             b'W+bGWl0RpWKXc5AKv1jV18mKeqa7Y8mBACdF/S82o6OMefMNKt85tXUmZmLwiCAlyO30ID+TkoEn'
-             b'L5znKv3HP3mdXn/7OjMKDg7HfAjQqoDUM7o3hQLtgKnB/a101HLzzj26kZIHdGzQZTp5+hRdvXKJ'
-             b'uul9YNLg+kW13HWZ7ukze4ZHM0GdOonU3hm6D5TZFUGDvAsGomwqSBmNSLJkoxRJ9KOATFkXg9ir'
-             b'ICoAA4nnOFX2d1P13yqFGQEvAYyl5um5f/FTn/i3L/3Cy99cCwC9vwlAu7/JSX09WydZj00CcHD/'
-             b'/iPZUbvduXf+yjPffOM7d369k4J41PkxxExu3rpDTz591UDdagsqC6ovCnXR00ohLd77e3fY9pSD'
-             b'awqyJXtUB2IFV3amUyOgFdMXNsLhFSxwe1hE00IDOiqUskQyToi5sawTc3WpmaVAPzx3la5+/Fep'
-             b'feI8sReM11Z0EOQ1RGvQ6kfgQgWJ4AZkPmbsvX5fUP4S/anV69LRwT51u73sEocWPLfxUwCGHj8n'
-             b'EsAppM8BGwCAOFTmOM9QK35afdWDiuLkdmq2b1UUu2+c1qAvX4HSB3W/dLxAqUNjwSvLoFV6VmNE'
-             b'YiFe7Cv67r65vk6M3WXmrnPgUBtgDwyCGfMltV7PIABOQnjEFLjDUPG4YZGOCR0Dl4OGsR7IBH9C'
-             b'aJhgQfENcLubTXnvS5UvhhxvxVLIc0lEVC4YgkYAVVbMPFjKSAp7Sffj7MUrnIiiM3T/1ts8XsGD'
-             b'WvgG9Bf5mXQKphRjo8Y1Mqh8reESBNcSlddvSn8urkoMk2gtRBlZCD6gFudFrsQVALhYSlKbjueF'
-             b'p56gZ5+6QNN0D+8+eEA3bu7SrVs3aTKZEhpYdQqUraLSIO212+PYG6LmRMTR/f0junV/n37wo1eo'
-             b'n57D82dO01OXnqDtrQHLSnulBETT+Fd3n6D2yvydi0HdlmXMYQrWPrg8Lgk61ovUyEgX+bioSVTt'
-             b'edXERbJSYm2HV994IxULI35ecSgViQmU7w7rX/7n//n/RkWHfGtNTXs/2/8wCmtwN+vtsUgAik73'
-             b'keyolaqNyx946auvffcrv876314ESFBd37h9l+lq3i1EezxSngaafSx6/NPDAzrc2+MKhMVgUmWM'
-             b'1vcsBQdUmwCLQRgFC2atZijRLG2dy1ULhaZVm9XLdLESRLq4lQWbajsutGmWKtBLH/4MnXv5s1T7'
-             b'Ds216kGFiwDFIDkOaJ6Rz2U6llZayKaTMVeySF4W6bXd4VAqHrTI04LNYD9Ued0+HwuCe6UjCoAC'
-             b'IesbdaGdMcWuxTiGej5lwJ1vtTnJQIcjO7MpNcqroppJIGWhGRfFGx7yy14EcTq9Dgt9VPiip7p+'
-             b'gcq/qpS5lZIANqQRtxxvzAWlcJImYU5plJycKf7AaJsx2/06DrKo7PCGxXTOds8LYCNwzvWi4Rmz'
-             b'zkDNFavhADItTMcaIu8LgyJV9mPG5oJHBxKSROIWGAE2MWJmRalrmdrzalcqaldm0NlJ92VIk9EB'
-             b'3b99m6mYIS4YBOmjywh/q+K9AejMQ0EDPLMZDJnAjAESkylSB0LluJu8cCNVJTQ8s/OlWDbZnBNc'
-             b'Bd7eS++/cvo4PXnhHI2nz9CD3T26c/ceHabn6d79h6xkyWMeHRUsVY1POvslB1p8V/YOprS//zr9'
-             b'1Suv05mTx/jPudOn2AlxOOiL1TNnFkvTE9ROCBIBqftdNudp2iJR6byNMKNAGFtIbLP5j0kC2esi'
-             b'nxs3zqIYR926dZuyK7fiJ1DxP/2hT/3O1bSusOx3Ua5X7PdpYxVUow6vt8cnAUBQeBSbb5X0/Esf'
-             b'/NIX/20nFU+1q7wskgAuvX3tLdpLgX2QquPldMlS6U559aRo7Pl0RFPYzUYB/UAE5Sevv8UtRpiv'
-             b'QF3uYx9+gc6dbEkr2dTDtE3N1UhQapE6xJm0KOaVqHaczsetA2GgMFY17Q7p7JUP0unnfylVXaik'
-             b'pIJGJQwgXrvX42CNdj9c9rAYoqp12oIVkJa0+xH8cIyVIt5nkyVX+qDfobzB3L+GIBJokWlfvFqj'
-             b'moUqYOVolioh0PWCtcHjMpdPcQVk15ylYaali5FKyRQIAoMpMfdl5D3auCmjQRsZQQ9gH1IfAhkz'
-             b'RE5uYL7EQDfM7quSAy0qdu5W4L+pskZVj5GBZ7+AZW538/68KM+ULQEt4r7hfRhrMCdcOw0YOxQq'
-             b'EmPqehnLYCA8C7ROsBtBXRjjwhgkAEXOtKMhglD4b1FIRRz1Hmd5ZGVIENsViwVyd7hJF4ZbdPDw'
-             b'AWsKQIGQXQe9V5YCzq/OIlO4v16lgZcqPeg1IOL4inxf/Er7P2QqqJjeKLI+iE8B2fMazHBHRYdM'
-             b'6hfJVnqmOum7dPHcabp49mRKYjr04OCQ3njzWvp+3WCcDWSugZfh51BlqNEpKTEqUbAvnt+7Dx7S'
-             b'vd1d+vHrb9IwJe5PXblMp48fp2PHt1KC3WWanQ+aBFBQ8SHpcng1CvKaqEi7v1bKbJE9moAB0Gxc'
-             b'kgblFzp1LgzKVgDr5+DhHl2/cYOTNx7SoTGAkVS6xx/+2Kf/D5hIIcleb+/f1u1v8HhpvT1uI4C9'
-             b'B49kR1hsjp08+Z2t00+8Mrv92jNceQSpTEZHR/wFf/75F9LPxiKCghm/IrgrDjwpmKQK/LuvvELf'
-             b'/u5f0d3dA57/CREgUrdd0f7RiM6dPZXBaba4Cz+rXLH7bebiTDTSXIC1BjjBLVTAJNIiLUyzVCk9'
-             b'95FfoeNXPpTCTItR8RUHxnR885plzOtyJp/JJkFiJYwFrNUapOA4oQkCOgeHmkI65/7GNh3tP6QO'
-             b'Kt/FMlOw6rS4gvaHMQU6Bmyli+o2neh8cqhS+l5Bcul4a88ofFTNApTMPn4aeH3mS/vYjKuZ5z+X'
-             b'4IyEpFIGAKiGnCwpHZOtZtFwDfAXSMfWQddCgj67NTrzk3ei2KdAsGDJG2n5T974YFo4C1YBCWDU'
-             b'trfTqtIVjfKboMmXAg5k2eCwEvTNq0CNYZA4QIEQSd1CugaNvR1lnplgMuQDuJLWxMm08J0i+kmf'
-             b'HUg2D3eOs3MkMCb3bl5ng6KWj9yehgDOUhEiXvECfJec+grrc1hYl8HcGKMGUHRKogAYc+2sCnuS'
-             b'j0g73KsUMakTH1wLgzeBH9k3J50R93RMg5RkffiF5+jFZ59hnvw8XZPrqZJ+/c036d69hzRbLFV4'
-             b'SToiuNd47ttVh4wQu5+SiC//2Z/ToNujXrtNV5++TDvbW3TqxMnc28B1xnUszCdB5XujlewrEr9s'
-             b'AFS2+flZ2liHJJnhWxQkuQoLwRm0Kp+O9R4d7h9y+5+f45Zntk9v+8T9537hI1+CjHR3rU3//nYA'
-             b'2JxqfR0euwRguLn96HbW7U4uP/Pc135w469TAiBUPq7G0kJy+/ZN+uCHXhbd9mXNFCFUkn1Uxmnh'
-             b'+t6PXqevfPVrdOvebhaTgerZ2VPH6YXnn6bLly9QmYJUlRblCSRpuYXvGx3yaLPnoGIthXYZVC3Q'
-             b'UOWKGseCtQDqvLdBV1/4GO0g+Jd9ASqyW1+bGN4N5bxUjYO6Bw1+SBmj4ixababkzadHDGbk2Tpk'
-             b'bVMl1kq/H+89FKrfZMQBn8GOMMRJ5zQ72mcUO5vTqC47gp9HsGp3WQRlNtqT1jNJwoHz8xmCZQGU'
-             b'RWhV3CYyyJDNjJYCygsstVvxAg42BfAF5NspWMxkhMLxdqbcbrRY4dq3kHsWxPAHgDtmCKRqDC3i'
-             b'QrsJzhz5VtrBXp0FmRpaNJKuGGOUmlBxWA9qYASxkULuHZ6RGDLnj1bFfMFtt7Y/OMqzxUwEkdgb'
-             b'oGDgIEsUox3OHRk8Y+GdkrOxQaJHaqiS5nLHJlXpGHvDLbp0dZPefuMVGh/cT/uXe2Ae91HnpdHw'
-             b'DsF07R1Xt1zjryrfkbn7SbOcbZDz+VmzPSgtUSHwGT3oG92BjDfQt+K5T5dvAoqjE9xBGeb0gStP'
-             b'0PNXL9HDvYN0E1p8z27eQIdgRLu79xkDczQ6YowE3sM6AylZ3B9N6M7uPr1+4xaPm47t7KTv3Hk6'
-             b'c3yHk25QM1l+WZM2ozxGy/+i03FOVAZFfIcHgHfNrHnJ+3EKZA10584ddlgsQoM7mUyW9PSnPvoH'
-             b'xy5dvkUYi1G1Xq3fr/l/LTod6+0xTACoeISAj7RaXn3hpS/95Rd/679laVcXeAHFEnbnzk1emPvD'
-             b'DWmjp8r4YG+P/uKb36Uv/smf0PWbtxlIhnb6oNelKxfO09NPXqIzJ7cZ+FenigdofvDkXWle5zG7'
-             b'veX5rHYMtE6XFreTv3tTI4GMblpwWtun6JmPfI56Jy6lCk8tcJEAxKUg6lVwxgB3i8WU587MZW+3'
-             b'GHm9nEnQCdC6R9KDmABp3PT62Xwi0sXG48doICUWVUo66lRtIxCiS9IdbLHsMAJggWNgyVyZJcs4'
-             b'w2Xd9mg69VH92HWrdVFltUXMv0HFKlq82EaenwvYkpH+Wp2BOVErQAsdBxuPiCANMSNgVRsfrWW8'
-             b'32EE4CsG5bGSHJWq2hoZhCY0yoWAC9UGlpgKV3MCxrbRnEho0I+xsbM1I5+V7g53KRDYy8AjiBYn'
-             b'X+LiWOs4gEWOCsdzYtgkl2ybLFTEEFwWVeIgHpq8Rfj+hepTyPgCTIUzFy6nqnST9u7foiUwHk40'
-             b'+5dRRIoyUUGpctJVUKnhGBtHPvWHcDawsRm4x+ipEHVLNRriBCIICt5YhE6TVhvvoBAOOoKoVXVP'
-             b'0HnyjE7GBzw267bFzKlsV3T82Ss8aUCiVLW6dHh4SPPZiEGhe4cjGg636fXX36QpU+wcf8+Ojg5Z'
-             b'eOjOvYc8Irr0xFnebzTJYSeeGdz1j1F9AOR7VzAdNiqxx6QofXb28yq/zb9Lz93de3eZZcBwUQAE'
-             b'08nP6oKeevZDv0Og/K7R/+9vEEhrsS/WHZbH8t6zUtuj2tL6efnpD3zDd7bHaTHtoeT1PFuu6N7d'
-             b'e/T29es02NzkRfyH3/hz+tL//ad09+4dXgQxF8cC/cyl83T14nm6eO5UCpwjmu0/EGe5opBAUBpu'
-             b'3+tMlbQdL4uTj5RFXpzamUazYPWyeGIxLAY7dOmlj9PG2WdoNJ5xJwFv7g03aZoC9mJ00JiUBNWw'
-             b'Bw2QZ/ZzWqBdDyR8CqZw45sdHaQF/ZDnraGeC88+JQnzGuY6XZ5NIxCDr47qv04LsFcDGhbSUSvb'
-             b'wMp+pFrzjVyK+b+b4YvVoFE16b3SEBEYUa3xLJmV+Ap1NVzy64tWyUh8rqRnE575suc9mzEFsWUO'
-             b'UsnlwEqG+lft9jrwPpy3RCRkZTc+R1Tn3CVwPEIpWAhIHQkZ0V/mAI6WPlez5hmv2vA4dwYLYr4P'
-             b'vIArmQPOrIaFAACXC2lt14pXQEdmUYu2Q1Bb4uxSzAFwIV0EuE1qPyV3AagxmIIfArpTOyfPsljV'
-             b'7bffoOnhLjtAFubsp09hZNtgRc9LQz8b8whI0uxuVY8nyqhAXqM0xzwgkWTMjIqcOhMG6wwwFkGZ'
-             b'CC5LEWnVLboMQZ+poCMFYFDwtujlc8NyQpvDDrmNDn9vzp0krr5P77zEXRU2s4JnREruWp0ejdN3'
-             b'EAqLPPLxvklqnFD+5Htn7X3xyuh1uw3oNmhrSBN26SAJbROg3qOjCbuGOh4DSkK/SL+rBpvjs5cu'
-             b'f/twdMjfj/X2/mx4RgoWXltvj2UCMDp6dJKPzo1p+9ipvz514clvTW796NPdSkFe6SE7Spn8//q/'
-             b'/CZX/li496GRnwJMtw9xnTlMCeif/fI/ojPHUnU8OaLJ/m7GFtQkuv9N4eaYR2wjYMrYZAuNIdPV'
-             b'ctvX/MpTHdc/fZGefPnT5HtbNJkvxe42LXJMNyyk6i8ZHe9Zhpd59AwiXLL3QWswlIq5TIsVjHSY'
-             b'D18wWh/OfGqxwmA1bmFzgKy54qmnR+n81KkPCyICQDpfBsKtNI2zuUqeGdcZA7BKMTPhFBF2k/GG'
-             b'zecRR1g8qCjVfW+pQjIFL6pgG0QVwjH0Ly/MCsRD90DcGStJIhZzdXeT4C73thAlPNXGz6BE5xTd'
-             b'LwkDo/wXmrapkFAMsRGbcSvmM9rZgVCQeA14rhTLlPwh+PM4AuMO3CuWMoZT4YITLpwvV9DaMifT'
-             b'8EcVXTsFIXrtAmT4ns7yfUapR6VrwpER1MEbb9Y0S0mhMwYDH3q9SiTNn+VVfU+slws1U9JrHIRM'
-             b'D7pmoXr7gicQ7f5CXfAs8asV9WH/DnHlSdcOhkn9RjPWiYbNUI6EmV85SXtms7laKat4Uyq/MS6a'
-             b'h7pJPtMHzEfpmuJ8um2yHCTmBNRlLQSniZ80eioW5HIr2VfM6AeVftZECaDQe7v3mf5XBzXmSicD'
-             b'7E9ra3i/1R3cQ1IQ4pqW9n5sWE/gWdLG2LFo0xoE8BgmAIPh4NHusdOnlz/7+d/+o3/9g0+3WdDD'
-             b'wrEELiixYVFAlQDg3zQtRtubPfqVz3yMNtoVB1BeN8o21dnmNMPBuD3ozG6W3clitm4VyVSnPvAx'
-             b'd5at5QjA3/EnnqOLH/pkCv47jJCPxnVHsE/VEeRjiyjobOkcFDxTb6VKEL8DIhkIfq5Yi5INeZbT'
-             b'UTpezwmN6cczsJ+TASeIf8MhOJslK3XRgnhuFQuLYaXZr8Fc26wKEmNnP5vX40am6m86HfOXGddg'
-             b'MZ+ISIxTK96izG53LL+swbfWYMwiRUqpNP69WzFsQZVZtjosrsQJgws53Vry+KDg68wiPWwbLNr+'
-             b'mC0iYHPg9r7h5PP1nq3YxBrewZgPkUcthaobMhAtyKw/Lhp3OzhALhbGNFjyCGChjoLoIHCw1HUN'
-             b'FXIX2gBReH1L3b8kiNo9IgWXRiWJAiiZzunclWd4THPn+ls0m+6JkqDKAAvexBgLxEmm2f2SPf9q'
-             b'0yyOuc3oysCIQZUTjVZHsQnEjV2x0iP1GWejn6hsGEsIQ55y5aSMfONhYDbRThUdV3n63AY2Kp4v'
-             b'1S/AK8Yg5uPjOUStwkxq/mXPFrtFLsCUqfQ5oXe4FXJnxnST07W/eftOem7nYn0dxTwKz/WTT179'
-             b'dlW5g9HR3nqVfr+q/3T9wcDYTGsbddrr+P9YYgBajxpcE+nDn/7Hv/Xlf/+v/4fFdPdEHTSDzyIp'
-             b'XmfagRfuXruk/+jzn6NBx7FmPVcBCBSKrm4UA0ztTtXtNJCSVZFcYbtGFEcrUV7ewTBIlcmZqy/S'
-             b'2ec+TK67JcHfFM8MeKUrZBS9VuW1C41wPt7XwMtltQbA9G/I7JJTWeKZAuHdO7TRrdkcs9GLBiVb'
-             b'1HModRndH62Vax1UjQRiviPt5TZTC2cqmxxZ79+Q72BWMGrfIkNZNoGdg6l2CSCok/YBoCPbHaO1'
-             b'X/oVcaFmHs0dgAxCjHnX0HhAVY1EA3auABvyWIFjRcWBvtJAb9JMUQGKDFg0NSdPWcSI1RnNU0Ad'
-             b'AjmgocsBYEmtHQ5gHwodA+Bc5jM+/sCdg1LEdRyp2JSq9Ok5IFEJhWOPBNIRBQfsEJpkiccnMh7o'
-             b'9Pt08enn6OjgId29eY27Rp6NkkQ3wcYzFFcEqHKg10TAS9AWN8HAEy1nPhiZg+2z5wFZR4gPWeyW'
-             b'BYQvc3+5bCIqFA2Up8ZJUUdDqxS8AElfA8M6r+OSqNoFxtYnlcRW4SfXAE9d05MiezAk0Dt9zEpl'
-             b'c6gPAp934CMs1GvDxcZM6MH+IX9LRVdCukPTZaCzFy9/68TpM2v63/tW/cs6eu/2nQYsu94evwRg'
-             b'8YhogKvbiY3hmx/57K/+5td/59/8T7yWijWcLiSisjZN1fGxnQ36Rx//KHVSQTFJwT+3uBnfLyE8'
-             b'mJ66Uu+8SI/p/FwWGW9BVEVfgrb/eQaKRTIFoeMXn0/B/6MU2wMGOUVniYTOp8nATJ4R4SxZGrMk'
-             b'inKfG6147ZfT/OhgBbmt3VvKWC9dIzWgxAYRHnTmbJU0GZs8UnZyM9R31FYuMxqyTK2Tyhc0w+U8'
-             b'U+1Mhx9VGLAAs+kRgwGBmMfxegby1dkNN6olLwKssAYK8bTHbH0+5wDB2IBCVBZZSdmtRGun0sSm'
-             b'W8/qewvR1y9F9If53SryQ6oCBxaICc2YxmyIRi2M2WeeKZnoPJCo6S1VQY9FiQroDZSK+Jdq3atw'
-             b'EKPNcb4+d88VC1DnBAweDhLog0oQ+5RbtFZvsNIyXcZU4I2geJ5rdXlODrMhVKlLAESduilGpSGq'
-             b'bF5QEIKNDiLTL50mAoGphmStdVPlsza/OhV6zYeXedwg+8/oevPb1dgukgcuUxHN+CfoKMkFlcG2'
-             b'LoLdCx3tmJxviQQhKxtK1R60A2VISNM78CnBwDVlsGiU/XpOMnxOjtqtSnQyQsFJwf7BSMWqHCf9'
-             b'SOhCeobOnD3/3QAQ7WK2XqXfhw1389rrr6cE4BY9+9yL6wvyuCYAPF995Okl0Sc+/6u/+40//K3/'
-             b'0S+mxapTHbvTpUX9zMkd+pXPfjItDjXTzEjV2nwOeFqtwU7UibSo0beE+ud1ZhwE6R+t11mItju3'
-             b'vjFDLej8Mx+mM89/hBa+Q7ouNWt8bASByTU0K6N9ySKsKoO+ie5Z71z+ocfncyehzrK2+m/nVCQm'
-             b'5uDrcmtYqiHbR1RUuVXGhsUHdqKlToncoQDHX1Hxtc3bIyllsSv8/0I6PMxDL6oMpJsvpJ0uQjQy'
-             b'BgHrgXQMQSrRy3TNQtDqQPgD4OgYSCmfx4qHBjSEWmOUdj1ogEhMhEOuV4YtnotcYQeteJ06z1nn'
-             b'BtQ1CeQujwiYO85Mh4KxBawyiMRtGXJQdep+LK59hYBHl4sM7sMLJ9NJ+nHFtE2z7QV+AMlUvzvI'
-             b'VERhRoSMC8gaE/qsQOkOgDZIPB8PZ+j+vTtsQwxFQQAUfZCgKwMBuf/B7q2NVtSIKujzKllfwcef'
-             b'Vff4v9DLMOqnaRGqW2YMihxofBNk3uEUAyEIQL7WXhPVIJRUgBprR41Zj2TOWeI3Z7LmEKhOnxbw'
-             b'JUGvm86BLxk0GVXYSXL1kBL8QhOySAvTTEjneTga0+7egbBOLE9Lb+p0h7P9B3uvfOurX+d7vd4e'
-             b'ZYNWzMGgC7IHyfK1vsLjnQD4zuDR7zVV2d/42v/+a+PDg6LSzB9BYj5fcJt4OOzT5z/9MWqlxWMG'
-             b'2p0vcotfRFwKCYAk7e7CEOJRbFiDlP0MwvLBN+WdsbPV0GaZKt/zcPN7+hdoUfRkJq2rWqHKbXEF'
-             b'ta3DVuk6aLtT6Fkr4EPry7ugBjImWKPJSE4QKC/YHMhWaNFW5TZcd8fdBSnapPqyyYaMShbsNcAt'
-             b'f7YcbinFzXOlvIBaH8sKLzIHP7BCn4CyMLf3LQneJRsOLnhWzuhqXfwtyHElrwh7Vtvzyu9e1jnI'
-             b'MlXOi86AJAqlsAbgKJeuw5zb8DED/Vysldqv7yHBXDD/2K5HbKCcsbZes8gYi5OguR1GwWWw8qO+'
-             b'zzTpo4yBQm6ZSLUfdayD/3U6XX1P3dRC6h9gcDtgGlytP4tOkf5ZVoosugG5HlkpsKSzF5+io4M9'
-             b'enDvFicC3BHwMVsyWxer4EpXAG+FHnetz0qlwFCnDnpBBrW5ExUV8elioRW5nFPJAzAxNSpw6ube'
-             b'GBuqolvpJBVKkuURmPk76EP7DoEkv9L+tzGFDQBUBdBTkWG3eMaK9IzC7ZP7eNCRKD09fHifBoNN'
-             b'8lVbdCKiKDvCPnsyHgv+RkduSEzPXDr55gd/6aPXKrZEXvPTH+F0luXLDx/u0+6tWyLLvXb+e8wx'
-             b'AI/6CwZQ1miv/Vff+NP/dNhpcbXvvaw8Bbf6SvrMpz9OvW6bluD3RkGlh9U+LdVaBekskmlP8m+e'
-             b'XXvjxhvvWqp1TiOckANrBP/nP0zHLj5PDm3/5cqCT8RB1TF1qlQp4aa1irpsadNQ5zIOAQFfDWDf'
-             b'oVUj828N3jbf186rqN3Jwuq0igx5waXcMTCddFYaVPEirly9IsTVM4ANddLfQWVD5wRt/joFXCgK'
-             b'Evt592g2g0BO+r2ekwjNLWkJWd70PiQCQvPz0impl+JlwKI7S6GDwbehDrlC1TaCnBM1IjVeZ+aF'
-             b'gvqgd4AEBUGUKaZBqvnMNtBkgxd268QY9z8KCE0W/prlhucLGVEIfkEsasVsRrT/xedAjs0rytw7'
-             b'kwKO7wDRmVAhT6UV/In3sEpiMIaAU7dE0TSIZIZIXp8PMwimDD7Ff5D0dHp9ZgyMR0d0tL9LBynw'
-             b'wV/AlBQNF8A0wFjruMj2FpqukNofSzu+6VKZLHB23NPoHowKohgGA3Oam1/DcpDrbCJQ/KxpJ58H'
-             b'9LBrdqLrIMcmCowNyNA+w/Mz3YAMJRmoOn2mxRpQFc/aJF2L/+sPv0hb29v08U9+hjY2hgxWxfdu'
-             b'L1X/c5aK7shoEEyCGhbOJ95IN2MyOthfr9CPcOaPNXBw/DTflxjXiL/1BiIbOOuP8kGruvT9r371'
-             b'n+xef/WljU6RMvsiB7eQFskXX3qBTm5v8fw0qALeCutJaUaFtse1UrZ2uC8ylclmpZEMxKc4gLTW'
-             b'oQ4+ffUDdOLKixTKLoO4vEZlgNQQ+KpUreQvQR2kggEX3jU0NbN7ZUqbVbP8eQbkC03bP48Toi6s'
-             b'TpH/K456Gd2t1yoDGLWLUEtyE4LwxxG4ocnfaXVolhIpliZmL4I2t6xxHpCsxVx1Nhekf53uJyc1'
-             b'UWmSSJ5QGZIq5M2FFriIM0mUavEKsFGAUAcXilcgHcsIKFKCprSg0W1gw5daAjhAfTLyqPWzfT53'
-             b'Ab95lfQNuT1sZkO5Wrefs3VzYN96JBS4TkzvcyKSwxgCk6aNIjeMGb59LmsuxBU1Oh1roOpvjCQD'
-             b'TY5G1B/2tbL1mpgQMwrksbC5eGRAJXc41MM+5lrY5fOQRlWkbm+QEtwenTh1lnbv3WXzp+nRvlgi'
-             b'W7MeIEXXWOj6rOlAOeGU5Fw6GlGFiDg9rkWeusjqAepyqS1eQw0aCj9a9yXGRrdRE+pitfvjm+fU'
-             b'aJRszUsKonSWRAXuIBQiWpC7Y/1U5TuYfvGzwg6h9L3vfZ9u3t6l23cf0q3b9+kff/7zdP6Js3wV'
-             b'7t7f5Ue+ItE48Aoa3Nk+/vDY+YtUj0frFfpRzfzTMzOZLqUQWgf/9WYJAALio9zwZf7TP/wP/6pT'
-             b'KHgOwVSr7FaroKevXODKgitH04LPz6OXliOkYoM1bWUgj5klt8lXrHzJQGMMVJOuwTytKJvnr9KZ'
-             b'qy8x4pmXVpaRnXPbuFJ+/xya/CwIQ1k8hatkIOhbrZx8ZER+NDaCBZRGhIeUErbqjW7cs9wNoKiU'
-             b'qJXOv2nje/GwF5GavgRwlctFlEAXBah+aPOjepxCpz4lK3ExZUvfhf6eTF2PBX2qPD/loIH9eQkw'
-             b'IhZUsTkRTIEYuQ97WHaEWwjYUKvyYGqAccW0hsS/AZ0Hp54MnLQoFsNlExiXkywWBVoKJVA8BprL'
-             b'FJX+5XQGTNx6n/G5oAshioReMA7apYBb4nI2F9MY/WxLKnjGDDqi0gENrzYajfg4eAyQ/tcbqESz'
-             b'tr8nkzEnW9yJcE1ih/dO0rXqUJcMM/MONDw1kshOswjRHqjoxJkL6TpP6Na1N2k+PpIxgFLjos7P'
-             b'GQWP84tyvYKjBiRovgbwI1DJXxEWqjPglH0SVGUxajVuCBVa8RFwyhVw2mlj5H9UrELGOSgk1alA'
-             b'UWxoiQ1aPDa4GaaIOmZ+4LtlIxruxKXv8sPdB3zP8bsHqeL/7f/wO/S5z32GPvzhl2nv4DArJDIY'
-             b'1y34Hlet9jg9oMwSWW/vfeaPizw6nNDe/iFtHtug9VBlveUEoP2I7ICl+q/o7o3rV2++8cPPDUsV'
-             b'LdHZPQLdpUsXqNfrSIXnJChwgoBWcZTWJLdEVcmPcUteudLq5lYooCibxxnVjoFpqfraPk0XX/il'
-             b'VCG1069K9n1HUOWTBTUOM/SqzX+vufvhFcRWcKAtTGlO287z+YQrXRb1yVxprQC9oadd5l47Q2Lz'
-             b'Ei3By5ttsbO8RSopQfF3mIYHelin25VjgLERC6AsdJQQ2JK1ZpGbUiR8l1NRyWORnUqu10LU+RC7'
-             b'zCXPafZfqmwurq0vRZYX9rrL+ZKTCZYf9uJNv2A1P9VfUER/VBg669Vjju8EB8DWzADtlYXYMKu+'
-             b'u9POipWcUPxjMaKlWO7agNpEi6xah8KgLPxyXwtWVoRtsdJAVaEQXQp8JjoApPxzTnJ0dGSiR8Gq'
-             b'3/S/br8nDAEXGwfDzHBrWv08IpqN+XMgRoTP7PeGma3I9D/w5E0pUgOhVxMqWXfVJBhgu/S8XXrq'
-             b'WXYavHvrOrteVqXqVXDHy6vMrjoCRt+MLeBK6eT5lo/TAVRslAyZdmf4AO0a+AbSkgOBUzxHtsc2'
-             b'ZooLGaBitk0+BLPN4O6QPNZRcRLClAmWSOBZV0tn7xuVSpzLlSev0I9++APuorS7LZrOa/qDP/oi'
-             b'jWeLFJAOqGqnQJ+Fmzy1qhYd7u/t/fG/+zfiy7He3mP8D/TkB36BTp06R2ui/3r7WwnA8hGCbKtO'
-             b'i77x5T/5l5MHdzf7m10OTizuwY5/nl78wLOyUJihSLRpuiD5jR9Mth5pxSrtR68t/pjnnU6DKXlV'
-             b'GGsP6KmPfI6qjRMpkC5l0SyUYgSOewoQAHaJs92cq0Qs5NAaB5Kehw8FflZLAEkBgClyGvBQ9UI+'
-             b'Fwp65FyW723oftL+N1106AXU1Aj4OKpztQgRJCx2YSEugjiu+XiSghprA7OjGoPRovDMGdG+qCUg'
-             b'ov1dCPAOGgCMVse4ouqkn82lwyL9VO4iszPjQvzsEN/QMShaLVnOC7kWPB6oLekqhMpnwVtb5qzv'
-             b'H4Xux+fuROzHq2SwX5UujkpzjGYO1KJFPRM0f1AhGis4+RGQdjUzE1StEMfAngx8SYx6JhoCMpZR'
-             b'LXwdz+DaxKW59QVW23OK3M+gSn0tRgZBuz3GLun3+tq1WHLi2O700jMS9HmMVkxJ96jV5ecnt9qz'
-             b'MHXDbJAFWMcm6Vg6G5t0ZWuHbl+/xmDBQhM0T02HSYyRTBgo8hgicNKp/haKiymZFWEKiuJy6azL'
-             b'RKtKkg1okVYaT/k5dc1UyuiOPlKjQxDrbF5kKH1+brILoiQBw40NckjIFFTJ37EUwK8+/TR9+KMf'
-             b'pW9+65us/NdiH2WiL33lK2KqpR0V73w+l8HmxtvtqmCA4Xp7L23/JR07e4l2Tp3nhHm9rbe/lQBU'
-             b'3d6j2RNAYItl+3tf/9J/1m/BQa7mljsW8Ml8Tk8+/RRtbQxSBTDLqGfSBYcrXNIKeWmVji46tuo6'
-             b'qVZMVMU42ghczPfuDOnqy5+hanCckNRAnCbUigoHsA289rBgETNQtVrQK0fViBl7p83CQC7PTiGI'
-             b'M6Kiu8HgMKuykChAbjawSuBSUM5Vm5XLynTO88VEQGwQwknnwWj85czkiBjA2CpEiIWDLBC4Qbsa'
-             b'KQhXRrVCfT4bMZ2MUeZRZu58XSZpfwDx+UqMdaa1mP8gcGC8h0DM9D4ROgo6u8dngNMdlymR4XH8'
-             b'VEF0eO2c28BWmQPx7021rShUW6CWeXFRZnoiI+lV4MarrC6xal/JWgIF2wPK7VsyWr5QfIVp3gRh'
-             b'PAQLmNI1QgLG+g18fwWTUaqPQyTj+8t4idR9j70Ogtk9S9BlT/v0A+AofCFYkzmPDQpBsHtp9cvi'
-             b'GGVGr/LGw40dQbcHs4SI2Rq52x/m4Dg6OqRevy/qeLQq7GS0fJdBfDinZTrYk+eeSNVwl+7cfIvH'
-             b'XfbMRcWOFFq+W3JeZPi9cOpJEfwNI6E5Z1IApHsHz7VBLGQOag77KlSlwv3siUFqSqSOG0Srrst6'
-             b'jVX1kFTVsErJkiT1uf8j45r0u0995rN049YNunnzJmsEVAX0BUrpXpmZUpTEDB2Ip5/5wK2PfOzj'
-             b'NDVfjPX27hIAfP97O3yd47r6X29/VwJAj0oHwPfoO1//wq/du/6Tl4cIthz8pcoYdDv0/HPP8CId'
-             b'deYooiouS646dQdjhpRS4qwtapRArh65LW0sZAWYuRadf+4XaXjmSkowYNATrIPMixjqrBn48qmq'
-             b'wDy21VEULM/FowR/VJ3pD/Te2x3pBnDlidegxQ67VfgYAESXFjE2LEk/RwKBeXpgwZuKF2Vpc3sO'
-             b'6kE7DU5Fcohn2uKW55jKRzQ9GvFMezae6OJfc5U7Bme9lP2xNG6t7XMhu7OOd6/fE0ocX1OpkDF7'
-             b'dmHBwXjJ1L2Cgz1arYRxCwIdfh+l2uduCLj+vmgSM8VmIJhTbnG7/Dun9D8hzPustMdBs/YCQFSA'
-             b'oPSiZY4PBoKM2IWAImC4QlUTnRyjYTKcJSICjBS1PhljMI7A/OmtjRAbDIDhATDymabrOOxv8H7A'
-             b'+e9BQ6AocpgKmoC2WDhpzokirJxJXfcQiNpI/OJSvRAaWh4Hfw2qSw3mJRsrUUOv85rsUKFeC0Qb'
-             b'28f4PO5cf0MSMKvBVYbYbHULc96DSA4L9tTqPIiEpG78DJwkJIHlsQtNCHTGL18xVZCUjpSp9Pno'
-             b'GwVKww2oyFNQoK1bySMMchhdVDZswZgV6CqEmPktSlAQ50f8+cQnPkm/9zu/zdbfZkBmmgUM6uRk'
-             b'k2gxTd+r/sbI9TZElGm9vbtxLInd+bwO5NbBf739fQnAYnb0SB63qrWgr33h3/83RT1JC3yZpT2x'
-             b'Epw6cTwlAV1uPeuAVpbeIItQrW3TckV7nnMKbv037Ufji3sTjXEF24ieufoCHb/0PC2CU5pbEM47'
-             b'VMfmc+YzV5XY+BYqNgTuPIKNUOk6Glxq6rSlzd9K1T8qfaaEiRcNt7pRgU3Gh9Tp9hkwWDBnfirz'
-             b'1Vo001HjE84VVW89o8VkwbSvMJsxyI4nGezStszz0hHr2EOFrxZqFLoHcCFEi5olUsVCdoaORbvL'
-             b're4ORuXoMCh9jUVywLN2C+4YoIPAUjQsoOM5+YjAFSxd1qVHkK7wX04yCtYVYAqeFwAlziNqlSe2'
-             b'uTo/p2y0IN0NJBhVocfphVSwAhrLrncI6HPpSlTtntgtewTOkuftPPcN0plAaJqPx5xA4XpJb1o6'
-             b'FIwfWYYsuytgTdcwCbTKhQ5Cv1/lZBBt/mACSzrfbusYIDKNsq1VbchzdLAMmEGSEokuOkdkbWvH'
-             b'SV3UBCKSyFubtapi+98xjzX6KEyChts7jBS589brrAlgVFaTIF6RnCDBg0r/3DVYfjUDEkthp4p9'
-             b'BrvJ5kouNO18q+KzYIUC/aKBWhtjAaE+WoLvsky2XGajJcr7liwIJfvMhkt6HfHas2fP0q/+039G'
-             b'f/InX6LDwwn7ZvBVNR+ItP9Jei7OP/n8a7du3/ve3d/9vTVV7V1uGMs99cwzdP7CJVqhIK239fZ3'
-             b'dAAegQ4AKuCb165deOW7f/657baId4gATFrk00Jw9uQJDjC82CsCOoQ6h3sWjHGUEdms4saas7V0'
-             b'EbL1iwnoiGgIRqCb556i8x/4KM2CVOizVK110n/njDUouWLk1qpKo/I8PAVN2PbiGIXypTNl5vlH'
-             b'rsL5eAHgqwoGuQEbANQ5Fi7MhlHxV6y8t+DWPdMp099Bs1vORmwAVHNwrqEsw8GbaqOn+YaKo+WS'
-             b'RySuJdCgG4BWrND5wkoVWfLvYrD2a+M9T6qmx52AKImCL1orWu1SsS0mc6nWtG1PisAXFztpt0Og'
-             b'h8clvmic5Vjz3sB1hSQ8TubxbCnKrn9iHUyqLVLr+IGxDnkxl7Y1ri/GBJxgOQFiBlX9a/ADQboY'
-             b'KQkxoShnDni1zdpd7jyQKejFuqlGzRGQGuCfhU/c15KFcMyrzueENjrFKETBZ+DfnV5XUflBAXXG'
-             b'tRcKIGb6BUyu0rVHEjfoDyRRWWGsZP6Aij1tbB9nyeV719+UMYdvNPydVsnNfQi562HHGQwkumIr'
-             b'HFUP2P0NrwlDqhYhrmAElMgaV1greCy8OTOGrNtvuYSPzTcS1xn4Gbh8LuqwErRlDQjK0pmlyv+J'
-             b'y1fovzhzjr71zW+lP9/WjpOhMGHqVNCv/cZ//T9fee6lt0eHB2uN+nfV9o/UG/To+MlTNDo41NHU'
-             b'eltvf1/sLh+BF3SrR9def/Wzi9HBpt9oZwAfVg0UT5sbQ67gorYODRHvNBhq2CeBQC8V3R95POp1'
-             b'ERAP8VokTtWIdePURXrqQ5+ihRO6EGhtABsyRz0lJQuA+wDc4ypf2rJW0aO6NqtSKZlUdS4KVQ3O'
-             b'gAXm+2lf4HVDNa/TqbjaD/OUHCynPPNfpKqQTXSWc67yZeA9zyZFWQAIi673StGW0YhUjrI8F4Uk'
-             b'JEzvIgH+oXUKRTrzYTfF46DXL8aGkIXOArv8aekolWoQt8RgCPpaA7Agt3G9UPFDT99lx1nh0i9U'
-             b'cwAgyKWOCMCFh49Ct6NoerMFJrHXBV5BhGS8NQbUjVATHwY/Cs0Qo42osrLW9o6mEkiNOZMxRUR5'
-             b'sXEOzCY7TpUDvf5Jr8FnjCcjGgyG8lytejVEhd2l5xH0x6rfW3Fm1Ga4PpcAAuJKtTpdBuMh8QFV'
-             b'sErXi2mYOs4ChqBkEyvtGIAL3xKA62I254S4DbOl3GIvpBOilfrWybM8Zji4f5vVAHM3wzoB1uFQ'
-             b'zwS5xob2F8U+SwAkcajfgdA3IKR1biz/zI6Z5NUcqKG8yvRfjYt0RJfdCfW51ZkAB38eW7BVss9J'
-             b'h1ehJTacWgouAd2WU6dPZu0DUgEqnG+rP5il5/YbcXpELbcmq/28G+5dmZ6zU2dOMwh6va23n5oA'
-             b'7O/ee+/xv92hr/7h7/8awV0ttnKAWqbq++KFJ+jEiR1u5UZD90VqVOCcBEWfi5q8fMms2onOfEDb'
-             b'Gi1t9rWfU0xB6IkXXibMCpeLoHLD0u7G/H2WAgDU7RAYWVkOM3fSWTMCrQndkCrGMU9dnezYqAaz'
-             b'aTEwWhzucuDnqj4Ffcz1Hdr7bFCkxkIrHuwy741M3RMCmqyV3gc1ZDEJ1cDudcKfJm1te7ViJZqm'
-             b'c2gzO0GSAKjN4WoVpZr+OPssz65pUAVsYy5gIji88C7491ydwuymU2iLVgxwWnDyi6bM14gU2DwY'
-             b'FcV8MaduIXahmIUTm+cEDoZsJ81yolJ9zthfvM3jEeLOQCWJge51nq4jggLGLlHb0I33AensuRZF'
-             b'P+7SyGHNQWsEDqNo564I3jceyTXCi/D3XnfAYL4+qm+r6LXvjiBbMvOj4oQGOgDMzahrERQqKtWN'
-             b'iOrP0ARNr5x4wQZo4OTRzIKfsYK1IzQAcyLW0q6EUCAdRgtFocFzpeLG56dzPHXhMnW6Pdq98aZ4'
-             b'XXiV/NV7H9X+NyrF1I6PQaOaDYq8tRpJWSdgRXBJ82oR4MLPtKyPBiKwcZs6E3rFJNgIjscEiicw'
-             b'Dwwet0WlgpLIPkdV6bTOCCeSSt3ERwwHA+4Y4b3OZLvT34c7p++fOHnqGqcf74dHyf+/wz/95Mev'
-             b'cufv1KVL6PWtL8l6+xkwAKmCfS8bgEz749Hg1luvfrTi4Iwq2zFYD63QsynbR2UXqKksQiyk0lbx'
-             b'kZKkfRxVe94Hge5F59WJjESlj+f0KWhSi5564WPUHZygOXuJixe8UxESc7jjEwTSH0mBVoKLWhTk'
-             b'eL66XKiBjqjkcTCv51L71DOaPXyYquQxA+q4Oo0S8FlHP4rXvc07AycE2sTwlI1XogaLQmfrgj1Q'
-             b'kGQNS1/hvEcz1fHyOhRAvV5PgH3Kl0NQbbPefkWHB/tcVWKEgavKgclmqk6ukwsQCVpyQCy8Sdku'
-             b'taqO1OF5t+eFeDaTKr9U0SZGzQcBaQIUyfa6PJKouUeBY5XjEyABdyDS+1tQWEzntYDZUAWufM33'
-             b'hvO59HuMZ7ItsWu8EkYAX6bjAatiPB7ztet1hzqDlnZy9NnVXiresFRdh3RNQpkSgQ4ZGh5aCkhe'
-             b'Do8OqZ+Os+CxSikqk9HogC7LP9ezlCj2SrOt4iSx2+6RgQRr9bEXNT+5r3wvAYDrdUTQaUUcx/LZ'
-             b'Il0PU53kjkJKasqq1SSJOnzAMW+dOEPTdO5He3cY/xJW5LAzpz9jK0odEdRqcWzmUl6DtYptNWbU'
-             b'GTjLOAEdu0V1uOTvTojZlKvma6gijaRmTComRSqLLI2SFoFJVJu0csYbiIJhwVLTKtnsZLz14MEu'
-             b'j0hKBdciyUBS3xsO3+oMeiNzc1xvP/savHnsFL39xttpfVurJ663nyMB6PffmxAQQFPf/dY3f/Hh'
-             b'3RtXUKvWEPQJIgCEGehG+gOaXIimdV9rtR9VMMdn9TNeQoOOA7xa9phFr75/kRaWC8+9RMfPPkXT'
-             b'ILPjmmfzngMrU/Ig+MOB1ot9rC/lmJBfqLAML8BcbTpu31KYc1t/OT+i5eiQtfU9wGnLhQKZbPYs'
-             b'lLI8oyZS5T1BTkdDT+u4odSFL1vv4qzSe6dLoelV+n7r6XMiYfx7CypebO56nXY+DvDXBWymGvha'
-             b's4/HRxxwUOkiaHVSkqDkPg0DxEkMGWVMg0Kn29bPDCkYH3E1iqrN6WKMJAHjEHQAvFbq3lkAcsyk'
-             b'8Ok1+D0W9Ra3vCW4zvgaRuqXXW37y4waoxlS4B0SB69qjEhMbLavlgpS5atwUGYopHs/HG7IrFmp'
-             b'jiata7YSnW5HMSfEyYWBosAMgCsi7iPOs+oOtFejcAu7v3qdFul54PvZ7yu+QRM4HS3B6Aqvb2mr'
-             b'n+f0Tn0JdCSGDg/7QqDj0/RtZZYfZby1c+YsjcYHFAGGBN2T2QqFEg108p6d/VZAlvw5er9cXBEn'
-             b'tLGPogM04JtstbavtNKPTULgZVwSnctJQ0PLdcweWKZr0B8OqZMSLPbWUPth3ofaekbjGLAtN/E4'
-             b'6a03rzUdAk0w0CXYOnbsB7ev32Cw5Xr72TZcQyS5H/rFT2RL6fW23n72DsDyvc3aypanv/zmn//L'
-             b'CPAbSdUPyRkEjPNb27S9uZGqy5EA3QKtzPoFoBUMyBTFFs3p6mR2u2o5w2vYfBlp48QTdPrJF2gS'
-             b'i+zBh6of1CL4C0DlbomuAmR+lwsVtampSIGJq1SYoYCjzypykR3bFqMHvODOJ4fkljOphNLCuQhC'
-             b'1XM20FaZdfRs52lfoH31Oj2dy4utMSR1zQYYVfdoPKIu1BZV/Y8DQjqeFgvelGRkbxNYmUym6fVt'
-             b'tU2epyq0I4uqo5WqKHJgN8DcnF3+BECIitQrmK7xgnd0NBrxqAHBFb4BuAa9rlS4UYFk5tuOn2f3'
-             b'O+OdR5HgdaHKuv6GFsc9hIqh0NfCO5MjBG8kIc5kbRvkuRe7QsEE+EIFm5yFYP48MDFQ4UdNGPEa'
-             b'cPlrnqu39P5IQIqq3S9OhtJCL8tCgYBq0ehkJh5EhF6rdp+DP8YBi9mCEyAB+AkQEd0J0SyQAIjj'
-             b'LdkLQRJTFubJeBZi7wawIlrayg48PuipX0DgSlqlffhZY+BrkHHaiTNP0J23X+eEAHRJBmgqg6Aw'
-             b'ISUS0KpZ9ZqsoWkW2DNjiaXoa4nUdiNYRUIHXMVHRMrjGJcbWTHjQ/gaRfUJIBH7qVWiGtci2ps0'
-             b'MSR5tIThEByrXt69cyerVApUCBRHT8+98MGvnDx3mYG86+2nb/iu9Xpdevut1/PoZ72tt58rfrv6'
-             b'3UsBYlGfHh66N3/0g09UToROatXwR6Z//PgOS9bKwyl0qcJLUOEpblDLX7NCV9UYUdf1WSaO5/MA'
-             b'V/W26PIHXuYRAN6EeT1/VqrOFovALWf2isdaNJtxnMI6j6DIyQE05p0YAS2mKSCmNXey94BR+yxG'
-             b'goorLjNAgc1s0t8PD4+4q4AgYE5nwnSQc2av83rJsrqdoqWVk7wOhigCfgxZiZPNicx+VWsz8wTo'
-             b'oWLV2TjeW/PnLLltjACDGXq7rDIIDpUXqs+yGnAorirBACymM/ZgcFoptqtWBsyVHh0CCWZo/QPU'
-             b'xoFFk4XMLQ8yGsB54/zR/savxympQQAdDAZCUcugMjGPmU1nfA+77XZDtwuqe4/ux0zYEb2UGAWd'
-             b'WwvOQwCOLICk4j4AHVZlpxGE8k4ra2UscKwBHgHzf6HoTY8m1O210/PgVSxIwIcs0lRKQO1C9U+x'
-             b'EqLuWHJQQhLUUpwDi/Hw9a+5W8B4AeXVGzK/yHbKXubW6kyJJM6StVq9AaLR77T7IeyJgsxQiFPa'
-             b'2tFgY4vuVx1aTheaaKmRkfPZ66c2MKPRAblLtpIoetXYD4oD0HvqssqfSADXJtujAV0EDKN9rFhm'
-             b'O8oOmDxesd/BEyIlKEheljxa0kQhOAUvqtYA8EAM/Czpzv1dure7y9eYv9MRYlx1KiS64czFK98r'
-             b'KxlvrLef1vYv6PDhLk2nIasprrf19nMnAJ3e4F2/GfPnN9947YXdO9dfZOS8ms9gzUXA2Rz0uD3P'
-             b'5iVFI49q6GasTVLZRA2kslBFRPD0Hm8UFq5MK7r83C9Q0dtmgQstpUTpDopipbRaobu+nM3yaIER'
-             b'8rUg/pmSBqDaeI+Wkz2hqUHzHYGeHQEFxY6fj4/GNMS18SJLy1bGDeGMRYWkTSyfUXm0kSVQseod'
-             b'B74iV3oGcsShH00nPJcu0/uPUjBFG7liqpzwoWsTR1L740CCkxDXvYC0LU+aud3fqrJSHYP54HTH'
-             b'n6EKdSpOIx3hWh0YXfYtwJgEi4g2LrRabuh0MjYwq+PIDIvYksA1X8z4enVRMWulCIoloz4gcjSS'
-             b'4AqmgV0rMDNQ6Zveg9PPQxKF9u/mcEN0AvJ1MfNdwSQAgwHj+2j6AlBKVLUzJAbDzYEGxcbm2bwl'
-             b'Vmf0JnEb7EjUY8IVTaubkybns9HTci4AxV5H6IMYb+D6dTsdfqDFTjnb6knHIl0jdKk6rXb2IQCg'
-             b'E92i0gxvdPaOKh2qlacvXKLrr/1YEicGjeqIiVQmWFPmoMdtgDszFfaabMSsqbGifcBOkzIaECGg'
-             b'FX0A/rUCDn2j0S9MPZU31kof14hHLDpt0N9mq2V+ntS6G1cLXZm9g30VdZLkAN+r8YIla988c/6p'
-             b'1xahXFPXfmrlL+qhYF/UYV35r7f3kADMl+++3eZThfXKj777ycX0sOqWBU0WqhKW/g/z/+Nb22n9'
-             b'GvOC6hW5zTQhbWPiy88Wv7VUdIwu5sWsbERIODAQnb5ylTZPX6RFFH15tCmh6scFlc5XXRDBHATQ'
-             b'Vrsn1EPw2aPQ/sDvn41SxX+0lz5qLkh1gNrqYLR6UaPzYkoizq+R22wMFCOZhQt3PDZ88HpFZtWj'
-             b'wp3wnL/bLjN4azydckWMl0AZsdA2OWb50h6Xue4EARNIdSD9gwTTqIkOrkmv3ZVrXEhQjlnMXYOp'
-             b'Aus2Njdzi16F6/ifh9Nxw0+HrG2vI0Ee1z2d12Q0SudfMVgP96qXXmuGPVGDtYAopQIGDiEafcyk'
-             b'ZUvxeUCygn0Kf9yq08D3AZ/BKRezNgSYh+q8PRjmdn8eaIISWpugsooJRQEFCoWyoM0U9C3oGOd9'
-             b'PJ5wgOKkg9kUlDs4Tgnv+Ge305dKvZZuAe4B7jB4/zi/2XzJnQAcXzclmAj6GKO0WqKEWHhSamrQ'
-             b'MUcpgFH1oEAnx2XbYDm+wWCjEWlxpojhNImDHv4OnTp3UVgBwTQw1I3R6JGKHTH2yap0b2Ara4Be'
-             b'ahmNKPLfHI7J24DGDIFUiTM2Kn4ZD4Hkr5AENFCjsohr00/Jmjz2RRbTckqZZHxIbGyOcexvXrsm'
-             b'oFgnowusIXguzly89K1euzhCN2a9/T0brltKDou0NgHDwuZa9ToBWG/vIQGo3oMbIERPXv/Jjz8J'
-             b'aVtun4oGHs/az5zcTstPLZK+pCA5xVizSQ9Rllo1ExCeaXrVRc9mJKn67Q5o4/hZWvIeg6xKqgPP'
-             b'wTEPK0kd8QqunOpUecm8llCKpuryCJws6I2m/Sw1sOnHmCe69DtF+tVQ1QpmwuI+Go1puDFUrnPk'
-             b'5ALzdQSaSrsO3Io2QRuySqfI9CnH9Lyaj6ulgDCb74NOxl0A7WwgcE2VWidtZxbUpSPIB6fXQo7Y'
-             b'Qu9ofMRI+CJr2qfTngnTgVkR6XT73b4qAMYcaC1A4PMEgFfq8Uib3StFbM7zXnmN4QJA82PDpDjn'
-             b'7gLm79xCVwEinJ/TdvFkPOVxQ1W2MjhslII0MActHp1I1S4eAaYyJ6j+8Qgdja48RTyGmLKWgI1l'
-             b'omrtSzCSbgZTKI3epop01kPHeUDRcdAfCpPBSccmmmW0BUtedbMHH3o4PKIwidsqVfA+ixcJKNZM'
-             b'k4FVaLWrRqrYO75HqNxa2vFx+lxJt6giU1gEdm/r+Cnaf3Cf6qN9uRfWVXI2ArApWWy6CKHpcQTX'
-             b'JICcXmiXgKihecrDUFCD9w/aVSHGUDAjwDe4QxllhNyGFplh42o4YVp47UOoY6GNWrAu7D18yAm0'
-             b'fbd5nJGO+9KzL3wJZkK0WMPY/t6RK8aRRwcp2d2iNdxvvT0aDIB7d+02LLLjw1HvzVde+SWZSUsV'
-             b'FGoJJtubfQbhiZW5Zx1zLCDFSrBzCg7iNrSKnDjVjHeqOT9PC+GFJ5+j7tYxURXjGWzMMqvONdrx'
-             b'TqsKvGaRKl18GBab2dEuLfbuM0WJpXLBAigUhZxNVRBApzy6QGCx6kza3gJuQ0WMuXdTaRJ3GzC3'
-             b'L5SxQEa/QpuXRW9SIEJly4HeZa11LIauypNVoVnxHLjMAVAYE5FpeDLCCGQK9i2d6ZNWlVGtc92K'
-             b'vZsxCJ0MbJXOJdXYHGp1KaAPh4MMGqNohjeSmI0mY74Gw24vMxv43phRkIu5dZ4lnLVtvlyKi1xG'
-             b'5pNgB132f5AguTnczL4NeUits3an5Sb20+/3FEsgbpGdnoIgVb/Asw6AiPTA3ImxH0WRPysqKwOY'
-             b'CTAeMK/vsQiQjlv4XvJTqFRIE2mKInQTBBMRWO63lvYrxg4p2NWmYWAAutxoyLZAotuAY/ImSNVQ'
-             b'7ibjMeNZ2i2lxen3CB2Hre0TdOdwX7EGQs8LynTIyoi5da9dGk/5317vi+r95SAeLIEI1KhK6nlE'
-             b'kwOkkDtMzG5ROWnpUkQeVeSxHqp+Ux40ACKbRenzBE/6ownt7x9y0si3rZDj8O1h/YGPffrr5fZp'
-             b'GmytLYD/zuI/JYkH9++x1PmaIbneHl0HoKje3Ts7HXrt+z/46I3Xf3L1xEZbNO61LTlIC+yJY9ti'
-             b'juJN6KcxHSUWz3GqlKdFVlErEMnn6gHiP4Ptk7Rz+mKqQipZ7HXxi2obrHBCmYpGk701kFhNs8Pd'
-             b'9Oc+V9shiqEQEMfOUM1qN8zqeZ3OSgBlFAHP0usUKDnwq8c58/nnc66EvU5cl2yXW1NbeeLkRB+f'
-             b'8RClUrCCJAw4/k5bJYiDgLtq1RQQRzrpWrDzoFZ9wFcAHT3s9lRtTpToRFVRFnOhykloFVVB4ja1'
-             b'V8la75rrBgxD1RInSIASQf3bGg5zrxFXVapZyhzvVtnKmQ94/hBv6XUL6aqwla+X+TwpLS79bzjo'
-             b'83WRR6aTqZScEOC12TlGRZKgSZCud4uFdSLrOFiSw8qIUZTlvM47FgvRVcDfMaqRYr8R90WAGR0e'
-             b'8dgD976lXYHlUlrpvmy07w/2RTOgYmVEl5HVUR0GlSxBU7A9oFlQCq6EOxLpOSnZK6LguT6udRf3'
-             b'OAgANGoSIkJKVoaLAmW/v5ErZe58aEjH2KE33KCi06XlZEQVrTgNKuBOTJm8ihCFTHnMDkFRx24x'
-             b'ZvGemMcEqvZHZmvtc9JLqgRoFNgiSuUfFXyJ5xLXsnaNr0DMibh8d6IJS0HAKVX3t+7cTd+nmXgv'
-             b'KMoQ16+7uXW9dPEnB7ffeEdXbr01G7Awc4h9+TXgb709wgSA3i19JC3C3/z6n/7HBI93amfqGRbf'
-             b'kyn497HYL6cqNyqLbWH0sQY2zouFOAKbZZnP8q3BlXTyiSvkIFcslnDKCw9Zxzwr19l5OK1EUjW3'
-             b'GD1M1f9DnufG2irlOquhEbfI50xdZER71M8QG0CpxrywCIIeo88ytTHr0xt/H1bHrd4wi80jyDfs'
-             b'qZj15q3VjR9jfDCAQU0Q2l/VMzBYzO/DjBaYATayURii6SJgOzw6on67pzLA0ilAa33Q7+v4QjZU'
-             b'mgysK6sGPR4kMeiDxkdN9SrBt8yzfxEp1lo5Ot6H2tTzz1hWt9VSWptjzQLcxiNW6muJsJDOluHI'
-             b'x6OSXrVSzbisetdK97tQLXoJONK5mKRzwvVDN6BJRATUWKjaod4aZiogoQOWolW1FB+h4EbFHrAY'
-             b'UtHIC28MB1rRisX0fD5N16XXUOmQZqbXbwyHiqx3zPwAdVM6KcT7tS4AqeqjuTV67TihdT5bzPi5'
-             b'Q/A3iiIYM9CpKErVewjQU+ixyMvujbdYapcxM2qh7bVqt66SYydA9SCMWvtrsixKv42/gYwOGqc4'
-             b'4/mTCgS5/PxZkm2dn9wsEqEng1yQah2YzoBhG3QUhCTt7v0Hqt+gLBt4BMwWdP7pJ//y5LETB8z/'
-             b'X+P/3tn2d0J7DYt6BUS93tbbo0oA3o1VJLTiD/Z63/+Lr/5a5RWZHMQ6FwB1VD6Qyg2RskaZKwpV'
-             b'WAs6n3SCvs8+JRVXwrxoBLb7of7OcRrsnOR5uY0FGMVutCabRwZpvUJ9sIAXzWif5uP99POpWc/w'
-             b'/ziAOGI3PWuXIpCBFocXTsczfj2c+MDf729u8gwbVyloWRV19tntdVVSWPaPyn0wqIyOLceVBfGJ'
-             b'F7rAKoIVt3E7HZl5d7vCkYdbYavqahW84Ix/NFG6HFv+riQ8aHdPRynICgIbWgHOZ/hbHlU4a0FH'
-             b'wVTweMRZECfFZwgfH+1cobh7DnzLVMEPAQBU6DiClUgBV9msxuuCj64GCzBhLOFVac7myIWnhhMm'
-             b'vek2KnWrKPWcjg5HHNhFsU+r7yjMgEpdBo1HH6KNgIIkA9n61mcxFNYe0EDDlLwoHH+RmPXUaVU5'
-             b'tSl0vAKshCU8VXqQq6KXk7kJZIRbJXckLDjiiQDXv1cMOMDjGcSoJxfg6UV7e3s03NgUm2PzvWHs'
-             b'RKldHModgelsmp6BNndGbBSDUcb2iVP08O5tEQvSqto7n3EaTuWHpd2+ZBB9HeXBMz2N6CzA62iI'
-             b'A3rMHZisSEhOr6902wRsqOesCbixPZpugd1FYAbqFUCoOlTqfpCUkXUGNFEDZvKpp1/4CpqF9WLd'
-             b'217d8LwKdMT/rYJnva23R5IAhPDz6wD4FOB//P3vfGL3xhvPtktZiFlqlp2oSnrp+Sd5/i/ys1p5'
-             b'BQ321uCMQmYyy19T/XPafse0++ylZ1OQqhjNHBixvxQ3OlR0QasbrYRMPGg+O6LF0S6rqDnvsmkK'
-             b'K8WVpdWZjfaAE2CCAO6qLGLTSoFF96ozUWktQ1oX7d8YGjSVeRSaHMuUFe5AjetzIoNzZ7AYGi4a'
-             b'gKUTgcqopaYroniIQAPGAhIFzIQh+0sGJtTmvEiwFpoURZ1ZN6mcVOVRVBBdE3hB1SuVcnkwOkxJ'
-             b'TI+vCYW4MhMOXDFjn7WZvgah5MmipCY02UpBRhADHh9ENr9B0IY6nGM5XalmGdSYKv+q3fkba5li'
-             b'GpA0et9o/zkZiaCzAEYHN47UWKbOWAtH2csB6P3plDtRSFKYipcDtbjoATgIfEBRNJaAeCfm0v1B'
-             b'jwMiB3IbIzjXCOAoxkRU7YKqWArrQzovhmvwHKhZ6Cbtr9/vC+jNNSwTTjoAeAtNRccdEYwpaMXt'
-             b'0WbrvqTh5jY9uD1KCYeMycz7qCbVbVC5YAEV2uVVoSAWM1KSngUUPWJJnn22+M2tC1LabpRZfrDE'
-             b'QwG8LIrE38kmiXMuZPMus+vWC8UJFgCA4vTpM5CQynb6rvV/cvvuLfbFWG+WKxe0s7OjFt5x7Yy4'
-             b'3t6fBODoaPxzt6SK6YL++Hd/+7/vpNjRa3V1Xipgs2G/S53S5wU7ZnnKpiqIWr34lYU2eGvvi3b4'
-             b'9unz1B1sUF1UGUXMYC8EzKA2pcEqkJrlbZeTA5ofPMREXmbwQZD2FhlBWyqU0w19esz2Id2qVkLa'
-             b'PpWZaku185GFF14dztTS1bTUR0cjnuliNh4yzzxyMCv0nM0XvYgmgCSLNASTEBDbzA3Xa4UKG+p2'
-             b'rqOzfzNzCdw2bymXHz9hhUA2klnKXDyd6DSdD4BuovFPPFIAEK6dKtegALwQZOnFnLrILm+exwgA'
-             b'K2JOz61+NWGaTyb8nna3KwZFELBJixPGGzgmHCgAbFzlQW8gnU9BrUa4J2YQPp9ztfIogMmADgvm'
-             b'/dZZCNlYyHMlO0iBWQDqCjBEJYnrnq55J33uMhiTxEChMbMqMg9eh/eDftfG/ZkRgPPv9NpWHKvR'
-             b'UJOYWGIFXwDzCRhNJ5yc8b0zzIQ9zw54ihH1ewOe16LbJN2MSIejIx7j4PoBQ8LiQ1RqQiriO8so'
-             b'apVBJX9N5bDN6owpPVDwpQVzA8FGS6ZQrSti32B8lJsPokdhtX7UJLxp1Usi6GzU46IoaTlLery6'
-             b'FMpreR6trArV/5FvsAGCNYHE6wDQvHP7riRJ2shAgloO+mFre+va+HBP3D7XG9+XyXhEpRO6aFGs'
-             b'hZHW2/uUAAw3d36+BCAFl9d++P2P/eDrX/4X3coAhIIMxvf/wtmzvIDNHCk/utGbdyr6gwAuDf16'
-             b'pUPg81zct/p07NwTNMUCUSpXvHQcjDrdvnqpB/UTT4F8OkrBP1X+k0MmIlrLnxXI5kup/qsyC9mQ'
-             b'IrSXHJCkwsdyBdAet2oN1B1Emrenwa9Eq77VypapqJR57qxVKNbGQlHQTufIR7ClTdUweZ+R7tb2'
-             b'XaTKquUaeV9hPhQZlJbN+YJjAZpKzYJsjo0FGQFwPp3xSMJRA/BCD7gPG1utviaTGbenCxVZwcw/'
-             b'5Oo2MpPBQIJG2+SFvBBal+rYsXqfydmKbfCCZW8ZtEeUeelADAQ10MG+gCcoOiWPNOxZabPeQdEw'
-             b'CdjFccLjkq2tbYpe/R/Sv6fp+DFnZ9BYp8NsCKg2HgHXgJFMqux7KkoTjJWQjnGc9tfv9y3q81lg'
-             b'ccWIoFScQaXmPDjeo5QIwb8CidPBeMTXixULQ8wtdBgvefV8QBDj0U7VzmMaYC8yU8Ic+aJILLPi'
-             b'YpQkARTEouVyoogKGHPwQX9D2+i1iAulHSOh6A2GNBsdkLj3+qzeR0bv446AdIUKcyv0ileJlCGE'
-             b'MVeTvqksjUGQZbgtn2jAtcHJH1YP9VDU7GTAIqlIkz3OwRIxJw6e08mc1Q9dxlxIMlq1uvePnzr7'
-             b'Fq7ZGgAoo8aNrR3a37vHColE69b/ensfEwAW+Ph5trRYfukLv/9fFstpiXYqz+e9zOY3hh26eO4M'
-             b'V9dZ8MdpPSFyctz6zn7hmjwENjSvuaWP9u7Js6dosH2c5qHUfUklguoUVrwGUkPVv5jBvAfmKdP0'
-             b'OvvCuIzwZ7AXd/mF217rVwkVMP4Erf/hGDhJwWIzLbJBnfrQeoWtrFitkiqchTyT45GBHgvQ6Ah1'
-             b'QO5HNWTB6zBrxu9RjTNKXw8PtEFW6sNCuFioyIfPgEmnVZtUii2ef1s9ana4+Dvc1SLTxyIHslZF'
-             b'eSYbfcxdG7FdJfOF4esQWDc/JSEQF1FjIU6uUiKEbgKAfMzx19e6bCATc9Bi7rpT/rhbAUgqpgKv'
-             b'ROUdQshOdgiY4kbYUbCjVe2BuydlqQyHoO1yuAh2BKQYYsPJj9wJaUmlq1x8r9WsjSZ6rB2gBk1O'
-             b'xWy0azAHOyHIfQyKncCYxGmQRoLnFZCJ8xFrZcfte7NjRrs/C+1oIPa5y0CcbLAYEa4VOzlKgrS1'
-             b'uZVZDMxqcOJbUPYHCvIkbaGrdG+6BuhosTIlFQ0chBpKH48woswG+D7aHD5G1Y8guVdR2f4+is9U'
-             b'MC0IUxtU6l5sFCetnWOsnZIVKAUkKjsL7+i4OBV3IsWYQByLk0FWF6y5U7FMSerOYPPm7q3be7cX'
-             b'a/ofkupuvy/PXL1cB/319v4nAPHneMZcqgYP7t8++cNvf/k/6fdKrvCXOtfEl/3Y9iYBE8DhnReA'
-             b'ZgYolCW0NitV/AtZCEQ49iQ2wCmgbO6cSoHbgm1T0c2VfiXt3Zpm430K0yPyMI3JMd9z2x5eBFDU'
-             b'q7rtPLdFkAf3va+e7pTnpIGrwSF7yAtfHPNkDv66+E1mWuW6qJWpF6SVtrrxWcb9VlYW/xttaow0'
-             b'AKzDuMEFFUPSSp8r3HRMGE8g48cajzGALbvz+ZJxAlyveaeshQXPrKMG1Fa7mzUIsMOZtZdths0U'
-             b'R2VSWOWn1SDP9FteiX+FsCi8oN2jagb4KAEU1fZg0M/3k10J2cJZKn7sa4rrll6DgMLyuGo97JrU'
-             b'jI5GR3z+RdXXGXIDmgNYtMzPhwJIAVJseTVjEkMbdFfGoym34jmAx4Yq6F2+s2JwtDrDj6JSSWpy'
-             b'FDRp0QGCMiQ8j1aq9Cw6b452BQMhIZkM5ULSLkgHiP2WtLPZLbHV1c9WrwevmhauMR2KihHAeY8n'
-             b'h9TrpkW/bNrmXkGbboX2h89tp9ctVf2S1ETL5HftAgfrspEJ/snIjVM4c1hUyW1mm9QhMxrkyRCP'
-             b'gJjOsWbFPnXq1AQCvhQ4uk67UrtglzEYIUsrCz6B6YPaydrd28uAUxsjQOugPxjeuPzU1TCfPeYG'
-             b'QJrAbpw8xQJms4eTtdjPenv/E4Dwc1hvFoMBfeULv/cbezevPXF2Z8iVHABOElcCfejFZ6ndLgUc'
-             b'ZFK5rsjc5tyaVzkbx45hQaV/AovHbJ09R4OUAOA3UFxjlbQQMrobnYawnKU/E6rHh+wgEzNlqeAF'
-             b'EAsxMxLYmz7m1iQAb52iyAHpiL3i+wo+k4UU7dYiBYFBv7KONk0giGOI6OBZmhimPOiAmAZMoQs6'
-             b'jgPeA/gyAxsgnP2StmBbC/oXqJHYV1Wqm590NridXy+zLSvP9amRITafe2YxKPrf2qjklrkaFLR7'
-             b'SrO82A7XZFKs0ooGe8DrbNrx/huLXOgMIHEAl5+pj4xCr9mzAAlBty/Iep6DH424FS7VprQWkAv0'
-             b'jYvvGkOYLEms16fXHYjhTwhZDTfqHF+aPdpNCKIfb9URPyWwF57BlrhQQF+R8xoeIcyEKw3wIYL7'
-             b'eDJlQR0kb6OUwHSRxOkYBZU8mCjQKai5jV+RQTrLDB4x18rIgVospEUFUFmLGe+CJKCVQafyXOM9'
-             b'YcX9Eu6bs/mMqZ9imT2UjoNqS2RcgSYBWX0vPTsbOzs02tvNDn2FIvpFYttlTwCTsiicQmABqJSo'
-             b'L2qdBWWHQEMKmAMg5e6FJkWqqeC1c2CeGrNFLfAAMw9iUKvPWgOScEiigWPYvX+fjJ64ZL0L+Yxz'
-             b'Fy7+cLixkZ696rEO/igASu7ypedobYe83v6hEgDS6vKnbXhAR/uHg6//0e//d9uDrnqIe63gl3T6'
-             b'2A4d2xryjFdE/fw7wFvekPIIxnXMlSmLkXhpeWGJH+ycoJgCEFrTsOhl6VNt8WIRn08PaTE+opiS'
-             b'AO4OBGl5OjPmgXIejGdcldEAnpp2KesVKL0GgRQL56KWAACQ3Wqp6jSygMcOkZu6zpCvbF5kq63I'
-             b'AgueoNakI1RynrAO9pr2lLnVHoQjHsRbwERvrCMzh8WqXzGVcY0CYDPPjsyz73XbansrgaPPDoTv'
-             b'RKyz4qOTCpcTECuwNTRzgqQJT21BOwrgDoEegZZFioK0+1vsFaCLlzPDnQY531gCO+5kjw7HXKmX'
-             b'zDBw2VcAf4NmP9ThIFoEEyZo8LNGwuERDTcGnMhoFsDHiVk5Ku1Wu+Dgy74S2FeKSH0Vc1LnX/5M'
-             b'lvjFKME3HPecUHGoSsE3Ja3Ad/gsh6sJCwJgUM+DqNfSiykQX09XZHrcQC2EGcSVksYed5SMQSKB'
-             b'kdv8VZ8aeIAkPZw4LmsZ4TinFkWivMD0vuAYZ8A6ANDN5AMvctdALIKtI+XVC0AdBhRMaGwVbxLL'
-             b'luGSy89yWKElOjVTqg1goDgN9scAzkGTOKdaFeQa5UA5L0nwYxFpOp0pi0JFwXnk56nd6b56++03'
-             b'UuL2+HYAcHVPXLjIz6er11TI9fYPiQEofzblDZcqmW988Qu/sXv9tRf7BZDxUuuw811aqF587iov'
-             b'hjXP+Issg8rytrKKKNVIq7mVNnJUTnp7Y4sG28eY+uV0H1AYREVaL8a0mOwxBoClgJ1UHVGr5fHs'
-             b'kAMF67gHl6t3oI+lTdxmvnpe9Jyoa/FncxeBBGC3oovACnhpUcbsdhm07Q/wW/pdH6OIWqh73L2o'
-             b'BV9QesfWseRMm14qQ/ZhV18B4+KDO49xRcVqepEXRKfVIxTTBphfc/WHADpSW94it/FJ5+teZ89Q'
-             b'LeyislfwF+SXa6b1VRlb0FLlR0tiRiyY0+Vko2hV2tpWIGB6/8ZA1AGjCiPJPwQ4p8u9oPlbFV97'
-             b'E3qZ6oLOpkpROxkqXOO0k8EUv3StIHVsfI6qXUlil/a9sSHCPIai96wq6dj4x2bPinGjeUoYO5WH'
-             b'lYRgG0gMhMDTJw2Q7FGgClAYoyDJhBlSmZLgqtvi53I8X3DCp+Z7/Pyh4wCRIEkaCrV5bnNQPTw6'
-             b'5ASO8R1BRg649gO+burCVMvrNtg4x2dWizOHvyCdMlYE1Jb84XjM++10etIN8ALI7A02UyK+y6MX'
-             b'Ue8zYyOXx2oA1DoTpFDUiw9egXlBL51TfQYD/flMVTQQq3xbzClQRi+UBa0BWC05yJvSRm26AIqJ'
-             b'8IpVwLNzcHjI451Qu5w0wJ778jMvvHL2ytPs4Pm4zv2hItqGc2od1m3/9fYPmwDUk9FPD/7M2ZnT'
-             b'X37pC//VRreksAiZvofF4/ixbTq+syWVhvmeaDVsrndR0fW8KDiRR3UqfRow70+Vzelzl3hRCfWM'
-             b'mxMBWgKo0Ocjms8n3Ib01MiX8uKWzfCkRS8iQdHA7dziN19zVNsw8wHimEOtVjjwMkA/FfK1CDJI'
-             b'OLAPSNLiPd1S5H0xWqgQ8BUNzU2OWlrX0+mhBIGirVS0aP1RFv1xaig0ZV57i5MGVLzg+ZuYkGgj'
-             b'yCI6HPbJQFeOA2hHednSNWBNf3UftEqVP0+V31y2hm0Mf6ChwFK9quaGRbhSq2OrRLi6nc0Z3AlU'
-             b'vR0P8BdIJhAw40rpEhkM2VJPcpOYrfPIwVsiZLPi2OgqAI8BAaJG6MRxooYukldTJk7iUjKE82Xh'
-             b'o9BgGPhaINijfZ7OjV33tK2BihOYj0Grt8KJl8q3XghwFUY9diKO/oaOgnYHIMzD+A4KWSBHxlpi'
-             b'IY1zz0u2UkcpCwFKcMS8X5gBDdJeFLGBYxipsqFgOPjapOsMlgZleWtprfuiVCVs0bXwqnrp9b2k'
-             b'IyrzMBBAX7EiySs4D7EXFtohO0U6p4lHXGEUSJJuZkzS2Vd7ZNaeaDcqk5rZ86FDC6Bx/ebnAp4S'
-             b'+3v7SmuNjBvC49rtD8f9XveNg3t3RPTmMdwwWgP8sc3f9/W23v6BE4CqP/jpr0oL619/+y8+cee1'
-             b'v/psr4SfvcyqWV40zOmpyxeo061oPh7n6lT0Z4IJqQttTINAcDW3bEUvPGYJWMxkFykhYaMUL5VW'
-             b'zXNxmSczT9g1Cma1KgCK7G5H5t86z+V2NZl4i3wO2tisvKdSvAgS7FbHoK/ILdiyTMeHdm/aOToH'
-             b'Vskj8UDruexUDJByioJnSlY6OK74ogH35jx3Zh17icRZHhVVstcF2Wr54BoxFqcdDSvHgCfwSv8z'
-             b'nQRo1g/SglHpvNhpMoIAuSIMK8DKqszjBjgDlv2qad2D4oYZtd6jQqlzrRKWo1VWrfOqusguewo8'
-             b'QxBlVb30A1TDwRwetQK34BqCsT4ot5qj6tcPN4dyr7NLX5Hn7lGTS7yTPRq8qPHhXrFWQU0MOOx0'
-             b'hamA62oWwdh66dqEdkvlZqI6GorPPWiL0PyH8p91ZOBrABxHt9sS62K9v85UB/H5RyO+Dn21SOYE'
-             b'gWV7QwaVZmlj57U1rs9e6TXAq5El3CDTcXMrnemcghspeUTjqYw+2yfb0xJZcXGmuYaD069+ps+W'
-             b'CkKxDDnpaSh/MgzzMTaofu8ayV+v+1EvCeP2c5fBN6M8U2E0DQUD/dkcQ9gypN9r2S+SMySUuIjM'
-             b'ADHWQlnOq04H8x96HHVuhOiRrvlyrX+w3v5fSgCWP0PmDbLPV7/4B/+qqEeFr4pciWIx3dro0xNn'
-             b'TtFyEdgH3YGKp+prHISiooOjrgxOqUBor2qlgUWht7nJ8+H5bCwBJ6jSnVNDEjWBsboWvHAG0Jmk'
-             b'q1ZsC27ZgjO+oW1iAW1hFNAd9JlSZ3LES12EvYKiGBPgtZom17isaoUIkyPSxW48nfLqhio5mleq'
-             b'Cq2AusjSuk5a7Ji7A7AmC3yhU2aRJobADAcipoTNuWrt9QZ6XdAmT9em18rJBT5mc3NDaXsCeERF'
-             b'alWqyNbOmDZnCgwcxAsvojrgoKckC9e64s6G4/djHAHKZAWufiHgMzN5geAPxhpRGRn4yyRd4x7G'
-             b'DxrUHSdIOP4F/T/svdezJNl5J/adk1neXNduZoAZDCwJECSX5O6KDAmktEFFaB9Wiv1T9aSHlULa'
-             b'CHEZ5IIGSxIYYAwG49rd7ntv3fKV5+z5fS6zIZLSgwLo7qkcNLqvqaq053M/09cZvr3eXJ/w2sVi'
-             b'Iep4Mbi3PFrsrDFQgu+qVIsNWA4Ishjx5FZBj69dlpk/jyhibDtM2pEC/uLAYLqei/tsd3CA3PFI'
-             b'Bcc7KckTdyKUHtcol9/ofYytwH6WpE48LhJnaaPRyJPZqFW5SRNDvhnnFKMPfOZ4NGMcgGAlKsa4'
-             b'4HmpyjOyO2zLfS73KLNBsN+7Rjo05TriWiToJlTREye0msBIgJ5Febnq+WsQzqHtful836gacjQV'
-             b'tXITjU5xVI1SQY5k9sd8XTThtqunlMqkcsJIunt8fit+PzNpDNr1CtmonTLOWpZziftUaLfkiVGv'
-             b'P1yc33uwGQAQmb48QdDGo8vNkpr16hiFjtuvEQNw+OdBJ0DEP/zgg7f/6v/6D//uzcmgLNY7N/oA'
-             b'Leq7v/190T9vtB2o1UJUwR8BBTXS8o/WHVBXMlXWw/pzfve+crHbNqN4iB94oRLwnLqUZbEjZrtX'
-             b'XSIbFZhBC7mvrnit3WCQtrsCBpMukOPpRGV2oy6amY03EBAwe2W0c3lAMSN3zp5WUCIs1PY6oyHt'
-             b'qeG5fKPAOOa1M56BFESYRSI5KLAsqBJBVm6EggTFxS3ICEPb6mL5i1l930uIWAlILbSCrOqKJ+cG'
-             b'FSOSnCq0rgjsY08tsJDftwQ/Pi8xuhsc6euh4X5yeqLgOqnmp7OpsxMMHJYMcGie9gpChFgQg/FK'
-             b'VAGoL5JR+vQYgnQj2O64wlmVscgNQIBI2oIg/euqR6aFAFGmetR3Cpqo1gLzsBMcSjVwr9shkpfy'
-             b'+Y335rNX6QiY6xU+Z+aCN/g+87FjcKlbvjpqwYt7DW6IUEBkskKTuCNS9wJjMKSMbpxLj+u43m34'
-             b'fcajmsF8DOizsQNjCoa6a7CRbqjHrJW+4zX40pj/RQdfw8+oUWBVa8PUI11oWEdi5g4YOkIFDXdH'
-             b'NIJXklRYUkfdURbTdOWcNaYfMdTPjGY3Hdyjwd02cbXrXotbgXBXFv+O8WT+8Oc//YfblBJ9aTxu'
-             b'tfN2/91vsqX1sfY/br/WBCDH/xcQYAl+f/fXP/yfttdP7xwGM2lfkkjpvvXmA3rn7bdVnCcpXoC0'
-             b'pd7IbJKDa0Utwkj9yJvGxVJQ7dTK74+54xHM4K4t07qCKcapZCoMYkJKKvASS7W1ZI2Afuw5XWlX'
-             b'ghcqu2Ff2sTYVstbVoHjxU6D12qlXGyAzNjS1YULBOym808s9MyPh6GNLc5qx7tcbrgbUVXq165d'
-             b'VgbdKegQ+4MZvOjZg5tv5jYN09FC1WNtBZnnt+1pLKub7YqDLI86EqmgSpCgWIm4DYJtXfcURZ6V'
-             b'kqj0Ni+lAeybaxvWNMYzV5sAZXFQQDJFkqAg0RHwWsUdEyzuOPeWCFlLH0Gox+MVvSbKZE+mkaDt'
-             b'ZKaNJrmOqLIhWwxZYxZfygeuoiFjh/MKUR7my5uctNLLtjy66auxj7AsgK0ABRHSzAO2UW6lpoK2'
-             b'3kkNdlhyFyMpeEOUzwINrc3vBLjH3REFkgBrv9mtuQsSo4ASdwYWZGfEPv/JhkMh0/afqGHUgY8l'
-             b'O1pf7gdoS+BzROrViPzEioFm4hTdrEfYCnivoFbX7RhK0ficRwb3jsiqP8C6kaEV9EkdxoyjP2Jr'
-             b'DGSvNyMvS6RsJIF/87F3PAsCtSOC/AKTQNgceyhZGsOhnGNcs+n5+ccnp6esfvhl2bjbOTulHsZm'
-             b'R+XD4/brTgCa/T9PvwmrRD/6T//xfxn3o7RSNVEHZx3AP1AA2ehFJEHK16rExkI5jZYNKrXS0YXn'
-             b'SvOQGKk+v7hbqqmR0Oe8aJcgPBxIoE2sprflSlU00WsJeiQ4AOak2yIXfFUSL/q+S7OINW1o5UjN'
-             b'yc9obBz8aw3iCCF1q8MNWVlI7orJUWqBY9x6LueBam+5VyEofZG8bQyBn2jCacqnxt/NoVSh+60q'
-             b'A8p7YhRQ12q3SqIVELT9mvlcNMo2kOQKXQtgDya1IvmVModugFeHWToNSelsMMdhFD63ZhsXFkJ7'
-             b'mk11qqG2qCWgcWWNQAOxJ95/SV4ArDQ7XK5IYbyD1ibwASX5MjEnMYTSVjWr/gmSnjn1nQ6LBQ/s'
-             b'G8/HYbGL7kBPzq+xOdxvIMiIg1kcqRVjgvwxghjuIfwaU9HAhCifu92syvUIrKRoYlUYdbANVa3n'
-             b'iHsV0q0xxUKxta74eE1syG7q0DE3kulTakUOzJnRukicRGw5gYvUAQ+y7r4eU6h0/KUt+AOUL8Uh'
-             b'UkT7cku3NJnH3DoZKAehtevVJIrBurkjN4n7rdK+jwIdBfgX/JpKLm/nRRwgKx8TRWf0cMIabXxm'
-             b'yfGKrzFwNbjX+Vku9+tb737zZw++811qVl+ONriJkaEIOar7HreXIgGgfyYJBS/6g5/85Hc/fu9H'
-             b'f8J+8QZsR8ty2KM337zHznVGxzPBE2lIR201NjpvbSsZXiCSBsKymN65+wYnDpZdMEaqBMQeB9/k'
-             b'LX/MUbHQmwfJFqj9SqvgF7IWcq3+gYIBBVSWGNyWFazUCIRfOgImb2vBU81lzFEO359Nxh7IGt5H'
-             b'aW3jF6CQ18r4Bq5Ihxz8hD3AAQrCRvoZ4D0LGyByEKqrkSq/KfmK58G1o+cj8BVaWWExhUdBFYcc'
-             b'rFh0qBxnf9z3LgnsddmwJgxFDCgHrrins5GzN6B7gP1KObVugolEdjdnxUJkbx4MerUmY+X3AQJk'
-             b'b4GanQDNTEZYCIkxDzzGiFFZAQIM41l4I/P2fk9Q7XsWjhJvgExtEsgI9NAwQA5VY6U+9kj2pNMg'
-             b'1xldDzZkQoCBGn4U0xprmScdUuNaQM0S98cUbAZ3BFSDJqBKKwHKmWzwjvEcPQZYuncCmepizceG'
-             b'z61UM18kXLMbuIjBjbbVQ+sYib9nEAHiOTrAnjuWnuavNbhDzVIqfGFq3C6u6QDHQ743W7dDF9bW'
-             b'Do91D5ImR8l0EYxSadRAYoaiJwtEresl36u2o6JGRF2/CnRqsokOdWy9/W1U8Y9lgMs+Z+v8Je2C'
-             b'ILHb7i5//J/+jBOh177yL/fB+f036fT8XO7PjvficTtuv7YEAK33f2qLkwn9zX/+s3+fN4thbzpU'
-             b'hTtUDweajCas5oUb2xZGBbzrTJx0MdJWqqqNIZDJ9FK4zYPBSCxptUKCrgCqTq72OdhH14AfDlVm'
-             b'NcuME/xxo5TZ61ElhV6tqoG5I3bTESlRbv7tzQ3NTk7c3OeAti6fD5FhuS4/n5dzYCp/IZi6mlAQ'
-             b'ELhGw74KDrWytUJqqPgcIKhArGdePsdV2lLmBIAd8EyxXY1pWCgF52U0Fi+Dcs6Tt/bJgyo48haM'
-             b'u2hvsxtmEZroDG7+/gigvRgdENbrV+70xt0ACPVUlbvMMaAsC7aCgsnZijkN2tczMR5QaRcJftB8'
-             b'B8I+aJaG4wNWBEkQTJG25fquSsU3n8+8Rcz85xhcGGfJBj81MwmScu4RzbLSQDF/xkhkyviI4Nzp'
-             b'pMp1MI5CnOtDBjonN8Xp94cu1GNjEuG5yzWDr4ApEIudAKige3Y4FO66JGO31zc0nk3L+atZaRD3'
-             b'6nx+wud512w5mR3x3DvxsSLRYTBg+e/29oa7ShgJsMpllLYwUPJMYzTLYYBEy2cPIWedxUNgfbtg'
-             b'/wsbfXDrP5jPsLJIlMfPokdZukyVjXocCdgGbnLevwgVM5e/PKNNDq5KmbIlZdnHHAz+S6SjpOBX'
-             b'wYCRmVpVwuvrK6WvtuMFPBz7lLZwSAR49PUf/Wd65/TclqrjdtxejgSg6v0TSoBlcWnWm+rvf/jn'
-             b'/3Y0RKPgIDRzTETLAvbtb3yjVGwDnoWinoD7WEy+FqnYjyD5YdITkqys0nUEkOjALf+z+VlZYPvc'
-             b'5iX1V8ccczKdSgBqhCVQaeXWcUFR9De55CwWHFDFxvVUXMh6UUYAHp5Vb11b/TMLyjpiSO47IBuq'
-             b'6mgWvqHTzmcZ2cgAtc6SSrerNY374nAnwat8XglGIzWkIeVw4/hOT086i3FLFZT2aauqF9pJLCcc'
-             b'GFdIg0NlYsu/l8t1+byaA41ePGUbpBcCHHQHMtOwLLE6KGdLuPxB2RlM+Sv/7UrljQoYTAdcH4jr'
-             b'DEoQRfxhRgG1Bjgy+46eQFFHJRFJBWMnMG4p+zDvnbR69Qi86tfQaIcD5jnRVsqQW+sf1R3AvrMn'
-             b'BOtNRNd9sEQS45A69PgeTGrKpLKUbYXMp6ligCMSRengWNCS6h/dJdAtTdjGXj+eTjk5Zevl8gxA'
-             b'Vpk/F9oOEGIKIhCB5AlMCTFiEp79CMlR0MSNgZNSDY9GUwFOulFfYGEgBtAmwTBsSzKBwB7N4AfJ'
-             b'Y9TOUFStBTK/J0uYcud9TUBLp/ZBaXsq2dvYWKwix5DwvWDGFsr354SArAuRvAthyUjmhUVeg2Tx'
-             b'6upGEzwzjZIu1rd/87uf//bv/cvXXgUQeB3WQeDO1BH2d9xeJgzA4R/PvpEYfP7JR995/vAX35tW'
-             b'YrATVTkMC/abbz4oVZ3czNHc3NSvXSxfQyt6QuTWJqYbht8Dw2B+di7rq878a9V7t3kiqFRgGKDN'
-             b'bP7iEJDJPIYY0vJW5mlwy8P7A2UOeeFYD7kSbJqlBMqs9rzl9+H4F2LozGszHxtXgCrFiQoWpjFt'
-             b'xSNBYFGqeYDqeCafkzuuIWDANrhqWW9embN2P2x7t1vh7leVBraKRx0AVA47BkUUWttiwQHInHy/'
-             b'KwnAMNpAlmzJn0xH7l6PljwSLO6EYFavSVjWSpiBWtBAgJzuoNZXZeb+Y2yBtk6l7WUcp+nj6+RD'
-             b'OxaSdbEBTkkAR0yFlHPWi1HbvPA0h6HSkNvJtUsDZ0/U8Cmoem2/DEEuVreNt5PZZActfq2Oca2q'
-             b'asiJIToOOKdon3O7u3wuXAgn07ptScMTAMZB7G7YYypiv18xW2Sg18Z47TiG68UNd0OGCtSKJPRC'
-             b'tPtxnkKv6tw3saMdGZUjnxyLYmMd7wzptZcQWjtgMmcbnEXqpDzqW1CSsfWCdpuV2Dmzy6YE36if'
-             b'KhE+tW1564qx03Z2SqYFa+vPkSYiDhTIuTWW4s5X6OAJVNyp6pf1YcBCXeQug8HBrpXNA4LIL9cK'
-             b'4OUkKErXEMnayenpoxqU0Pr19bvPrL+xYfvn8exMR0LH7bi9JAlAjP9EP6osgH/7wz//083y+XB2'
-             b'MlFhGbFyvXPngqvN/UYXAJVuJXMbU0376BP9zNzypGpjSBggrTspFfioVFP7fbtAGpc+8bw4cXDh'
-             b'oKWVBlOisZAkafeaMU5WXAA6BtVgTFVZ3LeLK+Wfy25gf+DtbsmJdQOkbaFtfkzMFUzIlX+FGeZO'
-             b'ZuADseU1lz1TF8Q8m81ltK2adEYPNb/sNrXEwKkAl7lavdyV/hbUVjXofrAOUpTjN2wcvjcaq6+9'
-             b'idTEqO+h81b4rpegi4QF16nP5jh7rsBZQCZWXMFjd3t98RRgZgOL+IjDW1LBIuuDBNWHZ2plIB0J'
-             b'aCDmYGBjFetiRKWBBgY92kjCvCMYGBrgvlh7i5j1/eH7gLFJrDz5ER2ITPtmVxIRbWu7sx5x0Mcp'
-             b'6mmVZb4Dk/lMi/XkwLf+QAWYynnBPcUgzSzKiUJnb8SUh8SmWLwVghsbQS4auIy+zvbFmKmSqjlL'
-             b'W57HEyWhxrEMVMI3mIKeNkQAniW1/oX9NM5rVBVFvD+uRw+jClXdwzmDd8LTT55IgK/U+CeQVuBR'
-             b'E6P0grdDUlxAthtVWTj8JOGeSepNGFplRnNGyHofmhCTAA1FvdOMneBYF81mOgg4yHgXwVtyAuAE'
-             b'ONXErDiBgYviYHR4+vDz6/1m/dqqAALwd3rnPt1/+x2nKx+34/ZSJQD5HzGf4AW2ZK0//L//z/95'
-             b'wPrdjVQYlfCmJ5jFazVoqHdSb/SYzWpFpUlDaxNvv8uI8iTa5oIKtjpaFiC0undlIR0x8LCdV7LV'
-             b'K3TX1YWP55tMY4yK4kc0GNNgekKb22uiDsLRwtlAFePwk22pHlm+V1OVQz7Qzc0Vc8KruvZ5nfje'
-             b'G90tugHOarvlandSPlNZkJy8IBBPpmOijsBs5rn8xNveVqYJ1zuKiZItHJj5c0teWrwunwwXOpgE'
-             b'VT2mwjGdWlvBjGAv73f9/CkHFMyeYd3alAqd87mS0MGJbjiZlmA65C4ORHtGExFHOmw3rObIndry'
-             b'/sEoc5l0fJPc5McqSIxlsC9Gl8s6U4+cgJD4FoTWKCl1QGKiwBgUKR9JBQM54EN/H90OCCKhy8Kz'
-             b'/iy+kXhviD3h/XCcEBUKiqp3GdsgF+OmVPIYSeAaQ4xJje89uGdHzmuXR//NjnwdxbycRRK4nERn'
-             b'AogpDnHABwZgMpmp8I2g96OC74D/gAMhaIIIyui8IBjW9URUKyOUHoeiL4DjLt/r8edINwGCUtfP'
-             b'Hpf78pK7K+ihhSTiT1mBfzlSm7Blm8dnF0KS5Dq4dG/I1Ab5jgxyNtxOphbUF6TDkey+R2KaGgX+'
-             b'VfpURbkXtTklMtXRBbNuGeWfnSKI5aTcN/vl9fVqu7xVjNBrVvnjGe716d7b33DVyON23F66BGD3'
-             b'jyhRIfg9++LzNx9+/OG/GMMW1sx1kqDN3/7qVxm4k3OLEs8dLXCrPLjjF8y5Ljg6WKo3zHHHXNk2'
-             b'JgoTknYTUsv5z0JVEhW5WxakIZ1BuuY4iVJbLIFtfHaXNosFHXYrt0M1zfioLTnrZ2O0YMh6YByw'
-             b'nM1mMwH9mdtflPa4qapYyxZBkZMHLMACqhZqHvP85biD2gtzVaeYgKx+aFmV16TtnLilioCNhZOr'
-             b'87KiPr96JhVW2U+0zKF18OjRIwbN7bYHbsGiDY+vkXxJxZmdBmiBrTKTJg1mLLrTyDx4OB5zCx3j'
-             b'CVAG617FKnxnp2cc4AF2G0IBL6ENvmN1PHyeqA6KAh9XsDm33gMkwdkWdp8/i9STAgxTh7IpY5Kk'
-             b'bHcEa7EjbuRceetH3h3JAd8/UcGXGO+U7yGZgEJdUDth6CyIix950JbFOXvVi2CFZApVO45NyZt8'
-             b'jtabJX8ei/tYAgsdAlT4fRGH6qkJkukiQDcCKj7mHIhOGfbhoDsBjr/RNpG88K2IgI6HkfUEJPGS'
-             b'bkgslfaOnj9+yF0a7i7x/sHGOHEF3hhzxQK9VvWVBvoQs6obtqA/OQ+tDgQ31Nj8yScbihF40RyL'
-             b'LZ75ApREZbsr905fOmCmOoj3UY/iQGLlHHL0FPxwkM7fHklYjLs79+6tgT3JryEfnnOu/oQGk6my'
-             b'aY7bcXsJE4ChorFf2MqC9/EP//K/WV8/O52djJwGhuoTYCmIdyBxyKElNQVzFbNKMFurMkpADx39'
-             b'cFYjizSdn/DftdvJSgiQ2XPfddBB7sJc+Kzsa9T2q3uomtVrWezHJ+eMlN5vbzn4k4v0LHmeG9hm'
-             b'+KCCP6jSJ6AdKMJd8ohKA0Y2n3Ui32fTkhecQ9uyF0OAhoVs8HMJWlGSIUbdh1bBjQFZKmML+mKU'
-             b'RAZgyhUSl7K4Pn/+nFbLBX3x+ee02axlf8R3mVvnyQGCwkqwqkva8dYxid7NYb1x83pRNcCqknk3'
-             b'pJf3uw1fq8XVhoPw5eMn9Av6UGb6fC0G1B8OGAx45/4bND+/y0p8zFYY9ng2jVYvQIbcEVA0f0vp'
-             b'l4AbjVve6JiIb52O2xy14j2x043COAWUSBjQiOaDtMhZFEd56ECuwyZXJhLyThxcvKty4EA/MpEd'
-             b'XaVZnpmDdGhBgPobHMytWxONGRAUJ6KaBjl2Ktjs/R55+8jMlWQ6Bwro9N9VYKAh9709QgLwrKpE'
-             b'X3zyc9qvbqh29z7rHoXu2F0DcFYKYfIxheR9KuFrdD7rkhg9l7r0RGvZmSWyiSnpfr7A9dPRi17b'
-             b'VmvCrmnFrB5JprN7chCLQ/V3d+7fX0GX47UTxEEXaXZCq73QXqlfHyPNcXs5E4A1QHS/tI3KM/rj'
-             b'v/3hH1elMmkOA0aey4yyVC2Qr2Rd86xSp6b/3c4Ig80Us80cgwcBbnWiUhtORNgltHoYwYVPslOt'
-             b't7u1uOlpKclVdBIXwCqKxSmVwDA8OZM2fgn+8CNIMqDnIIaZblQ++HK7ZuU5UwxExQIUPXjr3GLN'
-             b'0rpl/nqS6rp2dL0spODTgxfOSnLuLx9FdCcJLTJpGKsqaQdDFtlEjPAzoM9vr5/Sovy9LEnLzdVz'
-             b'Wlxf0b4EKVT7UyRmiWX5GIeA/ReVQlKnPBEbylrJZxM3SqbIZudUKjNKwpvn9rfucWX0MXKGoYvP'
-             b'2PnC/BYt7tvbTE/Lb378yS84yOP8nJ5d0MnZnOfqg145zyWTm5+clmu2FXOeg4xsALxrNGHC2Afu'
-             b'd/COgFFRqPpyztS2OCkx3ZDyIhjU566MtZUNyR41+eOA0q+9evfEx3ElQj+ta/GhwIEtbq9oVPaj'
-             b'Cn3GEnDXR0cJUR0V0QEJyjJAAmF0TIwmxB2wIcPcs0ZFrNSLYUVDJBrGj9fW+mG3lQ5PSSwgMc0q'
-             b'lZMJezegW+H8fIx9ymc+/ORDWjx/SL1KukBCEdWgjFvDFBLdAKq9jg6YUYe/oEI9bYkfXANB85tW'
-             b'C4LMlEo9A1QO2ASH5D5Rp8LYzvgqlymuFJ0QOeHGqCOanoUZC8VqNxzNDxhNvU4JQNCrmOohpc2C'
-             b'WIXsuB23lxYDkP6f8//V7ZI+/tl7/wKzyxCy8pVFROT8/FSpRckRw9E86GKlfuAHDZcNm5/IXLFt'
-             b'B+PP2d27PP9mfXwNRLD8ZeWAXp/BeOzpnpLV4Y5uhrAIAHmB3eh6NL94g6mJt8+fuE46t+Q3O65c'
-             b'xThH2vegF8ZOS5Td5fg4hQ4Vg1WimcVuIBaENm/bxhPXuBCj0tC02jJ5VT1GVngrn7st+4CWPubW'
-             b'Tx89pMePH9GTJ0/p6dOnLIHasElKxQqFkBKGj8DJ6Yy+9vV3aVeSA4D3nDURaqkaleuO1RQBWhWN'
-             b'2QQJCyrOz0EZBLflWuLa1b0BB6jr6xuZ0fIZJsYYZBXBMddFAV1qEldVbr1rToAs5lMO8umjz+nR'
-             b'55/w6+qSAIBFgerz/r0LWQYhomNWw0Fm2rhOzGwo164PLAnoZ+X38P6T+SkDLtGKN3MljGSACci1'
-             b'jDf4WoZKBJ3KfYY2fa8ekIDXxBwJFD3Y27beBsTt6LosylmrZPhAIIEIZlmHbo2qWC6Z6VFLF0oR'
-             b'/Bh58Yih7rmC4+Lmitv4YF4sbm/opCShDJ5H+95w/Erzkw5aw1YP3J0YDFU9IjK+YLcTXQgk27ty'
-             b'TI8efkrrxRX1ja8fxaiIAYdk7JNIraxQloRAmRYSl5MqP2odb8JHxk7oJN/2Lm4jnFXvwpgEcjOo'
-             b'4FASEa0YXAHDMQgq9sPUYByvJmKJGT6SGaMAGIynt/OLOzvuuL1OCUA51tuS0EHq+Cj1d9xe+gRg'
-             b'8fzJC99gJPl2e359+fA7vJC6PGsqC3yP3n7zASVesKUqFUEfMflg9TFSQx9dOLO1PYMAYzIHz6os'
-             b'lqcy+2cgkdi0iHiOJAtYMMC1Zz0Aoy4p8HA8FaW6Q6poenanvLBPm1LR7Ve3MmdWpN1QXelyO9h0'
-             b'Fri46BEHEq7Mo5i6bAHCKscJ3XuuSIMY00DaFoAyzGmx6CeV2m1MisY41EHGCDiWn3/0c247470/'
-             b'/OCn9OzpEwZUIilBF+L05G4J+iMaD/vlT48/D+/WK9Xjfr/hYDmoxTsAiQl3I+qolrvEAL6s83+c'
-             b'R1SVkaWX54LcL/t7W4IUzinsilGFP+5XMreN0pFYrra0XJegOzvhwMf6DUZjy9p1MAS5rmf4Dhb5'
-             b'KqquQRacw2Kxka4JPdcKMtHdszlXsHW0MVGpCLd7kWleLz1w4PguF9ccVFZXj+XzSjC8rnucAKAL'
-             b'UoUedx/64wkfO1DW0FzAeyMIm2SujJ0EE1ErUE349trkLn/XsafBK7CcNRI0oO+DjqC4+je2Rzk2'
-             b'4CCsc2L/D56+PCPE97N0OMp1qccOIlwsbmg+n3PgHI2nXoAzPVNxIpj7DzDeKO+1vH5OTz79mCDR'
-             b'LQZYFSP2GQoTkteZQcF5uattkLOP2uyZVQANa084ryMHdQNMDO4LrYyVvmPbhXEXSlIVQX+OpJpv'
-             b'cvaxgY3sILok9tFVCYSSREftFHBCpAl4rMq/6kjhdYn/WYCOB7UwP27H7aVPALbrF0U4UPV88tFH'
-             b'39zcPL/Xt+CvQiYQaMHi2JilqPL9pbzRiWE0EJBUVkapa9uOgmzf7hFoazcRwV+sbZ86NLcsWv5Y'
-             b'QPr92mTfxQ4WZjqn5yUYTEvlu6JdCR6Vuq8lbdWnFxz8JFgl07s/SBCacHWvBkZAYYNzXirZm9uS'
-             b'TEDwRc2SOAB06HFRW6IYH8x4gQ88n2/ynj7/9DP66Xvv0c3VlVvNnp+f0W99//t0fnFBZ2cXMlsH'
-             b'2K38jSDdHLYlCRjTruwLgnHT7FU7vz0/CPaxFiYG0OKo9nGelrcrBpehMl8tr3i0gkRlWf49LVUp'
-             b'gIn4DBzJ17/5LQ6i+92aUvnMVQn6O7ADyrFCIwFJAFrVOClNrujqZkV7EZMVxT/tEJjhTepcWx4B'
-             b'lf27WSyFXgdcwfopTUqCMyqJB1gdSFROT6cilKOzceOoV9Hm2opkR7u77CM3+g9s4Mx4BXDib55l'
-             b'tzIGnoOtfMu5Pr1zr5yjPgfP0WSqtFEdkZDJG7cyumZTnJRWivsVvhSurx+0q2WjLpltifxyv+fj'
-             b'Kow2nD/vqWbk4C+jgahtdAVDKuIOyQUkq4GjeFrum9XVM6qBS1C3zARVP6VikhpDNS5KlDucftJ7'
-             b'ntok2lT6QsvWCaYtwIcRFbirIyHV6SDDmHQkvEOl1yUpeyKqIVWj+JZErYSiPm8u1qWjkKy0Tpke'
-             b'pvzhz36qj2d+DWJ/Zsnoc9x/VU/9LY7bcXvJE4CLuw9e+AYC3U/+4e++C83xQT/KrE+rPCzgPCtF'
-             b'C9g6ijx3btwFzSqsYNz9jgafWQCPJjNugVqbWTucLEze6Gs5j2jE9KRSkxNVNefOwfDkgurxvGTb'
-             b'5bslmKEDYbK4HvSTUMpMzAbeAULHSqzIVkUJDqLs2/AcuadOcuOJyNlKF1WU89ouqgQQnoOfnvLi'
-             b'vyyV3meffUIf/ux9ev78Gc+X3373XbqDgH96QtM5qkUBpaHiFK39xDQyaCEQSXU4oh7Px8nV6yKZ'
-             b'zzIWYZ47l2/xfirYAPRCtmMur5nMz51xMT8dyKkoPxuM59qKFqfGuplQvwTN2XbLSY8twoxCb4ac'
-             b'bPQGCISP+HzXCqC8Xtzy+Y3KDW8oq+xsu/gHBjdKsMFM/2a1p5tlSTSfLXmGvimB57BZ00VJBGbT'
-             b'sc/GTS/BBXW6NsemN6FVs8z/iZNRJFnNYcNt/8tyDfguQAIwP6EEdP/8lIZafeNcJ+XiM4+fRWmQ'
-             b'QIy9FS1qdfI8wCmyD7xH6LXzc8WytO2l4D4QkmSQt85JfQlCR0o5aOscXgy71ZoWz57Sk0efUANR'
-             b'oxCUPmtWxOVcWffFnPYidVrv5M8nBRnNuKqfylZboDeIZUtxJNe0YIxCMPhkUIBi9EDObo3UWkpj'
-             b'VDOetbK/sdNBiG4ilF0ZVKkxTjdEZ+ndb31HErfXIFjinN5cXzObpFcd5/7H7RVJANAm725VqSQ/'
-             b'/fjD3+VAQCbpK9Sk85OZCNq4c2lk5HFM7YJiWve50sVPlc0McYSYBdpZkP6hL2AAmvHIlt3ZcqlG'
-             b'VzRioJ1az+bGucz1eEa90Wn52YC2pRpslJIYNEhjUTfxEszIubUOcFZZYKU9HwWglToiBS51KqwA'
-             b'tGST8qcRbFJI7WIJPYJexcnQs2eX9NH779MXn3/GgeWrb3+Vfv9f/UGp+O+xnj+7JUJGF26BmNdH'
-             b'QVgHF2aRAE1urHLw3fHqWP3bM7mVILdZlQCupkZ6TRK1xkaKa8ha37naHQPRBsK4KNV5PZSkazQ7'
-             b'Y9pZana0226YkfCNEUBqa7oqSc0+lMThbMqJ4JMn5eskdMj9wRb79nwiOeGOgag6ldNYcxDfl39/'
-             b'8tljnmPf3C5pNhoyk+DO3XsMMN0sb1RNr9WYF8EEPTjTwW8k8RRgu1SrztJQyuCiXBvmoi+uBdQH'
-             b'AF9JxNDpmUIGOoomfw0/igrUPLNy1oqZE4mg7WyoCa5KIhSFXRCyV+QSgBsXZ4ICIgCiYgUtSRfu'
-             b'46gyxjii58+u6FnZr9XNdTnmBYv9mOcEBaJW2De1Ad5sf+1BM3S/JqlIgk1C2bQX+PwYwFGZNtKC'
-             b'F0BHo06GVY4ukOViQO622LJ8kt1NjMUwU5vMiWAXhBiyJeEi1833baXjMrWU+MXHP89eRLzCGzp8'
-             b'd+/d547e4bA/RpXj9uokAE9L4OpuUCZ78tmnv9FjPm9yWhbW37sXZxKguBWYfaFwvjBXQY2ylGoO'
-             b'UNG1AaTViOpnfnqm7XldbMDj3jfcORgopxpiP256YssSgtdwQuPTN7g6Bd3vsCkJwGbpDCn85qoE'
-             b'rNFwxNSuyWwiOgblf6fTE3kPbas2KgG8ZV7znqv+rAsdd2x5lqwqa6jWs8jUYr8wz//oAwn808mM'
-             b'vv3t79BXS8U/BWaB7YGTSBajW5LMmz17Nc8nxsSMKHawCofWYCWINC51EixXe1ef167DnMcFXcTN'
-             b'+MhAhH7KyUh32XMemd/GEgzBmBhRf3wiKoPlfZalSp2VhKacJFpcX3IgfHAxK9doxPoFz6+eM8f7'
-             b'Zrku537Pgkqkc2bX8u9oQCB44NjW+0Sbw5rC9ZKe3+7opCSYsJ0+P5kzeBBjjpZCV96nLLCBtfEt'
-             b'2VTr2mSQu9RBeQjOQcZGkiChG3D79BEnYQDYIfBg5FWXRBNdqX05hrM79/0kDgZjNvlBmx60StyT'
-             b'bIFbiYERo/VTq61AKszDQFN+JhT9DkRCuccWJeDfXD4RoaOSYKVmzwkBRl/o7FQ26lHMi4sMw3HQ'
-             b'VBadOhjbuTPfpRW3/M3q2twUxX46sCMED7MU3OfPi47T5D5SwyOKjvmQfFgJmrlRh8WKliVxmUxP'
-             b'WTKck3NLHnQOLglDpeOG5HTFSvex/FJ1796D8DqAAA9s07ymOBodI8pxe7USgDtf/Yp/gbbc7WIx'
-             b'fvr4s2+jat6utyrrSux8Bjtcnt2SVFtBHdJM95v0+936xS11ldHPvf4qUuv5KlFryDSo9msRCMne'
-             b'DYBQTBxOaXLxJsXBlBcNPHSZF9HsPGq8Bp0Dp4BldTO1hVUDIoJ+paqAyNwxvyd39CNVO2vcZl30'
-             b'ygNdPn5MH334IaP4UbX+4X/7x1QWMqYKQsEQIjVtZ1iqYjFl6QKlbB6rCGmTXktN55zJwh+0wv1l'
-             b'C7EsO6lzZXJBI1N7a+cVyT3m3Z8hyHzYjHzIUwsJHE1q2ezYt0FZ2JjWBpncyZwOuw0tri6p2a64'
-             b'9X7/ZMzB6Y37d+m6XKur6xt+7fOrG06+tofEmAQE4ipGndCIFgJ3Vcp9t97uaP3okoMQQIkXJ3NO'
-             b'zobs0LdnbwPDQjhI0cYFqeNRYMIznGM16j4nqpSi6VDp/F30GSBLt1vd0vpWOg9gkiQRvC9V3RtS'
-             b'6fK+onswUxGlhtv3nKBFubabss9MAQOlsdyT8HzfrJaibLjbMb0zgCoYRF2xCpUHcWaycoZyECaN'
-             b'yvA1neeJKbRZKKGWaFiBzmJb7qGgzpLZcsykSXvN91gVgr6v1u4u/Uz+XLuQVGhFm1r8i9glN8pG'
-             b'CTpqs3vaks2gfwsGRsCG0qFpLBeMw/EwoFPyKicA4mCaBbNztPk7bq9aAvBf/vqv2vZ/WeyeP3/+'
-             b'znp5/ZVRDCqZK9k8lM+gp06qBS9SpS31xwA/ZM5hwfT9oyOWsWic3r3LCoCJrE3Y2rlmtQxm4xVF'
-             b'4eO70+mcmhKgByd3KfQnqh1+YPnatN++EPzYvCW07mX4J6hwrNg26EnXtPxoU143qXWuG1qZY676'
-             b'm8w2vBXbuMr44NEXD0vg/4Cunj+nd975Gn3v+79DZ+d3+DhQ0TVY4IOoH7I4kdGnQksflP1JRk33'
-             b'FrIpKvJPeLGt1Va15ZmT2fJSUB2E6ACqhqlvClajVsTFFm13TNYwn1LXw7DjPBhsEU8tHtwlc+Vd'
-             b'h0gCJxOanp6XALegmxIwNwAxYtRSqveTUY/Opne4mr5/dkL1aErXiyV9/vARfy5wBJhJix6B0S4l'
-             b'MZT6PdLjp9f09PIZgxfRdQI1cj6fSBBVIKIZC3F1qYqAOVkLXbQMAutVUJtskZbvpLiVrNRPNRgK'
-             b'em7FVnhPT37xvoBKFbBX94YCCuVxQp/vKU4sIAt9sxCZ5rrm0Ymb6gSVinLKIWlQN2aLmA0lG9Oo'
-             b'S58kOkG9GeKLuAOm2snnWmveUja5fnXrOGichWA6i5picq6kVTue1Rx1TCRgTnECFgyCGQyxTkeT'
-             b'PCnZl2eo7g/skzujC8VsoHBg7YqaqqRKgcHFwiLYRJWOGV/J4A/K9GanFNfjdtxewQTgW9/5Df8C'
-             b'AMD/+H/8h+9u16veZFiZ4Bi3O09nMxrUPV7YzZDF4qwsom27vtLWPkRCuf2fWiYBqGnsWLdvtGWb'
-             b'la+cvInLi3vSJTLDiCXS+OIBVeO5yNCW4LxbX1Mu1aeikHzmvWXHvT7Pau1HPE5gQF8rfzqbzNqF'
-             b'04D2ut/bsjANWBsg0BcPS+B//wPmfN+7/4D+uz/+7+ns4oK9DCB4452FmHUAHxyzIAZtCobL5DI1'
-             b'OAYAEwEY2pXKdwoQHzDuhwMnPsNhj9vOmL1DNAevul3e0Gg04ZY1UP8AM4I3js/ZsozvRD3YwWMv'
-             b'P+9FNv7hrkQ5Hmj/I7htSqAeDoYtvTPkdgHPanITBR9hioutdW9uheTKP4bjWfncGS1mV7S8uSzV'
-             b'8zOuRmMjycgAc+1S8T04G9NscJ+DJqr7R08uab3b6+nKIuiUG69cAcpjvED58aePnpbjKEnFCVrx'
-             b'2/L3nKmRvarHErrkHgOmRpGVC4/9r1pNh6TyxUxjl4TKtO+FmiYU1ShgAzFXAsWPhW80oSj3m823'
-             b'waJo1tnvJ06Hs9ybPVV/NAyJS2O7NXHg+8ftnlXcKZuKoQn8oGPCY6Lo4j4SRBvFA+RWArjRa8Pj'
-             b'uTagNmaVrJ2TZE4BIXsyLwBblUAOHSdCg/aF7KBEctVO0HD3nDg1phfgENngiVfyewyjruReGCUR'
-             b'rJvDHlOa/asoBBSUUbTZHfg5PG7H7ZVMAEDF8QRgOKJPfv7hN6MC6rAop1zxvBwUQOpYnAZrW2uV'
-             b'2VgDPQhf2FvM1lrMgsymINa20oY11xES2pguIMzLr62q6FF/hkpyXmr+wBa3VUgcLCP3AXJb+SpT'
-             b'gag17sG+MJCwUz2RqqJ5ohHNLleAVeNJn9bLJf34v/wdPXr0kO4+uE9/9IMf0OnZHX4LUAizwbE1'
-             b'qmeVNxZlvkY7qUpHzOqih8QnSYdDVGYzj1Zs3xDUgoraQOhH7IilEptN52TufaD8SbdDqjJIGjs/'
-             b'HQyJ8cDZG3LsreqbqMlFtvHFt4Uh0Y5qpJq22Umkjp6vt51jbBsNSOOAsh/NS2AuycDNs8d0KAkJ'
-             b'oyeAsseYAMkAqqQSHC8mA5oNH/B0/Pr6lq5ubmm5lUSKGhGcModD/IeKGiZGj55e8v10+Rx2zlP6'
-             b'ylv3OABW0RT/ko+AyAyLKgG6GVWNL7Xdl4Z4V3R8iJUfFN+RlQECZbYvJkh7YQ9knadzF6aRLhdZ'
-             b'gM2dQN4FxikCXxNh4cVLNGSkQJauDoP5UlYdDXJQpfHKU2VNBO1w6ejDkgvGCdi0zUCZMSpmR06J'
-             b'AUdYUigYy8aHPnqjVH4e+d7OLesgKBgR6ojqyuX3EBskZXG5ZGBgT59lTVBMwqg5HHqr22X1qioB'
-             b'8lPSG/HzGI71/3F7VROAN9/+mn8ButOTL774rYhZdJOc0ozgBYS2IeBNlcxsToNjgxsFBCpP3oKG'
-             b'VptQozs5awGA3FK0+WFZSGB2g2qwr21FLEKHakBjtP5BoTvsyoISabtYcaUlXu2VouSTWshn5y4v'
-             b'oRJXAlwNw9iAbH0vFsPjAf8ewDv4A4EfrvCiBM2ff/hB+fMRnZ2e0w/+5H+gU1T8irY3opT1c5ny'
-             b'qLLBSRMnSy5WqzVX9zu0vYEjYIVAsYLF/nHAV54URg7YyV4dPEnxMYHzx7t4iq44ktADwUJAh0DE'
-             b'lRQuCJ58T6VtIYc76rVt5ChSrmApcDCtezwvNgdHUBTRhndhGLWE9nRBkz+jjJ3efUAn53dotbih'
-             b'Z4+/oF25nrXaJHM7Gm3+/U7OQXnlg/M53Tmf0a5ct2fPr7k7gXMFLQKuvjHW0FGTdQdQVT+7XdLV'
-             b'ex+yRfDdi1M6mU1EcTCJWx2D5oz0lttkVex+WfFBq1urelUfIAY3wuGrojoBjoAPxk5oNNhaApG0'
-             b'g1FLhJbZBrx/ua2ebH6vZk3SEUo8l89qwmOVudAHbXwQxVxHWQ04kQ5SVWKEJeUMmA3tMaHkzx1o'
-             b'TlLqZtCxRGNWyHhmeVRgY5RMLnsQkuMEgmokyDlUICKSFz5GY7FIIiYEoobFlqKJ/2DNAKMimbhY'
-             b'U37rEKgj3/wqhf+qN6SGk8bDMYoct1c3AVheXfkX+8GQlleX34iVtCuTiqignT7o9TnIOZfXKhyt'
-             b'DrK2Ca0LoJmDzz2z1sNNyl5Y2owy6aLGc8hssr9loYl9bv2H4Zi22x2bwYArDdMX0Osscdiud2wf'
-             b'PGWQIrkkbyIzzclq6VqLebxypAH+M5tWVOW5BKePPnyfUe6/9/v/ku7cu8/fRyBMFvCp8orI/BA8'
-             b'WjMu6uAgKPgFIDj2epXOZCXZ2axXLP/qTnU4j9D7l4moyPJGCd6GaYgmpOLje61idZAtNqvoKGQv'
-             b'2A0k5nr01vkgEV3KQapczK6xkON7y82WAzSU8CBjXE9qxQZIkhfbWUlryKSdnKR69TBlGk3mtF48'
-             b'p8uHX7DIUR3VVpZnwuoemA78fsNyf71595SV8JoMkaZIn37+BS1ub8trd1LBRqHQSXIlDI7dpiR5'
-             b'n2FEcF32OdC9kgycTtEB2guCvpFRhrFPjN/PXaEs5y+Zk6SeMDlnNtNtbKjwQreAmBZqRoaxFb3S'
-             b'EUOl44AUjLWZzWhBK+nkuvkp6wggmp2vyFhR7EhLm+BPMrS+gPlkdl75vSkqV6ntTpDcH6nT4THI'
-             b'S2vjre0Cew+9r0wmO5i2hpESU3aVR86KVXaLcRHmDKriVeYtAdwERlGUel5UNCnVm80m4hheqQ6A'
-             b'qi1OwJJpjgHkuL3iCUCf0ffCAFjc3JxdPn70jrDvDhqoMyPyL+5ciAiNtpblYdBFzUll5HNIZa/p'
-             b'MyMP+Z17FxxYktKGolY5hjrGCEIMhTJLiPZPptSD2E8WFDcLA5U/h82qrHONqwZi8WcAmH5t8rQT'
-             b'9pHPv8Spd7kiFwxijj6ogLstvfnWV+j84i7/xma78eCeHSfQMADSQWix4+SWNUByRZi0ctf2u81/'
-             b'YW7TG6j/PARVtiwnK5ayye1uMRqAnC0b6vREr3+5WjJbImjQwXsvYEw0mvB7VEPtZCgzwP3dHDHe'
-             b'tp2NqoX3gDgPU9HKeRhxN0SSDbGrlVb0crXiIAXTmqCo8KTVb9TRiWAWhc2A6n1+541yg43oi48/'
-             b'5A4HEssYQ9dh1q+9JEgNd4XmkwF96+tvscoiOgKwgX52fUPb3Y6PLYosnbVHaLOTjsvi9hHNp316'
-             b'4827tC1J3NlsxsmrO+8xTz7wTD8Zh79jV8sATK18Xd0+x1bzPijnPget4gU8WOWsorsVo/nxesN8'
-             b'oFWftAvh8ZYqVxp0oa1gnQDpjCWtqM3B0RgdlVpzZzOhMq39nDyJ8YZ0yk7sq5wump1JYVLdwirN'
-             b'3h1gPQ5NdLM921XXhVM6fMClDGdTBvUe+BlXsa5sCRdJJyfK2cRI7mCnen+ori+f1ei+vUoJAPb1'
-             b'4ivv8Ijj0BwzgOP2iicAsdnJP0JN+9Xird1q8WCmLmhoVUeeU0cajkr2vtt4tRCUS6x1nZu5ZnUI'
-             b'NKCgLShYYNiSV21ipUkQGcDGXOhagVZZ9MVhbDKYnnJFCOT4oASopgRoUKyazUZkfyMPoRkBD5qe'
-             b'UPcEnMf7bv7l5e+b2wVLdYIiaJW4o7TLw1z1RasdAWZ/aNqZpv7LmAzB9dDFFvh2seIEqafOhlAm'
-             b'hBkPnAHbSYF8nvgCJB5xiNOdCMQIfS27gh+kiA1ICCyASdgOBkOvxYzhJ4C+5Eh3S7jAfAA2AMnN'
-             b'YbsrxzZU0OGBJiPBDEB8CQp/XFlT7nrLeluYtILE8QRFzyP6LFZwvBOjJaMkmoQvKVgQ+vqj2Qk9'
-             b'ePtdevrwM0rbVYnB1jKOQgk1KmnOHtTWN1eMUB+XczPuleRzdpfunE25O3G72tHzqwWtcd8EGacY'
-             b'WwJt5qvbDT3/6Sd8Xz4eL0tCMKZpueaz8YBb0pRb8xoG+mXrTsUXElk+1Fi5cl4wRoRqIwjsVYCf'
-             b'raqegv2MIROTV905Z38ujMefBbsnzX8VeApWOdtOmCNf0CSCM42gstay1yGZ/G9yTE5mIx5jTOQX'
-             b'bYNya3PdeFcgtH4AwUyJZX+TukwGfbZNiggdHE4y3AOA3D0xOkNIMCeRxyZmUoQOTorXi5uqvxu8'
-             b'MiwAdMow4hqMJ86MOW7H7ZVOALYmf1oeyk8//fjbMe+jcehrlaNFu5Grb62Yo3GEc0v9saLOBXP1'
-             b'd9wPntHaUYv23LFpraSiU393Fk0pvzc+vUNxOBLrYCD6S+DAPHm5XjnKGxUhZvoQD0op+ay6YS31'
-             b'4CJ/+LwxwIGYQeuMt3G6oAqTcIUTKXf80Zxe2P3/ZK1wad+jgomm4KZWyKjeY2hZEVm912Hkw9Vd'
-             b'xz8eFWpgDEBTAnIJmABb2oJKgugfj8cqjyzLKqR7hUNfc/UuKokScMW6mVgIKeTgwkGmgc+/r+BE'
-             b'dB9KbOTkT8SPghgilQQGCnmkrWQxCModDGXmMYEJ/JjkrY0Y2la3GBgBJDibndKTzz6hyyefixFR'
-             b'FHaI3S+NKzImY72JxS56UfuS6JQSdjwbsz7AndMpbSAitDvQZ599rp0I1ZnngCPJJCSIF1AWzNd0'
-             b'Vl779lv3CHkaQKSV4jQsVAU9JxKck1O77JgtwQ3KOEhtpiQJEInojoH95J6vNFVIyo+PHa8AlebV'
-             b'0YhRa0nHR9ad6jBa5feDdp143BD5vNWWsDneJqiHRZDPjqqUSOLQKc+bdCo8sU3dDhFfEZf+NbkO'
-             b'Txxs37IIZOVsEsD5BWliPJNg4EAwarFYU656OvJi7cDe4uZ6zKOoV4A/L1r/NX3t7v2OQdpxO26v'
-             b'eAIAT3cOGCWrXa1W38LMNWEubsIxZXW9d+eOmrcc2KHNW6o+Hc1OBXT9MhUROajufa9UqjVboNIL'
-             b'Pu01GwDJgsY86vL+9XDKnH/W7u/1lZ8f2IUw7Ta6WCdfsDjPaFqswRiARR0HgNKHYM80OJvhwqXt'
-             b'9par2h6saXmBFfoXec1PDtjKbm6UuLuwKgHyZH7Cx9vrS/Ji4jk4tEG/FluVEgBW6zUHflDZWFa2'
-             b'LNqr23UJvAORR8+tiVKvrtrjUn5hH90A1xAQ1UWcF3xG1MUTx384wJhoQ/OZeBiIxroEmAE6Dk1m'
-             b'8Zm6R647MJtNnN7H57GRz2S73vKTXUk0diXI4nwaN6DSbnQ7KtDEI1ZtMLEkkFQJspHZ8en9N2k4'
-             b'm9HzJ49ou77lLg6f1Sg4EKtSXcPBcRxREjwGYR5oVHZiOkQXZUDj+h5tD6CkBXp2dUPrcm2yOucg'
-             b'QcraRn+22NDNB5+UxKhPw3I95uNBua9Py/20FyZBjl7JG+89Ogg2+uxdMBW5pb25uFL09NcYBpwL'
-             b'8XFU0q3KNs2PrUumnv8UFb2vrXhOODSRMboihRYESDoqMIpjHdXIx5KY1HZzgmv/B+9SiDhWdGts'
-             b'eQaSsh5aDQ1n6qgXdMqmDyJBHlTV09FMXAG1e2E4FYBmq3Lf4/7j444yGuDEu0mTm+vru4PR6ONX'
-             b'oQMA7ZFv/+b3ODHO+Yj8P26vSQLwn//8z/gf0Of/8L2f/AYqOwSY2NdqtSwrF+dnPGMGHx9VQQzW'
-             b'mrSKRfXFg6qS5awCIlbIRLZaHZZAklLyakS4wo1TnTgO9UcUxyfYNUI85GqFYeQin8pJiJnQwCo3'
-             b'RQ6+LMdZAtZoMuJuBSlf+3a14hl5dzaKvZtNpx1BmeBzW5kJt6YwmxLwoQlgaLoBJzJ91UKxtjkY'
-             b'DGt2dRvUlfLbDRApKoKmQogKkFvnoEmVBRIyu2jPY2GueoLr3u6Euz9G27oSwZwD+wlk5hxPJsrI'
-             b'UGQ5B88a5j9TH0+IzG8bil2tOQdPVExwBtf2drEQh8JejwMnTHaACxkM2vHAerniMQ6CPb+2kjc6'
-             b'bA88QgnRzGZanKDr80cBeE5Ozrkj8OzxI7q6fMgAQSQCMXu7RtvUjcygK2l1W17A3HUkXM2aP+Nk'
-             b'PObkE9oPD+7MabnZ0adflARju+fu0X6f3SEPwWu53tNtuUDXt1valHtnAFnfco1n0wnNy3mN8G7I'
-             b'SeWb5V4PpqEforbEVcCJBEzY6M8l8Fd+DmT+rwE76fUI0RPMSPb9joa+EzqzJ9Kk36/0e0l9ILwS'
-             b'jVGDv6HzqfW4cHC+MUs0QneS8PY5VkGqnDvjq+BYEQ/Txn5Ah4PFlpIbAHW7JjgfGEOMmUKcGOhK'
-             b'jSTWu+2KfucP/vXom7/ze+WG37z8K2U5P5ty/+M579X1MXIct9cjAfjBv/kf+R+Qxf2z//1/ewfA'
-             b'vB6qObFe4weaRXVSanXmMzngyIKg1XBckTLPmZdHr5rmZ2dtoPcWoi4w2kYdTed0qMfc/gf3Gy57'
-             b'XAWyhGqm/eYGq3XbIs9WsSF4Rra5jQp8sknDHECwKBUkglDUBdtobZyMlIPZQfkvVj5fJ52Pmn+5'
-             b'K7QhoKvHPO+bLuATzMhbLyHnO2PxM1oi2vwItjG2wincCdAWbtasCAs7mxYl6awEQ9D7vLytPjDr'
-             b'H5TPqK17ECQQw60N/gaT6YjPLToEpBa2hyaxDgBbLGtVCblfEZxvxWUkcYge0MBqECMilTJuRM53'
-             b'rJ0dbOvNlhMHMWBKiiQPTo0TJ75A53cflHvipCQBT+n68km5rnvVDtDEMouvvFXMwVQmbRxj8201'
-             b'x9mVRA/7PC3n92v3L1heGDbHp2d36erqmk2brpdrxnfgmDBm+uyLS75PRyWp2pTAtAHwtHyNBAtO'
-             b'iazWQ9ZeanEt3FbXTkjS8U6ybBdKljraMEEe1vknExXS7piBSIN1D7JXzvIsVa7HGJmCGF4IRlmV'
-             b'AoMm4k5szIbED63Sdm4Dt+MJXSYY1zOpU0BswY5ZkD0sSOx4S+uGJe92HNhJ0myTheVT6/0RtePA'
-             b'8s/az6kUMYS20OL6+bxklTxyepk3JER9dJzSEfR33F6zBODD9/5eEoCqDsubZ3eMvmOpPNrSlSLW'
-             b'g1aXiQVLSFwAVfo3BeVrmw2pFRy5FZHhhCK3D1VrK5u49Q8DoWo05Uo3qmY8U8WQgOyhB7+TxThm'
-             b'd/MzwxNr2ePvbamWseigUoXLW9JKagWXtnIsg2GfjOvNfPckVMLpeMwLI/joqPqxWI2HI6YwgRHA'
-             b'gjtZwVPlNavNinn+jnREoC0Bbr3a0rT8rs5RVBylKd9f07QkJGadK8lVLZPZzggBI4O6F82UjgM/'
-             b'ZqUm2mOIq8TWymMFNApIDDgCLOAIwLWZKWXZr2CMhJSd786OwvvsgDG7Llbu4TM22z2fD5lXS/CB'
-             b'4x0SiF6sWq0gLJQ9646YkVTS66IyxiTzZxaJqQd058HbNCsJ39MvPqXd8ppBnk65Exq9aPpjBBBb'
-             b'zwMOn0pJk/tIFe3KIg0FwsRmPuXcbhd0Nq7pfPqAzYeurhd0s1hycrBqttzlWu/Q6VnQZfnZsCRI'
-             b'56ew6g2MIwGAEI0ZMa2xKteU7iRwcsIWVEI4ixYBqzW7853I6Wal/AnjQRgEyVrnrVmvd26iaiwE'
-             b'Dd6ZRYiUMmtyxlq1RzW4atkNLS5HRmyCJ4j62dn2jTrnNCqQUJNqhTbyeU9640XtcpB6AOLehLJn'
-             b'kyT5xPNmrp9BcQC2RgiQsN2/1XI5vF3c0PYl7gDw+LLc+wPuYhy34/aaJQCPHz3kB3e3295ZLm7u'
-             b'IthypqsLAVTnTk9PdP4adFkir9pbr3N1+soiMJMcTy2rNirMrL1hVHaJg+6aQWkIJEKbg7zttG17'
-             b'Kk8dgQeIdSjFsYww2tNcbS74ZwC8uYZ9ENZARCu7cvdcXrAQ+IMa9KClDoBanyV/iYF2Jteau8p3'
-             b'CFkVGAIjh1FblQ8AoC+gUQx3UP0yA8C6I1q9AVCJsUPWF6PFj44D06SgMQeRovIfWArG/0Yigrce'
-             b'DgfeRQhO7Ff2RQwdKeRYjmvLSVWvVnCl1swsbZxllolFuooDWahTYjDlaFBbrV3O644Tk36vYhW/'
-             b'ZLRBtbI9QEWQZGFMRp0jE4Bq/QhwPfb7RhgZriqoTBH9kkGegxG9+e436fb5JT15+AntwfKwqpN5'
-             b'4o1XlI5XyL9ER1VnSqPuSdu6YVBjVFmgAfQGTif0xtmc6YWgFq7K/l0v1uX+EkGc22ZDV4sFHz8r'
-             b'YJbz8u7bb1DYgiI55LEU2zd7RZ2cOyDdjtz2wI1+WSl4Ngb3yjCanOBsVRtDNQkYNhhkvGPIhKhW'
-             b'2HwegisDqEtf0LPtBhN8zCILYEqCjivUGzap7r91BxIFs/IgcyOU3Um5Nagyp8Iqi2pkOmzo9vqK'
-             b'Jien3jliWp+eAzw7oP/+/Xs/9uTJ2CWXzy5HXzz8gnbb7Usd/N/9xreOkeK4vZ4JwB/9yZ9SKMHy'
-             b's49/frG6vbkzRtVYqf0nxGl6lQrGKNWIOkhfrSLcPEbtbXNnPslue8MRC+6IlnzyliRm41HRygzc'
-             b'qnpU9UsgBt4AJj8AN7G5yrZUqXupqLUiwj7BvlfsUJvWcrZsM7X15er2cJD5MzoCVXQhHPNGdzMc'
-             b'dVxjYZqh7CtwBTFI9ecIfLwfMBMlQEC1j4PYYc/jisoCkCYOiFG3t2uu3EfWddAWLYSNgCcQJlwu'
-             b'lWdfKtxOfA9WsmVtCytNDOh9LPYjTgwaMq4/WtZjTSCYX4ZWNwRYglLUArWGP1msatERGSORCckX'
-             b'PewLWYUdpPWfKTuOAoJKjIsAYLB8BhIG/ACv80Z1lnOw3yGZGGnip+Wo9Pd95s/ikuV9pqcXNJmf'
-             b'0NNHX9D15UM2eoJ6oXa9W6qiVqMd4qN2NGQMFVVdzyR9GOwWZDTFzoJ5z6qM9y/mZTcAOh3T48dP'
-             b'xYK4JBurcm0uL59x8rLeNvSzn3/B9+DpfMYYD4yVTufTsn9JQJoYa1Cl1MzkAlVZ+fC4vlWgTkJY'
-             b'dZI5e25MR1/vy2DPUvc4dKSgc3TPSNW6WvosytZRxoKxNqhD6YvKKHAmQ2gD/sHOqAl7Ndo1EBMF'
-             b'Na1sJY6bQ1Lp68CjpRfEv7Tdx46KQlhUvATxuV7cXN198ugR01Nf0vqf3nz765K8Hrfj9jomAO//'
-             b'w484QH304Qfv5GZfh17XZEQW+Kh4gCbL3zG2FDkyhLI+MMkUwnL0qnBWFvYcevSCJn0Ui2GRa83s'
-             b'9jcZTwW4VRZdBPdms2JJYq5+mj1LjJqefVbRHRNA2ZdFGJXsDOI1WoGg2oX874Tb5LoQqqgLEosa'
-             b'hjIdgBnm5Gi9B0GNCS4Akiho0yuIq0F3gWVNldut/uiLm1ualsq/qkznQD4RnYOg+3o4qC96OXmc'
-             b'pKhroJbQMh+1Fi50E4Z9Dh7JAIxa+UFZ0IIDPhtMi9XtRt5T55RNlrYwRgLMdKghMNTw73LiEMh1'
-             b'BygbTbNxlT6Xg6WgMr6R1QKRUAxNp0CDC1v2UlslMiug7nEHAmMT06RtHQYV5taZaycTcSrn9v5X'
-             b'3qHZ2RndPH1MV+VPZGpoazjlXPrcSh4KRS96VR5UDjl5V6J1zGPVYLTzEbBKxY+O0YOTGZvs8Pkt'
-             b'Cc+bd05otdrS1dWC/SYozOjq2XO6KZ/17PqWW97D8ty8+cYd2q/XnBTwSGYorA2RL5Y5RhXalnzr'
-             b'vhzcVElNMX2eLx4VAsxLorGkfhKkgpOZx29Cv6w82QpKhZFEMrhMsZoQyAjODbyCAXn03qqoCcnF'
-             b'h7RHUBJE+XkVjEIrCdyBkyrzsAx+/eyesfsfvz6fThnAaJoJOCaIXZX7460/+KMfsDLmSzr85zWl'
-             b'YY+KI/DvuL2GCcDX3vkG9cYT+pu//Ivfhsxu7A154WJ0eVkgz+ais94kRS0rJzqEdmqZuih+lbfN'
-             b'rXdpCcAzbd0nb3kG1VUPiinoT0+oN5ky+hwALICLgs7UA1zymuSoaMyfEahr4zcjUUGbuRpL8pKk'
-             b'WkblMZtNZZFqpBwC6r5XMgm2Gjb8AOveNwKM6421uiIWzAnW89c56JAFcbTJndW9DkC48Zi7ADkq'
-             b'TkLs3pTnb2BBrXZr9XwHsn614n0HVQr7AxniSr9OGpgRwHgh2gPUN3awopVaWJx5TKCBBZ+4PezK'
-             b'edORglV5SLp47FDRdr0RGqNW/zjfECoCdkEwApkWqyUnVLHqOEOqKqN5xUknWfELCk7D4l7XPU0I'
-             b'hRnSNDvueoiRUfBgTNQp6pWGyf4MoyndeWvEwRgGQ/jdXbl2lc6pg36+sBpiSzPrJhuuppda+VtN'
-             b'enBIKRsZL7HEdI5Soe4Z6V3R6ahPp+N7fL1g/fvsfMa22JhZL24XnCwBZ7JAx+DqUwYYIhE4OZmX'
-             b'67+hcbnHMG5hM6R6IKJFRi1UeWK+jDxyy1ojKyo/RBPZVdtfYeYHp0t2iGjc4Ukq2qQeHULsV1xE'
-             b'iy8IDoC10x/0ddqgt2SCzK9LOjei8NeSPCu95ugSYo7fH8/4PhGMgGEe5N5Ass1dNAbhimcIrmOz'
-             b'3533y/3Viy8npe6WpagP3Rv0uB231ysB+Pjn77MN8MPPfvH12maDsQVUAZAWzQUupLa9GNosOSr9'
-             b'iAOBIe3156iywfVHmzAaLSpaCzPyLDyWRbUajpn3LMCmxEpmDCNDpQ6/dTyIjcxEefaeG596JsYG'
-             b'VG2FKT1LB2pZtSULV/R2PjAAqOQw54OXPZICQ777eIAEUY9q3KSR8Y/VSuhAlQLt+v1KcRHSyIXy'
-             b'IDoPWCC73gS3y2UJEnNd/DOfewO5AX+AY7N2buLKQ4IW0PuZ5YGJg0rMqj2viE2A71yxDoyKkhBI'
-             b'9G05eeI8KB0KphdGpTyGzElXryQXclnk/CCYBZvaZugU4PdGHJwg7dvACrU/dHnZ/UbAk+iEmNa8'
-             b'qujzPYSRR1K3OdwHlbpDcpITLbioWI46HZ5c3KPzu/fZE+CTj35G2+VCW/zifOdzf6uvOejXrvcQ'
-             b'PcNogZftep71Xs/exIrarcH9l9Wm+nDYsPXvFOOwvGdDqsn5ifPBT956gxMH3E+gpkKeGTLUUdvs'
-             b'NyVAjkeRzvrCjNCdUsaMou6Dsk10XGHaArGjmxy6TTer6gUo4ah9Sxay0xQUnxHabl1W5cmgwT8L'
-             b'wb/V6AjmfyD7ZZLPQXEmbcJR8/mBNfLhsKZhby7dgigS2E2Q53NSEvs6qr5AFN8DnOPlzfP55vIR'
-             b'bUrC9bLN/gclUeUk/rgdt9c5AfjKt77NEqqPHn3x3Ritda0BsyxG0/HERrrlgY5epSiOp50Nqz44'
-             b'i75EWdRRiUOBDxoAjDzOQRc0LDhiJYpWbKhKdTSaUVd3hEs0tMzZdrSRdmoQ+pDQqaSq22y3tCuB'
-             b'5+R03mrp7xMvQlEBUhgDgIKHID4c9v0hB5gNfulVo7Q+0KlS4rn1kIVu2tYxJxnWgobOQKLWhphE'
-             b'olWohpIcTWcT+f1G2ufY57p8PZ9NxU5XQrm0h2P0xRwOd6aWuF6Vinky0Blk8KQJXGQkVXVdtxFB'
-             b'uytIVvAltAaSdlu6nO6sVRyq0WRBJ9EL6oSkanfBUGD8d9LRUOswFFUPIJgEMjooOg6w0n65vKVx'
-             b'Se6Y/qiQtkOz5Y7DuAQG+bXkJitkJkuk7Wt0gfiwa/rq13+Dbq8u6dHnn/Dr2QBPCZdVbJX7SLst'
-             b'bcBrq9kQ2mOICjJtq2GdbcdoKBG+TlFnVmxpG5P6AMglFGn+pMmudBtYjMkEdspn3L844308eOeL'
-             b'XC1H6HosseSJatYqOeQOM6OTBeSsYwGS5Dtpxc0ungLeaAF3kRznYtc+aJcoKeZEEoruMRtrwzIN'
-             b'HdmowyAbFVHjwlq4frvNlvrD7N4OLlyUknem5CGR+wVTtZvnl+c//cmP2YPjZQr+GIl++3u/rZ4Q'
-             b'x+24vcYJQJ/n4CXYLG/vcVWYWw18LPBs0EPZRWP4p145tmtZotbC1uaAYjRT6SJQtQtttPariPlA'
-             b'+S+U/WDHv0qc8yDq02Od+polgslcyFRgRChGxIHaAGmRhF7W0q9kQUXwCbbg6wKJ3+lz+9vUy7q+'
-             b'99YZlVHCeNR3XIQFPyQ2yZD+GtggGjRiZoBQyLIuvKhwoO/f62izYwmGg6FRFdUuxQV+sCGJCKEr'
-             b'ghM64iyyk0I73DB3XSpJQ8BLcN+y0l3khAGqfoxR0PAAn4G9zvX7A9EE2KwlgRjwSEG7KZLddOtQ'
-             b'Fy7KmrH1wP2fz8i953S8wipwManmvRwIOhFoqTP2I2cOAENoDDi7IXTuoeRMEyQI84v71B9NaXV7'
-             b'xU6D6bAXqqdKT8cO7dTa2bETPXOHQcFJZI5tS5yyNkuUVZ/I3QCjj1wCd2wwtmqU2WAyyaSdm2wa'
-             b'F6EVUWIQpuJIQmgTaJ+i5zYAGe6CVGCrNXCSSp9M0bLzs7a1kZxm6rB+A4maG2RodR7yC8gER0l4'
-             b'JykpxTCHVkFSEvFA6sDM5wn3MY7xkBvtFsq747Y5nZ/w8wJxpoo1Cw6MCVjfLr7y7rd/qzzCg83L'
-             b'YgiEY95t1zyG2zHb5bgdt9c4Afjbv/prPNLjzWo1hpyoVZmGOOKKRduIlaHTjXamdqNSFUWWEWV0'
-             b'uQGCONU3cZHEPGoT8EmaNKCu7vVHYPiVICWWw1i3RClPqucDxOCrSufDO62gdfFNjSiM6SLIfOhe'
-             b'ZFwCqH5YcHqoWEAlhJQwo9x7shBCIEgD5aERpzg8+HU1VLZA1qqvIw/sljEaMJTCJVTCkVdZUny3'
-             b'iz+HFRV9YZCiVl9NKvtY93juDWMkyO7yOfWkJLC5kIjr9PkzUd0zJ13R4jKmEWAksACkSVzW7gmP'
-             b'KRgb17CyHhItnK/JZKROjW0VLFz/ZEgxlgPGy5GMbcrrtvstax+YTCyuEbo+/Z4a+nQAaKIjEXVQ'
-             b'k9lJ0cyg3PEGHZf9TsYvsV2EsxocSbIRvDrFvsKMZVj2YTwRxsB6ecPsjEqTpRBaul1UtgonBlGT'
-             b'WyhaBklJwy+ZEzq41Yx7jPcSnOvCADgZNSRPNgzPkq1T4/16s9S1lpmYKRlewjs7pkjpp0Yltk1v'
-             b'g8+cVuOhBemaloNoK0jSwS12C/bKx1dYQTspsXm/Pr8tq8LTHU7O+Bqrv0FLdySVKSYf2wAXMQmd'
-             b'8xlaW3AkiugMIQHA8xSz+Dasl4u7m+Vy2q+qTXpJnPWY+dOriI5Sv8fty5AApPLwX15efmW5url3'
-             b'xkhXCVioNiA+M54MFVUftd2bTAJNF2WbfXdodTrvRsV2fu8BI4xdZl8XiRh7qr/f54qO4D/AAj6y'
-             b'6LJZTwxcHUZtm0bMsHNP9QSyAKwa9XYvHwAud8PGPwNZwEGX6il9CXsKjXwt2vH+aFnbSADJAboP'
-             b'fapbcZYGngErms8nvC9Awa8ZKDfWQ5FZP+b2fd637N2Dm8UtA/DAIOCArVUhc+qTWBijc2HBURwN'
-             b'2+6LdMWl48GB3+z/Qmt7LCDDHlUjE/ypeAwRtd2KYwCQUXCMWap6INUHA+34ZsYxsGqfsgf4OPD7'
-             b'jXHqxf4Y4ExmbVSkVK/gBjENj3Mql4qF4BILKVWVz5qBfahZF36oVSqUBMVRUkSTLMA3HOhC1YEJ'
-             b'dsBnogYsn98fjemr734TgjJQlaPV7U352YEOux31NBiaJHMKrchN0so/h9SmdUGOpQ1q5GBCEaTK'
-             b'zBKwajoo6t6VCoMT7fT4KruI1DrsdM2x2u4DZescWI8/tV4zSZQIY6vN5KG4yQcB0KnAEOyORalR'
-             b'k2e+56J7Cbh7oM70cmxZGcZJNK+DVropqOhS0kRFugwmrSy7X5LU1ZK26xVVg6EfR84t4EKSdEuh'
-             b'4HIJ/M9m9Dd//Ren4/H46cvQAcCufvM736NpPTuG/+P25UgAfv8P/4je+9u/ubNfr4Zh1tfaVVrM'
-             b'vR5Edio1tiF3EOMqH4HIqzQLOCoAxCp16kiWgzvwuXRJFkbAPpUAfHpOVQksu/2mBKIBt98Y1FaC'
-             b'52GPWfyYtrdXMl9P8hmVgvQkmDaC+GekdhRntCAgOebzl31crzcc3MWwxtTXSrDvCygQ+zJWoZ9s'
-             b'XQ+oE8I05mTq6zeOZ8JWoC5xRNPZ1DX+g4vdEIP7goINzS4VIxXM6JGsoAWeU2u9Gkh0/o2shoAJ'
-             b'FUK2QjD9giwiK9bGd+2DHBwfwYs8Gyxp2zdae9pUGyMDMr3c1ha7Ihy1mkzetUAg55ep+E2/FudF'
-             b'c1NE9wGGTcHwEikzgj7YCEVb79CBqEwCWVkNoCViXt6awTS0vF1yF6MfexrqRBTHei/UkcARfEA5'
-             b'b5MZDSdzqYxLJfnok1/Q7dVTocUpzs8khoMFpti20M0i12zxkhXwTZC5t/pbWOPJjstwMtwTCmLv'
-             b'nHT0YSMwcmEpTYLN7MnfwdQSW/lqxkpodR9zah0q9Xu4FlXVWgoH6kpyG40vuB6BjalEx6PyUUfu'
-             b'YEOsgxHUATT7KEbBiiJf6OOL7IZE0esBY2YEG7NplwBJ39tvv00/uvzbcg/0uAPDrfbNply62Tu/'
-             b'9f3ffX/3a8YBBNYluOEuZD46/R23L0sC8MGP/oo++tl7s1CCccg9LTQbrZbEvhet1dbnzYKoIv+j'
-             b'VlNJ2nq2RHPrGYhxKWNUKzw6OApKaxD86Q0m3HZDtQjwXU+tffclaPdLNbHf7rj93agaHAdxViCT'
-             b'xYvV6FSznRewinx0kZgXLcC8qPRE47SzN7naq1hrFX8d9g0Hol6l3ZCoUOoc9HWidx5UZSVmTZhK'
-             b'hbO8XXEcHbF8bK0Odu5/zvZyw0GPkxbIBcMmlcfrjXQfsqqrYT8nbBAU1AOgcTXEfTlWrpizBEwB'
-             b'wFUMhmT1vv6gBMXELohjJEAKUIwxGEX+hdZ21hY7KJD4N6r81XLD14Pn97kVfrK28h76CpstzUrw'
-             b'5oQjy+w3Kuisx0lCBzcSSZIx06vLklj0eiIVq31+DlSz+cRn4UjUIMCD9rEIGLUOkDaPd/lpG8tU'
-             b'fXrwzru0e/CAnj/6gnalMsX5S/udu/dJC12BckktdoNpIVTiSaBWwSl1pKxJjK2sk9DlH6SsjIuk'
-             b'1W/IHlh/ec4g36r1eDrAGE1u7PqY4RCzVlQIgM2R9FyxTbdW/4yTMTdO7ZCQKROGhsi9OsQoy3QA'
-             b'WmBu1rDfqMdAh/6nro6CulQxq5RcVMrGHftyrTCegY+HzYBwBEj+Ls7O+TpwAmAsnHKPrharrw7R'
-             b'AaRfr9gOP1+D3dHl77h9uRKAR08u6eOPPvyOj9FNu36faFKqWIAEoZ6Wte3XAoxMeCW18qI5OlAI'
-             b'i9v89IJdBpvUAdcpQOiAoDYYUAW0Pcv37pktALoX+PRoGR72JRD1oARY0XA650U8loVuu13LzD6L'
-             b'axwe2joK1QkcdCw0IwaVyeI1BP0M7dokGvZwDMQSBKAhAwSjgJyajm45RiNW0YveeeWGPVHbrsAY'
-             b'9HhRrHiBZqe8unI6HsYT6DSga3C7upXWP6iD5fV9tKFJZG7RQkfVjO4A5o/g5kc1ekFAXZfjHZWA'
-             b'OaqHNEQwY3e9Hs/PkQDhnI2mY2naojUO8KWLDDGAXl0DG9XTR8dlx+9dG/pbOyqhBMCRSRlrVrRZ'
-             b'rRmMORj2uAoE4K+nSYjFuS3kgzHrjRL8EWRB8URigi6JA9coecu6CmayTLTb7ll6mGmTSo1DkEFy'
-             b'2B8EwYboeU8qJOS+EqTe9qTjEZyD4bQkAt/gewD6CY8++wUtS4UHZgkoh7GOypAU0yoyLwajx7lm'
-             b'QGBbYHNXdMCfj/izj08YyBJMeLit84P9n5lgdREl3MGK2inQ5r4i6UOwhn2UY4xS8TMHv4msOeHd'
-             b'EAX7JYlm/Hq1kNKPNpsrATiywZDSAAzj4AmN5StJRjRGSzS2T9ZOXNIxE9N+cR/jnlLdCutGmGJo'
-             b'OiiFuMpOOeyXN//8k5/fee8ffvRrlQPG8z0/OSnrwoSLjuN23L40CcAf/dt/Tx9/8P47eXfgxUKQ'
-             b'xoFnvqcnU54Rb1i1K7okLRYGVP6ySKioDesHKFhKqzqI/4iTSOPod1LaFBcUdQnEoUcouiEcgwCP'
-             b'Vn5S0RMg1xGksfAMxnN5H9Dpxnuu+rF4Nqx9L9r6cJTr91Gh7ukQBMHOC1YJkGgSoBIZzfo8J2Y5'
-             b'1koqQVAEQyUVLmSLGeh12Kv5S5aKBgYzOpeHFC4H7vJ9lv8NB+HWl2OoeiWJSTueQw+GE4ngsXzu'
-             b'eObdB17cy3FBYawPmWQas5PhZFD2uSeKa+iEgFePMcR0MBZWRC1dBeaql383260A03S0gYSkLp+P'
-             b'5Io55FUlLD4I8Wx3TjELinAPrttPwoigVutdXWM61a/NrVXO1hyYGoAuA4MXpeNhVsqiZNdTDwLT'
-             b'o4c9LxK4qXov4Lw3bOV8oEE5r8IYUUdEjFwg90xi6wzfBmF8UJuIdgWBO7Pn7L4DkSpYBZdkYLde'
-             b'cTLw+OGn5d+3YmkD9Lq1u0PjLI+QlfIZssnx6PhCcfNJ2/vJMoG2I8BtKB/955bckDtz7qyS2Po5'
-             b'SROX7L+ntFk17smaQARnnrSqfpb0eMLgdE3tKCW15ya5X+X5zW03QO+JlkHSEfiMQbs28v2oOhgt'
-             b'XbGd7QPEypRdHg/qfaOiBW9+9St8j0EuWORGJHEqifx3vv+vf8DX5teWAJT9f/bwE9rtdseIcNy+'
-             b'XAnA7ecf0fXlo3nsuObx4n8QzfegdqRW8jDSOZJm/jIz5lmkWbUmnTdWosSXbEEncv13Vrgryy+C'
-             b'FRaTfl0Wht1WOgFsMStiN5mNa2pVqtuVBWTEC3hVAmo9qDiQV0pVG0DKdLeR6lxtZw/la5kDp1Jh'
-             b'bKSzwJgqrejTlr3gMd6uoQwI8SGuYADIG2qrNlJPF1kowmVFMyJ4DMBQwNiiJBYNJxEYT9RU51LB'
-             b'9xCMBz4Dr2jQUslQuUOnB8rruXKZVzjh9VDZl4AIUGKoxeYVi34FhkRoRY8AmIz9Hp8PCeS1XBtU'
-             b'Z+hKMBDswAEOrdYkAvJQHuC/QbtLLD4k/H68L0YIBmbDaYN0MZIOMyjCgp20AxLJUP+KP1DcwB4d'
-             b'nFAxaQMKhegKGO6C84oqsHRwV8Mf7zedjjyRxH4tVxt1Z5R7ZjIakyn+cRDWcybsB2swGf88tt2s'
-             b'mFTIpiQjoyn1R5neGmG0tKHrZ5e0uLrieyQGs7ky9gapGU9ov9aRmAnaZDVByjoyUG1et1SWpMJ6'
-             b'AY0D57IR7SQWd7AEbdfFwAk5RNUBAGgyKwMvKlMkO3AxaAOfAZQ8cpJORGasRlvFG3AvhaC23Krw'
-             b'qWZa2c6taQiY90YnEex6CpscM1NwcU9CxZO9Dyr5rCDdgelUxICavXTFwObBmOzyi8+/8dkH7/Pz'
-             b'+WuZ/cOa+uKCZ//HBOC4fekSgA/f/4Cur2+GhthuecSBZ73eyssC/ksmAqMVTLTZrIHMVFUMs+hJ'
-             b'eeibZLrosQMsKgsHUOJot5VFAJr7gT9fqYYkQjuxVMWofPFZeECh2S4JikKnuJ1eiVkQIlb5fSw2'
-             b'NXceyj72I4kQK4xqxlK5GMqchV1KMjGU1rIlLtJlUBW5WoSBxJaVuMOBaqEuCQv72uPfoS/qhz0S'
-             b'zQJ+fcXJRmPocJ1dmyoh+ey0bn3Z8W3GPxx0zCCqBhK3VR1PF3cef4Bep3PYBhgCJFElcRiXc4q2'
-             b'e9DFuqf8cfMosGl5o5bLOA5QuHD8bG2s1rqbknAhGRP1wOw6LvjZ7XJdzudAHAfJWsgCHsMIptcP'
-             b'LIIkoNBMy+WSRqORykiX/2oBMxpGIlaxM3IgtzPO2uA34WGch/12T+utqCmaiRRGTNGMk9S22jAa'
-             b'jt+wihVJUH9Ig9GExvMzurNZs5vdfreim+fPvDINUQCipAlKMnpcUjlrs1Ym0ScwFBxX3CFpEtLB'
-             b'K+SgyYx1DpKAErOM1oKyMlJuwYoSXA+uIRA6XYZc6XMYSGmqQSmcrD3l3QJ5p0oxCbkza7dxRG7l'
-             b'L1Sr34SQQkceILiZkepmKMsgObNBfi+BRlfVbvGt0n+cIEtnUBIyJKgYPz15+PnXnzy7nA0G/UX+'
-             b'FTMBsiYwJ83pC/ffcTtuX5oE4C//4s/p+eWTqdi1kqO0xYxm6NWPVAS1LqhC5RHlttYlTGXRvIrb'
-             b'luq6P+opK0CrEJjuIGCViFkD5Kdyt8QgP1lMWQMgS4BlbAIW7RIQEOgqxgdU3DHgeSvP7QVxDDT6'
-             b'dn1bgsRWW6a5NbxReVdS/rVwo8XjvWk6/HHLLqT4UQc14qo6p4PgF5CURBWQqSvlm0fX52d6Y1bb'
-             b'ZLK2v9myKhIf44fDQWVyK05gxM53z/RLONGxMWM0Sr7oGWBSw4HbZqrMtqj5daAL7mDEw658DOTg'
-             b'z4jqRa88RF74tsywGPJ+j0YDBmc5fgPa9X0ILJkGvMQLNkTJpu0uXHaMQQAghNARV+rsxOj9eA6a'
-             b'vY5LoBkIYdchpwwhqNF4aCB2F/Cpey0tzehz3MIuJ2Q8GmsAk+p7vV6Wzx+X8yMdq+Cywoqgd5ZG'
-             b'cCjKQc9fPRzRBdQuy/13cfcNWt0uaLG4KhXpivbrrZjYNORUV/NBcHpf659LreKeOVp3qumsxkSa'
-             b'tJj8ru2bJd1MyIBsdnbnK+HjR9VTcIft0HoqQNMgSHekIU0INPcRhcHo5FyKubX0NSRCsuq/FRYK'
-             b'2qEwJIOBE5OyDrImb2yKFQRrg+cClMzZybnLQxtOAaZQF/cu6NPPPpNnaS/dvfI03b97986Di4uL'
-             b'RcOuir+y6F+S9j53/lbPryjTMQE4bl/CBOCP/82fhp/81Z+9w1rsIbSgoPL0z2Dig6pLaWZZ0fzS'
-             b'mK5U3U9d+XhlqNSet1TGfXDjh7pIZVcIZHEeyNii+i8Ldk+DF7FpTsXWqntuc5cFZbtna2IEqe3t'
-             b'kpXr0CYXvWFZzLj6Q0scr0tZXeDaWa5RmIC65rUwH1ybP+em4yoofu0HU9yrpBJGAGVGAQB/fdEq'
-             b'kAVbhHKYoYB9UmoVAhQqcbT/AYqy6ixo692LL1DpUP2VwItRBVdLWiE2GqQbPQ+CL6hpXapVVK6H'
-             b'7Zrb9UlbtkEZCpilo/vRsDpej8WTkornBAW9QYYXG3sFGN1PcQk2xnGAF7V0Lw70h8RAR3mtdjHM'
-             b'x16DSRKFJ3eKY0BeXbu+P/ZnA+XBsvhCT8GxIQBllmsI1cTxZNIa45QfrTcbGqixDpI2tJdVNYCD'
-             b'F1wk5Rg4/LkZkXgqkLepsztYKo7Bx1YC4ou9EU1Ph3Ry937ZjyWlkthcP39Cm9WK7wP4H3DgDLGt'
-             b'pWN6ERgY5Vq76Y7x7TQZNG2HrO/hXggdHQB8fcCYKIhroVlCk6pgOtNAE0/u1iU1aQomwtTVUUgt'
-             b'z0DbQEGfZ0sgyNQWNYmhQG47RI55INc24I4Ed7wyWwKQ0QH3W2VUyOfGXKmJ1ZTm83NKH3/KolGN'
-             b'gkmvFlfDD37y4988/Vd/+LPtrxAIyIwiJCET00k4bsftS5gAfPWtN4YlUD2wxbHVAs90fnGHA1xw'
-             b'vfKOI1iMjkBOJntqPeYM2teYK0YsZMY551Z1CVxYrEIJVgimDe05mUBBvYP/eyXUO8ytK8UR7EAJ'
-             b'5G7EwSVNUTlmpV5xgEMAxRxeKVZMU4w6ay2BAUlGxSA68Sdn61ss1I0EWlDXRA1QWAH4HqobtKd5'
-             b'ulCOBUjlKpqqHnXMXAShDWCiIP+juIhRKwQjJjimuKa8cgQpLPRIFhIcD4XyiOSgVsoV9jHxzw68'
-             b'j9ztwHgBM3vMWw8yF2bL0kqwAZyE7HcdtLlgB8wpT2OCzMyRdDSqWKf4jPVyy3RFSS7aBTMbFa2j'
-             b'bYMN1X/Ke95fnIPr6wXNpyOurriJfZD5N4s5csteArVZFVCwcxgY+Gmqc062s66U36M2908eCGVW'
-             b'rftfgve4JAVIggJ19P51Tm6gOd4HbdVnldnlu7zsbw+umL0JDaciCgO1wsXiOW1LhbtZ3ZaEoKEd'
-             b'388yluFkMWXXFrCqX2J8dk2A4K57KtMbxSEhZumAJVXejOxL0bSgUU2u+LOYYmneAYnECFCVIVLu'
-             b'1OyC08ka4BNR53oml5AwTIObB2nS6owF7wpax0M5/kHKABEJC+ItEUMrM9x+AIMqT+Z3yv2BbFYw'
-             b'NTyiKMf4+IvPfrOc8//18CuS3sX9ArDx/M49OpR75Vj8H7cvbQLw/s9+3N9vt3UIHR12RSNfPXtK'
-             b'4wd3tW1ubmWt0IeJzHCQYsCUegKUxWl+eq4zz4YXQAQoiL9Mp8Py0K2pgk96CRA8pS8LqQQ0qZgQ'
-             b'/KGuhyC2gz8A6IFqqsNzRIwGUH0ENx5gkFyTN24+EjrGKgyNYhpfUHCcGLw0SmNCwEzuYy4LLgd6'
-             b'HsBro1T104krUG3NNuJlAO0ABP26Eu2BZBQs2wfLGMKLxjPSjk98vJHtcyWBAZAKyQbEgvYYCTDY'
-             b'r3Hxnxgq/fyGg0Jkrf+eBPny2j2fy3J+yvkODMRstOhVv3gW8mkpgCvM9McDoUQm446LGx8nZZjX'
-             b'QmipV3c0+hvvZoiyniZm5V45hTGTzE/4mrO9bzkG4YAHmgxHIibUTqO9EzNQJblGkexArY9GQyKv'
-             b'kEnkdFm74MASwMIosFl1oOlsJnTBkjhBr2A0GncCWHZ6H2M/9ApFrX6D29iLIY8p/1WDEZ3hfYBd'
-             b'KJ95c/2MNutbFi7ableCQUiiNpn1/aJ2AJJX7zouQpBM5IDQZDS9IJ+p2pAd4yCVNdbrZW6NFuhN'
-             b'EMo9E7K8h0n/tu6AoaX4UethoWmWnJfYCnaJDkhuf2on2bsb6hnC8sjSiWu8u9CI9lEWvY3tfk8P'
-             b'3rpfEnkZNeF+YtntksA+/Pyz701KsdHbbH5FCQAxtZlSc4wAr+gGFhQhfiRJ8rlQretuXXLc/r8k'
-             b'AB9/9NGoaXY9pzcpqhgAL7S2AZQz8I9pjxvH2FDQLiHqRn/CAR8G81uXqp6FAcviBJW84UQU9pjm'
-             b'F2RxM8Q6ZtOb9Yq/7k/njNjmLigq9fGIEcONAhQROHNJEg7rjexHDC0Km9u8jQqQDPjnqPL7LNKj'
-             b'CyqCTbN3i1IRdBGGQeigwms1+GFf9kb8B/B60RKQqp1bylHPCesT6KxXKz9TVWNQWdDyF4nDAPgG'
-             b'HVMgAKAD0JMWdsU6DMRVP/Ypc5dDRFrSXuSSOcAcGp2XS0IFFkc05wJlQgQ1zMHvQ3SphskRpIEn'
-             b'AwcrRvY0GLpTIOdAJVuqFEgHgxTMcOueAuKojeI2bqmiAfKIOwnU70nQ6gjiYB8QnCF4BJOizEqI'
-             b'fW+dr6CYCL+C8bAFaHUc9iiJ4BBGJ2KdTLRcrZVN0LbAZc5M2qmyjkzlOA8L+FnV+IIGwaT6EmTq'
-             b'gSn7zD7UfTq5c5/O4wO+/tvNsiRRK6a4Xz2/VLrjToCpDFAkP2iu93UsZoZBrD6oOxS1kmahHlUT'
-             b'DooBcG6euxyGznmPKlplHYbWqcslCBxP0bQCBSYlbBiB3PoR2Dlxn6ysIMHgdlLCJiDzrpD7arvb'
-             b'MCjVcR0kyfad+xd8jberjV9SJNPPHn/2zceffswJ/6+i+keSeXHvbtcX+rj9/3N21VWyFht3YIUA'
-             b'FI4C4K2Hw1JojPn8Qx+Gn03QcMtzLAytWBaAeFr+DN2XPejC4QChssKXxffyyZNw8vHHAVbUiYu4'
-             b'Oq+X68SNLsyzAwu5NOXXd+UtrsuidSiva0qikCr+vB5/NvYR+4P9WqsXCrrUFTutvv7ZRP3Bez+9'
-             b'XyrHWa1VhLTGI8uxvvnmgxLMd+1K6R2ASvUCGjVEkQucLNhXQplLNkfUwID3tCBV9UdcHYLvDlEa'
-             b'VjUrnwUlsc3tDS/uWGgPJdjD8S3wDRKY+462ZuiJUl86HDrVk2qwd1qcEkS1/ZtUbyALeC/vBXQk'
-             b'Lc+DC8C4wRpXNMIG4NZ6ENGQWFeOoDb3wkbPBSrEqu4LuBDqiqYH36nyeC4PQZpKmt2Yy0uLN7G0'
-             b'bsPvUXFFjxtSqH5qKoOAlw4uAxtDy3sXVH/DgjrEJj//lb03gbYsO8vD9t7n3PHNr8au6upJPdCz'
-             b'0CyklkKDZmQGY7DBNo4ZDQk2wQMrTsBezopXYrPANsHBjo0DDjZyJMdICE2o0dxqDT2pB7V6UE/V'
-             b'NQ9vvvees3f29/3/v88tFjFgS1jYUa9SdVe9d9+95+yz9/9//zc4jk1kw1f8IMl7rkbjkt3A999G'
-             b'/flVOWPgszDUJMRgUDDHIsLlADoDdn/QjIONC5tuOXffoe5gZqEYhDk0xnXQeBAf/V7JOmhFeZDf'
-             b'33jQ77gjxa4gua3NHTcajmn7PK9Cwc+QIKXuoUXnOehXZbFD5oW1triwVIiNrpSvphLQYtein+3F'
-             b'VIUxP/1oKErpufHCKn/h+gBW9jpy2dq4wHWHERY4BUEdMid7u1KaJaeQeRfVy5VqC7BNNu4vplau'
-             b'uBZ2BQGtr9XdsDyPKk+Meu8sQTPpfXGa9IdihOJWkxP6VLxAUtfva1EVi+SXypJgKE2+0lGKAMhq'
-             b'fbJAIRuJ5KI2NwWjXBT08sa7k3bVTlr2hY2zJ1+UP//B9f0HTrVf5VAg/LzZZLczb/r///fvP9I1'
-             b'mh1NDrtsjKzyM49nEL4cMHPzwxE9HurewE/3Jgs758+Mts6fGZ4/e2Z49vSZ0cbFi/smk91rPv7b'
-             b'H1hybTO6cO7s8Ny5s0c3z104MJ3urP7sz/z1hWa619vZ2R40zXQt5q/R0RwgSbFakTjRvLSY6uF/'
-             b'/Z/8vNDDfTQZbcLhnveBhP95+p2HtqrCJO/jF/MGMctFRuz3+rNevw+V7O7m+XM7z8z2zs92t596'
-             b'5umnzvhQn9/c2Hj2zOlTz+fPuZGfzYt1v78BvhrzXvKeWTHfpVKlzH8GBcD6vgNL+YABZUwhZknC'
-             b'ElmgqdZ081MHN1+MSCy/XSNQVCs+Xs4b4sqyOOtZgLmyx0sxARLQqE8J2iAXA9DT4/DZ296kE17u'
-             b't3nIxNmM7lz8GU0sXVmkJFC7ktg6M4BhNKxuPF6xVxCpKN8LGneMwxEdvu82BW+2r+ohYLI5b+5n'
-             b'QS1WMV/n5qfe6OhuALEj756HdSsSwUvsXV3x/LcZMSpQHvAolipxoiMgEYNWn1E7Xjl0agYjiQeA'
-             b'HVv8upjmuAVOCVpiZMPRBtQSCumj4MJ8e2E81vl5Kt7wdHIDHwGESiU4esu6V0kovR04s2bFnYuI'
-             b'qquScfgtLwq87YXQB3XAeDQsbHXwA4iWMPwouEWkJ8bUsdZT4MiDlbnO0adYA/l9MS7YRR7yVQhF'
-             b'tz7PDWDqoROXOiBJiVkFPTGnYgxxr8QQi7qjcbu7O/k1FxRG7wDxYMywoIcwD2v9eXpKG2HO3P1p'
-             b'Oc34as98i9V9h/j95CGo3TM65I2LF2Qt5u+/eOE8LXRp7JSv1wwwuMVuWkqjGVrpGAnrrNKMgVSM'
-             b'gnSEP+eJoOU4EQXj59gYKZlZkK0EfaZbOkI2UmdYEJB+tqrqc/yEwnV5ecXlDbRDN1xSOokhJR0f'
-             b'SEkALPQOX3aZO3vunIaBiSx3Z/PiwY2NC9dddsWxU81XMROAGRQYP4bOAOu/pP+xiejlgwy8nfw8'
-             b'9fPeS1ItVDAjc05NTG8c5b1ulA/2anvL725tLp+/cH5xc3NzvLW1deRTH/rAkXyIrz33zNMrDz14'
-             b'7xUfe887j+xsXlja3tpa2tvb3d/MJovtbDqaTifDQLs1CZB79v5PEMWkvwzXsOdS32gEgeU4qQqd'
-             b'eVacy6tIc5HcQLtil59RsfGRSXCRu6ple24NlvL/7zf2zY5FjOuI89zJ1p3+0ufdZ2fyZGBc+Lnf'
-             b'flcuJuq9MBidffTznz2xtu/AE4OFxQdzcXNieW3t5Kg/eHxl377jg8FwI+RrN8gFPQqhsJf+2FlJ'
-             b'17e/+tXjD73zX+QqTpEWVykUWXX559wYUoktJTwc9c4E9RwnJSCSRc9N1ht5qSMGCbouMbwwsZnk'
-             b'zQ5kwYaJf0IWG4yW8n/nC1pH3XTyxrg3zR27SAFxCLNYyB1iC8axOuE5db8TrXE3f8ccmGQwlQuy'
-             b'e1ao1Q5Mi7z3SuSq3BxjHEdw7KJ9CeoHKQxI1AJxMMicXXIBOoJamb3OIWRaQYmhD4mMDQmKNQlr'
-             b'qvPHIahscXPsA5myGvQJk1aaM9BB71oAaAFDk6O2lRa1e4LotBc1c8BsXC09kL7/CgPjkALrf6zy'
-             b'PHwtnPgWF0ai71efeEoiURgIFCGESS32ArX8dTHkQWe3m+/jIrp0TaFLc566FsgzUJTIJG89IhI9'
-             b'w+lpvcwQKv38M5BJo1OHQLWgxXgBhM3aC+kUSY+9ak6E4YurIXMgUiwDc453WAQFbhCF71I20Y7o'
-             b'J0hB6lB5I9/p1yQhE+goqGKOA1Ct9QNH1DvBufH6PpWk1izO8mYrhbLWAOdOn9SiRpEZSEHzhgO5'
-             b'K4oi8FAMwWAWR9k0vRBRo0Qw4xkJvyuCuAuUEgQFsdOLy2u5MB/SW2MAtyovHhhQ7iytrDqgtPja'
-             b'jY0Nd+HceTUVCnL5FLlgDogxgipxS0RRio5xbX2dapUAWS/HZi2L/Kcef/RlN9z+4k98NYN4UHxi'
-             b'XQBFXFj+L6UACORH4f7Hja3Bk48+dNvJ55654ewLJ3s7u9v13t5k+fHHHlvFWZyL795sMhntbF1c'
-             b'297aXtjd3utvbF7Y9y9+YedYbsxWfYq9fO/qe973b9gU9muR3eIBrGErblkR+kBUzsZfFjUt0mbY'
-             b'cSdFoFpyhfIeqE6Wbm5NutTt477kWMo5ZD/DjOhKHkgSO25D1SxXI9ioDM/BXGw1igoYUvHIwvtt'
-             b'tpAzk4+LOJpthstPHn/68uNt+7K8kr/7U7/1Tnq39MeLbT0an9l/+PDjhy47+vC11914zxXXXffo'
-             b'kWNXfDEX+ad7C4tExXzY+JofM9UXzpwYSw9TFa04NkdAp5alPh9TKoTheYOT2M2eqU9vpSlttS+K'
-             b'fv4M4t/BKQz3HeY+gENrMu0jO+EpDv+AWeJe7hhG+KL84Lb5e/IimUhYB5UC2u2ge6xoixudKRK8'
-             b'ONYI/I9Nr5UukgeUblJByXDl4EzC1CcLvxFnOByCwUx7FK51GnJjXZ0PczGqSUxUOBu3oage/F3y'
-             b'WrdQY7QaSoougeD77H4FwG0l60AvHmSFdRCFAateY2cHyR2ooX7IxUOEsoK1WnOpbz3HM74UD/h9'
-             b'c3NbDvbgC9yMTq1XdTa3+BhL4y7dkNBykgcdfgXoevuVmtW4zu+gknxjhei9zPO9V0KnStaUa7mb'
-             b'Cwx4CITSMcpcegKCaL4fcA8skDcyHXYnlCN6PczwO+KdcU8Wh33mWLS4Lgnk05lyNnTUAcfFnqQN'
-             b'jsdjyYnQ9wzJIcYaQBNQ3MX8+ZCAqGa5Kn/skBGX/CVWxIYEpHQJgO6MkUFkv20KGmQJmsK+D268'
-             b'si5rS+HxI1ctad1ICQWLk93tLZc3abe8ti4Fml33UngISXZr42K+rhtuOFrIB/sS/wxrx2x6OaIi'
-             b'MUdUMLmDc71Bj46bJaiom7+oc2TgJri4uCwKiBSL0oCalSQGSlhPreYGJC2UUFguwGwqyns2xUwv'
-             b'r9fHH3rgDvet3/0PfKq+at1/Wc/+vwyqWJ3v42w66z9832fvfOizn/q2Lz/6hdedPfHsDamZBDQg'
-             b'5Ejl34G6zWaSEUH1k+45dERFimq+qUPmhlSUR7sF9QFxmryqmp2CKWl2RixRm05HxKkbDxk/hNYi'
-             b'lUqglTulhFk/x5man8cXwqqRqpVng5/QJvHDqBSNMn6M98axcUVO611nZV1ZTL2TDJIQZP1Xw1qD'
-             b'7lwZAbbtThW3dw6d+dLJQy888vnX3Ps77/tBICsr6/vO7jt05OHrb7n97utvvvXj+w4c/MzagcMv'
-             b'hMGC8/ns6qyxv4bWyMVz53vcmqI00mrwzg2SHvs2P6T2XkxueFDqKKAo/4IrLGJsIEG736TwelJb'
-             b'1aSMTfyaFag9uTpv5tABQwYG6B+HCjTFjNBt5eDvYS4M2V4zpdmPVz09vfyRTRBVA61LEp+DkjPf'
-             b'p6d+pI7bZvGyqUbdyAUBCOU9R+1EosKmgOAjZ+8C3UbV6NOgxUYQ5AfUtPidO/FLERjVYQ4Z72T9'
-             b'a5xxVDIlqmoSqLRLT6qUkIcy0nJ4Rris0uKjKkVV5a1TVY/31EUGW1iOafSNyIkKZDTq6zy4e59E'
-             b'OfJ72NkRWSbY/16LGSARsCkGnwOv0R9YgqRcx+3dHbL2xULXsyAUIpArufPb+d7hUO0Puo1AIH5F'
-             b'bcqh4nktYDAjRD9RZ+DnjbQgqSkhjOI9weyDvD6MD6LujaNRr3O8i+pIF2s5BFN7icxwaXGpkAXp'
-             b'LZHXGmKqxTyokVECO2NNzlMDHlfm66qWmTM18pqyZwK9qIiNM92/AvEya48lRKflhuaKRbI48LV5'
-             b'Yx+7VSRJlqgg10HavvMdWNo3dMv795exBrvg3rB8vvykqm9Aw8N4lA913FOgKkG5Gt7NhQX5ULbf'
-             b'3b3tDt3ynbsgNuu9nW3Xp6ukXgM120IBcMXlV7hRLvQQfGWFG5Cpk88+dduZ488O67ra+2qgANF4'
-             b'Nf9ZO/4pCQ8wf96nHvrkJ1///nf92k+fffqLd/Yd0kF77uhy3p/aQDSKhTwQVY7Z8u8aId62TTFF'
-             b'kwMzaZS0FKm2txrHyvhQwh9phTulo0lTkQhPRZxO5UQIHXrpnXpygGwsI+gW9u/kA4mrZI9ukrHw'
-             b'yZIe3FHzRMyRtPK+OGf29VD3qmbp3FhF9up9p4KpNHCLWS/wGUGomRNVU0qxXA/znTH9UGcClv9u'
-             b'99y+s0+cuuNjj917x0f+Xf3XlvYfPn/ZVdfde91Nt7//imuu+8CVL7rhC9VoRPs3l8+0r4UatN64'
-             b'cH5Y64WKqvXmjDyKxCzqgdqFkHSMYgttMStYr3a6NKEpcGwoLKKoFqmEO5PrbEbyl+5OJyRaTHd3'
-             b'ucGCaAf2P+aj8AAQp7HdomdWVxOrBcuDzR9VdZWseBfFYstKC9N5m1YmmUXCrlycraTURUs8C/IZ'
-             b'rIuVRVvxYG5aSSekGx98BNI0FyhTOeg0RCWURRc00ldMfKg0UN06Dhh2hdHRApcHNc72Rrp+Mrzp'
-             b's9+wO8cIhIe/BteHJC6FGJN0nENlu8N4Z3cv7wmBRQyQnq1tsLTzxltLhU91xEw2yDDn/oavYfVs'
-             b'M/ekRlChKxS8drFJ42Xx/u2gx3uGM2FgxkDHJh/n+4mHaCd3/XjA0XWKfbMcgohKRnwwYbTcIozz'
-             b'AY6xyObmllteWlBmvy9md3y4g5DSiGToeCZYImNwpfquyU7W+zsXiwyTJcw8bTyEP8c6BLnJ0gmF'
-             b'j9ASym65YSINsi8HjI4OZGKg/U8VLlEYmLwwFW6N2URoW+ItSdNIo4lWeyWYx2yEzZVPZ6XmTDx/'
-             b'YNuG503y6AX1aRWFMIWI8UBSpaAGtkKf5uRUCmsE6dBCFG+BoPwQEkBDnPsswe1NdtxSkvcupEQ5'
-             b'QPBMjhdGbnV11Z06fYb3hj89r7sL505etb2zeeOV111/b/oKe/JDCovMh4sXL7rx0pKL/zmc9V4a'
-             b'KaCoiBUPsFave6O93XPrz33xoSvvvfsTf/KDv/6rP3pwIQwPjj3JqijcEa/eKErbxM7UydaFnMdm'
-             b'wmVwui9cjypIS+HVgCpoJkzJvkRTRTmsZb5I51+puRi+Z1DXcqCTO9WX1wwm1ZYmpTeo3craitu8'
-             b'uOXWVpdhV++WFhb5fUByo6IM5peBpYdEUiKKSF2tpJGc7u2V5y23gxx14r1Dlor9BxHrDCQDvyua'
-             b'm7jsdXXQoHiarmluiT7TrZ6TFutdBRQpjtkpgjjkL9s5s3byC2fufPaBT93ZVKO/s++yKx++4tqb'
-             b'7rr95a98z+WXH71nMB5twQ7f7+38J0Ok6o2NjUNO4d/Kd1AmyBDO7IGjs+SV8vcdjdoWS+yMUJxX'
-             b'VnxP/zOJjSy+two8LAU1CEQUEmV6XoJ1cmcJMlTTyqwe7wM3UiDzJC6CmD3nhczBBQ5uyId0B/Oa'
-             b'UifMc1+qjPkuiHr5/H6YkhcF/mnVMtdc4ipdWM4+Fz5l0Jm5q8SWGEqCRgxwkEro5tL1pDBOZQae'
-             b'FC7r9cec+3tLc9PsQ0gRe/VAJInU7s9IYKOkTzfXQGlmy1lmq1kEqbjupVLQlO5Sq6t+vy5mcviG'
-             b'4aDuGlBFbRDOQq5G1cHa5HLArHUaeT8Z1xswb7d8gEB3QEL0Q2Ht9ziLV+6HE4mhs5FQMbWRD4Q8'
-             b'AVb/Ubwigl7+Mbv7NGcGJAf3St4I5CN2NxXrhP4SgPLdfIeQiDChmEDRQEa9KTrUFjgas55x0qrm'
-             b'UGkjA5c06trgQ44ctCPA/dnd3na9JSFs7uxu579fFM5KXguwwYajoXUY5q7H95AuCQQuJE4hFnbu'
-             b'CKL0SEUy6FUiCASJvY8+h4I8BEXYooGv+XrWugRi+RrvujRBPntE88SxL/muqO54DZf4AfKfZq7A'
-             b'IOnAdZwH8SDwxXei0i7PiKDYmMEDOHHylHJ0pDia7Wz07v/8Z99w5c233etmX2lL4EsRrj+mJz7R'
-             b'RaCgvdGCm1642Dt/7tzlT3zpsduff/bpV5194fhtF0+fvK6ZbB74+Lt+eamd7ITLl4dcp3u7jSI4'
-             b'4n1RAfNV7giuS6v3kqjbXHHpNQo9WOGq6pPaOsBKDuMekLg6kMeEWHLsyT1Eg/f7XF9oMka5kKbC'
-             b'LPTZJCyO+iScwhFUUkHFAr6YZuT/9fPztpubl4W8H6CJYcS7mzO6so4imWW7rCVIlSXsrKWzbEpz'
-             b'ih5VFaL4vHDxvBTu+e+2dvbcxuaGWMuTxBzdxY0tcp8wEhZ0w9HEjkWrNUaqgpFL0hauDpulVva0'
-             b'EZosP+lPTjz+4i++8OSLH/rYb/2VhbX9Tx295oYPvOTVr33H4auu+nhvNJ75/H7+yAuArc2NFSP3'
-             b'SQUndqU93FB400epACi+iMKEZrJZ533KuWD0wiAeLy7nym0tb6Sy2bt5tUQS8iDCWFCVkwwkA2/d'
-             b'UJLMKNl99XmwwxBHfPjbXBwM88E/KbVHKgMVcyp3BRCVYJJGf86MlXJqPbv3pJ+3VUcwGvEovGmz'
-             b'YJlPov/UnBfzsEc1aCloJU9ACZIcCeTihgWJDf6NqS2wvNeuVqfwghw0U2Ww69jEiaUxi6Akxkog'
-             b'vuF64SGZ5cOl7vfk65Rrwc0+L/xk8K6Kv/HeapUtJn2Ia7UINmoO3up4ccSvwbwcBjuLiwsdPKMO'
-             b'f2rkULiMTg8XNr6aM8CtInjlNySFkpWBPZXkQsr+nM32vEKRuVpvWj70RrTbgwlUrxImPz6jKhN2'
-             b'clUP6HJhNOQ6DdVIZoX5a7b3gCT1OJ/GmIEHtDo7wncA9sNexwzb4B3kAhOHP3zh8WMnEzE+qgZ1'
-             b'meEnDWWiqkKz7IFYLC2uKpIU3ULuTgwpwga40JN7VsiAOiP3ZY7pCqGpiwAOauZjUr/UOfUZZyB1'
-             b'8bxGvnWm1/dRyZNJ3osSYpOqeCzNs7hRKSqQbDKkykJfLIm7PA1aAQumwvsmBFZ5H6HyZZThNStA'
-             b'rLQTUTVhcDvme/QHY3f5saPu0Ucf1RRKfH/k1953z91v+hPf/ef+VxvFfUWOzfxMbm9u0afB+z9e'
-             b'0i1q0vPBCZ163iP8CyeOX/fw/ffe8fSXHrvj+LNPv+TCmZPXNjubox4UFgEFdW6OKiHjoRvd2tlg'
-             b'V43HrNJDm4qpKM8+z6W8ToZA2PIeuLMzU36P7D+1l/uCvXGYnw905Ng7gNRC3QN7Z/CHBvk5Q4GO'
-             b'vXC0MCxKIOfSHOG2sxWP6iaZzKbcl0FTx5lyouQZAm1DFHq/vtQnwvguaW6wr4sZCAP2fLuGtscV'
-             b'N1B1b92/vqZnUnIH1vDzD8t70qRMNBY79KyI7ty58+7c+QuURG7nYuTixgb34yYKqZ2kR0UMuAco'
-             b'Ou712RC5Yr5PvnUjN/Ozs89c8/DzT/7I/Z/44A/tv/K6+15555v/2Utf9or/a2l9/0WM5MBE/CMp'
-             b'APImSM2ltxS+JEQxwEQ8gEJSWEjuDC3Hg4iMbBbjfY8fMKiNr2kki2QqdTIpJMMtLEpnjQMdOeDw'
-             b'E8BBWOWOEAzn/jBXuBO4BQp03mPIzY50+ooiCMkwkUHsbE4aKg0paZRdJ1UaTCfAakbULg+yOVIi'
-             b'yYdBzHEqPbhYIFQdqauqDDloipwmaPAMOyiKEHQO3LaFOOhdt2FLDS0VbttOeaiBnU4HY873B+yY'
-             b'6lrm+20y05hG1jdmWhiLTGfigtgI5AwYmmiHpthZ9wdSD4oYei/k9zDJXSledwhZnm4AuMcw4UHH'
-             b'bQ9pXxMWpTMUSA7BPD2t1HHhNrd2WPWO8sOPw1PaPFcIO5BCTtT9j9ciaDGkMdLCR7AHMRSZD3Xh'
-             b'BjR5tU/2VTdo08YD3UUKRaAmyI3eLEYNV75zBlRCHlATBhXp4YYVugi7ai9zYYbWJE8Tqi45UN4P'
-             b'fhI+M5AEHzrvBV8OaF+4MyWEUKF3oEhY80tLi/yqra0tjhWQqYCRziSvc0E8fAnKqoK4U1qV/bsL'
-             b'W4P8ndoaGwlxB+OzQS3mSFag2sYf5L+bplXItSt2pZBIZR7rCqejcpd4PrPh9xyjbV44J4cJnx1j'
-             b'Wcve0Mz2KLdjfHchSLY8TPDn+9fXVcnSZWPg8Drx7BO3Xzh75vDq/v0nfPMV2gCBUs2mLv2xmP17'
-             b'NizQmg+bsdvZ3Fl45IH7X/7QA/e+8d577v7Gk8efvW1n48J4edQnGoeDbglkbWd5J0IsbhS5hFwZ'
-             b'XTj2FvpK5dc+sm8f9yJwvA4fOeJeeOGEuzIXZCdOnnYnT54hkoeCA/D3+srQ9Svh8qDgXc33zUZp'
-             b'Nt4yLnjrzB9CuDpmZSFk4VgCqMrn1K5d+a/FG4ScFMa5pBK4liwMzNv3pW6kKNWNjL/Uj8SrCsaC'
-             b'uEi7miNk01vIbNu1YI6abjlP1h7k1x2sjLmG9q2CH3OMz02T3xvGkfh9b5bcs8eP56Zkl2gFiga8'
-             b'bmXoXutZkPFyobDV6wYjteV8BkynMWx8+dGX/PovPPCSD1x27K++5LWv//U3vOVb/tmhq696vJo0'
-             b'5EF8VQuA6e6k7iJra7a72LQOHDwgs5FZJ2IPKXYEjC4QXVijURjyCEyh/p8Nhlnrai+FSjUvrgqH'
-             b'HWB0zLJJ9OrzIRUYXnzsIf9Kgk+5Wd406lApecqp/n2qjPyO/WyKBMqQdBYtxiIygmh1Pu+1eCEZ'
-             b'zBcxlEBGGslKb3l971GYWDwsKBOrPefzUSFPIzMJf6KV9zQXZkNr5RiUyGUit+jEtKpHxinY+0lZ'
-             b'3ixc9OcHH9SVTh4sSU4U/3d0VDYOMF+DeZ/+SPir5kNYEUKsNBNAJTD5tQHBmXTSl3GvEBqlm+6L'
-             b'O52xPjAeUijOoH7eJr43OZloNFSrjNRremR+vUGv7oDk/OeIFUYEsdgfBzeuh52SwyVC7pJBEPmw'
-             b'SV0p8FuqlVuRgiI6uoap3pDsh2FvoN4Obs7Jct4ET1jsvD/iYVuKD8wLm/wADvpDFmIry8s6X2wl'
-             b'5bI3VGgjut3cJaArwmfGJkAHQyYWSvcE5rttXOiaZI3J32EjNitfqirgh9+rxS+BBcGM/heW8IjP'
-             b'0CjqE/UzSKBTKn4MjrkCjsVdRWi2IrdFuB4zmmhRDqXPOuafNN5yMgvlCKyyhqBym7mAQTEHNCZp'
-             b'iI9IZ9UZUQmglhuAER4K1NhvtShVTgM6/vxG9uWDZG111Z0+fU506JVEA2+dObnvS1944OXX3/Li'
-             b'd+99RWyBPTk55hCavha9fzhXztczF6PIR7l48uSBh+///Ose+Oyn3vLYww/euXHmxNVuJuO5lVwk'
-             b'7T+0rhyNkuE8Z32eLum0wS2CLbZXgt2B/fvdjddfS14V9jF4OYxHogC6IhcBV11+VPelROjc675j'
-             b'aw3W1wmNj+/QFTZ7yqnyOjI2221DpQzRa3UiW5BFQ23NdErHr6nxmushZmbOd4Fe0XguUfMk1NjS'
-             b'dz2CklydBoQJypBM7q2KlVRGCVpkK7EvagNVOG6xG7NxGxGHaxYEUMMALThyeL9yoHrumWeeYyF+'
-             b'6tQpenwQP4RbLK3QfVE2eDVxE85AcgfR3F04cfVH3/krP/XZD7/vR17/lrf/s2943Rt+8dDRy5+M'
-             b'GEO4r45Ndp03yh7gY++bDv/DQzxrO5ZySurrFbV6CwVKLGQ6Zcx3Vq+oqOoCUbKftS4dTHoc6Jra'
-             b'Rh187tIp22gTD/ummfCG9MdjzvuF1KfGO5NJJ+G4RNst0A2S+OhgiPl+fl3p3Ntyc4PKUDjfUptK'
-             b'6XgVAbCEQC0KJBe+k1e1jZZAleibS3ravGmci3PaaJONSVAReQuqgAAzGrN2ifet5Fr05D3jvrRa'
-             b'9BhSwWVZSVyyRRN7naEX1EVh2WE1kE6bz0KXZz8l8lATsgIhTrgO+cBoxQmwK4nm8Dg9GAXiDiUo'
-             b'hs6GqIhzZ7uMsUG4lKi0m4sIXD/o9O2Btbp8pM59JY1NZ8WGINkBg+Jia3uHxQLd51Tag9+3drYp'
-             b'LyyHu3ajnOEroW66N2OaIJGBJN4B9BcQK0FyTDBjhENgic6NEhk8GPg5vbzM5aMS+yxdr+IsVL0W'
-             b'kBjpUilKKIfUWbsvNI2qeCUA2owWmoNOGKMEp7N+fb+TZs/1hpK8h+cAowuiNPnvFmHiop8Tsc5F'
-             b'UZCv5d5k141ggV15TXqMYs3MgzEqh6PJ92jmVhYrKb7z4Q0lytLSWO+V+EF4C1EKicU6UhvtHlWh'
-             b'MB20WJZCk0WAORPZjCHvoCiWjl520J3I3WefoWFi1hXy93z8wx9469U33vZujIP+Yw/WAa5HjDpm'
-             b'qL62hH/wyYCrXGzc2eePX/7Iww9884OfufvNTzz0wDdunj19EEPCQT+4g8v4DPBM8OUwswMuqveJ'
-             b'Z9MhTUHoVdxLwD/Zf+igW1pe41gLB/r1117D/ZYIUf5iZoYgQwXXOopiis6h2A8aUSy1JRlS9/pW'
-             b'OE8Y84Vovjxyz2UKqiPRIG6URCcxvpR8bPFNUSO4ZOZW82MpG52WReMLqin3NSgfNnWSOiV4mDdI'
-             b'MudgbUSlGY2yn/uuQKrmiLUlMAyFihkOSYCpUxou/zwoqkQhkaax8iBlIZ7c9ddcRSUbOEE7O1s0'
-             b'b3vuuRfc8y8cd9MmEtoP6rYK0xz83CaKgg1IwdrCyKW9zdW73vErP/nR33rPX7z91a9/x2vvfMM/'
-             b'2n/4yEOzXIh/xQuAyWzaS4UllzopETcpX+QdRrSwSxHE5gF8pCKJkJQtsewNKRSzhqQzaUpB8uLD'
-             b'/BrmPwzSMQZ+PsiwoOECiK4nqW4fkKF0JLWQUjDbQWdcD/gafk5+xXcGEp166Ddpwhtf58oMntGM'
-             b'3DV2nM7Gbb0ZSc+rc1tSrXoIrpjLiGmq024rFh0/Qm4IWQOVUK28m5vT2jVFd4f5NLpZFjIM+hmI'
-             b'ax1tdnuaYOeKgYw8WIwwVCmlmPyoRVFX+et8mU5ukKpU2tEnXz6XZQ/g50Pb69VJw9jrkGbhXpjP'
-             b'w3isfu4KreE9VYrESEyvIAQMAEKn4f2l5m9qQxtCKJpdIjJK0uxruqHTbhKPOQ56OBX2qlCiqYEO'
-             b'LANC7yLmSrEDGaNX2aZZGdMFsReKU54d9LNZW762y7oXsyB26ZVwBSYT6NVH/DPh53WMCfw7D9qk'
-             b'o7F8f4YD85eQxMPKegsvChNCgtggMJhVWJ3KCKOJVD3diBv+PQpCSmFBpII0cd1rnkXP7eZNZW1h'
-             b'Sdz6YirPDTfXkiggdJSV5UWVYmmokeqYO1tj+OLX4symhFQcmpB2inOmBhwhj0LE+6IO6VWcGcuU'
-             b'TVAv65ug4ycZCmM9N89l0FFDEquxF11zpbv/wQfpRZBUAz7I1+fsiWfvWFtbHO0/uLbr4n8c/Lm5'
-             b'cdE1vu92tve+Rs58T8c4IDJtTMPP3f3JN37mrg987+NfuO8Ns+0La4Gj0OAWB0ArRamBrAkW6EBC'
-             b'21TY6LGkkU5Jyl1bXeK+gAZivLzs9h84wO4fBzicVAfsNHXcxXs4oNlVpEOjHHbSXzR88aBpj9hn'
-             b'A55x7EtJnhW8n95owNcTvlYl64kkbSlCqVBAmBlY+Log8e7B4eKYaG+vuE9K+uqMe64ksnru8xgD'
-             b'e4WPTZVFySJ5YnbYx07eV9A9Hc0Vbo1sw9HQRx2NxVKAdDYDNvprm06O61Q5FrsoExYPwWtjq3J0'
-             b'JKIy3C3uEdFaXVphw3j08BF36uxVbiM3Sc8+87y7cOGC29SsGwk+09jvJFbwuCa4X01eE/e8710/'
-             b'/NmPfvDPvuLOt/6jO974tr9fjxfOunPnvoIIwLQJeoXzbz1nrSxNc7q6Xl0CO/OEFOTfjDkKeByd'
-             b'0OraypyHe1RYyEyEuqIg9OoCwTslTmA80Da6saCTwr+rsU7S+Xsyox8Xi6aaMLkRGWPSGbBkx9tB'
-             b'XNNDX+AobqZVraoFpwloApmzW0tRE9fUncqLja0djCIzTGpJG6Uib1ORR/o5hUQqlrK93MX1GGSE'
-             b'BzJGcRBM2ukkjcNtp0kNX7y4+aXOrML81RtlriK/gHPYIsX03JjBLWDXZocrw2lscYV8wC6ohjZq'
-             b'SJCgIAZPl9TAMpcT4x3P7x3pwSVIAJUDl5Aq5giaYPrDu0FHAPgZyA/A9RuGQVe0NZq+mP+HgzeY'
-             b'JFWBNyJUQXX3+Z9N5gEssHuGDC/FbswArTHWK81/grCTYewjJk3SGYw0plgSruXPLQ0Qa5gOiHZQ'
-             b'5iW0t7PH9yeW1LJJAPYHbE4+AjYmzFxpGiTx2TAkwXpuwGkZL9PgCQTHKZUuQ/FHCDJSEigVxLqh'
-             b'syw+SDrnHc0g48KRWg/H4kkhsynX9qelEYJnAYpKbdxVGhv5mXA9JrtixAPI3a5PTw9/4TuokxvR'
-             b'kaqkI3JEwvvQkr+xt71Fz/9Ky9uo8cYkCgYpDjnSim3RZzfaZdGsJV/zwwcPun2rq+7E2fMuDTSU'
-             b'ath3x7/8pZvvu/fzr33pq+/44Gy2+x980E73dtxzTz/hDl927Gvi4Ofacb7/+MNfeOUDn/30tz72'
-             b'0H1vOf3cUzcu5uWygKJgacyDdcrToC3IF5+B1uDwVBwewVVBjXz06OXuyqOXuWuuuMKdv3jBPXf8'
-             b'hby+Fl1jnCUvtu4333wT5/vSgA1oRY71iyLTqwaeR7R2yshq6Y2W8q9FLTBlTEY6M0aO2Dc4ipUI'
-             b'dRlTiqKekudaSMzDZeP/+M6DxUkwWXGwjAVw55jWqaV8SObe6spoAqRwrD1DI50ikFj32xvnS5Ip'
-             b'HQZb4YOB/8VZen7W4CFTyKvOTLTCnFTYl/FgMtm4810zoX8fne0dqaR58hPFVr9erNUReO/8nlvN'
-             b'xfhyvsdXHj1KrsWJM6ephDlzYYOIrNc8HTRnwu0RxHdxBGR8b+HD//ZXf+rhez/9nd/+577/b910'
-             b'+8t+LZ8/XxFWS50vRjDofD7qM2p7a3G6Nl+XblIO3HlyknVgQWeXpjR2yXTN4tlf9bTICNKd0myo'
-             b'EWtfVlE0y8kPTN4wwRGg1I6ue23H/s+vRyMg5zqnPovr1bCdYO+zFUiLAigzrSDPoBG5HfkLXWHD'
-             b'ha2FSVT2cuxsH4RRrtWoc3MsbVNzzc2UyvtSwx/5czGYgVQMUBE6OVh1CofC8cASLoCcUNhI+zQD'
-             b'iuzuhdWa1GGtLdG4VqiBXFL1RH7jLOEQMO/ubu4IFuxuaU2W2MWTHMfuLc4hcImIAGZUgKYg43E6'
-             b'KnFq7jSgRr4T5gCaRneMqheOerjOIzj4SbISr8dQ+QOdPM65nZ1dOfjpDx7KLGUbfgX5s49HncUw'
-             b'q2P6CBiLXebieI9MoIuCjKCANSdLr2uwmkMV8BmgMsAooMfOqLA2uvGHolvD4bD8GQ9JmAsNh+oe'
-             b'HMuaGuWKH/cUG+V4vMyfMVxJ5f0gvwIkvWThWUx91M4/CXelrnt64EvokxS1XiFsKVai8k3o6oDg'
-             b'KS/ZDf16oGMyzSjABthOxFo7b/yLywOtkYVgZWmYqifQ+66JgNodFU+jMrf1bocM6Jm4ZTqDX9X3'
-             b'QjM4GqYhduM04UN0ErPxwqI7dPiQO3nuvHY/QsJd7CX36H2fe8tLX/emD9b/gQQoKHV2LpzR+/Kf'
-             b'8OBHASqGTb1HH37ojXe993/5qVNPf/G1IU7ceNBz68NKDs+Yu90k3JWk60ANTaQIhBlXLmxRKPTz'
-             b'833Ddde4ffvWEMlGBA5rEVdqeW3Nvfa6r3MXcoF8//0P0p63mSV3y4tvd8euuUr2D/CYki+KiNKf'
-             b'oIidwogkd/u5uO7ngx9NyxT3r+c4x26T7FmpUhMzfDKYk+UD2TxherXawKPQqAb8PkkN1b0jiZTQ'
-             b'XFNNw+XNWRPfA4SzJIo1wNe1SHDMjTHFWrCpku67q7mojDN1EkTDBr+PmfDS8HOngOW3LgiCqaQ/'
-             b'NBfb2xtUYqEoRmNWGkN9X3OB2OrIqbLSYKNQX9QvQiy3a6rWxODykIiKRmHm1lYX3Prasrv62DG3'
-             b'tbvnjp887R559LFcCMxIEhQemDwnrcrM9y2O3fTMs9f+nz/7P/3Ll3zjt7zm7d/1Z/9GfzTaJBfu'
-             b'P6oAiE3oZtwKK6cwF+PLQZCiAKnY/woVInbzdz0E+/2hbsqmxVM7AYOHuYHW7EgxOwzcHPvFnx5k'
-             b'CeqC9yS0o92bEHJ0Pihr0xXrYRfbLsmtFdUCOi362U92uZnyYmqkq8kMxcHPhALSvURztYpm4KJV'
-             b'qVd3NhzWrVgEe/XP98X0JUk3xyCbUFjUBaxWdnyDDHLdTbHxA97DARfVAEdAjTinRxeTFNNKy0yt'
-             b'YpcVCGk3hWRgBKCgpEP8BypLHDrDfChzPp8Yl1HY4UA74KhnhB1zALOO3j6jU/2wkMuqklEQnStJ'
-             b'nQIr1mVjEW9+4QjADAjdMWf+3Tle+AqQ5hX7EVU84K8WxwONL47lIKHDV4/G3XzdisiTL918Wdiq'
-             b'68eVxXUQwyPfseKT5+sEk6AqY18MSXzp8ulqaMWcmQTlr20AZ+bNBQlhlGr18tf1xZ0QhW7UzsbI'
-             b'Rc3UAk9CdzDhszUygmmSZEMAwpUI6ChwKw5adY0sRbhLc7JLX2DUVLIJZL2w4EkV0bY6CFl0CkKR'
-             b'kke9zVfh3jeZuUm+Tkv584TKd3ySoDJWLwVI7UNh/neIlxZLUTI5HGB917BDnbU2ydUOyZvxVuWO'
-             b'XXm5u/+hR2SkGGTtwFL6iw989k27G+eGw0F/L/4hxwDs/kFWU3fO/yTyPRAqfd9tXby4ds9Hfvvb'
-             b'Pv7B3/zR5x77wsvG+UBaB5cjDYWTxFGeKK9mJOyq3bLC+0tLfaJ1QLBuufkWd+VVV7mz507lrnCc'
-             b'i/kVt7C0qMl0VS6SF0lcxX5y+v4H+NGb/LqHjxxylx+7wnHM70RZI1HkjUhF1f6W7nT9/HoLq/C6'
-             b'J0mb66PZU9+Mimsd3TQP+KiBaE7Hs6FPoirWl2jjK9d5xxlEr66bGuTFM0f3UnCZsP5BUEQDYfam'
-             b'Kc6NmB0JPCqDbUuBj2sgTVWTz58em0O8Bjgw/d5IfV0cnS5HC0v5x7YauSmP0dJsl+8PXAnsySgG'
-             b'oBgDF2bj/NnOBK1pBLHDPlx3jQqx2BiLrNk61ajBZNIk+OIQSutxmIjl9XBgdcmtLY3c/tWR29pr'
-             b'3Rce/qLb2hHpe+0k10XUdRKmN8735b67fuMvPffU469665/+vp+49fbbPrI7abuYdCvc/4BrvzYz'
-             b'Ba8VOqkOZsriLNazmfuwqcAgfOrVHAgzf8xEyMAvhjjGeldZF/wFKjkgeiSrzHgxsNHBsQlwk8R1'
-             b'bhcUQuDShhVdf9CX79HD0WxYZeQQCnzKzbM350OvMhJKD9VqmKYT6p5mqIIz9z91P2L33+pGrZwA'
-             b'mcVWCtM0BTTBDMvNJfWludEJFhRuJ6x8J5MdJU35EnRBNysY8Xj5d76/SgySvMJSeAi5+JSlLVHD'
-             b'llOgPvXW2bsy9s77v0nW5J5sb8FQo6epfDqf12MFmldA9pgP4hoOCVu2JdmNQTTTqMluck0hK+v1'
-             b'BPbG1zudUVbB7Ix1ZBSLg5RKaSKduxaMuOaFDIMir88DLxaCIG1jOa/ud/77XiRtMCjCIe3miEF7'
-             b'OxK3i4IjqPd+pUYjsFLGzxjAabBMzOX7ZnsNN9BKpTq93pCkzTIKTJI3ABQr9MduNFh0Q26WClAm'
-             b'r0hPZ7oim7zEY/tGw2/oHKYBUnr9Q5K0y1C2Dny+RDOtWPTLzSXFdSzWvFHvk3pvFLVOKm6JMxZV'
-             b'PTdYWCCyRvLttOH7AakvcCwzLKqNaIVrEuaUhD9Rze8uXrzArtQXwq+QhEOXHSizXwRxgcjKrwmF'
-             b'Z4DrizW+ljtWoE/ycWZcHoCpL5567qYvP/7Yq298ySvvCrO9P2T3X7nnHr7Pra4s/5F3/zTACWN3'
-             b'+uQL137k/e/50Wceue87L5589tggF+yX75Pky+mkUWKd+NUbQx9Q/N5eyz0C6/lYPrSPHr3M7Ttw'
-             b'wPVyYbl//yFaKB+44sp8yI0K/ycC4QEpkwdK7c6fPeseefjRfHg11PffdOtNgmbGWGjcRTrPgwjr'
-             b'KK/NXl7P65flRT9S8CtxXEmSMLpqWHIrvM2xLAqYmUazc63VdHHlnosArul0zqJa3eSKG2jLkW7y'
-             b'3fiWCFeUKHCh9kfyW3xxoVQvAWYPVCXwCl+D4qlXSXT7JHfUlCLHCfdzKBfg/tfY2MCLF4JJnIW8'
-             b'L83KQm9YxtkSpd26lfX9xbxsd2vDbW5sUDm1efG8EBoVVfRpzvvEu44U7jt02KTWlh9Ds7JGgvCO'
-             b'HjpA5OrYkcPu3gcecU88/QyD9YaKwJJoHDzHf4dXRm7n9ONf/yv/4G//1p/4nh/6a9/w5m/933bi'
-             b'pnqYeHon+D/g4q+LS6lCOpXJiLzM2dvYxdlGNU0IlkwGEoRXAkghH9UlyMms3WQ8L68D3foANpDc'
-             b'SPv8WajecLhP97YJabITgE46LyiRCgoRC4eskNnMPzqUOidoBxSUZY2Hgu6DbOqnuZIVq1s415GE'
-             b'o/yCUtDoLLhYxFqqWlXpRidQT0PSnBZNIgMoVrGdJbEvxEluDL1eCUNhRRrlWkuREufev1wjdKaY'
-             b'lTORuWXGsbOIZlbKPhVkwX7bzofeeKHfzeCTuK5JIWEOX0FDcLxuCNoR66a/uLg4d5joGKhcE2Hg'
-             b'ar5P6dhnuRDpMdHD016zV2uIlH4uT6vjSohCURy2yNKnI2To4Gft4DEbF+tNV1QLeGApR9Ru14hQ'
-             b'CPyx+WDSsQjQHUCiKbkyfpL4Yy361QnMUstwQLetqFGG5DeEYqQ0IGNeeRcg6ODAXxrS7ZBOktjo'
-             b'gDxNlczZNjqiCQXSt7moMaNJsCLLXwoqbl5IYoxqJYxGA9cIiBMMn3BQUwEi6w0FCtYRXo+yTqv2'
-             b'FCWRolCtvVvRvWA0UghRKNR7mgGAeOR67FI+rCv11IBfgHXdkGnygNbQTxQtmP/HRoi2pPOp74Xt'
-             b'D7LJVnzPWG8t9xVlPasfBEmq+Q8O7DvgDh3c706cOCkcHZWVIhzoU7/zwe+68SWvviv+IY17250t'
-             b'gY3/yE5/APy5sAoL7sL5c0d++33v/sGPvf/df3kUd9cWBpVbqH1HXlNJGx7noAV+00gOw8rKmrv+'
-             b'xqtzt37M7du3z63v3+8WV9cJsfdgnOYr9aGX4slguFgsaR2zTu65+25q0vFn68vrbiV3vLOZuuEF'
-             b'rweUEJKJpuWifS8/c4tIpewvcEyKBmV783wuIMaE9+luSQ9/jS7nAR6p4ABCy5yL2EnE0WS1eASM'
-             b'34T3qTkaNJEKMroCOtlqOquN6LjfubYj+UWTWsvVniIrRRExkqg1hAxNaxUk40AM5qSOgJ/EbBoJ'
-             b'9UdDd0PVoXnWnNpMX/9dFAWVPJu62/XyfrO6n8a5bnXrIM+2M2dPuj06CDad6+S8zX1Mc060eqi0'
-             b'qXCmKuVGgK+Apm6Qv/GVL77J3XLTde6RLz3hnnziSUrFmYGijEHkJAxh5e7i6L2/+ou/cOH8+Wvf'
-             b'+h1/6qcm5zcnoY/n6oib5HNumvwlKMXvjQDMhxrg/VXdQ5zMrjbaLFWgc87S/ZyLmXYbTRSNcm1A'
-             b'ZQmn8SXdLSgsX+kcs+UG2FP2vkAeWBhTVHKl+lNns9TllhtEn+ZC0LmwZ7JAeqoBt/mT3PNKiSbK'
-             b'6mxjcYqyKGB2ZNFYebEkBkaNVQ1qTJNKLoKE+LiowRSdIZV8n1oGt6rhp4pB/bVNrhU15MK6/0Ap'
-             b'o8LOoftsLDhADNQDu2hukd6o8i5C4xPhTkil3ileYRRC0pr+GTpwvCdYBUtH0eUINI10qVh0O9u7'
-             b'PFQrNXpyczD0eDgoG2EVuoExulfGy2LEYOQNziTF3XCUKwl47xuJ0esGUFdD2dBCV+BYh0+yTHBd'
-             b'yqAWMcYShsnO8vJSuafi1GjFrVwDEAeLMUX+M7wmkaH+JepftalNnMm1mG2Ol9xovMzEy6ROe9hE'
-             b'MWcc5I0ShQTVLG1U6I9vVOOnRb4XFRUAWob1BAcx2mIzREo3+ErdAtukhj6R9tdEiCDhnLSKtwch'
-             b'ic4x7S3PI6hznxjtRHX3FJQK62IvF8ew2IYPOvgP/eFICwgjPUto1uLSYkdmxfvuVcVhTUY9lIWU'
-             b'sY51pXnX5SGAzzKbpUvsgi2uHR9hmAuzK6445k7mAsAEHiSjjir32AOfftvFM8cPrqysnBIvj98H'
-             b'ds/XauP0Cbd55nlFKr7qnj2UGOPnHn/6y7f8zvt+40e+eP/d37Vz4dSBA6M+fT9A+GSxE4Sc66tK'
-             b'vesbAB5ueWXFXXnNUXfVNde6K6++xh254irXHy1IQE9LCEpGJvnQSzj0Kd8L5V4nlWbWyOfIRdMz'
-             b'Tz9LYhmu5TCv52uvvAIPnJNIFDl8at27iULVQiwdrR92g9WDbI44tpnsUo2FNcT9DooTFNO54/cc'
-             b'XTai9MJ+5SVzBMRC7NuA12fwtg+dCZwktvdk1KpIaYodG1+eiVgOY8oaY6utwVxcFlz+csEya6c8'
-             b'EKmhxzOc/7tf9UqBhPOGjRKLfX3e8wcDLwleJIL++qIIgEmGV+seU8y4wl/r0GsvdBz+gjwd7/0Q'
-             b'rlP+WRfPnXUbF8+y0LFsRDUB1IIidRH0XgbobXE91pwSL7gznvmD6yvuRW99o/v8fQ+6xx57zG1e'
-             b'vOgGtIqPyreTGGPwSD75G7/2V86cOnHwbd/2XT9YV/2dEmWffv8iuM4VnSkfLvHLZzWU5uaylKm5'
-             b'Oe19qxGOWrG1jocu4eNS7acyaxEznorVbNO2OtIUb3/CUDGpr/+ejA3ULGWQHwh2PG7GjrHZa4vn'
-             b'uVdSESF29WbG7Mf0/a1CQ5Kc16X2ucJN9p2HtBIHqSoIEmgR7IAVU0EpElA8UMIVi8LAm8yJ11yj'
-             b'ZVNd1A14oDmWoAFSq2ZC6PJnmroo3WKrFSqjfZMWJJQMSYJd5SU7u1MvBJX5JdXmy3VuaUVZl5no'
-             b'hB1jpLFOKRry94CgV6IDlElvhzXYtpg9Ug5Igp7GJv/u/ieJFhldB75m1Je0OcytAL2ZwY15Rljg'
-             b'Tozmb19RMyss+74GhsB0ZMqiRpK3ZA0SgmTQR08+pxWQ+VDDQ728tFK6UcM5bW37EiXcPYhCShwI'
-             b'DKndOn7tkHwK1cYod/xrnO0bKzs2knZmOeSA7mGdTPloKrYi4uNQVzqGarutLMnnwEx+qnwU89cQ'
-             b'CF/WQl+tsmsNh7KAKdP/Y6MxZnUSe04Z3em4JWnnn5JEJLNz00TP4WDE+0tCl5NQI76/Xp9FHj05'
-             b'plNVKLgytkGQ1QaY1uRXaNgP9oBG0hujFyMV/DFivuHXAUhbrYDKfVQbBKIDV111tXvggQd5QFZq'
-             b'tIR1cOH5J4598nc+9L1v+c6/+HNVtfX7uv3FvIY2z5wUZnrTftW6fSJxtcg27//MPXd88N3/9i8/'
-             b'96WH3hgmF5eWx5VbG9XCkleSZtCCUSy/c2OTr+llxy531153nbvx5lvdkcuvZAQ0J3v5wiDVnEZj'
-             b'XpFF5WgQptYLZwx2FICVmpBtXNhwn/303fR18Pl+3p5f+9jll7tdxNDqOI4y5iADJop9sX/kLn60'
-             b'eoB8AaKCeX8BqtXXvBZmlARF6YJIhPt5X0BuSzPd02YoEGFNMXaBcamTQcco48uaNupALQJhbe5p'
-             b'6OA5CnZ8rkGKTt5c/9Q3hOs98rmBI2ltoVtOkmHhbjrJh7uw+iMzPMgfm0wKfwf3ZLwwZriaIHOp'
-             b'qKrk8GtKXyAT4zl9eOEOpRLjTcO3JKRAyHv3HzlK+eWp55/hdamU65NMyqz7nzejJedLoWr7UWfH'
-             b'HfL+t+Omp15wr3zZS9wrXvFy99G7PuIef/IJp6lKonzwLc+E9YXaPX7Ph7/n/97a6v3ZH/pL3+fr'
-             b'ate1f7BnoE6K98mHKWHJQnxTFofZ2iY9JINBfUoYNMwfMC3CKtoYy1zVjFc5swVCkC/OwmrFCpcp'
-             b'YjjcZrMCtbRKqBOCX5jTguZFNO103N5XpcvmTaiC3jzZapt2woeUZ34lSX9i+xr1oTTzoNTlQDs1'
-             b'j3Am0cLD15YH2M7HlhWoMv2bthBUvDr+WYQmoSAkG7JYaDoGvW76JH21Ys3KeX+tm34QQyAUBzT6'
-             b'0UMNygF2fQpfk6i2u0dmsMlYaAjDrrw7/AZ9U154diXYWAZw2VOvfrw7uNthKSyoZA6HvtcpnnAW'
-             b'5kJ2ZjJTR8drpkdM2VIY3r5O9MGeunpcob4RA10qDPrERqdX3L2cWkaLN4GpUKRko6LAu0LOxK45'
-             b'4SGzoLNJ3wVxaBWwtbnJoqPqSSIh1BC47nD4sx/YxrmuH5bBa+uM3OXoph6KWQd8JPK9pPFqlA0e'
-             b'4SyU9Wk8MJMbeYqJ9XCrXR8KxqC205Y/0RAxUAvqSv0QNE0T17VRJIukwNArmQx4jaR8jIJYhFSU'
-             b'N/J3kRtj8AM9aGU92+gDrzlAEUAbbdmYUzH3lCCvqo8itydjASefZ3PjgtvZ2hCCV4xmx1ZMQU3u'
-             b'xQIyF0Uw88K9LcZNc3asUmQ7d/DQQXf48CH37NPPlRkt1tP+paG7+0Pv/gt3vu07fmkw7O/8+zwB'
-             b'cO2mG+cIV4OM+dXz5kdGRAWo/9BvvuPX/vtPvP83fniYZoPlxXEuEmseUjNwKjS2muQ2FvYySrzu'
-             b'ppvd9Tfd6m689Xa3urpGJzkw8ietmlOHLn0ituKSyn0Qaxp7RCMe8dZ9yzoUgutDX3jIXby4yYJx'
-             b'KT+7B/bvY7EhB5ZGlxdlh5pAQa2yuJLbWXSxDcdMMqbEvjalBwD9AqY70jYxjjy/L6SgSsukZD6R'
-             b'HEYlwll4mtMmKWhyIX1egAArfE+HSo7mkF3gZRygn6uzntcRraInPOCZMCp/Rmv1RjwEaLNrvjVo'
-             b'FJAfAGdNHtgNv67S9FNr1gylMC8Nyb3QUIy5YkbZ4IpmdxS7aB43uJYLy27/Zcfc6ee+zDMiskFQ'
-             b'5kUJ+9TMGA1fktdvpVnxofCHxAuhdRfPnXH7Dl/mvunNb3SXP/ZYLvLuyff5LOXGPC/RGOU9cDHv'
-             b'8c89dPefesev9OKP/dRPf1++3pM/iI9GOHDocBLPf9dh19oRywdFNyn63yp1coyklXfx3Nfs8+oS'
-             b'P9rQOcjpwg6hUvtR6YqwSdbQxef3AKIGOx6tCAnwprarLOeiU+OcB3ph3sP9L4lnQK02r+C30gyo'
-             b'6nTNrHkI9cQu/lHjKiuGWnhNrqolHhUFBOnMjfhoY34VnW7GqVy3ND+v9GoLrFGV7OJbieGMOhqx'
-             b'uRo3bY0whoEEw34QZ5l/ppFM6IMQ53PkYzdD0k5wMpGQHAv98aGz5SwbLx/GUFQbfJX8PYOeyonK'
-             b'oizaLyFYplD8/E2S1yorVuXyvJboQHbUscrIfUkh8KRjI45hGrBuZxIqptbB0WRfIL8M6qJCQJFD'
-             b'Yw6+hy7ZCwfo4vLCnLugZM5P6FngNehkrCMD3xWpeihFXVNgv8/QE41X3XjtsvzrkKuGi/kB7hVf'
-             b'cypKbE6eZN4I6K9P2H8qm5L6QlQaPlSkoPqzLLoXrynwvvA0oiFiqUNjwDOwYlAc38zUKbg0N/d3'
-             b'6rduIUCWCFkHMeSpNH0TG6EvkitP4h/+zpOAGktRypFDPuCnexJDDZibOR359SZwIGQTEFX25Iu6'
-             b'xrJUg5pLkeTG0KfOgGhueKTuh4mqoWO5C54qrOzVDXSY79GpJx+97XOf/Mh35DZV8NLf61d+ryee'
-             b'fsLtbl3U+fRX4eDHM5PXUd4BRp/68Pt/4B/+9F/9xKfe+44fXxu6werikHtU5J4mfhtcU/k52MrF'
-             b'Ju7N1ddd7/7U9/559z0/8GPujje9zS3vP5Q37j677lI4YZ9oBYUiD8ZJc0RFhzZjlTer7lDmEGhy'
-             b'QCzcyId/xT2jcVddc2UurA7JPU8mCRUpMg+9IDvVaO0gPSqa3GSB0If9jWuCEPMsN1w7LuDPoGog'
-             b'wuTdEG6ZCpcLh8sCwrwibrEQgdms0FWw4f5F7pImPVYCqRKtlLFsO7dN+XJYJm/rJSnXR64J1GMg'
-             b'HXLshuvVqnshIbZGDHm0CxZfC1dI090/kUXwZDbTPTrqYS1oBhG/GItskPt3bNX0J3ax3bpnoqgf'
-             b'Ly3na7pQxrqtRm+7gkRWvGZJY+0teMj8zYKpsPR43dvddqdeOM73dvNtt7k3vvVtbv/+y+hmaoWM'
-             b'yN2jG9fJPfrpu777l//hz/5jbHq+kNL/PWv70NGjcUp7x1jIP3LOVjLnC6X5KJ2oVX3qsdglz5mP'
-             b'fvHCD4RHSVrRDqtpmmKuw+rMMd20CAoA29ihjoOX3uSaUGgWjF1KmSvV1bzkzkiHMXbxsK1esKid'
-             b'S8lhN1corV6JFBRjHp1RtUaQkC6roRRFzSZMeZA6Ua38CJHVJS12MJpgiI9yCfA6VejrxRUbYK8x'
-             b'ynRKxIOBII5WvQSCSbNaohI244Frm/EORBLkNR3Qcwa/lQ9jC2KSaM5aOu4gXRqgdpHyec39Lk4B'
-             b'XOSb21v5IZnodUb6oKfHPvIbyMJvzZCpM8So1LVQ/DIB6daE36AzhtOfcBiiBttowl8+5OEjUCrv'
-             b'1A1bYT6EbtvTyTHIsz5LZf5fjhaFDDlKUqtRVvyWF6HFj4X5bObrs5OLrMXVA27pwDE3XAULeiwR'
-             b'x61GXDvTDAupKdSVdl8t1yd+IORP9vNQNNKoidegJdRZiDjed5u35rDLmhN5nfE5KPHEPFZ5LEbs'
-             b'S9qFOk2LLNPRqMzoQpqC9FHIsyBN0VUYCWlO4q8ZfsVNuVUWdKWM6rYUMUA1hNPhWaDjGuyBYMcZ'
-             b'aJQRX9V5vpvJkuwVKjMNkpxpz0Yybk3qJrvgDF35omvcyuoq15N5RuBrgAJ85Df+9Y/Pts8OgaBJ'
-             b'/sfcLwzS8yH1/OOPfJVsfj1n4fltD+/+7Q/86b//03/94+/5lX/8T9OFky/av7SgXeuc3FcjpiEl'
-             b'A1P/9pe+yn3fD/6Y+6Ef+0n30le/3vVyh7i9M80HaxSyW6szcR3xcW9IiiRpcp/52BNp1GaCCCaK'
-             b'LRSl+TnEc769s82DDsvjyNGjQvIrBk9qXa7yPypO8nrB4S+pexOZ/U8FRgdKi9cGagYyNZ4FcltY'
-             b'XO8Wg7OperE4lXZaoWtW8PMS6HmnX+yHTYzFDtu4AGTft+0lc38Sr2d7mpsiBOykDRyK3NlkpiZy'
-             b'FQmsxg8SqWo3kpP9tZPIGQ8Ka47op0pssSdO9iZC3JxNy7gVEcOzxtISlcxnIW963jgdba6uH2Bx'
-             b'xAIkqj05imBVnkXf+e0kb1Nyr2ZnhpCmQlKc5vezt7XDz3ro8GH3plwEIHF3pmRQNEKQJWJ8t5Sv'
-             b'wyfe+67/+tf/+S/93dGgN1f0/96/6qeefHIyIEt4VtzQ7DAps2YvDO6o6XxeISQGsdjmj8MLTP0k'
-             b'dqZB/dKdBeaQwCY3DlsV4Kn+eOhaRLvy0GcqhvpE60YAXb2XBELZ7E0WJ5sqdetOjHWwMcIDIFG5'
-             b'MC2bF7GMVsN01JpWo/8K+9Snrj9h58ZDw7zDm+IQJRIUkUUG81vVcUgxPdLDFv9Oj39WdRUhWbwv'
-             b'6fpEkx1o5SHVMOdh7IK7Qsawb+ERNMWUIsU5rd9cjGaPB59aZERxP6wUHjZo3jYpT7K9msFYlJsX'
-             b'uL5WFETsgEflAeXhYQYKqvVParph2QB4zDBDFuJdVB6JGsIgpjT/Q8MjxPz2JdWQ/4343sVR2Xr3'
-             b'NCiqP+yXjrdkknsJaJJo5agaaiHF1EoMinPhQBaX64o1RaJUaf3gUUZTh96IdrwqhlVnQO0I1FAH'
-             b'96zBfVcVjKd3hY5mptMyi29TW9LFbEOQWWfN7qEhk7rm3BMPLRAw3Lc2dtG8lHUGdVcLYe4hxrWe'
-             b'CaFVmdHsv0NXCLNDASkU/A0tgOzeVWrggn/vj0SWRi6BEwtWGDtho2MXyIyEKChVfs0zx5/Pm/+W'
-             b'qxUBEq5BO/ee1SzMmyV37oC3NtzCynpR1iTjZ9jvKObye1jft+6uve5q98D9D3RoEZ8T5048/sDL'
-             b'P/PJu77nG97wJ/65m+1ccjzjdTfOnFJY138Fj3340eQCKL/tT7z/fd/2sQ+95398/olHvn4t71fL'
-             b'Q42NxviEcjTPzhafF0XbYi5kbrzlNvfq17zOHbniRZzd41DB4cngI99xzLDHVLFz4qHB2XRXrrEl'
-             b'ZXKFi7SaawTESj0kE62nvdvYuKANhTDs+2VklFzbhbOUZg0rqb+wIu8NUj4oC/Iha2ZTTj0fZvng'
-             b'AUEUP1dczkMx4fF1EH7H7p75/82lS4pCjMz7tukiysmfELIxiopWDdewL7SUFMZCLo+p29tAVAXa'
-             b'1npB/fC84DD26iPA9NNWx24cpcq+5qlemLnOBLjg8OW1ITu1gsXs6+ya9XXkKOmqM17rXs/Ix/o8'
-             b'Bt8hAcKQd+PFZbd64JA7ffwZrHC1utYdTEfo5rxozVoKvqDu1kgGFQxAnr+3s+EWl5dZDKysrLhv'
-             b'/5Pf4d77m7/pjj/3ghJuvYwX8/esLw7cR9796z9x4y23fvTWl7zi3bs7/9+OmvVoONy70LYdYUof'
-             b'pM3NTZcu219mORZpKzm5yrLu9A1i4tTrla7aqvi+San0gcZ/c76d/wNRwLiZWHiAJElqCmIhGXSW'
-             b'6qNsRlKMtJ1TnVaz2A0rjdI1ravM+NtOh6m3vNIYSHM3M1tXdmbJnG1qCTMBQQsz61YqzEpTr+jS'
-             b'VWnBEKNCOk6gqWDmdFa/VsUnGjBaNI9thZPqfsVUQY4S8JnZWQfO+gnTk6CKihNzt5me0RUPR5L6'
-             b'jDRn/kxKIoFtL3O7+3U3RyMclRfS7oSue87bOMCYqZbeJYzhysvBgShgOeQ9c7DB+u9VvjCQxZtD'
-             b'UB7wB+JcZ7u3I0FAMCIS7kVNp8JCJozqrQACKbppXYOSGSUEx9JeqSc3vejxd+Y4ae9bXSqNBClh'
-             b'TZ2yAS+6QankQr7uYzdcXKPVaTIHhdZ0n7J+xJdBvSaQ1qikP3RF6JQhLYU8B05nwTT/SYoDEZIk'
-             b'zhILIVU1/wY9uqpSYyntxp3TcY7TWWnNYiKp5JVmRyQ4aRCXKg1EKULygghGgqwRGKqgADTEwFAa'
-             b'2v9ihNV2bGesTTxLU3JxeizKqp4QYcGuhhxx+/wZmIZoiIuyp2OaMwKLnZ+GxsLSGMq6Od9Jny6J'
-             b'a+XIYeBuvfVW98VHHmZBQNJkJeOTUT6F3/G///zfuv7mF//2/iNHn3aWCZ//fuvcaXfmhReEbPkV'
-             b'IvmBi1QPh+6xLzzwmnf+q3/5Nx/93N1vXhlW/tDymNcc5lNJURp26/nP4OaGmf5tN9/mXvVfvdFd'
-             b'c/2NvKfgh+yBiOakm+e105GCxdZSE6gR5gwCw2y3lXGKLDp5nprUKDqjjU3TkBDnQuuezcUZUYd8'
-             b'v2H8s7i8ygOWjVpqde7flq4apOD1w6vkz4Q6dAZsEZyabTLtW00jxXzZ6bqUvBIpXjmymLZqx+uL'
-             b'lwxZ+dOJElZrIfnxkEslbVUaGKWFUj2lyhZ9/sr+AA4Fx6GBn5/cqMm0RNdjCeNnwG63ZlT6REZz'
-             b'GE16QU+qap7oZ26uSQxUXacqMxMd2ounrqmynny8MNQtKBUSM5xEB8xE8HMpcIH3YmVtn9s8f5YH'
-             b'N0yFkqUTRssvcFQB2feG5IsHKZGJqAWC+vHgrEShhxHD7mSHbqjf8va3u/f/1vvck088xWeARUSU'
-             b'1NRRaKp3/PIv/eyV195w/3hx5Zlm9nvHa4el5eWLKXYaYvvVauRomTb7VBjiFvNo1qQGue/bd5Cb'
-             b'js1xZPcNXXetoTKYp6KSIdPUPK+pjxRziUojRpPNhNukD4m62EWx65VDtdXOI3BRkv/BTr+W7HKL'
-             b'N8UsFelkXMRhDtpV/2v9c5tL8QA2whU7eOmWCKeh+0ORYPGSqS2boi0YyBHlUBEbTRLA2qbosQe5'
-             b'siY7FiQ/J9dJfPynxRXNYEDRiwQds7QMTUF+Ou4JOnY8yGKKpFVd7YvG3vKtWX17XwiBBjDEdKmj'
-             b'HMN9LCTJErt00SN5rg51KSjsNWpK+oYulapdrukYueajwZzmNrrt7V1NipSucScXJCmk8nm9dnY4'
-             b'AHEYOSWnMmsbm79uEBK6IdcdMqhe0PjoBPlVl0KX9HNhi1lc2edGK4fdeP2yvMkvSxiKZdyUDtXz'
-             b'8Cx5Flbo6kMrs8pUooSdckeIHLFLm7GAdeq9YIWBsYidzRIb5X94eQ0SAuNMO6Uo9qptLBba5hLn'
-             b'SxiM5LRb9y3SQiESEl62tEtn96+StEmEB0GT3QoSx66TfIBa1BWt8AawieFaYBSwtXHRTfPBIN1j'
-             b'7H43q1QNDysdEU2XNHHTmQGNhQIpyS0KhyEodwXxwF93w/XkvcQoscUotPCqcevssX/9T3/h78ic'
-             b'UHXc4BLNpn9gw5Pfr+UH5A174ie/9NjLfuHv/u13/b3/4b+768v3feIta0Pva3qQTHlfjeCMazuD'
-             b'L0m+bl//im9w3/9jP+m+68//sLvyRV+XN2gkLE5V+huKyU3UICyiV6151c/Y/SZVs3DMRL2s7Guu'
-             b'FU5JZQ2B2YsHaTrIDSKa2OZutuduvu1WIcMFTdXEtao67g6u7RjBXULtz8+UoK+NNhVB5rRcG1zf'
-             b'ee0N4RvRypzd4nxppjezRkieR4mCz8Urwq28SGJbTbybMbQq6XNCbQBfP6jbmowozTfD66gvcpSC'
-             b'IomIdBkPRCpLe0hmTUIYxDgZZFk1FZZGIVSqbNAGNqg3Sf4NAVEYf5bkNX2PM+UDFIM8k7jG+RG5'
-             b'L94jPlnqoDanGvXOmTwiwaPv4H5DdJUI7pMvzbM5oyaX5oopV8YqGBVt5wKAGRt4fmH0lIvV17/+'
-             b'Dnfl1VcQEYGrKFC7aSOo+cmnv3Td//GPfu7n894rfl6aWzP/q/r2N7/u2ucff+Rb+5Wwkdmh5g+w'
-             b'vrriDh3Y17FQk1O3r1Rg1fLOUSmCYDUeU7ZnX1lyuF2nxa76YMwO+cCxKmmdZgRIt0KZlcGLqWNb'
-             b'+hIZSWNVzmc8pU61zkkdq+hQYmW1etJuldHAVVVc2HgYzy+34NVIplYYqi3OgHYyGXM9mmugjgDS'
-             b'HMXJ+qFQpTnCmmjEbU4tvICmZBlgloaKjjbFGvZB4hkWOGSRlm9tITtzTlOofO217Xag+7duM2qX'
-             b'XSCfui52v1RmwIxD4bNk/gLYlDGaiQK5Gd7TWdhKgM8e0gBZUMSCKEB2BEQApMKgg0d4AgAGtQhe'
-             b'fC4L/EHMKRP81NMB5BZ0TnT9m0OXTFUQ5iBUdDJOGerm4e81Y5sIEtIFkUnQG7neeNWNlvdz7hll'
-             b'eyuMW+tg+PC2ZgccpENXRYL5QVS+Ui8HRRx0UyAMrd1QreMzuv/ZdTNiINZsEH0/SWtOTJGirj2O'
-             b'esotToW/IO+l6kiavmBw6kFu76PHzahSYyxCsGoixfUfTeYqZi7sIr3mBuTXEPlhZwDW7Oy608e/'
-             b'nL922tmAWxS02YOjowpdYJV5LiwsL5M/0PEEwpzHui+MavN9wCjgicef4ky7eFKkyo3zWnjqiSdu'
-             b'P3zFtZ8/cvX1j822N91086Kb7GxznYLnsLK8wnVDzw2sv1xg7+S/h2UueEiCCkbyNXCPR3mf8lBv'
-             b'6OH8wnNPf9173vWOv/2uX/0n/+D004/ctpgvRF/XVTCibZDgnKkijy9/zevc27/zz7jX3vlmt7rv'
-             b'MNn/sI+NWgyaSkJIfZa90C1qFlJNo7wPlVTyUGjnrLZSZ2tMZ0ax+GTQVV43p1943j10/718do8e'
-             b'ucwdu+LKUvQad2o+7RWcAZ+L31QP2PBUyqSvRYPJgg9dNwoTKTpEeWImOa5tuiNKvUtMHiX8JkGO'
-             b'pKmIHTqTko5q7K1FS3brTMNCRwKkm59GBwtPIhJhjjr3RqFo/LTKwGhTrVmeiB7iVoCZY5/Zlodq'
-             b'HsWWTBoW9lVQJEPshW2MxsK0kbWEr8Dep8LXuZ2/C1JHQQlPham6EBqAE5QvE3ScmdTRs4teLnew'
-             b'S1ZFI4EGMb+nMULbvDQjMOq66qor3HPPPefOn9/keLHR4Lxhfn/PfvnJG/dddvmzl1999b0otFuN'
-             b'fbZf9fLKym7yXRJSyWCr1GrSC0shJPOIT0XO5gqqJ2+3Z65zGoCT3KVkuyLRUktHr/AXfw5gR1x8'
-             b'+/5gsqcumc5bYJHG/QrzcqbpWT15+GFBqfNWmbPX+tAQNNILJLapwaRV8+E+ThGF4FW2lOYypoUJ'
-             b'a2ErIlfxl/gwGxOWs99W/N0DrU/lfVn37RRSxvsHkxebnsn+GL/Ayl61tUHgaULqvVrcr+bzFhTG'
-             b'IrkGmx/0905+PsN+4HCnxQPn+L4ubN2YuiUbtXPEAoc+XvYvC4dKhTzHQgJkulFfD9HQWQBXCNfp'
-             b'lq7vtKC85oO+BfaIr8R43Fe7XPk6SJD6/XFB/b1erH6/1xmL6EML2+KgToXRmPnRlAaO+dvD8Yob'
-             b'LObDf+WASNyijCIsznn+4bUiiyUmHnRem7ogOcW/wIo5jQUTVnDnLNaoOx7WdND5NMmS2DjMDKWQ'
-             b'5b16CwixkMVBSBr9rBwCP8dgTh1QmOZsjIvEDwhSHUjogqLGV9otg7A5aSjTRbdHBvdc/jueJxRu'
-             b'LZ7hIHNXbHDnL5x2e9sbHPuQd2DGx7oulOwjBXolXCEcmw2kiHxma7EStw/s5r1EJEHQ62htZWXd'
-             b'7T94wJ05e4620lJcCLq3b7Hn3vuv/8XP3PLil3x0Np1dvHDqeXHV/A8AAOgXMl7AITJ47MF7X/fh'
-             b'9/zbH37kvnve3GyfX9iX16PD3BtE3yj7oNRXXq5Pvv7X33yT+8ZvfrO74abbXTUYMURmd3dHuCFJ'
-             b'CFli4CMFn8H5prwpBDKON2u9DlH4HeoboAEnbqYIl3F0iEA0Ki+FlwRm48qZwDOC4nPWzuWDlIQ+'
-             b'QVlh+wtpH8abXEnYJxs7xBI7dnK/8VmwFvO+NcXhq1Ju2y+sQzbfDq/SbNzvUDXysxopMr3anQs6'
-             b'lZ8JHOR07hP3QjdH5jUJL5VQ4EQhvY82xz3yU7wmnvYwSgZfiSqIPZEktzOVawZN/FOOTrFNL5WC'
-             b'UjB8VzjwwBw685XDM9Aqn6bnO3WcjK/rwu9JDC3bYWBYyQcwAzuYbOUiYDMXq0FlftXcWUgdXLJI'
-             b'ejXKsuJqfpKe1BE2r4d2uqsbh5ylk529XCAP3evvuMP9m3e+W6zKg9iXo2Faza/37n/1Kz9zy+0v'
-             b'/a1cLBz/3aZaYdgftE7DUJIaJJD1OJt1yWnzkTPc5Ez/rbKkwu0JnZzIp067PKdH9NopcTZlsrmU'
-             b'Oog8SAfRKuTS+cl33bMrEmTponiwKuuUs+GgpkBVv5NgqbERO++gdrJKiEuWDe18sXQUMt6cTIev'
-             b'0xbJoeKb5X5b92dsePAS2NmqSxs9CHBAq4zMKdPb173SmRu7VTSpgdpVyRxQCWXVFR88VDiWSF0c'
-             b'sBIM7TDDe2XEbzGnBtt+l5WuWRhz5tUT1j4qXpExqUGvRoBG6u1nOveXDl3IK1Uxemp1UYJ3gAck'
-             b'KXkUIxhoVoVs08HyFlfROSq6OQRFbYaRYjiZ6IbTab7hTGjpilET65JKr6KulyY/wYOVQ27lwDE3'
-             b'WtwnxhltW2RRJh6wEZZpmWnuA2Z/kBFPpySpZJPk/a8Kq9lpdKjTMCvxda/lslTmOila354iUE4d'
-             b'NC0l0psUUBzWVVqZqCHneEQLaaI5yVQaUa1dg9owT7g5BVpXg7sxVPbypMRf92Hw08xK1DSLEpLY'
-             b'AgtnIZG2yrPwbuv8KXfiuSdIJO3MTDU+1YxRWlWdaN4EkYAgB4Ecomq4FX3H1NfPMj9jdVow33TT'
-             b'jWIfHL06iwrsjpCg888+9tJf/Hv/88/mgtb3+oM/5HQ/8Vmrcuefr9Pix973m3/xb/34D9z9iz/z'
-             b'Ex947O4P/cmFtLOwvgSTmUSKDw2d1SQDB/yFzS03WFhy3/E9f8H90I//DXfDrS/N53cvr8UdN90T'
-             b'r5KknS9g/LZpSnh6V2DqWM8lTYeTA4YOegZVpzkuBdYh942ZFFhJ9tWOVAefi42S1MixogbXpMJU'
-             b'd3OSbM9rMFxYkfGK+u2HulbZXCOf2QkiNNvdE/kh0Aa6taoSIbUdKgslhmsV5VFvAvr8J6oS/Jw6'
-             b'xzst0puJSCc5EvX6flvZe3VESrk4x6Myvp1NhNjNkSMIudNGFFn5Wvc5TpVmK6nfhoiQYjGZw1+A'
-             b'7b+9MynGZPbcmxLA6dfy71sxSsMYUxOJ+J7oXlr2D3kdBDaBV+PVglsUB0IiX1nfJ4ZqesZ6HVOL'
-             b'bkcVM86yNOZSeZULZbk0TqPhocLg2Ec5WPgH7/3Y5UfcTTdeJ/keRmqE30suSnbOPH/sYx96748u'
-             b'LK9wzIcRfPm1vm/fRNj8rpPsuETbRPNpb33bwRHlLO8YocZyDCpl8+ZoFDWcROfzljDnDObWPMeY'
-             b'7IySjb43HIjLVNvaZelYlPoeQ22VuYKgvCg9qTi9mVGkIlMxE4mgtr6iw1aqnu/0qxbBKcZBQfAl'
-             b'joDF8Y4FxDyqoR1wTLFAt9i4ZHZX5YNzS2RpyUxeglRymJWBxKekpi7pbiAaz6hdQQksEm96K3xw'
-             b'LXb3dsjEr5IYyQABEbGEQl/gEhDunZXuYwG2usnuUScvw2cZgrCZNI4YlXb+rDv5gVlaWmBWuyEd'
-             b'oixIBXbHCAGEmMWFUWeegQx6kMpCdakKPM3bNs8k7QrqA2yITk2LtLr1SljrHLRkljkc9QVONV8B'
-             b'tajezIUBGLK4/MNlzPsPMaRE7GvVs97GSyxWK72WrRDfvPg/tPYe0QG1TXGwI3KghKI4M+KemDaZ'
-             b'nA+fm51/CAXyN0Z3ozbQVIioHaoRDs0SGBshA6sgkfWp+KvbCMwKSsursOeCipNWrhk/r874+jT8'
-             b'gZ+7FKEcYVCp4ySjPkpXWyt0nrz8e8zP34lnnnRxssONwmxQjVhrsrdgz2ClYzbwZTSwxWBjRt5q'
-             b'9oFTw5VgIwRz5WRjO8sb2VF32223uHvvfZB2xXjNhumXDSVOn/ngv/v+XxpU4zvf9Na/efDw0acG'
-             b'Lebt213he2k0IA83KB5wnZ958vGbnvzwB777gU9/7M+ce/7J6xb6wa2PcT17UtigoGpFrMSAslZm'
-             b'+WsHD7o3vOZ17lWveb3bd/AwPQumu9PiO8B1hbS83EFOqf1PmqjqCkPc0EqDf8muR5PF0Y7r7K9j'
-             b'Z+1snvQc62APxsHbCvwv5jMzN93eEu+J/F72HzzEpFXXtMXntBhnmTEY9j2sPXAa6GDZmaNxjyca'
-             b'1WPh6WYzJe0JJ6UUMrHT7KOIpJU7n18pJrF/VZpk16hpUEckd3OJmCJ7pkzOF/YQiyM4xtZhIAhA'
-             b'QY91vyE0Y9kRkeiqU2WBSZ3pNqtZCezqg8aBK4mV/Cs6C/ZK5oBTOXhkSmtdOCuV7zhTvnOfyt32'
-             b'hMFA0t1bTLqta0k0BAoHVVSTi0TISgqCPD/rLwfmvN9kKkZ3c7eRn/eFZ7/sDhw9Jlkgio6jsfyG'
-             b'V77cvfDCaXf8+Mm85gdEvOHdg+fmkx989w+96vXf/MuHLzv6RDObdSPhlfX9e1EXB+cf+msyUytQ'
-             b'EJ5SpTCe6yBvPf+9JiCJUUSH7rFrCWIgQ1hfnbHiLKrtb7/c3Bpwsxo5kFU+2VVCX/dIW4fLOSkZ'
-             b'oNOS+1zDrU110ZxvtpLkVBNNiOxGYupiRXj4qzQp2kGmdrzcIGPURCjpeCuVytnDG802V6veaImD'
-             b'Gv9Y29wWM0c4AVpqHzWtEzmY9cFiJrzmqHGTaFqVUolxkJFj3RxH1P57ESE3Fh1sqXvepDjmZhXV'
-             b'GVEOpdqJhjg56Q5x3xA+FMtMPKnUTzS1i0v1fA9TZDvR+PNJukXMoizG17oe2rvSUU7eDu7L9tau'
-             b'W1gccaNAZ4XzHrC/GYMY1E2cCQWlWnlHnWfjwTSEIbnYZXHn/1taWGCWOVj+g9GqFM1uWgqVjvFb'
-             b'lUhRMY5SAhEMUpqJjpfk4Wz1oJMNd1Kyb+k+acxm7Q7sfUsnYZG7rmj5BfiVFLhWA3WkCKh0Pcbu'
-             b'84cu2bJQM3wo0tpuTZlsSj5PM5M5Lq8Z4EKMXXrD/DzvUc1QI1jEicKA/g7waQhCDhS774q9ywvH'
-             b'v+x2N87lDqKSsYULhV5Fz3U/79UQRP0S9Npw3i0IGxG/pikR0ubtagFb9lxbkBZ0Ay/OBcCDDz3M'
-             b'AhRPNVUmINTla3HlwSX3yMff92eefPCzbxqvH7r3Rdfd+PH1A+ufWugPHu0Nhs/lw75ldsOACEjv'
-             b'zMmT19z/uc/d+dQXH3r7C49/4XX5xFxYGNXuwELN550HhQFkUhdSBgZyKjqm177m5e6Nb/92t//Q'
-             b'Ebebu33wXpKOCKPBf9q1yaxX+RkWvuTaUsSxEWil02xTq3LhIAWAebyX5M2Ka8i4MUyb0yjapCMJ'
-             b'POvnz59l8RMLSmrVlaFmsRuhkgtSS2GEEUtuDEJx8VPjrSQGZZBUR6/cCSXmBi/oj6y1hqhaVQ3E'
-             b'0r2QPsUh0wix2CuqQoit1WBHIfmSENrqdMiKG2nAUEhjrEE3VB2jmCssWe+t8pxaiVVvJpIeOGtm'
-             b'+qR1ML+RAuuBIVdJXDzrWgnHdSH77ebDerG3aLfVbedmeITch+CL+lpsiFtJ00nFQLcc2Db2QnMM'
-             b'XtzOxkVlHik5uyR2uhJURncYRQgNCY2pM1QzXwMJdErFvt7Gv+PcwL0ur9f3vO/Dbm8mZniGppw7'
-             b'feLAe/+fd/43P/Df/sRPtFrMaRyw2/GsJBo9LLsgFImb9MUkwZesed/NAL3mTM9L7uYOI7jCQVZS'
-             b'KTSpyCiNbgKLADEkmXfSs70lzcsMFa4HY5bwft2XLsfNhPynroVRbWNNRkc2aRJ2K6kdOPyddOC0'
-             b'6wyVytywf/VEkOJbktPMNjKaWiAZTDeveVXnRK12cX161ZA2qIKnyYYY9WEQSE0IJv1cuICIJBCg'
-             b'oBLsQGl00ircp4dKfi1A34FM/n6piiUha8aFOx4NS40KbXwNzX2QQwrZ2GM4VPlufiwyLd/N252Q'
-             b'8LDxIoBHCeqFHDgjSVHITEkLj8pIQBZhmz9L3+I1oTWf6/TwuSGnCep2Nh4PCoVBZICBPwu8BRyd'
-             b'Q031E91wZCzwUq/XjZLVyAOjEUwuBgsrbrSwlouGgeEFXeKhE3JQMDOQlAr3A5vdTOV81OgbwuWl'
-             b'gkdnCshUvPOZrSsjLuWpeIUxvQUFKXZsHgkMTYmSj4CNZ4YupRZ0gWMSJRwakY/Ficqo8DUl06dY'
-             b'5aZOwqrumuhc+f5IREMO+pidBxQNQUI/tHPS4rBRxrciYSiWW1WYHH/qi+78yeddL7QadS0eHV5h'
-             b'aSp3fFIWc1Q/jKgqKPU9d6ELIrMxS7RZ55zXujOCZMPPh3yMfevr7vbbbnOfuedzboTEuUa82sX3'
-             b'vmWaaHPx5PqpU89/0wsPf/6bsN2/e7S4c+joFQ/c8tKXfSD/tL2nH3/8ladPHb9hd+PClZOti6Nh'
-             b'HdzCoOYBP91tDNV1FN0rYQ51/e72hLHkX/8Nr3Zv+ZZvcwePHM3PzsxdvLAhHvTGd0ERhOeQ7P6J'
-             b'6EyUIOdVFYGDiN0jwn8UMSyaKCWVcm9QxRUPY8WlVTynihlpRJJJ+7RwiErkImejJ8Y97nclwScN'
-             b'YDLOEMOI2lmZuVGpgOdv1JfxpO51jcoX45zVuR1LUZEqRlVjP2PXLpbEdBMMMu7E64D4O0MhQ0WD'
-             b'QewynkjqF+B1Bs4AH9h2q+0vJI6NmiJ5LZSmezs0IcO1RTEbVSnT5EPa3IeD2dz4ODcC8XwGKQXH'
-             b'WCE3HQu9hYIQWFAfirSlxcWOZW1OfsYQa2WsADTBbNPlzPLF9px2x4WE7d3avoNud/MiPR5KI2BO'
-             b'mnFOAaWR40ZNL34wxhcyDl6+togjXt13iMWanLUV19+LrrnK3XDDte7+Bx66xDFyeTRwn/noh773'
-             b'2//89//c/kOXPZM01Kv++F0fOD8ajmZ+stmbn8l5nY8Gm9GXmdI8sUSTy9NcNK3rfMlJ3gI5oiQt'
-             b'dSQcQkaEh4Xd2Hkz+W7GRdKKdsroJlFZ1sqWRRUdhaUtD1NUHbaThdSri1zLKbGEG38rD5A3Rqpp'
-             b'6DWj3BjZgYzsWZmRRiP8RZNudJ8XN5UPO1GCHr+2pU63x84LqgeSdlxn40qyF7W/4hbHsVo51EOX'
-             b'9meW79HuTJgzypNOClVyd6xLZ4iFWI2qEui0AHXG7yrSSqdiZjWqFijdbJCVaiMPeAgwPEdZsru7'
-             b'U872a5W0UBqFAqDul1R7e/4sMrkqHvY22pDPDd5SUHngQFPQnPnLJLX9XVro2P7YDKYtMyUGw0W3'
-             b'sLiSD7yFfK3HsmkpFGEcEYyUvI16+MCp7WqS9xlgGe37xeOC3RgQKmVc46Aw3Tq89r1unlSURDPI'
-             b'CuX5YaBTEG5FVJWJWWzXGiYU1RyLm30V1CCxteGfFuFBbatF5cIuKs0NxbDWZpEzfzkgah7iKEbx'
-             b'vKDIZIQqij2V/+GwhflXE2VEg/k/ij4UZOdOPO/OnngGGAHnmK0SaIOZ/qg5aKd7dgWynktdkqLF'
-             b'+27MlEqpWXZb4xPgYDCvD5EgN+4VL3uZe+rJp92FcxdF5aLFj2psiKKM+rVYiuc112xfGD/38OlX'
-             b'Pfvw519FkypuwoIusRzMC2xntzEbdrHRRTiZhtVMJo2b5rf3stfc6b7pTW9zhy47RtRhZ2dXdewy'
-             b'HurlgoQxtrB/ns30PVflWnjXJYNW6jpJ7lAUJMB8GQQBEs+IpARc/q6x5WLQ5KjKmCo7nc5/3ool'
-             b'KRzamczS1y47mA+EfW5ve2duz0tlzxFESURqILshbIbKI4TgNHqAdi7msh+3c5yn0vmKuVeoeopQ'
-             b'NZq8V+lISFIqsd5g8IYMDaCgjDHQ8WnpfG29IP0QBycj4PdkP2d2hyuFJW2Op1N5rVb9EmKjz5QX'
-             b'JUq6dNPsEiY9mwfsX8vLC/Pceg0c8h1fwhqu1P39EPHfSqIWdEHUZ0beY/wwFW5yf4IPl3D4UUJN'
-             b'OBYREjD2JnqaeuHUze/bXq1xk+8UQC51zoiypebXy431bDGvwRDKCKlV3tQN11/LZMit7S1+LPBa'
-             b'wD/aO3vmwKc/ctd3vO1P/4Wf90lHz9df93Wnqqq/QbJSsirR03ZwoqYLXmVwKcwJ51QNEAvFJJVi'
-             b'wWxtcSOY1FYLhCpKE1m0uBiVRYp6MUVwmswntojKuNfRBGBZogWpi6LtpEKxmO+Qra7zGwmKMBti'
-             b'nfEFX0hHJRyDSiaBtpOOM0qCmkH+pqct+kydwSpRUSIma/Wf1m4P8j9fKRtWKumezlq9zX5VfuOL'
-             b'i5tohFnZ+nl7YRj/DER64s1oRl0ILeDQFpOHfe64zIsLmdFL/O2eEutKDHKSja5lxV5z85yP/E3q'
-             b'hb20uKAMWPk5iwtDkQpFmeHiPnEsEVQCBDOg/LNoN5zEsZGa4HZO4pl8cbszSSW5DDiS1cHRIFqj'
-             b'33kzP8rvZbi87pYPXOEGi/tdnQsB2Of6IoOU7qAl6TGVe+UULud9MKlWeciEpe913CQzc1VlGCSv'
-             b'/zB/fKbIjhNpk9dimYUkP08o9soyTlJNtuEMXpQTodha+858K8rmB3QJG64QQ6Nmb3A7IWqFTn86'
-             b'2ytxplG1yC19E4T1PeNcdcDXrdUHA+ZCIBVhzY4Wxu7c6ePuhacfc5VrlJmvzOniny7Xnv9Wcs5D'
-             b'iXwtm4SN1FK6hNQpamTtzsw6uARk1baDaJec3MrSYmGZW9J08HMETEo+K7eU19zq4tjtW112B9eW'
-             b'3eH1Zbe+MnTLeX1SJos5bV11Uj4wpMHUr5Lbney5af4RN3/9K92P/OTfdN/1fT/AQJftvPeZ6c//'
-             b'y9W7NltyXFdiO7PqPO65j36hG+hGAyAIiiAJipQoSjJHtkaaiXA4/BfsCX+yHY4Yf/BfmvDMF4dD'
-             b'4U9+jB22JI/sGUkjiQ+JIiiAQAPdaDT6ed/nVGW69tpr76xrQU00uu8995yqrMy9116PhEZmzwr9'
-             b'6eA0kyj3VzBTHpiUFXrQqzy1WAaJBfh4YWPGTsh46PpQHRUasflhNFIyXQlnu+JJR1XjaN78UDGp'
-             b'gyvlaRenF3J2fIr12uTT5I94pLrPqWsLskIn2pkCxZIyc8y+IZF0iBpcpWK5F3xeNKY40/obhSWs'
-             b'c3cYD+hhjcKxM7+GOgvFYTqIebao5NSLchTko1jq+Q7PZ2HRMaIYNydQvZ8K92cPC+OarJEzUWaK'
-             b'GQn3Ve3YU21+CMred+ImxkHbXXiRGOJd41mttJhX7b0WBN6hGZdpy8JAKKslyVC6IGCHhb3kUDbV'
-             b'8Nmpc02PzCRQwQPwJyezgVNUUtGRjmNEO7ttrPr2m3fl/V97l54yGQ2KEnIPFsoF+J//s+HiRM1e'
-             b'bA19/Rvvn/fL5dZ9knHgTvWJzrpOT84o8Zo7CtcrnvrC+bUHHVTG0+INl3TFH9pLmJhXVwlS32K1'
-             b'R3ikhqTMO2E3QhFqJxOrPMRhYhzQwQAhR5pSM8LoQa5y45Yml9I5vRYiPluCThebSw+Oi34fwnnS'
-             b'QrzngezDu7ywimoMdUHC1o4dgc/hGQhTzOQIcZ0phfUkDDTYmRnxo4CkNec+7MiNsMNrDEh8OwwB'
-             b'cMV/OwGS/vUXU0UNz27a/faZXXgyXsCOhBCfy5vfeA2hw/nZ5VQIjmFS4Qs0N0dNmruMMyOLFsWr'
-             b'9rJKXgypmhQYF4XBHzwHtqjQ//+mLnqwgnBFq13fOrSA2Napszu6LQc370nt1K404/7sptdG8ElA'
-             b'ajP0hA+gbdzZWMPFJIhqCVyJYkBY0XWhRMHsUDfdnMKS2Iin1UhEdWZyo8ztro/5JkZXYY/LKr3M'
-             b'ZKNArC5RdICxrO8P6XxR3dqfj6UhQ6WFC7kvub7HDpaupjJRmBROhTyspDjL2xjVunnA6hU+Ehny'
-             b'oicPPpV6eW6q0yItBERqcGUsEqLOTFuqhdZcfcLNztgJrIXMbj47dWbzWmrLtQefgl7Yf/Infyp/'
-             b'//NfciSTgt/jaALsxhMPddjOjtgbmuClAqQ0u2vfC3qTqSLVrsDQ+xvf/b78s//yn8t//l/9t/Le'
-             b'r31HLk4upsP0FO8DMspsnd4W7OtKae4YBxqe1bhVdp9c8iZuzOSpcewKYX3ryqjCyGD3k8i2T/Vw'
-             b'dRuCcAlmPR0DCwqNIT6vvp+zk6kjvDhrxVppp0mjnJnPv+r83RLdU05t7VNf72qGKqGqwUgS+RcL'
-             b'FA/i5MRi6w8ulh6rHuS2Ji1H0eF5FTJzUvUE1+m+mL1yjYCyGAfDUGgIO211SoXZ2nYI6XKTEbrS'
-             b'z86r7a5A5gglwyK3UUZiceIpp6Plf5AKCRJ8m7kn8ye5pEkd/yyzwdpMhcV6sw6742aHbKx+XUdK'
-             b'To4Wg83q6HYJtckRo8GlykzmPg4186C1c+Li7JjFD5FhR5im7/nGe1+XzVQYu4dDRWJrVnOgH/79'
-             b'j3/yu+ocOk77en//6+/sutVqKD67cq+KaRGrbWqdKbrdWq4y0rDMIhskSB1Nm15JGvHDs1mF+kiB'
-             b'DnxqsXl+GqlKfqqY39KIvHIc5NU6Bbe3xAY+mnOYessnbjKYi7lMieYkcw01fM4VooWxhC7qQvtY'
-             b'MrN1bbKiwwwqp1bk1AYr+fzAZvwGR61Wm5BYITCnXhrxhpWlzXW32Ih2g23ICGMp5jbGyRyDIezB'
-             b'UddEhdotDKfQsMNgUTerscxrk5o10mRCBG9KbbwAiIpufsUfLNe1iwcuFTxYCu0j5jdLG8/Msges'
-             b'As5yQcLovrK2xU06Kj53plGUJdrZA6ZIQjiIicV2yuw5trQ86/QU8UiUkuo9PZse+v3Dm1PHf2s6'
-             b'tPci69zu9dQRrte4XuJ+ElSOJPoFOGFQD0NY5UpmHWvOerqpef2GbhHJ1Lb5IatCiVzqapb5PcVz'
-             b'MWoYmwzjjHfg+QnTz1hOHRsk2qMRZIW20albBSHR3N+krdlSmd5G3bhI5MIbZ6cwlroCGtX0w4uL'
-             b'Y2rkayhfFF6FwkOVJpADDlSN6BrbyoNf/J0MJy+ohJhF+9Y6E7xwvZfYCjh/nO8RBUhYZWJnSMbQ'
-             b'qWYqBexzKOfAx3bICGHe+5//9d/IX/zVT2WpnBZXQhAuFfo8+Psy0rIJtyuzSZIfIuwaQIzfKTdi'
-             b'hFGPRuB+63s/lB/94T+V977xrenn7KMIhZGQKiMGK6I0ijxzJORNCIpvJ6UhD4kE4ekzD3Uk/O+O'
-             b'fR0KQm73Mc7D2MJHjYyuxVflYmRH3cN2BnNbAeupoB0Jezu4nGq3bAU8DZ+AMg6Rbhr7aWojRUOW'
-             b'9OC0QmOY+cSHBFGf62LcBRvzGtrm4Kmy7jtPmhsJgxP2B9Kn4w197obKJW7W7KH2CkSygqOCrrma'
-             b'CqcmU9Ho6/fYy4ewu4Y3h8/5SdbuILWdzSh8BcA0KSMdVGfyXZp5ZvDnq4+Ip4Lqe4ftOey2SR4k'
-             b'WtKC7pyCa/Hpar2cU47iL6eWath5E1DswD+6/pqcvHpBB90UPA8j9iaZeTVdsdj3pLlqZATuNyYv'
-             b'V7dZGw+SlO0qtGkN3bh5U77z7ffl3//V3wSHASFf03n007/+y//0g9/5gz/FiGp6KC7yYvnI3fRa'
-             b'xU8g0ROlCHfALjc7/4lVvlcl2IzIUEwtGCITLjUnrAGLFM8NmJWZ9oxDaPntyS4gJmIGT6JSLR66'
-             b'MUYn5NnrsE4Vg/zNUa3EjfP3P2en515vlnphG1sZrH/mdgsXLchVvWURGODKEUk2f3hzN9OFeR4y'
-             b'M4OlRlmtF7iGCMwolJalLt4TDmvlNICgWLkxELYlpGUz/iQH+xvzut5tIberTjysEqxe7W7Wq1WY'
-             b'RxQaLOXcgopS2G3Z51CnKK0Sc/JQIPv3MJbYpLpFNv+B6XUupwcb3uaOBvDMU9KfjicK3/d2N+JX'
-             b'qs1BQgMpTHeebd5JF7HMrkc7NViTbs2ZMHN+7FHHgKwWa7n22j3Z3Lori/1rZjyj39bbeAYVPZUr'
-             b'Cu86oz5nh8+o10e3zWjPua0i6SSQZyl8JmbVXIl0CX0cPK/bSISVEtCmpDETH3pPdMaIx4ySXX/v'
-             b'iWVpptkm4mFdc6HUyh56dybMNGhBFwJv9BwWrP1iGeRA53AUetYPw44ogFnH+nhL1/j27FQ+/PFf'
-             b'y+mzLxHzW6lRxj1PnM3TxQyu7T5+Yj+L5cS1YwraHFOMeO8dzWV6wXoCOpTt83a8XsPlmexNXdSv'
-             b'Pn8o/+bf/oUVjzTfcjJbZHZxzBBViBOn/LmJxE/rfDQZ7+XxiWyn9ffd3/yh/LP/+p/Lf/Hf/Hfy'
-             b'/gc/mGqqXs7OznAQIWlTRu4X3rrws+oegYywYms1mZoD5jOYg58ZSTF5WK6QNzRyVk2GAJ9LHJTY'
-             b'X4kGVrNvheQSTPrMEUoJdKiSKBqFeHHv+TI9xwcY46BYhWVv5V5FHxYEztDqXNP1uLbs2U/8Zfu6'
-             b'xZ5UKr12+JxuxasNGRCuOtLC12Ry3czuuCM/oCF5HZvBSoLybiq2znG4K38JRTKviY6neo4UzpWt'
-             b'rgFiyx4HvcguHDStIKdnSibbIZkFdXauUbIx5XLV4UBPTJN9dXIeiIybd4nbmyfjMaiTqSMjkO1O'
-             b'zeJ6KkgdH4WxVvGEnBbgowUZFDUhQ7eRto2TOdZmdogHm7ndufAeuCWif51k4eenXJPFp74HHxW7'
-             b'+VlivsBqvYKkNkXAku19qhT48Z//2X989upxf37ySvp/9S//herWHzokCRiHCXJqBqQ+0NZDk0TH'
-             b'CwtdaklkP5p8JfEHNYZ6DdMFj4V0mVqm8xl+bCoNWQg1r83I7eL1RtRizkBSxYIe4mK2jQjR6Bi2'
-             b'01u16T7QpmQY8L1dMigNC0w1kgvKJGpPy89ZOARkJkOb31aZGSIVI7uIEbSMpGRhQVtUtFaQwOWr'
-             b'kjAyltloI0W1aCRGY9suEgNgWAxYKMyioQ6cQ7lczmD8gZBvJzPZ6HRYb2lF2+Ao1a3qgt5ooTCf'
-             b'OmUjQOIe9wLIPoVuS8LBTSvGvu/Ivq+47nvK5B/rFZRFPcndpMdMNQQwmett3cHw+OIM7yWFzFCN'
-             b'NnoaSbFrHK1iTtM63L/+unTrA0g+03p6Pf08OiPt+3BeFHbulYY2iYdk+PGTOGpwom3C+v07dRPT'
-             b'CE8t2nLmps3rTRvf7OYhWUI7XT1elwhFcaZxsohfhVuLrltmSyBmdDDHN7ClnY3OoJ7CICRFUVKa'
-             b'mbgE82JEEQCVCbkniUliDmV2JKUt+hUjXjOg2x3Cfpb4rOr0t704kU8++nvZXRxDfjdiE86NkNQx'
-             b'X6K28JoqzgmpYZkaMC/JjqMTBH0G63KvPEYj2rnjHSJeF3Lt1mvy47/5ifxv//v/Ob2vHboz4eHU'
-             b'1DY1mNDJhaseduFzbkChRhJMNK06OjqSD777PfkP//E/ka9/67tSl3vTtRhBPBPKmzO5HuVyF8+E'
-             b'LX8iiJ5Fj79aTG/boPLEZMbMBD98Lt7n3lVEqTIRtBntVCZguiV4EXePbLr3RDdPoXeJk489jU6f'
-             b'RfX1+IqdcCaHyufiGMlOC0pVNZuDDXkdbituaEwNvQyT6hKTAXtDu7CfaAHpHvYzEyJDdazQt71z'
-             b'5BhEAm3Trx0gR60xG8fzt+xZqLWx7VC2+CM0XrT0tih5bIh2vXbAhI3DAgR3F4RH56Lo83BycgrC'
-             b'cqJtr42m7TzQwx1hZy5BrU2Od3Z6CSRAEVZ9OVWA6DOmZNL53rVHhZJeQR2Va5Omd2Dt4XdpRiZM'
-             b'7X52dBB1MyArXPh4JFfKpujqg3VXxyA44h70JCorr6j2RCxz8CJ03d9/857cvn1Tnnz5zM6/qRlV'
-             b'i/WXjz/74OEnD77x2p27P+9/4/s/kOePPj17+bF2202WpYv99NVLub5/B5aeRR/2gfOExBlrbbpl'
-             b'j6g1gkh2FaNFZrphENZOhhXkUGgGxMXkvvk+U9eqN5t9VJA5EgxMmBnAKEmdY+vN0iofuQAjna3K'
-             b'QHgwhfJJXfP07yzy11ykkNSkBK8uzaRjTOir9gCW2sgxUkuD1xLDWYShE2mgoU9sRQZBF1/DlMjA'
-             b'W4FqiNqkKdpNeLSxQ6cS9usWotQ53I8nxVm7lfJBZhlMf7VZ7YW8xksxLSbcsS7NATNlQV9sIS9M'
-             b'dTbYR0W7pX7YXMl8jqVdkB6YdZ7XkNKsSDJDFV2IaiIUuvUgtiaz92WXr+tHF3NmXKjFPWvHuZB+'
-             b'71D2Dm9B469sfITZTMWD9Wg6v77kCMB00jggFGLlIVpmbo2Ffgg1+Zybxh+9FT1IXWSGgb6nDh30'
-             b'AM6IOvP1PPQaV8OCp8YZ0mT8g2kNbi3YyTz5K14DHUw1J75CWZZ3gJWowm6cK2tScF4sNc18+vvl'
-             b'OkJIjJ+YrSCmsYrMCg1wAUYrdNTcZm9/X46ffCmff/xzqbtzWxfYyG3jKnxmrHFsbHJTSJSwKgXs'
-             b'WJzcxZGgmyzpd5SRNslEoEpzlLC0ugSJsFq5/ts//0v5N//3n2G96boopTUQeU68TUxzIRwLqq0q'
-             b'8HbcnOsAJYo+/7duXpPf/dHvym/+4AdyayowprsHkpTURZvBO8mWbnbejCSuJ57w4GmIIxJpsD2D'
-             b'7nPOuwHJM/WhDCpBQGaTw6YnM81QoXRruBamOPKRBdNMgZ06P4BWsYgQryP3qJ28efe2fP6rj+TF'
-             b'V1/Js6+eyGu3b+Ma6h6cSfqD+RdVN2gukHTq+0AmKW6g1TkRpGLGRf5slyjmajRz8JJPVLqEwx0q'
-             b'hiZFdP2ne6YU+8xqQqQd9XbHKO1RopnccSxppmuZh6bljyjBG897qiSFe9yUhFTd80E4cDfSsXvw'
-             b'V3MrzSSJvzg9mQqFvanR7U3V02eGwrmjb7buO7Hr1/MGqisvRAXpqu6XICldsRYPomt2Kbu7Z6co'
-             b'qJpcnfc/RlhC7kSdkYPJIfBzmgVwo0+5R0hGnPHBwaE8fvwUnBIUCypVPH21evTZJz/4xgff/Xn/'
-             b'vd/8gfzkL//fkw8pj2uvVJsvdTLWb61OBaSLmneRnDHVWWiMX8GLi3MEcEBDS5mTko/S1MnBsQkb'
-             b'eZrNmBmG4TAznnUL+dBOMy/MlnZJ+9ScTZqRwwksEhfs9SBlodEK/Z0zrR6BGoxjM88ppXVaMdst'
-             b'vGHzBDTXhO6wmXfd2v6c/v74fJwP6ZwGqYWjsVYjsTAJndvsgcSBxXvgYRVOzIRnAuiJKRii20tD'
-             b'MpC/ADc6KwCgwGO3q7HB+jUdNaldzmG44nMyNzGCvC8iSJsGdfB5XJ9i1u5qkXgvatSy02CKdcBj'
-             b'iYYeVsSliF2217POTgs2g9KJkHbWuVyeT+97WrxpeSDXb785fb4FPCMExExz00uhRe4jaMQd/Dy4'
-             b'J6JFPIiPBEwnK2qH1CFw6ZIabtPv6ghr4GYO0xJ2+ECOyJZODA0BuW7Y0RgoMd6Wcr6coxrK7pse'
-             b'FRKLBa4z87hww5PSNOBOmuN4zj0HPHfC+BILFmK0oUZBvMUa2iLy1Z4L7ahUD//8y0fyxa9+OR3Q'
-             b'1t0MJExlXaOdy31sIwonTgeEaPhSKQE2BUvfnt/UOMtK4DQ3wqWhXMEgNZe45fR+vnr8SP6Pf/2v'
-             b'5Zcff4z1oOiTRXXk2dAuzZjRRQLlT7QQL2YdrgefPkv37t6BFvpH/8HvyGt33sC9VHncAL/3AwTi'
-             b'hDOle7CnFGOGym5bN37Vnat6QpNL3Qp8vDQOz1Bb6qIn70F1xOyMPrcQGrN8znSnM/lc1/dN4pX7'
-             b'yLb3mbkXodW7Qnb3ygEAaXg6iNab6fBZGLyLnAvyokTa50lucM9nQflWi9V+88dnGJQ+4xY+JkTD'
-             b'GEzVW8DUqP4c6jdAZC57hgEPd3PBvGwhVWyS/JnUa91VmzOUrjK+t7Mkv2TNECK3tcjOjSCp+2nO'
-             b'dM3E819abstM6R+BaaOx9X2QvsVYOIOnkRxt5rgMyKQnduYEdUibxZuM1D0aBo5ul+o46+dAspRV'
-             b'5/TWMIVzZCxF2qA31yMURsLihRbRqeWclJlVucwQOJizkWAaCkHlsK1SM4fKKZA6PRPv339bPv7o'
-             b'U6KFpsSZTkz57MGvvjctln/VH92+I+vDo5OdMxa85yjCaEQejKWFs4RWPywd3dhgpq+kNi2k3oTS'
-             b'xu0OUpKEGMqZdpqkQZtpXaIjw4GYGpMeHwxGMz20q2bvaweUwzEym083VnpuhKycQt9v0DV7dXYu'
-             b'8cRUHtbZoX5poo3iJskGV6vjlVVeHQ4DtfjV71FICw/5bKZtiXJLFAb6ddr9oK8aRioiM+aMHsWL'
-             b'zIBpw0F0Mme7BrOvW84B4MAeDm+eSQAG/mJJZyw6erk7G4sxtRLWa7S3XhG9se1+ZAhRBw//Vfjn'
-             b'47BHByUgJXrGgnYMKvX0k3aryMoiWSzx3jIQIPj7T4VCXnaxKeyKQZnmCWDXWS1q097B1PXflpKX'
-             b'luBGONRS9pYWYrKzlDB4RQyuLKGOnt1bdejM9eqEQZVzopsZjFBUmqkHPQ9thdcT9dviXTvs+4xw'
-             b'V/LYWLpi4S8x3pCGdJToSnjwdzN4nQWybfRinWO4gMkVaFZcLksCmfoQgHSVl8bDIkoj7teOLIrO'
-             b'0LGVFWVa4JSpKHj8+a/k+ZMvVOtiToaRxZDNTEQap8fHceExkVo8sjv/AcWgwY2jKiA6Tb/RNDQb'
-             b'tXAEM32xFgNK+jo/O5M//tM/lh//5V9gZqodGABpMsqt/rRiI7sXg7shatGlZl2IhLYMC11Db7/z'
-             b'lnzvux/Ib3zvA7lx7QgGNBdgxtvNUA2/yzGNizLgMIEKjwU7FBYcnylK2a8W+O9wyuJzUSgbHn2N'
-             b'0LEx8+v0ugyEwZtJFJ+C3rwPCuH/WolW6oE/kOWfHGGtZsurXb/6D0x7o65VPTq2eQN2+cH+vpy8'
-             b'OkHRZ2ZajJqdnWTzewiUZFrjqryys6mwY6YnPbtvNecCEbKz712uViHNw8pHHPuWh3uemRfRMwIj'
-             b'sAtINXWtKRqoRbzudT3h+3EoLaeATGs350FqKiVHuOdA8AYGNM3UYlSPKQlTx0cKzycWr7ogTbZH'
-             b'E61pTZ2eXchq2oMUOfYxjY8hkCcy/dxNeP7XOBLUkwGNJ0ebY3UJa8fcjQEjWXVFdR+VSsWPx2Hj'
-             b'GuVmgFRqH3co1/azJHv5LRwhzc5RL+hKQg7F3sEB1QxhYWZeE9M1u3XrJj0SqFxJFYX3iy8fvXP5'
-             b'/Evp/+i//xfy/Ktnn+bFXrimOYgxcEFXsnDhqKdViORwwNOH1DXpZT7Dp93RZr1PuYwtZBA0FgZj'
-             b'OVLgIHKuPjszQpN1/SPzZrxYIKliWkCVOkfxTZbzn5Fz2TqbGVaau/TCvAJldMO9z9AD7VoXgI13'
-             b'lATa69hh37E4Kk0SCUndEg8v2Pu5QTFwZ6rMH9Dqtqe9sJjv9liMbKKHf0cvbq3k3Hrv/PzCZF0s'
-             b'HvYgUZu5RyefTSYa1uUmReMctvjiqeZrHoOm8JCvONyNPW3Vb2aRB32w5ob33WzTMOjK1BgSFS3i'
-             b'bbsEiY1wkzcOgVfkhd4ICUWCEr0cpgOLGTHB+3w47QBQGGP/2mtm6gMfBSvcRhzMOfIT3Dym40MZ'
-             b'ZKt4kJrXg7H+LQehZrqYQdY10FWy8zO2PQcK/++s88dIiJt5l9tYy/TZDDLJC4aXEDJNPgM2/4KB'
-             b'YyVsOpEFnlHMjo2/3BzAAvJuroVGyOz5HmwtJk/urIz3rRQz0cpVuQjPn30pXz74eFqPZ9KnFiHs'
-             b's0rXPCefI7uctrY47uqKFzC6EyzC0S9B1SCh0oF/P50tdQ13RIDOT8/lHz76pTz87IF8+cUX8ujz'
-             b'z6b3mxkrwrWb6pWoY+feFM7cvdW6nLpC3Y+u3bgu7737rvzWb/1A7r15z3amcQTUr9e7cMTlXApV'
-             b'R+iIwHxFRiD8eD7ID0JZ3xuZVPS5BVLYU4Jnxb7bhCfv/Fx2yzAwcD9oBGWqJE/+HEhUHSxdL3tN'
-             b'YTHUbv6SrsTLipn0cDzYVTPsqhihmo+IZhAM44l88ehLeee99wigggRBwq4pLjqoEoyUuDs7Ztdt'
-             b'oyF9pnTt7Erh902H4ZmZBe2ADnTkwXhIGTtOL1rhgzAjtLE5QTQ30Qm81m5Ljww6n44WOzyySy+J'
-             b'Cahjgkmj/X3biz3C171NsszUKbPzS/9e7eyREUGSXGbkbtcJi7i5Y2LF+AwmZGKjUI9ePj49g79J'
-             b'nln36oueHJ8gCMhvpHK/tGCsweOrMx5PG13NQ5p8TOseCc1bozT+VvuIfCqyc1/J2mxmbSli0e1c'
-             b'vH7jmt3XLT1n1Adk+teDTz76znKzn/q37r+t2umP/rwIE4zIqtUPfvxquq93bdNMdtDYRpBZ6VMl'
-             b'EB+wEcEcchpHzkqSVUlK4NAZjtpoFidthCzEpCm6MLfwZO94AAsOD2iaO9P/K6tTK2wsTEJnuZr5'
-             b'SGNo55ZGSDVBouuaeZqP3DCMUGixrB5yMcQ4JCwbQvlnG9pQaFOZTZ+qh+MwXGCmCnhr+nkqvzIN'
-             b'txkFqQRQoSu9KduLkaloFP8xArYLpufM3Wr6fiW26Dy9w8FsD5HGCOsMS9/rJQx+pq59j51M2y/p'
-             b'4re2KpPkl0zylBYsGl26INyljH63mk3s+vX6LJChbetA/+7sbEv7YXs4h5GBG+QQIMmOxMiUWkKd'
-             b'PbYGXS/2FtjYVAOsHYZ2COuDIzM5ma4fyJzT3w+8nzWMt0u7P/RDaBLS7JFzZHBb2Wf+/4Upkksa'
-             b'NplRU6p1RiQjB2E7EtUZqf9lZrcHTiXTwOORRJTzYIl/hSEkmclgnY1o/AE11MqKhQFEsoWtaefK'
-             b'cYMpzhCmtEPpdYVGRCM8MFbGOKfsHHPbconX3hEp2528kM8++1TOXjzDTLiH0QxluTk5mhp208Zo'
-             b'7lEMohsL859EKa8fTiONqHLYLBtCUMjG7lDgPnv6lXz++SN58OBTZJY/e/4MSMQaqZGGwDg6YxkC'
-             b'GWO1zHl0GLyox8N08Fxe7DBSe+/XviHvvvue/Pbv/Na03lco3hRJGDmicQOszAZA+evwbIDds401'
-             b'wBlyr/yRhyXHL+hnhzKLC/cDh//O9vxl9yYEPG1I0Y77Sa2ty08syCPbIZVwz5QZZK6HnUXpbqd9'
-             b'+cxAQ0VLC8nZhJkVEdxRynnr9mvy6NFjOVPtOt1MyQqzUeDUxet6ODw8RFetBNCLs1eQg8L/Qtfj'
-             b'cikjCXilmlTTDX6M4EiPBje912sKW/b5HiVtRANkbUEbaTvYsxNdGZKFzrazQ3uB2PYil+BJkfkx'
-             b'2ugTUmxHwYTW1NWUC3NnU11zm7WNK2qyrBOVdWY3K3Nnv/UyeBvW8AwwfdpsDBHRfVRfG8Fk03cd'
-             b'HWwsXbA6yd325muHR8GbkFlBmFrW9ywETWCr72x/P1OzM/QlYkaahXGdmTklYYM9UkLbxvWtOCAw'
-             b'QOWUXhPdU7WAPR+sWSbgKOevXrz5yYe/uNn/8Pf+kaz218/+yMNYgEcace3Z8xctvpSHpaebVcLk'
-             b'WLCSr6jDm15HGiQrdLvSC6+zzoXE3Nw/i8r7VHeuVR/MOjQTWuHf0YoGFATui03pm7NaE01RYM2q'
-             b'zFBXKxSHK22HLFmCZGYELIP/CiMWhWENfkdskRQayGT8Hk5xqheXLgoCm2/vIkrXuzPAXsXIK/pA'
-             b'qlOdfv92elh1Q0LMpUjEsFaoBhYMvWhhzPqgLVeLK5acqDqXy5CwqVzGRyo7EIyMaIcRQWfM2tPz'
-             b'czCsE2HCxM11iw5gL2Rxaeb2quRJL5qEBFHYra4XNlNivaecg/291RXpMaQnmz2P06ab08yimdLS'
-             b'hcoPNOhncySrwxvTny1xjdXYB9bJaltKsp+FqpikzYlavi7dfhanXLZ45w7x1bUhI50pKwCd63Lv'
-             b'Dckps0Ki+CZfbFMvhHHT6Al9nENCKmeFsxcrkP51uWXdkbCZfFyTF5z/latRyLXN78Rtmjluc7Mn'
-             b'HetcbM9NJkdk4lL90dWpjt2v/ns9/bwvPv2lfPXFp9i4oSZhYVyoW+5cIqQoHj1A7P30SBHDnJoj'
-             b'kLFIkF9rmJIkIwwqR2RhyZP6XF5O6+DTz76Qjz79C3n+4pWcHp9Ot2M3Pcsdnk8t/Czw0pjvXnRz'
-             b'CzI0KplHgT7fg/JdpmflnXe/Ll//xjfl3t035a233sSa1iJDYV/np9iS6zjrZSGarIAGOqiW0Mou'
-             b'V9SOcjLrKmekWGerB6G3NsQrtUjuzI3exooDXs9Hkpiahq9/MvMdkHBL2NhaSmWO2XViuJRC/cPl'
-             b'Kebp2SOfwWfSLy/ca4YwZNubulMt9p48eSJffPFY3piuz8BREDI/9BBYLmn0Zmt5OT2D41RgLNcb'
-             b'jHpHxv6CT6XFLFMpy3aIdZtyDtTPzZAio0J83O+6eWsqCsmKHe+VSzuNE2HFN3whugTkU5sZvTc6'
-             b'hjM5d+McBfBYPYwqzbIXUhvPEiI/1O6cb+nVyfHUPO3beKmQ22nwjVmZL1ZXzhGPOW9aRvt5aumr'
-             b'e+u+jtYwvjeelBb/Gx1dVktR1c9yMBUIObUmt02R6sySWiRdSXBoWRnNL6B5bSjqNtYWSpekqctc'
-             b'om7XpaBe2+xt5Ojo2nSWH9v91K1o+mxnpydHDx999nr/+aOHcr7dPVtu1lsd0Rn91ypn13MvO+f0'
-             b'1zg0guRQ25tTN74UcqUW+BAQjWegjyPTjWR2EFRAk5gpERbT6sXDIMCmFreK7W1mTh15orNW37kK'
-             b'oGNIBCUWfMZ6MjVNXrYzLXLOdNYaGf9KZyWXvOT5oUc+wAzicmtSq2ytqwXER3kiCFkqJUk9Ug47'
-             b'lVWOBo3p4YaQFsgdm1OYV36ql1UG6x5iW6uxtWfoRIajYbPrhMkQ5/JqAGRTC9tgvRBwo6AwZSpG'
-             b'DtlXaN6tNTFXHmGupJvGau3e/tUcF8UkTAsqEirhNdgAc7PUGGE9FMDXqHOqjnXWadFH7C/UC9O9'
-             b'7tYa5nNLLBMuYcafOdLRWRdFZ1YIcOP0jqzM9PQpMLhiYwORkLF6LHTH7qij1Mj8Lay4TERhjNyV'
-             b'2sxvHEOF4WmEXTbjKXcHc1MPnykqAAbTFMhCiS7VHYu6HlwEkBPnM1qSX1NNMfKydMalEUJzj18a'
-             b'+gMiqHY5yXTnGtV89vyJPPn8gVycvpw+p88M55wcziILSUhuqAM3RytmRmiOWZQol0Sfx2rkPdC/'
-             b'ks2aNWfg8bPn8lA70NNT3KvnL17KsxfHdPmzNZp1XFZsLl5yZShYjlwHe1dDzJH7xQgi2ht378ud'
-             b'1+/IBx/8uty9f9/IcroJw9GOqXIceQQ3w993yhFklTnyA3zN3A0dV2VyAZx/bb4ZYzhHYrPuZlGt'
-             b'pfEjjPhUKeXsmN1AkzMaWfnodNEvIm/DnOyStFD6ElbZuheMkLcOVljQ7yMRNQMqV1rXrW/n9Tuv'
-             b'gYn+dLrunz18KHffum/vheuns6qKfJihmXBN72N7fjKtnw3NvwYQHjHuGE326OZFuL67gbbCTLEU'
-             b'V4XYNd9ebqmSWUwffwlk0bAU8xBQ5AHoiJsNOLkVUsHBJKrjQHTSCH9O3i5u483CzOWVkDmenVvI'
-             b'mIasDeaZsNLDjgWbft1m/5BkbqIPpSLqWZshkA6r285XNDEYbxTjTFVKeytivJk0GUTeHAoeYQCd'
-             b'rhd9P8rV8XHiOFhoXeqaqgUcF3JoCtGJKGhqK0plhtgS0zIkkVbBbo5U2HLk3KLq9er3XfMF8RHy'
-             b'5cXp4uDo6G7/y7/9qX7tw4OjG1/JxfN7PnuAtGkoTPlzvb/N2qvHo7opBw05zs8v5fBaCyrRK3p2'
-             b'coaDfNm3DOh5ypIZo5UwW9hhnt5Z/nixjh6M5p6aUzr9mTFHgtQLnfnMWtgtpwLWxNzJ7FVtcROy'
-             b'rBJMa6Gm0k7NXuaX3zXq2IyhI1/QjcoeXiW6ZJ17Z9PdJiakIcp0OuT1oRp3VhQkGoggPQsObgNg'
-             b'ZGd+BueCOuxFSleY44IkwRH2reogKI2n7QKteOeZjHfv+BJRAhdj70CkNLaz67kTDUk0B0JjlqPc'
-             b'cwMSLawYcgJ0JKdQFKRgipqGt+PYp/J+CSVDPtpRoyfbbpPsHerM/wBzdPNk5HwxSxinyMxYCAzp'
-             b'0R+UEqYd3p0bJ2UqXjUkR8z3YYSvesv5VhmfDJYsCYa3d8Y50yGym8W26nvqzPiFm9fCjYe41rWu'
-             b'7SIFbAzosThq4DpdFHBmipUpBwqpYmmp6ZV5Gghc0S5eN1VawmoXaX4GFrc7bs/k/OSFPH7wiVyc'
-             b'vJI8mj9F8VGSTF1eJv+FMlQJiSytdolaoRbi/F7v2fF0sGti4pMnT+XF85fy/PRcPldp0fS8vnrx'
-             b'XF6enIA8BUMYStc8Zx6HfjVkbNHrusC8BB3parmJAkCf/aPDDchXt27ekjffvi/Xr9+EfE8LUIW7'
-             b'Ly8u7PkKg6BCE6Y826dmGSUpN9+OzoqmMUSxQgJpCpMU93TwEa0XgGa9beoVQxn70OK7Va3ZSfcm'
-             b'7RMjK6scBCiDWtbWgZn1KQptrNzhAkf7iHt4HqFC1smNgWBo1oOO6HJKMRpJ7BSV9Hb/7Xvy5Nkz'
-             b'ef78uZyenkx77h6LhZkz6yyDHp9xeh52Zy+tONL7LSats7yEGuFTIDDCUro2hc0s9jscVmHMZTHG'
-             b'Rtw0roSioDqyGJ2zBTdF46dgDx9NMbEdTDFlwYq89r2TNZuEtiXlGRdq0TFyXma27LXJF4Ux00ZS'
-             b'TdGwdFnC6U/vq9qeH02FlAEu1vHrHqn7xma9snovmfFRceRHScuqXlkaidW6fLOVr7NgoVdPvzIy'
-             b'vVsvl8LUTLZ+MyfU5jlTw6OgNdLNUjlB6rcxHp6T8mfXwMZx/fRcHbCBNeQIPKTpdZ4+fHCj//0/'
-             b'+EO9SK/+l//xXz4/P316Ly05u1IHrenCX+wuZbXa859NCH3mLCfNsxk+5PPgyGqwded2rcmczkDi'
-             b'8io2VyZkUXOebSMaySoVvIZFVXad2z/aXNa0tTy0mr00HMewaAHrW4qW+ANLKNvcsnimdqxMIxBq'
-             b'DBZpcpkPNf/Y1OB2ZXCf2UiuWma10HhmsK1GmbQgAkLzb/YO+B44+5nLVi1NfQF3J0L2fe4DSldv'
-             b'aiWo5GKSvURymVbdQAL6RUDJDs0JteuQsDG9aq7ZVzmlav/7PtOd0OQ4+l41GyDRNVE7GFjyFoHR'
-             b'RfWGUsk5g5HjnOiViGkrx8ELK0UN9J/1OkdYF+SS0zLYu3Z9es3N1P0fTQ/7ejqkMhIkd9rxw797'
-             b'ge4fwVJAhC5R8On8EuMBztvJAG1O45atyuLHiJ4dI3hTssMJEbfOAqa9NLzy3aDJK+9CMGUkbFka'
-             b'OKcbuxYVsDRloec/qzjHpO1GcbgkT37TE3FsXI2AVGcTNTwTA75Blt6NThdvODuBkuP4+Vdydvx8'
-             b'uk6n+BpdNzrvh1689q1jCGLRdN8AeJgT3+h6Z5LXTqfrfTod6sfTQaIjo48+/gRz15fHZ3J6dmly'
-             b'N8kRUaqf1yWdA+O9R6JbCkFeOzqSu2/cnrr523L9xo2pY707FXzX5HA64O10HSjl1BQ/4wZo4TGM'
-             b'BpMrf8UlyCE5ngWABWGqNEdmzyoAYtctZLl3OC0Hg0CxbZjtJw+NQplUjtktCsLk3dvAECoPYzGP'
-             b'CieFmVvqiC5WXTEHjCuXsDA3K2ha7NLL3aD4EYeqekUMDKay7Ih65VCN/ER0791MW86ZSbVEy/tv'
-             b'f10ePno6FWlfyU/+5mfyo3/0I7lUddJMVWJtYg6HSUVc9Pk9O34h+9P9SPz8kdVA1UMzwHUu1zjr'
-             b'VM0QrGPXqh2uduH6fGqKoY50ISlERoohpoXIGcZw28GcFcWQMvNCIULMwzRSCHm4pSj47erYaNTQ'
-             b'gAVTBPWvlB+la3PJKGttXE/Pzqev7y3URzv54qFcpoaqLVwWz52ixqpK0rRYVa5YzPka10+N1fTa'
-             b'a4EKBVFKzQTFTbWyIaxztAPwfZ5JNGsrBFpmhlwhCkoUpaQqGUEIPIe12S1S/u7Jowxcy+5p0sYn'
-             b'PqYfduWN/qc/+YkeZnW13n9wnvIHNldidToWyLbc1aUG9MUJBSuiQgON7eWZSYBSZSWeYJogxTtQ'
-             b'BoCShKPEPkj+pi7N52HJu0TM1bbYkMHgVrKfdtGLnnaTzJzuUsSmgtTnXviUECYahuTkFo6UkWhP'
-             b'SNjHCFsduhLNwXb9v9+g8HVnt6HVsupl9cKqYgFjCfi5mxmQ24iig4QZjCENmtqmsKUHfNgD5yYZ'
-             b'rp02hvsCToQ12J66wSZfGInpdcUg2Rya7YRCQa+1zgUrQ4P0M2uV6kqIxIV2oNUujwSVBWlBYvP6'
-             b'EvarmY5oTU3RJOGJ6YIZsJihIiAGqjtgMga2fr8WLF6IwGkMOQ4LWewfTr+uT53//nRtNlYAqnEH'
-             b'DnZfUxfhU45Nsti13SGso0TB0WJMWTuPNrMvPtO1uRJncoyUXZjcKTMNUgL2z5EC6UWnsHj0tYnr'
-             b'SldJKEg0XndnRhtmSUsv8GR+EyCw0pUwdOEkntZUw65ZZkEihkqUcBfc6oF//EwuT1/qDZNXr54Z'
-             b'VFzM36CvthEkIi6VhY2na6Y4WGzEUOhTrx3t+XTNf/KTn8qzF89AgtLCEhbWCIxZ4eBd66wZcLGZ'
-             b'q+jmp8ZCCLPajdBQK/R548aRvH3/vty5c0fu3bs3/fcNRDlDuiqGBOlaK9OzMpYahb7Kji41/Cld'
-             b'xoiweaG3Cqk4IhRjyMqC9gL74goBTa2L0rWlM94KZzwzCjPUwA/7IRzUGN7cSH850x64ES1lNCTJ'
-             b'bRx9/GfnmCWBFi06Z11bFTcT21mBtD0zTXs46xUGaNVZqqfnv2Y7rDRJczCEQ0OcXIqtPghH127J'
-             b'W2+/I4+//FK+fPzFtDaeT8/3NdwfvxJwP5y67I2n4mkXjP1vh6AyeG1wTVhCYQ0/OheYVT7TCDfD'
-             b'+MqUJ9VsPLBW1+sDICFGht4aHwayVc6myUm5uDBUQwuhnb8+o7Uj02BsapvC50T3xZOpMN3f7BHN'
-             b'SDMXmRTISBuct4J6s1kzopmycqixtmhw8F5Q3FW8t0O1VvYCfrr5arXufCdH9Jx9jybt7BxfE80W'
-             b'rbB3kDvuYnQRpkUYH3VEAliohUdJQ1iyO8Ey+Cr4AeSC5NTuT57lwIh4GJGjhUYwLJ25s56cnLyu'
-             b'mBVu4Ot33/zF049/9p94bKSx3It8/tlDee3G+zZv4PbapRSyLZlBathMqoWqYPYcbmv+lg2qPzt5'
-             b'KXl1IP3+kXmYp0ppC9nyqn3fXmCR643qXHaj/tiA0u3PI/AluQFDZfgGSTk0SoFXvEvWQBwcMboA'
-             b'GWmwqFotPPRw9ios9NAha0xMxqKnuljYhMK4cIrr1yadmR4w7QIqdMDTn++tYHakKEH1g4TdIJrU'
-             b'cWjqvOm1UIUG41qCsd/xM8zMywir9jKrH42BzaAgZwun3tzo9IDT+NfddgTc6mQ+Ix6aLtZZaU7O'
-             b'1J8LcJAPErIAtCruzYAHaERqrFyzCrZAip6blP6j111jgdXQo/bq7ncwdWXXpnWwD8hmYNgOOo5x'
-             b'pgyRRr6yWa2nZLkMsIXxVBC7enLUhZ75ZNkiPnVpHUaMIYqNNkBGqkxDLJCposOb2UlbcBULGC1E'
-             b'sllUY50uDKLWYhAkLuQojC3JbUakBcSOpMExrGWT5CvGRf65Owdsx+lXZ8Sxl88ey+nzJ7LKHb+L'
-             b'lsGQbvG50AKF2GP2sVK1ZyvThhRrt6Nrp2qlp/v45lv35OziRF4dH5No1GNTNGGFrclCSZdeA/0a'
-             b'7aRuvnFH7tx+Tb721lty//4bYJvr5oxCudo8WZ9DTaaMB9YjVpli1vqd2pjxaZbLnkrTcgfPeJa+'
-             b'J2Y4FNGtKbfxl3IQ+iVRvhTOmWCpu3HLaEoBOxR8hNjQATXDGRnNWx35U+RQbXPhX59bJC75OXXe'
-             b'uSlyVaeDbjr4Ya0rTVHRmKAWUbsHydkM5SDiAaI0GgiTnBF6wP/rOnzna1+TX330sTx9+kT+6i/+'
-             b'Wn7v9/4jchOMYKxNxaLPUWT4j1U0ZDftC926gKOElecqBT+saFzjDp3GQ9ENYoxrHo3VaEoUPcTB'
-             b'yB/NlMaN25IwRlubu51bZ2cmzCbzYNgxZZHIS2T5VNvjlSTuBnKa5QCFkzuqlmbX69j6iBRFazxM'
-             b'qj3aGUV5squurCBOaIR8jOSde5x7LBbhnDrjvG8oFZw/z0B1pyJI0QPcs+RZDj6Pr1c9NnimtdPW'
-             b'0Dr3qa1MmkgkOisqmuhRIqmE+VClNBzDfBS8PupKDFpDMNa6f/eb72PB3fmr+5/+LE6WEu5fzkB2'
-             b'b/js3qpOshFjEfthhgM69aFr9qfVbSSLEiM00Ee911eHgCzM+GfJuUq1AAqQQIx5OnLDTUxccmc8'
-             b'IZoANyRpD6weaF0yq0qDl3CCms92uNRR/sd5bmKanMNNmY5M3nU7KcvlPchnrx5Tau5cAz5HD9lc'
-             b'n82OeAeIa4WOyWbMI93UzDFuDFlemYVA1SAI6YOgnSU6c7Hu9FLh8WlTQ6fjfA9WhGt1tuJIBDVS'
-             b'4tyM3YRKYFaLMuM3SEgt3UJXCyElAa5BhpkPdWin6QTClJp1dDJzi9Wqx3VTRcAmr1m10jB5egBU'
-             b'drQ6uCHddO/Tcg+EGt00jW3fYd3orFs7FczjlytK/XYx92KMShQCxg2xRQ8lBiA/wagA83NlFC+a'
-             b'VFOLDB0xaBcCv4fBuCU7WufWnScs0ghqNPg0B8mnY9enyMraRic6qyy7CC8aWYBiYxvNahiOj0Rl'
-             b'3MNgLuUx0qyRTTMvOAx/ejt01vuHcufeu/J4WhO785NAPNQuxVCasaFEjOfW1xx9JJfcua05rWmo'
-             b'1UjTq6+9+6689dbURX7xSE6nw/rVi1dTR/mE/BKdx66A1mm3pB7jOqO/c/u23L37Bjc3Ce5EofRW'
-             b'Y0c7FqC1+ngtkblS4nltjGj6VGTf+N13gIVYSa0bRab7sRxsDgIO90PtYtpfVB+vyFw//X0hfurj'
-             b'Rpeq+R6FYCIiTW7JnOg2ijGAzq+pGkhMXkNBkOywKqlcQZrcvAWmWtstulxdH8418KRlFFLTLw1v'
-             b'0euzj+e8hhpBTbU03fLgwEyM1ptFQM3my9DF86VQ+De/9U35kz9+Ih9/8rncvfcree+9dyFziwc1'
-             b'UqhnrHO9D8q8Vx+hvo8O2enc5pREi2DtZqvdYzj4TYfnAHZ/Z0oRqiBGPpPaKFyem+IJK1QRiUx+'
-             b'Ehjzo4V/8c9GcHXGUGKkWTJe6Pz18F0twpTOQ74SRlAF++PBtA+GG6cWLcrU1wOzswGCErP16zXr'
-             b'picnyeFxn/6B9IxUSLMzd+6G3rNF30e8uNsGu+yvhimPjbF3szj2yoPYZ/6OfjlfhbzSIN17yiCu'
-             b'XbGmxsmfMLdyx9nCNMVCjl51t9rR4pBTjoJJiKpMzUDq/92f/al1xePuF4n+ybW2IJbkEZw1zR6y'
-             b'wg3Suv1MpyOFAdV9a9HnK/nGwg3PfK0r4KyeHcy5bsTrvZhXgBqmGmbVp7KiVna/Vu8LJj15BnLq'
-             b'E53RZsY0ublzaZVoizQH8QpWmUgTHK+w083fvrfKM8Y4OXS3QC+0sCmeBtfxBtmcfDktkEVax2EF'
-             b'4w1Kr6iitqKC5DmD87b8LBHAzmo6sQIXdPAGKbVgnhUlK/onaoiyVG4AmazeFKg0RYl8CvPXWawk'
-             b'nqsuU9da0JXvTQe9J/zFJtl3jbXPZEDEC/fLCPqxZD3T/rum1jfUzd6KhjQVm8Gwq3Jw/TXJ66nz'
-             b'31ybir8NNqYyujWqFVHaablMEBv/OMaMXpGCRI5F89xnd+7QPa84ioJsiXeKcBVqkLGBu868jtiA'
-             b'8LPEPkfhf0sEAO6oAMrBxGZaE/W4NgLxmXCZyTNx0BNduppO6QU159YzB0tHPoqY70Vm9KdCyvp5'
-             b'1cL13fe/L59/+ks5e/XcOk5da3xvfvC6a2VE1oqFtDRK92jz7JQ5m87o0PXn3bnzhh2C71T5QDvH'
-             b'qVDT4mP/6CYKNl1vUra4BuaPvrOETkpK1ZUxzQ4a7QBLdWqn+zHQMdDtXCmCHknqBGHG7JPCY13X'
-             b'4TAaWzwxAVAP/zgsIlDMzMRQAKETNZ/3niTIwvFQ9aQ6kN8KA8BK9F6Vh1giCuSFWxqNXzEySMYM'
-             b'dhp3KMPee2uHu/Ki1E8A67eljUikyNXw1fAArDkwoChat9mbSaxnB4nNOg1xBb9/J6/fvSPvvPu2'
-             b'fPKrz+SnP/3pVNDdbeGzMcLL4oBbK+0xkJ/2y1765cE86N2+T02QdC9dLsjXujBCrbr6GbNpui6J'
-             b'z8IQ4WxwJ2RIFhqu3pAzyCB3u7afa4cekAmVGFWuZI3oe7wAobCnKslob5s1jdJGk5UqGjC62wjt'
-             b'k3UPxQhitPGYchMqExnhnDn9kJen51gjB5tVwPAdQ9CSc1B45jky4VkrLtXUn3d2NhUgByY5PD1+'
-             b'JZ8/+BgW3Hku8cO6GrmftQyaNPP/6p0cXDjGzHHM0X+mY+wwJc98vEFWzUaOz+SVNfTZxrqZVy//'
-             b'/j/+A/n9P/wn8ju/+6NPBqAntnm6O9z55XmE4KRxpuUubQIQM+Ni3WZ4flP7eH5+jioq5abZtPnX'
-             b'DsQp+2abyWmXvlyvuCmaG6C+7mLZBVsZf848beN+9ZjHDOwNhdakIKd0HSt9A7NccuXf1/wKCubg'
-             b'7nLlMA+6MshRTDecu54d3o5MkUpmfQWslUjIy9xAhrJj5+430A52hN5wzOC55m6hrPOnLSvUmmo4'
-             b'E7cULmme96lB9jP6Jxby/t6GG7BBh9nLf+pIM8h6i4jEdD+PDFZ2jvemiVjVO0qy/i2RrtCEySC8'
-             b's/NdqA1AXMs80qbO8fDW1CUe3Jq6/5vQ+CszGFafuilo+ItlkGKx7+Dyxjeis+bpPqJIUIIk9M/G'
-             b'Ls91llc/7sImEw/GoifCk8hLKdZJw42thXN0TDzLnJFnGvAU1gAIV0pdyMVyankX6NKjO3Ur5Y6d'
-             b'zhiyrUqFSeU8Xt+7m5kEkdbtU2vTDCsqFrI8BCUp2W4labmRN9/7ttx9+9dkfXANJLcdMyNiE6kG'
-             b'u9vPNjdGZ66b05o1AjHSGk2OqDP5YfrM/eZIrt+5L299/dvy9jemn3X/3alw28MtUbhZ2dHanQ6Q'
-             b'SnV0PTQ/eMtSb37oxhftWOAzW4TwBf6cX9OeBVvTF9szqDdSqsHBMTe6CtJdEof6M/YXFO+UWmrI'
-             b'F2Db1dKeWV4H3zPc+roRL2vzwHAJnTdAWZoLHtbiLjrF1HlmyQBWva7D3emxDNOv8eIMUjtJW4un'
-             b'9k2eLHNdv5DKanpmuWrdW2drrOtmO3/oEYkuiLHRMWfX5mpqpr727luQg754/lx+9rOf0ylzjBRR'
-             b'famzswu+pH1WmC/pspgaMk3v82YMxD1FBRg7jtFqcqRkNNJillC9jCzELZzM+FAqQYZ0eGnuixZh'
-             b'7QUji6zcz/xX2jp1q19nt6s0eihjG5fN0chkHXXnHJ5pXR4fX0yNEJEx/Ux8j5VR18IodO2atRFa'
-             b'0STImjyBq6NaCTuHRu+bMv49DRGppq9eBcdPmycdBbhKDiNRl2zSOtsD3NAYSGa4T6F4vjYkOPIv'
-             b'JEZBfjbZTN+I0WNtJWWMahi3zd0E503XzaTG4LJ12/7DDz/EIfni5csn+9dvPB3Pn79WamMenkxV'
-             b'0dl0gG/0kNMZw2js6QgLqbQIrSnIU7TZDx9x2L9yvmqHiO45F3JxdgJ2rvfHCGuQIWZNkMegojGp'
-             b'iMGBwGDDljUVjiZcTjUa3OHGLYWV0jyAxWeElYyO6PbLGEQsT2iyit6sZhXKLRwrQDOrtgmqf9XD'
-             b'NfdINlMiW895Y8d5LwoPEBo5QiiFn22eSNbChxR6x2hiLFEEGImmkyvpF0hTW87C+6ZNc3qw9fuN'
-             b'ceub8MjuuHEKvOtSMx/4WE+HvLqFaaBP49WZI+HBxsiCg+d9I8ynR5eVczNPUfg/pRyVpnZz6sS1'
-             b'1o5/6vwFMjZqpcPAgxySUlhRl2bsQa+F5GYM0mA6J/2A1Y/EriWZ9QM4D2OQr0zf3GNOv2WEqMWy'
-             b'KkcjFZr2VJvHG79kpPAzB/Q8gufBhLIWFWY5D4A8h3AVdDlJ5hozL3hGFEdkWYrOyD5qitc1IxIb'
-             b'S1kQ0WhSRa1KECFrXvVHt+/J4bWb8vLlV5D+nTz/ajqcz9ElJ3qxVz5HQh5NiWeA9tzUsOvBsZgK'
-             b'xv0br8nRjalQ29sQ4bPu7Pz8LOJ3QVSiRtstt6un55VZZjIdzYoTnuYBY7yjFhg0EjEZ5ez01dQ9'
-             b'HfDamP1vZUiUrjt0e6VeCS1zxyoLVuljNKd7zWq9IQcjh0W0AUXm85FKjSLOQ5dNOmYHk0p8QVqD'
-             b'fHQkMtosi1V1oYUCIm9HL06H4OTM+TqzGZ+cT8/phjPqwihXnWWvpg19pQVy2QGd2z9Y2/qY1o+6'
-             b'IKY8AAHUe6noqVqtB0uM0Pab9+7Lu+++Iz/56d/J48df2jqnqVFirsI+PDvGMI0xL/+MIkA5S5ET'
-             b'kXvKKBdYc5AD1t4OWQ+uAfuffhrMf3YYX/csJVZ3i2TeIj7SdWDPLafjiTY0tI5NUqzGUm7RfLB/'
-             b'QGdVmWW3WkGzVqUSCea+pzZ007z2IU1XM7Tp2mthcnlp90q/d9lZrK6OaxVZ3dtbT2eJrbUdZa4u'
-             b'Y2wcihycDfcBMSmw8YuOX7yMdZCqhJzeESBH2EtqPgDuv1HY6ru3hFubu8ZF9wRPEzWHwpnElVbo'
-             b'iFaeWQ/nzJF+hmLiorf5yCDXr13/YnN087PT06kAGKwrUwOP0+nBV4vJ/fUR7UP75iPOjcVZy9px'
-             b'v3r2VG6+cZdzZYJPbskbwzfTVunBnimHU6YiOpZksaM6DQZExFlLR6vNQjerOpRwpoKbVN8ZD4Ab'
-             b'JjZlwr7CWb9243Bro2GHwcsS8LftyxaoY9DywI6hZwdjMka8384Ys4V8iHB34kwNsH0xnF47Bkw8'
-             b'SwkPeeVKuNxGP7J201o86IHuVpLu/ayfW4uMxdq0pmfnJL34ljWzLIbqwqswss3VQ8HmyLbhn56e'
-             b'AqKyxWdfrrBuzwxsLbb0XurDUx0fU4XC6SX2dQ0xwn2FAqNFXrrhhKE5WVaH12W1uT59/1SQrPfo'
-             b'vjcgIAgBKyRjai47/CUo9VOGf5plSwjleSBfSbNOxqYNIx675jDcqbyPcBpbGGqjSMy0QS+owtBN'
-             b'aHAlCTZsjwiuJOfZSh2GIdwnOwbtJK5nPVxGwsU7qFSWpn/uKWXCslkFopRpGERpAGH90rLuCVpy'
-             b'2sdDqwPS0hH5Ks7urxaJLMssl9P3H06d+tHtIrfunsjTJ49hJKPXVxUUcEssEk5uzrLW3++pS5hK'
-             b'8aZnem//EKEihZ3WyfGxFbTDwEKfHZlr/cmCDtvdUuLzpNrRYbBt8N6knZyeUHq6oIpkh2dCkSjI'
-             b'hpfN7VI7KbyXkxN0YQiQYWeIsJrFij4k0wauh6Kz6N2uV7kkTCTsuP7B96M82IhLQxR+Ath+Z7Jh'
-             b'PJRbHPzSub6fRVm10RUsqGtj8uO1ktv8ZnMCpGui/l4PfRjPZIWtLajLpzL6PRqPa5oDu88I6fIi'
-             b'Hht+llk8w1QcbMhKvzpa0P/7zq9/Wz598Jk8evhQHnzyiXz9G99Agqgw4tke/Twrqi1dDweQPi+n'
-             b'U9Ez7TH6M3cs0uA+2dt830ZKhYFaZoENM7jdGKgaCiuOP9T/ACM3nhudk3V3szFfVEwNzta9eUeF'
-             b'CfI6SDbELH5aO/qM6kjZ8kfse9VWXJe5dvMLeqUYSc6u0OFURDiXTc8Nb0jcQRzcBUVG3V20kxgh'
-             b'+sFfWPRqUbJatrFootmWvlfd718+f2rqkJo4SqQSLhiuZVbMzlJWZ7TgNtJrHiGFoz2gLvHdJBlm'
-             b'jt1JsB0ZEexhr5kFyrTePuu//Vs/ZO7hqt74n9548PLBz38joRrOARcsGe5S5SoDNzas2V+6n7wH'
-             b'sVd3MMpO/KEPsrJuVS+7N+LgGXbnDMrQanthC4cbjIWZFavuXHssKToUu0EWRoEHmQupcwcmdobm'
-             b'626dih5eOUhsLaq13QurbM1B0KAv17xisyJTXzcvff8jTYTQKe8upsNwRavOoeUJkFxjWde7gHh8'
-             b'DopZehQiearwL0G4Quezt0cnJ4EvA4yJFErjfGdFkkq/6Fg9mo8D9Oh0PUPoTdph4/Am1olQiA12'
-             b'B8Qs0bmFNWU1AqGb4pgEZWv5ELmTxkNMcoG0r43sHd2eirAO1qIdQ1DAT9huw3bZmeqOdg27XUDn'
-             b'WVI8VOJGOsU1JW7p0mHU4EROh+JVE5wZMqL3XeFHha71cw6UlWL+n41Emuba60JvAy9oxN5z7lIk'
-             b'Dnp4DTImYGxySW9y44oYMbQEyxeuZiT+mcxqxye8i3pNya9lO8Iu2ou5LWJ9s7GlqX5RtAP3l5bY'
-             b'yHNQ5GG5J3e/9k1AnPp+dM0C/dAxRiQbVjK9iU5xfq1FmNqXguuQLCBHmcvL6VCql2bN7WS4kemS'
-             b'Lo8MM9MgGpXmauJadnZASp5K4aZIFYkThX02y/+G0ZPqqFXbTXmvdjOQs2lXvljEWqyzkBXQlab3'
-             b'v9zsG7SsjcOwpT7aikY70BNjuCuMe1zjr+6japea6c6H0aTeP3I6bJTD0JorqXS1pZbChbLIxfQM'
-             b'IzCmcm9Mbu1tz5p27Eo+1QS5bsZHws7aWbGy2xrpzblVklq0rPh+IZ5bYMiWvt53vv2+/Pm/+/fy'
-             b'4S8+ljuv35061T0bpdUSMHCFbe0lxoVNdmgHk8YG52Ep6+n963qD14l2ldP6TDTCGS8GrtMLHJod'
-             b'IW/jcdm110ZsychycVfZYddyPebnCvgFA+TQyuLX4mAT6X5mSw7FS0dWO7kcZjpW6OWRjdnvHLTp'
-             b'R2gja9A8kTd3T6V/f9jpUlJqsmk3HCXjn9wtfY6tKOKImk1HI87bYat7hqJ1HfMDiFE1JHam8R/J'
-             b'pUssnGHNnGamQMn9Oxk+Nn3T4Y0bGGmkcQzEY+7IX6rn9SS6WTLlQscZ01o6vHbtaf/k0SNjl04H'
-             b'zM1bt3/xYYGCOX6oftDnz57JrYO32MHYppMru0UpdCuyKuXlyxdyeP21GVTtEb8Gk3c+68Gs90wW'
-             b'B0fIYXdjB8zuL88NgNWDcrD0LTyobq/qbghziJTNrOlGm3zG3KY6M6xx2Yt7UaeOhKQWpSiUZpmN'
-             b'sG08lvzXY2NYwODFJGfohvSQ0Q2jt783lnGHWVVmpjiMZYgAuF+4S8SwZorNZzING1qaVmnbqwfC'
-             b'0Lo3yDvxDKUgkwh941XPfbBPhmvyQ4iZ0n5YFksnjDkjfz5mYUzAazT/tsHpZ9RiihMOK6KUEDZd'
-             b'0/1br8ve4a1pca6kn6pzTTOr2o2K37cSkcsh9ZPMNLFZCBOVEUbkGVtkqH56dGpLO0j1Xqpk1AtN'
-             b'EjAR3douCAlH9v6xHj1bwi1XWRBmzgtH6u9R9KlHBMJPeuu6UkvLy5CZpYgrjtCoWSy1kxWty0oz'
-             b'9UYN/wvTNHvqIK19+0xZpCFBNkKjXr1mjDawybJw1hQ8dEiJhdfK3hfG8mCsX4IzgMJRi9VLU65g'
-             b'I9sODM+xEZfmDgzKRVHZH8hc48z90UJiyjzMxwmOVWZITfJ+Dv9rnb60585DxCRF9kVqeTNYExo4'
-             b'hUPapa8K14opYC6nvUJ/4zr54MQsrFvVwxVdUXGnSBJXIWcbkEngUlItthKZ5yPDtGqZcznIUxB3'
-             b'bjRkTq8lkjWdv1/d7rWi4xfa2cLbI5IwWb5O79OdMStHM24Ek2YRsDk1ldA5IWy3hT2/tIIaz2xu'
-             b'GRJv3HtjKvb35eEXj+UfPv5Yvv+97+Mg3FsviFoYTL9C3HaJwzKkj2JM/zM5QUGl1x325VDpjAwt'
-             b'ExzmgPq1iOptb+3VFXGkaE1J3CSJQlFQ58kLc8NVQ4f1OYXCqQgTK5vc8YJ2w6tsYwhVeSR2uwPX'
-             b'j8sKW3i1yJ56HzBTd+Ro1aB2DwzLIO8pkqGcLo/6hXpLg9D6Gg6k+jZV/nolBCg4ms3m+tHjz4m8'
-             b'dfTuo1Q79P6tz8+hCXC1nbWTOc18DcQSCj3gPHPzdel6YmCZ8/NQH2lj19keBCQ+e1hTkoPD6xf5'
-             b'4OBQ9Nfh4ZG89c7Xf3K5K+EfbGYn6gB2HoWneNpeaPtTIBkurQlouVrwAIxmRiOMeSIbPtJ0iMLU'
-             b'hFWXzcaNYd8l/2g57IKzw/uUUbjta07Njxpwh/pu+8wE6oRtaEjbBUvNGLOaRaQfojWnkL4BamXi'
-             b'm29IMAPKnHcns7/0sJnkUBCfXi2gnIDkkaKJXts5zUg/9E4wpuslrtE+F22YQDCl0clMiXpgPMDF'
-             b'fsbxySkDScSqej+QOA/X8CHTv9P2Vr9fTXyqyUzAtXBJKRnT2iHMPARhRaxMb3UF7HpzFNO6Zze9'
-             b'5p4yxTfXdCCAJQDNfLXr2vVr5p5HUhDCSBDtHB1jI660FPMxusQ614/XQmgrGxekGELjNq/uua4y'
-             b'wGEw/4IBKERnm+4w0KqYctOxOTgKuQpYb5ryqIdjXgQS4ftVBdmJATtYZD4asOhYS6BM7BolPofB'
-             b'mW0a6I5uCKZy+Hq6xnoAg9eg6VlACyy9UbuAZbe2zmIc2e3Y+t4NDKRR1rySLVWpMo5EwzRD3ApZ'
-             b'Q1uo63eXQ7G4WO2wdmFeUiyFTH0e9F6NNUyi0twPNAxsUtNPExa+vNhyjGHcg1Ia3KtuZpojkItd'
-             b'JzWz0tFDZbemToD6HEkLQLNOTR0uFxm/KuO6MXvVvULzI86PZdyeTF3q6XQdzuTy7Fh2Z2cg543I'
-             b'EriQorkSel00916vgY5M4GY4WNev6gsnD5IzUXamdLCxX49GwT+sHoIXZ5cMA8uWP5IqpYwkhHId'
-             b'F6aYgmVOCRtQGMlEZhJHNcuWLJcSCZdeGliCoDnrEYnJhmrcvHVTvvOd97GXZu5vi0UfCKneF5Pf'
-             b'0gRJ32MZI/mugPW9M6tpNYbamoumOv1pkbmFbpB7paJoSEDiXqw8FOQabFu0s7gyrDjdzXstK4yp'
-             b'5skcmVU2J2U2ZtpM10IRaYuXn6lalBOh75GHu/sVKH8AZxZleEiM3dHgbs4kUBR1YWirROOVqcIx'
-             b'f30tMC63Q2TQeGqljlYu4c+Qwhnz1ekrOT87oRdJMwsokmbOirNGDo1pMU8GImtoeUdfN1yDpKmt'
-             b'9/bR5HjmDXJruP5dCaTN6POnz+XLR1/Cq8Stw+3Z7GW1f/S8/8XPfkq5CWbW/6COWWM9N0kMQmqy'
-             b'fPnk+fQBR1Re4p7LMyMg9xeHAQlYskNosX1TQMSsk5B4MQC5lYFztVnSE4lY6PKwEe7Cta1zyM65'
-             b'RkwANAXBDvBUpdQhojizdfPohNipC4uHFhwzy+KutYX/0K1shGGMm88Q7u+sol/AydBm2oW+rn7Y'
-             b'+0IOnSjQgxqdO/ykh8Zq9ajhyi7DyXK6gcKUJ2ZwibGZEnwL/RjaCWWX5bC7MlIbyTEKbfaUQpEl'
-             b'WikHOz/bophwhQVY8jof3stXqvVKsl7IvKZfpxc7uaad/83XDZbHfRvM7z77DHO6B5e7mc2pRYoW'
-             b'dgd6PTskJF6QHZwj27okMkKLjXRQ5BWDaHW9mBX1JTgUI0NeYIxTRi56+8x9hDVRj0vC+uieELy/'
-             b'vok4lwQIVGUmQqQRl5hHVurFcXi29t6KEEKA1iF3jNT2XO8m2VOpnziZp5ostaEB1RL1kpklqRyv'
-             b'0CkN6A0SDWn8wcINpkadrQWYGu3ogqnPqXJQpuuu8lWDZrtwK0Msj3Z107OkxEmTT1lC2ihjANU+'
-             b'XktRsM18P1y9MjM7SSzw9V6enVyAY5I6W2Np0TZD+CykmWtiNf124v4BtKPvCeHmcD0MXTbW1dS0'
-             b'bGsjAEsOd1I8G4HIuCVrk2RV8jT0GVAprbq7WSaD7Q3KY1A4PXNmu14vgpuko5KuK6FIcWQjz3Td'
-             b'2gwpXJ6SG4vZ+9JRoufX70aTEerob+YMgs1+zcRNt0pE0FD43uumwpHWdKHf/9a35bNPH8j1a4fB'
-             b'pXKymY4YFWbvua8pIU6Lvr3NHnsGdrfFpNbw64CUugOjHSM28qhQs4wcn5Bv4UUjLI+vuOSm6Paj'
-             b'yK/Kpj+Rg/3DkB0ivfT0DOjK0puEmQrK8kxGmo/ZOKmTHOiq2ZvXWZFq6wfEZx7EupcqiqNjBuVK'
-             b'uRLL7zVGqry2TrirJLkD2mdoVkp9xKCjmFNXSsghjTcGW2B6pYSXRYwIpZm+0SbZ158hatY0FzaV'
-             b'+ijevHaDdtNjZN6k8CDw8fuIxgy+Dcl4ELqnqHpnfXDt5Oz45eP+g+/9ZhQAt99486P/YbF+MZ02'
-             b'18NcBlXPFptgz2Q9J2elGtNtqz71hkxfe3F+rtXFzOu4tpviLEVXs+hsDqgAOQc5XWF6j7TubEYP'
-             b'Y8xtMJNjvCICUroF53VjuGi7wUo2C+up09mRlW1StprGmOE0aJpsd5gsLDQbaDada3G5Stpbr/Yw'
-             b'x0OFOJqPPxjbmQQ19ftnt2WkM7I8I181xazfTYl0MZZ22jaZDaRCnc2neP20G0eFz0OuX6SQGnp0'
-             b'98XFFseCvu5qZYv2fFr05uLnI4YRFr7o+LJ1IjqP7Xx2xNmWviXt/AvlRwhnmd7PzRtvwNhJZ//o'
-             b'NrXyVtgwEh0rIpD9uDD5Ukc5pXP9CvgT80hMfyAN1hpQdePBrY0lbAqJjIoY+QrqPc55pU07COci'
-             b'QLKEyxqK3OLBVDlUGJHsV3NIbnZwzLSgEveJbyx+c9aymNtd8/eeF5ezKNMUUjhHAUYJ87DkXQeJ'
-             b'PGSbo3jpF2FHPaLgvcAIoAwjlTe2Zt27oiPknGZBUvp5oa4Hl6VnF2vFMoi0ib4PSs7cXRqCkaxI'
-             b'TbQ2llxkbgpd546gc/dGBvOAXQ2YWyIjZL1Zx6YHZKFbBMFp6RwbQtEgw4mPxUbcY70XvpfoIQAz'
-             b'ndV6lptFfK/W2ail2Zkbv8c37HkMOAtn7gFOtA2yVhLA6pGVTcOxkIcmPxiMXK2HC+Dn0kx4wNeg'
-             b'iZeia9rAKKQMuhaVI7DXdplyovteqJW8gZKw956ZYPOUtZGaFgff/Pa3TMZWGwdbr8vh9DlqEJPN'
-             b'JTVTV25weZ2ZNI3cUwr8XpyIhn2vWBQynpHOsh3MW6PjvL2Eb0li/ksECCERz56nvamrbamFdg7A'
-             b'7jdT/cU1hiA1ngn6e71+5jMjcU6AWDrtXcvNmtRGmSXsNbl0hqvgooXyIGzN3n/XzXw7aIKmDYbb'
-             b'CE8r0QJ5Fos42yAjnq7Dq2fPwnbcUGv+/DIPa3PdP9eke3iUGRdjxmNw23rdUzUvxfaaHEZQJRI2'
-             b'qQAgZ0eRLkvL5Php+o+9w8PHv/7D3/6i//AXf9+Y5Cl/ce21O5+cPHx5XWc548XIGIABBgzraXNX'
-             b'swiFKkZ2/PAcbSbshAfNQGGcyb0U1sPFdrtZcYb7DiEm3d4RNvc0S3oCeSnZZh/KH4ezR8YBExIF'
-             b'sckcZWLmmEh7xEay81ANz09ss79IsZsp5BSu1mJGIXZFAMAcn7oK90V3Rqp2UuO0EUtvgRRAUgj7'
-             b'jFyoTZrIZQJZTg5VxN5mNWNYtjpkLG2UoE6AUhvL2Tl0CF/RwAu3+OTcuXKWpvpjnUOClSxmgqPr'
-             b'cG9/b+Z3MHNrJMyJ7iy56U4KJy1laRfaWWoxpvO9xd6hLDY3kKWwU0g1uWOXmX94pY+5sScUjkxf'
-             b'9IAKZnjXKzNlWmHuLj1ByDqQrqde1g5xGQvvq6EsGh60pFmSywn1mit0ryvaN2gz56lBaHNSpFOt'
-             b'HQWA+Qzu4+Cwjc3o3ESIMquRGe3GDTGzE4uLLaFtD88qFpz6OltVKEyHFzwHdJapcHcdQcTTrkT7'
-             b'x92o4TpUcrAogipEO6DOSFidkgVhLmXyK8gFyc529aGxzKfnZdWZbKvmQOngW6Gz5KmAvTzfGo8i'
-             b'G3sZRCJcg60l21kY+mwMSAlT9X2uRqJj4IRh952gU4+NODdBn8Ol8xTGUrxgMmLmBqQ6T15rEdb+'
-             b'Kjq31bWkRcLA8Kecx6uGWNKKfWGmBQi9KrfTvW69BJFMi7qYcbotsfBZIudIJWiadWApc9K06wiz'
-             b'Mqe2k/NTdJN6gPR7XZAWV4Bmc/MhYCGh9z51rc5Qn3lI2jzhdDBG/YLWtsnNqqL45DM6XYs33riH'
-             b'5+5yeo60kICLHWf+Xp+6UYz71evrXapsr0u2Bn3+WezQVLmpXhsYIWWLCl5BYrsl96UhQim1jrf9'
-             b'XcKZoofgcmEpqrApZnFciW7klGQOgeifK7HycGOjDHXoswbOUyIFLpYr+pv46OVs2hOU/e/cMPVF'
-             b'UZIi9iPX6tNrwdDAHqNJzcjQnwkEW9dZ10ot5QxoE4WiyWW1aq52coI9KNFSEF4RpciM7WTFrCNn'
-             b'EW5VwAezIm00InG1dFo3DNcxxNGN6zYeY4Ed0v6U4p4aCt7JixcvkJGRYWJHtd70ee7eeeOjl199'
-             b'dZnvf+1d0V9vvvM1+fo33y9HN177ROcjlZuF3gedb5ycnIVZim8KiXK6PDOX1N+fnx6bGUgm5wuG'
-             b'Kx2Zm41Z6X71qv3tk6cDcsMipILZf2mxm13YLhpxagCcexUecvMTzJpD/94WuMPKEclt7db0PduA'
-             b'P3X+t1guaXrD7HdKjdx7XRcs9N99H1IjIxdK8xHP7Mg7Rq/S3KIZ7FIbMWPfC92rTk7P7PXolBcu'
-             b'jbPoWC0MTDpVrphEXJCc5FaZtG6wHTo4Nfaethr+oh1zmLgk/rvEA1jEkgV9MetyVCipW+7J5ugW'
-             b'pGQIeIkYW84ZL7dBaLSCxGbkkbeQe2LcdaZh5d3yMU3ntqBGooPBSGIEr3qxZx5OgLCNaOY5IEJS'
-             b'aOah7ZGuKTQsLmk1OaADXw71VT8A9bXpO4BMxxmCYw+5xJzf+AdbW8u1qWRi/u8FEjdGjW6F18Ro'
-             b'8zslW6nsUEc1I+f0mq6WqUNGV57NtXCHUCrBQePmTtiQyy5SMz2iWOg9ARSs0KoW17LAvhuHrR5o'
-             b'unklux768zEuKJWBXZWFSgrCk8wJa2yD9WeeXZ6blBL8igEJgzbrrG3MwedRWd/ZR4Fi/iMDi7HE'
-             b'jIOYw4fszv6l1tF7yzWVIHzfjFXWQwZEQGHuhm/EtXFb2uYtMTtNM4MwCQviFHIGu9bWFR4wOVNN'
-             b'cc6nAvhy+pVoSOMEOw3LUqloZEO4hiW7JLRGp+12wYVR0hZis0fvEhZIynHYDgF176jB12fQuRsI'
-             b'gd6ZDBTdPQ2+vJtXjbsWrSgEMz8PUTNj4+9oIFQDPfCCC0hAMZa75hyk0TpNlxqD8xRBOsYN8ILe'
-             b'DrnMQqDEHL/w9yqX9MwRENE1ERLX1P452N+f5SjQfe/iItafNpmQDZs4H/sfApBSu39mRNSyJUTc'
-             b'WMycBSFL58ikc0UAi36vNjXpEgcrR0uId58+5+MvPgN60EMyKzMSn0RGhKF/deZvMoQxkgeORSdI'
-             b'Sp3urpvr16eG8cjGOc4qmJGmbTtqYXsf/sMvTbEgRhTWXxfbUW69cf9DVafkxw8fiP/68tEDuXX7'
-             b'zk/H6t7D7NymN/v0+UvyyTJ/gJ0l2cMzkNUsEUwRSV28cEvV8S4XJPbk0LfqRevgeX+Jjt+6KKuA'
-             b'PF8Z0pFknb3qRrMH/oAlzXjacceD30NxhHyEsfkD0KoUnbRDMe5imGqoBtT61Bji5erXVMY8kBSk'
-             b'cHWXDNIFkcbnN6PpvXtaC2dn+eLgHCNp0AmRvgZ13thgY5HDg0PqZd0YgnAwjS8U0ylhLZtB6jk+'
-             b'PsP9US9sVNacReq9PEfSYWpqH34mjbtcTRuos7gzvRi0498OTJqbCrh96LKrVf7aiR3dgLPfaN6r'
-             b'mG8rPIUZIHdI8/Kv0ZkUxp764udklJ7wV32/4xD2NojzNk+IVKhcOyCLCB5AUGvJgCV+rmdWZB5E'
-             b'3vFXnjaFs35AmbnSeKenCsMqeM8xxrzaD/+aQldv9rJCqaCToRqKkGhUVZPMvADsVmvxVTCGX+Ha'
-             b'4sDCLjqgKBvpf+DcFnBzaMpkZN2dFRzaIZDQqKMbK467KIi9etagljSapE47TbgS5sRQqwWe1ZoZ'
-             b'1S2VRkrA9GYxrM29MKJj0zzQqMLUxosxbQBgIczCTg/mC6JFev0VKjc42g5ADRQy+SJh32FHImCO'
-             b'GawWuZWxtm7dajLJjuMNk67q7/Ut68ECIyeau2j37attpY58HD0YKdY6VY2P9TAdJ6lqsQJSoxft'
-             b'ucG4Gq1dauN3+++12+z6lvSon33nhFXaHGuT5ZGDrsBSJU/U7al166oo2Geqn3EVLkM1JLVp+7VJ'
-             b'0Zm3xQzXIIpVIg5ajCv5MAeaar75CfvPPq8dGfHT+1WDnEbPpZlNpUStuEdDib24jiWQWRTsgxUv'
-             b'QD6ndWaz/Rr7lMkll3iuIWcthspYRPTsB9eZIZqkQFRhn67df06xl9mIqScT3vZ4lUlKboTj06ng'
-             b'tAiKLoiJwsAnyC8pktJ9t7hsnHsLpNCMLX76xUMglo7K+MgBI8aa6cLaXdHUm3SRoV85heNtQuff'
-             b'xwhWn+vN0REWXCdpNiJw1DTPM8Wxxr784rHxgPie9Su30/+88dbX/m5987b0d+/djwpIHY2++Z1f'
-             b'//H/87/+kczUTPiQmhBWWFVbCp4xN7H7884NRMn0YcaDVlusZZBrskEnyko0m0TTMSpqsH+0NDmJ'
-             b's2W5aSfiGhkz+RHwDUwxTHbQwjFAIOzD8xwV92ixleGsxg3Irh3Zw5zH6ua9nboW/T7M3HRDYLcL'
-             b'sgv03+0GWtdWeQBUwvzslorNYE2C5dBM5qFdZilSbdPEBtz1TEa0jkPnNXoID1PVphBg8flxl2g9'
-             b'22x89eeZB38JNyiNbrW8ioQuDwYa2wJUZ7O/Rya9rTndUCF5WWZWq6yifQEnJ1Hpx+injWWqxDES'
-             b'WZC4WeEXXilfQfcMAx3rSFwJYdwLgzGLjFfmtiW1Q9PMfAyqzjaXYfE0/flAZiz4K4uw21VEweF8'
-             b'qC+omjCP8pHxqebWhw58JNlutACnQrSgQMapxebS7nHO4UuQHcruclO9OAxOs5zUNee5lseeZ0E4'
-             b'EujVol9T32tdXGZ1Br4LC1FzrWxpdB09CfRrFDHQa7DVUQmUEP6erNDB50Lhs7J4UMgnyfZfWuy0'
-             b'/X0H1UBHcMzktR2c+AB5Z6HsUq6MjxIL65RyG+cEJshETtVWr1dM8Zy6p6ng1NccOPLZ37PiMvnc'
-             b'Va89xVN6z5F/QeMtdOhZUZEU7GqoP/JVyD6Fh7YVkhZTzfhwysBCt19n89ZiRlY4pOjKWQifOtco'
-             b'dU0aKERC9DrqPLqjYRdkxiTsiuvNy2xcSldFocmMIo4OLeyYcbLqeo6lpElMpRXFmfReSCV1VNnl'
-             b'trcQ98xsqHzeMjKdUQ83tbW1Ma+hAspyB3l03TVEi6inI7hOKg4me5KIZHalTpCOU20uhGrSA7v1'
-             b'iuJF2HRVImkK7et4AvP9MhrjXgoKyUR3zPh53vUy9n2zXsWzV0lg1iIN17XvmNFE1UTumvEW37OO'
-             b'ZjIRA6gjYE7VxxjRPCOSGahJa2wd0dPC7+mjhzD+WdMquLJ1T5HzoWg2DaI4ZinSSH5I6+SYF6Im'
-             b'N6dmNMb+tevTublH46SAwoPrZRLiHMgk1DVnpziXdiPPFEWipz373pv3f3z56rn0z58+jQJAPY2P'
-             b'jq797XJvPday6+bUEiWq7UC4SDYP9J/qBK7EeFXV5qqftLrlwQmtBAHJZTRpbr4gTNsCnGTdWQ+S'
-             b'k1kOY4tXaEXldL19R7fsGQ1rkG7MxTM56W6lOOyu+mdzXmsVdhfkn50e+mDldraBVCdQ7LAp64Zp'
-             b'TmLWTY1kXqbccVbTMRjGHgy3x3UHOIfDEGq03YVeWP9OK0+t0JRYB2iLGmSDm0rA9H3fvKiNiLey'
-             b'gYt2Qkq6XNksUWV9cGSVRl5xb/mlL2hslC0OFF+rqW1pGVp/m8bkgPxMFmbwd5q6+tX+NYT6VO2I'
-             b'FbnZ7Zp0j5GdFfDiafguNAixcTR8Pg75IWeYcIDsCIGVbNr7GXPYuvXRHuKuEiotNLexDSKHvpz6'
-             b'2ML5rHv2OzmH+5giT4pe6JDP8g2SGe6MVlTAh76MtLRNdu8HI3gCvBydRS4tzSMQjnZQhmfDaD4U'
-             b'cJ6jPasVj+bbDXZxbwcmnOVK0xvnRYbEaG//YOoPbNap3RkY0L0X2l3AyQWs+SU1+5WWrRWozY4/'
-             b'nwIFQz52Vgx0NMKZ+4eLpzHyQEpBQpMrpkDO7QBJq7OuvWR7/jMXphcMDflpnJPIAg4mvc85G9fF'
-             b'f68Fyw710WiWz1vj2HT91Y7RteFN855CpmimSMZTUAKsHkILolrOJlfIXZ/TlOuVTPlCX/6ernP+'
-             b'7Lfi0IqLy8udRbNOn1MJi+4s6M8CyJKOrhSirdlT4gr2YD3ojRdRAhqO4OfatOgmBbZCfjfQ05+x'
-             b'snp9ChDKTMvsFKQ7zNRddu3W1HTazEbCCNtnL7Ac/UlMSg3SKdcDZvJQF4kRj6ujq03jnyhRTKnJ'
-             b'Wc3mnJJn4XMuieTWgutp/KYajehuV43NXy0dUUqK+fglsi6mz73qOUGyk1X3jOXC9phg5UszmEpR'
-             b'BBS6BXqQlxU42sgeP/tKnn75EAVVYUJuatK2GU9D2mdk42Wv3IUvSpmTafU80Ed1tZHrU8c+XAn7'
-             b'mhFuZ1yugqycXj7/1UM5OT1FoJyTD7Xgvnb7zhfv/do3/3alzpPLVSf+Sxnkt19/7cFqc/B4F7BX'
-             b'JmS1A4kqebwiZ/kR8MMHMXPWBgi081l9ms3aBYQKD2wI8rM6Uk2bWqJhTbLcVDP4UTcl1frSuc1C'
-             b'PxaWOa3SJPVjR1feMfmIJEEGsJjNI2UYObfZDy8kAol48z0HPjF50MJkmv2oh1cAllGSltrLloGM'
-             b'zhIbQAquAbtG5mGXNJKdbl2TklXAQp0xdBn5IydnZ9bBgU2/wPX02yKzTRGBPsE+ypG8qJaYSgBp'
-             b'Dpv2Q5bTgnWpDwxheMD3y85mhdp74QAhYWv6+kvI9zq4zfXrw+lw2oO3f+JBGn7wJCi4RbJwlrlY'
-             b'Wl63Q5AGk7euIbHtrDTfARmQBj2ZTH/XYyOHQTeS7KlYGQWcQbhk6GraWKXTH/PshdKl7NHScV4Z'
-             b'VA6fCiJFcJHc7oKBL85fKLMohmyhVh4bLSxogFKUMisEPCcjhdOiqlt041CJlaZcmtPgdP2VZazv'
-             b'Y2gRuODDED7UAvaSBZ9K9BCfOg4hVRJq7Ae3NHaYUnLYuLorWKBCoxlWgShJFz0w1fm8doTQx20J'
-             b'vX8iyuPzNhD82Jlttzt2uBVwufGBPLBnR9hcR1IXJlViMJMn+uk/qlxxIqBFLCeqUEqQtSoLNf1P'
-             b'TQ/dW++b58FgcjYQnjSifCwsXCTy40uEL1W5gJlQDc90PRgzZ/OOZHSAka3A1HWj47rIhFDUk3B+'
-             b'cG6mf9SwB2OLnGZEidQK85RjLBShNtzTtfhYMIDHkyg3jAz2mFdtHhoxsdIy2jrqi4uBZFF7r1rk'
-             b'IKhqug46FgEawveqhxU+T257VuYeoq+vUjx/VisNqU7gN9J4TEFkE5kl3jXVV4qvQxgvG6naZISi'
-             b'z0EK6B77SG6NY6KlraICViCaV403wQWqA80NuGjNYGdrXmWX2rwoVwqGUXwede/TNSjJ0dbMtdSb'
-             b'JbsGnJ1dMOSt7bl15uCrz9Ll1GU/efTZtK8yAK02vlmOz0/yZqAlHc9G8k7SwiD/bKFZVwyDpqb0'
-             b'2muv2/vjWD1QRl6vkhhZnlwCneTLL740Z0aiA8P062K6DrfffPuvN0eHX0Gy+fCzz8R/ffbJJ+oB'
-             b'/uLm7bsfKhFw9I1velNaAHz26AsSMwo7G0tX8uooMU9er9Dp8Us6MrGOoTogrK1z+yB0Fpie3HOL'
-             b'meytU0dIy2DZ7DrP140EEiB042SU6kbadfy51G/rBVi4j3YOODiGO07AQLrYlsQczkShk7ycNo4t'
-             b'pYvufGafTzvsgdngSDgUQywGzGBLpDp5RY3rRXtiY13XGXRoRibYAN3khlaxgEU3GxzEYaBRjM1a'
-             b'IuDFNvh+0Uf3oofCwI0cvgGLpVzpz3LHzlia8gFOgSNmqYWw+ViteNLX0kNDFR1pvYbRz+bwFhz+'
-             b'4NWQbSSyXO8x6YroxiI3sqe0kY7MCh03RrERyggiDIhmTIjL5IRgc0tmoax6d5P2WdZ3pkVs9c5H'
-             b'D2SdjS9WMXZwUpPPKDt3VczNZ90XJrpt7wE6Y87mhfkJDHCz7ExZwsAXvKfiKMTY9vg0k1HN472o'
-             b's9eiE34E5Ev462ohsECaZEbxuwO/YWfvgQeiunaOREI6hrVA4zuz511oB8yuEIMWyvsQjQxo3xAa'
-             b'yJ36jiM7gxuhbuA1xqY/MMEy54bozSDfPLMf1S/cMudCv36js1ZqrtXPH854UajYvNgPYu28CztS'
-             b'jPj4+moS5GTFQs5ITiY/Oz0/JdRqYzddFtpdK0JWOc+Gz0EKxxJAypnESN0KAOtmCy/SNQgSZmcE'
-             b'6IGwsn69cgP8IC/k+SSrU6dnlWOcYiNQXQ/ardsM3fYhY6ZLrC87qC+Yh2AvrTC4BnOZL1iFYQ2K'
-             b'sWoJknN/B2R1uHpciy2F1/mAQdLLdacySpUZoxlKZdY1tkCdmEQSDdpud1HkqsLB45MNBEjWQPg3'
-             b'ldn4i/8MHLfBA2Zv6WIccn1sL9UibfB0TxYMuqdqMWJruaKDFY4PFGHZ6HWmbHdBcl6hKYxe28P9'
-             b'PSOwzkAIGF3RfRX3mJ25FgT7iEsnJ6KEFWJISDXIDlwR3iD3fhB3Ap1e+9OPf4kRotN74tyrPN9S'
-             b'yzTBGIC+FSn7RMigf+H3dZWxyvo3U+f/xtvvAp10Aylh0iCjZqg+qUypHS2R8vJSHnz6qTVyTGfV'
-             b'b70Yqnzre7/1f6XFvqXWfvc3f1uu/Pqd35O333v/by3atZHMdPG9ePUq5FqpNn9v4cy1isOCIsfH'
-             b'L0k6qAGjOPwaTl6ZEY1uwFP0jZ+a+YiGTAzMlR7soiF0ZdlDf99l24Qzb0JhlRYkGE9ec9Z7bDrN'
-             b'jQBVKCr3GsYmpvLqOUu0eekw7KKqK6UQ9q14uNWKtHP4yEmSM+LgjkQtmBn1fK9xIxuBEuTJ6WvO'
-             b'zi+s9isea0nYt5rXgibzOas79M6UBpiCYWT3XcGn6DuLaVWttHctdVbJqsyxJ2+iuI0ybXeha99Z'
-             b'1vvBjduyuXFHuqn7H5izbgl3RkLS4BnPZ/DFER2NPuza7dF+tjVDLeazwch2dyBvLJTpdZZE6A5t'
-             b'Rv2wwgByGwZROdnOzJdawIjNTnPTYbMFG+llUOiClxiPEh1BMTZu1WwHnfOBBNgiObDhjS0TALCz'
-             b'WSMGizw2yWZ2YFJJoSMX59B6q1GtozMZcGjrhr1adCY5VAMkwpNbWhObb8IOsF6l7aewcyu0BwZp'
-             b'kZCxrgX92W5uJAzGMrTC3ATVNRNvq++DgQ6uTyphnOWyO5/7zu1cM8ljjZlcPZBU5kk2uk60wDVi'
-             b'oHWdurln+hgYkSu3VE4iiSrRU5ttsL2nDWxvvdfmzmmc+eRbW61eFqsVk/yoZomCmdkClSQ2V8ZU'
-             b'ZpjoJ1Y2emzk0hxC9QD07jxMgpKpLPQAD0WLNNKn/4m5dlqBrYRLENzYoCgSBftnQuRa+Hhq3Ehn'
-             b'PLiLSooRXSLips+ph7546qmTIz2JLs2izlHL8Rkzs6MUjZlZRcsVuNmbEM8tEW9WkhFZ1YXU4e3t'
-             b'boh9Vai8UBSxSZur3ZuFIRG7rblF6rVAHgTPF/DE+sTI3BSNmSPK+n4UaUkzJAKcrcFDhgoKN+3o'
-             b'nQzrhZA/75A1KsFRn415yKRKbbscxZEqDSrVHhljhlE+/+Rj9a4n+sJCv6RQs9QrzMVmqOb3CL5e'
-             b'2gARccLV1sZHC5zNgdx6/R5Gkf6MZP4KVGVu+MLiXJvYh48eyVdfPTFZenzSThZ71+oH3//BH8t4'
-             b'YYX+6fELmf/avnoud++/9ZfqplZ8EbJjOlYoiCzKzmIF4skvgLobhAQzEWlBBs4yVhZp5kZweXZu'
-             b'sH5jDcnl+RnMCyrjhZXYBJ/9sWIDVpgSIRPVkAnxOTxg60W7eyNn/dXCEzzq1+MqdaPTKnW52rDT'
-             b'sQ0Y7P7RnAwzLTf1/S7V7Y+EE2PoKkQ5AJpXsoUExEsvedYdgGq1osW8d578ZHNDJff5pqMH9r7O'
-             b'ZcIIyfgGKokqxWQfQskJ4KRqhMoSnvkCZy/t8mSWq17pFqZdQCHLWqNGsQnx2ut7udgOkVXe8bDU'
-             b'TlVlfv3mpqR+A4c/JNT1K/xewh/dfNNBykGk6HkQfJT5H7Kg1JCHOWPcCq6OZkiFBN2KgwAGIyqD'
-             b'm67PKtvXJGqh1WQFUjd3NaxXOxoXMeL+ZyGj3irljjwP7STGS5OEwfUPD02lw1gzJja29mCFD6oy'
-             b'6qnTGHNeQJpBlGJaZug77QL02PRKGHUgV2K0zV0RGx2WKgE1s3DU0RLux2homBV1hjgsad6jSIxG'
-             b'yHrxoyMzuBRyZqgHix5mCpNDu815c89AHS0Uut54MPosjUhgW+C6W7RzASoUgElthwI9RJpPBwsr'
-             b'K8yIIFFi2QhcdeYk6ptlCbPUpjYw8l6mQZjK/ZbaFIz/H3tvGmtZdp2H7b3PueN7NXVXzxy6yRYp'
-             b'kRQpySIpWvNoRZasKFJkOQMcCBEMJ7YSQMhgxA5gGP4VJMjgIMiP2EGEOLCTiILtiFRkMzJlkaJI'
-             b'URRFimSzm+ypqqura37jvfecvbPXt7619nktSiLl2AIClVCqZtV79917zj57r/Wtb9BRh4ZiBUC5'
-             b'eUoSwybffoYUmDJDj7GFScvzv8GYRxPhJCZ2oDdIINd6b7VnESz4d/OOCEQG5X6fnGw9bli64/X+'
-             b'0m16LSXu6OiQny9gNCfQskPtJCbKvZqbhI0trMTUzpLyDeYYF3ZogjqzvyZXSO4viHV+7eIkoEsP'
-             b'Ctm/R4Z/ySEpqK7Y5yaDlUUaeXSKrnEfZkeRfHO9v+LDr2OH4s+TnjlKrJNirNAcyBRD7nrHxaFJ'
-             b'mmTDW2wzzzDZfyEXJ5dL9hlJrERhW+i/YMZFnN/JtZLCsXHRAs+arOOnyGaTRaTwH6TQMJdYM+eS'
-             b'OfkSXXZLGy0u2Y70HFiorz+a0h0Of5n9z4jSWhyc29jF7AWXm15xYx550CO+2ph+PCuNZP1APfwl'
-             b'0RTPDp+tNEEiAgOEumiIUnIfmac+/5R+3iFrAFR9Xk5rUXbp4dd88rVvePITuHaCAIhkb/r79OQw'
-             b'PPLoIx9P88UYaWEa6OB1cHhcD6NTr/p9ziMbFsc1mcWCdHzb+sAkHoqQZ/TiRrfirJjZyla5qNN5'
-             b'WEq3d3JEw5HaAdWLjhlM6qi/Vtcv6+YEsovUbctc1X0jUmrdJuGrPCFk6EbaYiVLafN/OIoRrpKK'
-             b'Uzbc09PjWnisXEbU+3uPk9ledGmNzUQF0uqZdT5jt5PI3ZXFKJ+tsTgVxh9KbtyKOPHAD5H2tnVx'
-             b'n6rF7v7eWgutEics7IkL4kSjnbhJyQ2dL3slAhKFkK5jDfMfEjxhutOF5YXLIa0uhG6+xpzKHCJ3'
-             b'iJyljTNdrBC9O+8nIS9F5WQxmh2Ddyauf8VMf6cbNueBAHqjEuXk53SBGeJJE9IySZg9Ush2XmlL'
-             b'Jwwb2UlWhauFqITwPG96/8u60oO357/3hMAjZ+wZoUMaGsSRQbYwkY7Wvp3P9Oxgi94ZZh/vyHo2'
-             b'P35FAcQDgNd8RnKVPOw7zT9HDnpHORTji818BkZZ9VpvR0ZW05rUdP87c+9cLRjTusP12gw7bCgD'
-             b'tfGyri2Yx504af4l925zeqzjjTz18Yxuq2qHtLwHKVQD2dZHRxvt5Odz/O/tRk1f4H4nJGHyFmyB'
-             b'bph/obTg3Ox7Q3KtvjuKGvqYzjr0tSmLBsPcPTh0QpkUQzOD8NVEHs+wRaPKHjTvJf9dPTX0oGmd'
-             b'XKSsUfehOAmAKbSVPuPw1DLjLfSn570TVKLuL3pomTuJFuSFHATr8uw6l9ieaduTR1MVcWwQJgfN'
-             b'CBOfbUtV4usIFK8qVZWVijxQSHnZSS0q97VYYPCI6joyToc0M3s0EJP3IZ33qXCMuJ/O+AypNl9R'
-             b'RCnMhJgn91Eskzsqp0o29YQe7ALHd9TeW8Hhl9N5E4pUyGuMKN426uiaJi6IURsR4Tms6nUec24x'
-             b'JrngPSz4PkpIkyXYyIKC2goSqyPVjMAo2JSLYqcWzttaSL347DNhc3SnFl1zz1mJ9FGwIKhIc59g'
-             b'o90SgwVI2lrQaxXd6A4Ww7UpvXT5kXrreh+T+9kSk6vrTMZcxjwhxoZw+87d8PTTX9BzD3CDFvbb'
-             b'uu6/7t1/8v/oy3B6fPtGOL57KyTpIKe/7907COcv3f/F+bkL1zeWxMT531E9/O8eHIGAZ7nvsVYw'
-             b'MZcWcMCDC3aId25h00qhdcYxtQ54Lsx1VjxxqmscN5Q8KUsVfsq8wAK/R+oalXHfgSRlKV52sfST'
-             b'd7i4xVyiQgv8EWY3NkEcfjMvDIoRU8qoEZe1AxJpoEA8QCOgTOhQmQHa322xscoBpW50CTnatg/I'
-             b'wYJqUxbT9uRMWtyydjOSAV5K81NH/rl0GrxmqMbP7WnKVmibnAUrId0JMbq1gwf0GK0U9cxu0T97'
-             b'RxLbJlPaT2XFHXDoATKq93h94aEw378/zNYXIYuyzAA1gGGKVt97FW3EFzwMZmQxlclNRhZSSI00'
-             b'a9LunSqKTlnSoiAB0VMkVzSSgvHNVvX/cLQDL6T3+bkGZowk4zVzqsxDSWephXaZ2skNWf0mBMod'
-             b'OVYwZEQPXCWyZUb4yqGYLBNDihKy/8MEGneyUM40mNqxaEja/WNdzHS+D6fBrJBlzpN47ayIF3kb'
-             b'hWS8jThq9h2CWICyaYykjipKYaR0xJqWn7FBEa7vOVGuJOsV8HHSA7pQ0hqTxX63yFXd3EZKmOiv'
-             b'UEor8lzrXhy6VcWmHdoqp9J1Xois9J6tfny6weeX96HPcsR6bYe8FnYHMgsOzBjoCmR4KFLiSPvs'
-             b'FQtanTUKSiDSwmbCpJ4jakBjqZc6Rw6UCfedjls0SXPLNZ49Lrw3YmB9jeOTrfvQC8M9U+IcSNgz'
-             b'8ljhZ1iCwBdbIlyfLPtLkY29ucLKUUc8Nn5R2Dg1ElpUSXKmNFQ+n1gTJxqOlaL+AXGCOhlZr0+T'
-             b'13GCKOW3o76WJOG1bHpzHTOL7EjfBSJZQk4WjkM0VCT7z7PPtYQXRD91Tuao87gpeyK5U3lq2avF'
-             b'DsYGu0ykZKKwKYH7dBv3bHcjUBojqlvEtFzPHXMrzChN7pUgYqNJsgNJhxjzUZIpoXSCgtXPIKNo'
-             b'2Q8O7twML3zxqTCcHsF9NXKzTRYlTA9+RxLQADTztzMTQYzdNAAoImpeOGZ74f4HHg1rsWluHpoT'
-             b'B8twhjiqghF9F0qg7sKnf+ezLeqc37MVztD6/Mm3fM/3vrcuBFhxy+/+4UceC9NfCkt1dx597ROf'
-             b'+uKta48ISmHXUzZsKRJA0JBKzlgPZfSF2lG7Dk4fndmG2Jz0TbdbokldgjsC6kOvOuyTw7thtX9R'
-             b'H4oJ1JjpcmS+4MgJSIUHQHDintt9Uu9p5holJicddmS5Wsc3jiojSpSzrNbnYDJjKYRSDAyQGqnn'
-             b'O8JT5N/Ef55Q0YycAZXCGbswgbMgN1gLnkkeAtEU6ZDkZwikja6eM/Tsmlo1JYEuuV6TVTfXKpqe'
-             b'3aljyETRw12qc3nwOuhq576JAHEIWumrA5uiH7KJ6QyydgT1+9bnHwj9Yr8+8OJKVzc48fGXg1gO'
-             b'rtPBeXOigtiOJz6XH8fRoT2bGWr2Aq+7j6zoFSAzTin2ep3/jqjqE0Y04rwIySlGNhnM/8yHKtNI'
-             b'E/9zGJs7W2LQkTHT6brVmLlqEJXAsDaYn9B+px4NHdnXau+bsRkgTz6mtuHQ2lZtcZt3uZKMKOnh'
-             b'1pJS72E1KnvU0BRkRAyadZHYeRYWRTC5kpn9qK6cSO+rawQjkd0OB+bmROx/1XEs5CY5w2ElnQp4'
-             b'GQkHOe7bbuD1GWhlrPAgRhHYtAdHElKpRYalQJZWJGaLXDUU0LI7MHukhbJo/hdz2haHZnbF/R1r'
-             b'jxuaEKyiE6v097m9cyzKCs21unrAr33Ds/RGIQ3K89DTgyLQAz3ysFI76OJmNVJIDXQDFKkY4Hgx'
-             b'2oHRTPD7KNcIcG9UCabOdI20TN+QjpwmL54TnqWu09GoIJfmuKUIWeOD4DUKffBZ1k/HTOacibCx'
-             b'PLEg5kgDREpmIOBQVw2cF9pCtrQwJVGpHNXiaf/cOeXq+YjApLKaTSCHIWB/kx+CUKuorck0ozmz'
-             b'0ohtzoKvTH1N6j53eHgIgpkGGSUPdDLJqHyfjXHh4TDufEomyY8gXM4X7m9ib1jGNVA8Yf+a4b9z'
-             b'bqoDdZtNrcVuPkG+P/icXsaLc+ZcCBlzc4q91/xdFOxLiAeWxm93Uq/j3TvhxitX698VBuNlRZrt'
-             b'2XOnyjjhr0RGh+fJ4Z0aP0RQKDQBBfk55y9dxr4wMlcmWQw7i1/rAM36GMgpbK8TnsXrN6+HT37q'
-             b't9F4Fj7b0rQc18bpzd/0zvc/9oY3fzpsT4Fq4scf3T0I09+Hd+7V6mYbHn3N4x/f7kavOiNZ0tev'
-             b'34TbWPEs+lahJp9FaDV99/atWs0fs/su7uomXf3hwZHPhmRO6HrWQhe1uihOa5WYOB9PzHjOnP90'
-             b'5ivA+b4FiYhtcMqlRbCas1ZqWcuRJEZjqnbdElAuglWkyxxOsJFvN0eQU8PIRDbg7U49CsTyctBI'
-             b'1UJpoGBrwlIVVYF0+vPlsmmcCXVjtmfHgnlrEpKfzTtAlGZS4mxdVsQy31mTedugfVVFZELf/azz'
-             b'0YzAw2qilDSDncY7dijbj4drGqQidRHKYbvcC3sXHw69SKo6Db7YgWinBZt4JlhXIJ9pc3zMSju5'
-             b'VK1MJFp2kAbSUORgw/s1oxBAqMZMj0qwEfKi2CrXQ3LW9ZwbKq9DHO+yhedMpOcp6ewwU6bph21g'
-             b'KhahQvxdp1ySWHJLjCxaHBiAlKU7kMJQyKg03oi0JgVCEPWAsnVl4U2IlS7NBTBxLBPZ3SI3gOCj'
-             b'jsvmjPlVEqrYquLBlAMc8/+iRiZMNVTvAiXzzecdis+ReQCGHqCwFbc48Fh4LXajIwtejE9m8YBS'
-             b'wUPpm5QtRZd1NkZzmtjBtoyB5nvATuVVTm0YG40DIOVpGFjqpkU7E0tKI3RZ1wP9vIwWdxyb1Sso'
-             b'3u5qS6yci81mRy8BFp9FvUKEQ7Iddt4NdYhctvvX0TQoUJXgEZz4Q2beOnPWmbn8DPla4dN05jti'
-             b'Ej6BxaVQFvIaEw0bKbi447Xo4IX7I74rlproB2jWYnzWKTNckAhcs6hIiM6lqQ8Xi1fKGUcaQIXS'
-             b'7GZt9LG/v26eMVAsFZDuVLevRjniQWJWvbIfH8lzHYv7iVhjrtLGHUcxzaBIvt7uocz/4aYYRifs'
-             b'ybU4AcN/p2FXLWGt/v0OYwL5GniukJ9SGAQ1I2lzsEI/cWYuI6qBjopJQ7RgIsT3pMROdXxEMWjp'
-             b'lIxqBupF3xYhI9KskNwvtQ7fnB6GV648F648+1S4deMlSP26CX/FgudkF0jcbxIleTBGc/Ln5M/c'
-             b'3p98x7auh4sPPRrue+iRuu8uwqCBC836eUIgNXmgxefGYpkqWpR++jNPhQOx0YYaZcDeIvLtoe4z'
-             b'f/pf+7N/y1xK7Xd/fHIUXv1LZoSvfcMbPrIbg3c9gQ5KB/XrZY64kE3JJDxEAmwWr9U2OY8Wk8rq'
-             b'HPCkuHLtrVwXfXK8qd22kpuUs8RLQwlaQsqfdC0DrXTl9XrOFPOEoaowa6GsBA+3SVNo/oJDPc3w'
-             b'mpaupkSaAQeREqmjJ5eBfEc3LmWdju5WOCLuUbu0OYJwTnW0IRVc1oNFNmPpMpCSVSwKQqtB0dIi'
-             b'wrLv3MfdbWKLBpSMtDO1g0Qd14J3v/LQgzweO5dHKcw6c011MeMQIBQ9xwEZh1VHjXam5GR98cHa'
-             b'+e8B9l7WIkbGH/a+LeY1lGZgEibWoxZHWybRsBahabsIumFWyhblq12Hl3CekKeRw/o6QF0G2ioH'
-             b'XWPoRjoGhlDGY0l/wbS2EmubuolTYEcZlXpGJDoNAjq3JMCgpi7+YAWVOpopjsGrUCVY1fCqLIpI'
-             b'EpAWPCq7A6zfmSsk3cJidsWEWI4KFDvSXthSzgbGF9sBoQdWYixyAgdBZKhqXz2qkINvyXgvlkBZ'
-             b'bATH9aD+FBtCiTAQYIBOpM9CY36HCXJlfyOIoFwbyWk/EXtcmdPWDVcOrdlCCzuZb4skzuKWgx9Q'
-             b'xR081W2TevBZB8MsOexF9WKkteLmLq0wVq5MRvGY5irXEiKf3FOLIJ91PaHngX4Z0aHYniMURSwz'
-             b'9hmXKooyYbHyseV80WsIGBm3SGXMGQeQzLDhEyByWHJATFFydHyKjnFOYxszrII8jmM52axl9ODh'
-             b'NuzWMTrg06QJnTP8LFnisi/YoWaNwGzFFMtkaEyHR3cLh8cZIG0pHFvSJrTcTKsjsiZ8ibLw3BGL'
-             b'rJb3tb9et7VAaZk8f7avgFBKdQJGKXVPXJKcKDJIl/CGxlnaW668SZzzdUaLlPaWqYM9tI1jcGmz'
-             b'xi8bG76YNk7QGHH2RJcelMbYayO7PVVzuPkiuc8JoP5OC8KOnhybzXE4vHe7Nqp3Q9mpUszSWi2o'
-             b'KBQzF4NtF++5Nm+5TLIkqDKxJFgbZQCRm6/C+csPhOW5855JYQ2MLdIySaLNsSE3PhGhUurKtRvh'
-             b'Yx//FAjreRfcTVai2p982zf847e+/R0fKMdHk/TOuv4vXr78uwoA6Rif+Ko3fSIuFkf1RuyZRlYs'
-             b'gA/rAy9VnDgexRxZ5SlhTF34kvkbYpO++cor4aHVnm7skyjEzpiu9ev2z+95ap8m+PH61k3t8OBm'
-             b'2L9wn274o3byxhfIvglgCN4yBEphTnt2SA0bTNYDRLolsKu7dIZxbDHBmr9eN4LlOhydHMC2eDzZ'
-             b'YLYvjH9JZXN7ThQ0kXG/PefznO30HeOL1TXOixEWsEszRCrNZEMJYgM2G4FxujzpvhSfwgI8PDkG'
-             b'ZAXmrVsH6f8d1Codr01284QfNGGg0O0LqER9gNcXAPl3iPPVZ+P06MA1+dEe+NCrJI2oikDL8sA4'
-             b'xGkpbj5/tDARpjbCZnkA6RCM90A4fKae/jJSQO78LqvJEsNkss2cqXiQh06uz+A2wzp/s7FUsi6A'
-             b'1qA4LOWAHEbKORtXxF3dCt0aRYaatEPItH92h7P2wdyzW+d8LUs8RnPjE4pGj0NauhVBkOTY7usD'
-             b'OoDNOKiUNakEUcYdu6wZEoFubHLdNOxqpL//iGdH4eY5Ie5M4p9G/A7jBgzfTC0+0hKTkk/V919f'
-             b'W5gUOj5JHA1YkmEHUuIwbNztzkxyPNOB27JFoYYcmuVqVPXKjEX4fLHwnI3kvh8x3Ds8xoG2YEZA'
-             b'Bul2BBoGpUlsSKPmNATC5pQic4S8qRvpvJ819j468BaAZDwAHAgWipQ1rRNQNLdXSMVaMCyzF4Lv'
-             b'U4nOZTbj7mgbK4evfI6pgmzMA83ROhzUVthqk6R+ErM4o0RauRsdPS0CUdJIUxejDZ3b35sY4ceJ'
-             b'pbneBwGTsiMwRKGKEodRcPocfercl92d0wr3zkip9AGQ0KTEkJ3YUuLDbqPpmHINUZR4RISSdeV2'
-             b'zNwWV4nG06wPHIBRG78yGYl6MA8LXRsrmfvj7nSHMaj8tjCpKScFHBDhEE1kcoWW7Tq2yC7ZTlSs'
-             b'4drLWjo6Creuv1SLtnvg6MxnyY11piOwGCYWx0TGMknA0RwiSWMt9NOxSOAhq+pptX+uHv6XobSB'
-             b'hDNZezjZr5srSTNjMiOsWDCeRO5F/d8f/djHQdjsqBJC81Cfw7q7hu/+gR/670SZJa6x019AK179'
-             b'e6wH0CMPP/bcQ4++9guFcyxjCMviF0JOzzzrKSPW/KFdFgZDCN1Mi1dyYcIFmOaG66KQjd9Y7zKE'
-             b'SvWwOBWHQMKvYaCnM0l+4JnJHJsjhuw3JjsRZYeNbOS8pzhZT53wNh7jq372WTX79SCQudACh9AO'
-             b'xjeCHPSUA8rXY9OFJ0FHprQuLM1kL7T9tWjH1K6TkaHkAJzgzvYg7oTcVILPtAPHIIGhEyDrzGZ8'
-             b'VlqyXuCccoVoWSV5jUXT3fhUYR6kr6uWmfKsjmkeFnsXa/ewViOJrJ7SSeazhqIgCrNTU6MyhY9z'
-             b'8znnGjFOhxz+sLcluz+SgRypZxfVhhz6aqmsBz5gcFF2CORbgi94t0wlSUe98tVNTy2TJyEoJDha'
-             b'miUknchhz5R3JmwwIHQWQorjyK5l4MxeY0HtsybOY4Xl0sXe562JcLkRWopFGWOEdNIUKAxV6uDZ'
-             b'v2VC4wwOiTZGkHTFRb0HciiLggYBJiZjDNqhQglTlKA3DgM3rkJPdGa0d1qgKkTNKZ0092V0tzBN'
-             b'ygwkYKmypsTm3z8gnCe8CsoPZ3z+DZqfyc8LipSpg2RAcWpfgxCcOPFk4LO/WqxUugtlwAYkULDS'
-             b'RfJbX1OIg7YTCrlLIU29yDJnHoliyCE8PbjBSO/7yaihcRHKxDNDkbTEcVhsttF07xQf9R1NhJxL'
-             b'T98L0YRncGdm9WBeN/04f75cTwm+MSjZVAvC2JcDVSOFtekR8m4XO2ezy98fSafGkCwgnTmekUvb'
-             b'a51uT13qZ2mfR6dH5Mg062lY8fadkxrl856cKsdDGiE4LyrdPezo7GlFkBwwQBRDs3G3MmREwzXS'
-             b'EyA6+hpyG90UR+Um8JErycLkfjBcacLI931jEoIgyOR8Nm+AeNRiPXVaFMh1BI+FKg/zN5BC3BIP'
-             b'7bATVO/erVfC1eefCc9/4fP19+fCyfFdcLZEYtvBQnxUfozsDSD8FQb7hIkuX30oMrw5dd91Z0SJ'
-             b'bYf/YS3gpSDcPx/uf+SxcN/DjxDZ3LJRm3qhUInVWsaWUDkhg4vtvnzGLz77bPjc555CwaWfu97f'
-             b'urfeOd6GJ7/2G3/xnd/0nn8g41OQgKe/b9y4Eb7Ur+VqnR9+zRs/+vmrz33t3txmDXp43rh1M7z+'
-             b'0QcboS+MXmUbQxzVFYxHTgCnzBYrmkC0ON+Uiy8EIzgIu1k2BpVQy+Y8goB1cnwQFmL6kWyUMIEl'
-             b'Te5SQsuwj+ZVyOhfKypKokVmp8UCuit9YFOnB5VU0xqOQrlTHhlgOMM6UCMR7egkm1xIIvKQiPRK'
-             b'KkbpVuTBls1h2GqSmki7yoQH4Qcb6+OdHRBRkvzWPkMKE89ym2/Lb4R4MAnM0AOP+J24WYCBLLaW'
-             b'fJIgGULkpUYbp8U67F96LEQUdD0Ki+3pRmMwZySjUP4tn2FkKIYZl2QSISexRM2dDKl6auTk8Djn'
-             b'29GYxZ2R8LZOdhRoPfJgB8VJCij7XpjcbL1gUvYyN4ue81x2Nuawp4xqNYAx9CVMrr/N3BN9JtQS'
-             b'N7bXzcU3L/VgHz2wyD+tSTBp2CMHW98vyR9QtATXEhuG+geIqiBC95OoXglAmARCXAj0nRtkr6Oo'
-             b'5O0X3qscNLZhymuIWoGdsdg6i2V2T/ti3LMxwuVu4Ax35GtKsFLgPHzcbnnI5LOmMbG4X4VnSLCY'
-             b'bk6A2bvDaCRYU0WnZpiUOKdHNC1JdYvlvFmmEk4NcXR3vf39/ckBqw6DGJGIRS5g6dLuySQhU9jm'
-             b'Irvrk87JRd4lrn2JLpJH8P1PmBOjiyMStAM6MHekUmR18lzBuEg0993eGb+JgYZQWh9HWBP7pl6i'
-             b'q6bQgXoAmRYfs3l0PomOa8R9Tz9vHozUaftZG6cBpeqSLWgnJAJxSMUPei/WY3TSZyRsH1kMrtb7'
-             b'RFVHjv9EhZOZzteZo4EbXyU4Uk4QE+ls6zWTOGThAERKvQv3ZJGrzoWwmjjfjwH7khm2ydfKfiqH'
-             b'VMdmLE5D4dy3sLghk43bBpicKSfm9FhH2iA1s1geRyX2auGdw+bkCOtAunBBgVIZ9FmUQqnnoVvG'
-             b'oCGAzEugg1/QWsyLYO/GragxyXUGNo5RsTY4MVy873JY164fIXUcHwULjSpnyeGOuFkyID3+kcwK'
-             b'l0DNMZB7fVILvn/6qx+qe+YMnBqxEevjDGtQwmG/+wd/9G/N6jk1vqr7xxp67Rve8CULgLjaC+94'
-             b'1zd98Hc+8oGfBOw86iYsP+HWnbtKyAgtKQ52PpwZTgi/gFyPDw/Cxfp6xLJ1cWLOo3GPiaxguaBr'
-             b'bnymA8ZcF6YeUqHO0TFJQeC+i2W6MKbnZZONgNk+Dh4ZC824wM3Qd6vHu0Z1ZoW3M7YowCfo+sHK'
-             b'HGoFd6oyHLJ9ZXMVr/2OTFA46mWNVC079eBO065H4w1g04iHlAtYFoNUcrK5qBaWaXAMUsHGLEY9'
-             b'9fssNc2QDtHZLtnxy7UUFu1qtZzwLsxYMKPrNcnSKBXzfB3Wlx5AZw8FQSooYgzy3x2fuI2kze2D'
-             b'w5RNX2zBFcVT8cgd6Symc9DRAb5ODZqQ42BRuVFJowjkmc8sy02DdxDkE1nUcT14ol/nBC0zyggj'
-             b'P2vU1EGd7/dhtA5ipKNd0INYDHOgXOiVBGdSSc8ASMUDPR0P9nSzruUahKmiRQmmPRnUQnCCIiMS'
-             b'euwaVJ2si5L5rayzXVZ74LF58UeOmZT9rnBmBlqwxBpTJ8ctfl7mjFJIXmIIhQ1ORgdQDiw8CGhG'
-             b'UmsZRpety0dVpNQUNU0f7Y6erk1XkpGgMGuOobZQSnSaYEh3OJk97+3r3Pjo4AjGLsg2CHGSxBc4'
-             b'XzVeQMuHV4VOpx2XG80n5Utw/GFI0W5U+3IdKTCSeL6gYkH3AyGV2QgjUAtvROOB9uPys2fzWYPG'
-             b'S3CvAyVRWZ/uYlhdj0U73mAWrUVh3+zFSWg+FMJ4P7aQHE0bPIHKZ6mbP0cAggYKktjv9RyFmOKi'
-             b'87S6YuNTjiR7FkZKSOxgDiZFgiAlQtY7f+E8fsZs3juLP5DEK9dif31Oia4Mj/JGW2SbJ+q1v14u'
-             b'J+oE/VPuu97fpPduUGUIVCGzBV5GzgJMbPMWpnCyF8pRKevo9EhJ3zoOSZ6KB3lr7BzpUDCBGLN0'
-             b'8eRKWQ5NKZkpmsFdVlFkZ73+MWjollnVYS+Pyj+B3XuZ2KTDfIdGRETYTONfyK/wrBFLmJXmTcYN'
-             b'tblaLvfCcr2nYXDzuTYCuUk4A5GgmIqrHqIz/9sea94lzTCrRaj/6oc/Gq69fKM22Wu624oftioa'
-             b'vvm7vvP//LpvfPcvZEHPUv+7CwDNuv7dv7rdafjqt77112fL1aZWjIv6qKNSkTnavXuH4V5dSBf3'
-             b'Vjo3xPVVhCCZtaaxgusbuvnytbB//pLai9oDlBSSFHcpVNNk65epZCTHZigjwTbhSDu5ruPDGLwi'
-             b'NvIEZqlZyV2yMLK5q7nbnGyOx/XmLF1dYCxoheyzmmEADut1Y2Dk6vZURwKAeHYaNoKfE0zuRhIJ'
-             b'0sV6HTSiehv148GeV4jf84kMR4l/UviECa4h/yGkKjCC2cnKg+xoCz/zatmUAYDH56l535cy0fSS'
-             b'mxCVgJZW+2Hv4oN1w4/gdsAakxIW864uNsOawHHZHCuYpcAnhMUNrZlD5INY2O0r4qPQOUcl0n3C'
-             b'5a9W/AxawkEtKEM9pORwUwMokt0Iy+oDZOFPgbpolfDZ2AFZEaOOCOoPwZgGJElAlUpyguSzE1Rv'
-             b'wxlhYqiTBRhlokPNucPlbJOCzkYwQJRY4CYa9mzrM6QGKXM3mpo5w3n0gwN8FQP5BO0wyRn5AFII'
-             b'BgZKyfse6TgnDpPQHaeREa/Y5zTxDFLVgSOSEfCvXGsruMqOhEcW9xiH7baee0EQwFUAPuCTcJh6'
-             b'UAmpT8h+Q9f5QShBLUvp6jstIORZwJqlY53Kwlr3Jl8kQS1SxCLbPrRkPHlFhAfVZ2+PREDraKNL'
-             b'uXKDRS1u3BA/Qt2dedhzf1C30OzVIrNUYL6FvUjQhDK1so5k/feWUM0ciYyRjBR6CPSiX8UIS9lB'
-             b'LYrZrYoD33KmlsSB0kizbG2MddrrThAM+XvhNsyNrBz0EJORZt+vKclTRAUhODHiekcSomUur8Js'
-             b'5nP06hkQzK+CYw+DWcx4xxACkd3J2lvvLT1tT8N09Pul+LQEQT2dO+xvXijaWqvdtRQ3RwcH4eD2'
-             b'DR3tUj5qz3Xwg1d4KVHjvonadDwktbtu7zNQVgceszFLBObPTaJpnJPk389hdJ9aAJsQjouiMSnH'
-             b'5qFg0nOG8ORJcaycDv3MWqiqqZicccJ52b9wCY0g0jXd4IxIXgqeP2PjoTOCmXDWLdXcI6KbwhE5'
-             b'quvp6aefDp/85GfqGlyFgXkRGjVeX39x/vb3/ciP/+dyc7e73Zc85/s8lC/5D2JP+uijr/vc5Uce'
-             b'/63NtWfeNesVektF51/Xb94JFy/USnE49fPAwiNEdqAuSIgZw8YjhAph5eZhcClEn+ZhbylkwjZ7'
-             b'0w5PE8XGsmV3MWIZj3VDPYGb09rlP2ESjGgQimz886hEotjZvVQLV3iiM04y02/fbGqh4c/qSoeD'
-             b'LgVuoqr1B8zP7h9wdd8zeTBz4RXCq5z7M9I2M6u8UGJkBg0y18RDGidMcmpCO2RPr0Jz3pj4ypd0'
-             b'lsVrBkwyupkteWDTCrNeOcQAU+YkB3JXr59E+YrZz6L+93i64cyqEQUlN7qXsY10EbnlNUSb5UFf'
-             b'yjl7VnmeWj7P9KHtlbhGzYsXZpnVuaRXSfCTdK/DZgeNP1j5QS1B1UPCDqfSSID4DHS8YzRpnIQa'
-             b'9d1cA4Simj0VxqJ2LKIEx5H3gayJUrzbQkccWiY8Hrgz2e2Z6pCW715imFTpI0J7sF2VpOtGeBrF'
-             b'bIFJKIOSQL0SiiEX0pVQGtSRh1JYqCAspWQP4pFgHrmfsjEnyDcz+RRFo0hHtTYWIulsPvNwHcj8'
-             b'CjeqvuN9I0GzI1HSdOvTuf/kv43Hs0KULTfW1AhYe3vrZoZE5CgyeRElBXc+KWJEYrwnzpM5qhd+'
-             b'bAjKtha+QuJaIOFxjkbA5IwHh4eaNUBodLvTEZQUVrN+xrGQWg/3ziOphyY3Xsq3URQKtK2NhiJW'
-             b'eyzCHfXgWPJ0u1W/gmRGVuoNoLK1RhRUS3F1tQs0DJJK9Ny6FT4lmAueyoYDGwf5PDOoDNTiGPdv'
-             b'Nlf1SBi90JGxyWy2bKZpKdDVb+4SSJuldJCAMSAqNTMkHUFk8hMSfAKEs2Ey2sJnQhj5PQ2GoqmA'
-             b'3JzI/By0gcgTx1GV8WXYul+5cjUMtTiJdHztaa7UGWJMG3kc/GY1bV4bY8ua6EKD2fEzYiF/yf6+'
-             b'a1woD6dTjb88k5HFOxpQ+d85KX6HfdEjkfRK0/TMvPfHCQG4uMzZMiRILqxnm3T8F++/n34Ric1j'
-             b'nmTDRLXtLi0hF9c2x4kahrBgzu1MUKFCffY5+kMxNwt3790Lv/bRj5OjVHf6rNdUitlrN++F7/vx'
-             b'H/kfn3jLW39nd3jgSZGv/pXwRr/Eb7lc8/1z+W3v/OZfPNqNrvNXe8GIMYDB5y5ZSFNvZ8uF103g'
-             b'1o2XPTSoBYcVEir0axExObZAA2XlaqwvCFnC+JbAIFS7U8IEoUruPIt6IyCLMUc6RtqiysWB0uv1'
-             b'Jbtc2ZmafCczP7ExRiZ7Vv9tRAHTy1wQEBioRJO4Fc85gFxLNn0e/Kh+5WAsNgaYjEaMjGgySkKf'
-             b'CuOfBqP8wEAitkhUWR2y6Z1sNpwr64YrM0uB/92iNIshiKWA6b/Pahcy3zsfVhcerJvNPhb6sB28'
-             b'c3W4Cc1VfX/bXUvGmoxYzEikseIVjpKKF650kjOOPAe1NFaRhr7fjjB1YPeC0RJkk6MTdixKOE/W'
-             b'S2KmfDFfASeTkGHcNX169Fhec+NjStuwdTaupt+1G7Ibdjyccmgy25FrODkha1pwtlQ8hU+FxIjD'
-             b'jIVZLBOVADXDiZHHgSMnMqR0A8yZGQ+6NlNos9vRQp5Mcw6vDJ1tyjhgPl/QBrge/hsNC5LPmMGt'
-             b'qBuRQK2GeKUAaBkHxhhwr1BoUNvtB5XJO5vsWEd+HW2O28Df74Vn1RebcXc8UNqVM9tYJKeJRazA'
-             b'4H5fLSlSUZVQmludPG/nRK/u+6LmayByNxg0rL832y0L49L88F23HXzMVs70EJZfMCKlzzgpiQqn'
-             b'xK54Q56EXIZZ13nan/i6m39CNrmmJ8hFN1MTWaTnt3scrI66DHkT8mE0blRUSfB2N/DVOmre5xwN'
-             b'KsIVY/LrJ2NMO6gl40M7oY7R0J0bC8Fg7OBeuH37JtaQI4cMTYW5Dvk8h9D6B98PZC8EwhSao+e9'
-             b'u3fD3Ts3wgvPPBWuv/BMGE4O68Ekz9rA41WRoeSu+Zb/EDS8LGJy6Pteik3xlS04TrpuQfQSo8/p'
-             b'aqleHwrHZzuPzIbcN66EgqBpKaITwluej42gArwXoOfXkTvkfshDmS/B4L94+cHwwEOPhQceeW04'
-             b'f+k+IKryu+RWSJrSKBHWz8UC9VqBU6Zng9tsZy86UJSUhgQIf+Ljv/mJet9uK/Gv08+Z4CSZw/2v'
-             b'e8OnfvTf+Lf+CzH9kbjx3+t3P1+vwu/5q1bhX/uud3/gn/z8z/61HNV8Rx2qYnjllVfgk9wzHAdz'
-             b'KHxIY6XLhj0L6gVRD/e7dzSJTCppC4YxGZ9NWS3P2jZQbqJl0uknMYIRAxq5CMj/blVSJns+ydyv'
-             b'T5wB77xTtDASm5dpHPCoS9A6U2jEZ5hvduK1LrI/+m/LgyPMdYf8ZeaZlMWZGF+L9zwWd4VyopgR'
-             b'JM2aVCDR9cpd1GyDEJh3//z+NCuFpkQ7Z77KZ+uKSvzgYFUXg5BrhD/Q0KPowRyqxd7Ug//+MD93'
-             b'Pwx+Rs60Aq1/cbvhdLhVpEI1HO7dYFa7jZC40y4IkrStSitHNXCCNS9nYjJnlvlfHk4Ab0vnKrKX'
-             b'bJgYNeqIOg0a8RssWyBFJwDhgTAJ25gnzG6al1BqI9ddZuqQbg7qIRHo0BdGRUAE7Uhm3xvV2Qxx'
-             b'xEE3NOQTZCXsGeKh3Z/JfJp2XzaqAZ798vPkWm+BJGnQz0YjrUe1ZkUKHw2S8k4zAaTTxfcLeTRo'
-             b'bjk280yvhqL215p5Qd/wgRNsJiQKcXO3bWmYUoRiRJUso0G7NYzohGMiP8NnixoIpHHGO4eHY7AM'
-             b'j+jVnqlo1HNh5MGV4AUg61Z07gKRHh4cAipeLlcgZ+G6irxyoyxkmDb1rH+485lLoazj9XJFqb0W'
-             b'cwI1y6hxjS41ueGM2ADvcf9Soy0jmQb8fZyYp8xST+6GwtICleeisbXqpNafcWqEUyQ13uI9oOOx'
-             b'RO98JXaqT/wGGQE6p1Zuw8nRBt+DJsIUXKN24XIdunUHFQ4MeWTcRf8C8EVEylmfj3P7a08fhdSO'
-             b'vAYlWna+TwqPRc0sk28Y8iz1PAxlvcDhjsRpFED0oIhm313f050bN8P9F+8DcUzCcsKEta+GOiPe'
-             b'uzsOesAdo2/r2rl763a4c/3lup43OOARV5+aL0gszc5GHF3hRpBiy3wowc3BIjXvOvun7XmcdMo0'
-             b'/yqex5Ino9DmWqnIskp2dduIDY4Hyqdd+OguJGpEBkRGRjszVaIk4fDIGu/USyFaFDnXjOELynhi'
-             b'QiOLnBSaUZSSYJv5lRHSXec/ydsIk9TYjvdCii5pMn77k58Kn3/qs0CbBDFGMy1rUorftNr91E/9'
-             b'+//x/oXzt4YvQfw7c8TbBfmSv+om/8Y3veU3Lj382qeHW88/OTN5RdQUulu3b4WHL98PiASblZFt'
-             b'usibXRxmgtyiVpkPPPIaTdzig3F4fKgOd0IsEYJbbp2xQiNk5cocnqzVTjaf3UnYClNzvodZrbnR'
-             b'paLdkh74GRVlIelMDoae8KmarMhDv9XlMOp2MSK2t1fJTNbZv0DUgIwF1k369z0PkpEbM6SAUpyI'
-             b'TMCqVsjIYrMoDdpdmK+1eYMDEpW54dqINW0+O3LeLCORWa++953N2YvmkNvO19H5KpwxWQGmHi4+'
-             b'9HDdeM4B+hc/eXEK9DhQdmuF2mXrSkxOGRn/5hpUPlwd4cEefvwqSxzy6KoL+RyiVZdDT8ibIfNh'
-             b'yPS9Fz/xpLP35jOQz6AkKdG/oSRG3cbmJ8FoZZj6FI1dlnGLHP4ljxw7KKlIDj3Z3AaYemQoBiIj'
-             b'vEpsvuiZZC4j/USTMBGmM/OSRnZNXmQgswCEzUFDAJleBvRJ/uQaUiKS6rKlyBCJ6XZ3ohK6UQ/Z'
-             b'kc+PIGHqfKefUwo0LQJ1dNIzzjhZqgP9CSKH25KVgJEIvQaES4ORVeeKY5qC5QnbOHhsrfFNpMjr'
-             b'6G4n6/YQPIAVil6BqhWB0zHFer2v1zwwIKroYSSS4AgTrp73ts05Mbu07AOSJc1OGS5uMxLdbHpv'
-             b'Sh8fH3ZBTM3UkKdXp8aiqpclXPuKF4uTxwPrREa0wlDPzBGANn1uPiJUNdFOOnXFx3IdFSzYoMmd'
-             b'iIg53muzE9oZq/pg3aRu4Uxb6iZLSCgNtPVOqoARxGB/b79JwcyHgY6DpdN1FnkYC9FxHHccW/Ut'
-             b'gVPkhfVw31vOvAGSdSR8jpub43DzlWvh0de/AY6k8KyIvRdbsjb7lTnPtMCj09Mj2LYf3r0FFYqc'
-             b'snN06oq4QqXTpWCp53Bt5z4yIF8ieWJfMJVUNLleWwPa9bM4nSAdFEAwut5UK2PjK2G/UF4OrIOB'
-             b'AhWMXwSx7BksNK/XTBAVEJLlnEHqH33wXyVhT8pMxN6cw2QEyX2vJ2fB/AukUC2xY3lRGg+HYVPm'
-             b'smrpreD1EGEmmEu2cK5ruQ+f/dxnwgc/+EFcB0XK+7BBTsoYbtw9DT/wE//2X3/3t3z7+ySB8g/6'
-             b'1etM/vf4Vf9t/+LFgze/9es/+Il//MUnV8KMpZxHOq4Xr1wNjzz0IDqinuSowQwbGLFbqLWVN3p4'
-             b'cCdceuCyluiEN9b7a2edGwFI2KDwfGaWcaAmWw0j6PY2qAXwRmaiq314G8PqFgSoOeG2AT7pBQQz'
-             b'9VCPTKyChpwzQFThiwUqV4RhcH3DKliIa7120Qr/j64xzTs1cRHlJxizzNYWbgCsgyXwQu8kWcwZ'
-             b'8OGcutrADk9eq1czclcuyKEpaVdIIKtH+75sKlGJliMZ5k7PdW/ghKhReR/I95biAsTAVeiW50CI'
-             b'kwMQcPpo1WVjoAy7U09fizabcIZ/U32AWNmpSY4a0Mi9njlcbell6DL58zIr5TTrnWgk68XywQ3i'
-             b'zSTFmfuJpum1HZvTPe1fGc2bGaqh5MvksD9c8gpNgnrVN2NuPrILz8xP7zv3PzCntmDyPxPSl7ZJ'
-             b'KWHuFAd/THNohAUFEvtnPZB6zD1lLii20pnENe++YqBEdsORCO2vo0ov0UHR8Aksfm6MkDLFLWRt'
-             b'MLKycUCn7OeexjKywcFdMgWGJ5kJlwUG9VqoOdFPYdjihV8bd2SqL6QAmIeFmhqJe5scZvx3PEcl'
-             b'nsnYMPNSmAORACte88Vz0jVpbjlXu+kV/e1tjQusvVqsfU2FCS1Bg5kKRh1rusyBvNt1JLC10ZRs'
-             b'jsrQJ+SdVP8um33PLm8+j65TPzpRgqONE61o75kLL9wFzNJRjCtiIddArIblkEQRl0YUCeAnAH1J'
-             b'4POoPLW5eAJC7xSJUG+RpM6H1gCJqqAeHEA5Ek+C+iYOZWZf11o/MQ4CErU5DXfv3MS4B6qi+aLu'
-             b'3/eF8/ddZnEVNc0vF+b7aOcsCigx85H9Gf4TMnqdJSKBzXo2l9BQFYyltuGl556RRaYuiIFZK2bB'
-             b'zojoNJLNL9eyTKklyRsej8L9Er4TuQ3DJkTpzrlbkLfKvk71SeAalM/fQcqpRftSrqO8PzqABsYS'
-             b'Yy9KxcwxmbgJL1J3/YvFe7kwwa91hGxjbyKSwm+KubknmqWvDVGLy9aJpll6bGiIWIoNPbLx4aJ+'
-             b'xmeefjr8P7/8T4EIKuJMeXNdj3eOj8Lb3vMd//sP/+i//jdPYd8e/+ACIJTy+39FXdzveNd73v9r'
-             b'v/TzP5k1QUTfYP2B12/erhXlKchHgYulK9rduXQ6WShPfSBq17CrD9+sVrNKiNOayP0EihJvhAHe'
-             b'SgKS25jVXCi1wCxT3ksWKUndaOKeVuGp5+xZpUORZii72n3IXHSg/exI4xTAr31UP2nu+ckIPWSf'
-             b'Q1LVa+KfPPhbWkNigxyYJy+LyvgTddMecpNMectRr8NqMWdqLIHWpP8+o12tsVancGSceN5nSExy'
-             b'g+bpnKibtnbYkfpqqTrh8IcCSdP1FKUhEypYTG1UImbQZK9klWqYJPlRaiRIShSNY1B/hlS7sw4a'
-             b'+hFz5BkkZ7XTE4a4MPy5ceBB6FQPKwcmIn4nT41lx6cUJ+uB5LddIdcku+FNJOsxltwgxFl062kv'
-             b'nY25z0CodrgPLf1xGJ2ZXTxwrPhr6y2k3CxpIlrMPTsundsLv0LuO6nESoIU5EN8EBiVnD00JQKF'
-             b'kcNxqH8apIiR1KCpczuQTudasCV1E0O0dP07MRiSJMnTpBunvH+57nBa7JT4hp+ZC4mIKntNk9jc'
-             b'SKhTpa+TAb0HaTXoX14QXa3N2CORnIlxSZ5YMRsHRT6LPFvF0xEndGcmMTrxaQJcKbLcsTppa3/H'
-             b'xMTFXPMrMBoxxYqw3mdzyotVKhoJIY95WkOYT8aIWXCLHNB9YkXPDDPvUvStbjDzAtKgekpkb0aK'
-             b'McMxs++YOxJcJaNGQ4nPq0pTNYBL/Oc7P/hO689YSyBWsHRUHXkh+TIxkZG5K3r49x5zLb9EoXTt'
-             b'hWdBlIbaBxX9Jtw8Pqj/dgzkNfHAy2abSzvwzAskBfFWFAaCyJrlLUO0Qk4soPQ4Pqgd/8GdW9DQ'
-             b'K08x+rqYHtUmug30iygT87icm8RtYMMQo5kJ0a0U95O5FPKo9QsNOKv3em//HJ4peVag3hAkdj5z'
-             b'HX10BQC5HUZClutuP8d1/dFHp+oPE10/4fPYRpVyoDRZQlUoZwKvTPppzUs3sdH0ETeDoQqvrR36'
-             b'inJ0Tg6Xw19QLMlh+MAvfxDj3BkJmPLsC3p17+AkhP0Hnvnzf/Gnf0YbjyH8wcd/+NJZAGe+oG4c'
-             b'D7/mNR9e33f/jZAPLwfChVJ1nO40qGJvteQmr0yJEqJ3a/ZwmevVrVu3wsPrcxSWFmd8+uymmL8a'
-             b'nf2YPmVbzZa2s8gSMElQfY8bpKotw2yxxNkGqH84xUMUCeOMnDnnqLNtgetlbimLHglMm1HDfgS6'
-             b'Tzp7lUoa6MDQ0tmAMIg+lwjD6OQunSOnrIsrO1w28rwtnMvpYlGnOeum9RBEABN12vv92vXKhuyD'
-             b'KJOo362vu5EchdXaF+GMixt595KzXR+YIF1qnOEeiRZ1B4Z98So0mYNfCY1skixpjwcQ2b2RkJzp'
-             b'8TXu16BCOUySLl5KZAqzIQKJeRpZKZrtnacsIjKZOfYKZU6MNtitRxq0SPEjf4c5cmxQPUySRq4c'
-             b'5yoorwAFzTgya6EVHSUY0ayc0eFEn70Vj0G19Yq7udPqO4Bspp0WtgsbhdFZLyS1axWJ2JC1EOrF'
-             b'a2HcahdeNy65HwK3dik64VfgcBSpYijlPgvRIVU51IWkhoJWiq5aQGzE1wLGTTpqkCAlRbF2JCA1'
-             b'iVkmGSvT5a61L6+yH41N413C2YS1wsIDayIqG1/e0wX4tav2WiJxV5Js2cWJrt9IYAGeFsaCn3pL'
-             b'yPsVAitm9NSjg4xrh5EpEEiKwnhs1qSU8mWbQfwxVD4477tJ/oE2E2oPbYxuHWn1XUcLYfWZEKWA'
-             b'jBRW1pAQqSh0urQMCVmDi/qcWbS5uOrJ+9EI4NK6XUoTEeYk3JvYueGLkBtLad4BUE6J0dieIgIa'
-             b'1Dhirq4Jli4NApH61ssv1a+x5FK1hlYb6BLuvHwNV/ahx14XssmPTfJLbhLGCPV+CrqwvnQ/dGQx'
-             b'NoRBUSItT269fDXcfuWawvS0Z7YUyuCHeCB3gIZQJToTP3J8mSwBidkMo0H8NgQVnoAgpZ3E1+6r'
-             b'fW4tREH47ZP7P8TYrMIzyaBqPa+hXZnXYRoPbpkrqmKhERMcQq2qsveSnJF/RvXiSaPRxzHNbM6S'
-             b'hScZIcyOyLGcMdWMNPQyMzs0PEn/NJdDUc8J2vL+X3xfuHvvLsjxep9V7nlY19vdoT/+9376P/mL'
-             b'Dzz82Aunh/e+rO5feV/z7g/4khIef/INL77pbV/3y8985AM/tkztJm83Q7hx41Z48L5LYKiabjZk'
-             b'u4YKhYz0cJYDVCIV80OPKUFm4kl9cHQQ1usl4PVCr0sh9ckmImlWJs8CES6SzTuZU2OiOZ7USjJh'
-             b'JLCjvWKk85SSVToaLmRmGKimdtZr2I8ciuJI13E+XMh4hrRPNgYxqIAByim+Z0FUII98vaCd38hK'
-             b's3nvazekkZtLP6zl+8wwJtnXjWYb3FQtsrjlewXudOKwuc/Gvmmni/FlxSCoVo17lyDLS3Q7RAwt'
-             b'JDlT1Ce2tsvrXc68oY9V2YwcoJkwsoW6yAxstNhlyvMKCTND7VLlICpRORfzbo4NVVP+bHPR62te'
-             b'3MVSBUN2yaJZjKqULrXIVLJ05X5mztRQmNIf32OXBIqT+ys/Gw/S4B0u5GWd+bo08lHzgqdO3hpR'
-             b'u6ecgWqAz1zJdVH0+Ttm2jNPXBl89TnZIANhDjSgHvpB8wZUcbIBCUy6GJH2KEJF4x4crtmjh2H9'
-             b'K4e8RBRLlb9TTgoOQLGqZsEmiYKJo5KeOmR53gTKlrcuBYsYPhm5Kk6gRxsTZIZTmX4Y7piptCRH'
-             b'YcSLVfaiw2Ejh6d0YcXNkGJY7+/rRmWBW/X+HBwfaYpf6XwWqk6PyeFl6+iNH2Nt0QIz3DyZ5Wtx'
-             b'JIW0IDCuDRAuhnBOyBMI5AoogheVTi6jq0GharlG/WR2LGsqYqY8uJzPOlMjr2oyIYOqkvHZix8U'
-             b'agjTJJHSKMkBK/4ASuRaKbowDN7B2nhTjZo6jk+0M5TuLyJAqOfzyzFC/Rw3XnohbGunH+gvMetU'
-             b'lRJZ2AggePfGy+Hc+Qthde68c6xsziANgTk8Cso0PZSRoZIUuZDn6fqVF2GdC/UDo5eTs90D7HCp'
-             b'bQ1qtUMpnmn8zSPAVBl5EiQW5/VAWuI5BbESJkYrjrM6Hty0dB5GOqd24GGZOsCdFz1QJhA1DO7V'
-             b'osFQOrLJbtSUeHeNvR89ftpfB01Ip4UFxxDYB1Ju+6dNDeUZGgydzDT7aSFYFoddjBNStGBSRWRH'
-             b'FYPGIksg0fve975w9aWXwEkL1PsDyar73fWDXfhXf/I//CvveM93/lLYHdZ9/1z4cn/15t39+/6q'
-             b'h+hb3/6Nv/DJX/mlH5PnTIqpGQ03nn3+Snjj469TUgRZnIWfSHpQq8yMuyWzy6NaxVy4/zItc7XL'
-             b'2lsZ8zc0Nm/tWvf3k2/JKnFQQhRYscXS1AjtyQMr5EBVeyhMNypsOFvuKfmvJyOXem31DRhoYBSc'
-             b'MGb4mhQQ8r97xunK18pGrhHGlEHmgclzdZOpG3qgN44tcukOhVvQc36q0igNXYIbFw+awPjLwm5P'
-             b'r1l0YoqR9aQYmJGVulz1XJhkaFuJUN/PfH0u9Mt9JRJGTxVqftJxqkAgKYWBPmpVq7LGYvNj6PJ3'
-             b'agoiZjcmn+kSWed6eONAn7ErkP+WTlXgaUMUeh3BFKYFRqb+qYNfi5fOOTsxT+6l8E5iyR7CYeV8'
-             b'5Ny4Q0ojJTbCskbUr943EBR3W14rKjLgmjWAk9JY787NJQOeG1uakH1YqIjErjDOGN3ZfEbt76CK'
-             b'GYHmlyTbSTe7VdczQaVkBq1ZBkpCUpqBXYPOs9Pl/qeeznBJZW8gX23URU5iZWeLjv4EjSGPGec4'
-             b'tFEXjKv0QBEEw1GO5qhCElyeRDgHOgvKMF9hVYnHlWdPNqY1Di1zabSAl52S8IKZJlk8s6pk5PBP'
-             b'zmLXrVdkr+L737Ebk+Kk5/pawsQrOCwu91NHB8ovkF9qFJQ9x8AZ8nw943uIPnqebCyn90cjs5UM'
-             b'cTIoqXKGpNEINULOYzjDQCiNoKppg9k5DoY6LSmnC6WhoEAwzBQrtDEXCMe0eMY6hkeCOoU6oiGj'
-             b'if3VWftZphzeu3Mz3L11QwE8HtglTyhrlMP19XNc+eLT4bVf9WYcsjm0LlkO805l9+CllO02TMod'
-             b'FHyyfg5uvhwObt/E10c6ujILLqjIQRu3ElsRnScS0OJralQ+wKiF32y1AJwv8P58vqcwPl1E5dmQ'
-             b'r4uIdo4TT3xz44sePBds4BDNMltDuKy2VT6gvh9Zv96xcwxjaiNqVXWvaWlQam1ucmT1qvcY55Ka'
-             b'5M+Afvz8YMhqnMReRx8TRUqbzciILgUcEc3C4eFBPfzfH166clXVUzl4MT3U179y8zh8/4//+b/5'
-             b'r/zoj/23YTwO4cvs/P1o7+AV9fv/ruVSePvXv/MDi71Lt0ce/IBL6oF25+7dcOvWXYdE1dQn42CG'
-             b'F3KOHlJj3vTiCSDdoA0MS2jJekpyOVbCXswOrdhIoBQjayjTUoI13K8cnUPd9DbHynYWWE9YwfC3'
-             b'P4EN7bA9JcyYfPYFGIsbPGBq/Qv3m58h6lcr+DljaS29rJCFHkwiVTLnx9ElVOr0lc+EPYQ4cZyy'
-             b'rtIrRF3E4pJmFrhClrJELHkPFg9s1Sk8/mmoIddBiD940Bm+M4VOXxUHxYNnVI998gJGzqB9poVF'
-             b'K3PXRT3cFw61yvsTRCTR9hY3Z9TOqpsGZZTgjnROvouJ8q3OTR3lnoy8vnFkcEmKLv3TuXtSiRGL'
-             b'0xFmP21TiCG7tj710dn6xjPpZjRNCXESxkSSX1TWcHGf/8zAHI2KRd1PVYt07Grcox7m2jVpJjmI'
-             b'Y0JwE3KXkAUpEUqFzoCjavele4+E8+RHm0UvrglhxHFQ46CuI1Ra782S/ICYWvqgEfZUKrnTsUlW'
-             b'+WMgAoegGhQuozvr5Ry9K4nN+Ygb5VwjajNYtTD7EY/87EKq5hopf7dB5kUbIxQy20f6e3QazgpP'
-             b'hpYfv8dDMFBxQAQtTnwI7P1FbSLU7KnxlKS+lZTSMNnQRc4GYxtu3MKbyMWKmqwum/3MyVfL3rz/'
-             b'tQuRMJXxjFOqEoaPTo5pulMchham/ulmxzETPwe9QawfhoIotsPQUlG7bubdJ0Jr4Fja+cFh2IjP'
-             b'qCFZFivhe+HlK8+pvj4GV4IYn8QMwvDF4KQM4ca1q/qs0KdAya9EL4XHU/fO05NDVSqRiyEjB0EQ'
-             b'7t18BQVU4tOjDVgHSZ/8jAKToY4JogzpIWO/8D7JWAs+9vW5lSbwwUcfCw8+/Jqwd+6+sN47R/8V'
-             b'RQDVpfasVt64VIWSPkedWVDC/4W5NTusE5V5WiEhxa88N/J1so+jEaGnho4w9M9s0fLMcChGFmRU'
-             b'tnmkCuJS6Dei5N7oIUQoLjttEjWdVj0lsOdaaFpiwYSTOJFHptfqlZevh/e+9+fD888/j4ZBSOHb'
-             b'Uflnsre8eOsofP23fv9/82d+7M/+Vff5j/Er+t0PZfyDy4TaZTz42seee/wtb/tnz/zGL//Quosu'
-             b'OZFu9PmXroYHHriE6Nrgpnb1JljEpVU6XDzbushu18V0+ZFHPWTChzOEvJKHtSQnKkGTO1d3tTJa'
-             b'vv2MwTmUTUBfql3WsCmMS1WzCNXE0xlsc4SDvWOGuqWD6XxuR210pomNEgRl45NuZcYQi4LErx0O'
-             b'lE0tRBbd2ZmpeWfLTV8sZq6HlQJH4n5Ne6wjkBMdK8ypR5bNdMOY0eR4tx5lKbUQJJMamaGIQMIo'
-             b'I2d4IO17ov9fM2xR6R+94I3QJuxSuQ6Su47cg1O3tAQjejS2s3IssNBhvVvc+hfJeqXXyl0KI7Da'
-             b'e7XTHEffzGzeL1BZphGQz92CBthIYYE426wqkMhxkqA5lmg3K52voWgtSWymLrAjzjwoOD5yic6E'
-             b'8KiMoOAHU6TLIfU5gIzhtpcbj0AtjJNK24JawQKZm3WTDlsPHFgEg1R6qoco0KSehidCCNxBgqWb'
-             b'xUhFwI7JjkmvvcDVwh/YbpVgSCJXB4WHZlUIHL5DwUsZLqWUyITvKc/LscWsMuzHCnXhZ4h+H8oT'
-             b'I+gli5aduudE+M2jIJV9rX7RufU+XksMphBXKp3vyKI4dT7+0vGFmmY56ZJ/nhOLcYOFkx74p/Xa'
-             b'yChQnt+FBO0EtZO27IUyjfVmLyWbsRQkqrNvaaWHkkmwXjinRQtkStXIXHezLgQttc67p0QY8egx'
-             b'kOdSO/S9hcPBli6I6OXOUjCViKyxvMH9P4rLpfWzoGie9466DUBxRuwDBu4hma/+kOvXroSETIzo'
-             b'EbJA1Ip5zaupTjZ0S4qaw3shi+QUstzoXgtQSuGNDiCMdmkfUsvduAnHdw7C8cGduicmrLWEpiLT'
-             b'sjqD9GojJ+NlGa+jeChQJndsGc5dvK+u7SXI3i1rgUFTKXjhE+kmqfVpCi3jk81i0tRIQ3vk6w+O'
-             b'j0MEKVb37x0Csgbu5TrS0jyMxLWcoQpRF04dzanLn/6bnDcnp5oOK2NNWVNzQaspoRb+mKwv9T6h'
-             b'N0FWrtcOJmtEMGcTo6YxE4XWtlBIe4I8ndT3vt7bU+5LXfMf/vCvh5evXweXRJFvcqHq+rt+cBy+'
-             b'/tv/1P/87/6lv/wzHQu+8nvY/f7+MsCQv7yvrB/8He/8pn/0qV/7wA+t+56WlrrxXL9xsy6UAXPs'
-             b'rIRRzPiSbSypzRih/a4PjcBW5y9ewrznrCY2QA9vnapsRLDcnCefGdkhAB2kvTYT9XqeeViOdSMb'
-             b'Twd9qJn2pT7wg86VospvMue/HQNphEwFsl/931sYmWTEtB4fHYJUJ+z3cdTwCQQV1Q192adm/DNx'
-             b'UFu4uxalZ/h8i2ZkxwII0ZOzbpIwFsGJCBO3QEiFUkuJcq/y+n+ySLSb78JM8gH6BdH+0Te35tlc'
-             b'cCCUrB2hsJzlQCrW1VAZAJkT5tYjf152foKx6LMZsAghbKbpWvo9QYsCi4ZmJ2VvYyx0sRu1yjdC'
-             b'kM/fxuww6kg7X5vfjZyTy5d0ZtPJFMjCAinTvwCbkcw4LVQnmeVobJP+3IJUvIMMLbSlYAMRSG7B'
-             b'eXrHQiYric3kimlUglbSZLTY2fiiB/EuM+Cnnyl5L3GsJTPwgvVGaSK1y+NOr6naS6uBTkE3XWhl'
-             b'rMXauNNAoGRKGqoRME6gk51dTh83UCFRvHBqpjkwq1mmV6PeEwOe2CK8mWgUJ06SKucanXS1JDtf'
-             b'CJwY1Ygcbb3y50XZ3koWTWkS+mNGYVHT+lraZBtjIfa40/+1XMxY4FsxWp+L1HshZJ9PkgSjPwuK'
-             b'jkTml5xC1aT23Ov50os4FLNEWxKLIuSgFEUXLLwsWHpdYvCQ2b1GRQ8ExUHBKEqQetBmWJsv8PNP'
-             b'TtSeWIKOmvyx0ItjsjJFllm7dFGSqPIqkK+TfG4dJ4hfJMlNOE6A8g8OwsUH1tjjLBUwMelS9pej'
-             b'u7cxLrt78wbGgebHbxa7xVUEtCk2xexU3RY7l/hCkVXXlJhD7e1fQKrrmHW/tvttULoV4DpDHyFJ'
-             b'7JGv0Tv3RorLTT2M5fulmTo6PMK+I4Xryy+9XA/sY411r393VA9KGzWjrZIx7VgmQU8aSGcFYuaa'
-             b'zL63quurkqObW2mLZi4To6wmnbYIZBQ1lvEQiRiM9MxIxZFgGz+kZGRCHRlgfDqa1BCGE+HKjaPw'
-             b'5nd/59/7Cz/zV35qvVqOmWg3iL9faQHQfbkzg/pD3v4N7/zFnzt/+cawvXt55hyLLty+exheuvZK'
-             b'eOyB+3VBlOIVvFWGzsFkwIi82U09UGUxgOtc6KE09cUna1Y+t3TDcpkk5tTYlwbDWzEwsMNJwQIA'
-             b'RhJ45JAeEOowMjtaoXyFQZGaNirbfeTcsycSoPOZ+t9inoOTbsc5v1W8eZKPrmQtQJTjiO4HiXHM'
-             b'h7fRhTG+4QnQqyHMAoxhHkyjpUNZMZAYVnJau7JlMKsgYRvLRiWsUDUIkxm4FA7n63VYnrU7DSq/'
-             b'00S5dGYUYQY5yMtO6ifvlr0uL+x8Qxp3W5eU9UlHKTBOGjVwSRUQo0eVZiOsMExNgzhGPYzcMEMK'
-             b'R5WZAjaP6hoOpURsm/1QVIVhnctAL3izC1aIeGhFZVYJofuY25iCs9HipkKv4kQS2sP1KJEZ4uqA'
-             b'Jz8ncVrXw6HNc4nQQfRwAlTWOYhGWXPWtZAo0OujkLUDP3QuRcJ8PnWEFJMS/+j5gP+O5rxbdNRi'
-             b'DPc4jcENzJfvgBpIF4RNBiflSGg4N9KSOaillkYmCM9YPJmccGxixK6kUupICn4T2a550SRMsdCe'
-             b'z1tgJ9eRXOqjw+Pa4a9flXwSMAqR71uTC2QdfeJ76Rfq5zDCWCmAR4N5eX2GVqsZDxDt8uS5lq+b'
-             b'w/CmjX5A1kyas+GFR73w8lytEaoVWpT2xDhIrtRh3av2ancmJEJD16UoECRjH14E+nzI9T4+PdHP'
-             b'WMwWXcO2EIxUdB0jvwBzaCOQ6f3xMKaorP/evP/5dVIkSoDVtavPTYLBAufVSiLuYjmj1sjuqKpG'
-             b'VTevvRTW9SCWUR72wKE0pXJ9b8d378DcR/k1av5mxZomZnYEbEmoZeSw8jzUe0Tn3PRPqWtCLHMT'
-             b'yc4yPtNAq8SAskg0d85UPX1mpVCR4Kk79f289NJL+GxChhSDm8PDExzwYkSE9d1s57g3q4Sy0G67'
-             b'TKkXFPhg3Fu0YI/szCMcI7Pu9cGk6uRWFKppYnQ9QYwTOawUWUb+jHHC4Sg0AQpQSZmhmO53zcFw'
-             b'hjVUPEHS4pvN6VTemxj9vP093/vz/8Ff/et/YbacD+PxZO7/Fc7/UQDcvXXry/7ii+fOP/f6r3rb'
-             b'Lz33iV/5c4vUlPpi1fnci1fCax66TNOb2Gx3J+YXhYvUXN1u3Lge9i5cdItUzgnCyfEGxhRyCC4l'
-             b'3Qp+1tkvfCExKZL8YdX8erl2oxqp+hCCUxqDM4GZNyg5Sg5pbC6a2gbj21zcG3pg8aIqkExJ8qjj'
-             b'VJfPUOLmIc6R2faaQc2zgWYiBXa+IPewewdBa6ZwYmbIjGzcJ9sTPByIxuUClIdQjFTUuk4/t8qT'
-             b'LIea6guYENFq14NyZEEO6nqGTn3uxii6wtSISK5JxnujxISoheaGNDFTYQY9/U7QwXZZmc9hNJ1R'
-             b'Y80nxiWDpEeNcjQzoHZ8KkwOj28EdpK5O6IYG22OHXX8U0J7yGRmqvyF5NApHiGEQXUtMtV8A6zd'
-             b'GCe9Zok+045ujFQ3ln5OC9mRqgElRCF+edC0PRQyMTEiO3Ft0sCK4VaGaGi6n8L3W5hb9Tj0A9fd'
-             b'uM34vLZ9w/1vHCkXZaEzNyMrdQmU7ngso8/xM50DB8saD6P7ITRJVnHNgyEewupHljqMtHLdaI/r'
-             b'GtvDqEqcP4WwOqtrS3zIW8fDjYr20WkeWliKa6t5OEvnv2pkNjGt0kCdBHTFdNtGcjo+qgfp/n7z'
-             b'irB48NDRSKeDZj3DZz46CRBeFl0iKlHcNlmgXBQLBnsDGStUFhliN2/EMP9/BeOHZNIvUuSEhIik'
-             b'Pt/idc5/TkYnZWpdExE+Y3JLGyt2NKMpZNEvFzMnT2ZXspJfIXB0XYui6b/64rO1ITminDK6pA2F'
-             b'dmiIg5vIWO5GoNnWbhNeev4L4bEnntS9V+bmFr5lGSS5KQECuQ4WUdue2ki7aT8rlQxotsMyGtk/'
-             b'Hy5cusxxpFy/HVMY1W1Enh9BIsQd9urzL4Q79+7i0L9x85VaLB4gRTDzjEk0mFK1UfNN6brZJH2Q'
-             b'dthU8YOf4AL9RLVzdlmzWu5pNkDozFGzax40U54WSeOWLzNFlXQPzvga9ZAwi9+O1t2ZSGcjERpV'
-             b'PlJxExlX7OKxLrgp0FDXz+2THL7hu3/4b/+l/+g/+8u1MDwuktXyhzj0zxQAy8X6y/5i+dp3ffN3'
-             b'/Nxvfeif/Ll90djSiUk6sqvXXgl364axL6lUlP8lVtI+zzdTmaALUkJ3bl27Fh567LVqbsMyDa5O'
-             b'PGQyk7Dag5nIGp7TaUq7HF8cZjO5U+vgSS/RbG2LErsSrUtjiI0oVzQattj/HlsKVJg6OXEbMEvH'
-             b'QG9v6I7hJti378FNFMb+BIWPauMLrfc2A7kwAyDdYBXyFyKTuq418yBZUCAt2mwvtkAe8V/X2OXg'
-             b'5jYGI0KTjqp/S+KdOqpZl4Q4XqAQck1mrJ10lgpJUVSffQiC6AWv7PsZNmELuknF0tuyw+xG5DHH'
-             b'uM4Ce0jwk3s+ykM+T9TAa2fQG9yW1NlOfiy8DMScJWhcLpIIoc/XIgoMe1qhFtfwRd8ETb7jdh3s'
-             b'tgAHDqroEEQDrNtxpJV0T1b+CElfsESy0VQARSWsJK/Je5mLP8ZOZ3el01l9ovoDnazMFceB10o7'
-             b'ytR1IZxZtVr8oYPe6WfJ8O+v62s3KlIysoCcJBc24tXU42DipWZM8U4LPuNMeEhN/RrxkLfRCzpz'
-             b'3tPUxWaEwrQ0cHOI0oib3mqhvv0SjSvXeUYHzjTZPO25K1NuN+FqORz3qY1Xa2mFj9AYWISsPY/1'
-             b'PyVyd39vpZa1Ng4R5j9GKj3W5t56QfVHQLEGUqWw/pONL3KTgjKnyfYWUy7A3+DkVN3zZnPnIRzW'
-             b'g3l/taaKpfhYUp45STCUcYAUfYmyThi1pESyXZxQJpXIOzBHQoo++VpBWuSgvvrCcyDqgQ/Dubqj'
-             b'0Zk2NonEO24OnUmyfQgZwQW488rL4eL9D5GgqohpLC10DEjTaHtcmFgKk2aTO1YqwRMhPUa5/nn+'
-             b'4sWwd/6CNyd4fdgsL1CMyehYfGF++9OfDtt6Pw4Oj9AkIRhKwoUk5IZdfYpdGwFSCaOFd3BHPwt8'
-             b'alHDiWMxyu181BxbhoybUOle6hFcZZItYGsiRQ8+csMqpv5pvdW1QLzQCjh1Qo2eB5kbyESrYVPP'
-             b'6bhOBQOjB9jdO9iFg2G2+4Gf+Mm/8SM/8W/+DSjCxP0uhX/uX/1qb/Vlf7HMz7/p2771//5Hf//J'
-             b'z21uPv/mGYklspEdHR+F569eD2978gmwovVaR7+YgbPITCkb9Kn1z7u3rofVuXN1oVxkF6EFQIhT'
-             b'9nyYaLPFa3xxhj0vbFsJ+xC4LJM4tFrNJ7NL6jKNDBdZA5bmzGQOGbrBGcO0EaIVN8otMaq0B8MQ'
-             b'si2hqL5b+Kwbh8ZIrXCk/Cy0KEmwViWMZL4i87U4vC5rQ8iCJZRJxnlAHPMerYGbIF7oO7WD6cwi'
-             b'M/oMOEycpXQGrDkIOWti4izNXMfaoZLtEAeN7HSkzW1V6ij+2aVzmZHDj0HnfHKYSUc00mZY/eGj'
-             b'xzQrtKnXbKCOV/ZD8wCAbDOTze5hGJGHZaf+5kLgZBpbYtKeRiwr6c7Icv7ODIJP1JJx1iYPmM+u'
-             b'CUsWVuDq9x88ztiuvW9wUi4MWxRTIINmddrDoQyOgEi+OpWdQj66VYKQcAfISsZmstt5UaIb20Ci'
-             b'nG7I+t7NHVLj51B8yetB3kp+QR58NimvkZiMqMZLRTkHnA+ax36gIdUOZMIFPtsc5jsjM+sj4GbM'
-             b'LWOZjBg4LxcAuBa8YjkKOaCxsRMLFj4jMNY5E3ieXK8+n8/IlRkpKU3haKMeGzPkS+ghthuUzQ8y'
-             b'H5E2I+9RJIKi2bX4nJ8Kcerk+DRcOH/O1UZWNKuBWT8JdmzyL5vnyN+JysgChywWUQ5/tZwevZhZ'
-             b'2VrokvMWbGPHiMA6Ow7KJS/BZl+C5sAISw58eR2oL1bkNe1Q1Je6vq6K099WD3+T7cI+mk+Y2HUn'
-             b'AtbBDzRjGXVUGilRVpqf61ev1KLpPGR9xoNRhIzJqWZUMzHF8ZhkxvkGHoDmWw+Gf713lx94JMxl'
-             b'vJvVijp1msshh/wLV66ET336s+HqSy9TBaPcD9gtd50XGSJ5jfQTgFMew8EsD6Q39ZWb6kQGu9Fo'
-             b'LTW5MPaRYs6HtBmne+1AcjDGEqbIYSRvnLgXlthSbKcJkoENglmQW6ZEZEPQJSu9iuv8fe8OyrMa'
-             b'iWBCCyCfo37N0WYM5y8/euONb378A9/1/X/mv/+G97zngye1+Cxfpsvfl1UASBjPV/Jrb3//3tf8'
-             b'iXe991fe+/n/9IHzqwaF1Df83Asvha954xu4mDjrYOKTeeEX99hus5OTo0MwQ0cSwgxqOanvTcM9'
-             b'OvUYoGtZbDJabB5SHbvkbjJvsbLh6Pg4rJgQeMb6OGZ/PIidcdPJ7tDlK8CgOJfXNn2nBPnIQ7Ra'
-             b'LPxwD9aFZVVKoGihsyySz6Km+imyAXaWdvybIaz3Fn6DkRlQNIZUChw5x6QzipPPtlguQSCcdWKk'
-             b'sVayo5HbOi2WhCEOTgIZtTbTmzH0SA4I6WxBagJMxeRDHGwq+5KxsTDXtbGIPoaBneWoRD2NTVa3'
-             b'M/W+1y0pmxiX5Bi4//F+j3zQLOktkbgVGSwU4RyoNrfCVg606sQDP1IultVso9CV0Q1DJtrp4pJS'
-             b'spVzm52ji6//vdkc4XrqYUwtOSVwgnJ08wUdGWftZ4BHMWNHogTA1Kt6I2rSDrpFmeN1iTr2cXR3'
-             b'PPscCgm3s3KkU5+QhWCdPA7uEQE7nrmmXRrpS41NdAyjJLzEe7/zgbCZsNifsgHLde0YvWvMbldV'
-             b'Y4avPhggn3FcgSx44Rr0pkixzjfBmVLnq6FForIRkO5ZdPKqdChOyZB5sjC6FTSNEz8Gy5EIHs5k'
-             b'6IUUIPb683kLrlGXT2Xsnzu33+LCJ6aHhmjYXnR8ogerKAzaBpPrs7Z+1T5gI5Im1zVb3d1uDKu0'
-             b'gMRxRJS47gda4Eb34fCCyJM3Ag3AtCBR5VTWg6Y+dLeuPR8O7txGEW7Fsj1TepYUh6uL3T8n/arb'
-             b'pRVTsCWW0Sf3uusvvQDmebQsDk7wEslvzt0CJF3cDCwTxdMxgDXTKSzrdV3XomJRm7oM1cwS1/bq'
-             b'lavhM5/9THjmi88B4h/ohRGS2jlLh7yFL4NmYiRPhGXBBwVZ8vef+bzL6yhvK8E/QM/2blfX17ab'
-             b'LbYxzY7mi2X9735T7/nh+f3zt5fL5UlHGGu+mA210952fT/W/eeoruvbSf29YSBYP+NQrx/Ce1Pf'
-             b'w21sNkvyBKaisj1I0Opz2NdnLtU13p9utvOksr5cn73aU0WRyezV+9adnB4v60v0skfU5m9xcnq6'
-             b'lta47rW6Deac6lpIDz78yJXH3/imD73jnd/4D5er/SsdOF+nX7bD35ddAGAe/xX8GusB9a3f/r1/'
-             b'91ff/w9/Ose8TlmzpqWjvHX7bnjl9u3wyKV9XZwGQYVWRXWpMVMKCS+Hd+6E85cuexdMz1dUvpGu'
-             b'gydHOoMUH/BC8sUGpL+es+QWUiE6YmSOU18uDHurYGVj3A20zA0K8am8rFlKWoKXdQK+aZaJU1nR'
-             b'eZI6jGW35yyMppQDRDZLmdOvVwuXQm5Od6iEQdyzhxQPGzdVdqAKw1vhUWAO0gFZoPkEdzKBFqPB'
-             b'xl0LrLCUvpERyciHH3ZNfsQHFx2p6M9nNrKIzdLTDuVB4X070M2VsYuNhJnYNaurH8ct0cJkFD5D'
-             b'ZQtSX8LcW1UXWgzgNXmYG0tH54sjiZPJLYAVWRm5ac6UsDaYx4DC4ZZGCSQkxpbLwM3dtPOKuNZN'
-             b'REhoovZYrFwWCVlQ7bh0WtkhdbIU88FQ/bBq/mkmJBu43Do5JMVXYSg+swTCMBYmoeXmBYFCbZzM'
-             b'GpWYBM4E2eUmVMTMMii73UKhLAI5UJIkz7ONzQQZiGni/eAJhs2EZA9kNT1EBjqmmeIDG21dM4jE'
-             b'3ttrChdUsj1zyVfuKFgYgJKZew/de2rmKIGxwNZF2cGMKGJ0dEFNdGhzTSsZhKDEucrqxB53tVyE'
-             b'PEF4pMAWOH8207UhGyXc/Tr9+YnrVGbNMBBjAl2ZCGPXsNNOhLBHKl4awoXnnK6dijQFPMcyo5Z9'
-             b'SsigGtClf29qAS2QrSFIWO+xDy0DQQqKWixKgQgS6WYL5ELyHoQkvTk9CpuTI1UOqB6RrPWmnCmG'
-             b'LORgYjxC3+oxH9xn3jFQTTXEzzsJdzen+syiA9XRgrsvcB1E8ngQ4kuDHNsfBuwvy/q5ZuHCfZeB'
-             b'jEVyp56tB/5HP/bR8Myzz6rmHumEPYqJwRAU1lawsKAiC9gkE/dA6pS1KLLNNA/75y6c7F28cLMe'
-             b'jNfmy/3nXvPEE1fOn7/4fP36Z173+BPXH3zo4Xv7F/ZPnvr0p05Wq/17jzz66PbCfZeG9f5+1vEd'
-             b'bYKLNhJqKlIL93rt7119gYZt6iGicv2ZFr3SCMl5MYvuuRJYOI/bU/dyEGIqgnokg0NIwcu9sPfQ'
-             b'a5o3g7NjtfGDq2FHZcuoe9PIhmlzehiO7h7g2V+tVuH/61/9V1pQCOPyTV/91b/91V/3jR+48ulf'
-             b'/8EOB43OzE9rl/n0F74YHnnn1yNJMHic6oSQlppsQt+AQrs3rl0Jjz7+xnDGwMpSA+trr/do3mKZ'
-             b'AzZ/LsljFI+OjuqD1IFNGmhMggJAdJoToaFslLPZygl7AnUr3HcE6Z1zm2RWdqzOfiJhsUO50H70'
-             b'dNihwl1Cz1pauhMhoplleMe2+c5o4hOThaSo6Yg8DH2MzRAlJx5wugXtS9gFiXKNTxHcsGM0boCn'
-             b'6AkbN5AJW/jwRbdcbc5/yV0cA2UugPttdMM5pVtpkZQixUBm52d5DSCqGYTWRXqSd+z0KRXqSAql'
-             b'5r/TcAR12aK8LrGKwfw1KKNd+SZ0pUvJZ61aiSSfQ541BiFkWc7KwJwXEBraY9LBgT79iW2NWgtn'
-             b'aoR3WsAE3ViRDTEomUvf93RpayECt7oSafk8g1LFZocjnQ9HstcT7UwRCSs+AWJaImOPProiRDb/'
-             b'rJRl3TSle08dVSe9SgCLrn1YlAKqLW7Baic07l1uuQkZBbUGEy3AhNa5+wzJlZ0HnCD4KyQvBEpU'
-             b'Br8gP8vlOmiw4YjXmtU1K/8mv6XQkB8thW+kUQtIuOBaROZoNHi1WDGdpiQuLaZoDcJRR9HXDBbb'
-             b'a2u6Mb/N0VBCvYRIp/CuHY65JWDyewX2l+JpJaE4tF5TP6Uc5h0Jjtkm5YndesexW+GoorHwVZLY'
-             b'AcWT53KZ5l4ACHwvBzy8SXZ1H7x+DT4pkQe8PHsyOopMyDxDnj0Tb5xBXTPUK8QWZRNdpZLcpj0T'
-             b'ae1S8GhgazjU+MC4ELmRMz0qL03GYXVvXO2FhagK6ucWVZd8zzOffyp84rd+M1x98WpdmzGs6v4p'
-             b'O4YAViO5QiOtipU8KLytDDR1hGy7FkV7F44uP/jICw8+9NBTj7zm8c/d/+BDn37iyTc/O1vMX7z/'
-             b'gcvXju4dHr/47Avl3d/yLeGknje/9ZEPh8efeEN44KFHwmxvEZ6t7wG20F1yEzWEhSECmkjiSHRI'
-             b'xgu1kJSRlpJtE019wMHXAqB+D1xhh1YAqO+C2sNbSuCrC4B5vV572xNV7aTg4WouAt8NvucpcKfq'
-             b'pgCTojH8i/zVh+4rhxQEbv6T3/k9f+fvfPxDPyjn8pznmJCmvvjilfCWJ98YHrx4AZuXbb7W34yE'
-             b'0zEXMWZ2/W8xmrhz4zpIKdkTuqakMYWnCkNVIg9lDbTQSls2p0gv7+L2jZwdce3KYbInGxW7MLWE'
-             b'jG4yND1A5O/nc2a9Z4XuRs4A4kTGZIQRqe7l5ouuF3Be9ABIo8KxqyisbrV4EoawOBT2y4UfLrKh'
-             b'HxwchosXz/MzFu/OfD7WqTucsrwT9LEDmOmBchYtVCLlP9IByXyqM4idVpsJLnEzjAFU307veYYP'
-             b'oYuXYgua9A0LmOAWqNGDL1iYcL6FjIWdkgbV751xtJJxD7e7NnuNnZroaJWtCx9zwX6hbHxE+iqc'
-             b'KuY4xenlsqnQClnGEyX7xhRfZRBrh1YmwVCuAxwekxIgZQyQd1tK8zQsCp95M4C8ZXN2nesp69+K'
-             b'IeFRCBwPaF+KvKJ+BCgwGTjkDoeegaEeB7Nu5tcBB/m8B+IjfyU6aDmMZkAjTv37OkY7RyelyprY'
-             b'kHPBURkrXuVpafFoxQbQiKAyTsMFVkI2JZdF7sFytfCQqkgiovI/RrePxrPcMQaXwIY82/vgBej6'
-             b'ifPk0j7T2wvMKwYse2lB1nhsoTNRD1gZFwi/AAVgGbgekuviLYM9kQsgiJusOdkXWoiSoVWJ76k0'
-             b'zoUU/afHYT1f0QFQeR8LeJPMlHHKg0OKIDFzaWQ3lYEa/0FlzJT7mjdFSSaiRHGyEpMnOsPLfT+4'
-             b'c7fue7fDtnb5Guyi0c+9peeRuNbGjeS7WGFLqaJy/ErjWEzI1iYxjJOYnabnmZCfY5rsU7RSLoag'
-             b'cfaZoo/31G283o/FKiz3L4b1+QvYf69deTH85m98PHzuqafgcyDyyrlYs5E3kGe1EON73da1LkE2'
-             b'R/J8Ldb54gMPPfu6J77qo088+dUffvR1r/3ken/v829+y9uu17Nhe+mR14UbLzwfHnz94+HWKy+H'
-             b'mTR8og47OalN2hGKZnf4E1+MXWp+LJPf09wTZzbG8Efwy+ehnio54Wz/S/v1FakAJoGa4V3f8h3v'
-             b'/wf/289+6uj6F96GQ1apPPUhzOHFa9fCg/ddwCzSdf05N9alHfCTA0Ae0FsvX6sPVK0m1+ebRjxM'
-             b'OuWiulLJCt9DSlZzHUT3KXGd2R4GfV2BB2VmB+gu5jNh03FieWoSrUIotCMki9IlWdcom9IRNhjZ'
-             b'EJbzRdPskqWcbKMsjaAk2tX5bMkIUQs5KeG0Hj77+0r2EQjSuoLIUcmFi+dYdSs0O2TV4MvPR1ws'
-             b'Uv44L8zqFtZPwnQ0e159B+T7BH3YYT45qEgGEPZMxwTMvpaOVb4mdVobouMtJm8c3PJVOpotCGRz'
-             b'HIAjM62nqXIoLth/qKhDO/iR9qgB1sAp2NTHO2mzyCwW1Vu/f6YVx44OgBgfyOFNX34USaa0smSw'
-             b'PJVotqdK3fvq55SxCtjpGjyFvIKkiXD+ubPabqJw2A3NMU/Y/yDvqDMiNh3I8gYUK4iH7nRTtahp'
-             b'IzgaHAuERCKBaYiC8YZA1eLFDvc/RhAPRYsgbsSZqJh2DMzbiNk752CdnKlQcvM839ZDVw56UXQc'
-             b'Hh6F8/t7jMw2slfxNMZc7BDTMCocgkRpTk52UOLgvsWuZZm735TlFwjsPymD5dplLSDPCXLmTqAK'
-             b'9eIZzBo4JGmBlifQTJnUlOWUaAWnIuzwdxq45Al89e82o8qBYzkDuwciLrLeoewwaDtOGt36d2K9'
-             b'KkWMWcILoiZWwHMiIwb7yr+dovifsWtU98ZgFr1FkjuPUNQfHR/geSw7FpYGjBpZzLr40PSAqQQf'
-             b'I7iqCax9cj1S8rwE4y+UaSIrrbVbCCv18dHtgnx+qDyAOOFZmblaOEOcTvXZX5+/VH9fxDr82Ec+'
-             b'En7zox8Lt+/egRxZOB0yjoWSSIzOiHzeEx1/PfRn+xcPH3vTWz/2tq//E+9/y9vf8UsPPvTgZ/Yv'
-             b'XDo5OToN8/WyFhMvYM86FSlgvXaQqYr5keSw0Nvjj+bw/v/Prz7/IaoN6Q7WFy4dv/u7/tTf/r9+'
-             b'9n/4r/YXqu3Hwqr35YsvXAlvfuMTYTlrzEhqhCBbMpvKsbQpXO40dvHOzVfCw3vnOP8tPkfe5R26'
-             b'IHno1v2KB65Wx0dCFpQZHHaD7Pagsmj31nS4mxYgsXX5YjEKCRNnZdAn181OXk9IdfKQCXQ4I6yH'
-             b'EUFqskZ9wEaSfVQBgBksGeYxqITqLGloRCez1y1prDEhftX3KdyG9XLpdbv714wDihMEkayWk8JD'
-             b'IT85dORresDnZJTT6Uo6bJFdIk0OccczI6Gqfe28w/uX758xDdFyH3yzCZzrqrsLChpLejN9rSIu'
-             b'KVgSMlL85Ou2TA1Tpx4cdmIHumOOgEic0lxtnYsz+ynRER3tGBzpwWcaFQqP7sJnhVzPMCPr1JIr'
-             b'OGJQX31BqhJNWyz/wVLksC4lEIVyv0wXMaAkmPcr70TJawMDixTKlvFYQnjSSM4Etb80RLGisBCG'
-             b'B6o1qFx1INQHk5hOIdg+zZHzjvvCw0lsQ+UQV9mlubLnFuvrgVzNg8K6DSlOZFwVyNq+cGFfXe6G'
-             b'EQWlOFTC5gXPWVPvgOzXtU4U0GcXzzj2GZq0Od2gqM25NCljVNUHRgHLPTLR81lCk1jnFty9YKwy'
-             b'i5uVOynmQ0KyNbKudOk5tPAiOVzEqMfROT7uZsJks/6j2m3LZxdTHrxOv3J2PkycxLddTIaCht0g'
-             b'dS3SCY84pvzsZGYw7Lplpr2WSOCkSFbHyN+DOzeRQyKW2sKlyJSwRYxO7fMnlz3jWcqUpXk72AG5'
-             b'S5SAIpQrK2e8WFxtaPyOPLGEt8YlWkjPyKxaJ4nqRU4mwQwTpmScRmcHR2KRDFivwf6l+8P5ixfC'
-             b'jVeuh1/70K+FZ55+Bj9P1CRi2JU5xumo2z+tP/v28TYsLj321Pd+2/f8L9/6nd/99x944IHPi7mS'
-             b'NEmyV5zKQX+yUakp48P/+Ne/yBHAH/YC1xv27d/1vT/3C3/vZ//akE8vBSZDidb17r3j8PSzL4av'
-             b'ffNX0fhBF7mxsIMdoGFSfZIQdHjndnhl9mK4/+FH3akNm+eoEHBmd28wKg5DkAWDH+DCMkVS3nLR'
-             b'Jv+E5GS+J9I66O5LIfGuzQnlS0EIItyZGU4Ch9eubU4mQ5LvOaw/TwxOFE4b0aHIhrVctEM2mq5f'
-             b'FAHLOUmHpjxgalW2fJ7kBLUwga+lAAKsziJHC4xENEULsJPaXZxbnSNaohrsMJrGVMcuHb0TRDop'
-             b'ZDyXAdGqzyDj4FLGgXsFu4mxCYOsaFEnwEzNqxKA+ty4HoATwAfQwmRkmiLsgCWtUTq30Uh5E65H'
-             b'0NeWzQ6GOGTBK8rT+Rw65uJ+CHpqtK/1fLhIp0d0+wrpq/pBDUEyC7RpBylf0zExUsYR4CkgxW+G'
-             b'uaV1xIWtksUNm/kRZvyDukymTnME5DUQ8AOvfCWVibQMXb5m+qL4G8JW41Vjz+JjpxwCy++IE0TN'
-             b'HNk4+DBtckszVVncXCJXk2G6kZ1wQieq5MnAIosjDkRgRzhW2qwZ1tPgxOgsXw524cKgQN/r/N5J'
-             b'pwxkK6vB1XIePRmxMBNe1QJaBKllcP5dFsSBc36T6JkePZbiOu0wGYvDJ4QFtMqBi9+fpSt1ioeI'
-             b'Baax7ThSST2NmOplXgMhZShVYHQ1xyaFjm6QjiZVyBzcuhlu37iO+yVFLQpc+oVgXEJyrXuLFN0z'
-             b'zAApUgGhaqfOf45ZMAeiKCk0wm+IDeI3G3QMKBzOoALLJHQm6XOLXXJM+tiSDRns5teIfAu8Ru3s'
-             b'Lz/4qMx8w4fqwf/ZT38y3Lt9oJ+ZDVspZg9c98JtCLcOj8Kl1zzx2T/9oz/8X7/pa97yd++7/8GD'
-             b'/Yvnw64e+ILSDLQWN0LzH//6l1QAdP0f7oLLg/rw61//3Dd887e993f+2ft+chGja6ilE3/p5Rvh'
-             b'zW98Q+gnYT4+kw9m1dgeQHnYMivWm9eu4GC474GHwo5Z4cLwVXex5h8OYwnAc8ktXbFZ9Ese1qUZ'
-             b'PrjJkEF0etwhpAFOgxv8ObOCoERW2UmNeMrURVa5tieHx7VrmqNbDzlzTJbJQCdDPkygM7J3jaCY'
-             b'CMGJUYiwgNXkxNzIsqfBSR5B6hgnbNAdndGOj48ZJpHUx066ObB6NQxDdcmqK8+EE5HKB7g9N415'
-             b'GQmN95qMZT8HmnrlBIDFjPl4YL2XtcInQx/SLJGVzei21nVnQosi/Qg6vhYOYBk3oKvpPezCoMtM'
-             b'J7LM2XWH0KFBOxWmTmbbjOklb26TWsQ0tQLIaqfHGgATaNhDFGfcDrqB9pTCCQ8BPAGOCSzpECQm'
-             b'TR4EOU/mtcgHL7A3dglabnI0QzOUxEVypmWZ1/eygStgLQg2Wf0ZkDZWHFnQz771jHP1by+OFoD/'
-             b'wQNCDjAJLFqttfCVYrfH3FyRlfVi4QdvnIwhQZRazl0Bg/efFIlaknlsEcgh9Y6YJNJPdzJ+im30'
-             b'YJwYKQpSaKqHJOxvg7ftWo2F1zc1L/WgxYO6gNLfITbtuwS6zBCjqw5x8vqr9dKLPVMamOfE1PY6'
-             b'MY3QyXFsJuR192vh7K6J0fz+dTxTJtbkIM91ytUpcPg8Cqenh+Hu7ZuY50dD9cSt0Gx4iWZqPgah'
-             b'+My8htQztrgwjLJ42qY2QZnBqWZHm3mm68E8OsPZvEkSraupbAqhkQfdRj21GHX6HzjdbGi5oVaY'
-             b'ADWaz2Eb3s1X4YWrL4WP/sZvhBdfeD6s698LX0QMi0pWfpI4/23qn3drc3Tu4ce/8H0/9H3/5Xu+'
-             b'+dv+1/seeujuK9euYhyyZx40fwzj/xEiAP88usL6vd/3wz/2P33iVz/w78zKacKMB05P83Dj1p1w'
-             b'5cpL4Y2vewybkg3WzIYeMzefU7UQhNCpEYKMAi7ed5/C2HyaTAMs80hhlUI/SqmTLWYQj2ivqxG0'
-             b'GpW7oof+jP/2/7L3JlC2XWd54L/3OXeuW/XqzYOe9J41WJI12JZnY2NsbOO2wRgMJHEIU5qkHSBt'
-             b'GtJu6LBIAlkdoEkMK3QMnU43dAjJogEndnuB3QbiQTa2hSTL0tP09Oaxql5Nd75n797/uM9zVtMQ'
-             b'yzKEKpaQ9V7VrTucs/////5v0BtSiQQx5N0npRnx0iyHcHg2oJnN8bDpQZGeeIsS8tSi2NuOEu9W'
-             b'CiaRW4phf4ZNez0vTH4v8rTIh5kvTPaEhh4ghhDZ45klcLNpICgXtepKtNM0KHaor+j/Oyn0lHJF'
-             b'/v5S3C27PU8QXgNMNB3Qm38rT8DeW7aDWvBSIyC2lprEiGYWTZnkLRFSpHL4Dxm6YBiUcCHYb8Db'
-             b'JIwsYCo+MlEboVAaOCW91VEkr5lBdtCx4Y8edmTxjJ+DuuxpOIuUAERlENIdjwa0niJnxrnEutaM'
-             b'SQohJxLUjSscaXZpIkyvbUrGSQU7K8bc/InvTSr6kRoRXDfNRL6KrHC0e4ZKgpGCBPWo1bFM9Jon'
-             b'oBGlELLrWZYUObq+yE88REOSNDlSMWEKYMF7pGRlxVzkorlpxTjuMbnqoZ+9WaJK4Pxwewxlq0FS'
-             b'KCVDkvVt4DWLkTMd3x8RotnaRqOfcQPNCZtFLtL6cWMQD7rqFc6MixQF4/FZI5o9kXgtalvOgFa7'
-             b'kTMeVP4LoqsXYypKCsT7OTV0mHoYg0R5eyZm4hnTxnVFDOayiYUakYjpdATjzSE1x+srK9TEojzM'
-             b'i+SZ1iPSMBBaJRJZQj48iIzUyect60nvzfnU22dPZhBiLudldepMzAcqGYZQg0u88W2I/1Oyo2cV'
-             b'CjpLcU2FLpqBCM4tQ6maCO0Hfn5sr52+l6yvWWGCaNB6GurOnLsE17a2KQa+nQaWpYUFlt7ivYhc'
-             b'K4pg97A1nsOwaAzf/K7v+Odv+5Zv/7nhYHBlPNiGaWrs1JV05+vPQwPw5bRfqfu+4+57P/WCl3zN'
-             b'B0984iPfVLYCG6rEOR2Ajz91Em684ZDsQINoogubkKIuivnEpoOJb9ZIe9hL587CoZueJ3GQUXax'
-             b'BRHqXMHHyAg1yp6h8QxKqxSGWfco5+G1Qe3GkuOhiry/77QlF1w88LFpwH2pwsoI6+MkhQcfyUhw'
-             b'f9hh5rc2INjpb49G0O11JKeAb3QkW7XSc6bDXoozFh6UnKCpD68qwDIO2HKSg0bwgGupy5kwgz3t'
-             b'NHn322iKD7bcvI72aJvQW27T7y+iePoXzFbHKkShI/jzIkvRkAtqGITESPNdIZGotaRGL77VtHsk'
-             b'uDxYOh5P6Pz6WFbHsbucEOiJtFgFJgwSXBhmopGvqCjivhU1xPjnSoctiF0/MTY07wSFS+G02GYu'
-             b'SRQJXuZQzUzzzk+5kIOXDZDIJQ+Z92htLcY2rFARON8c3QI7EUY1XolsV4zZAJXEjyK3QnbfyJWY'
-             b'CqTPcjVuFoJETc9SgcGfQfSBD/85TZ9eYNowr3J8aMzuiFzHdW3m6Dkh3wOz7lVKqHtxvW6MtmXI'
-             b'Cb+XuMKYjqdQ9spaTx+hv9Ct+SS4HKiDDXSzNMQnky4zN8iJT4PJYUUrjsRdfIROu8kIiDo3QvZb'
-             b'xzULXvOIqKnPhRay4ZBjh9EMi/I0AtgUW5B0b0jNlRf3RJbVzTlKOTV2o8GE7hUkanq5RCj1kBQY'
-             b'gowh2ih8j26nJzwHvmfRex/Pme31VZr05+Mhmy+ZJVctJVCdHOlzYnJncEqd07S5yhp7k9lJs2N+'
-             b'FQ4klCjnIJozJaatSjJUs2ib0RGuGDE3fpYK8Pb2MBXqLYpsnpD8lFdw2NygaBDfD7zGdy0uwoG9'
-             b'u2V5xAgIGuygXS++74iOouHY5sYm/XlRcggW38PRwo4IoU2HxtX0Xu+76fmf+4Ef+u9+6Pid990P'
-             b'U4x/XxXkaOfrz1UD8GU7C6Wb6E1vf+cvnvj0J77JezGMSRdXq1XAWuoSH33iabj79luExSqGqkK4'
-             b'K2iCF+Zp5YyBG0Qfjjfb1XQY7DlwRHa+fFDQvlgKdxe7dEkYHE9GEqrRpQMKpx31IFem7mzOjnrK'
-             b'VMaDCQ+laIWEfwftOAVl44EzykTChjV4Yyz0e+xERYlkfNiSOgE0y7ykB0BHMC8OSGqKi4/V6bXJ'
-             b'5U2nG7w/8AbGPyc3tyoa0TWaDrpgu1/bbTsj/Yi1XSq4I5hsb0Gju8DRuQLzk3eVl6lViimZfwg3'
-             b'gNovz/A4/pxOiXiAmrQpCLu/yNGjWMCJAY9FrWSHPIo+pYOCJX8ITxdqR4yF36DkNH2gbAvZ1ih/'
-             b'VM6IRkunx3RfYuCoLH/6zDipSA59wVCIK1CZfl814xNJDnSSuFWJt0CQ1QzC+DOKny4oIRIJW9hY'
-             b'otoByZMkB8OCPwcJTVLEQVIrcZrCJih9A65C8DFAJnqQ3ANSFc/ntPIJlO4XJd5YHP5QUaHisVjZ'
-             b'wV9XdGPsaSHpcexSKPrvGGtBJbU+PTUi+DuRVY/rJSd7XoSxewvdjIKJ94Uz+SqPgxgKRDt1WieU'
-             b'VvHTVEefLzXkqHYZc6w0XgNYhJDkphaxaOZTSE1D/kVDzLc44W9GP0MEPEVyXK2PS8+n02oKwhaN'
-             b'jBhBFRWRiWf4OK6wRnBESGGHCI2IAGZ3UpDVVWHOis7lXTndA5g0mO5xRBi3tzZhfW3VInPFNwZy'
-             b'foDLqJogHCA5GCC/A73jKrAIVePYEEGZtORBzK8KzihhSq04qHojBVokMfJi0gtrpUKMSYWbm5uU'
-             b'mIr2upcuXUnXSBqOJmMyo1JrIHat5MAaPu/4GZ+/cBUeg6d4VeZ9llHHTHIEQgJlABI5ICm1Cna8'
-             b'bKb3uXKNVPyr4avf9s0//83f8df/SW/vvu04GYCrqp1K++cWAai+TNHhcAT3vOglHz182ws+uvrE'
-             b'A1+PWlcl5WABfPKZ03DL8RvJipcnwpjhfCMzFdR5KyGwEPIfNgEbq1dhaXk3MbcpBEKgQk1SoiAT'
-             b'qERz3LDUukiSsSnFB7OBhjNJIvl7d/hA6AnMRx1szIg7he1ET5P+cJi+v9cCi4dMz6+/0KHfgVMW'
-             b'+jNjLvXCQt+8gusMVpIh4bOMc7b6bbUlSMVLkzE3Ag9KqwhaRfiu1YYcNhCM9Bhr0y4eoBgLrHLC'
-             b'KJDwdLRJ0y1ByxrN7Hna9kT+m4rFsurIWaeOvvD4q9RcxqmxjxLNvMsQfBCXO4QAMYgHr6WCGyly'
-             b'LkP+QioKtEbAaUGscqmxEEYx8Q0wnbGqdInCsDea5szntaxxZ7IfJ5allo8AOtUCpQIiYmDWu2Vk'
-             b'tn8sqBGjKTwEhvdlBcNTovhzY5Sv94IM5eJNEx1N7mOSPmIzgRPnBCfPsiWcAUY9CHanaT/9WcNT'
-             b'09nC9zWyjXIT37MZ7+8ZZYjs/BV0mvSWHa5OmK5WbCajGRfydI02kcyKDpHyGW9tDQlV8rIj5p14'
-             b'wUYjSvBymX6rO2GEwlG3TVp5bbJkMsWpn+MwtQlnaWqz3RQeT0UFtYtmP4ETPVE5U7Yb1Aji9+d7'
-             b'gA2U9NrHdE5ahVDqYrAmm1QoiGalokb3qndmsAWicsEGriO8BprmyzKz3tP3LmKSIN3DfK9pIBU1'
-             b'p0VDAnCioBZyjqTPbHNjDbbSP+PRkDkLMRoq5JWoF6KhFAWoOa4xFIUwK6hAFQXZESRAoqaJtBmc'
-             b'nVmc+xBrtufs9Q9iJ+zEe2I73VOXLp+n6R6vwZWVqzKdS/y5L8UzvyTXQW/pM064FNwA8fCl2lKW'
-             b'IYLLKas6dtDwIk1JdLp6Q5KqE/VEuu42B3DgeXd+9nu+/7vfc/u9d3/S4XkwH+9U2D/vDQBCiF/u'
-             b'F05H3/At73zfr/38o19Pe6nAJBc86BH+PnP+Etzx/OelaU7c0qRBMEc4ufBNnKcSNNr/V3Dh9Ek4'
-             b'fOwW3mGHvCdEAhAeSMQQDjyFkkVrxXnOC50FVhCYBlkiRIv2dXCcMm4n0wEVPjYYEmtK8BQFisyY'
-             b'XACzRwAxotNBuD1IRXeiiAOzWdmGV1j+UZgPXuWDhem58QDE5qa30JHoYWeabjU2wt5pe2sb+r0F'
-             b'TllLRR8hPNzv93qFwZAgJLpYTWC4tQoLS/uyyQSwn/b1O2dx8kMJI/qpixyNtPYSiOLEgEl17dyP'
-             b'iI4dJy45mHEqwZ2y14yiOdssczwzSHAJQ+fkxEieC7w/5c82cJ4olcZZlpgJ5J7pALWCaFMrZH6D'
-             b'Z8lG0eRJp5DUtvl0xJbI6gpGbniqAGHXQco7CIx+TEgpwDbJBIvOeQ+MaAbC0Qhll/K8OdiLvf+D'
-             b'EBFpQg3O1g+YMknyQw0BilkAyqsnYYu7KpO10NoajVIospmnuAUqbGDWrlEJX+DEFU96VYnspgCn'
-             b'Zo5PDZCzNBQdQt5MUXSMGELGOtMp7eixeFcxq3VYqggEiRNpsGKpadO3jNPT72n0pXhfOHmelZgd'
-             b'FdIEpt+7WC7INcqTrkpK8drudgpDzWy6BrbyRs6G8BCZZ+CZ8cEubDlBMAqBjpIbS3bdJIdD2W/j'
-             b'XnqwvUG2uLN0jUxQax64Cbf42Ch3u4XDRI7A9oUl70XIPh5RmwBZfUbLtYuU10BIlBAm+fOQ1WDN'
-             b'k8RLZDHC9ytXV1OR3YZTZ87CMF0/Y5TK4d3kA6k6yHCJEDtBTiKdWJnIlwFC42MYkRAs5kCQpBrK'
-             b'JgZndvDOJZ4WQ5rSfTKcj6C9a+/lr/um7/jFr3vzW9/X6na3J+jIWjZ2qutfiAZg/uU3AGF7E171'
-             b'6td88DO//4oPXfjiZ9+6kA4hhDWD4735o088CcduOgztoswEsSg6bhksohcyWc2YhyZJ7K3TDXnh'
-             b'zCk4futtdAjrKoksSoVMAwLrZsKS7sx4P9hC6Z8vhWXOUwJCm61UvPEQwk6/S3m9YJJEVRyQfpzI'
-             b'hFPa7+M+DOVExAQmY5eS/MCHaPjTZKkX7we9OJvJFCuxxurVrgcEKhOaDa/5QXLjqy2nEzdFIGMN'
-             b'L8Q4jM3lAhHM5lIVAl6agJCagO3NVej2d9ONTC5/QlCjacArMVMiLSV5jxAIkfXhayBI3WeZHDYv'
-             b'VcWuaxyfKy58+AgFQ7gFsOSOHf0k1U54G2HuaDqnydoXsgoQ2FEMgHyoy9xqMba16VRbJOZvzfg5'
-             b'pYMdfckJakdLzoLNerCIzeYTLtYVr1I0IIjJ1BzBSpNhUVoQDhW4ORMIKS5Z8hTo+kUJZZMd+RTh'
-             b'iOKJUMW6jJCVJUVkhAKJXXMBeZ1ourVq06oliFTbKVqmyXfRoFzFsqe65xYxTxuRgYoP8Sm7YnFT'
-             b'KtfWTNYdhMKQG99UTG1KIVbKgty5miumu45UOUpFsiekWvXDwCIxrqacykfqHL5uUd6I0dhOpIme'
-             b'JIUNhp9VWgNCEg6s6NgmBUBD1gTyGQS2Ku60u/baKTAMmxSCpwtGTdJjzIhzUlq+hxMyrkd+BzUc'
-             b'HSLCra1eTU1yKvyzMftQEIeCV5NRzXc0Rz7wkBBcXdWC2vyKgmiI6KeiXOEycWhTlGtCHDuDwPi1'
-             b'6zkKiRWvlQbJ8gpKzbu2vgkXr1yE9fUN2EwT9py4gqVYarOrYCmeG3rdBVlxEf+II+8kmwEsbdRc'
-             b'Nj2v/0xAVclYpA1s5HRQ4kSTAohN0lCRExrt+cLeg4+97Q1v/tU3fMNbfq2/e8/lrdU1cjRFmfXO'
-             b'11+QBqDZ6z87j9TqwGvf9m0//y8feuAtHeLZcAIWXmjDwQgee+xJuO/eu2nS4nO+pMkPYpaiqSkp'
-             b'JciZPpe7+/lwC65eOg/7Dh2lnTII7Bet5S2lg50LmuBtVsT1gUoXndeJS6BRlSWYty2QJhWnOwqG'
-             b'kYMaizKZqKT/jcWf4mdDNCY/HqiLSwswn7Dmm9jgeCp7YDkW7jjNxwAlNxXB5hROAsFY3UikmaTf'
-             b'j5McSs5QY43mQ2Rl2uuYy1ejdGa2E8nVbZvMTRoE+UuQD6Z3pcN6NtqCRqcvkZWVTB5svwsmUQLZ'
-             b'b7J9LYgXQKWOLHLokYkQwvhkkTuhQ5XDRcR6GKdiIXjRhCirEPoucRLEhokQGymaVHLmlZy1HnS2'
-             b'tR2kMwUy7VKJHwA5rlmNHxFGJmb7fEwFGxumAJy/QM8nXQe4m26UTDKryFtB9s5zdgEUC0FqHmjy'
-             b'xVUJWRdPoElQNJB/QozaqMle1cme3hWCojAqQja+6TXNUlFjMyDmVDh1aQvZv50nTE/5ExRugwcp'
-             b'oVbeZBuzWZD1SrQ4aVxNEESsigC9nsPMdOTqgleFULOYZfWF9zote0k/5LtFyalKxlMEfkHyMkLN'
-             b'2hd3/9UsQJ2/pjAy8RAIHSuyMyjFCVeyfqkZ3+BjIRohjaATFAqbx06nZ7Gv0Qgoas3BzQpee3z/'
-             b'RtrV82XJvh/oJLd24UK6Vzb5M8YQIeHO4PutBjzMEYliBw1ZvRTn5qGjhD/ppc1l1EkkdZBAM3UG'
-             b'BR9zvxO8RVejTLeU7+GCfwUuXl6F7XRmjpDTRITadC2nM6ch6wBWlgYhHlZm10zWQJg5kM6NLSTw'
-             b'jSva6ZftzsS3ehudfn+t1+ls9HsL4+louLB26eLN65uru9CwTYUIQQJ/woyRnXl6zTNcp6b3u9Fe'
-             b'GBy84caHX/ySl33oRS97+YeO3njsi/09+1PnPYHJYMiNfLnD7v8L1QCgf/yz8eVm2/DCF774Y7fc'
-             b'84p/e+6hT/zVbkNOZeLBlHDy9Fm4+fgxWEpFrKIEvZj3kKbMVbuKGpufcXjyx95YuUp77eW9+2nH'
-             b'qLss5xtWRDAJDHeguG/XKNmmOMwFcYjTmNJWhyVEeKFPxiNO1iNIu+CDUAxhkM2NiV0cShNprww1'
-             b'cw8mz4FJrYJMWEH0u2Ae/tnEyEEuGsqa1qmLiiJJtZDo1bLvqS1J6P2ZTljmh8ZCXUzjAp8fL/Ke'
-             b'EnvxCr3G02P2lvbApOJpJFggjqjoq5xTzchApE5fv4cOvYIZzfz9QlwLyobniVpjfgtSFQR2rktN'
-             b'CBvmgBgOMUeiQpmlk0nXqnmWRtHqQyfgWAMzNUERC+eclRCBAlp45UIEPlkvqAaeDH/IS4Hd/dDl'
-             b'ryF6fx8razoKMXTBa4bY/chFwImy2eSADmw+cBKca5rhXAiIntZEhcjIqBBUnBRZQUa1nE6CX6JP'
-             b'd0b0CzRBzatKZIYRtIY4I1AWFj7TrSWEEVnRl/QcyFynWdo1pb4USMaLDmx9QiiahgIBxZpSE8nI'
-             b'SDTi2/ZwkAp/R5oFZ9a/ZGxUMC+mJOMrzsuYTmZkTa1k26DJl6JawyeEhFdExNABEpUi3Ox2aaUG'
-             b'YsmN6B0FYcVoHIspJQKyjTASeOuyx0CfP6sB+HIOsJ7ODbxeMVJ3RkWVmw5qrGqqDo7ZZRUS6I7f'
-             b'ZX2+XKCCDDhObXReFhci7a0RMKkHMy6A3L0icy5SEzicTGFlcxPOnDnPRL7tIQwQ2sfPEK1zMbhI'
-             b'Gp1K3mdKxiyjGfngwVMScdrD2uYIpuk1tJcPXLrrlfd9+OZbb7//hhuPP9Ff6J3dc+DQtfZCb9ho'
-             b'tifEipyN3IWnnz7+4Q9+6PtOPPLQ1wxHg+V0LjfCbIa6lSoNJsN+f2G7v2t59cANNz512+23f+7m'
-             b'W297YP/e/Sddo4iogqDskeE2P6+dr7+gKoBn65EQLkqH/Rvf8c5f+MUHPvUtvRa0yCnbsy3qJF0s'
-             b'j5x4Al7zspeQL0A24iis4Dsx0SHrUBbQ5NbA8Y2KKADer8t7DtDBHMVQCEjPzCx82quTQYjGfIpx'
-             b'SfpdI7TlxH17r2sTBwfDFAbL+xLh+5KmcTLdgGhaf02PI6MVTI5CAx8ximFP9AouXrgIhw4eYpg1'
-             b'/Win087e6HLgF64Q/X4kYxM6uEWChhO/sp39l6Q1V+K2B3KAxTKaNz+To4JMVZm4Q/sLGMPm2mVo'
-             b'dZfSH7PvQB3CxWKuhYukmqgC8DpxBHMNJc+mObO4Cf7XOObAsO9MMgcq0FwBRmvo3y7WLFhk6nd5'
-             b'ZHQa4KSmM1I4MzeEpZz0e1DPjmiHV5vcyCsOdOiT11Q0dBpnhKIy2d+M7IjJg5+Mn1gCRol/Aufj'
-             b'45O50mwuyZQcR+vNqU1oXxqLnJoc/PNqrK8ziIJE+fQus9ctB4SvPzxIKQtArWDT59qU4oTXBu7n'
-             b'myW/Tk2+yzFHvq5qtbWIrrDI5ArthNPjN5siC4wur8nEVtmLbz362Rcdb0Q6kMTTLqIfUPOlQKSs'
-             b'4oahU7bA4ChtKMmFsgCt+FSoIYoRGO+jF3pdQ+YoZ4BMmqKtRPA5IQqhzTNP5kyIixBtLcL69hk5'
-             b'KCLrH5s9tOBFtAd5H9NUpDSG2mvR5zAKQynVGIr0/tK0W+4D3WGFkW+5cS95OIkgqg3P0kZTL/Aa'
-             b'ITjNBGG76HH6rLe2tuDpk2fgUmpM0EWUm6OS7bHLlqkwzEXdMXeHhibkhwiBlc6P9F5sjtK1XHam'
-             b'h+9+0cdf/Mqv/Tev/NrXfzB9w2X8fb1du2H78gVYWOwj0YMvvtmUnt7Srl0nv+cH3/Pjp584Ab3F'
-             b'pWL33n2N1GC5yWhSnXrisdnRo0firsNH0mtAxG5Kn9t0axtmgxEjgdHVU1V2vv5iIgCjZ+3B8LHu'
-             b'vusFn77rFa/510/c/9HvXe6VLDcDTpK7cOkqXFxZgb27l9i3XnK/Xcx5gXzQV3bQknmmE3NLR4sF'
-             b'WEsXdLvVgzYeIJQcN7cOXeN6O60us9/F4EcJViS/KqMxqpVkxgersvJZI90QFAB/Rg1kcKfJPDlP'
-             b'WfSQj3e6YfF7sTCvrq7CwUMHataaXNBwHYBObfw6mQA0J2e+hvz++g5RGeFBoH7PJkjYIBBJMhib'
-             b'mi1kIzvVNRgiDrKLBYFqfSp81ShNcrv2wmReGRKi+0jOAqiYFCywfZBDu6RpdEaYqqK4Hs17qiDS'
-             b'MEcTP+n4K24CyNpXWNQEo8/GjLDghYfOYem1kMWzz3tIS1uDaIWcK+Zc7H49+eOjdJBEByV7r1PT'
-             b'giUnhkwwtUdS5ig/H2wCvAQfIcqB5k5OGg/POKgoASITq4TRT+SnOZowtZjFnw5F9F0ggmE986Lm'
-             b'nR6UTOXddVrGzY1tagyRM0JRwcBhSPSWRSnIVDgb4gUgzZDLlrEVuQrOhKTIMLzKXdl8h58HIWA1'
-             b'u238HtSIY3HFdQKSUPF7sAHqdTs5kkyJuZE182IXJbt8oMa3Kcx7QsoQ5m8yeoYNQwjZJED55oPh'
-             b'hCSFal5lltYmq6vzDtiXwXAquR4wdY5DlqbkpUBSzXRtDTc3wHXGsHrlCoxS0Y8SketEOZKdQTMC'
-             b'42XFoIEW6irpFYV0fAYFI9A5pQ/L34E19aB3ueZSSGYC/u5r6xtw6fJVOHX2PKxvbhNz3lNgTlMy'
-             b'P9RASdo2ifM2NdI8sJs2XpeB1RTrgwG0dx9Yf+nXv/nXXvvmt/6rA4eOPIRHZTO9v2tXLhH8D+0u'
-             b'83Mq9l4wsSI2funPq9GQnUP9clW22hX/OQdSIRkS/x6HNCbGllBrx3e+/ktoAFq97rP7iK0WfOO7'
-             b'vutnf/bBz7y9CqM9dGnzoo2Cd7544kl47atfag5malmpPvIEhJI8TGVIQRzxXJ5GU9OwcvEsHL7p'
-             b'FprWeNoQi97gzDHMS3FDmV5J1qE8YRcCiyI4Oxxw5GiOsWViDE42szgnCNjpHhwiaW0RVsZBokPy'
-             b'K7CIVhCpz959++HSxfOwcvUy7N17gHX08hxbCJMq+UdCkbp46LJTCEGcA4RbF/oSgwoENSqfodfp'
-             b'pf+eUoSwMuGd0314hK7qpWOUYivohdd96hS2t1agROMYNBBBLsZsJnxDeR3EKm7QnxPkrwRAityd'
-             b'0TRNu2fPts8I3+J/U2EU61RtJKrAZkO4H9amhorFeGJyUVUqRwtpQoXERFCMaMTD6XxEE3sDp0l8'
-             b'74Jn0yDg6R/XDXhwlXJN0NSUAVnmHKCMD+H8wIFEeLI3Fd6XawjNeTh2dk5sZ1+KYiIyGQ7DXWhg'
-             b'FvmiMtJizl2Ty1tTCSMFwVCYjXwLojxMvkSEqCvsaybK4Z6/0ylJHqqXPmVYkBFOzTkvsnkOx1hn'
-             b'FQT+wPYQffhbdJ0iFyMKkY7dHVmKCcIF6UjRj0oHlxJHBjyjMRXYJh3+BRUuRHOwUWCteKR1BEha'
-             b'ZUMxfq+I25hJiAJl9XpK4mPOAQcRTTkwy+UGfipKC43qnk3ncg/rnh7IlrZ0HCU+Gm6QD/8GOvJF'
-             b'XhmSWRgS38xIwlPDZmgSNWWSTGmuRhpL7GtBShJ/jQ2QsPd5dSXGVLEW2wt8juF6CRurzTQxP/b4'
-             b'03D5ygpsbTNiiOdBq1WzQSfCocvx4ZKgxAFgQpKkTKCC4nO301HS33vw6Vd87et+601ve8e/vOH2'
-             b'Ox/Hbxiusitho9H4MxfpqF1jDNdl1e98/RfeAFwHIT4bX6lAHn/+XSfe8Pbv+JmP/Pr7/8lik5n8'
-             b'UchY5y5dhlNnLsDNRw+RhzgT153oS4UtG1Uj74xopDcHSdPwlpiO4MLpp+DADTelgtCRvbnavdXs'
-             b'bmMt39Nxsla09CxHN6qZISkDGnXLZWHWt3mC8bS+IMKVQII5bhYsLAf10LuWl9MkcpnIcsu793KS'
-             b'l7GiQZi5QSKIzceOJgb2QBe1Aoa4TCo58Fokc3KUZFfR9N1sc0MxF+mjMunxxEK1AjY9yG2Iqjcm'
-             b'tH6cilg6KOeT1Ah0U5FomtufTjsInbM0LxKQG6QJckTya6K2jg5uir1N72ur2ZDpvSImdjR5pcCZ'
-             b'4sMQa34G9L77HA8NBmvH6x0daUdfkDeAk9Aagq0loS96L7tqXl9QQEtREhRMxjwx++ojEZAtbAtJ'
-             b'TCzJX5/K1mzOSJPnfTmtDXDNQQY9U1awRI7pjSJ9M1hc50LHltF4cGMBiwIBkwd8iFa8eD3kzIhG'
-             b'XzMnSpZiwMRkUvwWZNdreJQ4YlMDgc0rk0gF4BBUh417nGnfKa8+fcMwTXRo3UtS1wAWzmPXuJJR'
-             b'hVpOyIDLfBhEkRHl4aYr1FQrQHr9WLelJSSOi5FKdxW253AlbsodXn/p2iyiEP+8vp9BqZHMJyDl'
-             b'CvMAMPQKkbvJaARrVy/Spc1uuo5NdVRa5JRcHDMrX+/+EMyPI0ghdsJ7CWYdyVp+VhjI8kXUSvw8'
-             b'vZ1NzBtKTU9qXh55/Bm4snI1/bNKEzRev01KBVULbZXtegELnHGhMpjECoJZ+oUjDMwpinDLXS//'
-             b'2Gve+JZfuuveF/3e7oOHByTH3d7iJM2d6Xzn68/aAIR0WD3bXz5swhvf9o5f/vTHfvdvbJ078YK+'
-             b'sKerwAKxh77wRTh8YA8TEBR+c1nX7Fw0+FtdqVhjnS9wklrNRnD+zNNw+NitxPSfkySKWczk5d1p'
-             b'8iHUEae/EHkyEh99fFLtJu8T8axBEjNOggyDBvPIIDJSmvr6/S5N607W6mQdSgUnChFM5FLp8ZZ2'
-             b'7YKtjQ3YuHaNivXePXvAUGA5jGczZKF7y3J3wkPoNFmGpnBgq1mIQ+IcNFyHZVU4lTLhDeVci92u'
-             b'SdTwWWATQ4QxKeoVui0WYsmcHiukqQr3w75s0VTs0ZGP3mueMqsZR85SnK9IAYuizdwLDKjxYqJi'
-             b'OeJzmvp0Wonz7OqXc8pZ5aGWufWY5ijYvRPBMoYg0XQ+nXCIj+eYVoojTUW4wqxx5CogiUxsaKkZ'
-             b'Esc/zZCgv9O9QAFieFSKC3XFzQJxAPjzI94Awvpzfq9wpeFFfUFrlaiJgRFqgWzmWz+f5/USJcAV'
-             b'+Ha06GeQ+IbwN9mwymunuFTaxXMwj37OWEy2t1hyV4h0DLXXeD0RgTVUZhOLTQ8yx3HaxmahKUgB'
-             b'B/wwioaTKUbmGvfTmbBS9PVADS5eE/h9LqpJksthW5olD7wiQeIhSQJDNorCvXazbNLnwt4NrkZT'
-             b'YIInSfWKUgx6GIlhJ0HehZOO3OVESuScTNHZjtYXm7B++Tzt/En9IQ2I0wwIJe7Zoi9AYeUx5sZd'
-             b'xO8BJCpXzJTwfiG7be5cqanF/547J1ukQPHlTuyZPZkQNeDa5hacePIknDl/EQbpsyB4v2xkJau8'
-             b'P6rIYOmfY4dEIjCKkU/Bjc5kWsG14RjK3q7tO1768g9/w9vf+cvHj9/8+82FhWqwvg7VYICdpKEr'
-             b'O187X3/mBsA32l+RB148cGT92/7mD/7E+//hj/5fnJQmRRwPqtEY/uiBh+FVL32RTR1Z6OUs0Jom'
-             b'uTivScGdOGVxJjYl0s2nsHLxHBw8epMx0Dm/vNQVozT/QXLAO1BIXKZSpmhfGllTW7S8dODe3L1w'
-             b'4udJy0mWOpMU0Wpzobcgk67VOvrCyXTP/n1w7vQpWL10AbDR2n/oILvwVbyewEYkyL4fd9FomYnG'
-             b'KyoowgLBVsUtXmnIZDYezShsqNfhyR0P6KW+BJpIcjmehsiwNr9enWSkGKsHO+YawGwME9zPz0bU'
-             b'SIW5pxUBJr/R9l0Ifk7ifNkhyV0Xc0rTIWnu52KPq3pnJheyzhCyNS7kwmAztKTGVIGb0ia5RzIp'
-             b'j94PCjziSY50zO2SZJcgMkYlGBo03eBVAPkVVGxNLOxJW5vQ2in9XRObAPQJIGXBnF6z2syCaVR0'
-             b'cxUEIhe4GFnvY4n89SVN37RikgLBwJLYX5deioAjYIPgb7SPjmiqOeDkyUKu9fSH/X4nF14hNjKR'
-             b'LcdcK3el2xPkSGxcGSma036coXfhjJgZVySJLt4TUUw0sBlptzrcCMn+G3k6SGZDeWKv07b7BmV9'
-             b'3jVqz4PvYrpXLKbXWYNHSoUZ20V3VGJo5kf8WTjbyXMxd2KVvHL1Kmyur7KM0bPol0h3NkBEQ9l0'
-             b'F2/+EaTckDcxOMu70LyC7LlQMUoBRXYdNLWhohEVfT6OmrgWRYWfOncRzl64DOcuXoHJfEZ8nma7'
-             b'a8MA+RiI46SGbmXyMQZ6adZCQQPFOBX+YRoOfH//lde/9Q3/+g1vefu/2Hfo8BNFes9Gl69QhK5J'
-             b'TXe+dr6+nAZgNht9RR7Yzcfwsle+8rf+4L5XfODMQ/e/vdOQ6Qo4COb0+Uuwf+9puO15N9JNS/Ct'
-             b'ZqiLgQ8UIWedO+U+g7hoCQwQCphsbcLlc2fg0NHjAqM5skgNYj6Ch3kh/tU8bTkr7njE4fTcIWJS'
-             b'zIQrANp/YhgPHkylxM7qeYZTHTr3aQGck0GMowkminPeYr8Phw4dgQtnT6fDay0dtttw4OAh6KSm'
-             b'IcrELAnhYtyhCIc4DVKqoO0ybD+KDQRO86C+BrW/x+eOTO4uwv710ZQIlPKaleXsA5vOITHOB4Kb'
-             b'Z6Mpk91mmPrW4YZCJowgUDlB6IX82YzNb8i7wXPOPe+yOSgniv2zpfvFkCfP4HNVlWYPiYYqHdPE'
-             b'Ui+6b1UbEc8A8+oxZ55SBCfMjMYpXsJoovIZAh/sVEgEdiYWpw9U8EssYLhOIVQjGGsfRFJmmjXn'
-             b'ss4+ck4D+MIgc4K0yVMgmL0Lviej4ZiuPQrmETKdPg76qiOcrsYr/cUuQ+uBVxBl4a+zZGVjobwu'
-             b'w0kRHSGxAcBEQ6/Rg7b/4scoi45o+x1xH/Dl43WKD0poF0gyHfA0TpzCmM2ZqBGHQGZa1nAQ0hOY'
-             b'pCfrLJTLdqlZ1c+OEQL0XeCmJwhnobSoa1sLkYthC3SDBbJ2uXzhbGrypmQwg/1b4z9RUmhAEvNU'
-             b'uKCzL0iwtYxK8dCY0JlJD71FhTcXQuacVBYHzsYAXJipGSJZYUnHznA8gUeffAbOXLgEV1eukSIC'
-             b'UTR28KvnfsglFL0E56TnWWTlEnpiYGuPMlMs+rPYCodvv/3TL/+6N/4fd979og8sHThwGZ1BJ9ub'
-             b'4kvA5jw7Xztfz0oDQHKOr9AXHoDf/n1/++//1HsefE0zjndzylQQgxwPf/yFE3Do4D5YXuwTKUwv'
-             b'7vilWere2U6YcgMIPqsoOw1vfDTFGW2tw7Wrl2B53yGgl+Ry84CFHCVHTE+qpBA5KgjYjPQ6naxH'
-             b'1yIf+aZk9zohydSCVmLMIT40EEvGveaIg5C/MMcASX0bK1dSsRzD+bMnYWn3Pti77yAR7aJorX3p'
-             b'sqGJpBY6IWupgxexxYsmGwIJ5Aqa/a0wZoH6c5koXJbpIKyL+m6aNoxspFGxFWQDOHECS5M3muFE'
-             b'isTFnXoTWp0+kYxwj1nNGaYkfTwmIuJedzoxMyWoRZZaE4C/R8iJ1Oh5YeYD+8nrpIvuffz+za+z'
-             b'VGULWoayUQJANsPYUDbZqheLJaZIUlNAJL8GQbOBmgrRU9NzZJYzmdSiXBTEtMaLWqPmj2CaBPSl'
-             b'H4ypUcRmYzQaMZmvwzn0XZ36yV7Y8XvrI5E+LX/e5WtHZvycmhe8EfjQQhpJlchtiSKJRJdJakal'
-             b'8GrwESsAnDUqTtIDkYDWbmDYFK8s9Pdzf6NunGDaG0x+a6YmpfDBmjWUQuKOndYGkU12gHgwcyJf'
-             b'ov8EOctJE1eIM6dWZ/bdR9OqYAV2gVYQ4jSX3idy1ey0Zdpn7gk2TcPNNXLpQyMmnpRFJqq/LMYc'
-             b'YiSkGmXTxxqKAAY8RVEdUbsm2xnBTpz6OKDapWDlRlEY+4fl9sgVmZO08MzZ8/DE08/AyvoW+Urg'
-             b'eqdRROEgRDHUcrwSM+mksBqQhyJrM+whMTZ3C3kZew7Gl7z2Db/9ite/6Reed9sdn/DtXjUfbMIc'
-             b'A5fK5s60v/P1lWkA6m5fX4mvY3fc9YW3vut7furDv/r+n1/AiT6IJzjKeNId+fmHHoHXveKlrLnG'
-             b'WU0S3PAQLMzE3hNEyetMbiCC+gY6Z3tAbADQBnZhaY/wDXifvdhf5CAWwwccJXMhvN6j3bJMecQ4'
-             b'DnS4t1pdStoiWUzgmFJ0AKyEfKdsfi8HRyFOeFFI0E7h9lSw+v0+PbdWwcTBayuXAf2yl3fvh276'
-             b'O0/yLT14C5o0BqkhwpVGS4o4HhxoitJfLPPrJri/IMMblP+1UsHAiA78TDVsRCejdqNVKzb8GWCh'
-             b'wMATJGplwpgoCyJHC2M3hQc1ys0GowEbkfCImJ5nei7FTA1QzZ+AVAs4aZL2v4ajRicQL9hEiNN8'
-             b'QYQ9/jfLIR3v3an5KgnGJo10wTKkoLntkTkA5KtQcLqgk501cUSqKZP8UKMvHgdRkvtqpu5M8Kon'
-             b'CYrLn+H7zoNSFSInMBlRUxsPRVaQzY3XCBq69Ps9M53BL+QioIqk0+EpGZnujjz+G4Yk4JuD+++W'
-             b'RCuzHi2yn4Uy/UVyiXIz73Kit+IEHP4kpNfg1FFaLIDT7yqipGs6i5/Fx2eCHsf8kklQeu98t7AV'
-             b'C8gnTWsTifyOgjARlF2oB74XAh+6BvYstlkLqlORXbrvup0mOwTi/Yss/rUV8uZ3YS7R02IfTc+r'
-             b'sHUeN7GcbKfXbQV5DeQ0RleLvBR8VepQmI+aTZJjD9vjVi5LdrGlwIYZ/3x1Yws+8enPUcOCnxui'
-             b'Ar3OglhRB439ARUMBeEjRA3XkRKO790cOTvpOhilS3f3kePw1te9qXrl6978I4duvvWfAaZhpiYj'
-             b'jAd0z9VshWSoqjU/O187X19uA5Du2q/sbwgTePtf/c5fOPHgA284/dD9b22p0QbwYXT+4io8feoc'
-             b'3H7bMZiPJ+wgp0YwQYA7GmvmZg5DTmou2wQFIVsh/Hrl4hn6797iktj1qsaYiVZB/MhxklrsLxjT'
-             b'Xw841veXAvXLpOVdtsMVX29lfk2VUGYxmjpA8iGFhwOacBw8fIQKv6bjTUZbcPnCkDy99x25ARaX'
-             b'lms2qY4kXJobTkUiTeD9fgNU5+0NbUALU2wKZjxFi2se6eVnM85Xx52sy1GHgTzr2d64SQFKGgUb'
-             b'zdCHqVOVRJIXPM0Efs1xItQqPyXvcZ7CmNCEU02z1bXDzyZeDX5y3ARWwtVQO13+uPm1knwOXzsa'
-             b'ljgmMlazCRVzSn5rsCwP0QCMOyUjnlBZRHQg3f6MUAIylIpz+ewhyw6ju+4M1VUOhqxg6E6j4AAh'
-             b'zSnAQttFTbUGEMVKpnWQ9RKQHTNC6ogqLSwwUqXMzyiIGMLfTmRjTCeXZiNyk0crMhBDmSIXvKyT'
-             b'54ZlMBqTX7662eH7j40ruuihfLTTLmqMekdyPJQhOjXrSb8AkTHLATDvgjSVbw/Z+Md5k9JqFQ0S'
-             b'KIQEP9OuWxgTv4943SHvg5L6am9yBsc8ySJREdMqC1i9coHUCaP0/uH7Wso9H6RhLcSWlzzsxcJY'
-             b'+xuauKOzkCAQnhE2lkw7iULoCzn7QbdOcr/QGYENWphr3B+tavDvzl+8CBcvXIILV1dgczhmtM43'
-             b'WD4bIMtUXc1nIbIxlzMHz8DqunSxbKXC71LjcOOd98DXfcPb4SWveh20lval2yE8WOF1UfE6ZjhJ'
-             b'zx/XJY4zU5A3gddao7dI10MZdhj/O1/PRgMQvsK/AaHeZqt619/+oR/5x+959D433zyIO1e8ISos'
-             b'JulG+vwXHoXuQhcOH9pDOeo41SqJyWzBJGwjynSndroaCxsIceVIz6sXTqc/vBGWdu3hKdGIRj4d'
-             b'8COCcV2NsEcQqSQS4lGCrmXRuAdcbDvNju3+iZMmhCf2lmcnNCpqWkyUTxD45/cdPETs9NXxxesy'
-             b'6cN8BJupMbi2skJNQpdIhZwJXiFUaainqAVk9zumZqlMBYUh8Ta5BwZpDCTwB+1EdQlpVIB0QFdM'
-             b'WGNr3FKRd5b0lTK9ReYmIEpS+mgRvooRIJzv1TJV3ieyUKbwpgF9tjoFai46mZiVPOEXErlLoTCh'
-             b'YBMikvdVkhvvxZ2Qi1/ZaMmE74gngOuJUoh/FTHo51bYK7H2rWUH1XloAvOz8yTubrFwosJDXRt5'
-             b'FcD79vF4LuYzRU3qFUXCBwTN99KU68XPwYmzpRe56ng4IWhd3dxcqc6FjhCl6GpJcBVPukWrYaRX'
-             b'XN2026LrtvwcTaiMNhXi97c7HdAkBfYs8FZ5SVOvzHdpBtFy2L7HR9PCG2gjoDqhFek6R3Jmp90D'
-             b'kb5TczHcHhAZruUlkhgqWsk1oGUqDEJ9gB1BeZVR0j00HQ5g9doqDIcbJJMspMEvHHsikMmuaB7Z'
-             b'1lu4PzQAFHTdaJF1UVdn6q8hpEY199LinF8+31PCIQjy3eh3gCTjC5dX4JlTZ+Dk6dPS3BYsOVWr'
-             b'alm7uAKM8GgqZEn549S8OUVHD9J1tPvgjfCal78WXvPm/wqO3vJ8KDs9blarabpAir+WfugPnJsL'
-             b'Pyjy9a2kI10fcdcMje4CG1VJWqez4KYI1zFrd752vv5EEuBo9JX/Lel33HjTjSfe8a7v+x/+3S//'
-             b's3+1jE54aKJCuvgG7ZA/88DD8PVf+yro99ocP4m3udxMJLehIl/IdBjM1UvjOtkhKxAEi8V19dJ5'
-             b'kg51+4u0h9SblA1MbFxhcli6qXHyY4lUzCxp4BQtZdU7mWqRVIjPA81iaKcpASwYNtKkYBZnpiqF'
-             b'EKkQJDxw6EgqCIP0zzZb96JfO4bqjDk3+/KZU3SDL+8/CLv37GV9cpWja4UZyDAxutnFwlTzNn2Q'
-             b'fG5KbPEGnk4kB6tEx8w/zoQ0CxtmeVmatlEiuWvXEkzRXa6WTubd9S52EebG/AcxjKFDb1aJRa7I'
-             b'2BwYb4MUBfgxpPcIn4sX5IBPzJI+8yi6bJBiGMVHoJplHoDCCg4Jg2EujVy4zkHOkgUtcEfjT3mv'
-             b'jURBfk3smEjWy7F20NaIdwTXR6fCFCrIVGzb7OZIRFAIQl4rjD8QINh7ZJOvdSHy+Pa7+CfIuz9I'
-             b'GA/ukDGQqpkROpyskVS3kA5/M8YiMyDkhjhj+CvHZYiuka02NWoIsxMVoxbqU4qTJUhhbqYmCx8H'
-             b'GxpGBIL4N7ADpg9N4xhyiJQjEyP2WIgWN+2cLgsEKcJ7pcFucv3UpGxtrcHWtRUYbK7Tc/YOTPqr'
-             b'fAuwvALmmiiZ1dlz4nWdqhkohCnycg/ENdNZeiKv6rxkEmgCJJ0p4vpHZknp91y9tgHnzl+ELzz2'
-             b'JK8AGm1BEqWT9A7s+PB1ywMZMqCQeypwKFH62f033wKvfN2b4OWv/jroHzqa7pM5eVSMp0Oy9/Uc'
-             b'mf2djVbrP6Zm/jcx5LHbbhFFthSEI1ZfAvnreyU+D+hhgYFBvtHITOWdJmDn6/+vAXBVeE5+UZWK'
-             b'y5ve9o3/+6NfePB1T3zuD7+rVURhknOi3mAwgfs/+yC89lUvo0NIL15vml4k5VYEMSv0SBayIV4X'
-             b'rWlHbGowLpw+CXsP3UBEvCpox58nAYKFI9+A3QWW+TE0zd74eCNtb4+g3UzzTNMbQ5wlXmLTK77f'
-             b'+MAdIkU5OySVUB7lhkVHuf2Hb4AzJ59k73nI6Vv0pOcT+tfq+TOwubYCrXTQ79t30CaLfEcXBIs6'
-             b'sRmlA1jgb2xM8DBfKLpE4NMfRob2dDiGpcU+64110yl2zCiD25X+jsh8MzTMAbHwlTz39EKRnEW8'
-             b'hGaGP012B0KiU1If6OSmOQGQWfbUJKj3g0gElTwRdRrzuQjI7t3FGlEToiX6OVEMgKhJIAsnpEAo'
-             b'84Pleki5KJoiBhWtO/MKPLlGNonY5SlQihAVIvRVYktUQI4pkAZUKipPrc7QISwI3V5Tnnua5qcz'
-             b'NvqRBA5yqCRiZoMTImdsz1xIlK0GGWmrVnid5LORFTYMrNvvUDODKx9HqXAlR8vGKtvoUoMS0zQ6'
-             b'psagkGZLP2fvMzkR+QWYuonunf2FHmlVQPMCcI1FbnZNS6EL6TnhfrzfWxCNu4EW6XHGrDCZjGBj'
-             b'7SqMBlvclEjD6oSPEMWvIKoMWK6BII1kIY1VFNRCrztnG3v+/0GT9gLUkMRKYnT5PcGXUlGqZkkr'
-             b'go2NATz6+NPwxMmTdA832m1ZYzm+xiy0SxIYfMxkTiephBLBS4scWV/s27cfDh+5AU6eeAwe/sxn'
-             b'0nu0zRkFs0Ck3hnFEJMMuN3utN/fKJv/qGw115eW91xdXFq+vP/QDQ+/+OWv/g833Pz8ExTONfuT'
-             b'SNtOZMYBeou7uAUL1U6V2/n6/24Aykbjuftt6Xd93w//6A//+LtP3DvduPjCjkCtZJTim3Dpyho8'
-             b'+Mij8NIX3nWdAx8dMALkeeezrEwgMPLelukDLJYTiER4JRVT8jhPN0QIzqZknEa2BwOO0C29FXGU'
-             b'KeGprpBmv8cyKXLSczyRoP84hvBEXSpLNKsg7XRolgRzStCRHCD4eN2FJTh09BhcuXCKbXU9ry3y'
-             b'QcV5B7PhJowH2zDYWIdd+/bB7v37OQ52OqcJiYqDB5poMRO+i4xxOvjQhKjPU2tQzgNOOKl49Lu8'
-             b'GtAs9XSQoxOiOpN5yQLviXGSGqMoKoKQNfOl+NNBHwRKUAQ+JKtpIAMa3TFr7DLI/hbfP7KCUqZ1'
-             b'jDV9fVWTd/F77aIzK9j8PGrGUaLEwIMUvfkps8EHa7oUoYgxq0m6Cy12dJxVREJTtEZ9BAgdEEgd'
-             b'4XvS1vsgYHhkCZtOkOnnBtuydxdEA2NvybhGnNnYDthl3Xkt3CoKcgA1I0pKXHRKWAN2uHS8xy6E'
-             b'COl0shbJXH9hQVIuo8RQR2qiy0I8HLHoD8Yks0PVQA/Joop7C2LWxDWW+eTx88Lrt9ctuKRJR+XF'
-             b'F8OAdZqK+bMi5ECh9/TEWp12amqQi+Hg/OlTqfkasCmPRNy6mB02mbAnjoiFu860x6nDpMH20ZwS'
-             b'nagiPKjDJDP+Y8XukUaao4ZAGEOoWBDi6NW1DXji6dNw6vR5itEt08RfCj9E5/loSiT+38wrCDWX'
-             b'QXpARgaEg0M0x/T4axjve/6CeJfomSGuuzGaQRn+3WYM3fR7jtGfUx4H3lcOPvQb/+dP3PXyr/nt'
-             b'd37X3/zJg0ePnZyNh3/CeC8cIZEtI9G6ubBIbJ4i5tXIztfOF3MAiuK5+23pql/cs3ft+3/kx979'
-             b'M+99z4eaZVguXSXEGg4zefLps+QLfs8LbiMIdB4zQY/IUXryQnYIxB8Ocz649HudZnin/3Hp3Gk4'
-             b'eLSAhdQEMBmMYb8eriIKn3fYLrKJC8jUqv8ne9+trQFBvtSEBJ1DWZ5mWfKOyXN480Ior2PxOvEj'
-             b'2713f5qmh3Dt8gXmAXguihXp2Es22MF9Oh4OswmsYQJiOtD6u/dQo6T7ZYJxMfoU9+q1cJUYciqb'
-             b'hgF59TaP2dGNkvBs1xvMOpl27UKxnKaGA0NXcHWi+04lUWHhoynNM/EOoWgklUVh6Q/JmY7DWvjz'
-             b'cpTS2GnX1ACGIAiyowQv+SXoO09qjTSFqrQQ3eoA1EYZTDapGg9sbHjHzul3E5H6IZzPVsSBlBM+'
-             b'eFIdGCYOQFp3tDIGLWjSRuCkhp8z5R1EtgQGesyOpMnxpNXQpk+BITNq4AYqQ9yY+tiTdQb/Fv7Z'
-             b'9J6juyEVL5+K0pSLadMzX0Ko6wNUb+Bn4nN4FP4VTuXs8V9BPcIR7alrRvO2dqAmzsiBgpKgP4Ln'
-             b'SF2qr8RyL2hCx9feKL19bmTrO51JI6nmSkAa/mtXVmE7NbBjlLOhQQ7B/V6cKGWyN36GuuPx/eaU'
-             b'om+2BpzsaA2DEFUZEQqCx/P8zSZUkt4ngVvULHheoeH7urm5DU+efAaeOnUuvZe4MmsRukXXqc+s'
-             b'x0pQniBIiq67HGh3AHJfC8k1RrHS95bY2CyVP+JFCsuQfpTocC3aBaglsHwSgjLFMFz4/Ef/w3ee'
-             b'ePQLr/3Rf/Rz33zsltserCaTP+Whix9Iy7YGO/V/56v+5fNO8jn6Jx3Od7/wxfd/2/e++91rgyqi'
-             b'SUizgX70TFLCgvboiafJUpOCfgTW5ekmmPbe601IzFmG5Lhw8r+9TN14KDXSIXH1PE4g23SDFcLq'
-             b'x8MfUQOyO4WiZqsqN6LL+z49sEmHHbKgEOV3w+FYtMfczWNRoEx1qOwMjoI8xMj77UOHj8JiKug4'
-             b'wXO3zwxnhclJ0q+TXPqPzauXAGM7t7eu0a4YCy0zjR2RpvDAJXY0ogqS5OdlmhVHHEI90NI4yvSM'
-             b'sL+Xors9GPJzSd+JueRBvOvR6AV94/G956lFpnKB3iUJnSyNe50a6ztEMUXJUxfpwEXONki/Dw9l'
-             b'hEMRts6OcSCwN8O6OIUSMa+240cIuhK+gJOkwWaDZYBIkGul54sSTp6kUiPQbEkeQrAMe2xeeOce'
-             b'6bG20msm7b6RzOaCPHDAFJ334timoS9Opkj895TIXMxpwefMrPLUNKJdqylMollMm39TcLWejK9Z'
-             b'hN5J5hcjIVSIbFTqakmTvxP4nasnclJmbH5BrycI3D1MnzWYESSjQ1pstVkt/PUVgT0axBRHVwfp'
-             b'f4/S1ImflXfO8g8U/lfLZPwvZPUjr2j18jk4d/IJGKyvEtJVGOqh/8NBVj4Gm7h5fcfZCarAUOBH'
-             b'0wGCZmkoAU7E/rba0zUCoQaqhAAy6kG75M/+8Rfhtz/8MXjkiXQmVOl8aHYyCgE1vkHUESDaIEDo'
-             b'iplC1UyFInsYmJtpdHkdKA0PGSchkoNNQbp3m87TfYPDA6I1KK/Fa6xJTXODpMbddgN67RKO7F2C'
-             b'waXTN/1v7/uZ91XjcZvPrD/NietyYiFeG/O5pHTuFL+dLwrN+iq0hOlC/Ka//t2/MZtNb/74v/+N'
-             b'n9q/1IbB5jXwqHtF5my6Pr/wxcfJIOjIoYNEaoOQk7Kc7C29mNZEm8VVNSBwahT3LyKTVXD+mSfB'
-             b'N9sEwbdaHSYbpm9A+05EEJBtzXCxIyOQ8XAkk2TXMsvp770G1ThqWBaasqs1lnaQiRyIAYx73kIz'
-             b'x724kqXCfvDIURiPBnRgIjTrNYxE2UX6WuWwxXn22qXzMBls864vHTgTMbZBUyNKwxuzb/7ufQeg'
-             b'0+uTSU4kGR83SW3XZmi9ANZNC4O63WmZ2yIWTIWoTc4XHEXeYpHDyTrEDG2rWkMnVF2zNFuZUIdR'
-             b'sby24ENb8+H5PRV4ltj8SMgcw0K/BzWyNkAtaY+MkJx4OTphyqein0OGYpbWyWSLCgws/Mh8t92x'
-             b'JEB60nR3pbjq61LNYJTi0TDC4XB7TIx/MmYy5zdvEUZR3rPCebG8zY1lFCyLiqZj58IQM5qFNa8r'
-             b'druah8Gvaw5bqQgvtFjBUoqnBH0bWgpXM9bTRw7WppRBdHI0U6NsRIRmTmi2hJ9tq8Vy01k1oeYW'
-             b'7ZxJnSBIBaFb6TU2LFJY1CAiqcPn3Ou16bWil8PKymXYvLaSXscU2o0ykzGFwBfF1TGqgY+8MS7m'
-             b'ZRAP0HIvSBqfOg/mZgpErZLXJ5HCnZzFanN8d0n+AePpHB55/FE48dQp2NgcUpy0ojOWh2BGTVYx'
-             b'6boP0rzS44n/ACkDXJYe1l2PifNKmxFRMciEr6/O2VrKmYeE1zhqkNAw+bkgCZTz9Pke2LUAZx97'
-             b'6LW/98Hf+t63vPPbf6ka/efnuFCqYbGTIbDTAHw1vvBumIzgHe/6rp8+9czT+049+Mm/u2+hTUxW'
-             b'PDCwK8ap4bEnnoZGOoz2Li+TY5tqqis1Q5Gdt+qqs/MdGPxNxi5O7HaRmTvaTpPJk3DkpuPQ7i6Q'
-             b'qY96BdieOfAEQEWFbtYq+9V7hEgrakoWUTqmJBupFZujISz2ehJK4onhX7qSihhBhMKOx+kFiUZH'
-             b'b74NTj95gg4vchBTW1+XWfaFTBQsK5zDcGPNEsQshhgP8e0Je7+kpuDK2ZMQUyOw5+Ah6PeX0+9q'
-             b'sTsesE0xWqsNU0FppkYCTWfUYY5y5dts1YonH8WyNplvUEYlgknpcRyuhMWTGPBE+JqTnBCndmPf'
-             b'O5bzFTTpCavDl2I20zAyJj98QcVV4UrUr+P70iMuhua5e+XZC5GltPVE9shH0t2Emg7vC/teUlYI'
-             b'jFyRl4C4P0j64/b2gFQBCAfPJSxpYaF33SoHV1UkEUzXAEs6fSp2TaOiaoIfwtC6EsDXiNMnwu3Y'
-             b'/I0nYyriZdvT4Y7v80KnJz/nchBOBPNJKJUN79XOWRQh6fk0HCMRzOsoSSLqxZKX3PZavDrC18zO'
-             b'mCVLawNPyHNSR0RqALSJovAitPfF3HovCYAUhlSLwpV7cpQa2dVLF2E43OTPw3GD5cTbwAJrJLkR'
-             b'NCrZ59cJar3sWYESNJlPHD+97PSpXIZgZkZRybTOZXdLai6bsL49hGsbm/DZBx6Gze0RBV+12t3c'
-             b'NQjJGK4XutTmosiPKbJdEGKgRSL5bLLEsdXZVVNTJTX+k65DiY/2ttDSjA8+xyReiNAjREFazZYg'
-             b'i4HcEBeaDj79Bx991+vf+OZfytbV/xlHMPFNyh1OwF/6BqD86nWBePO8+++998f/55947x0rTzz4'
-             b'pl7BEiLchTdS8b28ugkf+f1PwqtfcR/chEgA2oLKSMhEHImZ1aAgITFV5BvvaWItpOgKZ4cPiWoK'
-             b'508/BUefd2uaEDrQapS2tJ3PIx/6va509FVtKmBIr4EHO8apUkIe9+8g3Xsfw1yATT/wYKU9cuBA'
-             b'EzTzqeuQK9opd+HYLXfCM0+dINc9tFN1QTz3HXuQ227faZ4CmAWq2p96TVGU0xTT8uZhAisXzsBG'
-             b'4wo5Dvb6i+SU2GhzMl0Xp6AgufVeJ69CsI0gjnyIxzbkkPNGlHSy86THEPtc/PUlZdY35OADWxfg'
-             b'WoRlcdnGVt3qguSe+5KVALxTB9lpt7LJjMbNyGel5i9Fg7kAqOfHYkjEvsjvL/IxMPERYXQndrBM'
-             b'CIyUGIkwa8kyLHq62HzQezwHms6VB0ATYGDnOSIC4v5fGhWz4pXJEZ0L8XerTbCCsfjcnDRKarQT'
-             b'qOFtUNHWaXmK6xPx0p9IA4aTfTdN9FTokBuAlszp+1qNvHahydGzO6RlPqTf3+o0xQ6Y5ZeLC335'
-             b'LDTMKKT3qJvttzVRL11/3U7PIohjLc2ODo/0nGepkbmcrrHZeIBli9wAQVZwlv6oNr9QK+i10Z1X'
-             b'/fq9Yo8cZpJtoWiaLIVk3RcIFGiQ2ZN6JimfAJ8X/unZS1fg0597GDa2t1Ij1qRrH9vpIJG8mhSZ'
-             b'HRQ1oEcRIi+8FHYJJKphVFMiVSEFIyUSkbZgBAY5KxiyhN+zZ+8eQLUVETbTfWj233I2BVEVaecR'
-             b'ZMeBhNJHHns83cfRrJKRTjNcv3p8PBnuXlratUb355fxVZTeCLU7X38pVwBfxd+e7qLOwtLge3/w'
-             b'R773Z3/sv/3IfLB6R8OxVzZO5ahLnkzH8EefexD8fffC0cMHiWimcKnqxi17XiZn4ugFyChBFCmP'
-             b'U98A3tddOH0KDh49Bu3OAulxicybTpJ2O98UbOXJKAG6ryHb3rM9HpvnYDBPOqyaQkgrfLZX5QmJ'
-             b't4LYiIzTxI17eyxqYc5TL5Icy/SYx2+9E86feoIkU02Bd7OWOdhSzymcGEUiKYcD/1FlhzeQeyA3'
-             b'SHE+ga21EWyvrdLk39+9F/YdOJx+1pt8jVn6sSYf5gkOp2F8jUi8U6Y4mNZbDuwYRdI0J3mZFlM8'
-             b'/Ea0r6+ooSIsA6fQNPGizSnB6rLGoSCZsksT5VSkUSwTdbY6wShdPDTxuuBwlUqikV2NhMWR07w/'
-             b'r8UjS8HTbCT88x6ZJzkxbQxm4GP7eJnG8T0cDMepSDYld4Ff93TKiFUHpzQQqDj9HakRGvx7K2BD'
-             b'GyzAzUZpkLNTNrurjWTSyE6wmLa5kZwiwa5s2vohB00wR8NWYIIQYfFz9YYEeM+PqAxnVngrbtPU'
-             b'ROD3Nhve4n753glEwGWvCqUJZVUGIhjTdJ2uX7kIo+EGOTY2XH7vIIS8Yjb1A5hJETdSQraLpRHe'
-             b'1H/DZUoqX/+C4kVl3eskju9rwesFIh+WzGleWV2DEydPkcNoFbys8KKsmoDtk0XZEGsOUYVTsqA6'
-             b'M0pKoQwToC6TwrfAtE1UvaCV9u7du8hHZO/e3em/m+S+SdwZua9ciGZ05QUdId6PrIACeVrUskao'
-             b'qWnCuXNn4fLaOq1saKhIfz3Y3Ny/cvHSTQvt7hqSU7+cr7mbwPLSEq/ndogBfwkbgK9gGNCf6iv9'
-             b'/sPHj5//W+/9B//1z//Yez7Qr0Z7uq2SjEfwvscdMSICn/7cQ9B6VQv279lNRjUU++sLcVFjRnFk'
-             b'IaBYfPocBGLaYiY56USJhLnzp07CPiTk7drNpCMMASqCMLW9TLB8YGIEr9r96u6YpszA0iWQA1vl'
-             b'WkF2sRpwFIlwNoeAzQKrhWXvPIdGOjSOHLsFzp58gghdWPwcLwRpl0jn6nVhNUJFkGhZYUHVZHJO'
-             b'bFQFKXCFEAEDbK5cIkMi1rEXsLxvD3QX+sbqpn88d1GquiCIn/cYsp+swKwOVZWgcK7I3fBH8ZDU'
-             b'1+7IIIgPPFy9NATSxymkW3SM0Y/vqb6fTvMRlHjpCuNGILsfr48WcTCAHfMsJdeLLwHQ7yrF3nk4'
-             b'RCe6NlnoakHFz8yTbK60Q5DMk8CbTayHHLsrRA9GjuS/USHChMWOmFRRSSE+Az4uQv9BrH+VvKdJ'
-             b'zZkcx2WPiZJcDPq9nsRTS3NAa42S0IRoHgE8HeL7QXbDZBsbqGmjNZZA+UgsK6SQcsHLzn9RVlbE'
-             b'5UiFCd+TTqcUoFooi+lf3VRMsUFZvXg2XUOb1FwUoMaXXl5ByETDaJ8iT/5RoX9pKojZX4CK/pR4'
-             b'S80pRJP5Qc2yNIhMT3AOKvx4Fqytb8ITTz8Np89eIEkfyvBK5/6TiGGasmOOP4bcA9iHoXHOgfg1'
-             b'zB/BawaLZavdJGTozjtugV1Li3T90SBNgV0zbsVxMJhNcrqkSEJBoomdNhQx5vfYqa8Jo3mYVomE'
-             b'VmxcQk0pU1WTYntjvT8abFOo1Zf7hcpddG+MIe6oBHY4AF+Fr8kIbr/3xZ/8gf/xp//K+3/mH/x6'
-             b'u5jvq+YjDgPBDnnOIUGf+szn4YX33AlHjxwQu8zKtLQacGNp4F52cvjnIoXLVqBR5eLpd8xh9cJp'
-             b'unGX0X2P4HsmJeFUihK4rkySReFtOhZPMjr0G1CK9pblPWRLjDB0mvKx4CwuLFChbHVacoBVmYQG'
-             b'YJIyNP658eY74PzpkzBP70lJh2FBEaaeEvpEj01HpqXTWA67QaYYpOT1kItsISyTNIejpKI32OTC'
-             b'nJ4v5hI0O23oLSxCkabZXq9P3AUkFVLBjziNB/stILIsksbhrhV3zrTv9sYaZ+35gIoZTZ34mgWG'
-             b'xoLY7JYCCTNTPx+/jhn7+rkiKx6LFxoQIXEwMlsbp8guRdmCHaISCkFNja4M8PmhMVK/s0DNEsoS'
-             b'LXVRPexdbQynJmFI9r2ly/uaTqfHkrd0nWBID9o/2+4YsPnosOxU8QjhozK5kONy1USHSJbp+sTf'
-             b'0yX73oKClpAvQHyLoHC72CBZQA0HMVmErjSmWmAKzQUQ5zuF4/H78BoG2euDwNfozkd5B9GL4oHt'
-             b'eumaTq+vitmZERP0httbxOrfWr8G0+E2NH1hyYLBMHQ1YRBPDrkH66FQUVGkkPkukLOZ6M+DEQ1j'
-             b'bixr+koOueKV0/rmNpy9eAm+8IUTMEHkwrOxUpwrazjYVK+5F17MsxAhYDZJFOa+NMAka51Br9+B'
-             b'Q4f3U9N1y803w7GbjkLDcxjSFEOmUiNcTcVsKQRZswCfO7Km5BWb+AAoUVDSQ6PwJIiQF9mXQm0n'
-             b'kaOMXiWqdsJTg2yv02O3uu2q0+uQ4+ez85Xu5dkQilZvpyruNABfhW1AOgDvefkrP/pDP/kz3/rP'
-             b'f/rv/9uej4dimHKqmxjBbI+n8PFPfw7uvO1meOHdd+C4TdMoJdvVNouVFFVvnvOBk+pszqoT6Nhm'
-             b'CCeaKhV79Ox3Mtiifh1d26ISCGI+xEjmFdmWmIhg+Chkjdphh7rAkp9+rysHXnYsdC6b+/LNXYhz'
-             b'mU83dh+OPu82uHjmJMxGQ4ZVPcvFCp0YXLRMeK8bTJn+jU0dxYSGLN4drwdUpI0OaHR0SdM0HRNh'
-             b'brixQcQMjPjF+rL/4GHo9JfoHS0lHrXwhZnOYDENCsnKZKfFH59OH3fNJvwqyVgH/7wpQTI43Y2n'
-             b'rLQgh7tYr8MyqaUJEeFXLMZerHWReIia/lKgfo2EIv5Iepn4mGrhi7B1v9szfgS6/Jk7oCA5nVYp'
-             b'emv+RDq0n3cW46scEC1UCJo1G+46mLvZLI1Eik0fWgVboKCBMungRi6CoDFElBQ9PbpNFhL+YyZ/'
-             b'RgLk/AMk6JFXPeT3e1ZNyVEQzYCUwMeOel7WUXmqi2J0tD0cEO+AEi21+NLOecLPSV4HmeWk62F7'
-             b'sAGb61dhtLVJzweRg5IrmxA8+Xp0mqhsg7Q3zkbMGL9592mGRwV8nXppaINdS5L8V3Dzw1zYWl5B'
-             b'KvSPP3MG/uiBhwmxYAfH0hAaVYo4s4b2Ji/FhoaCxxCRC8xrqdJj4O4evR5QfXTjkUOpyWzCnuVd'
-             b'ljkx216HqcL6FkgGFoplkksl7iq5sRIlBJ1H0dZ52sATL1ea61AwARD5Arg6W7m2KUMNTSep6enO'
-             b'lnbv2Sp6C9Bpzp7FQxg7r5nd3ztfOw3Ac/oVBlvw/Hvv+/jf+fF//K2/9NM//uuN+bVjLS8Fk8Yr'
-             b'nuweeuTpNJ0HeNE9d9BOlvLe5YAwhzNQf/LKmL5cCGsTc62oN9O/Nq9eJp3svkM3ABicXRj8iNM1'
-             b'wsl40BDkmgon3rmdLsO72OVXIHngtGrQm4gjVg0Kt/SwaP9mUlGkHWGj1YGDNxyDc6eeTgfTGBpk'
-             b'tZonZGsehARpu1KAfHAC1PbdztjSGcEADT9kchF4qz0RU/jSD14+dwpceq2eZGDNNA0tQX9x2VYC'
-             b'zqmHgu5MccKdksY+1oqUpiOyuiD7ElBT40vbSwf1C8DnV/H0iI3bQpr0Q80yr9NpZuOlGnJA2Iar'
-             b'7KAH0DCnGnFSLZwh0nTV63Uh2xlHWzmoZTFC7ly4W/TZIYxOvUoMxgb3huXzCskKuVxeUffjSJIs'
-             b'xMM+sPmT6vLJN0KLRcEGQPgcEV7G34s+AxzDHIQoxwW4iAXxLlxN7286e88kNkQt+DkVrKhot7Nh'
-             b'lLpoIqETo3sJBeA12XB7EyapCcXiD/MpW/c6Z6FUUSF4sdc1yR5ATR3nDHoPiihch3455gLIao3t'
-             b'9Hn1Fqi5LvNVH9n8CUlxl66uwR8//EXYIM8K/nz0NWljlz0HYrYnFnUJSevSvT5Ln2+z2YZdy8tw'
-             b'YN8y3Hbr8+DAgb1EbiwcOzEiGueFJMuOj4V5RFCMtl2I7AiY+UYiVQXPU4kMHYU6BoImOQZ515wh'
-             b'J/iWrqyswtr6OvlVcJ4Jx1IXrfaovbC4DWRi9Sxj9sQj4YjqnSZgpwF4jr8QIx2kJuDF9/+t9/7k'
-             b'G3/l5/7hbww3rt7XUuZx4MPZp6n8sSdPw9q1a/DSF90Fu5f7UM14v6z2nKGmf2aZTTYv8RKTWtU8'
-             b'BcgYKN1cm6tXyZP90E3HWdArNr1RYozVPY+c5drtbEvsmd0+mU5J441Fy04cqbb4GEiKo0CiwLBw'
-             b's80pd+CCqAk8MeJb7R7cdMvz4eKFMzDZ2hKFgxcoswKTxl83VeFbxHToKM5l9G64WuxP3XTGOZmo'
-             b'gvkqkAegy0xvxFHdvEoH0ATWRwNYv3qJi2gqKHv2HqSiwczpBqkLqDAXLNMiAlTUfWe0ZDk+kx25'
-             b'/FE8rkz7oyGz+FEGup0OYITPXe1zcyJwR+likEYC0x3xsEeyIikJsJB1WMeOEDsSLkubrIuMRFdR'
-             b'DIYyAy9Kk0eF1XNBRhlWjqCW4hWZnzGipERPUznrL/lA558Jwt5mRITY/FjAvXwO6rsvZjMKVZPL'
-             b'oUPlQmkfL06GvXYn+yKk7x1i4UKoPj3PspXRB+V/4ESMrpb4PMdVEMMoIQCCt8cKVSXyNnmu6fPb'
-             b'WEMHvzVyoZzPJkSsc97bXkPDr5xqL2NWytTW/jWEJOclZBmMM6WCF8g7ilW0SnqZrCeYHkomiyac'
-             b'PX8JPv/wo7A1GDNXRCSDsYacmGIk5rVBlIRLcqwkye2cCHs33XgU9u7eA4cO7kvXXfo7NKYabIpC'
-             b'Q+KwyT2woHMjaGftgg0m6mDpLdhJbJxNXuhySqBydWpvkLOGSD5DfLj0ekfpubD5UkGDzpzSBwtM'
-             b'xhw0y8YGwV3h2c9yabYKuPn5t8DW2rWdUKGdBuCr8JWm3v379z31ite/5Vs/8Xsf/J3ptYsv7LdZ'
-             b'z0165QZn1F+4ug4f++QfwWte8RI4tHcXWwdXPAURXB44OleT2riJyNG4PuZCGKSQ4655PNiAS2ee'
-             b'gTYWiHTxk3wuTRheHd6q/HN06OsBhiY66ftcg8ljOMSi3hsLkhMyHUJ67HDmqRkI4jcQo7+Oi0TD'
-             b'WaMNR2+6lcKDhpvXqDBGSzFUIxVviYaWcyCQqhM/cE+uafx9OXSNT15PoTfO/Pz5nBeZkivMzlQP'
-             b'bPRnIAZEOkSvXTwLqwKVY2ra4p5lkmahRBKfP8qukGFOfQBxE3TKZ0gXCYI2qaVGo0ccCS/vU9be'
-             b'a3ojhhEhbB1lJ+7U+hbY3c/OVQ2T8RqGHCUpji2OkThFzmtFkZGgwK9jPOPXVxTxuslOS5ZJw9DM'
-             b'CJ+/wLakvy8Yxtd1gYb+hJCRGS3Q2hwiwRUbziZNXI7WTvz6Yk72EyiBkQy+dqjwI+QfmLDqUrHE'
-             b'a41WCYjMqKmVY04FytCwcQnShHlpaijVEmVz2OTNxjAeb8PKpXPkLomTahM9OUhjH8UACAwpiXIx'
-             b'mbLG+CGODJgc5LAuEC+AoFO/NqVize3qKI0w4tlUh+2a1za24eHHHofzl67AfM6rpgJXUEF1Kdpc'
-             b'Zh5QDuXie3uSJnk0OdqXpv0777wVDu7fQ0FH48EwTfmbJBklPCsW5jJReG6mIWhrUnBhDzmMzHgP'
-             b'rmYwVWtGQEh9am9caRumiI/yeh0nOgZCOppEYmT0SJAHuj4rWOwvbjQ77XVMFPyKTOnpCbbR+6Io'
-             b'nnWAYedrpwH401FSpug/3z39zX/tu7/xIx/4rd/cOPf0yxfbhTn7ERyYbpDhaAa///HPwC3HjsA9'
-             b'L3g+WcBSh6+aZZk4WfvLpLpKuMqeQQX5386MO7DTx4I72GQAb+0K2nQ2002xAEtLu6GDU694jUcs'
-             b'FCJrwomImd4VIxUCHecyku1GsfAu9vvSONTlPxrzGeUg8rQOGA92w6VzZ6BIhbIw/XaUNYAmJEYr'
-             b'2FEKlZOpRbXKFpWrxiwhZjJSVLg6GjLivEimgliUKORZmwyIsTwdwMqFgXkJ4C4W5ZXI8Ee/eSQW'
-             b'YiojIym8IsGpzok5TRQY2tL8XCmVPK8R1NQH31c04aHGo1WKNTO6Lk7o8ZHlzzLAllQmB9vDUWow'
-             b'ONgHDZGKsmEENCzeOPEjvN/WcKzrTGEwrZL3+mUpjUHwthoiYmOjIax6EFdIz3tpIe2hAyGIrzzK'
-             b'SRE5UMc9IcFbM6G/3tu1y14QbP3MaIa5NQosj78bSZHKW+QMe18jOwqJ0IsSJXDTgZ/b+rX1dL2v'
-             b'U/gUXictD+Z7wFwAvn5YNeqpWbUiZ5B/yFJFn3MnGGVC0q2Y/zjJ0Q3ib0GOdIW1Waq6YBvoBlzb'
-             b'HsKFi5fhi48/BVvYALbbEl9S5O9FYlyOc2BoXa5XVNSQMVW7CTcfvwnufsGdcODAcmpK06Q/mcB4'
-             b'awOcWjPjPWtyTqd6Bm4cpXhH+YzNrKn2ezm9WGWieTFlyzdNOIW8HtL8DQUL8XOJsi7ZXF/PWxXv'
-             b'BA1zsLzvwFONXr/CoCX3FYTpO0vYOEbiRux87TQAz/UygFjm+/v9cz/w3//E23/1V/6X95179HPf'
-             b'0aoYiqfsP4dSwCbd5F984iSsb27By+67F5Z3LbE8JtbgbFeT78mNGyQrQH29QrxORcd58fhdFep3'
-             b'h7CJcaarq6mwddNB1IGFxeXUDHRZ9w1epp1K9swyRRelEdQiMNmobDaucx5DxQDezCgdairkXAVO'
-             b'GKNUtib0d+2FMk3WV86fgtlgi13hosuTipUNR4dhUKQ1OjOmIftT/LF5JXB31LPFznKFrLPWGsx3'
-             b'wQmKoCsThVi9FEmxUuBDLB1gA9wdi+Bxur0F165eFKg8cpxsb4GsWvG9xFz5QSrSWMQQOXBuzgxy'
-             b'2vUzIQ0TFpVXQEiAeT2ISS02YLqXF35HEGLiEioxZE5lcxsnagx20lPpVaj59ENUhYAnN0A+w6WJ'
-             b'kvcDxA63LGKN2FmI/LKw4uy8kg6DJExykUYynUNCYeUMRcLPFFcpaF9MeQyeA5emqWChYyQiLGVq'
-             b'LLfT9a7X0mA8TE1Bm8iCMQT5HCvzxXc1h0RUZ4y2B4QojUZb9H14/RQaqBQ5UMdr8XIySgfJxhDI'
-             b'HZupoG56BsPz9VHEbH8LtRhddcZzIjvUiGKLPaamsKBr6JEnnoYnnzkHq6lBQUfQZqMtn2k04ymQ'
-             b'COEgqYasNAEq+nilLC8vwfEbb4DjaUBY6i8Q0Xea7h9GzDKXwsl6kUKflWQYM6rGIFENXVNpr7yv'
-             b'Xh7LKZEhunpHYteqOieq8yGhF0YE5GhyigpH35DRiO5zbuQ52wM5SAcP3/QFVE5NMWfiOTiJEYHZ'
-             b'kQfuNADPfRPgGAnoL/Yv/50f/nt/5SMf+sBnPvY7/+an9vQaXTTMmW5vUxOA8qey7MLFK9fgP97/'
-             b'eUoSvOHQIZoUGL7kQ4bIV0Tj5mM61OI8gxHElIWsk32QwypLxabp0EQZ1MbKChUvXBGg734rFTGU'
-             b'zgULzKnMPVClg/MwEzKVrDNKsTcWiR8/VZFOBf75SuJB0TXw8E3PS03ISiqml2iSdnLoRJnmo/iW'
-             b'O4YF5FAp4TMP/DFcvLoOx47dCEePHITFVNBY+8uHODYhrESIBlGTNz1c3zBxeKDLkiyZVgrZITvl'
-             b'EmBoSulz/C2whAnfezQ0mVbT9NmOWC2BlqSeQ35w1YJELyyCiLR0u4ts2StJbjgtIXxPBSE1S1sb'
-             b'16CbGgn830XhzVMdhHEdTRnhMiMkiDRMlCMqCyQylgXPaIiMs0lfGeraVCKa1EjPZXNjndz2omQT'
-             b'hFS4B5sb1Fg0Wx3YRM8FNFOajFmeCuq34LI0T4xnioL3993UsEzS92OhRlkevkfj4ZCjoJv82gfo'
-             b'PdAsCU1CXwec6FV2RqoX1dwHNrPK6hNen1SOjauUDKtGO4ZCGf2untjIxlr4oEEKmuryyTBL1imV'
-             b'MNyjqAXo8dVtUrH5ivkDzCkBQmVGk3kq+Nfg8w8+BGsbQ2pt2+1+ZqbHGg3WBUPPyBIcOBgJbbp3'
-             b'7VqEl77khXDshsPpLa+o8M8mQ5OXFs4bsRRhffDO3D4ZnteMESGoUjMlC6XIJFV5d7PPgNPcA29r'
-             b'OkYGPLkXcp5JzE2BoXZZXQTiEoh2zddSg6foDV4XKNfEVd4td975OUhnQfM5Ws47JYyGaqdi7jQA'
-             b'z30XgEE3GDTy5nd8yz8tyuLRT370g7+WTsd9uK9nZjGX8Warm26cKXzq0w/AkYMH4L4XvQCWlhZh'
-             b'OksX7jzmyZ5Ia4VpgWOoW2Fy1rezA6uwG1buYe7KIxvihNk4FeQRrK9dIbeu5b37KYgHnfFIJhez'
-             b'z7mncJiOYbyY+lYUbSaOUZa9l0SxwmJTFYKkwkI2qE3Yc+AwNNLjbKcJe7C5TodVYZ4A3lBDZdVj'
-             b'8VjctQc+8/BTcGVtGx585AnYu3sRXvGSe+HgvmWtEHzwFWIAJKiAhhixOYujXb0aI2GBdSHanp7I'
-             b'l7K/9rGm6hOJYiERqWSXqqqmIqMMPdL5sw0stgDTwUb6Z7uercuJhKS1LkmuNRpuwlYqhvi+WOiK'
-             b'rClUjkhwMK1EJOVOg92NtIYqDSkuLpqm3VwBXTQzRt3vY/EoU3FfWOjDyuWL9Lkt7Fqivx9i/O14'
-             b'TO8dFmvUk6srFB3kQfzfa2FWKvlTtPhaeu2IDpT4PqfrpFL7WHy/0jU3SxNgC6niaDyDQVb4ngrx'
-             b'szDrXL56Sq9LFG9qVtvhg/Y32iC47PUfs2GOuQEGIeV5DaziqGDdtZMbvpB2XSmfeLi+8Hs125HG'
-             b'C1GgWfqMHn/qNDx64ilat9BkjNbZAvFzwddrsVDfXoHQ0CtiQp/B0uIi3PGiu+H48Rugm5qyKjWZ'
-             b'QSd150Rqx5+nB5byim2V5Q8YKdMzwqZul7ZeiLzm85IxAhJupAZYurYyaoAlB0LNVtn2Z4IpBeOj'
-             b'IOJ39vQZuHzpSmp0u2RPTs2sR1h+afOmW277Y75Hnxsbd15TMXk6xi/Zj+187TQAz81VmCbvrW14'
-             b'wT33/u4L7n3hN/yv//R/+pW1c0+/eM+uvnSnQXbVSA5qw/lLV2H0qc/C3XfdBYcPH4JYzPIBVHqD'
-             b'8BjWZCMOpw6qlWj/5aDyJtvhqVChX5oaHPsps2vYHNauXEjNwFXiDBw8fIR26HhD4zSott3CzYKF'
-             b'bk8ISsKqlkjToLGihawwgsDthZCJ0t8t79kNy8u7YH31CqxevgAhFRw8kCwjQSVP9LbM4egNB2HP'
-             b'3uXUdEQqIpfXrsEfpvfn1uNH4Z67ng9LCz2GTWPt5IJaxGqINs1otDGerA0MkqnyJGvUuZDJYboi'
-             b'4MLNBbBwDGs6dX6TKGT+M471JR6DEhfpyfDahxq39Jpm4ynB2FU1pRVKjk9iFYI9tikfGNEovRq+'
-             b'MMOeBlrcsSsDW2SEQQ5q5+rFH2xaG08GMN5c5QktFd/R+gq9WircxAng5rWFUFQBVihKsYfmiZuL'
-             b'ToSs5KDpXBz9dWusGntTUhSMsuBu3ReF2DnzhVVp/CywyYxWfa9kVxeus/jl3yABS67KMdvmDgjZ'
-             b'i9/zdyqZ/Xpmu7cm2+PjF5LtYJ5V7BWoXQ6SJifzAKfOXYJnTp2Fsxcup2YAZacdXr0pL0WVNEFu'
-             b'RuHcUCTwHI1xpukePwAvvOcFsHtpCXqp8KO8b5buCaf8B/xMU7MUnJBhqc/V+GAN5KkMCfA+Xzus'
-             b'BCjkXq24GIsBk4/aSDGBT2f8oJ+BvH8Oao6AUS2pFdFw3FS5rMtd3xzIqoWvAfRaQGHogWPHHj18'
-             b'6PAz6QXSmuW5O38ZgcOmDgnAOz3ATgPwVfmajEZw2113PfA3/pu/++Z//5u/8f4Tn/3Ut3QbAF2U'
-             b'k4k8CSfeRirAm4Mh3P9Hn4UbjhyBl774HmjgNCbJc14iu0gPLJBxiOrsFq/TVDMvLYg9rsCAEsAT'
-             b'Yj6oaLIhUmCa2MZzykPH4r2wtAy79x4QZq8jmJvtT8XQx3lJEhOCoOM9JELGOOmSNzvt8Wc21fHk'
-             b'UZHMDcl1W9fWoJpMhClODAk2WHEs29qz3IcbDh6AE0+egm6vS3HIo3EFjzz2FGxsbMAtz7sx/XOM'
-             b'3jct+FSsJYg+evl3YLvlSmBmiouV4h4lCrmUTDRmPqtXfZCgITAiX5QDPZp/QxA0xnOzA7pTngs7'
-             b'WjgLAuiTkRF6Cag7nHKxHAfG6FTKOe7+Om8C+q9CINw8BNdc6bKBTnbDizX1lqbD5c7AmbWvl2sk'
-             b'MGHNRTNMcvUJESDbDMt7qNM3z84VvW+upvawiFxNnyNNejAYPKqCQ1jwyrYHVaT7jAJQ0cL1k6RT'
-             b'Km9FoXBefynJwwthnddlINHVPIQGI7cS2qKrI0WlsHGLjA5hQ4zoGwYxnb5wCU6dvgBnUuFHxjtO'
-             b'u0qRU4OnoBwVaza0IHKzurTYh9uff5yuX3Q+RE+Q6XguPgg1l7wYjN8SMwAk1yb7bARzzGQqLTUs'
-             b'Thz8jIoqmSNRjYlUdliJo2LGWugzx/UVPb7wHnweaCJoUygrqsAhYq1uCVuDAd1jhYYlUex1BS+/'
-             b'+8Ufh2Y/HYSDr8pevtlbhBlskjz0uUIgdr52GoDreQFjzGNvr7z7R977bR/+nd/5/o994Dd/ajBc'
-             b'29NByDFN96jDJ2/3koNRnjz5DGxsbsC9aUI4eHA/6fjQ4AMnbYKxo064IaOdwqTOqXsAufQH2Zfz'
-             b'SE8pbMD7dHWr8w6MoTvaWIWzG2ucHd8ood1eIJa7JuqBHMq2BhTTkwmRvrj448TLUH20HTe+DmJd'
-             b'y+5b88md+I57lx3UkUD24rvvgLXUKGAsKrmmIVs//W40HFm9cgVOPXMaXnrffbB//16aBJGjwPkI'
-             b'kCHcyPmIZIsr0sMq6GQTaWqdC1ErmvGLmvvMec0hjQ892znk4mi+8QhaxGxNxMENQvISCRmpNbwl'
-             b'IirfgXThVISCSeZAGhBXW6pwpC67CzIfQCWjMWv0TeYgHBJr+zR8Sg2l1EY2UNNEu162dDDuiQuZ'
-             b'bKqrmhwFwI2P+ViI1l7XGTz5Bms4eK3kxAtf1lWReRIxqh1wkMLps2Q1qrJD3hMZb708N1Bmu6Aj'
-             b'/GlmO2FXi68N2lioysTV9vmx4Pe90sa6oqYBCYtIRj2XCv+ZcxeoGcW9f9FoWf6kkURFxut9btro'
-             b'tVdsDb1n9y648YbD6Zq+kzImcMcfpjE3YcThy6ZQ2fWTm1flzpj+XiLFQ4zWpHlFPWJlsk0nckgf'
-             b'2eMCfTec13CRin9DTeboo7EodB9Ww3VqeRAqHW004OKly+mfi+K6yRydijKuWnD7vS/6A4MlvzpQ'
-             b'LDQWFskvAom9O15BOw3AV+WLHLqm0/DqN7zxX9x5172//3//u19/39OPfPbNPT5Gaa/IE3aAdrdH'
-             b'jmGfuP8zcOTQAbj33rthod0iODzKYWelU6dM2gdywEes2d3SGVm5Wvqbs71YNtCR6UlO7NIxvBpj'
-             b'muBncxhNpxY96l1eR/CuOagfnRnfYEEqo0rCmKgGIuljA5JA03DQSVLo+WanG5kRvtxvwde/7lXw'
-             b'u//Px1NzMWO/+wZCzWgM3IArK9fgDz95P9xw6CDcdutxCjxpd7sUZRyFiIiHHL73MdRITVGnIpCp'
-             b'Wt5XlFVhEh36pk+mPPkX7N9OpEvkSaSmrTSDmcwG9zHC9SRyhaj1TwouRiqjdJATCo2N77OzoPxN'
-             b'8JKwiIUyKE+gqNnH1kyT5Fc5YWs7Y3Z72YMHk2bhh6LNn1MCmLwnmv5ujo1O90BezHS8rIWceVPQ'
-             b'tWjJfVJ01F9eUI1giIX45tuuPTeT/HpE5gmVSAMz4UyzBsyFDxjqhSqI+50nZjwiEp5IKGD7c5Uh'
-             b'uqirkpiRDGpMBOug/bWHJ9O0f/rUObh05Sp5T7S7fSHM1gq3FuD/l733gLL0qu8E//f7Xqz3Klen'
-             b'6ix1q1s5AQKJJKKQQYjMgAHbrG1w9jivPZ6xmTkez3rs8bF3z57jObM+44Fdz9jG2IxBMkkEoYSk'
-             b'bkmtzjlWd+Wql7979/7Tvd8Tkgf7YATiXZ1SVVd4733h3X/6BW2bS1cPEwcU2ZqcmIDrrr4Rtm5a'
-             b'T6qKWbcpmBUrwN1IqQ1/nxSEgaCQAQbWppqSqVCReATE8Rf/L5HXZ6WrErABTnUeHI82HCdTmXQM'
-             b'jNXuScqTFvUCkE6AgThuc1bBjMjSaJCzZlooE3iURLN8AVAZX3/usit2PQRZG57XyOufu+T3Bdre'
-             b'etkAEzBIAJ6v+xAR+Q2YmJo68MM/84tv/frXvvyLX/ib/+9/L2atIUW4c/vY0Iwff//E6XNwcXYe'
-             b'brr+GpjGboCvcvH3Mt02xKI10100ifacOu+j2CEtOyfo6syp9G8WgoQVTr1uGkmoH42OhGl7xV9k'
-             b'WrnNBRFBUQsly0llwTtZJps3I/etdCs0cECgRAFt3ApOQv73+EgdXvvK20hGdWl5ieK1cqDLJQPN'
-             b'ZhOePnAAjh45AlNTU7B5y2ZWPPSrUmXDGwwiSA2iJKzboVYrfo1BenWFTW0Q1IUWuuViSl2HZjuj'
-             b'9uZQrUr0TqRPIpiy7v+Ntrzolodui2i5S5LI3R7RIrmyz8JGqQlXaAar0pEmPzrXpeshVbPVtMAG'
-             b'0Sb1qE8sX0ut4kOnSbj8zAroSc6RCMjS9I2KFEcAmnRAEtUZFeEv90TkkmRRDMcKzkDb0+T/kMZg'
-             b'CCziY4IAj5GZsyZgrKvgVGSGgGUK1NOfc3ChNndmhYofUxOVZw4CU4lK9EkXx7GcNYiWBqhRj7Jn'
-             b'JNGwLtdC87+HyobNZhe++tAjcHFukebu1AlDSpt1fR232AYDoevyjB8VI6cmJ+Gaq3bBhnVrYKiE'
-             b'FMkWCSipeI55hmKNCVN3UfHMV98yTsjEpMravIwgBNYIBAwCv7cUd8iKk6oS6uh68bnsH++AgIwJ'
-             b'u4GjPHmkRI7TBXMyozkXPe7p06fFDZHPPl6Fhk/YX3TdTV8YmZi65De953/z9S8KbcwBnRKxUzlI'
-             b'AgYJwPO1er4yKJcq7R94x7v/3djkxH33/PVf/eHMqYM3TdXKbCVusuBSh5S4ZqsH933lQbhs+2bY'
-             b'fcUOGEFpXvHVZhlhwz7jhgVAEh32gYp2OKK9Kbo4zFldEqWFnVB/ZLvX9rbVTVa6Az3xANDhodb/'
-             b'DOrKor55IiMKG5XNnKCTneiJR2ESK/gEEGMYEInflNrwG9dOwPTrXg0PPvooHDt2lII5vlZ8HnR4'
-             b'S1FIx/93/sIMnDl3PnRDrJi+4L/xPHa7GQsEJUlImDoi0OOEjqetaCO690UCrHElSvz5AreyUcCp'
-             b'5Df28ZFhWL9uLVH7hv3XGIgxSXBZJrFMxi6QQ2sHRHgSCVUq5uK4OmcDloKAybirwhhQCWZOfOCt'
-             b'7esGOQeBh21UaY478qHdbhPh2oPoKEhi4tRwSlQIbVDKUzR5PuGAgGpPpIVvA2I86h0kebeg8HX8'
-             b'PyZ8PdLQl7Pk2I5a9fKSTJJE3MCNJldp1DfQRogKRRnWCOB5glj0gg3of6qkxZNCVeuSYhk6PoE7'
-             b'c+6CTyYPw+JyE1YaberKoTCUFRMtK7oKMS2OTn0sZW1hzN8DqM+/ffNGn4gWGNznHxvPP4Fehdpr'
-             b'9L0SBK0cW4anhaD/7+TdVRse8x/jNMLC+5ccHjGc93rSnMmgsbLIt5aIFyUgmiA5+XClnCY5O2Xr'
-             b'1DeE39dGRkO0n0AiWAsIPiF0vxgreh9FWFpZgUtzC4K/YSAwjltamYGrbrjp74HGHd9Fwjx4MEhT'
-             b'dagV0Br4BwwSgOepG+Df7Oiet2PnFV/d8rO//Kov3Ps/f/Urn/3kv6xBuzpcKVN2zZa2HCSRKXD4'
-             b'6Ck4PzNLzoJbsBtgOegiuM1Z3YmN2qQzcFradVay90QEgBKxlrWCgI7ccxc87EFMVIwgg63MUkFa'
-             b'l4RcdyC68y60k+lr5eDmxIpUqIY3KGGyyzjBQl7VLwle9rgBZ7ZLm9OtL30RrJ2ahCf27oUW6vCT'
-             b'Mp0VAB4G6DIUHHb5GG+ArWC0Is3ImKSTC0yZtFhpBiDBloMFm9AYmsswlgwpmII/oMSgR8kAOv71'
-             b'mhmsrMzA8TMXaANF+2SUsN1x2XZYs2aSAIqT4yMs04ujBfR/sHxu1F6VNR4gACptUPQRqqOI2mhH'
-             b'RYGFwStCvp9IsLMCBgwSyk5auyanH6CteB01aAHpkpyIsGgPiDGTFaBenEPriFgqV6t6eNySV856'
-             b'pi6GQVmOe1eZjdqzoethmAJIUsFB30ISFL2fTRJa9UHcSLEYlCElwe43T2djN0dLJlIgIDiSrvVf'
-             b'PX3wMBw/dRYuzi6wzY2//wvlSpDiDkZAuTGLZh74+jo+oUc54FtecqN/b14FvdYq4VE6za7cxTm1'
-             b'AivXwUSrbsXtUNdPbbItJwDFag2GJybpPi0C+1CUjQJ9470yVB/h0UO3A8tLc9S9wuCOSYKjjkrC'
-             b'XUBI5P5LAraAnUCTAGql15vl5IJNou0/2Q9YMAqT40szM+TumBRK9F7Dv0P9jNHJdfNXX3/zfYjY'
-             b'TIUe+V2zkORSrsJYZcjvIyv+HLUHkXWQADw/q+MrhGKhuvKuD/zQb+y+9urPfOoTf/YHF08cfnGt'
-             b'bKAim53sIQQ+Wm224WsPPgqnp9fBNVfvhuF6lYKOIt+smBDlaLvcGZXZYRDdkbYykbfU29TkNhWp'
-             b'UMkq2EV1+VQQ84TxSUzwQU+EMsYVTfIMfXhRMLMxDqjIjZKKaCyhYiPy+4m2vYVeh762V1+5C9ZN'
-             b'TcDBQ4fh6IlTpD5Hm2ySBpQyjvm6lj/zRspVTajIxf7YSNB0oZWsgjD+eQvM/TeuwNoEwDrjSZqG'
-             b'ipY79VhNMHOg2WGp08f3HWQbWv8Y69ZNwFC5RIqBOy+/nMSGUPpXnxktUwifQMIt3PEAUXWMc1jW'
-             b'cUiCz4Gqu6mUoQoYZSLak4S927nYWjYBZW9jwATlhEsAz2lImXBDuIBVMCbOhmN/2vC4wZlgKGNs'
-             b'0od1YNCaJoXxSYwwWzIZXyn/nZgVAQvBY6zMRZqjviqVH44JA99n/JgqqhUZERS0iwUoFcowv7QC'
-             b'Dz+6B06fmyHjHXx/KabBAkTMApicDC6Ea5ch8NMnd5um18I1u6+A9VNj0FycE8BlIq1zFzEZ2vqw'
-             b'ITcOCbSqVYpqBD9PqQQTa9bTeMhK4mW1d+IYW5HJvB9dMEkl0n+e9EkDAoZJxnllkZ637YM0diMY'
-             b'TIydF+66ZTbqRCQQDZK4v6/jDkz4C0ELge8M1oM+e/YcASOd7CuYdLQ7Pdh+3e4HJzdsOO7a7e++'
-             b'mbtiJvwJQkE0lw35jw4MnIQGCcDzhA2w0Gk0YOdVV3/tJ3/tX9/+P/7sT3/zwDe+8rP+piyjYApr'
-             b'5arRCNPsjp06D+cuzsGundvgisu2QNlvalkWtd55JmuFDutyRjzc6k1ysrkM8hE2gLMBPGYCgIw3'
-             b'apxxm4Arc1xBELtAHfyMcOMDOPsZ7ziuEPKcMuPy9DJx+qMxQEG6FEYo4Pxb7U4TJnwCcOu62+Da'
-             b'G1ZhcWEW9j31FCytNGB1tUXzepzjdjJBIsvGWkMQkP+P7XQtK/ihjKuY6JSKTMHCnzdbHZKfbXVa'
-             b'pOzYa3cpUBtuLJCCH481kiBtzLz1IicJRRDMg4Uz5y4pKB0OHTtLHY6tmzfC+nVrCN+AYkJpyZDc'
-             b'sVVApQL1jHK/k6DGZ1KjijQMsFTJWojudQnk7H8VTa+JTc4wySVKwLOQ10txsuknokvgcvbNKrec'
-             b'r4RpBOU0SEYEvAIxxXtPXqvJyeJKEpMkoBNkVTJUHwrFqRilVUqyYk3e8sko9k4YKUZm12omJWDJ'
-             b'pEQdkvMXLsLh46f8++cSrKw2yV6XXC2l6E016OXMkGisBawHQdfJ3wijo6NwG3alJupg24jqb5OU'
-             b'QKZR3hrRLWARnjCyU00CxWWofoFU/xjUC5UKTKxdT2ZV7HxpQ9eAxg3yWgu0PZiQVAdPTXk8tMPG'
-             b'vx8axnOBqoNdaPq9BlUte/6eQ+dMZYxYwWmAfK1OjNrBYMpvKqPJFBaXFmB+cZEcMjvIZCpwMtpp'
-             b'GXjRra/8W1IP/Wdw//t2ZwK0x/j9wHb5uqf5PWuwBgnAd2oRLx7c6pvf8a5fefkrX/E3n/nr//5H'
-             b'sycP31ivFGTuyyUteduXEhIleXTPATh56ixcdcXlRIdDAxmkGGkLnsxrdLd2isROchrhcb5HAULm'
-             b'BlbBPsJMiFxrqUCsEZlwpkwlOkh03DFIIGqMmyDKm0gyAqGaSeQxnbSHTdD050Y9VpJG5t3kfuaf'
-             b't9NCz/sOVIoJDK1fB+vWTNHGhopsKEnaaffInx4TFKyosRJfMzlFTnzYyucGA7fG8djQVAd/R0vL'
-             b'Xo/pihlRGi00Vht+g+vBcqMJBw8fhRW/gaLhCJ63AlIafeCXqUNowyuGA017tN292uhQUvbE04dh'
-             b'775DZKE7MVaHy7dvI4vXkeEhwhVg29ZmwslOYvvZaQANDIKUApOOZRwkQUOfuwBa2Vvm44tangrF'
-             b'RTsnk9dSCriB0AHOg91yHXCd7Sjcg3njaWChqLpA7ggg9JHp7zLBHzqRdBb9BXrcHh+fU23JlDsc'
-             b'Uq0affT8uCOI5ohmAzBeolji63Pm7Hk4fOIknDp1DrriWVEqVUGd+DTBEiZpoLqRA6GU76iSiCOg'
-             b'm268Fq7cuZ26Uj1/PyQQOyUEcJTWfJ56aXUAkuRcMFVbQ3QIMPhXanUY95U/RlQX+hGRBZFI9Q4m'
-             b'FV8E7v5EqL7Sg53ceyoEZKBY9cdcGWJdAn+gnWYbej7RRRtfshbu9aTjZojTz0wFVEmMBkCJeCkc'
-             b'PHLUv896VJRgUoyTNlQBrIxOLl5540s+21rhJON7Y8W+ZKWYBrnkQT9gkAB8h7sBaCO7Cpft3PG1'
-             b'j/7Sb7zus3/7qd/66j2f/sh4pVBAep7t9IQtwBtpwW9gS6sd+MpDj1MA2bl9C+zacRmD8KwT0Ft0'
-             b'AgPVT5fAm0QwcVC1A1EaU6U81V03LrDeQ+WprWgNTEorZFERF90DtQObc4wLCHN9fgXGaYvYiNph'
-             b'NG/NzZI5yCL/Ht+sZX8eimhCVK+zPLFjSdRE+P2WorOAwVwS2hMEHss6FGDQrrU+PEodg8bqqq/8'
-             b'O2R8g6h/1ZC/7LLtsLy8BEtLyz7hWIEn9x2gZKPbc7QR8jyc2jU83pe2NJnkkDueut4xAOvCpWU4'
-             b'O/M4ncedl20hnMHOy7f56nKMbG8pyPWyOH+2Ws2KBZCVAJ6YUO1qRR7BhS6IwCBILorX2MBFDMp+'
-             b'fWpCQf82VEogc+y+zg48Q1goN0VSoSIdAzhJ9kzAmLtgXathEXKiOibgCWRMY6P4DSUPVmyTqTKV'
-             b'JMMx6t0UChRQ0aTnzFnkqs/QsaPqZTmMuDQpFj+N4FMh94m0FhAkiEzda3bvgCv8PTAy4oMoeiUQ'
-             b'BgUpj1wVE7deDJe4S8H3szXRj4KdKrNwvpV6iVbL1eERGJ9ax8wFgGB0xSOgCKpMxKGQ309WXrcN'
-             b'HSBVsDTqGyLdvIBBRTSEf92VOhYXdaiJeFe3tQqNxgr5XPREXppuQxFeUpfH1ZUVav8XBEehVOKW'
-             b'fwm7b3rJ323csukoekwUC997WzbeR2s3bYRLZ8/KvTdYgwTgO5yNooLgyMSauR/68Z/86Z27rv7M'
-             b'X/7X//wfL54+tnukjDaw0jC17HCGG2ualmFpuQPf2LMfjp44DZdt3QTbNm9ii9nEyfReK18eJySy'
-             b'Ybqcax45jGUZU5Xw73Ki75l8JC4VcZwoG6qgL4fIdeESA0noJgF5HGfKwinXjVGq3DTNKQxq4EiS'
-             b'wNcmJL7gAYjWJI5jTtTn8HwUcByRcYlLxyGSqFYlUw2jsRn3ZwTLUCBtfbLabTZ8hVTxG/EwQN2Q'
-             b'iJPsxH5jbNAGPDZcg7GRGh3v2rXrfAJg4dTJ03Dk2DH/9x0K/GlBOeuCwDZRQU8rXRoX+A3SX1F6'
-             b'ikNHTxGF7OjJcz6hKcK6tZNw+fbNMDUxTja9xTQJyQ0nERASwaD4qGpy2vrWmTq3baIWvJ4MF1X6'
-             b'VMY4BPBnBHlO7pLcqFTHCzZQN8MIQGfFaAhjbKB56vVPxL5XZ7EIKk2k7uckVRIYG+8ZNTuiY9bk'
-             b'TvESYrlNm0SpDK1OF/bvOwinz12ACzOz9H00JGKUex7zIKJYaqgl4kZGnC2xA4QeHhs2rIEbrt4N'
-             b'a8br5Gdg202xOpYAnaoevyRXVrsHGaskOtVlsOwnYZOgbgiO2Q9DI+MwPrEm12mLOvyKjQiKfCb6'
-             b'+jrR+E9yyoN8jIkAa1UcLBER32g4Fe5Hen8V/T02DPVa3Z+/DrTb2FFriJuhC3jAoq+Q9+8/Ab1u'
-             b'RvuIAkiJKumP/w13vePjIJiA78kKGnUDimWY3rqdzLsW5udgoCA0SAC+40kAVq3tVhNecuutf7d5'
-             b'27b7/+LP/vRXHvriPT83Wk4q1VJBOPdA7cw00QokgYXFBjz2xCE4evQsgQRvvvEaGButB/oYJGwu'
-             b'xKIraZAJNSIHm4SZpxHaUqRaGdE1V4U8Ui5TtzqTShUorX3pPCQqOyyKeyo848SgJzHs5EePL8Iv'
-             b'ai5Ela5sYrrjJUFy1ZAfANHHBO2MWQAGfqJ7IV5CMAeZgMGQIYBUsl6XUdJcKTUp8GbSKcBNbqg2'
-             b'DGvWT0Ntcg0sLyzC8twszVCZ/2zDRlsfqkDNfzl53W64zFfwB8kHvglnz1/yrykLXQbc9BXj3RM5'
-             b'4kDDs3yqKpUhKPqAgW3b1VaPEoETp8/DULUMG30A2jy9npKCSrnErXCUWhbTIwqOmMgYE7oddF0y'
-             b'oTQi8ltpnxARbS6Jc/mcEQIpP2oQUu/lEF5MRMT3NfVN7CZBDv/B+lA6ZrLCUWcvAxJgks4Qqkgq'
-             b'7kR/x2iiB1HpMg8CBJH3RWMr7RY87Sv+A0eOw8JSk+4xlJFWN7t4SBFdK2QJpumpzHaWkcbE2Ngw'
-             b'3P6KW2Bqcpw55J02H4NIDwOo5K8J3Splm+j3M0k0eLxhid5pUk4erMhL1+ojMDa5VsYxInFs2B3U'
-             b'KDsiRzsEZQIEyWeVntbri88r4wGr3gnAlMt4AjmhNDZIDIMkbGjhXPT3WX1sDDpo/d3pQc8nVdgl'
-             b'WFxYhhMnT1KHKtMWnn+mRqMNG3dc99gVV137RTxXLvnebaDr3TE8MQXr/TlcujQ7QAUMEoDn507E'
-             b'bkAxTRfe+f4P/Nrr7rjjr//2L/77xw7tfex1Q+h1YWxAPjvxoTeFMrWbO5mBS3PL8KUv30/a+ls3'
-             b'bfIBZC250vEbP6E3tA73nMiIhv0hb9HL6uG87VqRlU1AlAlVecxGcJPV6oWrS6U1gYCogpCKU8Ai'
-             b'8BA94U3fBSMjmxOTcdGQR4JGIps+icqIdS8CjxDIN3PxPKz6TamLm9bqCqyutOR3elTd4NMWTXz9'
-             b'GNhb7ZYPxGW45WW3wa5rbqR2aNP/LdK8qHoLBbFlnQF1RfNfDw8V4eYbroRiqQKHj52BvU8+Tcc9'
-             b't7DgHzyhah+PKdUxbU6J0YkEa0oAKxOMlHDrbrV79Hj7fXIxUq/D+Ngo3HDt1TAyUiUMAsUVPC7D'
-             b'XHUG7dlY2esoxjnBDEAwnTG5gG5dTugGlEYf9Zld8DuAOI6QQKzJTWD52yhio8HW5CRk2SsnYbQ6'
-             b'BreMeehU7SqewNhgzRt8L0TTn50Ki3Sf48u7cGkeZheW4PTZc1Lxp8TvZ0CleGGYNEoZuNy1hKiE'
-             b'iElIy98bVV/lvuzm6+Hqq66Agsmg49+Dxpgo2CN4F3WQMuzZGwF+1mqjiwWaNAmw4s9hrBgdJTA5'
-             b'tRZqI2MBtOo01coh/5PgFpmwaJJ280TSm/wVTExoIKfPYcROGTNxUlCwLicXbkm2W0cVTo2ISL0x'
-             b'hRTlyjsZ0ebKPinAxOjJ/QdhEQW0SmWRBef7tePP7+vvfvd/SisjDeg12KnzBbBG16yljgBaqg/W'
-             b'IAF4HmZSPDdsrqzAjl27H/ylj/37Ox7+6v13/t1f/b8fu3D84A0jpWJoD4v+LYPYxCCn6SvRMzPz'
-             b'MOM/6vUajI+OwIbpDaSUh+qCZKNqWSIzy3SOzOY5rtcLkr6Bz5+oqYhsJCbOm1Xox8pcWlvRiYL7'
-             b'aD5azImd8LySN5EkVMxpEHaRwIFc5ZQrp1ZzhYI1Av4Q0T2/uEQqfi0f9BGEhAqCTf9v9BAgQJiI'
-             b'lPD5KNCcvVhKSDPAiCkNKgTii1y3btoH/1vgmutvgJlz52BlwWf+vRbRABlqJV0Dp0TGaH6DFT9u'
-             b'yu3mKmzZMAkb191K5xY55o/u3eeTiRZ1aXA2TWgA0b43WlHKOdDOh5PkB4McXpdieRhWWxYWz8yQ'
-             b'O2J9qETjgcu2bYPxkRESJ0JbZ0rMehJ8HdsZczWdBOEmCqIYpFMIjAWTpFGoSbwDcg2p3Bc6K8/5'
-             b'wmtCkEBfUhHsiFVTIgQl6eYk0no3SaQsqqGP2DjzQ1tKwlK8d+j6VWB5tQnnL16C02fOw7GT50Sk'
-             b'ypBAjYK4EqPyvBr8pQMV8k9OcvF+QofGin8vXXPDtYSlGR2uQscnA13sJiXioJn7W23JmyC8INgY'
-             b'ncikfE6UvBfcIsWUC2WrRyfXsQWzDYpGQvljrAU+XmpM1DXQHpgTJooRwSTB7IC+F7XNryZCqi0s'
-             b'mB32O+BxTqrg0pClyfXD978pMG3QdSEtJnDRV8L7Dx4MappMOCoQBXbN1iseu+WVt/859FYF1/FC'
-             b'KcIslKoVogpiMTYABg4SgOctE0Ckri8l7dU33vjpF93yki9+5Yuff/un/vwTv7Q0P3PtRK3k3789'
-             b'alXT5qGzdQREkZlPAVZ9Nbl8/iKcPDtDAWF6/TpfgYxBvVYjWduR4WGxAubKwKmdaTC6yQG5pA0a'
-             b'gkqoaKXqs7zRaZUWJXE5wJHTIOrtJ2xQQtxqNE/xm8my33g7/nO5MgRP7HkCWo0G1IZHaGNaWVqk'
-             b'eXy716ONx2bGV/mOPnqZC7K5hUIagGuIRUqVOCatfhwToBFTpVKCDZs2w7btl8ENN15Lx3v84D6w'
-             b'nQ4pKPI808rsWs1f0jAvVHK3cqZp3/fnjsFYADu2boANa6dgZnbeV/FHYNEnLBmZs/hXVExE2U4f'
-             b'LstZ2pqAkHfibkf2tmkZ2v44WwtNuDC7DAeOnqTOwJrJSbjumt0UrIZrQ2LKJPx4NdYJrXwT5Ju1'
-             b'O6BgQf19NWoy0qHQLpMC+vLUgUghA4hMeb0TbB/AUAOTyTUYGEfC/gk661f3RhAlx7SIdDMHyysN'
-             b'OHPuJBn0nD5/iZI6pnUmwVGRtQNix8gIs4SogVbb85x8Nlst8nt46UtuplFLfajqkwFkkzQC6p1B'
-             b'pTlqnMg9k9S2GPOEICsoeasW05IRKeIf31vV0VGY8JWlk4AfKI4sRSTAzvjWT/MB2ppg9RzwsmLH'
-             b'zMzD6DkRFBysCH6l6lTMuhkpjnpMmpvdSHtKFSUDIMSSH8dX7v86dLqMEcIfVnyyhe6kSz7hfMs7'
-             b'3vMHhUqtDd3VFxid3r+niylUfJLdWl2FgangIAF4fvMA/4ZDcNrIyMjqdS+65c92X3PDXz7y4P13'
-             b'7n346z87e/bYS9Nuo1BOE/Ey51YnzaMTBcHhTBpI//7IidM+gByl7xX8pjFcr8G2bZthdHSEePLY'
-             b'YseqKEkY/YtbAirc4WdUO6O2oOKPMXAUgCh5hTRq/XeEKkTgOP8CUDkNKx6UNF1cmCfznlazRcjj'
-             b'+cUFmjeis2BgIUgy42Zm6RGxwpOpB6mMCdGJBHkChQ2Du4tgJyfOb5hUoFdA6o9p547tcNNNN1KC'
-             b'MjE+Dl2fdFw6f8ZXz116vlTFZVzUVwgFUrBVTmJlmUjrFyB0MLhdnEGtWoTtm9bDju2b4ciRY3Du'
-             b'3AzMLS7Dkq9iUWuetQVkFi6WwjQ0ySIi3gYKplRoxl+XAle2c4tNuDh3DI6ePOuPrwRX7Njqk45J'
-             b'GPGJQK06RDKyKMmqfPp8IAa5J5T7x/Pn0LgPgUftB7SqzwvsmNgCCjPwAJxSRoLLtbTUgscUBV3e'
-             b'4zRChYYcg1Nxzoye7pcWV2C50Yan9h/25+4idTrwupWKVUa5g4o8RXljFiNyQa2QRy+ic+EfG6Wh'
-             b'Cdl/1U644oodUPfnDSmYXdGuD46EVtyErPT02RaTX6+Or/QOSVLpkGRQUIUGp1LTmPMlMDI+CfXx'
-             b'cXoPGNAuQaDCCOg1nk/TJ9JgAj5AmTtOOnQmh8cAmelb9ZQwIjfscsm6tNdcSNcMvT/V6CdoTGAF'
-             b'nBbhqX0H4MyZC8Q80mvc9Qn0in9/b7ny5nte/prX/DfoLr8wAXNCba745LDVWB0EoUEC8F2w0Nym'
-             b'6QNIudy4+vob/uK221/7yRNHD910/xfv/ejRJ/a8u7cyX6uVWMIWKygVk8kcI7Cp7Y8t06Qib/QM'
-             b'5ldW4cLjT4jzH1cOIz4pGPIBDDdjfG8P+0ocCzMUyRmu1cmxjpkGlvZIDOY8krBkd7yyvEyVdqdD'
-             b'w2of6FtMkTNOeMxMNyoIsp2eG7n5OQphEmabEtyB3eR6NPPn0QVjAThoWqruM3p8pE9OjI9SoN26'
-             b'bStcsWsnrJmagMbSIlTKKUn0zpw5Sd2TIEVsXVBdi5Vr/Nrp+VEd40TtV1Pdp0PllgjbgACKvTZc'
-             b'dvlm2HH5VlhaXoWvP/w4zC0sQ7vV8YlVkR5HVfRtH9re5VrqEIGZ0uou+KSsUOAka3GlDfc/vJeM'
-             b'jTZNryN9egSxYbcHE7oC8pyJB55BsGQIDpM5qV8NgHF4L3gzlSrO+di52BBJNFNIol6ACwh2l5M3'
-             b'VrtekZlJpPZNmZK52uzARV/hnzx9Dk75oL9KDAtDynPI4RfXqnhnJCYmKLlOFFfiltHy/t5vtlv0'
-             b'+Nt8MoYukuumxkhCl7prOppQ5kTi+h00BZPgJFlxMsc3kpWpymYYq8g5w06GKZdgbGotAUwzK3Ze'
-             b'Uq3nRynqdJjvpgVFQum+OVUndEojdNFpQR8qEatmGaupWZd18fhYM0EwOeLmaUBHMIwZKPn38oK/'
-             b'Vx9+7EnqtpCNtFFQYQ+WOjb78Hs/8H+YYsUBdk1ewB3Yst8LSVGx0+6TxB6sQQLwPN2UjA/oIifZ'
-             b'7+gbN295+I1vfdfDnTvu/t39ex95/94Hv/ae+XOnr0izDlTLRdbhRx3wLJPWobT4HbctMVjhfFwF'
-             b'ULBsWvYBfWm1Eef+Z2bkiaPlLYP/bKhIQHjLjClKaAyBTUr8HayOUzHVSQVtTk3UxIq6XqJsKq7t'
-             b'XTAcpra95V60SBJrxczIbRQyQR788HAdxsbHYP26KRgeqsDOy7fD6NgIKfx1um1YuniOAv5KUyiG'
-             b'glEwqncP2rYVcRrVK+4fcgdVRDB5nfr8/JyDISEIhLqPzAVMtqpVtjteXmnCocPH4cCBIwQAJDaH'
-             b'gAAT8UoI4Ed5CYyiV8Mb6XwAizgVkiIFUTyKE2fn4MjJ82RFOzJSp2Rup08+qmUc99SgXq0KOM8K'
-             b'jY7VDROJpFblc+U/p2ODoOSnbo5a0+fsfhSwp9VqYoIls1JQWbDOH4lPYBDDgceF5+P4yTM+6M/A'
-             b'vK/8ccSDXSds86eqaeC0CpfnSCLDhCmXqegBsCIk3h+o14AV7s6dl8PG6bWwbctGSsi6raYICEk1'
-             b'7qDPalkPigGVWc4gyeQEkUC0IoT1YBIxyOI5UNXfe/XRCZr3dwl0J48QxRpyb+l47zjngv12rhgF'
-             b'gH6Mhrbr9b3S/5AmdMUAou5DVJHk+yYNLA9NFnp0P5QrVXjwvvt9EtCAElpjY1cqYUzJ/EoLdr34'
-             b'VZ+69kUv/vx3hevfP2sXwBEosu73ldlz54Pz6mANEoDvkkzAv5lRCtdX2Gs2bDqw86of/M3b3/jm'
-             b'/3Ds0KFXP/LA/e84tv+J167Mz2wuWw4eKOKRyKZprQstx0TKQcIQYEVAkrkFofyhS5HN+bqpsllU'
-             b'+EsgBlNtySYq6iMceKPOaqpoB0783OPGhAsrfAr8VoMT4wQwyHcJ8JfRKAJ12YdqQ7BlzRTs3rUD'
-             b'xv2GO+orX6zsUHGu0VyEmdUF0P2NkpAEYtVOOqBGNXJYpsUwup/AZEnODS9XcamnX75L2yfaA1F5'
-             b'z8o8PxXaI3Us/OsfHx6Cm2+4ipweL8xcgsefeAIarQZhI0iuGJOnlA1a2MrZSXeExV9DtUrqbRLA'
-             b'E3EaRGOb4hAlS4uNtt/Em3Di5DliQKxbOwU7tm2FlcUF2LJ5E8kgl0pFGEKWiGLRuz1p4WMywCDT'
-             b'IBFNOEITKmGjXhBWkoEsVvt4vMTYAFZZwzEQSjbP+efGNvKlS/Pk5NjwwbjjrznOmQspBv0qqdBZ'
-             b'CYaJGvyEyGyCAqIGRKfeNYbPOdLY0DNi88b1cNstN8PY6AjN+NvNZRoLqCcj4yTyYVaSKs4gYkWP'
-             b'h54Z6T2IuRIyVzIbVP4UF1Hx1f7Y+ARJ++LDZOzyFdWwTbxPYgPfxcaTZsJW71XzrIr1RjAZRiQY'
-             b'A7xDaIWZc31Kfk7dQa0LHQ9l/KQJy0Xj2A61Ew4cOAgHDx4h22y1vO5l8n6tji6/58Mf/Xfi1/zC'
-             b'32YpCSjB8NgYrC4vDgCBgwTguzQXyHpEWymWSytX3njzpy+/+vpPt1aXR+dmZ6558rGHbjl5+PBd'
-             b'l86evGl1cXa4ilJfCLgrF4PsL1eDXBWmsslasZ7NMnGqg9gaj8FfKFUJi/pQsBPOH4L+iPNPl1GC'
-             b'g43UQX5wUfBTzXfHfH3SHVBANwaQbo8aF7bXhQlf2V5/3XUwMTEBtSEfvNAu1XZgdf58VCtMgEYM'
-             b'CghLVYwnhHtVMLRBsMdJGcW66uJT4FzQTeAKWfzq1JEuiWA5F8fdcWOncYwkUglrJJBjG9q+Vouw'
-             b'64qtsHHTOr/hHoZmqw1nz1+ApeUVDuSoC49dgTSN+vbaqVGxHJw8O+6g0LVzbOnKXRd/Df0TIj0O'
-             b'j39+oQH3P7TXX88uAQlxTfiNDZ0MUWMAsRK7d+2EUiGVZr22vcXXXrChlFCxyQR93UMqKQI/e3wt'
-             b'V31QR0vc2bkFGtVg9+nc+fMwc2mW5Kx7TsWsimTBi2eqXBbgmhgEpZAE1olRJUDl8xsb7JA1GHZQ'
-             b'3RGxHP75169dQ4JK2zdvgHIxgW5jkZ0H1aRBoJFWjitU9U6xD8JmSZJgWGTyJkkJB1nq7siIAHn0'
-             b'aDSD8/5EVB+5e2P6DJ20C6CP6Vxfy0GhgxLUzXMOqOl+E6pAksvOQ7fAiMdBsAYWC2eI3QxO2S29'
-             b'f0DsnS8szsMXvvRlH/B7UCyV+D0i6pMLzS7c/s73/V/bdux8tLO8/P2zvRoeQw1GAIME4Ls/EyBb'
-             b'UGxztv2mWl7ccfW1X/N74tfu/sEP//7c+XObj584dtOTj37j5RfPnLp1bub8zsbqwlS3uWoQxISK'
-             b'gxioUqFkhcrcSCBNtGqA6Pom6mMgs+BMqIUW4qxcjVCp0iATFha/wS4DVomTo2PgfAWMtqo2J1us'
-             b'+vbtbpuC3rYtW+D6qy8n7W5kE2AnwKEpi2yxCKxLdYvUygm/J2Nakh1gBxN/LIXwd4TwJh50IRi6'
-             b'sHcCv3Ll2iegSYSDgK+3kS0BaQwmoTNCiK0sjAmoklfVOf8f0s6qpRRuuv5qajfOLizC3j1PwcLC'
-             b'Eiz6RIDcBxNHFaj6tYdJA52rbrAIDl2c0GqW7gMG54y7BAjiBFOWxAZgZnYJzszMhtHH/iPHKXEq'
-             b'4bVBWVifJG6YXstASv9Y3XaXXieeXazqGeqQEVCv6X+G2gcrKys+YeuwHbJUptV6zQfUon9+X2Uq'
-             b'4FCPgftQRBGMQ20IVtXO6hweJPhLvMZrioBTf/go37x711WwY+tmqFQYB+OwE5C5aIQVvBJy7xjL'
-             b'jA4nmgyZJJ9WKXRObXKE6WCiQBLe3uWhGpkL1UfGISmVGWujgkEJ0x6tUwqtJg4mYFvCseakskPC'
-             b'k4NmQNQhklGBdACkQ2JNv9eDFfVIBdYmLoL+gouiJpQZJ3l4f379gQf9PTHrg39VlC3l7Ph7qDYx'
-             b'ffgH3v6uP7DN5guL9ve/agIAjzURd5Nl2SDMDBKA75XulSUlsx7jBWB8as2pyemNp7Zu3/GpXi8z'
-             b'pUJh4vGHH9jes9lVZ8+c2LlwaebqXrOxqbG8sKbT7kz0Op2a39xTEAAZWhlbqYDSRPnLMr9HwEyl'
-             b'SqC0QqGC4arpA0g7LRZb1VrtYmWoPm/S0oKvLM5v3rrt5Lr1G2fb3d7szit3LbVmT//mp/7kj19h'
-             b'ZPZNOgVOAYQdqNeH4FUvvw3GR30Q6bbA9SxtWJSwINArEStW2RCR9oVFOyLhWZo4EzHDNLrJSUs5'
-             b'lc9WA0/Sr2xnhe4XNmblguc2aIij1mieJKIx3NXgDTiRrimC6gpiiUu/7YNz5nrQ7XVguFqGV9z6'
-             b'Imj6amt+cRkOHD5CXQEcjVDVnBQEQW7F0TECx5xSAHWmq0wv1HbQBBF4Tq2qetidKKUVOY4MVlY7'
-             b'weHRinIdKhSCnEMCt5mcLx/SL8XHAYM/6iYUBYCKGyZhQZJELIgTgFw724bT5SRouv65tlOxKRsq'
-             b'Y+pLkGkTA9zWrBmH7Vs3wdaNG2B8vA49f3+QHRZ5MRgaK6BjpFF1I8lerYukOe382BzoE7EZLqIa'
-             b'g+ERPYR/+MJQFYbrozDsk1e6hHSuLOQegvn0idr4ciJZgAT67RVjlfnNjf44pgOXU2N0MoQykUkA'
-             b'rq8FIEBDG5gmwZRThKGi5TNjNpJiBfbt3w9PPX0ISuVyZHYIDqdp086P/fhP/sL4mokLSNH9vlv+'
-             b'ohf9NTe+4IBGaxBcBgnA99qMgJ3yeu2MQFB+c3L1ycnZkdHR2d3X3/jIwaefhOnNm0jz/MTRo8PX'
-             b'XH/z+NLC/NDZ0yerp04dr7RazU2bt2ydXlpcqvV63SJGtUKhnJXKlU5tuN5sd9qtp5/c2xyZmLow'
-             b'uWZ6bsuWrcubt2xe9RVV8/SRI4tXXXtD77yvLL742U/Di259BVy2YzeURydhce7Shj/449/d3G2s'
-             b'QLlQEEEjrgg7nRZMr5uCm2+4DurVFNorCzyHVRl2cTFLcONNBJvgJDharYIjoE+l8BMXUdUE3HKZ'
-             b'BCet5oNsoRrpUiVI7AeXk2V3NnL4+081jVbw9fS4y8ziLoixTIUehskIBQbpq1uhfPv/fCpA+utr'
-             b'Jkdg7doXwaW5BeoMzPvPZ86cpxEBqa6ZQqBIihRTTio2h/wOdaG0g1MJNlZQikm0D07TnDmQy7e/'
-             b'IQr6BLyHi8DSHCZEJ+IgIyKeQbM4T94wKlgTCKXTCVslzL1NdBTELgMG2La/J8aGh2F8bBiuvHIn'
-             b'JYX1SoUS1NbKIoso8ZSHXBPRTIsSEKd6EUnOjdLQKaCAKtfSBBMiSUyC3bEJYlkj4xNQG52g7hKP'
-             b'x2K8NkqzU5leAm1mIt3D9FTQr7Udr0DaZ7SdQaAXUbVRKX0qc2xVEojfC6wBLM+rXTkJ9ikHcjzG'
-             b'VPAVKsaJvhPzS8tw/wMPk+YEy2XbYO602rXwpve++9df/NKX/c3S91Hr/9nHAQNRgEEC8EJZWUYb'
-             b'K3YIfPyGrNMhdTR/ky9PrVmzPOQ3Vvz+/MIsTKxZA294x7tgeWaWVPSQY14u16Dkq/7y2CjMXrgA'
-             b'R48cglqtBj6pgPHJSfCPAatIAewhKKvtq/cOtY3Rea/TXoUK1OHzn/rET8yeOrptol6GDr4W6a1i'
-             b'239qfAxue9nNUMBAiTQcQbrrxsYxiufyRI3TnqU0bE2uzgoqcKBzWRcFcnQGG4nrMgHXTZcfLXER'
-             b'/AZBbyAPimQleKPqcJkVwRahO6ZRnEdZGfSn1CbusbSLzKUD+M4HzDXjI/5c1KG0awdZ3C4sLfki'
-             b'pAWX5pfh9OlzYXyNyHkQN0AjlWZwAMwNLtR8h3vUOjM2JBaj+AlWhxTSnagFqveDMdHpkbovEB3l'
-             b'A4XRmRDkVAZYz2yOuC4Bkzsq6hehAZRMHHuZYCYc1KpVuHLXdti9YxsM10o088fzhHoO9DokojmV'
-             b'yhZhoHy72on7IJgk6B4YdY1U7YMgzQvCwOBjQSAYmkbhPU+Mysw+awfIacfCRVR/lFQ2Mb8K4yoL'
-             b'z6WkY3K/H3s4+ncRIxHMl8JsLvg9SkfLEQbCOtXwYDYF+owhKPPeez8HKz6xpHtInqnrb4CGP/dX'
-             b'3fKqv377+z74++1myydqA4X8wRkYJAAv+FscN11C22dceZH5TqMBrWaDENbok44OZ9jmRCR55jdh'
-             b'1hpgeh6K/dDGHWZmhv6uXq/Drquvhmq1Ao3FefPo/fe9CcN6u9ULAkMYs4pJAW658XpIxehGq0Id'
-             b'dnJQyYKgjTqhReS0VqoumqHkNlEOhcwy4Ihng0hKLJutVIYizoM+ColQ8UwSkNqBN69AteAAqKVz'
-             b'j9X/BC0vPXgKUHhetYrG2l+189miWZAHokrYba7A9NoJ2LRxDWMjfHV73idks3PzcOHCLCwsLkCr'
-             b'3aYg2u0yqrtQKrARVKBXphIfbOhWqLgNtdoJkCnjAxGscQnbSLvgFAk5w6ZcyhUwdkZAiSDAT1Gp'
-             b'NGw3bCUgc/WsYkdO/BYyHnf473V9Ejg5Me6r/GHYsGEKtm/ZCGiKhYh+538W6Hsy/mDRo54kNxyA'
-             b'RYafXqs1gb8BIcyjaZJJpctgRWeBS+9MZu314THi8qMoDL7kXi/75krQGYGU8tgkNdEYS6UCTF86'
-             b'2k/b+wd6d8FlMjgDgspSJ3HuH+6t/kcjdoSDPs0AlxO3wg7SV778ZTh35hxpLRjJl3DEgpLI9bWb'
-             b'D7//Iz/z85Ck1vbaeX3i7+PoP0gBBgnAYP0jmw0ZjE9MwhvfeCcJC+Gu2Go1xpdm57ZguzZLgYCB'
-             b'+IGCQy990Q0wNlwl4SPSyxc3NRBBoFBxiuiM6SvDIoPvH6LuMj8dhF+esFiRtUH3nqoknLkrZz5s'
-             b'wlakYKM7HI9SZUptpbQXP4WMwHk4e09F+c/G9jp+1gGtIr+tC1RClR1WIRbs0GByRfNkU4QtG9bC'
-             b'ts3r6Y8bqw1otjvQaHfhxMlTsNJowdz8PB3Tqk/emGUmUrk4mw+8+kJsuTtNriAYOCWBCO9y8SqR'
-             b'cYro2SttT35ubTQBUn49B2grIwgnngc8/0fDGwzAHZ/AjPpKe/3aSdiydSNMjY8SLgLpndaiS12X'
-             b'Hpxlg03QIgjJltjuJhIgM00e5dpynoJUPxlZYPJjBeDnRIwJz1FagpGRMdLvRywDm0eJWZZJot01'
-             b'uL6KG8ccqVhc6zgm1TZ/zpLXRSWmbyHe5EybHAR/AgUOxsBugo9IzkJR6H98T1rLuhw4HilVq3Dg'
-             b'6QPw2GOPQ6VUhY6FqNlQSGFhue1+4kM/+ssbL7/8uG2ssGX29/swFeXZe1lIYgdrkAAM1rewun4D'
-             b'Hxsdg67f4BfOX6DNf25urrq83BgeQmGjTMR+UDcd6Wg7tvkdt8mBMGHzIg74aax0UqYeska7CZ7y'
-             b'EJrPuba/NvaFV280ugWlN9dfdUlAMYH7bsTKN4tJAD1vIVToWmEaoVYa4uynRCejea1xOS33WLW6'
-             b'VKt9F1TgnNIuEZ+g8rPCr9cRCBm8+POF1T4CHFGNsTJSh3H/w60b19FxdnuGujXHTxyFXgdtkXs+'
-             b'MWhCq9eBmQuXKJBi0GWAYRotXVX0R2bfSqeM44QoCmQ1eTCSrIB4GAiCHih5Q1J8T6yLmWJpyBkw'
-             b'hdHhOkxvmibRmcnJMRj1x1AtJuSvgB0SZIdwHiHPmzIzgKp6cTl0krGQ/gCi+amDkvThPaiT5FSj'
-             b'v9+XAFexUvUBvw7FchnK1Rq9NifeF5pUMuhRkP1BNdlFW+zg9Jij9qkoj4lmWSG6q8dCrsqPqsAm'
-             b'sDuMWmyrq59iWdRGIpd8hSNyWaAh0jkCG8C7mNScu3ARPv+lL5EvgpVjQewJVv+XFlbh1Xf9iz+8'
-             b'5dZXfrK7vNz3Pvr+zgDA3xtVaH4/AiEHCcBg/VOz5kq5SmhsEOc/5H8nhUKv1e50EptVkBPOm3hK'
-             b'dr6P79lD815UsGMzH9lxpU0NyrFWZHn0Gw4Up9jqlKo0iRq4LGDjYkvWQWi5q6qaEY16ra5UQlVd'
-             b'3oLhiyD4TKLVmg0gOUoURBIw8M5ltq9grmDAAiZIDCdBm0GliOW5rczuFaSVMbUrk3FF1s3o8VHm'
-             b'lh1rE/BnFq68fJsEH67WUSVvYWGZOhynTp+hoDwzcxEa+Hf+X712l8SYupnI5RLnPyeRm4iqHLFA'
-             b'ErJkJuS/D5osOW1Jvx+DKLbsadThA/eGdevpvG70AR+VKvFeQJnmoaGKtJ87kLX9R6sXgIiURBEI'
-             b'E/qCpbNKxjPsb2NzUrpOE0OZdwMEfIENCUxK/O4qGmNVh6BSqfkTVgjWv4HOB3GeHtv94alBR/ja'
-             b'h4II3M9V7yZSAfveHPF4NMGxOcfBvAgQnQOTaxwksZNF4D8b8K85zYqoYWGEtor8ftRk+Ku//CQp'
-             b'aWLil9n4updaXdh+3Yu/9MGP/syv47d6gUUyWJTPDjQBBgnAYH1rCzctNhACqf54YcCojYxcGF+3'
-             b'fu/y6SMvr4eRKuOu9zx9GI6dOgPX7N4JG9etgaFahTdIpVqh+VFqcja0Jrrm5HzqVWcdJHiJj1uO'
-             b'rifjBBklqC2uEVoYVZkuE9Q6uxrS31kIssyccGSCNRMaGT0HK6wpel4510wm4A1aYz8GdgQJ6nTY'
-             b'KstBjhmkqmUGgo3ocXmA4Kgr/H5QVUPgjgUmXxw0UuqyYJ4xNTZMr2ntxJWkjzC/sAgtbLX7319Z'
-             b'WkEXSgJxIq8fE4fFhQUCwBVLRVhamKdRTYfkdlMYr9dpnry62oBabYSOEQ2iMLBPTE5SAlAbGmKQ'
-             b'6EiNqJBkPY1tel/ptxqLwRPBEGUyDRgCpefxMabB/Y9Fe1LqNFg1a2Kty2CTTeBG6cSQdHOxQLz9'
-             b'SqVCdLdCscLPmYpLH3YlbCzI9R4JQTQY+Ei0tNCPGwkxPWckBTFqm+eoKhOVEVaNAGv7k4rwzoAA'
-             b'TY3vMf5XBi43ahBbZmtFXIm9F/D+RW37L3zuXn9PtMhciwYXgtFY7fQgq42f+7Ff/PWfqgwPN6Dd'
-             b'hkKpNNjI8ivBcdtKX9dwsAYJwGB9U/B3JC16+a5dUB6q8qaWWxUfDN741rv/9P/5g999+ZjjAMvA'
-             b'M0ca6s2WhQcf3QdD5QJs2bwB1q0Zh/Vr10G1WuJNL8kHdqmOnQkbpYoY2aAkp5SuCA4L81PpKiRa'
-             b'VYaq0UgFT/6qYuuLM9IiUc2YIGA5sMvvswmNiRV8kkTwH74erIyViqevSQyEDOvOUiDItKWsIMVQ'
-             b'WpoQAJy0vxMZ3rPZiwjcqJ+9tJZZGCYTtLsVgGZCmIKu//V6tQDDtQKdx/UTo3LuuALEahnliskd'
-             b'0l+bjq/S8ajaHdbzx04NJgBYUaLnAcrkFov89kVrVci65AOBXYWs05KuiajROdef0BgWFzLq8qeg'
-             b'N2EnELaCkjH/11kSoR+CmEPxnTBKcSzwo3bIiC8YGh4jgKRqK1hJsoI4r4ngOyc0Rg2oQTI4nyQ8'
-             b'VxwISUEeke9yPYVcBwoggEkxAbGxnx8HWJFKEEWERbDL5YYZfKv3SACKuifKVjBMM73n3nvh/IUL'
-             b'/jpV6RykNFLx19knV6uu2Pvhn/7ln924bftTvZWlwSb2rPG/X89isAYJwGA9VwLgK63VxjK0lha/'
-             b'6efLPot++e2v/S+PP/TQi84ceOIjFegSejqVOTQClXA+2fGPs//YGTh87DRMTZ6AbZunfUIwDaPD'
-             b'NV+kGtZcty5sftTkFuc4K9UwG58xtYws5/N4cP0dsV61CjEUYSLIVZ4JE61ZydCpwhoDyIJRDkgA'
-             b'SySkJIkACXWOLrmAABCdSrtqAJBkBLdtmnzYnoCzktCCZla9ETsDF7X8Mw4POrk2yr1PorNgCsxM'
-             b'V0AaiDYAaSJkCVnbWtEVoGSFXk8GtXJRgI0dnwQwSHKoXImmQNjtGcJRDkvyElIfxwO9Ls3Ne+jp'
-             b'GLTppXti4jzcqrMgsFgSd04SYiEQr19HLQYisM8ooTPy5oPlIaj4kjIvUpibuQgLs3NQHapDfXTM'
-             b'HzdbLHPLP87p2eSHRXOs3gcmgQRyKHrT/7n/3ofAHnEqJ9wXznMtg6Aanbdkzt+hpv+zKFPy/aR/'
-             b'wWMpnhw4kmXO0FRJ7KNZLMvAV796Pxw7ehxKxQr9HMSroeSTtrnFBtz+1vf/6q2ve9P/6C7PDcDu'
-             b'/0Bep9TYwRokAIP1nIsDCLVe0+RZ30ilYtF95Od/8ef/y//9f1b33H/fh6Ynhn2s6bF9rWFOPe7n'
-             b'5XKVVNVWmy3Y89QBOHHKJwPjw7B+w1pYu3Y9GdvYApDmgMtMQGilCeu1W+kYqIRvP9ffhHEFiccQ'
-             b'wt3E6s0wNkE7z0q1lkE9By7U+4c0YAAgiLU4qcYVFa8GMqIxaHJcbUHWE7vAf390bII27k6rRcGS'
-             b'KH7k2IbJimIVnBjIsAwzWfdS6crmR6HrEmQBpdORiD+B4deRBA45BFYFYzKkwpbuTCL0SOe0g6Hy'
-             b'tjJW6YmZE7AKoxOsAoEqUw36graQzkiirotBotYQXsNlDPRTvIQi9BMVfMJjNj0GaAaJ6jQnJS2p'
-             b'CQEE+BpggokjkJXFeVjySSl2LSq+EkZfjNJQTeSp9dIbn7jomCh2m8IFyytBgrBDgxViPJ/QF/z1'
-             b'K+kqqeBUDrMCieIBXK7r0P/OcX1PnZOHNjxqoyrVn+ce6V+zq92DDz4MT+59grpyXbm+DFpM4eJS'
-             b'C265422/d/e73/sfob1KI5jBeo5dzV+TUrnEdt6DLGCQAAzWc71RgNrLzC82z5lNj0xMtH7qF3/t'
-             b'Rx68/xV//5m/+PhvzJ85sXvIX/lSKlQ6k4WOAiYSQ37DRtYAesYfO3kO6vWjMDZah4mpCdi+ZRNU'
-             b'SiW2LXasSwAiVas6/QFa55y0kmXWLtVfn4CQtO37mrg5C1Z2WZPqkertJLbmhTkANiq30TjA9vr4'
-             b'icKkg6iRw1+sYNckTaFSHoJypQSjE5OwsroCjZWGzM+t2C1wNc7eBDbI2yInHoKNbk7XkH7WDYp3'
-             b'SRCREREhEwMsW+Za9lhIpNIuFKSjwhaxLJlrAzIfj6eQmj4Negpmlql5+KLRqIjCWCajj0Q6DtJb'
-             b'J+kEFwFx9PcYlDII3RDi/BuVfcog0fOnqnjqYqi4EG6PiP6DYYuqbheanTasUO4wB8XKkD+8hBkX'
-             b'acl/FGijx7FGLMj7tBWlC5ELxHlrXgX05ToHECr3HIZDuhgm9xRhzBPsA/rFhSBnyay21FadLIO0'
-             b'sPP3Thm+8ejj8ODDD9NYILMuGvn5311s92D66pv/5gMf/bl/leDYptsloNtgPfcaGh6BysJCuF8H'
-             b'a5AADNazBPdnfvVsC8Fkfve1r7vzzR+/+eYb7/mrP//ELzz2wNd+aGbm9Pp6yUAd0eImE8dAxy1x'
-             b'x8Y+aC6Dc+iz5y/BmbMzJGgyVK3AmqlJmJ5e76udkgRnoIARMPfSfk8il8vHuYTR7cHMx4m2TwJG'
-             b'u8NivQoyDqBAkiiy3MW2u86KXRY2a5rJY7hCpHmgc2XUIlYrW5AATe1nnzzhsa60O/QY6Dg3VB+B'
-             b'tevH6eGaTUwGVokuhzoLbOgSLWJR2U+Du9ONSqh5ab6OtNxy59OQd9nDCJyG4Gn0XOQ8CEA6Ejy0'
-             b'TkT0JkcHFOVDlaR1arFrBdQnOvXh3AlTg1OWTFn0nJzZ2BJXYKDlCytJgIAGhQdvBAioQEgjdEwn'
-             b'owFKAEXYSZONdrMBnaRIVMCKr5rL/jOaTLnEROGhwC5xAS8QwaguOO3pSEdHFUEvwESVQW3fQ05y'
-             b'GfoaDKbv+3S+bL9MsMl5CxgVtgK+n/D+P3zkGDz4wAM+sSmIMREE58MuGj9NrT/w4Z//lY8mpWIL'
-             b'gz8MEO7fQm8ToFavD+iRgwRgsL4d7ybcmFu+uq3V6pfe+b4P/Nrb3/eB3//qfV980yNf+cIHzh07'
-             b'9OqK6xRqRTR3SQm8RpN6nFU7ltglty7/3+zSKswsLMHJC5dg/9ETpCmwY/s2qNdrUMMqTuh0SH9j'
-             b'Hj5XyglVfdL2JBCeQgnT0BUwWo05neMrpZC37ERHClbGAyYL4Cx6bJOTBc55wScy8A8a+CQNzGY0'
-             b'iQYr3Pi7LViYa0OjtEwArupQDYZHJmjGjr4JrXaTZJ2zTo/0CqwAB5Og4R+NdjgVEVxDEo19cmrI'
-             b'MgqQFrhJc7N+l1M5jJUwJwY2J68gmvuWWQdWkHWpejLQP7OA5gcZoah/vctx6KPyniMfhVAVh6qa'
-             b'2RZWIfna8ZGZOClR6vWi81LgVM0H+WKxTIyAIjoeFgr0bwVv8t9nOStirdgh5/qTSwKe2Q3om/Pr'
-             b'sD8CQFWx8FsduDup8E3IRWxuJuWEZcJdAqT7nTh1Cj57z73MXrEQjgPBoSj804Xy7Ed+4uc+PDE1'
-             b'dXbFV7SD9a2von8PDlKlQQIwWN/GmUHWy6gKG51ac/Elt73qv+7avfu/zV+av+Gxh7/+vuNP733X'
-             b'3PyFLUUfNOqoD2BFqlcLWXGvw2CFJjwLy224OLcCJ8/MQMlv7NPr18AVO7bC+EgdigVDc3uD1TMi'
-             b'04XqnGj1m7CcnRDT1IdOugcm2NHmpWWpbSyCNE5yAEcJixR9xkRzIhfbvNbl5QujZzvYIFLHtrTo'
-             b'wohVW4e9G5aWFmBkZJysdofqw5QQ4DlALYBurw3thi/o/O+hJgCCErUFjq9Zud88BrBhDKI4hUg0'
-             b'jxrzRj3uVdBGrZvl+BM6/9wl4ViZ9MU6iqkpc9EVnEf4EHFXJGnnJCeqZyMtkrsaOhfvyZgiEetq'
-             b'vFSGnR9zzo7BvbDA9Dec9yONET9ji5ukkpG9kBaYOUJ6Bi74SZlA+5MRg4vzewcuCAGpMJVK7hoD'
-             b'McibPFhAjYc4OTL/SylA8+xztTCf4nPkAAKaBbOrzF9rFFU6duIkfO7zn/f3toWiP85Ot8fASsSV'
-             b'+OPsFGvzd73ng/9i165dXyNa26Ca/UduV6ncG4PzNkgABuvbOz7wkaTnK1rb69n109OPvv6t73w0'
-             b'ecs7fvv0qZOv3fPIA+89deip13WXFyZGEXXeaUKSoURulzYxRDfbzEq1hFVlAbFpcOz0OThx5hyM'
-             b'DddgfHQEpibGYfvmaSj7yg+56NRKVuU9MaaJQK84bwdQBgCIdjw39NmD3YSKkwJXZsLv0GZNSMSM'
-             b'mQqSrATjn5wkEFfC4u0uXQIjcsNYQWcSVZcW52BlecEfwxDUxsboM/YZKr6KrdXHWDrYH1u304VO'
-             b'a9V/NElUicCS0GOeuGF6oyooKDsBpPJN8tK1Jon+CCZIJ4l5kKoranFr5DGiWp81PWIvIFCTuzhi'
-             b'tIQYgIRn06nw10Ou4bgr44ywOxxLLaUuMj+sY6En6pr4qh5n3SWa5xeJtojYEa7uSwQCDHoOanss'
-             b'Ijna4lcnQhMKdwN5lR/WpBLtCHChqx/MpQRrkpg+q8AoICQZooL8nMsjC/P0QHlUk+S6ZTp6MGHE'
-             b'QMeR8O/i2OL48ZPwPz/9mSBQRZbI9PwpGW6tZmblbe//wfdffc21f99utyEplwebzj96k3JhjDNY'
-             b'gwRgsP6Z3mNoIoRIfr+hL91wy22fvPFlr/zk4QNPbz559NDbn/jG/e86d/jpFxdtViqZkt9wfUDD'
-             b'YJaaCKiTAFwqVKgCWlxtwdzCCtEKDx89BSO+gl6/YQo2r18HVdwIU7F1Mamg0K2S0HOdXJ5TW0F4'
-             b'c5cgzam9pbEu0Lk4jRXSECCcJgsJT8yNtJg1F3CqE5DEPgOJ1DhB42vr1wd0HJ90fMKEpjWFUhWq'
-             b'9RG/0VuS5E39eUmHijQ2cCJ2Q2ZNviJEMRiyhyYDqAx6vY7IyeVoiaAteQb70cgAxySQ7xZItJbA'
-             b'ShbNdB0UM2GD74Lum8E0CZ87J89sBWugwjYgdrh6TjUYZgl7GmAwr5V9Ze+TnkKpQs+J3PZUwKek'
-             b'TCjmCj1uewRaniruGgmsqvHPglBRUMeYmCCE0UhiRLci4dtDjHfyrn8yatfUKlD9jHpCQE5TOB/8'
-             b'Xb6DkJe0jgwXHUkoW4CGKKUCnJ+ZgXs/9zlVwArH4OQ+W7Wm/aGf+cWP3PrK136m5a+9oc7bAMz2'
-             b'j11kkhY8HwZrkAAM1j97VwBFZFDNbnR0/NQb7nrPH7789Xf80eGn9ly//8nH3vnUww+8d/HS+csS'
-             b'nzBUSyw5jJ2Ajg9qDAjnzTBN/G1V5I10drEB5+cW4diZ8/DE0CFYMzEOG9ZNEYhwfGJUZG0FeY1i'
-             b'PT0J4bhpUo8+tsRVftiInDColLCGGgOidqeSwwJuC5bEQElC6oxUlikESqHMi22iaoY6i3ciNESU'
-             b'C6A5rlmEZmMVKsMjUPVVMFejghAXqhyivZMSQMUMC1WTY0+rtcrH5r+HinFYeXepsyIOhhrYoUjg'
-             b'PdY3cAK1ywK7gkfOnCjQzNoUxDuBGQtZzvWQZIz9i6GuQMojBJSGLhB3nSNrUcCc+DkldD4j3bF9'
-             b'TwxDwgWYcKwc+F2U3HHPUEs0cbigdsSJ0crfCJ8+l9tYxiZkgo0IbeDEBBaAJnCixctoD5Nr5+v9'
-             b'EQCRJiQZfa4+4VO+tRztp/Mqg+xCYWgUUvIJEM78/+6ee6DZbvnzV6DxUiYujkmhCE1bsO/80Y/+'
-             b'9CvvfOvHly5eiln2YP0TihM2JhusQQIwWN/Rdx4w8r27iobxdnrz1sc2bd322Gtef+fvHj6w/5VP'
-             b'Pfbw248+vfeOi2dPbignhihppYKaCAlaP+Ppfpriz0ssg9rqwKpPBI6eOk2GNOumJmDblo0wXK/D'
-             b'8HCdisiMFWkomCUC+2PddYgeBABBoCWJtZo45CkQLA3OBTpiUAZAZhTZnUWFQ0F7G1ClQhc7CUa8'
-             b'B0SuGH+xvbpM7f5mqQxDtRqUUEcB29/Wxrayi0Y/ijyoVOqUZBT91zUR0FGUfmIYY5G5XkhcaJ4v'
-             b'OQ6OFTKfbKHxE4LryFYWv5dx8jAyOsYuhj64E+oepOoXKiElTo6V6VLDY4MgrpSz3+2LVyp8k0Hf'
-             b'cakDYe7X+r4KIw1QfEY+5togTARiHkTXOBFjKOf6NfxcTktCEj9j+9o/goqMHQ0T2zzBtjpa9eqd'
-             b'4cT9D6L/gMn/Ho9rEJtQ8And0eMn4O8+81l6b5TSAtP9LCcpbf/1aqPj3vuRn/qF19397j+x/v4Y'
-             b'zK6/DWtQ/Q8SgMF6fmcEGGR6ftOrVYeWrr3+xk9fc931n15dnp86cfzYGx954IE3njy0/zULM6c3'
-             b'VnxArZYLrAFs2DkFN0/yuw9iRfi5CK1uD46fugAnzp6HerVCjnVTU1OwbfNGohnS/JoU+jiRwNGD'
-             b'Vrd5tL1u51bTAcfNfqZ9pVRRgnOBScAIOgm4OnLQ4C+z96B9LFoEZPoS+PbcQqeHzXrQbnWh2VyC'
-             b'QqEMo6MT5HhH7m+iZGZdRLSrdG4iVMBM1Q+SXLBKyfA2BDybSFXtg0yxWJF62gWjO5BzwpRCFjly'
-             b'4pqYStckk7Y+qSiYyLTT2bpy3J+tUjU5g3sN5Dle3LNlAPm/DME7b7ijTnzRawEoKQMVTDL5oB8b'
-             b'+w6i2ZRYSvZV7yb/OiUJcCKypFoRcebP9wsLBEU/CRAAodpDE13VJ0wnTvjK/7OfgSJS/XzG0O3Z'
-             b'ME7Cv5xdasJb3vfh33rd29/5n1DoZwD4G6xBAjBYL5xEXEYE2O5H/ny5VLp022vf8PFtl+/+eGN5'
-             b'aeLMmZN3PPXIQ3eeOnrwFSsLM1vKJQNVBIUZRlCrdCoGoiSV+XCRB9ht/7MzM4tw+vwcHDh4FCbH'
-             b'hmHb1o2wds2kf54CjRQym8l+rz4CSZjNGnH303lvdA1UC1cnALdU0OSsDJcJJS4xPXF5S4JSnsu3'
-             b'qGVkEDj8SRQxckLPg6wDC5fOQeITgfrwKKQoblOrCyZAQHxGsAw2xnsENqqqAWMPkuBY5/KiQc4J'
-             b'jkESHaOCxNxloJRBy2LFSRgJTy6neCejgcRFqZ3nalMrJTHkgga+qWX+zX8gwV+CriZRUTfACEVf'
-             b'uggu35I3EaPhYmcngPtyL8S5KNLTP+M3IdlzuVZycIG0oinhFJLJI5bMdilhDHROTZD8vXfg8EG4'
-             b'74v30bjLptYnw+zC2M0ySg5nfPB/xZvf9Ud3v++Dv4XmPoqLGazBGiQAg/UC7Mqxg18PRV1aTax4'
-             b'517+ujd+YteuKz+xtLw0urC48Kp9T+x9+6Gnnrh9efHSFiSBlasGKrirZllo2ZILIO3NqX8M9qBv'
-             b'+5+fuTgPF2YXaQ9FSuH2LRthYmKCkoFatcLAxaxLQYs604bpcMZydZlJSzsJxj4YUJNcS9+ENjZI'
-             b'ThHaxNA/g3YaLMUEyYnvgclZHFuh8BFosduGeUwEfNU4NIwUwjrJmhrRHXDalgd2iEMjpKAgCOIu'
-             b'R8fDlS6eo9Ro+95FrX45dpUJZsZDBFImIn4Tj8sES1wjVDz+nX/YayffitXW/HP/8jNsfaVl4FSH'
-             b'PyQiOXR9n2FzTla5r4X/jNmEeebIgbtE+kJMXhsgpxKYFxQKv+CMjAEKMZkTMyvEQzzyjW/Agw88'
-             b'SKMdsl7usb4DJnjG/3y22YPXvu29v/XOD/5v/6Y8OgJAoluItRh0AAZrkAAM1vfBIvBgs0ma+oU0'
-             b'Xbzppa/4m2tuvu1v5i+eGz535vTLnnjsG287fmDfG2cvnNmeZG2ooGUs8velbcuSwjZIB6NNbpdG'
-             b'Dw7O+kTg7IU5Cp31WhUu274F1q2bglqtBEPoL485RY/VAA1rzzB2IMdVJ767asYb01cZOmmNi1Sd'
-             b'VP4aRIyI+lDmIm18BibRd9UhEGyuOraA3jf4vdXFWVhdWfTBokBeC7X6CGEFlNLn5I+oha+MA6mW'
-             b'k+Dcx2qKFjTGMa9fEfVRkEfpjiYmQxK4IVArpTI28pxq9uOeo63fd5Fd8AB41uofYvXvpBMRRzQu'
-             b'J86UO//mWQh5DvoTlj6fHpPDNih2Ic7r+5sR2h+w0B/yIxPAmHgPUCfAWpGTLhC98ctf/Ro89OCD'
-             b'UCpVqXtESRjqIRQT6Pjfm1vuwhve+YO/+Y4P/MjHOq02SfyGbGMQ/wdrkAAM1vddMoCVaQfFcXrI'
-             b'l17edc319155w833tpaX6yeOHHnZ/icfe+v+xx+98+K5U9sT2wY0wENAFfGoAXIa7rmdPy1SkrDU'
-             b'7MKjTx6Cwr5DUK8PwdT4BFyxcytMTowyndCh0EyXdO8DsM2xgozRzoW2hp0a7WQheNkwR1Z9AB4X'
-             b'JCYeG2kG5KKVy3fQRbfAihVhIeXn67U7kLWa0FpZhuHRcQLlVWvDlBhQFyTLxWmfjKhrXmJygdfE'
-             b'qhkEvIevJs3RpLgzA8HoRllu2gE3ESIfArEK7jwn1KpPDdBFj51n+TV1XoTweiCYETkT+f1R3TDa'
-             b'7lJqw25SMUBrg8bEroAJ2j8mqEkGrQgXnzPfZQjJA+SxDHKfKS6DfI5ZRjrx1f3nPv8FeHzP46Rg'
-             b'CGKS5HLOiHOrXbj9rvf8mzvvevvHmj75TQaadYM1SAAGa7Diwqo+67bBddDetrSy69ob/v66F7/4'
-             b'72fPXRg+cfzorfueePSuo0/vfcPsuZOXu25mysgmSFkuGDdkFNhxMktl1diU6GtYiS2udvzHOTh9'
-             b'YQZGfDKAWgPbtkzDhvWTnEQUDEkaI1o+s7GSTFXy3ooicYwPhMZP8mJBEI1y+BWJYmBo2isWQNrZ'
-             b'QXZWteI52qA6X4IVpP/ZwvwsxbJmc5Usc0sVlMkdIiqZVr9G5frEvle7GUkOvU7nxCXPaGkDKRm6'
-             b'PoOiSL3ro8xBHJ0HsxsTg29U3INc0ARtsTwjCTC5ij436zcu2CHnuy4m0AFjvHc5lgcD9iJeQU48'
-             b'/SjTGt7m7aMgJBzhdbj+7kWE/1lQJkPsHNgg7Yu0vk9/+tOw/8B+qFaqklxw0EfMSNffJEuNDO54'
-             b'5/v/9dve+8Hfbvng7+9dKJUG5j6DNUgABmuwnr08RFGPTgu6vkIvFQvLV1x97T1X3XDdPT7gD+17'
-             b'6qnrn3r8G3cc3rf3zfPnT12bNVaKqDOAgDp2wcskKAjHH1kFKDWcMCJ7fomFh06dOw/1oQqsnRqD'
-             b'XTsvJwvjgujN214mlsUiQRxogRzYiR5HP3KxchWHQRT7wWQmpQAj9stBWyDL6Q3EujoEJBd1iSk1'
-             b'ID69hU67Ae3mClWcaEBUrtboQytfJ+A+/ZxoShLwbKpQp4+dM8GROJqYiIFw0k5Xz6KcjI4EzT7i'
-             b'Xfy5SyDJZQmBRidSu1YEhlyosrn7kQcAxsRIkioQjIPL2flqt0YreRDjpAD0i4FelRufq1URK3yI'
-             b'IEM9HhPPYS/rSdfBQqVSgYWVFfi7z9wDp06dhHp9mEB/WRatrHv+2s13bO/tH/rIr93xph/4PVT4'
-             b'c4PKf7AGCcBgDda3ngwQKr7bJkDV0MRkY9O2bV+f3rzl66+5866Pzc6cvebwvqfuPHn04BvPnTr+'
-             b'4u7qUrUAPb5REX1t2LY2cxycjRC5k2KJgsxqswtHT56H02cvkjLf1MQYbJ5e55OCcQIRIne7Z21w'
-             b't0tkDkxSt8B+AMQOALVKBkpACozIC4Ge9QASZhZoQ1tm6/R3Qa9fzJF0pBCcbUBMdwysLi35j0Uo'
-             b'iRsh6uijfDImB9ZF0F8YX4gHQF+rGzkCwoMXRwUGrhEYMokWy7m/iOZ5pg+cqIlA8gw/AuOCOK6g'
-             b'IlxOl9/lfXUDBS/gJOTJTBzvR3voJLb7XU6dL+fvC6rQZyTxkCnLc0ARTB+kod82CH/ao0pfWRLF'
-             b'ShmOHD8BX/jSl2BhbhGq5Rr0uiIlnTA3s+ETyG5au/S+n/joj73hLXd/cukCMz4Ga7AGCcBgDdY/'
-             b'PRsgPX2ck5tC2lu/cePjW7bveDxJ09+5cO7cVQ9//at3Hzn49J0XTx+/qbc8X6kXU9a6R+AgMgEy'
-             b'R8I2PctVJNH6UKTFb/BLKy2YnT/lN/dTNCbYsHYKNqz3ycDaSSj43yVhHejlgIImSARnGXsCRHQ+'
-             b'u/ph8sEKeJbdCI0KCEHQpze5ICiSfExINFFIRyvUggVmMvjHRqlhNBfCnxR8AjAyOgHl6pD/UYF9'
-             b'ELTij3ZGfRh4Z4UeSDmRgtuSAGzkat6IRkMOPGe+WSE/Vvsx0Qg8efl5iL0udif0e9S1sCYo61oT'
-             b'OyLG5kYskBPos31NiRywMnYpTM7o6dm0BwD6cQXxRy6MG6wkJKhuiCOiR/c8AZ/7whdI2bJSqUK3'
-             b'y94RRRS38t9r+/M2Pr3j0fd88Ed/ZGTN1B7bag3U/QZrkAAM1mB9Wxch/3vQyRroKufWrN/w1Bvv'
-             b'esdT9frw7xw9cvCqxx76+t1Hnnj8rvMnjt6YdVcLZb+pl8l1Tyh40KXKjoR0LIPK0JwGg9HcUgsu'
-             b'zh6Fpw8eg/HxEZgaH4WrrtgBQ7Uy6xSo74hjjwJU0QkBUUyLnLS3Q2By0uJG8yEjbP6830zO8pbQ'
-             b'5exeE+fgWGFaNumRxniYwGetVZjzyUBaqpDmfn14DIpkKJOolV4wB2L8QZIrltUFUAR00ACILGot'
-             b'4QbipMA8S/jM4fBCkBZMg7OBNaBJT6D46XnJK+9G6QGAnGSwyu+56CYR/APCOX8GkL6PtvmsgT8m'
-             b'Ms/QEXrG8Rni+xdKZWi12/DAfQ/A1x96iGywjf9o9zLWYvDnquc/rzR7MLlt9+d+9td/633lavXi'
-             b'udOnBu/TwRokAIM1WP+MfQEOBpgM+CCYVSp2/YbpJ1//5rc9eeeb7/6dU8eOXnP8yKE3PfLAV94x'
-             b'c+r4ja69mtaKBrEFMp/PyNUn4NQsEJc+LRcJdX9pbtF/zMP5mUuwbs0krJ2ahPXr1pLcK/0esHiP'
-             b'cdr2trl42BMHARc6GOQhIEHLhMqb2/JpAJuJrr12Bhy7yDEzLmGku1XzGanU8Ui6Leh0WjDfbBBz'
-             b'oDxUhZJPChIxUrIiZsQBzwaevYLcWMpWZ+45id5cpA24gHzpbCBXo0egZF90V9lcmfUHUZ5c5R6w'
-             b'AQLiI4MfE4N8GCkYE8SKIjhQXkwilsoikgQ5EyFNcCLIj5kbJlBBbUgIMgF14qhldn4BPvPZe+Dk'
-             b'iVOssJiKHoMAFHs2gdnlFuy6+dZPv/cDP/yBaqm00MXKf7AGa5AADNZgfUdbA+SuhzoDabGUTW/e'
-             b'smfnddfvefHLX/l7p04evWH/3sfecvzg0z9w8ezpa7vNldJQmkGxwEEU2/y5BgMZ5yD9DgPHYqMN'
-             b'C8dOw5HjZ2C4XqME4spdl8PUxCjUqlXoCXCQ6l8rlSGLv7M8MCho3XAVT6Y7QBLGYifEwTFJuXuA'
-             b'mvzqc4AjDLHyS3F+H239xA2POfP4BrVS7bcai9BaXfDBqkBqg0O1un/IIh0TeQrYROx+ARSLZ5za'
-             b'3EZDJTIHQllgYRoEPIBVqp0L+AeQzoYW7qENn7NthuCtwEmNMg+CkZPqDiTCwAgvJSIS8xJDKnNs'
-             b'TMQs5LEF+dyAxwE6EhH3CKfOkPz6dFxQ8NcBQZgHDh2Ge//+c7C60vDXvIKKTND117VaKBJGA6/e'
-             b'pdUOvPi1d/7RR3765351duZcg2mqA8DfYA0SgMEarOc1GbBoX9xoYMDt+WTgkU2bNz9i7rz7ty/O'
-             b'zV6zb++etxzZ9/ibzh4/dJNtrlZKONf1gR0DeCrdc6WYocRwknIlu9ruwHKjBV9+4BswOlKDjevX'
-             b'0cfUxAjhBUg6uMeMAOXoq0sf1aGEEUgZk4CvkrR5i+KgZ9nLILPUfs61BChSI0NBKAY8s7cu4BFI'
-             b'3CeQDjngYVKzMH8RlhbmoVStwdBQDar+M2IhTGa5M6DqgqpdYE3U1FdZYxXJEZ0BE3jzLsjvWrFq'
-             b'ViW/Pl4gPEMuWKWatZ2vo4LgdSAwRAsQoIQuPjeI4mLe9Cl4AeSlfyEKAJlAPWSjJiedFqvATMeg'
-             b'UwT6tdst+OpX74PH9+4lid9SqUznGoWkMGHIbApttH5OCs23ffCDv3z1zS/540KhQHbZgzVYgwRg'
-             b'sAbruysXYDc8/1EsVbINGzftmd5y2Z7Xv/ktv7M4O3v5vj17X314/5PvOn/y8G3dxnJ1qIDtYb/Z'
-             b'Z5Y0AmyfQYwlkB9ACRrtDPYfPgmHj5yAzRvWwfjYKGycXk8OhsgIYBliCXSptuDTQDmjx7QQ7XlN'
-             b'NLVRth5z03uqRxSq5KDeJ06B2uIO3HuV85WuRHt1CVorC1Au+yRgZJQUBxEEickAodhFiMfkuP2J'
-             b'DMut2h3LQycujiD4+AT/gGJFoEmBia13G5MSkSSQhnsM0lqtm5wLkTIPgs+7hdzri8mEAiVVI8C5'
-             b'fLs/qjUGmqIcH11XfK0Y+ItFH/xLcOLkSfjil+6D8+fPc9fEZ4MY3NFjAv0qUPxndqkNa7ZesffH'
-             b'P/wTP71x29Yvnzx6lDs+g8p/sAYJwGAN1nf3QgBh5j+KaZJNbZg+eF2xcvC1b33bn5w5fnz3gSef'
-             b'eNO+xx++4+yxA7fa1nKtmvBcPCWOP4P4MhuDdKFQoSB45NR56PpEYHj/YWIPbJxeC5um10AhEdBe'
-             b'xlWrUxxAmIXb6CioQrg4txdPAXREtKASfWmg6Rlhuat5jnPRNMcGi1qOuFqRI2qh02xAu9UA44Na'
-             b'qVCiMcHI6DjhBVghUKSWLWshuNB+j7JGAexIoxJRY3SqjeByLAkXOgehY+Bib9+Z3MQBYsLjQLsm'
-             b'Jir6JVECOA80UM09Ohd0Ym14PubxJ5JumODo6J5hbICYj263B1/90v2w11f9va4P9r7qb3d6dB2w'
-             b'o0NqjP6h5hs92HjljX/1oR/7qR/dsm373NzF8wOg/2ANEoDBGqzvvc4A6gwgtbCFCYGb3rL16ct2'
-             b'Xvn0jS95ye9fnLl4pU8G7t7/+MN3zZ46enNneaVYRQBhIaUA08V2MLm9MYo+SbGCLECj04VDx07D'
-             b'0ZNnYHRkCLZv2QQb1jKAEINqwAqQERzr92s2gF93bIGwAJnVrkDCFbiNQjfWKsvASZCLQjiMIeBy'
-             b'OBF4PbkLqnhOws9nSWSoycI1nRYlAOVKFSq1GqSFAr/lQwcCKAGx0nZ36hQoqDmiHuK/kwQ0NNtc'
-             b'UFeFYqeZDyjdUPQCVF8gaCNJkuNMCPBWVAsRdW9cTACC6uAzBYqS3DUWXwB6eDLrEb0DfwCVcgmO'
-             b'+6r/oQcegsOHj0AN8RJpiSh+OJ+hsUAxgaZPCpqu1Hn1m9/9b1/5utf/bpZlnR7R/AZvo8EaJACD'
-             b'NVjf04sEdLodwCkuOheu37Dx6c3bLn/6tle95j+cPX70un17Hr370L7H3zpz+vi1qe0m5TSFIqP+'
-             b'KDhRmLKMDi8jDc9HoKXlNux58hDsLx+DTRvWwo7LtsL6tWuom9DL0OGQJYyZT8CTdsLpUcVv4/xd'
-             b'+tlWGgaJVNfGJiJ4A6x5AMLrF4EiDarRNMeyfLByB6g4TsGXvNDudaDZWIJkqYDUSigV/UelQkj4'
-             b'fHcCQojnMI+vJ02iXqD+VkKOiyZqHgjNEfKa+znvAGdy7nxg+rwIbE7wx/SxCiJJMZgCKiEglyAU'
-             b'qxXGJ4jSI87yi/76dXs9uP/rD8BDDz/ir3kPaqiw6Di5w3NTSHgksdLJYGLrzqfe9+4P/cudV1xx'
-             b'b7PZoA7SYA3WIAEYrMF6Aa4s64Jrkbxwtn5642Mbpqcfe/ntr/63p08ev+n4sSPv2f/4Y2+dOXPi'
-             b'spIPbzVf+aeOUfNclVtCmReoW1AgUaATZy7CmfOXYO2aCahUSnDdVVfBcH1InOXUi56xB5SMGMT8'
-             b'Z4KKN8FmWE2QTGgcmCBaw6p1aRDo4fTESachIcqaURqgAAqiuZCAEq1PBlb8B6xSAK8MVWGoXif9'
-             b'e5RUxuNBPQUjtslkgwxW8XosHqSCxAriw46DsCOCqoBW6BaCn2JURYSoSGgiViLYFoteQpgqgHYW'
-             b'lFGhfy/ywpbHGPi61djh4NGj8PDDD8OZ02fJ0Q87IGyczCqP2GXx6Rmstg28+NV3/Oe3vPsHf2Vi'
-             b'as3c/Mz50IEZrMEaJACDNVgv5CWiQ1m3Q7yCddMbHrz+ZS9/8K53vv9fPfaNh1/zyP33/cipQ/tf'
-             b'kzWWR6grUChThY6AQyYCcDBMCgX6fHbmEgELZ2cXYGIMvQgug8nxcSggxazXleCn3PSUglIigRzb'
-             b'+GmSiMGNE5U9HhHEVjhEflywOjaiIihVNAEKbU5jX2yFxWUQXzfP8y20GsvQXEUvgpSkh0fGJ30C'
-             b'U+OugmE6oXMmUPYS4dFHsaQkwBxswgJDfWC5PgtiySJUEli/1n5DAiHAE8PCQn/nQbofKj9gxQ4Z'
-             b'qXkpivoUU7gwOwcP+sB/8OAhAkBWqxV/3i3pPuBooOevgf8nrPqqf3x626n3vP3dv/7SV93+Z52V'
-             b'Veg1m4P3w2ANEoDBGqzvz2TAB7duD7qNBlSqtdUrrrr6b6+/6ca/vXjx4uZjBw++ad+exz507MBT'
-             b'LytB15QrBSgI7U+DFgYZRJSbYhFWGm1YXD4DJ86chc3T60ltcGxshDzmXdZl9T9pc6ORkRNoviXd'
-             b'fkeugDyEz4ILoTF5sx4INDvl2QWJXRBMvHQrjHYbUBxJGQQmIv9B+P5o3zx34SwyKagjUKnWoTZU'
-             b'h0w6EaRxYJMYgBMIVr6M4pPHzOkSB8AeAPRJBGouEF5DdPRLnHoBPIPv76JBk4r70AigVIZmowlf'
-             b'+doj8OS+fbCyvEJSvkjHRA0HlPlFGuj/z96VxsZ1Xefztnkzw01chqsobiIpUvuuyNZiyXYsyZZs'
-             b'NUm9IEqMGnHiLogD113QAkaLoi3iH0GDukGbpijgAIkEVxUaOZZsWTIdS6Ika7EYiRIpUuK+zHDn'
-             b'rG/pPefe94YOULRI6yaO7yePPBzNvIUgcbbvfF8Gkx4tDPGE7W7ff+C1hx97/C9z83NHnXSK9CUk'
-             b'y19CJgASEp91iL17iwWGNAuOBfkF/Rvv2/aP2x7e8y+9Xbfuu3j2/Sd/fvHsE9NTo6XhgAGmzi1+'
-             b'fUU73LWnboEO6UwKevoGYGBwBCrLI9DU1ACFBXlgGiZLBCwS4uFtaexeC78Ax+ZjAXxuuwsMf3iw'
-             b'94X6FE3Eb14VOwvNdsR7NPqIJUYJPAnw1hT43jzqFrhi/MADYCaVIJ5EfG4W4qEQBMwQ8R7QrhiV'
-             b'8hzL+Zj9MPkjaGLmL6SAs75Ajt/q92WRs4q9sPBvzxRooXZvVm5ZjDywY8M1mPiYgH1x6dIV9rgM'
-             b'segkGKYu7HwdFGvkKow0slBgNpkBvaB46Klnn335czt2/tBh95hgVT8SP2Xwl5AJgISExC82BVhg'
-             b'ZlU4CxTBcE6mZfXaM1U1DWc237/zL/rv3tl/vu3dr4z0dm0O2EkloKNxDMr2sqCj8+rcUA1wAhq1'
-             b'yfuGxmBgdAzyc3OgvrYWGupqIaDzIMWDmrAAVlR/9c6F7HNvVECEOo/p7kn+ChEdr03uWwULJUHX'
-             b'1/L3grHoGHjphMLHBA6NIRR//p6Iz0MyEacgbrJkIDc/nyUDYU5WFNsM9H1yOHvR4VHaJw46YntB'
-             b'+QVpYZ/Q5+0BCqdELP+JgwDia19b2fNRYCmTxo2N+vsH4cbPb0LH9U7SPCCPBMURSsqOGGMokGQJ'
-             b'yxQL9s0bth358nO/+1JRSaQPbZhRYlrGfQkJmQBISPz3yQASAVMpVh3PQ15B4dDmnbu/t3n7ru9f'
-             b'az9736VzP/v6wJ0bj8ZnY7khnKe73j66TdWowgIXjgcwSKI74bXrN6GruxdWtjbB4spyljgYNBpA'
-             b'QyFvru8q3h4+j5O2IwK14q0XejI4Isiqnqqfp/VPu4j0Dm1BRuO18omXSA0IW6zxcdtgUuHjloMs'
-             b'gVH9Kjwdn4MYSwY4YdCA3DyWDITD3AxJEAVd0QmhfEBTRBIikg+x5O8IP4CFokBey8D/knT/s7aC'
-             b'jlj30wyNVe0pOP1eG9zp7YUUe27iFoC7cFWQezjgn4yrglFYMnjoua/88YoNn/thOBR2U5jQKHK/'
-             b'T0JCJgASEr8MUAkwzoKhGbSqa2rea1215r2Mnalve/vEUx0fXng62t/TEmRR2jREoxwlgF2umoeE'
-             b'O5X9ysWTGTh36SpECguhuqoSltYtIfGedCbtB2ua+auKPyOnY9meZaGSbaC74nXUwRddAHeBmE7W'
-             b'vtebsQvxYotvNvDpg8rHCX6HYOEcnvYBqbpGwqQNaYil4jR/x8o7FM7hIwLkMaicby9EDH3FQO8e'
-             b'uLaAy5IkzzlRCBSJ66OGgOX4IkKo1ockP7zeru5uaHvvfZianoWAYYIZCEKGFBm9Dgi7H/b+FAoz'
-             b'GSGnZf3WIwefOfRyaVl538zUDNhGQP7sSkjIBEBC4n8JESiRhZ5OpWBRaaRn574Df/XgvoOvdnfe'
-             b'2Hm+7dTXhno695tKRtddi1j+qEjn77LrOqtUdYjOzBB7fWBoEBpra6C6upLlC3ylDStrrt+v+oY7'
-             b'OCLgGv+OaPVjAFVFVS0og2I7ATsKrqstKP+zMsMqeEY/Kh8OKOCvyGm+LqDGlQi9rXxcQ2TX5XBB'
-             b'A+IL4CM+O8MqcfQjyCXBIepoKNmRgO81IHgKpHXoZnkNC62CFUEO1Fmw1nQVotEYdNzshPHxGNzp'
-             b'6WV5iMbX+hyevCDXghIepDcoATBy8t3Sirp3N23f/e2N9287iUSKNEvWpKSfhIRMACQkPhngOmEy'
-             b'AZoZTq1ct/5EdV3diampyQfef+f4N29fbd+To6tGIBRg1W2GBc0Utal5IqGBZigwEp2E0fEJKOru'
-             b'gZUrl0FlSSEPckLT3hXtfwWy+3HuQsa8mlXK8SRxFWWB7S66IvraAnwLQdG5eA5qGWhCs4A7+Qkz'
-             b'HtwOEMmBKkbyntWfP3YQWkZJJA3OzRHrPhgK8WQgnMcSHY1mAo64NtW3BxZdCDGt8Ep+rPgNFvwH'
-             b'h4fg7r270Nl5C0bHotQ5CbDXFbGeyO9XXDNLOJLsoHpece8Djx18pbml9XUtYDpuOk1JgupLB0pI'
-             b'SMgEQELikwJW+skk2Ra3rlh1evmaNae7O29sPnHs375x83L7k0ErYRoUlBbY61LgMygpGBmfhskP'
-             b'LkJVWQmsam2GosJC6hwAeK193n7QuKOPqKAVb/MOPmbHI07gispaW2iuIwI8BlaSNlL57NyX5BVJ'
-             b'g+oJ9DuKmJ0vsAL2NAAcbrGMf9A1b5495mZmIC9/EUsIApCbm4cWznR8R8j0imzCn/PrQoZ5YiIG'
-             b'PT090H7xQ5ghq14TQsEQVwz0tgFoU0KlDCZto7BSaHbjrgdfu2/H7lcXlUSi0aEBzsNwXUn0k5CQ'
-             b'CYCExP8nvJW6JKiODnVNze1PPP1s+4N7H/+n40de//PbVy98PqjZENT43N0V4j5I+jODJjHe+4Zj'
-             b'MDl9BRpqq6GePXLDQV+iVvUJb6qvj0dqgb4E7wJxXze7B+C9yMV7eIeA2w6JToGqZEWGaFyg8rm6'
-             b'p+Hv7/Rnmf181c8TAHJ9zwD857mZaRopoNhQ3qIiCJohHrjJx4ifJxAI0EfHxsfg/LnzMDQwROt5'
-             b'mm6yew5zt0GhbugKbwI8Y4pV92kwoWppy7v7DnzhD5dv2HB5YmwUrGRCcA7kT6GEhEwAJCR+tS0B'
-             b'cFIsWCXj0Ny64oP6P3ll70cXzu05fvTHfzZ45+aW/IDOqnnXc9Phs3zNoDX/VNqBazduw9DIGKxo'
-             b'WQqRkkIIaDolDbYfch2f8OdV+j5pUMleg6+t7/L9f4zzeAzNI/m5C813OG8Amfg8oDuCaJ/d6+eS'
-             b'AyodQHGEWqAgDypeyhHQeFLBzjQ3FYMEu3YcCaAHgR5giY6mQceVDpianITbd7ohzb5POqvqyW/B'
-             b'5UwEtFrGBIPMltiRsOKfSmZg6Yp1Z/Y98cW/qWte9s5sbMJOxedoZRMMQ/7ISUjIBEBC4terJ4Ad'
-             b'AcfOOKvWrjteUlZ+qvdOz2+3vfPmH/Td6li3KKyTJ71nI0zEP0WlYDkxPQdtZy9Cfl4I1q9eDVVl'
-             b'EVBYsHNEDz5boTtZkSBXyAELMx6PC0DNfZULCKligU8RLHvuS5C9ZlUYIim+3Z/XAXD9AhsJiG6W'
-             b'kMDHBEILAI15iLvAgr6m8tVAvI6BwQGYnJ6HflbtD4+O0rF0nZMdUbEP3QfRrwH5AEhERO5Cip1/'
-             b'Lu1CVf2y9oN793932YpVR3Jyc9IoWoRjB1nyS0jIBEBC4te8IeBCCq1mwU1u2f7Av67btPXI1SsX'
-             b'Dp1+69i3xu/1NOaZGqiuBRarcjVNEONUg9QFZ+fT8P75i9BUVwPLWxopaLq24xPpPCleCuti355r'
-             b'DQrCnUcbEFLEXkVPegGi0ueVvWjq85UCYUOs+PoBykL2vidF7IhRAhknsYfFXQKJpY8cBUeB4cFR'
-             b'uH7rFkRjE2ClbQgETAjoBmjs/LZj8Q1H5BKomDTgOp8L8ZQFjhF0ShbXtO/d/chrzS3LD1fW16ej'
-             b'g33se5SSlr0SEjIBkJD4tCUCrKqNz4NmBuMP7P+t761av+FHp06++fz5k2++mJgcK1sUDgFkLBHg'
-             b'aLOeFO/Q5vajm10wEo3CkupKaKhB/QAdHCvDK3JaGVRBFW1/HuJVzjHwtwOEAR/71VfF+21vfk8k'
-             b'PW6sp4mAzh3/FD4u8Hf2+Sxf9VYLRS6Aa4rYBUDRHgzow9EJ6L3bD1OT0zDL7hfvxNAM0E2D1vxI'
-             b'HAill22g+8NrwMlCkiU2ScW0mjdvemvXQ498p7Sy4kw4f5EdHRggDQYZ+CUkZAIgIfHpBlLoWWBk'
-             b'1fDUQ48+8bdbt24/cuI/jv3RpbZTh4xUMpgTYDW86nDmu6Nx0RsW8AdHJ6B/OAb9Q1FobazjYwEX'
-             b'xPjAW79XiWynKkJwB8DfxycdAFW4+alcIAgjtqs6oIjA7rhZS2JSH0C1QFCFA6HH5neFCiFLENDs'
-             b'COV3M0mYYIH/+o1bMDwawzYCOR1iS59MelAuGRUTgTP6HbHFgA+U7k2rhtO6Yeubu/cceLW+eXmb'
-             b'4lhubHQY0om45xcoISEhEwAJid8ACCleJAqWlJX3PPU7LzzfvHz1908d//dX7nZc3pur22AoXOsf'
-             b'AyeWyEEzQAF6cGQchkZGobF2CTQubYDiwlxKALzqXREaAorqbQOI3QEh+E/eA2KVUBVyg8J8zyf2'
-             b'8UvELQWd8hVQva0CrPQNci/Elv3wyBj0Dw7C2EQMZmbmsNYn7wAgQSKyJ8KntHqII4g0+SbokGH/'
-             b'hPqHqpE3Vdu68uj9ux/6wer1G84awaCTmJ5l+Y8thXwkJGQCICHxG54IZDKQyaSgomrxxW+8+PKj'
-             b'Xbc6n/nxD/7hr6fG+hcXhDXQWfBl+QA4JIhjgWlo7P8a3B0chb6hEaisKIHVLc1QkJ9LwRVldfmx'
-             b'+c4A8QIUPipwBTvAUwMEALF2B74wjyKke0kKgNwDNSLzYTcgmUxBX889GItOQjyRgnh8HtKpDCUF'
-             b'hhmiYzmkaAjCvtihz+PJMHnBaj+ZtqG4srp/1dqNh3d/fu/f267Tm1dYCCjiw8cUEhISMgGQkPjs'
-             b'5AFgsQCYCRjulp27Xq9vaWn76Rs/evHyB6cPWam5opCh4jYBafHbtk3BGwMrNtJHxmIwNvYBLK4o'
-             b'g6al9VAWidAuv0MuezodnZ4TaZ5/xvU2BigtwPk/JxaSZr+iUPveEV2B8dgEq/htGBochqGxcYgj'
-             b'EQ94ax9leoPhIG0deIY8eB7L4iuKDjs4KhlY7Lw5hSXR1qblZ9Zt3XG4prbuZDAYmtZZYjEyPMju'
-             b'PQxuQK7zSUjIBEBC4rMKVBVkVXVxaVnf3i8++eKqTVu/2/nRtT+9ePrkk0pmLsc0DVDTSfFWXs3r'
-             b'OFtnFf1YbJJV5hehurICqlgyECkphoAZEBZCLhcVwvY/VuhEBNBoxEBKfSS0k4EUSwQw2E9Pz8Cd'
-             b'u/eoop+anhZeBAo5AwYCoY9ZE2OigDN+7PXbJNqjEZs/zaJ/IDffLV1cc3nHw4/8c0Nzy9GiktKR'
-             b'YG4eTIwOk3qiYsqgLyEhEwAJCYlsP4AF68z8PBRGIj3PPPfCc1u37fq7t35y9KXb19q/4NrJUFhX'
-             b'ae/esm1uo6siyU4lI6C+/gHoHxxglXkIcsJhKI1EoKiwAMKhEOkMGMjWtwEmJ7GNnwALSXksYN/p'
-             b'uQdTcwnqCjj+ep5KDH6VNhJUnnSgzr/jcQuwkcBJfRlMHtjx0yyxCBeXD2/esv2NdVvuP1y1uKo9'
-             b't6ggPTc5AVYqBZZucCKkhISETAAkJCT+i4aAZZHUbUX1ko+++sI3D/V1d37n9ImfvNRx8WcHldSc'
-             b'mRvQeRUvpvv4H5IGca8+iTP6+SSMRWPUqg+R5DD75Q8YYGdsmJmdg3Q6zap2lAh0aCWPVgrx80gi'
-             b'FNpCliPUAIWbHwZ8y+ZiQjZ7X9pyIMXeF14UmVtS13huzcath1eu3nAsp7h43AwGITEzCVY8QWMG'
-             b'TCIkJCRkAiAhIfE/SQLYw85kqDW/uKb28jNf+72n7+56eNM7Pz32UueH5x4PKSkjbHAHPl1R/Vk+'
-             b'cQR0QfFnATyeStPRMBhTlwGr+4AJKgr6GApV9Z5uAK0eOlxgyLIcUgjErgG6CCLH0GHBH+f6Zihv'
-             b'fnFt46WlK1YfX1LXcDRSWt5dVFYOGnsPWvLqquJvFUhISMgEQEJC4peElUlTIlBTX3/hy8///pf6'
-             b'evdsOfvuyW+N3Ln5WEB1gqqTZoHbJgtim6p0QcyjlT+N4r7OBYUpCeD2wzzg46qe7XKfQf4aZ+6j'
-             b'kA8y91PsicUSgPzi8pGGpmXt1TUNJ+sbm9+ub2zqMvPzYKCnG2x2XieRAEULSKVeCQmZAEhISPyf'
-             b'JwK4McAe1XUN5w889dUvjfT3bbp+9fLXe2917JseHyw1XQeCOlBFj3N/EC18suf1jH/RD0CxWLBW'
-             b'aa8fX7NQGEgxwHItIgW6ig65iwrmI8Vlt5tWrD1T09D8diQSaa9YsmRiZmKSXUMSHExKqMVvkRWw'
-             b'hISETAAkJCQ+YVDwZUG4vGrxhZY1Gy9MT0QjvT1d23s7rz9yr6tzy9z0ZEMmMRciQSHkFma8DQJ8'
-             b'2Kxid0AzdUASv6oGIFSQP62ZoZGS0vJbVbVLPyyvqLhcWlbSUVW9pD9cWGJPs6A/PzVJDP5MMkHr'
-             b'hXJxX0JCJgASEhK/Eihgs0QAGfY5+fnj6+/b8cbKtRve0BRXv3LpUl3QDNbd7ry+5G5PV2N5RVWx'
-             b'pqhmJm2rhq6xkl1LjIyMxJpaVnRV19TctjOZe2s2bBqLz85kcoqKYSYWZUlDglYHrUQCbHYO15UM'
-             b'fgmJTzP+U4ABAAbBEp4UvqJwAAAAAElFTkSuQmCC')
-        )
-    )
-)
-
-__all__ = ['EXCEPTION_HAND']
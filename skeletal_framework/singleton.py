@@ -53,5 +53,3 @@ class Singleton(metaclass = SingletonMeta):
 
 
 __all__ = ['Singleton']
-
-inspect_magic_genealogy(Singleton)
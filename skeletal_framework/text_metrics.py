@@ -0,0 +1,213 @@
+"""
+Cached text measurement.
+
+Measuring a string means selecting a font into a DC and asking GDI for its
+extent; doing that on every paint or layout pass adds up quickly. `TextMetrics`
+measures into a private memory DC and keeps the results keyed by
+(HFONT, text) in bounded LRU caches:
+
+    metrics = TextMetrics()
+    width, height = metrics.measure(h_font, title)
+    sizes = metrics.measure_many(h_font, labels)          # font selected once
+    shown = metrics.ellipsize(h_font, path, max_width)    # from cached prefix widths
+
+HFONT values are only meaningful while the font exists, so cache against fonts
+with a stable lifetime (the ones handed out by `DpiContext.font`), and call
+`forget_font` before deleting any other font that was measured.
+"""
+import bisect
+import ctypes
+from collections import OrderedDict
+from collections.abc import Iterable
+from ctypes import wintypes
+
+from skeletal_framework.layout.box_layout import Size
+from skeletal_framework.singleton import Singleton
+from skeletal_framework.win32_bindings.gdi32 import (
+    CreateCompatibleDC, DeleteDC, GetTextExtentExPoint, GetTextExtentPoint32, SelectObject
+)
+
+__all__ = ['TextMetrics']
+
+_NO_LIMIT = 0x7FFFFFFF
+
+
+class TextMetrics(Singleton):
+    """
+    Process-wide text measurement service.
+
+    Args:
+        max_extents: Number of (font, text) extents kept.
+        max_prefixes: Number of (font, text) prefix-width arrays kept; these are
+                      as long as the text, so fewer of them are kept.
+    """
+
+    def __init__(self, max_extents: int = 4096, max_prefixes: int = 256):
+        self.max_extents = max_extents
+        self.max_prefixes = max_prefixes
+
+        self._extents: OrderedDict[tuple[int, str], Size] = OrderedDict()
+        self._prefixes: OrderedDict[tuple[int, str], tuple[int, ...]] = OrderedDict()
+
+        self._hdc: int | None = None
+        self._selected_font: int | None = None
+
+        self.hits = 0
+        self.misses = 0
+
+    def _dc_with_font(self, h_font: int) -> int:
+        # The memory DC lives as long as the service; the font only changes when
+        # a different one is measured.
+        if self._hdc is None:
+            self._hdc = CreateCompatibleDC(None)
+
+        if h_font != self._selected_font:
+            SelectObject(self._hdc, h_font)
+            self._selected_font = h_font
+
+        return self._hdc
+
+    def measure(self, h_font: int, text: str) -> Size:
+        """Width and height of the text in the font, as GetTextExtentPoint32 reports them."""
+        key = (h_font, text)
+
+        size = self._extents.get(key)
+        if size is not None:
+            self._extents.move_to_end(key)
+            self.hits += 1
+            return size
+
+        self.misses += 1
+        return self._store_extent(key, self._measure_uncached(self._dc_with_font(h_font), text))
+
+    def measure_many(self, h_font: int, texts: Iterable[str]) -> list[Size]:
+        """Measure several strings in one font; the font is selected at most once."""
+        texts = list(texts)
+        extents = self._extents
+        results: list[Size | None] = []
+        missing: list[int] = []
+
+        for text in texts:
+            size = extents.get((h_font, text))
+            if size is None:
+                missing.append(len(results))
+            else:
+                extents.move_to_end((h_font, text))
+            results.append(size)
+
+        self.hits += len(results) - len(missing)
+        self.misses += len(missing)
+
+        if missing:
+            hdc = self._dc_with_font(h_font)
+            for index in missing:
+                text = texts[index]
+                results[index] = self._store_extent((h_font, text), self._measure_uncached(hdc, text))
+
+        return results
+
+    def prefix_widths(self, h_font: int, text: str) -> tuple[int, ...]:
+        """
+        `widths[i]` is the width of `text[:i + 1]`, from one GetTextExtentExPoint call.
+
+        Used for ellipsis and wrapping: the longest prefix that fits a width is a
+        bisection instead of one measurement per candidate length.
+        """
+        key = (h_font, text)
+
+        widths = self._prefixes.get(key)
+        if widths is not None:
+            self._prefixes.move_to_end(key)
+            self.hits += 1
+            return widths
+
+        self.misses += 1
+
+        if not text:
+            widths = ()
+        else:
+            dx = (ctypes.c_int * len(text))()
+            size = wintypes.SIZE()
+            GetTextExtentExPoint(self._dc_with_font(h_font), text, len(text), _NO_LIMIT, None, dx, size)
+            widths = tuple(dx)
+            self._store_extent(key, Size(size.cx, size.cy))
+
+        self._prefixes[key] = widths
+        if len(self._prefixes) > self.max_prefixes:
+            self._prefixes.popitem(last = False)
+
+        return widths
+
+    def fit(self, h_font: int, text: str, max_width: int) -> int:
+        """Number of leading characters of the text that fit in `max_width`."""
+        return bisect.bisect_right(self.prefix_widths(h_font, text), max_width)
+
+    def ellipsize(self, h_font: int, text: str, max_width: int, ellipsis: str = '…') -> str:
+        """The text, shortened with a trailing ellipsis if it is wider than `max_width`."""
+        widths = self.prefix_widths(h_font, text)
+        if not widths or widths[-1] <= max_width:
+            return text
+
+        available = max_width - self.measure(h_font, ellipsis).width
+        if available <= 0:
+            return ''
+
+        return text[:bisect.bisect_right(widths, available)] + ellipsis
+
+    def wrap(self, h_font: int, text: str, max_width: int) -> list[str]:
+        """
+        Split a single line of text into lines no wider than `max_width`, breaking at
+        spaces where possible and inside words that are too long on their own.
+        """
+        widths = self.prefix_widths(h_font, text)
+        lines: list[str] = []
+
+        start, offset = 0, 0
+        while start < len(text):
+            end = bisect.bisect_right(widths, offset + max_width, lo = start)
+            if end >= len(text):
+                lines.append(text[start:])
+                break
+
+            space = text.rfind(' ', start, end + 1)
+            if space > start:
+                lines.append(text[start:space])
+                start = space + 1
+            else:
+                end = max(end, start + 1)
+                lines.append(text[start:end])
+                start = end
+
+            offset = widths[start - 1]
+
+        return lines
+
+    def forget_font(self, h_font: int) -> None:
+        """Drop every cached measurement of a font that is about to be deleted."""
+        for cache in (self._extents, self._prefixes):
+            for key in [key for key in cache if key[0] == h_font]:
+                del cache[key]
+
+        if self._selected_font == h_font and self._hdc is not None:
+            DeleteDC(self._hdc)
+            self._hdc = None
+            self._selected_font = None
+
+    def clear(self) -> None:
+        self._extents.clear()
+        self._prefixes.clear()
+        self.hits = self.misses = 0
+
+    def _store_extent(self, key: tuple[int, str], size: Size) -> Size:
+        self._extents[key] = size
+        if len(self._extents) > self.max_extents:
+            self._extents.popitem(last = False)
+
+        return size
+
+    @staticmethod
+    def _measure_uncached(hdc: int, text: str) -> Size:
+        size = wintypes.SIZE()
+        GetTextExtentPoint32(hdc, text, len(text), size)
+
+        return Size(size.cx, size.cy)
@@ -10,7 +10,7 @@ from pyvda.com_defns import IApplicationView
 
 import win32con
 
-from skeletal_framework.win32_bindings.monitor_info import GetMonitorInfo, MonitorFromPoint
+from skeletal_framework.monitor_registry import MonitorRegistry
 
 
 IN  = 1
@@ -23,17 +23,13 @@ def main():
     if process is not None:
         process.switch_to_this_window()
 
-        monitor = GetMonitorInfo(
-            hMonitor = MonitorFromPoint(
-                x = 0, y = 0
-            )
-        )
+        monitor = MonitorRegistry().from_window(process.hwnd)
 
         width, height = 1040, monitor.height - 40
         process.set_window_pos(
             hwnd_insert_after = 0,
-            x = (monitor.width - width) // 2,
-            y = (monitor.height - height) // 2,
+            x = monitor.left + (monitor.width - width) // 2,
+            y = monitor.top + (monitor.height - height) // 2,
             width = width, height = height,
             flags = win32con.SWP_NOZORDER
         )
@@ -12,7 +12,7 @@ from typing import Any, TYPE_CHECKING
 
 from comtypes.client import CreateObject
 
-from skeletal_framework.win32_bindings.wsh_interfaces import CLSID_WScriptShell, IWshShell3, IWshShortcut
+from skeletal_framework.win32_bindings import wsh_typelib
 
 # --- 1. COM Constants ---
 COINIT_APARTMENTTHREADED = 0x2
@@ -43,12 +43,13 @@ def main():
     script = output_folder / 'hello_world.py'
     script.write_text("print('Hello World')")
 
-    shell = CreateObject(CLSID_WScriptShell, interface = IWshShell3)
+    shell = CreateObject(wsh_typelib.WshShell, interface = wsh_typelib.IWshShell3)
 
     terminal = r'%LocalAppData%\Microsoft\WindowsApps\wt.exe'
     arguments = f'-d "{output_folder}" --title "Command Prompt" cmd.exe /k "{sys.executable}" {script}'
 
-    shortcut: IWshShortcut = shell.CreateShortcut(str(filename))
+    # The type library declares CreateShortcut as returning a plain IDispatch
+    shortcut = shell.CreateShortcut(str(filename)).QueryInterface(wsh_typelib.IWshShortcut)
     shortcut.TargetPath = terminal
     shortcut.Arguments = arguments
     shortcut.WorkingDirectory = str(output_folder)
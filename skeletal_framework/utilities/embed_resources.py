@@ -1,6 +1,44 @@
+"""
+Embeds images for the framework.
+
+The main mode builds a resource pack from a whole directory:
+
+    python -m skeletal_framework.utilities.embed_resources images/ \
+        -o skeletal_framework/resources/resources.pack
+
+Every PNG/ICO file becomes an entry named after the file (`exception_face.png` ->
+`EXCEPTION_FACE`). Files are processed in a process pool, identical contents are
+stored once, and a manifest of sizes, mtimes and content hashes next to the pack
+lets a rebuild reuse the payload of every file that did not change. Alongside the
+pack, a small index module lists the entries, so `skeletal_framework.resources`
+knows its names without opening the pack.
+
+Each PNG also gets a pyramid of downscaled levels, stored as entries named
+`NAME@WxH`: halves down to `MIN_LEVEL_SIDE`, plus the exact sizes the image takes
+when fitted into a square of `--fit-box` pixels (96-DPI) at each of the common
+DPIs. At runtime `resources.nearest_level` picks the smallest level covering a
+requested size, so at most one short resize is left to do.
+
+`encode_image` is the older mode: one generated module of base64 literals per image.
+"""
+import argparse
 import base64
+import hashlib
+import io
+import json
+import re
+import sys
 import textwrap
+import time
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
+from typing import NamedTuple
+
+from skeletal_framework.resource_pack import (
+    PackEntry, PackSource, ResourcePack, level_name, png_dimensions, write_pack
+)
 
 FILE_TEMPLATE = """
 import base64
@@ -50,11 +88,441 @@ def encode_image(image: str, var_name: str, filename: str):
         file.write(final_source_code)
 
 
-if __name__ == '__main__':
-    filename = Path(__file__).parent.parent / 'resources' / 'exception_face.py'
+def pack_images(images: dict[str, str | Path], filename: str | Path, *, compress: bool = False) -> list[PackEntry]:
+    """
+    Write images into a resource pack instead of generated modules; the raw file
+    bytes are stored, so nothing is re-encoded and there is no base64 overhead.
+
+    Args:
+        images: Resource name -> image file
+        filename: The pack to (re)write
+        compress: zlib the payloads; pointless for already compressed formats like PNG.
+    """
+    sources = []
+    for var_name, image in images.items():
+        image = Path(image)
+        sources.append(
+            PackSource(
+                name = var_name,
+                data = image.read_bytes(),
+                format = _file_format(image),
+                compress = compress
+            )
+        )
+
+    return write_pack(filename, sources)
+
+
+MANIFEST_VERSION = 2
+
+DEFAULT_PATTERNS = ('*.png', '*.ico')
+
+# Square boxes (96-DPI pixels) that get exact-fit levels; 125 is the crash dialog header's edge length
+DEFAULT_FIT_BOXES = (125,)
+# 100%, 125%, 150%, 175% and 200% scaling
+FIT_BOX_DPIS = (96, 120, 144, 168, 192)
+# Halving stops before the smaller side drops below this
+MIN_LEVEL_SIDE = 32
+
+INDEX_TEMPLATE = '''
+"""
+Index of {pack_name}, generated by `python -m skeletal_framework.utilities.embed_resources`.
+Do not edit.
+"""
+
+# name: (format, width, height, source file)
+RESOURCES = {{
+{entries}
+}}
+
+# name: (width, height) of each precomputed level, largest first
+LEVELS = {{
+{levels}
+}}
+'''
+
+
+class _Processed(NamedTuple):
+    data: bytes
+    format: str
+    width: int
+    height: int
+    levels: tuple['_Processed', ...] = ()
+
+
+@dataclass(slots = True)
+class EmbedReport:
+    """What an `embed_directory` run did."""
+    entries: list[PackEntry] = field(default_factory = list)
+    processed: list[str] = field(default_factory = list)
+    reused: list[str] = field(default_factory = list)
+    # name -> name of the entry whose content it shares
+    duplicates: dict[str, str] = field(default_factory = dict)
+    seconds: float = 0.0
+
+
+def resource_names(files: list[Path]) -> dict[Path, str]:
+    """
+    Entry names for files: the stem, upper-cased, with anything but letters and digits
+    turned into underscores. Files whose stems collide also get their extension.
+    """
+    def base(file: Path) -> str:
+        return re.sub(r'\W', '_', file.stem).upper()
+
+    counts: dict[str, int] = {}
+    for file in files:
+        counts[base(file)] = counts.get(base(file), 0) + 1
+
+    return {
+        file: base(file) if counts[base(file)] == 1 else f'{base(file)}_{_file_format(file)}'
+        for file in files
+    }
+
+
+def _file_format(file: Path) -> str:
+    return file.suffix.lstrip('.').upper()[:4]
+
+
+def _digest(data: bytes) -> str:
+    return hashlib.blake2b(data, digest_size = 16).hexdigest()
+
+
+def pyramid_sizes(width: int, height: int, fit_boxes: tuple[int, ...] = DEFAULT_FIT_BOXES) -> list[tuple[int, int]]:
+    """
+    Sizes of the levels to precompute for an image, largest first: successive halves
+    while the smaller side stays at least `MIN_LEVEL_SIDE`, and the size the image
+    takes when fitted into each box at each of `FIT_BOX_DPIS`, rounded the way
+    `Header` rounds it. Sizes not smaller than the image are left out.
+    """
+    sizes = set()
+
+    level_width, level_height = width // 2, height // 2
+    while min(level_width, level_height) >= MIN_LEVEL_SIDE:
+        sizes.add((level_width, level_height))
+        level_width, level_height = level_width // 2, level_height // 2
+
+    for box in fit_boxes:
+        for dpi in FIT_BOX_DPIS:
+            # DpiContext.scale
+            edge = (box * dpi + 48) // 96
+            ratio = min(edge / width, edge / height)
+            size = (int(width * ratio), int(height * ratio))
+            if 0 < size[0] < width and 0 < size[1] < height:
+                sizes.add(size)
+
+    return sorted(sizes, reverse = True)
+
+
+def _pyramid(data: bytes, fit_boxes: tuple[int, ...]) -> tuple[_Processed, ...]:
+    """Encoded levels of a PNG, each resampled from the full image."""
+    from PIL import Image
+
+    levels = []
+    with Image.open(io.BytesIO(data)) as image:
+        image.load()
+        for size in pyramid_sizes(image.width, image.height, fit_boxes):
+            output = io.BytesIO()
+            image.resize(size, Image.Resampling.LANCZOS).save(output, format = 'PNG', optimize = True)
+            levels.append(_Processed(output.getvalue(), 'PNG', *size))
+
+    return tuple(levels)
+
+
+def _process_image(
+        path: str,
+        max_size: int | None,
+        recompress: bool,
+        fit_boxes: tuple[int, ...] | None
+) -> tuple[str, _Processed]:
+    """Pool worker: the source digest and the bytes to store for one file; no pyramid if `fit_boxes` is None."""
+    data = Path(path).read_bytes()
+    digest = _digest(data)
+    fmt = _file_format(Path(path))
+
+    # Icons hold several resolutions; they are stored as they are
+    if fmt == 'PNG' and (max_size or recompress):
+        from PIL import Image
+
+        with Image.open(io.BytesIO(data)) as image:
+            if max_size and max(image.size) > max_size:
+                image.thumbnail((max_size, max_size), Image.Resampling.LANCZOS)
+                recompress = True
+
+            if recompress:
+                output = io.BytesIO()
+                image.save(output, format = 'PNG', optimize = True)
+                if output.tell() < len(data) or max_size:
+                    data = output.getvalue()
+
+    levels = ()
+    if fmt == 'PNG':
+        width, height = png_dimensions(data)
+        if fit_boxes is not None:
+            levels = _pyramid(data, fit_boxes)
+    else:
+        from PIL import Image
+
+        # PIL warns about icons whose directory sizes disagree with their images
+        with warnings.catch_warnings(), Image.open(io.BytesIO(data)) as image:
+            warnings.simplefilter('ignore')
+            width, height = image.size
 
-    encode_image(
-        image = r'C:\Users\*********\Python\SkeletalFramework\images\exception_face.png',
-        var_name = 'EXCEPTION_FACE',
-        filename = str(filename)
+    return digest, _Processed(data, fmt, width, height, levels)
+
+
+def _load_manifest(path: Path) -> dict:
+    try:
+        manifest = json.loads(path.read_text(encoding = 'utf-8'))
+    except (OSError, ValueError):
+        return {}
+
+    return manifest if manifest.get('version') == MANIFEST_VERSION else {}
+
+
+def embed_directory(
+        source_dir: str | Path,
+        pack_path: str | Path,
+        *,
+        index_path: str | Path | None = None,
+        manifest_path: str | Path | None = None,
+        patterns: tuple[str, ...] = DEFAULT_PATTERNS,
+        jobs: int | None = None,
+        max_size: int | None = None,
+        recompress: bool = False,
+        compress: bool = False,
+        pyramid: bool = True,
+        fit_boxes: tuple[int, ...] = DEFAULT_FIT_BOXES,
+        force: bool = False
+) -> EmbedReport:
+    """
+    (Re)build a resource pack from every matching file in a directory.
+
+    Args:
+        source_dir: Directory with the images
+        pack_path: The pack to write
+        index_path: Index module to generate; none if omitted
+        manifest_path: Defaults to `<pack>.manifest.json`
+        patterns: Glob patterns of the files to embed
+        jobs: Worker processes; files are processed in-process when only one needs work
+        max_size: Downscale PNGs whose larger side exceeds this
+        recompress: Re-save PNGs with maximum compression, keeping the smaller result
+        compress: zlib the stored payloads
+        pyramid: Store downscaled levels of every PNG
+        fit_boxes: Boxes (96-DPI pixels) whose per-DPI fitted sizes get a level of their own
+        force: Ignore the manifest and reprocess everything
+    """
+    start = time.perf_counter()
+    report = EmbedReport()
+
+    source_dir = Path(source_dir)
+    pack_path = Path(pack_path)
+    manifest_path = Path(manifest_path) if manifest_path else pack_path.with_suffix('.manifest.json')
+
+    files = sorted({file for pattern in patterns for file in source_dir.glob(pattern) if file.is_file()})
+    names = resource_names(files)
+
+    fit_boxes = tuple(fit_boxes) if pyramid else None
+    options = {
+        'max_size': max_size, 'recompress': recompress, 'compress': compress,
+        'fit_boxes': list(fit_boxes) if fit_boxes is not None else None
+    }
+    manifest = {} if force else _load_manifest(manifest_path)
+    previous = manifest.get('files', {}) if manifest.get('options') == options else {}
+
+    old_pack = None
+    if previous and pack_path.exists():
+        try:
+            old_pack = ResourcePack(pack_path)
+        except (OSError, ValueError):
+            previous = {}
+
+    processed: dict[str, tuple[str, _Processed]] = {}
+    to_process: list[Path] = []
+    file_records = {}
+
+    try:
+        for file in files:
+            name = names[file]
+            stat = file.stat()
+            record = previous.get(file.name)
+
+            unchanged = (
+                    record is not None and old_pack is not None and name in old_pack
+                    and record['name'] == name
+                    and record['size'] == stat.st_size and record['mtime_ns'] == stat.st_mtime_ns
+                    and all(level_name(name, *size) in old_pack for size in record['levels'])
+            )
+            if unchanged:
+                entry = old_pack.entry(name)
+                levels = tuple(
+                    _Processed(bytes(old_pack.data(level)), old_pack.entry(level).format, width, height)
+                    for width, height in record['levels']
+                    for level in (level_name(name, width, height),)
+                )
+                processed[name] = record['digest'], _Processed(
+                    bytes(old_pack.data(name)), entry.format, entry.width, entry.height, levels
+                )
+                report.reused.append(name)
+            else:
+                to_process.append(file)
+
+            file_records[file.name] = {'name': name, 'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}
+
+    finally:
+        # The pack is about to be replaced; the payloads were copied out
+        if old_pack is not None:
+            old_pack.close()
+
+    arguments = [(str(file), max_size, recompress, fit_boxes) for file in to_process]
+    if len(to_process) > 1 and jobs != 1:
+        with ProcessPoolExecutor(max_workers = jobs) as pool:
+            results = list(pool.map(_process_image, *zip(*arguments)))
+    else:
+        results = [_process_image(*argument) for argument in arguments]
+
+    for file, result in zip(to_process, results):
+        processed[names[file]] = result
+        report.processed.append(names[file])
+
+    # Identical sources are noted here; write_pack stores their bytes once
+    first_by_digest: dict[str, str] = {}
+    sources = []
+    for file in files:
+        name = names[file]
+        digest, item = processed[name]
+        file_records[file.name]['digest'] = digest
+        file_records[file.name]['levels'] = [(level.width, level.height) for level in item.levels]
+
+        if digest in first_by_digest:
+            report.duplicates[name] = first_by_digest[digest]
+        else:
+            first_by_digest[digest] = name
+
+        sources.append(PackSource(name, item.data, item.format, compress, item.width, item.height))
+        sources.extend(
+            PackSource(level_name(name, level.width, level.height), level.data, level.format, compress, level.width, level.height)
+            for level in item.levels
+        )
+
+    report.entries = write_pack(pack_path, sources)
+
+    if index_path is not None:
+        write_index_module(
+            index_path, pack_path.name, report.entries, {names[file]: file.name for file in files},
+            {names[file]: [(level.width, level.height) for level in processed[names[file]][1].levels] for file in files}
+        )
+
+    manifest_path.write_text(
+        json.dumps({'version': MANIFEST_VERSION, 'options': options, 'files': file_records}, indent = 2),
+        encoding = 'utf-8'
     )
+
+    report.seconds = time.perf_counter() - start
+    return report
+
+
+def write_index_module(
+        filename: str | Path,
+        pack_name: str,
+        entries: list[PackEntry],
+        source_files: dict[str, str],
+        levels: dict[str, list[tuple[int, int]]] | None = None
+) -> None:
+    """
+    Generate the module listing a pack's entries; only rewritten when its content changes.
+    Level entries are listed under their image in `LEVELS` rather than in `RESOURCES`.
+    """
+    levels = levels or {}
+    level_entries = {level_name(name, *size) for name, sizes in levels.items() for size in sizes}
+
+    lines = [
+        f'    {entry.name!r}: ({entry.format!r}, {entry.width}, {entry.height}, {source_files.get(entry.name, "")!r}),'
+        for entry in sorted(entries, key = lambda entry: entry.name)
+        if entry.name not in level_entries
+    ]
+    level_lines = [
+        f'    {name!r}: {tuple(map(tuple, sizes))!r},'
+        for name, sizes in sorted(levels.items())
+        if sizes
+    ]
+    source = textwrap.dedent(INDEX_TEMPLATE).lstrip().format(
+        pack_name = pack_name, entries = '\n'.join(lines), levels = '\n'.join(level_lines)
+    )
+
+    filename = Path(filename)
+    try:
+        if filename.read_text(encoding = 'utf-8') == source:
+            return
+    except OSError:
+        pass
+
+    filename.write_text(source, encoding = 'utf-8')
+
+
+def main(argv: list[str] | None = None) -> int:
+    package_dir = Path(__file__).parent.parent
+
+    parser = argparse.ArgumentParser(
+        prog = 'python -m skeletal_framework.utilities.embed_resources',
+        description = 'Embed a directory of images into a resource pack.'
+    )
+    parser.add_argument(
+        'source', nargs = '?', type = Path, default = package_dir.parent / 'images',
+        help = 'directory with the images (default: %(default)s)'
+    )
+    parser.add_argument(
+        '-o', '--output', type = Path, default = package_dir / 'resources' / 'resources.pack',
+        help = 'pack to write (default: %(default)s)'
+    )
+    parser.add_argument(
+        '--index', type = Path, default = package_dir / 'resources' / '_index.py',
+        help = 'index module to generate (default: %(default)s)'
+    )
+    parser.add_argument('--manifest', type = Path, help = 'manifest file (default: <output>.manifest.json)')
+    parser.add_argument(
+        '-p', '--pattern', action = 'append', dest = 'patterns',
+        help = f'glob of files to embed; repeatable (default: {" ".join(DEFAULT_PATTERNS)})'
+    )
+    parser.add_argument('-j', '--jobs', type = int, help = 'worker processes (default: CPU count)')
+    parser.add_argument('--max-size', type = int, help = 'downscale PNGs larger than this many pixels on a side')
+    parser.add_argument('--recompress', action = 'store_true', help = 're-save PNGs with maximum compression')
+    parser.add_argument('--compress', action = 'store_true', help = 'zlib the stored payloads')
+    parser.add_argument('--no-pyramid', action = 'store_true', help = 'do not store downscaled levels of PNGs')
+    parser.add_argument(
+        '--fit-box', type = int, action = 'append', dest = 'fit_boxes',
+        help = 'square box (96-DPI pixels) to store per-DPI fitted levels for; repeatable '
+               f'(default: {" ".join(map(str, DEFAULT_FIT_BOXES))})'
+    )
+    parser.add_argument('-f', '--force', action = 'store_true', help = 'ignore the manifest and rebuild everything')
+    args = parser.parse_args(argv)
+
+    if not args.source.is_dir():
+        parser.error(f'{args.source} is not a directory')
+
+    report = embed_directory(
+        args.source, args.output,
+        index_path = args.index,
+        manifest_path = args.manifest,
+        patterns = tuple(args.patterns) if args.patterns else DEFAULT_PATTERNS,
+        jobs = args.jobs,
+        max_size = args.max_size,
+        recompress = args.recompress,
+        compress = args.compress,
+        pyramid = not args.no_pyramid,
+        fit_boxes = tuple(args.fit_boxes) if args.fit_boxes else DEFAULT_FIT_BOXES,
+        force = args.force
+    )
+
+    for name, original in report.duplicates.items():
+        print(f'{name}: same content as {original}, stored once')
+
+    print(
+        f'{len(report.entries)} entries -> {args.output} '
+        f'({len(report.processed)} processed, {len(report.reused)} unchanged) '
+        f'in {report.seconds * 1000:.1f} ms'
+    )
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,29 +1,421 @@
-import comtypes.client
-import comtypes.gen
+"""
+Generates Python wrappers for the Windows Script Host type library (wshom.ocx).
+
+    python -m skeletal_framework.utilities.generate_wsh_reference
+    python -m skeletal_framework.utilities.generate_wsh_reference IWshShell3 IWshShortcut WshShell
+    python -m skeletal_framework.utilities.generate_wsh_reference --full
+
+`--full` has comtypes dump the whole library into `generated_bindings/` (Windows
+only); that dump is also the reference for GUIDs, DISPIDs and signatures. It
+covers FileSystemObject, TextStream and everything else in the library, which
+is why nothing imports it at runtime.
+
+By default the requested names are selected from the dump together with what
+they depend on (base interfaces, interfaces and enums in method signatures, the
+interfaces of coclasses) and written to `win32_bindings/wsh_typelib.py`. In that
+module each class is only defined, and its vtable only built, the first time it
+is looked up; enums and constants are plain values.
+"""
+import argparse
+import ast
 import os
-from pathlib import Path
+import re
+import sys
+import textwrap
+from dataclasses import dataclass, field
+from pathlib import Path, PureWindowsPath
+
+PACKAGE_DIR = Path(__file__).parent.parent.absolute()
+
+output_folder = PACKAGE_DIR / 'utilities' / 'generated_bindings'
+
+WSH_DUMP = output_folder / '_F935DC20_1CF0_11D0_ADB9_00C04FD58A0B_0_1_0.py'
+WSH_OUTPUT = PACKAGE_DIR / 'win32_bindings' / 'wsh_typelib.py'
+
+# What `create_shortcut` needs
+DEFAULT_NAMES = ('WshShell', 'IWshShell3', 'IWshShortcut')
+
+# Interfaces that comtypes defines itself; references to them in other generated modules are redirected
+_COMTYPES_BASES = {'IUnknown', 'IDispatch'}
+
+_ENUM_COMMENT = re.compile(r"^# values for enumeration '(\w+)'$")
+
+MODULE_TEMPLATE = '''
+"""
+{description}
+
+Selected from the comtypes wrapper of {library} by
+`python -m skeletal_framework.utilities.generate_wsh_reference`. Do not edit.
+
+Classes are defined, and their vtables built, on first lookup.
+"""
+{imports}
+
+{values}
+
+
+{factories}
+
+
+# name: (define the class, assign its members, classes to load with it, base classes first)
+_CLASSES = {{
+{classes}
+}}
+
+_defined = {{}}
+_completed = set()
+
+
+def _load(name):
+    _, _, closure = _CLASSES[name]
+
+    # Every class first, so members can refer to each other, then the members, bases before subclasses
+    for member in closure:
+        if member not in _defined:
+            _defined[member] = _CLASSES[member][0]()
+
+    for member in closure:
+        if member not in _completed:
+            _completed.add(member)
+            _CLASSES[member][1]()
+
+    return _defined[name]
+
+
+def __getattr__(name):
+    if name not in _CLASSES:
+        raise AttributeError(f'module {{__name__!r}} has no attribute {{name!r}}')
+
+    value = globals()[name] = _load(name)
+    return value
+
+
+__all__ = [
+{all}
+]
+'''
+
+
+def generate_full() -> Path:
+    """Have comtypes write its wrapper of the whole library into `generated_bindings/`."""
+    import comtypes.client
+    import comtypes.gen
+
+    if not output_folder.exists():
+        output_folder.mkdir(parents = True, exist_ok = True)
+
+    init_file = output_folder / "__init__.py"
+    if not init_file.exists():
+        print(f"Creating missing __init__.py in {output_folder}")
+        init_file.open(mode = 'w').close()
+
+    comtypes.gen.__path__ = [str(output_folder)]
+    comtypes.client.gen_dir = str(output_folder)
+
+    wsh_path = Path(os.environ["SystemRoot"]) / "System32" / "wshom.ocx"
+    print(f"Generating Python wrapper for: {wsh_path}")
+    print(f"Output directory set to: {comtypes.client.gen_dir}")
+
+    module = comtypes.client.GetModule(str(wsh_path))
+
+    print(f"\nSuccess! The wrapper file is located here:")
+    print(module.__file__)
+
+    print("\n--- INSTRUCTIONS ---")
+    print("Open that file in your editor.")
+    print("Search for 'IWshShortcut' to see the exact GUIDs, DISPIDs, and method signatures.")
+
+    return Path(module.__file__)
+
+
+@dataclass
+class _Definition:
+    """A top-level name of the dump: a class with its later `Name.attr = ...` statements, or plain assignments."""
+    name: str
+    is_class: bool
+    statements: list[ast.stmt] = field(default_factory = list)
+    members: list[ast.stmt] = field(default_factory = list)
+    base: str | None = None
+
+
+class _Dump:
+    """The parts of a comtypes-generated module that selection needs."""
+
+    def __init__(self, source: str):
+        self.source = source
+        self.lines = source.splitlines()
+        self.tree = ast.parse(source)
+
+        self.imports: list[ast.stmt] = []
+        self.definitions: dict[str, _Definition] = {}
+        self.enums: set[str] = set()
+        self._read()
+
+    def _read(self) -> None:
+        enum_starts = {
+            match.group(1): number
+            for number, line in enumerate(self.lines, start = 1)
+            if (match := _ENUM_COMMENT.match(line))
+        }
+
+        for node in self.tree.body:
+            if isinstance(node, (ast.Import, ast.ImportFrom)):
+                self.imports.append(node)
+
+            elif isinstance(node, ast.ClassDef):
+                base = node.bases[0] if node.bases else None
+                self.definitions[node.name] = _Definition(
+                    node.name, True, [node], base = base.id if isinstance(base, ast.Name) else None
+                )
+
+            elif isinstance(node, ast.Assign) and len(node.targets) == 1:
+                target = node.targets[0]
+
+                # Class.attr = ... (vtables, coclass interfaces); the class precedes it in the dump
+                if isinstance(target, ast.Attribute) and isinstance(target.value, ast.Name):
+                    definition = self.definitions.get(target.value.id)
+                    if definition is not None and definition.is_class:
+                        definition.members.append(node)
+
+                elif isinstance(target, ast.Name) and target.id != '__all__':
+                    self.definitions[target.id] = _Definition(target.id, False, [node])
+
+        # An enum type carries its values along
+        for name, start in enum_starts.items():
+            definition = self.definitions.get(name)
+            if definition is None:
+                continue
+
+            self.enums.add(name)
+            end = definition.statements[0].lineno
+            definition.statements[:0] = [
+                other.statements[0] for other in self.definitions.values()
+                if not other.is_class and other is not definition and start < other.statements[0].lineno < end
+            ]
+
+    def references(self, definition: _Definition) -> set[str]:
+        """Names of other definitions a definition reads, IDE hint blocks aside."""
+        names = set()
+        pending = definition.statements + definition.members
+        while pending:
+            node = pending.pop()
+            if _is_hint_block(node):
+                continue
+
+            if isinstance(node, ast.Name) and isinstance(node.ctx, ast.Load) and node.id in self.definitions:
+                names.add(node.id)
+            pending.extend(ast.iter_child_nodes(node))
+
+        names.discard(definition.name)
+        return names
+
+    def depth(self, name: str) -> int:
+        """Number of base classes that are themselves defined in the dump."""
+        base = self.definitions[name].base
+        return 0 if base not in self.definitions else self.depth(base) + 1
+
+    def segment(self, node: ast.AST, replacements: dict[str, str], drop: list[ast.AST] = ()) -> str:
+        """
+        Source of a node with Name references (and module-qualified comtypes bases)
+        rewritten, keeping the dump's formatting; `drop` lists nested nodes to leave out.
+        """
+        # Column offsets are in UTF-8 bytes
+        lines = [line.encode('utf-8') for line in self.lines[node.lineno - 1:node.end_lineno]]
+        lines[-1] = lines[-1][:node.end_col_offset]
+        lines[0] = lines[0][node.col_offset:]
+        first_column = node.col_offset
+
+        edits = []
+        for child in ast.walk(node):
+            if isinstance(child, ast.Name) and child.id in replacements:
+                edits.append((child, replacements[child.id]))
+
+            elif isinstance(child, ast.Attribute) and child.attr in _COMTYPES_BASES and isinstance(child.value, ast.Attribute):
+                edits.append((child, child.attr))
+
+        for child, text in sorted(edits, key = lambda edit: (edit[0].lineno, edit[0].col_offset), reverse = True):
+            index = child.lineno - node.lineno
+            start = child.col_offset - (first_column if index == 0 else 0)
+            end = child.end_col_offset - (first_column if index == 0 else 0)
+            lines[index] = lines[index][:start] + text.encode('utf-8') + lines[index][end:]
+
+        dropped = {
+            number for child in drop
+            for number in range(child.lineno - node.lineno, child.end_lineno - node.lineno + 1)
+        }
+        kept = [line.decode('utf-8') for index, line in enumerate(lines) if index not in dropped]
+
+        return '\n'.join(kept).rstrip()
+
+
+def _is_hint_block(node: ast.AST) -> bool:
+    return isinstance(node, ast.If) and isinstance(node.test, ast.Name) and node.test.id == 'TYPE_CHECKING'
+
+
+def select(dump: _Dump, names: list[str]) -> tuple[list[str], list[str]]:
+    """
+    The definitions needed for `names`: (classes, values), each in dump order.
+
+    Raises:
+        KeyError: A name is not defined in the dump.
+    """
+    missing = [name for name in names if name not in dump.definitions]
+    if missing:
+        raise KeyError(f'not in the type library: {", ".join(missing)}')
+
+    selected = set()
+    pending = list(names)
+    while pending:
+        name = pending.pop()
+        if name not in selected:
+            selected.add(name)
+            pending.extend(dump.references(dump.definitions[name]) - selected)
+
+    order = list(dump.definitions)
+    classes = sorted((name for name in selected if dump.definitions[name].is_class), key = order.index)
+    values = sorted((name for name in selected if not dump.definitions[name].is_class), key = order.index)
+
+    return classes, values
+
+
+def _closure(dump: _Dump, name: str, classes: set[str]) -> list[str]:
+    """Classes to load together with `name`, base classes first."""
+    closure = set()
+    pending = [name]
+    while pending:
+        current = pending.pop()
+        if current not in closure:
+            closure.add(current)
+            pending.extend((dump.references(dump.definitions[current]) & classes) - closure)
+
+    return sorted(closure, key = lambda member: (dump.depth(member), member))
+
+
+def render(dump: _Dump, names: list[str], library: str) -> str:
+    """The source of the slim, lazily loading module for `names`."""
+    classes, values = select(dump, names)
+    class_set = set(classes)
+
+    # Inside the factories, other classes are looked up in the loader's table
+    replacements = {name: f'_defined[{name!r}]' for name in classes}
+
+    imports = []
+    for node in dump.imports:
+        if isinstance(node, ast.ImportFrom) and node.module not in (None, 'typing'):
+            kept = [alias for alias in node.names if alias.name != '_check_version']
+            if kept:
+                imports.append(ast.unparse(ast.ImportFrom(node.module, kept, node.level)))
+
+    # An enum value may also have been selected on its own; each statement is emitted once
+    value_statements = []
+    value_sources = []
+    emitted = set()
+    for name in values:
+        statements = [statement for statement in dump.definitions[name].statements if id(statement) not in emitted]
+        if not statements:
+            continue
+
+        emitted.update(map(id, statements))
+        value_statements.extend(statements)
+
+        source = '\n'.join(dump.segment(statement, {}) for statement in statements)
+        if name in dump.enums:
+            source = f"\n# values for enumeration {name!r}\n{source}"
+        value_sources.append(source)
+
+    factories = []
+    class_entries = []
+    for name in classes:
+        definition = dump.definitions[name]
+        class_node = definition.statements[0]
+
+        # IDE hints of the dump; they would be invisible inside a factory anyway
+        hints = [node for node in class_node.body if _is_hint_block(node)]
+        class_source = dump.segment(class_node, replacements, hints)
+        factories.append(
+            f'def _define_{name}():\n{textwrap.indent(class_source, "    ")}\n    return {name}\n'
+        )
+
+        if definition.members:
+            members = '\n'.join(dump.segment(member, replacements) for member in definition.members)
+            factories.append(f'def _members_{name}():\n{textwrap.indent(members, "    ")}\n')
+            members_function = f'_members_{name}'
+        else:
+            members_function = '_no_members'
+
+        closure = _closure(dump, name, class_set)
+        class_entries.append(f'    {name!r}: (_define_{name}, {members_function}, {tuple(closure)!r}),')
+
+    factories.append('def _no_members():\n    pass\n')
+
+    exported = classes + [
+        statement.targets[0].id for statement in value_statements
+        if not statement.targets[0].id.startswith('_')
+    ]
+
+    description = f'{", ".join(names)} and their dependencies'
+    source = textwrap.dedent(MODULE_TEMPLATE).lstrip().format(
+        description = description,
+        library = library,
+        imports = '\n'.join(imports),
+        values = '\n'.join(value_sources),
+        factories = '\n\n'.join(factories).rstrip(),
+        classes = '\n'.join(class_entries),
+        all = '\n'.join(f'    {name!r},' for name in exported)
+    )
+
+    return source
+
+
+def generate_selected(
+        names: list[str],
+        dump_path: str | Path = WSH_DUMP,
+        output: str | Path = WSH_OUTPUT
+) -> Path:
+    """Write the slim module for `names`, selected from a comtypes dump."""
+    dump_path = Path(dump_path)
+    dump = _Dump(dump_path.read_text(encoding = 'mbcs' if sys.platform == 'win32' else 'utf-8'))
+
+    library_path = next(
+        (
+            ast.literal_eval(node.value) for node in dump.tree.body
+            if isinstance(node, ast.Assign) and isinstance(node.targets[0], ast.Name)
+            and node.targets[0].id == 'typelib_path'
+        ),
+        dump_path.name
+    )
+
+    output = Path(output)
+    output.write_text(render(dump, names, PureWindowsPath(library_path).name), encoding = 'utf-8')
+    return output
 
-output_folder = Path(__file__).parent.absolute() / 'generated_bindings'
-if not output_folder.exists():
-    output_folder.mkdir(parents = True, exist_ok = True)
 
-init_file = output_folder / "__init__.py"
-if not init_file.exists():
-    print(f"Creating missing __init__.py in {output_folder}")
-    init_file.open(mode = 'w').close()
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog = 'python -m skeletal_framework.utilities.generate_wsh_reference',
+        description = 'Generate wrappers for the WSH type library.'
+    )
+    parser.add_argument(
+        'names', nargs = '*', default = list(DEFAULT_NAMES),
+        help = f'interfaces, coclasses or enums to include (default: {" ".join(DEFAULT_NAMES)})'
+    )
+    parser.add_argument('--full', action = 'store_true', help = 'regenerate the full comtypes dump first (Windows only)')
+    parser.add_argument('--dump', type = Path, default = WSH_DUMP, help = 'comtypes dump to select from (default: %(default)s)')
+    parser.add_argument('-o', '--output', type = Path, default = WSH_OUTPUT, help = 'module to write (default: %(default)s)')
+    args = parser.parse_args(argv)
 
-comtypes.gen.__path__ = [str(output_folder)]
-comtypes.client.gen_dir = str(output_folder)
+    dump_path = generate_full() if args.full else args.dump
+    if not dump_path.exists():
+        parser.error(f'{dump_path} does not exist; run with --full on Windows to create it')
 
-wsh_path = Path(os.environ["SystemRoot"]) / "System32" / "wshom.ocx"
-print(f"Generating Python wrapper for: {wsh_path}")
-print(f"Output directory set to: {comtypes.client.gen_dir}")
+    try:
+        output = generate_selected(args.names, dump_path, args.output)
+    except KeyError as error:
+        parser.error(error.args[0])
 
-module = comtypes.client.GetModule(str(wsh_path))
+    print(f'{", ".join(args.names)} -> {output}')
+    return 0
 
-print(f"\nSuccess! The wrapper file is located here:")
-print(module.__file__)
 
-print("\n--- INSTRUCTIONS ---")
-print("Open that file in your editor.")
-print("Search for 'IWshShortcut' to see the exact GUIDs, DISPIDs, and method signatures.")
+if __name__ == '__main__':
+    sys.exit(main())
@@ -15,7 +15,7 @@ __all__ = [
     'CreatePen', 'CreateRoundRectRgn', 'CreateSolidBrush',
     'DeleteDC', 'DeleteObject',
     'Ellipse', 'ExtTextOut',
-    'GetObjectType', 'GetStockObject', 'GetTextExtentPoint32',
+    'GetObjectType', 'GetStockObject', 'GetTextExtentExPoint', 'GetTextExtentPoint32',
     'FrameRgn',
     'LineTo',
     'MoveToEx',
@@ -605,6 +605,56 @@ def GetTextExtentPoint32(hdc: int, lpString: str, c: int, psizl: wintypes.SIZE)
     return GetTextExtentPoint32W(hdc, lpString, c, psizl)
 
 
+# https://learn.microsoft.com/en-us/windows/win32/api/wingdi/nf-wingdi-gettextextentexpointw
+# BOOL GetTextExtentExPointW(
+#   [in]  HDC     hdc,
+#   [in]  LPCWSTR lpszString,
+#   [in]  int     cchString,
+#   [in]  int     nMaxExtent,
+#   [out] LPINT   lpnFit,
+#   [out] LPINT   lpnDx,
+#   [out] LPSIZE  lpSize
+# );
+_GetTextExtentExPointW = ctypes.WINFUNCTYPE(
+    wintypes.BOOL,
+    wintypes.HDC,
+    wintypes.LPCWSTR,
+    ctypes.c_int,
+    ctypes.c_int,
+    ctypes.POINTER(ctypes.c_int),
+    ctypes.POINTER(ctypes.c_int),
+    wintypes.LPSIZE
+)(
+    ('GetTextExtentExPointW', GDI32),
+    (
+        (IN, "hdc"),
+        (IN, "lpszString"),
+        (IN, "cchString"),
+        (IN, "nMaxExtent"),
+        (IN, "lpnFit"),
+        (IN, "lpnDx"),
+        (IN, "lpSize"),
+    )
+)
+_GetTextExtentExPointW.errcheck = errcheck_bool
+
+
+def GetTextExtentExPoint(
+        hdc: int,
+        lpszString: str,
+        cchString: int,
+        nMaxExtent: int,
+        lpnFit: ctypes.c_int | None,
+        lpnDx: ctypes.Array | None,
+        lpSize: wintypes.SIZE
+) -> bool:
+    """
+    The out-parameters are passed in by the caller: `lpnFit` as a `c_int` (or None),
+    `lpnDx` as a `c_int` array of at least `cchString` elements (or None).
+    """
+    return _GetTextExtentExPointW(hdc, lpszString, cchString, nMaxExtent, lpnFit, lpnDx, lpSize)
+
+
 # https://learn.microsoft.com/en-us/windows/win32/api/wingdi/nf-wingdi-exttextoutw
 # BOOL ExtTextOutW(
 #   [in] HDC        hdc,
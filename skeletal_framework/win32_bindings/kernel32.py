@@ -5,13 +5,17 @@ from skeletal_framework.win32_bindings.errcheck import call_with_last_error_chec
 
 __all__ = [
     'GetConsoleWindow',
-    'GetModuleHandle'
+    'GetModuleHandle',
+    'GlobalAlloc', 'GlobalFree', 'GlobalLock', 'GlobalUnlock',
+    'GMEM_MOVEABLE'
 ]
 
 IN = 1
 OUT = 2
 INOUT = 3
 
+GMEM_MOVEABLE = 0x0002
+
 kernel32 = ctypes.WinDLL('kernel32', use_last_error=True)
 
 # https://learn.microsoft.com/en-us/windows/win32/api/libloaderapi/nf-libloaderapi-getmodulehandlew
@@ -47,3 +51,101 @@ def GetModuleHandle(lpModuleName: str | None) -> int:
              If the function fails, the return value is NULL.
     """
     return call_with_last_error_check(GetModuleHandleW, lpModuleName)
+
+
+# https://learn.microsoft.com/en-us/windows/win32/api/winbase/nf-winbase-globalalloc
+# HGLOBAL GlobalAlloc(
+#   [in] UINT   uFlags,
+#   [in] SIZE_T dwBytes
+# );
+_GlobalAlloc = ctypes.WINFUNCTYPE(
+    wintypes.HGLOBAL,
+    wintypes.UINT,
+    ctypes.c_size_t
+)(
+    ('GlobalAlloc', kernel32),
+    (
+        (IN, "uFlags"),
+        (IN, "dwBytes"),
+    )
+)
+
+
+def GlobalAlloc(uFlags: int, dwBytes: int) -> int:
+    """
+    Allocates bytes from the heap, e.g. GMEM_MOVEABLE memory for the clipboard.
+
+    Raises:
+        OSError: If the memory could not be allocated.
+    """
+    handle = _GlobalAlloc(uFlags, dwBytes)
+    if not handle:
+        raise ctypes.WinError(ctypes.get_last_error())
+    return handle
+
+
+# https://learn.microsoft.com/en-us/windows/win32/api/winbase/nf-winbase-globalfree
+# HGLOBAL GlobalFree(
+#   [in] HGLOBAL hMem
+# );
+_GlobalFree = ctypes.WINFUNCTYPE(
+    wintypes.HGLOBAL,
+    wintypes.HGLOBAL
+)(
+    ('GlobalFree', kernel32),
+    (
+        (IN, "hMem"),
+    )
+)
+
+
+def GlobalFree(hMem: int) -> None:
+    _GlobalFree(hMem)
+
+
+# https://learn.microsoft.com/en-us/windows/win32/api/winbase/nf-winbase-globallock
+# LPVOID GlobalLock(
+#   [in] HGLOBAL hMem
+# );
+_GlobalLock = ctypes.WINFUNCTYPE(
+    wintypes.LPVOID,
+    wintypes.HGLOBAL
+)(
+    ('GlobalLock', kernel32),
+    (
+        (IN, "hMem"),
+    )
+)
+
+
+def GlobalLock(hMem: int) -> int:
+    """
+    Locks a global memory object and returns the address of its first byte.
+
+    Raises:
+        OSError: If the object could not be locked.
+    """
+    address = _GlobalLock(hMem)
+    if not address:
+        raise ctypes.WinError(ctypes.get_last_error())
+    return address
+
+
+# https://learn.microsoft.com/en-us/windows/win32/api/winbase/nf-winbase-globalunlock
+# BOOL GlobalUnlock(
+#   [in] HGLOBAL hMem
+# );
+_GlobalUnlock = ctypes.WINFUNCTYPE(
+    wintypes.BOOL,
+    wintypes.HGLOBAL
+)(
+    ('GlobalUnlock', kernel32),
+    (
+        (IN, "hMem"),
+    )
+)
+
+
+def GlobalUnlock(hMem: int) -> bool:
+    """True while the object is still locked by other callers; False once it is fully unlocked."""
+    return bool(_GlobalUnlock(hMem))
@@ -7,12 +7,12 @@ monitor properties such as position, dimensions, and work area.
 """
 import collections.abc
 import ctypes
-from abc import ABC, abstractmethod
+from abc import abstractmethod
 from ctypes import wintypes
 from collections.abc import Callable
-from typing import (Any, Dict, Generic, Iterator, Literal, Mapping, Optional, Sequence, SupportsIndex, Tuple, TypeVar, Union, overload)
+from typing import (Any, Dict, Generic, Iterator, Literal, Mapping, NamedTuple, Optional, Sequence, SupportsIndex, Tuple, TypeVar, Union, overload)
 
-__all__ = ['GetMonitorInfo', 'MonitorFromPoint', 'EnumDisplayMonitors', 'MonitorInfo']
+__all__ = ['GetMonitorInfo', 'MonitorFromPoint', 'EnumDisplayMonitors', 'MonitorInfo', 'MonitorSnapshot']
 
 IN = 1
 OUT = 2
@@ -22,6 +22,7 @@ MONITOR_DEFAULTTOPRIMARY = 0x00000001
 MONITOR_DEFAULTTONEAREST = 0x00000002
 MONITOR_ANONYMOUS = 0x00000004
 MONITOR_DEFAULT = MONITOR_DEFAULTTONULL | MONITOR_DEFAULTTOPRIMARY
+MONITORINFOF_PRIMARY = 0x00000001
 CCHDEVICENAME = 32
 
 T = TypeVar('T')
@@ -29,61 +30,60 @@ K = TypeVar('K', bound = Union[str, int])
 V = TypeVar('V')
 
 
-class RectangleSequence(collections.abc.Sequence[int], ABC):
+_tuple_getitem = tuple.__getitem__
+
+
+class RectangleSequence(tuple):
     """
     Base class for rectangle-like sequence objects.
 
-    Provides common functionality for both Workspace and other rectangle-based
-    sequence types, implementing the Sequence protocol with proper slicing
-    support, equality testing, and pattern matching.
+    An immutable (left, top, right, bottom) tuple. Iteration, unpacking, `len`
+    and hashing are the C implementations of `tuple`, so nothing is allocated
+    when a rectangle is unpacked, and comparing with another tuple stays in C.
+    Other sequences, such as a `[left, top, right, bottom]` list, compare
+    equal by their items. Subclasses only add
+    named accessors and helpers. Slicing returns a `SlicedRectangle` to keep
+    the type consistent for comparisons, and `match` / `case` patterns can
+    use either positional sub-patterns or the coordinate names.
     """
 
+    __slots__ = ()
+    __match_args__ = ('left', 'top', 'right', 'bottom')
+
+    def __new__(cls, left: int = 0, top: int = 0, right: int = 0, bottom: int = 0):
+        return tuple.__new__(cls, (left, top, right, bottom))
+
     @property
-    @abstractmethod
     def left(self) -> int:
         """X-coordinate of the left edge"""
-        pass
+        return _tuple_getitem(self, 0)
 
     @property
-    @abstractmethod
     def top(self) -> int:
         """Y-coordinate of the top edge"""
-        pass
+        return _tuple_getitem(self, 1)
 
     @property
-    @abstractmethod
     def right(self) -> int:
         """X-coordinate of the right edge"""
-        pass
+        return _tuple_getitem(self, 2)
 
     @property
-    @abstractmethod
     def bottom(self) -> int:
         """Y-coordinate of the bottom edge"""
-        pass
+        return _tuple_getitem(self, 3)
 
     @property
     def width(self) -> int:
         """Width of the rectangle in pixels"""
-        return self.right - self.left
+        left, _, right, _ = self
+        return right - left
 
     @property
     def height(self) -> int:
         """Height of the rectangle in pixels"""
-        return self.bottom - self.top
-
-    @property
-    def _data(self) -> Tuple[int, int, int, int]:
-        """Internal tuple representation of the rectangle coordinates"""
-        return self.left, self.top, self.right, self.bottom
-
-    def __iter__(self) -> Iterator[int]:
-        """Returns iterator over rectangle coordinates (left, top, right, bottom)"""
-        return iter(self._data)
-
-    def __len__(self) -> int:
-        """Returns number of coordinates (always 4 for a rectangle)"""
-        return 4
+        _, top, _, bottom = self
+        return bottom - top
 
     @overload
     def __getitem__(self, index: SupportsIndex) -> int:
@@ -98,7 +98,7 @@ class RectangleSequence(collections.abc.Sequence[int], ABC):
         Get item or slice from the sequence.
 
         When a slice is used (e.g., x[:2]), this returns a new RectangleSequence
-        instead of a plain sequence, keeping the type consistent for comparisons.
+        instead of a plain tuple, keeping the type consistent for comparisons.
 
         Args:
             index: Integer index or slice
@@ -109,12 +109,10 @@ class RectangleSequence(collections.abc.Sequence[int], ABC):
         Raises:
             IndexError: If index is out of range
         """
-        if isinstance(index, slice):
-            # For a slice, create a SlicedRectangle with the sliced values
-            return SlicedRectangle(self._data[index])
-        else:
-            # For single item access, return the raw item
-            return self._data[index]
+        if index.__class__ is slice:
+            return SlicedRectangle(_tuple_getitem(self, index))
+
+        return _tuple_getitem(self, index)
 
     def __eq__(self, other: Any) -> bool:
         """
@@ -126,19 +124,20 @@ class RectangleSequence(collections.abc.Sequence[int], ABC):
         Returns:
             True if the coordinates match, False otherwise
         """
-        if isinstance(other, RectangleSequence):
-            return self._data == other._data
+        if isinstance(other, tuple):
+            return tuple.__eq__(self, other)
         elif isinstance(other, collections.abc.Sequence):
-            return self._data == tuple(other)
+            return tuple.__eq__(self, tuple(other))
         return NotImplemented
 
-    def __match_args__(self) -> tuple:
-        """Support for pattern matching with match/case"""
-        return self._data
+    def __ne__(self, other: Any) -> bool:
+        result = self.__eq__(other)
+        return result if result is NotImplemented else not result
 
-    def __str__(self) -> str:
-        """String representation of rectangle coordinates"""
-        return str(self._data)
+    # Defining __eq__ would otherwise make instances unhashable
+    __hash__ = tuple.__hash__
+
+    __str__ = tuple.__repr__
 
     def as_dict(self) -> Dict[str, int]:
         """
@@ -147,11 +146,12 @@ class RectangleSequence(collections.abc.Sequence[int], ABC):
         Returns:
             Dict with keys 'left', 'top', 'right', 'bottom'
         """
+        left, top, right, bottom = self
         return {
-            'left'  : self.left,
-            'top'   : self.top,
-            'right' : self.right,
-            'bottom': self.bottom
+            'left'  : left,
+            'top'   : top,
+            'right' : right,
+            'bottom': bottom
         }
 
     @property
@@ -162,9 +162,10 @@ class RectangleSequence(collections.abc.Sequence[int], ABC):
         Returns:
             (x, y) coordinates of the center
         """
+        left, top, right, bottom = self
         return (
-            self.left + (self.width // 2),
-            self.top + (self.height // 2)
+            left + ((right - left) // 2),
+            top + ((bottom - top) // 2)
         )
 
 
@@ -176,7 +177,9 @@ class SlicedRectangle(RectangleSequence):
     while maintaining the same interface for consistency.
     """
 
-    def __init__(self, data: Sequence[int]):
+    __slots__ = ()
+
+    def __new__(cls, data: Sequence[int]):
         """
         Initialize with coordinate data.
 
@@ -184,42 +187,20 @@ class SlicedRectangle(RectangleSequence):
             data: Sequence of coordinate values (may be incomplete if sliced)
         """
         # Pad with zeros to ensure we have 4 values
-        self._rect_data = tuple(list(data) + [0] * (4 - len(data)))[:4]
-
-    @property
-    def left(self) -> int:
-        return self._rect_data[0]
-
-    @property
-    def top(self) -> int:
-        return self._rect_data[1]
-
-    @property
-    def right(self) -> int:
-        return self._rect_data[2]
-
-    @property
-    def bottom(self) -> int:
-        return self._rect_data[3]
+        return tuple.__new__(cls, (*data, 0, 0, 0, 0)[:4])
 
     def __repr__(self) -> str:
-        return f"SlicedRectangle(left={self.left}, top={self.top}, right={self.right}, bottom={self.bottom})"
+        left, top, right, bottom = self
+        return f"SlicedRectangle(left={left}, top={top}, right={right}, bottom={bottom})"
 
 
 class Workspace(RectangleSequence):
     """
     Represents a monitor's workspace area (visible area excluding taskbar and other UI elements).
 
-    Implements the Sequence protocol to allow tuple-like operations. The sequence contains
-    four elements representing the workspace coordinates: (left, top, right, bottom).
-    Windows RECT structure defines the rectangular area with coordinates relative to the screen origin.
-
-    Attributes:
-        _workspace (wintypes.RECT): Windows RECT structure containing workspace coordinates
-            - left: x-coordinate of upper-left corner
-            - top: y-coordinate of upper-left corner
-            - right: x-coordinate of lower-right corner
-            - bottom: y-coordinate of the lower right corner
+    An immutable tuple of the four workspace coordinates: (left, top, right, bottom).
+    The coordinates are copied out of the Windows RECT structure on construction, relative
+    to the screen origin.
 
     Properties:
         left (int): Left coordinate (x-coordinate of the upper-left corner)
@@ -230,38 +211,24 @@ class Workspace(RectangleSequence):
         height (int): Height of workspace (bottom - top)
     """
 
-    def __init__(self, workspace: wintypes.RECT):
+    __slots__ = ()
+
+    def __new__(cls, workspace: Union[wintypes.RECT, Sequence[int]]):
         """
-        Initialize with a Windows RECT structure.
+        Initialize with a Windows RECT structure or a (left, top, right, bottom) sequence.
 
         Args:
             workspace: Windows RECT structure defining the workspace area
         """
-        self._workspace = workspace
-
-    @property
-    def left(self) -> int:
-        """X-coordinate of the workspace's left edge"""
-        return self._workspace.left
-
-    @property
-    def top(self) -> int:
-        """Y-coordinate of the workspace's top edge"""
-        return self._workspace.top
-
-    @property
-    def right(self) -> int:
-        """X-coordinate of the workspace's right edge"""
-        return self._workspace.right
-
-    @property
-    def bottom(self) -> int:
-        """Y-coordinate of the workspace's bottom edge"""
-        return self._workspace.bottom
+        try:
+            return tuple.__new__(cls, (workspace.left, workspace.top, workspace.right, workspace.bottom))
+        except AttributeError:
+            return tuple.__new__(cls, workspace)
 
     def __repr__(self) -> str:
         """Returns detailed string representation of workspace coordinates"""
-        return f"Workspace(left={self.left}, top={self.top}, right={self.right}, bottom={self.bottom})"
+        left, top, right, bottom = self
+        return f"Workspace(left={left}, top={top}, right={right}, bottom={bottom})"
 
     def contains_point(self, x: int, y: int) -> bool:
         """
@@ -274,10 +241,8 @@ class Workspace(RectangleSequence):
         Returns:
             True if the point is within the workspace boundaries
         """
-        return (
-                self.left <= x < self.right and
-                self.top <= y < self.bottom
-        )
+        left, top, right, bottom = self
+        return left <= x < right and top <= y < bottom
 
     def intersects(self, other: RectangleSequence) -> bool:
         """
@@ -289,11 +254,13 @@ class Workspace(RectangleSequence):
         Returns:
             True if the rectangles intersect
         """
+        left, top, right, bottom = self
+        other_left, other_top, other_right, other_bottom = other
         return not (
-                self.right <= other.left or
-                self.left >= other.right or
-                self.bottom <= other.top or
-                self.top >= other.bottom
+                right <= other_left or
+                left >= other_right or
+                bottom <= other_top or
+                top >= other_bottom
         )
 
 
@@ -386,6 +353,12 @@ class MonitorInfo(ctypes.Structure, PropertyAccessMixin[Union[str, int], Any], m
         'isPrimary', 'isAnonymous', 'center'
     ]
 
+    _string_properties = frozenset({
+        'Monitor', 'Work', 'Workspace', 'Flags', 'Device',
+        'left', 'top', 'right', 'bottom', 'width', 'height',
+        'isPrimary', 'isAnonymous', 'center'
+    })
+
     def __init__(self, *args, **kwargs) -> None:
         """Initialize monitor structure and set required size field"""
         ctypes.Structure.__init__(self, *args, **kwargs)
@@ -394,11 +367,6 @@ class MonitorInfo(ctypes.Structure, PropertyAccessMixin[Union[str, int], Any], m
         self._monitor_tuple = None
         self._workspace_obj = None
         self._monitor_rect = None
-        self._string_properties = {
-            'Monitor', 'Work', 'Workspace', 'Flags', 'Device',
-            'left', 'top', 'right', 'bottom', 'width', 'height',
-            'isPrimary', 'isAnonymous', 'center'
-        }
 
     @property
     def Monitor(self) -> Tuple[int, int, int, int]:
@@ -642,7 +610,7 @@ class MonitorInfo(ctypes.Structure, PropertyAccessMixin[Union[str, int], Any], m
         if isinstance(other, MonitorInfo):
             return self.Monitor == other.Monitor
         elif isinstance(other, collections.abc.Sequence):
-            return self.Monitor == other
+            return self.Monitor == tuple(other)
         return NotImplemented
 
     def __repr__(self) -> str:
@@ -655,6 +623,100 @@ class MonitorInfo(ctypes.Structure, PropertyAccessMixin[Union[str, int], Any], m
         return self.Monitor
 
 
+class MonitorSnapshot(NamedTuple):
+    r"""
+    Compact, immutable copy of a monitor's MONITORINFO.
+
+    A `MonitorInfo` is a live ctypes structure that also carries a property cache and
+    lazily built `Workspace` / `SlicedRectangle` wrappers. A snapshot is a plain tuple
+    (no per-instance dict), so it is cheap to keep hundreds of them around, hash them,
+    compare them and unpack them. It exposes the same read-only properties that the
+    rest of the framework uses on `MonitorInfo`.
+
+    Fields:
+        left, top, right, bottom: Monitor rectangle in virtual-screen coordinates
+        work_left, work_top, work_right, work_bottom: Work area (excluding the taskbar)
+        flags: MONITORINFO.dwFlags
+        device: Display device name (e.g. r'\\.\DISPLAY1')
+        handle: The HMONITOR the snapshot was taken from
+    """
+    left: int
+    top: int
+    right: int
+    bottom: int
+    work_left: int
+    work_top: int
+    work_right: int
+    work_bottom: int
+    flags: int
+    device: str
+    handle: int = 0
+
+    @classmethod
+    def from_monitor_info(cls, info: MonitorInfo, handle: int = 0) -> 'MonitorSnapshot':
+        monitor, work = info.rcMonitor, info.rcWork
+        return cls(
+            monitor.left, monitor.top, monitor.right, monitor.bottom,
+            work.left, work.top, work.right, work.bottom,
+            info.dwFlags, info.Device, handle or 0
+        )
+
+    @property
+    def Monitor(self) -> Tuple[int, int, int, int]:
+        """Monitor's complete screen area coordinates"""
+        return self[0:4]
+
+    @property
+    def Work(self) -> Tuple[int, int, int, int]:
+        """Work area coordinates"""
+        return self[4:8]
+
+    @property
+    def Workspace(self) -> 'Workspace':
+        """Usable work area excluding taskbar and other UI elements"""
+        return Workspace(self[4:8])
+
+    @property
+    def Flags(self) -> int:
+        return self.flags
+
+    @property
+    def Device(self) -> str:
+        return self.device
+
+    @property
+    def width(self) -> int:
+        """Monitor width in pixels"""
+        return self.right - self.left
+
+    @property
+    def height(self) -> int:
+        """Monitor height in pixels"""
+        return self.bottom - self.top
+
+    @property
+    def isPrimary(self) -> bool:
+        """Whether this is the primary monitor"""
+        return bool(self.flags & MONITORINFOF_PRIMARY)
+
+    @property
+    def isAnonymous(self) -> bool:
+        """Whether this monitor has no EDID data"""
+        return bool(self.flags & MONITOR_ANONYMOUS)
+
+    @property
+    def center(self) -> Tuple[int, int]:
+        """Center coordinates of the monitor"""
+        return (
+            self.left + (self.width // 2),
+            self.top + (self.height // 2)
+        )
+
+    def contains_point(self, x: int, y: int) -> bool:
+        """True if the point is within this monitor's area"""
+        return self.left <= x < self.right and self.top <= y < self.bottom
+
+
 # https://learn.microsoft.com/en-us/windows/win32/api/winuser/nf-winuser-monitorfrompoint
 # HMONITOR MonitorFromPoint(
 #   [in] POINT pt,
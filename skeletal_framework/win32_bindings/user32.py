@@ -8,6 +8,7 @@ For comprehensive documentation on the Windows User API, refer to:
 https://learn.microsoft.com/en-us/windows/win32/api/winuser/
 """
 import ctypes
+import functools
 from ctypes import wintypes
 from collections.abc import Callable
 from typing import Any, TYPE_CHECKING
@@ -17,21 +18,22 @@ from skeletal_framework.win32_bindings.errcheck import errcheck_bool, errcheck_z
 # noinspection DuplicatedCode
 __all__ = [
     'AppendMenu',
-    'BeginPaint',
-    'CallWindowProc', 'CreateMenu', 'CreateWindowEx',
-    'DefWindowProc', 'DestroyIcon', 'DestroyWindow', 'DispatchMessage', 'DrawFocusRect', 'DrawFrameControl', 'DrawText',
-    'EnableMenuItem', 'EnableWindow', 'EndPaint',
+    'BeginDeferWindowPos', 'BeginPaint',
+    'CallWindowProc', 'CloseClipboard', 'CreateMenu', 'CreateWindowEx',
+    'DefWindowProc', 'DeferWindowPos', 'DestroyIcon', 'DestroyWindow', 'DispatchMessage', 'DrawFocusRect', 'DrawFrameControl', 'DrawText',
+    'EmptyClipboard', 'EnableMenuItem', 'EnableWindow', 'EndDeferWindowPos', 'EndPaint',
     'FillRect', 'FrameRect',
-    'GetClientRect', 'GetCursorPos', 'GetDC', 'GetMessage', 'GetScrollInfo', 'GetSysColor', 'GetSysColorBrush',
-    'GetSystemMetrics', 'GetWindowLong', 'GetWindowRect', 'GetWindowText', 'GetWindowThreadProcessId',
+    'GetClientRect', 'GetCursorPos', 'GetDC', 'GetDpiForSystem', 'GetDpiForWindow', 'GetKeyState', 'GetMessage', 'GetParent', 'GetScrollInfo', 'GetSysColor', 'GetSysColorBrush',
+    'GetSystemMetrics', 'GetSystemMetricsForDpi', 'GetWindowLong', 'GetWindowRect', 'GetWindowText', 'GetWindowThreadProcessId',
     'HideCaret',
     'InvalidateRect', 'IsDialogMessage', 'IsWindowEnabled',
     'KillTimer',
     'LoadCursor', 'LoadIcon', 'LoadImage',
     'MapWindowPoints', 'MessageBox', 'MoveWindow',
+    'OpenClipboard',
     'PostMessage', 'PostQuitMessage', 'PtInRect',
     'RedrawWindow', 'RegisterClass', 'RegisterClassEx', 'ReleaseCapture', 'ReleaseDC',
-    'ScreenToClient', 'SetActiveWindow', 'SetCapture', 'SetFocus', 'SetProcessDPIAware', 'SetScrollInfo',
+    'ScreenToClient', 'SetActiveWindow', 'SetCapture', 'SetClipboardData', 'SetFocus', 'SetProcessDPIAware', 'SetProcessDpiAwarenessContext', 'SetScrollInfo',
     'SetTimer', 'SendMessage', 'SetWindowLong', 'SetWindowPos', 'SetWindowRgn', 'SetWindowText', 'ShowScrollBar', 'ShowWindow', 'SwitchToThisWindow',
     'TranslateMessage', 'TrackMouseEvent',
     'UnregisterClass', 'UpdateWindow',
@@ -46,6 +48,22 @@ INOUT = 3
 
 user32 = ctypes.WinDLL('user32', use_last_error = True)
 
+
+@functools.cache
+def _optional_export(name: str, prototype: type, paramflags: tuple, errcheck: Callable | None = None) -> Callable | None:
+    """
+    Resolve an export that older Windows versions lack, on first use rather than at
+    import, so that the module still imports there. None if user32 does not have it.
+    """
+    try:
+        function = prototype((name, user32), paramflags)
+    except AttributeError:
+        return None
+
+    if errcheck is not None:
+        function.errcheck = errcheck
+    return function
+
 if ctypes.sizeof(ctypes.c_void_p) == 8:  # 64-bit
     ULONG_PTR = LONG_PTR = LRESULT = ctypes.c_longlong
 else:                                    # 32-bit
@@ -452,6 +470,34 @@ def AppendMenu(hMenu: int, uFlags: int, uIDNewItem: int, lpNewItem: str | None)
     return AppendMenuW(hMenu, uFlags, uIDNewItem, lpNewItem) > 0
 
 
+# https://learn.microsoft.com/en-us/windows/win32/api/winuser/nf-winuser-begindeferwindowpos
+# HDWP BeginDeferWindowPos(
+#   [in] int nNumWindows
+# );
+_BeginDeferWindowPos = ctypes.WINFUNCTYPE(
+    wintypes.HANDLE,
+    ctypes.c_int
+)(
+    ('BeginDeferWindowPos', user32),
+    (
+        (IN, "nNumWindows"),
+    )
+)
+
+
+def BeginDeferWindowPos(nNumWindows: int) -> int:
+    """
+    Allocates memory for a multiple-window-position structure and returns a handle to it.
+
+    Args:
+        nNumWindows (int): The initial number of windows for which to store position information.
+
+    Returns:
+        int: A handle to the multiple-window-position structure (HDWP).
+    """
+    return call_with_last_error_check(_BeginDeferWindowPos, nNumWindows)
+
+
 # https://learn.microsoft.com/en-us/windows/win32/api/winuser/nf-winuser-beginpaint
 # HDC BeginPaint(
 #   [in]  HWND          hWnd,
@@ -508,6 +554,21 @@ def CallWindowProc(lpPrevWndFunc: int, hWnd: int, Msg: int, wParam: int, lParam:
     return CallWindowProcW(lpPrevWndFunc, hWnd, Msg, wParam, lParam)
 
 
+# https://learn.microsoft.com/en-us/windows/win32/api/winuser/nf-winuser-closeclipboard
+# BOOL CloseClipboard();
+_CloseClipboard = ctypes.WINFUNCTYPE(
+    wintypes.BOOL
+)(
+    ('CloseClipboard', user32),
+    ()
+)
+_CloseClipboard.errcheck = errcheck_bool
+
+
+def CloseClipboard() -> bool:
+    return _CloseClipboard()
+
+
 # https://learn.microsoft.com/en-us/windows/win32/api/winuser/nf-winuser-createmenu
 # HMENU CreateMenu();
 _CreateMenu = ctypes.WINFUNCTYPE(
@@ -627,6 +688,56 @@ def DefWindowProc(hWnd: int, Msg: int, wParam: int, lParam: int) -> int:
     return DefWindowProcW(hWnd, Msg, wParam, lParam)
 
 
+# https://learn.microsoft.com/en-us/windows/win32/api/winuser/nf-winuser-deferwindowpos
+# HDWP DeferWindowPos(
+#   [in]           HDWP hWinPosInfo,
+#   [in]           HWND hWnd,
+#   [in, optional] HWND hWndInsertAfter,
+#   [in]           int  x,
+#   [in]           int  y,
+#   [in]           int  cx,
+#   [in]           int  cy,
+#   [in]           UINT uFlags
+# );
+_DeferWindowPos = ctypes.WINFUNCTYPE(
+    wintypes.HANDLE,
+    wintypes.HANDLE,
+    wintypes.HWND,
+    wintypes.HWND,
+    ctypes.c_int,
+    ctypes.c_int,
+    ctypes.c_int,
+    ctypes.c_int,
+    wintypes.UINT
+)(
+    ('DeferWindowPos', user32),
+    (
+        (IN, "hWinPosInfo"),
+        (IN, "hWnd"),
+        (IN, "hWndInsertAfter"),
+        (IN, "x"),
+        (IN, "y"),
+        (IN, "cx"),
+        (IN, "cy"),
+        (IN, "uFlags"),
+    )
+)
+
+
+def DeferWindowPos(hWinPosInfo: int, hWnd: int, hWndInsertAfter: int | None, x: int, y: int, cx: int, cy: int, uFlags: int) -> int:
+    """
+    Updates the multiple-window-position structure for the specified window.
+
+    The returned handle may differ from the one passed in, and must be used for
+    every subsequent call. If the call fails, the system has already freed the
+    structure and it must not be passed to EndDeferWindowPos.
+
+    Returns:
+        int: The updated multiple-window-position structure handle (HDWP).
+    """
+    return call_with_last_error_check(_DeferWindowPos, hWinPosInfo, hWnd, hWndInsertAfter, x, y, cx, cy, uFlags)
+
+
 # https://learn.microsoft.com/en-us/windows/win32/api/winuser/nf-winuser-destroyicon
 # BOOL DestroyIcon(
 #   [in] HICON hIcon
@@ -770,6 +881,21 @@ def DrawText(hdc: int, lpString: str, nCount: int, lpRect: wintypes.RECT, uForma
         raise ctypes.WinError(ctypes.get_last_error())
 
 
+# https://learn.microsoft.com/en-us/windows/win32/api/winuser/nf-winuser-emptyclipboard
+# BOOL EmptyClipboard();
+_EmptyClipboard = ctypes.WINFUNCTYPE(
+    wintypes.BOOL
+)(
+    ('EmptyClipboard', user32),
+    ()
+)
+_EmptyClipboard.errcheck = errcheck_bool
+
+
+def EmptyClipboard() -> bool:
+    return _EmptyClipboard()
+
+
 # https://learn.microsoft.com/en-us/windows/win32/api/winuser/nf-winuser-enablemenuitem
 # BOOL EnableMenuItem(
 #   [in] HMENU hMenu,
@@ -824,6 +950,30 @@ def EnableWindow(hWnd: int, bEnable: bool) -> None:
         raise ctypes.WinError(ctypes.get_last_error())
 
 
+# https://learn.microsoft.com/en-us/windows/win32/api/winuser/nf-winuser-enddeferwindowpos
+# BOOL EndDeferWindowPos(
+#   [in] HDWP hWinPosInfo
+# );
+_EndDeferWindowPos = ctypes.WINFUNCTYPE(
+    wintypes.BOOL,
+    wintypes.HANDLE
+)(
+    ('EndDeferWindowPos', user32),
+    (
+        (IN, "hWinPosInfo"),
+    )
+)
+_EndDeferWindowPos.errcheck = errcheck_bool
+
+
+def EndDeferWindowPos(hWinPosInfo: int) -> bool:
+    """
+    Simultaneously updates the position and size of every window collected in the
+    multiple-window-position structure, in a single screen-refreshing cycle.
+    """
+    return _EndDeferWindowPos(hWinPosInfo)
+
+
 # https://learn.microsoft.com/en-us/windows/win32/api/winuser/nf-winuser-endpaint
 # BOOL EndPaint(
 #   [in] HWND              hWnd,
@@ -968,6 +1118,57 @@ def GetDC(hWnd: int) -> int:
     return call_with_last_error_check(_GetDC, hWnd)
 
 
+# https://learn.microsoft.com/en-us/windows/win32/api/winuser/nf-winuser-getdpiforwindow
+# UINT GetDpiForWindow(
+#   [in] HWND hwnd
+# );
+# Windows 10 1607 and later; resolved in GetDpiForWindow
+_GetDpiForWindow = ctypes.WINFUNCTYPE(
+    wintypes.UINT,
+    wintypes.HWND
+)
+
+
+# https://learn.microsoft.com/en-us/windows/win32/api/winuser/nf-winuser-getdpiforsystem
+# UINT GetDpiForSystem();
+# Windows 10 1607 and later; resolved in GetDpiForSystem
+_GetDpiForSystem = ctypes.WINFUNCTYPE(
+    wintypes.UINT
+)
+
+
+def GetDpiForSystem() -> int:
+    """The system DPI; 96 on systems without the export."""
+    function = _optional_export('GetDpiForSystem', _GetDpiForSystem, ())
+    return function() if function is not None else 96
+
+
+def GetDpiForWindow(hwnd: int) -> int:
+    """The window's DPI; 0, as for an invalid window, on systems without the export."""
+    function = _optional_export('GetDpiForWindow', _GetDpiForWindow, ((IN, "hwnd"),))
+    return function(hwnd) if function is not None else 0
+
+
+# https://learn.microsoft.com/en-us/windows/win32/api/winuser/nf-winuser-getkeystate
+# SHORT GetKeyState(
+#   [in] int nVirtKey
+# );
+_GetKeyState = ctypes.WINFUNCTYPE(
+    wintypes.SHORT,
+    ctypes.c_int
+)(
+    ('GetKeyState', user32),
+    (
+        (IN, "nVirtKey"),
+    )
+)
+
+
+def GetKeyState(nVirtKey: int) -> int:
+    """The key's state when the current message was posted; negative while it is down."""
+    return _GetKeyState(nVirtKey)
+
+
 # https://learn.microsoft.com/en-us/windows/win32/api/winuser/nf-winuser-getmessagew
 # BOOL GetMessageW(
 #   [out]          LPMSG lpMsg,
@@ -1001,6 +1202,25 @@ def GetMessage(lpMsg: Any, hWnd: int | None, wMsgFilterMin: int, wMsgFilterMax:
     return GetMessageW(lpMsg, hWnd, wMsgFilterMin, wMsgFilterMax)
 
 
+# https://learn.microsoft.com/en-us/windows/win32/api/winuser/nf-winuser-getparent
+# HWND GetParent(
+#   [in] HWND hWnd
+# );
+_GetParent = ctypes.WINFUNCTYPE(
+    wintypes.HWND,
+    wintypes.HWND
+)(
+    ('GetParent', user32),
+    (
+        (IN, "hWnd"),
+    )
+)
+
+
+def GetParent(hWnd: int) -> int | None:
+    return _GetParent(hWnd)
+
+
 # https://learn.microsoft.com/en-us/windows/win32/api/winuser/nf-winuser-getscrollinfo
 # BOOL GetScrollInfo(
 #   [in]      HWND         hwnd,
@@ -1084,6 +1304,25 @@ def GetSystemMetrics(nIndex: int) -> int:
     return _GetSystemMetrics(nIndex)
 
 
+# https://learn.microsoft.com/en-us/windows/win32/api/winuser/nf-winuser-getsystemmetricsfordpi
+# int GetSystemMetricsForDpi(
+#   [in] int  nIndex,
+#   [in] UINT dpi
+# );
+# Windows 10 1607 and later; resolved in GetSystemMetricsForDpi
+_GetSystemMetricsForDpi = ctypes.WINFUNCTYPE(
+    wintypes.INT,
+    wintypes.INT,
+    wintypes.UINT
+)
+
+
+def GetSystemMetricsForDpi(nIndex: int, dpi: int) -> int:
+    """The metric at `dpi`; the unscaled GetSystemMetrics value on systems without the export."""
+    function = _optional_export('GetSystemMetricsForDpi', _GetSystemMetricsForDpi, ((IN, "nIndex"), (IN, "dpi")))
+    return function(nIndex, dpi) if function is not None else GetSystemMetrics(nIndex)
+
+
 # https://learn.microsoft.com/en-us/windows/win32/api/winuser/nf-winuser-getwindowlongptrw
 # LONG_PTR GetWindowLongPtrW(
 #   [in] HWND hWnd,
@@ -1487,6 +1726,26 @@ def MoveWindow(hWnd: int, X: int, Y: int, nWidth: int, nHeight: int, bRepaint: b
     return _MoveWindow(hWnd, X, Y, nWidth, nHeight, bRepaint)
 
 
+# https://learn.microsoft.com/en-us/windows/win32/api/winuser/nf-winuser-openclipboard
+# BOOL OpenClipboard(
+#   [in, optional] HWND hWndNewOwner
+# );
+_OpenClipboard = ctypes.WINFUNCTYPE(
+    wintypes.BOOL,
+    wintypes.HWND
+)(
+    ('OpenClipboard', user32),
+    (
+        (IN, "hWndNewOwner"),
+    )
+)
+_OpenClipboard.errcheck = errcheck_bool
+
+
+def OpenClipboard(hWndNewOwner: int | None) -> bool:
+    return _OpenClipboard(hWndNewOwner)
+
+
 # https://learn.microsoft.com/en-us/windows/win32/api/winuser/nf-winuser-postmessagew
 # BOOL PostMessageW(
 #   [in, optional] HWND   hWnd,
@@ -1756,6 +2015,38 @@ def SetCapture(hWnd: int) -> int:
     return call_with_last_error_check(_SetCapture, hWnd)
 
 
+# https://learn.microsoft.com/en-us/windows/win32/api/winuser/nf-winuser-setclipboarddata
+# HANDLE SetClipboardData(
+#   [in]           UINT   uFormat,
+#   [in, optional] HANDLE hMem
+# );
+_SetClipboardData = ctypes.WINFUNCTYPE(
+    wintypes.HANDLE,
+    wintypes.UINT,
+    wintypes.HANDLE
+)(
+    ('SetClipboardData', user32),
+    (
+        (IN, "uFormat"),
+        (IN, "hMem"),
+    )
+)
+
+
+def SetClipboardData(uFormat: int, hMem: int) -> int:
+    """
+    Places data on the open clipboard. On success the system owns `hMem`, and the
+    caller must neither free nor lock it anymore.
+
+    Raises:
+        OSError: If the data could not be placed; `hMem` is still the caller's then.
+    """
+    handle = _SetClipboardData(uFormat, hMem)
+    if not handle:
+        raise ctypes.WinError(ctypes.get_last_error())
+    return handle
+
+
 # https://learn.microsoft.com/en-us/windows/win32/api/winuser/nf-winuser-setfocus
 # HWND SetFocus(
 #   [in, optional] HWND hWnd
@@ -1790,6 +2081,31 @@ def SetProcessDPIAware() -> bool:
     return _SetProcessDPIAware()
 
 
+# https://learn.microsoft.com/en-us/windows/win32/api/winuser/nf-winuser-setprocessdpiawarenesscontext
+# BOOL SetProcessDpiAwarenessContext(
+#   [in] DPI_AWARENESS_CONTEXT value
+# );
+# Windows 10 1703 and later; resolved in SetProcessDpiAwarenessContext
+_SetProcessDpiAwarenessContext = ctypes.WINFUNCTYPE(
+    wintypes.BOOL,
+    wintypes.HANDLE
+)
+
+
+def SetProcessDpiAwarenessContext(value: int) -> bool:
+    """
+    Raises:
+        OSError: If the call fails, or the system does not have the export.
+    """
+    function = _optional_export(
+        'SetProcessDpiAwarenessContext', _SetProcessDpiAwarenessContext, ((IN, "value"),), errcheck_bool
+    )
+    if function is None:
+        raise OSError('SetProcessDpiAwarenessContext needs Windows 10 1703 or later')
+
+    return function(value)
+
+
 # https://learn.microsoft.com/en-us/windows/win32/api/winuser/nf-winuser-setscrollinfo
 # int SetScrollInfo(
 #   [in] HWND          hwnd,
@@ -0,0 +1,592 @@
+"""
+WshShell, IWshShell3, IWshShortcut and their dependencies
+
+Selected from the comtypes wrapper of wshom.ocx by
+`python -m skeletal_framework.utilities.generate_wsh_reference`. Do not edit.
+
+Classes are defined, and their vtables built, on first lookup.
+"""
+from ctypes import *
+from comtypes import BSTR, CoClass, COMMETHOD, dispid, GUID, IUnknown
+from comtypes.automation import IDispatch, VARIANT
+from ctypes import HRESULT
+from ctypes.wintypes import VARIANT_BOOL
+
+typelib_path = 'C:\\Windows\\System32\\wshom.ocx'
+
+# values for enumeration '__MIDL___MIDL_itf_iwshom_0001_0037_0001'
+WshRunning = 0
+WshFinished = 1
+WshFailed = 2
+__MIDL___MIDL_itf_iwshom_0001_0037_0001 = c_int
+WshExecStatus = __MIDL___MIDL_itf_iwshom_0001_0037_0001
+
+
+def _define_ITextStream():
+    class ITextStream(IDispatch):
+        _case_insensitive_ = True
+        _iid_ = GUID('{53BAD8C1-E718-11CF-893D-00A0C9054228}')
+        _idlflags_ = ['hidden', 'dual', 'nonextensible', 'oleautomation']
+    return ITextStream
+
+
+def _members_ITextStream():
+    _defined['ITextStream']._methods_ = [
+        COMMETHOD(
+            [dispid(10000), 'propget'],
+            HRESULT,
+            'Line',
+            (['out', 'retval'], POINTER(c_int), 'Line')
+        ),
+        COMMETHOD(
+            [dispid(-529), 'propget'],
+            HRESULT,
+            'Column',
+            (['out', 'retval'], POINTER(c_int), 'Column')
+        ),
+        COMMETHOD(
+            [dispid(10002), 'propget'],
+            HRESULT,
+            'AtEndOfStream',
+            (['out', 'retval'], POINTER(VARIANT_BOOL), 'EOS')
+        ),
+        COMMETHOD(
+            [dispid(10003), 'propget'],
+            HRESULT,
+            'AtEndOfLine',
+            (['out', 'retval'], POINTER(VARIANT_BOOL), 'EOL')
+        ),
+        COMMETHOD(
+            [dispid(10004)],
+            HRESULT,
+            'Read',
+            (['in'], c_int, 'Characters'),
+            (['out', 'retval'], POINTER(BSTR), 'Text')
+        ),
+        COMMETHOD(
+            [dispid(10005)],
+            HRESULT,
+            'ReadLine',
+            (['out', 'retval'], POINTER(BSTR), 'Text')
+        ),
+        COMMETHOD(
+            [dispid(10006)],
+            HRESULT,
+            'ReadAll',
+            (['out', 'retval'], POINTER(BSTR), 'Text')
+        ),
+        COMMETHOD(
+            [dispid(10007)],
+            HRESULT,
+            'Write',
+            (['in'], BSTR, 'Text')
+        ),
+        COMMETHOD(
+            [dispid(10008)],
+            HRESULT,
+            'WriteLine',
+            (['in', 'optional'], BSTR, 'Text', '')
+        ),
+        COMMETHOD(
+            [dispid(10009)],
+            HRESULT,
+            'WriteBlankLines',
+            (['in'], c_int, 'Lines')
+        ),
+        COMMETHOD(
+            [dispid(10010)],
+            HRESULT,
+            'Skip',
+            (['in'], c_int, 'Characters')
+        ),
+        COMMETHOD([dispid(10011)], HRESULT, 'SkipLine'),
+        COMMETHOD([dispid(10012)], HRESULT, 'Close'),
+    ]
+
+
+def _define_IWshShell():
+    class IWshShell(IDispatch):
+        """Shell Object Interface"""
+        _case_insensitive_ = True
+        _iid_ = GUID('{F935DC21-1CF0-11D0-ADB9-00C04FD58A0B}')
+        _idlflags_ = ['hidden', 'dual', 'oleautomation']
+    return IWshShell
+
+
+def _members_IWshShell():
+    _defined['IWshShell']._methods_ = [
+        COMMETHOD(
+            [dispid(100), 'propget'],
+            HRESULT,
+            'SpecialFolders',
+            (['out', 'retval'], POINTER(POINTER(_defined['IWshCollection'])), 'out_Folders')
+        ),
+        COMMETHOD(
+            [dispid(200), 'propget'],
+            HRESULT,
+            'Environment',
+            (['in', 'optional'], POINTER(VARIANT), 'Type'),
+            (['out', 'retval'], POINTER(POINTER(_defined['IWshEnvironment'])), 'out_Env')
+        ),
+        COMMETHOD(
+            [dispid(1000)],
+            HRESULT,
+            'Run',
+            (['in'], BSTR, 'Command'),
+            (['in', 'optional'], POINTER(VARIANT), 'WindowStyle'),
+            (['in', 'optional'], POINTER(VARIANT), 'WaitOnReturn'),
+            (['out', 'retval'], POINTER(c_int), 'out_ExitCode')
+        ),
+        COMMETHOD(
+            [dispid(1001)],
+            HRESULT,
+            'Popup',
+            (['in'], BSTR, 'Text'),
+            (['in', 'optional'], POINTER(VARIANT), 'SecondsToWait'),
+            (['in', 'optional'], POINTER(VARIANT), 'Title'),
+            (['in', 'optional'], POINTER(VARIANT), 'Type'),
+            (['out', 'retval'], POINTER(c_int), 'out_Button')
+        ),
+        COMMETHOD(
+            [dispid(1002)],
+            HRESULT,
+            'CreateShortcut',
+            (['in'], BSTR, 'PathLink'),
+            (['out', 'retval'], POINTER(POINTER(IDispatch)), 'out_Shortcut')
+        ),
+        COMMETHOD(
+            [dispid(1006)],
+            HRESULT,
+            'ExpandEnvironmentStrings',
+            (['in'], BSTR, 'Src'),
+            (['out', 'retval'], POINTER(BSTR), 'out_Dst')
+        ),
+        COMMETHOD(
+            [dispid(2000)],
+            HRESULT,
+            'RegRead',
+            (['in'], BSTR, 'Name'),
+            (['out', 'retval'], POINTER(VARIANT), 'out_Value')
+        ),
+        COMMETHOD(
+            [dispid(2001)],
+            HRESULT,
+            'RegWrite',
+            (['in'], BSTR, 'Name'),
+            (['in'], POINTER(VARIANT), 'Value'),
+            (['in', 'optional'], POINTER(VARIANT), 'Type')
+        ),
+        COMMETHOD(
+            [dispid(2002)],
+            HRESULT,
+            'RegDelete',
+            (['in'], BSTR, 'Name')
+        ),
+    ]
+
+
+def _define_IWshShell2():
+    class IWshShell2(_defined['IWshShell']):
+        """Shell Object Interface"""
+        _case_insensitive_ = True
+        _iid_ = GUID('{24BE5A30-EDFE-11D2-B933-00104B365C9F}')
+        _idlflags_ = ['hidden', 'dual', 'oleautomation']
+    return IWshShell2
+
+
+def _members_IWshShell2():
+    _defined['IWshShell2']._methods_ = [
+        COMMETHOD(
+            [dispid(3000)],
+            HRESULT,
+            'LogEvent',
+            (['in'], POINTER(VARIANT), 'Type'),
+            (['in'], BSTR, 'Message'),
+            (['in', 'optional'], BSTR, 'Target', ''),
+            (['out', 'retval'], POINTER(VARIANT_BOOL), 'out_Success')
+        ),
+        COMMETHOD(
+            [dispid(3010)],
+            HRESULT,
+            'AppActivate',
+            (['in'], POINTER(VARIANT), 'App'),
+            (['in', 'optional'], POINTER(VARIANT), 'Wait'),
+            (['out', 'retval'], POINTER(VARIANT_BOOL), 'out_Success')
+        ),
+        COMMETHOD(
+            [dispid(3011)],
+            HRESULT,
+            'SendKeys',
+            (['in'], BSTR, 'Keys'),
+            (['in', 'optional'], POINTER(VARIANT), 'Wait')
+        ),
+    ]
+
+
+def _define_IWshShell3():
+    class IWshShell3(_defined['IWshShell2']):
+        """Shell Object Interface"""
+        _case_insensitive_ = True
+        _iid_ = GUID('{41904400-BE18-11D3-A28B-00104BD35090}')
+        _idlflags_ = ['dual', 'oleautomation']
+    return IWshShell3
+
+
+def _members_IWshShell3():
+    _defined['IWshShell3']._methods_ = [
+        COMMETHOD(
+            [dispid(3012)],
+            HRESULT,
+            'Exec',
+            (['in'], BSTR, 'Command'),
+            (['out', 'retval'], POINTER(POINTER(_defined['IWshExec'])), 'ppExec')
+        ),
+        COMMETHOD(
+            [dispid(3013), 'propget'],
+            HRESULT,
+            'CurrentDirectory',
+            (['out', 'retval'], POINTER(BSTR), 'out_Directory')
+        ),
+        COMMETHOD(
+            [dispid(3013), 'propput'],
+            HRESULT,
+            'CurrentDirectory',
+            (['in'], BSTR, 'out_Directory')
+        ),
+    ]
+
+
+def _define_IWshCollection():
+    class IWshCollection(IDispatch):
+        """Generic Collection Object"""
+        _case_insensitive_ = True
+        _iid_ = GUID('{F935DC27-1CF0-11D0-ADB9-00C04FD58A0B}')
+        _idlflags_ = ['dual', 'oleautomation']
+    return IWshCollection
+
+
+def _members_IWshCollection():
+    _defined['IWshCollection']._methods_ = [
+        COMMETHOD(
+            [dispid(0)],
+            HRESULT,
+            'Item',
+            (['in'], POINTER(VARIANT), 'Index'),
+            (['out', 'retval'], POINTER(VARIANT), 'out_Value')
+        ),
+        COMMETHOD(
+            [dispid(1)],
+            HRESULT,
+            'Count',
+            (['out', 'retval'], POINTER(c_int), 'out_Count')
+        ),
+        COMMETHOD(
+            [dispid(2), 'propget'],
+            HRESULT,
+            'length',
+            (['out', 'retval'], POINTER(c_int), 'out_Count')
+        ),
+        COMMETHOD(
+            [dispid(-4)],
+            HRESULT,
+            '_NewEnum',
+            (['out', 'retval'], POINTER(POINTER(IUnknown)), 'out_Enum')
+        ),
+    ]
+
+
+def _define_IWshEnvironment():
+    class IWshEnvironment(IDispatch):
+        """Environment Variables Collection Object"""
+        _case_insensitive_ = True
+        _iid_ = GUID('{F935DC29-1CF0-11D0-ADB9-00C04FD58A0B}')
+        _idlflags_ = ['dual', 'oleautomation']
+    return IWshEnvironment
+
+
+def _members_IWshEnvironment():
+    _defined['IWshEnvironment']._methods_ = [
+        COMMETHOD(
+            [dispid(0), 'propget'],
+            HRESULT,
+            'Item',
+            (['in'], BSTR, 'Name'),
+            (['out', 'retval'], POINTER(BSTR), 'out_Value')
+        ),
+        COMMETHOD(
+            [dispid(0), 'propput'],
+            HRESULT,
+            'Item',
+            (['in'], BSTR, 'Name'),
+            (['in'], BSTR, 'out_Value')
+        ),
+        COMMETHOD(
+            [dispid(1)],
+            HRESULT,
+            'Count',
+            (['out', 'retval'], POINTER(c_int), 'out_Count')
+        ),
+        COMMETHOD(
+            [dispid(2), 'propget'],
+            HRESULT,
+            'length',
+            (['out', 'retval'], POINTER(c_int), 'out_Count')
+        ),
+        COMMETHOD(
+            [dispid(-4)],
+            HRESULT,
+            '_NewEnum',
+            (['out', 'retval'], POINTER(POINTER(IUnknown)), 'out_Enum')
+        ),
+        COMMETHOD(
+            [dispid(1001)],
+            HRESULT,
+            'Remove',
+            (['in'], BSTR, 'Name')
+        ),
+    ]
+
+
+def _define_IWshExec():
+    class IWshExec(IDispatch):
+        """WSH Exec Object"""
+        _case_insensitive_ = True
+        _iid_ = GUID('{08FED190-BE19-11D3-A28B-00104BD35090}')
+        _idlflags_ = ['dual', 'oleautomation']
+    return IWshExec
+
+
+def _members_IWshExec():
+    _defined['IWshExec']._methods_ = [
+        COMMETHOD(
+            [dispid(1), 'propget'],
+            HRESULT,
+            'Status',
+            (['out', 'retval'], POINTER(WshExecStatus), 'Status')
+        ),
+        COMMETHOD(
+            [dispid(3), 'propget'],
+            HRESULT,
+            'StdIn',
+            (['out', 'retval'], POINTER(POINTER(_defined['ITextStream'])), 'ppts')
+        ),
+        COMMETHOD(
+            [dispid(4), 'propget'],
+            HRESULT,
+            'StdOut',
+            (['out', 'retval'], POINTER(POINTER(_defined['ITextStream'])), 'ppts')
+        ),
+        COMMETHOD(
+            [dispid(5), 'propget'],
+            HRESULT,
+            'StdErr',
+            (['out', 'retval'], POINTER(POINTER(_defined['ITextStream'])), 'ppts')
+        ),
+        COMMETHOD(
+            [dispid(6), 'propget'],
+            HRESULT,
+            'ProcessID',
+            (['out', 'retval'], POINTER(c_int), 'PID')
+        ),
+        COMMETHOD(
+            [dispid(7), 'propget'],
+            HRESULT,
+            'ExitCode',
+            (['out', 'retval'], POINTER(c_int), 'ExitCode')
+        ),
+        COMMETHOD([dispid(8)], HRESULT, 'Terminate'),
+    ]
+
+
+def _define_IWshShortcut():
+    class IWshShortcut(IDispatch):
+        """Shortcut Object"""
+        _case_insensitive_ = True
+        _iid_ = GUID('{F935DC23-1CF0-11D0-ADB9-00C04FD58A0B}')
+        _idlflags_ = ['dual', 'oleautomation']
+    return IWshShortcut
+
+
+def _members_IWshShortcut():
+    _defined['IWshShortcut']._methods_ = [
+        COMMETHOD(
+            [dispid(0), 'propget'],
+            HRESULT,
+            'FullName',
+            (['out', 'retval'], POINTER(BSTR), 'out_FullName')
+        ),
+        COMMETHOD(
+            [dispid(1000), 'propget'],
+            HRESULT,
+            'Arguments',
+            (['out', 'retval'], POINTER(BSTR), 'out_Arguments')
+        ),
+        COMMETHOD(
+            [dispid(1000), 'propput'],
+            HRESULT,
+            'Arguments',
+            (['in'], BSTR, 'out_Arguments')
+        ),
+        COMMETHOD(
+            [dispid(1001), 'propget'],
+            HRESULT,
+            'Description',
+            (['out', 'retval'], POINTER(BSTR), 'out_Description')
+        ),
+        COMMETHOD(
+            [dispid(1001), 'propput'],
+            HRESULT,
+            'Description',
+            (['in'], BSTR, 'out_Description')
+        ),
+        COMMETHOD(
+            [dispid(1002), 'propget'],
+            HRESULT,
+            'Hotkey',
+            (['out', 'retval'], POINTER(BSTR), 'out_HotKey')
+        ),
+        COMMETHOD(
+            [dispid(1002), 'propput'],
+            HRESULT,
+            'Hotkey',
+            (['in'], BSTR, 'out_HotKey')
+        ),
+        COMMETHOD(
+            [dispid(1003), 'propget'],
+            HRESULT,
+            'IconLocation',
+            (['out', 'retval'], POINTER(BSTR), 'out_IconPath')
+        ),
+        COMMETHOD(
+            [dispid(1003), 'propput'],
+            HRESULT,
+            'IconLocation',
+            (['in'], BSTR, 'out_IconPath')
+        ),
+        COMMETHOD(
+            [dispid(1004), 'propput'],
+            HRESULT,
+            'RelativePath',
+            (['in'], BSTR, 'rhs')
+        ),
+        COMMETHOD(
+            [dispid(1005), 'propget'],
+            HRESULT,
+            'TargetPath',
+            (['out', 'retval'], POINTER(BSTR), 'out_Path')
+        ),
+        COMMETHOD(
+            [dispid(1005), 'propput'],
+            HRESULT,
+            'TargetPath',
+            (['in'], BSTR, 'out_Path')
+        ),
+        COMMETHOD(
+            [dispid(1006), 'propget'],
+            HRESULT,
+            'WindowStyle',
+            (['out', 'retval'], POINTER(c_int), 'out_ShowCmd')
+        ),
+        COMMETHOD(
+            [dispid(1006), 'propput'],
+            HRESULT,
+            'WindowStyle',
+            (['in'], c_int, 'out_ShowCmd')
+        ),
+        COMMETHOD(
+            [dispid(1007), 'propget'],
+            HRESULT,
+            'WorkingDirectory',
+            (['out', 'retval'], POINTER(BSTR), 'out_WorkingDirectory')
+        ),
+        COMMETHOD(
+            [dispid(1007), 'propput'],
+            HRESULT,
+            'WorkingDirectory',
+            (['in'], BSTR, 'out_WorkingDirectory')
+        ),
+        COMMETHOD(
+            [dispid(2000), 'hidden'],
+            HRESULT,
+            'Load',
+            (['in'], BSTR, 'PathLink')
+        ),
+        COMMETHOD([dispid(2001)], HRESULT, 'Save'),
+    ]
+
+
+def _define_WshShell():
+    class WshShell(CoClass):
+        """Shell Object"""
+        _reg_clsid_ = GUID('{72C24DD5-D70A-438B-8A42-98424B88AFB8}')
+        _idlflags_ = []
+        _typelib_path_ = typelib_path
+        _reg_typelib_ = ('{F935DC20-1CF0-11D0-ADB9-00C04FD58A0B}', 1, 0)
+    return WshShell
+
+
+def _members_WshShell():
+    _defined['WshShell']._com_interfaces_ = [_defined['IWshShell3']]
+
+
+def _no_members():
+    pass
+
+
+# name: (define the class, assign its members, classes to load with it, base classes first)
+_CLASSES = {
+    'ITextStream': (_define_ITextStream, _members_ITextStream, ('ITextStream',)),
+    'IWshShell': (_define_IWshShell, _members_IWshShell, ('IWshCollection', 'IWshEnvironment', 'IWshShell')),
+    'IWshShell2': (_define_IWshShell2, _members_IWshShell2, ('IWshCollection', 'IWshEnvironment', 'IWshShell', 'IWshShell2')),
+    'IWshShell3': (_define_IWshShell3, _members_IWshShell3, ('ITextStream', 'IWshCollection', 'IWshEnvironment', 'IWshExec', 'IWshShell', 'IWshShell2', 'IWshShell3')),
+    'IWshCollection': (_define_IWshCollection, _members_IWshCollection, ('IWshCollection',)),
+    'IWshEnvironment': (_define_IWshEnvironment, _members_IWshEnvironment, ('IWshEnvironment',)),
+    'IWshExec': (_define_IWshExec, _members_IWshExec, ('ITextStream', 'IWshExec')),
+    'IWshShortcut': (_define_IWshShortcut, _members_IWshShortcut, ('IWshShortcut',)),
+    'WshShell': (_define_WshShell, _members_WshShell, ('ITextStream', 'IWshCollection', 'IWshEnvironment', 'IWshExec', 'IWshShell', 'WshShell', 'IWshShell2', 'IWshShell3')),
+}
+
+_defined = {}
+_completed = set()
+
+
+def _load(name):
+    _, _, closure = _CLASSES[name]
+
+    # Every class first, so members can refer to each other, then the members, bases before subclasses
+    for member in closure:
+        if member not in _defined:
+            _defined[member] = _CLASSES[member][0]()
+
+    for member in closure:
+        if member not in _completed:
+            _completed.add(member)
+            _CLASSES[member][1]()
+
+    return _defined[name]
+
+
+def __getattr__(name):
+    if name not in _CLASSES:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+    value = globals()[name] = _load(name)
+    return value
+
+
+__all__ = [
+    'ITextStream',
+    'IWshShell',
+    'IWshShell2',
+    'IWshShell3',
+    'IWshCollection',
+    'IWshEnvironment',
+    'IWshExec',
+    'IWshShortcut',
+    'WshShell',
+    'typelib_path',
+    'WshRunning',
+    'WshFinished',
+    'WshFailed',
+    'WshExecStatus',
+]